@@ -0,0 +1,215 @@
+import argparse
+import ast
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from graph_session import MODULES, NETWORKS, GraphSession, resolve_analyses
+from workers import PROCESSES_VARIABLE
+
+CACHE_PATH = "cache/results"
+
+# analyses write their results relative to the working directory
+OUTPUT_DIRECTORIES = ["result_tables", "figures"]
+SHARED_DIRECTORIES = ["models", "dataset"]
+
+_session = None
+_graph_hashes = {}
+
+
+def graph_hash(path):
+    # content hash of a stored graph, remembered per file size and modification time
+    files = sorted(glob.glob(os.path.join(path, "*")))
+    stamp = tuple((file, os.path.getsize(file), os.path.getmtime(file)) for file in files)
+
+    if _graph_hashes.get(path, (None,))[0] != stamp:
+        digest = hashlib.sha256()
+        for file in files:
+            digest.update(os.path.basename(file).encode())
+            with open(file, "rb") as stored:
+                for block in iter(lambda: stored.read(1 << 24), b""):
+                    digest.update(block)
+
+        _graph_hashes[path] = (stamp, digest.hexdigest())
+
+    return _graph_hashes[path][1]
+
+
+def local_imports(file):
+    # modules of the same directory imported anywhere in a source file
+    directory = os.path.dirname(file)
+    with open(file, "rb") as source:
+        tree = ast.parse(source.read(), file)
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+
+    files = {os.path.join(directory, f"{name.split('.')[0]}.py") for name in names}
+    return {file for file in files if os.path.exists(file)}
+
+
+def source_hash(analysis):
+    # the analysis module and every local module it transitively imports; editing any of them
+    # invalidates results
+    pending = [os.path.abspath(sys.modules[analysis.__module__].__file__)]
+    files = set(pending)
+
+    while pending:
+        for file in local_imports(pending.pop()) - files:
+            files.add(file)
+            pending.append(file)
+
+    digest = hashlib.sha256()
+    for file in sorted(files):
+        digest.update(os.path.basename(file).encode())
+        with open(file, "rb") as source:
+            digest.update(source.read())
+
+    return digest.hexdigest()
+
+
+def task_key(analysis_name, analysis, graph_name):
+    description = {
+        "analysis": analysis_name,
+        "network": graph_name,
+        "graph": graph_hash(NETWORKS[graph_name]),
+        "source": source_hash(analysis)
+    }
+
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+def restore(key):
+    # copies cached tables and figures into the working directory and returns the captured output
+    cached = os.path.join(CACHE_PATH, key)
+
+    for directory in OUTPUT_DIRECTORIES:
+        if os.path.isdir(os.path.join(cached, directory)):
+            shutil.copytree(os.path.join(cached, directory), directory, dirs_exist_ok=True)
+
+    with open(os.path.join(cached, "output.txt")) as output:
+        return output.read()
+
+
+def _init_worker():
+    # tasks already run side by side, so the pools inside an analysis stay single-process
+    os.environ[PROCESSES_VARIABLE] = "1"
+
+
+def _run_task(analysis_name, graph_name, key):
+    # runs in a worker, inside a sandbox that becomes the cache entry once the analysis succeeds
+    global _session
+    if _session is None:
+        _session = GraphSession({name: os.path.abspath(path) for name, path in NETWORKS.items()})
+
+    analysis = dict(resolve_analyses([analysis_name]))[analysis_name]
+    root = os.getcwd()
+
+    sandbox = tempfile.mkdtemp(prefix=f"{key}.", dir=CACHE_PATH)
+    for directory in OUTPUT_DIRECTORIES:
+        os.makedirs(os.path.join(sandbox, directory))
+    for directory in SHARED_DIRECTORIES:
+        if os.path.isdir(directory):
+            os.symlink(os.path.abspath(directory), os.path.join(sandbox, directory))
+
+    graph = _session[graph_name]
+    output = io.StringIO()
+
+    try:
+        with contextlib.redirect_stdout(output):
+            os.chdir(sandbox)
+            try:
+                analysis(graph, graph_name)
+            finally:
+                os.chdir(root)
+    except BaseException:
+        shutil.rmtree(sandbox, ignore_errors=True)
+        raise
+
+    for directory in SHARED_DIRECTORIES:
+        if os.path.islink(os.path.join(sandbox, directory)):
+            os.unlink(os.path.join(sandbox, directory))
+
+    with open(os.path.join(sandbox, "output.txt"), "w") as captured:
+        captured.write(output.getvalue())
+
+    shutil.rmtree(os.path.join(CACHE_PATH, key), ignore_errors=True)
+    os.replace(sandbox, os.path.join(CACHE_PATH, key))
+
+    return key
+
+
+def graph_size(graph_name):
+    indices = os.path.join(NETWORKS[graph_name], "indices.npy")
+    return os.path.getsize(indices) if os.path.exists(indices) else 0
+
+
+def run_parallel(analysis_names, graph_names, processes=None, use_cache=True):
+    # (network x analysis) tasks, largest networks first; cached results are restored instead of recomputed
+    os.makedirs(CACHE_PATH, exist_ok=True)
+    for directory in OUTPUT_DIRECTORIES:
+        os.makedirs(directory, exist_ok=True)
+
+    available = [name for name in graph_names if os.path.isdir(NETWORKS[name])]
+    for graph_name in sorted(set(graph_names) - set(available)):
+        print(f"Skipping {graph_name}: {NETWORKS[graph_name]} does not exist")
+
+    analyses = resolve_analyses(analysis_names)
+    tasks = [(analysis_name, graph_name, task_key(analysis_name, analysis, graph_name))
+             for graph_name in sorted(available, key=graph_size, reverse=True)
+             for analysis_name, analysis in analyses]
+
+    pending = []
+    for analysis_name, graph_name, key in tasks:
+        if use_cache and os.path.exists(os.path.join(CACHE_PATH, key, "output.txt")):
+            print(f"[cached] {analysis_name} on {graph_name}")
+            print(restore(key), end="")
+        else:
+            pending.append((analysis_name, graph_name, key))
+
+    failures = []
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker) as executor:
+        futures = {executor.submit(_run_task, *task): task for task in pending}
+
+        for future in as_completed(futures):
+            analysis_name, graph_name, key = futures[future]
+
+            try:
+                future.result()
+            except Exception as error:
+                failures.append((analysis_name, graph_name, error))
+                print(f"[failed] {analysis_name} on {graph_name}: {error!r}")
+                continue
+
+            print(f"[done] {analysis_name} on {graph_name}")
+            print(restore(key), end="")
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run network analyses in parallel, reusing cached results.")
+    parser.add_argument("analyses", nargs="+", help=f"module ({', '.join(MODULES)}) or module.analysis")
+    parser.add_argument("--networks", nargs="+", default=list(NETWORKS), choices=list(NETWORKS))
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false")
+    arguments = parser.parse_args()
+
+    failures = run_parallel(arguments.analyses, arguments.networks, arguments.processes, arguments.use_cache)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
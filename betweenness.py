@@ -0,0 +1,113 @@
+import math
+import random
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+import numpy as np
+
+from workers import worker_count
+
+# above this many edges the exact O(nm) pass is replaced by pivot sampling
+EXACT_EDGE_LIMIT = 1_000_000
+DEFAULT_EPSILON = 0.02
+DEFAULT_DELTA = 0.1
+
+_cache = weakref.WeakKeyDictionary()
+_worker_graph = None
+
+
+def sample_size(node_count, epsilon, delta=DEFAULT_DELTA):
+    # Hoeffding bound with a union bound over all nodes: every normalized score is within
+    # epsilon of the exact value with probability at least 1 - delta
+    bound = node_count / max(node_count - 1, 1)
+    return math.ceil(bound ** 2 * math.log(2 * node_count / delta) / (2 * epsilon ** 2))
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _accumulate(sources, weight):
+    graph = _worker_graph
+    partial_betweenness = nx.betweenness_centrality_subset(graph, sources, list(graph), normalized=False,
+                                                           weight=weight)
+    return np.fromiter(partial_betweenness.values(), dtype=np.float64, count=len(graph))
+
+
+def _raw_betweenness(graph, sources, weight, processes):
+    processes = worker_count(processes)
+    chunk_count = min(len(sources), processes * 4)
+
+    if processes == 1 or chunk_count <= 1:
+        _init_worker(graph)
+        return _accumulate(sources, weight)
+
+    chunks = [sources[i::chunk_count] for i in range(chunk_count)]
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(graph,)) as executor:
+        return sum(executor.map(_accumulate, chunks, [weight] * chunk_count))
+
+
+def _betweenness(graph, weight, k, seed, processes, normalized):
+    nodes = list(graph)
+    n = len(nodes)
+
+    if k is None:
+        sources, scale = nodes, 1.0
+    else:
+        sources, scale = random.Random(seed).sample(nodes, k), n / k
+
+    raw = _raw_betweenness(graph, sources, weight, processes) * scale
+
+    if normalized:
+        raw *= (1.0 if graph.is_directed() else 2.0) / ((n - 1) * (n - 2)) if n > 2 else 0.0
+
+    return dict(zip(nodes, raw.tolist()))
+
+
+def fingerprint(graph, weight):
+    # content of the graph as seen by the computation, so edits that keep the node and edge counts
+    # still invalidate cached scores
+    return hash((tuple(graph), tuple(graph.edges(data=weight, default=1) if weight else graph.edges())))
+
+
+def betweenness_centrality(graph, weight=None, k=None, epsilon=None, delta=DEFAULT_DELTA, seed=42,
+                           processes=None, normalized=True):
+    # exact unless k pivots or an error bound epsilon is requested, or the graph is too large
+    if k is None and epsilon is None and graph.number_of_edges() > EXACT_EDGE_LIMIT:
+        epsilon = DEFAULT_EPSILON
+        print(f"Sampling betweenness centrality (epsilon = {epsilon}, delta = {delta})")
+
+    if k is None and epsilon is not None:
+        k = sample_size(len(graph), epsilon, delta)
+
+    if k is not None and k >= len(graph):
+        k = None
+
+    key = (weight, k, seed, normalized, fingerprint(graph, weight))
+    results = _cache.setdefault(graph, {})
+
+    if key not in results:
+        results[key] = _betweenness(graph, weight, k, seed, processes, normalized)
+
+    return results[key]
+
+
+def top_nodes(centrality, count=10):
+    return sorted(centrality, key=centrality.get, reverse=True)[:count]
+
+
+def validate_sampling(graph, k=None, epsilon=None, weight=None, count=10, seed=42):
+    exact = betweenness_centrality(graph, weight=weight, k=len(graph), seed=seed)
+    sampled = betweenness_centrality(graph, weight=weight, k=k, epsilon=epsilon, seed=seed)
+
+    exact_top, sampled_top = top_nodes(exact, count), top_nodes(sampled, count)
+    overlap = len(set(exact_top) & set(sampled_top)) / count
+    max_error = max(abs(exact[node] - sampled[node]) for node in graph)
+
+    print(f"Top-{count} overlap: {overlap:.0%}, same order: {exact_top == sampled_top}, "
+          f"max absolute error: {max_error:.5f}")
+
+    return overlap, max_error
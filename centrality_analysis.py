@@ -1,12 +1,20 @@
 import networkx as nx
 import pandas as pd
 
+from betweenness import betweenness_centrality
+from graph_session import run_analyses
+from katz import KatzSolver
+from network_modeling import SUBREDDIT_FILTER
+from sparse_centrality import closeness_centrality, harmonic_centrality
+from sparse_centrality import eigenvector_centrality as sparse_eigenvector_centrality
+
 
 def calculate_centrality(graph, centrality_type, graph_name):
     switch = {
         "DC": nx.degree_centrality,
-        "CC": nx.closeness_centrality,
-        "BC": nx.betweenness_centrality
+        "CC": closeness_centrality,
+        "HC": harmonic_centrality,
+        "BC": betweenness_centrality
     }
 
     centrality = switch[centrality_type](graph)
@@ -23,13 +31,14 @@ def calculate_centrality(graph, centrality_type, graph_name):
 def calculate_centralities(graph, graph_name):
     df_dc = calculate_centrality(graph, "DC", graph_name)
     df_cc = calculate_centrality(graph, "CC", graph_name)
+    df_hc = calculate_centrality(graph, "HC", graph_name)
     df_bc = calculate_centrality(graph, "BC", graph_name)
 
-    return pd.concat([df_dc, df_cc, df_bc], axis=1)
+    return pd.concat([df_dc, df_cc, df_hc, df_bc], axis=1)
 
 
 def eigenvector_centrality(graph, graph_name):
-    centrality = nx.eigenvector_centrality(graph, weight="weight")
+    centrality = sparse_eigenvector_centrality(graph, weight="weight")
     data_frame = pd.DataFrame.from_dict(centrality, orient="index", columns=["EVC"])
     result = data_frame
 
@@ -40,27 +49,36 @@ def eigenvector_centrality(graph, graph_name):
     return result
 
 
-def katz_centrality(graph, graph_name):
-    # lambda_max = max(nx.adjacency_spectrum(graph))
-    # print(f"alpha < {1 / lambda_max}")
+def katz_centrality(graph, graph_name, alpha=None):
+    solver = KatzSolver(graph, alpha=alpha)
+    if solver.radius > 0:
+        print(f"alpha = {solver.alpha} (alpha < {1 / solver.radius})")
+    else:
+        print(f"alpha = {solver.alpha} (no edges, any alpha converges)")
 
-    alpha = 5e-6
     target_subreddit = "reddit.com"
+    targets = [subreddit for subreddit in SUBREDDIT_FILTER if subreddit in graph]
 
-    def katz(beta, file_name):
-        centrality = nx.katz_centrality(graph, alpha=alpha, beta=beta, nstart=None, weight="weight")
-        data_frame = pd.DataFrame.from_dict(centrality, orient="index", columns=["Katz"])
+    def katz(scores, file_name):
+        data_frame = pd.DataFrame(scores, index=solver.nodes, columns=["Katz"])
 
         data_frame.sort_values(by="Katz", ascending=False, inplace=True)
         data_frame = data_frame.head(10)
         data_frame.to_csv(file_name.lower())
 
-    katz(1.0, f"result_tables/{graph_name}_katz.csv")
+    katz(solver.uniform(), f"result_tables/{graph_name}_katz.csv")
+
+    if not targets:
+        return
+
+    # one batched solve for every target subreddit instead of one nx.katz_centrality call each
+    personalized = pd.DataFrame(solver.personalized(targets), index=solver.nodes, columns=targets)
 
     if target_subreddit in graph:
-        beta_map = dict([(node, 1e6 if node == target_subreddit else 1.0) for node in graph])
+        katz(personalized[target_subreddit].to_numpy(), f"result_tables/{graph_name}_katz_modified.csv")
 
-        katz(beta_map, f"result_tables/{graph_name}_katz_modified.csv")
+    top_nodes = {target: personalized[target].nlargest(10).index.tolist() for target in targets}
+    pd.DataFrame(top_nodes, index=range(1, 11)).to_csv(f"result_tables/{graph_name}_katz_personalized.csv".lower())
 
 
 def composite_centrality(graph, graph_name, centralities):
@@ -77,29 +95,23 @@ def composite_centrality(graph, graph_name, centralities):
     centralities.to_csv(f"result_tables/{graph_name}_composite.csv".lower())
 
 
-def analyze():
-    SNet = nx.read_gml("models/snet.gml")
-    SNetF = nx.read_gml("models/snetf.gml")
-    SNetT = nx.read_gml("models/snett.gml")
-    UserNet = nx.read_gml("models/usernet.gml")
-
-    # graphs = [SNet]
-    graphs = [SNet, SNetF, SNetT, UserNet]
+def centrality_tables(graph, graph_name):
+    centralities = calculate_centralities(graph, graph_name)
+    df_evc = eigenvector_centrality(graph, graph_name)
+    centralities = pd.concat([centralities, df_evc], axis=1)
 
-    # graph_names = ["SNet"]
-    graph_names = ["SNet", "SNetF", "SNetT", "UserNet"]
+    composite_centrality(graph, graph_name, centralities)
 
-    for graph, graph_name in zip(graphs, graph_names):
-        print(f"Network {graph_name}...")
 
-        centralities = calculate_centralities(graph, graph_name)
-        df_evc = eigenvector_centrality(graph, graph_name)
-        centralities = pd.concat([centralities, df_evc], axis=1)
+ANALYSES = {
+    "centralities": centrality_tables,
+    "katz": katz_centrality
+}
 
-        katz_centrality(graph, graph_name)
-        composite_centrality(graph, graph_name, centralities)
 
-        print()
+def analyze(graph_names=("SNet", "SNetF", "SNetT", "UserNet"), analyses=tuple(ANALYSES), session=None):
+    return run_analyses([(analysis, ANALYSES[analysis]) for analysis in analyses], graph_names, session)
 
 
-analyze()
+if __name__ == "__main__":
+    analyze()
@@ -0,0 +1,50 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as fs
+
+STORE_PATH = "dataset/store"
+
+# uncompressed Arrow IPC files can be memory-mapped, so processes reading the same
+# month share the page cache instead of each holding a private copy
+PARTITIONING = ds.partitioning(pa.schema([("month", pa.int8())]), flavor="hive")
+
+
+def write_cleaned_data(data_frame, name):
+    table = pa.Table.from_pandas(data_frame, preserve_index=False)
+    ds.write_dataset(table, f"{STORE_PATH}/{name}", format="arrow", partitioning=PARTITIONING,
+                     existing_data_behavior="delete_matching")
+
+
+def open_cleaned_data(name, memory_map=True):
+    return ds.dataset(f"{STORE_PATH}/{name}", format="arrow", partitioning=PARTITIONING,
+                      filesystem=fs.LocalFileSystem(use_mmap=memory_map))
+
+
+def month_filter(months):
+    return None if months is None else ds.field("month").isin(list(months))
+
+
+def read_cleaned_table(name, columns=None, months=None, memory_map=True):
+    dataset = open_cleaned_data(name, memory_map)
+    return dataset.to_table(columns=columns, filter=month_filter(months))
+
+
+def read_cleaned_data(name, columns=None, months=None, memory_map=True):
+    return read_cleaned_table(name, columns, months, memory_map).to_pandas()
+
+
+def read_cleaned_batches(name, columns, batch_size, months=None, memory_map=True):
+    dataset = open_cleaned_data(name, memory_map)
+
+    for batch in dataset.to_batches(columns=columns, filter=month_filter(months), batch_size=batch_size):
+        if batch.num_rows > 0:
+            yield batch.to_pandas()
+
+
+def stored_months(name):
+    fragments = open_cleaned_data(name).get_fragments()
+    return sorted({ds.get_partition_keys(fragment.partition_expression)["month"] for fragment in fragments})
+
+
+def count_rows(name):
+    return open_cleaned_data(name).count_rows()
@@ -2,136 +2,272 @@ import networkx as nx
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from itertools import chain, combinations
+from functools import partial
+from itertools import islice
 from scipy.cluster.hierarchy import dendrogram
+from scipy.linalg import LinAlgError
+from scipy.sparse import csgraph, csc_array
 from sklearn.cluster import SpectralClustering
+from sklearn.manifold import spectral_embedding
 
+from betweenness import betweenness_centrality
+from graph_session import run_analyses
+from louvain import RUNS, communities as louvain_communities
+from partition_storage import PartitionView, save_partitions
+from structural_holes import constraint as burt_constraint
+
+# normalized Laplacian eigenvalue separation below which eigenvectors are not determined by the embedding size
+DEGENERATE_GAP = 1e-8
+
+
+def most_central_edge(graph, k=None, seed=None):
+    # k sampled sources approximate edge betweenness on graphs too large for the exact pass
+    k = None if k is None or k >= len(graph) else k
+    centrality = nx.edge_betweenness_centrality(graph, k=k, seed=seed)
+    return max(centrality, key=centrality.get)
+
+
+def girvan_newman_splits(graph, max_splits=None, k=None, seed=None):
+    communities = set(map(frozenset, nx.connected_components(graph)))
+    roots = list(communities)
+    splits = []
+
+    partitions = nx.community.girvan_newman(graph, partial(most_central_edge, k=k, seed=seed))
+
+    # every partition differs from the previous one by exactly one community split in two
+    for partition in islice(partitions, max_splits):
+        current = set(map(frozenset, partition))
+        (parent,) = communities - current
+        splits.append((parent, *(current - communities)))
+        communities = current
+
+    return roots, splits, communities
+
+
+def splits_to_linkage(roots, splits, leaves):
+    leaves = sorted(leaves, key=lambda community: sorted(map(str, community)))
+    cluster_ids = {community: i for i, community in enumerate(leaves)}
+    cluster_sizes = {community: 1 for community in leaves}
+
+    linkage = []
+
+    def merge(first, second, parent, height):
+        cluster_sizes[parent] = cluster_sizes[first] + cluster_sizes[second]
+        linkage.append([cluster_ids[first], cluster_ids[second], height, cluster_sizes[parent]])
+        cluster_ids[parent] = len(leaves) + len(linkage) - 1
+
+    # the last split is the lowest merge
+    for height, (parent, first, second) in enumerate(reversed(splits), start=1):
+        merge(first, second, parent, float(height))
+
+    top = roots[0]
+    for height, root in enumerate(roots[1:], start=len(splits) + 1):
+        merged = top | root
+        merge(top, root, merged, float(height))
+        top = merged
+
+    return np.array(linkage, dtype=np.float64), leaves
+
+
+def community_label(community):
+    nodes = sorted(map(str, community))
+    return nodes[0] if len(nodes) == 1 else f"{nodes[0]} (+{len(nodes) - 1})"
+
+
+def create_dendrogram(graph, graph_name, max_splits=None, k=None, seed=None):
+    roots, splits, leaves = girvan_newman_splits(graph, max_splits, k, seed)
+    linkage, leaves = splits_to_linkage(roots, splits, leaves)
 
-def create_dendrogram(graph, graph_name):
-    communities = list(nx.community.girvan_newman(graph))
-    print(communities)
-
-    # building initial dict of node_id to each possible subset:
-    node_id = 0
-    init_node2community_dict = {node_id: communities[0][0].union(communities[0][1])}
-    for comm in communities:
-        for subset in list(comm):
-            if subset not in init_node2community_dict.values():
-                node_id += 1
-                init_node2community_dict[node_id] = subset
-
-    # turning this dictionary to the desired format in @mdml's answer
-    node_id_to_children = {e: [] for e in init_node2community_dict.keys()}
-    for node_id1, node_id2 in combinations(init_node2community_dict.keys(), 2):
-        for node_id_parent, group in init_node2community_dict.items():
-            if len(init_node2community_dict[node_id1].intersection(init_node2community_dict[node_id2])) == 0 and group == init_node2community_dict[node_id1].union(init_node2community_dict[node_id2]):
-                node_id_to_children[node_id_parent].append(node_id1)
-                node_id_to_children[node_id_parent].append(node_id2)
-
-    # also recording node_labels dict for the correct label for dendrogram leaves
-    node_labels = dict()
-    for node_id, group in init_node2community_dict.items():
-        if len(group) == 1:
-            node_labels[node_id] = list(group)[0]
-        else:
-            node_labels[node_id] = ''
-
-    # also needing a subset to rank dict to later know within all k-length merges which came first
-    subset_rank_dict = dict()
-    rank = 0
-    for e in communities[::-1]:
-        for p in list(e):
-            if tuple(p) not in subset_rank_dict:
-                subset_rank_dict[tuple(sorted(p))] = rank
-                rank += 1
-    subset_rank_dict[tuple(sorted(chain.from_iterable(communities[-1])))] = rank
-
-    # my function to get a merge height so that it is unique (probably not that efficient)
-    def get_merge_height(sub):
-        sub_tuple = tuple(sorted([node_labels[i] for i in sub]))
-        n = len(sub_tuple)
-        other_same_len_merges = {k: v for k, v in subset_rank_dict.items() if len(k) == n}
-        min_rank, max_rank = min(other_same_len_merges.values()), max(other_same_len_merges.values())
-        range = (max_rank-min_rank) if max_rank > min_rank else 1
-        return float(len(sub)) + 0.8 * (subset_rank_dict[sub_tuple] - min_rank) / range
-
-    graph = nx.DiGraph(node_id_to_children)
-    nodes = graph.nodes()
-    leaves = set(n for n in nodes if graph.out_degree(n) == 0)
-    inner_nodes = [n for n in nodes if graph.out_degree(n) > 0]
-
-    # Compute the size of each subtree
-    subtree = dict((n, [n]) for n in leaves)
-    for u in inner_nodes:
-        children = set()
-        node_list = list(node_id_to_children[u])
-        while len(node_list) > 0:
-            v = node_list.pop(0)
-            children.add(v)
-            node_list += node_id_to_children[v]
-        subtree[u] = sorted(children & leaves)
-
-    inner_nodes.sort(key=lambda n: len(subtree[n]))  # <-- order inner nodes ascending by subtree size, root is last
-
-    # Construct the linkage matrix
-    leaves = sorted(leaves)
-    index  = dict((tuple([n]), i) for i, n in enumerate(leaves))
-    Z = []
-    k = len(leaves)
-    for i, n in enumerate(inner_nodes):
-        children = node_id_to_children[n]
-        x = children[0]
-        for y in children[1:]:
-            z = tuple(sorted(subtree[x] + subtree[y]))
-            i, j = index[tuple(sorted(subtree[x]))], index[tuple(sorted(subtree[y]))]
-            Z.append([i, j, get_merge_height(subtree[n]), len(z)])  # <-- float is required by the dendrogram function
-            index[z] = k
-            subtree[z] = list(z)
-            x = z
-            k += 1
-
-    # dendrogram
     plt.figure()
-    dendrogram(Z, labels=[node_labels[node_id] for node_id in leaves])
+    dendrogram(linkage, labels=[community_label(community) for community in leaves])
     plt.savefig(f"figures/dendrogram_{graph_name}.png")
 
+    return linkage
+
+
+def adjacency_matrix(graph):
+    # scikit-learn's arpack path only accepts 32-bit sparse indices
+    adjacency = nx.adjacency_matrix(graph).astype(np.float64)
+    adjacency.indices = adjacency.indices.astype(np.int32)
+    adjacency.indptr = adjacency.indptr.astype(np.int32)
+    return adjacency
+
+
+def shared_spectral_embedding(adjacency, n_components, seed=None):
+    # the same embedding SpectralClustering computes, solved once for the largest k
+    maps = spectral_embedding(adjacency, n_components=n_components, eigen_solver="arpack",
+                              random_state=seed, drop_first=False)
+
+    # Rayleigh quotients of the recovered eigenvectors give the normalized Laplacian spectrum
+    laplacian, dd = csgraph.laplacian(adjacency, normed=True, return_diag=True)
+    vectors = maps * dd[:, np.newaxis]
+    vectors /= np.linalg.norm(vectors, axis=0)
+    eigenvalues = np.einsum("ij,ij->j", vectors, laplacian @ vectors)
+
+    return maps, eigenvalues
+
+
+def discretize(vectors, random_state, max_svd_restarts=30, n_iter_max=20):
+    # Yu and Shi's multiclass discretization, as in scikit-learn's SpectralClustering(assign_labels="discretize");
+    # kept here so the shared embedding can be discretized without scikit-learn's private module
+    eps = np.finfo(float).eps
+    n_samples, n_components = vectors.shape
+    vectors = vectors.astype(np.float64, copy=True)
+
+    norm_ones = np.sqrt(n_samples)
+    for i in range(n_components):
+        vectors[:, i] = (vectors[:, i] / np.linalg.norm(vectors[:, i])) * norm_ones
+        if vectors[0, i] != 0:
+            vectors[:, i] = -1 * vectors[:, i] * np.sign(vectors[0, i])
+
+    vectors = vectors / np.sqrt((vectors ** 2).sum(axis=1))[:, np.newaxis]
+
+    svd_restarts = 0
+    has_converged = False
+
+    while svd_restarts < max_svd_restarts and not has_converged:
+        rotation = np.zeros((n_components, n_components))
+        rotation[:, 0] = vectors[random_state.randint(n_samples), :].T
+
+        c = np.zeros(n_samples)
+        for j in range(1, n_components):
+            c += np.abs(np.dot(vectors, rotation[:, j - 1]))
+            rotation[:, j] = vectors[c.argmin(), :].T
+
+        last_objective_value = 0.0
+        n_iter = 0
+
+        while not has_converged:
+            n_iter += 1
+
+            labels = np.dot(vectors, rotation).argmax(axis=1)
+            vectors_discrete = csc_array((np.ones(len(labels)), (np.arange(0, n_samples), labels)),
+                                         shape=(n_samples, n_components))
+
+            try:
+                U, S, Vh = np.linalg.svd(vectors_discrete.T @ vectors)
+            except LinAlgError:
+                svd_restarts += 1
+                print("SVD did not converge, randomizing and trying again")
+                break
 
-def spectral_clustering(graph, graph_name):
+            ncut_value = 2.0 * (n_samples - S.sum())
+            if abs(ncut_value - last_objective_value) < eps or n_iter > n_iter_max:
+                has_converged = True
+            else:
+                last_objective_value = ncut_value
+                rotation = np.dot(Vh.T, U.T)
+
+    if not has_converged:
+        raise LinAlgError("SVD did not converge")
+
+    return labels
+
+
+def discretize_embedding(maps, k, seed=None):
+    # replay the arpack start vector draw so labels match SpectralClustering(random_state=seed)
+    random_state = np.random.RandomState(seed)
+    if seed is not None:
+        random_state.uniform(-1, 1, maps.shape[0])
+
+    return discretize(maps[:, :k], random_state)
+
+
+def per_k_labels(adjacency, ks, seed=None):
+    return {k: SpectralClustering(n_clusters=k, assign_labels="discretize", affinity="precomputed",
+                                  random_state=seed).fit(adjacency).labels_ for k in ks}
+
+
+def spectral_labels(graph, ks, seed=None, shared_embedding=True):
+    adjacency = adjacency_matrix(graph)
+
+    # a disconnected graph has one zero Laplacian eigenvalue per component; the basis arpack returns for
+    # that null space depends on the number of requested eigenvectors, so one embedding cannot reproduce
+    # every per-k fit and each k is solved separately
+    components, _ = csgraph.connected_components(adjacency, directed=False)
+
+    if not shared_embedding or components > 1:
+        return per_k_labels(adjacency, ks, seed), None
+
+    maps, eigenvalues = shared_spectral_embedding(adjacency, max(ks) + 1, seed)
+
+    # the same holds for any repeated eigenvalue among the ones used
+    if np.any(np.diff(np.sort(eigenvalues)) < DEGENERATE_GAP):
+        return per_k_labels(adjacency, ks, seed), None
+
+    labels = {k: discretize_embedding(maps, k, seed) for k in ks}
+
+    # gap between the k-th and (k+1)-th smallest eigenvalue
+    eigengaps = {k: eigenvalues[k] - eigenvalues[k - 1] for k in ks}
+
+    return labels, eigengaps
+
+
+def validate_spectral(graph, ks=range(2, 12), seed=0):
+    shared, _ = spectral_labels(graph, ks, seed)
+    separate, _ = spectral_labels(graph, ks, seed, shared_embedding=False)
+    matching = [k for k in ks if np.array_equal(shared[k], separate[k])]
+    print(f"Shared embedding labels equal per-k SpectralClustering for {len(matching)} of {len(ks)} k")
+
+
+def spectral_path(graph_name):
+    return f"models/spectral/{graph_name}".lower()
+
+
+def spectral_partitions(graph_name):
+    # colored graph for any k via spectral_partitions(name).colored_graph(k)
+    return PartitionView(spectral_path(graph_name))
+
+
+def spectral_clustering(graph, graph_name, ks=range(2, 30), seed=None, shared_embedding=True):
     np.set_printoptions(precision=0, suppress=True)
 
-    for k in range(2, 30):
-        clustering = SpectralClustering(n_clusters=k, assign_labels="discretize", affinity="precomputed")\
-            .fit(nx.adjacency_matrix(graph))
+    labels, eigengaps = spectral_labels(graph, ks, seed, shared_embedding)
+
+    for k in ks:
+        cluster_sizes = np.bincount(labels[k], minlength=k)
+
+        gap = "" if eigengaps is None else f" (eigengap {eigengaps[k]:.5f})"
+        print(f"{k:2}-cluster partition{gap}: {cluster_sizes}")
+
+    save_partitions(graph, spectral_path(graph_name), labels)
 
-        colors = clustering.labels_
+    if eigengaps is not None:
+        best_k = max(eigengaps, key=eigengaps.get)
+        print(f"Largest eigengap at k = {best_k}")
+        return labels, best_k
 
-        color_labels = []
-        cluster_sizes = np.zeros(k)
+    return labels, None
 
-        for color in colors:
-            color_labels.append(str(color))
-            cluster_sizes[int(color)] += 1
 
-        colored_graph = nx.Graph()
-        for color, node in zip(color_labels, graph.nodes()):
-            colored_graph.add_node(node, color=color)
+def louvain_path(graph_name):
+    return f"models/louvain/{graph_name}".lower()
 
-        for edge in graph.edges(data=True):
-            colored_graph.add_edge(edge[0], edge[1], weight=edge[2]['weight'])
 
-        nx.write_gml(colored_graph, f"models/spectral/{graph_name}/{graph_name}_spectral_{k}.gml".lower())
+def louvain_partitions(graph_name):
+    # key 0 is the consensus partition, keys 1..runs the individual seeded runs
+    return PartitionView(louvain_path(graph_name))
 
-        print(f"{k:2}-cluster partition: {cluster_sizes}")
+
+def louvain_clustering(graph, graph_name, runs=RUNS, seed=42):
+    labels, partitions, modularity, run_modularity = louvain_communities(graph, runs=runs, seed=seed)
+    community_sizes = np.sort(np.bincount(labels))[::-1]
+
+    print(f"{graph_name} Leiden consensus of {runs} runs: {len(community_sizes)} communities, "
+          f"modularity {modularity:.5f}")
+    print(f"\tRun modularity: mean {np.mean(run_modularity):.5f}, max {np.max(run_modularity):.5f}")
+    print(f"\tLargest communities: {community_sizes[:10].tolist()}")
+
+    save_partitions(graph, louvain_path(graph_name),
+                    {0: labels, **{run: partitions[:, run - 1] for run in range(1, runs + 1)}})
+
+    return labels, modularity
 
 
 def find_brokers(graph, graph_name):
     # broker -> high betweenness centrality + low network constraint
-    centrality = nx.betweenness_centrality(graph, weight="weight")
-
-    if graph.number_of_edges() < 100_000:
-        constraint = nx.constraint(graph, weight="weight")
-    else:
-        constraint = dict([(node, 1.0) for node in graph])
+    centrality = betweenness_centrality(graph, weight="weight")
+    constraint = burt_constraint(graph, weight="weight")
 
     broker_coefficient = dict()
 
@@ -147,26 +283,17 @@ def find_brokers(graph, graph_name):
     data_frame.to_csv(f"result_tables/{graph_name}_brokers.csv".lower())
 
 
-def analyze():
-    SNet = nx.read_gml("models/snet.gml")
-    SNetF = nx.read_gml("models/snetf.gml")
-    SNetT = nx.read_gml("models/snett.gml")
-    UserNet = nx.read_gml("models/usernet.gml")
-
-    graphs = [SNetT]
-    # graphs = [SNet, SNetF, SNetT, UserNet]
-
-    graph_names = ["SNetT"]
-    # graph_names = ["SNet", "SNetF", "SNetT", "UserNet"]
-
-    for graph, graph_name in zip(graphs, graph_names):
-        print(f"Network {graph_name}...")
+ANALYSES = {
+    "dendrogram": create_dendrogram,
+    "spectral": spectral_clustering,
+    "louvain": louvain_clustering,
+    "brokers": find_brokers
+}
 
-        # create_dendrogram(graph, graph_name)
-        spectral_clustering(graph, graph_name)
-        # find_brokers(graph, graph_name)
 
-        print()
+def analyze(graph_names=("SNetT",), analyses=("spectral",), session=None):
+    return run_analyses([(analysis, ANALYSES[analysis]) for analysis in analyses], graph_names, session)
 
 
-analyze()
+if __name__ == "__main__":
+    analyze()
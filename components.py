@@ -0,0 +1,173 @@
+import time
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+from sparse_centrality import to_csr
+
+# breadth-first searches allowed before unresolved eccentricities are left as bounds
+BFS_LIMIT = 1000
+ECCENTRICITY_SAMPLES = 1000
+
+
+def union_find(node_count, sources, targets):
+    # union by minimum root over all edges at once, then full path compression, until every edge is
+    # inside one set; merged edges drop out, so each round only touches edges between different sets
+    parent = np.arange(node_count)
+
+    while len(sources):
+        source_roots, target_roots = parent[sources], parent[targets]
+        active = source_roots != target_roots
+        sources, targets = sources[active], targets[active]
+
+        np.minimum.at(parent, np.maximum(source_roots[active], target_roots[active]),
+                      np.minimum(source_roots[active], target_roots[active]))
+
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    return parent
+
+
+def component_labels(matrix, connection="weak"):
+    # labels numbered by decreasing component size, so component 0 is the giant component
+    if connection == "weak":
+        coo = matrix.tocoo()
+        roots = union_find(matrix.shape[0], coo.row.astype(np.int64), coo.col.astype(np.int64))
+        _, labels = np.unique(roots, return_inverse=True)
+    else:
+        _, labels = csgraph.connected_components(matrix, directed=True, connection="strong")
+
+    sizes = np.bincount(labels)
+    rank = np.empty(len(sizes), dtype=np.int64)
+    rank[np.argsort(-sizes, kind="stable")] = np.arange(len(sizes))
+
+    return rank[labels]
+
+
+def component_sizes(labels):
+    return np.bincount(labels)
+
+
+def giant_component(matrix, connection="weak", labels=None):
+    # node indices of the largest component and its adjacency, sliced from the CSR of the whole graph
+    labels = component_labels(matrix, connection) if labels is None else labels
+    nodes = np.flatnonzero(labels == 0)
+    return nodes, matrix[nodes][:, nodes].tocsr()
+
+
+def _distances(matrix, source):
+    return csgraph.shortest_path(matrix, directed=True, unweighted=True, indices=source)
+
+
+def _pick(scores, degree, unresolved):
+    # the unresolved node with the best score, ties going to the highest degree
+    scores = np.where(unresolved, scores, -np.inf)
+    ties = np.flatnonzero(scores == scores.max())
+    return ties[np.argmax(degree[ties])]
+
+
+def eccentricity_bounds(matrix, directed=False, bfs_limit=BFS_LIMIT):
+    # Takes and Kosters' bounding eccentricities on a connected (strongly, if directed) graph: every BFS
+    # from v tightens d(w, v) <= e(w) <= d(w, v) + e(v) and e(w) >= e(v) - d(v, w) for all w, alternating
+    # sources between the largest upper and the smallest lower bound until the bounds meet
+    node_count = matrix.shape[0]
+    transposed = matrix.T.tocsr() if directed else matrix
+
+    structure = (matrix - sparse.diags(matrix.diagonal())).tocsr()
+    structure.eliminate_zeros()
+    degree = np.diff(structure.indptr)
+
+    lower = np.zeros(node_count)
+    upper = np.full(node_count, np.inf)
+    unresolved = np.ones(node_count, dtype=bool)
+
+    # a leaf is one step further from everything than its only neighbour
+    leaves = np.flatnonzero(degree == 1) if not directed and node_count > 2 else np.array([], dtype=np.int64)
+    anchors = structure.indices[structure.indptr[leaves]]
+    unresolved[leaves] = False
+
+    searches = 0
+    use_upper = True
+
+    while unresolved.any() and searches < bfs_limit:
+        source = _pick(upper if use_upper else -lower, degree, unresolved)
+
+        forward = _distances(matrix, source)
+        backward = _distances(transposed, source) if directed else forward
+        searches += 1 + directed
+
+        if np.isinf(forward).any() or np.isinf(backward).any():
+            raise ValueError("Eccentricities are only finite on a connected graph")
+
+        eccentricity = forward.max()
+        lower = np.maximum(lower, np.maximum(backward, eccentricity - forward))
+        upper = np.minimum(upper, backward + eccentricity)
+        lower[source] = upper[source] = eccentricity
+
+        unresolved &= lower != upper
+        use_upper = not use_upper
+
+    lower[leaves] = lower[anchors] + 1
+    upper[leaves] = upper[anchors] + 1
+
+    return lower, upper, searches
+
+
+def sampled_eccentricities(matrix, samples=ECCENTRICITY_SAMPLES, seed=42):
+    # exact eccentricities of uniformly sampled nodes, an unbiased sample of the distribution
+    rng = np.random.default_rng(seed)
+    node_count = matrix.shape[0]
+    sources = np.arange(node_count) if samples >= node_count else rng.choice(node_count, samples, replace=False)
+
+    return np.array([_distances(matrix, source).max() for source in sources])
+
+
+def distance_matrix(graph, connection="weak"):
+    # giant component adjacency on which distances are finite: undirected for weak connectivity
+    matrix = to_csr(graph, None)
+    directed = graph.is_directed() and connection == "strong"
+
+    if graph.is_directed() and not directed:
+        matrix = (matrix + matrix.T).tocsr()
+
+    nodes, giant = giant_component(matrix, connection)
+    return nodes, giant, directed
+
+
+def validate(graph, connection="weak"):
+    matrix = to_csr(graph, None)
+    labels = component_labels(matrix, connection)
+
+    if graph.is_directed():
+        expected = nx.weakly_connected_components(graph) if connection == "weak" \
+            else nx.strongly_connected_components(graph)
+    else:
+        expected = nx.connected_components(graph)
+    expected_sizes = sorted((len(component) for component in expected), reverse=True)
+    print(f"Component sizes ({connection}) match NetworkX: {component_sizes(labels).tolist() == expected_sizes}")
+
+    nodes, giant, directed = distance_matrix(graph, connection)
+    labels = list(graph)
+    subgraph = graph.subgraph([labels[node] for node in nodes])
+    if graph.is_directed() and not directed:
+        subgraph = subgraph.to_undirected(as_view=True)
+
+    start = time.perf_counter()
+    expected = nx.eccentricity(subgraph)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lower, upper, searches = eccentricity_bounds(giant, directed)
+    backend_time = time.perf_counter() - start
+
+    exact = np.array([expected[labels[node]] for node in nodes])
+    print(f"Eccentricity: NetworkX {reference_time:.3f}s, bounding {backend_time:.3f}s with {searches} BFS, "
+          f"{np.count_nonzero(lower == upper)} of {len(nodes)} nodes resolved, "
+          f"bounds hold: {bool(np.all((lower <= exact) & (exact <= upper)))}, "
+          f"resolved exact: {np.array_equal(lower[lower == upper], exact[lower == upper])}")
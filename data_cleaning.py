@@ -1,39 +1,91 @@
 import glob
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from cleaned_store import count_rows, read_cleaned_data, stored_months, write_cleaned_data
+
+SUBMISSIONS_COLUMNS_TO_DROP = ["created_utc", "url", "permalink", "domain", "distinguished"]
+COMMENTS_COLUMNS_TO_DROP = ["created_utc", "distinguished", "controversiality"]
+
+SCHEMA = {
+    "author": "category",
+    "subreddit": "category",
+    "subreddit_id": "category",
+    "score": "Int32",
+    "num_comments": "Int32",
+    "controversiality": "Int8",
+    "over_18": "boolean",
+    "stickied": "boolean",
+    "locked": "boolean",
+    "hide_score": "boolean"
+}
+
+
+def read_month(filename, month, columns_to_drop):
+    data_frame = pd.read_csv(filename, index_col=0, dtype=SCHEMA,
+                             usecols=lambda column: column not in columns_to_drop)
+    data_frame["month"] = pd.Series(month, index=data_frame.index, dtype="int8")
+    return data_frame
 
-def read_data(directory):
-    data_files = glob.glob(directory + "/*.csv")
-    data_frames = []
 
-    for month, filename in enumerate(data_files):
-        data_frame = pd.read_csv(filename, index_col=0, low_memory=False)
-        data_frame["month"] = month + 1
-        data_frames.append(data_frame)
+def concat_months(data_frames):
+    # categories differ between months, unify them so concat keeps the categorical dtype
+    for column in data_frames[0].select_dtypes("category"):
+        categories = union_categoricals([data_frame[column] for data_frame in data_frames]).categories
+        for data_frame in data_frames:
+            data_frame[column] = data_frame[column].cat.set_categories(categories)
 
     return pd.concat(data_frames, ignore_index=True)
 
 
+def read_data(directory, columns_to_drop=(), processes=None):
+    data_files = sorted(glob.glob(directory + "/*.csv"))
+    months = range(1, len(data_files) + 1)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        data_frames = list(executor.map(partial(read_month, columns_to_drop=set(columns_to_drop)),
+                                        data_files, months))
+
+    return concat_months(data_frames)
+
+
+def remove_unused_categories(data_frame):
+    for column in data_frame.select_dtypes("category"):
+        data_frame[column] = data_frame[column].cat.remove_unused_categories()
+
+    return data_frame
+
+
 def clean_data(data_frame, columns_to_drop, name_id):
 
     data_frame = data_frame[data_frame["id"].notnull()]
-    data_frame = data_frame.drop(columns_to_drop, axis=1)
+    data_frame = data_frame.drop(columns_to_drop, axis=1, errors="ignore")
     data_frame = data_frame[data_frame["author"] != "[deleted]"]
     data_frame = data_frame.rename(columns={"id": name_id})
 
     data_frame.reset_index(drop=True, inplace=True)
     data_frame["id"] = data_frame.index
 
-    return data_frame
+    return remove_unused_categories(data_frame)
+
 
+def remove_unlinked_comments(submissions, comments, known_submissions=None):
+    # known_submissions tells which of the other link ids belong to submissions stored earlier
+    link_ids = comments["link_id"].str.slice(3)
+    linked = link_ids.isin(submissions["submission_id"].unique())
 
-def remove_unlinked_comments(submissions, comments):
-    submission_ids = submissions["submission_id"].unique()
-    comments = comments[comments["link_id"].str.slice(3).isin(submission_ids)]
+    if known_submissions is not None:
+        unmatched = ~linked.to_numpy()
+        linked[unmatched] = known_submissions(link_ids[unmatched].to_numpy(dtype=str))
+
+    comments = comments[linked]
     comments = comments.drop("id", axis=1)
     comments.reset_index(drop=True, inplace=True)
     comments["id"] = comments.index
-    return comments
+    return remove_unused_categories(comments)
 
 
 def print_data_frame(data_frame):
@@ -43,34 +95,57 @@ def print_data_frame(data_frame):
     print()
 
 
-def export_cleaned_data(data_frame, filename):
-    data_frame.to_csv(f"dataset/cleaned/{filename}.csv", index=False)
-    data_frame.to_pickle(f"dataset/cleaned/{filename}")
-
-
 def prepare_data():
     submissions_path = "dataset/reddit_submissions_2008"
     comments_path = "dataset/reddit_comments_2008"
 
-    submissions_columns = ["created_utc", "url", "permalink", "domain", "distinguished"]
-    comments_columns = ["created_utc", "distinguished", "controversiality"]
-
-    submissions = read_data(submissions_path)
-    comments = read_data(comments_path)
+    submissions = read_data(submissions_path, SUBMISSIONS_COLUMNS_TO_DROP)
+    comments = read_data(comments_path, COMMENTS_COLUMNS_TO_DROP)
 
     print_data_frame(submissions)
     print_data_frame(comments)
 
-    submissions = clean_data(submissions, submissions_columns, "submission_id")
+    submissions = clean_data(submissions, SUBMISSIONS_COLUMNS_TO_DROP, "submission_id")
 
-    comments = clean_data(comments, comments_columns, "comment_id")
+    comments = clean_data(comments, COMMENTS_COLUMNS_TO_DROP, "comment_id")
     comments = remove_unlinked_comments(submissions, comments)
 
     print_data_frame(submissions)
     print_data_frame(comments)
 
-    export_cleaned_data(submissions, "submissions")
-    export_cleaned_data(comments, "comments")
+    write_cleaned_data(submissions, "submissions")
+    write_cleaned_data(comments, "comments")
+
+
+def append_month(submissions_file, comments_file, known_submissions=None):
+    month = max(stored_months("submissions"), default=0) + 1
+
+    submissions = read_month(submissions_file, month, set(SUBMISSIONS_COLUMNS_TO_DROP))
+    comments = read_month(comments_file, month, set(COMMENTS_COLUMNS_TO_DROP))
+
+    submissions = clean_data(submissions, SUBMISSIONS_COLUMNS_TO_DROP, "submission_id")
+    comments = clean_data(comments, COMMENTS_COLUMNS_TO_DROP, "comment_id")
+
+    # new comments may belong to submissions from any earlier month; without an index of the stored
+    # submission ids they are all read back from the store
+    if known_submissions is None:
+        submission_ids = pd.concat([read_cleaned_data("submissions", ["submission_id"]),
+                                     submissions[["submission_id"]]], ignore_index=True)
+        comments = remove_unlinked_comments(submission_ids, comments)
+    else:
+        comments = remove_unlinked_comments(submissions, comments, known_submissions)
+
+    # continue the row ids of the months already stored
+    submissions["id"] += count_rows("submissions")
+    comments["id"] += count_rows("comments")
+
+    write_cleaned_data(submissions, "submissions")
+    write_cleaned_data(comments, "comments")
+
+    print(f"Appended month {month}: {len(submissions)} submissions, {len(comments)} comments")
+
+    return month, submissions, comments
 
 
-prepare_data()
+if __name__ == "__main__":
+    prepare_data()
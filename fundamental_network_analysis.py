@@ -1,136 +1,224 @@
-from collections import Counter
-
 import networkx as nx
 import matplotlib.pyplot as plt
-import powerlaw
-from numpy import NaN
+import numpy as np
+
+from assortativity import attribute_assortativity, degree_assortativity
+from clustering import clustering_coefficients, clustering_profile, transitivity, weighted_clustering_profile
+from components import (ECCENTRICITY_SAMPLES, component_labels, component_sizes, distance_matrix,
+                        eccentricity_bounds, sampled_eccentricities)
+from graph_session import run_analyses
+from null_models import REPLICAS, ensemble, z_scores
+from power_law import COMPARISONS, degree_sequences, fit_degree_sequences
+from rich_club import normalized_rich_club
+from small_world import TIME_BUDGET, Z_SCORE, small_world_coefficients
+from sparse_centrality import to_csr
 
 
-def clustering_coefficient_distribution(graph, graph_name, weight):
+def clustering_coefficient_distribution(coefficients, global_clustering, graph_name, weight):
     print("Using edges weight..." if weight else "Without edges weight...")
 
-    average_clustering = nx.average_clustering(graph, weight=weight)
-    clustering_coefficients = [coefficient for coefficient in nx.clustering(graph, weight=weight).values()
-                               if coefficient > 0]
-    global_clustering = max(clustering_coefficients)
+    nonzero_coefficients = coefficients[coefficients > 0]
 
-    print("\tAverage clustering coefficient:", average_clustering)
+    print("\tAverage clustering coefficient:", coefficients.mean())
+    print("\tMaximum clustering coefficient:", nonzero_coefficients.max(initial=0.0))
     print("\tGlobal clustering coefficient: ", global_clustering)
 
-    plt.hist(clustering_coefficients, bins=50)
+    plt.hist(nonzero_coefficients, bins=50)
     plt.gca().set(title=f"{graph_name}", xlabel="Clustering Coefficient", ylabel="Count")
     plt.savefig((f"figures/{graph_name}_cc_dist_" + ("weight" if weight else "no_weight") + ".png").lower())
     plt.clf()
 
 
-def clustering_coefficient_calculation(graph, graph_name, weights):
-    node_count = graph.number_of_nodes()
-    edge_count = graph.number_of_edges()
-    random_network = nx.erdos_renyi_graph(node_count, (2 * edge_count) / ((node_count - 1) * node_count))
-
+def clustering_coefficient_calculation(graph, graph_name, weights, replicas=REPLICAS):
     for weight in weights:
-        clustering_coefficient_distribution(graph, graph_name, weight)
-        clustering_coefficient_distribution(random_network, f"random_{graph_name}", weight)
+        # G(n, m) replicas with the observed weights shuffled over their edges, so weighted clustering
+        # is compared with graphs of the same weight distribution
+        profile = clustering_profile if weight is None else weighted_clustering_profile
+        samples = ensemble(graph, profile, model="gnm", replicas=replicas, weight=weight)
+        random_coefficients, random_transitivity = samples[:, :-1], samples[:, -1]
+        random_metrics = np.column_stack([random_coefficients.mean(axis=1), random_transitivity])
+
+        # one triangle count per graph and weight; every statistic derives from it
+        coefficients = clustering_coefficients(graph, weight)
+
+        clustering_coefficient_distribution(coefficients, transitivity(graph), graph_name, weight)
+        clustering_coefficient_distribution(random_coefficients.ravel(), random_transitivity.mean(),
+                                            f"random_{graph_name}", weight)
 
+        average_z, global_z = z_scores([coefficients.mean(), transitivity(graph)], random_metrics)
+        print(f"\tz-scores against {replicas} G(n, m) graphs: average {average_z:.2f}, global {global_z:.2f}")
 
-def small_world(graph):
+
+def small_world(graph, graph_name, time_budget=TIME_BUDGET):
     if not graph.is_directed():
-        sigma = nx.sigma(graph)
-        omega = nx.omega(graph)
+        coefficients = small_world_coefficients(graph, time_budget=time_budget)
 
-        print(f"Small-world coefficient sigma: {sigma}")
+        print(f"{graph_name} small-world coefficients from {coefficients['random_references']} random and "
+              f"{coefficients['lattice_references']} lattice references ({coefficients['seconds']:.1f}s):")
+        print(f"{graph_name} small-world coefficient sigma: {coefficients['sigma']:.5f} "
+              f"+/- {Z_SCORE * coefficients['sigma_error']:.5f}")
         print("A graph is commonly classified as small-world if sigma > 1")
         print()
-        print(f"Small-world coefficient omega: {omega}")
+        print(f"{graph_name} small-world coefficient omega: {coefficients['omega']:.5f} "
+              f"+/- {Z_SCORE * coefficients['omega_error']:.5f}")
         print("omega =  0 -> graph has small-world characteristics")
         print("omega = -1 -> graph has a lattice shape")
         print("omega =  1 -> random graph")
 
 
-def assortativity_analysis(graph):
-    if graph.is_directed():
-        dac_in = nx.degree_assortativity_coefficient(graph, x="out", y="in")
-        dac_in_weighted = nx.degree_assortativity_coefficient(graph, x="out", y="in", weight="weight")
+def assortativity_analysis(graph, graph_name):
+    print(f"{graph_name} assortativity:")
 
-        print(f"In-degree assortativity coefficient: {dac_in:.5f}")
-        print(f"Weighted in-degree assortativity coefficient: {dac_in_weighted:.5f}")
+    coefficients = degree_assortativity(graph)
 
-        dac_out = nx.degree_assortativity_coefficient(graph, x="in", y="out")
-        dac_out_weighted = nx.degree_assortativity_coefficient(graph, x="in", y="out", weight="weight")
+    if graph.is_directed():
+        print(f"In-degree assortativity coefficient: {coefficients['out', 'in', None]:.5f}")
+        print(f"Weighted in-degree assortativity coefficient: {coefficients['out', 'in', 'weight']:.5f}")
 
-        print(f"Out-degree assortativity coefficient: {dac_out:.5f}")
-        print(f"Weighted out-degree assortativity coefficient: {dac_out_weighted:.5f}")
+        print(f"Out-degree assortativity coefficient: {coefficients['in', 'out', None]:.5f}")
+        print(f"Weighted out-degree assortativity coefficient: {coefficients['in', 'out', 'weight']:.5f}")
+
+        print(f"Out-out assortativity coefficient: {coefficients['out', 'out', None]:.5f}")
+        print(f"In-in assortativity coefficient: {coefficients['in', 'in', None]:.5f}")
     else:
-        dac = nx.degree_assortativity_coefficient(graph)
-        dac_weighted = nx.degree_assortativity_coefficient(graph, weight="weight")
+        print(f"Degree assortativity coefficient: {coefficients['total', 'total', None]:.5f}")
+        print(f"Weighted degree assortativity coefficient: {coefficients['total', 'total', 'weight']:.5f}")
 
-        print(f"Degree assortativity coefficient: {dac:.5f}")
-        print(f"Weighted degree assortativity coefficient: {dac_weighted:.5f}")
+    # SNet marks the subreddits related to the economic crisis
+    if any(attribute == "target" for _, attributes in graph.nodes(data=True) for attribute in attributes):
+        print(f"Target attribute assortativity coefficient: {attribute_assortativity(graph, 'target'):.5f}")
 
 
 def rich_club(graph, graph_name):
     if not graph.is_directed():
-        rc = nx.rich_club_coefficient(graph, normalized=False, seed=42)
+        for weight in [None, "weight"]:
+            print(f"{graph_name} {'weighted ' if weight else ''}rich-club coefficient, normalized by "
+                  f"{REPLICAS} degree-preserving randomizations")
+
+            coefficients, normalized, samples = normalized_rich_club(graph, weight=weight)
+            significant = np.flatnonzero(z_scores(coefficients, samples) > Z_SCORE)
+
+            # degrees whose randomized coefficient is zero give NaN or inf ratios
+            finite = np.flatnonzero(np.isfinite(normalized))
+            if len(finite):
+                degree = finite[np.argmax(normalized[finite])]
+                print(f"\tMaximum normalized coefficient: {normalized[degree]:.5f} at degree {degree}")
+            else:
+                print("\tNo finite normalized coefficient")
+            print(f"\tz > {Z_SCORE} at {len(significant)} of {len(normalized)} degree thresholds"
+                  + (f", the lowest being {significant[0]}" if len(significant) else ""))
+
+            plt.plot(range(len(normalized)), normalized)
+            plt.axhline(1.0, color="gray", linestyle="--")
+            plt.gca().set(title=f"{graph_name}", xlabel="Degree", ylabel="Normalized Rich Club Coefficient")
+            plt.savefig((f"figures/{graph_name}_rich_club" + ("_weighted" if weight else "") + ".png").lower())
+            plt.clf()
 
-        x, y = zip(*rc.items())
 
-        plt.plot(x, y)
-        plt.gca().set(title=f"{graph_name}", xlabel="Degree", ylabel="Rich Club Coefficient")
-        plt.savefig(f"figures/{graph_name}_rich_club.png".lower())
+def degree_distribution(graph, graph_name):
+    sequences = degree_sequences(graph)
+    fits = fit_degree_sequences(sequences)
+
+    for kind, degrees in sequences.items():
+        label = "" if kind == "total" else f"{kind}_"
+        title = "" if kind == "total" else f"{kind.capitalize()}-"
+
+        degree_count = np.bincount(degrees)
+        x = np.flatnonzero(degree_count)
+        y = degree_count[x]
+
+        plt.scatter(x, y, marker=".")
+        plt.gca().set(title=f"{graph_name} {title}Degree Distribution",
+                      xlabel="Degree", xscale="linear", xlim=(1, max(x.max(), 2)),
+                      ylabel="Count", yscale="linear", ylim=(1, max(y.max(), 2)))
+        plt.savefig(f"figures/{graph_name}_{label}degree_distribution.png".lower())
         plt.clf()
 
+        fit = fits[kind]
 
-def degree_distribution(graph, graph_name):
-    degree_sequence = sorted([d for n, d in graph.degree()], reverse=True)
-    degree_count = Counter(degree_sequence)
+        if np.isnan(fit["xmin"]):
+            continue
 
-    x, y = zip(*degree_count.items())
+        print(f"{graph_name} {kind} degree power-law fit:")
+        print(fit["alpha"])
+        print(fit["xmin"])
+        print(fit["sigma"])
 
-    plt.scatter(x, y, marker=".")
-    plt.gca().set(title=f"{graph_name} Degree Distribution",
-                  xlabel="Degree", xscale="linear", xlim=(1, max(x)),
-                  ylabel="Count", yscale="linear", ylim=(1, max(y)))
-    plt.savefig(f"figures/{graph_name}_degree_distribution.png".lower())
-    plt.clf()
+        for distribution in COMPARISONS:
+            print(f"Loglikelihood ratio: {fit[distribution]['R']}")
+            print(f"Statistical significance: {fit[distribution]['p']}")
 
-    results = powerlaw.Fit(degree_sequence)
 
-    if results.power_law.xmin is NaN:
-        return
+def connection_modes(graph):
+    return ["weak", "strong"] if graph.is_directed() else ["weak"]
 
-    print(results.power_law.alpha)
-    print(results.power_law.xmin)
-    print(results.power_law.sigma)
 
-    R, p = results.distribution_compare("power_law", "exponential")
-    print(f"Loglikelihood ratio: {R}")
-    print(f"Statistical significance: {p}")
+def component_analysis(graph, graph_name):
+    for connection in connection_modes(graph):
+        sizes = component_sizes(component_labels(to_csr(graph, None), connection))
+        kind = f"{connection}ly connected " if graph.is_directed() else "connected "
+        suffix = f"_{connection}" if graph.is_directed() else ""
 
-    R, p = results.distribution_compare("power_law", "truncated_power_law")
-    print(f"Loglikelihood ratio: {R}")
-    print(f"Statistical significance: {p}")
+        print(f"{graph_name} {kind}components: {len(sizes)}")
+        print(f"\tGiant component: {sizes[0]} nodes ({sizes[0] / len(graph):.2%})")
+        print(f"\tSecond largest component: {sizes[1] if len(sizes) > 1 else 0} nodes")
 
+        size_count = np.bincount(sizes)
+        x = np.flatnonzero(size_count)
 
-def analyze():
-    SNet = nx.read_gml("models/snet.gml")
-    SNetF = nx.read_gml("models/snetf.gml")
-    SNetT = nx.read_gml("models/snett.gml")
-    UserNet = nx.read_gml("models/usernet.gml")
+        plt.scatter(x, size_count[x], marker=".")
+        plt.gca().set(title=f"{graph_name}", xlabel="Component Size", xscale="log", ylabel="Count", yscale="log")
+        plt.savefig(f"figures/{graph_name}_cc_size_distribution{suffix}.png".lower())
+        plt.clf()
 
-    graphs = [SNetT]
-    # graphs = [SNet, SNetF, SNetT, UserNet]
-    graph_names = ["SNet", "SNetF", "SNetT", "UserNet"]
 
-    for graph, graph_name in zip(graphs, graph_names):
-        print(f"Network {graph_name}...")
+def eccentricity_analysis(graph, graph_name, samples=ECCENTRICITY_SAMPLES):
+    # exact eccentricities of the giant component where the bounds converge, sampled sources otherwise
+    for connection in connection_modes(graph):
+        nodes, giant, directed = distance_matrix(graph, connection)
+        lower, upper, searches = eccentricity_bounds(giant, directed)
+        resolved = np.count_nonzero(lower == upper)
+        kind = f"{connection} " if graph.is_directed() else ""
+        suffix = f"_{connection}" if graph.is_directed() else ""
+
+        print(f"{graph_name} eccentricity of the {kind}giant component ({len(nodes)} nodes, {searches} BFS):")
+        print(f"\tDiameter: {lower.max():.0f}" if upper.max() == lower.max()
+              else f"\tDiameter between {lower.max():.0f} and {upper.max():.0f}")
+        print(f"\tRadius: {upper.min():.0f}" if upper.min() == lower.min()
+              else f"\tRadius between {lower.min():.0f} and {upper.min():.0f}")
+
+        if resolved == len(nodes):
+            eccentricities = lower
+        else:
+            print(f"\t{len(nodes) - resolved} eccentricities unresolved, distribution from {samples} sampled nodes")
+            eccentricities = sampled_eccentricities(giant, samples)
+
+        values, counts = np.unique(eccentricities.astype(np.int64), return_counts=True)
+
+        plt.bar(values, counts / counts.sum())
+        plt.gca().set(title=f"{graph_name}", xlabel="Eccentricity", ylabel="Fraction of Nodes")
+        plt.savefig(f"figures/{graph_name}_eccentricity_distribution{suffix}.png".lower())
+        plt.clf()
 
-        # clustering_coefficient_calculation(graph, graph_name, [None, "weight"])
-        # small_world(graph)
-        assortativity_analysis(graph)
-        # rich_club(graph, graph_name)
-        # degree_distribution(graph, graph_name)
 
-        print()
+def clustering_analysis(graph, graph_name):
+    clustering_coefficient_calculation(graph, graph_name, [None, "weight"])
+
+
+ANALYSES = {
+    "clustering": clustering_analysis,
+    "small_world": small_world,
+    "assortativity": assortativity_analysis,
+    "rich_club": rich_club,
+    "degree_distribution": degree_distribution,
+    "components": component_analysis,
+    "eccentricity": eccentricity_analysis
+}
+
+
+def analyze(graph_names=("SNetT",), analyses=("assortativity",), session=None):
+    return run_analyses([(analysis, ANALYSES[analysis]) for analysis in analyses], graph_names, session)
 
 
-analyze()
+if __name__ == "__main__":
+    analyze()
@@ -0,0 +1,82 @@
+import argparse
+import importlib
+
+from graph_storage import load_graph
+
+NETWORKS = {
+    "SNet": "models/snet",
+    "SNetF": "models/snetf",
+    "SNetT": "models/snett",
+    "UserNet": "models/usernet"
+}
+
+MODULES = {
+    "fundamental": "fundamental_network_analysis",
+    "centrality": "centrality_analysis",
+    "communities": "communities_detection"
+}
+
+
+class GraphSession:
+    # Loads each network the first time it is requested and keeps it for the rest of the process.
+
+    def __init__(self, networks=None):
+        self.paths = dict(NETWORKS if networks is None else networks)
+        self.graphs = {}
+
+    def __getitem__(self, graph_name):
+        if graph_name not in self.graphs:
+            print(f"Loading {graph_name}...")
+            self.graphs[graph_name] = load_graph(self.paths[graph_name])
+
+        return self.graphs[graph_name]
+
+    def __contains__(self, graph_name):
+        return graph_name in self.paths
+
+    def evict(self, graph_name):
+        self.graphs.pop(graph_name, None)
+
+
+def resolve_analyses(names):
+    # "centrality" selects every analysis of a module, "centrality.katz" a single one
+    analyses = []
+
+    for name in names:
+        module_name, _, analysis_name = name.partition(".")
+        table = importlib.import_module(MODULES[module_name]).ANALYSES
+        selected = [analysis_name] if analysis_name else list(table)
+        analyses += [(f"{module_name}.{analysis}", table[analysis]) for analysis in selected]
+
+    return analyses
+
+
+def run_analyses(analyses, graph_names, session=None):
+    session = GraphSession() if session is None else session
+
+    for graph_name in graph_names:
+        print(f"Network {graph_name}...")
+
+        for _, analysis in analyses:
+            analysis(session[graph_name], graph_name)
+
+        print()
+
+    return session
+
+
+def run(analyses, graph_names, session=None):
+    return run_analyses(resolve_analyses(analyses), graph_names, session)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run network analyses in a single process.")
+    parser.add_argument("analyses", nargs="+", help="module (e.g. centrality) or module.analysis (e.g. centrality.katz)")
+    parser.add_argument("--networks", nargs="+", default=list(NETWORKS), choices=list(NETWORKS))
+    arguments = parser.parse_args()
+
+    run(arguments.analyses, arguments.networks)
+
+
+if __name__ == "__main__":
+    main()
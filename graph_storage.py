@@ -0,0 +1,300 @@
+import json
+import os
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+MODELS_PATH = "models"
+MODEL_NAMES = ["snet", "snetf", "snett", "usernet"]
+
+
+class StoredGraph:
+    # CSR adjacency with a node-label table and attribute columns aligned to nodes / CSR entries.
+    # Undirected graphs store both directions of every edge, self-loops once.
+
+    def __init__(self, directed, labels, indptr, indices, node_attributes=None, edge_attributes=None):
+        self.directed = directed
+        self.labels = labels
+        self.indptr = indptr
+        self.indices = indices
+        self.node_attributes = node_attributes or {}
+        self.edge_attributes = edge_attributes or {}
+
+    @property
+    def number_of_nodes(self):
+        return len(self.indptr) - 1
+
+    # enough of the NetworkX graph interface for to_csr and KatzSolver
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return self.number_of_nodes
+
+    def is_directed(self):
+        return self.directed
+
+    def sources(self):
+        return np.repeat(np.arange(self.number_of_nodes), np.diff(self.indptr))
+
+    def edge_mask(self):
+        # every stored entry for directed graphs, one entry per undirected edge otherwise
+        return slice(None) if self.directed else self.sources() <= self.indices
+
+    def csr(self, weight="weight"):
+        n = self.number_of_nodes
+        data = self.edge_attributes[weight] if weight in self.edge_attributes else np.ones(len(self.indices))
+        return sparse.csr_matrix((np.asarray(data, dtype=np.float64), self.indices, self.indptr), shape=(n, n))
+
+
+def encode_labels(labels):
+    encoded = [str(label).encode("utf-8") for label in labels]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(label) for label in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def decode_labels(data, offsets):
+    buffer = data.tobytes()
+    return [buffer[start:end].decode("utf-8") for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+
+def attribute_column(values):
+    if all(isinstance(value, bool) for value in values):
+        return np.array(values, dtype=bool)
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values if value is not None):
+        values = [np.nan if value is None else value for value in values]
+        return np.array(values, dtype=np.int64 if all(isinstance(v, int) for v in values) else np.float64)
+    return np.array(["" if value is None else str(value) for value in values])
+
+
+def from_networkx(graph):
+    labels = list(graph)
+    index = {node: i for i, node in enumerate(labels)}
+
+    node_keys = sorted(set().union(*(attrs.keys() for _, attrs in graph.nodes(data=True))))
+    node_attributes = {key: attribute_column([attrs.get(key) for _, attrs in graph.nodes(data=True)])
+                       for key in node_keys}
+
+    edges = list(graph.edges(data=True))
+    sources = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    targets = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+
+    edge_keys = sorted(set().union(*(attrs.keys() for _, _, attrs in edges)))
+    edge_attributes = {key: attribute_column([attrs.get(key) for _, _, attrs in edges]) for key in edge_keys}
+
+    return from_edges(graph.is_directed(), labels, sources, targets, node_attributes, edge_attributes)
+
+
+def from_edges(directed, labels, sources, targets, node_attributes=None, edge_attributes=None):
+    edge_attributes = edge_attributes or {}
+
+    if not directed:
+        mirrored = sources != targets
+        sources, targets = np.concatenate([sources, targets[mirrored]]), np.concatenate([targets, sources[mirrored]])
+        edge_attributes = {key: np.concatenate([column, column[mirrored]]) for key, column in edge_attributes.items()}
+
+    order = np.lexsort((targets, sources))
+    indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=len(labels)), out=indptr[1:])
+
+    return StoredGraph(directed, list(labels), indptr, targets[order],
+                       node_attributes, {key: column[order] for key, column in edge_attributes.items()})
+
+
+def masked_graph(stored, edge_mask=None, node_mask=None):
+    # subgraph of the kept CSR entries between the kept nodes; entries stay in CSR order, so the result
+    # is valid without sorting, and node indices are remapped with a cumulative count of kept nodes
+    n = stored.number_of_nodes
+    node_mask = np.ones(n, dtype=bool) if node_mask is None else np.asarray(node_mask, dtype=bool)
+    keep = np.ones(len(stored.indices), dtype=bool) if edge_mask is None else np.asarray(edge_mask, dtype=bool)
+
+    sources = stored.sources()
+    keep = keep & node_mask[sources] & node_mask[stored.indices]
+
+    codes = np.cumsum(node_mask) - 1
+    kept_nodes = np.flatnonzero(node_mask)
+
+    indptr = np.zeros(len(kept_nodes) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes[sources[keep]], minlength=len(kept_nodes)), out=indptr[1:])
+
+    return StoredGraph(stored.directed, [stored.labels[i] for i in kept_nodes.tolist()], indptr,
+                       codes[stored.indices[keep]],
+                       {key: column[node_mask] for key, column in stored.node_attributes.items()},
+                       {key: column[keep] for key, column in stored.edge_attributes.items()})
+
+
+def permuted_graph(stored, order):
+    # the same graph with its nodes in a new order; node i of the result is node order[i]
+    order = np.asarray(order, dtype=np.int64)
+    codes = np.empty(len(order), dtype=np.int64)
+    codes[order] = np.arange(len(order))
+
+    sources, targets = codes[stored.sources()], codes[stored.indices]
+    entries = np.lexsort((targets, sources))
+    indptr = np.zeros(len(order) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=len(order)), out=indptr[1:])
+
+    return StoredGraph(stored.directed, [stored.labels[i] for i in order.tolist()], indptr, targets[entries],
+                       {key: column[order] for key, column in stored.node_attributes.items()},
+                       {key: column[entries] for key, column in stored.edge_attributes.items()})
+
+
+def to_networkx(stored):
+    graph = nx.DiGraph() if stored.directed else nx.Graph()
+
+    node_columns = {key: column.tolist() for key, column in stored.node_attributes.items()}
+    graph.add_nodes_from((label, {key: column[i] for key, column in node_columns.items()})
+                         for i, label in enumerate(stored.labels))
+
+    mask = stored.edge_mask()
+    labels = np.array(stored.labels, dtype=object)
+    sources = labels[stored.sources()[mask]].tolist()
+    targets = labels[stored.indices[mask]].tolist()
+    edge_columns = {key: column[mask].tolist() for key, column in stored.edge_attributes.items()}
+
+    if list(edge_columns) == ["weight"]:
+        graph.add_weighted_edges_from(zip(sources, targets, edge_columns["weight"]))
+    else:
+        graph.add_edges_from((u, v, {key: column[i] for key, column in edge_columns.items()})
+                             for i, (u, v) in enumerate(zip(sources, targets)))
+
+    return graph
+
+
+def save_stored_graph(stored, path):
+    os.makedirs(path, exist_ok=True)
+
+    label_data, label_offsets = encode_labels(stored.labels)
+    arrays = {"indptr": stored.indptr, "indices": stored.indices,
+              "label_data": label_data, "label_offsets": label_offsets}
+    arrays.update({f"node_{key}": column for key, column in stored.node_attributes.items()})
+    arrays.update({f"edge_{key}": column for key, column in stored.edge_attributes.items()})
+
+    # written next to the old file and renamed over it, so readers that memory-mapped it keep a valid copy
+    for name, array in arrays.items():
+        temporary = os.path.join(path, f"{name}.tmp.npy")
+        np.save(temporary, np.asarray(array))
+        os.replace(temporary, os.path.join(path, f"{name}.npy"))
+
+    meta = {"directed": stored.directed,
+            "node_attributes": list(stored.node_attributes),
+            "edge_attributes": list(stored.edge_attributes)}
+    with open(os.path.join(path, "meta.json"), "w") as meta_file:
+        json.dump(meta, meta_file)
+
+
+def load_stored_graph(path, memory_map=True):
+    mmap_mode = "r" if memory_map else None
+
+    def array(name):
+        return np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+
+    with open(os.path.join(path, "meta.json")) as meta_file:
+        meta = json.load(meta_file)
+
+    return StoredGraph(meta["directed"],
+                       decode_labels(array("label_data"), array("label_offsets")),
+                       array("indptr"), array("indices"),
+                       {key: array(f"node_{key}") for key in meta["node_attributes"]},
+                       {key: array(f"edge_{key}") for key in meta["edge_attributes"]})
+
+
+def entry_positions(indptr, indices, rows, columns):
+    # CSR position of every (row, column) entry, or where it would be inserted, from a binary search inside
+    # each row; only the compared entries of a memory-mapped indices array are read
+    low = np.asarray(indptr[rows], dtype=np.int64)
+    end = np.asarray(indptr[rows + 1], dtype=np.int64)
+    high = end.copy()
+
+    while True:
+        searching = np.flatnonzero(low < high)
+        if not len(searching):
+            break
+
+        middle = (low[searching] + high[searching]) // 2
+        smaller = np.asarray(indices[middle]) < columns[searching]
+        low[searching] = np.where(smaller, middle + 1, low[searching])
+        high[searching] = np.where(smaller, high[searching], middle)
+
+    found = np.zeros(len(rows), dtype=bool)
+    inside = np.flatnonzero(low < end)
+    found[inside] = np.asarray(indices[low[inside]]) == columns[inside]
+
+    return low, found
+
+
+def add_edge_weights(path, sources, targets, weights, new_labels=(), new_node_attributes=None, weight="weight"):
+    # adds weights to the edges of a stored graph, creating missing edges and appending new nodes, and
+    # returns the resulting weight of every (source, target); when no edge is created the weight column
+    # is updated in place through its memory map, otherwise the new entries are spliced into the arrays
+    stored = load_stored_graph(path)
+    node_count = stored.number_of_nodes + len(new_labels)
+    indptr = np.concatenate([stored.indptr, np.full(len(new_labels), stored.indptr[-1])])
+
+    sources, targets = np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64)
+    rows, columns, values = sources, targets, np.asarray(weights, dtype=np.float64)
+
+    if not stored.directed:
+        mirrored = rows != columns
+        rows, columns = np.concatenate([rows, columns[mirrored]]), np.concatenate([columns, rows[mirrored]])
+        values = np.concatenate([values, values[mirrored]])
+
+    keys, inverse = np.unique(rows * node_count + columns, return_inverse=True)
+    values = np.bincount(inverse, values, minlength=len(keys))
+    rows, columns = keys // node_count, keys % node_count
+
+    positions, found = entry_positions(indptr, stored.indices, rows, columns)
+    weight_path = os.path.join(path, f"edge_{weight}.npy")
+
+    if found.all() and not len(new_labels):
+        column = np.load(weight_path, mmap_mode="r+")
+        column[positions] += values.astype(column.dtype)
+        column.flush()
+        updated = np.asarray(column[positions], dtype=np.float64)
+    else:
+        # existing entries shift by the number of entries inserted at or before them
+        insertions = positions[~found]
+        shifted = positions + np.searchsorted(insertions, positions, side="right")
+        shifted[~found] = insertions + np.arange(len(insertions))
+
+        edge_attributes = {key: np.insert(np.asarray(column), insertions, np.zeros(1, dtype=column.dtype))
+                           for key, column in stored.edge_attributes.items()}
+        edge_attributes[weight][shifted] += values.astype(edge_attributes[weight].dtype)
+        updated = edge_attributes[weight][shifted].astype(np.float64)
+
+        counts = np.bincount(rows[~found], minlength=node_count)
+        indptr = indptr + np.concatenate([[0], np.cumsum(counts)])
+
+        new_node_attributes = new_node_attributes or {}
+        node_attributes = {key: np.concatenate([np.asarray(column), np.asarray(
+            new_node_attributes.get(key, np.zeros(len(new_labels), dtype=column.dtype)), dtype=column.dtype)])
+            for key, column in stored.node_attributes.items()}
+
+        save_stored_graph(StoredGraph(stored.directed, stored.labels + list(new_labels), indptr,
+                                      np.insert(np.asarray(stored.indices), insertions, columns[~found]),
+                                      node_attributes, edge_attributes), path)
+
+    return updated[np.searchsorted(keys, sources * node_count + targets)]
+
+
+def save_graph(graph, path):
+    save_stored_graph(from_networkx(graph), path)
+
+
+def load_graph(path, memory_map=True):
+    return to_networkx(load_stored_graph(path, memory_map))
+
+
+def convert_gml_models(names=MODEL_NAMES):
+    for name in names:
+        gml_path = f"{MODELS_PATH}/{name}.gml"
+
+        if os.path.exists(gml_path):
+            save_graph(nx.read_gml(gml_path), f"{MODELS_PATH}/{name}")
+            print(f"Converted {gml_path} -> {MODELS_PATH}/{name}")
+
+
+if __name__ == "__main__":
+    convert_gml_models()
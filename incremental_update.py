@@ -0,0 +1,331 @@
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from cleaned_store import read_cleaned_data
+from data_cleaning import append_month
+from graph_storage import add_edge_weights, decode_labels, encode_labels, load_stored_graph
+from katz import KatzSolver
+from network_modeling import (SUBREDDIT_FILTER, WEIGHT_THRESHOLD, ComembershipAccumulator, build_accumulator,
+                              generate_snet, generate_snet_filtered, generate_snet_target, generate_user_network)
+from sharded_index import ShardedIndex
+from sparse_centrality import leading_eigenpair, to_csr
+
+SNET_STATE_PATH = "models/snet_comembership.npz"
+CENTRALITY_STATE_PATH = "models/centrality"
+# id -> author and label -> node position indexes; kept outside the graph directories, which are hashed whole
+INDEX_PATH = "models/incremental"
+
+# relative edge-weight change since the last full recompute that triggers a new one
+DRIFT_THRESHOLD = 0.1
+CHUNK_SIZE = 1_000_000
+
+
+class CentralityState:
+    # Degree, eigenvector and Katz scores of one network, kept between monthly updates.
+
+    def __init__(self, nodes, degree, eigenvector, eigenvalue, katz, alpha, mass, drift=0.0):
+        self.nodes = nodes
+        self.degree = degree
+        self.eigenvector = eigenvector
+        self.eigenvalue = eigenvalue
+        self.katz = katz
+        self.alpha = alpha
+        self.mass = mass
+        self.drift = drift
+
+    def aligned(self, nodes):
+        # previous values in the order of `nodes`; nodes that are new get the mean as a starting guess.
+        # updates only append nodes, so the previous nodes are usually a prefix and align by position
+        if nodes[:len(self.nodes)] == list(self.nodes):
+            positions = np.concatenate([np.arange(len(self.nodes)), np.full(len(nodes) - len(self.nodes), -1)])
+        else:
+            index = {node: i for i, node in enumerate(self.nodes)}
+            positions = np.array([index.get(node, -1) for node in nodes])
+        known = positions >= 0
+
+        def align(values, fill):
+            result = np.full(len(nodes), fill, dtype=np.float64)
+            result[known] = values[positions[known]]
+            return result
+
+        return (align(self.degree, 0.0), align(self.eigenvector, self.eigenvector.mean()),
+                align(self.katz, self.katz.mean()))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        label_data, label_offsets = encode_labels(self.nodes)
+
+        np.savez(path, label_data=label_data, label_offsets=label_offsets, degree=self.degree,
+                 eigenvector=self.eigenvector, katz=self.katz,
+                 scalars=np.array([self.eigenvalue, self.alpha, self.mass, self.drift]))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as state:
+            eigenvalue, alpha, mass, drift = state["scalars"].tolist()
+            return cls(decode_labels(state["label_data"], state["label_offsets"]), state["degree"],
+                       state["eigenvector"], eigenvalue, state["katz"], alpha, mass, drift)
+
+
+def weight_mass(stored):
+    return float(np.asarray(stored.edge_attributes["weight"])[stored.edge_mask()].sum())
+
+
+def degrees(stored):
+    # NetworkX degrees from the CSR structure: in + out for directed graphs, undirected self-loops twice
+    n = stored.number_of_nodes
+    degree = np.diff(stored.indptr).astype(np.float64)
+
+    if stored.directed:
+        degree += np.bincount(stored.indices, minlength=n)
+    else:
+        sources = stored.sources()
+        degree += np.bincount(sources[sources == stored.indices], minlength=n)
+
+    return degree
+
+
+def matrices(stored):
+    matrix = to_csr(stored, "weight")
+    return matrix.T.tocsr() if stored.directed else matrix
+
+
+def full_recompute(stored):
+    print("Full centrality recompute")
+    nodes = stored.labels
+
+    eigenvalue, eigenvector = leading_eigenpair(matrices(stored), not stored.directed)
+
+    solver = KatzSolver(stored, radius=eigenvalue)
+    katz = solver.solve_unnormalized(np.ones((len(nodes), 1)))[:, 0]
+
+    return CentralityState(nodes, degrees(stored), eigenvector, eigenvalue, katz, solver.alpha, weight_mass(stored))
+
+
+def incremental_recompute(stored, state, mass_change, drift_threshold):
+    drift = state.drift + mass_change / max(state.mass, 1.0)
+
+    if drift > drift_threshold:
+        return full_recompute(stored)
+
+    nodes = stored.labels
+    _, eigenvector, katz = state.aligned(nodes)
+
+    eigenvalue, eigenvector = leading_eigenpair(matrices(stored), not stored.directed, v0=eigenvector)
+
+    # alpha stays fixed between full recomputes so scores remain comparable month to month
+    if state.alpha * eigenvalue >= 1.0:
+        return full_recompute(stored)
+
+    solver = KatzSolver(stored, alpha=state.alpha, radius=eigenvalue, method="iterative")
+    katz = solver.solve_unnormalized(np.ones((len(nodes), 1)), start=katz[:, np.newaxis])[:, 0]
+
+    return CentralityState(nodes, degrees(stored), eigenvector, eigenvalue, katz, state.alpha, state.mass, drift)
+
+
+def write_top(nodes, scores, column, file_name):
+    data_frame = pd.DataFrame(scores, index=nodes, columns=[column])
+
+    data_frame.sort_values(by=column, ascending=False, inplace=True)
+    data_frame = data_frame.head(10)
+    data_frame.to_csv(file_name.lower())
+
+
+def update_centralities(stored, graph_name, mass_change, drift_threshold=DRIFT_THRESHOLD):
+    path = f"{CENTRALITY_STATE_PATH}/{graph_name}.npz".lower()
+
+    if os.path.exists(path):
+        state = incremental_recompute(stored, CentralityState.load(path), mass_change, drift_threshold)
+    else:
+        state = full_recompute(stored)
+
+    state.save(path)
+
+    n = len(state.nodes)
+    katz = state.katz / (np.sign(state.katz.sum()) * np.linalg.norm(state.katz))
+
+    write_top(state.nodes, state.degree / max(n - 1, 1), "DC", f"result_tables/{graph_name}_DC.csv")
+    write_top(state.nodes, state.eigenvector, "EVC", f"result_tables/{graph_name}_EVC.csv")
+    write_top(state.nodes, katz, "Katz", f"result_tables/{graph_name}_katz.csv")
+
+    return state
+
+
+def author_labels(authors):
+    # missing authors become "", which never takes part in an interaction
+    return authors.astype(object).where(authors.notna(), "").to_numpy(dtype=str)
+
+
+def index_authors(index, data_frame, id_column):
+    index.add(data_frame[id_column].to_numpy(dtype=str), author_labels(data_frame["author"]))
+
+
+def author_indexes():
+    submission_authors = ShardedIndex(f"{INDEX_PATH}/submission_authors")
+    comment_authors = ShardedIndex(f"{INDEX_PATH}/comment_authors")
+
+    # one-off bootstrap from the months that are already stored
+    if not submission_authors.exists():
+        index_authors(submission_authors, read_cleaned_data("submissions", ["submission_id", "author"]),
+                      "submission_id")
+    if not comment_authors.exists():
+        index_authors(comment_authors, read_cleaned_data("comments", ["comment_id", "author"]), "comment_id")
+
+    return submission_authors, comment_authors
+
+
+def node_positions(name, path, labels):
+    # positions of labels in a stored graph, new labels numbered after its current nodes; the index is
+    # returned so it is only extended once the graph itself holds the new nodes
+    index = ShardedIndex(f"{INDEX_PATH}/{name}_nodes")
+
+    if not index.exists():
+        stored_labels = np.array(load_stored_graph(path).labels, dtype=str)
+        index.add(stored_labels, np.arange(len(stored_labels)))
+
+    unique, inverse = np.unique(labels, return_inverse=True)
+    positions = index.lookup(unique, -1)
+
+    new = positions < 0
+    positions[new] = len(index) + np.arange(new.sum())
+
+    return positions[inverse], unique[new], positions[new], index
+
+
+def derived_networks(threshold):
+    # SNetF shares the SNet node order; derived networks that do not match are generated once from SNet
+    stored = load_stored_graph("models/snet")
+
+    if not os.path.exists("models/snetf/meta.json") or \
+            len(load_stored_graph("models/snetf").indptr) != len(stored.indptr):
+        generate_snet_filtered(stored, threshold)
+    if not os.path.exists("models/snett/meta.json"):
+        generate_snet_target(stored, SUBREDDIT_FILTER)
+
+
+def update_snet(month, submissions, comments, chunk_size, threshold=WEIGHT_THRESHOLD):
+    if os.path.exists(SNET_STATE_PATH):
+        accumulator = ComembershipAccumulator.load(SNET_STATE_PATH)
+    else:
+        # one-off bootstrap from the months that are already part of models/snet
+        accumulator = build_accumulator(chunk_size, range(1, month))
+
+    derived_networks(threshold)
+
+    activity = pd.concat([submissions[["author", "subreddit"]], comments[["author", "subreddit"]]],
+                         ignore_index=True)
+    delta = sparse.triu(accumulator.update(activity), k=1).tocoo()
+
+    # every subreddit is an SNet node, also the ones without co-members yet
+    subreddits = np.array(accumulator.subreddits(), dtype=str)
+    positions, new_labels, new_positions, nodes = node_positions("snet", "models/snet", subreddits)
+    new_attributes = {"target": np.isin(new_labels, SUBREDDIT_FILTER)}
+
+    sources, targets = positions[delta.row], positions[delta.col]
+    weights = add_edge_weights("models/snet", sources, targets, delta.data, new_labels, new_attributes)
+
+    # SNetF gains the whole weight of edges that cross the threshold and the increment of the others
+    kept = weights > threshold
+    increments = np.where(weights - delta.data > threshold, delta.data, weights)
+    add_edge_weights("models/snetf", sources[kept], targets[kept], increments[kept], new_labels, new_attributes)
+
+    # SNetT already holds every target subreddit
+    target_index = pd.Index(load_stored_graph("models/snett").labels)
+    target_sources = target_index.get_indexer(subreddits[delta.row])
+    target_targets = target_index.get_indexer(subreddits[delta.col])
+    inside = (target_sources >= 0) & (target_targets >= 0)
+    add_edge_weights("models/snett", target_sources[inside], target_targets[inside], delta.data[inside])
+
+    nodes.add(new_labels, new_positions)
+    accumulator.save(SNET_STATE_PATH)
+
+    mass_change = float(delta.data.sum())
+    print(f"SNet: {len(new_labels)} new subreddits, {np.count_nonzero(weights == delta.data)} new edges, "
+          f"weight +{mass_change:.0f}")
+
+    return mass_change
+
+
+def interaction_pairs(comments, submission_authors, comment_authors):
+    # commenter -> submitter for every comment and parent author -> replier for every reply
+    commenters = author_labels(comments["author"])
+    submitters = submission_authors.lookup(comments["link_id"].str.slice(3).to_numpy(dtype=str), "")
+    parents = comment_authors.lookup(comments["parent_id"].str.slice(3).to_numpy(dtype=str), "")
+
+    sources = np.concatenate([commenters, parents])
+    targets = np.concatenate([submitters, commenters])
+    kept = (sources != "") & (targets != "") & (sources != targets)
+
+    return sources[kept], targets[kept]
+
+
+def update_user_network(comments, submission_authors, comment_authors):
+    # only the new comments create interactions; their parents are looked up in the author indexes
+    sources, targets = interaction_pairs(comments, submission_authors, comment_authors)
+
+    positions, new_labels, new_positions, nodes = node_positions("usernet", "models/usernet",
+                                                                 np.concatenate([sources, targets]))
+    add_edge_weights("models/usernet", positions[:len(sources)], positions[len(sources):],
+                     np.ones(len(sources)), new_labels)
+    nodes.add(new_labels, new_positions)
+
+    print(f"UserNet: {len(new_labels)} new users, weight +{len(sources)}")
+
+    return float(len(sources))
+
+
+def update_month(submissions_file, comments_file, drift_threshold=DRIFT_THRESHOLD, chunk_size=CHUNK_SIZE):
+    submission_authors, comment_authors = author_indexes()
+    month, submissions, comments = append_month(submissions_file, comments_file, submission_authors.contains)
+
+    index_authors(submission_authors, submissions, "submission_id")
+    index_authors(comment_authors, comments, "comment_id")
+
+    snet_mass = update_snet(month, submissions, comments, chunk_size)
+    usernet_mass = update_user_network(comments, submission_authors, comment_authors)
+
+    update_centralities(load_stored_graph("models/snet"), "SNet", snet_mass, drift_threshold)
+    update_centralities(load_stored_graph("models/usernet"), "UserNet", usernet_mass, drift_threshold)
+
+
+def network_edges(path):
+    # label-keyed view of a stored network that does not depend on its node order
+    stored = load_stored_graph(path)
+    labels = np.array(stored.labels, dtype=object)
+    mask = stored.edge_mask()
+
+    pairs = zip(labels[stored.sources()[mask]].tolist(), labels[stored.indices[mask]].tolist())
+    keys = pairs if stored.directed else map(frozenset, pairs)
+    return set(stored.labels), dict(zip(keys, np.asarray(stored.edge_attributes["weight"])[mask].tolist()))
+
+
+def rebuild_networks(chunk_size=CHUNK_SIZE):
+    generate_snet(SUBREDDIT_FILTER, chunk_size)
+    SNet = load_stored_graph("models/snet")
+    generate_snet_filtered(SNet, WEIGHT_THRESHOLD)
+    generate_snet_target(SNet, SUBREDDIT_FILTER)
+    generate_user_network(chunk_size=chunk_size)
+
+    # the rebuilt networks have a new node order, so their positions are indexed again on the next update
+    for name in ["snet", "usernet"]:
+        shutil.rmtree(f"{INDEX_PATH}/{name}_nodes", ignore_errors=True)
+
+
+def validate(submissions_file, comments_file, chunk_size=CHUNK_SIZE):
+    update_month(submissions_file, comments_file, chunk_size=chunk_size)
+    names = ["snet", "snetf", "snett", "usernet"]
+    incremental = {name: network_edges(f"models/{name}") for name in names}
+
+    rebuild_networks(chunk_size)
+
+    for name in names:
+        print(f"{name}: incremental update equals full rebuild: {incremental[name] == network_edges(f'models/{name}')}")
+
+
+if __name__ == "__main__":
+    update_month(sys.argv[1], sys.argv[2])
@@ -0,0 +1,312 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+from sparse_centrality import to_csr
+from workers import worker_count
+
+RUNS = 8
+CONSENSUS_THRESHOLD = 0.5
+CONSENSUS_ROUNDS = 5
+MIN_GAIN = 1e-12
+
+_worker_matrix = None
+
+
+def _init_worker(matrix):
+    global _worker_matrix
+    _worker_matrix = matrix
+
+
+def quality_matrix(graph, weight="weight"):
+    # W such that Q = sum_ij W_ij [c_i = c_j] / M - gamma sum_c K_c^out K_c^in / M^2 with M = sum W;
+    # undirected self-loops count twice, as in nx.community.modularity
+    matrix = to_csr(graph, weight)
+
+    if not graph.is_directed():
+        matrix = matrix + sparse.diags(matrix.diagonal())
+
+    return matrix.tocsr()
+
+
+def compact(labels):
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def _membership(labels):
+    return sparse.csr_matrix((np.ones(len(labels)), labels, np.arange(len(labels) + 1)),
+                             shape=(len(labels), labels.max() + 1))
+
+
+class ModularityGraph:
+    # Strengths and symmetrized links of one level of the aggregation, with the modularity gains of moves.
+
+    def __init__(self, matrix, resolution=1.0):
+        self.matrix = matrix.tocsr()
+        self.node_count = matrix.shape[0]
+        self.resolution = resolution
+
+        self.out_strength = np.asarray(self.matrix.sum(axis=1)).ravel()
+        self.in_strength = np.asarray(self.matrix.sum(axis=0)).ravel()
+        self.total = self.out_strength.sum()
+
+        # a move changes Q by the links in both directions, so gains are computed on W + W^T
+        self.symmetric = (self.matrix + self.matrix.T).tocsr()
+        self.loops = self.symmetric.diagonal()
+
+        links = self.symmetric.tocoo()
+        self.rows, self.columns, self.weights = links.row.astype(np.int64), links.col.astype(np.int64), links.data
+
+        entries = self.matrix.tocoo()
+        self.entry_rows, self.entry_columns, self.entry_weights = entries.row, entries.col, entries.data
+
+    def totals(self, labels, communities=None):
+        communities = labels.max() + 1 if communities is None else communities
+        return (np.bincount(labels, self.out_strength, minlength=communities),
+                np.bincount(labels, self.in_strength, minlength=communities))
+
+    def modularity(self, labels):
+        internal = self.entry_weights[labels[self.entry_rows] == labels[self.entry_columns]].sum()
+        out_totals, in_totals = self.totals(labels)
+        return internal / self.total - self.resolution * (out_totals @ in_totals) / self.total ** 2
+
+    def _expected(self, nodes, out_totals, in_totals):
+        return self.resolution * (self.out_strength[nodes] * in_totals + self.in_strength[nodes] * out_totals) \
+            / self.total ** 2
+
+    def best_moves(self, labels, nodes, allowed=None):
+        # the best neighbouring community of every node, gain relative to staying, positive gains only
+        out_totals, in_totals = self.totals(labels)
+        links = (self.symmetric[nodes] @ _membership(labels)).tocoo()
+
+        entry_nodes, targets, weights = nodes[links.row], links.col, links.data
+        own = targets == labels[entry_nodes]
+
+        # staying: links and strengths of the own community without the node itself
+        own_links = np.bincount(links.row, np.where(own, weights, 0.0), minlength=len(nodes)) - self.loops[nodes]
+        current = labels[nodes]
+        stay = own_links / self.total - self._expected(nodes, out_totals[current] - self.out_strength[nodes],
+                                                       in_totals[current] - self.in_strength[nodes])
+
+        gains = weights / self.total - self._expected(entry_nodes, out_totals[targets], in_totals[targets]) \
+            - stay[links.row]
+
+        valid = ~own & (gains > MIN_GAIN)
+        if allowed is not None:
+            valid &= allowed(entry_nodes, targets)
+
+        entry_nodes, targets, gains = entry_nodes[valid], targets[valid], gains[valid]
+        order = np.lexsort((-gains, entry_nodes))
+        first = order[np.concatenate([[True], entry_nodes[order][1:] != entry_nodes[order][:-1]])] \
+            if len(order) else order
+
+        return entry_nodes[first], targets[first], gains[first]
+
+    def independent(self, candidates, rng):
+        # candidates without a neighbouring candidate of higher random priority; such moves do not
+        # change each other's link terms
+        priority = np.full(self.node_count, -1.0)
+        priority[candidates] = rng.random(len(candidates))
+
+        conflict = (priority[self.rows] >= 0) & (priority[self.columns] > priority[self.rows]) \
+            & (self.rows != self.columns)
+        blocked = np.zeros(self.node_count, dtype=bool)
+        blocked[self.rows[conflict]] = True
+
+        return ~blocked[candidates]
+
+    def apply(self, labels, quality, movers, targets, gains):
+        # the expected-weight terms of simultaneous moves interact, so Q is checked and the weakest half
+        # of the moves dropped until the round improves it
+        order = np.argsort(-gains, kind="stable")
+        movers, targets = movers[order], targets[order]
+
+        while len(movers):
+            moved = labels.copy()
+            moved[movers] = targets
+            moved_quality = self.modularity(moved)
+
+            if moved_quality > quality:
+                return moved, moved_quality, movers
+
+            movers, targets = movers[:len(movers) // 2], targets[:len(targets) // 2]
+
+        return labels, quality, movers
+
+    def neighbours(self, nodes):
+        return np.unique(self.symmetric[nodes].indices)
+
+    def move_nodes(self, labels, rng):
+        # Louvain local moving in synchronous rounds; only neighbours of moved nodes and candidates that
+        # lost a conflict are reconsidered
+        quality = self.modularity(labels)
+        active = np.arange(self.node_count)
+
+        while len(active):
+            candidates, targets, gains = self.best_moves(labels, active)
+            if not len(candidates):
+                break
+
+            chosen = self.independent(candidates, rng)
+            labels, quality, moved = self.apply(labels, quality, candidates[chosen], targets[chosen], gains[chosen])
+            if not len(moved):
+                break
+
+            active = np.union1d(self.neighbours(moved), candidates[~chosen])
+
+        return compact(labels)
+
+    def well_connected(self, refined, communities):
+        # Leiden's condition for a subcluster T of community C: links between T and C - T at least the
+        # expected weight gamma (K_T^out (K_C^in - K_T^in) + K_T^in (K_C^out - K_T^out)) / M
+        same_community = communities[self.rows] == communities[self.columns]
+        same_cluster = refined[self.rows] == refined[self.columns]
+        external = np.bincount(refined[self.rows], self.weights * (same_community & ~same_cluster),
+                               minlength=refined.max() + 1)
+
+        cluster_out, cluster_in = self.totals(refined)
+        community_out, community_in = self.totals(communities)
+        parents = np.zeros(len(cluster_out), dtype=np.int64)
+        parents[refined] = communities
+
+        expected = self.resolution * (cluster_out * (community_in[parents] - cluster_in)
+                                      + cluster_in * (community_out[parents] - cluster_out)) / self.total
+        return external >= expected
+
+    def refine(self, communities, rng):
+        # Leiden refinement: well-connected singletons merge greedily into well-connected subclusters of
+        # their own community; movers are independent and only join clusters they link to, so every
+        # subcluster stays connected
+        refined = np.arange(self.node_count)
+        quality = self.modularity(refined)
+
+        while True:
+            connected = self.well_connected(refined, communities)
+            singleton = np.bincount(refined, minlength=self.node_count)[refined] == 1
+            active = np.flatnonzero(singleton & connected[refined])
+
+            parents = np.zeros(self.node_count, dtype=np.int64)
+            parents[refined] = communities
+
+            def allowed(nodes, targets):
+                return (parents[targets] == communities[nodes]) & connected[targets]
+
+            candidates, targets, gains = self.best_moves(refined, active, allowed)
+            if not len(candidates):
+                break
+
+            chosen = self.independent(candidates, rng)
+            refined, quality, moved = self.apply(refined, quality, candidates[chosen], targets[chosen],
+                                                 gains[chosen])
+            if not len(moved):
+                break
+
+        return compact(refined)
+
+    def aggregate(self, labels):
+        membership = _membership(labels)
+        return ModularityGraph((membership.T @ self.matrix @ membership).tocsr(), self.resolution)
+
+
+def louvain(matrix, resolution=1.0, refine=True, seed=None):
+    # community label per node; with refine, communities are aggregated through Leiden's refined
+    # partition, which keeps them connected, instead of being aggregated directly
+    rng = np.random.default_rng(seed)
+    level = ModularityGraph(matrix, resolution)
+    membership = np.arange(level.node_count)
+    labels = np.arange(level.node_count)
+
+    if level.total == 0:
+        return labels
+
+    while True:
+        labels = level.move_nodes(labels, rng)
+        if labels.max() + 1 == level.node_count:
+            break
+
+        clusters = level.refine(labels, rng) if refine else labels
+        if clusters.max() + 1 == level.node_count:
+            break
+
+        parents = np.zeros(clusters.max() + 1, dtype=np.int64)
+        parents[clusters] = labels
+
+        membership = clusters[membership]
+        level = level.aggregate(clusters)
+        labels = parents
+
+    return compact(labels[membership])
+
+
+def _run(seed, resolution, refine):
+    return louvain(_worker_matrix, resolution, refine, seed)
+
+
+def louvain_runs(matrix, runs=RUNS, resolution=1.0, refine=True, seed=42, processes=None):
+    # one column of labels per seeded run
+    seeds = np.random.SeedSequence(seed).generate_state(runs).tolist()
+    run = partial(_run, resolution=resolution, refine=refine)
+    processes = worker_count(processes)
+
+    if processes == 1 or runs == 1:
+        _init_worker(matrix)
+        partitions = list(map(run, seeds))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(matrix,)) as executor:
+            partitions = list(executor.map(run, seeds))
+
+    return np.column_stack(partitions)
+
+
+def consensus(matrix, partitions, threshold=CONSENSUS_THRESHOLD, rounds=CONSENSUS_ROUNDS, resolution=1.0,
+              refine=True, seed=42, processes=None):
+    # Lancichinetti and Fortunato's consensus clustering: links weighted by the share of runs that put
+    # their endpoints together, weak agreements dropped, and the result clustered again until all runs agree
+    structure = ModularityGraph(matrix)
+    links = structure.rows != structure.columns
+    rows, columns = structure.rows[links], structure.columns[links]
+
+    for round_seed in np.random.SeedSequence(seed).generate_state(rounds).tolist():
+        agreement = (partitions[rows] == partitions[columns]).mean(axis=1)
+        if np.all((agreement == 0) | (agreement == 1)):
+            break
+
+        keep = agreement >= threshold
+        agreement_matrix = sparse.csr_matrix((agreement[keep], (rows[keep], columns[keep])), shape=matrix.shape)
+        partitions = louvain_runs(agreement_matrix, partitions.shape[1], resolution, refine, round_seed, processes)
+
+    qualities = [structure.modularity(labels) for labels in partitions.T]
+    return partitions[:, int(np.argmax(qualities))]
+
+
+def communities(graph, weight="weight", runs=RUNS, resolution=1.0, refine=True, seed=42, processes=None):
+    # consensus labels in graph node order, with the modularity of the consensus and of every run
+    matrix = quality_matrix(graph, weight)
+    partitions = louvain_runs(matrix, runs, resolution, refine, seed, processes)
+    labels = consensus(matrix, partitions, resolution=resolution, refine=refine, seed=seed, processes=processes)
+
+    quality = ModularityGraph(matrix, resolution)
+    return labels, partitions, quality.modularity(labels), [quality.modularity(run) for run in partitions.T]
+
+
+def validate(graph, weight="weight", seed=42):
+    start = time.perf_counter()
+    expected = nx.community.louvain_communities(graph, weight=weight, seed=seed)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labels = louvain(quality_matrix(graph, weight), seed=seed)
+    backend_time = time.perf_counter() - start
+
+    nodes = list(graph)
+    partition = [{nodes[i] for i in np.flatnonzero(labels == label)} for label in range(labels.max() + 1)]
+    reported = ModularityGraph(quality_matrix(graph, weight)).modularity(labels)
+
+    print(f"Louvain: NetworkX {reference_time:.3f}s, {len(expected)} communities, "
+          f"modularity {nx.community.modularity(graph, expected, weight=weight):.5f}; "
+          f"CSR Leiden {backend_time:.3f}s, {len(partition)} communities, "
+          f"modularity {nx.community.modularity(graph, partition, weight=weight):.5f} (reported {reported:.5f})")
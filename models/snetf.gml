@@ -1,66331 +0,0 @@
-graph [
-  node [
-    id 0
-    label "myparkingsign"
-  ]
-  node [
-    id 1
-    label "dezan"
-  ]
-  node [
-    id 2
-    label "flying"
-  ]
-  node [
-    id 3
-    label "marcusjjam"
-  ]
-  node [
-    id 4
-    label "citylocalbelfast"
-  ]
-  node [
-    id 5
-    label "as3"
-  ]
-  node [
-    id 6
-    label "livableplaces"
-  ]
-  node [
-    id 7
-    label "Jeannes"
-  ]
-  node [
-    id 8
-    label "Rubens"
-  ]
-  node [
-    id 9
-    label "bestentrepbooks"
-  ]
-  node [
-    id 10
-    label "interesting"
-  ]
-  node [
-    id 11
-    label "Ornella"
-  ]
-  node [
-    id 12
-    label "jenkem"
-  ]
-  node [
-    id 13
-    label "zeuux"
-  ]
-  node [
-    id 14
-    label "Bellydance"
-  ]
-  node [
-    id 15
-    label "ActivistNow"
-  ]
-  node [
-    id 16
-    label "MarketingBabe"
-  ]
-  node [
-    id 17
-    label "FunStuff"
-  ]
-  node [
-    id 18
-    label "energyefficiency"
-  ]
-  node [
-    id 19
-    label "noshit"
-  ]
-  node [
-    id 20
-    label "rosslinks"
-  ]
-  node [
-    id 21
-    label "CADCAM"
-  ]
-  node [
-    id 22
-    label "CelebrityBabyGossip"
-  ]
-  node [
-    id 23
-    label "washingtondc"
-  ]
-  node [
-    id 24
-    label "jun"
-  ]
-  node [
-    id 25
-    label "onlysc"
-  ]
-  node [
-    id 26
-    label "Intubate"
-  ]
-  node [
-    id 27
-    label "LittletonCoinCompany"
-  ]
-  node [
-    id 28
-    label "ExecNetProperties"
-  ]
-  node [
-    id 29
-    label "EntertainMe"
-  ]
-  node [
-    id 30
-    label "clao"
-  ]
-  node [
-    id 31
-    label "8bit"
-  ]
-  node [
-    id 32
-    label "virtualworlds"
-  ]
-  node [
-    id 33
-    label "sailing"
-  ]
-  node [
-    id 34
-    label "PlanetaCiencia"
-  ]
-  node [
-    id 35
-    label "webbuzzz"
-  ]
-  node [
-    id 36
-    label "lullaby"
-  ]
-  node [
-    id 37
-    label "prnine"
-  ]
-  node [
-    id 38
-    label "financialmarkets"
-  ]
-  node [
-    id 39
-    label "radhoo"
-  ]
-  node [
-    id 40
-    label "Zharster"
-  ]
-  node [
-    id 41
-    label "dostuff"
-  ]
-  node [
-    id 42
-    label "sushi"
-  ]
-  node [
-    id 43
-    label "Jennifer"
-  ]
-  node [
-    id 44
-    label "AmericanHistory"
-  ]
-  node [
-    id 45
-    label "charts"
-  ]
-  node [
-    id 46
-    label "VotingReddit"
-  ]
-  node [
-    id 47
-    label "GLIS663"
-  ]
-  node [
-    id 48
-    label "interface_design"
-  ]
-  node [
-    id 49
-    label "ClandestineMarketing"
-  ]
-  node [
-    id 50
-    label "Dimas"
-  ]
-  node [
-    id 51
-    label "ffxi"
-  ]
-  node [
-    id 52
-    label "Wahido"
-  ]
-  node [
-    id 53
-    label "Vietnameasytravel"
-  ]
-  node [
-    id 54
-    label "Libertarian"
-  ]
-  node [
-    id 55
-    label "editgrid"
-  ]
-  node [
-    id 56
-    label "Tesla"
-  ]
-  node [
-    id 57
-    label "EverythingThai"
-  ]
-  node [
-    id 58
-    label "Richien"
-  ]
-  node [
-    id 59
-    label "MMJ"
-  ]
-  node [
-    id 60
-    label "rudiemods"
-  ]
-  node [
-    id 61
-    label "tala"
-  ]
-  node [
-    id 62
-    label "compaign"
-  ]
-  node [
-    id 63
-    label "pinkfloyd"
-  ]
-  node [
-    id 64
-    label "Boise"
-  ]
-  node [
-    id 65
-    label "classicReddit"
-  ]
-  node [
-    id 66
-    label "WiscMUG"
-  ]
-  node [
-    id 67
-    label "furry"
-  ]
-  node [
-    id 68
-    label "NatGeo"
-  ]
-  node [
-    id 69
-    label "maxtou"
-  ]
-  node [
-    id 70
-    label "beyou"
-  ]
-  node [
-    id 71
-    label "chess"
-  ]
-  node [
-    id 72
-    label "thetansonly"
-  ]
-  node [
-    id 73
-    label "timelapses"
-  ]
-  node [
-    id 74
-    label "Harvard"
-  ]
-  node [
-    id 75
-    label "cityofangels"
-  ]
-  node [
-    id 76
-    label "casinostags"
-  ]
-  node [
-    id 77
-    label "muxtape"
-  ]
-  node [
-    id 78
-    label "BloZip"
-  ]
-  node [
-    id 79
-    label "podcasts"
-  ]
-  node [
-    id 80
-    label "Webbook"
-  ]
-  node [
-    id 81
-    label "Empowerednurse"
-  ]
-  node [
-    id 82
-    label "culturalstudies"
-  ]
-  node [
-    id 83
-    label "jobinterviews"
-  ]
-  node [
-    id 84
-    label "thamiz"
-  ]
-  node [
-    id 85
-    label "britishcolumbia"
-  ]
-  node [
-    id 86
-    label "2008is1929"
-  ]
-  node [
-    id 87
-    label "winhid"
-  ]
-  node [
-    id 88
-    label "economics2"
-  ]
-  node [
-    id 89
-    label "scrapir"
-  ]
-  node [
-    id 90
-    label "Triduanus"
-  ]
-  node [
-    id 91
-    label "mac"
-  ]
-  node [
-    id 92
-    label "drblog"
-  ]
-  node [
-    id 93
-    label "cute04"
-  ]
-  node [
-    id 94
-    label "unfunny"
-  ]
-  node [
-    id 95
-    label "spiritual"
-  ]
-  node [
-    id 96
-    label "timperry42"
-  ]
-  node [
-    id 97
-    label "Badass"
-  ]
-  node [
-    id 98
-    label "gr8buy"
-  ]
-  node [
-    id 99
-    label "depraved"
-  ]
-  node [
-    id 100
-    label "Celtic"
-  ]
-  node [
-    id 101
-    label "jengajam"
-  ]
-  node [
-    id 102
-    label "London_News"
-  ]
-  node [
-    id 103
-    label "TrafficSchool"
-  ]
-  node [
-    id 104
-    label "algorithm"
-  ]
-  node [
-    id 105
-    label "MICROTEST"
-  ]
-  node [
-    id 106
-    label "smart"
-  ]
-  node [
-    id 107
-    label "conspiracy"
-  ]
-  node [
-    id 108
-    label "blackberrynation"
-  ]
-  node [
-    id 109
-    label "thesayer"
-  ]
-  node [
-    id 110
-    label "Teachforever"
-  ]
-  node [
-    id 111
-    label "iran"
-  ]
-  node [
-    id 112
-    label "finnish"
-  ]
-  node [
-    id 113
-    label "MAXSPEED"
-  ]
-  node [
-    id 114
-    label "Switzerland"
-  ]
-  node [
-    id 115
-    label "longisland"
-  ]
-  node [
-    id 116
-    label "Kristronline"
-  ]
-  node [
-    id 117
-    label "fetish"
-  ]
-  node [
-    id 118
-    label "entertainment"
-  ]
-  node [
-    id 119
-    label "eberling"
-  ]
-  node [
-    id 120
-    label "totosoft"
-  ]
-  node [
-    id 121
-    label "Purdue"
-  ]
-  node [
-    id 122
-    label "consultingblog"
-  ]
-  node [
-    id 123
-    label "Jokes"
-  ]
-  node [
-    id 124
-    label "Cephalopods"
-  ]
-  node [
-    id 125
-    label "Honorcide"
-  ]
-  node [
-    id 126
-    label "MomsRule"
-  ]
-  node [
-    id 127
-    label "hilmy"
-  ]
-  node [
-    id 128
-    label "Bratz"
-  ]
-  node [
-    id 129
-    label "samokrutka"
-  ]
-  node [
-    id 130
-    label "zope"
-  ]
-  node [
-    id 131
-    label "Zinemaya"
-  ]
-  node [
-    id 132
-    label "Woerterbuecher"
-  ]
-  node [
-    id 133
-    label "Stardom"
-  ]
-  node [
-    id 134
-    label "testreddittryitfornj"
-  ]
-  node [
-    id 135
-    label "ScrapMetalPrices"
-  ]
-  node [
-    id 136
-    label "programmingbooks"
-  ]
-  node [
-    id 137
-    label "SocialNews"
-  ]
-  node [
-    id 138
-    label "kansascity"
-  ]
-  node [
-    id 139
-    label "womenofreddit"
-  ]
-  node [
-    id 140
-    label "Stratfor"
-  ]
-  node [
-    id 141
-    label "graphics"
-  ]
-  node [
-    id 142
-    label "RockYourWeb"
-  ]
-  node [
-    id 143
-    label "nightnightly"
-  ]
-  node [
-    id 144
-    label "productivity"
-  ]
-  node [
-    id 145
-    label "ja"
-  ]
-  node [
-    id 146
-    label "altaVoz"
-  ]
-  node [
-    id 147
-    label "anime"
-  ]
-  node [
-    id 148
-    label "techculture"
-  ]
-  node [
-    id 149
-    label "markymark"
-  ]
-  node [
-    id 150
-    label "Wolffe"
-  ]
-  node [
-    id 151
-    label "CODEcontent"
-  ]
-  node [
-    id 152
-    label "ads"
-  ]
-  node [
-    id 153
-    label "Buffalo"
-  ]
-  node [
-    id 154
-    label "FelonReports"
-  ]
-  node [
-    id 155
-    label "pancreaticcancer"
-  ]
-  node [
-    id 156
-    label "graphicnovels"
-  ]
-  node [
-    id 157
-    label "USMLEMD"
-  ]
-  node [
-    id 158
-    label "AlquileresArgentina"
-  ]
-  node [
-    id 159
-    label "visualeffects"
-  ]
-  node [
-    id 160
-    label "lispclub"
-  ]
-  node [
-    id 161
-    label "Lechnacom"
-  ]
-  node [
-    id 162
-    label "Travelchacha"
-  ]
-  node [
-    id 163
-    label "Zonker"
-  ]
-  node [
-    id 164
-    label "explolab"
-  ]
-  node [
-    id 165
-    label "ShowtimeTees"
-  ]
-  node [
-    id 166
-    label "weed"
-  ]
-  node [
-    id 167
-    label "orlando"
-  ]
-  node [
-    id 168
-    label "meron5"
-  ]
-  node [
-    id 169
-    label "PHANTOMAVRI"
-  ]
-  node [
-    id 170
-    label "Slimemolds"
-  ]
-  node [
-    id 171
-    label "JamesAddison"
-  ]
-  node [
-    id 172
-    label "insideYC"
-  ]
-  node [
-    id 173
-    label "bdsm"
-  ]
-  node [
-    id 174
-    label "infosthetics"
-  ]
-  node [
-    id 175
-    label "aldimeola"
-  ]
-  node [
-    id 176
-    label "VenezuelaReddit"
-  ]
-  node [
-    id 177
-    label "Rule_34"
-  ]
-  node [
-    id 178
-    label "angrykeyboarder"
-  ]
-  node [
-    id 179
-    label "cogsci"
-  ]
-  node [
-    id 180
-    label "tabletucker"
-  ]
-  node [
-    id 181
-    label "mike918999"
-  ]
-  node [
-    id 182
-    label "SamReddit"
-  ]
-  node [
-    id 183
-    label "Demoscene"
-  ]
-  node [
-    id 184
-    label "BeyondWords"
-  ]
-  node [
-    id 185
-    label "impoliteconversation"
-  ]
-  node [
-    id 186
-    label "HouseGarden"
-  ]
-  node [
-    id 187
-    label "bioreddit"
-  ]
-  node [
-    id 188
-    label "TechDispenser"
-  ]
-  node [
-    id 189
-    label "organic"
-  ]
-  node [
-    id 190
-    label "EugeneOnline"
-  ]
-  node [
-    id 191
-    label "Fran"
-  ]
-  node [
-    id 192
-    label "dior_lei"
-  ]
-  node [
-    id 193
-    label "redditCANADA"
-  ]
-  node [
-    id 194
-    label "whinybitchcirclejerk"
-  ]
-  node [
-    id 195
-    label "Dr_Horrible"
-  ]
-  node [
-    id 196
-    label "braga"
-  ]
-  node [
-    id 197
-    label "Fabrizio"
-  ]
-  node [
-    id 198
-    label "DanSturgis"
-  ]
-  node [
-    id 199
-    label "Subprime"
-  ]
-  node [
-    id 200
-    label "amitshah"
-  ]
-  node [
-    id 201
-    label "broccoli"
-  ]
-  node [
-    id 202
-    label "webanalyticsblog"
-  ]
-  node [
-    id 203
-    label "bangladesh"
-  ]
-  node [
-    id 204
-    label "brentpurves"
-  ]
-  node [
-    id 205
-    label "spanishlanguagenerds"
-  ]
-  node [
-    id 206
-    label "swissinfo"
-  ]
-  node [
-    id 207
-    label "redditAnswers"
-  ]
-  node [
-    id 208
-    label "jac481"
-  ]
-  node [
-    id 209
-    label "osbgroup"
-  ]
-  node [
-    id 210
-    label "Tandberg"
-  ]
-  node [
-    id 211
-    label "translation"
-  ]
-  node [
-    id 212
-    label "ipv6"
-  ]
-  node [
-    id 213
-    label "BlackBlog"
-  ]
-  node [
-    id 214
-    label "inspirational"
-  ]
-  node [
-    id 215
-    label "PoliticalHumor"
-  ]
-  node [
-    id 216
-    label "wesnoth"
-  ]
-  node [
-    id 217
-    label "bestdamntech"
-  ]
-  node [
-    id 218
-    label "personalRss"
-  ]
-  node [
-    id 219
-    label "ANALI"
-  ]
-  node [
-    id 220
-    label "torus"
-  ]
-  node [
-    id 221
-    label "amateurradio"
-  ]
-  node [
-    id 222
-    label "hurricane"
-  ]
-  node [
-    id 223
-    label "ftw"
-  ]
-  node [
-    id 224
-    label "turkalo"
-  ]
-  node [
-    id 225
-    label "persuasivecontent"
-  ]
-  node [
-    id 226
-    label "woz"
-  ]
-  node [
-    id 227
-    label "gamereviews"
-  ]
-  node [
-    id 228
-    label "artofpickup"
-  ]
-  node [
-    id 229
-    label "Qyam"
-  ]
-  node [
-    id 230
-    label "Kucinich"
-  ]
-  node [
-    id 231
-    label "cocoa"
-  ]
-  node [
-    id 232
-    label "self2"
-  ]
-  node [
-    id 233
-    label "networking"
-  ]
-  node [
-    id 234
-    label "biassaid"
-  ]
-  node [
-    id 235
-    label "geeky"
-  ]
-  node [
-    id 236
-    label "Icreon"
-  ]
-  node [
-    id 237
-    label "TasteCast"
-  ]
-  node [
-    id 238
-    label "whowantslove"
-  ]
-  node [
-    id 239
-    label "RBT"
-  ]
-  node [
-    id 240
-    label "backdropsource"
-  ]
-  node [
-    id 241
-    label "racing"
-  ]
-  node [
-    id 242
-    label "churchvisions"
-  ]
-  node [
-    id 243
-    label "thelazyslackerblog"
-  ]
-  node [
-    id 244
-    label "James1234"
-  ]
-  node [
-    id 245
-    label "vancec"
-  ]
-  node [
-    id 246
-    label "pomppoker"
-  ]
-  node [
-    id 247
-    label "GlobalEconomy"
-  ]
-  node [
-    id 248
-    label "sheddit"
-  ]
-  node [
-    id 249
-    label "RushLimbaugh"
-  ]
-  node [
-    id 250
-    label "chicagotribune"
-  ]
-  node [
-    id 251
-    label "technews"
-  ]
-  node [
-    id 252
-    label "Dwight"
-  ]
-  node [
-    id 253
-    label "RealLifeSketch"
-  ]
-  node [
-    id 254
-    label "akilito"
-  ]
-  node [
-    id 255
-    label "medicalscience"
-  ]
-  node [
-    id 256
-    label "aww"
-  ]
-  node [
-    id 257
-    label "Glorycamp"
-  ]
-  node [
-    id 258
-    label "drudgereport"
-  ]
-  node [
-    id 259
-    label "outdoorsmen"
-  ]
-  node [
-    id 260
-    label "BMW"
-  ]
-  node [
-    id 261
-    label "meetup"
-  ]
-  node [
-    id 262
-    label "Anarcho_Capitalism"
-  ]
-  node [
-    id 263
-    label "CallForPapers"
-  ]
-  node [
-    id 264
-    label "virals"
-  ]
-  node [
-    id 265
-    label "Diggolo"
-  ]
-  node [
-    id 266
-    label "themintchicks"
-  ]
-  node [
-    id 267
-    label "osx"
-  ]
-  node [
-    id 268
-    label "duwanis"
-  ]
-  node [
-    id 269
-    label "GlobalWarming"
-  ]
-  node [
-    id 270
-    label "shaku1981"
-  ]
-  node [
-    id 271
-    label "beef"
-  ]
-  node [
-    id 272
-    label "Fivelead"
-  ]
-  node [
-    id 273
-    label "Jaden"
-  ]
-  node [
-    id 274
-    label "runetnews"
-  ]
-  node [
-    id 275
-    label "lily"
-  ]
-  node [
-    id 276
-    label "captainnachopants"
-  ]
-  node [
-    id 277
-    label "mensa"
-  ]
-  node [
-    id 278
-    label "Uberazzi"
-  ]
-  node [
-    id 279
-    label "ben"
-  ]
-  node [
-    id 280
-    label "vagina"
-  ]
-  node [
-    id 281
-    label "onlinegames"
-  ]
-  node [
-    id 282
-    label "FirefoxAddons"
-  ]
-  node [
-    id 283
-    label "gossip"
-  ]
-  node [
-    id 284
-    label "shtruc"
-  ]
-  node [
-    id 285
-    label "LoveMugs"
-  ]
-  node [
-    id 286
-    label "curiosity"
-  ]
-  node [
-    id 287
-    label "serialkiller"
-  ]
-  node [
-    id 288
-    label "FineArt"
-  ]
-  node [
-    id 289
-    label "ASC"
-  ]
-  node [
-    id 290
-    label "uponthousands"
-  ]
-  node [
-    id 291
-    label "IPhoneApps"
-  ]
-  node [
-    id 292
-    label "geyik"
-  ]
-  node [
-    id 293
-    label "talespinner"
-  ]
-  node [
-    id 294
-    label "WendyM"
-  ]
-  node [
-    id 295
-    label "racism"
-  ]
-  node [
-    id 296
-    label "Jacob"
-  ]
-  node [
-    id 297
-    label "Igor"
-  ]
-  node [
-    id 298
-    label "updates"
-  ]
-  node [
-    id 299
-    label "quotes"
-  ]
-  node [
-    id 300
-    label "IraqDeathToll"
-  ]
-  node [
-    id 301
-    label "Music"
-  ]
-  node [
-    id 302
-    label "efluential"
-  ]
-  node [
-    id 303
-    label "BlackMarket"
-  ]
-  node [
-    id 304
-    label "tanjit"
-  ]
-  node [
-    id 305
-    label "travel"
-  ]
-  node [
-    id 306
-    label "interviewquestions"
-  ]
-  node [
-    id 307
-    label "Dipsy"
-  ]
-  node [
-    id 308
-    label "Graffiti"
-  ]
-  node [
-    id 309
-    label "arabic"
-  ]
-  node [
-    id 310
-    label "clownpenis_fart"
-  ]
-  node [
-    id 311
-    label "jobpostings"
-  ]
-  node [
-    id 312
-    label "kuebasah"
-  ]
-  node [
-    id 313
-    label "WFRE"
-  ]
-  node [
-    id 314
-    label "australia"
-  ]
-  node [
-    id 315
-    label "motorbikes"
-  ]
-  node [
-    id 316
-    label "y2cl"
-  ]
-  node [
-    id 317
-    label "tinfoilhat"
-  ]
-  node [
-    id 318
-    label "carhire01"
-  ]
-  node [
-    id 319
-    label "landscaping"
-  ]
-  node [
-    id 320
-    label "CKL"
-  ]
-  node [
-    id 321
-    label "Green"
-  ]
-  node [
-    id 322
-    label "Pacifism"
-  ]
-  node [
-    id 323
-    label "wristtattoo"
-  ]
-  node [
-    id 324
-    label "try"
-  ]
-  node [
-    id 325
-    label "FISA"
-  ]
-  node [
-    id 326
-    label "electronic_cigarette"
-  ]
-  node [
-    id 327
-    label "beauty"
-  ]
-  node [
-    id 328
-    label "CARHIRE"
-  ]
-  node [
-    id 329
-    label "vmware"
-  ]
-  node [
-    id 330
-    label "MASA"
-  ]
-  node [
-    id 331
-    label "tempatan"
-  ]
-  node [
-    id 332
-    label "cheerwine"
-  ]
-  node [
-    id 333
-    label "memphis"
-  ]
-  node [
-    id 334
-    label "MacleansMagazine"
-  ]
-  node [
-    id 335
-    label "Autoseatcushions"
-  ]
-  node [
-    id 336
-    label "Tonya"
-  ]
-  node [
-    id 337
-    label "Pankaj"
-  ]
-  node [
-    id 338
-    label "IndiMusic"
-  ]
-  node [
-    id 339
-    label "CriminalBR"
-  ]
-  node [
-    id 340
-    label "7Gossip"
-  ]
-  node [
-    id 341
-    label "getrealtest"
-  ]
-  node [
-    id 342
-    label "oversightings"
-  ]
-  node [
-    id 343
-    label "bpdc"
-  ]
-  node [
-    id 344
-    label "codeprojects"
-  ]
-  node [
-    id 345
-    label "bitch_n_complain"
-  ]
-  node [
-    id 346
-    label "Babyluver"
-  ]
-  node [
-    id 347
-    label "ohwhataworld"
-  ]
-  node [
-    id 348
-    label "ScrewYouGuys"
-  ]
-  node [
-    id 349
-    label "iCoCo"
-  ]
-  node [
-    id 350
-    label "Media_Sharing"
-  ]
-  node [
-    id 351
-    label "haxe"
-  ]
-  node [
-    id 352
-    label "scales"
-  ]
-  node [
-    id 353
-    label "Gothic"
-  ]
-  node [
-    id 354
-    label "Smiffys"
-  ]
-  node [
-    id 355
-    label "baduk"
-  ]
-  node [
-    id 356
-    label "thingsthatarefun"
-  ]
-  node [
-    id 357
-    label "RealEstate"
-  ]
-  node [
-    id 358
-    label "unclibwebteam"
-  ]
-  node [
-    id 359
-    label "webhosting"
-  ]
-  node [
-    id 360
-    label "jews"
-  ]
-  node [
-    id 361
-    label "Decisions"
-  ]
-  node [
-    id 362
-    label "doomedamerica"
-  ]
-  node [
-    id 363
-    label "soccer"
-  ]
-  node [
-    id 364
-    label "ANYVIDEO"
-  ]
-  node [
-    id 365
-    label "travelers"
-  ]
-  node [
-    id 366
-    label "JACKgg"
-  ]
-  node [
-    id 367
-    label "INDO_US_NUCLEAR_DEAL"
-  ]
-  node [
-    id 368
-    label "kde"
-  ]
-  node [
-    id 369
-    label "Descary"
-  ]
-  node [
-    id 370
-    label "DoraTheExplora"
-  ]
-  node [
-    id 371
-    label "KaptainCo"
-  ]
-  node [
-    id 372
-    label "stereo"
-  ]
-  node [
-    id 373
-    label "RareList"
-  ]
-  node [
-    id 374
-    label "StupidNinjaSociety"
-  ]
-  node [
-    id 375
-    label "Palm"
-  ]
-  node [
-    id 376
-    label "screwed"
-  ]
-  node [
-    id 377
-    label "SerialMurder"
-  ]
-  node [
-    id 378
-    label "it"
-  ]
-  node [
-    id 379
-    label "Gogogadgetwidget"
-  ]
-  node [
-    id 380
-    label "Christians"
-  ]
-  node [
-    id 381
-    label "PCH"
-  ]
-  node [
-    id 382
-    label "fotografiaainternet"
-  ]
-  node [
-    id 383
-    label "programing"
-  ]
-  node [
-    id 384
-    label "Songwriting"
-  ]
-  node [
-    id 385
-    label "kriminals"
-  ]
-  node [
-    id 386
-    label "PhotoBlog"
-  ]
-  node [
-    id 387
-    label "harneu"
-  ]
-  node [
-    id 388
-    label "hip_hop"
-  ]
-  node [
-    id 389
-    label "orangeinks"
-  ]
-  node [
-    id 390
-    label "nanowrimo"
-  ]
-  node [
-    id 391
-    label "spammers"
-  ]
-  node [
-    id 392
-    label "StarWars"
-  ]
-  node [
-    id 393
-    label "catswithbacon"
-  ]
-  node [
-    id 394
-    label "Psychedelic"
-  ]
-  node [
-    id 395
-    label "ProMigrant"
-  ]
-  node [
-    id 396
-    label "UKBUBBLE"
-  ]
-  node [
-    id 397
-    label "narwhals"
-  ]
-  node [
-    id 398
-    label "SinoBeta"
-  ]
-  node [
-    id 399
-    label "unitedkingdom"
-  ]
-  node [
-    id 400
-    label "Poojabrahmi"
-  ]
-  node [
-    id 401
-    label "musicandnoise"
-  ]
-  node [
-    id 402
-    label "rbeder"
-  ]
-  node [
-    id 403
-    label "ppbb"
-  ]
-  node [
-    id 404
-    label "Shortfilms"
-  ]
-  node [
-    id 405
-    label "cool"
-  ]
-  node [
-    id 406
-    label "Morrisseysolo"
-  ]
-  node [
-    id 407
-    label "NaturalWomen"
-  ]
-  node [
-    id 408
-    label "5Cene"
-  ]
-  node [
-    id 409
-    label "ProcurementLeaders"
-  ]
-  node [
-    id 410
-    label "Steeletravel"
-  ]
-  node [
-    id 411
-    label "future"
-  ]
-  node [
-    id 412
-    label "womentravel"
-  ]
-  node [
-    id 413
-    label "floridasux"
-  ]
-  node [
-    id 414
-    label "WomenOfColor"
-  ]
-  node [
-    id 415
-    label "PLUSMOOD"
-  ]
-  node [
-    id 416
-    label "DanSaltman"
-  ]
-  node [
-    id 417
-    label "selfhelp"
-  ]
-  node [
-    id 418
-    label "MailMeShirts"
-  ]
-  node [
-    id 419
-    label "java"
-  ]
-  node [
-    id 420
-    label "Parkour"
-  ]
-  node [
-    id 421
-    label "oppositeday"
-  ]
-  node [
-    id 422
-    label "Drugs"
-  ]
-  node [
-    id 423
-    label "digg"
-  ]
-  node [
-    id 424
-    label "conspiracies"
-  ]
-  node [
-    id 425
-    label "mplatz"
-  ]
-  node [
-    id 426
-    label "Austin"
-  ]
-  node [
-    id 427
-    label "galeej"
-  ]
-  node [
-    id 428
-    label "circlejerk"
-  ]
-  node [
-    id 429
-    label "budiman"
-  ]
-  node [
-    id 430
-    label "COPYRIGHT"
-  ]
-  node [
-    id 431
-    label "ijustreddit"
-  ]
-  node [
-    id 432
-    label "fakenews"
-  ]
-  node [
-    id 433
-    label "ComputerWeekly"
-  ]
-  node [
-    id 434
-    label "Pre_Bacon"
-  ]
-  node [
-    id 435
-    label "RATS"
-  ]
-  node [
-    id 436
-    label "ASKPCExperts"
-  ]
-  node [
-    id 437
-    label "ElementaryEducation"
-  ]
-  node [
-    id 438
-    label "agnosticism"
-  ]
-  node [
-    id 439
-    label "filmbuff"
-  ]
-  node [
-    id 440
-    label "ZenHabits"
-  ]
-  node [
-    id 441
-    label "artistic"
-  ]
-  node [
-    id 442
-    label "Tinnagorn"
-  ]
-  node [
-    id 443
-    label "WeAreTheFilmMakers"
-  ]
-  node [
-    id 444
-    label "lolz"
-  ]
-  node [
-    id 445
-    label "uls"
-  ]
-  node [
-    id 446
-    label "BlogContests"
-  ]
-  node [
-    id 447
-    label "redditorpics"
-  ]
-  node [
-    id 448
-    label "sociology"
-  ]
-  node [
-    id 449
-    label "shirts"
-  ]
-  node [
-    id 450
-    label "blender"
-  ]
-  node [
-    id 451
-    label "magamed"
-  ]
-  node [
-    id 452
-    label "blownmortgage"
-  ]
-  node [
-    id 453
-    label "TechRadar"
-  ]
-  node [
-    id 454
-    label "TechDaysTour"
-  ]
-  node [
-    id 455
-    label "basura"
-  ]
-  node [
-    id 456
-    label "PalinProblem"
-  ]
-  node [
-    id 457
-    label "NonAustrianEconomics"
-  ]
-  node [
-    id 458
-    label "Ezekiel"
-  ]
-  node [
-    id 459
-    label "csnews"
-  ]
-  node [
-    id 460
-    label "prolog"
-  ]
-  node [
-    id 461
-    label "Indiana"
-  ]
-  node [
-    id 462
-    label "openerp"
-  ]
-  node [
-    id 463
-    label "scholarscamp"
-  ]
-  node [
-    id 464
-    label "GreenEnergyNews"
-  ]
-  node [
-    id 465
-    label "BurningMan"
-  ]
-  node [
-    id 466
-    label "2008Olympics"
-  ]
-  node [
-    id 467
-    label "TRADEMARK"
-  ]
-  node [
-    id 468
-    label "iPhoneNews"
-  ]
-  node [
-    id 469
-    label "Leoparr"
-  ]
-  node [
-    id 470
-    label "Pirate"
-  ]
-  node [
-    id 471
-    label "Concert"
-  ]
-  node [
-    id 472
-    label "scripting"
-  ]
-  node [
-    id 473
-    label "metaverse"
-  ]
-  node [
-    id 474
-    label "MotherAboutInsane"
-  ]
-  node [
-    id 475
-    label "BIZWIZ"
-  ]
-  node [
-    id 476
-    label "honestly"
-  ]
-  node [
-    id 477
-    label "heavy_metal"
-  ]
-  node [
-    id 478
-    label "GinsanaEnergy"
-  ]
-  node [
-    id 479
-    label "supdeeht"
-  ]
-  node [
-    id 480
-    label "ajax"
-  ]
-  node [
-    id 481
-    label "resources"
-  ]
-  node [
-    id 482
-    label "Atkins"
-  ]
-  node [
-    id 483
-    label "outrage"
-  ]
-  node [
-    id 484
-    label "Lawyer"
-  ]
-  node [
-    id 485
-    label "wackynews"
-  ]
-  node [
-    id 486
-    label "gtd"
-  ]
-  node [
-    id 487
-    label "lego"
-  ]
-  node [
-    id 488
-    label "Theaters"
-  ]
-  node [
-    id 489
-    label "IndiaOnline"
-  ]
-  node [
-    id 490
-    label "feminisms"
-  ]
-  node [
-    id 491
-    label "Opeth"
-  ]
-  node [
-    id 492
-    label "flyingpenis"
-  ]
-  node [
-    id 493
-    label "implead"
-  ]
-  node [
-    id 494
-    label "nasa"
-  ]
-  node [
-    id 495
-    label "Bnews"
-  ]
-  node [
-    id 496
-    label "tattoosofgirls2"
-  ]
-  node [
-    id 497
-    label "LeonaLewis"
-  ]
-  node [
-    id 498
-    label "WalKnDude"
-  ]
-  node [
-    id 499
-    label "diggstolefromreddit"
-  ]
-  node [
-    id 500
-    label "johnmccain"
-  ]
-  node [
-    id 501
-    label "BDSMStores"
-  ]
-  node [
-    id 502
-    label "opensource"
-  ]
-  node [
-    id 503
-    label "computergraphics"
-  ]
-  node [
-    id 504
-    label "Tamil_Blogs"
-  ]
-  node [
-    id 505
-    label "Transhuman"
-  ]
-  node [
-    id 506
-    label "martialarts"
-  ]
-  node [
-    id 507
-    label "rgwtest"
-  ]
-  node [
-    id 508
-    label "redditsucks"
-  ]
-  node [
-    id 509
-    label "Clockwork"
-  ]
-  node [
-    id 510
-    label "parsoc"
-  ]
-  node [
-    id 511
-    label "MooreForWomen"
-  ]
-  node [
-    id 512
-    label "fsharp"
-  ]
-  node [
-    id 513
-    label "EPICBACON"
-  ]
-  node [
-    id 514
-    label "Online"
-  ]
-  node [
-    id 515
-    label "Nurseries"
-  ]
-  node [
-    id 516
-    label "KILO_ALDIRICI"
-  ]
-  node [
-    id 517
-    label "Omemo"
-  ]
-  node [
-    id 518
-    label "Pflegehilfe"
-  ]
-  node [
-    id 519
-    label "produkt"
-  ]
-  node [
-    id 520
-    label "emergenze"
-  ]
-  node [
-    id 521
-    label "Labour"
-  ]
-  node [
-    id 522
-    label "Petitions"
-  ]
-  node [
-    id 523
-    label "PRICXwatch"
-  ]
-  node [
-    id 524
-    label "lift"
-  ]
-  node [
-    id 525
-    label "Ezinewriter"
-  ]
-  node [
-    id 526
-    label "omoibadan"
-  ]
-  node [
-    id 527
-    label "chidchan"
-  ]
-  node [
-    id 528
-    label "aqzaveri"
-  ]
-  node [
-    id 529
-    label "ethandit"
-  ]
-  node [
-    id 530
-    label "govstuff"
-  ]
-  node [
-    id 531
-    label "MSN_ADRESLERi"
-  ]
-  node [
-    id 532
-    label "MarketPicks"
-  ]
-  node [
-    id 533
-    label "foreignaffairs"
-  ]
-  node [
-    id 534
-    label "shemale"
-  ]
-  node [
-    id 535
-    label "invest"
-  ]
-  node [
-    id 536
-    label "Fliiby"
-  ]
-  node [
-    id 537
-    label "Gopinath"
-  ]
-  node [
-    id 538
-    label "AquariumFish"
-  ]
-  node [
-    id 539
-    label "Lookieloo"
-  ]
-  node [
-    id 540
-    label "tidder"
-  ]
-  node [
-    id 541
-    label "blasphemyhaven"
-  ]
-  node [
-    id 542
-    label "rockerhifi"
-  ]
-  node [
-    id 543
-    label "programming_pics"
-  ]
-  node [
-    id 544
-    label "herddit"
-  ]
-  node [
-    id 545
-    label "cfi"
-  ]
-  node [
-    id 546
-    label "badreddit"
-  ]
-  node [
-    id 547
-    label "BlueCheese"
-  ]
-  node [
-    id 548
-    label "ask"
-  ]
-  node [
-    id 549
-    label "hurts_my_eyes"
-  ]
-  node [
-    id 550
-    label "hivemind"
-  ]
-  node [
-    id 551
-    label "SOA"
-  ]
-  node [
-    id 552
-    label "kooks"
-  ]
-  node [
-    id 553
-    label "theworld"
-  ]
-  node [
-    id 554
-    label "TwilightGurl"
-  ]
-  node [
-    id 555
-    label "hotselling"
-  ]
-  node [
-    id 556
-    label "web20development"
-  ]
-  node [
-    id 557
-    label "Woerterbuch"
-  ]
-  node [
-    id 558
-    label "PCebooks"
-  ]
-  node [
-    id 559
-    label "naphi"
-  ]
-  node [
-    id 560
-    label "galaxyweblinks"
-  ]
-  node [
-    id 561
-    label "hrw"
-  ]
-  node [
-    id 562
-    label "Shopaholic"
-  ]
-  node [
-    id 563
-    label "makhanhar"
-  ]
-  node [
-    id 564
-    label "byu"
-  ]
-  node [
-    id 565
-    label "Energy_Efficiency"
-  ]
-  node [
-    id 566
-    label "ferdinando"
-  ]
-  node [
-    id 567
-    label "CHHC"
-  ]
-  node [
-    id 568
-    label "Conserve"
-  ]
-  node [
-    id 569
-    label "Amazingdit"
-  ]
-  node [
-    id 570
-    label "titan"
-  ]
-  node [
-    id 571
-    label "BookSmarts"
-  ]
-  node [
-    id 572
-    label "Roosta"
-  ]
-  node [
-    id 573
-    label "Zensky"
-  ]
-  node [
-    id 574
-    label "rest"
-  ]
-  node [
-    id 575
-    label "CoolBikes"
-  ]
-  node [
-    id 576
-    label "testing12332"
-  ]
-  node [
-    id 577
-    label "gp2x"
-  ]
-  node [
-    id 578
-    label "inflatable"
-  ]
-  node [
-    id 579
-    label "sportscars"
-  ]
-  node [
-    id 580
-    label "pylu"
-  ]
-  node [
-    id 581
-    label "netaudio"
-  ]
-  node [
-    id 582
-    label "hookah"
-  ]
-  node [
-    id 583
-    label "word"
-  ]
-  node [
-    id 584
-    label "Cruises"
-  ]
-  node [
-    id 585
-    label "cros"
-  ]
-  node [
-    id 586
-    label "lyrics"
-  ]
-  node [
-    id 587
-    label "fredwissman"
-  ]
-  node [
-    id 588
-    label "KarenLiberation"
-  ]
-  node [
-    id 589
-    label "BABScience"
-  ]
-  node [
-    id 590
-    label "reeemix"
-  ]
-  node [
-    id 591
-    label "hockeysphere"
-  ]
-  node [
-    id 592
-    label "sunsecurity"
-  ]
-  node [
-    id 593
-    label "redneck"
-  ]
-  node [
-    id 594
-    label "Woikr"
-  ]
-  node [
-    id 595
-    label "ManchesterUTD"
-  ]
-  node [
-    id 596
-    label "acriacao"
-  ]
-  node [
-    id 597
-    label "_Descary"
-  ]
-  node [
-    id 598
-    label "awesome"
-  ]
-  node [
-    id 599
-    label "Domaining"
-  ]
-  node [
-    id 600
-    label "Dumitru"
-  ]
-  node [
-    id 601
-    label "dev"
-  ]
-  node [
-    id 602
-    label "ronpaul"
-  ]
-  node [
-    id 603
-    label "trackbike"
-  ]
-  node [
-    id 604
-    label "writing"
-  ]
-  node [
-    id 605
-    label "boardgames"
-  ]
-  node [
-    id 606
-    label "Mackorisnik"
-  ]
-  node [
-    id 607
-    label "enviroknow"
-  ]
-  node [
-    id 608
-    label "WebGames"
-  ]
-  node [
-    id 609
-    label "sweden"
-  ]
-  node [
-    id 610
-    label "angelsflower"
-  ]
-  node [
-    id 611
-    label "linkai"
-  ]
-  node [
-    id 612
-    label "unlockiphoneliveseo"
-  ]
-  node [
-    id 613
-    label "ComProg"
-  ]
-  node [
-    id 614
-    label "SRRAR"
-  ]
-  node [
-    id 615
-    label "WebsiteDevelopers"
-  ]
-  node [
-    id 616
-    label "Besim"
-  ]
-  node [
-    id 617
-    label "cooltales"
-  ]
-  node [
-    id 618
-    label "Idea2Company"
-  ]
-  node [
-    id 619
-    label "elain"
-  ]
-  node [
-    id 620
-    label "Ringernation"
-  ]
-  node [
-    id 621
-    label "TakeAction"
-  ]
-  node [
-    id 622
-    label "redditman"
-  ]
-  node [
-    id 623
-    label "Archaeology"
-  ]
-  node [
-    id 624
-    label "eu"
-  ]
-  node [
-    id 625
-    label "CollegeCounseling"
-  ]
-  node [
-    id 626
-    label "greenmachinestour"
-  ]
-  node [
-    id 627
-    label "puppies"
-  ]
-  node [
-    id 628
-    label "WendyClem"
-  ]
-  node [
-    id 629
-    label "Shinobi"
-  ]
-  node [
-    id 630
-    label "literature"
-  ]
-  node [
-    id 631
-    label "Marketallica"
-  ]
-  node [
-    id 632
-    label "MMA"
-  ]
-  node [
-    id 633
-    label "GreenMGSM"
-  ]
-  node [
-    id 634
-    label "imprimerie"
-  ]
-  node [
-    id 635
-    label "WildwoodNJ"
-  ]
-  node [
-    id 636
-    label "Cathar"
-  ]
-  node [
-    id 637
-    label "trippy"
-  ]
-  node [
-    id 638
-    label "Eve"
-  ]
-  node [
-    id 639
-    label "wwww"
-  ]
-  node [
-    id 640
-    label "breakingBUZZ"
-  ]
-  node [
-    id 641
-    label "ucf"
-  ]
-  node [
-    id 642
-    label "DandD"
-  ]
-  node [
-    id 643
-    label "testname"
-  ]
-  node [
-    id 644
-    label "Esperanto"
-  ]
-  node [
-    id 645
-    label "athiest"
-  ]
-  node [
-    id 646
-    label "OperaMusic"
-  ]
-  node [
-    id 647
-    label "ouddy"
-  ]
-  node [
-    id 648
-    label "Chinese"
-  ]
-  node [
-    id 649
-    label "LosAngeles"
-  ]
-  node [
-    id 650
-    label "lamengao"
-  ]
-  node [
-    id 651
-    label "Unanimous"
-  ]
-  node [
-    id 652
-    label "spoilers"
-  ]
-  node [
-    id 653
-    label "Socialize"
-  ]
-  node [
-    id 654
-    label "sdcc1"
-  ]
-  node [
-    id 655
-    label "RedditorCreations"
-  ]
-  node [
-    id 656
-    label "Yamen"
-  ]
-  node [
-    id 657
-    label "bodybuilding"
-  ]
-  node [
-    id 658
-    label "ArunzFormula1"
-  ]
-  node [
-    id 659
-    label "AmandaNRoy"
-  ]
-  node [
-    id 660
-    label "Websites"
-  ]
-  node [
-    id 661
-    label "snobs"
-  ]
-  node [
-    id 662
-    label "socialinvesting"
-  ]
-  node [
-    id 663
-    label "Vofferu"
-  ]
-  node [
-    id 664
-    label "tattoos"
-  ]
-  node [
-    id 665
-    label "Contractors"
-  ]
-  node [
-    id 666
-    label "formula1"
-  ]
-  node [
-    id 667
-    label "baltimore"
-  ]
-  node [
-    id 668
-    label "webdeals"
-  ]
-  node [
-    id 669
-    label "DarkPoetFawn"
-  ]
-  node [
-    id 670
-    label "gadgetlab"
-  ]
-  node [
-    id 671
-    label "google"
-  ]
-  node [
-    id 672
-    label "reddit7752"
-  ]
-  node [
-    id 673
-    label "PoliticalAction"
-  ]
-  node [
-    id 674
-    label "adventuresports"
-  ]
-  node [
-    id 675
-    label "gonewild"
-  ]
-  node [
-    id 676
-    label "zoepster"
-  ]
-  node [
-    id 677
-    label "Colorado"
-  ]
-  node [
-    id 678
-    label "ExDiggers"
-  ]
-  node [
-    id 679
-    label "fuckedinvestmentbank"
-  ]
-  node [
-    id 680
-    label "taoism"
-  ]
-  node [
-    id 681
-    label "smritinayar"
-  ]
-  node [
-    id 682
-    label "funnyvideos"
-  ]
-  node [
-    id 683
-    label "puns"
-  ]
-  node [
-    id 684
-    label "sl"
-  ]
-  node [
-    id 685
-    label "onlinelivemeeting"
-  ]
-  node [
-    id 686
-    label "simon"
-  ]
-  node [
-    id 687
-    label "cheat_sheets"
-  ]
-  node [
-    id 688
-    label "FiestyCharlie"
-  ]
-  node [
-    id 689
-    label "haskell"
-  ]
-  node [
-    id 690
-    label "peaceulloan"
-  ]
-  node [
-    id 691
-    label "Marxism"
-  ]
-  node [
-    id 692
-    label "theflatlanders"
-  ]
-  node [
-    id 693
-    label "toonsUp"
-  ]
-  node [
-    id 694
-    label "Thaiblog"
-  ]
-  node [
-    id 695
-    label "dotfiles"
-  ]
-  node [
-    id 696
-    label "downvote"
-  ]
-  node [
-    id 697
-    label "Ongofu"
-  ]
-  node [
-    id 698
-    label "rankreddit"
-  ]
-  node [
-    id 699
-    label "Mariakiru"
-  ]
-  node [
-    id 700
-    label "franco_security"
-  ]
-  node [
-    id 701
-    label "polyphasic"
-  ]
-  node [
-    id 702
-    label "terrible"
-  ]
-  node [
-    id 703
-    label "BEEINGE"
-  ]
-  node [
-    id 704
-    label "LiverpoolFC"
-  ]
-  node [
-    id 705
-    label "tiptopmovie"
-  ]
-  node [
-    id 706
-    label "loosupaya"
-  ]
-  node [
-    id 707
-    label "Asiaobserver"
-  ]
-  node [
-    id 708
-    label "technobay"
-  ]
-  node [
-    id 709
-    label "kokonios"
-  ]
-  node [
-    id 710
-    label "AvaBea"
-  ]
-  node [
-    id 711
-    label "Iwillblowupthelaptop"
-  ]
-  node [
-    id 712
-    label "Fitness"
-  ]
-  node [
-    id 713
-    label "startfs"
-  ]
-  node [
-    id 714
-    label "sexytern"
-  ]
-  node [
-    id 715
-    label "Missed_Opportunities"
-  ]
-  node [
-    id 716
-    label "WorkHappyNow"
-  ]
-  node [
-    id 717
-    label "AmericanGovernment"
-  ]
-  node [
-    id 718
-    label "TrivaniTeam"
-  ]
-  node [
-    id 719
-    label "microsoft"
-  ]
-  node [
-    id 720
-    label "nobama"
-  ]
-  node [
-    id 721
-    label "gaynsfw"
-  ]
-  node [
-    id 722
-    label "waaagh"
-  ]
-  node [
-    id 723
-    label "innovationGarage"
-  ]
-  node [
-    id 724
-    label "government"
-  ]
-  node [
-    id 725
-    label "devcanon"
-  ]
-  node [
-    id 726
-    label "logocompetition"
-  ]
-  node [
-    id 727
-    label "TheTechLabs"
-  ]
-  node [
-    id 728
-    label "COMMARKETING"
-  ]
-  node [
-    id 729
-    label "Peiman"
-  ]
-  node [
-    id 730
-    label "Charlottesville"
-  ]
-  node [
-    id 731
-    label "jissmiss"
-  ]
-  node [
-    id 732
-    label "Manuj"
-  ]
-  node [
-    id 733
-    label "socialmedia"
-  ]
-  node [
-    id 734
-    label "accessibility"
-  ]
-  node [
-    id 735
-    label "TipsterHosting"
-  ]
-  node [
-    id 736
-    label "lunchatdolbey"
-  ]
-  node [
-    id 737
-    label "foom"
-  ]
-  node [
-    id 738
-    label "Health"
-  ]
-  node [
-    id 739
-    label "ColorBlind"
-  ]
-  node [
-    id 740
-    label "ANTISHARIA"
-  ]
-  node [
-    id 741
-    label "flashlight"
-  ]
-  node [
-    id 742
-    label "BayuAditya"
-  ]
-  node [
-    id 743
-    label "davidhood189"
-  ]
-  node [
-    id 744
-    label "amarok"
-  ]
-  node [
-    id 745
-    label "poetscorner"
-  ]
-  node [
-    id 746
-    label "FoodBlog"
-  ]
-  node [
-    id 747
-    label "sunum"
-  ]
-  node [
-    id 748
-    label "Reprap"
-  ]
-  node [
-    id 749
-    label "youre_doing_it_wrong"
-  ]
-  node [
-    id 750
-    label "pssdrafts"
-  ]
-  node [
-    id 751
-    label "science"
-  ]
-  node [
-    id 752
-    label "shell"
-  ]
-  node [
-    id 753
-    label "wackyworld"
-  ]
-  node [
-    id 754
-    label "Radixweb"
-  ]
-  node [
-    id 755
-    label "badmusic"
-  ]
-  node [
-    id 756
-    label "knitting"
-  ]
-  node [
-    id 757
-    label "umass"
-  ]
-  node [
-    id 758
-    label "bnm"
-  ]
-  node [
-    id 759
-    label "Rachel61"
-  ]
-  node [
-    id 760
-    label "theg33kshow"
-  ]
-  node [
-    id 761
-    label "subvertising"
-  ]
-  node [
-    id 762
-    label "Catholicism"
-  ]
-  node [
-    id 763
-    label "binoshtb"
-  ]
-  node [
-    id 764
-    label "zh"
-  ]
-  node [
-    id 765
-    label "interactiondesign"
-  ]
-  node [
-    id 766
-    label "wrexham"
-  ]
-  node [
-    id 767
-    label "atrocity"
-  ]
-  node [
-    id 768
-    label "TheOnion"
-  ]
-  node [
-    id 769
-    label "deanver"
-  ]
-  node [
-    id 770
-    label "pHwebdev"
-  ]
-  node [
-    id 771
-    label "Solorya"
-  ]
-  node [
-    id 772
-    label "MaryaSusan1"
-  ]
-  node [
-    id 773
-    label "nintendo"
-  ]
-  node [
-    id 774
-    label "pics"
-  ]
-  node [
-    id 775
-    label "kenyoncreditservices"
-  ]
-  node [
-    id 776
-    label "imageboards"
-  ]
-  node [
-    id 777
-    label "bronson"
-  ]
-  node [
-    id 778
-    label "Anxiety"
-  ]
-  node [
-    id 779
-    label "Dhimmitude"
-  ]
-  node [
-    id 780
-    label "singularity"
-  ]
-  node [
-    id 781
-    label "ABCCouriers"
-  ]
-  node [
-    id 782
-    label "environment2"
-  ]
-  node [
-    id 783
-    label "war"
-  ]
-  node [
-    id 784
-    label "criticalminds"
-  ]
-  node [
-    id 785
-    label "limaumanis"
-  ]
-  node [
-    id 786
-    label "AmerikanPolizei"
-  ]
-  node [
-    id 787
-    label "Haah"
-  ]
-  node [
-    id 788
-    label "statistics"
-  ]
-  node [
-    id 789
-    label "Viajes"
-  ]
-  node [
-    id 790
-    label "oldlive"
-  ]
-  node [
-    id 791
-    label "AmateurPorn"
-  ]
-  node [
-    id 792
-    label "Ohio_News"
-  ]
-  node [
-    id 793
-    label "ca"
-  ]
-  node [
-    id 794
-    label "ChanningTatum"
-  ]
-  node [
-    id 795
-    label "Golfo"
-  ]
-  node [
-    id 796
-    label "Tintomara"
-  ]
-  node [
-    id 797
-    label "VGC"
-  ]
-  node [
-    id 798
-    label "happy"
-  ]
-  node [
-    id 799
-    label "videogames"
-  ]
-  node [
-    id 800
-    label "bostonceltics"
-  ]
-  node [
-    id 801
-    label "aviation"
-  ]
-  node [
-    id 802
-    label "Confucianism"
-  ]
-  node [
-    id 803
-    label "NaturalDisasters"
-  ]
-  node [
-    id 804
-    label "extremeprogramming"
-  ]
-  node [
-    id 805
-    label "lovethepast"
-  ]
-  node [
-    id 806
-    label "Magic"
-  ]
-  node [
-    id 807
-    label "beachweddings"
-  ]
-  node [
-    id 808
-    label "Parenting"
-  ]
-  node [
-    id 809
-    label "Fishing"
-  ]
-  node [
-    id 810
-    label "eric"
-  ]
-  node [
-    id 811
-    label "blog"
-  ]
-  node [
-    id 812
-    label "Infosec2008"
-  ]
-  node [
-    id 813
-    label "Urbandead"
-  ]
-  node [
-    id 814
-    label "papercraft"
-  ]
-  node [
-    id 815
-    label "Cappuccino"
-  ]
-  node [
-    id 816
-    label "transhumanism"
-  ]
-  node [
-    id 817
-    label "Tenurist"
-  ]
-  node [
-    id 818
-    label "PGD"
-  ]
-  node [
-    id 819
-    label "Cow"
-  ]
-  node [
-    id 820
-    label "Sense"
-  ]
-  node [
-    id 821
-    label "sceptics"
-  ]
-  node [
-    id 822
-    label "redesign"
-  ]
-  node [
-    id 823
-    label "Halo2x"
-  ]
-  node [
-    id 824
-    label "operabrowser"
-  ]
-  node [
-    id 825
-    label "Biography"
-  ]
-  node [
-    id 826
-    label "sanfrancisco"
-  ]
-  node [
-    id 827
-    label "moon"
-  ]
-  node [
-    id 828
-    label "Mechatroniker"
-  ]
-  node [
-    id 829
-    label "cristyano"
-  ]
-  node [
-    id 830
-    label "wireless"
-  ]
-  node [
-    id 831
-    label "Dinosaurs"
-  ]
-  node [
-    id 832
-    label "gps"
-  ]
-  node [
-    id 833
-    label "GeoAtreides"
-  ]
-  node [
-    id 834
-    label "pycon2008"
-  ]
-  node [
-    id 835
-    label "solucionesseo"
-  ]
-  node [
-    id 836
-    label "triumphproperty"
-  ]
-  node [
-    id 837
-    label "Crowdsourcing"
-  ]
-  node [
-    id 838
-    label "CAKEWIN"
-  ]
-  node [
-    id 839
-    label "Christmasparty"
-  ]
-  node [
-    id 840
-    label "HernandoRealty"
-  ]
-  node [
-    id 841
-    label "TwilightLinks"
-  ]
-  node [
-    id 842
-    label "area51"
-  ]
-  node [
-    id 843
-    label "not_bacon"
-  ]
-  node [
-    id 844
-    label "trash"
-  ]
-  node [
-    id 845
-    label "HowToDIY"
-  ]
-  node [
-    id 846
-    label "Bluegrass"
-  ]
-  node [
-    id 847
-    label "infp"
-  ]
-  node [
-    id 848
-    label "Coq"
-  ]
-  node [
-    id 849
-    label "KhmerLife"
-  ]
-  node [
-    id 850
-    label "akhilbali"
-  ]
-  node [
-    id 851
-    label "Blogging"
-  ]
-  node [
-    id 852
-    label "YoDawg"
-  ]
-  node [
-    id 853
-    label "DB2"
-  ]
-  node [
-    id 854
-    label "IntellectualReddit"
-  ]
-  node [
-    id 855
-    label "basis"
-  ]
-  node [
-    id 856
-    label "spatula_city"
-  ]
-  node [
-    id 857
-    label "diabetes"
-  ]
-  node [
-    id 858
-    label "HorribleIdea"
-  ]
-  node [
-    id 859
-    label "rdpriest"
-  ]
-  node [
-    id 860
-    label "leBuzzdeLamar"
-  ]
-  node [
-    id 861
-    label "telecom"
-  ]
-  node [
-    id 862
-    label "Happynews"
-  ]
-  node [
-    id 863
-    label "webcam"
-  ]
-  node [
-    id 864
-    label "DarK"
-  ]
-  node [
-    id 865
-    label "JetSetSocialite"
-  ]
-  node [
-    id 866
-    label "gogame"
-  ]
-  node [
-    id 867
-    label "bathrooms"
-  ]
-  node [
-    id 868
-    label "matjackson"
-  ]
-  node [
-    id 869
-    label "rpg"
-  ]
-  node [
-    id 870
-    label "cms"
-  ]
-  node [
-    id 871
-    label "euro"
-  ]
-  node [
-    id 872
-    label "Quebec"
-  ]
-  node [
-    id 873
-    label "tapefind"
-  ]
-  node [
-    id 874
-    label "books"
-  ]
-  node [
-    id 875
-    label "Apocalypse"
-  ]
-  node [
-    id 876
-    label "bertels"
-  ]
-  node [
-    id 877
-    label "recipes"
-  ]
-  node [
-    id 878
-    label "grails"
-  ]
-  node [
-    id 879
-    label "DaveRamsey"
-  ]
-  node [
-    id 880
-    label "AcademicArticles"
-  ]
-  node [
-    id 881
-    label "Uniongal"
-  ]
-  node [
-    id 882
-    label "gis"
-  ]
-  node [
-    id 883
-    label "rva"
-  ]
-  node [
-    id 884
-    label "Webmasters"
-  ]
-  node [
-    id 885
-    label "ATL"
-  ]
-  node [
-    id 886
-    label "cuetians"
-  ]
-  node [
-    id 887
-    label "ldingo"
-  ]
-  node [
-    id 888
-    label "Monterrey"
-  ]
-  node [
-    id 889
-    label "thestem"
-  ]
-  node [
-    id 890
-    label "furniture"
-  ]
-  node [
-    id 891
-    label "Francophone"
-  ]
-  node [
-    id 892
-    label "Annoying"
-  ]
-  node [
-    id 893
-    label "AsesoresInversiones"
-  ]
-  node [
-    id 894
-    label "houseless"
-  ]
-  node [
-    id 895
-    label "testingaufdeutsch"
-  ]
-  node [
-    id 896
-    label "Leitmotivmedia"
-  ]
-  node [
-    id 897
-    label "appdata"
-  ]
-  node [
-    id 898
-    label "free_thought"
-  ]
-  node [
-    id 899
-    label "homedreamtheater"
-  ]
-  node [
-    id 900
-    label "BLS"
-  ]
-  node [
-    id 901
-    label "maninee"
-  ]
-  node [
-    id 902
-    label "Oberon"
-  ]
-  node [
-    id 903
-    label "animations"
-  ]
-  node [
-    id 904
-    label "medienytt"
-  ]
-  node [
-    id 905
-    label "jos"
-  ]
-  node [
-    id 906
-    label "weddingfavors"
-  ]
-  node [
-    id 907
-    label "scion"
-  ]
-  node [
-    id 908
-    label "request"
-  ]
-  node [
-    id 909
-    label "captainreboot"
-  ]
-  node [
-    id 910
-    label "letterwritingguide"
-  ]
-  node [
-    id 911
-    label "csharp"
-  ]
-  node [
-    id 912
-    label "KeralaWebWorks"
-  ]
-  node [
-    id 913
-    label "GregSlevin"
-  ]
-  node [
-    id 914
-    label "Weird"
-  ]
-  node [
-    id 915
-    label "akira"
-  ]
-  node [
-    id 916
-    label "cpp"
-  ]
-  node [
-    id 917
-    label "NERInews"
-  ]
-  node [
-    id 918
-    label "penis"
-  ]
-  node [
-    id 919
-    label "OCPaddler"
-  ]
-  node [
-    id 920
-    label "ArtBook"
-  ]
-  node [
-    id 921
-    label "Dayspamiami"
-  ]
-  node [
-    id 922
-    label "notusa"
-  ]
-  node [
-    id 923
-    label "LegallyMinded"
-  ]
-  node [
-    id 924
-    label "xotcl"
-  ]
-  node [
-    id 925
-    label "Horoscop"
-  ]
-  node [
-    id 926
-    label "BilaBila"
-  ]
-  node [
-    id 927
-    label "DIY"
-  ]
-  node [
-    id 928
-    label "Saltworks"
-  ]
-  node [
-    id 929
-    label "RightsandLaw"
-  ]
-  node [
-    id 930
-    label "consciousness"
-  ]
-  node [
-    id 931
-    label "stephanerd"
-  ]
-  node [
-    id 932
-    label "kimkardashian"
-  ]
-  node [
-    id 933
-    label "shock"
-  ]
-  node [
-    id 934
-    label "userscripts"
-  ]
-  node [
-    id 935
-    label "srch"
-  ]
-  node [
-    id 936
-    label "Freemark"
-  ]
-  node [
-    id 937
-    label "blanket"
-  ]
-  node [
-    id 938
-    label "PoliticsUK"
-  ]
-  node [
-    id 939
-    label "MeeID"
-  ]
-  node [
-    id 940
-    label "yoomeo"
-  ]
-  node [
-    id 941
-    label "qclabels"
-  ]
-  node [
-    id 942
-    label "arduino"
-  ]
-  node [
-    id 943
-    label "ScottWhiskeyeBlog"
-  ]
-  node [
-    id 944
-    label "Asiana"
-  ]
-  node [
-    id 945
-    label "NEWWIDE"
-  ]
-  node [
-    id 946
-    label "miscellaneous"
-  ]
-  node [
-    id 947
-    label "sourceec"
-  ]
-  node [
-    id 948
-    label "potatoarecool"
-  ]
-  node [
-    id 949
-    label "Hapi"
-  ]
-  node [
-    id 950
-    label "plazanetwork"
-  ]
-  node [
-    id 951
-    label "Qtour"
-  ]
-  node [
-    id 952
-    label "SensitiveHeadlines"
-  ]
-  node [
-    id 953
-    label "breakingradio"
-  ]
-  node [
-    id 954
-    label "my_little_interests"
-  ]
-  node [
-    id 955
-    label "gianu"
-  ]
-  node [
-    id 956
-    label "birding"
-  ]
-  node [
-    id 957
-    label "sets"
-  ]
-  node [
-    id 958
-    label "sambaja"
-  ]
-  node [
-    id 959
-    label "Antiglobalism"
-  ]
-  node [
-    id 960
-    label "webtools"
-  ]
-  node [
-    id 961
-    label "chocolate"
-  ]
-  node [
-    id 962
-    label "Africa"
-  ]
-  node [
-    id 963
-    label "web"
-  ]
-  node [
-    id 964
-    label "torrents"
-  ]
-  node [
-    id 965
-    label "bootstrapping"
-  ]
-  node [
-    id 966
-    label "ExclusivelyDogBeds"
-  ]
-  node [
-    id 967
-    label "cccombobreaker"
-  ]
-  node [
-    id 968
-    label "canada"
-  ]
-  node [
-    id 969
-    label "housing"
-  ]
-  node [
-    id 970
-    label "3Dpungo"
-  ]
-  node [
-    id 971
-    label "batandball"
-  ]
-  node [
-    id 972
-    label "wazayf"
-  ]
-  node [
-    id 973
-    label "DADA"
-  ]
-  node [
-    id 974
-    label "colliston"
-  ]
-  node [
-    id 975
-    label "antibacon"
-  ]
-  node [
-    id 976
-    label "nederlands"
-  ]
-  node [
-    id 977
-    label "Teachers"
-  ]
-  node [
-    id 978
-    label "Discussion"
-  ]
-  node [
-    id 979
-    label "loghomes"
-  ]
-  node [
-    id 980
-    label "WeAreTheMusicMakers"
-  ]
-  node [
-    id 981
-    label "git"
-  ]
-  node [
-    id 982
-    label "Men_at_home"
-  ]
-  node [
-    id 983
-    label "occult"
-  ]
-  node [
-    id 984
-    label "grist"
-  ]
-  node [
-    id 985
-    label "Salsa"
-  ]
-  node [
-    id 986
-    label "software"
-  ]
-  node [
-    id 987
-    label "Nebraska"
-  ]
-  node [
-    id 988
-    label "wrong_subreddit"
-  ]
-  node [
-    id 989
-    label "sandiego"
-  ]
-  node [
-    id 990
-    label "dezvoltarepersonala"
-  ]
-  node [
-    id 991
-    label "agi"
-  ]
-  node [
-    id 992
-    label "gwetzel"
-  ]
-  node [
-    id 993
-    label "searchisbroken"
-  ]
-  node [
-    id 994
-    label "nachos"
-  ]
-  node [
-    id 995
-    label "policestateUSA"
-  ]
-  node [
-    id 996
-    label "newengland"
-  ]
-  node [
-    id 997
-    label "Gossimer"
-  ]
-  node [
-    id 998
-    label "imoka"
-  ]
-  node [
-    id 999
-    label "GreenCult"
-  ]
-  node [
-    id 1000
-    label "monika"
-  ]
-  node [
-    id 1001
-    label "Gracefullbabes"
-  ]
-  node [
-    id 1002
-    label "StencilRevolution"
-  ]
-  node [
-    id 1003
-    label "redesignreddit"
-  ]
-  node [
-    id 1004
-    label "almakdad"
-  ]
-  node [
-    id 1005
-    label "longvideos"
-  ]
-  node [
-    id 1006
-    label "phapluat"
-  ]
-  node [
-    id 1007
-    label "Libraries"
-  ]
-  node [
-    id 1008
-    label "Wordpress"
-  ]
-  node [
-    id 1009
-    label "CMMI"
-  ]
-  node [
-    id 1010
-    label "fhyd"
-  ]
-  node [
-    id 1011
-    label "lithuania"
-  ]
-  node [
-    id 1012
-    label "minnesota"
-  ]
-  node [
-    id 1013
-    label "OrangeCountyNY"
-  ]
-  node [
-    id 1014
-    label "drupal"
-  ]
-  node [
-    id 1015
-    label "SexyWomen"
-  ]
-  node [
-    id 1016
-    label "pointless"
-  ]
-  node [
-    id 1017
-    label "rbondi"
-  ]
-  node [
-    id 1018
-    label "inshort"
-  ]
-  node [
-    id 1019
-    label "illuminati"
-  ]
-  node [
-    id 1020
-    label "jtdrct"
-  ]
-  node [
-    id 1021
-    label "GSOH"
-  ]
-  node [
-    id 1022
-    label "spirituality"
-  ]
-  node [
-    id 1023
-    label "motorcycles"
-  ]
-  node [
-    id 1024
-    label "refreshphoenix"
-  ]
-  node [
-    id 1025
-    label "myth"
-  ]
-  node [
-    id 1026
-    label "FlightSimulation"
-  ]
-  node [
-    id 1027
-    label "tibet"
-  ]
-  node [
-    id 1028
-    label "law"
-  ]
-  node [
-    id 1029
-    label "VoteDownIf"
-  ]
-  node [
-    id 1030
-    label "uymasadakodum"
-  ]
-  node [
-    id 1031
-    label "swapmeet"
-  ]
-  node [
-    id 1032
-    label "blogebreddit"
-  ]
-  node [
-    id 1033
-    label "smellyfish"
-  ]
-  node [
-    id 1034
-    label "steak"
-  ]
-  node [
-    id 1035
-    label "alexrussia"
-  ]
-  node [
-    id 1036
-    label "Brann"
-  ]
-  node [
-    id 1037
-    label "Spore"
-  ]
-  node [
-    id 1038
-    label "psychics"
-  ]
-  node [
-    id 1039
-    label "sca"
-  ]
-  node [
-    id 1040
-    label "youthparticipation"
-  ]
-  node [
-    id 1041
-    label "facts"
-  ]
-  node [
-    id 1042
-    label "men"
-  ]
-  node [
-    id 1043
-    label "expert"
-  ]
-  node [
-    id 1044
-    label "weboose"
-  ]
-  node [
-    id 1045
-    label "Thaidarling"
-  ]
-  node [
-    id 1046
-    label "grammar"
-  ]
-  node [
-    id 1047
-    label "misc"
-  ]
-  node [
-    id 1048
-    label "idcontent"
-  ]
-  node [
-    id 1049
-    label "JesseAbram"
-  ]
-  node [
-    id 1050
-    label "jemfinch"
-  ]
-  node [
-    id 1051
-    label "exotic_cuisine"
-  ]
-  node [
-    id 1052
-    label "ClothesBracelets"
-  ]
-  node [
-    id 1053
-    label "offbeat"
-  ]
-  node [
-    id 1054
-    label "Patty"
-  ]
-  node [
-    id 1055
-    label "terroristrepublicans"
-  ]
-  node [
-    id 1056
-    label "mtg"
-  ]
-  node [
-    id 1057
-    label "aerospace"
-  ]
-  node [
-    id 1058
-    label "Eugene"
-  ]
-  node [
-    id 1059
-    label "PetsLoveJessica"
-  ]
-  node [
-    id 1060
-    label "SEO"
-  ]
-  node [
-    id 1061
-    label "trains"
-  ]
-  node [
-    id 1062
-    label "Denmark"
-  ]
-  node [
-    id 1063
-    label "Debt"
-  ]
-  node [
-    id 1064
-    label "contraptions"
-  ]
-  node [
-    id 1065
-    label "cyrusinnovation"
-  ]
-  node [
-    id 1066
-    label "asm"
-  ]
-  node [
-    id 1067
-    label "gaidep"
-  ]
-  node [
-    id 1068
-    label "halo"
-  ]
-  node [
-    id 1069
-    label "Bleachfinder"
-  ]
-  node [
-    id 1070
-    label "prowrestling"
-  ]
-  node [
-    id 1071
-    label "iloveeverything"
-  ]
-  node [
-    id 1072
-    label "VoteUplf"
-  ]
-  node [
-    id 1073
-    label "solaris"
-  ]
-  node [
-    id 1074
-    label "ALP"
-  ]
-  node [
-    id 1075
-    label "biology"
-  ]
-  node [
-    id 1076
-    label "zinio"
-  ]
-  node [
-    id 1077
-    label "Pornorati"
-  ]
-  node [
-    id 1078
-    label "Humanisme"
-  ]
-  node [
-    id 1079
-    label "Yeeher"
-  ]
-  node [
-    id 1080
-    label "Economics"
-  ]
-  node [
-    id 1081
-    label "sharkarts"
-  ]
-  node [
-    id 1082
-    label "politicalnews"
-  ]
-  node [
-    id 1083
-    label "CouchDB"
-  ]
-  node [
-    id 1084
-    label "siliconflorist"
-  ]
-  node [
-    id 1085
-    label "StopitNow"
-  ]
-  node [
-    id 1086
-    label "VisitCrete"
-  ]
-  node [
-    id 1087
-    label "International"
-  ]
-  node [
-    id 1088
-    label "Radiology"
-  ]
-  node [
-    id 1089
-    label "schadenfreude"
-  ]
-  node [
-    id 1090
-    label "evolution"
-  ]
-  node [
-    id 1091
-    label "OURANIMALFRIENDS"
-  ]
-  node [
-    id 1092
-    label "cazzate"
-  ]
-  node [
-    id 1093
-    label "miminco"
-  ]
-  node [
-    id 1094
-    label "voteup"
-  ]
-  node [
-    id 1095
-    label "NEIT"
-  ]
-  node [
-    id 1096
-    label "Zigimeworkspace"
-  ]
-  node [
-    id 1097
-    label "ThePerfectSmile"
-  ]
-  node [
-    id 1098
-    label "Kile"
-  ]
-  node [
-    id 1099
-    label "Cool_Pictures"
-  ]
-  node [
-    id 1100
-    label "stocks"
-  ]
-  node [
-    id 1101
-    label "allcrap"
-  ]
-  node [
-    id 1102
-    label "HERMITS"
-  ]
-  node [
-    id 1103
-    label "igr"
-  ]
-  node [
-    id 1104
-    label "Wholesale_Products"
-  ]
-  node [
-    id 1105
-    label "blingblog"
-  ]
-  node [
-    id 1106
-    label "Drexel"
-  ]
-  node [
-    id 1107
-    label "parislemon"
-  ]
-  node [
-    id 1108
-    label "crownedregal"
-  ]
-  node [
-    id 1109
-    label "8tracks"
-  ]
-  node [
-    id 1110
-    label "pokerposted"
-  ]
-  node [
-    id 1111
-    label "GrabberOrange"
-  ]
-  node [
-    id 1112
-    label "BBCAMISMG"
-  ]
-  node [
-    id 1113
-    label "pwnage"
-  ]
-  node [
-    id 1114
-    label "map"
-  ]
-  node [
-    id 1115
-    label "Database"
-  ]
-  node [
-    id 1116
-    label "adekeda"
-  ]
-  node [
-    id 1117
-    label "SophiesWorld"
-  ]
-  node [
-    id 1118
-    label "bulgaria"
-  ]
-  node [
-    id 1119
-    label "TheManifestStation"
-  ]
-  node [
-    id 1120
-    label "Irony"
-  ]
-  node [
-    id 1121
-    label "zhenyuan"
-  ]
-  node [
-    id 1122
-    label "Madumbi76"
-  ]
-  node [
-    id 1123
-    label "personals"
-  ]
-  node [
-    id 1124
-    label "mathematics"
-  ]
-  node [
-    id 1125
-    label "PS3"
-  ]
-  node [
-    id 1126
-    label "mozilla"
-  ]
-  node [
-    id 1127
-    label "USPE08"
-  ]
-  node [
-    id 1128
-    label "Dunn4good"
-  ]
-  node [
-    id 1129
-    label "shipping"
-  ]
-  node [
-    id 1130
-    label "bhutan"
-  ]
-  node [
-    id 1131
-    label "WebTechBlog"
-  ]
-  node [
-    id 1132
-    label "chilereddit"
-  ]
-  node [
-    id 1133
-    label "blenderbabies"
-  ]
-  node [
-    id 1134
-    label "ThisIsMyTestRun"
-  ]
-  node [
-    id 1135
-    label "teleco"
-  ]
-  node [
-    id 1136
-    label "Desktop_Wallpaper"
-  ]
-  node [
-    id 1137
-    label "mp3buff"
-  ]
-  node [
-    id 1138
-    label "Embeddedavr"
-  ]
-  node [
-    id 1139
-    label "ActressPhotos"
-  ]
-  node [
-    id 1140
-    label "WhiteMenGoneWild"
-  ]
-  node [
-    id 1141
-    label "uruguay"
-  ]
-  node [
-    id 1142
-    label "Sudhir"
-  ]
-  node [
-    id 1143
-    label "Social__Media"
-  ]
-  node [
-    id 1144
-    label "Internet"
-  ]
-  node [
-    id 1145
-    label "consumerist"
-  ]
-  node [
-    id 1146
-    label "intj"
-  ]
-  node [
-    id 1147
-    label "experience"
-  ]
-  node [
-    id 1148
-    label "SuicideWatch"
-  ]
-  node [
-    id 1149
-    label "brothels"
-  ]
-  node [
-    id 1150
-    label "LawofSuccess"
-  ]
-  node [
-    id 1151
-    label "stories"
-  ]
-  node [
-    id 1152
-    label "merb"
-  ]
-  node [
-    id 1153
-    label "Liang"
-  ]
-  node [
-    id 1154
-    label "Design"
-  ]
-  node [
-    id 1155
-    label "aynrandreddits"
-  ]
-  node [
-    id 1156
-    label "Jesika"
-  ]
-  node [
-    id 1157
-    label "ThriftyFinds"
-  ]
-  node [
-    id 1158
-    label "GreenProducts"
-  ]
-  node [
-    id 1159
-    label "mjd"
-  ]
-  node [
-    id 1160
-    label "SocialMediaLinks"
-  ]
-  node [
-    id 1161
-    label "Palestine"
-  ]
-  node [
-    id 1162
-    label "freelance"
-  ]
-  node [
-    id 1163
-    label "GoGreenUSA"
-  ]
-  node [
-    id 1164
-    label "paulantoinem"
-  ]
-  node [
-    id 1165
-    label "globalpoon"
-  ]
-  node [
-    id 1166
-    label "BSD"
-  ]
-  node [
-    id 1167
-    label "incidental"
-  ]
-  node [
-    id 1168
-    label "SearchMarketing"
-  ]
-  node [
-    id 1169
-    label "Christopher"
-  ]
-  node [
-    id 1170
-    label "GraphicNerd"
-  ]
-  node [
-    id 1171
-    label "Philippines"
-  ]
-  node [
-    id 1172
-    label "ITnews"
-  ]
-  node [
-    id 1173
-    label "romeguide"
-  ]
-  node [
-    id 1174
-    label "Gin"
-  ]
-  node [
-    id 1175
-    label "ko"
-  ]
-  node [
-    id 1176
-    label "ZinioBest"
-  ]
-  node [
-    id 1177
-    label "introweb"
-  ]
-  node [
-    id 1178
-    label "desktops"
-  ]
-  node [
-    id 1179
-    label "bilinkis"
-  ]
-  node [
-    id 1180
-    label "kevinbcp"
-  ]
-  node [
-    id 1181
-    label "Evil"
-  ]
-  node [
-    id 1182
-    label "berkeley"
-  ]
-  node [
-    id 1183
-    label "andrewdemm"
-  ]
-  node [
-    id 1184
-    label "AppleApps"
-  ]
-  node [
-    id 1185
-    label "Frugal"
-  ]
-  node [
-    id 1186
-    label "aliyaleigh"
-  ]
-  node [
-    id 1187
-    label "NorthernNewJersey"
-  ]
-  node [
-    id 1188
-    label "labortech"
-  ]
-  node [
-    id 1189
-    label "AmericanHondaSucks"
-  ]
-  node [
-    id 1190
-    label "Indyapulse"
-  ]
-  node [
-    id 1191
-    label "tazert"
-  ]
-  node [
-    id 1192
-    label "XYON"
-  ]
-  node [
-    id 1193
-    label "paris"
-  ]
-  node [
-    id 1194
-    label "Rudyman"
-  ]
-  node [
-    id 1195
-    label "Military"
-  ]
-  node [
-    id 1196
-    label "uggit"
-  ]
-  node [
-    id 1197
-    label "spotify"
-  ]
-  node [
-    id 1198
-    label "pitchengine"
-  ]
-  node [
-    id 1199
-    label "BestGamesEver"
-  ]
-  node [
-    id 1200
-    label "AtulTanna"
-  ]
-  node [
-    id 1201
-    label "Tiquicia"
-  ]
-  node [
-    id 1202
-    label "QA_Tools"
-  ]
-  node [
-    id 1203
-    label "clink"
-  ]
-  node [
-    id 1204
-    label "AttentionSeekers"
-  ]
-  node [
-    id 1205
-    label "arsenal"
-  ]
-  node [
-    id 1206
-    label "arguments"
-  ]
-  node [
-    id 1207
-    label "holidays"
-  ]
-  node [
-    id 1208
-    label "mantriarun"
-  ]
-  node [
-    id 1209
-    label "metalworking"
-  ]
-  node [
-    id 1210
-    label "dilipm"
-  ]
-  node [
-    id 1211
-    label "BerkshireHathaway"
-  ]
-  node [
-    id 1212
-    label "christmas"
-  ]
-  node [
-    id 1213
-    label "Canaddit"
-  ]
-  node [
-    id 1214
-    label "Kristabell"
-  ]
-  node [
-    id 1215
-    label "Melton"
-  ]
-  node [
-    id 1216
-    label "ru"
-  ]
-  node [
-    id 1217
-    label "blueoceandirect"
-  ]
-  node [
-    id 1218
-    label "wantonegotone"
-  ]
-  node [
-    id 1219
-    label "crl"
-  ]
-  node [
-    id 1220
-    label "antiterrorism"
-  ]
-  node [
-    id 1221
-    label "Addicting"
-  ]
-  node [
-    id 1222
-    label "riezuan"
-  ]
-  node [
-    id 1223
-    label "TakingLiberties"
-  ]
-  node [
-    id 1224
-    label "ourex"
-  ]
-  node [
-    id 1225
-    label "WillowVera"
-  ]
-  node [
-    id 1226
-    label "faridi"
-  ]
-  node [
-    id 1227
-    label "canon"
-  ]
-  node [
-    id 1228
-    label "rhs"
-  ]
-  node [
-    id 1229
-    label "Canuckgook"
-  ]
-  node [
-    id 1230
-    label "Integral"
-  ]
-  node [
-    id 1231
-    label "Toonih"
-  ]
-  node [
-    id 1232
-    label "ReverseEngineering"
-  ]
-  node [
-    id 1233
-    label "blackchasm"
-  ]
-  node [
-    id 1234
-    label "VietNam_website"
-  ]
-  node [
-    id 1235
-    label "Reruns"
-  ]
-  node [
-    id 1236
-    label "ManageYourLifeNow"
-  ]
-  node [
-    id 1237
-    label "rape"
-  ]
-  node [
-    id 1238
-    label "anti"
-  ]
-  node [
-    id 1239
-    label "formulaone"
-  ]
-  node [
-    id 1240
-    label "bulgaria_theme"
-  ]
-  node [
-    id 1241
-    label "ubiquity"
-  ]
-  node [
-    id 1242
-    label "radio"
-  ]
-  node [
-    id 1243
-    label "closedloopliving"
-  ]
-  node [
-    id 1244
-    label "Tanah123"
-  ]
-  node [
-    id 1245
-    label "Gusari"
-  ]
-  node [
-    id 1246
-    label "Cera1503"
-  ]
-  node [
-    id 1247
-    label "myblogroom"
-  ]
-  node [
-    id 1248
-    label "cts"
-  ]
-  node [
-    id 1249
-    label "UsedCars"
-  ]
-  node [
-    id 1250
-    label "evensys"
-  ]
-  node [
-    id 1251
-    label "delishio"
-  ]
-  node [
-    id 1252
-    label "Dirtfloor"
-  ]
-  node [
-    id 1253
-    label "PRunderground"
-  ]
-  node [
-    id 1254
-    label "philosophy"
-  ]
-  node [
-    id 1255
-    label "qgyh2"
-  ]
-  node [
-    id 1256
-    label "noprop8"
-  ]
-  node [
-    id 1257
-    label "realsurf"
-  ]
-  node [
-    id 1258
-    label "auto"
-  ]
-  node [
-    id 1259
-    label "OddSizeBeds"
-  ]
-  node [
-    id 1260
-    label "Informatics"
-  ]
-  node [
-    id 1261
-    label "none"
-  ]
-  node [
-    id 1262
-    label "jamesbritt"
-  ]
-  node [
-    id 1263
-    label "jira"
-  ]
-  node [
-    id 1264
-    label "wma"
-  ]
-  node [
-    id 1265
-    label "geekmusic"
-  ]
-  node [
-    id 1266
-    label "3cs"
-  ]
-  node [
-    id 1267
-    label "GraduateSchool"
-  ]
-  node [
-    id 1268
-    label "ebruce"
-  ]
-  node [
-    id 1269
-    label "glitchee"
-  ]
-  node [
-    id 1270
-    label "yellowpagesturkey"
-  ]
-  node [
-    id 1271
-    label "techsupport"
-  ]
-  node [
-    id 1272
-    label "Tomas"
-  ]
-  node [
-    id 1273
-    label "AnnikRubens"
-  ]
-  node [
-    id 1274
-    label "ischool"
-  ]
-  node [
-    id 1275
-    label "BCFood"
-  ]
-  node [
-    id 1276
-    label "viajeros"
-  ]
-  node [
-    id 1277
-    label "Thisisawesome"
-  ]
-  node [
-    id 1278
-    label "tritit"
-  ]
-  node [
-    id 1279
-    label "handexandi"
-  ]
-  node [
-    id 1280
-    label "bicycling"
-  ]
-  node [
-    id 1281
-    label "workathome"
-  ]
-  node [
-    id 1282
-    label "motorsports"
-  ]
-  node [
-    id 1283
-    label "forensics"
-  ]
-  node [
-    id 1284
-    label "VideoGameReviews"
-  ]
-  node [
-    id 1285
-    label "videogaming"
-  ]
-  node [
-    id 1286
-    label "Epicenter"
-  ]
-  node [
-    id 1287
-    label "invisibleclothes"
-  ]
-  node [
-    id 1288
-    label "StevePohlit"
-  ]
-  node [
-    id 1289
-    label "winternals"
-  ]
-  node [
-    id 1290
-    label "hardbodies"
-  ]
-  node [
-    id 1291
-    label "virtualization"
-  ]
-  node [
-    id 1292
-    label "Algereddit"
-  ]
-  node [
-    id 1293
-    label "IndustrialDesign"
-  ]
-  node [
-    id 1294
-    label "lean"
-  ]
-  node [
-    id 1295
-    label "starcraft"
-  ]
-  node [
-    id 1296
-    label "Weblogicguru"
-  ]
-  node [
-    id 1297
-    label "cheminformatics"
-  ]
-  node [
-    id 1298
-    label "rentcentralpa"
-  ]
-  node [
-    id 1299
-    label "media"
-  ]
-  node [
-    id 1300
-    label "mediareddit"
-  ]
-  node [
-    id 1301
-    label "rodjonsroadhouse"
-  ]
-  node [
-    id 1302
-    label "cuilsucks"
-  ]
-  node [
-    id 1303
-    label "Clothing"
-  ]
-  node [
-    id 1304
-    label "CandyCrib"
-  ]
-  node [
-    id 1305
-    label "chucktaco"
-  ]
-  node [
-    id 1306
-    label "championsleague"
-  ]
-  node [
-    id 1307
-    label "rrrd"
-  ]
-  node [
-    id 1308
-    label "cheats"
-  ]
-  node [
-    id 1309
-    label "investment"
-  ]
-  node [
-    id 1310
-    label "bizjgreen"
-  ]
-  node [
-    id 1311
-    label "neufbox"
-  ]
-  node [
-    id 1312
-    label "geoFeed"
-  ]
-  node [
-    id 1313
-    label "world_adekosis"
-  ]
-  node [
-    id 1314
-    label "caregiving"
-  ]
-  node [
-    id 1315
-    label "AlvinHe"
-  ]
-  node [
-    id 1316
-    label "FreeOnlineGames"
-  ]
-  node [
-    id 1317
-    label "bittersweet"
-  ]
-  node [
-    id 1318
-    label "haskell_proposals"
-  ]
-  node [
-    id 1319
-    label "providentestate"
-  ]
-  node [
-    id 1320
-    label "earthsearch"
-  ]
-  node [
-    id 1321
-    label "Bondage"
-  ]
-  node [
-    id 1322
-    label "Pictures"
-  ]
-  node [
-    id 1323
-    label "alexda"
-  ]
-  node [
-    id 1324
-    label "InnoGage"
-  ]
-  node [
-    id 1325
-    label "diabetesnews"
-  ]
-  node [
-    id 1326
-    label "cannabis"
-  ]
-  node [
-    id 1327
-    label "YourFindit"
-  ]
-  node [
-    id 1328
-    label "humanitarian"
-  ]
-  node [
-    id 1329
-    label "Models"
-  ]
-  node [
-    id 1330
-    label "acdindia"
-  ]
-  node [
-    id 1331
-    label "gothicandhorror"
-  ]
-  node [
-    id 1332
-    label "fial"
-  ]
-  node [
-    id 1333
-    label "javascript"
-  ]
-  node [
-    id 1334
-    label "BSG"
-  ]
-  node [
-    id 1335
-    label "sportwatches"
-  ]
-  node [
-    id 1336
-    label "ClassifiedAds"
-  ]
-  node [
-    id 1337
-    label "fantasyfootball"
-  ]
-  node [
-    id 1338
-    label "Mustang"
-  ]
-  node [
-    id 1339
-    label "pcmonteiro13"
-  ]
-  node [
-    id 1340
-    label "SMS"
-  ]
-  node [
-    id 1341
-    label "Invites"
-  ]
-  node [
-    id 1342
-    label "weighttalk"
-  ]
-  node [
-    id 1343
-    label "bendnews"
-  ]
-  node [
-    id 1344
-    label "miglioramento"
-  ]
-  node [
-    id 1345
-    label "allfacebook100"
-  ]
-  node [
-    id 1346
-    label "spk"
-  ]
-  node [
-    id 1347
-    label "venkey"
-  ]
-  node [
-    id 1348
-    label "filesharing"
-  ]
-  node [
-    id 1349
-    label "worstof"
-  ]
-  node [
-    id 1350
-    label "mushroom"
-  ]
-  node [
-    id 1351
-    label "chiptunes"
-  ]
-  node [
-    id 1352
-    label "fringeelement"
-  ]
-  node [
-    id 1353
-    label "MXO"
-  ]
-  node [
-    id 1354
-    label "Detox"
-  ]
-  node [
-    id 1355
-    label "freelancing"
-  ]
-  node [
-    id 1356
-    label "RouletteSystem"
-  ]
-  node [
-    id 1357
-    label "ForexMania"
-  ]
-  node [
-    id 1358
-    label "selflanguage"
-  ]
-  node [
-    id 1359
-    label "Freshhome"
-  ]
-  node [
-    id 1360
-    label "Freethought"
-  ]
-  node [
-    id 1361
-    label "SonyPS3"
-  ]
-  node [
-    id 1362
-    label "kliqd"
-  ]
-  node [
-    id 1363
-    label "MusicFail"
-  ]
-  node [
-    id 1364
-    label "pronadji"
-  ]
-  node [
-    id 1365
-    label "ChristmasSALE"
-  ]
-  node [
-    id 1366
-    label "gentle"
-  ]
-  node [
-    id 1367
-    label "shoebush"
-  ]
-  node [
-    id 1368
-    label "sharepoint"
-  ]
-  node [
-    id 1369
-    label "Hedging"
-  ]
-  node [
-    id 1370
-    label "FunEbay"
-  ]
-  node [
-    id 1371
-    label "guides"
-  ]
-  node [
-    id 1372
-    label "comicbooks"
-  ]
-  node [
-    id 1373
-    label "Aylol68"
-  ]
-  node [
-    id 1374
-    label "perl"
-  ]
-  node [
-    id 1375
-    label "Archana"
-  ]
-  node [
-    id 1376
-    label "charter"
-  ]
-  node [
-    id 1377
-    label "Seattle"
-  ]
-  node [
-    id 1378
-    label "KarmaArmy"
-  ]
-  node [
-    id 1379
-    label "springfieldMO"
-  ]
-  node [
-    id 1380
-    label "pittsburgh"
-  ]
-  node [
-    id 1381
-    label "photowalking"
-  ]
-  node [
-    id 1382
-    label "fail"
-  ]
-  node [
-    id 1383
-    label "DigitalDisasters"
-  ]
-  node [
-    id 1384
-    label "thepale"
-  ]
-  node [
-    id 1385
-    label "iMarketing"
-  ]
-  node [
-    id 1386
-    label "darl"
-  ]
-  node [
-    id 1387
-    label "magick"
-  ]
-  node [
-    id 1388
-    label "JaneDing"
-  ]
-  node [
-    id 1389
-    label "popetastic"
-  ]
-  node [
-    id 1390
-    label "WorkingParents"
-  ]
-  node [
-    id 1391
-    label "Physics"
-  ]
-  node [
-    id 1392
-    label "beards"
-  ]
-  node [
-    id 1393
-    label "bullshit"
-  ]
-  node [
-    id 1394
-    label "wealdreamit"
-  ]
-  node [
-    id 1395
-    label "grant_tda"
-  ]
-  node [
-    id 1396
-    label "pgoramming"
-  ]
-  node [
-    id 1397
-    label "bestofcraigslist"
-  ]
-  node [
-    id 1398
-    label "audio"
-  ]
-  node [
-    id 1399
-    label "templates"
-  ]
-  node [
-    id 1400
-    label "avtorentacar"
-  ]
-  node [
-    id 1401
-    label "chilipress"
-  ]
-  node [
-    id 1402
-    label "semanticweb"
-  ]
-  node [
-    id 1403
-    label "ArkansasShootings"
-  ]
-  node [
-    id 1404
-    label "Horses"
-  ]
-  node [
-    id 1405
-    label "propaganda"
-  ]
-  node [
-    id 1406
-    label "nukethewhales"
-  ]
-  node [
-    id 1407
-    label "userexperience"
-  ]
-  node [
-    id 1408
-    label "Grecian"
-  ]
-  node [
-    id 1409
-    label "apple"
-  ]
-  node [
-    id 1410
-    label "venezuela"
-  ]
-  node [
-    id 1411
-    label "TrueHorrorStories"
-  ]
-  node [
-    id 1412
-    label "TotallyTennessee"
-  ]
-  node [
-    id 1413
-    label "purity_products"
-  ]
-  node [
-    id 1414
-    label "australian"
-  ]
-  node [
-    id 1415
-    label "yardsale"
-  ]
-  node [
-    id 1416
-    label "hizdamnut_personal"
-  ]
-  node [
-    id 1417
-    label "crochet"
-  ]
-  node [
-    id 1418
-    label "withoutlinks"
-  ]
-  node [
-    id 1419
-    label "Metal"
-  ]
-  node [
-    id 1420
-    label "craigslist"
-  ]
-  node [
-    id 1421
-    label "redditua"
-  ]
-  node [
-    id 1422
-    label "mybaseballcardspace"
-  ]
-  node [
-    id 1423
-    label "cleavage"
-  ]
-  node [
-    id 1424
-    label "WVGE"
-  ]
-  node [
-    id 1425
-    label "Survival"
-  ]
-  node [
-    id 1426
-    label "KISS"
-  ]
-  node [
-    id 1427
-    label "freeclassifieds"
-  ]
-  node [
-    id 1428
-    label "biphentinhealth"
-  ]
-  node [
-    id 1429
-    label "TuyetVoi"
-  ]
-  node [
-    id 1430
-    label "sirusdesign"
-  ]
-  node [
-    id 1431
-    label "aii3e"
-  ]
-  node [
-    id 1432
-    label "redditbay"
-  ]
-  node [
-    id 1433
-    label "PhotoCenter"
-  ]
-  node [
-    id 1434
-    label "dtsit"
-  ]
-  node [
-    id 1435
-    label "avrham"
-  ]
-  node [
-    id 1436
-    label "Webroads"
-  ]
-  node [
-    id 1437
-    label "Slut"
-  ]
-  node [
-    id 1438
-    label "Detroit"
-  ]
-  node [
-    id 1439
-    label "greenbusiness"
-  ]
-  node [
-    id 1440
-    label "melbourne"
-  ]
-  node [
-    id 1441
-    label "OpenEd"
-  ]
-  node [
-    id 1442
-    label "tf2"
-  ]
-  node [
-    id 1443
-    label "PersonalLoanHelper"
-  ]
-  node [
-    id 1444
-    label "likereddit"
-  ]
-  node [
-    id 1445
-    label "MrChips"
-  ]
-  node [
-    id 1446
-    label "app"
-  ]
-  node [
-    id 1447
-    label "wfaulkner"
-  ]
-  node [
-    id 1448
-    label "indierock"
-  ]
-  node [
-    id 1449
-    label "vinyl"
-  ]
-  node [
-    id 1450
-    label "Entertainment_Gossip"
-  ]
-  node [
-    id 1451
-    label "Debtfreehispanic"
-  ]
-  node [
-    id 1452
-    label "nba"
-  ]
-  node [
-    id 1453
-    label "OSINT"
-  ]
-  node [
-    id 1454
-    label "ltst"
-  ]
-  node [
-    id 1455
-    label "davidw"
-  ]
-  node [
-    id 1456
-    label "poppins_reddit"
-  ]
-  node [
-    id 1457
-    label "Giants"
-  ]
-  node [
-    id 1458
-    label "OMGWTF"
-  ]
-  node [
-    id 1459
-    label "just4callie"
-  ]
-  node [
-    id 1460
-    label "RobotUprising"
-  ]
-  node [
-    id 1461
-    label "AmericanPolitics"
-  ]
-  node [
-    id 1462
-    label "pcgaming"
-  ]
-  node [
-    id 1463
-    label "TBarrett"
-  ]
-  node [
-    id 1464
-    label "halloween"
-  ]
-  node [
-    id 1465
-    label "gif"
-  ]
-  node [
-    id 1466
-    label "SGBoise"
-  ]
-  node [
-    id 1467
-    label "thisshouldbepolitics"
-  ]
-  node [
-    id 1468
-    label "daily_mail"
-  ]
-  node [
-    id 1469
-    label "be_Green"
-  ]
-  node [
-    id 1470
-    label "ecreeds"
-  ]
-  node [
-    id 1471
-    label "PlookaWebsite"
-  ]
-  node [
-    id 1472
-    label "Cliche"
-  ]
-  node [
-    id 1473
-    label "sexzone"
-  ]
-  node [
-    id 1474
-    label "beta1776"
-  ]
-  node [
-    id 1475
-    label "jeux_flash"
-  ]
-  node [
-    id 1476
-    label "Mortgage"
-  ]
-  node [
-    id 1477
-    label "Singles"
-  ]
-  node [
-    id 1478
-    label "WolfFrameworks"
-  ]
-  node [
-    id 1479
-    label "france"
-  ]
-  node [
-    id 1480
-    label "neoknight"
-  ]
-  node [
-    id 1481
-    label "Folk_Music"
-  ]
-  node [
-    id 1482
-    label "breakglass"
-  ]
-  node [
-    id 1483
-    label "aggieliberal"
-  ]
-  node [
-    id 1484
-    label "ASPNET"
-  ]
-  node [
-    id 1485
-    label "fixedgear"
-  ]
-  node [
-    id 1486
-    label "INTP"
-  ]
-  node [
-    id 1487
-    label "programming"
-  ]
-  node [
-    id 1488
-    label "Catalogbiz"
-  ]
-  node [
-    id 1489
-    label "lazyweb"
-  ]
-  node [
-    id 1490
-    label "DIPPSEO"
-  ]
-  node [
-    id 1491
-    label "GlobalistNews"
-  ]
-  node [
-    id 1492
-    label "Poetry"
-  ]
-  node [
-    id 1493
-    label "DataZilla"
-  ]
-  node [
-    id 1494
-    label "eo"
-  ]
-  node [
-    id 1495
-    label "ACL"
-  ]
-  node [
-    id 1496
-    label "LOC"
-  ]
-  node [
-    id 1497
-    label "tashad"
-  ]
-  node [
-    id 1498
-    label "mzaeen"
-  ]
-  node [
-    id 1499
-    label "CuteWriting"
-  ]
-  node [
-    id 1500
-    label "Parties"
-  ]
-  node [
-    id 1501
-    label "methlab"
-  ]
-  node [
-    id 1502
-    label "experssregalo"
-  ]
-  node [
-    id 1503
-    label "MyTotalKitchen"
-  ]
-  node [
-    id 1504
-    label "nintin"
-  ]
-  node [
-    id 1505
-    label "scifi"
-  ]
-  node [
-    id 1506
-    label "anrinn188"
-  ]
-  node [
-    id 1507
-    label "Anarchism"
-  ]
-  node [
-    id 1508
-    label "MDVC"
-  ]
-  node [
-    id 1509
-    label "elinaswain"
-  ]
-  node [
-    id 1510
-    label "wii"
-  ]
-  node [
-    id 1511
-    label "RawFitnessOnline"
-  ]
-  node [
-    id 1512
-    label "Islamofascism"
-  ]
-  node [
-    id 1513
-    label "nakajima"
-  ]
-  node [
-    id 1514
-    label "reproduction"
-  ]
-  node [
-    id 1515
-    label "algeria"
-  ]
-  node [
-    id 1516
-    label "UUreddit"
-  ]
-  node [
-    id 1517
-    label "collapse"
-  ]
-  node [
-    id 1518
-    label "my_own_test_reddit"
-  ]
-  node [
-    id 1519
-    label "analplay"
-  ]
-  node [
-    id 1520
-    label "shashimaru28"
-  ]
-  node [
-    id 1521
-    label "quiz"
-  ]
-  node [
-    id 1522
-    label "bomboimantado"
-  ]
-  node [
-    id 1523
-    label "MensRights"
-  ]
-  node [
-    id 1524
-    label "osfanboyism"
-  ]
-  node [
-    id 1525
-    label "Bagsforless"
-  ]
-  node [
-    id 1526
-    label "VideoRemix"
-  ]
-  node [
-    id 1527
-    label "whedon"
-  ]
-  node [
-    id 1528
-    label "pssnaked"
-  ]
-  node [
-    id 1529
-    label "tracetrack"
-  ]
-  node [
-    id 1530
-    label "NHibernate"
-  ]
-  node [
-    id 1531
-    label "autism"
-  ]
-  node [
-    id 1532
-    label "joob"
-  ]
-  node [
-    id 1533
-    label "OnceAgain"
-  ]
-  node [
-    id 1534
-    label "PeanutButter"
-  ]
-  node [
-    id 1535
-    label "FreeStuff"
-  ]
-  node [
-    id 1536
-    label "phpfreelancer"
-  ]
-  node [
-    id 1537
-    label "gingerbeer25"
-  ]
-  node [
-    id 1538
-    label "jewscaused911"
-  ]
-  node [
-    id 1539
-    label "Scotch"
-  ]
-  node [
-    id 1540
-    label "kajiroom"
-  ]
-  node [
-    id 1541
-    label "tablehockey"
-  ]
-  node [
-    id 1542
-    label "Celebrity_Pictures"
-  ]
-  node [
-    id 1543
-    label "Autos"
-  ]
-  node [
-    id 1544
-    label "athiesm"
-  ]
-  node [
-    id 1545
-    label "gratefuldead"
-  ]
-  node [
-    id 1546
-    label "FirstMeditations"
-  ]
-  node [
-    id 1547
-    label "AdultChildren"
-  ]
-  node [
-    id 1548
-    label "Washington"
-  ]
-  node [
-    id 1549
-    label "alcohol"
-  ]
-  node [
-    id 1550
-    label "Jawad"
-  ]
-  node [
-    id 1551
-    label "publishing"
-  ]
-  node [
-    id 1552
-    label "loldogs"
-  ]
-  node [
-    id 1553
-    label "TUPOEorg"
-  ]
-  node [
-    id 1554
-    label "fashion"
-  ]
-  node [
-    id 1555
-    label "Unbelievable"
-  ]
-  node [
-    id 1556
-    label "Las_Vegas"
-  ]
-  node [
-    id 1557
-    label "FuckingRepost"
-  ]
-  node [
-    id 1558
-    label "Vanhomeless"
-  ]
-  node [
-    id 1559
-    label "askkaens"
-  ]
-  node [
-    id 1560
-    label "Mary"
-  ]
-  node [
-    id 1561
-    label "writeright"
-  ]
-  node [
-    id 1562
-    label "mysecuritysign"
-  ]
-  node [
-    id 1563
-    label "nyisi"
-  ]
-  node [
-    id 1564
-    label "CaughtMyAttention"
-  ]
-  node [
-    id 1565
-    label "hamo2008"
-  ]
-  node [
-    id 1566
-    label "Lipstick"
-  ]
-  node [
-    id 1567
-    label "MMORPG"
-  ]
-  node [
-    id 1568
-    label "1111111"
-  ]
-  node [
-    id 1569
-    label "WhatIsLuxury"
-  ]
-  node [
-    id 1570
-    label "Freshmobileus"
-  ]
-  node [
-    id 1571
-    label "biberhapi"
-  ]
-  node [
-    id 1572
-    label "prueba"
-  ]
-  node [
-    id 1573
-    label "bngbng"
-  ]
-  node [
-    id 1574
-    label "free_movies"
-  ]
-  node [
-    id 1575
-    label "Emo"
-  ]
-  node [
-    id 1576
-    label "motiongraphics"
-  ]
-  node [
-    id 1577
-    label "gardening"
-  ]
-  node [
-    id 1578
-    label "Rwanda"
-  ]
-  node [
-    id 1579
-    label "Defcon"
-  ]
-  node [
-    id 1580
-    label "BoilerExplosion"
-  ]
-  node [
-    id 1581
-    label "Ethics"
-  ]
-  node [
-    id 1582
-    label "nsfw"
-  ]
-  node [
-    id 1583
-    label "loynomsc"
-  ]
-  node [
-    id 1584
-    label "plt"
-  ]
-  node [
-    id 1585
-    label "Rockband"
-  ]
-  node [
-    id 1586
-    label "ARG"
-  ]
-  node [
-    id 1587
-    label "CompEddit"
-  ]
-  node [
-    id 1588
-    label "gaijin"
-  ]
-  node [
-    id 1589
-    label "dating"
-  ]
-  node [
-    id 1590
-    label "alife"
-  ]
-  node [
-    id 1591
-    label "HurricaneIke"
-  ]
-  node [
-    id 1592
-    label "LatinAmerica"
-  ]
-  node [
-    id 1593
-    label "onlinebooks"
-  ]
-  node [
-    id 1594
-    label "Domains"
-  ]
-  node [
-    id 1595
-    label "SuperNova"
-  ]
-  node [
-    id 1596
-    label "BooCooBay"
-  ]
-  node [
-    id 1597
-    label "userstorylab"
-  ]
-  node [
-    id 1598
-    label "muslims"
-  ]
-  node [
-    id 1599
-    label "unhappy"
-  ]
-  node [
-    id 1600
-    label "belgium"
-  ]
-  node [
-    id 1601
-    label "cycling"
-  ]
-  node [
-    id 1602
-    label "Chennai"
-  ]
-  node [
-    id 1603
-    label "classicalmusic"
-  ]
-  node [
-    id 1604
-    label "CSU"
-  ]
-  node [
-    id 1605
-    label "thevoiceofdon"
-  ]
-  node [
-    id 1606
-    label "vdm"
-  ]
-  node [
-    id 1607
-    label "puerrit"
-  ]
-  node [
-    id 1608
-    label "worldwidewar"
-  ]
-  node [
-    id 1609
-    label "Galatron"
-  ]
-  node [
-    id 1610
-    label "political_issues"
-  ]
-  node [
-    id 1611
-    label "spain"
-  ]
-  node [
-    id 1612
-    label "christfollowers"
-  ]
-  node [
-    id 1613
-    label "faboccasion"
-  ]
-  node [
-    id 1614
-    label "The_Wire"
-  ]
-  node [
-    id 1615
-    label "photoshop"
-  ]
-  node [
-    id 1616
-    label "politics"
-  ]
-  node [
-    id 1617
-    label "Yalin"
-  ]
-  node [
-    id 1618
-    label "elivepages"
-  ]
-  node [
-    id 1619
-    label "311"
-  ]
-  node [
-    id 1620
-    label "hotsauce"
-  ]
-  node [
-    id 1621
-    label "AtlantisDivers"
-  ]
-  node [
-    id 1622
-    label "oregon"
-  ]
-  node [
-    id 1623
-    label "Basketball"
-  ]
-  node [
-    id 1624
-    label "Cheese"
-  ]
-  node [
-    id 1625
-    label "takeurseat1"
-  ]
-  node [
-    id 1626
-    label "Explosions"
-  ]
-  node [
-    id 1627
-    label "gal"
-  ]
-  node [
-    id 1628
-    label "Agorism"
-  ]
-  node [
-    id 1629
-    label "kebek"
-  ]
-  node [
-    id 1630
-    label "eggs"
-  ]
-  node [
-    id 1631
-    label "cute"
-  ]
-  node [
-    id 1632
-    label "news"
-  ]
-  node [
-    id 1633
-    label "hypatia"
-  ]
-  node [
-    id 1634
-    label "geopolitics"
-  ]
-  node [
-    id 1635
-    label "SubGenius"
-  ]
-  node [
-    id 1636
-    label "gayporn"
-  ]
-  node [
-    id 1637
-    label "esquivalience"
-  ]
-  node [
-    id 1638
-    label "phishing"
-  ]
-  node [
-    id 1639
-    label "MiaPresley"
-  ]
-  node [
-    id 1640
-    label "forrtryout"
-  ]
-  node [
-    id 1641
-    label "bestoutdoortowns"
-  ]
-  node [
-    id 1642
-    label "merry"
-  ]
-  node [
-    id 1643
-    label "www"
-  ]
-  node [
-    id 1644
-    label "EeePC"
-  ]
-  node [
-    id 1645
-    label "hotpockets"
-  ]
-  node [
-    id 1646
-    label "theship"
-  ]
-  node [
-    id 1647
-    label "gadgets"
-  ]
-  node [
-    id 1648
-    label "GoBrandIt"
-  ]
-  node [
-    id 1649
-    label "SantexQBlog"
-  ]
-  node [
-    id 1650
-    label "tattoosofgirls"
-  ]
-  node [
-    id 1651
-    label "Point_"
-  ]
-  node [
-    id 1652
-    label "Simplyzigzag"
-  ]
-  node [
-    id 1653
-    label "gridsix"
-  ]
-  node [
-    id 1654
-    label "TradeMaster"
-  ]
-  node [
-    id 1655
-    label "RedPrice"
-  ]
-  node [
-    id 1656
-    label "chentao807"
-  ]
-  node [
-    id 1657
-    label "owie"
-  ]
-  node [
-    id 1658
-    label "Govvit"
-  ]
-  node [
-    id 1659
-    label "Gossimerwebhosting"
-  ]
-  node [
-    id 1660
-    label "koreangamenewstest1"
-  ]
-  node [
-    id 1661
-    label "PlayadenBossa"
-  ]
-  node [
-    id 1662
-    label "motorcycle"
-  ]
-  node [
-    id 1663
-    label "HomeImprovement"
-  ]
-  node [
-    id 1664
-    label "culture"
-  ]
-  node [
-    id 1665
-    label "yeahisawthat"
-  ]
-  node [
-    id 1666
-    label "timetravel"
-  ]
-  node [
-    id 1667
-    label "Sakitha"
-  ]
-  node [
-    id 1668
-    label "rusmoney"
-  ]
-  node [
-    id 1669
-    label "ALALabAuto"
-  ]
-  node [
-    id 1670
-    label "meme"
-  ]
-  node [
-    id 1671
-    label "Entrepreneur"
-  ]
-  node [
-    id 1672
-    label "Gristmill"
-  ]
-  node [
-    id 1673
-    label "indonesia"
-  ]
-  node [
-    id 1674
-    label "vero"
-  ]
-  node [
-    id 1675
-    label "medicine"
-  ]
-  node [
-    id 1676
-    label "nyc"
-  ]
-  node [
-    id 1677
-    label "Lovecraft"
-  ]
-  node [
-    id 1678
-    label "picture"
-  ]
-  node [
-    id 1679
-    label "Storytellers"
-  ]
-  node [
-    id 1680
-    label "artenovance"
-  ]
-  node [
-    id 1681
-    label "AllAccess"
-  ]
-  node [
-    id 1682
-    label "ido"
-  ]
-  node [
-    id 1683
-    label "gracemassage"
-  ]
-  node [
-    id 1684
-    label "SportsEvent"
-  ]
-  node [
-    id 1685
-    label "LittleToddler"
-  ]
-  node [
-    id 1686
-    label "HotWater"
-  ]
-  node [
-    id 1687
-    label "jaggedaloc"
-  ]
-  node [
-    id 1688
-    label "egistb"
-  ]
-  node [
-    id 1689
-    label "singh85"
-  ]
-  node [
-    id 1690
-    label "cera"
-  ]
-  node [
-    id 1691
-    label "UFOs"
-  ]
-  node [
-    id 1692
-    label "winson"
-  ]
-  node [
-    id 1693
-    label "Bonsai"
-  ]
-  node [
-    id 1694
-    label "Livestrip"
-  ]
-  node [
-    id 1695
-    label "jecobsw"
-  ]
-  node [
-    id 1696
-    label "Madhav"
-  ]
-  node [
-    id 1697
-    label "designcontest"
-  ]
-  node [
-    id 1698
-    label "yahuwaku"
-  ]
-  node [
-    id 1699
-    label "Developernews"
-  ]
-  node [
-    id 1700
-    label "techymarketer"
-  ]
-  node [
-    id 1701
-    label "jobs"
-  ]
-  node [
-    id 1702
-    label "Artists"
-  ]
-  node [
-    id 1703
-    label "john_r"
-  ]
-  node [
-    id 1704
-    label "justjim73"
-  ]
-  node [
-    id 1705
-    label "teeshirtart"
-  ]
-  node [
-    id 1706
-    label "tmichaelcart"
-  ]
-  node [
-    id 1707
-    label "usa"
-  ]
-  node [
-    id 1708
-    label "DebtReliefServices"
-  ]
-  node [
-    id 1709
-    label "robot"
-  ]
-  node [
-    id 1710
-    label "qtp"
-  ]
-  node [
-    id 1711
-    label "crazybitch"
-  ]
-  node [
-    id 1712
-    label "golf"
-  ]
-  node [
-    id 1713
-    label "newhaven"
-  ]
-  node [
-    id 1714
-    label "MilleniumForce"
-  ]
-  node [
-    id 1715
-    label "whatsupp"
-  ]
-  node [
-    id 1716
-    label "xandy"
-  ]
-  node [
-    id 1717
-    label "DailyTrainings"
-  ]
-  node [
-    id 1718
-    label "SuperSwedishGirls"
-  ]
-  node [
-    id 1719
-    label "AmericanEconomy"
-  ]
-  node [
-    id 1720
-    label "AruiZen"
-  ]
-  node [
-    id 1721
-    label "death"
-  ]
-  node [
-    id 1722
-    label "kingrobotic"
-  ]
-  node [
-    id 1723
-    label "petshopplaneta"
-  ]
-  node [
-    id 1724
-    label "Unicode"
-  ]
-  node [
-    id 1725
-    label "Forex"
-  ]
-  node [
-    id 1726
-    label "BustingDiva"
-  ]
-  node [
-    id 1727
-    label "Lindy"
-  ]
-  node [
-    id 1728
-    label "matija"
-  ]
-  node [
-    id 1729
-    label "Nash8686"
-  ]
-  node [
-    id 1730
-    label "ResearchCapital"
-  ]
-  node [
-    id 1731
-    label "digitalove"
-  ]
-  node [
-    id 1732
-    label "kaboom"
-  ]
-  node [
-    id 1733
-    label "UIUC"
-  ]
-  node [
-    id 1734
-    label "polls"
-  ]
-  node [
-    id 1735
-    label "grrm"
-  ]
-  node [
-    id 1736
-    label "slate"
-  ]
-  node [
-    id 1737
-    label "Passion"
-  ]
-  node [
-    id 1738
-    label "Americans"
-  ]
-  node [
-    id 1739
-    label "RilySi"
-  ]
-  node [
-    id 1740
-    label "algorithms"
-  ]
-  node [
-    id 1741
-    label "haiku"
-  ]
-  node [
-    id 1742
-    label "complaints"
-  ]
-  node [
-    id 1743
-    label "hurd"
-  ]
-  node [
-    id 1744
-    label "hate"
-  ]
-  node [
-    id 1745
-    label "gambling"
-  ]
-  node [
-    id 1746
-    label "ProgrammingLanguages"
-  ]
-  node [
-    id 1747
-    label "fx15"
-  ]
-  node [
-    id 1748
-    label "GGGGive"
-  ]
-  node [
-    id 1749
-    label "pun"
-  ]
-  node [
-    id 1750
-    label "Graphics4u"
-  ]
-  node [
-    id 1751
-    label "PinklisarParadise"
-  ]
-  node [
-    id 1752
-    label "favorites"
-  ]
-  node [
-    id 1753
-    label "grecosonthefly"
-  ]
-  node [
-    id 1754
-    label "su123jon"
-  ]
-  node [
-    id 1755
-    label "Clemson"
-  ]
-  node [
-    id 1756
-    label "ecm"
-  ]
-  node [
-    id 1757
-    label "photography"
-  ]
-  node [
-    id 1758
-    label "typography"
-  ]
-  node [
-    id 1759
-    label "awards"
-  ]
-  node [
-    id 1760
-    label "GatorArcade"
-  ]
-  node [
-    id 1761
-    label "richlach"
-  ]
-  node [
-    id 1762
-    label "whattttt"
-  ]
-  node [
-    id 1763
-    label "KnittingReddit"
-  ]
-  node [
-    id 1764
-    label "norge"
-  ]
-  node [
-    id 1765
-    label "LaTeX"
-  ]
-  node [
-    id 1766
-    label "Liberty"
-  ]
-  node [
-    id 1767
-    label "LegalNews"
-  ]
-  node [
-    id 1768
-    label "kratos"
-  ]
-  node [
-    id 1769
-    label "bash"
-  ]
-  node [
-    id 1770
-    label "LazyHour"
-  ]
-  node [
-    id 1771
-    label "Designing"
-  ]
-  node [
-    id 1772
-    label "incomingbooks"
-  ]
-  node [
-    id 1773
-    label "WaybackMachine"
-  ]
-  node [
-    id 1774
-    label "nomorecrapmusic"
-  ]
-  node [
-    id 1775
-    label "hockey"
-  ]
-  node [
-    id 1776
-    label "is_computer_on"
-  ]
-  node [
-    id 1777
-    label "uvr"
-  ]
-  node [
-    id 1778
-    label "SixHourStartup"
-  ]
-  node [
-    id 1779
-    label "Maxwell"
-  ]
-  node [
-    id 1780
-    label "ShepherdExpress"
-  ]
-  node [
-    id 1781
-    label "powellendorsesdobama"
-  ]
-  node [
-    id 1782
-    label "citeboomers"
-  ]
-  node [
-    id 1783
-    label "ComputerworldUKNews"
-  ]
-  node [
-    id 1784
-    label "ghostbusters"
-  ]
-  node [
-    id 1785
-    label "Kehlocricket"
-  ]
-  node [
-    id 1786
-    label "Tantra"
-  ]
-  node [
-    id 1787
-    label "NOads"
-  ]
-  node [
-    id 1788
-    label "Celebrity_Central"
-  ]
-  node [
-    id 1789
-    label "joel"
-  ]
-  node [
-    id 1790
-    label "uk_ecommerce"
-  ]
-  node [
-    id 1791
-    label "Nails"
-  ]
-  node [
-    id 1792
-    label "charlenejones"
-  ]
-  node [
-    id 1793
-    label "finance2"
-  ]
-  node [
-    id 1794
-    label "marjorie_L"
-  ]
-  node [
-    id 1795
-    label "classics"
-  ]
-  node [
-    id 1796
-    label "Filmzu"
-  ]
-  node [
-    id 1797
-    label "Britain"
-  ]
-  node [
-    id 1798
-    label "linguistics"
-  ]
-  node [
-    id 1799
-    label "smokefree2009"
-  ]
-  node [
-    id 1800
-    label "911_Truth"
-  ]
-  node [
-    id 1801
-    label "wow"
-  ]
-  node [
-    id 1802
-    label "4chan"
-  ]
-  node [
-    id 1803
-    label "Personalized"
-  ]
-  node [
-    id 1804
-    label "followup"
-  ]
-  node [
-    id 1805
-    label "tacos"
-  ]
-  node [
-    id 1806
-    label "CAPSLOCK"
-  ]
-  node [
-    id 1807
-    label "RevDevsReddit"
-  ]
-  node [
-    id 1808
-    label "ResistTyranny"
-  ]
-  node [
-    id 1809
-    label "globalization"
-  ]
-  node [
-    id 1810
-    label "pixint"
-  ]
-  node [
-    id 1811
-    label "ciencia"
-  ]
-  node [
-    id 1812
-    label "Suomi"
-  ]
-  node [
-    id 1813
-    label "Hunting"
-  ]
-  node [
-    id 1814
-    label "bianca"
-  ]
-  node [
-    id 1815
-    label "cp_retailpos"
-  ]
-  node [
-    id 1816
-    label "whereisliz"
-  ]
-  node [
-    id 1817
-    label "Redditnecks"
-  ]
-  node [
-    id 1818
-    label "Pauliespoint"
-  ]
-  node [
-    id 1819
-    label "BlazersReddit"
-  ]
-  node [
-    id 1820
-    label "macprogramming"
-  ]
-  node [
-    id 1821
-    label "DNChamp"
-  ]
-  node [
-    id 1822
-    label "electronics"
-  ]
-  node [
-    id 1823
-    label "bedla"
-  ]
-  node [
-    id 1824
-    label "PSP"
-  ]
-  node [
-    id 1825
-    label "SQLServer"
-  ]
-  node [
-    id 1826
-    label "citizenjournalism"
-  ]
-  node [
-    id 1827
-    label "linuxgamedevelopment"
-  ]
-  node [
-    id 1828
-    label "deepdata"
-  ]
-  node [
-    id 1829
-    label "NotMadeInChina"
-  ]
-  node [
-    id 1830
-    label "Emarketer"
-  ]
-  node [
-    id 1831
-    label "computerviruses"
-  ]
-  node [
-    id 1832
-    label "veg"
-  ]
-  node [
-    id 1833
-    label "yahoo"
-  ]
-  node [
-    id 1834
-    label "BusinessIntelligence"
-  ]
-  node [
-    id 1835
-    label "avr"
-  ]
-  node [
-    id 1836
-    label "psychoanalysis"
-  ]
-  node [
-    id 1837
-    label "off_topic"
-  ]
-  node [
-    id 1838
-    label "defc0n1"
-  ]
-  node [
-    id 1839
-    label "Thirdsoul"
-  ]
-  node [
-    id 1840
-    label "Wirelessgalaxy"
-  ]
-  node [
-    id 1841
-    label "Scotland"
-  ]
-  node [
-    id 1842
-    label "directrep"
-  ]
-  node [
-    id 1843
-    label "CreativeInspiration"
-  ]
-  node [
-    id 1844
-    label "plasma"
-  ]
-  node [
-    id 1845
-    label "comedy"
-  ]
-  node [
-    id 1846
-    label "Tripartisan"
-  ]
-  node [
-    id 1847
-    label "pinoy"
-  ]
-  node [
-    id 1848
-    label "scheme"
-  ]
-  node [
-    id 1849
-    label "donrobert"
-  ]
-  node [
-    id 1850
-    label "lesb"
-  ]
-  node [
-    id 1851
-    label "twilight"
-  ]
-  node [
-    id 1852
-    label "billebert"
-  ]
-  node [
-    id 1853
-    label "superoutdoorsmen"
-  ]
-  node [
-    id 1854
-    label "contrarian"
-  ]
-  node [
-    id 1855
-    label "Ablacksheep"
-  ]
-  node [
-    id 1856
-    label "WebNews"
-  ]
-  node [
-    id 1857
-    label "Soccymartin"
-  ]
-  node [
-    id 1858
-    label "Aiqbalawan"
-  ]
-  node [
-    id 1859
-    label "tarot"
-  ]
-  node [
-    id 1860
-    label "giftfruit"
-  ]
-  node [
-    id 1861
-    label "sketches"
-  ]
-  node [
-    id 1862
-    label "BluesMusic"
-  ]
-  node [
-    id 1863
-    label "newzealand"
-  ]
-  node [
-    id 1864
-    label "badger"
-  ]
-  node [
-    id 1865
-    label "DigitalEdge"
-  ]
-  node [
-    id 1866
-    label "gustav"
-  ]
-  node [
-    id 1867
-    label "oreillymedia"
-  ]
-  node [
-    id 1868
-    label "civilengineering"
-  ]
-  node [
-    id 1869
-    label "DLP"
-  ]
-  node [
-    id 1870
-    label "wisebread"
-  ]
-  node [
-    id 1871
-    label "AmericanJewishPower"
-  ]
-  node [
-    id 1872
-    label "esteem"
-  ]
-  node [
-    id 1873
-    label "Realty"
-  ]
-  node [
-    id 1874
-    label "Gays"
-  ]
-  node [
-    id 1875
-    label "SuggestMusic"
-  ]
-  node [
-    id 1876
-    label "futbol_haberleri"
-  ]
-  node [
-    id 1877
-    label "Ofbeat"
-  ]
-  node [
-    id 1878
-    label "humptydumptynews"
-  ]
-  node [
-    id 1879
-    label "SatuKarimun"
-  ]
-  node [
-    id 1880
-    label "pwang"
-  ]
-  node [
-    id 1881
-    label "animalfriends"
-  ]
-  node [
-    id 1882
-    label "left4dead"
-  ]
-  node [
-    id 1883
-    label "korea"
-  ]
-  node [
-    id 1884
-    label "Innerpreneurship"
-  ]
-  node [
-    id 1885
-    label "london"
-  ]
-  node [
-    id 1886
-    label "regassan"
-  ]
-  node [
-    id 1887
-    label "WTF"
-  ]
-  node [
-    id 1888
-    label "PreparedSociety"
-  ]
-  node [
-    id 1889
-    label "newspapers"
-  ]
-  node [
-    id 1890
-    label "haloforge"
-  ]
-  node [
-    id 1891
-    label "CGSutra"
-  ]
-  node [
-    id 1892
-    label "weirdgames"
-  ]
-  node [
-    id 1893
-    label "Motorsport"
-  ]
-  node [
-    id 1894
-    label "adown"
-  ]
-  node [
-    id 1895
-    label "xrosswheeler"
-  ]
-  node [
-    id 1896
-    label "Hopefuls"
-  ]
-  node [
-    id 1897
-    label "blizzit"
-  ]
-  node [
-    id 1898
-    label "Catalysts"
-  ]
-  node [
-    id 1899
-    label "Trucking"
-  ]
-  node [
-    id 1900
-    label "xTRUMANx"
-  ]
-  node [
-    id 1901
-    label "Beers"
-  ]
-  node [
-    id 1902
-    label "greetings"
-  ]
-  node [
-    id 1903
-    label "telescopes"
-  ]
-  node [
-    id 1904
-    label "Rural"
-  ]
-  node [
-    id 1905
-    label "sumobackup"
-  ]
-  node [
-    id 1906
-    label "metart"
-  ]
-  node [
-    id 1907
-    label "hilary"
-  ]
-  node [
-    id 1908
-    label "Muecs"
-  ]
-  node [
-    id 1909
-    label "ArtMakers"
-  ]
-  node [
-    id 1910
-    label "Gears"
-  ]
-  node [
-    id 1911
-    label "Skepticism"
-  ]
-  node [
-    id 1912
-    label "potus08"
-  ]
-  node [
-    id 1913
-    label "anna7317"
-  ]
-  node [
-    id 1914
-    label "bushlegacyproject"
-  ]
-  node [
-    id 1915
-    label "EBM"
-  ]
-  node [
-    id 1916
-    label "Kerala"
-  ]
-  node [
-    id 1917
-    label "GreenBayPackers"
-  ]
-  node [
-    id 1918
-    label "Jithin"
-  ]
-  node [
-    id 1919
-    label "elections"
-  ]
-  node [
-    id 1920
-    label "FatLoss"
-  ]
-  node [
-    id 1921
-    label "videouselection2008"
-  ]
-  node [
-    id 1922
-    label "celebrity"
-  ]
-  node [
-    id 1923
-    label "Iowa"
-  ]
-  node [
-    id 1924
-    label "otl"
-  ]
-  node [
-    id 1925
-    label "CueSportTV"
-  ]
-  node [
-    id 1926
-    label "ShmoozeIt"
-  ]
-  node [
-    id 1927
-    label "WUOG"
-  ]
-  node [
-    id 1928
-    label "vikramkaushal"
-  ]
-  node [
-    id 1929
-    label "mental_helaht"
-  ]
-  node [
-    id 1930
-    label "DulceBurro"
-  ]
-  node [
-    id 1931
-    label "startups"
-  ]
-  node [
-    id 1932
-    label "Niger"
-  ]
-  node [
-    id 1933
-    label "subredditis"
-  ]
-  node [
-    id 1934
-    label "NoDuh"
-  ]
-  node [
-    id 1935
-    label "selfimprovement"
-  ]
-  node [
-    id 1936
-    label "HotelsUK"
-  ]
-  node [
-    id 1937
-    label "Jeffrey"
-  ]
-  node [
-    id 1938
-    label "Sexy"
-  ]
-  node [
-    id 1939
-    label "electronicmusic"
-  ]
-  node [
-    id 1940
-    label "Turkey"
-  ]
-  node [
-    id 1941
-    label "serbia"
-  ]
-  node [
-    id 1942
-    label "fuckthedrugwar"
-  ]
-  node [
-    id 1943
-    label "astro"
-  ]
-  node [
-    id 1944
-    label "yourgovernmentatwork"
-  ]
-  node [
-    id 1945
-    label "MichaelSeylar"
-  ]
-  node [
-    id 1946
-    label "boingboing"
-  ]
-  node [
-    id 1947
-    label "Amigos"
-  ]
-  node [
-    id 1948
-    label "letsmakeagame"
-  ]
-  node [
-    id 1949
-    label "CakeWatch"
-  ]
-  node [
-    id 1950
-    label "dlatua"
-  ]
-  node [
-    id 1951
-    label "BABEnvironment"
-  ]
-  node [
-    id 1952
-    label "browsers"
-  ]
-  node [
-    id 1953
-    label "iPhoneDev"
-  ]
-  node [
-    id 1954
-    label "GrammarNazi"
-  ]
-  node [
-    id 1955
-    label "pretty"
-  ]
-  node [
-    id 1956
-    label "rolaqonline"
-  ]
-  node [
-    id 1957
-    label "callingIT"
-  ]
-  node [
-    id 1958
-    label "Bamze"
-  ]
-  node [
-    id 1959
-    label "country"
-  ]
-  node [
-    id 1960
-    label "petpeeve"
-  ]
-  node [
-    id 1961
-    label "KLUG"
-  ]
-  node [
-    id 1962
-    label "cuiltheory"
-  ]
-  node [
-    id 1963
-    label "windows"
-  ]
-  node [
-    id 1964
-    label "loveandroid"
-  ]
-  node [
-    id 1965
-    label "Sparta"
-  ]
-  node [
-    id 1966
-    label "venti"
-  ]
-  node [
-    id 1967
-    label "younessi"
-  ]
-  node [
-    id 1968
-    label "MotivatedPhotos"
-  ]
-  node [
-    id 1969
-    label "Alex"
-  ]
-  node [
-    id 1970
-    label "yourweek"
-  ]
-  node [
-    id 1971
-    label "travelnews"
-  ]
-  node [
-    id 1972
-    label "hentai"
-  ]
-  node [
-    id 1973
-    label "Lighting"
-  ]
-  node [
-    id 1974
-    label "ngongo"
-  ]
-  node [
-    id 1975
-    label "Celebs_Gossiper"
-  ]
-  node [
-    id 1976
-    label "fsm"
-  ]
-  node [
-    id 1977
-    label "MonsterVine"
-  ]
-  node [
-    id 1978
-    label "audible"
-  ]
-  node [
-    id 1979
-    label "greentea"
-  ]
-  node [
-    id 1980
-    label "10stepstohealth"
-  ]
-  node [
-    id 1981
-    label "skating"
-  ]
-  node [
-    id 1982
-    label "seduction"
-  ]
-  node [
-    id 1983
-    label "Brooklyn"
-  ]
-  node [
-    id 1984
-    label "bestactorofiran"
-  ]
-  node [
-    id 1985
-    label "ashima28"
-  ]
-  node [
-    id 1986
-    label "Rocking"
-  ]
-  node [
-    id 1987
-    label "Innovationmeme"
-  ]
-  node [
-    id 1988
-    label "AdaptogenNet"
-  ]
-  node [
-    id 1989
-    label "ROHIT2SMART"
-  ]
-  node [
-    id 1990
-    label "MGSM"
-  ]
-  node [
-    id 1991
-    label "2012"
-  ]
-  node [
-    id 1992
-    label "JessicaMooray"
-  ]
-  node [
-    id 1993
-    label "wesley"
-  ]
-  node [
-    id 1994
-    label "DietHealth"
-  ]
-  node [
-    id 1995
-    label "environment"
-  ]
-  node [
-    id 1996
-    label "HAM"
-  ]
-  node [
-    id 1997
-    label "superhappy"
-  ]
-  node [
-    id 1998
-    label "forum"
-  ]
-  node [
-    id 1999
-    label "justwow"
-  ]
-  node [
-    id 2000
-    label "OUI"
-  ]
-  node [
-    id 2001
-    label "Stan"
-  ]
-  node [
-    id 2002
-    label "Jameselle"
-  ]
-  node [
-    id 2003
-    label "Israel"
-  ]
-  node [
-    id 2004
-    label "OneMFriends"
-  ]
-  node [
-    id 2005
-    label "anglotopia"
-  ]
-  node [
-    id 2006
-    label "Mastercom"
-  ]
-  node [
-    id 2007
-    label "Houseofbikers"
-  ]
-  node [
-    id 2008
-    label "mcmattp"
-  ]
-  node [
-    id 2009
-    label "animation"
-  ]
-  node [
-    id 2010
-    label "management"
-  ]
-  node [
-    id 2011
-    label "independent"
-  ]
-  node [
-    id 2012
-    label "endless"
-  ]
-  node [
-    id 2013
-    label "pkny23"
-  ]
-  node [
-    id 2014
-    label "InboxMarketing"
-  ]
-  node [
-    id 2015
-    label "philadelphia"
-  ]
-  node [
-    id 2016
-    label "haneporg"
-  ]
-  node [
-    id 2017
-    label "techinhiding"
-  ]
-  node [
-    id 2018
-    label "za121n"
-  ]
-  node [
-    id 2019
-    label "istanbul"
-  ]
-  node [
-    id 2020
-    label "autrementleweb"
-  ]
-  node [
-    id 2021
-    label "BiblicalArchaeology"
-  ]
-  node [
-    id 2022
-    label "MyDailyDj"
-  ]
-  node [
-    id 2023
-    label "Attenborough"
-  ]
-  node [
-    id 2024
-    label "ebooks"
-  ]
-  node [
-    id 2025
-    label "isariv"
-  ]
-  node [
-    id 2026
-    label "cars"
-  ]
-  node [
-    id 2027
-    label "MoneyAnswerTree"
-  ]
-  node [
-    id 2028
-    label "Caterinca"
-  ]
-  node [
-    id 2029
-    label "arunrocks"
-  ]
-  node [
-    id 2030
-    label "positivethinker"
-  ]
-  node [
-    id 2031
-    label "Celebs"
-  ]
-  node [
-    id 2032
-    label "indocapitalfund"
-  ]
-  node [
-    id 2033
-    label "dcpanganiban"
-  ]
-  node [
-    id 2034
-    label "ThisAmericanLife"
-  ]
-  node [
-    id 2035
-    label "TurkeyBacon"
-  ]
-  node [
-    id 2036
-    label "WikiDashboard"
-  ]
-  node [
-    id 2037
-    label "realestateinvesting"
-  ]
-  node [
-    id 2038
-    label "agathaaden"
-  ]
-  node [
-    id 2039
-    label "disc"
-  ]
-  node [
-    id 2040
-    label "ATWT"
-  ]
-  node [
-    id 2041
-    label "CougarPulse"
-  ]
-  node [
-    id 2042
-    label "UnsolvedMysteries"
-  ]
-  node [
-    id 2043
-    label "bonsaijon"
-  ]
-  node [
-    id 2044
-    label "captioncontest"
-  ]
-  node [
-    id 2045
-    label "AJokes"
-  ]
-  node [
-    id 2046
-    label "Gossiptainment"
-  ]
-  node [
-    id 2047
-    label "PeterSchiff"
-  ]
-  node [
-    id 2048
-    label "Genseq"
-  ]
-  node [
-    id 2049
-    label "d1g"
-  ]
-  node [
-    id 2050
-    label "YFRIndia"
-  ]
-  node [
-    id 2051
-    label "StupidCriminals"
-  ]
-  node [
-    id 2052
-    label "xinh"
-  ]
-  node [
-    id 2053
-    label "neoachorite"
-  ]
-  node [
-    id 2054
-    label "911truth"
-  ]
-  node [
-    id 2055
-    label "siliconvalley"
-  ]
-  node [
-    id 2056
-    label "quake3"
-  ]
-  node [
-    id 2057
-    label "Fantasy"
-  ]
-  node [
-    id 2058
-    label "xkcd"
-  ]
-  node [
-    id 2059
-    label "offensive"
-  ]
-  node [
-    id 2060
-    label "Tippiz"
-  ]
-  node [
-    id 2061
-    label "ComputerSecurity"
-  ]
-  node [
-    id 2062
-    label "helpdesk"
-  ]
-  node [
-    id 2063
-    label "asftechnology"
-  ]
-  node [
-    id 2064
-    label "Ashish"
-  ]
-  node [
-    id 2065
-    label "CarLeasing"
-  ]
-  node [
-    id 2066
-    label "african_music"
-  ]
-  node [
-    id 2067
-    label "hotvideos"
-  ]
-  node [
-    id 2068
-    label "goats"
-  ]
-  node [
-    id 2069
-    label "terryly"
-  ]
-  node [
-    id 2070
-    label "tubing"
-  ]
-  node [
-    id 2071
-    label "technology"
-  ]
-  node [
-    id 2072
-    label "MoosePatrol"
-  ]
-  node [
-    id 2073
-    label "FunnyFidos"
-  ]
-  node [
-    id 2074
-    label "Amigoni"
-  ]
-  node [
-    id 2075
-    label "visualization"
-  ]
-  node [
-    id 2076
-    label "WEBFTW"
-  ]
-  node [
-    id 2077
-    label "Guitarman51"
-  ]
-  node [
-    id 2078
-    label "l33t"
-  ]
-  node [
-    id 2079
-    label "Plugyoursite"
-  ]
-  node [
-    id 2080
-    label "Big_Tits_old_Milfs"
-  ]
-  node [
-    id 2081
-    label "vintagetwist"
-  ]
-  node [
-    id 2082
-    label "crime"
-  ]
-  node [
-    id 2083
-    label "cimigo"
-  ]
-  node [
-    id 2084
-    label "funnylolcats"
-  ]
-  node [
-    id 2085
-    label "harajuku"
-  ]
-  node [
-    id 2086
-    label "Outdoors"
-  ]
-  node [
-    id 2087
-    label "justforkids"
-  ]
-  node [
-    id 2088
-    label "LAlofts"
-  ]
-  node [
-    id 2089
-    label "NewsGuru"
-  ]
-  node [
-    id 2090
-    label "Letsgetawesome"
-  ]
-  node [
-    id 2091
-    label "porn"
-  ]
-  node [
-    id 2092
-    label "bungaseruni"
-  ]
-  node [
-    id 2093
-    label "PassionOnNow"
-  ]
-  node [
-    id 2094
-    label "Bakugan"
-  ]
-  node [
-    id 2095
-    label "GolfInstruction"
-  ]
-  node [
-    id 2096
-    label "uxbuzz"
-  ]
-  node [
-    id 2097
-    label "Quonews"
-  ]
-  node [
-    id 2098
-    label "nanotechnology"
-  ]
-  node [
-    id 2099
-    label "lectures"
-  ]
-  node [
-    id 2100
-    label "NOLA"
-  ]
-  node [
-    id 2101
-    label "actlocally"
-  ]
-  node [
-    id 2102
-    label "Poo"
-  ]
-  node [
-    id 2103
-    label "Joseph4u"
-  ]
-  node [
-    id 2104
-    label "StupidVideos"
-  ]
-  node [
-    id 2105
-    label "MACGREGOR"
-  ]
-  node [
-    id 2106
-    label "harrypotter"
-  ]
-  node [
-    id 2107
-    label "MontrealTechWatch"
-  ]
-  node [
-    id 2108
-    label "ScrappyMusic"
-  ]
-  node [
-    id 2109
-    label "OnlineBingoGala"
-  ]
-  node [
-    id 2110
-    label "borondon"
-  ]
-  node [
-    id 2111
-    label "Inflation_Watch"
-  ]
-  node [
-    id 2112
-    label "RedditRetards"
-  ]
-  node [
-    id 2113
-    label "ihavereadit"
-  ]
-  node [
-    id 2114
-    label "blackculture"
-  ]
-  node [
-    id 2115
-    label "zen"
-  ]
-  node [
-    id 2116
-    label "obeygiant"
-  ]
-  node [
-    id 2117
-    label "Cetatenie"
-  ]
-  node [
-    id 2118
-    label "transit"
-  ]
-  node [
-    id 2119
-    label "Julie"
-  ]
-  node [
-    id 2120
-    label "hcwdb"
-  ]
-  node [
-    id 2121
-    label "VideoBuzz"
-  ]
-  node [
-    id 2122
-    label "chistes"
-  ]
-  node [
-    id 2123
-    label "search"
-  ]
-  node [
-    id 2124
-    label "mspianobug"
-  ]
-  node [
-    id 2125
-    label "GossipMax"
-  ]
-  node [
-    id 2126
-    label "xbox360games"
-  ]
-  node [
-    id 2127
-    label "Hair"
-  ]
-  node [
-    id 2128
-    label "matheducation"
-  ]
-  node [
-    id 2129
-    label "earthhour"
-  ]
-  node [
-    id 2130
-    label "Discounts"
-  ]
-  node [
-    id 2131
-    label "NewOrleans"
-  ]
-  node [
-    id 2132
-    label "Common_Lisp"
-  ]
-  node [
-    id 2133
-    label "police"
-  ]
-  node [
-    id 2134
-    label "wallpaper"
-  ]
-  node [
-    id 2135
-    label "thiyagaraaj"
-  ]
-  node [
-    id 2136
-    label "MassHighTech"
-  ]
-  node [
-    id 2137
-    label "Reviews"
-  ]
-  node [
-    id 2138
-    label "fuckXmas"
-  ]
-  node [
-    id 2139
-    label "FedWorker"
-  ]
-  node [
-    id 2140
-    label "pranks"
-  ]
-  node [
-    id 2141
-    label "SocialTheory"
-  ]
-  node [
-    id 2142
-    label "CollegeFootball"
-  ]
-  node [
-    id 2143
-    label "Metamorphosis"
-  ]
-  node [
-    id 2144
-    label "malwarecity"
-  ]
-  node [
-    id 2145
-    label "zibb"
-  ]
-  node [
-    id 2146
-    label "kikko"
-  ]
-  node [
-    id 2147
-    label "punk"
-  ]
-  node [
-    id 2148
-    label "extjs"
-  ]
-  node [
-    id 2149
-    label "Fotobookmarks"
-  ]
-  node [
-    id 2150
-    label "I_am_a_PC"
-  ]
-  node [
-    id 2151
-    label "megaroyalti"
-  ]
-  node [
-    id 2152
-    label "metareddit"
-  ]
-  node [
-    id 2153
-    label "Mars"
-  ]
-  node [
-    id 2154
-    label "kefke44"
-  ]
-  node [
-    id 2155
-    label "Scary"
-  ]
-  node [
-    id 2156
-    label "riaa"
-  ]
-  node [
-    id 2157
-    label "information"
-  ]
-  node [
-    id 2158
-    label "hypotheticals"
-  ]
-  node [
-    id 2159
-    label "Anil"
-  ]
-  node [
-    id 2160
-    label "zeppelins"
-  ]
-  node [
-    id 2161
-    label "scissoring"
-  ]
-  node [
-    id 2162
-    label "weather"
-  ]
-  node [
-    id 2163
-    label "NewAgeReligion"
-  ]
-  node [
-    id 2164
-    label "TennisGrandstand"
-  ]
-  node [
-    id 2165
-    label "TORBooks"
-  ]
-  node [
-    id 2166
-    label "rosilawani"
-  ]
-  node [
-    id 2167
-    label "lazy"
-  ]
-  node [
-    id 2168
-    label "gokhan"
-  ]
-  node [
-    id 2169
-    label "dickoftheyear"
-  ]
-  node [
-    id 2170
-    label "xmpp"
-  ]
-  node [
-    id 2171
-    label "downloadfromyoutube"
-  ]
-  node [
-    id 2172
-    label "gtoddv"
-  ]
-  node [
-    id 2173
-    label "onlinejournalism"
-  ]
-  node [
-    id 2174
-    label "Sexzy"
-  ]
-  node [
-    id 2175
-    label "drunkenpigs"
-  ]
-  node [
-    id 2176
-    label "Epilare"
-  ]
-  node [
-    id 2177
-    label "subreddit_complaints"
-  ]
-  node [
-    id 2178
-    label "sar"
-  ]
-  node [
-    id 2179
-    label "tard"
-  ]
-  node [
-    id 2180
-    label "PhilosophyCorner"
-  ]
-  node [
-    id 2181
-    label "dailywtf"
-  ]
-  node [
-    id 2182
-    label "nutechstuff"
-  ]
-  node [
-    id 2183
-    label "Trays"
-  ]
-  node [
-    id 2184
-    label "blogger"
-  ]
-  node [
-    id 2185
-    label "cherrysave"
-  ]
-  node [
-    id 2186
-    label "matrako"
-  ]
-  node [
-    id 2187
-    label "college"
-  ]
-  node [
-    id 2188
-    label "bestof_conspiracy"
-  ]
-  node [
-    id 2189
-    label "renil"
-  ]
-  node [
-    id 2190
-    label "monocle"
-  ]
-  node [
-    id 2191
-    label "netsec"
-  ]
-  node [
-    id 2192
-    label "motormaniac"
-  ]
-  node [
-    id 2193
-    label "femto"
-  ]
-  node [
-    id 2194
-    label "SexyLinks"
-  ]
-  node [
-    id 2195
-    label "Neoogilvy"
-  ]
-  node [
-    id 2196
-    label "nodoubt2"
-  ]
-  node [
-    id 2197
-    label "omni"
-  ]
-  node [
-    id 2198
-    label "erlang"
-  ]
-  node [
-    id 2199
-    label "Capitalism"
-  ]
-  node [
-    id 2200
-    label "urgentloan"
-  ]
-  node [
-    id 2201
-    label "cuil"
-  ]
-  node [
-    id 2202
-    label "j2me"
-  ]
-  node [
-    id 2203
-    label "koreanmovies"
-  ]
-  node [
-    id 2204
-    label "Art"
-  ]
-  node [
-    id 2205
-    label "ekerala"
-  ]
-  node [
-    id 2206
-    label "MixingItUp"
-  ]
-  node [
-    id 2207
-    label "Catholic"
-  ]
-  node [
-    id 2208
-    label "BusinessNetwork"
-  ]
-  node [
-    id 2209
-    label "The_Fantasy_Art_Blog"
-  ]
-  node [
-    id 2210
-    label "scene"
-  ]
-  node [
-    id 2211
-    label "Articles"
-  ]
-  node [
-    id 2212
-    label "feetish"
-  ]
-  node [
-    id 2213
-    label "hotels"
-  ]
-  node [
-    id 2214
-    label "AmericanBridal"
-  ]
-  node [
-    id 2215
-    label "GameSkive"
-  ]
-  node [
-    id 2216
-    label "SecurityReddit"
-  ]
-  node [
-    id 2217
-    label "agile"
-  ]
-  node [
-    id 2218
-    label "ddpulsa"
-  ]
-  node [
-    id 2219
-    label "FAIRFederation"
-  ]
-  node [
-    id 2220
-    label "Sitesbid"
-  ]
-  node [
-    id 2221
-    label "csstest2"
-  ]
-  node [
-    id 2222
-    label "words"
-  ]
-  node [
-    id 2223
-    label "theater"
-  ]
-  node [
-    id 2224
-    label "mysearch2008"
-  ]
-  node [
-    id 2225
-    label "chicagoland"
-  ]
-  node [
-    id 2226
-    label "KnobsHingesandMore"
-  ]
-  node [
-    id 2227
-    label "ruby"
-  ]
-  node [
-    id 2228
-    label "rben"
-  ]
-  node [
-    id 2229
-    label "BeardsMotherfucker"
-  ]
-  node [
-    id 2230
-    label "Conservative"
-  ]
-  node [
-    id 2231
-    label "mypussyhurts"
-  ]
-  node [
-    id 2232
-    label "BlackOps"
-  ]
-  node [
-    id 2233
-    label "freesoftware"
-  ]
-  node [
-    id 2234
-    label "ada"
-  ]
-  node [
-    id 2235
-    label "Tryton"
-  ]
-  node [
-    id 2236
-    label "Showboxx"
-  ]
-  node [
-    id 2237
-    label "sv"
-  ]
-  node [
-    id 2238
-    label "Exercises"
-  ]
-  node [
-    id 2239
-    label "johncabellreads"
-  ]
-  node [
-    id 2240
-    label "vibemetrix"
-  ]
-  node [
-    id 2241
-    label "thetruth"
-  ]
-  node [
-    id 2242
-    label "jacobwillread"
-  ]
-  node [
-    id 2243
-    label "scala"
-  ]
-  node [
-    id 2244
-    label "eOffice"
-  ]
-  node [
-    id 2245
-    label "MyRevivl"
-  ]
-  node [
-    id 2246
-    label "oliveoil"
-  ]
-  node [
-    id 2247
-    label "Atlanta"
-  ]
-  node [
-    id 2248
-    label "Composers"
-  ]
-  node [
-    id 2249
-    label "Bikini"
-  ]
-  node [
-    id 2250
-    label "EntenduQc"
-  ]
-  node [
-    id 2251
-    label "songs"
-  ]
-  node [
-    id 2252
-    label "bestsitesever"
-  ]
-  node [
-    id 2253
-    label "panda"
-  ]
-  node [
-    id 2254
-    label "action"
-  ]
-  node [
-    id 2255
-    label "Hardcore"
-  ]
-  node [
-    id 2256
-    label "mobileweb"
-  ]
-  node [
-    id 2257
-    label "pitbulls"
-  ]
-  node [
-    id 2258
-    label "hhjoo"
-  ]
-  node [
-    id 2259
-    label "programming_ru"
-  ]
-  node [
-    id 2260
-    label "latin"
-  ]
-  node [
-    id 2261
-    label "wenyude"
-  ]
-  node [
-    id 2262
-    label "Amateur"
-  ]
-  node [
-    id 2263
-    label "JimDicken"
-  ]
-  node [
-    id 2264
-    label "solarpowerreview"
-  ]
-  node [
-    id 2265
-    label "yo_yo"
-  ]
-  node [
-    id 2266
-    label "fffffffuuuuuuuuuuuu"
-  ]
-  node [
-    id 2267
-    label "PoliticianRegistry"
-  ]
-  node [
-    id 2268
-    label "vikash"
-  ]
-  node [
-    id 2269
-    label "ideasfortheadmins"
-  ]
-  node [
-    id 2270
-    label "jasonallenmiller"
-  ]
-  node [
-    id 2271
-    label "answers"
-  ]
-  node [
-    id 2272
-    label "redditcompetition"
-  ]
-  node [
-    id 2273
-    label "harrisonburg"
-  ]
-  node [
-    id 2274
-    label "minnesotavikings"
-  ]
-  node [
-    id 2275
-    label "ryansjones"
-  ]
-  node [
-    id 2276
-    label "schneier"
-  ]
-  node [
-    id 2277
-    label "AnimatedGifs"
-  ]
-  node [
-    id 2278
-    label "halanscott"
-  ]
-  node [
-    id 2279
-    label "Belem40"
-  ]
-  node [
-    id 2280
-    label "PangaeaTravel"
-  ]
-  node [
-    id 2281
-    label "cocoadev"
-  ]
-  node [
-    id 2282
-    label "streetview"
-  ]
-  node [
-    id 2283
-    label "honesty"
-  ]
-  node [
-    id 2284
-    label "ravi"
-  ]
-  node [
-    id 2285
-    label "nsw"
-  ]
-  node [
-    id 2286
-    label "origami"
-  ]
-  node [
-    id 2287
-    label "space"
-  ]
-  node [
-    id 2288
-    label "GregK"
-  ]
-  node [
-    id 2289
-    label "thorlin"
-  ]
-  node [
-    id 2290
-    label "gamedev"
-  ]
-  node [
-    id 2291
-    label "NI4D"
-  ]
-  node [
-    id 2292
-    label "JeremyElijah"
-  ]
-  node [
-    id 2293
-    label "greenpartyhamilton"
-  ]
-  node [
-    id 2294
-    label "FinancialTrading"
-  ]
-  node [
-    id 2295
-    label "TheBible"
-  ]
-  node [
-    id 2296
-    label "BDIU"
-  ]
-  node [
-    id 2297
-    label "BCCResearch"
-  ]
-  node [
-    id 2298
-    label "Artimaeis"
-  ]
-  node [
-    id 2299
-    label "chemistry"
-  ]
-  node [
-    id 2300
-    label "Bedrijfsevenementen"
-  ]
-  node [
-    id 2301
-    label "memes"
-  ]
-  node [
-    id 2302
-    label "hobbylazy"
-  ]
-  node [
-    id 2303
-    label "gamedesignlondon"
-  ]
-  node [
-    id 2304
-    label "Tobacco"
-  ]
-  node [
-    id 2305
-    label "FTVgirls"
-  ]
-  node [
-    id 2306
-    label "schwa"
-  ]
-  node [
-    id 2307
-    label "pooplickingpromises"
-  ]
-  node [
-    id 2308
-    label "cocktails"
-  ]
-  node [
-    id 2309
-    label "celebritiesphotos"
-  ]
-  node [
-    id 2310
-    label "indiemusic"
-  ]
-  node [
-    id 2311
-    label "Crazy"
-  ]
-  node [
-    id 2312
-    label "alexandra6"
-  ]
-  node [
-    id 2313
-    label "Ihitztraffic"
-  ]
-  node [
-    id 2314
-    label "motherapproves"
-  ]
-  node [
-    id 2315
-    label "DMT"
-  ]
-  node [
-    id 2316
-    label "no"
-  ]
-  node [
-    id 2317
-    label "Candice"
-  ]
-  node [
-    id 2318
-    label "solusiplus"
-  ]
-  node [
-    id 2319
-    label "smallbiz"
-  ]
-  node [
-    id 2320
-    label "cnbeta"
-  ]
-  node [
-    id 2321
-    label "HairStraightener"
-  ]
-  node [
-    id 2322
-    label "SeeIt4Fun"
-  ]
-  node [
-    id 2323
-    label "Recursive"
-  ]
-  node [
-    id 2324
-    label "cyberthinkinfotech"
-  ]
-  node [
-    id 2325
-    label "CarpetRepair"
-  ]
-  node [
-    id 2326
-    label "JLProps"
-  ]
-  node [
-    id 2327
-    label "lagreenlife"
-  ]
-  node [
-    id 2328
-    label "survivor"
-  ]
-  node [
-    id 2329
-    label "Pets"
-  ]
-  node [
-    id 2330
-    label "Francie"
-  ]
-  node [
-    id 2331
-    label "Vegetarianism"
-  ]
-  node [
-    id 2332
-    label "suave"
-  ]
-  node [
-    id 2333
-    label "markedwardlewis"
-  ]
-  node [
-    id 2334
-    label "Public_Domain"
-  ]
-  node [
-    id 2335
-    label "evmsale"
-  ]
-  node [
-    id 2336
-    label "thomas"
-  ]
-  node [
-    id 2337
-    label "florida"
-  ]
-  node [
-    id 2338
-    label "Garritan"
-  ]
-  node [
-    id 2339
-    label "bees"
-  ]
-  node [
-    id 2340
-    label "Wonderwedge"
-  ]
-  node [
-    id 2341
-    label "sfmagazines"
-  ]
-  node [
-    id 2342
-    label "ralphnader"
-  ]
-  node [
-    id 2343
-    label "FoodPolitics"
-  ]
-  node [
-    id 2344
-    label "UrbanExploring"
-  ]
-  node [
-    id 2345
-    label "plavix"
-  ]
-  node [
-    id 2346
-    label "BCG"
-  ]
-  node [
-    id 2347
-    label "autonews"
-  ]
-  node [
-    id 2348
-    label "random"
-  ]
-  node [
-    id 2349
-    label "Sex_Offender_Issues"
-  ]
-  node [
-    id 2350
-    label "LGBTReddit"
-  ]
-  node [
-    id 2351
-    label "LuluTopContent"
-  ]
-  node [
-    id 2352
-    label "ferrets"
-  ]
-  node [
-    id 2353
-    label "giaoduc"
-  ]
-  node [
-    id 2354
-    label "nin"
-  ]
-  node [
-    id 2355
-    label "hotshots"
-  ]
-  node [
-    id 2356
-    label "HallOfFame"
-  ]
-  node [
-    id 2357
-    label "spark"
-  ]
-  node [
-    id 2358
-    label "l3ib"
-  ]
-  node [
-    id 2359
-    label "Astaqauliyah"
-  ]
-  node [
-    id 2360
-    label "LechnaBlog"
-  ]
-  node [
-    id 2361
-    label "Hardawrae"
-  ]
-  node [
-    id 2362
-    label "footballzone"
-  ]
-  node [
-    id 2363
-    label "futurenews"
-  ]
-  node [
-    id 2364
-    label "siobs"
-  ]
-  node [
-    id 2365
-    label "hitchhiking"
-  ]
-  node [
-    id 2366
-    label "hacking"
-  ]
-  node [
-    id 2367
-    label "sed"
-  ]
-  node [
-    id 2368
-    label "BurnsideWriters"
-  ]
-  node [
-    id 2369
-    label "dictionary"
-  ]
-  node [
-    id 2370
-    label "CanadaFTW"
-  ]
-  node [
-    id 2371
-    label "VillasMoraira"
-  ]
-  node [
-    id 2372
-    label "Mesothelioma_treat"
-  ]
-  node [
-    id 2373
-    label "emacs"
-  ]
-  node [
-    id 2374
-    label "nsfwvideos"
-  ]
-  node [
-    id 2375
-    label "Pantsless"
-  ]
-  node [
-    id 2376
-    label "heresy"
-  ]
-  node [
-    id 2377
-    label "MilwaukeeWebDesign"
-  ]
-  node [
-    id 2378
-    label "disability"
-  ]
-  node [
-    id 2379
-    label "masala"
-  ]
-  node [
-    id 2380
-    label "PaulShort"
-  ]
-  node [
-    id 2381
-    label "Terzostipendio"
-  ]
-  node [
-    id 2382
-    label "ireland"
-  ]
-  node [
-    id 2383
-    label "darlingasian"
-  ]
-  node [
-    id 2384
-    label "BritishPolitics"
-  ]
-  node [
-    id 2385
-    label "Heroes"
-  ]
-  node [
-    id 2386
-    label "singapore"
-  ]
-  node [
-    id 2387
-    label "bealemj"
-  ]
-  node [
-    id 2388
-    label "mercurial"
-  ]
-  node [
-    id 2389
-    label "WhiteCollarFraud"
-  ]
-  node [
-    id 2390
-    label "vid"
-  ]
-  node [
-    id 2391
-    label "BillCube"
-  ]
-  node [
-    id 2392
-    label "europeansolutions"
-  ]
-  node [
-    id 2393
-    label "mystupidtestreddit"
-  ]
-  node [
-    id 2394
-    label "beyazonluk"
-  ]
-  node [
-    id 2395
-    label "scouting"
-  ]
-  node [
-    id 2396
-    label "snoindod"
-  ]
-  node [
-    id 2397
-    label "InTraser"
-  ]
-  node [
-    id 2398
-    label "CanadaVotes2008"
-  ]
-  node [
-    id 2399
-    label "Shelia"
-  ]
-  node [
-    id 2400
-    label "Hepsi"
-  ]
-  node [
-    id 2401
-    label "Websitedevlopement"
-  ]
-  node [
-    id 2402
-    label "Polilingua"
-  ]
-  node [
-    id 2403
-    label "Temon"
-  ]
-  node [
-    id 2404
-    label "censorship"
-  ]
-  node [
-    id 2405
-    label "directory"
-  ]
-  node [
-    id 2406
-    label "bugreports"
-  ]
-  node [
-    id 2407
-    label "WebGol"
-  ]
-  node [
-    id 2408
-    label "kevin332"
-  ]
-  node [
-    id 2409
-    label "jameswatt"
-  ]
-  node [
-    id 2410
-    label "irwanbee"
-  ]
-  node [
-    id 2411
-    label "CiscoUCCE"
-  ]
-  node [
-    id 2412
-    label "MegaJonasLova"
-  ]
-  node [
-    id 2413
-    label "SignsUS"
-  ]
-  node [
-    id 2414
-    label "sandbox"
-  ]
-  node [
-    id 2415
-    label "Doom_And_Gloom"
-  ]
-  node [
-    id 2416
-    label "parrots"
-  ]
-  node [
-    id 2417
-    label "fascinating"
-  ]
-  node [
-    id 2418
-    label "awwcute"
-  ]
-  node [
-    id 2419
-    label "wc2010"
-  ]
-  node [
-    id 2420
-    label "Launch_Strategies"
-  ]
-  node [
-    id 2421
-    label "fr"
-  ]
-  node [
-    id 2422
-    label "1keral"
-  ]
-  node [
-    id 2423
-    label "melvin"
-  ]
-  node [
-    id 2424
-    label "school"
-  ]
-  node [
-    id 2425
-    label "proud12mama"
-  ]
-  node [
-    id 2426
-    label "vedicastrology"
-  ]
-  node [
-    id 2427
-    label "TheSystemInfo"
-  ]
-  node [
-    id 2428
-    label "iTulip"
-  ]
-  node [
-    id 2429
-    label "wagi"
-  ]
-  node [
-    id 2430
-    label "dixipix"
-  ]
-  node [
-    id 2431
-    label "Zeitgeist"
-  ]
-  node [
-    id 2432
-    label "rumors"
-  ]
-  node [
-    id 2433
-    label "argentina"
-  ]
-  node [
-    id 2434
-    label "Anthropology"
-  ]
-  node [
-    id 2435
-    label "xbox360"
-  ]
-  node [
-    id 2436
-    label "malaysia"
-  ]
-  node [
-    id 2437
-    label "alexandre"
-  ]
-  node [
-    id 2438
-    label "EasyStreet"
-  ]
-  node [
-    id 2439
-    label "StitchSimply"
-  ]
-  node [
-    id 2440
-    label "getdomain"
-  ]
-  node [
-    id 2441
-    label "techwriting"
-  ]
-  node [
-    id 2442
-    label "GreaseMonkey"
-  ]
-  node [
-    id 2443
-    label "smalltalk"
-  ]
-  node [
-    id 2444
-    label "marketcrash"
-  ]
-  node [
-    id 2445
-    label "Voto"
-  ]
-  node [
-    id 2446
-    label "happyatwork"
-  ]
-  node [
-    id 2447
-    label "lida"
-  ]
-  node [
-    id 2448
-    label "oilexploration"
-  ]
-  node [
-    id 2449
-    label "Essays"
-  ]
-  node [
-    id 2450
-    label "television"
-  ]
-  node [
-    id 2451
-    label "brighton"
-  ]
-  node [
-    id 2452
-    label "newsben"
-  ]
-  node [
-    id 2453
-    label "crypto"
-  ]
-  node [
-    id 2454
-    label "alaska"
-  ]
-  node [
-    id 2455
-    label "Airfare"
-  ]
-  node [
-    id 2456
-    label "moonhoax"
-  ]
-  node [
-    id 2457
-    label "questions"
-  ]
-  node [
-    id 2458
-    label "shoppingbag"
-  ]
-  node [
-    id 2459
-    label "tr"
-  ]
-  node [
-    id 2460
-    label "rugby"
-  ]
-  node [
-    id 2461
-    label "Iraq"
-  ]
-  node [
-    id 2462
-    label "NoveltyUserNames"
-  ]
-  node [
-    id 2463
-    label "Eienelle"
-  ]
-  node [
-    id 2464
-    label "linkmingle"
-  ]
-  node [
-    id 2465
-    label "nutrition"
-  ]
-  node [
-    id 2466
-    label "jena"
-  ]
-  node [
-    id 2467
-    label "FlyerWiki"
-  ]
-  node [
-    id 2468
-    label "videointhetube"
-  ]
-  node [
-    id 2469
-    label "tiantiankankan"
-  ]
-  node [
-    id 2470
-    label "politics2"
-  ]
-  node [
-    id 2471
-    label "Technologyzone"
-  ]
-  node [
-    id 2472
-    label "Randomosity"
-  ]
-  node [
-    id 2473
-    label "Quality"
-  ]
-  node [
-    id 2474
-    label "The_Trainer"
-  ]
-  node [
-    id 2475
-    label "suceel"
-  ]
-  node [
-    id 2476
-    label "vinblackham"
-  ]
-  node [
-    id 2477
-    label "nota"
-  ]
-  node [
-    id 2478
-    label "revenge"
-  ]
-  node [
-    id 2479
-    label "Xstaticarmchair"
-  ]
-  node [
-    id 2480
-    label "url"
-  ]
-  node [
-    id 2481
-    label "ipodsandappletalk"
-  ]
-  node [
-    id 2482
-    label "c64"
-  ]
-  node [
-    id 2483
-    label "GBGuide"
-  ]
-  node [
-    id 2484
-    label "bloggerdal"
-  ]
-  node [
-    id 2485
-    label "deism"
-  ]
-  node [
-    id 2486
-    label "GamingIndustryNews"
-  ]
-  node [
-    id 2487
-    label "RealtorWebDesign"
-  ]
-  node [
-    id 2488
-    label "memetics"
-  ]
-  node [
-    id 2489
-    label "outsourcing"
-  ]
-  node [
-    id 2490
-    label "ChileRemix"
-  ]
-  node [
-    id 2491
-    label "choppers"
-  ]
-  node [
-    id 2492
-    label "lost"
-  ]
-  node [
-    id 2493
-    label "nethack"
-  ]
-  node [
-    id 2494
-    label "cleavepoetry"
-  ]
-  node [
-    id 2495
-    label "prakash"
-  ]
-  node [
-    id 2496
-    label "Packaging"
-  ]
-  node [
-    id 2497
-    label "scaling"
-  ]
-  node [
-    id 2498
-    label "OddStuff"
-  ]
-  node [
-    id 2499
-    label "flash"
-  ]
-  node [
-    id 2500
-    label "NewAthens"
-  ]
-  node [
-    id 2501
-    label "MapleLinks"
-  ]
-  node [
-    id 2502
-    label "AsianGirls"
-  ]
-  node [
-    id 2503
-    label "empoweredinternet"
-  ]
-  node [
-    id 2504
-    label "cons"
-  ]
-  node [
-    id 2505
-    label "graffiticreator"
-  ]
-  node [
-    id 2506
-    label "destinationclubs"
-  ]
-  node [
-    id 2507
-    label "NLP"
-  ]
-  node [
-    id 2508
-    label "insomnia"
-  ]
-  node [
-    id 2509
-    label "left_blogs"
-  ]
-  node [
-    id 2510
-    label "falcons"
-  ]
-  node [
-    id 2511
-    label "AirDuctCleaning"
-  ]
-  node [
-    id 2512
-    label "rocketry"
-  ]
-  node [
-    id 2513
-    label "vids"
-  ]
-  node [
-    id 2514
-    label "Kaede_Rukawa"
-  ]
-  node [
-    id 2515
-    label "MillionaireMommy"
-  ]
-  node [
-    id 2516
-    label "joufgirls"
-  ]
-  node [
-    id 2517
-    label "MagicMushrooms"
-  ]
-  node [
-    id 2518
-    label "FantasticContraption"
-  ]
-  node [
-    id 2519
-    label "self"
-  ]
-  node [
-    id 2520
-    label "JuicedMangoes"
-  ]
-  node [
-    id 2521
-    label "Breakfast"
-  ]
-  node [
-    id 2522
-    label "GWilliamCo"
-  ]
-  node [
-    id 2523
-    label "Gabrella"
-  ]
-  node [
-    id 2524
-    label "ObamasInagural"
-  ]
-  node [
-    id 2525
-    label "MrWebmonster"
-  ]
-  node [
-    id 2526
-    label "hiphop"
-  ]
-  node [
-    id 2527
-    label "storesaver"
-  ]
-  node [
-    id 2528
-    label "RetailHomeGoods"
-  ]
-  node [
-    id 2529
-    label "poll"
-  ]
-  node [
-    id 2530
-    label "THA"
-  ]
-  node [
-    id 2531
-    label "socialism"
-  ]
-  node [
-    id 2532
-    label "labor"
-  ]
-  node [
-    id 2533
-    label "EnergyIndependence"
-  ]
-  node [
-    id 2534
-    label "lumrax"
-  ]
-  node [
-    id 2535
-    label "Trepanation"
-  ]
-  node [
-    id 2536
-    label "culturehacking"
-  ]
-  node [
-    id 2537
-    label "fashion360"
-  ]
-  node [
-    id 2538
-    label "oseun"
-  ]
-  node [
-    id 2539
-    label "wallpapers"
-  ]
-  node [
-    id 2540
-    label "wedding"
-  ]
-  node [
-    id 2541
-    label "dranger"
-  ]
-  node [
-    id 2542
-    label "AmericanMilitary"
-  ]
-  node [
-    id 2543
-    label "religion"
-  ]
-  node [
-    id 2544
-    label "futurevision"
-  ]
-  node [
-    id 2545
-    label "oil"
-  ]
-  node [
-    id 2546
-    label "subreddit"
-  ]
-  node [
-    id 2547
-    label "LUKEPICCO"
-  ]
-  node [
-    id 2548
-    label "bizarrenews"
-  ]
-  node [
-    id 2549
-    label "supermarkets"
-  ]
-  node [
-    id 2550
-    label "Mold"
-  ]
-  node [
-    id 2551
-    label "BellaBraxton"
-  ]
-  node [
-    id 2552
-    label "mygame"
-  ]
-  node [
-    id 2553
-    label "lists"
-  ]
-  node [
-    id 2554
-    label "ewing2001"
-  ]
-  node [
-    id 2555
-    label "DSP"
-  ]
-  node [
-    id 2556
-    label "things"
-  ]
-  node [
-    id 2557
-    label "artmine1"
-  ]
-  node [
-    id 2558
-    label "naughtyamerica"
-  ]
-  node [
-    id 2559
-    label "exboyfriendback"
-  ]
-  node [
-    id 2560
-    label "Atheism2"
-  ]
-  node [
-    id 2561
-    label "water"
-  ]
-  node [
-    id 2562
-    label "PATENT"
-  ]
-  node [
-    id 2563
-    label "turf"
-  ]
-  node [
-    id 2564
-    label "closeoutcctv"
-  ]
-  node [
-    id 2565
-    label "hdemici"
-  ]
-  node [
-    id 2566
-    label "FREE"
-  ]
-  node [
-    id 2567
-    label "motivationalspeech"
-  ]
-  node [
-    id 2568
-    label "urbanplanning"
-  ]
-  node [
-    id 2569
-    label "hotblooded"
-  ]
-  node [
-    id 2570
-    label "pic"
-  ]
-  node [
-    id 2571
-    label "amazon"
-  ]
-  node [
-    id 2572
-    label "Smarty"
-  ]
-  node [
-    id 2573
-    label "europe"
-  ]
-  node [
-    id 2574
-    label "Politicalanalysis"
-  ]
-  node [
-    id 2575
-    label "espneurofeed"
-  ]
-  node [
-    id 2576
-    label "Iceland"
-  ]
-  node [
-    id 2577
-    label "Bullet"
-  ]
-  node [
-    id 2578
-    label "cpanratings"
-  ]
-  node [
-    id 2579
-    label "Rickey"
-  ]
-  node [
-    id 2580
-    label "handletime"
-  ]
-  node [
-    id 2581
-    label "WorldHistory"
-  ]
-  node [
-    id 2582
-    label "meat"
-  ]
-  node [
-    id 2583
-    label "lansing"
-  ]
-  node [
-    id 2584
-    label "xomobo"
-  ]
-  node [
-    id 2585
-    label "yuen999"
-  ]
-  node [
-    id 2586
-    label "BloodNi55a"
-  ]
-  node [
-    id 2587
-    label "showroom"
-  ]
-  node [
-    id 2588
-    label "EPA"
-  ]
-  node [
-    id 2589
-    label "breadpig"
-  ]
-  node [
-    id 2590
-    label "UndiesDrawer"
-  ]
-  node [
-    id 2591
-    label "coins"
-  ]
-  node [
-    id 2592
-    label "pl"
-  ]
-  node [
-    id 2593
-    label "sydney"
-  ]
-  node [
-    id 2594
-    label "Watches"
-  ]
-  node [
-    id 2595
-    label "Dietandhealth"
-  ]
-  node [
-    id 2596
-    label "luke"
-  ]
-  node [
-    id 2597
-    label "PHP"
-  ]
-  node [
-    id 2598
-    label "newyork"
-  ]
-  node [
-    id 2599
-    label "PotterNerds"
-  ]
-  node [
-    id 2600
-    label "marketing"
-  ]
-  node [
-    id 2601
-    label "CSPapers"
-  ]
-  node [
-    id 2602
-    label "IRO"
-  ]
-  node [
-    id 2603
-    label "nerdcore"
-  ]
-  node [
-    id 2604
-    label "LiberalHippies"
-  ]
-  node [
-    id 2605
-    label "theselectionist"
-  ]
-  node [
-    id 2606
-    label "Great"
-  ]
-  node [
-    id 2607
-    label "arslion"
-  ]
-  node [
-    id 2608
-    label "CPAWebGuy"
-  ]
-  node [
-    id 2609
-    label "Buddhism"
-  ]
-  node [
-    id 2610
-    label "Shemoidesigns"
-  ]
-  node [
-    id 2611
-    label "Agriculture"
-  ]
-  node [
-    id 2612
-    label "Clickry"
-  ]
-  node [
-    id 2613
-    label "hopes"
-  ]
-  node [
-    id 2614
-    label "Cooking"
-  ]
-  node [
-    id 2615
-    label "computers"
-  ]
-  node [
-    id 2616
-    label "Drozzzz"
-  ]
-  node [
-    id 2617
-    label "testtest"
-  ]
-  node [
-    id 2618
-    label "Divorce"
-  ]
-  node [
-    id 2619
-    label "Virginia"
-  ]
-  node [
-    id 2620
-    label "techbookreviews"
-  ]
-  node [
-    id 2621
-    label "ponyexpress"
-  ]
-  node [
-    id 2622
-    label "ReliableScience"
-  ]
-  node [
-    id 2623
-    label "bebq"
-  ]
-  node [
-    id 2624
-    label "Backingitup"
-  ]
-  node [
-    id 2625
-    label "OSU"
-  ]
-  node [
-    id 2626
-    label "foccart"
-  ]
-  node [
-    id 2627
-    label "fallacy"
-  ]
-  node [
-    id 2628
-    label "musicians"
-  ]
-  node [
-    id 2629
-    label "Motivational"
-  ]
-  node [
-    id 2630
-    label "BiblicalArcheology"
-  ]
-  node [
-    id 2631
-    label "triangle"
-  ]
-  node [
-    id 2632
-    label "sugarcrm"
-  ]
-  node [
-    id 2633
-    label "Giuse"
-  ]
-  node [
-    id 2634
-    label "askJeph"
-  ]
-  node [
-    id 2635
-    label "AGo"
-  ]
-  node [
-    id 2636
-    label "epicthread"
-  ]
-  node [
-    id 2637
-    label "roundstone"
-  ]
-  node [
-    id 2638
-    label "Tardonaut"
-  ]
-  node [
-    id 2639
-    label "hugeboobs"
-  ]
-  node [
-    id 2640
-    label "Stargate"
-  ]
-  node [
-    id 2641
-    label "ukulele"
-  ]
-  node [
-    id 2642
-    label "LibertarianSocialism"
-  ]
-  node [
-    id 2643
-    label "ecommerce"
-  ]
-  node [
-    id 2644
-    label "Steve"
-  ]
-  node [
-    id 2645
-    label "AndySalmo"
-  ]
-  node [
-    id 2646
-    label "bigjimslade"
-  ]
-  node [
-    id 2647
-    label "conspiracyhub"
-  ]
-  node [
-    id 2648
-    label "usability"
-  ]
-  node [
-    id 2649
-    label "NuyoRiquena"
-  ]
-  node [
-    id 2650
-    label "teknoloji"
-  ]
-  node [
-    id 2651
-    label "ridiculous"
-  ]
-  node [
-    id 2652
-    label "theology"
-  ]
-  node [
-    id 2653
-    label "Demotivational"
-  ]
-  node [
-    id 2654
-    label "sriganesh"
-  ]
-  node [
-    id 2655
-    label "relaxinbathsalts"
-  ]
-  node [
-    id 2656
-    label "leet"
-  ]
-  node [
-    id 2657
-    label "skateboarding"
-  ]
-  node [
-    id 2658
-    label "Mister"
-  ]
-  node [
-    id 2659
-    label "madeinusa"
-  ]
-  node [
-    id 2660
-    label "worldnews2"
-  ]
-  node [
-    id 2661
-    label "WREDIT"
-  ]
-  node [
-    id 2662
-    label "crossfit"
-  ]
-  node [
-    id 2663
-    label "src_montbeliard"
-  ]
-  node [
-    id 2664
-    label "dgjohnston"
-  ]
-  node [
-    id 2665
-    label "brendoreddit"
-  ]
-  node [
-    id 2666
-    label "postname"
-  ]
-  node [
-    id 2667
-    label "CarlitoxX_Jair"
-  ]
-  node [
-    id 2668
-    label "RamaOne"
-  ]
-  node [
-    id 2669
-    label "ChildHealth"
-  ]
-  node [
-    id 2670
-    label "sub"
-  ]
-  node [
-    id 2671
-    label "Ninja"
-  ]
-  node [
-    id 2672
-    label "ZeroPunctuation"
-  ]
-  node [
-    id 2673
-    label "pencils"
-  ]
-  node [
-    id 2674
-    label "FrancieFace"
-  ]
-  node [
-    id 2675
-    label "wealthmanagement"
-  ]
-  node [
-    id 2676
-    label "MoneySavers"
-  ]
-  node [
-    id 2677
-    label "p2ptech"
-  ]
-  node [
-    id 2678
-    label "macgamedev"
-  ]
-  node [
-    id 2679
-    label "ogijun"
-  ]
-  node [
-    id 2680
-    label "functional"
-  ]
-  node [
-    id 2681
-    label "BABNews"
-  ]
-  node [
-    id 2682
-    label "Googlepagerank"
-  ]
-  node [
-    id 2683
-    label "ystore"
-  ]
-  node [
-    id 2684
-    label "greenbiz"
-  ]
-  node [
-    id 2685
-    label "orangered"
-  ]
-  node [
-    id 2686
-    label "zubii"
-  ]
-  node [
-    id 2687
-    label "Rikard"
-  ]
-  node [
-    id 2688
-    label "askcheez"
-  ]
-  node [
-    id 2689
-    label "IAMIL"
-  ]
-  node [
-    id 2690
-    label "interactive"
-  ]
-  node [
-    id 2691
-    label "submit"
-  ]
-  node [
-    id 2692
-    label "legos"
-  ]
-  node [
-    id 2693
-    label "psyapsy"
-  ]
-  node [
-    id 2694
-    label "kherisno"
-  ]
-  node [
-    id 2695
-    label "Twitter"
-  ]
-  node [
-    id 2696
-    label "LegalTeens"
-  ]
-  node [
-    id 2697
-    label "SinjeLuebbke"
-  ]
-  node [
-    id 2698
-    label "Mickreddit"
-  ]
-  node [
-    id 2699
-    label "Supplements"
-  ]
-  node [
-    id 2700
-    label "videos"
-  ]
-  node [
-    id 2701
-    label "Rhonda"
-  ]
-  node [
-    id 2702
-    label "garden"
-  ]
-  node [
-    id 2703
-    label "freeculture"
-  ]
-  node [
-    id 2704
-    label "Cricket"
-  ]
-  node [
-    id 2705
-    label "testingue2"
-  ]
-  node [
-    id 2706
-    label "badassgirls"
-  ]
-  node [
-    id 2707
-    label "WinCustomize"
-  ]
-  node [
-    id 2708
-    label "2008Election"
-  ]
-  node [
-    id 2709
-    label "SCUK"
-  ]
-  node [
-    id 2710
-    label "wecreate"
-  ]
-  node [
-    id 2711
-    label "Astronomy"
-  ]
-  node [
-    id 2712
-    label "survivalfood"
-  ]
-  node [
-    id 2713
-    label "StockMarket"
-  ]
-  node [
-    id 2714
-    label "littlestar"
-  ]
-  node [
-    id 2715
-    label "folk"
-  ]
-  node [
-    id 2716
-    label "mauritius"
-  ]
-  node [
-    id 2717
-    label "nottheonion"
-  ]
-  node [
-    id 2718
-    label "flychina"
-  ]
-  node [
-    id 2719
-    label "breakgame"
-  ]
-  node [
-    id 2720
-    label "Tecnologia"
-  ]
-  node [
-    id 2721
-    label "businessnews"
-  ]
-  node [
-    id 2722
-    label "aakashlivetek"
-  ]
-  node [
-    id 2723
-    label "dnorton"
-  ]
-  node [
-    id 2724
-    label "frostih"
-  ]
-  node [
-    id 2725
-    label "catonmat"
-  ]
-  node [
-    id 2726
-    label "finance"
-  ]
-  node [
-    id 2727
-    label "troyflorida"
-  ]
-  node [
-    id 2728
-    label "tweets"
-  ]
-  node [
-    id 2729
-    label "tips"
-  ]
-  node [
-    id 2730
-    label "TELOSMYSTERY"
-  ]
-  node [
-    id 2731
-    label "maaraj"
-  ]
-  node [
-    id 2732
-    label "baseball"
-  ]
-  node [
-    id 2733
-    label "exmafia"
-  ]
-  node [
-    id 2734
-    label "jquery"
-  ]
-  node [
-    id 2735
-    label "privacy"
-  ]
-  node [
-    id 2736
-    label "dylan"
-  ]
-  node [
-    id 2737
-    label "macdk"
-  ]
-  node [
-    id 2738
-    label "WingChun"
-  ]
-  node [
-    id 2739
-    label "robotlunch"
-  ]
-  node [
-    id 2740
-    label "provocative"
-  ]
-  node [
-    id 2741
-    label "surreal"
-  ]
-  node [
-    id 2742
-    label "joomla"
-  ]
-  node [
-    id 2743
-    label "WorldWideNews"
-  ]
-  node [
-    id 2744
-    label "5edwin"
-  ]
-  node [
-    id 2745
-    label "aodag"
-  ]
-  node [
-    id 2746
-    label "railfanning"
-  ]
-  node [
-    id 2747
-    label "QuadraIsland"
-  ]
-  node [
-    id 2748
-    label "Tacticum"
-  ]
-  node [
-    id 2749
-    label "Hindi"
-  ]
-  node [
-    id 2750
-    label "buzznewsroom"
-  ]
-  node [
-    id 2751
-    label "redundant"
-  ]
-  node [
-    id 2752
-    label "Yutiti"
-  ]
-  node [
-    id 2753
-    label "foodart"
-  ]
-  node [
-    id 2754
-    label "wine"
-  ]
-  node [
-    id 2755
-    label "Construction"
-  ]
-  node [
-    id 2756
-    label "ItsNotOnion"
-  ]
-  node [
-    id 2757
-    label "QueenSlimey"
-  ]
-  node [
-    id 2758
-    label "nsfw2"
-  ]
-  node [
-    id 2759
-    label "reddit_trolls"
-  ]
-  node [
-    id 2760
-    label "CFB"
-  ]
-  node [
-    id 2761
-    label "hiltingbury"
-  ]
-  node [
-    id 2762
-    label "Allsmsmessages"
-  ]
-  node [
-    id 2763
-    label "hacktivism"
-  ]
-  node [
-    id 2764
-    label "anilobm"
-  ]
-  node [
-    id 2765
-    label "WeeklyTA"
-  ]
-  node [
-    id 2766
-    label "Pennsylvania"
-  ]
-  node [
-    id 2767
-    label "Edwards"
-  ]
-  node [
-    id 2768
-    label "babeplanet"
-  ]
-  node [
-    id 2769
-    label "michaeldavid96"
-  ]
-  node [
-    id 2770
-    label "mgive"
-  ]
-  node [
-    id 2771
-    label "techdorks"
-  ]
-  node [
-    id 2772
-    label "paygossiper"
-  ]
-  node [
-    id 2773
-    label "piercing"
-  ]
-  node [
-    id 2774
-    label "Multiplayergames"
-  ]
-  node [
-    id 2775
-    label "howard_rosner_reddit"
-  ]
-  node [
-    id 2776
-    label "Metaphysics"
-  ]
-  node [
-    id 2777
-    label "linkhay"
-  ]
-  node [
-    id 2778
-    label "21212"
-  ]
-  node [
-    id 2779
-    label "refreshing"
-  ]
-  node [
-    id 2780
-    label "stock"
-  ]
-  node [
-    id 2781
-    label "getpresales"
-  ]
-  node [
-    id 2782
-    label "policeabuse"
-  ]
-  node [
-    id 2783
-    label "theSmallCapAlert"
-  ]
-  node [
-    id 2784
-    label "SafetyNews"
-  ]
-  node [
-    id 2785
-    label "lonely"
-  ]
-  node [
-    id 2786
-    label "unix"
-  ]
-  node [
-    id 2787
-    label "blackhatseo"
-  ]
-  node [
-    id 2788
-    label "RantRave"
-  ]
-  node [
-    id 2789
-    label "sporevote"
-  ]
-  node [
-    id 2790
-    label "Younai"
-  ]
-  node [
-    id 2791
-    label "rubyonrails"
-  ]
-  node [
-    id 2792
-    label "scitech"
-  ]
-  node [
-    id 2793
-    label "hotmanflesh"
-  ]
-  node [
-    id 2794
-    label "skycars"
-  ]
-  node [
-    id 2795
-    label "jeanculture"
-  ]
-  node [
-    id 2796
-    label "douche"
-  ]
-  node [
-    id 2797
-    label "Fun"
-  ]
-  node [
-    id 2798
-    label "chrome"
-  ]
-  node [
-    id 2799
-    label "mainfo"
-  ]
-  node [
-    id 2800
-    label "howto"
-  ]
-  node [
-    id 2801
-    label "chicago"
-  ]
-  node [
-    id 2802
-    label "sport"
-  ]
-  node [
-    id 2803
-    label "whatarekidssaying"
-  ]
-  node [
-    id 2804
-    label "BestPsychTutorials"
-  ]
-  node [
-    id 2805
-    label "PetsandSuch"
-  ]
-  node [
-    id 2806
-    label "Senditcertified"
-  ]
-  node [
-    id 2807
-    label "timecube"
-  ]
-  node [
-    id 2808
-    label "secret"
-  ]
-  node [
-    id 2809
-    label "god"
-  ]
-  node [
-    id 2810
-    label "tech"
-  ]
-  node [
-    id 2811
-    label "Storesonline"
-  ]
-  node [
-    id 2812
-    label "shamaaz"
-  ]
-  node [
-    id 2813
-    label "EducationWorld"
-  ]
-  node [
-    id 2814
-    label "lindynews"
-  ]
-  node [
-    id 2815
-    label "WedgieGirls"
-  ]
-  node [
-    id 2816
-    label "FiduciaryInvestment"
-  ]
-  node [
-    id 2817
-    label "BurrellColour"
-  ]
-  node [
-    id 2818
-    label "FIFIK"
-  ]
-  node [
-    id 2819
-    label "Danielsbestsites"
-  ]
-  node [
-    id 2820
-    label "PUBLICADDS"
-  ]
-  node [
-    id 2821
-    label "mormon"
-  ]
-  node [
-    id 2822
-    label "windowshots"
-  ]
-  node [
-    id 2823
-    label "fashionweek"
-  ]
-  node [
-    id 2824
-    label "dooblets"
-  ]
-  node [
-    id 2825
-    label "kitz007"
-  ]
-  node [
-    id 2826
-    label "TechnoGameGripes"
-  ]
-  node [
-    id 2827
-    label "weddingchapel"
-  ]
-  node [
-    id 2828
-    label "nondual"
-  ]
-  node [
-    id 2829
-    label "catfight"
-  ]
-  node [
-    id 2830
-    label "oreilly"
-  ]
-  node [
-    id 2831
-    label "nuclear"
-  ]
-  node [
-    id 2832
-    label "Paranormal"
-  ]
-  node [
-    id 2833
-    label "primetrend"
-  ]
-  node [
-    id 2834
-    label "opinions"
-  ]
-  node [
-    id 2835
-    label "kablamo"
-  ]
-  node [
-    id 2836
-    label "freemusic"
-  ]
-  node [
-    id 2837
-    label "sevenload"
-  ]
-  node [
-    id 2838
-    label "unknownarmies"
-  ]
-  node [
-    id 2839
-    label "trolling"
-  ]
-  node [
-    id 2840
-    label "MilitantStuggles"
-  ]
-  node [
-    id 2841
-    label "MitchHedberg"
-  ]
-  node [
-    id 2842
-    label "impoliteconverstaion"
-  ]
-  node [
-    id 2843
-    label "MensaPhilOpen"
-  ]
-  node [
-    id 2844
-    label "ArtCrit"
-  ]
-  node [
-    id 2845
-    label "Georgia"
-  ]
-  node [
-    id 2846
-    label "DirtyJerz"
-  ]
-  node [
-    id 2847
-    label "Tawn31"
-  ]
-  node [
-    id 2848
-    label "dotnet30"
-  ]
-  node [
-    id 2849
-    label "activism"
-  ]
-  node [
-    id 2850
-    label "sridhar"
-  ]
-  node [
-    id 2851
-    label "Lancement"
-  ]
-  node [
-    id 2852
-    label "fastfood"
-  ]
-  node [
-    id 2853
-    label "themes"
-  ]
-  node [
-    id 2854
-    label "quant"
-  ]
-  node [
-    id 2855
-    label "WahyuDewanto"
-  ]
-  node [
-    id 2856
-    label "Providence_Swings"
-  ]
-  node [
-    id 2857
-    label "wikipedia"
-  ]
-  node [
-    id 2858
-    label "startrek"
-  ]
-  node [
-    id 2859
-    label "California"
-  ]
-  node [
-    id 2860
-    label "GreenTree"
-  ]
-  node [
-    id 2861
-    label "business"
-  ]
-  node [
-    id 2862
-    label "dap"
-  ]
-  node [
-    id 2863
-    label "salesforce"
-  ]
-  node [
-    id 2864
-    label "TSQL_MIDDLE_Command"
-  ]
-  node [
-    id 2865
-    label "BargainShopping"
-  ]
-  node [
-    id 2866
-    label "awallafashagba"
-  ]
-  node [
-    id 2867
-    label "ducks"
-  ]
-  node [
-    id 2868
-    label "israelis"
-  ]
-  node [
-    id 2869
-    label "testowy"
-  ]
-  node [
-    id 2870
-    label "movies"
-  ]
-  node [
-    id 2871
-    label "MR4Real"
-  ]
-  node [
-    id 2872
-    label "Product"
-  ]
-  node [
-    id 2873
-    label "hinduism"
-  ]
-  node [
-    id 2874
-    label "zora"
-  ]
-  node [
-    id 2875
-    label "Protocols"
-  ]
-  node [
-    id 2876
-    label "holyroller"
-  ]
-  node [
-    id 2877
-    label "artition"
-  ]
-  node [
-    id 2878
-    label "JustinaConway"
-  ]
-  node [
-    id 2879
-    label "BagLovers"
-  ]
-  node [
-    id 2880
-    label "screenshots"
-  ]
-  node [
-    id 2881
-    label "Balls"
-  ]
-  node [
-    id 2882
-    label "boating"
-  ]
-  node [
-    id 2883
-    label "phish"
-  ]
-  node [
-    id 2884
-    label "painting"
-  ]
-  node [
-    id 2885
-    label "chakdeindia"
-  ]
-  node [
-    id 2886
-    label "amv"
-  ]
-  node [
-    id 2887
-    label "d_language"
-  ]
-  node [
-    id 2888
-    label "ohmygod"
-  ]
-  node [
-    id 2889
-    label "University"
-  ]
-  node [
-    id 2890
-    label "Bacon"
-  ]
-  node [
-    id 2891
-    label "nikolas"
-  ]
-  node [
-    id 2892
-    label "rugbyunion"
-  ]
-  node [
-    id 2893
-    label "SearchMyCampus"
-  ]
-  node [
-    id 2894
-    label "shouldhavesentapoet"
-  ]
-  node [
-    id 2895
-    label "HappinessSF"
-  ]
-  node [
-    id 2896
-    label "digitaladvertising"
-  ]
-  node [
-    id 2897
-    label "yro"
-  ]
-  node [
-    id 2898
-    label "VietNam"
-  ]
-  node [
-    id 2899
-    label "hotnesscelebritiess"
-  ]
-  node [
-    id 2900
-    label "refactorphoenix"
-  ]
-  node [
-    id 2901
-    label "censoredatreddit"
-  ]
-  node [
-    id 2902
-    label "ChristopherLower"
-  ]
-  node [
-    id 2903
-    label "classy"
-  ]
-  node [
-    id 2904
-    label "testpassport"
-  ]
-  node [
-    id 2905
-    label "Exercise"
-  ]
-  node [
-    id 2906
-    label "redsox"
-  ]
-  node [
-    id 2907
-    label "ManishSharma"
-  ]
-  node [
-    id 2908
-    label "Grind_Vision"
-  ]
-  node [
-    id 2909
-    label "oddities"
-  ]
-  node [
-    id 2910
-    label "Tcl"
-  ]
-  node [
-    id 2911
-    label "Bad_Cop_No_Donut"
-  ]
-  node [
-    id 2912
-    label "Boxing"
-  ]
-  node [
-    id 2913
-    label "teacherlibrarian"
-  ]
-  node [
-    id 2914
-    label "bernsbarry"
-  ]
-  node [
-    id 2915
-    label "bestbarsboulder"
-  ]
-  node [
-    id 2916
-    label "ZioNews"
-  ]
-  node [
-    id 2917
-    label "bdcburma"
-  ]
-  node [
-    id 2918
-    label "blitzforum"
-  ]
-  node [
-    id 2919
-    label "esolangs"
-  ]
-  node [
-    id 2920
-    label "Deliverator"
-  ]
-  node [
-    id 2921
-    label "JOrnstein"
-  ]
-  node [
-    id 2922
-    label "MLM"
-  ]
-  node [
-    id 2923
-    label "sbhockey"
-  ]
-  node [
-    id 2924
-    label "youtube"
-  ]
-  node [
-    id 2925
-    label "DBpooper"
-  ]
-  node [
-    id 2926
-    label "onlycode"
-  ]
-  node [
-    id 2927
-    label "RomulusCristea"
-  ]
-  node [
-    id 2928
-    label "indianbirder"
-  ]
-  node [
-    id 2929
-    label "matt"
-  ]
-  node [
-    id 2930
-    label "nsfa"
-  ]
-  node [
-    id 2931
-    label "nonprofit"
-  ]
-  node [
-    id 2932
-    label "abandoned"
-  ]
-  node [
-    id 2933
-    label "ohhdisss"
-  ]
-  node [
-    id 2934
-    label "dak"
-  ]
-  node [
-    id 2935
-    label "threed"
-  ]
-  node [
-    id 2936
-    label "MaynardsConfusions"
-  ]
-  node [
-    id 2937
-    label "lawns"
-  ]
-  node [
-    id 2938
-    label "Psychonaut"
-  ]
-  node [
-    id 2939
-    label "geography"
-  ]
-  node [
-    id 2940
-    label "magicTCG"
-  ]
-  node [
-    id 2941
-    label "Zionism"
-  ]
-  node [
-    id 2942
-    label "banjo"
-  ]
-  node [
-    id 2943
-    label "JeffPaul"
-  ]
-  node [
-    id 2944
-    label "drunk"
-  ]
-  node [
-    id 2945
-    label "Allin210"
-  ]
-  node [
-    id 2946
-    label "houston"
-  ]
-  node [
-    id 2947
-    label "Mirrors"
-  ]
-  node [
-    id 2948
-    label "Shailendra"
-  ]
-  node [
-    id 2949
-    label "PlayableWebGames"
-  ]
-  node [
-    id 2950
-    label "Crazy_On_Tap"
-  ]
-  node [
-    id 2951
-    label "BrooklynFriends"
-  ]
-  node [
-    id 2952
-    label "trustart"
-  ]
-  node [
-    id 2953
-    label "AnimalRights"
-  ]
-  node [
-    id 2954
-    label "Abundance"
-  ]
-  node [
-    id 2955
-    label "Guitar"
-  ]
-  node [
-    id 2956
-    label "AHMED3"
-  ]
-  node [
-    id 2957
-    label "wrong"
-  ]
-  node [
-    id 2958
-    label "testtest22"
-  ]
-  node [
-    id 2959
-    label "hacker"
-  ]
-  node [
-    id 2960
-    label "Memorials"
-  ]
-  node [
-    id 2961
-    label "bliptv"
-  ]
-  node [
-    id 2962
-    label "teevee"
-  ]
-  node [
-    id 2963
-    label "Heeroguy"
-  ]
-  node [
-    id 2964
-    label "Antireligion"
-  ]
-  node [
-    id 2965
-    label "CashbackCity"
-  ]
-  node [
-    id 2966
-    label "ACGA"
-  ]
-  node [
-    id 2967
-    label "mises"
-  ]
-  node [
-    id 2968
-    label "Indiatrends"
-  ]
-  node [
-    id 2969
-    label "test1234"
-  ]
-  node [
-    id 2970
-    label "Cricketworld"
-  ]
-  node [
-    id 2971
-    label "cake"
-  ]
-  node [
-    id 2972
-    label "PrimetimePolitics"
-  ]
-  node [
-    id 2973
-    label "latinoamerica"
-  ]
-  node [
-    id 2974
-    label "Apologists"
-  ]
-  node [
-    id 2975
-    label "testyreddit"
-  ]
-  node [
-    id 2976
-    label "4geth"
-  ]
-  node [
-    id 2977
-    label "German"
-  ]
-  node [
-    id 2978
-    label "social_bookmarking"
-  ]
-  node [
-    id 2979
-    label "Cafegadgets"
-  ]
-  node [
-    id 2980
-    label "CoolSiteOfTheDay"
-  ]
-  node [
-    id 2981
-    label "discussions"
-  ]
-  node [
-    id 2982
-    label "jaichiru"
-  ]
-  node [
-    id 2983
-    label "skeptic"
-  ]
-  node [
-    id 2984
-    label "DefendersOwn"
-  ]
-  node [
-    id 2985
-    label "Cplusplus"
-  ]
-  node [
-    id 2986
-    label "altnet"
-  ]
-  node [
-    id 2987
-    label "Event_Launch"
-  ]
-  node [
-    id 2988
-    label "BestSoccerPlayers"
-  ]
-  node [
-    id 2989
-    label "game"
-  ]
-  node [
-    id 2990
-    label "JazzMusic"
-  ]
-  node [
-    id 2991
-    label "lds"
-  ]
-  node [
-    id 2992
-    label "walmartvitamins"
-  ]
-  node [
-    id 2993
-    label "colorreddit"
-  ]
-  node [
-    id 2994
-    label "thenikoo"
-  ]
-  node [
-    id 2995
-    label "Garry"
-  ]
-  node [
-    id 2996
-    label "PcSoftBuy"
-  ]
-  node [
-    id 2997
-    label "love"
-  ]
-  node [
-    id 2998
-    label "virtualworld"
-  ]
-  node [
-    id 2999
-    label "YerbaMateCanada"
-  ]
-  node [
-    id 3000
-    label "Clojure"
-  ]
-  node [
-    id 3001
-    label "LipLock16"
-  ]
-  node [
-    id 3002
-    label "JamesButterfield"
-  ]
-  node [
-    id 3003
-    label "Tomcan"
-  ]
-  node [
-    id 3004
-    label "poker"
-  ]
-  node [
-    id 3005
-    label "MobileDepot"
-  ]
-  node [
-    id 3006
-    label "economy"
-  ]
-  node [
-    id 3007
-    label "edu2do"
-  ]
-  node [
-    id 3008
-    label "lojban"
-  ]
-  node [
-    id 3009
-    label "HPF"
-  ]
-  node [
-    id 3010
-    label "kharis"
-  ]
-  node [
-    id 3011
-    label "TestMySite"
-  ]
-  node [
-    id 3012
-    label "foss"
-  ]
-  node [
-    id 3013
-    label "pokemans"
-  ]
-  node [
-    id 3014
-    label "pugot"
-  ]
-  node [
-    id 3015
-    label "greatpinoy"
-  ]
-  node [
-    id 3016
-    label "healthcare"
-  ]
-  node [
-    id 3017
-    label "bizhonorsbooks"
-  ]
-  node [
-    id 3018
-    label "longform"
-  ]
-  node [
-    id 3019
-    label "BRBPodcast"
-  ]
-  node [
-    id 3020
-    label "TravelinginThailand"
-  ]
-  node [
-    id 3021
-    label "IRONMIKEHAMILTON"
-  ]
-  node [
-    id 3022
-    label "changedotgov"
-  ]
-  node [
-    id 3023
-    label "MEMS"
-  ]
-  node [
-    id 3024
-    label "iphone"
-  ]
-  node [
-    id 3025
-    label "neutralnews"
-  ]
-  node [
-    id 3026
-    label "hacks"
-  ]
-  node [
-    id 3027
-    label "nobik"
-  ]
-  node [
-    id 3028
-    label "MoveFitness"
-  ]
-  node [
-    id 3029
-    label "Composition"
-  ]
-  node [
-    id 3030
-    label "trance"
-  ]
-  node [
-    id 3031
-    label "NoMorePowellLinks"
-  ]
-  node [
-    id 3032
-    label "betch"
-  ]
-  node [
-    id 3033
-    label "DOCAM"
-  ]
-  node [
-    id 3034
-    label "billoreilly"
-  ]
-  node [
-    id 3035
-    label "voluptuous"
-  ]
-  node [
-    id 3036
-    label "cosplay"
-  ]
-  node [
-    id 3037
-    label "odd"
-  ]
-  node [
-    id 3038
-    label "Theism"
-  ]
-  node [
-    id 3039
-    label "Webmaster"
-  ]
-  node [
-    id 3040
-    label "energy"
-  ]
-  node [
-    id 3041
-    label "Vacations"
-  ]
-  node [
-    id 3042
-    label "BBMeals"
-  ]
-  node [
-    id 3043
-    label "optimism"
-  ]
-  node [
-    id 3044
-    label "audioengineering"
-  ]
-  node [
-    id 3045
-    label "grabeco"
-  ]
-  node [
-    id 3046
-    label "gnu"
-  ]
-  node [
-    id 3047
-    label "elsewhenreturns"
-  ]
-  node [
-    id 3048
-    label "Coach4u"
-  ]
-  node [
-    id 3049
-    label "pianoetudes"
-  ]
-  node [
-    id 3050
-    label "doctorwho"
-  ]
-  node [
-    id 3051
-    label "accurev"
-  ]
-  node [
-    id 3052
-    label "psychology"
-  ]
-  node [
-    id 3053
-    label "Stoner"
-  ]
-  node [
-    id 3054
-    label "Arzum"
-  ]
-  node [
-    id 3055
-    label "warhammeronline"
-  ]
-  node [
-    id 3056
-    label "DazedenConfewzd"
-  ]
-  node [
-    id 3057
-    label "test888"
-  ]
-  node [
-    id 3058
-    label "mazarebacha"
-  ]
-  node [
-    id 3059
-    label "altdotnettools"
-  ]
-  node [
-    id 3060
-    label "Wales"
-  ]
-  node [
-    id 3061
-    label "Promotionals"
-  ]
-  node [
-    id 3062
-    label "Webometrics"
-  ]
-  node [
-    id 3063
-    label "Ginkoba"
-  ]
-  node [
-    id 3064
-    label "Fish"
-  ]
-  node [
-    id 3065
-    label "sexyjapanx"
-  ]
-  node [
-    id 3066
-    label "history"
-  ]
-  node [
-    id 3067
-    label "IWTest"
-  ]
-  node [
-    id 3068
-    label "maths"
-  ]
-  node [
-    id 3069
-    label "Vote_up_if"
-  ]
-  node [
-    id 3070
-    label "usuiela"
-  ]
-  node [
-    id 3071
-    label "webcomics"
-  ]
-  node [
-    id 3072
-    label "BrickImaging"
-  ]
-  node [
-    id 3073
-    label "davebenzList"
-  ]
-  node [
-    id 3074
-    label "Zombie"
-  ]
-  node [
-    id 3075
-    label "punq"
-  ]
-  node [
-    id 3076
-    label "Mandriva"
-  ]
-  node [
-    id 3077
-    label "Python"
-  ]
-  node [
-    id 3078
-    label "norulesMMA"
-  ]
-  node [
-    id 3079
-    label "aws"
-  ]
-  node [
-    id 3080
-    label "Ebay"
-  ]
-  node [
-    id 3081
-    label "knowledgespeak"
-  ]
-  node [
-    id 3082
-    label "Bible"
-  ]
-  node [
-    id 3083
-    label "Souneil_Park"
-  ]
-  node [
-    id 3084
-    label "Romeo"
-  ]
-  node [
-    id 3085
-    label "achewood"
-  ]
-  node [
-    id 3086
-    label "snowboarding"
-  ]
-  node [
-    id 3087
-    label "newjersey"
-  ]
-  node [
-    id 3088
-    label "familychild"
-  ]
-  node [
-    id 3089
-    label "webdynamicideas"
-  ]
-  node [
-    id 3090
-    label "redditSubscribers"
-  ]
-  node [
-    id 3091
-    label "boston"
-  ]
-  node [
-    id 3092
-    label "manliness"
-  ]
-  node [
-    id 3093
-    label "RedBalloonDays"
-  ]
-  node [
-    id 3094
-    label "SexyPeachy"
-  ]
-  node [
-    id 3095
-    label "TechnologyBlogs"
-  ]
-  node [
-    id 3096
-    label "FunnyOlympic"
-  ]
-  node [
-    id 3097
-    label "civildraftinservice"
-  ]
-  node [
-    id 3098
-    label "floridanursinghome"
-  ]
-  node [
-    id 3099
-    label "ExplativeHeadlines"
-  ]
-  node [
-    id 3100
-    label "mrpurple"
-  ]
-  node [
-    id 3101
-    label "Quirked"
-  ]
-  node [
-    id 3102
-    label "es"
-  ]
-  node [
-    id 3103
-    label "PUAmethod"
-  ]
-  node [
-    id 3104
-    label "loft20"
-  ]
-  node [
-    id 3105
-    label "code"
-  ]
-  node [
-    id 3106
-    label "nomigobo"
-  ]
-  node [
-    id 3107
-    label "Stonecrypt"
-  ]
-  node [
-    id 3108
-    label "lol"
-  ]
-  node [
-    id 3109
-    label "PETA"
-  ]
-  node [
-    id 3110
-    label "LBD"
-  ]
-  node [
-    id 3111
-    label "games4u"
-  ]
-  node [
-    id 3112
-    label "de"
-  ]
-  node [
-    id 3113
-    label "taiwan"
-  ]
-  node [
-    id 3114
-    label "psychopharmacology"
-  ]
-  node [
-    id 3115
-    label "olivierg"
-  ]
-  node [
-    id 3116
-    label "UpperCanada"
-  ]
-  node [
-    id 3117
-    label "moleskine"
-  ]
-  node [
-    id 3118
-    label "copyfight"
-  ]
-  node [
-    id 3119
-    label "religionseriously"
-  ]
-  node [
-    id 3120
-    label "NewsPlus"
-  ]
-  node [
-    id 3121
-    label "diddit"
-  ]
-  node [
-    id 3122
-    label "Homebrewing"
-  ]
-  node [
-    id 3123
-    label "Askmoses"
-  ]
-  node [
-    id 3124
-    label "GFT"
-  ]
-  node [
-    id 3125
-    label "soccerleagueslive"
-  ]
-  node [
-    id 3126
-    label "lybolt"
-  ]
-  node [
-    id 3127
-    label "geeks"
-  ]
-  node [
-    id 3128
-    label "Dealzin8"
-  ]
-  node [
-    id 3129
-    label "weirdnews"
-  ]
-  node [
-    id 3130
-    label "Tgirls"
-  ]
-  node [
-    id 3131
-    label "humanresources"
-  ]
-  node [
-    id 3132
-    label "Immunology"
-  ]
-  node [
-    id 3133
-    label "Wormintheworks"
-  ]
-  node [
-    id 3134
-    label "CorporateCreative"
-  ]
-  node [
-    id 3135
-    label "BigFs5"
-  ]
-  node [
-    id 3136
-    label "Journalism"
-  ]
-  node [
-    id 3137
-    label "InternetMarketing"
-  ]
-  node [
-    id 3138
-    label "listmania"
-  ]
-  node [
-    id 3139
-    label "anonymus"
-  ]
-  node [
-    id 3140
-    label "Musicoursoul"
-  ]
-  node [
-    id 3141
-    label "funny"
-  ]
-  node [
-    id 3142
-    label "espanol"
-  ]
-  node [
-    id 3143
-    label "fundoo"
-  ]
-  node [
-    id 3144
-    label "Altamente"
-  ]
-  node [
-    id 3145
-    label "AskReddit"
-  ]
-  node [
-    id 3146
-    label "vegan"
-  ]
-  node [
-    id 3147
-    label "KiNov"
-  ]
-  node [
-    id 3148
-    label "FixedGearBicycle"
-  ]
-  node [
-    id 3149
-    label "solar"
-  ]
-  node [
-    id 3150
-    label "wordrosia"
-  ]
-  node [
-    id 3151
-    label "MVPSubmissions"
-  ]
-  node [
-    id 3152
-    label "neopagan"
-  ]
-  node [
-    id 3153
-    label "9jabuzz"
-  ]
-  node [
-    id 3154
-    label "ptsd"
-  ]
-  node [
-    id 3155
-    label "blackfriday"
-  ]
-  node [
-    id 3156
-    label "Quakers"
-  ]
-  node [
-    id 3157
-    label "LATIMES"
-  ]
-  node [
-    id 3158
-    label "syok3gp"
-  ]
-  node [
-    id 3159
-    label "Stuff"
-  ]
-  node [
-    id 3160
-    label "GeorgiaAquarium"
-  ]
-  node [
-    id 3161
-    label "Pampelmoose"
-  ]
-  node [
-    id 3162
-    label "zombies"
-  ]
-  node [
-    id 3163
-    label "microblogging"
-  ]
-  node [
-    id 3164
-    label "vermont"
-  ]
-  node [
-    id 3165
-    label "fashionnews"
-  ]
-  node [
-    id 3166
-    label "llin"
-  ]
-  node [
-    id 3167
-    label "militantatheist"
-  ]
-  node [
-    id 3168
-    label "dave"
-  ]
-  node [
-    id 3169
-    label "dogs"
-  ]
-  node [
-    id 3170
-    label "freebies"
-  ]
-  node [
-    id 3171
-    label "DrSpam"
-  ]
-  node [
-    id 3172
-    label "PhiBetaSigma"
-  ]
-  node [
-    id 3173
-    label "trailer"
-  ]
-  node [
-    id 3174
-    label "atheism"
-  ]
-  node [
-    id 3175
-    label "localecommerce"
-  ]
-  node [
-    id 3176
-    label "Judaism"
-  ]
-  node [
-    id 3177
-    label "firefox"
-  ]
-  node [
-    id 3178
-    label "Reefing"
-  ]
-  node [
-    id 3179
-    label "nhnews"
-  ]
-  node [
-    id 3180
-    label "Gopher"
-  ]
-  node [
-    id 3181
-    label "Mali"
-  ]
-  node [
-    id 3182
-    label "VolvoRWD"
-  ]
-  node [
-    id 3183
-    label "jruby"
-  ]
-  node [
-    id 3184
-    label "Alexanderc"
-  ]
-  node [
-    id 3185
-    label "revolution"
-  ]
-  node [
-    id 3186
-    label "greenskeptics"
-  ]
-  node [
-    id 3187
-    label "msu"
-  ]
-  node [
-    id 3188
-    label "Mushrooms"
-  ]
-  node [
-    id 3189
-    label "Ambientalmente"
-  ]
-  node [
-    id 3190
-    label "cardsinnerpoker"
-  ]
-  node [
-    id 3191
-    label "sysor"
-  ]
-  node [
-    id 3192
-    label "germany"
-  ]
-  node [
-    id 3193
-    label "squiggol"
-  ]
-  node [
-    id 3194
-    label "ZUMBEEL"
-  ]
-  node [
-    id 3195
-    label "psu"
-  ]
-  node [
-    id 3196
-    label "egalitarian"
-  ]
-  node [
-    id 3197
-    label "BritneySpears"
-  ]
-  node [
-    id 3198
-    label "PhD"
-  ]
-  node [
-    id 3199
-    label "QualityAssurance"
-  ]
-  node [
-    id 3200
-    label "datarecover"
-  ]
-  node [
-    id 3201
-    label "vod"
-  ]
-  node [
-    id 3202
-    label "RenewLV"
-  ]
-  node [
-    id 3203
-    label "Lanaiv"
-  ]
-  node [
-    id 3204
-    label "Palachinka"
-  ]
-  node [
-    id 3205
-    label "phoenix"
-  ]
-  node [
-    id 3206
-    label "vim"
-  ]
-  node [
-    id 3207
-    label "zapped"
-  ]
-  node [
-    id 3208
-    label "Fixed"
-  ]
-  node [
-    id 3209
-    label "aussierules"
-  ]
-  node [
-    id 3210
-    label "Android"
-  ]
-  node [
-    id 3211
-    label "artificial"
-  ]
-  node [
-    id 3212
-    label "Genealogy"
-  ]
-  node [
-    id 3213
-    label "pandorastations"
-  ]
-  node [
-    id 3214
-    label "SNUBA"
-  ]
-  node [
-    id 3215
-    label "lacy2430"
-  ]
-  node [
-    id 3216
-    label "CASTELATED"
-  ]
-  node [
-    id 3217
-    label "teddit"
-  ]
-  node [
-    id 3218
-    label "safety"
-  ]
-  node [
-    id 3219
-    label "ForgottenBookmarks"
-  ]
-  node [
-    id 3220
-    label "KMY1980"
-  ]
-  node [
-    id 3221
-    label "Tasers"
-  ]
-  node [
-    id 3222
-    label "russia"
-  ]
-  node [
-    id 3223
-    label "discgolf"
-  ]
-  node [
-    id 3224
-    label "MusicVideos"
-  ]
-  node [
-    id 3225
-    label "PrideNation"
-  ]
-  node [
-    id 3226
-    label "sharingjesus"
-  ]
-  node [
-    id 3227
-    label "newworldorder"
-  ]
-  node [
-    id 3228
-    label "shortstories"
-  ]
-  node [
-    id 3229
-    label "undead"
-  ]
-  node [
-    id 3230
-    label "modelrocketry"
-  ]
-  node [
-    id 3231
-    label "PersianDigg"
-  ]
-  node [
-    id 3232
-    label "Phenocal"
-  ]
-  node [
-    id 3233
-    label "slashdotxx"
-  ]
-  node [
-    id 3234
-    label "CassandraTroy"
-  ]
-  node [
-    id 3235
-    label "LowesRedApron"
-  ]
-  node [
-    id 3236
-    label "33revolutions"
-  ]
-  node [
-    id 3237
-    label "nuxeo"
-  ]
-  node [
-    id 3238
-    label "ten31"
-  ]
-  node [
-    id 3239
-    label "portugal"
-  ]
-  node [
-    id 3240
-    label "SamuiBeachVillage"
-  ]
-  node [
-    id 3241
-    label "OnlineShopping"
-  ]
-  node [
-    id 3242
-    label "bioinformatics"
-  ]
-  node [
-    id 3243
-    label "Shoes"
-  ]
-  node [
-    id 3244
-    label "vegas"
-  ]
-  node [
-    id 3245
-    label "uclanerds"
-  ]
-  node [
-    id 3246
-    label "NorthCarolina"
-  ]
-  node [
-    id 3247
-    label "mixes"
-  ]
-  node [
-    id 3248
-    label "crashcourse"
-  ]
-  node [
-    id 3249
-    label "Dealzin"
-  ]
-  node [
-    id 3250
-    label "UsefulBlogs"
-  ]
-  node [
-    id 3251
-    label "helpmereddit"
-  ]
-  node [
-    id 3252
-    label "punthreads"
-  ]
-  node [
-    id 3253
-    label "women"
-  ]
-  node [
-    id 3254
-    label "AllTube"
-  ]
-  node [
-    id 3255
-    label "unsigned"
-  ]
-  node [
-    id 3256
-    label "EcoKindDesign"
-  ]
-  node [
-    id 3257
-    label "WeGame"
-  ]
-  node [
-    id 3258
-    label "gnome"
-  ]
-  node [
-    id 3259
-    label "deferred"
-  ]
-  node [
-    id 3260
-    label "Concerts"
-  ]
-  node [
-    id 3261
-    label "sortrosia"
-  ]
-  node [
-    id 3262
-    label "adekosis"
-  ]
-  node [
-    id 3263
-    label "antiwar"
-  ]
-  node [
-    id 3264
-    label "Koreus"
-  ]
-  node [
-    id 3265
-    label "stefantochev"
-  ]
-  node [
-    id 3266
-    label "Pocketsmith"
-  ]
-  node [
-    id 3267
-    label "roddit"
-  ]
-  node [
-    id 3268
-    label "mandrivafr"
-  ]
-  node [
-    id 3269
-    label "NaplesWebDesign"
-  ]
-  node [
-    id 3270
-    label "ChicagoREALTOR"
-  ]
-  node [
-    id 3271
-    label "webmaster123"
-  ]
-  node [
-    id 3272
-    label "PakistanHousing"
-  ]
-  node [
-    id 3273
-    label "Oh2be16"
-  ]
-  node [
-    id 3274
-    label "Quran"
-  ]
-  node [
-    id 3275
-    label "files1000"
-  ]
-  node [
-    id 3276
-    label "comics"
-  ]
-  node [
-    id 3277
-    label "ChoosyHomeschoolers"
-  ]
-  node [
-    id 3278
-    label "joomlatricks"
-  ]
-  node [
-    id 3279
-    label "brewing"
-  ]
-  node [
-    id 3280
-    label "photographers"
-  ]
-  node [
-    id 3281
-    label "battletech"
-  ]
-  node [
-    id 3282
-    label "humor"
-  ]
-  node [
-    id 3283
-    label "THATPainterLady"
-  ]
-  node [
-    id 3284
-    label "TimeTravellers"
-  ]
-  node [
-    id 3285
-    label "Dissent"
-  ]
-  node [
-    id 3286
-    label "Sukhpreet"
-  ]
-  node [
-    id 3287
-    label "MovieGab"
-  ]
-  node [
-    id 3288
-    label "Sports2Debate"
-  ]
-  node [
-    id 3289
-    label "bjj"
-  ]
-  node [
-    id 3290
-    label "retrogaming"
-  ]
-  node [
-    id 3291
-    label "trolls"
-  ]
-  node [
-    id 3292
-    label "Thailand"
-  ]
-  node [
-    id 3293
-    label "goodoldays"
-  ]
-  node [
-    id 3294
-    label "sdfsd"
-  ]
-  node [
-    id 3295
-    label "lgbt"
-  ]
-  node [
-    id 3296
-    label "embassysuitesniagara"
-  ]
-  node [
-    id 3297
-    label "developer"
-  ]
-  node [
-    id 3298
-    label "myshortfilms"
-  ]
-  node [
-    id 3299
-    label "science2"
-  ]
-  node [
-    id 3300
-    label "valleyvoice"
-  ]
-  node [
-    id 3301
-    label "Krugman"
-  ]
-  node [
-    id 3302
-    label "Today"
-  ]
-  node [
-    id 3303
-    label "UseSmallWords"
-  ]
-  node [
-    id 3304
-    label "Faildogs"
-  ]
-  node [
-    id 3305
-    label "Homebrewing101"
-  ]
-  node [
-    id 3306
-    label "kyonounnsei"
-  ]
-  node [
-    id 3307
-    label "bingecat"
-  ]
-  node [
-    id 3308
-    label "marion"
-  ]
-  node [
-    id 3309
-    label "CommonLaw"
-  ]
-  node [
-    id 3310
-    label "Fedora"
-  ]
-  node [
-    id 3311
-    label "clikdicks"
-  ]
-  node [
-    id 3312
-    label "PutinforPresident"
-  ]
-  node [
-    id 3313
-    label "palin"
-  ]
-  node [
-    id 3314
-    label "Squidoo"
-  ]
-  node [
-    id 3315
-    label "jakobsenfred"
-  ]
-  node [
-    id 3316
-    label "MST3K"
-  ]
-  node [
-    id 3317
-    label "Preisvergleich"
-  ]
-  node [
-    id 3318
-    label "siciliasud"
-  ]
-  node [
-    id 3319
-    label "mileycyrus"
-  ]
-  node [
-    id 3320
-    label "ConceptSeries"
-  ]
-  node [
-    id 3321
-    label "advertising"
-  ]
-  node [
-    id 3322
-    label "televizoare"
-  ]
-  node [
-    id 3323
-    label "camping"
-  ]
-  node [
-    id 3324
-    label "dotnet"
-  ]
-  node [
-    id 3325
-    label "livemusic"
-  ]
-  node [
-    id 3326
-    label "Kasey"
-  ]
-  node [
-    id 3327
-    label "christianrap"
-  ]
-  node [
-    id 3328
-    label "Nametagsnet"
-  ]
-  node [
-    id 3329
-    label "Pocketbook"
-  ]
-  node [
-    id 3330
-    label "processsecrets"
-  ]
-  node [
-    id 3331
-    label "lakers"
-  ]
-  node [
-    id 3332
-    label "USPE12"
-  ]
-  node [
-    id 3333
-    label "azher"
-  ]
-  node [
-    id 3334
-    label "Greatdit"
-  ]
-  node [
-    id 3335
-    label "Rowing"
-  ]
-  node [
-    id 3336
-    label "DoggieWeight"
-  ]
-  node [
-    id 3337
-    label "JPK"
-  ]
-  node [
-    id 3338
-    label "SoftwareEngineering"
-  ]
-  node [
-    id 3339
-    label "SpoonBlog"
-  ]
-  node [
-    id 3340
-    label "forestcityinstitute"
-  ]
-  node [
-    id 3341
-    label "Shamanism"
-  ]
-  node [
-    id 3342
-    label "debates"
-  ]
-  node [
-    id 3343
-    label "Collapse_Peak_Oil"
-  ]
-  node [
-    id 3344
-    label "obituaries"
-  ]
-  node [
-    id 3345
-    label "LionsSummit"
-  ]
-  node [
-    id 3346
-    label "orf"
-  ]
-  node [
-    id 3347
-    label "shortentertainment"
-  ]
-  node [
-    id 3348
-    label "geospatial"
-  ]
-  node [
-    id 3349
-    label "microcontrollers"
-  ]
-  node [
-    id 3350
-    label "karaoke"
-  ]
-  node [
-    id 3351
-    label "abortionisprolife"
-  ]
-  node [
-    id 3352
-    label "cinemablend"
-  ]
-  node [
-    id 3353
-    label "surfing"
-  ]
-  node [
-    id 3354
-    label "karma"
-  ]
-  node [
-    id 3355
-    label "Paradise"
-  ]
-  node [
-    id 3356
-    label "CrazyJoe"
-  ]
-  node [
-    id 3357
-    label "lisp"
-  ]
-  node [
-    id 3358
-    label "reeses"
-  ]
-  node [
-    id 3359
-    label "toronto"
-  ]
-  node [
-    id 3360
-    label "2moroX"
-  ]
-  node [
-    id 3361
-    label "marriedtothesea"
-  ]
-  node [
-    id 3362
-    label "EuroBookings"
-  ]
-  node [
-    id 3363
-    label "FIlm"
-  ]
-  node [
-    id 3364
-    label "mobile"
-  ]
-  node [
-    id 3365
-    label "SwampSparrowSucks"
-  ]
-  node [
-    id 3366
-    label "rickroll"
-  ]
-  node [
-    id 3367
-    label "Money"
-  ]
-  node [
-    id 3368
-    label "PawShow"
-  ]
-  node [
-    id 3369
-    label "Nicole"
-  ]
-  node [
-    id 3370
-    label "rap"
-  ]
-  node [
-    id 3371
-    label "test54321"
-  ]
-  node [
-    id 3372
-    label "PirateParty"
-  ]
-  node [
-    id 3373
-    label "babychangingstation"
-  ]
-  node [
-    id 3374
-    label "math"
-  ]
-  node [
-    id 3375
-    label "scientific"
-  ]
-  node [
-    id 3376
-    label "Gamer"
-  ]
-  node [
-    id 3377
-    label "Christianity"
-  ]
-  node [
-    id 3378
-    label "c_language"
-  ]
-  node [
-    id 3379
-    label "PCFreak"
-  ]
-  node [
-    id 3380
-    label "testa"
-  ]
-  node [
-    id 3381
-    label "ebookcompiler"
-  ]
-  node [
-    id 3382
-    label "Vriesema"
-  ]
-  node [
-    id 3383
-    label "EnterpriseNation"
-  ]
-  node [
-    id 3384
-    label "FinanceNews"
-  ]
-  node [
-    id 3385
-    label "creditwrench"
-  ]
-  node [
-    id 3386
-    label "icanhaz"
-  ]
-  node [
-    id 3387
-    label "trt"
-  ]
-  node [
-    id 3388
-    label "pcolinks"
-  ]
-  node [
-    id 3389
-    label "Digital"
-  ]
-  node [
-    id 3390
-    label "kundi"
-  ]
-  node [
-    id 3391
-    label "Mullets"
-  ]
-  node [
-    id 3392
-    label "climate"
-  ]
-  node [
-    id 3393
-    label "MTB"
-  ]
-  node [
-    id 3394
-    label "bollywood"
-  ]
-  node [
-    id 3395
-    label "dnbmixes"
-  ]
-  node [
-    id 3396
-    label "Pizza"
-  ]
-  node [
-    id 3397
-    label "FourPanelsofFun"
-  ]
-  node [
-    id 3398
-    label "revenue"
-  ]
-  node [
-    id 3399
-    label "newspeak"
-  ]
-  node [
-    id 3400
-    label "Williammooch"
-  ]
-  node [
-    id 3401
-    label "China"
-  ]
-  node [
-    id 3402
-    label "web_infrastructure"
-  ]
-  node [
-    id 3403
-    label "nostalgia"
-  ]
-  node [
-    id 3404
-    label "Cleveland"
-  ]
-  node [
-    id 3405
-    label "MRMMO"
-  ]
-  node [
-    id 3406
-    label "quickoats"
-  ]
-  node [
-    id 3407
-    label "Virtual_Reality"
-  ]
-  node [
-    id 3408
-    label "compsci"
-  ]
-  node [
-    id 3409
-    label "AlertsCar"
-  ]
-  node [
-    id 3410
-    label "newscrux"
-  ]
-  node [
-    id 3411
-    label "xaluan"
-  ]
-  node [
-    id 3412
-    label "VC2009"
-  ]
-  node [
-    id 3413
-    label "vintagecomputing"
-  ]
-  node [
-    id 3414
-    label "blogofilia"
-  ]
-  node [
-    id 3415
-    label "Muskurahat"
-  ]
-  node [
-    id 3416
-    label "Dance"
-  ]
-  node [
-    id 3417
-    label "portblue"
-  ]
-  node [
-    id 3418
-    label "toys"
-  ]
-  node [
-    id 3419
-    label "manchester"
-  ]
-  node [
-    id 3420
-    label "video"
-  ]
-  node [
-    id 3421
-    label "DesignGrava"
-  ]
-  node [
-    id 3422
-    label "RenaissanceRonin"
-  ]
-  node [
-    id 3423
-    label "linux"
-  ]
-  node [
-    id 3424
-    label "USHealthcarePolicy"
-  ]
-  node [
-    id 3425
-    label "hu"
-  ]
-  node [
-    id 3426
-    label "diggsucks"
-  ]
-  node [
-    id 3427
-    label "TroubleFixers"
-  ]
-  node [
-    id 3428
-    label "telaviv"
-  ]
-  node [
-    id 3429
-    label "ltr"
-  ]
-  node [
-    id 3430
-    label "southafrica"
-  ]
-  node [
-    id 3431
-    label "voteups"
-  ]
-  node [
-    id 3432
-    label "newreddits"
-  ]
-  node [
-    id 3433
-    label "groovy"
-  ]
-  node [
-    id 3434
-    label "DotSiamMove"
-  ]
-  node [
-    id 3435
-    label "bitteroldmen"
-  ]
-  node [
-    id 3436
-    label "searchengines"
-  ]
-  node [
-    id 3437
-    label "nl"
-  ]
-  node [
-    id 3438
-    label "echoe"
-  ]
-  node [
-    id 3439
-    label "childwelfare"
-  ]
-  node [
-    id 3440
-    label "redditdev"
-  ]
-  node [
-    id 3441
-    label "ThirdWaveFeminism"
-  ]
-  node [
-    id 3442
-    label "hotdeals"
-  ]
-  node [
-    id 3443
-    label "lolcats"
-  ]
-  node [
-    id 3444
-    label "allthingsutah"
-  ]
-  node [
-    id 3445
-    label "atari"
-  ]
-  node [
-    id 3446
-    label "Corruption"
-  ]
-  node [
-    id 3447
-    label "ultimate"
-  ]
-  node [
-    id 3448
-    label "hornio"
-  ]
-  node [
-    id 3449
-    label "features"
-  ]
-  node [
-    id 3450
-    label "mrsubtraction"
-  ]
-  node [
-    id 3451
-    label "Cushings"
-  ]
-  node [
-    id 3452
-    label "PikeCountyPA"
-  ]
-  node [
-    id 3453
-    label "SubmitPro"
-  ]
-  node [
-    id 3454
-    label "tango"
-  ]
-  node [
-    id 3455
-    label "badasshub"
-  ]
-  node [
-    id 3456
-    label "NepalNews"
-  ]
-  node [
-    id 3457
-    label "UsInjins"
-  ]
-  node [
-    id 3458
-    label "MillAvenue"
-  ]
-  node [
-    id 3459
-    label "Designing_subreddits"
-  ]
-  node [
-    id 3460
-    label "flatlanderjournal"
-  ]
-  node [
-    id 3461
-    label "7mooode"
-  ]
-  node [
-    id 3462
-    label "Cryptogon"
-  ]
-  node [
-    id 3463
-    label "fortress"
-  ]
-  node [
-    id 3464
-    label "black_metal"
-  ]
-  node [
-    id 3465
-    label "Jazz"
-  ]
-  node [
-    id 3466
-    label "Firnrg"
-  ]
-  node [
-    id 3467
-    label "nanotech"
-  ]
-  node [
-    id 3468
-    label "rosevictorreddit01"
-  ]
-  node [
-    id 3469
-    label "amiga"
-  ]
-  node [
-    id 3470
-    label "BigNoise"
-  ]
-  node [
-    id 3471
-    label "ShirleyAtkinson"
-  ]
-  node [
-    id 3472
-    label "Knowing"
-  ]
-  node [
-    id 3473
-    label "OnlineDating"
-  ]
-  node [
-    id 3474
-    label "tennismasters"
-  ]
-  node [
-    id 3475
-    label "Kell"
-  ]
-  node [
-    id 3476
-    label "Charity"
-  ]
-  node [
-    id 3477
-    label "Games"
-  ]
-  node [
-    id 3478
-    label "GlobalNews"
-  ]
-  node [
-    id 3479
-    label "darkreddit"
-  ]
-  node [
-    id 3480
-    label "language"
-  ]
-  node [
-    id 3481
-    label "DjordjeZlatanovic"
-  ]
-  node [
-    id 3482
-    label "hawk258"
-  ]
-  node [
-    id 3483
-    label "AppEngine"
-  ]
-  node [
-    id 3484
-    label "lightningrod"
-  ]
-  node [
-    id 3485
-    label "mccainsgaffeoftheday"
-  ]
-  node [
-    id 3486
-    label "Heavymetal"
-  ]
-  node [
-    id 3487
-    label "QuickBooker"
-  ]
-  node [
-    id 3488
-    label "azliensa"
-  ]
-  node [
-    id 3489
-    label "iolanguage"
-  ]
-  node [
-    id 3490
-    label "conservativenut"
-  ]
-  node [
-    id 3491
-    label "tattoo"
-  ]
-  node [
-    id 3492
-    label "jbrains"
-  ]
-  node [
-    id 3493
-    label "death_metal"
-  ]
-  node [
-    id 3494
-    label "Redants"
-  ]
-  node [
-    id 3495
-    label "Minixr"
-  ]
-  node [
-    id 3496
-    label "AlternativeHair"
-  ]
-  node [
-    id 3497
-    label "SDOT4LIFE"
-  ]
-  node [
-    id 3498
-    label "HouseMusic"
-  ]
-  node [
-    id 3499
-    label "Charitable"
-  ]
-  node [
-    id 3500
-    label "buskers"
-  ]
-  node [
-    id 3501
-    label "seanmichael"
-  ]
-  node [
-    id 3502
-    label "audai"
-  ]
-  node [
-    id 3503
-    label "VoteUpIf"
-  ]
-  node [
-    id 3504
-    label "GameTech"
-  ]
-  node [
-    id 3505
-    label "splashsface"
-  ]
-  node [
-    id 3506
-    label "coldfusion"
-  ]
-  node [
-    id 3507
-    label "Crap"
-  ]
-  node [
-    id 3508
-    label "AlternativeHistory"
-  ]
-  node [
-    id 3509
-    label "djjroc"
-  ]
-  node [
-    id 3510
-    label "ass"
-  ]
-  node [
-    id 3511
-    label "restaurants"
-  ]
-  node [
-    id 3512
-    label "bizarre"
-  ]
-  node [
-    id 3513
-    label "Haknit"
-  ]
-  node [
-    id 3514
-    label "shoe"
-  ]
-  node [
-    id 3515
-    label "slashdot"
-  ]
-  node [
-    id 3516
-    label "camerabattery"
-  ]
-  node [
-    id 3517
-    label "outkast"
-  ]
-  node [
-    id 3518
-    label "xfce"
-  ]
-  node [
-    id 3519
-    label "cat"
-  ]
-  node [
-    id 3520
-    label "pinchpenny"
-  ]
-  node [
-    id 3521
-    label "reddit.com"
-  ]
-  node [
-    id 3522
-    label "redditrevolution"
-  ]
-  node [
-    id 3523
-    label "MemeMuseum"
-  ]
-  node [
-    id 3524
-    label "mattraibert"
-  ]
-  node [
-    id 3525
-    label "PoesLaw"
-  ]
-  node [
-    id 3526
-    label "Pork"
-  ]
-  node [
-    id 3527
-    label "morrissey"
-  ]
-  node [
-    id 3528
-    label "Entrebloggers"
-  ]
-  node [
-    id 3529
-    label "Clairepontino"
-  ]
-  node [
-    id 3530
-    label "PYF"
-  ]
-  node [
-    id 3531
-    label "functionallang"
-  ]
-  node [
-    id 3532
-    label "Vipin"
-  ]
-  node [
-    id 3533
-    label "Portland"
-  ]
-  node [
-    id 3534
-    label "Sobhaneh"
-  ]
-  node [
-    id 3535
-    label "fiction"
-  ]
-  node [
-    id 3536
-    label "bears"
-  ]
-  node [
-    id 3537
-    label "TnT"
-  ]
-  node [
-    id 3538
-    label "Publicani"
-  ]
-  node [
-    id 3539
-    label "KeysHappenings"
-  ]
-  node [
-    id 3540
-    label "animalattacks"
-  ]
-  node [
-    id 3541
-    label "JJKCrime"
-  ]
-  node [
-    id 3542
-    label "sex"
-  ]
-  node [
-    id 3543
-    label "todayilearned"
-  ]
-  node [
-    id 3544
-    label "popper"
-  ]
-  node [
-    id 3545
-    label "fukuro77"
-  ]
-  node [
-    id 3546
-    label "hurribugs"
-  ]
-  node [
-    id 3547
-    label "contests"
-  ]
-  node [
-    id 3548
-    label "tennis"
-  ]
-  node [
-    id 3549
-    label "kompassworld"
-  ]
-  node [
-    id 3550
-    label "Beginnerpilot"
-  ]
-  node [
-    id 3551
-    label "jobia"
-  ]
-  node [
-    id 3552
-    label "PoplarGirl1"
-  ]
-  node [
-    id 3553
-    label "GPSLLC"
-  ]
-  node [
-    id 3554
-    label "DreamHomes"
-  ]
-  node [
-    id 3555
-    label "mississippi"
-  ]
-  node [
-    id 3556
-    label "connconcon"
-  ]
-  node [
-    id 3557
-    label "PixelArt"
-  ]
-  node [
-    id 3558
-    label "Authenticfashion"
-  ]
-  node [
-    id 3559
-    label "Documentaries"
-  ]
-  node [
-    id 3560
-    label "mattculbreth"
-  ]
-  node [
-    id 3561
-    label "JimmyFallon"
-  ]
-  node [
-    id 3562
-    label "migration"
-  ]
-  node [
-    id 3563
-    label "employmentagencies"
-  ]
-  node [
-    id 3564
-    label "talk"
-  ]
-  node [
-    id 3565
-    label "sports"
-  ]
-  node [
-    id 3566
-    label "Polska"
-  ]
-  node [
-    id 3567
-    label "Survivalist"
-  ]
-  node [
-    id 3568
-    label "BabesInBra"
-  ]
-  node [
-    id 3569
-    label "whoa"
-  ]
-  node [
-    id 3570
-    label "slowakei"
-  ]
-  node [
-    id 3571
-    label "Ahken"
-  ]
-  node [
-    id 3572
-    label "Futurism"
-  ]
-  node [
-    id 3573
-    label "crybabies"
-  ]
-  node [
-    id 3574
-    label "hundredstensunits"
-  ]
-  node [
-    id 3575
-    label "Marrimiller"
-  ]
-  node [
-    id 3576
-    label "poerty"
-  ]
-  node [
-    id 3577
-    label "democracy"
-  ]
-  node [
-    id 3578
-    label "web30"
-  ]
-  node [
-    id 3579
-    label "bmx"
-  ]
-  node [
-    id 3580
-    label "TheSpidedrWebSystem"
-  ]
-  node [
-    id 3581
-    label "epicenterblog"
-  ]
-  node [
-    id 3582
-    label "girlskissing"
-  ]
-  node [
-    id 3583
-    label "Tees2Greens"
-  ]
-  node [
-    id 3584
-    label "Programminginterests"
-  ]
-  node [
-    id 3585
-    label "TechZulu"
-  ]
-  node [
-    id 3586
-    label "RUI"
-  ]
-  node [
-    id 3587
-    label "mertblog"
-  ]
-  node [
-    id 3588
-    label "houseofsodom"
-  ]
-  node [
-    id 3589
-    label "bernsteinslaw"
-  ]
-  node [
-    id 3590
-    label "Knoxville"
-  ]
-  node [
-    id 3591
-    label "GTA4"
-  ]
-  node [
-    id 3592
-    label "LSD"
-  ]
-  node [
-    id 3593
-    label "bicycles"
-  ]
-  node [
-    id 3594
-    label "AntiHillary"
-  ]
-  node [
-    id 3595
-    label "titox"
-  ]
-  node [
-    id 3596
-    label "Warcraft"
-  ]
-  node [
-    id 3597
-    label "otaku"
-  ]
-  node [
-    id 3598
-    label "featurerequest"
-  ]
-  node [
-    id 3599
-    label "Way2Send"
-  ]
-  node [
-    id 3600
-    label "gaming"
-  ]
-  node [
-    id 3601
-    label "phoenixarizona"
-  ]
-  node [
-    id 3602
-    label "yahooanswers"
-  ]
-  node [
-    id 3603
-    label "MusicLoft"
-  ]
-  node [
-    id 3604
-    label "Nima"
-  ]
-  node [
-    id 3605
-    label "tony"
-  ]
-  node [
-    id 3606
-    label "xubuntu"
-  ]
-  node [
-    id 3607
-    label "ARYA"
-  ]
-  node [
-    id 3608
-    label "qualjobs"
-  ]
-  node [
-    id 3609
-    label "Sudarshana"
-  ]
-  node [
-    id 3610
-    label "puzzles"
-  ]
-  node [
-    id 3611
-    label "NPR"
-  ]
-  node [
-    id 3612
-    label "TinT"
-  ]
-  node [
-    id 3613
-    label "GiftIdeas"
-  ]
-  node [
-    id 3614
-    label "PersianToronto"
-  ]
-  node [
-    id 3615
-    label "AnimalLiberation"
-  ]
-  node [
-    id 3616
-    label "sustainability"
-  ]
-  node [
-    id 3617
-    label "PuppiesWhoFightBears"
-  ]
-  node [
-    id 3618
-    label "WaitWhat"
-  ]
-  node [
-    id 3619
-    label "darwin"
-  ]
-  node [
-    id 3620
-    label "austin8591"
-  ]
-  node [
-    id 3621
-    label "shenzhen"
-  ]
-  node [
-    id 3622
-    label "warpiggs"
-  ]
-  node [
-    id 3623
-    label "slinger"
-  ]
-  node [
-    id 3624
-    label "longtext"
-  ]
-  node [
-    id 3625
-    label "vocabulary"
-  ]
-  node [
-    id 3626
-    label "PinkNews"
-  ]
-  node [
-    id 3627
-    label "xbmc"
-  ]
-  node [
-    id 3628
-    label "Kesehatan"
-  ]
-  node [
-    id 3629
-    label "Soambitious"
-  ]
-  node [
-    id 3630
-    label "foradog"
-  ]
-  node [
-    id 3631
-    label "GeekMyLove"
-  ]
-  node [
-    id 3632
-    label "Mortgages"
-  ]
-  node [
-    id 3633
-    label "SewerHorse"
-  ]
-  node [
-    id 3634
-    label "rashme"
-  ]
-  node [
-    id 3635
-    label "DominioDesign"
-  ]
-  node [
-    id 3636
-    label "food"
-  ]
-  node [
-    id 3637
-    label "olympics"
-  ]
-  node [
-    id 3638
-    label "steampunk"
-  ]
-  node [
-    id 3639
-    label "Dressupgurl"
-  ]
-  node [
-    id 3640
-    label "pharma"
-  ]
-  node [
-    id 3641
-    label "bugs"
-  ]
-  node [
-    id 3642
-    label "obama"
-  ]
-  node [
-    id 3643
-    label "C_Programming"
-  ]
-  node [
-    id 3644
-    label "Brian01"
-  ]
-  node [
-    id 3645
-    label "pua"
-  ]
-  node [
-    id 3646
-    label "Claire"
-  ]
-  node [
-    id 3647
-    label "CARTOON"
-  ]
-  node [
-    id 3648
-    label "rem091"
-  ]
-  node [
-    id 3649
-    label "apple89"
-  ]
-  node [
-    id 3650
-    label "wealth"
-  ]
-  node [
-    id 3651
-    label "obvious"
-  ]
-  node [
-    id 3652
-    label "Wonderland"
-  ]
-  node [
-    id 3653
-    label "SOF"
-  ]
-  node [
-    id 3654
-    label "UsefulShit"
-  ]
-  node [
-    id 3655
-    label "mechatronics"
-  ]
-  node [
-    id 3656
-    label "interviewpuzzles"
-  ]
-  node [
-    id 3657
-    label "shopingmania"
-  ]
-  node [
-    id 3658
-    label "HomeBrewNews"
-  ]
-  node [
-    id 3659
-    label "fuckFuck"
-  ]
-  node [
-    id 3660
-    label "Educatedguess"
-  ]
-  node [
-    id 3661
-    label "gay"
-  ]
-  node [
-    id 3662
-    label "awk"
-  ]
-  node [
-    id 3663
-    label "investing"
-  ]
-  node [
-    id 3664
-    label "Objectivism"
-  ]
-  node [
-    id 3665
-    label "NSCocoa"
-  ]
-  node [
-    id 3666
-    label "Sexyf"
-  ]
-  node [
-    id 3667
-    label "Voting"
-  ]
-  node [
-    id 3668
-    label "asia"
-  ]
-  node [
-    id 3669
-    label "nocrap"
-  ]
-  node [
-    id 3670
-    label "recycled"
-  ]
-  node [
-    id 3671
-    label "BintanLagoonResort"
-  ]
-  node [
-    id 3672
-    label "Self_Defense_1"
-  ]
-  node [
-    id 3673
-    label "CelebrityCaricatures"
-  ]
-  node [
-    id 3674
-    label "interestingasfuck"
-  ]
-  node [
-    id 3675
-    label "Baroque"
-  ]
-  node [
-    id 3676
-    label "ChrisMerchant"
-  ]
-  node [
-    id 3677
-    label "lovereddit"
-  ]
-  node [
-    id 3678
-    label "vitaminsforhairloss"
-  ]
-  node [
-    id 3679
-    label "myvideofight"
-  ]
-  node [
-    id 3680
-    label "CarpetCleaning"
-  ]
-  node [
-    id 3681
-    label "czech"
-  ]
-  node [
-    id 3682
-    label "intelligent"
-  ]
-  node [
-    id 3683
-    label "bork"
-  ]
-  node [
-    id 3684
-    label "shqip"
-  ]
-  node [
-    id 3685
-    label "TodaysNewsBlog"
-  ]
-  node [
-    id 3686
-    label "engrish"
-  ]
-  node [
-    id 3687
-    label "pinay"
-  ]
-  node [
-    id 3688
-    label "Omorashi"
-  ]
-  node [
-    id 3689
-    label "russian"
-  ]
-  node [
-    id 3690
-    label "Ajohn"
-  ]
-  node [
-    id 3691
-    label "astrology"
-  ]
-  node [
-    id 3692
-    label "Coffee"
-  ]
-  node [
-    id 3693
-    label "django"
-  ]
-  node [
-    id 3694
-    label "late"
-  ]
-  node [
-    id 3695
-    label "sportnographe"
-  ]
-  node [
-    id 3696
-    label "Swarming"
-  ]
-  node [
-    id 3697
-    label "types"
-  ]
-  node [
-    id 3698
-    label "datacompression"
-  ]
-  node [
-    id 3699
-    label "actuary"
-  ]
-  node [
-    id 3700
-    label "binselman"
-  ]
-  node [
-    id 3701
-    label "AsiaTalk"
-  ]
-  node [
-    id 3702
-    label "creativitycentral"
-  ]
-  node [
-    id 3703
-    label "bahai"
-  ]
-  node [
-    id 3704
-    label "nightlife"
-  ]
-  node [
-    id 3705
-    label "ObammunismWatch"
-  ]
-  node [
-    id 3706
-    label "bots"
-  ]
-  node [
-    id 3707
-    label "poppablues"
-  ]
-  node [
-    id 3708
-    label "polydactyl"
-  ]
-  node [
-    id 3709
-    label "DHgate"
-  ]
-  node [
-    id 3710
-    label "Infos"
-  ]
-  node [
-    id 3711
-    label "GreenEnergy"
-  ]
-  node [
-    id 3712
-    label "InternetActivism"
-  ]
-  node [
-    id 3713
-    label "Cybersquatting"
-  ]
-  node [
-    id 3714
-    label "flowchart"
-  ]
-  node [
-    id 3715
-    label "merecoincidence"
-  ]
-  node [
-    id 3716
-    label "promos"
-  ]
-  node [
-    id 3717
-    label "dynasty666"
-  ]
-  node [
-    id 3718
-    label "redditfree2009"
-  ]
-  node [
-    id 3719
-    label "Qualitydoor"
-  ]
-  node [
-    id 3720
-    label "blueangel"
-  ]
-  node [
-    id 3721
-    label "MediaServices"
-  ]
-  node [
-    id 3722
-    label "tldr"
-  ]
-  node [
-    id 3723
-    label "iaido"
-  ]
-  node [
-    id 3724
-    label "hotel"
-  ]
-  node [
-    id 3725
-    label "madG"
-  ]
-  node [
-    id 3726
-    label "pie"
-  ]
-  node [
-    id 3727
-    label "GGiPhone"
-  ]
-  node [
-    id 3728
-    label "Autographs"
-  ]
-  node [
-    id 3729
-    label "onemillion"
-  ]
-  node [
-    id 3730
-    label "capetownnews"
-  ]
-  node [
-    id 3731
-    label "Debate"
-  ]
-  node [
-    id 3732
-    label "howardstern"
-  ]
-  node [
-    id 3733
-    label "AspiringMarketer"
-  ]
-  node [
-    id 3734
-    label "libattery"
-  ]
-  node [
-    id 3735
-    label "nationwidepaintball"
-  ]
-  node [
-    id 3736
-    label "fbl2"
-  ]
-  node [
-    id 3737
-    label "askXKCD"
-  ]
-  node [
-    id 3738
-    label "kayakotto"
-  ]
-  node [
-    id 3739
-    label "gaurav"
-  ]
-  node [
-    id 3740
-    label "IndependentBaseball"
-  ]
-  node [
-    id 3741
-    label "hapaxlegomena"
-  ]
-  node [
-    id 3742
-    label "BILD_com"
-  ]
-  node [
-    id 3743
-    label "Shorpy"
-  ]
-  node [
-    id 3744
-    label "docsmartz"
-  ]
-  node [
-    id 3745
-    label "ScottishForums"
-  ]
-  node [
-    id 3746
-    label "f4forex"
-  ]
-  node [
-    id 3747
-    label "HeatherLutze"
-  ]
-  node [
-    id 3748
-    label "bathroomfix11"
-  ]
-  node [
-    id 3749
-    label "Gunners"
-  ]
-  node [
-    id 3750
-    label "MONASTIC"
-  ]
-  node [
-    id 3751
-    label "epilasyon"
-  ]
-  node [
-    id 3752
-    label "meta"
-  ]
-  node [
-    id 3753
-    label "StrangeUniverse"
-  ]
-  node [
-    id 3754
-    label "opensourcescifi"
-  ]
-  node [
-    id 3755
-    label "mentalhealth"
-  ]
-  node [
-    id 3756
-    label "DickButt"
-  ]
-  node [
-    id 3757
-    label "dvd"
-  ]
-  node [
-    id 3758
-    label "mykittygifts"
-  ]
-  node [
-    id 3759
-    label "Winworld"
-  ]
-  node [
-    id 3760
-    label "yep"
-  ]
-  node [
-    id 3761
-    label "sirichai"
-  ]
-  node [
-    id 3762
-    label "til"
-  ]
-  node [
-    id 3763
-    label "Zeeol"
-  ]
-  node [
-    id 3764
-    label "thewayoftheweb"
-  ]
-  node [
-    id 3765
-    label "confessions"
-  ]
-  node [
-    id 3766
-    label "BDJobs"
-  ]
-  node [
-    id 3767
-    label "Widgets"
-  ]
-  node [
-    id 3768
-    label "EnAmerique"
-  ]
-  node [
-    id 3769
-    label "TheRickyShow"
-  ]
-  node [
-    id 3770
-    label "OhWord"
-  ]
-  node [
-    id 3771
-    label "sexyfemale"
-  ]
-  node [
-    id 3772
-    label "rails"
-  ]
-  node [
-    id 3773
-    label "brasil"
-  ]
-  node [
-    id 3774
-    label "thesingularity"
-  ]
-  node [
-    id 3775
-    label "progressive"
-  ]
-  node [
-    id 3776
-    label "girgor"
-  ]
-  node [
-    id 3777
-    label "climateskeptics"
-  ]
-  node [
-    id 3778
-    label "vfx"
-  ]
-  node [
-    id 3779
-    label "security"
-  ]
-  node [
-    id 3780
-    label "picdump"
-  ]
-  node [
-    id 3781
-    label "openbsd"
-  ]
-  node [
-    id 3782
-    label "calvinball"
-  ]
-  node [
-    id 3783
-    label "SoundersFC"
-  ]
-  node [
-    id 3784
-    label "beefgun"
-  ]
-  node [
-    id 3785
-    label "italy"
-  ]
-  node [
-    id 3786
-    label "Fyn"
-  ]
-  node [
-    id 3787
-    label "nodoubt"
-  ]
-  node [
-    id 3788
-    label "Exoplanetology"
-  ]
-  node [
-    id 3789
-    label "Noospherism"
-  ]
-  node [
-    id 3790
-    label "custombusinesscards"
-  ]
-  node [
-    id 3791
-    label "secondlife"
-  ]
-  node [
-    id 3792
-    label "Asbestos"
-  ]
-  node [
-    id 3793
-    label "VAD"
-  ]
-  node [
-    id 3794
-    label "Sherewizki"
-  ]
-  node [
-    id 3795
-    label "vlogging"
-  ]
-  node [
-    id 3796
-    label "YouPublish"
-  ]
-  node [
-    id 3797
-    label "mufeedaanees1"
-  ]
-  node [
-    id 3798
-    label "DearReddit"
-  ]
-  node [
-    id 3799
-    label "Gopi"
-  ]
-  node [
-    id 3800
-    label "yoyo"
-  ]
-  node [
-    id 3801
-    label "skytourbeau"
-  ]
-  node [
-    id 3802
-    label "solutions"
-  ]
-  node [
-    id 3803
-    label "Egypt"
-  ]
-  node [
-    id 3804
-    label "Michigan"
-  ]
-  node [
-    id 3805
-    label "1_Irritated_Mother"
-  ]
-  node [
-    id 3806
-    label "access"
-  ]
-  node [
-    id 3807
-    label "cyberactivism"
-  ]
-  node [
-    id 3808
-    label "martin"
-  ]
-  node [
-    id 3809
-    label "sad"
-  ]
-  node [
-    id 3810
-    label "askgod"
-  ]
-  node [
-    id 3811
-    label "SUBZEROLOSANGELES"
-  ]
-  node [
-    id 3812
-    label "work"
-  ]
-  node [
-    id 3813
-    label "AegonReligare"
-  ]
-  node [
-    id 3814
-    label "petshop"
-  ]
-  node [
-    id 3815
-    label "brondo"
-  ]
-  node [
-    id 3816
-    label "redditanonoymous"
-  ]
-  node [
-    id 3817
-    label "karlitox"
-  ]
-  node [
-    id 3818
-    label "myshill3"
-  ]
-  node [
-    id 3819
-    label "stupid"
-  ]
-  node [
-    id 3820
-    label "aklunder72"
-  ]
-  node [
-    id 3821
-    label "Blind"
-  ]
-  node [
-    id 3822
-    label "soundbites"
-  ]
-  node [
-    id 3823
-    label "scrum"
-  ]
-  node [
-    id 3824
-    label "search9"
-  ]
-  node [
-    id 3825
-    label "soulmate"
-  ]
-  node [
-    id 3826
-    label "777gambling"
-  ]
-  node [
-    id 3827
-    label "Lemonchavs"
-  ]
-  node [
-    id 3828
-    label "Chuams"
-  ]
-  node [
-    id 3829
-    label "viet"
-  ]
-  node [
-    id 3830
-    label "Janet"
-  ]
-  node [
-    id 3831
-    label "cyoadventure"
-  ]
-  node [
-    id 3832
-    label "Web_Analytics"
-  ]
-  node [
-    id 3833
-    label "salakedan"
-  ]
-  node [
-    id 3834
-    label "HarvardElection08"
-  ]
-  node [
-    id 3835
-    label "arabicblogs"
-  ]
-  node [
-    id 3836
-    label "unlawflcombatnt"
-  ]
-  node [
-    id 3837
-    label "adnerds"
-  ]
-  node [
-    id 3838
-    label "zine"
-  ]
-  node [
-    id 3839
-    label "thebigbadwolf"
-  ]
-  node [
-    id 3840
-    label "LinuxTutorials"
-  ]
-  node [
-    id 3841
-    label "lifestyle"
-  ]
-  node [
-    id 3842
-    label "LDbidz"
-  ]
-  node [
-    id 3843
-    label "masangiklan"
-  ]
-  node [
-    id 3844
-    label "mexico"
-  ]
-  node [
-    id 3845
-    label "BestApparel"
-  ]
-  node [
-    id 3846
-    label "Blinds2go"
-  ]
-  node [
-    id 3847
-    label "celebrities"
-  ]
-  node [
-    id 3848
-    label "Roofio81"
-  ]
-  node [
-    id 3849
-    label "deutschland"
-  ]
-  node [
-    id 3850
-    label "projecth3o"
-  ]
-  node [
-    id 3851
-    label "MediaBias"
-  ]
-  node [
-    id 3852
-    label "engineering"
-  ]
-  node [
-    id 3853
-    label "StreetFighter"
-  ]
-  node [
-    id 3854
-    label "monkeys"
-  ]
-  node [
-    id 3855
-    label "D_programming"
-  ]
-  node [
-    id 3856
-    label "religiousdebate"
-  ]
-  node [
-    id 3857
-    label "Hillary"
-  ]
-  node [
-    id 3858
-    label "Subzero"
-  ]
-  node [
-    id 3859
-    label "Austria"
-  ]
-  node [
-    id 3860
-    label "scientology"
-  ]
-  node [
-    id 3861
-    label "Ubuntu"
-  ]
-  node [
-    id 3862
-    label "youtubetester"
-  ]
-  node [
-    id 3863
-    label "nader"
-  ]
-  node [
-    id 3864
-    label "e2mars"
-  ]
-  node [
-    id 3865
-    label "Sleeptreatment"
-  ]
-  node [
-    id 3866
-    label "surf"
-  ]
-  node [
-    id 3867
-    label "introduce"
-  ]
-  node [
-    id 3868
-    label "ChristianPrayer"
-  ]
-  node [
-    id 3869
-    label "BearlyaSubreddit"
-  ]
-  node [
-    id 3870
-    label "productreview"
-  ]
-  node [
-    id 3871
-    label "test"
-  ]
-  node [
-    id 3872
-    label "giveaways"
-  ]
-  node [
-    id 3873
-    label "sadao"
-  ]
-  node [
-    id 3874
-    label "fuck"
-  ]
-  node [
-    id 3875
-    label "Mosaic_Interactive"
-  ]
-  node [
-    id 3876
-    label "bookclub"
-  ]
-  node [
-    id 3877
-    label "idea"
-  ]
-  node [
-    id 3878
-    label "Khao_Lak_Thailand"
-  ]
-  node [
-    id 3879
-    label "Phonecasting"
-  ]
-  node [
-    id 3880
-    label "theantirobot"
-  ]
-  node [
-    id 3881
-    label "Madness"
-  ]
-  node [
-    id 3882
-    label "PristineMerchandise"
-  ]
-  node [
-    id 3883
-    label "encryption"
-  ]
-  node [
-    id 3884
-    label "nature"
-  ]
-  node [
-    id 3885
-    label "Risk"
-  ]
-  node [
-    id 3886
-    label "SingaporeMarketing"
-  ]
-  node [
-    id 3887
-    label "hairmetal"
-  ]
-  node [
-    id 3888
-    label "SignPetitions"
-  ]
-  node [
-    id 3889
-    label "STFU"
-  ]
-  node [
-    id 3890
-    label "Pink"
-  ]
-  node [
-    id 3891
-    label "BRAAAAINS"
-  ]
-  node [
-    id 3892
-    label "sick"
-  ]
-  node [
-    id 3893
-    label "ServerSupport"
-  ]
-  node [
-    id 3894
-    label "eupolitics"
-  ]
-  node [
-    id 3895
-    label "RivieraNayarit"
-  ]
-  node [
-    id 3896
-    label "Sporn"
-  ]
-  node [
-    id 3897
-    label "pbwiki"
-  ]
-  node [
-    id 3898
-    label "parapsych"
-  ]
-  node [
-    id 3899
-    label "transformers"
-  ]
-  node [
-    id 3900
-    label "Deineip"
-  ]
-  node [
-    id 3901
-    label "urbanexploration"
-  ]
-  node [
-    id 3902
-    label "2600"
-  ]
-  node [
-    id 3903
-    label "HPC"
-  ]
-  node [
-    id 3904
-    label "texas"
-  ]
-  node [
-    id 3905
-    label "cfcamerica"
-  ]
-  node [
-    id 3906
-    label "bitch"
-  ]
-  node [
-    id 3907
-    label "genetic_algorithms"
-  ]
-  node [
-    id 3908
-    label "SEC"
-  ]
-  node [
-    id 3909
-    label "Gail"
-  ]
-  node [
-    id 3910
-    label "HealthInsurance"
-  ]
-  node [
-    id 3911
-    label "joos"
-  ]
-  node [
-    id 3912
-    label "Indeye"
-  ]
-  node [
-    id 3913
-    label "survivalism"
-  ]
-  node [
-    id 3914
-    label "chinaacrylicbeads"
-  ]
-  node [
-    id 3915
-    label "INTELLECTUALPROPERTY"
-  ]
-  node [
-    id 3916
-    label "drburn"
-  ]
-  node [
-    id 3917
-    label "bestof"
-  ]
-  node [
-    id 3918
-    label "WebInfoList"
-  ]
-  node [
-    id 3919
-    label "myst"
-  ]
-  node [
-    id 3920
-    label "CaseMate"
-  ]
-  node [
-    id 3921
-    label "LifeHacker"
-  ]
-  node [
-    id 3922
-    label "videomakers"
-  ]
-  node [
-    id 3923
-    label "HealthcareErrors"
-  ]
-  node [
-    id 3924
-    label "invasion"
-  ]
-  node [
-    id 3925
-    label "Who"
-  ]
-  node [
-    id 3926
-    label "arbejdsglaede"
-  ]
-  node [
-    id 3927
-    label "mente_mecanica"
-  ]
-  node [
-    id 3928
-    label "nick"
-  ]
-  node [
-    id 3929
-    label "floss"
-  ]
-  node [
-    id 3930
-    label "BlogVibrations"
-  ]
-  node [
-    id 3931
-    label "modula3"
-  ]
-  node [
-    id 3932
-    label "PCHhumor"
-  ]
-  node [
-    id 3933
-    label "awesomereddit"
-  ]
-  node [
-    id 3934
-    label "Gifts"
-  ]
-  node [
-    id 3935
-    label "Animals"
-  ]
-  node [
-    id 3936
-    label "deandrown"
-  ]
-  node [
-    id 3937
-    label "hardware"
-  ]
-  node [
-    id 3938
-    label "sawwit"
-  ]
-  node [
-    id 3939
-    label "Chloetay"
-  ]
-  node [
-    id 3940
-    label "RWM"
-  ]
-  node [
-    id 3941
-    label "leagueofnonvoters"
-  ]
-  node [
-    id 3942
-    label "xprogramming"
-  ]
-  node [
-    id 3943
-    label "chachadeals"
-  ]
-  node [
-    id 3944
-    label "cncrk"
-  ]
-  node [
-    id 3945
-    label "Armoloy"
-  ]
-  node [
-    id 3946
-    label "LoanModification"
-  ]
-  node [
-    id 3947
-    label "pupunk"
-  ]
-  node [
-    id 3948
-    label "Tabs"
-  ]
-  node [
-    id 3949
-    label "ipostme"
-  ]
-  node [
-    id 3950
-    label "Zensurf"
-  ]
-  node [
-    id 3951
-    label "emerfv"
-  ]
-  node [
-    id 3952
-    label "Boobies"
-  ]
-  node [
-    id 3953
-    label "Jurors"
-  ]
-  node [
-    id 3954
-    label "worldpolitics"
-  ]
-  node [
-    id 3955
-    label "baseballcard"
-  ]
-  node [
-    id 3956
-    label "islam"
-  ]
-  node [
-    id 3957
-    label "douchebag"
-  ]
-  node [
-    id 3958
-    label "reference"
-  ]
-  node [
-    id 3959
-    label "daily"
-  ]
-  node [
-    id 3960
-    label "DailyShow"
-  ]
-  node [
-    id 3961
-    label "RedditComplaints"
-  ]
-  node [
-    id 3962
-    label "web_design"
-  ]
-  node [
-    id 3963
-    label "Posters"
-  ]
-  node [
-    id 3964
-    label "MathComics"
-  ]
-  node [
-    id 3965
-    label "Turkiye"
-  ]
-  node [
-    id 3966
-    label "playthecrowd"
-  ]
-  node [
-    id 3967
-    label "livesex"
-  ]
-  node [
-    id 3968
-    label "india"
-  ]
-  node [
-    id 3969
-    label "socialmediastuff"
-  ]
-  node [
-    id 3970
-    label "ocaml"
-  ]
-  node [
-    id 3971
-    label "radiocontrol"
-  ]
-  node [
-    id 3972
-    label "ByTheStreet"
-  ]
-  node [
-    id 3973
-    label "comic"
-  ]
-  node [
-    id 3974
-    label "anonymous"
-  ]
-  node [
-    id 3975
-    label "newcapitalclub"
-  ]
-  node [
-    id 3976
-    label "geostuff"
-  ]
-  node [
-    id 3977
-    label "homeschool"
-  ]
-  node [
-    id 3978
-    label "bestshoes"
-  ]
-  node [
-    id 3979
-    label "FlowerWindowBoxes"
-  ]
-  node [
-    id 3980
-    label "JHaHa"
-  ]
-  node [
-    id 3981
-    label "Payday"
-  ]
-  node [
-    id 3982
-    label "triathlon"
-  ]
-  node [
-    id 3983
-    label "SadNews"
-  ]
-  node [
-    id 3984
-    label "RacistReddit"
-  ]
-  node [
-    id 3985
-    label "blogs"
-  ]
-  node [
-    id 3986
-    label "Punkrockin"
-  ]
-  node [
-    id 3987
-    label "YomiuriGiants"
-  ]
-  node [
-    id 3988
-    label "designerly"
-  ]
-  node [
-    id 3989
-    label "ryerson"
-  ]
-  node [
-    id 3990
-    label "HotPads"
-  ]
-  node [
-    id 3991
-    label "slackware"
-  ]
-  node [
-    id 3992
-    label "NileshRathi"
-  ]
-  node [
-    id 3993
-    label "geek"
-  ]
-  node [
-    id 3994
-    label "CFL"
-  ]
-  node [
-    id 3995
-    label "kogoa"
-  ]
-  node [
-    id 3996
-    label "pennystocks"
-  ]
-  node [
-    id 3997
-    label "chwakcha"
-  ]
-  node [
-    id 3998
-    label "causes"
-  ]
-  node [
-    id 3999
-    label "lexlinguae"
-  ]
-  node [
-    id 4000
-    label "greece"
-  ]
-  node [
-    id 4001
-    label "onejerusalem"
-  ]
-  node [
-    id 4002
-    label "tamil"
-  ]
-  node [
-    id 4003
-    label "computerscience"
-  ]
-  node [
-    id 4004
-    label "geovanimartinez"
-  ]
-  node [
-    id 4005
-    label "overmoderated"
-  ]
-  node [
-    id 4006
-    label "industry"
-  ]
-  node [
-    id 4007
-    label "england"
-  ]
-  node [
-    id 4008
-    label "nightbloom"
-  ]
-  node [
-    id 4009
-    label "parent"
-  ]
-  node [
-    id 4010
-    label "java_webframeworks"
-  ]
-  node [
-    id 4011
-    label "Miami"
-  ]
-  node [
-    id 4012
-    label "newsfusion"
-  ]
-  node [
-    id 4013
-    label "Joe_zhang"
-  ]
-  node [
-    id 4014
-    label "CliveRichards"
-  ]
-  node [
-    id 4015
-    label "albino"
-  ]
-  node [
-    id 4016
-    label "ntoLabs"
-  ]
-  node [
-    id 4017
-    label "TheBeautyAcademy"
-  ]
-  node [
-    id 4018
-    label "hugs"
-  ]
-  node [
-    id 4019
-    label "naturism"
-  ]
-  node [
-    id 4020
-    label "CampingandHiking"
-  ]
-  node [
-    id 4021
-    label "interviews"
-  ]
-  node [
-    id 4022
-    label "Scribd"
-  ]
-  node [
-    id 4023
-    label "mytestreddittwo"
-  ]
-  node [
-    id 4024
-    label "awsomemusic"
-  ]
-  node [
-    id 4025
-    label "dancemusik"
-  ]
-  node [
-    id 4026
-    label "p41n"
-  ]
-  node [
-    id 4027
-    label "ideas"
-  ]
-  node [
-    id 4028
-    label "signofthefox"
-  ]
-  node [
-    id 4029
-    label "WeAreStillinBeta"
-  ]
-  node [
-    id 4030
-    label "sem"
-  ]
-  node [
-    id 4031
-    label "trailers"
-  ]
-  node [
-    id 4032
-    label "Weird_Science"
-  ]
-  node [
-    id 4033
-    label "Interior"
-  ]
-  node [
-    id 4034
-    label "redheads"
-  ]
-  node [
-    id 4035
-    label "Omaha"
-  ]
-  node [
-    id 4036
-    label "oracle"
-  ]
-  node [
-    id 4037
-    label "tonutest"
-  ]
-  node [
-    id 4038
-    label "librarians"
-  ]
-  node [
-    id 4039
-    label "straightedge"
-  ]
-  node [
-    id 4040
-    label "beer"
-  ]
-  node [
-    id 4041
-    label "albachtimi"
-  ]
-  node [
-    id 4042
-    label "Hot_Babes"
-  ]
-  node [
-    id 4043
-    label "nfsw"
-  ]
-  node [
-    id 4044
-    label "Shedworking"
-  ]
-  node [
-    id 4045
-    label "secularism"
-  ]
-  node [
-    id 4046
-    label "Impeachment"
-  ]
-  node [
-    id 4047
-    label "jltff"
-  ]
-  node [
-    id 4048
-    label "HOUMAN"
-  ]
-  node [
-    id 4049
-    label "sales"
-  ]
-  node [
-    id 4050
-    label "techoops"
-  ]
-  node [
-    id 4051
-    label "worldnews"
-  ]
-  node [
-    id 4052
-    label "merealty"
-  ]
-  node [
-    id 4053
-    label "Headlines"
-  ]
-  node [
-    id 4054
-    label "running"
-  ]
-  node [
-    id 4055
-    label "ryanbulmer"
-  ]
-  node [
-    id 4056
-    label "Spirits"
-  ]
-  node [
-    id 4057
-    label "Everton"
-  ]
-  node [
-    id 4058
-    label "kidsfacepainting"
-  ]
-  node [
-    id 4059
-    label "freebooks"
-  ]
-  node [
-    id 4060
-    label "Demolition"
-  ]
-  node [
-    id 4061
-    label "Ibollywoodvideos"
-  ]
-  node [
-    id 4062
-    label "gender"
-  ]
-  node [
-    id 4063
-    label "celebnsfw"
-  ]
-  node [
-    id 4064
-    label "RooR"
-  ]
-  node [
-    id 4065
-    label "ambusha"
-  ]
-  node [
-    id 4066
-    label "notreallynews"
-  ]
-  node [
-    id 4067
-    label "3ren"
-  ]
-  node [
-    id 4068
-    label "lifehacks"
-  ]
-  node [
-    id 4069
-    label "Denver"
-  ]
-  node [
-    id 4070
-    label "dpolly"
-  ]
-  node [
-    id 4071
-    label "RedditTakesAction"
-  ]
-  node [
-    id 4072
-    label "tedtalks"
-  ]
-  node [
-    id 4073
-    label "dico"
-  ]
-  node [
-    id 4074
-    label "baltimorednd"
-  ]
-  node [
-    id 4075
-    label "J2EE"
-  ]
-  node [
-    id 4076
-    label "Datingsites"
-  ]
-  node [
-    id 4077
-    label "debian"
-  ]
-  node [
-    id 4078
-    label "Enlighten"
-  ]
-  node [
-    id 4079
-    label "Cisco"
-  ]
-  node [
-    id 4080
-    label "lechna"
-  ]
-  node [
-    id 4081
-    label "softwaredevelopment"
-  ]
-  node [
-    id 4082
-    label "dilbert"
-  ]
-  node [
-    id 4083
-    label "TopPosition"
-  ]
-  node [
-    id 4084
-    label "orkut"
-  ]
-  node [
-    id 4085
-    label "SouthAfricanTravel"
-  ]
-  node [
-    id 4086
-    label "Ferrari"
-  ]
-  node [
-    id 4087
-    label "OurChinese"
-  ]
-  node [
-    id 4088
-    label "Powerplay"
-  ]
-  node [
-    id 4089
-    label "BLESSIE"
-  ]
-  node [
-    id 4090
-    label "footballcupleague"
-  ]
-  node [
-    id 4091
-    label "Owls"
-  ]
-  node [
-    id 4092
-    label "mobwisdom"
-  ]
-  node [
-    id 4093
-    label "SugarCoatings"
-  ]
-  node [
-    id 4094
-    label "diplomacy"
-  ]
-  node [
-    id 4095
-    label "flashlights"
-  ]
-  node [
-    id 4096
-    label "balkanpolitics"
-  ]
-  node [
-    id 4097
-    label "PropertyLawyer"
-  ]
-  node [
-    id 4098
-    label "ukpolitics"
-  ]
-  node [
-    id 4099
-    label "ariyes"
-  ]
-  node [
-    id 4100
-    label "architecture"
-  ]
-  node [
-    id 4101
-    label "sgportal"
-  ]
-  node [
-    id 4102
-    label "Cubicleddit"
-  ]
-  node [
-    id 4103
-    label "TENTRACKS"
-  ]
-  node [
-    id 4104
-    label "deaf"
-  ]
-  node [
-    id 4105
-    label "Viamedic"
-  ]
-  node [
-    id 4106
-    label "foreignpolicy"
-  ]
-  node [
-    id 4107
-    label "stacktrace"
-  ]
-  node [
-    id 4108
-    label "puzzlegames"
-  ]
-  node [
-    id 4109
-    label "Marius93"
-  ]
-  node [
-    id 4110
-    label "NYPolitics"
-  ]
-  node [
-    id 4111
-    label "Xnews"
-  ]
-  node [
-    id 4112
-    label "milf"
-  ]
-  node [
-    id 4113
-    label "HeyShae"
-  ]
-  node [
-    id 4114
-    label "CoolCars"
-  ]
-  node [
-    id 4115
-    label "pakistan"
-  ]
-  node [
-    id 4116
-    label "mndoci"
-  ]
-  node [
-    id 4117
-    label "SavedComments"
-  ]
-  node [
-    id 4118
-    label "mixtape"
-  ]
-  node [
-    id 4119
-    label "CLVideos"
-  ]
-  node [
-    id 4120
-    label "startup"
-  ]
-  node [
-    id 4121
-    label "Taringames"
-  ]
-  node [
-    id 4122
-    label "apod"
-  ]
-  node [
-    id 4123
-    label "Victoria"
-  ]
-  node [
-    id 4124
-    label "orsiko"
-  ]
-  node [
-    id 4125
-    label "wood"
-  ]
-  node [
-    id 4126
-    label "Addicted2Salsa"
-  ]
-  node [
-    id 4127
-    label "srpski"
-  ]
-  node [
-    id 4128
-    label "radiofreereddit"
-  ]
-  node [
-    id 4129
-    label "electroraggahiphop"
-  ]
-  node [
-    id 4130
-    label "relationships"
-  ]
-  node [
-    id 4131
-    label "SexToys"
-  ]
-  node [
-    id 4132
-    label "BitterVotersforObama"
-  ]
-  node [
-    id 4133
-    label "PoliticalPhilosophy"
-  ]
-  node [
-    id 4134
-    label "FootballCentral"
-  ]
-  node [
-    id 4135
-    label "guitartuts"
-  ]
-  node [
-    id 4136
-    label "inconcievable"
-  ]
-  node [
-    id 4137
-    label "reggae"
-  ]
-  node [
-    id 4138
-    label "responsetoemail"
-  ]
-  node [
-    id 4139
-    label "horror"
-  ]
-  node [
-    id 4140
-    label "tokiohotelamerica"
-  ]
-  node [
-    id 4141
-    label "HealthAndFitness"
-  ]
-  node [
-    id 4142
-    label "BlogIndians"
-  ]
-  node [
-    id 4143
-    label "bayarea"
-  ]
-  node [
-    id 4144
-    label "xna"
-  ]
-  node [
-    id 4145
-    label "aikido"
-  ]
-  node [
-    id 4146
-    label "EstwingTools"
-  ]
-  node [
-    id 4147
-    label "nsedreams"
-  ]
-  node [
-    id 4148
-    label "YankeeFlipperFeeder"
-  ]
-  node [
-    id 4149
-    label "aurismarketing"
-  ]
-  node [
-    id 4150
-    label "TellReddit"
-  ]
-  node [
-    id 4151
-    label "IntelligentVideos"
-  ]
-  node [
-    id 4152
-    label "japan"
-  ]
-  node [
-    id 4153
-    label "rubybr"
-  ]
-  node [
-    id 4154
-    label "Marijuana"
-  ]
-  node [
-    id 4155
-    label "Oliviaryan"
-  ]
-  node [
-    id 4156
-    label "dwhost"
-  ]
-  node [
-    id 4157
-    label "CarteBlanche"
-  ]
-  node [
-    id 4158
-    label "EmbracetheChaos"
-  ]
-  node [
-    id 4159
-    label "agnostic"
-  ]
-  node [
-    id 4160
-    label "education"
-  ]
-  node [
-    id 4161
-    label "nrl"
-  ]
-  node [
-    id 4162
-    label "guns"
-  ]
-  node [
-    id 4163
-    label "cakephp"
-  ]
-  node [
-    id 4164
-    label "facebook"
-  ]
-  node [
-    id 4165
-    label "mysafetysign"
-  ]
-  node [
-    id 4166
-    label "campusvideos"
-  ]
-  node [
-    id 4167
-    label "luisalonsoja"
-  ]
-  node [
-    id 4168
-    label "Paunchiness"
-  ]
-  node [
-    id 4169
-    label "wayne79au"
-  ]
-  node [
-    id 4170
-    label "Cufflinks"
-  ]
-  node [
-    id 4171
-    label "experiment1"
-  ]
-  node [
-    id 4172
-    label "TeamFortress2"
-  ]
-  node [
-    id 4173
-    label "angry"
-  ]
-  node [
-    id 4174
-    label "npr_test"
-  ]
-  node [
-    id 4175
-    label "Brandsaloon"
-  ]
-  node [
-    id 4176
-    label "Nurse_dot_com"
-  ]
-  node [
-    id 4177
-    label "genetics"
-  ]
-  node [
-    id 4178
-    label "marcog"
-  ]
-  node [
-    id 4179
-    label "guysharp"
-  ]
-  node [
-    id 4180
-    label "vi"
-  ]
-  node [
-    id 4181
-    label "Josie"
-  ]
-  node [
-    id 4182
-    label "ASCII"
-  ]
-  node [
-    id 4183
-    label "specialplace"
-  ]
-  node [
-    id 4184
-    label "thailandhotels"
-  ]
-  node [
-    id 4185
-    label "Impel"
-  ]
-  node [
-    id 4186
-    label "DigitalDivide"
-  ]
-  node [
-    id 4187
-    label "robotics"
-  ]
-  node [
-    id 4188
-    label "WorldWidePolitics"
-  ]
-  node [
-    id 4189
-    label "paintball"
-  ]
-  node [
-    id 4190
-    label "ants"
-  ]
-  edge [
-    source 44
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 44
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 44
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 54
-    target 3521
-    weight 1379
-  ]
-  edge [
-    source 54
-    target 1616
-    weight 1362
-  ]
-  edge [
-    source 54
-    target 1487
-    weight 828
-  ]
-  edge [
-    source 54
-    target 2861
-    weight 1003
-  ]
-  edge [
-    source 54
-    target 751
-    weight 1103
-  ]
-  edge [
-    source 54
-    target 1127
-    weight 101
-  ]
-  edge [
-    source 54
-    target 602
-    weight 226
-  ]
-  edge [
-    source 54
-    target 3145
-    weight 684
-  ]
-  edge [
-    source 54
-    target 3937
-    weight 54
-  ]
-  edge [
-    source 54
-    target 2058
-    weight 149
-  ]
-  edge [
-    source 54
-    target 152
-    weight 41
-  ]
-  edge [
-    source 54
-    target 3993
-    weight 510
-  ]
-  edge [
-    source 54
-    target 1995
-    weight 566
-  ]
-  edge [
-    source 54
-    target 2071
-    weight 1039
-  ]
-  edge [
-    source 54
-    target 3174
-    weight 715
-  ]
-  edge [
-    source 54
-    target 502
-    weight 39
-  ]
-  edge [
-    source 54
-    target 2227
-    weight 26
-  ]
-  edge [
-    source 54
-    target 1154
-    weight 46
-  ]
-  edge [
-    source 54
-    target 3077
-    weight 48
-  ]
-  edge [
-    source 54
-    target 3962
-    weight 129
-  ]
-  edge [
-    source 54
-    target 1080
-    weight 786
-  ]
-  edge [
-    source 54
-    target 118
-    weight 960
-  ]
-  edge [
-    source 54
-    target 4051
-    weight 1091
-  ]
-  edge [
-    source 54
-    target 3565
-    weight 224
-  ]
-  edge [
-    source 54
-    target 3642
-    weight 401
-  ]
-  edge [
-    source 54
-    target 3040
-    weight 283
-  ]
-  edge [
-    source 54
-    target 3006
-    weight 282
-  ]
-  edge [
-    source 54
-    target 1195
-    weight 64
-  ]
-  edge [
-    source 54
-    target 3954
-    weight 268
-  ]
-  edge [
-    source 54
-    target 2543
-    weight 153
-  ]
-  edge [
-    source 54
-    target 3141
-    weight 1075
-  ]
-  edge [
-    source 54
-    target 3295
-    weight 137
-  ]
-  edge [
-    source 54
-    target 1461
-    weight 55
-  ]
-  edge [
-    source 54
-    target 3066
-    weight 188
-  ]
-  edge [
-    source 54
-    target 1707
-    weight 72
-  ]
-  edge [
-    source 54
-    target 1632
-    weight 452
-  ]
-  edge [
-    source 54
-    target 4160
-    weight 21
-  ]
-  edge [
-    source 54
-    target 1887
-    weight 1050
-  ]
-  edge [
-    source 54
-    target 4162
-    weight 162
-  ]
-  edge [
-    source 54
-    target 4154
-    weight 269
-  ]
-  edge [
-    source 54
-    target 3847
-    weight 62
-  ]
-  edge [
-    source 54
-    target 107
-    weight 189
-  ]
-  edge [
-    source 54
-    target 774
-    weight 1118
-  ]
-  edge [
-    source 54
-    target 1507
-    weight 154
-  ]
-  edge [
-    source 54
-    target 3420
-    weight 121
-  ]
-  edge [
-    source 54
-    target 3600
-    weight 653
-  ]
-  edge [
-    source 54
-    target 1647
-    weight 471
-  ]
-  edge [
-    source 54
-    target 1409
-    weight 108
-  ]
-  edge [
-    source 54
-    target 3917
-    weight 333
-  ]
-  edge [
-    source 54
-    target 3542
-    weight 228
-  ]
-  edge [
-    source 54
-    target 301
-    weight 425
-  ]
-  edge [
-    source 54
-    target 2700
-    weight 541
-  ]
-  edge [
-    source 54
-    target 3276
-    weight 531
-  ]
-  edge [
-    source 54
-    target 1952
-    weight 31
-  ]
-  edge [
-    source 54
-    target 3443
-    weight 173
-  ]
-  edge [
-    source 54
-    target 1582
-    weight 459
-  ]
-  edge [
-    source 54
-    target 1053
-    weight 768
-  ]
-  edge [
-    source 54
-    target 724
-    weight 108
-  ]
-  edge [
-    source 54
-    target 738
-    weight 324
-  ]
-  edge [
-    source 54
-    target 179
-    weight 274
-  ]
-  edge [
-    source 54
-    target 1360
-    weight 106
-  ]
-  edge [
-    source 54
-    target 3377
-    weight 65
-  ]
-  edge [
-    source 54
-    target 2890
-    weight 202
-  ]
-  edge [
-    source 54
-    target 2191
-    weight 170
-  ]
-  edge [
-    source 54
-    target 1766
-    weight 37
-  ]
-  edge [
-    source 54
-    target 3636
-    weight 145
-  ]
-  edge [
-    source 54
-    target 608
-    weight 28
-  ]
-  edge [
-    source 54
-    target 321
-    weight 53
-  ]
-  edge [
-    source 54
-    target 3374
-    weight 173
-  ]
-  edge [
-    source 54
-    target 1517
-    weight 42
-  ]
-  edge [
-    source 54
-    target 3282
-    weight 274
-  ]
-  edge [
-    source 54
-    target 798
-    weight 234
-  ]
-  edge [
-    source 54
-    target 604
-    weight 63
-  ]
-  edge [
-    source 54
-    target 927
-    weight 27
-  ]
-  edge [
-    source 54
-    target 1254
-    weight 261
-  ]
-  edge [
-    source 54
-    target 869
-    weight 25
-  ]
-  edge [
-    source 54
-    target 1280
-    weight 50
-  ]
-  edge [
-    source 54
-    target 1505
-    weight 273
-  ]
-  edge [
-    source 54
-    target 2054
-    weight 29
-  ]
-  edge [
-    source 54
-    target 717
-    weight 38
-  ]
-  edge [
-    source 54
-    target 2614
-    weight 33
-  ]
-  edge [
-    source 54
-    target 1757
-    weight 114
-  ]
-  edge [
-    source 54
-    target 1322
-    weight 48
-  ]
-  edge [
-    source 54
-    target 3884
-    weight 33
-  ]
-  edge [
-    source 54
-    target 305
-    weight 23
-  ]
-  edge [
-    source 54
-    target 1938
-    weight 75
-  ]
-  edge [
-    source 54
-    target 2870
-    weight 170
-  ]
-  edge [
-    source 54
-    target 3408
-    weight 49
-  ]
-  edge [
-    source 54
-    target 986
-    weight 60
-  ]
-  edge [
-    source 54
-    target 1185
-    weight 126
-  ]
-  edge [
-    source 54
-    target 2204
-    weight 120
-  ]
-  edge [
-    source 54
-    target 561
-    weight 28
-  ]
-  edge [
-    source 54
-    target 3196
-    weight 31
-  ]
-  edge [
-    source 54
-    target 2061
-    weight 21
-  ]
-  edge [
-    source 54
-    target 2287
-    weight 192
-  ]
-  edge [
-    source 54
-    target 422
-    weight 113
-  ]
-  edge [
-    source 54
-    target 147
-    weight 24
-  ]
-  edge [
-    source 54
-    target 2857
-    weight 263
-  ]
-  edge [
-    source 54
-    target 3423
-    weight 294
-  ]
-  edge [
-    source 54
-    target 1523
-    weight 99
-  ]
-  edge [
-    source 54
-    target 3253
-    weight 133
-  ]
-  edge [
-    source 54
-    target 256
-    weight 115
-  ]
-  edge [
-    source 54
-    target 4098
-    weight 23
-  ]
-  edge [
-    source 54
-    target 1802
-    weight 25
-  ]
-  edge [
-    source 54
-    target 2553
-    weight 89
-  ]
-  edge [
-    source 54
-    target 4040
-    weight 60
-  ]
-  edge [
-    source 54
-    target 874
-    weight 107
-  ]
-  edge [
-    source 54
-    target 456
-    weight 27
-  ]
-  edge [
-    source 54
-    target 2800
-    weight 69
-  ]
-  edge [
-    source 54
-    target 1420
-    weight 43
-  ]
-  edge [
-    source 54
-    target 671
-    weight 22
-  ]
-  edge [
-    source 54
-    target 968
-    weight 110
-  ]
-  edge [
-    source 54
-    target 1943
-    weight 36
-  ]
-  edge [
-    source 54
-    target 3177
-    weight 31
-  ]
-  edge [
-    source 54
-    target 2329
-    weight 25
-  ]
-  edge [
-    source 54
-    target 490
-    weight 63
-  ]
-  edge [
-    source 54
-    target 424
-    weight 52
-  ]
-  edge [
-    source 54
-    target 2519
-    weight 261
-  ]
-  edge [
-    source 54
-    target 2099
-    weight 22
-  ]
-  edge [
-    source 54
-    target 3877
-    weight 47
-  ]
-  edge [
-    source 54
-    target 2810
-    weight 41
-  ]
-  edge [
-    source 54
-    target 842
-    weight 31
-  ]
-  edge [
-    source 54
-    target 2531
-    weight 32
-  ]
-  edge [
-    source 54
-    target 2003
-    weight 37
-  ]
-  edge [
-    source 54
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 54
-    target 314
-    weight 36
-  ]
-  edge [
-    source 54
-    target 3052
-    weight 88
-  ]
-  edge [
-    source 54
-    target 1125
-    weight 25
-  ]
-  edge [
-    source 54
-    target 4187
-    weight 22
-  ]
-  edge [
-    source 54
-    target 980
-    weight 44
-  ]
-  edge [
-    source 54
-    target 1970
-    weight 24
-  ]
-  edge [
-    source 54
-    target 2078
-    weight 40
-  ]
-  edge [
-    source 67
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 67
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 67
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 67
-    target 1616
-    weight 21
-  ]
-  edge [
-    source 67
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 67
-    target 751
-    weight 23
-  ]
-  edge [
-    source 67
-    target 774
-    weight 23
-  ]
-  edge [
-    source 67
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 67
-    target 1487
-    weight 22
-  ]
-  edge [
-    source 79
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 91
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 91
-    target 118
-    weight 30
-  ]
-  edge [
-    source 91
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 91
-    target 1409
-    weight 23
-  ]
-  edge [
-    source 91
-    target 1616
-    weight 31
-  ]
-  edge [
-    source 91
-    target 1487
-    weight 30
-  ]
-  edge [
-    source 91
-    target 3521
-    weight 36
-  ]
-  edge [
-    source 91
-    target 774
-    weight 31
-  ]
-  edge [
-    source 91
-    target 751
-    weight 30
-  ]
-  edge [
-    source 91
-    target 2071
-    weight 37
-  ]
-  edge [
-    source 91
-    target 1887
-    weight 28
-  ]
-  edge [
-    source 91
-    target 3141
-    weight 33
-  ]
-  edge [
-    source 91
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 91
-    target 1053
-    weight 23
-  ]
-  edge [
-    source 107
-    target 179
-    weight 125
-  ]
-  edge [
-    source 107
-    target 1409
-    weight 39
-  ]
-  edge [
-    source 107
-    target 1616
-    weight 492
-  ]
-  edge [
-    source 107
-    target 3521
-    weight 508
-  ]
-  edge [
-    source 107
-    target 1647
-    weight 196
-  ]
-  edge [
-    source 107
-    target 751
-    weight 424
-  ]
-  edge [
-    source 107
-    target 1632
-    weight 220
-  ]
-  edge [
-    source 107
-    target 1707
-    weight 44
-  ]
-  edge [
-    source 107
-    target 1127
-    weight 58
-  ]
-  edge [
-    source 107
-    target 1360
-    weight 76
-  ]
-  edge [
-    source 107
-    target 4051
-    weight 442
-  ]
-  edge [
-    source 107
-    target 3006
-    weight 151
-  ]
-  edge [
-    source 107
-    target 3917
-    weight 172
-  ]
-  edge [
-    source 107
-    target 2861
-    weight 363
-  ]
-  edge [
-    source 107
-    target 1487
-    weight 283
-  ]
-  edge [
-    source 107
-    target 602
-    weight 95
-  ]
-  edge [
-    source 107
-    target 3174
-    weight 255
-  ]
-  edge [
-    source 107
-    target 3954
-    weight 169
-  ]
-  edge [
-    source 107
-    target 1995
-    weight 246
-  ]
-  edge [
-    source 107
-    target 424
-    weight 80
-  ]
-  edge [
-    source 107
-    target 1080
-    weight 284
-  ]
-  edge [
-    source 107
-    target 3847
-    weight 47
-  ]
-  edge [
-    source 107
-    target 842
-    weight 38
-  ]
-  edge [
-    source 107
-    target 3565
-    weight 94
-  ]
-  edge [
-    source 107
-    target 3066
-    weight 135
-  ]
-  edge [
-    source 107
-    target 1053
-    weight 334
-  ]
-  edge [
-    source 107
-    target 3141
-    weight 434
-  ]
-  edge [
-    source 107
-    target 1887
-    weight 445
-  ]
-  edge [
-    source 107
-    target 4154
-    weight 169
-  ]
-  edge [
-    source 107
-    target 1507
-    weight 74
-  ]
-  edge [
-    source 107
-    target 774
-    weight 446
-  ]
-  edge [
-    source 107
-    target 3253
-    weight 70
-  ]
-  edge [
-    source 107
-    target 3276
-    weight 203
-  ]
-  edge [
-    source 107
-    target 1517
-    weight 40
-  ]
-  edge [
-    source 107
-    target 1582
-    weight 203
-  ]
-  edge [
-    source 107
-    target 118
-    weight 379
-  ]
-  edge [
-    source 107
-    target 3642
-    weight 175
-  ]
-  edge [
-    source 107
-    target 1757
-    weight 61
-  ]
-  edge [
-    source 107
-    target 2071
-    weight 394
-  ]
-  edge [
-    source 107
-    target 321
-    weight 41
-  ]
-  edge [
-    source 107
-    target 3420
-    weight 81
-  ]
-  edge [
-    source 107
-    target 3636
-    weight 84
-  ]
-  edge [
-    source 107
-    target 2191
-    weight 60
-  ]
-  edge [
-    source 107
-    target 3040
-    weight 145
-  ]
-  edge [
-    source 107
-    target 2054
-    weight 36
-  ]
-  edge [
-    source 107
-    target 314
-    weight 27
-  ]
-  edge [
-    source 107
-    target 3542
-    weight 131
-  ]
-  edge [
-    source 107
-    target 3374
-    weight 72
-  ]
-  edge [
-    source 107
-    target 1254
-    weight 139
-  ]
-  edge [
-    source 107
-    target 968
-    weight 79
-  ]
-  edge [
-    source 107
-    target 717
-    weight 34
-  ]
-  edge [
-    source 107
-    target 738
-    weight 169
-  ]
-  edge [
-    source 107
-    target 2543
-    weight 92
-  ]
-  edge [
-    source 107
-    target 456
-    weight 22
-  ]
-  edge [
-    source 107
-    target 490
-    weight 38
-  ]
-  edge [
-    source 107
-    target 3295
-    weight 55
-  ]
-  edge [
-    source 107
-    target 301
-    weight 203
-  ]
-  edge [
-    source 107
-    target 2870
-    weight 122
-  ]
-  edge [
-    source 107
-    target 2857
-    weight 140
-  ]
-  edge [
-    source 107
-    target 3282
-    weight 161
-  ]
-  edge [
-    source 107
-    target 3600
-    weight 235
-  ]
-  edge [
-    source 107
-    target 2890
-    weight 89
-  ]
-  edge [
-    source 107
-    target 2700
-    weight 284
-  ]
-  edge [
-    source 107
-    target 3993
-    weight 189
-  ]
-  edge [
-    source 107
-    target 3145
-    weight 293
-  ]
-  edge [
-    source 107
-    target 798
-    weight 120
-  ]
-  edge [
-    source 107
-    target 1322
-    weight 39
-  ]
-  edge [
-    source 107
-    target 256
-    weight 64
-  ]
-  edge [
-    source 107
-    target 724
-    weight 76
-  ]
-  edge [
-    source 107
-    target 2204
-    weight 74
-  ]
-  edge [
-    source 107
-    target 4162
-    weight 71
-  ]
-  edge [
-    source 107
-    target 422
-    weight 71
-  ]
-  edge [
-    source 107
-    target 2287
-    weight 113
-  ]
-  edge [
-    source 107
-    target 3443
-    weight 84
-  ]
-  edge [
-    source 107
-    target 1280
-    weight 35
-  ]
-  edge [
-    source 107
-    target 3377
-    weight 46
-  ]
-  edge [
-    source 107
-    target 1461
-    weight 34
-  ]
-  edge [
-    source 107
-    target 1195
-    weight 47
-  ]
-  edge [
-    source 107
-    target 3423
-    weight 98
-  ]
-  edge [
-    source 107
-    target 3052
-    weight 70
-  ]
-  edge [
-    source 107
-    target 1185
-    weight 76
-  ]
-  edge [
-    source 107
-    target 152
-    weight 23
-  ]
-  edge [
-    source 107
-    target 874
-    weight 67
-  ]
-  edge [
-    source 107
-    target 604
-    weight 35
-  ]
-  edge [
-    source 107
-    target 1523
-    weight 50
-  ]
-  edge [
-    source 107
-    target 2800
-    weight 49
-  ]
-  edge [
-    source 107
-    target 2519
-    weight 137
-  ]
-  edge [
-    source 107
-    target 1505
-    weight 130
-  ]
-  edge [
-    source 107
-    target 3884
-    weight 25
-  ]
-  edge [
-    source 107
-    target 1938
-    weight 48
-  ]
-  edge [
-    source 107
-    target 980
-    weight 38
-  ]
-  edge [
-    source 107
-    target 502
-    weight 23
-  ]
-  edge [
-    source 107
-    target 3962
-    weight 61
-  ]
-  edge [
-    source 107
-    target 2003
-    weight 33
-  ]
-  edge [
-    source 107
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 107
-    target 1154
-    weight 25
-  ]
-  edge [
-    source 107
-    target 4040
-    weight 27
-  ]
-  edge [
-    source 107
-    target 2232
-    weight 26
-  ]
-  edge [
-    source 107
-    target 2553
-    weight 65
-  ]
-  edge [
-    source 107
-    target 3877
-    weight 24
-  ]
-  edge [
-    source 107
-    target 986
-    weight 26
-  ]
-  edge [
-    source 107
-    target 2614
-    weight 23
-  ]
-  edge [
-    source 107
-    target 1420
-    weight 29
-  ]
-  edge [
-    source 107
-    target 3937
-    weight 25
-  ]
-  edge [
-    source 107
-    target 2058
-    weight 55
-  ]
-  edge [
-    source 107
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 118
-    target 3521
-    weight 20012
-  ]
-  edge [
-    source 118
-    target 751
-    weight 12025
-  ]
-  edge [
-    source 118
-    target 1616
-    weight 13593
-  ]
-  edge [
-    source 118
-    target 2861
-    weight 9346
-  ]
-  edge [
-    source 118
-    target 3565
-    weight 2136
-  ]
-  edge [
-    source 118
-    target 3600
-    weight 6698
-  ]
-  edge [
-    source 118
-    target 1582
-    weight 3958
-  ]
-  edge [
-    source 118
-    target 1647
-    weight 3645
-  ]
-  edge [
-    source 118
-    target 2421
-    weight 29
-  ]
-  edge [
-    source 118
-    target 1487
-    weight 9047
-  ]
-  edge [
-    source 118
-    target 2191
-    weight 917
-  ]
-  edge [
-    source 118
-    target 1216
-    weight 21
-  ]
-  edge [
-    source 118
-    target 152
-    weight 253
-  ]
-  edge [
-    source 118
-    target 3641
-    weight 91
-  ]
-  edge [
-    source 118
-    target 378
-    weight 29
-  ]
-  edge [
-    source 118
-    target 179
-    weight 1084
-  ]
-  edge [
-    source 118
-    target 3642
-    weight 2584
-  ]
-  edge [
-    source 118
-    target 964
-    weight 60
-  ]
-  edge [
-    source 118
-    target 3276
-    weight 4217
-  ]
-  edge [
-    source 118
-    target 3374
-    weight 858
-  ]
-  edge [
-    source 118
-    target 602
-    weight 300
-  ]
-  edge [
-    source 118
-    target 4051
-    weight 11345
-  ]
-  edge [
-    source 118
-    target 2058
-    weight 730
-  ]
-  edge [
-    source 118
-    target 3423
-    weight 1533
-  ]
-  edge [
-    source 118
-    target 719
-    weight 50
-  ]
-  edge [
-    source 118
-    target 1409
-    weight 693
-  ]
-  edge [
-    source 118
-    target 2227
-    weight 170
-  ]
-  edge [
-    source 118
-    target 774
-    weight 12943
-  ]
-  edge [
-    source 118
-    target 3420
-    weight 507
-  ]
-  edge [
-    source 118
-    target 3917
-    weight 1737
-  ]
-  edge [
-    source 118
-    target 3071
-    weight 74
-  ]
-  edge [
-    source 118
-    target 267
-    weight 41
-  ]
-  edge [
-    source 118
-    target 1769
-    weight 21
-  ]
-  edge [
-    source 118
-    target 2071
-    weight 11522
-  ]
-  edge [
-    source 118
-    target 2181
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1053
-    weight 6444
-  ]
-  edge [
-    source 118
-    target 561
-    weight 75
-  ]
-  edge [
-    source 118
-    target 3962
-    weight 775
-  ]
-  edge [
-    source 118
-    target 3443
-    weight 846
-  ]
-  edge [
-    source 118
-    target 1952
-    weight 130
-  ]
-  edge [
-    source 118
-    target 3377
-    weight 177
-  ]
-  edge [
-    source 118
-    target 3177
-    weight 160
-  ]
-  edge [
-    source 118
-    target 874
-    weight 520
-  ]
-  edge [
-    source 118
-    target 3077
-    weight 362
-  ]
-  edge [
-    source 118
-    target 671
-    weight 94
-  ]
-  edge [
-    source 118
-    target 1080
-    weight 3644
-  ]
-  edge [
-    source 118
-    target 2329
-    weight 105
-  ]
-  edge [
-    source 118
-    target 3542
-    weight 1032
-  ]
-  edge [
-    source 118
-    target 3066
-    weight 607
-  ]
-  edge [
-    source 118
-    target 604
-    weight 327
-  ]
-  edge [
-    source 118
-    target 3937
-    weight 215
-  ]
-  edge [
-    source 118
-    target 1333
-    weight 148
-  ]
-  edge [
-    source 118
-    target 1995
-    weight 3472
-  ]
-  edge [
-    source 118
-    target 3968
-    weight 93
-  ]
-  edge [
-    source 118
-    target 798
-    weight 1404
-  ]
-  edge [
-    source 118
-    target 2700
-    weight 3589
-  ]
-  edge [
-    source 118
-    target 3752
-    weight 21
-  ]
-  edge [
-    source 118
-    target 2857
-    weight 1070
-  ]
-  edge [
-    source 118
-    target 2978
-    weight 35
-  ]
-  edge [
-    source 118
-    target 3993
-    weight 3066
-  ]
-  edge [
-    source 118
-    target 3985
-    weight 89
-  ]
-  edge [
-    source 118
-    target 1127
-    weight 237
-  ]
-  edge [
-    source 118
-    target 3145
-    weight 3709
-  ]
-  edge [
-    source 118
-    target 3432
-    weight 92
-  ]
-  edge [
-    source 118
-    target 301
-    weight 2570
-  ]
-  edge [
-    source 118
-    target 1789
-    weight 101
-  ]
-  edge [
-    source 118
-    target 147
-    weight 133
-  ]
-  edge [
-    source 118
-    target 1505
-    weight 1285
-  ]
-  edge [
-    source 118
-    target 3112
-    weight 38
-  ]
-  edge [
-    source 118
-    target 3141
-    weight 12625
-  ]
-  edge [
-    source 118
-    target 1258
-    weight 93
-  ]
-  edge [
-    source 118
-    target 144
-    weight 101
-  ]
-  edge [
-    source 118
-    target 1887
-    weight 10635
-  ]
-  edge [
-    source 118
-    target 347
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1943
-    weight 127
-  ]
-  edge [
-    source 118
-    target 1425
-    weight 35
-  ]
-  edge [
-    source 118
-    target 1374
-    weight 64
-  ]
-  edge [
-    source 118
-    target 3357
-    weight 47
-  ]
-  edge [
-    source 118
-    target 3174
-    weight 3986
-  ]
-  edge [
-    source 118
-    target 2573
-    weight 45
-  ]
-  edge [
-    source 118
-    target 2614
-    weight 136
-  ]
-  edge [
-    source 118
-    target 877
-    weight 40
-  ]
-  edge [
-    source 118
-    target 3282
-    weight 1262
-  ]
-  edge [
-    source 118
-    target 986
-    weight 315
-  ]
-  edge [
-    source 118
-    target 2870
-    weight 914
-  ]
-  edge [
-    source 118
-    target 2810
-    weight 181
-  ]
-  edge [
-    source 118
-    target 1631
-    weight 42
-  ]
-  edge [
-    source 118
-    target 3253
-    weight 487
-  ]
-  edge [
-    source 118
-    target 502
-    weight 186
-  ]
-  edge [
-    source 118
-    target 1757
-    weight 593
-  ]
-  edge [
-    source 118
-    target 1254
-    weight 866
-  ]
-  edge [
-    source 118
-    target 505
-    weight 56
-  ]
-  edge [
-    source 118
-    target 1632
-    weight 1644
-  ]
-  edge [
-    source 118
-    target 2800
-    weight 303
-  ]
-  edge [
-    source 118
-    target 3636
-    weight 699
-  ]
-  edge [
-    source 118
-    target 4187
-    weight 111
-  ]
-  edge [
-    source 118
-    target 1931
-    weight 54
-  ]
-  edge [
-    source 118
-    target 4152
-    weight 97
-  ]
-  edge [
-    source 118
-    target 927
-    weight 122
-  ]
-  edge [
-    source 118
-    target 256
-    weight 506
-  ]
-  edge [
-    source 118
-    target 842
-    weight 88
-  ]
-  edge [
-    source 118
-    target 1349
-    weight 22
-  ]
-  edge [
-    source 118
-    target 123
-    weight 62
-  ]
-  edge [
-    source 118
-    target 689
-    weight 65
-  ]
-  edge [
-    source 118
-    target 2519
-    weight 1067
-  ]
-  edge [
-    source 118
-    target 422
-    weight 338
-  ]
-  edge [
-    source 118
-    target 2204
-    weight 536
-  ]
-  edge [
-    source 118
-    target 2924
-    weight 52
-  ]
-  edge [
-    source 118
-    target 3024
-    weight 72
-  ]
-  edge [
-    source 118
-    target 2543
-    weight 491
-  ]
-  edge [
-    source 118
-    target 4027
-    weight 89
-  ]
-  edge [
-    source 118
-    target 3954
-    weight 760
-  ]
-  edge [
-    source 118
-    target 2597
-    weight 65
-  ]
-  edge [
-    source 118
-    target 2417
-    weight 21
-  ]
-  edge [
-    source 118
-    target 2198
-    weight 31
-  ]
-  edge [
-    source 118
-    target 321
-    weight 181
-  ]
-  edge [
-    source 118
-    target 424
-    weight 106
-  ]
-  edge [
-    source 118
-    target 3693
-    weight 35
-  ]
-  edge [
-    source 118
-    target 724
-    weight 235
-  ]
-  edge [
-    source 118
-    target 738
-    weight 1292
-  ]
-  edge [
-    source 118
-    target 2287
-    weight 675
-  ]
-  edge [
-    source 118
-    target 3295
-    weight 394
-  ]
-  edge [
-    source 118
-    target 2890
-    weight 1019
-  ]
-  edge [
-    source 118
-    target 283
-    weight 172
-  ]
-  edge [
-    source 118
-    target 4098
-    weight 74
-  ]
-  edge [
-    source 118
-    target 968
-    weight 579
-  ]
-  edge [
-    source 118
-    target 215
-    weight 31
-  ]
-  edge [
-    source 118
-    target 3006
-    weight 584
-  ]
-  edge [
-    source 118
-    target 3052
-    weight 282
-  ]
-  edge [
-    source 118
-    target 3847
-    weight 296
-  ]
-  edge [
-    source 118
-    target 3884
-    weight 112
-  ]
-  edge [
-    source 118
-    target 448
-    weight 29
-  ]
-  edge [
-    source 118
-    target 305
-    weight 152
-  ]
-  edge [
-    source 118
-    target 2003
-    weight 77
-  ]
-  edge [
-    source 118
-    target 456
-    weight 128
-  ]
-  edge [
-    source 118
-    target 1554
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1397
-    weight 27
-  ]
-  edge [
-    source 118
-    target 1154
-    weight 256
-  ]
-  edge [
-    source 118
-    target 3040
-    weight 778
-  ]
-  edge [
-    source 118
-    target 314
-    weight 202
-  ]
-  edge [
-    source 118
-    target 1938
-    weight 330
-  ]
-  edge [
-    source 118
-    target 1322
-    weight 178
-  ]
-  edge [
-    source 118
-    target 2570
-    weight 71
-  ]
-  edge [
-    source 118
-    target 733
-    weight 130
-  ]
-  edge [
-    source 118
-    target 1185
-    weight 418
-  ]
-  edge [
-    source 118
-    target 2553
-    weight 335
-  ]
-  edge [
-    source 118
-    target 4007
-    weight 37
-  ]
-  edge [
-    source 118
-    target 3935
-    weight 55
-  ]
-  edge [
-    source 118
-    target 4154
-    weight 985
-  ]
-  edge [
-    source 118
-    target 3559
-    weight 34
-  ]
-  edge [
-    source 118
-    target 2082
-    weight 42
-  ]
-  edge [
-    source 118
-    target 2232
-    weight 46
-  ]
-  edge [
-    source 118
-    target 490
-    weight 204
-  ]
-  edge [
-    source 118
-    target 4160
-    weight 79
-  ]
-  edge [
-    source 118
-    target 869
-    weight 95
-  ]
-  edge [
-    source 118
-    target 2450
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1299
-    weight 29
-  ]
-  edge [
-    source 118
-    target 1507
-    weight 255
-  ]
-  edge [
-    source 118
-    target 308
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1707
-    weight 164
-  ]
-  edge [
-    source 118
-    target 630
-    weight 50
-  ]
-  edge [
-    source 118
-    target 4100
-    weight 32
-  ]
-  edge [
-    source 118
-    target 1280
-    weight 208
-  ]
-  edge [
-    source 118
-    target 1461
-    weight 85
-  ]
-  edge [
-    source 118
-    target 1360
-    weight 246
-  ]
-  edge [
-    source 118
-    target 3050
-    weight 54
-  ]
-  edge [
-    source 118
-    target 4040
-    weight 198
-  ]
-  edge [
-    source 118
-    target 2600
-    weight 33
-  ]
-  edge [
-    source 118
-    target 2054
-    weight 43
-  ]
-  edge [
-    source 118
-    target 1543
-    weight 28
-  ]
-  edge [
-    source 118
-    target 2801
-    weight 24
-  ]
-  edge [
-    source 118
-    target 3860
-    weight 83
-  ]
-  edge [
-    source 118
-    target 4162
-    weight 298
-  ]
-  edge [
-    source 118
-    target 3408
-    weight 211
-  ]
-  edge [
-    source 118
-    target 1232
-    weight 39
-  ]
-  edge [
-    source 118
-    target 363
-    weight 28
-  ]
-  edge [
-    source 118
-    target 440
-    weight 49
-  ]
-  edge [
-    source 118
-    target 2011
-    weight 100
-  ]
-  edge [
-    source 118
-    target 1125
-    weight 161
-  ]
-  edge [
-    source 118
-    target 1798
-    weight 61
-  ]
-  edge [
-    source 118
-    target 1922
-    weight 38
-  ]
-  edge [
-    source 118
-    target 808
-    weight 34
-  ]
-  edge [
-    source 118
-    target 3462
-    weight 38
-  ]
-  edge [
-    source 118
-    target 3956
-    weight 35
-  ]
-  edge [
-    source 118
-    target 1195
-    weight 141
-  ]
-  edge [
-    source 118
-    target 2844
-    weight 53
-  ]
-  edge [
-    source 118
-    target 423
-    weight 31
-  ]
-  edge [
-    source 118
-    target 2556
-    weight 65
-  ]
-  edge [
-    source 118
-    target 2434
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1691
-    weight 41
-  ]
-  edge [
-    source 118
-    target 980
-    weight 304
-  ]
-  edge [
-    source 118
-    target 548
-    weight 22
-  ]
-  edge [
-    source 118
-    target 1856
-    weight 24
-  ]
-  edge [
-    source 118
-    target 717
-    weight 53
-  ]
-  edge [
-    source 118
-    target 2743
-    weight 39
-  ]
-  edge [
-    source 118
-    target 1577
-    weight 44
-  ]
-  edge [
-    source 118
-    target 3324
-    weight 25
-  ]
-  edge [
-    source 118
-    target 712
-    weight 40
-  ]
-  edge [
-    source 118
-    target 1676
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1492
-    weight 38
-  ]
-  edge [
-    source 118
-    target 661
-    weight 26
-  ]
-  edge [
-    source 118
-    target 608
-    weight 129
-  ]
-  edge [
-    source 118
-    target 1199
-    weight 39
-  ]
-  edge [
-    source 118
-    target 2531
-    weight 77
-  ]
-  edge [
-    source 118
-    target 871
-    weight 42
-  ]
-  edge [
-    source 118
-    target 1523
-    weight 257
-  ]
-  edge [
-    source 118
-    target 3877
-    weight 221
-  ]
-  edge [
-    source 118
-    target 3162
-    weight 74
-  ]
-  edge [
-    source 118
-    target 3861
-    weight 62
-  ]
-  edge [
-    source 118
-    target 2832
-    weight 32
-  ]
-  edge [
-    source 118
-    target 2711
-    weight 82
-  ]
-  edge [
-    source 118
-    target 3375
-    weight 22
-  ]
-  edge [
-    source 118
-    target 2061
-    weight 52
-  ]
-  edge [
-    source 118
-    target 3196
-    weight 78
-  ]
-  edge [
-    source 118
-    target 3952
-    weight 31
-  ]
-  edge [
-    source 118
-    target 1664
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1775
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1028
-    weight 48
-  ]
-  edge [
-    source 118
-    target 2609
-    weight 33
-  ]
-  edge [
-    source 118
-    target 1832
-    weight 35
-  ]
-  edge [
-    source 118
-    target 1420
-    weight 176
-  ]
-  edge [
-    source 118
-    target 2009
-    weight 38
-  ]
-  edge [
-    source 118
-    target 3692
-    weight 24
-  ]
-  edge [
-    source 118
-    target 399
-    weight 57
-  ]
-  edge [
-    source 118
-    target 2953
-    weight 22
-  ]
-  edge [
-    source 118
-    target 1517
-    weight 118
-  ]
-  edge [
-    source 118
-    target 2997
-    weight 24
-  ]
-  edge [
-    source 118
-    target 3465
-    weight 25
-  ]
-  edge [
-    source 118
-    target 1802
-    weight 95
-  ]
-  edge [
-    source 118
-    target 2983
-    weight 35
-  ]
-  edge [
-    source 118
-    target 651
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1090
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1419
-    weight 67
-  ]
-  edge [
-    source 118
-    target 2955
-    weight 61
-  ]
-  edge [
-    source 118
-    target 549
-    weight 84
-  ]
-  edge [
-    source 118
-    target 3011
-    weight 29
-  ]
-  edge [
-    source 118
-    target 1140
-    weight 51
-  ]
-  edge [
-    source 118
-    target 1766
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1148
-    weight 72
-  ]
-  edge [
-    source 118
-    target 632
-    weight 79
-  ]
-  edge [
-    source 118
-    target 1634
-    weight 28
-  ]
-  edge [
-    source 118
-    target 3677
-    weight 74
-  ]
-  edge [
-    source 118
-    target 1064
-    weight 40
-  ]
-  edge [
-    source 118
-    target 2822
-    weight 78
-  ]
-  edge [
-    source 118
-    target 344
-    weight 40
-  ]
-  edge [
-    source 118
-    target 653
-    weight 30
-  ]
-  edge [
-    source 118
-    target 3872
-    weight 46
-  ]
-  edge [
-    source 118
-    target 675
-    weight 100
-  ]
-  edge [
-    source 118
-    target 1166
-    weight 22
-  ]
-  edge [
-    source 118
-    target 1391
-    weight 69
-  ]
-  edge [
-    source 118
-    target 2078
-    weight 153
-  ]
-  edge [
-    source 118
-    target 3108
-    weight 41
-  ]
-  edge [
-    source 118
-    target 2115
-    weight 31
-  ]
-  edge [
-    source 118
-    target 2634
-    weight 27
-  ]
-  edge [
-    source 118
-    target 3737
-    weight 39
-  ]
-  edge [
-    source 118
-    target 2099
-    weight 105
-  ]
-  edge [
-    source 118
-    target 1970
-    weight 123
-  ]
-  edge [
-    source 118
-    target 2836
-    weight 33
-  ]
-  edge [
-    source 118
-    target 916
-    weight 69
-  ]
-  edge [
-    source 118
-    target 3309
-    weight 22
-  ]
-  edge [
-    source 118
-    target 3633
-    weight 62
-  ]
-  edge [
-    source 118
-    target 3440
-    weight 31
-  ]
-  edge [
-    source 118
-    target 368
-    weight 40
-  ]
-  edge [
-    source 118
-    target 1900
-    weight 24
-  ]
-  edge [
-    source 118
-    target 3876
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1528
-    weight 45
-  ]
-  edge [
-    source 123
-    target 3521
-    weight 79
-  ]
-  edge [
-    source 123
-    target 3600
-    weight 39
-  ]
-  edge [
-    source 123
-    target 774
-    weight 76
-  ]
-  edge [
-    source 123
-    target 2861
-    weight 52
-  ]
-  edge [
-    source 123
-    target 751
-    weight 66
-  ]
-  edge [
-    source 123
-    target 1616
-    weight 73
-  ]
-  edge [
-    source 123
-    target 3141
-    weight 71
-  ]
-  edge [
-    source 123
-    target 1487
-    weight 47
-  ]
-  edge [
-    source 123
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 123
-    target 1647
-    weight 34
-  ]
-  edge [
-    source 123
-    target 3636
-    weight 25
-  ]
-  edge [
-    source 123
-    target 1080
-    weight 41
-  ]
-  edge [
-    source 123
-    target 1995
-    weight 40
-  ]
-  edge [
-    source 123
-    target 4051
-    weight 63
-  ]
-  edge [
-    source 123
-    target 3145
-    weight 52
-  ]
-  edge [
-    source 123
-    target 2870
-    weight 21
-  ]
-  edge [
-    source 123
-    target 3282
-    weight 39
-  ]
-  edge [
-    source 123
-    target 1632
-    weight 34
-  ]
-  edge [
-    source 123
-    target 1887
-    weight 71
-  ]
-  edge [
-    source 123
-    target 1053
-    weight 59
-  ]
-  edge [
-    source 123
-    target 3642
-    weight 25
-  ]
-  edge [
-    source 123
-    target 3276
-    weight 45
-  ]
-  edge [
-    source 123
-    target 2700
-    weight 41
-  ]
-  edge [
-    source 123
-    target 2071
-    weight 64
-  ]
-  edge [
-    source 123
-    target 798
-    weight 36
-  ]
-  edge [
-    source 123
-    target 3174
-    weight 43
-  ]
-  edge [
-    source 123
-    target 3542
-    weight 27
-  ]
-  edge [
-    source 123
-    target 301
-    weight 34
-  ]
-  edge [
-    source 123
-    target 738
-    weight 31
-  ]
-  edge [
-    source 123
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 123
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 123
-    target 1582
-    weight 39
-  ]
-  edge [
-    source 123
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 123
-    target 2287
-    weight 22
-  ]
-  edge [
-    source 123
-    target 179
-    weight 23
-  ]
-  edge [
-    source 123
-    target 1254
-    weight 22
-  ]
-  edge [
-    source 123
-    target 3066
-    weight 21
-  ]
-  edge [
-    source 123
-    target 1505
-    weight 28
-  ]
-  edge [
-    source 123
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 123
-    target 3917
-    weight 33
-  ]
-  edge [
-    source 123
-    target 3006
-    weight 23
-  ]
-  edge [
-    source 123
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 123
-    target 2058
-    weight 21
-  ]
-  edge [
-    source 123
-    target 2519
-    weight 28
-  ]
-  edge [
-    source 144
-    target 3521
-    weight 133
-  ]
-  edge [
-    source 144
-    target 3276
-    weight 69
-  ]
-  edge [
-    source 144
-    target 774
-    weight 108
-  ]
-  edge [
-    source 144
-    target 3145
-    weight 96
-  ]
-  edge [
-    source 144
-    target 1582
-    weight 57
-  ]
-  edge [
-    source 144
-    target 1616
-    weight 120
-  ]
-  edge [
-    source 144
-    target 1080
-    weight 75
-  ]
-  edge [
-    source 144
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 144
-    target 3993
-    weight 71
-  ]
-  edge [
-    source 144
-    target 798
-    weight 47
-  ]
-  edge [
-    source 144
-    target 2857
-    weight 55
-  ]
-  edge [
-    source 144
-    target 1647
-    weight 75
-  ]
-  edge [
-    source 144
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 144
-    target 1995
-    weight 69
-  ]
-  edge [
-    source 144
-    target 751
-    weight 120
-  ]
-  edge [
-    source 144
-    target 2861
-    weight 102
-  ]
-  edge [
-    source 144
-    target 3282
-    weight 52
-  ]
-  edge [
-    source 144
-    target 3642
-    weight 56
-  ]
-  edge [
-    source 144
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 144
-    target 2191
-    weight 35
-  ]
-  edge [
-    source 144
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 144
-    target 3917
-    weight 60
-  ]
-  edge [
-    source 144
-    target 1053
-    weight 93
-  ]
-  edge [
-    source 144
-    target 1487
-    weight 101
-  ]
-  edge [
-    source 144
-    target 3600
-    weight 73
-  ]
-  edge [
-    source 144
-    target 2800
-    weight 36
-  ]
-  edge [
-    source 144
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 144
-    target 2519
-    weight 42
-  ]
-  edge [
-    source 144
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 144
-    target 1254
-    weight 47
-  ]
-  edge [
-    source 144
-    target 1409
-    weight 27
-  ]
-  edge [
-    source 144
-    target 4051
-    weight 109
-  ]
-  edge [
-    source 144
-    target 1887
-    weight 106
-  ]
-  edge [
-    source 144
-    target 2071
-    weight 113
-  ]
-  edge [
-    source 144
-    target 3565
-    weight 36
-  ]
-  edge [
-    source 144
-    target 179
-    weight 57
-  ]
-  edge [
-    source 144
-    target 604
-    weight 31
-  ]
-  edge [
-    source 144
-    target 738
-    weight 53
-  ]
-  edge [
-    source 144
-    target 3636
-    weight 35
-  ]
-  edge [
-    source 144
-    target 3040
-    weight 35
-  ]
-  edge [
-    source 144
-    target 968
-    weight 24
-  ]
-  edge [
-    source 144
-    target 1505
-    weight 52
-  ]
-  edge [
-    source 144
-    target 2287
-    weight 27
-  ]
-  edge [
-    source 144
-    target 1185
-    weight 38
-  ]
-  edge [
-    source 144
-    target 2204
-    weight 29
-  ]
-  edge [
-    source 144
-    target 301
-    weight 65
-  ]
-  edge [
-    source 144
-    target 3174
-    weight 74
-  ]
-  edge [
-    source 144
-    target 3374
-    weight 47
-  ]
-  edge [
-    source 144
-    target 2890
-    weight 27
-  ]
-  edge [
-    source 144
-    target 2553
-    weight 26
-  ]
-  edge [
-    source 144
-    target 256
-    weight 27
-  ]
-  edge [
-    source 144
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 144
-    target 3423
-    weight 52
-  ]
-  edge [
-    source 144
-    target 3006
-    weight 29
-  ]
-  edge [
-    source 144
-    target 1757
-    weight 30
-  ]
-  edge [
-    source 144
-    target 3954
-    weight 39
-  ]
-  edge [
-    source 144
-    target 1632
-    weight 49
-  ]
-  edge [
-    source 144
-    target 3066
-    weight 33
-  ]
-  edge [
-    source 144
-    target 874
-    weight 38
-  ]
-  edge [
-    source 144
-    target 2810
-    weight 27
-  ]
-  edge [
-    source 144
-    target 2058
-    weight 40
-  ]
-  edge [
-    source 144
-    target 502
-    weight 21
-  ]
-  edge [
-    source 144
-    target 986
-    weight 31
-  ]
-  edge [
-    source 144
-    target 3420
-    weight 31
-  ]
-  edge [
-    source 144
-    target 3253
-    weight 31
-  ]
-  edge [
-    source 144
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 145
-    target 3521
-    weight 78
-  ]
-  edge [
-    source 145
-    target 2861
-    weight 22
-  ]
-  edge [
-    source 145
-    target 1487
-    weight 29
-  ]
-  edge [
-    source 145
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 145
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 147
-    target 3521
-    weight 164
-  ]
-  edge [
-    source 147
-    target 3600
-    weight 128
-  ]
-  edge [
-    source 147
-    target 1647
-    weight 85
-  ]
-  edge [
-    source 147
-    target 751
-    weight 138
-  ]
-  edge [
-    source 147
-    target 2861
-    weight 87
-  ]
-  edge [
-    source 147
-    target 1616
-    weight 140
-  ]
-  edge [
-    source 147
-    target 1487
-    weight 110
-  ]
-  edge [
-    source 147
-    target 3276
-    weight 103
-  ]
-  edge [
-    source 147
-    target 2700
-    weight 68
-  ]
-  edge [
-    source 147
-    target 3993
-    weight 82
-  ]
-  edge [
-    source 147
-    target 1505
-    weight 57
-  ]
-  edge [
-    source 147
-    target 1053
-    weight 88
-  ]
-  edge [
-    source 147
-    target 774
-    weight 145
-  ]
-  edge [
-    source 147
-    target 2857
-    weight 36
-  ]
-  edge [
-    source 147
-    target 1582
-    weight 70
-  ]
-  edge [
-    source 147
-    target 2191
-    weight 27
-  ]
-  edge [
-    source 147
-    target 4051
-    weight 122
-  ]
-  edge [
-    source 147
-    target 1080
-    weight 51
-  ]
-  edge [
-    source 147
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 147
-    target 3917
-    weight 55
-  ]
-  edge [
-    source 147
-    target 2071
-    weight 128
-  ]
-  edge [
-    source 147
-    target 3145
-    weight 85
-  ]
-  edge [
-    source 147
-    target 1887
-    weight 134
-  ]
-  edge [
-    source 147
-    target 1995
-    weight 52
-  ]
-  edge [
-    source 147
-    target 3174
-    weight 72
-  ]
-  edge [
-    source 147
-    target 3962
-    weight 25
-  ]
-  edge [
-    source 147
-    target 3443
-    weight 32
-  ]
-  edge [
-    source 147
-    target 738
-    weight 23
-  ]
-  edge [
-    source 147
-    target 3141
-    weight 140
-  ]
-  edge [
-    source 147
-    target 3282
-    weight 45
-  ]
-  edge [
-    source 147
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 147
-    target 1632
-    weight 37
-  ]
-  edge [
-    source 147
-    target 2287
-    weight 29
-  ]
-  edge [
-    source 147
-    target 3642
-    weight 42
-  ]
-  edge [
-    source 147
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 147
-    target 301
-    weight 58
-  ]
-  edge [
-    source 147
-    target 179
-    weight 36
-  ]
-  edge [
-    source 147
-    target 798
-    weight 41
-  ]
-  edge [
-    source 147
-    target 2519
-    weight 28
-  ]
-  edge [
-    source 147
-    target 1254
-    weight 33
-  ]
-  edge [
-    source 147
-    target 2870
-    weight 30
-  ]
-  edge [
-    source 147
-    target 256
-    weight 21
-  ]
-  edge [
-    source 147
-    target 2890
-    weight 29
-  ]
-  edge [
-    source 147
-    target 3542
-    weight 28
-  ]
-  edge [
-    source 147
-    target 2058
-    weight 30
-  ]
-  edge [
-    source 147
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 152
-    target 3521
-    weight 525
-  ]
-  edge [
-    source 152
-    target 751
-    weight 280
-  ]
-  edge [
-    source 152
-    target 3565
-    weight 70
-  ]
-  edge [
-    source 152
-    target 2861
-    weight 245
-  ]
-  edge [
-    source 152
-    target 1616
-    weight 284
-  ]
-  edge [
-    source 152
-    target 1487
-    weight 248
-  ]
-  edge [
-    source 152
-    target 3600
-    weight 183
-  ]
-  edge [
-    source 152
-    target 1647
-    weight 149
-  ]
-  edge [
-    source 152
-    target 774
-    weight 278
-  ]
-  edge [
-    source 152
-    target 1582
-    weight 132
-  ]
-  edge [
-    source 152
-    target 798
-    weight 69
-  ]
-  edge [
-    source 152
-    target 2857
-    weight 57
-  ]
-  edge [
-    source 152
-    target 2700
-    weight 127
-  ]
-  edge [
-    source 152
-    target 3993
-    weight 110
-  ]
-  edge [
-    source 152
-    target 3077
-    weight 29
-  ]
-  edge [
-    source 152
-    target 1080
-    weight 125
-  ]
-  edge [
-    source 152
-    target 3141
-    weight 278
-  ]
-  edge [
-    source 152
-    target 986
-    weight 28
-  ]
-  edge [
-    source 152
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 152
-    target 1053
-    weight 167
-  ]
-  edge [
-    source 152
-    target 2058
-    weight 49
-  ]
-  edge [
-    source 152
-    target 3276
-    weight 143
-  ]
-  edge [
-    source 152
-    target 4051
-    weight 268
-  ]
-  edge [
-    source 152
-    target 3145
-    weight 150
-  ]
-  edge [
-    source 152
-    target 2071
-    weight 285
-  ]
-  edge [
-    source 152
-    target 1887
-    weight 237
-  ]
-  edge [
-    source 152
-    target 968
-    weight 32
-  ]
-  edge [
-    source 152
-    target 2543
-    weight 28
-  ]
-  edge [
-    source 152
-    target 1995
-    weight 113
-  ]
-  edge [
-    source 152
-    target 3423
-    weight 69
-  ]
-  edge [
-    source 152
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 152
-    target 738
-    weight 62
-  ]
-  edge [
-    source 152
-    target 1505
-    weight 55
-  ]
-  edge [
-    source 152
-    target 1409
-    weight 41
-  ]
-  edge [
-    source 152
-    target 3917
-    weight 94
-  ]
-  edge [
-    source 152
-    target 4162
-    weight 21
-  ]
-  edge [
-    source 152
-    target 256
-    weight 30
-  ]
-  edge [
-    source 152
-    target 3443
-    weight 55
-  ]
-  edge [
-    source 152
-    target 3295
-    weight 23
-  ]
-  edge [
-    source 152
-    target 1632
-    weight 75
-  ]
-  edge [
-    source 152
-    target 301
-    weight 90
-  ]
-  edge [
-    source 152
-    target 2191
-    weight 61
-  ]
-  edge [
-    source 152
-    target 2890
-    weight 63
-  ]
-  edge [
-    source 152
-    target 1757
-    weight 31
-  ]
-  edge [
-    source 152
-    target 3542
-    weight 57
-  ]
-  edge [
-    source 152
-    target 1254
-    weight 43
-  ]
-  edge [
-    source 152
-    target 1507
-    weight 21
-  ]
-  edge [
-    source 152
-    target 874
-    weight 45
-  ]
-  edge [
-    source 152
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 152
-    target 2519
-    weight 71
-  ]
-  edge [
-    source 152
-    target 3006
-    weight 33
-  ]
-  edge [
-    source 152
-    target 3174
-    weight 108
-  ]
-  edge [
-    source 152
-    target 604
-    weight 27
-  ]
-  edge [
-    source 152
-    target 3282
-    weight 71
-  ]
-  edge [
-    source 152
-    target 3052
-    weight 21
-  ]
-  edge [
-    source 152
-    target 3420
-    weight 34
-  ]
-  edge [
-    source 152
-    target 3066
-    weight 37
-  ]
-  edge [
-    source 152
-    target 4154
-    weight 42
-  ]
-  edge [
-    source 152
-    target 3374
-    weight 50
-  ]
-  edge [
-    source 152
-    target 3962
-    weight 47
-  ]
-  edge [
-    source 152
-    target 179
-    weight 58
-  ]
-  edge [
-    source 152
-    target 2287
-    weight 41
-  ]
-  edge [
-    source 152
-    target 3954
-    weight 36
-  ]
-  edge [
-    source 152
-    target 2870
-    weight 44
-  ]
-  edge [
-    source 152
-    target 2204
-    weight 33
-  ]
-  edge [
-    source 152
-    target 2800
-    weight 22
-  ]
-  edge [
-    source 152
-    target 3040
-    weight 41
-  ]
-  edge [
-    source 152
-    target 602
-    weight 24
-  ]
-  edge [
-    source 152
-    target 3636
-    weight 32
-  ]
-  edge [
-    source 152
-    target 1185
-    weight 26
-  ]
-  edge [
-    source 152
-    target 2553
-    weight 25
-  ]
-  edge [
-    source 152
-    target 3877
-    weight 25
-  ]
-  edge [
-    source 179
-    target 3521
-    weight 1431
-  ]
-  edge [
-    source 179
-    target 3600
-    weight 799
-  ]
-  edge [
-    source 179
-    target 751
-    weight 1314
-  ]
-  edge [
-    source 179
-    target 3641
-    weight 35
-  ]
-  edge [
-    source 179
-    target 1487
-    weight 1063
-  ]
-  edge [
-    source 179
-    target 2861
-    weight 963
-  ]
-  edge [
-    source 179
-    target 1616
-    weight 1269
-  ]
-  edge [
-    source 179
-    target 1647
-    weight 658
-  ]
-  edge [
-    source 179
-    target 2071
-    weight 1171
-  ]
-  edge [
-    source 179
-    target 1080
-    weight 643
-  ]
-  edge [
-    source 179
-    target 3174
-    weight 679
-  ]
-  edge [
-    source 179
-    target 2191
-    weight 281
-  ]
-  edge [
-    source 179
-    target 3565
-    weight 245
-  ]
-  edge [
-    source 179
-    target 3276
-    weight 705
-  ]
-  edge [
-    source 179
-    target 3077
-    weight 107
-  ]
-  edge [
-    source 179
-    target 561
-    weight 34
-  ]
-  edge [
-    source 179
-    target 301
-    weight 517
-  ]
-  edge [
-    source 179
-    target 3374
-    weight 367
-  ]
-  edge [
-    source 179
-    target 1995
-    weight 623
-  ]
-  edge [
-    source 179
-    target 1053
-    weight 909
-  ]
-  edge [
-    source 179
-    target 774
-    weight 1223
-  ]
-  edge [
-    source 179
-    target 3145
-    weight 825
-  ]
-  edge [
-    source 179
-    target 1254
-    weight 448
-  ]
-  edge [
-    source 179
-    target 1409
-    weight 163
-  ]
-  edge [
-    source 179
-    target 3141
-    weight 1173
-  ]
-  edge [
-    source 179
-    target 3968
-    weight 31
-  ]
-  edge [
-    source 179
-    target 3177
-    weight 67
-  ]
-  edge [
-    source 179
-    target 2329
-    weight 31
-  ]
-  edge [
-    source 179
-    target 2857
-    weight 383
-  ]
-  edge [
-    source 179
-    target 1505
-    weight 414
-  ]
-  edge [
-    source 179
-    target 3993
-    weight 670
-  ]
-  edge [
-    source 179
-    target 4051
-    weight 1141
-  ]
-  edge [
-    source 179
-    target 3066
-    weight 216
-  ]
-  edge [
-    source 179
-    target 1789
-    weight 26
-  ]
-  edge [
-    source 179
-    target 1943
-    weight 67
-  ]
-  edge [
-    source 179
-    target 1887
-    weight 1058
-  ]
-  edge [
-    source 179
-    target 4187
-    weight 74
-  ]
-  edge [
-    source 179
-    target 3642
-    weight 403
-  ]
-  edge [
-    source 179
-    target 3542
-    weight 312
-  ]
-  edge [
-    source 179
-    target 3420
-    weight 149
-  ]
-  edge [
-    source 179
-    target 2700
-    weight 590
-  ]
-  edge [
-    source 179
-    target 1582
-    weight 525
-  ]
-  edge [
-    source 179
-    target 3917
-    weight 473
-  ]
-  edge [
-    source 179
-    target 3253
-    weight 155
-  ]
-  edge [
-    source 179
-    target 422
-    weight 121
-  ]
-  edge [
-    source 179
-    target 3282
-    weight 334
-  ]
-  edge [
-    source 179
-    target 3443
-    weight 229
-  ]
-  edge [
-    source 179
-    target 1420
-    weight 69
-  ]
-  edge [
-    source 179
-    target 2227
-    weight 43
-  ]
-  edge [
-    source 179
-    target 2058
-    weight 246
-  ]
-  edge [
-    source 179
-    target 2204
-    weight 186
-  ]
-  edge [
-    source 179
-    target 874
-    weight 201
-  ]
-  edge [
-    source 179
-    target 927
-    weight 53
-  ]
-  edge [
-    source 179
-    target 798
-    weight 376
-  ]
-  edge [
-    source 179
-    target 1632
-    weight 402
-  ]
-  edge [
-    source 179
-    target 3377
-    weight 57
-  ]
-  edge [
-    source 179
-    target 2800
-    weight 117
-  ]
-  edge [
-    source 179
-    target 424
-    weight 39
-  ]
-  edge [
-    source 179
-    target 2543
-    weight 182
-  ]
-  edge [
-    source 179
-    target 3636
-    weight 199
-  ]
-  edge [
-    source 179
-    target 4027
-    weight 47
-  ]
-  edge [
-    source 179
-    target 2870
-    weight 232
-  ]
-  edge [
-    source 179
-    target 2614
-    weight 65
-  ]
-  edge [
-    source 179
-    target 738
-    weight 385
-  ]
-  edge [
-    source 179
-    target 2287
-    weight 250
-  ]
-  edge [
-    source 179
-    target 604
-    weight 131
-  ]
-  edge [
-    source 179
-    target 1127
-    weight 75
-  ]
-  edge [
-    source 179
-    target 456
-    weight 37
-  ]
-  edge [
-    source 179
-    target 1507
-    weight 108
-  ]
-  edge [
-    source 179
-    target 3040
-    weight 270
-  ]
-  edge [
-    source 179
-    target 1154
-    weight 71
-  ]
-  edge [
-    source 179
-    target 964
-    weight 21
-  ]
-  edge [
-    source 179
-    target 1185
-    weight 157
-  ]
-  edge [
-    source 179
-    target 3937
-    weight 85
-  ]
-  edge [
-    source 179
-    target 968
-    weight 163
-  ]
-  edge [
-    source 179
-    target 502
-    weight 85
-  ]
-  edge [
-    source 179
-    target 3006
-    weight 194
-  ]
-  edge [
-    source 179
-    target 3357
-    weight 21
-  ]
-  edge [
-    source 179
-    target 1333
-    weight 55
-  ]
-  edge [
-    source 179
-    target 3962
-    weight 194
-  ]
-  edge [
-    source 179
-    target 1952
-    weight 45
-  ]
-  edge [
-    source 179
-    target 689
-    weight 27
-  ]
-  edge [
-    source 179
-    target 916
-    weight 21
-  ]
-  edge [
-    source 179
-    target 1757
-    weight 183
-  ]
-  edge [
-    source 179
-    target 3196
-    weight 43
-  ]
-  edge [
-    source 179
-    target 2890
-    weight 216
-  ]
-  edge [
-    source 179
-    target 3954
-    weight 255
-  ]
-  edge [
-    source 179
-    target 3408
-    weight 85
-  ]
-  edge [
-    source 179
-    target 4152
-    weight 27
-  ]
-  edge [
-    source 179
-    target 2553
-    weight 105
-  ]
-  edge [
-    source 179
-    target 256
-    weight 143
-  ]
-  edge [
-    source 179
-    target 505
-    weight 41
-  ]
-  edge [
-    source 179
-    target 3423
-    weight 352
-  ]
-  edge [
-    source 179
-    target 4154
-    weight 236
-  ]
-  edge [
-    source 179
-    target 1707
-    weight 59
-  ]
-  edge [
-    source 179
-    target 2810
-    weight 74
-  ]
-  edge [
-    source 179
-    target 3052
-    weight 177
-  ]
-  edge [
-    source 179
-    target 2711
-    weight 41
-  ]
-  edge [
-    source 179
-    target 1195
-    weight 44
-  ]
-  edge [
-    source 179
-    target 980
-    weight 68
-  ]
-  edge [
-    source 179
-    target 2570
-    weight 24
-  ]
-  edge [
-    source 179
-    target 1280
-    weight 70
-  ]
-  edge [
-    source 179
-    target 314
-    weight 65
-  ]
-  edge [
-    source 179
-    target 3295
-    weight 136
-  ]
-  edge [
-    source 179
-    target 1517
-    weight 47
-  ]
-  edge [
-    source 179
-    target 3432
-    weight 39
-  ]
-  edge [
-    source 179
-    target 1798
-    weight 41
-  ]
-  edge [
-    source 179
-    target 608
-    weight 31
-  ]
-  edge [
-    source 179
-    target 4160
-    weight 28
-  ]
-  edge [
-    source 179
-    target 3024
-    weight 24
-  ]
-  edge [
-    source 179
-    target 1523
-    weight 87
-  ]
-  edge [
-    source 179
-    target 2609
-    weight 22
-  ]
-  edge [
-    source 179
-    target 321
-    weight 55
-  ]
-  edge [
-    source 179
-    target 1391
-    weight 36
-  ]
-  edge [
-    source 179
-    target 2519
-    weight 296
-  ]
-  edge [
-    source 179
-    target 1360
-    weight 110
-  ]
-  edge [
-    source 179
-    target 4040
-    weight 68
-  ]
-  edge [
-    source 179
-    target 448
-    weight 21
-  ]
-  edge [
-    source 179
-    target 2531
-    weight 24
-  ]
-  edge [
-    source 179
-    target 3884
-    weight 54
-  ]
-  edge [
-    source 179
-    target 986
-    weight 115
-  ]
-  edge [
-    source 179
-    target 1461
-    weight 31
-  ]
-  edge [
-    source 179
-    target 549
-    weight 22
-  ]
-  edge [
-    source 179
-    target 671
-    weight 37
-  ]
-  edge [
-    source 179
-    target 2099
-    weight 50
-  ]
-  edge [
-    source 179
-    target 490
-    weight 96
-  ]
-  edge [
-    source 179
-    target 1148
-    weight 23
-  ]
-  edge [
-    source 179
-    target 3677
-    weight 21
-  ]
-  edge [
-    source 179
-    target 4162
-    weight 92
-  ]
-  edge [
-    source 179
-    target 1125
-    weight 41
-  ]
-  edge [
-    source 179
-    target 1322
-    weight 52
-  ]
-  edge [
-    source 179
-    target 724
-    weight 74
-  ]
-  edge [
-    source 179
-    target 3847
-    weight 43
-  ]
-  edge [
-    source 179
-    target 2003
-    weight 21
-  ]
-  edge [
-    source 179
-    target 3877
-    weight 76
-  ]
-  edge [
-    source 179
-    target 1938
-    weight 85
-  ]
-  edge [
-    source 179
-    target 3860
-    weight 32
-  ]
-  edge [
-    source 179
-    target 4098
-    weight 23
-  ]
-  edge [
-    source 179
-    target 675
-    weight 24
-  ]
-  edge [
-    source 179
-    target 3071
-    weight 34
-  ]
-  edge [
-    source 179
-    target 305
-    weight 23
-  ]
-  edge [
-    source 179
-    target 1931
-    weight 22
-  ]
-  edge [
-    source 179
-    target 602
-    weight 88
-  ]
-  edge [
-    source 179
-    target 1970
-    weight 41
-  ]
-  edge [
-    source 179
-    target 733
-    weight 30
-  ]
-  edge [
-    source 179
-    target 3861
-    weight 21
-  ]
-  edge [
-    source 179
-    target 842
-    weight 39
-  ]
-  edge [
-    source 179
-    target 2822
-    weight 27
-  ]
-  edge [
-    source 179
-    target 1802
-    weight 40
-  ]
-  edge [
-    source 179
-    target 877
-    weight 22
-  ]
-  edge [
-    source 179
-    target 3162
-    weight 22
-  ]
-  edge [
-    source 179
-    target 2011
-    weight 34
-  ]
-  edge [
-    source 179
-    target 1028
-    weight 22
-  ]
-  edge [
-    source 179
-    target 2078
-    weight 51
-  ]
-  edge [
-    source 179
-    target 869
-    weight 33
-  ]
-  edge [
-    source 179
-    target 3876
-    weight 25
-  ]
-  edge [
-    source 192
-    target 648
-    weight 28
-  ]
-  edge [
-    source 215
-    target 2861
-    weight 23
-  ]
-  edge [
-    source 215
-    target 751
-    weight 29
-  ]
-  edge [
-    source 215
-    target 1616
-    weight 37
-  ]
-  edge [
-    source 215
-    target 4051
-    weight 32
-  ]
-  edge [
-    source 215
-    target 1487
-    weight 21
-  ]
-  edge [
-    source 215
-    target 3521
-    weight 37
-  ]
-  edge [
-    source 215
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 215
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 215
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 215
-    target 1053
-    weight 25
-  ]
-  edge [
-    source 215
-    target 774
-    weight 32
-  ]
-  edge [
-    source 215
-    target 3141
-    weight 35
-  ]
-  edge [
-    source 256
-    target 751
-    weight 538
-  ]
-  edge [
-    source 256
-    target 1582
-    weight 255
-  ]
-  edge [
-    source 256
-    target 1487
-    weight 384
-  ]
-  edge [
-    source 256
-    target 3521
-    weight 627
-  ]
-  edge [
-    source 256
-    target 3077
-    weight 26
-  ]
-  edge [
-    source 256
-    target 1505
-    weight 170
-  ]
-  edge [
-    source 256
-    target 1616
-    weight 538
-  ]
-  edge [
-    source 256
-    target 3145
-    weight 402
-  ]
-  edge [
-    source 256
-    target 3600
-    weight 357
-  ]
-  edge [
-    source 256
-    target 1887
-    weight 561
-  ]
-  edge [
-    source 256
-    target 1647
-    weight 280
-  ]
-  edge [
-    source 256
-    target 4051
-    weight 492
-  ]
-  edge [
-    source 256
-    target 1757
-    weight 118
-  ]
-  edge [
-    source 256
-    target 1080
-    weight 223
-  ]
-  edge [
-    source 256
-    target 774
-    weight 593
-  ]
-  edge [
-    source 256
-    target 3423
-    weight 136
-  ]
-  edge [
-    source 256
-    target 561
-    weight 22
-  ]
-  edge [
-    source 256
-    target 1053
-    weight 461
-  ]
-  edge [
-    source 256
-    target 2700
-    weight 329
-  ]
-  edge [
-    source 256
-    target 2861
-    weight 374
-  ]
-  edge [
-    source 256
-    target 3443
-    weight 229
-  ]
-  edge [
-    source 256
-    target 3565
-    weight 134
-  ]
-  edge [
-    source 256
-    target 842
-    weight 24
-  ]
-  edge [
-    source 256
-    target 3141
-    weight 577
-  ]
-  edge [
-    source 256
-    target 2890
-    weight 183
-  ]
-  edge [
-    source 256
-    target 1995
-    weight 293
-  ]
-  edge [
-    source 256
-    target 2071
-    weight 488
-  ]
-  edge [
-    source 256
-    target 738
-    weight 194
-  ]
-  edge [
-    source 256
-    target 968
-    weight 72
-  ]
-  edge [
-    source 256
-    target 3071
-    weight 23
-  ]
-  edge [
-    source 256
-    target 3917
-    weight 235
-  ]
-  edge [
-    source 256
-    target 2191
-    weight 93
-  ]
-  edge [
-    source 256
-    target 1409
-    weight 89
-  ]
-  edge [
-    source 256
-    target 2543
-    weight 92
-  ]
-  edge [
-    source 256
-    target 1360
-    weight 55
-  ]
-  edge [
-    source 256
-    target 3253
-    weight 110
-  ]
-  edge [
-    source 256
-    target 3174
-    weight 288
-  ]
-  edge [
-    source 256
-    target 1707
-    weight 33
-  ]
-  edge [
-    source 256
-    target 3937
-    weight 43
-  ]
-  edge [
-    source 256
-    target 3276
-    weight 335
-  ]
-  edge [
-    source 256
-    target 301
-    weight 266
-  ]
-  edge [
-    source 256
-    target 1632
-    weight 220
-  ]
-  edge [
-    source 256
-    target 3954
-    weight 113
-  ]
-  edge [
-    source 256
-    target 1127
-    weight 51
-  ]
-  edge [
-    source 256
-    target 456
-    weight 29
-  ]
-  edge [
-    source 256
-    target 3993
-    weight 310
-  ]
-  edge [
-    source 256
-    target 3642
-    weight 199
-  ]
-  edge [
-    source 256
-    target 321
-    weight 39
-  ]
-  edge [
-    source 256
-    target 3040
-    weight 105
-  ]
-  edge [
-    source 256
-    target 3884
-    weight 43
-  ]
-  edge [
-    source 256
-    target 2329
-    weight 45
-  ]
-  edge [
-    source 256
-    target 3847
-    weight 49
-  ]
-  edge [
-    source 256
-    target 2556
-    weight 23
-  ]
-  edge [
-    source 256
-    target 3636
-    weight 146
-  ]
-  edge [
-    source 256
-    target 2287
-    weight 117
-  ]
-  edge [
-    source 256
-    target 3432
-    weight 27
-  ]
-  edge [
-    source 256
-    target 3282
-    weight 233
-  ]
-  edge [
-    source 256
-    target 2800
-    weight 71
-  ]
-  edge [
-    source 256
-    target 927
-    weight 28
-  ]
-  edge [
-    source 256
-    target 4154
-    weight 123
-  ]
-  edge [
-    source 256
-    target 3374
-    weight 113
-  ]
-  edge [
-    source 256
-    target 3295
-    weight 74
-  ]
-  edge [
-    source 256
-    target 3420
-    weight 104
-  ]
-  edge [
-    source 256
-    target 798
-    weight 257
-  ]
-  edge [
-    source 256
-    target 2204
-    weight 119
-  ]
-  edge [
-    source 256
-    target 724
-    weight 45
-  ]
-  edge [
-    source 256
-    target 2870
-    weight 150
-  ]
-  edge [
-    source 256
-    target 1154
-    weight 43
-  ]
-  edge [
-    source 256
-    target 3542
-    weight 155
-  ]
-  edge [
-    source 256
-    target 2553
-    weight 87
-  ]
-  edge [
-    source 256
-    target 1185
-    weight 70
-  ]
-  edge [
-    source 256
-    target 4187
-    weight 25
-  ]
-  edge [
-    source 256
-    target 314
-    weight 30
-  ]
-  edge [
-    source 256
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 256
-    target 305
-    weight 31
-  ]
-  edge [
-    source 256
-    target 1938
-    weight 57
-  ]
-  edge [
-    source 256
-    target 1195
-    weight 31
-  ]
-  edge [
-    source 256
-    target 3066
-    weight 106
-  ]
-  edge [
-    source 256
-    target 2857
-    weight 199
-  ]
-  edge [
-    source 256
-    target 733
-    weight 23
-  ]
-  edge [
-    source 256
-    target 986
-    weight 45
-  ]
-  edge [
-    source 256
-    target 3006
-    weight 82
-  ]
-  edge [
-    source 256
-    target 3377
-    weight 33
-  ]
-  edge [
-    source 256
-    target 283
-    weight 21
-  ]
-  edge [
-    source 256
-    target 422
-    weight 64
-  ]
-  edge [
-    source 256
-    target 4162
-    weight 57
-  ]
-  edge [
-    source 256
-    target 2614
-    weight 36
-  ]
-  edge [
-    source 256
-    target 1254
-    weight 122
-  ]
-  edge [
-    source 256
-    target 874
-    weight 96
-  ]
-  edge [
-    source 256
-    target 490
-    weight 43
-  ]
-  edge [
-    source 256
-    target 2810
-    weight 43
-  ]
-  edge [
-    source 256
-    target 3962
-    weight 97
-  ]
-  edge [
-    source 256
-    target 1322
-    weight 55
-  ]
-  edge [
-    source 256
-    target 980
-    weight 33
-  ]
-  edge [
-    source 256
-    target 424
-    weight 21
-  ]
-  edge [
-    source 256
-    target 3177
-    weight 35
-  ]
-  edge [
-    source 256
-    target 2058
-    weight 130
-  ]
-  edge [
-    source 256
-    target 4040
-    weight 37
-  ]
-  edge [
-    source 256
-    target 1943
-    weight 23
-  ]
-  edge [
-    source 256
-    target 1523
-    weight 48
-  ]
-  edge [
-    source 256
-    target 3052
-    weight 57
-  ]
-  edge [
-    source 256
-    target 2519
-    weight 178
-  ]
-  edge [
-    source 256
-    target 2011
-    weight 21
-  ]
-  edge [
-    source 256
-    target 502
-    weight 26
-  ]
-  edge [
-    source 256
-    target 1507
-    weight 39
-  ]
-  edge [
-    source 256
-    target 1280
-    weight 29
-  ]
-  edge [
-    source 256
-    target 602
-    weight 44
-  ]
-  edge [
-    source 256
-    target 604
-    weight 51
-  ]
-  edge [
-    source 256
-    target 1420
-    weight 58
-  ]
-  edge [
-    source 256
-    target 608
-    weight 30
-  ]
-  edge [
-    source 256
-    target 3877
-    weight 31
-  ]
-  edge [
-    source 256
-    target 1970
-    weight 21
-  ]
-  edge [
-    source 256
-    target 2099
-    weight 21
-  ]
-  edge [
-    source 256
-    target 1802
-    weight 22
-  ]
-  edge [
-    source 267
-    target 3600
-    weight 35
-  ]
-  edge [
-    source 267
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 267
-    target 1409
-    weight 28
-  ]
-  edge [
-    source 267
-    target 2861
-    weight 30
-  ]
-  edge [
-    source 267
-    target 1616
-    weight 39
-  ]
-  edge [
-    source 267
-    target 1487
-    weight 42
-  ]
-  edge [
-    source 267
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 267
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 267
-    target 774
-    weight 44
-  ]
-  edge [
-    source 267
-    target 2700
-    weight 21
-  ]
-  edge [
-    source 267
-    target 301
-    weight 21
-  ]
-  edge [
-    source 267
-    target 3145
-    weight 27
-  ]
-  edge [
-    source 267
-    target 751
-    weight 40
-  ]
-  edge [
-    source 267
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 267
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 267
-    target 3174
-    weight 22
-  ]
-  edge [
-    source 267
-    target 2071
-    weight 45
-  ]
-  edge [
-    source 267
-    target 1582
-    weight 23
-  ]
-  edge [
-    source 267
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 267
-    target 1053
-    weight 26
-  ]
-  edge [
-    source 267
-    target 3993
-    weight 30
-  ]
-  edge [
-    source 281
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 281
-    target 774
-    weight 21
-  ]
-  edge [
-    source 283
-    target 3521
-    weight 667
-  ]
-  edge [
-    source 283
-    target 3565
-    weight 58
-  ]
-  edge [
-    source 283
-    target 1616
-    weight 100
-  ]
-  edge [
-    source 283
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 283
-    target 798
-    weight 24
-  ]
-  edge [
-    source 283
-    target 3276
-    weight 37
-  ]
-  edge [
-    source 283
-    target 3642
-    weight 39
-  ]
-  edge [
-    source 283
-    target 2071
-    weight 135
-  ]
-  edge [
-    source 283
-    target 1053
-    weight 71
-  ]
-  edge [
-    source 283
-    target 3847
-    weight 41
-  ]
-  edge [
-    source 283
-    target 774
-    weight 116
-  ]
-  edge [
-    source 283
-    target 2861
-    weight 149
-  ]
-  edge [
-    source 283
-    target 1582
-    weight 55
-  ]
-  edge [
-    source 283
-    target 738
-    weight 36
-  ]
-  edge [
-    source 283
-    target 1887
-    weight 101
-  ]
-  edge [
-    source 283
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 283
-    target 3600
-    weight 45
-  ]
-  edge [
-    source 283
-    target 751
-    weight 82
-  ]
-  edge [
-    source 283
-    target 1995
-    weight 42
-  ]
-  edge [
-    source 283
-    target 1647
-    weight 34
-  ]
-  edge [
-    source 283
-    target 3141
-    weight 116
-  ]
-  edge [
-    source 283
-    target 1080
-    weight 40
-  ]
-  edge [
-    source 283
-    target 4051
-    weight 133
-  ]
-  edge [
-    source 283
-    target 301
-    weight 50
-  ]
-  edge [
-    source 283
-    target 1632
-    weight 38
-  ]
-  edge [
-    source 283
-    target 1487
-    weight 47
-  ]
-  edge [
-    source 283
-    target 2700
-    weight 46
-  ]
-  edge [
-    source 283
-    target 3542
-    weight 28
-  ]
-  edge [
-    source 283
-    target 2870
-    weight 36
-  ]
-  edge [
-    source 283
-    target 3282
-    weight 23
-  ]
-  edge [
-    source 283
-    target 3993
-    weight 30
-  ]
-  edge [
-    source 283
-    target 3145
-    weight 32
-  ]
-  edge [
-    source 283
-    target 3174
-    weight 32
-  ]
-  edge [
-    source 301
-    target 2861
-    weight 1794
-  ]
-  edge [
-    source 301
-    target 751
-    weight 2494
-  ]
-  edge [
-    source 301
-    target 1616
-    weight 2806
-  ]
-  edge [
-    source 301
-    target 1080
-    weight 1081
-  ]
-  edge [
-    source 301
-    target 1487
-    weight 1890
-  ]
-  edge [
-    source 301
-    target 3521
-    weight 3388
-  ]
-  edge [
-    source 301
-    target 3565
-    weight 739
-  ]
-  edge [
-    source 301
-    target 3276
-    weight 1396
-  ]
-  edge [
-    source 301
-    target 3077
-    weight 133
-  ]
-  edge [
-    source 301
-    target 2191
-    weight 320
-  ]
-  edge [
-    source 301
-    target 561
-    weight 43
-  ]
-  edge [
-    source 301
-    target 3600
-    weight 1774
-  ]
-  edge [
-    source 301
-    target 3374
-    weight 397
-  ]
-  edge [
-    source 301
-    target 774
-    weight 2833
-  ]
-  edge [
-    source 301
-    target 3985
-    weight 45
-  ]
-  edge [
-    source 301
-    target 1254
-    weight 496
-  ]
-  edge [
-    source 301
-    target 2870
-    weight 571
-  ]
-  edge [
-    source 301
-    target 2614
-    weight 84
-  ]
-  edge [
-    source 301
-    target 874
-    weight 311
-  ]
-  edge [
-    source 301
-    target 2329
-    weight 69
-  ]
-  edge [
-    source 301
-    target 3420
-    weight 304
-  ]
-  edge [
-    source 301
-    target 1647
-    weight 1161
-  ]
-  edge [
-    source 301
-    target 3282
-    weight 672
-  ]
-  edge [
-    source 301
-    target 3542
-    weight 537
-  ]
-  edge [
-    source 301
-    target 602
-    weight 147
-  ]
-  edge [
-    source 301
-    target 3071
-    weight 44
-  ]
-  edge [
-    source 301
-    target 964
-    weight 34
-  ]
-  edge [
-    source 301
-    target 1127
-    weight 138
-  ]
-  edge [
-    source 301
-    target 1409
-    weight 325
-  ]
-  edge [
-    source 301
-    target 3917
-    weight 804
-  ]
-  edge [
-    source 301
-    target 3641
-    weight 49
-  ]
-  edge [
-    source 301
-    target 3642
-    weight 858
-  ]
-  edge [
-    source 301
-    target 2700
-    weight 1484
-  ]
-  edge [
-    source 301
-    target 3145
-    weight 1632
-  ]
-  edge [
-    source 301
-    target 1053
-    weight 2044
-  ]
-  edge [
-    source 301
-    target 1995
-    weight 1205
-  ]
-  edge [
-    source 301
-    target 4051
-    weight 2318
-  ]
-  edge [
-    source 301
-    target 3177
-    weight 96
-  ]
-  edge [
-    source 301
-    target 2071
-    weight 2405
-  ]
-  edge [
-    source 301
-    target 3636
-    weight 411
-  ]
-  edge [
-    source 301
-    target 1420
-    weight 120
-  ]
-  edge [
-    source 301
-    target 1887
-    weight 2572
-  ]
-  edge [
-    source 301
-    target 3066
-    weight 343
-  ]
-  edge [
-    source 301
-    target 1582
-    weight 1141
-  ]
-  edge [
-    source 301
-    target 3993
-    weight 1197
-  ]
-  edge [
-    source 301
-    target 798
-    weight 608
-  ]
-  edge [
-    source 301
-    target 3141
-    weight 2739
-  ]
-  edge [
-    source 301
-    target 3295
-    weight 200
-  ]
-  edge [
-    source 301
-    target 3443
-    weight 413
-  ]
-  edge [
-    source 301
-    target 630
-    weight 31
-  ]
-  edge [
-    source 301
-    target 3174
-    weight 1271
-  ]
-  edge [
-    source 301
-    target 4154
-    weight 560
-  ]
-  edge [
-    source 301
-    target 733
-    weight 68
-  ]
-  edge [
-    source 301
-    target 724
-    weight 143
-  ]
-  edge [
-    source 301
-    target 502
-    weight 84
-  ]
-  edge [
-    source 301
-    target 1333
-    weight 61
-  ]
-  edge [
-    source 301
-    target 2857
-    weight 596
-  ]
-  edge [
-    source 301
-    target 1938
-    weight 199
-  ]
-  edge [
-    source 301
-    target 1154
-    weight 149
-  ]
-  edge [
-    source 301
-    target 3962
-    weight 373
-  ]
-  edge [
-    source 301
-    target 3253
-    weight 271
-  ]
-  edge [
-    source 301
-    target 3847
-    weight 179
-  ]
-  edge [
-    source 301
-    target 1554
-    weight 30
-  ]
-  edge [
-    source 301
-    target 399
-    weight 24
-  ]
-  edge [
-    source 301
-    target 2204
-    weight 365
-  ]
-  edge [
-    source 301
-    target 1185
-    weight 224
-  ]
-  edge [
-    source 301
-    target 3937
-    weight 124
-  ]
-  edge [
-    source 301
-    target 3040
-    weight 381
-  ]
-  edge [
-    source 301
-    target 968
-    weight 262
-  ]
-  edge [
-    source 301
-    target 1505
-    weight 566
-  ]
-  edge [
-    source 301
-    target 1258
-    weight 40
-  ]
-  edge [
-    source 301
-    target 2287
-    weight 374
-  ]
-  edge [
-    source 301
-    target 2800
-    weight 172
-  ]
-  edge [
-    source 301
-    target 738
-    weight 673
-  ]
-  edge [
-    source 301
-    target 4187
-    weight 48
-  ]
-  edge [
-    source 301
-    target 2556
-    weight 36
-  ]
-  edge [
-    source 301
-    target 3006
-    weight 283
-  ]
-  edge [
-    source 301
-    target 3423
-    weight 582
-  ]
-  edge [
-    source 301
-    target 305
-    weight 79
-  ]
-  edge [
-    source 301
-    target 1632
-    weight 823
-  ]
-  edge [
-    source 301
-    target 2450
-    weight 35
-  ]
-  edge [
-    source 301
-    target 1028
-    weight 25
-  ]
-  edge [
-    source 301
-    target 3432
-    weight 48
-  ]
-  edge [
-    source 301
-    target 980
-    weight 252
-  ]
-  edge [
-    source 301
-    target 456
-    weight 66
-  ]
-  edge [
-    source 301
-    target 2890
-    weight 492
-  ]
-  edge [
-    source 301
-    target 1757
-    weight 326
-  ]
-  edge [
-    source 301
-    target 2553
-    weight 219
-  ]
-  edge [
-    source 301
-    target 3884
-    weight 73
-  ]
-  edge [
-    source 301
-    target 986
-    weight 155
-  ]
-  edge [
-    source 301
-    target 321
-    weight 98
-  ]
-  edge [
-    source 301
-    target 1419
-    weight 49
-  ]
-  edge [
-    source 301
-    target 3968
-    weight 39
-  ]
-  edge [
-    source 301
-    target 604
-    weight 190
-  ]
-  edge [
-    source 301
-    target 927
-    weight 65
-  ]
-  edge [
-    source 301
-    target 2181
-    weight 23
-  ]
-  edge [
-    source 301
-    target 4152
-    weight 51
-  ]
-  edge [
-    source 301
-    target 440
-    weight 22
-  ]
-  edge [
-    source 301
-    target 3408
-    weight 76
-  ]
-  edge [
-    source 301
-    target 1492
-    weight 27
-  ]
-  edge [
-    source 301
-    target 1676
-    weight 24
-  ]
-  edge [
-    source 301
-    target 1631
-    weight 28
-  ]
-  edge [
-    source 301
-    target 2810
-    weight 86
-  ]
-  edge [
-    source 301
-    target 1322
-    weight 113
-  ]
-  edge [
-    source 301
-    target 1360
-    weight 137
-  ]
-  edge [
-    source 301
-    target 1691
-    weight 25
-  ]
-  edge [
-    source 301
-    target 3954
-    weight 383
-  ]
-  edge [
-    source 301
-    target 2543
-    weight 260
-  ]
-  edge [
-    source 301
-    target 4027
-    weight 41
-  ]
-  edge [
-    source 301
-    target 2061
-    weight 25
-  ]
-  edge [
-    source 301
-    target 1461
-    weight 45
-  ]
-  edge [
-    source 301
-    target 2519
-    weight 571
-  ]
-  edge [
-    source 301
-    target 2009
-    weight 23
-  ]
-  edge [
-    source 301
-    target 2844
-    weight 37
-  ]
-  edge [
-    source 301
-    target 4040
-    weight 131
-  ]
-  edge [
-    source 301
-    target 1280
-    weight 107
-  ]
-  edge [
-    source 301
-    target 2711
-    weight 40
-  ]
-  edge [
-    source 301
-    target 2836
-    weight 32
-  ]
-  edge [
-    source 301
-    target 2955
-    weight 46
-  ]
-  edge [
-    source 301
-    target 424
-    weight 56
-  ]
-  edge [
-    source 301
-    target 1798
-    weight 25
-  ]
-  edge [
-    source 301
-    target 314
-    weight 116
-  ]
-  edge [
-    source 301
-    target 3935
-    weight 32
-  ]
-  edge [
-    source 301
-    target 1952
-    weight 78
-  ]
-  edge [
-    source 301
-    target 3162
-    weight 39
-  ]
-  edge [
-    source 301
-    target 3377
-    weight 98
-  ]
-  edge [
-    source 301
-    target 632
-    weight 34
-  ]
-  edge [
-    source 301
-    target 3861
-    weight 34
-  ]
-  edge [
-    source 301
-    target 422
-    weight 215
-  ]
-  edge [
-    source 301
-    target 1507
-    weight 137
-  ]
-  edge [
-    source 301
-    target 2924
-    weight 34
-  ]
-  edge [
-    source 301
-    target 3196
-    weight 47
-  ]
-  edge [
-    source 301
-    target 490
-    weight 96
-  ]
-  edge [
-    source 301
-    target 3052
-    weight 165
-  ]
-  edge [
-    source 301
-    target 2531
-    weight 32
-  ]
-  edge [
-    source 301
-    target 1577
-    weight 25
-  ]
-  edge [
-    source 301
-    target 1195
-    weight 65
-  ]
-  edge [
-    source 301
-    target 1517
-    weight 53
-  ]
-  edge [
-    source 301
-    target 717
-    weight 25
-  ]
-  edge [
-    source 301
-    target 4162
-    weight 136
-  ]
-  edge [
-    source 301
-    target 4160
-    weight 38
-  ]
-  edge [
-    source 301
-    target 2082
-    weight 30
-  ]
-  edge [
-    source 301
-    target 1943
-    weight 66
-  ]
-  edge [
-    source 301
-    target 3860
-    weight 47
-  ]
-  edge [
-    source 301
-    target 3877
-    weight 105
-  ]
-  edge [
-    source 301
-    target 3559
-    weight 25
-  ]
-  edge [
-    source 301
-    target 4098
-    weight 37
-  ]
-  edge [
-    source 301
-    target 1707
-    weight 92
-  ]
-  edge [
-    source 301
-    target 2003
-    weight 40
-  ]
-  edge [
-    source 301
-    target 2227
-    weight 58
-  ]
-  edge [
-    source 301
-    target 671
-    weight 64
-  ]
-  edge [
-    source 301
-    target 1523
-    weight 131
-  ]
-  edge [
-    source 301
-    target 712
-    weight 27
-  ]
-  edge [
-    source 301
-    target 3108
-    weight 23
-  ]
-  edge [
-    source 301
-    target 2011
-    weight 48
-  ]
-  edge [
-    source 301
-    target 3024
-    weight 34
-  ]
-  edge [
-    source 301
-    target 842
-    weight 50
-  ]
-  edge [
-    source 301
-    target 2570
-    weight 42
-  ]
-  edge [
-    source 301
-    target 608
-    weight 68
-  ]
-  edge [
-    source 301
-    target 719
-    weight 25
-  ]
-  edge [
-    source 301
-    target 505
-    weight 23
-  ]
-  edge [
-    source 301
-    target 1064
-    weight 23
-  ]
-  edge [
-    source 301
-    target 3465
-    weight 25
-  ]
-  edge [
-    source 301
-    target 2099
-    weight 42
-  ]
-  edge [
-    source 301
-    target 2743
-    weight 22
-  ]
-  edge [
-    source 301
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 301
-    target 1802
-    weight 55
-  ]
-  edge [
-    source 301
-    target 2058
-    weight 333
-  ]
-  edge [
-    source 301
-    target 689
-    weight 30
-  ]
-  edge [
-    source 301
-    target 549
-    weight 43
-  ]
-  edge [
-    source 301
-    target 1140
-    weight 23
-  ]
-  edge [
-    source 301
-    target 1125
-    weight 65
-  ]
-  edge [
-    source 301
-    target 1148
-    weight 32
-  ]
-  edge [
-    source 301
-    target 3677
-    weight 38
-  ]
-  edge [
-    source 301
-    target 2822
-    weight 34
-  ]
-  edge [
-    source 301
-    target 3872
-    weight 21
-  ]
-  edge [
-    source 301
-    target 675
-    weight 47
-  ]
-  edge [
-    source 301
-    target 347
-    weight 24
-  ]
-  edge [
-    source 301
-    target 2115
-    weight 23
-  ]
-  edge [
-    source 301
-    target 1391
-    weight 41
-  ]
-  edge [
-    source 301
-    target 1789
-    weight 24
-  ]
-  edge [
-    source 301
-    target 1970
-    weight 53
-  ]
-  edge [
-    source 301
-    target 3633
-    weight 21
-  ]
-  edge [
-    source 301
-    target 3050
-    weight 24
-  ]
-  edge [
-    source 301
-    target 869
-    weight 41
-  ]
-  edge [
-    source 301
-    target 3876
-    weight 25
-  ]
-  edge [
-    source 301
-    target 2232
-    weight 23
-  ]
-  edge [
-    source 301
-    target 2078
-    weight 72
-  ]
-  edge [
-    source 305
-    target 4051
-    weight 142
-  ]
-  edge [
-    source 305
-    target 3636
-    weight 65
-  ]
-  edge [
-    source 305
-    target 1053
-    weight 119
-  ]
-  edge [
-    source 305
-    target 3521
-    weight 214
-  ]
-  edge [
-    source 305
-    target 1995
-    weight 96
-  ]
-  edge [
-    source 305
-    target 774
-    weight 153
-  ]
-  edge [
-    source 305
-    target 3282
-    weight 57
-  ]
-  edge [
-    source 305
-    target 2071
-    weight 148
-  ]
-  edge [
-    source 305
-    target 3600
-    weight 85
-  ]
-  edge [
-    source 305
-    target 751
-    weight 142
-  ]
-  edge [
-    source 305
-    target 3423
-    weight 35
-  ]
-  edge [
-    source 305
-    target 2204
-    weight 39
-  ]
-  edge [
-    source 305
-    target 3565
-    weight 73
-  ]
-  edge [
-    source 305
-    target 1647
-    weight 61
-  ]
-  edge [
-    source 305
-    target 1409
-    weight 22
-  ]
-  edge [
-    source 305
-    target 2861
-    weight 134
-  ]
-  edge [
-    source 305
-    target 1616
-    weight 144
-  ]
-  edge [
-    source 305
-    target 3917
-    weight 44
-  ]
-  edge [
-    source 305
-    target 1487
-    weight 98
-  ]
-  edge [
-    source 305
-    target 2287
-    weight 36
-  ]
-  edge [
-    source 305
-    target 2870
-    weight 41
-  ]
-  edge [
-    source 305
-    target 738
-    weight 87
-  ]
-  edge [
-    source 305
-    target 3276
-    weight 62
-  ]
-  edge [
-    source 305
-    target 3006
-    weight 33
-  ]
-  edge [
-    source 305
-    target 3040
-    weight 30
-  ]
-  edge [
-    source 305
-    target 2543
-    weight 24
-  ]
-  edge [
-    source 305
-    target 3642
-    weight 52
-  ]
-  edge [
-    source 305
-    target 1632
-    weight 72
-  ]
-  edge [
-    source 305
-    target 1154
-    weight 24
-  ]
-  edge [
-    source 305
-    target 2191
-    weight 22
-  ]
-  edge [
-    source 305
-    target 3847
-    weight 25
-  ]
-  edge [
-    source 305
-    target 3962
-    weight 29
-  ]
-  edge [
-    source 305
-    target 3141
-    weight 157
-  ]
-  edge [
-    source 305
-    target 1887
-    weight 136
-  ]
-  edge [
-    source 305
-    target 1757
-    weight 35
-  ]
-  edge [
-    source 305
-    target 968
-    weight 21
-  ]
-  edge [
-    source 305
-    target 3253
-    weight 38
-  ]
-  edge [
-    source 305
-    target 3174
-    weight 53
-  ]
-  edge [
-    source 305
-    target 2890
-    weight 33
-  ]
-  edge [
-    source 305
-    target 1582
-    weight 61
-  ]
-  edge [
-    source 305
-    target 2700
-    weight 78
-  ]
-  edge [
-    source 305
-    target 1080
-    weight 64
-  ]
-  edge [
-    source 305
-    target 1938
-    weight 28
-  ]
-  edge [
-    source 305
-    target 2329
-    weight 24
-  ]
-  edge [
-    source 305
-    target 3954
-    weight 34
-  ]
-  edge [
-    source 305
-    target 1185
-    weight 34
-  ]
-  edge [
-    source 305
-    target 3542
-    weight 45
-  ]
-  edge [
-    source 305
-    target 3993
-    weight 57
-  ]
-  edge [
-    source 305
-    target 3145
-    weight 66
-  ]
-  edge [
-    source 305
-    target 798
-    weight 42
-  ]
-  edge [
-    source 305
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 305
-    target 3066
-    weight 34
-  ]
-  edge [
-    source 305
-    target 874
-    weight 30
-  ]
-  edge [
-    source 305
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 305
-    target 604
-    weight 27
-  ]
-  edge [
-    source 305
-    target 1505
-    weight 29
-  ]
-  edge [
-    source 305
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 305
-    target 2519
-    weight 32
-  ]
-  edge [
-    source 305
-    target 1254
-    weight 22
-  ]
-  edge [
-    source 308
-    target 774
-    weight 28
-  ]
-  edge [
-    source 308
-    target 2071
-    weight 23
-  ]
-  edge [
-    source 308
-    target 751
-    weight 24
-  ]
-  edge [
-    source 308
-    target 1887
-    weight 25
-  ]
-  edge [
-    source 308
-    target 1616
-    weight 23
-  ]
-  edge [
-    source 308
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 308
-    target 3141
-    weight 25
-  ]
-  edge [
-    source 314
-    target 3521
-    weight 309
-  ]
-  edge [
-    source 314
-    target 751
-    weight 239
-  ]
-  edge [
-    source 314
-    target 968
-    weight 28
-  ]
-  edge [
-    source 314
-    target 774
-    weight 260
-  ]
-  edge [
-    source 314
-    target 2861
-    weight 170
-  ]
-  edge [
-    source 314
-    target 2058
-    weight 50
-  ]
-  edge [
-    source 314
-    target 1995
-    weight 121
-  ]
-  edge [
-    source 314
-    target 4051
-    weight 250
-  ]
-  edge [
-    source 314
-    target 1887
-    weight 245
-  ]
-  edge [
-    source 314
-    target 3565
-    weight 57
-  ]
-  edge [
-    source 314
-    target 798
-    weight 67
-  ]
-  edge [
-    source 314
-    target 2071
-    weight 231
-  ]
-  edge [
-    source 314
-    target 1647
-    weight 114
-  ]
-  edge [
-    source 314
-    target 1053
-    weight 180
-  ]
-  edge [
-    source 314
-    target 1616
-    weight 236
-  ]
-  edge [
-    source 314
-    target 3600
-    weight 157
-  ]
-  edge [
-    source 314
-    target 3276
-    weight 110
-  ]
-  edge [
-    source 314
-    target 1487
-    weight 196
-  ]
-  edge [
-    source 314
-    target 3145
-    weight 151
-  ]
-  edge [
-    source 314
-    target 2700
-    weight 121
-  ]
-  edge [
-    source 314
-    target 3642
-    weight 63
-  ]
-  edge [
-    source 314
-    target 3282
-    weight 57
-  ]
-  edge [
-    source 314
-    target 1632
-    weight 87
-  ]
-  edge [
-    source 314
-    target 3141
-    weight 235
-  ]
-  edge [
-    source 314
-    target 2890
-    weight 50
-  ]
-  edge [
-    source 314
-    target 1582
-    weight 110
-  ]
-  edge [
-    source 314
-    target 3443
-    weight 43
-  ]
-  edge [
-    source 314
-    target 738
-    weight 65
-  ]
-  edge [
-    source 314
-    target 1080
-    weight 111
-  ]
-  edge [
-    source 314
-    target 3066
-    weight 42
-  ]
-  edge [
-    source 314
-    target 4154
-    weight 46
-  ]
-  edge [
-    source 314
-    target 3542
-    weight 65
-  ]
-  edge [
-    source 314
-    target 3374
-    weight 51
-  ]
-  edge [
-    source 314
-    target 2870
-    weight 50
-  ]
-  edge [
-    source 314
-    target 1757
-    weight 42
-  ]
-  edge [
-    source 314
-    target 2287
-    weight 60
-  ]
-  edge [
-    source 314
-    target 3295
-    weight 29
-  ]
-  edge [
-    source 314
-    target 2204
-    weight 38
-  ]
-  edge [
-    source 314
-    target 2857
-    weight 67
-  ]
-  edge [
-    source 314
-    target 3917
-    weight 81
-  ]
-  edge [
-    source 314
-    target 3962
-    weight 41
-  ]
-  edge [
-    source 314
-    target 3423
-    weight 65
-  ]
-  edge [
-    source 314
-    target 3174
-    weight 131
-  ]
-  edge [
-    source 314
-    target 422
-    weight 27
-  ]
-  edge [
-    source 314
-    target 3993
-    weight 116
-  ]
-  edge [
-    source 314
-    target 1185
-    weight 28
-  ]
-  edge [
-    source 314
-    target 1505
-    weight 72
-  ]
-  edge [
-    source 314
-    target 874
-    weight 33
-  ]
-  edge [
-    source 314
-    target 2543
-    weight 48
-  ]
-  edge [
-    source 314
-    target 2519
-    weight 65
-  ]
-  edge [
-    source 314
-    target 3954
-    weight 59
-  ]
-  edge [
-    source 314
-    target 3006
-    weight 35
-  ]
-  edge [
-    source 314
-    target 3636
-    weight 48
-  ]
-  edge [
-    source 314
-    target 3253
-    weight 41
-  ]
-  edge [
-    source 314
-    target 2553
-    weight 30
-  ]
-  edge [
-    source 314
-    target 1409
-    weight 30
-  ]
-  edge [
-    source 314
-    target 2191
-    weight 40
-  ]
-  edge [
-    source 314
-    target 3177
-    weight 21
-  ]
-  edge [
-    source 314
-    target 3040
-    weight 40
-  ]
-  edge [
-    source 314
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 314
-    target 1938
-    weight 21
-  ]
-  edge [
-    source 314
-    target 1254
-    weight 56
-  ]
-  edge [
-    source 321
-    target 2519
-    weight 56
-  ]
-  edge [
-    source 321
-    target 2071
-    weight 208
-  ]
-  edge [
-    source 321
-    target 1254
-    weight 55
-  ]
-  edge [
-    source 321
-    target 602
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3145
-    weight 114
-  ]
-  edge [
-    source 321
-    target 3600
-    weight 108
-  ]
-  edge [
-    source 321
-    target 751
-    weight 213
-  ]
-  edge [
-    source 321
-    target 1887
-    weight 192
-  ]
-  edge [
-    source 321
-    target 3565
-    weight 61
-  ]
-  edge [
-    source 321
-    target 1647
-    weight 112
-  ]
-  edge [
-    source 321
-    target 2861
-    weight 178
-  ]
-  edge [
-    source 321
-    target 1582
-    weight 73
-  ]
-  edge [
-    source 321
-    target 1616
-    weight 227
-  ]
-  edge [
-    source 321
-    target 4051
-    weight 204
-  ]
-  edge [
-    source 321
-    target 2543
-    weight 43
-  ]
-  edge [
-    source 321
-    target 3521
-    weight 246
-  ]
-  edge [
-    source 321
-    target 3276
-    weight 88
-  ]
-  edge [
-    source 321
-    target 724
-    weight 37
-  ]
-  edge [
-    source 321
-    target 1995
-    weight 192
-  ]
-  edge [
-    source 321
-    target 3954
-    weight 80
-  ]
-  edge [
-    source 321
-    target 1127
-    weight 36
-  ]
-  edge [
-    source 321
-    target 3993
-    weight 101
-  ]
-  edge [
-    source 321
-    target 3040
-    weight 105
-  ]
-  edge [
-    source 321
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 321
-    target 3642
-    weight 85
-  ]
-  edge [
-    source 321
-    target 1053
-    weight 169
-  ]
-  edge [
-    source 321
-    target 1185
-    weight 59
-  ]
-  edge [
-    source 321
-    target 1080
-    weight 141
-  ]
-  edge [
-    source 321
-    target 3636
-    weight 72
-  ]
-  edge [
-    source 321
-    target 1632
-    weight 112
-  ]
-  edge [
-    source 321
-    target 1461
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3847
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3917
-    weight 71
-  ]
-  edge [
-    source 321
-    target 1938
-    weight 21
-  ]
-  edge [
-    source 321
-    target 738
-    weight 127
-  ]
-  edge [
-    source 321
-    target 3253
-    weight 41
-  ]
-  edge [
-    source 321
-    target 774
-    weight 207
-  ]
-  edge [
-    source 321
-    target 798
-    weight 66
-  ]
-  edge [
-    source 321
-    target 2204
-    weight 50
-  ]
-  edge [
-    source 321
-    target 3006
-    weight 60
-  ]
-  edge [
-    source 321
-    target 3066
-    weight 54
-  ]
-  edge [
-    source 321
-    target 3423
-    weight 51
-  ]
-  edge [
-    source 321
-    target 1487
-    weight 142
-  ]
-  edge [
-    source 321
-    target 733
-    weight 21
-  ]
-  edge [
-    source 321
-    target 2287
-    weight 62
-  ]
-  edge [
-    source 321
-    target 2191
-    weight 40
-  ]
-  edge [
-    source 321
-    target 3282
-    weight 83
-  ]
-  edge [
-    source 321
-    target 3141
-    weight 200
-  ]
-  edge [
-    source 321
-    target 1505
-    weight 59
-  ]
-  edge [
-    source 321
-    target 1707
-    weight 25
-  ]
-  edge [
-    source 321
-    target 2810
-    weight 24
-  ]
-  edge [
-    source 321
-    target 1757
-    weight 45
-  ]
-  edge [
-    source 321
-    target 422
-    weight 31
-  ]
-  edge [
-    source 321
-    target 1154
-    weight 39
-  ]
-  edge [
-    source 321
-    target 2614
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3420
-    weight 37
-  ]
-  edge [
-    source 321
-    target 2890
-    weight 38
-  ]
-  edge [
-    source 321
-    target 2870
-    weight 53
-  ]
-  edge [
-    source 321
-    target 1322
-    weight 23
-  ]
-  edge [
-    source 321
-    target 3443
-    weight 47
-  ]
-  edge [
-    source 321
-    target 3174
-    weight 97
-  ]
-  edge [
-    source 321
-    target 3052
-    weight 40
-  ]
-  edge [
-    source 321
-    target 4154
-    weight 54
-  ]
-  edge [
-    source 321
-    target 3962
-    weight 42
-  ]
-  edge [
-    source 321
-    target 3374
-    weight 39
-  ]
-  edge [
-    source 321
-    target 1409
-    weight 43
-  ]
-  edge [
-    source 321
-    target 1360
-    weight 27
-  ]
-  edge [
-    source 321
-    target 2700
-    weight 108
-  ]
-  edge [
-    source 321
-    target 2553
-    weight 37
-  ]
-  edge [
-    source 321
-    target 968
-    weight 37
-  ]
-  edge [
-    source 321
-    target 874
-    weight 39
-  ]
-  edge [
-    source 321
-    target 3542
-    weight 64
-  ]
-  edge [
-    source 321
-    target 1523
-    weight 22
-  ]
-  edge [
-    source 321
-    target 2800
-    weight 35
-  ]
-  edge [
-    source 321
-    target 3295
-    weight 30
-  ]
-  edge [
-    source 321
-    target 1280
-    weight 26
-  ]
-  edge [
-    source 321
-    target 986
-    weight 23
-  ]
-  edge [
-    source 321
-    target 3937
-    weight 21
-  ]
-  edge [
-    source 321
-    target 1507
-    weight 34
-  ]
-  edge [
-    source 321
-    target 2857
-    weight 65
-  ]
-  edge [
-    source 321
-    target 2058
-    weight 34
-  ]
-  edge [
-    source 344
-    target 1487
-    weight 83
-  ]
-  edge [
-    source 344
-    target 2861
-    weight 35
-  ]
-  edge [
-    source 344
-    target 1616
-    weight 48
-  ]
-  edge [
-    source 344
-    target 3521
-    weight 62
-  ]
-  edge [
-    source 344
-    target 774
-    weight 52
-  ]
-  edge [
-    source 344
-    target 751
-    weight 44
-  ]
-  edge [
-    source 344
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 344
-    target 3145
-    weight 24
-  ]
-  edge [
-    source 344
-    target 3141
-    weight 51
-  ]
-  edge [
-    source 344
-    target 1887
-    weight 40
-  ]
-  edge [
-    source 344
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 344
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 344
-    target 2071
-    weight 55
-  ]
-  edge [
-    source 344
-    target 1053
-    weight 23
-  ]
-  edge [
-    source 344
-    target 3423
-    weight 22
-  ]
-  edge [
-    source 347
-    target 3521
-    weight 40
-  ]
-  edge [
-    source 347
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 347
-    target 2861
-    weight 32
-  ]
-  edge [
-    source 347
-    target 1616
-    weight 38
-  ]
-  edge [
-    source 347
-    target 1647
-    weight 25
-  ]
-  edge [
-    source 347
-    target 1053
-    weight 37
-  ]
-  edge [
-    source 347
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 347
-    target 3141
-    weight 38
-  ]
-  edge [
-    source 347
-    target 2071
-    weight 37
-  ]
-  edge [
-    source 347
-    target 3600
-    weight 26
-  ]
-  edge [
-    source 347
-    target 3174
-    weight 24
-  ]
-  edge [
-    source 347
-    target 1995
-    weight 24
-  ]
-  edge [
-    source 347
-    target 751
-    weight 35
-  ]
-  edge [
-    source 347
-    target 1632
-    weight 26
-  ]
-  edge [
-    source 347
-    target 2700
-    weight 29
-  ]
-  edge [
-    source 347
-    target 1487
-    weight 28
-  ]
-  edge [
-    source 347
-    target 4051
-    weight 38
-  ]
-  edge [
-    source 347
-    target 774
-    weight 39
-  ]
-  edge [
-    source 347
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 347
-    target 798
-    weight 21
-  ]
-  edge [
-    source 347
-    target 1887
-    weight 38
-  ]
-  edge [
-    source 347
-    target 1080
-    weight 22
-  ]
-  edge [
-    source 347
-    target 2857
-    weight 26
-  ]
-  edge [
-    source 347
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 347
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 363
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 363
-    target 3521
-    weight 43
-  ]
-  edge [
-    source 363
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 363
-    target 774
-    weight 32
-  ]
-  edge [
-    source 363
-    target 751
-    weight 31
-  ]
-  edge [
-    source 363
-    target 4051
-    weight 32
-  ]
-  edge [
-    source 363
-    target 1887
-    weight 31
-  ]
-  edge [
-    source 363
-    target 2071
-    weight 32
-  ]
-  edge [
-    source 363
-    target 1053
-    weight 25
-  ]
-  edge [
-    source 363
-    target 1616
-    weight 29
-  ]
-  edge [
-    source 363
-    target 1487
-    weight 21
-  ]
-  edge [
-    source 363
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 368
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 368
-    target 1487
-    weight 58
-  ]
-  edge [
-    source 368
-    target 3600
-    weight 31
-  ]
-  edge [
-    source 368
-    target 3423
-    weight 53
-  ]
-  edge [
-    source 368
-    target 2071
-    weight 54
-  ]
-  edge [
-    source 368
-    target 1053
-    weight 28
-  ]
-  edge [
-    source 368
-    target 1616
-    weight 44
-  ]
-  edge [
-    source 368
-    target 4051
-    weight 45
-  ]
-  edge [
-    source 368
-    target 751
-    weight 48
-  ]
-  edge [
-    source 368
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 368
-    target 3141
-    weight 45
-  ]
-  edge [
-    source 368
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 368
-    target 2191
-    weight 21
-  ]
-  edge [
-    source 368
-    target 1647
-    weight 35
-  ]
-  edge [
-    source 368
-    target 774
-    weight 43
-  ]
-  edge [
-    source 368
-    target 1995
-    weight 25
-  ]
-  edge [
-    source 368
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 368
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 368
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 368
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 368
-    target 2861
-    weight 34
-  ]
-  edge [
-    source 378
-    target 3521
-    weight 129
-  ]
-  edge [
-    source 378
-    target 1487
-    weight 25
-  ]
-  edge [
-    source 378
-    target 1616
-    weight 28
-  ]
-  edge [
-    source 378
-    target 2071
-    weight 32
-  ]
-  edge [
-    source 378
-    target 3785
-    weight 26
-  ]
-  edge [
-    source 378
-    target 774
-    weight 27
-  ]
-  edge [
-    source 378
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 399
-    target 751
-    weight 63
-  ]
-  edge [
-    source 399
-    target 1616
-    weight 66
-  ]
-  edge [
-    source 399
-    target 3954
-    weight 26
-  ]
-  edge [
-    source 399
-    target 4051
-    weight 70
-  ]
-  edge [
-    source 399
-    target 3174
-    weight 31
-  ]
-  edge [
-    source 399
-    target 3521
-    weight 81
-  ]
-  edge [
-    source 399
-    target 2071
-    weight 68
-  ]
-  edge [
-    source 399
-    target 1080
-    weight 40
-  ]
-  edge [
-    source 399
-    target 2861
-    weight 52
-  ]
-  edge [
-    source 399
-    target 738
-    weight 28
-  ]
-  edge [
-    source 399
-    target 1053
-    weight 44
-  ]
-  edge [
-    source 399
-    target 3040
-    weight 21
-  ]
-  edge [
-    source 399
-    target 3141
-    weight 64
-  ]
-  edge [
-    source 399
-    target 3600
-    weight 42
-  ]
-  edge [
-    source 399
-    target 1487
-    weight 54
-  ]
-  edge [
-    source 399
-    target 774
-    weight 65
-  ]
-  edge [
-    source 399
-    target 3917
-    weight 23
-  ]
-  edge [
-    source 399
-    target 1887
-    weight 58
-  ]
-  edge [
-    source 399
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 399
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 399
-    target 1995
-    weight 34
-  ]
-  edge [
-    source 399
-    target 3276
-    weight 30
-  ]
-  edge [
-    source 399
-    target 3993
-    weight 31
-  ]
-  edge [
-    source 399
-    target 3145
-    weight 39
-  ]
-  edge [
-    source 399
-    target 1632
-    weight 28
-  ]
-  edge [
-    source 399
-    target 3423
-    weight 27
-  ]
-  edge [
-    source 399
-    target 1647
-    weight 27
-  ]
-  edge [
-    source 417
-    target 3521
-    weight 30
-  ]
-  edge [
-    source 417
-    target 774
-    weight 21
-  ]
-  edge [
-    source 417
-    target 751
-    weight 21
-  ]
-  edge [
-    source 417
-    target 1616
-    weight 21
-  ]
-  edge [
-    source 417
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 419
-    target 1487
-    weight 33
-  ]
-  edge [
-    source 419
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 419
-    target 2071
-    weight 25
-  ]
-  edge [
-    source 419
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 422
-    target 3521
-    weight 434
-  ]
-  edge [
-    source 422
-    target 1995
-    weight 204
-  ]
-  edge [
-    source 422
-    target 774
-    weight 400
-  ]
-  edge [
-    source 422
-    target 751
-    weight 380
-  ]
-  edge [
-    source 422
-    target 2861
-    weight 287
-  ]
-  edge [
-    source 422
-    target 3600
-    weight 220
-  ]
-  edge [
-    source 422
-    target 1616
-    weight 399
-  ]
-  edge [
-    source 422
-    target 3253
-    weight 72
-  ]
-  edge [
-    source 422
-    target 3993
-    weight 184
-  ]
-  edge [
-    source 422
-    target 4051
-    weight 348
-  ]
-  edge [
-    source 422
-    target 1647
-    weight 191
-  ]
-  edge [
-    source 422
-    target 3282
-    weight 132
-  ]
-  edge [
-    source 422
-    target 3542
-    weight 143
-  ]
-  edge [
-    source 422
-    target 3141
-    weight 381
-  ]
-  edge [
-    source 422
-    target 4027
-    weight 21
-  ]
-  edge [
-    source 422
-    target 1632
-    weight 179
-  ]
-  edge [
-    source 422
-    target 3420
-    weight 72
-  ]
-  edge [
-    source 422
-    target 2700
-    weight 227
-  ]
-  edge [
-    source 422
-    target 3636
-    weight 92
-  ]
-  edge [
-    source 422
-    target 1080
-    weight 194
-  ]
-  edge [
-    source 422
-    target 1487
-    weight 252
-  ]
-  edge [
-    source 422
-    target 798
-    weight 119
-  ]
-  edge [
-    source 422
-    target 3006
-    weight 84
-  ]
-  edge [
-    source 422
-    target 2071
-    weight 337
-  ]
-  edge [
-    source 422
-    target 3040
-    weight 95
-  ]
-  edge [
-    source 422
-    target 1127
-    weight 43
-  ]
-  edge [
-    source 422
-    target 724
-    weight 59
-  ]
-  edge [
-    source 422
-    target 1887
-    weight 372
-  ]
-  edge [
-    source 422
-    target 1195
-    weight 36
-  ]
-  edge [
-    source 422
-    target 3954
-    weight 104
-  ]
-  edge [
-    source 422
-    target 3847
-    weight 35
-  ]
-  edge [
-    source 422
-    target 3642
-    weight 124
-  ]
-  edge [
-    source 422
-    target 3884
-    weight 23
-  ]
-  edge [
-    source 422
-    target 738
-    weight 158
-  ]
-  edge [
-    source 422
-    target 1461
-    weight 28
-  ]
-  edge [
-    source 422
-    target 2329
-    weight 21
-  ]
-  edge [
-    source 422
-    target 1053
-    weight 291
-  ]
-  edge [
-    source 422
-    target 3565
-    weight 102
-  ]
-  edge [
-    source 422
-    target 424
-    weight 36
-  ]
-  edge [
-    source 422
-    target 1322
-    weight 35
-  ]
-  edge [
-    source 422
-    target 2543
-    weight 80
-  ]
-  edge [
-    source 422
-    target 3174
-    weight 219
-  ]
-  edge [
-    source 422
-    target 4154
-    weight 222
-  ]
-  edge [
-    source 422
-    target 927
-    weight 21
-  ]
-  edge [
-    source 422
-    target 2204
-    weight 89
-  ]
-  edge [
-    source 422
-    target 4162
-    weight 41
-  ]
-  edge [
-    source 422
-    target 2287
-    weight 94
-  ]
-  edge [
-    source 422
-    target 3276
-    weight 192
-  ]
-  edge [
-    source 422
-    target 3377
-    weight 22
-  ]
-  edge [
-    source 422
-    target 1254
-    weight 128
-  ]
-  edge [
-    source 422
-    target 502
-    weight 33
-  ]
-  edge [
-    source 422
-    target 1505
-    weight 105
-  ]
-  edge [
-    source 422
-    target 3917
-    weight 159
-  ]
-  edge [
-    source 422
-    target 1707
-    weight 35
-  ]
-  edge [
-    source 422
-    target 3066
-    weight 74
-  ]
-  edge [
-    source 422
-    target 2810
-    weight 33
-  ]
-  edge [
-    source 422
-    target 3052
-    weight 63
-  ]
-  edge [
-    source 422
-    target 2553
-    weight 55
-  ]
-  edge [
-    source 422
-    target 986
-    weight 24
-  ]
-  edge [
-    source 422
-    target 2857
-    weight 137
-  ]
-  edge [
-    source 422
-    target 2890
-    weight 105
-  ]
-  edge [
-    source 422
-    target 1582
-    weight 202
-  ]
-  edge [
-    source 422
-    target 4040
-    weight 34
-  ]
-  edge [
-    source 422
-    target 1185
-    weight 71
-  ]
-  edge [
-    source 422
-    target 1154
-    weight 30
-  ]
-  edge [
-    source 422
-    target 3077
-    weight 22
-  ]
-  edge [
-    source 422
-    target 3962
-    weight 50
-  ]
-  edge [
-    source 422
-    target 1952
-    weight 22
-  ]
-  edge [
-    source 422
-    target 2191
-    weight 72
-  ]
-  edge [
-    source 422
-    target 1938
-    weight 57
-  ]
-  edge [
-    source 422
-    target 1757
-    weight 64
-  ]
-  edge [
-    source 422
-    target 1507
-    weight 61
-  ]
-  edge [
-    source 422
-    target 1280
-    weight 27
-  ]
-  edge [
-    source 422
-    target 3443
-    weight 85
-  ]
-  edge [
-    source 422
-    target 2519
-    weight 128
-  ]
-  edge [
-    source 422
-    target 1409
-    weight 41
-  ]
-  edge [
-    source 422
-    target 1523
-    weight 40
-  ]
-  edge [
-    source 422
-    target 2800
-    weight 47
-  ]
-  edge [
-    source 422
-    target 2614
-    weight 26
-  ]
-  edge [
-    source 422
-    target 874
-    weight 74
-  ]
-  edge [
-    source 422
-    target 2870
-    weight 106
-  ]
-  edge [
-    source 422
-    target 3145
-    weight 262
-  ]
-  edge [
-    source 422
-    target 968
-    weight 55
-  ]
-  edge [
-    source 422
-    target 1360
-    weight 43
-  ]
-  edge [
-    source 422
-    target 604
-    weight 39
-  ]
-  edge [
-    source 422
-    target 3423
-    weight 102
-  ]
-  edge [
-    source 422
-    target 3937
-    weight 36
-  ]
-  edge [
-    source 422
-    target 1420
-    weight 34
-  ]
-  edge [
-    source 422
-    target 3877
-    weight 26
-  ]
-  edge [
-    source 422
-    target 3374
-    weight 78
-  ]
-  edge [
-    source 422
-    target 980
-    weight 30
-  ]
-  edge [
-    source 422
-    target 490
-    weight 27
-  ]
-  edge [
-    source 422
-    target 602
-    weight 48
-  ]
-  edge [
-    source 422
-    target 3295
-    weight 50
-  ]
-  edge [
-    source 422
-    target 842
-    weight 24
-  ]
-  edge [
-    source 422
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 422
-    target 2058
-    weight 56
-  ]
-  edge [
-    source 422
-    target 2078
-    weight 26
-  ]
-  edge [
-    source 423
-    target 3521
-    weight 34
-  ]
-  edge [
-    source 423
-    target 1053
-    weight 27
-  ]
-  edge [
-    source 423
-    target 2861
-    weight 28
-  ]
-  edge [
-    source 423
-    target 1887
-    weight 34
-  ]
-  edge [
-    source 423
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 423
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 423
-    target 751
-    weight 30
-  ]
-  edge [
-    source 423
-    target 1616
-    weight 34
-  ]
-  edge [
-    source 423
-    target 774
-    weight 32
-  ]
-  edge [
-    source 423
-    target 1995
-    weight 24
-  ]
-  edge [
-    source 423
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 423
-    target 3145
-    weight 22
-  ]
-  edge [
-    source 423
-    target 3600
-    weight 25
-  ]
-  edge [
-    source 423
-    target 1647
-    weight 23
-  ]
-  edge [
-    source 423
-    target 1487
-    weight 29
-  ]
-  edge [
-    source 423
-    target 2700
-    weight 23
-  ]
-  edge [
-    source 424
-    target 774
-    weight 114
-  ]
-  edge [
-    source 424
-    target 1632
-    weight 73
-  ]
-  edge [
-    source 424
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 424
-    target 2071
-    weight 109
-  ]
-  edge [
-    source 424
-    target 3145
-    weight 85
-  ]
-  edge [
-    source 424
-    target 3600
-    weight 54
-  ]
-  edge [
-    source 424
-    target 751
-    weight 120
-  ]
-  edge [
-    source 424
-    target 874
-    weight 21
-  ]
-  edge [
-    source 424
-    target 1616
-    weight 130
-  ]
-  edge [
-    source 424
-    target 4051
-    weight 118
-  ]
-  edge [
-    source 424
-    target 1487
-    weight 79
-  ]
-  edge [
-    source 424
-    target 3642
-    weight 48
-  ]
-  edge [
-    source 424
-    target 3443
-    weight 27
-  ]
-  edge [
-    source 424
-    target 2800
-    weight 23
-  ]
-  edge [
-    source 424
-    target 3993
-    weight 56
-  ]
-  edge [
-    source 424
-    target 3276
-    weight 57
-  ]
-  edge [
-    source 424
-    target 3521
-    weight 133
-  ]
-  edge [
-    source 424
-    target 1053
-    weight 83
-  ]
-  edge [
-    source 424
-    target 3377
-    weight 21
-  ]
-  edge [
-    source 424
-    target 2861
-    weight 108
-  ]
-  edge [
-    source 424
-    target 1995
-    weight 68
-  ]
-  edge [
-    source 424
-    target 3253
-    weight 27
-  ]
-  edge [
-    source 424
-    target 3006
-    weight 49
-  ]
-  edge [
-    source 424
-    target 3066
-    weight 48
-  ]
-  edge [
-    source 424
-    target 738
-    weight 56
-  ]
-  edge [
-    source 424
-    target 3052
-    weight 28
-  ]
-  edge [
-    source 424
-    target 1505
-    weight 41
-  ]
-  edge [
-    source 424
-    target 724
-    weight 36
-  ]
-  edge [
-    source 424
-    target 1254
-    weight 48
-  ]
-  edge [
-    source 424
-    target 2287
-    weight 45
-  ]
-  edge [
-    source 424
-    target 1080
-    weight 70
-  ]
-  edge [
-    source 424
-    target 3565
-    weight 26
-  ]
-  edge [
-    source 424
-    target 3174
-    weight 71
-  ]
-  edge [
-    source 424
-    target 3954
-    weight 55
-  ]
-  edge [
-    source 424
-    target 1887
-    weight 117
-  ]
-  edge [
-    source 424
-    target 1360
-    weight 33
-  ]
-  edge [
-    source 424
-    target 2700
-    weight 71
-  ]
-  edge [
-    source 424
-    target 2543
-    weight 38
-  ]
-  edge [
-    source 424
-    target 1461
-    weight 22
-  ]
-  edge [
-    source 424
-    target 3636
-    weight 33
-  ]
-  edge [
-    source 424
-    target 3282
-    weight 48
-  ]
-  edge [
-    source 424
-    target 798
-    weight 43
-  ]
-  edge [
-    source 424
-    target 3040
-    weight 37
-  ]
-  edge [
-    source 424
-    target 1647
-    weight 60
-  ]
-  edge [
-    source 424
-    target 4154
-    weight 48
-  ]
-  edge [
-    source 424
-    target 2870
-    weight 45
-  ]
-  edge [
-    source 424
-    target 1582
-    weight 55
-  ]
-  edge [
-    source 424
-    target 2204
-    weight 27
-  ]
-  edge [
-    source 424
-    target 2519
-    weight 42
-  ]
-  edge [
-    source 424
-    target 1185
-    weight 30
-  ]
-  edge [
-    source 424
-    target 4162
-    weight 30
-  ]
-  edge [
-    source 424
-    target 3420
-    weight 29
-  ]
-  edge [
-    source 424
-    target 602
-    weight 30
-  ]
-  edge [
-    source 424
-    target 3374
-    weight 24
-  ]
-  edge [
-    source 424
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 424
-    target 2857
-    weight 44
-  ]
-  edge [
-    source 424
-    target 1938
-    weight 22
-  ]
-  edge [
-    source 424
-    target 1507
-    weight 28
-  ]
-  edge [
-    source 424
-    target 3917
-    weight 47
-  ]
-  edge [
-    source 424
-    target 3423
-    weight 31
-  ]
-  edge [
-    source 440
-    target 3600
-    weight 30
-  ]
-  edge [
-    source 440
-    target 751
-    weight 56
-  ]
-  edge [
-    source 440
-    target 2861
-    weight 53
-  ]
-  edge [
-    source 440
-    target 1616
-    weight 59
-  ]
-  edge [
-    source 440
-    target 3521
-    weight 100
-  ]
-  edge [
-    source 440
-    target 2071
-    weight 55
-  ]
-  edge [
-    source 440
-    target 774
-    weight 60
-  ]
-  edge [
-    source 440
-    target 1995
-    weight 26
-  ]
-  edge [
-    source 440
-    target 3141
-    weight 56
-  ]
-  edge [
-    source 440
-    target 3145
-    weight 30
-  ]
-  edge [
-    source 440
-    target 1887
-    weight 53
-  ]
-  edge [
-    source 440
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 440
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 440
-    target 1487
-    weight 41
-  ]
-  edge [
-    source 440
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 440
-    target 738
-    weight 27
-  ]
-  edge [
-    source 440
-    target 1080
-    weight 27
-  ]
-  edge [
-    source 440
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 440
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 440
-    target 1053
-    weight 39
-  ]
-  edge [
-    source 440
-    target 4051
-    weight 51
-  ]
-  edge [
-    source 448
-    target 774
-    weight 36
-  ]
-  edge [
-    source 448
-    target 751
-    weight 34
-  ]
-  edge [
-    source 448
-    target 1616
-    weight 36
-  ]
-  edge [
-    source 448
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 448
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 448
-    target 2861
-    weight 27
-  ]
-  edge [
-    source 448
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 448
-    target 1053
-    weight 25
-  ]
-  edge [
-    source 448
-    target 1887
-    weight 28
-  ]
-  edge [
-    source 448
-    target 2071
-    weight 34
-  ]
-  edge [
-    source 448
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 448
-    target 1487
-    weight 22
-  ]
-  edge [
-    source 456
-    target 1995
-    weight 79
-  ]
-  edge [
-    source 456
-    target 1616
-    weight 166
-  ]
-  edge [
-    source 456
-    target 3521
-    weight 164
-  ]
-  edge [
-    source 456
-    target 3040
-    weight 36
-  ]
-  edge [
-    source 456
-    target 3141
-    weight 137
-  ]
-  edge [
-    source 456
-    target 2071
-    weight 124
-  ]
-  edge [
-    source 456
-    target 751
-    weight 133
-  ]
-  edge [
-    source 456
-    target 3295
-    weight 28
-  ]
-  edge [
-    source 456
-    target 1887
-    weight 143
-  ]
-  edge [
-    source 456
-    target 3565
-    weight 44
-  ]
-  edge [
-    source 456
-    target 2861
-    weight 117
-  ]
-  edge [
-    source 456
-    target 4051
-    weight 132
-  ]
-  edge [
-    source 456
-    target 1487
-    weight 84
-  ]
-  edge [
-    source 456
-    target 3642
-    weight 102
-  ]
-  edge [
-    source 456
-    target 1080
-    weight 87
-  ]
-  edge [
-    source 456
-    target 1053
-    weight 113
-  ]
-  edge [
-    source 456
-    target 3636
-    weight 39
-  ]
-  edge [
-    source 456
-    target 1127
-    weight 32
-  ]
-  edge [
-    source 456
-    target 3443
-    weight 33
-  ]
-  edge [
-    source 456
-    target 3600
-    weight 74
-  ]
-  edge [
-    source 456
-    target 774
-    weight 148
-  ]
-  edge [
-    source 456
-    target 3954
-    weight 47
-  ]
-  edge [
-    source 456
-    target 3993
-    weight 69
-  ]
-  edge [
-    source 456
-    target 3276
-    weight 73
-  ]
-  edge [
-    source 456
-    target 3282
-    weight 57
-  ]
-  edge [
-    source 456
-    target 1647
-    weight 64
-  ]
-  edge [
-    source 456
-    target 738
-    weight 56
-  ]
-  edge [
-    source 456
-    target 2700
-    weight 84
-  ]
-  edge [
-    source 456
-    target 2543
-    weight 30
-  ]
-  edge [
-    source 456
-    target 798
-    weight 45
-  ]
-  edge [
-    source 456
-    target 2870
-    weight 35
-  ]
-  edge [
-    source 456
-    target 3145
-    weight 88
-  ]
-  edge [
-    source 456
-    target 2857
-    weight 40
-  ]
-  edge [
-    source 456
-    target 3066
-    weight 31
-  ]
-  edge [
-    source 456
-    target 3006
-    weight 39
-  ]
-  edge [
-    source 456
-    target 2890
-    weight 40
-  ]
-  edge [
-    source 456
-    target 3253
-    weight 33
-  ]
-  edge [
-    source 456
-    target 1582
-    weight 59
-  ]
-  edge [
-    source 456
-    target 1505
-    weight 33
-  ]
-  edge [
-    source 456
-    target 604
-    weight 24
-  ]
-  edge [
-    source 456
-    target 1632
-    weight 70
-  ]
-  edge [
-    source 456
-    target 3423
-    weight 21
-  ]
-  edge [
-    source 456
-    target 3174
-    weight 80
-  ]
-  edge [
-    source 456
-    target 3917
-    weight 58
-  ]
-  edge [
-    source 456
-    target 2191
-    weight 22
-  ]
-  edge [
-    source 456
-    target 1254
-    weight 31
-  ]
-  edge [
-    source 456
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 456
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 456
-    target 2204
-    weight 25
-  ]
-  edge [
-    source 456
-    target 3542
-    weight 36
-  ]
-  edge [
-    source 456
-    target 2519
-    weight 30
-  ]
-  edge [
-    source 490
-    target 1995
-    weight 150
-  ]
-  edge [
-    source 490
-    target 2861
-    weight 171
-  ]
-  edge [
-    source 490
-    target 1616
-    weight 240
-  ]
-  edge [
-    source 490
-    target 3521
-    weight 259
-  ]
-  edge [
-    source 490
-    target 3253
-    weight 103
-  ]
-  edge [
-    source 490
-    target 3006
-    weight 47
-  ]
-  edge [
-    source 490
-    target 3040
-    weight 45
-  ]
-  edge [
-    source 490
-    target 4051
-    weight 206
-  ]
-  edge [
-    source 490
-    target 1632
-    weight 94
-  ]
-  edge [
-    source 490
-    target 3066
-    weight 59
-  ]
-  edge [
-    source 490
-    target 738
-    weight 105
-  ]
-  edge [
-    source 490
-    target 3052
-    weight 49
-  ]
-  edge [
-    source 490
-    target 751
-    weight 231
-  ]
-  edge [
-    source 490
-    target 1505
-    weight 79
-  ]
-  edge [
-    source 490
-    target 724
-    weight 28
-  ]
-  edge [
-    source 490
-    target 1254
-    weight 79
-  ]
-  edge [
-    source 490
-    target 2287
-    weight 45
-  ]
-  edge [
-    source 490
-    target 1053
-    weight 179
-  ]
-  edge [
-    source 490
-    target 3642
-    weight 109
-  ]
-  edge [
-    source 490
-    target 3954
-    weight 49
-  ]
-  edge [
-    source 490
-    target 3295
-    weight 79
-  ]
-  edge [
-    source 490
-    target 3141
-    weight 216
-  ]
-  edge [
-    source 490
-    target 1487
-    weight 155
-  ]
-  edge [
-    source 490
-    target 2543
-    weight 55
-  ]
-  edge [
-    source 490
-    target 3196
-    weight 27
-  ]
-  edge [
-    source 490
-    target 3600
-    weight 141
-  ]
-  edge [
-    source 490
-    target 774
-    weight 219
-  ]
-  edge [
-    source 490
-    target 2071
-    weight 198
-  ]
-  edge [
-    source 490
-    target 1360
-    weight 34
-  ]
-  edge [
-    source 490
-    target 3174
-    weight 152
-  ]
-  edge [
-    source 490
-    target 1887
-    weight 209
-  ]
-  edge [
-    source 490
-    target 1707
-    weight 25
-  ]
-  edge [
-    source 490
-    target 1080
-    weight 122
-  ]
-  edge [
-    source 490
-    target 3565
-    weight 45
-  ]
-  edge [
-    source 490
-    target 3993
-    weight 107
-  ]
-  edge [
-    source 490
-    target 3276
-    weight 120
-  ]
-  edge [
-    source 490
-    target 3443
-    weight 53
-  ]
-  edge [
-    source 490
-    target 3145
-    weight 160
-  ]
-  edge [
-    source 490
-    target 1507
-    weight 28
-  ]
-  edge [
-    source 490
-    target 2700
-    weight 99
-  ]
-  edge [
-    source 490
-    target 2191
-    weight 42
-  ]
-  edge [
-    source 490
-    target 1582
-    weight 101
-  ]
-  edge [
-    source 490
-    target 1185
-    weight 54
-  ]
-  edge [
-    source 490
-    target 874
-    weight 52
-  ]
-  edge [
-    source 490
-    target 3636
-    weight 48
-  ]
-  edge [
-    source 490
-    target 2890
-    weight 48
-  ]
-  edge [
-    source 490
-    target 1523
-    weight 67
-  ]
-  edge [
-    source 490
-    target 3542
-    weight 88
-  ]
-  edge [
-    source 490
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 490
-    target 604
-    weight 41
-  ]
-  edge [
-    source 490
-    target 1647
-    weight 100
-  ]
-  edge [
-    source 490
-    target 3917
-    weight 87
-  ]
-  edge [
-    source 490
-    target 4154
-    weight 41
-  ]
-  edge [
-    source 490
-    target 2519
-    weight 66
-  ]
-  edge [
-    source 490
-    target 2204
-    weight 52
-  ]
-  edge [
-    source 490
-    target 1127
-    weight 27
-  ]
-  edge [
-    source 490
-    target 3374
-    weight 50
-  ]
-  edge [
-    source 490
-    target 798
-    weight 94
-  ]
-  edge [
-    source 490
-    target 1757
-    weight 31
-  ]
-  edge [
-    source 490
-    target 968
-    weight 40
-  ]
-  edge [
-    source 490
-    target 3423
-    weight 54
-  ]
-  edge [
-    source 490
-    target 1409
-    weight 25
-  ]
-  edge [
-    source 490
-    target 2857
-    weight 72
-  ]
-  edge [
-    source 490
-    target 3282
-    weight 68
-  ]
-  edge [
-    source 490
-    target 3962
-    weight 28
-  ]
-  edge [
-    source 490
-    target 2870
-    weight 57
-  ]
-  edge [
-    source 490
-    target 1938
-    weight 28
-  ]
-  edge [
-    source 490
-    target 4162
-    weight 28
-  ]
-  edge [
-    source 490
-    target 2058
-    weight 36
-  ]
-  edge [
-    source 490
-    target 1154
-    weight 22
-  ]
-  edge [
-    source 490
-    target 2553
-    weight 36
-  ]
-  edge [
-    source 502
-    target 3423
-    weight 179
-  ]
-  edge [
-    source 502
-    target 1487
-    weight 251
-  ]
-  edge [
-    source 502
-    target 3600
-    weight 133
-  ]
-  edge [
-    source 502
-    target 2861
-    weight 170
-  ]
-  edge [
-    source 502
-    target 751
-    weight 226
-  ]
-  edge [
-    source 502
-    target 2191
-    weight 92
-  ]
-  edge [
-    source 502
-    target 3565
-    weight 38
-  ]
-  edge [
-    source 502
-    target 1647
-    weight 141
-  ]
-  edge [
-    source 502
-    target 1080
-    weight 108
-  ]
-  edge [
-    source 502
-    target 3521
-    weight 275
-  ]
-  edge [
-    source 502
-    target 1616
-    weight 208
-  ]
-  edge [
-    source 502
-    target 986
-    weight 63
-  ]
-  edge [
-    source 502
-    target 1995
-    weight 112
-  ]
-  edge [
-    source 502
-    target 2071
-    weight 249
-  ]
-  edge [
-    source 502
-    target 774
-    weight 209
-  ]
-  edge [
-    source 502
-    target 3937
-    weight 50
-  ]
-  edge [
-    source 502
-    target 671
-    weight 28
-  ]
-  edge [
-    source 502
-    target 3177
-    weight 23
-  ]
-  edge [
-    source 502
-    target 1053
-    weight 140
-  ]
-  edge [
-    source 502
-    target 1887
-    weight 187
-  ]
-  edge [
-    source 502
-    target 3917
-    weight 90
-  ]
-  edge [
-    source 502
-    target 1582
-    weight 90
-  ]
-  edge [
-    source 502
-    target 602
-    weight 24
-  ]
-  edge [
-    source 502
-    target 2058
-    weight 56
-  ]
-  edge [
-    source 502
-    target 4051
-    weight 198
-  ]
-  edge [
-    source 502
-    target 3993
-    weight 127
-  ]
-  edge [
-    source 502
-    target 1154
-    weight 25
-  ]
-  edge [
-    source 502
-    target 3077
-    weight 59
-  ]
-  edge [
-    source 502
-    target 2227
-    weight 21
-  ]
-  edge [
-    source 502
-    target 3962
-    weight 80
-  ]
-  edge [
-    source 502
-    target 3066
-    weight 44
-  ]
-  edge [
-    source 502
-    target 3040
-    weight 46
-  ]
-  edge [
-    source 502
-    target 3642
-    weight 59
-  ]
-  edge [
-    source 502
-    target 3006
-    weight 39
-  ]
-  edge [
-    source 502
-    target 1952
-    weight 27
-  ]
-  edge [
-    source 502
-    target 1333
-    weight 22
-  ]
-  edge [
-    source 502
-    target 1254
-    weight 60
-  ]
-  edge [
-    source 502
-    target 3636
-    weight 36
-  ]
-  edge [
-    source 502
-    target 3141
-    weight 207
-  ]
-  edge [
-    source 502
-    target 2204
-    weight 38
-  ]
-  edge [
-    source 502
-    target 1632
-    weight 84
-  ]
-  edge [
-    source 502
-    target 2810
-    weight 34
-  ]
-  edge [
-    source 502
-    target 2700
-    weight 94
-  ]
-  edge [
-    source 502
-    target 1409
-    weight 55
-  ]
-  edge [
-    source 502
-    target 3145
-    weight 138
-  ]
-  edge [
-    source 502
-    target 738
-    weight 68
-  ]
-  edge [
-    source 502
-    target 1505
-    weight 80
-  ]
-  edge [
-    source 502
-    target 3174
-    weight 102
-  ]
-  edge [
-    source 502
-    target 1757
-    weight 45
-  ]
-  edge [
-    source 502
-    target 2287
-    weight 55
-  ]
-  edge [
-    source 502
-    target 4154
-    weight 38
-  ]
-  edge [
-    source 502
-    target 2543
-    weight 27
-  ]
-  edge [
-    source 502
-    target 968
-    weight 32
-  ]
-  edge [
-    source 502
-    target 3253
-    weight 32
-  ]
-  edge [
-    source 502
-    target 3282
-    weight 64
-  ]
-  edge [
-    source 502
-    target 2870
-    weight 51
-  ]
-  edge [
-    source 502
-    target 3276
-    weight 107
-  ]
-  edge [
-    source 502
-    target 3408
-    weight 26
-  ]
-  edge [
-    source 502
-    target 3374
-    weight 68
-  ]
-  edge [
-    source 502
-    target 2800
-    weight 41
-  ]
-  edge [
-    source 502
-    target 3443
-    weight 42
-  ]
-  edge [
-    source 502
-    target 604
-    weight 21
-  ]
-  edge [
-    source 502
-    target 2519
-    weight 59
-  ]
-  edge [
-    source 502
-    target 3420
-    weight 46
-  ]
-  edge [
-    source 502
-    target 798
-    weight 61
-  ]
-  edge [
-    source 502
-    target 2857
-    weight 65
-  ]
-  edge [
-    source 502
-    target 874
-    weight 40
-  ]
-  edge [
-    source 502
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 502
-    target 2890
-    weight 34
-  ]
-  edge [
-    source 502
-    target 3954
-    weight 48
-  ]
-  edge [
-    source 502
-    target 1185
-    weight 44
-  ]
-  edge [
-    source 502
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 502
-    target 2553
-    weight 28
-  ]
-  edge [
-    source 502
-    target 2078
-    weight 25
-  ]
-  edge [
-    source 502
-    target 1507
-    weight 23
-  ]
-  edge [
-    source 505
-    target 751
-    weight 67
-  ]
-  edge [
-    source 505
-    target 1616
-    weight 63
-  ]
-  edge [
-    source 505
-    target 3521
-    weight 68
-  ]
-  edge [
-    source 505
-    target 3276
-    weight 34
-  ]
-  edge [
-    source 505
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 505
-    target 2071
-    weight 60
-  ]
-  edge [
-    source 505
-    target 774
-    weight 65
-  ]
-  edge [
-    source 505
-    target 1995
-    weight 34
-  ]
-  edge [
-    source 505
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 505
-    target 1487
-    weight 52
-  ]
-  edge [
-    source 505
-    target 1080
-    weight 33
-  ]
-  edge [
-    source 505
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 505
-    target 3374
-    weight 24
-  ]
-  edge [
-    source 505
-    target 3141
-    weight 56
-  ]
-  edge [
-    source 505
-    target 2861
-    weight 48
-  ]
-  edge [
-    source 505
-    target 4051
-    weight 58
-  ]
-  edge [
-    source 505
-    target 1254
-    weight 24
-  ]
-  edge [
-    source 505
-    target 1887
-    weight 51
-  ]
-  edge [
-    source 505
-    target 1647
-    weight 34
-  ]
-  edge [
-    source 505
-    target 1505
-    weight 36
-  ]
-  edge [
-    source 505
-    target 738
-    weight 27
-  ]
-  edge [
-    source 505
-    target 3993
-    weight 38
-  ]
-  edge [
-    source 505
-    target 3600
-    weight 45
-  ]
-  edge [
-    source 505
-    target 1053
-    weight 41
-  ]
-  edge [
-    source 505
-    target 1632
-    weight 21
-  ]
-  edge [
-    source 505
-    target 3145
-    weight 40
-  ]
-  edge [
-    source 505
-    target 2857
-    weight 22
-  ]
-  edge [
-    source 505
-    target 1582
-    weight 26
-  ]
-  edge [
-    source 505
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 548
-    target 774
-    weight 24
-  ]
-  edge [
-    source 548
-    target 751
-    weight 24
-  ]
-  edge [
-    source 548
-    target 1616
-    weight 23
-  ]
-  edge [
-    source 548
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 548
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 548
-    target 3521
-    weight 27
-  ]
-  edge [
-    source 548
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 549
-    target 3521
-    weight 121
-  ]
-  edge [
-    source 549
-    target 1616
-    weight 108
-  ]
-  edge [
-    source 549
-    target 1487
-    weight 81
-  ]
-  edge [
-    source 549
-    target 774
-    weight 113
-  ]
-  edge [
-    source 549
-    target 2890
-    weight 37
-  ]
-  edge [
-    source 549
-    target 1080
-    weight 42
-  ]
-  edge [
-    source 549
-    target 1887
-    weight 113
-  ]
-  edge [
-    source 549
-    target 3145
-    weight 74
-  ]
-  edge [
-    source 549
-    target 751
-    weight 97
-  ]
-  edge [
-    source 549
-    target 1053
-    weight 72
-  ]
-  edge [
-    source 549
-    target 3600
-    weight 70
-  ]
-  edge [
-    source 549
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 549
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 549
-    target 2700
-    weight 54
-  ]
-  edge [
-    source 549
-    target 2861
-    weight 64
-  ]
-  edge [
-    source 549
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 549
-    target 3276
-    weight 65
-  ]
-  edge [
-    source 549
-    target 2071
-    weight 99
-  ]
-  edge [
-    source 549
-    target 3174
-    weight 59
-  ]
-  edge [
-    source 549
-    target 4051
-    weight 85
-  ]
-  edge [
-    source 549
-    target 3423
-    weight 28
-  ]
-  edge [
-    source 549
-    target 1582
-    weight 52
-  ]
-  edge [
-    source 549
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 549
-    target 1647
-    weight 48
-  ]
-  edge [
-    source 549
-    target 1632
-    weight 22
-  ]
-  edge [
-    source 549
-    target 798
-    weight 24
-  ]
-  edge [
-    source 549
-    target 3993
-    weight 44
-  ]
-  edge [
-    source 549
-    target 1995
-    weight 43
-  ]
-  edge [
-    source 549
-    target 3642
-    weight 34
-  ]
-  edge [
-    source 549
-    target 2519
-    weight 30
-  ]
-  edge [
-    source 549
-    target 3443
-    weight 22
-  ]
-  edge [
-    source 549
-    target 3282
-    weight 25
-  ]
-  edge [
-    source 549
-    target 2058
-    weight 21
-  ]
-  edge [
-    source 561
-    target 751
-    weight 86
-  ]
-  edge [
-    source 561
-    target 1616
-    weight 91
-  ]
-  edge [
-    source 561
-    target 1487
-    weight 72
-  ]
-  edge [
-    source 561
-    target 3521
-    weight 93
-  ]
-  edge [
-    source 561
-    target 2861
-    weight 69
-  ]
-  edge [
-    source 561
-    target 1080
-    weight 56
-  ]
-  edge [
-    source 561
-    target 2191
-    weight 25
-  ]
-  edge [
-    source 561
-    target 3276
-    weight 50
-  ]
-  edge [
-    source 561
-    target 774
-    weight 87
-  ]
-  edge [
-    source 561
-    target 3374
-    weight 23
-  ]
-  edge [
-    source 561
-    target 1254
-    weight 33
-  ]
-  edge [
-    source 561
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 561
-    target 1053
-    weight 65
-  ]
-  edge [
-    source 561
-    target 2700
-    weight 47
-  ]
-  edge [
-    source 561
-    target 4051
-    weight 87
-  ]
-  edge [
-    source 561
-    target 2890
-    weight 22
-  ]
-  edge [
-    source 561
-    target 1995
-    weight 56
-  ]
-  edge [
-    source 561
-    target 2071
-    weight 80
-  ]
-  edge [
-    source 561
-    target 738
-    weight 35
-  ]
-  edge [
-    source 561
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 561
-    target 1887
-    weight 82
-  ]
-  edge [
-    source 561
-    target 3174
-    weight 65
-  ]
-  edge [
-    source 561
-    target 1632
-    weight 37
-  ]
-  edge [
-    source 561
-    target 3253
-    weight 29
-  ]
-  edge [
-    source 561
-    target 1582
-    weight 39
-  ]
-  edge [
-    source 561
-    target 3600
-    weight 51
-  ]
-  edge [
-    source 561
-    target 2543
-    weight 34
-  ]
-  edge [
-    source 561
-    target 1360
-    weight 23
-  ]
-  edge [
-    source 561
-    target 3141
-    weight 84
-  ]
-  edge [
-    source 561
-    target 798
-    weight 35
-  ]
-  edge [
-    source 561
-    target 3642
-    weight 37
-  ]
-  edge [
-    source 561
-    target 1647
-    weight 40
-  ]
-  edge [
-    source 561
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 561
-    target 3993
-    weight 38
-  ]
-  edge [
-    source 561
-    target 3145
-    weight 60
-  ]
-  edge [
-    source 561
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 561
-    target 2870
-    weight 24
-  ]
-  edge [
-    source 561
-    target 3542
-    weight 33
-  ]
-  edge [
-    source 561
-    target 3282
-    weight 36
-  ]
-  edge [
-    source 561
-    target 1505
-    weight 32
-  ]
-  edge [
-    source 561
-    target 3052
-    weight 23
-  ]
-  edge [
-    source 561
-    target 2287
-    weight 23
-  ]
-  edge [
-    source 561
-    target 3066
-    weight 27
-  ]
-  edge [
-    source 561
-    target 2857
-    weight 35
-  ]
-  edge [
-    source 561
-    target 2058
-    weight 24
-  ]
-  edge [
-    source 561
-    target 2519
-    weight 29
-  ]
-  edge [
-    source 561
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 602
-    target 3521
-    weight 434
-  ]
-  edge [
-    source 602
-    target 1616
-    weight 431
-  ]
-  edge [
-    source 602
-    target 1487
-    weight 257
-  ]
-  edge [
-    source 602
-    target 2861
-    weight 321
-  ]
-  edge [
-    source 602
-    target 3600
-    weight 211
-  ]
-  edge [
-    source 602
-    target 751
-    weight 352
-  ]
-  edge [
-    source 602
-    target 3565
-    weight 99
-  ]
-  edge [
-    source 602
-    target 3276
-    weight 154
-  ]
-  edge [
-    source 602
-    target 3374
-    weight 66
-  ]
-  edge [
-    source 602
-    target 4051
-    weight 355
-  ]
-  edge [
-    source 602
-    target 2058
-    weight 60
-  ]
-  edge [
-    source 602
-    target 3423
-    weight 95
-  ]
-  edge [
-    source 602
-    target 3443
-    weight 69
-  ]
-  edge [
-    source 602
-    target 774
-    weight 363
-  ]
-  edge [
-    source 602
-    target 3420
-    weight 62
-  ]
-  edge [
-    source 602
-    target 1647
-    weight 165
-  ]
-  edge [
-    source 602
-    target 1409
-    weight 52
-  ]
-  edge [
-    source 602
-    target 3917
-    weight 137
-  ]
-  edge [
-    source 602
-    target 3642
-    weight 146
-  ]
-  edge [
-    source 602
-    target 3542
-    weight 96
-  ]
-  edge [
-    source 602
-    target 2700
-    weight 201
-  ]
-  edge [
-    source 602
-    target 1127
-    weight 50
-  ]
-  edge [
-    source 602
-    target 1887
-    weight 358
-  ]
-  edge [
-    source 602
-    target 1053
-    weight 240
-  ]
-  edge [
-    source 602
-    target 3282
-    weight 97
-  ]
-  edge [
-    source 602
-    target 3141
-    weight 348
-  ]
-  edge [
-    source 602
-    target 3145
-    weight 220
-  ]
-  edge [
-    source 602
-    target 2810
-    weight 25
-  ]
-  edge [
-    source 602
-    target 1995
-    weight 185
-  ]
-  edge [
-    source 602
-    target 2071
-    weight 335
-  ]
-  edge [
-    source 602
-    target 3377
-    weight 34
-  ]
-  edge [
-    source 602
-    target 2519
-    weight 107
-  ]
-  edge [
-    source 602
-    target 2543
-    weight 66
-  ]
-  edge [
-    source 602
-    target 1254
-    weight 103
-  ]
-  edge [
-    source 602
-    target 1582
-    weight 160
-  ]
-  edge [
-    source 602
-    target 724
-    weight 61
-  ]
-  edge [
-    source 602
-    target 3295
-    weight 50
-  ]
-  edge [
-    source 602
-    target 1461
-    weight 24
-  ]
-  edge [
-    source 602
-    target 1080
-    weight 255
-  ]
-  edge [
-    source 602
-    target 3636
-    weight 52
-  ]
-  edge [
-    source 602
-    target 3006
-    weight 107
-  ]
-  edge [
-    source 602
-    target 3040
-    weight 109
-  ]
-  edge [
-    source 602
-    target 738
-    weight 126
-  ]
-  edge [
-    source 602
-    target 3954
-    weight 114
-  ]
-  edge [
-    source 602
-    target 2287
-    weight 79
-  ]
-  edge [
-    source 602
-    target 1360
-    weight 34
-  ]
-  edge [
-    source 602
-    target 3174
-    weight 201
-  ]
-  edge [
-    source 602
-    target 3253
-    weight 53
-  ]
-  edge [
-    source 602
-    target 4162
-    weight 71
-  ]
-  edge [
-    source 602
-    target 1195
-    weight 32
-  ]
-  edge [
-    source 602
-    target 1632
-    weight 168
-  ]
-  edge [
-    source 602
-    target 1507
-    weight 57
-  ]
-  edge [
-    source 602
-    target 1505
-    weight 85
-  ]
-  edge [
-    source 602
-    target 2870
-    weight 80
-  ]
-  edge [
-    source 602
-    target 717
-    weight 21
-  ]
-  edge [
-    source 602
-    target 4154
-    weight 112
-  ]
-  edge [
-    source 602
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 602
-    target 2191
-    weight 67
-  ]
-  edge [
-    source 602
-    target 1185
-    weight 52
-  ]
-  edge [
-    source 602
-    target 1523
-    weight 33
-  ]
-  edge [
-    source 602
-    target 3962
-    weight 55
-  ]
-  edge [
-    source 602
-    target 3066
-    weight 80
-  ]
-  edge [
-    source 602
-    target 2890
-    weight 64
-  ]
-  edge [
-    source 602
-    target 1766
-    weight 23
-  ]
-  edge [
-    source 602
-    target 986
-    weight 24
-  ]
-  edge [
-    source 602
-    target 3993
-    weight 154
-  ]
-  edge [
-    source 602
-    target 1420
-    weight 28
-  ]
-  edge [
-    source 602
-    target 1938
-    weight 32
-  ]
-  edge [
-    source 602
-    target 1707
-    weight 35
-  ]
-  edge [
-    source 602
-    target 874
-    weight 46
-  ]
-  edge [
-    source 602
-    target 798
-    weight 84
-  ]
-  edge [
-    source 602
-    target 968
-    weight 38
-  ]
-  edge [
-    source 602
-    target 2204
-    weight 44
-  ]
-  edge [
-    source 602
-    target 3937
-    weight 24
-  ]
-  edge [
-    source 602
-    target 3052
-    weight 35
-  ]
-  edge [
-    source 602
-    target 2553
-    weight 41
-  ]
-  edge [
-    source 602
-    target 1757
-    weight 43
-  ]
-  edge [
-    source 602
-    target 2857
-    weight 85
-  ]
-  edge [
-    source 602
-    target 3847
-    weight 24
-  ]
-  edge [
-    source 604
-    target 751
-    weight 352
-  ]
-  edge [
-    source 604
-    target 2861
-    weight 274
-  ]
-  edge [
-    source 604
-    target 1616
-    weight 357
-  ]
-  edge [
-    source 604
-    target 1487
-    weight 256
-  ]
-  edge [
-    source 604
-    target 3521
-    weight 433
-  ]
-  edge [
-    source 604
-    target 3276
-    weight 216
-  ]
-  edge [
-    source 604
-    target 3420
-    weight 48
-  ]
-  edge [
-    source 604
-    target 2700
-    weight 159
-  ]
-  edge [
-    source 604
-    target 3993
-    weight 166
-  ]
-  edge [
-    source 604
-    target 1505
-    weight 146
-  ]
-  edge [
-    source 604
-    target 3377
-    weight 29
-  ]
-  edge [
-    source 604
-    target 1254
-    weight 142
-  ]
-  edge [
-    source 604
-    target 3565
-    weight 104
-  ]
-  edge [
-    source 604
-    target 2543
-    weight 65
-  ]
-  edge [
-    source 604
-    target 3600
-    weight 217
-  ]
-  edge [
-    source 604
-    target 2191
-    weight 59
-  ]
-  edge [
-    source 604
-    target 1647
-    weight 159
-  ]
-  edge [
-    source 604
-    target 3962
-    weight 69
-  ]
-  edge [
-    source 604
-    target 2071
-    weight 320
-  ]
-  edge [
-    source 604
-    target 2810
-    weight 26
-  ]
-  edge [
-    source 604
-    target 3141
-    weight 346
-  ]
-  edge [
-    source 604
-    target 1053
-    weight 261
-  ]
-  edge [
-    source 604
-    target 4051
-    weight 320
-  ]
-  edge [
-    source 604
-    target 3917
-    weight 154
-  ]
-  edge [
-    source 604
-    target 3937
-    weight 24
-  ]
-  edge [
-    source 604
-    target 874
-    weight 110
-  ]
-  edge [
-    source 604
-    target 798
-    weight 134
-  ]
-  edge [
-    source 604
-    target 1887
-    weight 309
-  ]
-  edge [
-    source 604
-    target 774
-    weight 353
-  ]
-  edge [
-    source 604
-    target 3642
-    weight 138
-  ]
-  edge [
-    source 604
-    target 1995
-    weight 163
-  ]
-  edge [
-    source 604
-    target 3282
-    weight 123
-  ]
-  edge [
-    source 604
-    target 3145
-    weight 237
-  ]
-  edge [
-    source 604
-    target 927
-    weight 22
-  ]
-  edge [
-    source 604
-    target 1582
-    weight 155
-  ]
-  edge [
-    source 604
-    target 3542
-    weight 96
-  ]
-  edge [
-    source 604
-    target 3443
-    weight 75
-  ]
-  edge [
-    source 604
-    target 3040
-    weight 71
-  ]
-  edge [
-    source 604
-    target 1127
-    weight 31
-  ]
-  edge [
-    source 604
-    target 1080
-    weight 178
-  ]
-  edge [
-    source 604
-    target 1420
-    weight 30
-  ]
-  edge [
-    source 604
-    target 3066
-    weight 88
-  ]
-  edge [
-    source 604
-    target 2204
-    weight 95
-  ]
-  edge [
-    source 604
-    target 2870
-    weight 88
-  ]
-  edge [
-    source 604
-    target 2553
-    weight 60
-  ]
-  edge [
-    source 604
-    target 738
-    weight 125
-  ]
-  edge [
-    source 604
-    target 3847
-    weight 29
-  ]
-  edge [
-    source 604
-    target 3071
-    weight 21
-  ]
-  edge [
-    source 604
-    target 3077
-    weight 29
-  ]
-  edge [
-    source 604
-    target 3253
-    weight 78
-  ]
-  edge [
-    source 604
-    target 968
-    weight 42
-  ]
-  edge [
-    source 604
-    target 1938
-    weight 37
-  ]
-  edge [
-    source 604
-    target 3636
-    weight 87
-  ]
-  edge [
-    source 604
-    target 1280
-    weight 24
-  ]
-  edge [
-    source 604
-    target 3295
-    weight 47
-  ]
-  edge [
-    source 604
-    target 3954
-    weight 84
-  ]
-  edge [
-    source 604
-    target 3174
-    weight 163
-  ]
-  edge [
-    source 604
-    target 1632
-    weight 132
-  ]
-  edge [
-    source 604
-    target 2800
-    weight 51
-  ]
-  edge [
-    source 604
-    target 1757
-    weight 69
-  ]
-  edge [
-    source 604
-    target 2287
-    weight 71
-  ]
-  edge [
-    source 604
-    target 2519
-    weight 105
-  ]
-  edge [
-    source 604
-    target 4154
-    weight 66
-  ]
-  edge [
-    source 604
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 604
-    target 1185
-    weight 61
-  ]
-  edge [
-    source 604
-    target 3006
-    weight 70
-  ]
-  edge [
-    source 604
-    target 3052
-    weight 63
-  ]
-  edge [
-    source 604
-    target 1154
-    weight 30
-  ]
-  edge [
-    source 604
-    target 1360
-    weight 37
-  ]
-  edge [
-    source 604
-    target 2614
-    weight 21
-  ]
-  edge [
-    source 604
-    target 1322
-    weight 27
-  ]
-  edge [
-    source 604
-    target 3423
-    weight 74
-  ]
-  edge [
-    source 604
-    target 733
-    weight 21
-  ]
-  edge [
-    source 604
-    target 3884
-    weight 24
-  ]
-  edge [
-    source 604
-    target 1492
-    weight 22
-  ]
-  edge [
-    source 604
-    target 3374
-    weight 68
-  ]
-  edge [
-    source 604
-    target 1523
-    weight 40
-  ]
-  edge [
-    source 604
-    target 2329
-    weight 24
-  ]
-  edge [
-    source 604
-    target 2857
-    weight 125
-  ]
-  edge [
-    source 604
-    target 986
-    weight 31
-  ]
-  edge [
-    source 604
-    target 1707
-    weight 29
-  ]
-  edge [
-    source 604
-    target 724
-    weight 44
-  ]
-  edge [
-    source 604
-    target 1507
-    weight 35
-  ]
-  edge [
-    source 604
-    target 3877
-    weight 27
-  ]
-  edge [
-    source 604
-    target 1517
-    weight 21
-  ]
-  edge [
-    source 604
-    target 980
-    weight 25
-  ]
-  edge [
-    source 604
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 604
-    target 3177
-    weight 25
-  ]
-  edge [
-    source 604
-    target 1409
-    weight 52
-  ]
-  edge [
-    source 604
-    target 2058
-    weight 63
-  ]
-  edge [
-    source 604
-    target 1943
-    weight 21
-  ]
-  edge [
-    source 604
-    target 4162
-    weight 28
-  ]
-  edge [
-    source 608
-    target 751
-    weight 142
-  ]
-  edge [
-    source 608
-    target 1616
-    weight 136
-  ]
-  edge [
-    source 608
-    target 3174
-    weight 67
-  ]
-  edge [
-    source 608
-    target 3521
-    weight 174
-  ]
-  edge [
-    source 608
-    target 3276
-    weight 86
-  ]
-  edge [
-    source 608
-    target 774
-    weight 156
-  ]
-  edge [
-    source 608
-    target 3600
-    weight 122
-  ]
-  edge [
-    source 608
-    target 2071
-    weight 141
-  ]
-  edge [
-    source 608
-    target 3066
-    weight 21
-  ]
-  edge [
-    source 608
-    target 3141
-    weight 149
-  ]
-  edge [
-    source 608
-    target 1632
-    weight 46
-  ]
-  edge [
-    source 608
-    target 2861
-    weight 90
-  ]
-  edge [
-    source 608
-    target 3565
-    weight 34
-  ]
-  edge [
-    source 608
-    target 3636
-    weight 26
-  ]
-  edge [
-    source 608
-    target 1887
-    weight 138
-  ]
-  edge [
-    source 608
-    target 3917
-    weight 60
-  ]
-  edge [
-    source 608
-    target 738
-    weight 29
-  ]
-  edge [
-    source 608
-    target 1053
-    weight 106
-  ]
-  edge [
-    source 608
-    target 3443
-    weight 28
-  ]
-  edge [
-    source 608
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 608
-    target 1487
-    weight 108
-  ]
-  edge [
-    source 608
-    target 1080
-    weight 58
-  ]
-  edge [
-    source 608
-    target 2700
-    weight 85
-  ]
-  edge [
-    source 608
-    target 3993
-    weight 66
-  ]
-  edge [
-    source 608
-    target 2204
-    weight 23
-  ]
-  edge [
-    source 608
-    target 1995
-    weight 58
-  ]
-  edge [
-    source 608
-    target 3423
-    weight 41
-  ]
-  edge [
-    source 608
-    target 1647
-    weight 71
-  ]
-  edge [
-    source 608
-    target 3374
-    weight 29
-  ]
-  edge [
-    source 608
-    target 4051
-    weight 117
-  ]
-  edge [
-    source 608
-    target 3145
-    weight 95
-  ]
-  edge [
-    source 608
-    target 1505
-    weight 35
-  ]
-  edge [
-    source 608
-    target 3282
-    weight 49
-  ]
-  edge [
-    source 608
-    target 3542
-    weight 27
-  ]
-  edge [
-    source 608
-    target 2890
-    weight 37
-  ]
-  edge [
-    source 608
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 608
-    target 1582
-    weight 66
-  ]
-  edge [
-    source 608
-    target 798
-    weight 45
-  ]
-  edge [
-    source 608
-    target 2519
-    weight 37
-  ]
-  edge [
-    source 608
-    target 3642
-    weight 44
-  ]
-  edge [
-    source 608
-    target 1254
-    weight 29
-  ]
-  edge [
-    source 608
-    target 1185
-    weight 24
-  ]
-  edge [
-    source 608
-    target 2870
-    weight 34
-  ]
-  edge [
-    source 608
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 608
-    target 2058
-    weight 24
-  ]
-  edge [
-    source 608
-    target 874
-    weight 21
-  ]
-  edge [
-    source 630
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 630
-    target 774
-    weight 60
-  ]
-  edge [
-    source 630
-    target 751
-    weight 59
-  ]
-  edge [
-    source 630
-    target 3141
-    weight 60
-  ]
-  edge [
-    source 630
-    target 1887
-    weight 53
-  ]
-  edge [
-    source 630
-    target 3521
-    weight 71
-  ]
-  edge [
-    source 630
-    target 2071
-    weight 46
-  ]
-  edge [
-    source 630
-    target 1254
-    weight 29
-  ]
-  edge [
-    source 630
-    target 1616
-    weight 58
-  ]
-  edge [
-    source 630
-    target 3954
-    weight 22
-  ]
-  edge [
-    source 630
-    target 1053
-    weight 51
-  ]
-  edge [
-    source 630
-    target 3276
-    weight 30
-  ]
-  edge [
-    source 630
-    target 1080
-    weight 31
-  ]
-  edge [
-    source 630
-    target 1995
-    weight 26
-  ]
-  edge [
-    source 630
-    target 1632
-    weight 28
-  ]
-  edge [
-    source 630
-    target 2861
-    weight 38
-  ]
-  edge [
-    source 630
-    target 4051
-    weight 58
-  ]
-  edge [
-    source 630
-    target 738
-    weight 23
-  ]
-  edge [
-    source 630
-    target 3174
-    weight 38
-  ]
-  edge [
-    source 630
-    target 1647
-    weight 22
-  ]
-  edge [
-    source 630
-    target 1487
-    weight 38
-  ]
-  edge [
-    source 630
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 630
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 630
-    target 2700
-    weight 25
-  ]
-  edge [
-    source 630
-    target 1582
-    weight 27
-  ]
-  edge [
-    source 632
-    target 3141
-    weight 89
-  ]
-  edge [
-    source 632
-    target 774
-    weight 89
-  ]
-  edge [
-    source 632
-    target 2700
-    weight 48
-  ]
-  edge [
-    source 632
-    target 1616
-    weight 91
-  ]
-  edge [
-    source 632
-    target 3565
-    weight 38
-  ]
-  edge [
-    source 632
-    target 1887
-    weight 83
-  ]
-  edge [
-    source 632
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 632
-    target 3600
-    weight 60
-  ]
-  edge [
-    source 632
-    target 1487
-    weight 55
-  ]
-  edge [
-    source 632
-    target 2861
-    weight 67
-  ]
-  edge [
-    source 632
-    target 751
-    weight 80
-  ]
-  edge [
-    source 632
-    target 1080
-    weight 38
-  ]
-  edge [
-    source 632
-    target 4051
-    weight 75
-  ]
-  edge [
-    source 632
-    target 2071
-    weight 75
-  ]
-  edge [
-    source 632
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 632
-    target 1582
-    weight 40
-  ]
-  edge [
-    source 632
-    target 1995
-    weight 32
-  ]
-  edge [
-    source 632
-    target 1053
-    weight 56
-  ]
-  edge [
-    source 632
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 632
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 632
-    target 3145
-    weight 49
-  ]
-  edge [
-    source 632
-    target 1647
-    weight 37
-  ]
-  edge [
-    source 632
-    target 3276
-    weight 33
-  ]
-  edge [
-    source 632
-    target 3993
-    weight 33
-  ]
-  edge [
-    source 632
-    target 3282
-    weight 23
-  ]
-  edge [
-    source 632
-    target 1632
-    weight 31
-  ]
-  edge [
-    source 632
-    target 738
-    weight 27
-  ]
-  edge [
-    source 632
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 632
-    target 3917
-    weight 28
-  ]
-  edge [
-    source 648
-    target 2744
-    weight 28
-  ]
-  edge [
-    source 648
-    target 3521
-    weight 27
-  ]
-  edge [
-    source 651
-    target 3917
-    weight 31
-  ]
-  edge [
-    source 651
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 651
-    target 3145
-    weight 42
-  ]
-  edge [
-    source 651
-    target 1053
-    weight 32
-  ]
-  edge [
-    source 651
-    target 1080
-    weight 23
-  ]
-  edge [
-    source 651
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 651
-    target 774
-    weight 42
-  ]
-  edge [
-    source 651
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 651
-    target 2071
-    weight 39
-  ]
-  edge [
-    source 651
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 651
-    target 3174
-    weight 27
-  ]
-  edge [
-    source 651
-    target 2861
-    weight 34
-  ]
-  edge [
-    source 651
-    target 1616
-    weight 39
-  ]
-  edge [
-    source 651
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 651
-    target 4051
-    weight 39
-  ]
-  edge [
-    source 651
-    target 751
-    weight 38
-  ]
-  edge [
-    source 651
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 651
-    target 1887
-    weight 41
-  ]
-  edge [
-    source 651
-    target 1582
-    weight 23
-  ]
-  edge [
-    source 651
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 653
-    target 774
-    weight 34
-  ]
-  edge [
-    source 653
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 653
-    target 1616
-    weight 33
-  ]
-  edge [
-    source 653
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 653
-    target 1887
-    weight 33
-  ]
-  edge [
-    source 653
-    target 3521
-    weight 34
-  ]
-  edge [
-    source 653
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 653
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 653
-    target 1487
-    weight 26
-  ]
-  edge [
-    source 653
-    target 4051
-    weight 30
-  ]
-  edge [
-    source 653
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 653
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 653
-    target 1053
-    weight 30
-  ]
-  edge [
-    source 653
-    target 751
-    weight 32
-  ]
-  edge [
-    source 661
-    target 3521
-    weight 32
-  ]
-  edge [
-    source 661
-    target 1616
-    weight 28
-  ]
-  edge [
-    source 661
-    target 774
-    weight 30
-  ]
-  edge [
-    source 661
-    target 751
-    weight 26
-  ]
-  edge [
-    source 661
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 661
-    target 1887
-    weight 21
-  ]
-  edge [
-    source 661
-    target 1053
-    weight 23
-  ]
-  edge [
-    source 661
-    target 3141
-    weight 27
-  ]
-  edge [
-    source 661
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 661
-    target 3145
-    weight 22
-  ]
-  edge [
-    source 671
-    target 3600
-    weight 88
-  ]
-  edge [
-    source 671
-    target 751
-    weight 115
-  ]
-  edge [
-    source 671
-    target 774
-    weight 116
-  ]
-  edge [
-    source 671
-    target 1616
-    weight 109
-  ]
-  edge [
-    source 671
-    target 2191
-    weight 45
-  ]
-  edge [
-    source 671
-    target 1487
-    weight 116
-  ]
-  edge [
-    source 671
-    target 3521
-    weight 144
-  ]
-  edge [
-    source 671
-    target 1647
-    weight 83
-  ]
-  edge [
-    source 671
-    target 3177
-    weight 21
-  ]
-  edge [
-    source 671
-    target 1053
-    weight 86
-  ]
-  edge [
-    source 671
-    target 2071
-    weight 127
-  ]
-  edge [
-    source 671
-    target 2861
-    weight 97
-  ]
-  edge [
-    source 671
-    target 3066
-    weight 35
-  ]
-  edge [
-    source 671
-    target 3937
-    weight 23
-  ]
-  edge [
-    source 671
-    target 3565
-    weight 40
-  ]
-  edge [
-    source 671
-    target 1409
-    weight 39
-  ]
-  edge [
-    source 671
-    target 986
-    weight 30
-  ]
-  edge [
-    source 671
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 671
-    target 3282
-    weight 53
-  ]
-  edge [
-    source 671
-    target 4051
-    weight 107
-  ]
-  edge [
-    source 671
-    target 3993
-    weight 79
-  ]
-  edge [
-    source 671
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 671
-    target 2519
-    weight 50
-  ]
-  edge [
-    source 671
-    target 1995
-    weight 70
-  ]
-  edge [
-    source 671
-    target 1080
-    weight 57
-  ]
-  edge [
-    source 671
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 671
-    target 3145
-    weight 80
-  ]
-  edge [
-    source 671
-    target 1254
-    weight 29
-  ]
-  edge [
-    source 671
-    target 1887
-    weight 104
-  ]
-  edge [
-    source 671
-    target 3276
-    weight 65
-  ]
-  edge [
-    source 671
-    target 2287
-    weight 43
-  ]
-  edge [
-    source 671
-    target 3420
-    weight 38
-  ]
-  edge [
-    source 671
-    target 3253
-    weight 23
-  ]
-  edge [
-    source 671
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 671
-    target 1582
-    weight 56
-  ]
-  edge [
-    source 671
-    target 798
-    weight 39
-  ]
-  edge [
-    source 671
-    target 2204
-    weight 30
-  ]
-  edge [
-    source 671
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 671
-    target 2857
-    weight 47
-  ]
-  edge [
-    source 671
-    target 3174
-    weight 57
-  ]
-  edge [
-    source 671
-    target 3006
-    weight 26
-  ]
-  edge [
-    source 671
-    target 738
-    weight 45
-  ]
-  edge [
-    source 671
-    target 3917
-    weight 56
-  ]
-  edge [
-    source 671
-    target 2553
-    weight 24
-  ]
-  edge [
-    source 671
-    target 3636
-    weight 27
-  ]
-  edge [
-    source 671
-    target 3423
-    weight 61
-  ]
-  edge [
-    source 671
-    target 1757
-    weight 29
-  ]
-  edge [
-    source 671
-    target 3542
-    weight 33
-  ]
-  edge [
-    source 671
-    target 2890
-    weight 26
-  ]
-  edge [
-    source 671
-    target 1154
-    weight 24
-  ]
-  edge [
-    source 671
-    target 3962
-    weight 45
-  ]
-  edge [
-    source 671
-    target 3443
-    weight 31
-  ]
-  edge [
-    source 671
-    target 3374
-    weight 39
-  ]
-  edge [
-    source 671
-    target 1632
-    weight 54
-  ]
-  edge [
-    source 671
-    target 3040
-    weight 32
-  ]
-  edge [
-    source 671
-    target 2870
-    weight 43
-  ]
-  edge [
-    source 671
-    target 1505
-    weight 40
-  ]
-  edge [
-    source 671
-    target 2543
-    weight 24
-  ]
-  edge [
-    source 671
-    target 2800
-    weight 28
-  ]
-  edge [
-    source 671
-    target 3642
-    weight 38
-  ]
-  edge [
-    source 671
-    target 874
-    weight 33
-  ]
-  edge [
-    source 671
-    target 2058
-    weight 30
-  ]
-  edge [
-    source 675
-    target 1582
-    weight 92
-  ]
-  edge [
-    source 675
-    target 3521
-    weight 130
-  ]
-  edge [
-    source 675
-    target 3174
-    weight 68
-  ]
-  edge [
-    source 675
-    target 1616
-    weight 117
-  ]
-  edge [
-    source 675
-    target 2519
-    weight 35
-  ]
-  edge [
-    source 675
-    target 3642
-    weight 37
-  ]
-  edge [
-    source 675
-    target 3993
-    weight 54
-  ]
-  edge [
-    source 675
-    target 3917
-    weight 49
-  ]
-  edge [
-    source 675
-    target 774
-    weight 120
-  ]
-  edge [
-    source 675
-    target 3141
-    weight 117
-  ]
-  edge [
-    source 675
-    target 1887
-    weight 117
-  ]
-  edge [
-    source 675
-    target 1487
-    weight 92
-  ]
-  edge [
-    source 675
-    target 2071
-    weight 104
-  ]
-  edge [
-    source 675
-    target 2890
-    weight 35
-  ]
-  edge [
-    source 675
-    target 3145
-    weight 78
-  ]
-  edge [
-    source 675
-    target 1053
-    weight 80
-  ]
-  edge [
-    source 675
-    target 751
-    weight 105
-  ]
-  edge [
-    source 675
-    target 3423
-    weight 34
-  ]
-  edge [
-    source 675
-    target 4051
-    weight 106
-  ]
-  edge [
-    source 675
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 675
-    target 3253
-    weight 24
-  ]
-  edge [
-    source 675
-    target 2857
-    weight 29
-  ]
-  edge [
-    source 675
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 675
-    target 2058
-    weight 27
-  ]
-  edge [
-    source 675
-    target 3276
-    weight 66
-  ]
-  edge [
-    source 675
-    target 798
-    weight 36
-  ]
-  edge [
-    source 675
-    target 2861
-    weight 85
-  ]
-  edge [
-    source 675
-    target 3542
-    weight 39
-  ]
-  edge [
-    source 675
-    target 1080
-    weight 47
-  ]
-  edge [
-    source 675
-    target 3600
-    weight 70
-  ]
-  edge [
-    source 675
-    target 1995
-    weight 41
-  ]
-  edge [
-    source 675
-    target 1647
-    weight 52
-  ]
-  edge [
-    source 675
-    target 1505
-    weight 25
-  ]
-  edge [
-    source 675
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 675
-    target 738
-    weight 22
-  ]
-  edge [
-    source 675
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 675
-    target 1632
-    weight 32
-  ]
-  edge [
-    source 675
-    target 3282
-    weight 32
-  ]
-  edge [
-    source 689
-    target 3521
-    weight 135
-  ]
-  edge [
-    source 689
-    target 1487
-    weight 176
-  ]
-  edge [
-    source 689
-    target 3145
-    weight 47
-  ]
-  edge [
-    source 689
-    target 2861
-    weight 70
-  ]
-  edge [
-    source 689
-    target 1616
-    weight 105
-  ]
-  edge [
-    source 689
-    target 751
-    weight 117
-  ]
-  edge [
-    source 689
-    target 3374
-    weight 75
-  ]
-  edge [
-    source 689
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 689
-    target 4051
-    weight 88
-  ]
-  edge [
-    source 689
-    target 2071
-    weight 107
-  ]
-  edge [
-    source 689
-    target 3993
-    weight 36
-  ]
-  edge [
-    source 689
-    target 2191
-    weight 29
-  ]
-  edge [
-    source 689
-    target 3600
-    weight 59
-  ]
-  edge [
-    source 689
-    target 3276
-    weight 43
-  ]
-  edge [
-    source 689
-    target 1995
-    weight 24
-  ]
-  edge [
-    source 689
-    target 3077
-    weight 36
-  ]
-  edge [
-    source 689
-    target 1080
-    weight 42
-  ]
-  edge [
-    source 689
-    target 3917
-    weight 30
-  ]
-  edge [
-    source 689
-    target 3423
-    weight 59
-  ]
-  edge [
-    source 689
-    target 3141
-    weight 91
-  ]
-  edge [
-    source 689
-    target 1887
-    weight 77
-  ]
-  edge [
-    source 689
-    target 3408
-    weight 41
-  ]
-  edge [
-    source 689
-    target 1318
-    weight 26
-  ]
-  edge [
-    source 689
-    target 1053
-    weight 37
-  ]
-  edge [
-    source 689
-    target 3174
-    weight 40
-  ]
-  edge [
-    source 689
-    target 774
-    weight 101
-  ]
-  edge [
-    source 689
-    target 2700
-    weight 22
-  ]
-  edge [
-    source 689
-    target 1582
-    weight 30
-  ]
-  edge [
-    source 712
-    target 3521
-    weight 60
-  ]
-  edge [
-    source 712
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 712
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 712
-    target 751
-    weight 49
-  ]
-  edge [
-    source 712
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 712
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 712
-    target 1616
-    weight 49
-  ]
-  edge [
-    source 712
-    target 2071
-    weight 46
-  ]
-  edge [
-    source 712
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 712
-    target 1995
-    weight 26
-  ]
-  edge [
-    source 712
-    target 1080
-    weight 24
-  ]
-  edge [
-    source 712
-    target 2861
-    weight 39
-  ]
-  edge [
-    source 712
-    target 3145
-    weight 30
-  ]
-  edge [
-    source 712
-    target 738
-    weight 35
-  ]
-  edge [
-    source 712
-    target 2700
-    weight 22
-  ]
-  edge [
-    source 712
-    target 4051
-    weight 44
-  ]
-  edge [
-    source 712
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 712
-    target 774
-    weight 45
-  ]
-  edge [
-    source 712
-    target 1053
-    weight 30
-  ]
-  edge [
-    source 712
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 712
-    target 3276
-    weight 22
-  ]
-  edge [
-    source 717
-    target 2861
-    weight 56
-  ]
-  edge [
-    source 717
-    target 1616
-    weight 71
-  ]
-  edge [
-    source 717
-    target 3141
-    weight 61
-  ]
-  edge [
-    source 717
-    target 4051
-    weight 67
-  ]
-  edge [
-    source 717
-    target 1887
-    weight 64
-  ]
-  edge [
-    source 717
-    target 3521
-    weight 74
-  ]
-  edge [
-    source 717
-    target 2071
-    weight 61
-  ]
-  edge [
-    source 717
-    target 1461
-    weight 21
-  ]
-  edge [
-    source 717
-    target 1080
-    weight 53
-  ]
-  edge [
-    source 717
-    target 751
-    weight 66
-  ]
-  edge [
-    source 717
-    target 738
-    weight 33
-  ]
-  edge [
-    source 717
-    target 3145
-    weight 42
-  ]
-  edge [
-    source 717
-    target 724
-    weight 23
-  ]
-  edge [
-    source 717
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 717
-    target 3066
-    weight 25
-  ]
-  edge [
-    source 717
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 717
-    target 1995
-    weight 35
-  ]
-  edge [
-    source 717
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 717
-    target 4154
-    weight 22
-  ]
-  edge [
-    source 717
-    target 3954
-    weight 35
-  ]
-  edge [
-    source 717
-    target 2543
-    weight 24
-  ]
-  edge [
-    source 717
-    target 798
-    weight 22
-  ]
-  edge [
-    source 717
-    target 1254
-    weight 22
-  ]
-  edge [
-    source 717
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 717
-    target 1053
-    weight 40
-  ]
-  edge [
-    source 717
-    target 1632
-    weight 38
-  ]
-  edge [
-    source 717
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 717
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 717
-    target 3040
-    weight 25
-  ]
-  edge [
-    source 717
-    target 1487
-    weight 39
-  ]
-  edge [
-    source 717
-    target 2287
-    weight 23
-  ]
-  edge [
-    source 717
-    target 3282
-    weight 26
-  ]
-  edge [
-    source 717
-    target 774
-    weight 59
-  ]
-  edge [
-    source 717
-    target 1647
-    weight 28
-  ]
-  edge [
-    source 717
-    target 2519
-    weight 25
-  ]
-  edge [
-    source 717
-    target 1582
-    weight 27
-  ]
-  edge [
-    source 717
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 717
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 719
-    target 3600
-    weight 41
-  ]
-  edge [
-    source 719
-    target 751
-    weight 55
-  ]
-  edge [
-    source 719
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 719
-    target 3423
-    weight 38
-  ]
-  edge [
-    source 719
-    target 1616
-    weight 60
-  ]
-  edge [
-    source 719
-    target 4051
-    weight 48
-  ]
-  edge [
-    source 719
-    target 1487
-    weight 59
-  ]
-  edge [
-    source 719
-    target 3521
-    weight 67
-  ]
-  edge [
-    source 719
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 719
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 719
-    target 1582
-    weight 25
-  ]
-  edge [
-    source 719
-    target 2700
-    weight 35
-  ]
-  edge [
-    source 719
-    target 774
-    weight 50
-  ]
-  edge [
-    source 719
-    target 1647
-    weight 38
-  ]
-  edge [
-    source 719
-    target 3993
-    weight 41
-  ]
-  edge [
-    source 719
-    target 1080
-    weight 29
-  ]
-  edge [
-    source 719
-    target 3141
-    weight 52
-  ]
-  edge [
-    source 719
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 719
-    target 3917
-    weight 23
-  ]
-  edge [
-    source 719
-    target 2071
-    weight 58
-  ]
-  edge [
-    source 719
-    target 1053
-    weight 36
-  ]
-  edge [
-    source 719
-    target 1887
-    weight 44
-  ]
-  edge [
-    source 719
-    target 1995
-    weight 27
-  ]
-  edge [
-    source 719
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 719
-    target 1409
-    weight 23
-  ]
-  edge [
-    source 719
-    target 3282
-    weight 25
-  ]
-  edge [
-    source 719
-    target 738
-    weight 21
-  ]
-  edge [
-    source 719
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 719
-    target 1632
-    weight 23
-  ]
-  edge [
-    source 719
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 724
-    target 2519
-    weight 93
-  ]
-  edge [
-    source 724
-    target 2071
-    weight 245
-  ]
-  edge [
-    source 724
-    target 1254
-    weight 106
-  ]
-  edge [
-    source 724
-    target 3145
-    weight 187
-  ]
-  edge [
-    source 724
-    target 3600
-    weight 145
-  ]
-  edge [
-    source 724
-    target 751
-    weight 255
-  ]
-  edge [
-    source 724
-    target 1887
-    weight 236
-  ]
-  edge [
-    source 724
-    target 3565
-    weight 85
-  ]
-  edge [
-    source 724
-    target 1647
-    weight 125
-  ]
-  edge [
-    source 724
-    target 2861
-    weight 232
-  ]
-  edge [
-    source 724
-    target 1582
-    weight 122
-  ]
-  edge [
-    source 724
-    target 1616
-    weight 281
-  ]
-  edge [
-    source 724
-    target 4051
-    weight 247
-  ]
-  edge [
-    source 724
-    target 2543
-    weight 79
-  ]
-  edge [
-    source 724
-    target 3276
-    weight 140
-  ]
-  edge [
-    source 724
-    target 3521
-    weight 283
-  ]
-  edge [
-    source 724
-    target 3377
-    weight 31
-  ]
-  edge [
-    source 724
-    target 1995
-    weight 181
-  ]
-  edge [
-    source 724
-    target 1632
-    weight 183
-  ]
-  edge [
-    source 724
-    target 3006
-    weight 111
-  ]
-  edge [
-    source 724
-    target 1505
-    weight 103
-  ]
-  edge [
-    source 724
-    target 3253
-    weight 48
-  ]
-  edge [
-    source 724
-    target 3052
-    weight 51
-  ]
-  edge [
-    source 724
-    target 738
-    weight 132
-  ]
-  edge [
-    source 724
-    target 3066
-    weight 98
-  ]
-  edge [
-    source 724
-    target 3282
-    weight 117
-  ]
-  edge [
-    source 724
-    target 3174
-    weight 151
-  ]
-  edge [
-    source 724
-    target 4154
-    weight 90
-  ]
-  edge [
-    source 724
-    target 1766
-    weight 22
-  ]
-  edge [
-    source 724
-    target 1127
-    weight 56
-  ]
-  edge [
-    source 724
-    target 3636
-    weight 78
-  ]
-  edge [
-    source 724
-    target 2287
-    weight 87
-  ]
-  edge [
-    source 724
-    target 1053
-    weight 213
-  ]
-  edge [
-    source 724
-    target 3954
-    weight 131
-  ]
-  edge [
-    source 724
-    target 1080
-    weight 194
-  ]
-  edge [
-    source 724
-    target 1461
-    weight 36
-  ]
-  edge [
-    source 724
-    target 1757
-    weight 52
-  ]
-  edge [
-    source 724
-    target 774
-    weight 255
-  ]
-  edge [
-    source 724
-    target 1487
-    weight 169
-  ]
-  edge [
-    source 724
-    target 3642
-    weight 119
-  ]
-  edge [
-    source 724
-    target 3141
-    weight 251
-  ]
-  edge [
-    source 724
-    target 2204
-    weight 66
-  ]
-  edge [
-    source 724
-    target 3993
-    weight 131
-  ]
-  edge [
-    source 724
-    target 798
-    weight 92
-  ]
-  edge [
-    source 724
-    target 3847
-    weight 26
-  ]
-  edge [
-    source 724
-    target 3420
-    weight 60
-  ]
-  edge [
-    source 724
-    target 2700
-    weight 164
-  ]
-  edge [
-    source 724
-    target 3040
-    weight 111
-  ]
-  edge [
-    source 724
-    target 1195
-    weight 36
-  ]
-  edge [
-    source 724
-    target 3884
-    weight 22
-  ]
-  edge [
-    source 724
-    target 874
-    weight 46
-  ]
-  edge [
-    source 724
-    target 1938
-    weight 41
-  ]
-  edge [
-    source 724
-    target 3542
-    weight 103
-  ]
-  edge [
-    source 724
-    target 1360
-    weight 48
-  ]
-  edge [
-    source 724
-    target 4162
-    weight 59
-  ]
-  edge [
-    source 724
-    target 1322
-    weight 28
-  ]
-  edge [
-    source 724
-    target 1280
-    weight 22
-  ]
-  edge [
-    source 724
-    target 2870
-    weight 91
-  ]
-  edge [
-    source 724
-    target 3917
-    weight 105
-  ]
-  edge [
-    source 724
-    target 2890
-    weight 63
-  ]
-  edge [
-    source 724
-    target 1507
-    weight 58
-  ]
-  edge [
-    source 724
-    target 3443
-    weight 65
-  ]
-  edge [
-    source 724
-    target 2857
-    weight 102
-  ]
-  edge [
-    source 724
-    target 1185
-    weight 53
-  ]
-  edge [
-    source 724
-    target 1707
-    weight 51
-  ]
-  edge [
-    source 724
-    target 2058
-    weight 47
-  ]
-  edge [
-    source 724
-    target 968
-    weight 52
-  ]
-  edge [
-    source 724
-    target 3374
-    weight 57
-  ]
-  edge [
-    source 724
-    target 2800
-    weight 40
-  ]
-  edge [
-    source 724
-    target 2810
-    weight 28
-  ]
-  edge [
-    source 724
-    target 1943
-    weight 23
-  ]
-  edge [
-    source 724
-    target 2191
-    weight 64
-  ]
-  edge [
-    source 724
-    target 3295
-    weight 45
-  ]
-  edge [
-    source 724
-    target 2553
-    weight 58
-  ]
-  edge [
-    source 724
-    target 3423
-    weight 76
-  ]
-  edge [
-    source 724
-    target 3962
-    weight 52
-  ]
-  edge [
-    source 724
-    target 1523
-    weight 26
-  ]
-  edge [
-    source 724
-    target 1409
-    weight 50
-  ]
-  edge [
-    source 724
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 724
-    target 986
-    weight 27
-  ]
-  edge [
-    source 724
-    target 1420
-    weight 30
-  ]
-  edge [
-    source 733
-    target 774
-    weight 119
-  ]
-  edge [
-    source 733
-    target 751
-    weight 119
-  ]
-  edge [
-    source 733
-    target 3141
-    weight 123
-  ]
-  edge [
-    source 733
-    target 1887
-    weight 115
-  ]
-  edge [
-    source 733
-    target 3174
-    weight 44
-  ]
-  edge [
-    source 733
-    target 3521
-    weight 163
-  ]
-  edge [
-    source 733
-    target 3993
-    weight 74
-  ]
-  edge [
-    source 733
-    target 2857
-    weight 32
-  ]
-  edge [
-    source 733
-    target 2700
-    weight 76
-  ]
-  edge [
-    source 733
-    target 1053
-    weight 104
-  ]
-  edge [
-    source 733
-    target 2861
-    weight 127
-  ]
-  edge [
-    source 733
-    target 1080
-    weight 78
-  ]
-  edge [
-    source 733
-    target 1254
-    weight 25
-  ]
-  edge [
-    source 733
-    target 3636
-    weight 38
-  ]
-  edge [
-    source 733
-    target 1154
-    weight 34
-  ]
-  edge [
-    source 733
-    target 1616
-    weight 128
-  ]
-  edge [
-    source 733
-    target 2071
-    weight 140
-  ]
-  edge [
-    source 733
-    target 986
-    weight 30
-  ]
-  edge [
-    source 733
-    target 2204
-    weight 34
-  ]
-  edge [
-    source 733
-    target 2890
-    weight 26
-  ]
-  edge [
-    source 733
-    target 3565
-    weight 52
-  ]
-  edge [
-    source 733
-    target 1995
-    weight 88
-  ]
-  edge [
-    source 733
-    target 3954
-    weight 28
-  ]
-  edge [
-    source 733
-    target 738
-    weight 70
-  ]
-  edge [
-    source 733
-    target 4051
-    weight 109
-  ]
-  edge [
-    source 733
-    target 3066
-    weight 22
-  ]
-  edge [
-    source 733
-    target 1647
-    weight 77
-  ]
-  edge [
-    source 733
-    target 3253
-    weight 27
-  ]
-  edge [
-    source 733
-    target 3642
-    weight 42
-  ]
-  edge [
-    source 733
-    target 3600
-    weight 71
-  ]
-  edge [
-    source 733
-    target 3282
-    weight 42
-  ]
-  edge [
-    source 733
-    target 1487
-    weight 92
-  ]
-  edge [
-    source 733
-    target 1582
-    weight 52
-  ]
-  edge [
-    source 733
-    target 3276
-    weight 52
-  ]
-  edge [
-    source 733
-    target 2553
-    weight 26
-  ]
-  edge [
-    source 733
-    target 3423
-    weight 32
-  ]
-  edge [
-    source 733
-    target 2287
-    weight 30
-  ]
-  edge [
-    source 733
-    target 2191
-    weight 25
-  ]
-  edge [
-    source 733
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 733
-    target 3040
-    weight 41
-  ]
-  edge [
-    source 733
-    target 1757
-    weight 22
-  ]
-  edge [
-    source 733
-    target 1409
-    weight 36
-  ]
-  edge [
-    source 733
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 733
-    target 2870
-    weight 40
-  ]
-  edge [
-    source 733
-    target 1632
-    weight 55
-  ]
-  edge [
-    source 733
-    target 3542
-    weight 34
-  ]
-  edge [
-    source 733
-    target 3006
-    weight 46
-  ]
-  edge [
-    source 733
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 733
-    target 3917
-    weight 34
-  ]
-  edge [
-    source 733
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 733
-    target 3374
-    weight 24
-  ]
-  edge [
-    source 733
-    target 1505
-    weight 31
-  ]
-  edge [
-    source 733
-    target 3145
-    weight 63
-  ]
-  edge [
-    source 733
-    target 798
-    weight 31
-  ]
-  edge [
-    source 733
-    target 874
-    weight 23
-  ]
-  edge [
-    source 733
-    target 2810
-    weight 23
-  ]
-  edge [
-    source 733
-    target 2519
-    weight 39
-  ]
-  edge [
-    source 738
-    target 3521
-    weight 1762
-  ]
-  edge [
-    source 738
-    target 751
-    weight 1449
-  ]
-  edge [
-    source 738
-    target 1995
-    weight 933
-  ]
-  edge [
-    source 738
-    target 774
-    weight 1413
-  ]
-  edge [
-    source 738
-    target 3141
-    weight 1375
-  ]
-  edge [
-    source 738
-    target 2614
-    weight 74
-  ]
-  edge [
-    source 738
-    target 798
-    weight 362
-  ]
-  edge [
-    source 738
-    target 2071
-    weight 1347
-  ]
-  edge [
-    source 738
-    target 3636
-    weight 356
-  ]
-  edge [
-    source 738
-    target 3253
-    weight 237
-  ]
-  edge [
-    source 738
-    target 1647
-    weight 680
-  ]
-  edge [
-    source 738
-    target 1616
-    weight 1508
-  ]
-  edge [
-    source 738
-    target 3917
-    weight 418
-  ]
-  edge [
-    source 738
-    target 4051
-    weight 1342
-  ]
-  edge [
-    source 738
-    target 3542
-    weight 399
-  ]
-  edge [
-    source 738
-    target 1080
-    weight 815
-  ]
-  edge [
-    source 738
-    target 3066
-    weight 274
-  ]
-  edge [
-    source 738
-    target 1053
-    weight 1130
-  ]
-  edge [
-    source 738
-    target 2204
-    weight 237
-  ]
-  edge [
-    source 738
-    target 2800
-    weight 126
-  ]
-  edge [
-    source 738
-    target 2287
-    weight 305
-  ]
-  edge [
-    source 738
-    target 2861
-    weight 1195
-  ]
-  edge [
-    source 738
-    target 1632
-    weight 681
-  ]
-  edge [
-    source 738
-    target 3006
-    weight 318
-  ]
-  edge [
-    source 738
-    target 2082
-    weight 29
-  ]
-  edge [
-    source 738
-    target 2232
-    weight 23
-  ]
-  edge [
-    source 738
-    target 3052
-    weight 154
-  ]
-  edge [
-    source 738
-    target 3282
-    weight 459
-  ]
-  edge [
-    source 738
-    target 2978
-    weight 22
-  ]
-  edge [
-    source 738
-    target 3600
-    weight 781
-  ]
-  edge [
-    source 738
-    target 3565
-    weight 449
-  ]
-  edge [
-    source 738
-    target 1409
-    weight 187
-  ]
-  edge [
-    source 738
-    target 1487
-    weight 924
-  ]
-  edge [
-    source 738
-    target 3276
-    weight 648
-  ]
-  edge [
-    source 738
-    target 3423
-    weight 321
-  ]
-  edge [
-    source 738
-    target 2890
-    weight 251
-  ]
-  edge [
-    source 738
-    target 2700
-    weight 773
-  ]
-  edge [
-    source 738
-    target 968
-    weight 192
-  ]
-  edge [
-    source 738
-    target 1582
-    weight 592
-  ]
-  edge [
-    source 738
-    target 1887
-    weight 1310
-  ]
-  edge [
-    source 738
-    target 3642
-    weight 550
-  ]
-  edge [
-    source 738
-    target 2191
-    weight 210
-  ]
-  edge [
-    source 738
-    target 1505
-    weight 371
-  ]
-  edge [
-    source 738
-    target 3040
-    weight 382
-  ]
-  edge [
-    source 738
-    target 1154
-    weight 98
-  ]
-  edge [
-    source 738
-    target 3993
-    weight 630
-  ]
-  edge [
-    source 738
-    target 3145
-    weight 839
-  ]
-  edge [
-    source 738
-    target 1258
-    weight 37
-  ]
-  edge [
-    source 738
-    target 3937
-    weight 88
-  ]
-  edge [
-    source 738
-    target 3954
-    weight 363
-  ]
-  edge [
-    source 738
-    target 2857
-    weight 370
-  ]
-  edge [
-    source 738
-    target 3174
-    weight 678
-  ]
-  edge [
-    source 738
-    target 1254
-    weight 322
-  ]
-  edge [
-    source 738
-    target 2924
-    weight 29
-  ]
-  edge [
-    source 738
-    target 4187
-    weight 39
-  ]
-  edge [
-    source 738
-    target 3443
-    weight 252
-  ]
-  edge [
-    source 738
-    target 1185
-    weight 202
-  ]
-  edge [
-    source 738
-    target 2870
-    weight 323
-  ]
-  edge [
-    source 738
-    target 1757
-    weight 214
-  ]
-  edge [
-    source 738
-    target 4160
-    weight 59
-  ]
-  edge [
-    source 738
-    target 2553
-    weight 169
-  ]
-  edge [
-    source 738
-    target 877
-    weight 21
-  ]
-  edge [
-    source 738
-    target 2543
-    weight 227
-  ]
-  edge [
-    source 738
-    target 3295
-    weight 184
-  ]
-  edge [
-    source 738
-    target 1943
-    weight 57
-  ]
-  edge [
-    source 738
-    target 2810
-    weight 85
-  ]
-  edge [
-    source 738
-    target 1127
-    weight 110
-  ]
-  edge [
-    source 738
-    target 3847
-    weight 132
-  ]
-  edge [
-    source 738
-    target 3985
-    weight 31
-  ]
-  edge [
-    source 738
-    target 2329
-    weight 73
-  ]
-  edge [
-    source 738
-    target 4040
-    weight 88
-  ]
-  edge [
-    source 738
-    target 1766
-    weight 26
-  ]
-  edge [
-    source 738
-    target 1280
-    weight 84
-  ]
-  edge [
-    source 738
-    target 3374
-    weight 246
-  ]
-  edge [
-    source 738
-    target 2519
-    weight 373
-  ]
-  edge [
-    source 738
-    target 4154
-    weight 299
-  ]
-  edge [
-    source 738
-    target 1938
-    weight 129
-  ]
-  edge [
-    source 738
-    target 3935
-    weight 36
-  ]
-  edge [
-    source 738
-    target 1461
-    weight 58
-  ]
-  edge [
-    source 738
-    target 927
-    weight 53
-  ]
-  edge [
-    source 738
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 738
-    target 3884
-    weight 84
-  ]
-  edge [
-    source 738
-    target 1554
-    weight 27
-  ]
-  edge [
-    source 738
-    target 1090
-    weight 21
-  ]
-  edge [
-    source 738
-    target 2011
-    weight 32
-  ]
-  edge [
-    source 738
-    target 2570
-    weight 36
-  ]
-  edge [
-    source 738
-    target 808
-    weight 22
-  ]
-  edge [
-    source 738
-    target 1195
-    weight 77
-  ]
-  edge [
-    source 738
-    target 1707
-    weight 102
-  ]
-  edge [
-    source 738
-    target 2743
-    weight 26
-  ]
-  edge [
-    source 738
-    target 874
-    weight 217
-  ]
-  edge [
-    source 738
-    target 4162
-    weight 124
-  ]
-  edge [
-    source 738
-    target 1517
-    weight 41
-  ]
-  edge [
-    source 738
-    target 1577
-    weight 30
-  ]
-  edge [
-    source 738
-    target 3962
-    weight 215
-  ]
-  edge [
-    source 738
-    target 986
-    weight 121
-  ]
-  edge [
-    source 738
-    target 1322
-    weight 88
-  ]
-  edge [
-    source 738
-    target 3860
-    weight 32
-  ]
-  edge [
-    source 738
-    target 3071
-    weight 32
-  ]
-  edge [
-    source 738
-    target 2054
-    weight 24
-  ]
-  edge [
-    source 738
-    target 1028
-    weight 24
-  ]
-  edge [
-    source 738
-    target 1507
-    weight 118
-  ]
-  edge [
-    source 738
-    target 1523
-    weight 113
-  ]
-  edge [
-    source 738
-    target 3077
-    weight 65
-  ]
-  edge [
-    source 738
-    target 2227
-    weight 21
-  ]
-  edge [
-    source 738
-    target 1333
-    weight 33
-  ]
-  edge [
-    source 738
-    target 1952
-    weight 40
-  ]
-  edge [
-    source 738
-    target 1360
-    weight 115
-  ]
-  edge [
-    source 738
-    target 3420
-    weight 194
-  ]
-  edge [
-    source 738
-    target 1420
-    weight 71
-  ]
-  edge [
-    source 738
-    target 3408
-    weight 38
-  ]
-  edge [
-    source 738
-    target 3377
-    weight 73
-  ]
-  edge [
-    source 738
-    target 3162
-    weight 22
-  ]
-  edge [
-    source 738
-    target 3177
-    weight 65
-  ]
-  edge [
-    source 738
-    target 2058
-    weight 189
-  ]
-  edge [
-    source 738
-    target 3641
-    weight 32
-  ]
-  edge [
-    source 738
-    target 2061
-    weight 25
-  ]
-  edge [
-    source 738
-    target 3196
-    weight 43
-  ]
-  edge [
-    source 738
-    target 2556
-    weight 33
-  ]
-  edge [
-    source 738
-    target 2531
-    weight 31
-  ]
-  edge [
-    source 738
-    target 2711
-    weight 48
-  ]
-  edge [
-    source 738
-    target 2450
-    weight 22
-  ]
-  edge [
-    source 738
-    target 1391
-    weight 34
-  ]
-  edge [
-    source 738
-    target 1798
-    weight 27
-  ]
-  edge [
-    source 738
-    target 980
-    weight 66
-  ]
-  edge [
-    source 738
-    target 4027
-    weight 38
-  ]
-  edge [
-    source 738
-    target 842
-    weight 42
-  ]
-  edge [
-    source 738
-    target 3968
-    weight 46
-  ]
-  edge [
-    source 738
-    target 4098
-    weight 34
-  ]
-  edge [
-    source 738
-    target 1125
-    weight 46
-  ]
-  edge [
-    source 738
-    target 2003
-    weight 37
-  ]
-  edge [
-    source 738
-    target 3432
-    weight 37
-  ]
-  edge [
-    source 738
-    target 1148
-    weight 26
-  ]
-  edge [
-    source 738
-    target 3877
-    weight 71
-  ]
-  edge [
-    source 738
-    target 3677
-    weight 21
-  ]
-  edge [
-    source 738
-    target 3861
-    weight 22
-  ]
-  edge [
-    source 738
-    target 2078
-    weight 44
-  ]
-  edge [
-    source 738
-    target 2099
-    weight 26
-  ]
-  edge [
-    source 738
-    target 1802
-    weight 29
-  ]
-  edge [
-    source 738
-    target 1970
-    weight 37
-  ]
-  edge [
-    source 738
-    target 869
-    weight 23
-  ]
-  edge [
-    source 751
-    target 1616
-    weight 15981
-  ]
-  edge [
-    source 751
-    target 3521
-    weight 20128
-  ]
-  edge [
-    source 751
-    target 1487
-    weight 10969
-  ]
-  edge [
-    source 751
-    target 3565
-    weight 1879
-  ]
-  edge [
-    source 751
-    target 3600
-    weight 6806
-  ]
-  edge [
-    source 751
-    target 1647
-    weight 3811
-  ]
-  edge [
-    source 751
-    target 2861
-    weight 10360
-  ]
-  edge [
-    source 751
-    target 2191
-    weight 1069
-  ]
-  edge [
-    source 751
-    target 1789
-    weight 124
-  ]
-  edge [
-    source 751
-    target 1582
-    weight 4029
-  ]
-  edge [
-    source 751
-    target 3642
-    weight 2864
-  ]
-  edge [
-    source 751
-    target 3641
-    weight 108
-  ]
-  edge [
-    source 751
-    target 2421
-    weight 24
-  ]
-  edge [
-    source 751
-    target 3374
-    weight 1176
-  ]
-  edge [
-    source 751
-    target 774
-    weight 14549
-  ]
-  edge [
-    source 751
-    target 3077
-    weight 492
-  ]
-  edge [
-    source 751
-    target 3276
-    weight 4586
-  ]
-  edge [
-    source 751
-    target 4051
-    weight 12991
-  ]
-  edge [
-    source 751
-    target 2058
-    weight 827
-  ]
-  edge [
-    source 751
-    target 3423
-    weight 1907
-  ]
-  edge [
-    source 751
-    target 1080
-    weight 4413
-  ]
-  edge [
-    source 751
-    target 3937
-    weight 248
-  ]
-  edge [
-    source 751
-    target 4187
-    weight 147
-  ]
-  edge [
-    source 751
-    target 1374
-    weight 84
-  ]
-  edge [
-    source 751
-    target 2071
-    weight 13084
-  ]
-  edge [
-    source 751
-    target 2181
-    weight 49
-  ]
-  edge [
-    source 751
-    target 1053
-    weight 6720
-  ]
-  edge [
-    source 751
-    target 3968
-    weight 111
-  ]
-  edge [
-    source 751
-    target 2628
-    weight 21
-  ]
-  edge [
-    source 751
-    target 1166
-    weight 27
-  ]
-  edge [
-    source 751
-    target 1887
-    weight 12151
-  ]
-  edge [
-    source 751
-    target 3443
-    weight 866
-  ]
-  edge [
-    source 751
-    target 1952
-    weight 143
-  ]
-  edge [
-    source 751
-    target 3377
-    weight 206
-  ]
-  edge [
-    source 751
-    target 3177
-    weight 176
-  ]
-  edge [
-    source 751
-    target 3420
-    weight 514
-  ]
-  edge [
-    source 751
-    target 2329
-    weight 119
-  ]
-  edge [
-    source 751
-    target 874
-    weight 568
-  ]
-  edge [
-    source 751
-    target 3993
-    weight 3335
-  ]
-  edge [
-    source 751
-    target 1258
-    weight 104
-  ]
-  edge [
-    source 751
-    target 3066
-    weight 702
-  ]
-  edge [
-    source 751
-    target 2700
-    weight 3683
-  ]
-  edge [
-    source 751
-    target 1995
-    weight 3945
-  ]
-  edge [
-    source 751
-    target 798
-    weight 1475
-  ]
-  edge [
-    source 751
-    target 3071
-    weight 79
-  ]
-  edge [
-    source 751
-    target 964
-    weight 63
-  ]
-  edge [
-    source 751
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 751
-    target 3141
-    weight 13669
-  ]
-  edge [
-    source 751
-    target 3145
-    weight 4174
-  ]
-  edge [
-    source 751
-    target 3693
-    weight 42
-  ]
-  edge [
-    source 751
-    target 4027
-    weight 95
-  ]
-  edge [
-    source 751
-    target 1254
-    weight 1062
-  ]
-  edge [
-    source 751
-    target 3432
-    weight 94
-  ]
-  edge [
-    source 751
-    target 1505
-    weight 1441
-  ]
-  edge [
-    source 751
-    target 3174
-    weight 4906
-  ]
-  edge [
-    source 751
-    target 3636
-    weight 735
-  ]
-  edge [
-    source 751
-    target 1943
-    weight 153
-  ]
-  edge [
-    source 751
-    target 2543
-    weight 552
-  ]
-  edge [
-    source 751
-    target 2857
-    weight 1181
-  ]
-  edge [
-    source 751
-    target 3917
-    weight 1871
-  ]
-  edge [
-    source 751
-    target 1409
-    weight 740
-  ]
-  edge [
-    source 751
-    target 3962
-    weight 846
-  ]
-  edge [
-    source 751
-    target 1707
-    weight 170
-  ]
-  edge [
-    source 751
-    target 3357
-    weight 87
-  ]
-  edge [
-    source 751
-    target 3253
-    weight 521
-  ]
-  edge [
-    source 751
-    target 3985
-    weight 72
-  ]
-  edge [
-    source 751
-    target 877
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1127
-    weight 238
-  ]
-  edge [
-    source 751
-    target 986
-    weight 350
-  ]
-  edge [
-    source 751
-    target 2227
-    weight 200
-  ]
-  edge [
-    source 751
-    target 2810
-    weight 201
-  ]
-  edge [
-    source 751
-    target 2870
-    weight 830
-  ]
-  edge [
-    source 751
-    target 3282
-    weight 1290
-  ]
-  edge [
-    source 751
-    target 2800
-    weight 319
-  ]
-  edge [
-    source 751
-    target 1757
-    weight 639
-  ]
-  edge [
-    source 751
-    target 1632
-    weight 1756
-  ]
-  edge [
-    source 751
-    target 2978
-    weight 33
-  ]
-  edge [
-    source 751
-    target 3861
-    weight 74
-  ]
-  edge [
-    source 751
-    target 1931
-    weight 62
-  ]
-  edge [
-    source 751
-    target 927
-    weight 135
-  ]
-  edge [
-    source 751
-    target 1507
-    weight 310
-  ]
-  edge [
-    source 751
-    target 4152
-    weight 103
-  ]
-  edge [
-    source 751
-    target 3542
-    weight 1063
-  ]
-  edge [
-    source 751
-    target 2573
-    weight 52
-  ]
-  edge [
-    source 751
-    target 842
-    weight 99
-  ]
-  edge [
-    source 751
-    target 2614
-    weight 149
-  ]
-  edge [
-    source 751
-    target 1425
-    weight 47
-  ]
-  edge [
-    source 751
-    target 3954
-    weight 862
-  ]
-  edge [
-    source 751
-    target 968
-    weight 694
-  ]
-  edge [
-    source 751
-    target 2519
-    weight 1153
-  ]
-  edge [
-    source 751
-    target 1420
-    weight 171
-  ]
-  edge [
-    source 751
-    target 2078
-    weight 167
-  ]
-  edge [
-    source 751
-    target 2204
-    weight 575
-  ]
-  edge [
-    source 751
-    target 2597
-    weight 78
-  ]
-  edge [
-    source 751
-    target 2417
-    weight 23
-  ]
-  edge [
-    source 751
-    target 2198
-    weight 50
-  ]
-  edge [
-    source 751
-    target 2924
-    weight 52
-  ]
-  edge [
-    source 751
-    target 2287
-    weight 795
-  ]
-  edge [
-    source 751
-    target 3295
-    weight 458
-  ]
-  edge [
-    source 751
-    target 2890
-    weight 1092
-  ]
-  edge [
-    source 751
-    target 1360
-    weight 299
-  ]
-  edge [
-    source 751
-    target 1154
-    weight 258
-  ]
-  edge [
-    source 751
-    target 4098
-    weight 91
-  ]
-  edge [
-    source 751
-    target 1195
-    weight 162
-  ]
-  edge [
-    source 751
-    target 4154
-    weight 1093
-  ]
-  edge [
-    source 751
-    target 3006
-    weight 673
-  ]
-  edge [
-    source 751
-    target 3052
-    weight 328
-  ]
-  edge [
-    source 751
-    target 3040
-    weight 965
-  ]
-  edge [
-    source 751
-    target 3884
-    weight 132
-  ]
-  edge [
-    source 751
-    target 3559
-    weight 39
-  ]
-  edge [
-    source 751
-    target 2082
-    weight 45
-  ]
-  edge [
-    source 751
-    target 2232
-    weight 52
-  ]
-  edge [
-    source 751
-    target 2003
-    weight 99
-  ]
-  edge [
-    source 751
-    target 2299
-    weight 22
-  ]
-  edge [
-    source 751
-    target 3112
-    weight 38
-  ]
-  edge [
-    source 751
-    target 1322
-    weight 178
-  ]
-  edge [
-    source 751
-    target 1554
-    weight 34
-  ]
-  edge [
-    source 751
-    target 1691
-    weight 46
-  ]
-  edge [
-    source 751
-    target 916
-    weight 91
-  ]
-  edge [
-    source 751
-    target 2009
-    weight 35
-  ]
-  edge [
-    source 751
-    target 4160
-    weight 89
-  ]
-  edge [
-    source 751
-    target 1938
-    weight 296
-  ]
-  edge [
-    source 751
-    target 1185
-    weight 475
-  ]
-  edge [
-    source 751
-    target 2061
-    weight 64
-  ]
-  edge [
-    source 751
-    target 1125
-    weight 164
-  ]
-  edge [
-    source 751
-    target 4007
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1333
-    weight 185
-  ]
-  edge [
-    source 751
-    target 3935
-    weight 62
-  ]
-  edge [
-    source 751
-    target 2553
-    weight 342
-  ]
-  edge [
-    source 751
-    target 2832
-    weight 33
-  ]
-  edge [
-    source 751
-    target 869
-    weight 112
-  ]
-  edge [
-    source 751
-    target 1766
-    weight 54
-  ]
-  edge [
-    source 751
-    target 1299
-    weight 30
-  ]
-  edge [
-    source 751
-    target 4100
-    weight 34
-  ]
-  edge [
-    source 751
-    target 2556
-    weight 60
-  ]
-  edge [
-    source 751
-    target 1461
-    weight 105
-  ]
-  edge [
-    source 751
-    target 3050
-    weight 60
-  ]
-  edge [
-    source 751
-    target 4040
-    weight 216
-  ]
-  edge [
-    source 751
-    target 3196
-    weight 91
-  ]
-  edge [
-    source 751
-    target 1391
-    weight 109
-  ]
-  edge [
-    source 751
-    target 3847
-    weight 227
-  ]
-  edge [
-    source 751
-    target 1543
-    weight 29
-  ]
-  edge [
-    source 751
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 751
-    target 3408
-    weight 304
-  ]
-  edge [
-    source 751
-    target 2011
-    weight 110
-  ]
-  edge [
-    source 751
-    target 4162
-    weight 343
-  ]
-  edge [
-    source 751
-    target 1232
-    weight 46
-  ]
-  edge [
-    source 751
-    target 2099
-    weight 139
-  ]
-  edge [
-    source 751
-    target 1090
-    weight 46
-  ]
-  edge [
-    source 751
-    target 2955
-    weight 62
-  ]
-  edge [
-    source 751
-    target 2711
-    weight 101
-  ]
-  edge [
-    source 751
-    target 3375
-    weight 28
-  ]
-  edge [
-    source 751
-    target 1492
-    weight 44
-  ]
-  edge [
-    source 751
-    target 3309
-    weight 26
-  ]
-  edge [
-    source 751
-    target 2570
-    weight 76
-  ]
-  edge [
-    source 751
-    target 2609
-    weight 38
-  ]
-  edge [
-    source 751
-    target 808
-    weight 33
-  ]
-  edge [
-    source 751
-    target 801
-    weight 25
-  ]
-  edge [
-    source 751
-    target 3162
-    weight 83
-  ]
-  edge [
-    source 751
-    target 2844
-    weight 53
-  ]
-  edge [
-    source 751
-    target 1523
-    weight 285
-  ]
-  edge [
-    source 751
-    target 2450
-    weight 33
-  ]
-  edge [
-    source 751
-    target 2434
-    weight 25
-  ]
-  edge [
-    source 751
-    target 1517
-    weight 142
-  ]
-  edge [
-    source 751
-    target 980
-    weight 323
-  ]
-  edge [
-    source 751
-    target 1577
-    weight 56
-  ]
-  edge [
-    source 751
-    target 1798
-    weight 81
-  ]
-  edge [
-    source 751
-    target 3956
-    weight 43
-  ]
-  edge [
-    source 751
-    target 2600
-    weight 24
-  ]
-  edge [
-    source 751
-    target 1280
-    weight 243
-  ]
-  edge [
-    source 751
-    target 1676
-    weight 34
-  ]
-  edge [
-    source 751
-    target 3324
-    weight 31
-  ]
-  edge [
-    source 751
-    target 1631
-    weight 42
-  ]
-  edge [
-    source 751
-    target 3860
-    weight 85
-  ]
-  edge [
-    source 751
-    target 1419
-    weight 71
-  ]
-  edge [
-    source 751
-    target 2054
-    weight 52
-  ]
-  edge [
-    source 751
-    target 3952
-    weight 28
-  ]
-  edge [
-    source 751
-    target 1199
-    weight 43
-  ]
-  edge [
-    source 751
-    target 1028
-    weight 61
-  ]
-  edge [
-    source 751
-    target 871
-    weight 51
-  ]
-  edge [
-    source 751
-    target 3024
-    weight 75
-  ]
-  edge [
-    source 751
-    target 3877
-    weight 248
-  ]
-  edge [
-    source 751
-    target 1856
-    weight 28
-  ]
-  edge [
-    source 751
-    target 2743
-    weight 48
-  ]
-  edge [
-    source 751
-    target 2983
-    weight 37
-  ]
-  edge [
-    source 751
-    target 2531
-    weight 86
-  ]
-  edge [
-    source 751
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 751
-    target 3146
-    weight 26
-  ]
-  edge [
-    source 751
-    target 1775
-    weight 23
-  ]
-  edge [
-    source 751
-    target 3465
-    weight 23
-  ]
-  edge [
-    source 751
-    target 1664
-    weight 25
-  ]
-  edge [
-    source 751
-    target 1832
-    weight 41
-  ]
-  edge [
-    source 751
-    target 3692
-    weight 28
-  ]
-  edge [
-    source 751
-    target 1528
-    weight 48
-  ]
-  edge [
-    source 751
-    target 1377
-    weight 21
-  ]
-  edge [
-    source 751
-    target 2953
-    weight 21
-  ]
-  edge [
-    source 751
-    target 3108
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1922
-    weight 21
-  ]
-  edge [
-    source 751
-    target 1064
-    weight 42
-  ]
-  edge [
-    source 751
-    target 1140
-    weight 55
-  ]
-  edge [
-    source 751
-    target 3663
-    weight 22
-  ]
-  edge [
-    source 751
-    target 1802
-    weight 103
-  ]
-  edge [
-    source 751
-    target 1397
-    weight 29
-  ]
-  edge [
-    source 751
-    target 3011
-    weight 29
-  ]
-  edge [
-    source 751
-    target 2115
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1148
-    weight 77
-  ]
-  edge [
-    source 751
-    target 3677
-    weight 77
-  ]
-  edge [
-    source 751
-    target 3856
-    weight 29
-  ]
-  edge [
-    source 751
-    target 2822
-    weight 83
-  ]
-  edge [
-    source 751
-    target 1326
-    weight 23
-  ]
-  edge [
-    source 751
-    target 1822
-    weight 22
-  ]
-  edge [
-    source 751
-    target 3872
-    weight 49
-  ]
-  edge [
-    source 751
-    target 1634
-    weight 32
-  ]
-  edge [
-    source 751
-    target 1349
-    weight 21
-  ]
-  edge [
-    source 751
-    target 2634
-    weight 27
-  ]
-  edge [
-    source 751
-    target 3737
-    weight 40
-  ]
-  edge [
-    source 751
-    target 1970
-    weight 132
-  ]
-  edge [
-    source 751
-    target 2836
-    weight 31
-  ]
-  edge [
-    source 751
-    target 3633
-    weight 63
-  ]
-  edge [
-    source 751
-    target 2801
-    weight 28
-  ]
-  edge [
-    source 751
-    target 3876
-    weight 51
-  ]
-  edge [
-    source 751
-    target 3462
-    weight 48
-  ]
-  edge [
-    source 751
-    target 1900
-    weight 27
-  ]
-  edge [
-    source 753
-    target 1887
-    weight 24
-  ]
-  edge [
-    source 753
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 753
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 753
-    target 1053
-    weight 22
-  ]
-  edge [
-    source 764
-    target 3521
-    weight 135
-  ]
-  edge [
-    source 764
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 774
-    target 3521
-    weight 22179
-  ]
-  edge [
-    source 774
-    target 1616
-    weight 17121
-  ]
-  edge [
-    source 774
-    target 3276
-    weight 5010
-  ]
-  edge [
-    source 774
-    target 1487
-    weight 11126
-  ]
-  edge [
-    source 774
-    target 3600
-    weight 7267
-  ]
-  edge [
-    source 774
-    target 3565
-    weight 1933
-  ]
-  edge [
-    source 774
-    target 2861
-    weight 10258
-  ]
-  edge [
-    source 774
-    target 1647
-    weight 3823
-  ]
-  edge [
-    source 774
-    target 1769
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2191
-    weight 1011
-  ]
-  edge [
-    source 774
-    target 3177
-    weight 184
-  ]
-  edge [
-    source 774
-    target 3141
-    weight 15982
-  ]
-  edge [
-    source 774
-    target 1053
-    weight 7419
-  ]
-  edge [
-    source 774
-    target 3071
-    weight 85
-  ]
-  edge [
-    source 774
-    target 964
-    weight 66
-  ]
-  edge [
-    source 774
-    target 3420
-    weight 561
-  ]
-  edge [
-    source 774
-    target 1409
-    weight 772
-  ]
-  edge [
-    source 774
-    target 3917
-    weight 1961
-  ]
-  edge [
-    source 774
-    target 3641
-    weight 101
-  ]
-  edge [
-    source 774
-    target 3642
-    weight 3086
-  ]
-  edge [
-    source 774
-    target 3542
-    weight 1172
-  ]
-  edge [
-    source 774
-    target 1582
-    weight 4619
-  ]
-  edge [
-    source 774
-    target 968
-    weight 742
-  ]
-  edge [
-    source 774
-    target 2700
-    weight 4251
-  ]
-  edge [
-    source 774
-    target 3145
-    weight 4511
-  ]
-  edge [
-    source 774
-    target 798
-    weight 1519
-  ]
-  edge [
-    source 774
-    target 2978
-    weight 36
-  ]
-  edge [
-    source 774
-    target 2071
-    weight 13500
-  ]
-  edge [
-    source 774
-    target 2857
-    weight 1241
-  ]
-  edge [
-    source 774
-    target 3993
-    weight 3479
-  ]
-  edge [
-    source 774
-    target 3423
-    weight 1898
-  ]
-  edge [
-    source 774
-    target 1080
-    weight 4339
-  ]
-  edge [
-    source 774
-    target 3077
-    weight 450
-  ]
-  edge [
-    source 774
-    target 3374
-    weight 1057
-  ]
-  edge [
-    source 774
-    target 3024
-    weight 81
-  ]
-  edge [
-    source 774
-    target 4051
-    weight 13513
-  ]
-  edge [
-    source 774
-    target 1127
-    weight 255
-  ]
-  edge [
-    source 774
-    target 874
-    weight 583
-  ]
-  edge [
-    source 774
-    target 3112
-    weight 34
-  ]
-  edge [
-    source 774
-    target 1254
-    weight 1038
-  ]
-  edge [
-    source 774
-    target 3066
-    weight 688
-  ]
-  edge [
-    source 774
-    target 3937
-    weight 242
-  ]
-  edge [
-    source 774
-    target 3174
-    weight 5140
-  ]
-  edge [
-    source 774
-    target 1995
-    weight 3828
-  ]
-  edge [
-    source 774
-    target 1258
-    weight 107
-  ]
-  edge [
-    source 774
-    target 1887
-    weight 14210
-  ]
-  edge [
-    source 774
-    target 2543
-    weight 555
-  ]
-  edge [
-    source 774
-    target 1707
-    weight 166
-  ]
-  edge [
-    source 774
-    target 3253
-    weight 552
-  ]
-  edge [
-    source 774
-    target 2870
-    weight 920
-  ]
-  edge [
-    source 774
-    target 2614
-    weight 153
-  ]
-  edge [
-    source 774
-    target 2329
-    weight 134
-  ]
-  edge [
-    source 774
-    target 3443
-    weight 974
-  ]
-  edge [
-    source 774
-    target 877
-    weight 43
-  ]
-  edge [
-    source 774
-    target 3968
-    weight 116
-  ]
-  edge [
-    source 774
-    target 3985
-    weight 76
-  ]
-  edge [
-    source 774
-    target 2810
-    weight 202
-  ]
-  edge [
-    source 774
-    target 3636
-    weight 784
-  ]
-  edge [
-    source 774
-    target 2204
-    weight 616
-  ]
-  edge [
-    source 774
-    target 1505
-    weight 1401
-  ]
-  edge [
-    source 774
-    target 1943
-    weight 142
-  ]
-  edge [
-    source 774
-    target 1425
-    weight 43
-  ]
-  edge [
-    source 774
-    target 3282
-    weight 1430
-  ]
-  edge [
-    source 774
-    target 4152
-    weight 111
-  ]
-  edge [
-    source 774
-    target 4187
-    weight 132
-  ]
-  edge [
-    source 774
-    target 842
-    weight 97
-  ]
-  edge [
-    source 774
-    target 3962
-    weight 904
-  ]
-  edge [
-    source 774
-    target 1931
-    weight 55
-  ]
-  edge [
-    source 774
-    target 1757
-    weight 704
-  ]
-  edge [
-    source 774
-    target 2058
-    weight 806
-  ]
-  edge [
-    source 774
-    target 986
-    weight 361
-  ]
-  edge [
-    source 774
-    target 1333
-    weight 178
-  ]
-  edge [
-    source 774
-    target 2181
-    weight 55
-  ]
-  edge [
-    source 774
-    target 2800
-    weight 334
-  ]
-  edge [
-    source 774
-    target 3693
-    weight 50
-  ]
-  edge [
-    source 774
-    target 1632
-    weight 1837
-  ]
-  edge [
-    source 774
-    target 3954
-    weight 851
-  ]
-  edge [
-    source 774
-    target 2227
-    weight 212
-  ]
-  edge [
-    source 774
-    target 3377
-    weight 216
-  ]
-  edge [
-    source 774
-    target 3432
-    weight 95
-  ]
-  edge [
-    source 774
-    target 1952
-    weight 136
-  ]
-  edge [
-    source 774
-    target 3860
-    weight 86
-  ]
-  edge [
-    source 774
-    target 2287
-    weight 767
-  ]
-  edge [
-    source 774
-    target 1360
-    weight 294
-  ]
-  edge [
-    source 774
-    target 2890
-    weight 1200
-  ]
-  edge [
-    source 774
-    target 2519
-    weight 1259
-  ]
-  edge [
-    source 774
-    target 2597
-    weight 88
-  ]
-  edge [
-    source 774
-    target 4154
-    weight 1190
-  ]
-  edge [
-    source 774
-    target 3006
-    weight 668
-  ]
-  edge [
-    source 774
-    target 1195
-    weight 169
-  ]
-  edge [
-    source 774
-    target 3847
-    weight 279
-  ]
-  edge [
-    source 774
-    target 3040
-    weight 907
-  ]
-  edge [
-    source 774
-    target 1154
-    weight 289
-  ]
-  edge [
-    source 774
-    target 1322
-    weight 207
-  ]
-  edge [
-    source 774
-    target 1554
-    weight 47
-  ]
-  edge [
-    source 774
-    target 1397
-    weight 30
-  ]
-  edge [
-    source 774
-    target 4027
-    weight 91
-  ]
-  edge [
-    source 774
-    target 2924
-    weight 58
-  ]
-  edge [
-    source 774
-    target 1938
-    weight 368
-  ]
-  edge [
-    source 774
-    target 2570
-    weight 85
-  ]
-  edge [
-    source 774
-    target 1185
-    weight 476
-  ]
-  edge [
-    source 774
-    target 2061
-    weight 63
-  ]
-  edge [
-    source 774
-    target 2232
-    weight 49
-  ]
-  edge [
-    source 774
-    target 1507
-    weight 312
-  ]
-  edge [
-    source 774
-    target 3935
-    weight 64
-  ]
-  edge [
-    source 774
-    target 2374
-    weight 22
-  ]
-  edge [
-    source 774
-    target 2553
-    weight 383
-  ]
-  edge [
-    source 774
-    target 1691
-    weight 47
-  ]
-  edge [
-    source 774
-    target 3408
-    weight 260
-  ]
-  edge [
-    source 774
-    target 1299
-    weight 27
-  ]
-  edge [
-    source 774
-    target 1577
-    weight 52
-  ]
-  edge [
-    source 774
-    target 1419
-    weight 77
-  ]
-  edge [
-    source 774
-    target 4100
-    weight 40
-  ]
-  edge [
-    source 774
-    target 2556
-    weight 70
-  ]
-  edge [
-    source 774
-    target 1461
-    weight 104
-  ]
-  edge [
-    source 774
-    target 1377
-    weight 26
-  ]
-  edge [
-    source 774
-    target 3050
-    weight 57
-  ]
-  edge [
-    source 774
-    target 4040
-    weight 233
-  ]
-  edge [
-    source 774
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 774
-    target 2600
-    weight 27
-  ]
-  edge [
-    source 774
-    target 4007
-    weight 41
-  ]
-  edge [
-    source 774
-    target 1280
-    weight 251
-  ]
-  edge [
-    source 774
-    target 927
-    weight 125
-  ]
-  edge [
-    source 774
-    target 3295
-    weight 500
-  ]
-  edge [
-    source 774
-    target 3956
-    weight 48
-  ]
-  edge [
-    source 774
-    target 4162
-    weight 350
-  ]
-  edge [
-    source 774
-    target 983
-    weight 22
-  ]
-  edge [
-    source 774
-    target 3375
-    weight 24
-  ]
-  edge [
-    source 774
-    target 3884
-    weight 136
-  ]
-  edge [
-    source 774
-    target 1140
-    weight 59
-  ]
-  edge [
-    source 774
-    target 2573
-    weight 48
-  ]
-  edge [
-    source 774
-    target 2531
-    weight 79
-  ]
-  edge [
-    source 774
-    target 1326
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2099
-    weight 131
-  ]
-  edge [
-    source 774
-    target 801
-    weight 25
-  ]
-  edge [
-    source 774
-    target 4160
-    weight 92
-  ]
-  edge [
-    source 774
-    target 2844
-    weight 62
-  ]
-  edge [
-    source 774
-    target 1523
-    weight 293
-  ]
-  edge [
-    source 774
-    target 1125
-    weight 173
-  ]
-  edge [
-    source 774
-    target 1166
-    weight 24
-  ]
-  edge [
-    source 774
-    target 2434
-    weight 28
-  ]
-  edge [
-    source 774
-    target 980
-    weight 339
-  ]
-  edge [
-    source 774
-    target 2711
-    weight 92
-  ]
-  edge [
-    source 774
-    target 2082
-    weight 47
-  ]
-  edge [
-    source 774
-    target 3196
-    weight 95
-  ]
-  edge [
-    source 774
-    target 1798
-    weight 70
-  ]
-  edge [
-    source 774
-    target 3861
-    weight 70
-  ]
-  edge [
-    source 774
-    target 3877
-    weight 255
-  ]
-  edge [
-    source 774
-    target 2955
-    weight 68
-  ]
-  edge [
-    source 774
-    target 1543
-    weight 35
-  ]
-  edge [
-    source 774
-    target 2009
-    weight 36
-  ]
-  edge [
-    source 774
-    target 1374
-    weight 75
-  ]
-  edge [
-    source 774
-    target 1492
-    weight 46
-  ]
-  edge [
-    source 774
-    target 3162
-    weight 89
-  ]
-  edge [
-    source 774
-    target 3052
-    weight 328
-  ]
-  edge [
-    source 774
-    target 1199
-    weight 48
-  ]
-  edge [
-    source 774
-    target 1232
-    weight 42
-  ]
-  edge [
-    source 774
-    target 871
-    weight 44
-  ]
-  edge [
-    source 774
-    target 1775
-    weight 26
-  ]
-  edge [
-    source 774
-    target 2832
-    weight 33
-  ]
-  edge [
-    source 774
-    target 3952
-    weight 34
-  ]
-  edge [
-    source 774
-    target 808
-    weight 30
-  ]
-  edge [
-    source 774
-    target 2450
-    weight 42
-  ]
-  edge [
-    source 774
-    target 1517
-    weight 136
-  ]
-  edge [
-    source 774
-    target 1631
-    weight 46
-  ]
-  edge [
-    source 774
-    target 3674
-    weight 24
-  ]
-  edge [
-    source 774
-    target 3108
-    weight 46
-  ]
-  edge [
-    source 774
-    target 1028
-    weight 58
-  ]
-  edge [
-    source 774
-    target 4098
-    weight 87
-  ]
-  edge [
-    source 774
-    target 1922
-    weight 33
-  ]
-  edge [
-    source 774
-    target 1856
-    weight 27
-  ]
-  edge [
-    source 774
-    target 1676
-    weight 38
-  ]
-  edge [
-    source 774
-    target 2003
-    weight 103
-  ]
-  edge [
-    source 774
-    target 1832
-    weight 44
-  ]
-  edge [
-    source 774
-    target 3692
-    weight 33
-  ]
-  edge [
-    source 774
-    target 1664
-    weight 24
-  ]
-  edge [
-    source 774
-    target 2628
-    weight 23
-  ]
-  edge [
-    source 774
-    target 3559
-    weight 38
-  ]
-  edge [
-    source 774
-    target 2011
-    weight 119
-  ]
-  edge [
-    source 774
-    target 2652
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2609
-    weight 35
-  ]
-  edge [
-    source 774
-    target 1766
-    weight 52
-  ]
-  edge [
-    source 774
-    target 3146
-    weight 26
-  ]
-  edge [
-    source 774
-    target 1391
-    weight 93
-  ]
-  edge [
-    source 774
-    target 1420
-    weight 192
-  ]
-  edge [
-    source 774
-    target 3465
-    weight 25
-  ]
-  edge [
-    source 774
-    target 3324
-    weight 26
-  ]
-  edge [
-    source 774
-    target 2743
-    weight 49
-  ]
-  edge [
-    source 774
-    target 3074
-    weight 23
-  ]
-  edge [
-    source 774
-    target 1802
-    weight 108
-  ]
-  edge [
-    source 774
-    target 2953
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2262
-    weight 23
-  ]
-  edge [
-    source 774
-    target 2983
-    weight 31
-  ]
-  edge [
-    source 774
-    target 3210
-    weight 23
-  ]
-  edge [
-    source 774
-    target 2054
-    weight 50
-  ]
-  edge [
-    source 774
-    target 3011
-    weight 33
-  ]
-  edge [
-    source 774
-    target 1148
-    weight 84
-  ]
-  edge [
-    source 774
-    target 2997
-    weight 22
-  ]
-  edge [
-    source 774
-    target 1528
-    weight 46
-  ]
-  edge [
-    source 774
-    target 3677
-    weight 84
-  ]
-  edge [
-    source 774
-    target 3856
-    weight 27
-  ]
-  edge [
-    source 774
-    target 3309
-    weight 24
-  ]
-  edge [
-    source 774
-    target 2822
-    weight 96
-  ]
-  edge [
-    source 774
-    target 1789
-    weight 107
-  ]
-  edge [
-    source 774
-    target 1064
-    weight 44
-  ]
-  edge [
-    source 774
-    target 3440
-    weight 36
-  ]
-  edge [
-    source 774
-    target 869
-    weight 108
-  ]
-  edge [
-    source 774
-    target 3872
-    weight 57
-  ]
-  edge [
-    source 774
-    target 1634
-    weight 32
-  ]
-  edge [
-    source 774
-    target 2115
-    weight 37
-  ]
-  edge [
-    source 774
-    target 3357
-    weight 68
-  ]
-  edge [
-    source 774
-    target 2634
-    weight 28
-  ]
-  edge [
-    source 774
-    target 1090
-    weight 42
-  ]
-  edge [
-    source 774
-    target 3737
-    weight 41
-  ]
-  edge [
-    source 774
-    target 2801
-    weight 29
-  ]
-  edge [
-    source 774
-    target 3462
-    weight 41
-  ]
-  edge [
-    source 774
-    target 1415
-    weight 21
-  ]
-  edge [
-    source 774
-    target 1970
-    weight 132
-  ]
-  edge [
-    source 774
-    target 2198
-    weight 41
-  ]
-  edge [
-    source 774
-    target 2836
-    weight 36
-  ]
-  edge [
-    source 774
-    target 2078
-    weight 172
-  ]
-  edge [
-    source 774
-    target 3633
-    weight 65
-  ]
-  edge [
-    source 774
-    target 916
-    weight 73
-  ]
-  edge [
-    source 774
-    target 3876
-    weight 48
-  ]
-  edge [
-    source 774
-    target 1900
-    weight 28
-  ]
-  edge [
-    source 798
-    target 3521
-    weight 1737
-  ]
-  edge [
-    source 798
-    target 1616
-    weight 1494
-  ]
-  edge [
-    source 798
-    target 1582
-    weight 715
-  ]
-  edge [
-    source 798
-    target 2700
-    weight 699
-  ]
-  edge [
-    source 798
-    target 2857
-    weight 399
-  ]
-  edge [
-    source 798
-    target 2861
-    weight 1110
-  ]
-  edge [
-    source 798
-    target 1487
-    weight 1116
-  ]
-  edge [
-    source 798
-    target 3565
-    weight 371
-  ]
-  edge [
-    source 798
-    target 1647
-    weight 723
-  ]
-  edge [
-    source 798
-    target 3145
-    weight 909
-  ]
-  edge [
-    source 798
-    target 3993
-    weight 715
-  ]
-  edge [
-    source 798
-    target 1080
-    weight 622
-  ]
-  edge [
-    source 798
-    target 3141
-    weight 1485
-  ]
-  edge [
-    source 798
-    target 1053
-    weight 1143
-  ]
-  edge [
-    source 798
-    target 4051
-    weight 1341
-  ]
-  edge [
-    source 798
-    target 1995
-    weight 699
-  ]
-  edge [
-    source 798
-    target 3542
-    weight 330
-  ]
-  edge [
-    source 798
-    target 2800
-    weight 132
-  ]
-  edge [
-    source 798
-    target 3917
-    weight 570
-  ]
-  edge [
-    source 798
-    target 2071
-    weight 1347
-  ]
-  edge [
-    source 798
-    target 1887
-    weight 1363
-  ]
-  edge [
-    source 798
-    target 3985
-    weight 30
-  ]
-  edge [
-    source 798
-    target 3600
-    weight 983
-  ]
-  edge [
-    source 798
-    target 2227
-    weight 33
-  ]
-  edge [
-    source 798
-    target 2058
-    weight 276
-  ]
-  edge [
-    source 798
-    target 2191
-    weight 242
-  ]
-  edge [
-    source 798
-    target 3276
-    weight 831
-  ]
-  edge [
-    source 798
-    target 927
-    weight 59
-  ]
-  edge [
-    source 798
-    target 4152
-    weight 30
-  ]
-  edge [
-    source 798
-    target 842
-    weight 45
-  ]
-  edge [
-    source 798
-    target 3962
-    weight 207
-  ]
-  edge [
-    source 798
-    target 2870
-    weight 272
-  ]
-  edge [
-    source 798
-    target 4187
-    weight 47
-  ]
-  edge [
-    source 798
-    target 3420
-    weight 206
-  ]
-  edge [
-    source 798
-    target 3282
-    weight 431
-  ]
-  edge [
-    source 798
-    target 2181
-    weight 23
-  ]
-  edge [
-    source 798
-    target 3443
-    weight 343
-  ]
-  edge [
-    source 798
-    target 3253
-    weight 202
-  ]
-  edge [
-    source 798
-    target 3642
-    weight 538
-  ]
-  edge [
-    source 798
-    target 3066
-    weight 226
-  ]
-  edge [
-    source 798
-    target 3636
-    weight 238
-  ]
-  edge [
-    source 798
-    target 2614
-    weight 65
-  ]
-  edge [
-    source 798
-    target 2204
-    weight 192
-  ]
-  edge [
-    source 798
-    target 2287
-    weight 253
-  ]
-  edge [
-    source 798
-    target 2329
-    weight 57
-  ]
-  edge [
-    source 798
-    target 3935
-    weight 30
-  ]
-  edge [
-    source 798
-    target 2553
-    weight 158
-  ]
-  edge [
-    source 798
-    target 3174
-    weight 697
-  ]
-  edge [
-    source 798
-    target 3040
-    weight 240
-  ]
-  edge [
-    source 798
-    target 2810
-    weight 77
-  ]
-  edge [
-    source 798
-    target 1127
-    weight 88
-  ]
-  edge [
-    source 798
-    target 3847
-    weight 92
-  ]
-  edge [
-    source 798
-    target 2570
-    weight 32
-  ]
-  edge [
-    source 798
-    target 2543
-    weight 154
-  ]
-  edge [
-    source 798
-    target 3954
-    weight 250
-  ]
-  edge [
-    source 798
-    target 2890
-    weight 299
-  ]
-  edge [
-    source 798
-    target 3884
-    weight 60
-  ]
-  edge [
-    source 798
-    target 1461
-    weight 36
-  ]
-  edge [
-    source 798
-    target 1195
-    weight 52
-  ]
-  edge [
-    source 798
-    target 1409
-    weight 164
-  ]
-  edge [
-    source 798
-    target 1254
-    weight 300
-  ]
-  edge [
-    source 798
-    target 874
-    weight 186
-  ]
-  edge [
-    source 798
-    target 3006
-    weight 177
-  ]
-  edge [
-    source 798
-    target 3377
-    weight 74
-  ]
-  edge [
-    source 798
-    target 4162
-    weight 93
-  ]
-  edge [
-    source 798
-    target 1360
-    weight 100
-  ]
-  edge [
-    source 798
-    target 1938
-    weight 115
-  ]
-  edge [
-    source 798
-    target 2519
-    weight 369
-  ]
-  edge [
-    source 798
-    target 3295
-    weight 136
-  ]
-  edge [
-    source 798
-    target 1258
-    weight 24
-  ]
-  edge [
-    source 798
-    target 1322
-    weight 71
-  ]
-  edge [
-    source 798
-    target 4154
-    weight 236
-  ]
-  edge [
-    source 798
-    target 1632
-    weight 456
-  ]
-  edge [
-    source 798
-    target 1280
-    weight 69
-  ]
-  edge [
-    source 798
-    target 877
-    weight 23
-  ]
-  edge [
-    source 798
-    target 1523
-    weight 110
-  ]
-  edge [
-    source 798
-    target 3052
-    weight 129
-  ]
-  edge [
-    source 798
-    target 1757
-    weight 203
-  ]
-  edge [
-    source 798
-    target 1154
-    weight 73
-  ]
-  edge [
-    source 798
-    target 1505
-    weight 359
-  ]
-  edge [
-    source 798
-    target 3374
-    weight 244
-  ]
-  edge [
-    source 798
-    target 2011
-    weight 31
-  ]
-  edge [
-    source 798
-    target 1185
-    weight 171
-  ]
-  edge [
-    source 798
-    target 3423
-    weight 326
-  ]
-  edge [
-    source 798
-    target 1507
-    weight 75
-  ]
-  edge [
-    source 798
-    target 1517
-    weight 32
-  ]
-  edge [
-    source 798
-    target 3196
-    weight 40
-  ]
-  edge [
-    source 798
-    target 2924
-    weight 25
-  ]
-  edge [
-    source 798
-    target 968
-    weight 158
-  ]
-  edge [
-    source 798
-    target 3408
-    weight 46
-  ]
-  edge [
-    source 798
-    target 3937
-    weight 71
-  ]
-  edge [
-    source 798
-    target 3968
-    weight 30
-  ]
-  edge [
-    source 798
-    target 986
-    weight 96
-  ]
-  edge [
-    source 798
-    target 4040
-    weight 65
-  ]
-  edge [
-    source 798
-    target 1707
-    weight 58
-  ]
-  edge [
-    source 798
-    target 4160
-    weight 22
-  ]
-  edge [
-    source 798
-    target 3860
-    weight 36
-  ]
-  edge [
-    source 798
-    target 1798
-    weight 25
-  ]
-  edge [
-    source 798
-    target 980
-    weight 60
-  ]
-  edge [
-    source 798
-    target 4027
-    weight 30
-  ]
-  edge [
-    source 798
-    target 2711
-    weight 38
-  ]
-  edge [
-    source 798
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 798
-    target 3432
-    weight 39
-  ]
-  edge [
-    source 798
-    target 2844
-    weight 23
-  ]
-  edge [
-    source 798
-    target 3877
-    weight 82
-  ]
-  edge [
-    source 798
-    target 3677
-    weight 24
-  ]
-  edge [
-    source 798
-    target 964
-    weight 22
-  ]
-  edge [
-    source 798
-    target 2822
-    weight 31
-  ]
-  edge [
-    source 798
-    target 3071
-    weight 39
-  ]
-  edge [
-    source 798
-    target 1148
-    weight 29
-  ]
-  edge [
-    source 798
-    target 3641
-    weight 40
-  ]
-  edge [
-    source 798
-    target 2099
-    weight 31
-  ]
-  edge [
-    source 798
-    target 3077
-    weight 70
-  ]
-  edge [
-    source 798
-    target 3108
-    weight 22
-  ]
-  edge [
-    source 798
-    target 1943
-    weight 60
-  ]
-  edge [
-    source 798
-    target 1125
-    weight 39
-  ]
-  edge [
-    source 798
-    target 1420
-    weight 86
-  ]
-  edge [
-    source 798
-    target 1952
-    weight 47
-  ]
-  edge [
-    source 798
-    target 1970
-    weight 32
-  ]
-  edge [
-    source 798
-    target 3177
-    weight 63
-  ]
-  edge [
-    source 798
-    target 3633
-    weight 24
-  ]
-  edge [
-    source 798
-    target 3162
-    weight 23
-  ]
-  edge [
-    source 798
-    target 2003
-    weight 21
-  ]
-  edge [
-    source 798
-    target 1802
-    weight 40
-  ]
-  edge [
-    source 798
-    target 869
-    weight 27
-  ]
-  edge [
-    source 798
-    target 2556
-    weight 24
-  ]
-  edge [
-    source 798
-    target 1333
-    weight 35
-  ]
-  edge [
-    source 798
-    target 2078
-    weight 53
-  ]
-  edge [
-    source 801
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 801
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 801
-    target 1887
-    weight 26
-  ]
-  edge [
-    source 801
-    target 2861
-    weight 22
-  ]
-  edge [
-    source 801
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 801
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 808
-    target 1616
-    weight 32
-  ]
-  edge [
-    source 808
-    target 3521
-    weight 42
-  ]
-  edge [
-    source 808
-    target 1053
-    weight 28
-  ]
-  edge [
-    source 808
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 808
-    target 1887
-    weight 29
-  ]
-  edge [
-    source 808
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 808
-    target 2861
-    weight 31
-  ]
-  edge [
-    source 808
-    target 4051
-    weight 32
-  ]
-  edge [
-    source 808
-    target 3141
-    weight 39
-  ]
-  edge [
-    source 842
-    target 3600
-    weight 58
-  ]
-  edge [
-    source 842
-    target 1995
-    weight 60
-  ]
-  edge [
-    source 842
-    target 2870
-    weight 39
-  ]
-  edge [
-    source 842
-    target 2861
-    weight 78
-  ]
-  edge [
-    source 842
-    target 1616
-    weight 97
-  ]
-  edge [
-    source 842
-    target 3141
-    weight 93
-  ]
-  edge [
-    source 842
-    target 4051
-    weight 91
-  ]
-  edge [
-    source 842
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 842
-    target 1053
-    weight 78
-  ]
-  edge [
-    source 842
-    target 1647
-    weight 59
-  ]
-  edge [
-    source 842
-    target 3962
-    weight 29
-  ]
-  edge [
-    source 842
-    target 2071
-    weight 88
-  ]
-  edge [
-    source 842
-    target 1487
-    weight 72
-  ]
-  edge [
-    source 842
-    target 3565
-    weight 26
-  ]
-  edge [
-    source 842
-    target 3443
-    weight 31
-  ]
-  edge [
-    source 842
-    target 3917
-    weight 49
-  ]
-  edge [
-    source 842
-    target 3145
-    weight 70
-  ]
-  edge [
-    source 842
-    target 1887
-    weight 95
-  ]
-  edge [
-    source 842
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 842
-    target 1080
-    weight 46
-  ]
-  edge [
-    source 842
-    target 3066
-    weight 28
-  ]
-  edge [
-    source 842
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 842
-    target 2519
-    weight 40
-  ]
-  edge [
-    source 842
-    target 3636
-    weight 27
-  ]
-  edge [
-    source 842
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 842
-    target 2890
-    weight 24
-  ]
-  edge [
-    source 842
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 842
-    target 2700
-    weight 60
-  ]
-  edge [
-    source 842
-    target 2204
-    weight 25
-  ]
-  edge [
-    source 842
-    target 3282
-    weight 40
-  ]
-  edge [
-    source 842
-    target 874
-    weight 24
-  ]
-  edge [
-    source 842
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 842
-    target 3276
-    weight 50
-  ]
-  edge [
-    source 842
-    target 1632
-    weight 47
-  ]
-  edge [
-    source 842
-    target 1757
-    weight 27
-  ]
-  edge [
-    source 842
-    target 1409
-    weight 21
-  ]
-  edge [
-    source 842
-    target 3954
-    weight 33
-  ]
-  edge [
-    source 842
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 842
-    target 1254
-    weight 41
-  ]
-  edge [
-    source 842
-    target 1505
-    weight 41
-  ]
-  edge [
-    source 842
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 842
-    target 3174
-    weight 56
-  ]
-  edge [
-    source 842
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 842
-    target 1582
-    weight 56
-  ]
-  edge [
-    source 842
-    target 3374
-    weight 26
-  ]
-  edge [
-    source 842
-    target 1185
-    weight 23
-  ]
-  edge [
-    source 842
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 842
-    target 3006
-    weight 25
-  ]
-  edge [
-    source 842
-    target 2857
-    weight 48
-  ]
-  edge [
-    source 842
-    target 3040
-    weight 34
-  ]
-  edge [
-    source 842
-    target 3423
-    weight 35
-  ]
-  edge [
-    source 842
-    target 2058
-    weight 23
-  ]
-  edge [
-    source 851
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 869
-    target 3521
-    weight 129
-  ]
-  edge [
-    source 869
-    target 3600
-    weight 112
-  ]
-  edge [
-    source 869
-    target 3993
-    weight 82
-  ]
-  edge [
-    source 869
-    target 1487
-    weight 91
-  ]
-  edge [
-    source 869
-    target 1616
-    weight 116
-  ]
-  edge [
-    source 869
-    target 2191
-    weight 21
-  ]
-  edge [
-    source 869
-    target 2071
-    weight 104
-  ]
-  edge [
-    source 869
-    target 1505
-    weight 57
-  ]
-  edge [
-    source 869
-    target 1080
-    weight 41
-  ]
-  edge [
-    source 869
-    target 3141
-    weight 107
-  ]
-  edge [
-    source 869
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 869
-    target 1887
-    weight 96
-  ]
-  edge [
-    source 869
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 869
-    target 1053
-    weight 65
-  ]
-  edge [
-    source 869
-    target 2861
-    weight 76
-  ]
-  edge [
-    source 869
-    target 2700
-    weight 47
-  ]
-  edge [
-    source 869
-    target 3145
-    weight 60
-  ]
-  edge [
-    source 869
-    target 1582
-    weight 54
-  ]
-  edge [
-    source 869
-    target 2857
-    weight 28
-  ]
-  edge [
-    source 869
-    target 3174
-    weight 60
-  ]
-  edge [
-    source 869
-    target 3423
-    weight 37
-  ]
-  edge [
-    source 869
-    target 1632
-    weight 29
-  ]
-  edge [
-    source 869
-    target 3276
-    weight 72
-  ]
-  edge [
-    source 869
-    target 1995
-    weight 46
-  ]
-  edge [
-    source 869
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 869
-    target 1647
-    weight 49
-  ]
-  edge [
-    source 869
-    target 4051
-    weight 99
-  ]
-  edge [
-    source 869
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 869
-    target 3282
-    weight 39
-  ]
-  edge [
-    source 869
-    target 3066
-    weight 24
-  ]
-  edge [
-    source 869
-    target 1254
-    weight 33
-  ]
-  edge [
-    source 869
-    target 874
-    weight 30
-  ]
-  edge [
-    source 869
-    target 2890
-    weight 27
-  ]
-  edge [
-    source 869
-    target 3542
-    weight 29
-  ]
-  edge [
-    source 869
-    target 3642
-    weight 31
-  ]
-  edge [
-    source 869
-    target 2519
-    weight 32
-  ]
-  edge [
-    source 871
-    target 3521
-    weight 55
-  ]
-  edge [
-    source 871
-    target 4051
-    weight 53
-  ]
-  edge [
-    source 871
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 871
-    target 1616
-    weight 47
-  ]
-  edge [
-    source 871
-    target 1487
-    weight 33
-  ]
-  edge [
-    source 871
-    target 2071
-    weight 45
-  ]
-  edge [
-    source 871
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 871
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 871
-    target 1053
-    weight 27
-  ]
-  edge [
-    source 871
-    target 1080
-    weight 28
-  ]
-  edge [
-    source 871
-    target 3174
-    weight 22
-  ]
-  edge [
-    source 871
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 871
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 871
-    target 3141
-    weight 41
-  ]
-  edge [
-    source 871
-    target 1647
-    weight 30
-  ]
-  edge [
-    source 871
-    target 3145
-    weight 26
-  ]
-  edge [
-    source 874
-    target 3521
-    weight 688
-  ]
-  edge [
-    source 874
-    target 3565
-    weight 138
-  ]
-  edge [
-    source 874
-    target 1616
-    weight 608
-  ]
-  edge [
-    source 874
-    target 2861
-    weight 440
-  ]
-  edge [
-    source 874
-    target 3642
-    weight 199
-  ]
-  edge [
-    source 874
-    target 3377
-    weight 28
-  ]
-  edge [
-    source 874
-    target 2614
-    weight 44
-  ]
-  edge [
-    source 874
-    target 1080
-    weight 293
-  ]
-  edge [
-    source 874
-    target 3066
-    weight 143
-  ]
-  edge [
-    source 874
-    target 3600
-    weight 367
-  ]
-  edge [
-    source 874
-    target 3993
-    weight 293
-  ]
-  edge [
-    source 874
-    target 2800
-    weight 82
-  ]
-  edge [
-    source 874
-    target 4051
-    weight 529
-  ]
-  edge [
-    source 874
-    target 1487
-    weight 430
-  ]
-  edge [
-    source 874
-    target 2543
-    weight 117
-  ]
-  edge [
-    source 874
-    target 3174
-    weight 327
-  ]
-  edge [
-    source 874
-    target 3636
-    weight 160
-  ]
-  edge [
-    source 874
-    target 2329
-    weight 28
-  ]
-  edge [
-    source 874
-    target 3937
-    weight 57
-  ]
-  edge [
-    source 874
-    target 2870
-    weight 180
-  ]
-  edge [
-    source 874
-    target 3420
-    weight 95
-  ]
-  edge [
-    source 874
-    target 1507
-    weight 63
-  ]
-  edge [
-    source 874
-    target 2191
-    weight 122
-  ]
-  edge [
-    source 874
-    target 1995
-    weight 299
-  ]
-  edge [
-    source 874
-    target 1254
-    weight 220
-  ]
-  edge [
-    source 874
-    target 1053
-    weight 429
-  ]
-  edge [
-    source 874
-    target 3253
-    weight 116
-  ]
-  edge [
-    source 874
-    target 2700
-    weight 310
-  ]
-  edge [
-    source 874
-    target 3276
-    weight 345
-  ]
-  edge [
-    source 874
-    target 2071
-    weight 531
-  ]
-  edge [
-    source 874
-    target 1647
-    weight 281
-  ]
-  edge [
-    source 874
-    target 1887
-    weight 517
-  ]
-  edge [
-    source 874
-    target 3542
-    weight 168
-  ]
-  edge [
-    source 874
-    target 1632
-    weight 220
-  ]
-  edge [
-    source 874
-    target 3141
-    weight 549
-  ]
-  edge [
-    source 874
-    target 3145
-    weight 419
-  ]
-  edge [
-    source 874
-    target 3443
-    weight 122
-  ]
-  edge [
-    source 874
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 874
-    target 1505
-    weight 251
-  ]
-  edge [
-    source 874
-    target 3968
-    weight 27
-  ]
-  edge [
-    source 874
-    target 1127
-    weight 45
-  ]
-  edge [
-    source 874
-    target 3954
-    weight 156
-  ]
-  edge [
-    source 874
-    target 1154
-    weight 53
-  ]
-  edge [
-    source 874
-    target 2204
-    weight 136
-  ]
-  edge [
-    source 874
-    target 1757
-    weight 115
-  ]
-  edge [
-    source 874
-    target 1360
-    weight 61
-  ]
-  edge [
-    source 874
-    target 3282
-    weight 189
-  ]
-  edge [
-    source 874
-    target 3006
-    weight 116
-  ]
-  edge [
-    source 874
-    target 1943
-    weight 35
-  ]
-  edge [
-    source 874
-    target 3295
-    weight 68
-  ]
-  edge [
-    source 874
-    target 2857
-    weight 223
-  ]
-  edge [
-    source 874
-    target 1322
-    weight 42
-  ]
-  edge [
-    source 874
-    target 986
-    weight 56
-  ]
-  edge [
-    source 874
-    target 1461
-    weight 23
-  ]
-  edge [
-    source 874
-    target 3052
-    weight 87
-  ]
-  edge [
-    source 874
-    target 1938
-    weight 55
-  ]
-  edge [
-    source 874
-    target 3917
-    weight 253
-  ]
-  edge [
-    source 874
-    target 3071
-    weight 28
-  ]
-  edge [
-    source 874
-    target 1582
-    weight 270
-  ]
-  edge [
-    source 874
-    target 3077
-    weight 52
-  ]
-  edge [
-    source 874
-    target 1798
-    weight 26
-  ]
-  edge [
-    source 874
-    target 3408
-    weight 37
-  ]
-  edge [
-    source 874
-    target 3962
-    weight 94
-  ]
-  edge [
-    source 874
-    target 4160
-    weight 21
-  ]
-  edge [
-    source 874
-    target 968
-    weight 80
-  ]
-  edge [
-    source 874
-    target 2531
-    weight 22
-  ]
-  edge [
-    source 874
-    target 1517
-    weight 30
-  ]
-  edge [
-    source 874
-    target 4152
-    weight 28
-  ]
-  edge [
-    source 874
-    target 2711
-    weight 28
-  ]
-  edge [
-    source 874
-    target 4040
-    weight 41
-  ]
-  edge [
-    source 874
-    target 2553
-    weight 91
-  ]
-  edge [
-    source 874
-    target 3884
-    weight 44
-  ]
-  edge [
-    source 874
-    target 4154
-    weight 140
-  ]
-  edge [
-    source 874
-    target 1523
-    weight 62
-  ]
-  edge [
-    source 874
-    target 1185
-    weight 102
-  ]
-  edge [
-    source 874
-    target 2890
-    weight 121
-  ]
-  edge [
-    source 874
-    target 3847
-    weight 41
-  ]
-  edge [
-    source 874
-    target 2287
-    weight 137
-  ]
-  edge [
-    source 874
-    target 1409
-    weight 92
-  ]
-  edge [
-    source 874
-    target 1420
-    weight 53
-  ]
-  edge [
-    source 874
-    target 3423
-    weight 177
-  ]
-  edge [
-    source 874
-    target 2810
-    weight 39
-  ]
-  edge [
-    source 874
-    target 2519
-    weight 178
-  ]
-  edge [
-    source 874
-    target 2058
-    weight 125
-  ]
-  edge [
-    source 874
-    target 4187
-    weight 30
-  ]
-  edge [
-    source 874
-    target 3374
-    weight 153
-  ]
-  edge [
-    source 874
-    target 1333
-    weight 23
-  ]
-  edge [
-    source 874
-    target 3040
-    weight 136
-  ]
-  edge [
-    source 874
-    target 3432
-    weight 22
-  ]
-  edge [
-    source 874
-    target 927
-    weight 33
-  ]
-  edge [
-    source 874
-    target 4162
-    weight 55
-  ]
-  edge [
-    source 874
-    target 3860
-    weight 23
-  ]
-  edge [
-    source 874
-    target 1707
-    weight 38
-  ]
-  edge [
-    source 874
-    target 2099
-    weight 31
-  ]
-  edge [
-    source 874
-    target 980
-    weight 37
-  ]
-  edge [
-    source 874
-    target 1195
-    weight 30
-  ]
-  edge [
-    source 874
-    target 3177
-    weight 36
-  ]
-  edge [
-    source 874
-    target 3877
-    weight 41
-  ]
-  edge [
-    source 874
-    target 1280
-    weight 38
-  ]
-  edge [
-    source 874
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 874
-    target 3876
-    weight 32
-  ]
-  edge [
-    source 874
-    target 1952
-    weight 28
-  ]
-  edge [
-    source 877
-    target 3521
-    weight 54
-  ]
-  edge [
-    source 877
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 877
-    target 2861
-    weight 35
-  ]
-  edge [
-    source 877
-    target 1487
-    weight 37
-  ]
-  edge [
-    source 877
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 877
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 877
-    target 1616
-    weight 41
-  ]
-  edge [
-    source 877
-    target 3636
-    weight 40
-  ]
-  edge [
-    source 877
-    target 1080
-    weight 22
-  ]
-  edge [
-    source 877
-    target 1995
-    weight 28
-  ]
-  edge [
-    source 877
-    target 4051
-    weight 35
-  ]
-  edge [
-    source 877
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 877
-    target 3282
-    weight 21
-  ]
-  edge [
-    source 877
-    target 1887
-    weight 39
-  ]
-  edge [
-    source 877
-    target 1053
-    weight 31
-  ]
-  edge [
-    source 877
-    target 2700
-    weight 26
-  ]
-  edge [
-    source 877
-    target 2614
-    weight 22
-  ]
-  edge [
-    source 877
-    target 2071
-    weight 44
-  ]
-  edge [
-    source 877
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 877
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 916
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 916
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 916
-    target 2861
-    weight 59
-  ]
-  edge [
-    source 916
-    target 1487
-    weight 130
-  ]
-  edge [
-    source 916
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 916
-    target 1080
-    weight 39
-  ]
-  edge [
-    source 916
-    target 3521
-    weight 102
-  ]
-  edge [
-    source 916
-    target 1616
-    weight 81
-  ]
-  edge [
-    source 916
-    target 2071
-    weight 92
-  ]
-  edge [
-    source 916
-    target 1505
-    weight 24
-  ]
-  edge [
-    source 916
-    target 4051
-    weight 76
-  ]
-  edge [
-    source 916
-    target 3408
-    weight 24
-  ]
-  edge [
-    source 916
-    target 3423
-    weight 49
-  ]
-  edge [
-    source 916
-    target 3145
-    weight 36
-  ]
-  edge [
-    source 916
-    target 3374
-    weight 33
-  ]
-  edge [
-    source 916
-    target 3276
-    weight 38
-  ]
-  edge [
-    source 916
-    target 1582
-    weight 26
-  ]
-  edge [
-    source 916
-    target 3600
-    weight 53
-  ]
-  edge [
-    source 916
-    target 1647
-    weight 36
-  ]
-  edge [
-    source 916
-    target 3174
-    weight 37
-  ]
-  edge [
-    source 916
-    target 1053
-    weight 42
-  ]
-  edge [
-    source 916
-    target 3141
-    weight 70
-  ]
-  edge [
-    source 916
-    target 1887
-    weight 62
-  ]
-  edge [
-    source 916
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 927
-    target 2861
-    weight 108
-  ]
-  edge [
-    source 927
-    target 1616
-    weight 132
-  ]
-  edge [
-    source 927
-    target 3521
-    weight 157
-  ]
-  edge [
-    source 927
-    target 1647
-    weight 90
-  ]
-  edge [
-    source 927
-    target 3565
-    weight 35
-  ]
-  edge [
-    source 927
-    target 3066
-    weight 29
-  ]
-  edge [
-    source 927
-    target 1053
-    weight 107
-  ]
-  edge [
-    source 927
-    target 2870
-    weight 33
-  ]
-  edge [
-    source 927
-    target 1505
-    weight 57
-  ]
-  edge [
-    source 927
-    target 3443
-    weight 30
-  ]
-  edge [
-    source 927
-    target 2191
-    weight 31
-  ]
-  edge [
-    source 927
-    target 3145
-    weight 99
-  ]
-  edge [
-    source 927
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 927
-    target 3282
-    weight 54
-  ]
-  edge [
-    source 927
-    target 3600
-    weight 86
-  ]
-  edge [
-    source 927
-    target 1080
-    weight 67
-  ]
-  edge [
-    source 927
-    target 3542
-    weight 42
-  ]
-  edge [
-    source 927
-    target 1582
-    weight 62
-  ]
-  edge [
-    source 927
-    target 1995
-    weight 89
-  ]
-  edge [
-    source 927
-    target 2800
-    weight 36
-  ]
-  edge [
-    source 927
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 927
-    target 2071
-    weight 133
-  ]
-  edge [
-    source 927
-    target 1254
-    weight 37
-  ]
-  edge [
-    source 927
-    target 3993
-    weight 78
-  ]
-  edge [
-    source 927
-    target 3917
-    weight 57
-  ]
-  edge [
-    source 927
-    target 1887
-    weight 123
-  ]
-  edge [
-    source 927
-    target 1487
-    weight 104
-  ]
-  edge [
-    source 927
-    target 4051
-    weight 121
-  ]
-  edge [
-    source 927
-    target 3642
-    weight 51
-  ]
-  edge [
-    source 927
-    target 3040
-    weight 37
-  ]
-  edge [
-    source 927
-    target 3276
-    weight 67
-  ]
-  edge [
-    source 927
-    target 3141
-    weight 133
-  ]
-  edge [
-    source 927
-    target 2204
-    weight 38
-  ]
-  edge [
-    source 927
-    target 2287
-    weight 40
-  ]
-  edge [
-    source 927
-    target 3006
-    weight 29
-  ]
-  edge [
-    source 927
-    target 2890
-    weight 40
-  ]
-  edge [
-    source 927
-    target 3636
-    weight 43
-  ]
-  edge [
-    source 927
-    target 3253
-    weight 31
-  ]
-  edge [
-    source 927
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 927
-    target 4154
-    weight 35
-  ]
-  edge [
-    source 927
-    target 3954
-    weight 31
-  ]
-  edge [
-    source 927
-    target 1632
-    weight 55
-  ]
-  edge [
-    source 927
-    target 1757
-    weight 33
-  ]
-  edge [
-    source 927
-    target 1409
-    weight 27
-  ]
-  edge [
-    source 927
-    target 2857
-    weight 50
-  ]
-  edge [
-    source 927
-    target 2543
-    weight 25
-  ]
-  edge [
-    source 927
-    target 3374
-    weight 34
-  ]
-  edge [
-    source 927
-    target 3174
-    weight 60
-  ]
-  edge [
-    source 927
-    target 1185
-    weight 42
-  ]
-  edge [
-    source 927
-    target 3423
-    weight 49
-  ]
-  edge [
-    source 927
-    target 2058
-    weight 27
-  ]
-  edge [
-    source 927
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 927
-    target 2519
-    weight 44
-  ]
-  edge [
-    source 927
-    target 968
-    weight 24
-  ]
-  edge [
-    source 964
-    target 3600
-    weight 46
-  ]
-  edge [
-    source 964
-    target 2861
-    weight 51
-  ]
-  edge [
-    source 964
-    target 1616
-    weight 61
-  ]
-  edge [
-    source 964
-    target 1487
-    weight 58
-  ]
-  edge [
-    source 964
-    target 3521
-    weight 72
-  ]
-  edge [
-    source 964
-    target 1647
-    weight 48
-  ]
-  edge [
-    source 964
-    target 3423
-    weight 32
-  ]
-  edge [
-    source 964
-    target 3276
-    weight 39
-  ]
-  edge [
-    source 964
-    target 3917
-    weight 32
-  ]
-  edge [
-    source 964
-    target 4051
-    weight 58
-  ]
-  edge [
-    source 964
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 964
-    target 2700
-    weight 36
-  ]
-  edge [
-    source 964
-    target 3141
-    weight 64
-  ]
-  edge [
-    source 964
-    target 2071
-    weight 67
-  ]
-  edge [
-    source 964
-    target 1080
-    weight 25
-  ]
-  edge [
-    source 964
-    target 2191
-    weight 31
-  ]
-  edge [
-    source 964
-    target 3145
-    weight 51
-  ]
-  edge [
-    source 964
-    target 3374
-    weight 22
-  ]
-  edge [
-    source 964
-    target 1887
-    weight 55
-  ]
-  edge [
-    source 964
-    target 1995
-    weight 32
-  ]
-  edge [
-    source 964
-    target 1053
-    weight 42
-  ]
-  edge [
-    source 964
-    target 2857
-    weight 24
-  ]
-  edge [
-    source 964
-    target 3993
-    weight 44
-  ]
-  edge [
-    source 964
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 964
-    target 3174
-    weight 32
-  ]
-  edge [
-    source 964
-    target 1582
-    weight 35
-  ]
-  edge [
-    source 964
-    target 1632
-    weight 25
-  ]
-  edge [
-    source 964
-    target 2519
-    weight 24
-  ]
-  edge [
-    source 964
-    target 3282
-    weight 24
-  ]
-  edge [
-    source 968
-    target 3521
-    weight 888
-  ]
-  edge [
-    source 968
-    target 1616
-    weight 761
-  ]
-  edge [
-    source 968
-    target 1487
-    weight 521
-  ]
-  edge [
-    source 968
-    target 986
-    weight 39
-  ]
-  edge [
-    source 968
-    target 1995
-    weight 363
-  ]
-  edge [
-    source 968
-    target 3423
-    weight 168
-  ]
-  edge [
-    source 968
-    target 4051
-    weight 688
-  ]
-  edge [
-    source 968
-    target 2890
-    weight 123
-  ]
-  edge [
-    source 968
-    target 2071
-    weight 647
-  ]
-  edge [
-    source 968
-    target 2700
-    weight 333
-  ]
-  edge [
-    source 968
-    target 1053
-    weight 491
-  ]
-  edge [
-    source 968
-    target 3917
-    weight 190
-  ]
-  edge [
-    source 968
-    target 1505
-    weight 179
-  ]
-  edge [
-    source 968
-    target 2191
-    weight 90
-  ]
-  edge [
-    source 968
-    target 1887
-    weight 678
-  ]
-  edge [
-    source 968
-    target 1409
-    weight 99
-  ]
-  edge [
-    source 968
-    target 3642
-    weight 213
-  ]
-  edge [
-    source 968
-    target 3937
-    weight 32
-  ]
-  edge [
-    source 968
-    target 3040
-    weight 123
-  ]
-  edge [
-    source 968
-    target 3145
-    weight 392
-  ]
-  edge [
-    source 968
-    target 3636
-    weight 115
-  ]
-  edge [
-    source 968
-    target 3600
-    weight 424
-  ]
-  edge [
-    source 968
-    target 1647
-    weight 270
-  ]
-  edge [
-    source 968
-    target 2861
-    weight 525
-  ]
-  edge [
-    source 968
-    target 2800
-    weight 50
-  ]
-  edge [
-    source 968
-    target 1080
-    weight 326
-  ]
-  edge [
-    source 968
-    target 3993
-    weight 291
-  ]
-  edge [
-    source 968
-    target 3276
-    weight 341
-  ]
-  edge [
-    source 968
-    target 2287
-    weight 115
-  ]
-  edge [
-    source 968
-    target 1154
-    weight 31
-  ]
-  edge [
-    source 968
-    target 4187
-    weight 22
-  ]
-  edge [
-    source 968
-    target 3443
-    weight 99
-  ]
-  edge [
-    source 968
-    target 1185
-    weight 82
-  ]
-  edge [
-    source 968
-    target 3565
-    weight 147
-  ]
-  edge [
-    source 968
-    target 3174
-    weight 384
-  ]
-  edge [
-    source 968
-    target 1632
-    weight 225
-  ]
-  edge [
-    source 968
-    target 1757
-    weight 96
-  ]
-  edge [
-    source 968
-    target 2553
-    weight 60
-  ]
-  edge [
-    source 968
-    target 3141
-    weight 694
-  ]
-  edge [
-    source 968
-    target 1582
-    weight 256
-  ]
-  edge [
-    source 968
-    target 2204
-    weight 76
-  ]
-  edge [
-    source 968
-    target 3253
-    weight 82
-  ]
-  edge [
-    source 968
-    target 3954
-    weight 147
-  ]
-  edge [
-    source 968
-    target 3374
-    weight 113
-  ]
-  edge [
-    source 968
-    target 3006
-    weight 102
-  ]
-  edge [
-    source 968
-    target 3066
-    weight 103
-  ]
-  edge [
-    source 968
-    target 1707
-    weight 38
-  ]
-  edge [
-    source 968
-    target 3542
-    weight 146
-  ]
-  edge [
-    source 968
-    target 3282
-    weight 168
-  ]
-  edge [
-    source 968
-    target 3295
-    weight 71
-  ]
-  edge [
-    source 968
-    target 3847
-    weight 40
-  ]
-  edge [
-    source 968
-    target 1254
-    weight 129
-  ]
-  edge [
-    source 968
-    target 2543
-    weight 88
-  ]
-  edge [
-    source 968
-    target 1507
-    weight 54
-  ]
-  edge [
-    source 968
-    target 4154
-    weight 155
-  ]
-  edge [
-    source 968
-    target 2870
-    weight 118
-  ]
-  edge [
-    source 968
-    target 1943
-    weight 24
-  ]
-  edge [
-    source 968
-    target 2810
-    weight 33
-  ]
-  edge [
-    source 968
-    target 2857
-    weight 173
-  ]
-  edge [
-    source 968
-    target 1517
-    weight 22
-  ]
-  edge [
-    source 968
-    target 1523
-    weight 51
-  ]
-  edge [
-    source 968
-    target 1322
-    weight 33
-  ]
-  edge [
-    source 968
-    target 3968
-    weight 21
-  ]
-  edge [
-    source 968
-    target 1280
-    weight 38
-  ]
-  edge [
-    source 968
-    target 3962
-    weight 86
-  ]
-  edge [
-    source 968
-    target 3052
-    weight 52
-  ]
-  edge [
-    source 968
-    target 980
-    weight 30
-  ]
-  edge [
-    source 968
-    target 1127
-    weight 43
-  ]
-  edge [
-    source 968
-    target 4040
-    weight 25
-  ]
-  edge [
-    source 968
-    target 3377
-    weight 28
-  ]
-  edge [
-    source 968
-    target 1360
-    weight 52
-  ]
-  edge [
-    source 968
-    target 3077
-    weight 36
-  ]
-  edge [
-    source 968
-    target 2519
-    weight 154
-  ]
-  edge [
-    source 968
-    target 1938
-    weight 51
-  ]
-  edge [
-    source 968
-    target 3420
-    weight 80
-  ]
-  edge [
-    source 968
-    target 2058
-    weight 94
-  ]
-  edge [
-    source 968
-    target 1125
-    weight 26
-  ]
-  edge [
-    source 968
-    target 4162
-    weight 47
-  ]
-  edge [
-    source 968
-    target 1420
-    weight 27
-  ]
-  edge [
-    source 968
-    target 3177
-    weight 28
-  ]
-  edge [
-    source 968
-    target 1195
-    weight 25
-  ]
-  edge [
-    source 968
-    target 3877
-    weight 23
-  ]
-  edge [
-    source 968
-    target 3408
-    weight 22
-  ]
-  edge [
-    source 968
-    target 2078
-    weight 23
-  ]
-  edge [
-    source 980
-    target 1616
-    weight 347
-  ]
-  edge [
-    source 980
-    target 3141
-    weight 326
-  ]
-  edge [
-    source 980
-    target 3521
-    weight 401
-  ]
-  edge [
-    source 980
-    target 3642
-    weight 83
-  ]
-  edge [
-    source 980
-    target 3600
-    weight 221
-  ]
-  edge [
-    source 980
-    target 2071
-    weight 306
-  ]
-  edge [
-    source 980
-    target 2204
-    weight 49
-  ]
-  edge [
-    source 980
-    target 4051
-    weight 281
-  ]
-  edge [
-    source 980
-    target 1582
-    weight 118
-  ]
-  edge [
-    source 980
-    target 1409
-    weight 46
-  ]
-  edge [
-    source 980
-    target 3253
-    weight 30
-  ]
-  edge [
-    source 980
-    target 3423
-    weight 80
-  ]
-  edge [
-    source 980
-    target 1887
-    weight 308
-  ]
-  edge [
-    source 980
-    target 3565
-    weight 55
-  ]
-  edge [
-    source 980
-    target 1647
-    weight 147
-  ]
-  edge [
-    source 980
-    target 1487
-    weight 283
-  ]
-  edge [
-    source 980
-    target 3443
-    weight 47
-  ]
-  edge [
-    source 980
-    target 2191
-    weight 41
-  ]
-  edge [
-    source 980
-    target 1053
-    weight 214
-  ]
-  edge [
-    source 980
-    target 1360
-    weight 23
-  ]
-  edge [
-    source 980
-    target 3174
-    weight 156
-  ]
-  edge [
-    source 980
-    target 3420
-    weight 30
-  ]
-  edge [
-    source 980
-    target 2700
-    weight 153
-  ]
-  edge [
-    source 980
-    target 2800
-    weight 27
-  ]
-  edge [
-    source 980
-    target 3282
-    weight 67
-  ]
-  edge [
-    source 980
-    target 2861
-    weight 221
-  ]
-  edge [
-    source 980
-    target 3993
-    weight 165
-  ]
-  edge [
-    source 980
-    target 2287
-    weight 32
-  ]
-  edge [
-    source 980
-    target 1080
-    weight 131
-  ]
-  edge [
-    source 980
-    target 2543
-    weight 28
-  ]
-  edge [
-    source 980
-    target 1185
-    weight 35
-  ]
-  edge [
-    source 980
-    target 1757
-    weight 42
-  ]
-  edge [
-    source 980
-    target 3917
-    weight 105
-  ]
-  edge [
-    source 980
-    target 3145
-    weight 191
-  ]
-  edge [
-    source 980
-    target 1254
-    weight 62
-  ]
-  edge [
-    source 980
-    target 4154
-    weight 71
-  ]
-  edge [
-    source 980
-    target 2890
-    weight 57
-  ]
-  edge [
-    source 980
-    target 2519
-    weight 74
-  ]
-  edge [
-    source 980
-    target 1505
-    weight 69
-  ]
-  edge [
-    source 980
-    target 3052
-    weight 30
-  ]
-  edge [
-    source 980
-    target 3954
-    weight 46
-  ]
-  edge [
-    source 980
-    target 3276
-    weight 156
-  ]
-  edge [
-    source 980
-    target 3066
-    weight 36
-  ]
-  edge [
-    source 980
-    target 3962
-    weight 62
-  ]
-  edge [
-    source 980
-    target 3542
-    weight 56
-  ]
-  edge [
-    source 980
-    target 2857
-    weight 58
-  ]
-  edge [
-    source 980
-    target 1995
-    weight 120
-  ]
-  edge [
-    source 980
-    target 3006
-    weight 38
-  ]
-  edge [
-    source 980
-    target 4162
-    weight 21
-  ]
-  edge [
-    source 980
-    target 3374
-    weight 57
-  ]
-  edge [
-    source 980
-    target 3636
-    weight 35
-  ]
-  edge [
-    source 980
-    target 1154
-    weight 21
-  ]
-  edge [
-    source 980
-    target 2870
-    weight 44
-  ]
-  edge [
-    source 980
-    target 1632
-    weight 71
-  ]
-  edge [
-    source 980
-    target 2553
-    weight 23
-  ]
-  edge [
-    source 980
-    target 2058
-    weight 42
-  ]
-  edge [
-    source 980
-    target 3040
-    weight 51
-  ]
-  edge [
-    source 980
-    target 1507
-    weight 22
-  ]
-  edge [
-    source 983
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 986
-    target 3521
-    weight 443
-  ]
-  edge [
-    source 986
-    target 2861
-    weight 289
-  ]
-  edge [
-    source 986
-    target 1647
-    weight 241
-  ]
-  edge [
-    source 986
-    target 3600
-    weight 251
-  ]
-  edge [
-    source 986
-    target 4051
-    weight 326
-  ]
-  edge [
-    source 986
-    target 1487
-    weight 387
-  ]
-  edge [
-    source 986
-    target 1616
-    weight 338
-  ]
-  edge [
-    source 986
-    target 3423
-    weight 211
-  ]
-  edge [
-    source 986
-    target 2071
-    weight 394
-  ]
-  edge [
-    source 986
-    target 3993
-    weight 247
-  ]
-  edge [
-    source 986
-    target 1943
-    weight 21
-  ]
-  edge [
-    source 986
-    target 3565
-    weight 92
-  ]
-  edge [
-    source 986
-    target 2191
-    weight 147
-  ]
-  edge [
-    source 986
-    target 1053
-    weight 257
-  ]
-  edge [
-    source 986
-    target 3141
-    weight 329
-  ]
-  edge [
-    source 986
-    target 1757
-    weight 72
-  ]
-  edge [
-    source 986
-    target 3542
-    weight 94
-  ]
-  edge [
-    source 986
-    target 2810
-    weight 44
-  ]
-  edge [
-    source 986
-    target 1080
-    weight 171
-  ]
-  edge [
-    source 986
-    target 3937
-    weight 72
-  ]
-  edge [
-    source 986
-    target 3282
-    weight 126
-  ]
-  edge [
-    source 986
-    target 1995
-    weight 164
-  ]
-  edge [
-    source 986
-    target 3917
-    weight 144
-  ]
-  edge [
-    source 986
-    target 1887
-    weight 297
-  ]
-  edge [
-    source 986
-    target 1938
-    weight 39
-  ]
-  edge [
-    source 986
-    target 2700
-    weight 172
-  ]
-  edge [
-    source 986
-    target 3174
-    weight 160
-  ]
-  edge [
-    source 986
-    target 2857
-    weight 112
-  ]
-  edge [
-    source 986
-    target 2890
-    weight 66
-  ]
-  edge [
-    source 986
-    target 1582
-    weight 157
-  ]
-  edge [
-    source 986
-    target 3636
-    weight 67
-  ]
-  edge [
-    source 986
-    target 3954
-    weight 82
-  ]
-  edge [
-    source 986
-    target 2800
-    weight 65
-  ]
-  edge [
-    source 986
-    target 1154
-    weight 42
-  ]
-  edge [
-    source 986
-    target 3177
-    weight 53
-  ]
-  edge [
-    source 986
-    target 2519
-    weight 101
-  ]
-  edge [
-    source 986
-    target 3145
-    weight 217
-  ]
-  edge [
-    source 986
-    target 2553
-    weight 46
-  ]
-  edge [
-    source 986
-    target 3276
-    weight 191
-  ]
-  edge [
-    source 986
-    target 2058
-    weight 99
-  ]
-  edge [
-    source 986
-    target 2287
-    weight 84
-  ]
-  edge [
-    source 986
-    target 1254
-    weight 95
-  ]
-  edge [
-    source 986
-    target 3040
-    weight 71
-  ]
-  edge [
-    source 986
-    target 3066
-    weight 72
-  ]
-  edge [
-    source 986
-    target 2204
-    weight 58
-  ]
-  edge [
-    source 986
-    target 1632
-    weight 117
-  ]
-  edge [
-    source 986
-    target 3641
-    weight 28
-  ]
-  edge [
-    source 986
-    target 3962
-    weight 126
-  ]
-  edge [
-    source 986
-    target 3077
-    weight 56
-  ]
-  edge [
-    source 986
-    target 1409
-    weight 91
-  ]
-  edge [
-    source 986
-    target 2543
-    weight 39
-  ]
-  edge [
-    source 986
-    target 3295
-    weight 30
-  ]
-  edge [
-    source 986
-    target 3052
-    weight 27
-  ]
-  edge [
-    source 986
-    target 1322
-    weight 32
-  ]
-  edge [
-    source 986
-    target 3408
-    weight 27
-  ]
-  edge [
-    source 986
-    target 3642
-    weight 93
-  ]
-  edge [
-    source 986
-    target 3374
-    weight 109
-  ]
-  edge [
-    source 986
-    target 1952
-    weight 35
-  ]
-  edge [
-    source 986
-    target 3420
-    weight 70
-  ]
-  edge [
-    source 986
-    target 2870
-    weight 77
-  ]
-  edge [
-    source 986
-    target 1185
-    weight 47
-  ]
-  edge [
-    source 986
-    target 3253
-    weight 37
-  ]
-  edge [
-    source 986
-    target 3443
-    weight 70
-  ]
-  edge [
-    source 986
-    target 1360
-    weight 21
-  ]
-  edge [
-    source 986
-    target 3006
-    weight 67
-  ]
-  edge [
-    source 986
-    target 4187
-    weight 26
-  ]
-  edge [
-    source 986
-    target 3847
-    weight 25
-  ]
-  edge [
-    source 986
-    target 1505
-    weight 107
-  ]
-  edge [
-    source 986
-    target 3377
-    weight 25
-  ]
-  edge [
-    source 986
-    target 2227
-    weight 23
-  ]
-  edge [
-    source 986
-    target 1333
-    weight 32
-  ]
-  edge [
-    source 986
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 986
-    target 4154
-    weight 45
-  ]
-  edge [
-    source 986
-    target 3877
-    weight 21
-  ]
-  edge [
-    source 986
-    target 1420
-    weight 26
-  ]
-  edge [
-    source 986
-    target 1507
-    weight 30
-  ]
-  edge [
-    source 986
-    target 2078
-    weight 27
-  ]
-  edge [
-    source 1023
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 1028
-    target 1616
-    weight 71
-  ]
-  edge [
-    source 1028
-    target 1080
-    weight 44
-  ]
-  edge [
-    source 1028
-    target 3521
-    weight 70
-  ]
-  edge [
-    source 1028
-    target 1254
-    weight 27
-  ]
-  edge [
-    source 1028
-    target 3642
-    weight 28
-  ]
-  edge [
-    source 1028
-    target 1487
-    weight 38
-  ]
-  edge [
-    source 1028
-    target 1995
-    weight 31
-  ]
-  edge [
-    source 1028
-    target 3141
-    weight 54
-  ]
-  edge [
-    source 1028
-    target 2071
-    weight 58
-  ]
-  edge [
-    source 1028
-    target 1887
-    weight 54
-  ]
-  edge [
-    source 1028
-    target 1647
-    weight 23
-  ]
-  edge [
-    source 1028
-    target 4051
-    weight 61
-  ]
-  edge [
-    source 1028
-    target 3993
-    weight 21
-  ]
-  edge [
-    source 1028
-    target 1053
-    weight 41
-  ]
-  edge [
-    source 1028
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1028
-    target 1632
-    weight 30
-  ]
-  edge [
-    source 1028
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 1028
-    target 2861
-    weight 54
-  ]
-  edge [
-    source 1028
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 1028
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 1028
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1028
-    target 1582
-    weight 21
-  ]
-  edge [
-    source 1028
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1053
-    target 3521
-    weight 8776
-  ]
-  edge [
-    source 1053
-    target 1616
-    weight 7356
-  ]
-  edge [
-    source 1053
-    target 4051
-    weight 6278
-  ]
-  edge [
-    source 1053
-    target 3276
-    weight 3246
-  ]
-  edge [
-    source 1053
-    target 3565
-    weight 1374
-  ]
-  edge [
-    source 1053
-    target 3600
-    weight 4186
-  ]
-  edge [
-    source 1053
-    target 1487
-    weight 4818
-  ]
-  edge [
-    source 1053
-    target 2870
-    weight 742
-  ]
-  edge [
-    source 1053
-    target 2191
-    weight 653
-  ]
-  edge [
-    source 1053
-    target 1647
-    weight 2656
-  ]
-  edge [
-    source 1053
-    target 3177
-    weight 139
-  ]
-  edge [
-    source 1053
-    target 3993
-    weight 2541
-  ]
-  edge [
-    source 1053
-    target 2071
-    weight 6407
-  ]
-  edge [
-    source 1053
-    target 2861
-    weight 5098
-  ]
-  edge [
-    source 1053
-    target 3968
-    weight 75
-  ]
-  edge [
-    source 1053
-    target 2329
-    weight 110
-  ]
-  edge [
-    source 1053
-    target 1995
-    weight 2811
-  ]
-  edge [
-    source 1053
-    target 1080
-    weight 2580
-  ]
-  edge [
-    source 1053
-    target 1582
-    weight 2704
-  ]
-  edge [
-    source 1053
-    target 3174
-    weight 3007
-  ]
-  edge [
-    source 1053
-    target 1887
-    weight 7020
-  ]
-  edge [
-    source 1053
-    target 3443
-    weight 730
-  ]
-  edge [
-    source 1053
-    target 3642
-    weight 1871
-  ]
-  edge [
-    source 1053
-    target 3937
-    weight 190
-  ]
-  edge [
-    source 1053
-    target 2543
-    weight 430
-  ]
-  edge [
-    source 1053
-    target 1707
-    weight 157
-  ]
-  edge [
-    source 1053
-    target 2700
-    weight 2990
-  ]
-  edge [
-    source 1053
-    target 3374
-    weight 660
-  ]
-  edge [
-    source 1053
-    target 2857
-    weight 947
-  ]
-  edge [
-    source 1053
-    target 3253
-    weight 450
-  ]
-  edge [
-    source 1053
-    target 3985
-    weight 65
-  ]
-  edge [
-    source 1053
-    target 3141
-    weight 7207
-  ]
-  edge [
-    source 1053
-    target 3962
-    weight 594
-  ]
-  edge [
-    source 1053
-    target 3145
-    weight 3040
-  ]
-  edge [
-    source 1053
-    target 3282
-    weight 1190
-  ]
-  edge [
-    source 1053
-    target 1631
-    weight 37
-  ]
-  edge [
-    source 1053
-    target 3066
-    weight 552
-  ]
-  edge [
-    source 1053
-    target 1757
-    weight 508
-  ]
-  edge [
-    source 1053
-    target 2978
-    weight 27
-  ]
-  edge [
-    source 1053
-    target 3542
-    weight 900
-  ]
-  edge [
-    source 1053
-    target 4187
-    weight 89
-  ]
-  edge [
-    source 1053
-    target 1505
-    weight 991
-  ]
-  edge [
-    source 1053
-    target 4152
-    weight 77
-  ]
-  edge [
-    source 1053
-    target 1254
-    weight 722
-  ]
-  edge [
-    source 1053
-    target 2204
-    weight 481
-  ]
-  edge [
-    source 1053
-    target 2800
-    weight 268
-  ]
-  edge [
-    source 1053
-    target 3420
-    weight 444
-  ]
-  edge [
-    source 1053
-    target 3917
-    weight 1516
-  ]
-  edge [
-    source 1053
-    target 1943
-    weight 115
-  ]
-  edge [
-    source 1053
-    target 2810
-    weight 164
-  ]
-  edge [
-    source 1053
-    target 1632
-    weight 1482
-  ]
-  edge [
-    source 1053
-    target 2181
-    weight 40
-  ]
-  edge [
-    source 1053
-    target 1931
-    weight 39
-  ]
-  edge [
-    source 1053
-    target 2058
-    weight 595
-  ]
-  edge [
-    source 1053
-    target 3377
-    weight 151
-  ]
-  edge [
-    source 1053
-    target 1409
-    weight 526
-  ]
-  edge [
-    source 1053
-    target 3024
-    weight 52
-  ]
-  edge [
-    source 1053
-    target 3423
-    weight 1146
-  ]
-  edge [
-    source 1053
-    target 1349
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 2614
-    weight 127
-  ]
-  edge [
-    source 1053
-    target 3954
-    weight 659
-  ]
-  edge [
-    source 1053
-    target 2227
-    weight 88
-  ]
-  edge [
-    source 1053
-    target 1789
-    weight 60
-  ]
-  edge [
-    source 1053
-    target 2417
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 2924
-    weight 48
-  ]
-  edge [
-    source 1053
-    target 3636
-    weight 641
-  ]
-  edge [
-    source 1053
-    target 3641
-    weight 66
-  ]
-  edge [
-    source 1053
-    target 2287
-    weight 591
-  ]
-  edge [
-    source 1053
-    target 3295
-    weight 353
-  ]
-  edge [
-    source 1053
-    target 1360
-    weight 234
-  ]
-  edge [
-    source 1053
-    target 2890
-    weight 862
-  ]
-  edge [
-    source 1053
-    target 3071
-    weight 69
-  ]
-  edge [
-    source 1053
-    target 2832
-    weight 27
-  ]
-  edge [
-    source 1053
-    target 3884
-    weight 120
-  ]
-  edge [
-    source 1053
-    target 1195
-    weight 127
-  ]
-  edge [
-    source 1053
-    target 2519
-    weight 940
-  ]
-  edge [
-    source 1053
-    target 3006
-    weight 506
-  ]
-  edge [
-    source 1053
-    target 1258
-    weight 79
-  ]
-  edge [
-    source 1053
-    target 3040
-    weight 688
-  ]
-  edge [
-    source 1053
-    target 1154
-    weight 207
-  ]
-  edge [
-    source 1053
-    target 1127
-    weight 203
-  ]
-  edge [
-    source 1053
-    target 2609
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 1554
-    weight 34
-  ]
-  edge [
-    source 1053
-    target 1397
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 1938
-    weight 281
-  ]
-  edge [
-    source 1053
-    target 3847
-    weight 228
-  ]
-  edge [
-    source 1053
-    target 1322
-    weight 167
-  ]
-  edge [
-    source 1053
-    target 2570
-    weight 70
-  ]
-  edge [
-    source 1053
-    target 1185
-    weight 376
-  ]
-  edge [
-    source 1053
-    target 4027
-    weight 68
-  ]
-  edge [
-    source 1053
-    target 2061
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 3935
-    weight 64
-  ]
-  edge [
-    source 1053
-    target 3559
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 2082
-    weight 48
-  ]
-  edge [
-    source 1053
-    target 2232
-    weight 36
-  ]
-  edge [
-    source 1053
-    target 3052
-    weight 254
-  ]
-  edge [
-    source 1053
-    target 2553
-    weight 324
-  ]
-  edge [
-    source 1053
-    target 1461
-    weight 81
-  ]
-  edge [
-    source 1053
-    target 4160
-    weight 59
-  ]
-  edge [
-    source 1053
-    target 1798
-    weight 57
-  ]
-  edge [
-    source 1053
-    target 4100
-    weight 25
-  ]
-  edge [
-    source 1053
-    target 2556
-    weight 64
-  ]
-  edge [
-    source 1053
-    target 3050
-    weight 43
-  ]
-  edge [
-    source 1053
-    target 4040
-    weight 182
-  ]
-  edge [
-    source 1053
-    target 4154
-    weight 845
-  ]
-  edge [
-    source 1053
-    target 1492
-    weight 36
-  ]
-  edge [
-    source 1053
-    target 2600
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1280
-    weight 175
-  ]
-  edge [
-    source 1053
-    target 3432
-    weight 74
-  ]
-  edge [
-    source 1053
-    target 1952
-    weight 106
-  ]
-  edge [
-    source 1053
-    target 1543
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 3408
-    weight 130
-  ]
-  edge [
-    source 1053
-    target 1691
-    weight 42
-  ]
-  edge [
-    source 1053
-    target 2955
-    weight 49
-  ]
-  edge [
-    source 1053
-    target 1517
-    weight 93
-  ]
-  edge [
-    source 1053
-    target 3375
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 1299
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2844
-    weight 47
-  ]
-  edge [
-    source 1053
-    target 3077
-    weight 201
-  ]
-  edge [
-    source 1053
-    target 2434
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2711
-    weight 72
-  ]
-  edge [
-    source 1053
-    target 1419
-    weight 48
-  ]
-  edge [
-    source 1053
-    target 2011
-    weight 84
-  ]
-  edge [
-    source 1053
-    target 1507
-    weight 207
-  ]
-  edge [
-    source 1053
-    target 3196
-    weight 66
-  ]
-  edge [
-    source 1053
-    target 2531
-    weight 57
-  ]
-  edge [
-    source 1053
-    target 4162
-    weight 264
-  ]
-  edge [
-    source 1053
-    target 1676
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 3861
-    weight 46
-  ]
-  edge [
-    source 1053
-    target 1766
-    weight 40
-  ]
-  edge [
-    source 1053
-    target 4007
-    weight 29
-  ]
-  edge [
-    source 1053
-    target 1140
-    weight 36
-  ]
-  edge [
-    source 1053
-    target 3860
-    weight 75
-  ]
-  edge [
-    source 1053
-    target 3952
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1199
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 2573
-    weight 35
-  ]
-  edge [
-    source 1053
-    target 1577
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 1523
-    weight 235
-  ]
-  edge [
-    source 1053
-    target 3693
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 3956
-    weight 31
-  ]
-  edge [
-    source 1053
-    target 2450
-    weight 32
-  ]
-  edge [
-    source 1053
-    target 3877
-    weight 162
-  ]
-  edge [
-    source 1053
-    target 1922
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2003
-    weight 60
-  ]
-  edge [
-    source 1053
-    target 1775
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 1832
-    weight 32
-  ]
-  edge [
-    source 1053
-    target 1420
-    weight 162
-  ]
-  edge [
-    source 1053
-    target 1664
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 3692
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 1125
-    weight 115
-  ]
-  edge [
-    source 1053
-    target 1232
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 4098
-    weight 63
-  ]
-  edge [
-    source 1053
-    target 1064
-    weight 29
-  ]
-  edge [
-    source 1053
-    target 2743
-    weight 42
-  ]
-  edge [
-    source 1053
-    target 1374
-    weight 35
-  ]
-  edge [
-    source 1053
-    target 3162
-    weight 55
-  ]
-  edge [
-    source 1053
-    target 2983
-    weight 31
-  ]
-  edge [
-    source 1053
-    target 3011
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2054
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 1148
-    weight 60
-  ]
-  edge [
-    source 1053
-    target 1856
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1634
-    weight 25
-  ]
-  edge [
-    source 1053
-    target 3677
-    weight 71
-  ]
-  edge [
-    source 1053
-    target 1802
-    weight 82
-  ]
-  edge [
-    source 1053
-    target 2822
-    weight 62
-  ]
-  edge [
-    source 1053
-    target 3872
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 1333
-    weight 104
-  ]
-  edge [
-    source 1053
-    target 3440
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 2597
-    weight 53
-  ]
-  edge [
-    source 1053
-    target 2099
-    weight 65
-  ]
-  edge [
-    source 1053
-    target 2115
-    weight 24
-  ]
-  edge [
-    source 1053
-    target 3108
-    weight 38
-  ]
-  edge [
-    source 1053
-    target 3357
-    weight 29
-  ]
-  edge [
-    source 1053
-    target 1425
-    weight 31
-  ]
-  edge [
-    source 1053
-    target 1090
-    weight 33
-  ]
-  edge [
-    source 1053
-    target 3737
-    weight 25
-  ]
-  edge [
-    source 1053
-    target 2009
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1391
-    weight 54
-  ]
-  edge [
-    source 1053
-    target 1970
-    weight 88
-  ]
-  edge [
-    source 1053
-    target 2836
-    weight 24
-  ]
-  edge [
-    source 1053
-    target 3633
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 2078
-    weight 124
-  ]
-  edge [
-    source 1053
-    target 1528
-    weight 28
-  ]
-  edge [
-    source 1053
-    target 3876
-    weight 32
-  ]
-  edge [
-    source 1064
-    target 1616
-    weight 43
-  ]
-  edge [
-    source 1064
-    target 3521
-    weight 51
-  ]
-  edge [
-    source 1064
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 1064
-    target 1887
-    weight 44
-  ]
-  edge [
-    source 1064
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 1064
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 1064
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 1064
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 1064
-    target 3423
-    weight 21
-  ]
-  edge [
-    source 1064
-    target 3141
-    weight 46
-  ]
-  edge [
-    source 1064
-    target 1487
-    weight 40
-  ]
-  edge [
-    source 1064
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 1064
-    target 2071
-    weight 42
-  ]
-  edge [
-    source 1064
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1064
-    target 2861
-    weight 25
-  ]
-  edge [
-    source 1064
-    target 4051
-    weight 36
-  ]
-  edge [
-    source 1080
-    target 2861
-    weight 4371
-  ]
-  edge [
-    source 1080
-    target 1616
-    weight 5215
-  ]
-  edge [
-    source 1080
-    target 1487
-    weight 3393
-  ]
-  edge [
-    source 1080
-    target 3521
-    weight 5698
-  ]
-  edge [
-    source 1080
-    target 3077
-    weight 167
-  ]
-  edge [
-    source 1080
-    target 3565
-    weight 791
-  ]
-  edge [
-    source 1080
-    target 3276
-    weight 1730
-  ]
-  edge [
-    source 1080
-    target 2191
-    weight 441
-  ]
-  edge [
-    source 1080
-    target 2071
-    weight 4211
-  ]
-  edge [
-    source 1080
-    target 3066
-    weight 429
-  ]
-  edge [
-    source 1080
-    target 3374
-    weight 534
-  ]
-  edge [
-    source 1080
-    target 1995
-    weight 1983
-  ]
-  edge [
-    source 1080
-    target 1647
-    weight 1394
-  ]
-  edge [
-    source 1080
-    target 3642
-    weight 1432
-  ]
-  edge [
-    source 1080
-    target 3377
-    weight 100
-  ]
-  edge [
-    source 1080
-    target 3600
-    weight 2187
-  ]
-  edge [
-    source 1080
-    target 3968
-    weight 58
-  ]
-  edge [
-    source 1080
-    target 2329
-    weight 59
-  ]
-  edge [
-    source 1080
-    target 1582
-    weight 1405
-  ]
-  edge [
-    source 1080
-    target 3993
-    weight 1260
-  ]
-  edge [
-    source 1080
-    target 2857
-    weight 567
-  ]
-  edge [
-    source 1080
-    target 2700
-    weight 1584
-  ]
-  edge [
-    source 1080
-    target 1254
-    weight 588
-  ]
-  edge [
-    source 1080
-    target 3141
-    weight 4152
-  ]
-  edge [
-    source 1080
-    target 4051
-    weight 4330
-  ]
-  edge [
-    source 1080
-    target 1409
-    weight 310
-  ]
-  edge [
-    source 1080
-    target 3024
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 3177
-    weight 71
-  ]
-  edge [
-    source 1080
-    target 2543
-    weight 302
-  ]
-  edge [
-    source 1080
-    target 3174
-    weight 1962
-  ]
-  edge [
-    source 1080
-    target 3985
-    weight 35
-  ]
-  edge [
-    source 1080
-    target 3443
-    weight 393
-  ]
-  edge [
-    source 1080
-    target 3282
-    weight 626
-  ]
-  edge [
-    source 1080
-    target 1757
-    weight 296
-  ]
-  edge [
-    source 1080
-    target 1931
-    weight 37
-  ]
-  edge [
-    source 1080
-    target 1507
-    weight 229
-  ]
-  edge [
-    source 1080
-    target 2800
-    weight 157
-  ]
-  edge [
-    source 1080
-    target 3542
-    weight 514
-  ]
-  edge [
-    source 1080
-    target 3420
-    weight 274
-  ]
-  edge [
-    source 1080
-    target 1887
-    weight 4029
-  ]
-  edge [
-    source 1080
-    target 1505
-    weight 598
-  ]
-  edge [
-    source 1080
-    target 3636
-    weight 380
-  ]
-  edge [
-    source 1080
-    target 2614
-    weight 83
-  ]
-  edge [
-    source 1080
-    target 3917
-    weight 906
-  ]
-  edge [
-    source 1080
-    target 2870
-    weight 391
-  ]
-  edge [
-    source 1080
-    target 3954
-    weight 613
-  ]
-  edge [
-    source 1080
-    target 2924
-    weight 28
-  ]
-  edge [
-    source 1080
-    target 3641
-    weight 53
-  ]
-  edge [
-    source 1080
-    target 4027
-    weight 62
-  ]
-  edge [
-    source 1080
-    target 3253
-    weight 277
-  ]
-  edge [
-    source 1080
-    target 2204
-    weight 278
-  ]
-  edge [
-    source 1080
-    target 2287
-    weight 390
-  ]
-  edge [
-    source 1080
-    target 2227
-    weight 81
-  ]
-  edge [
-    source 1080
-    target 1154
-    weight 127
-  ]
-  edge [
-    source 1080
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 3962
-    weight 344
-  ]
-  edge [
-    source 1080
-    target 3357
-    weight 38
-  ]
-  edge [
-    source 1080
-    target 2198
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 1374
-    weight 34
-  ]
-  edge [
-    source 1080
-    target 2058
-    weight 356
-  ]
-  edge [
-    source 1080
-    target 1632
-    weight 1064
-  ]
-  edge [
-    source 1080
-    target 3295
-    weight 210
-  ]
-  edge [
-    source 1080
-    target 3006
-    weight 613
-  ]
-  edge [
-    source 1080
-    target 2519
-    weight 565
-  ]
-  edge [
-    source 1080
-    target 2232
-    weight 37
-  ]
-  edge [
-    source 1080
-    target 3040
-    weight 661
-  ]
-  edge [
-    source 1080
-    target 2003
-    weight 68
-  ]
-  edge [
-    source 1080
-    target 3937
-    weight 127
-  ]
-  edge [
-    source 1080
-    target 3145
-    weight 1767
-  ]
-  edge [
-    source 1080
-    target 1258
-    weight 51
-  ]
-  edge [
-    source 1080
-    target 1943
-    weight 71
-  ]
-  edge [
-    source 1080
-    target 2810
-    weight 122
-  ]
-  edge [
-    source 1080
-    target 1195
-    weight 109
-  ]
-  edge [
-    source 1080
-    target 2556
-    weight 34
-  ]
-  edge [
-    source 1080
-    target 3423
-    weight 771
-  ]
-  edge [
-    source 1080
-    target 2890
-    weight 455
-  ]
-  edge [
-    source 1080
-    target 1185
-    weight 290
-  ]
-  edge [
-    source 1080
-    target 4187
-    weight 59
-  ]
-  edge [
-    source 1080
-    target 1517
-    weight 111
-  ]
-  edge [
-    source 1080
-    target 2726
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 1952
-    weight 71
-  ]
-  edge [
-    source 1080
-    target 1333
-    weight 60
-  ]
-  edge [
-    source 1080
-    target 1691
-    weight 28
-  ]
-  edge [
-    source 1080
-    target 1127
-    weight 179
-  ]
-  edge [
-    source 1080
-    target 1299
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 4154
-    weight 493
-  ]
-  edge [
-    source 1080
-    target 3050
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 4040
-    weight 106
-  ]
-  edge [
-    source 1080
-    target 1492
-    weight 29
-  ]
-  edge [
-    source 1080
-    target 2600
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 3847
-    weight 122
-  ]
-  edge [
-    source 1080
-    target 2531
-    weight 64
-  ]
-  edge [
-    source 1080
-    target 1280
-    weight 118
-  ]
-  edge [
-    source 1080
-    target 2011
-    weight 58
-  ]
-  edge [
-    source 1080
-    target 3462
-    weight 31
-  ]
-  edge [
-    source 1080
-    target 1461
-    weight 77
-  ]
-  edge [
-    source 1080
-    target 1420
-    weight 92
-  ]
-  edge [
-    source 1080
-    target 1090
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 1707
-    weight 126
-  ]
-  edge [
-    source 1080
-    target 1766
-    weight 41
-  ]
-  edge [
-    source 1080
-    target 2743
-    weight 38
-  ]
-  edge [
-    source 1080
-    target 4152
-    weight 49
-  ]
-  edge [
-    source 1080
-    target 4098
-    weight 58
-  ]
-  edge [
-    source 1080
-    target 2553
-    weight 165
-  ]
-  edge [
-    source 1080
-    target 3408
-    weight 117
-  ]
-  edge [
-    source 1080
-    target 1938
-    weight 156
-  ]
-  edge [
-    source 1080
-    target 2181
-    weight 24
-  ]
-  edge [
-    source 1080
-    target 2844
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 3309
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 4162
-    weight 213
-  ]
-  edge [
-    source 1080
-    target 4160
-    weight 51
-  ]
-  edge [
-    source 1080
-    target 3956
-    weight 25
-  ]
-  edge [
-    source 1080
-    target 3860
-    weight 48
-  ]
-  edge [
-    source 1080
-    target 1360
-    weight 159
-  ]
-  edge [
-    source 1080
-    target 1577
-    weight 35
-  ]
-  edge [
-    source 1080
-    target 3559
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 1789
-    weight 55
-  ]
-  edge [
-    source 1080
-    target 3432
-    weight 54
-  ]
-  edge [
-    source 1080
-    target 3162
-    weight 33
-  ]
-  edge [
-    source 1080
-    target 2082
-    weight 34
-  ]
-  edge [
-    source 1080
-    target 3884
-    weight 69
-  ]
-  edge [
-    source 1080
-    target 2570
-    weight 42
-  ]
-  edge [
-    source 1080
-    target 2573
-    weight 39
-  ]
-  edge [
-    source 1080
-    target 1798
-    weight 39
-  ]
-  edge [
-    source 1080
-    target 2054
-    weight 30
-  ]
-  edge [
-    source 1080
-    target 3196
-    weight 48
-  ]
-  edge [
-    source 1080
-    target 3877
-    weight 120
-  ]
-  edge [
-    source 1080
-    target 1322
-    weight 100
-  ]
-  edge [
-    source 1080
-    target 3935
-    weight 29
-  ]
-  edge [
-    source 1080
-    target 1676
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 2061
-    weight 38
-  ]
-  edge [
-    source 1080
-    target 2711
-    weight 49
-  ]
-  edge [
-    source 1080
-    target 3052
-    weight 189
-  ]
-  edge [
-    source 1080
-    target 1832
-    weight 24
-  ]
-  edge [
-    source 1080
-    target 3071
-    weight 46
-  ]
-  edge [
-    source 1080
-    target 2609
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 1523
-    weight 172
-  ]
-  edge [
-    source 1080
-    target 1528
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 1391
-    weight 50
-  ]
-  edge [
-    source 1080
-    target 2955
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 1080
-    target 1419
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 1140
-    weight 32
-  ]
-  edge [
-    source 1080
-    target 3861
-    weight 25
-  ]
-  edge [
-    source 1080
-    target 2099
-    weight 62
-  ]
-  edge [
-    source 1080
-    target 1148
-    weight 33
-  ]
-  edge [
-    source 1080
-    target 1634
-    weight 27
-  ]
-  edge [
-    source 1080
-    target 3677
-    weight 40
-  ]
-  edge [
-    source 1080
-    target 1425
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 2822
-    weight 31
-  ]
-  edge [
-    source 1080
-    target 1125
-    weight 63
-  ]
-  edge [
-    source 1080
-    target 1970
-    weight 62
-  ]
-  edge [
-    source 1080
-    target 3633
-    weight 23
-  ]
-  edge [
-    source 1080
-    target 1802
-    weight 44
-  ]
-  edge [
-    source 1080
-    target 2078
-    weight 88
-  ]
-  edge [
-    source 1090
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 1090
-    target 1616
-    weight 47
-  ]
-  edge [
-    source 1090
-    target 1632
-    weight 26
-  ]
-  edge [
-    source 1090
-    target 2861
-    weight 33
-  ]
-  edge [
-    source 1090
-    target 2071
-    weight 42
-  ]
-  edge [
-    source 1090
-    target 4051
-    weight 43
-  ]
-  edge [
-    source 1090
-    target 3174
-    weight 39
-  ]
-  edge [
-    source 1090
-    target 3521
-    weight 49
-  ]
-  edge [
-    source 1090
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 1090
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 1090
-    target 1887
-    weight 33
-  ]
-  edge [
-    source 1090
-    target 3141
-    weight 40
-  ]
-  edge [
-    source 1090
-    target 3145
-    weight 34
-  ]
-  edge [
-    source 1090
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1090
-    target 1487
-    weight 32
-  ]
-  edge [
-    source 1090
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 1090
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1090
-    target 1582
-    weight 21
-  ]
-  edge [
-    source 1115
-    target 1487
-    weight 22
-  ]
-  edge [
-    source 1115
-    target 3521
-    weight 22
-  ]
-  edge [
-    source 1125
-    target 1887
-    weight 161
-  ]
-  edge [
-    source 1125
-    target 1616
-    weight 172
-  ]
-  edge [
-    source 1125
-    target 3600
-    weight 159
-  ]
-  edge [
-    source 1125
-    target 1487
-    weight 137
-  ]
-  edge [
-    source 1125
-    target 3521
-    weight 210
-  ]
-  edge [
-    source 1125
-    target 1647
-    weight 106
-  ]
-  edge [
-    source 1125
-    target 2861
-    weight 122
-  ]
-  edge [
-    source 1125
-    target 3423
-    weight 49
-  ]
-  edge [
-    source 1125
-    target 3141
-    weight 165
-  ]
-  edge [
-    source 1125
-    target 2191
-    weight 30
-  ]
-  edge [
-    source 1125
-    target 4051
-    weight 152
-  ]
-  edge [
-    source 1125
-    target 3565
-    weight 43
-  ]
-  edge [
-    source 1125
-    target 3642
-    weight 55
-  ]
-  edge [
-    source 1125
-    target 2071
-    weight 158
-  ]
-  edge [
-    source 1125
-    target 3917
-    weight 54
-  ]
-  edge [
-    source 1125
-    target 3993
-    weight 81
-  ]
-  edge [
-    source 1125
-    target 1409
-    weight 34
-  ]
-  edge [
-    source 1125
-    target 3954
-    weight 27
-  ]
-  edge [
-    source 1125
-    target 3145
-    weight 93
-  ]
-  edge [
-    source 1125
-    target 1505
-    weight 49
-  ]
-  edge [
-    source 1125
-    target 1582
-    weight 81
-  ]
-  edge [
-    source 1125
-    target 4154
-    weight 44
-  ]
-  edge [
-    source 1125
-    target 1995
-    weight 73
-  ]
-  edge [
-    source 1125
-    target 3174
-    weight 81
-  ]
-  edge [
-    source 1125
-    target 2890
-    weight 55
-  ]
-  edge [
-    source 1125
-    target 3962
-    weight 29
-  ]
-  edge [
-    source 1125
-    target 2870
-    weight 39
-  ]
-  edge [
-    source 1125
-    target 3443
-    weight 34
-  ]
-  edge [
-    source 1125
-    target 3040
-    weight 38
-  ]
-  edge [
-    source 1125
-    target 2700
-    weight 83
-  ]
-  edge [
-    source 1125
-    target 2287
-    weight 34
-  ]
-  edge [
-    source 1125
-    target 1757
-    weight 27
-  ]
-  edge [
-    source 1125
-    target 3636
-    weight 29
-  ]
-  edge [
-    source 1125
-    target 3276
-    weight 79
-  ]
-  edge [
-    source 1125
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 1125
-    target 1632
-    weight 52
-  ]
-  edge [
-    source 1125
-    target 2519
-    weight 37
-  ]
-  edge [
-    source 1125
-    target 2857
-    weight 45
-  ]
-  edge [
-    source 1125
-    target 3282
-    weight 45
-  ]
-  edge [
-    source 1125
-    target 1254
-    weight 23
-  ]
-  edge [
-    source 1125
-    target 3374
-    weight 23
-  ]
-  edge [
-    source 1125
-    target 3542
-    weight 29
-  ]
-  edge [
-    source 1125
-    target 1185
-    weight 22
-  ]
-  edge [
-    source 1125
-    target 2058
-    weight 25
-  ]
-  edge [
-    source 1127
-    target 3521
-    weight 293
-  ]
-  edge [
-    source 1127
-    target 2861
-    weight 218
-  ]
-  edge [
-    source 1127
-    target 1616
-    weight 291
-  ]
-  edge [
-    source 1127
-    target 3420
-    weight 64
-  ]
-  edge [
-    source 1127
-    target 3600
-    weight 138
-  ]
-  edge [
-    source 1127
-    target 1647
-    weight 124
-  ]
-  edge [
-    source 1127
-    target 1409
-    weight 48
-  ]
-  edge [
-    source 1127
-    target 3917
-    weight 106
-  ]
-  edge [
-    source 1127
-    target 1487
-    weight 164
-  ]
-  edge [
-    source 1127
-    target 3642
-    weight 186
-  ]
-  edge [
-    source 1127
-    target 3542
-    weight 83
-  ]
-  edge [
-    source 1127
-    target 2700
-    weight 160
-  ]
-  edge [
-    source 1127
-    target 3276
-    weight 134
-  ]
-  edge [
-    source 1127
-    target 1995
-    weight 177
-  ]
-  edge [
-    source 1127
-    target 3565
-    weight 101
-  ]
-  edge [
-    source 1127
-    target 3066
-    weight 83
-  ]
-  edge [
-    source 1127
-    target 3145
-    weight 168
-  ]
-  edge [
-    source 1127
-    target 4051
-    weight 234
-  ]
-  edge [
-    source 1127
-    target 1887
-    weight 249
-  ]
-  edge [
-    source 1127
-    target 3141
-    weight 252
-  ]
-  edge [
-    source 1127
-    target 3993
-    weight 137
-  ]
-  edge [
-    source 1127
-    target 2071
-    weight 235
-  ]
-  edge [
-    source 1127
-    target 3954
-    weight 121
-  ]
-  edge [
-    source 1127
-    target 3040
-    weight 102
-  ]
-  edge [
-    source 1127
-    target 1254
-    weight 80
-  ]
-  edge [
-    source 1127
-    target 3295
-    weight 49
-  ]
-  edge [
-    source 1127
-    target 2543
-    weight 69
-  ]
-  edge [
-    source 1127
-    target 1461
-    weight 40
-  ]
-  edge [
-    source 1127
-    target 3006
-    weight 90
-  ]
-  edge [
-    source 1127
-    target 1632
-    weight 169
-  ]
-  edge [
-    source 1127
-    target 2870
-    weight 90
-  ]
-  edge [
-    source 1127
-    target 3282
-    weight 119
-  ]
-  edge [
-    source 1127
-    target 3847
-    weight 28
-  ]
-  edge [
-    source 1127
-    target 1322
-    weight 25
-  ]
-  edge [
-    source 1127
-    target 1707
-    weight 46
-  ]
-  edge [
-    source 1127
-    target 1360
-    weight 39
-  ]
-  edge [
-    source 1127
-    target 1582
-    weight 127
-  ]
-  edge [
-    source 1127
-    target 3443
-    weight 65
-  ]
-  edge [
-    source 1127
-    target 2191
-    weight 50
-  ]
-  edge [
-    source 1127
-    target 4154
-    weight 70
-  ]
-  edge [
-    source 1127
-    target 2890
-    weight 59
-  ]
-  edge [
-    source 1127
-    target 2800
-    weight 33
-  ]
-  edge [
-    source 1127
-    target 3377
-    weight 23
-  ]
-  edge [
-    source 1127
-    target 3174
-    weight 155
-  ]
-  edge [
-    source 1127
-    target 3636
-    weight 71
-  ]
-  edge [
-    source 1127
-    target 1195
-    weight 25
-  ]
-  edge [
-    source 1127
-    target 1938
-    weight 46
-  ]
-  edge [
-    source 1127
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1127
-    target 3253
-    weight 50
-  ]
-  edge [
-    source 1127
-    target 1507
-    weight 37
-  ]
-  edge [
-    source 1127
-    target 1505
-    weight 84
-  ]
-  edge [
-    source 1127
-    target 3052
-    weight 39
-  ]
-  edge [
-    source 1127
-    target 2857
-    weight 93
-  ]
-  edge [
-    source 1127
-    target 3423
-    weight 60
-  ]
-  edge [
-    source 1127
-    target 1185
-    weight 47
-  ]
-  edge [
-    source 1127
-    target 1523
-    weight 31
-  ]
-  edge [
-    source 1127
-    target 1757
-    weight 57
-  ]
-  edge [
-    source 1127
-    target 1154
-    weight 22
-  ]
-  edge [
-    source 1127
-    target 2204
-    weight 57
-  ]
-  edge [
-    source 1127
-    target 2519
-    weight 83
-  ]
-  edge [
-    source 1127
-    target 2810
-    weight 29
-  ]
-  edge [
-    source 1127
-    target 2553
-    weight 38
-  ]
-  edge [
-    source 1127
-    target 3962
-    weight 49
-  ]
-  edge [
-    source 1127
-    target 2058
-    weight 47
-  ]
-  edge [
-    source 1127
-    target 2287
-    weight 68
-  ]
-  edge [
-    source 1127
-    target 3374
-    weight 53
-  ]
-  edge [
-    source 1127
-    target 1420
-    weight 22
-  ]
-  edge [
-    source 1127
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 1140
-    target 3521
-    weight 61
-  ]
-  edge [
-    source 1140
-    target 1616
-    weight 57
-  ]
-  edge [
-    source 1140
-    target 4051
-    weight 49
-  ]
-  edge [
-    source 1140
-    target 1487
-    weight 47
-  ]
-  edge [
-    source 1140
-    target 3600
-    weight 37
-  ]
-  edge [
-    source 1140
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1140
-    target 1887
-    weight 57
-  ]
-  edge [
-    source 1140
-    target 3642
-    weight 30
-  ]
-  edge [
-    source 1140
-    target 3141
-    weight 58
-  ]
-  edge [
-    source 1140
-    target 2861
-    weight 40
-  ]
-  edge [
-    source 1140
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 1140
-    target 3145
-    weight 30
-  ]
-  edge [
-    source 1140
-    target 3174
-    weight 32
-  ]
-  edge [
-    source 1140
-    target 2071
-    weight 53
-  ]
-  edge [
-    source 1140
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 1140
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1140
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 1140
-    target 3565
-    weight 22
-  ]
-  edge [
-    source 1140
-    target 3276
-    weight 27
-  ]
-  edge [
-    source 1140
-    target 1582
-    weight 29
-  ]
-  edge [
-    source 1140
-    target 1632
-    weight 22
-  ]
-  edge [
-    source 1148
-    target 3600
-    weight 48
-  ]
-  edge [
-    source 1148
-    target 3141
-    weight 82
-  ]
-  edge [
-    source 1148
-    target 4051
-    weight 68
-  ]
-  edge [
-    source 1148
-    target 3521
-    weight 86
-  ]
-  edge [
-    source 1148
-    target 2071
-    weight 70
-  ]
-  edge [
-    source 1148
-    target 1647
-    weight 36
-  ]
-  edge [
-    source 1148
-    target 3145
-    weight 79
-  ]
-  edge [
-    source 1148
-    target 2700
-    weight 43
-  ]
-  edge [
-    source 1148
-    target 1254
-    weight 25
-  ]
-  edge [
-    source 1148
-    target 2861
-    weight 58
-  ]
-  edge [
-    source 1148
-    target 1616
-    weight 79
-  ]
-  edge [
-    source 1148
-    target 1887
-    weight 80
-  ]
-  edge [
-    source 1148
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 1148
-    target 3282
-    weight 24
-  ]
-  edge [
-    source 1148
-    target 3174
-    weight 52
-  ]
-  edge [
-    source 1148
-    target 3917
-    weight 42
-  ]
-  edge [
-    source 1148
-    target 1487
-    weight 62
-  ]
-  edge [
-    source 1148
-    target 2890
-    weight 27
-  ]
-  edge [
-    source 1148
-    target 1632
-    weight 21
-  ]
-  edge [
-    source 1148
-    target 1995
-    weight 35
-  ]
-  edge [
-    source 1148
-    target 3276
-    weight 51
-  ]
-  edge [
-    source 1148
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 1148
-    target 2857
-    weight 21
-  ]
-  edge [
-    source 1148
-    target 2519
-    weight 35
-  ]
-  edge [
-    source 1148
-    target 3253
-    weight 23
-  ]
-  edge [
-    source 1148
-    target 1582
-    weight 50
-  ]
-  edge [
-    source 1148
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1647
-    weight 175
-  ]
-  edge [
-    source 1154
-    target 2861
-    weight 219
-  ]
-  edge [
-    source 1154
-    target 1487
-    weight 228
-  ]
-  edge [
-    source 1154
-    target 3521
-    weight 328
-  ]
-  edge [
-    source 1154
-    target 3962
-    weight 128
-  ]
-  edge [
-    source 1154
-    target 1995
-    weight 161
-  ]
-  edge [
-    source 1154
-    target 3040
-    weight 61
-  ]
-  edge [
-    source 1154
-    target 3006
-    weight 52
-  ]
-  edge [
-    source 1154
-    target 3565
-    weight 88
-  ]
-  edge [
-    source 1154
-    target 2071
-    weight 281
-  ]
-  edge [
-    source 1154
-    target 3937
-    weight 35
-  ]
-  edge [
-    source 1154
-    target 3145
-    weight 145
-  ]
-  edge [
-    source 1154
-    target 3636
-    weight 75
-  ]
-  edge [
-    source 1154
-    target 1505
-    weight 73
-  ]
-  edge [
-    source 1154
-    target 3600
-    weight 174
-  ]
-  edge [
-    source 1154
-    target 1887
-    weight 251
-  ]
-  edge [
-    source 1154
-    target 1616
-    weight 273
-  ]
-  edge [
-    source 1154
-    target 2700
-    weight 158
-  ]
-  edge [
-    source 1154
-    target 2287
-    weight 70
-  ]
-  edge [
-    source 1154
-    target 2800
-    weight 42
-  ]
-  edge [
-    source 1154
-    target 3993
-    weight 158
-  ]
-  edge [
-    source 1154
-    target 3276
-    weight 140
-  ]
-  edge [
-    source 1154
-    target 3443
-    weight 57
-  ]
-  edge [
-    source 1154
-    target 1185
-    weight 42
-  ]
-  edge [
-    source 1154
-    target 1409
-    weight 80
-  ]
-  edge [
-    source 1154
-    target 1952
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1333
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1254
-    weight 54
-  ]
-  edge [
-    source 1154
-    target 3141
-    weight 272
-  ]
-  edge [
-    source 1154
-    target 4051
-    weight 241
-  ]
-  edge [
-    source 1154
-    target 1757
-    weight 86
-  ]
-  edge [
-    source 1154
-    target 2204
-    weight 104
-  ]
-  edge [
-    source 1154
-    target 2870
-    weight 82
-  ]
-  edge [
-    source 1154
-    target 3174
-    weight 115
-  ]
-  edge [
-    source 1154
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 1154
-    target 3374
-    weight 55
-  ]
-  edge [
-    source 1154
-    target 3423
-    weight 81
-  ]
-  edge [
-    source 1154
-    target 2890
-    weight 69
-  ]
-  edge [
-    source 1154
-    target 3847
-    weight 30
-  ]
-  edge [
-    source 1154
-    target 2553
-    weight 32
-  ]
-  edge [
-    source 1154
-    target 1322
-    weight 31
-  ]
-  edge [
-    source 1154
-    target 1938
-    weight 35
-  ]
-  edge [
-    source 1154
-    target 3066
-    weight 60
-  ]
-  edge [
-    source 1154
-    target 4154
-    weight 51
-  ]
-  edge [
-    source 1154
-    target 3253
-    weight 49
-  ]
-  edge [
-    source 1154
-    target 2191
-    weight 44
-  ]
-  edge [
-    source 1154
-    target 3884
-    weight 24
-  ]
-  edge [
-    source 1154
-    target 3954
-    weight 56
-  ]
-  edge [
-    source 1154
-    target 3295
-    weight 28
-  ]
-  edge [
-    source 1154
-    target 3420
-    weight 52
-  ]
-  edge [
-    source 1154
-    target 2857
-    weight 76
-  ]
-  edge [
-    source 1154
-    target 1632
-    weight 94
-  ]
-  edge [
-    source 1154
-    target 3917
-    weight 95
-  ]
-  edge [
-    source 1154
-    target 3282
-    weight 88
-  ]
-  edge [
-    source 1154
-    target 2614
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 2543
-    weight 45
-  ]
-  edge [
-    source 1154
-    target 1523
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 3542
-    weight 80
-  ]
-  edge [
-    source 1154
-    target 1582
-    weight 123
-  ]
-  edge [
-    source 1154
-    target 2519
-    weight 66
-  ]
-  edge [
-    source 1154
-    target 3052
-    weight 32
-  ]
-  edge [
-    source 1154
-    target 3177
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 2058
-    weight 40
-  ]
-  edge [
-    source 1154
-    target 2810
-    weight 33
-  ]
-  edge [
-    source 1154
-    target 4162
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1507
-    weight 26
-  ]
-  edge [
-    source 1154
-    target 3877
-    weight 24
-  ]
-  edge [
-    source 1166
-    target 3521
-    weight 33
-  ]
-  edge [
-    source 1166
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 1166
-    target 1887
-    weight 21
-  ]
-  edge [
-    source 1166
-    target 3423
-    weight 22
-  ]
-  edge [
-    source 1166
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 1166
-    target 1616
-    weight 26
-  ]
-  edge [
-    source 1166
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 1166
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 1995
-    weight 279
-  ]
-  edge [
-    source 1185
-    target 1616
-    weight 505
-  ]
-  edge [
-    source 1185
-    target 3636
-    weight 152
-  ]
-  edge [
-    source 1185
-    target 1887
-    weight 427
-  ]
-  edge [
-    source 1185
-    target 1517
-    weight 43
-  ]
-  edge [
-    source 1185
-    target 3937
-    weight 50
-  ]
-  edge [
-    source 1185
-    target 2071
-    weight 452
-  ]
-  edge [
-    source 1185
-    target 3040
-    weight 162
-  ]
-  edge [
-    source 1185
-    target 3145
-    weight 333
-  ]
-  edge [
-    source 1185
-    target 1505
-    weight 149
-  ]
-  edge [
-    source 1185
-    target 3600
-    weight 273
-  ]
-  edge [
-    source 1185
-    target 1647
-    weight 259
-  ]
-  edge [
-    source 1185
-    target 2861
-    weight 399
-  ]
-  edge [
-    source 1185
-    target 1487
-    weight 352
-  ]
-  edge [
-    source 1185
-    target 2700
-    weight 245
-  ]
-  edge [
-    source 1185
-    target 2287
-    weight 96
-  ]
-  edge [
-    source 1185
-    target 2800
-    weight 77
-  ]
-  edge [
-    source 1185
-    target 3443
-    weight 103
-  ]
-  edge [
-    source 1185
-    target 3993
-    weight 252
-  ]
-  edge [
-    source 1185
-    target 3276
-    weight 226
-  ]
-  edge [
-    source 1185
-    target 3521
-    weight 557
-  ]
-  edge [
-    source 1185
-    target 4187
-    weight 21
-  ]
-  edge [
-    source 1185
-    target 1409
-    weight 68
-  ]
-  edge [
-    source 1185
-    target 1632
-    weight 211
-  ]
-  edge [
-    source 1185
-    target 2204
-    weight 100
-  ]
-  edge [
-    source 1185
-    target 3174
-    weight 236
-  ]
-  edge [
-    source 1185
-    target 3141
-    weight 470
-  ]
-  edge [
-    source 1185
-    target 3642
-    weight 181
-  ]
-  edge [
-    source 1185
-    target 3374
-    weight 105
-  ]
-  edge [
-    source 1185
-    target 2519
-    weight 143
-  ]
-  edge [
-    source 1185
-    target 2614
-    weight 36
-  ]
-  edge [
-    source 1185
-    target 2890
-    weight 121
-  ]
-  edge [
-    source 1185
-    target 3565
-    weight 121
-  ]
-  edge [
-    source 1185
-    target 1582
-    weight 233
-  ]
-  edge [
-    source 1185
-    target 2553
-    weight 77
-  ]
-  edge [
-    source 1185
-    target 3253
-    weight 93
-  ]
-  edge [
-    source 1185
-    target 3423
-    weight 153
-  ]
-  edge [
-    source 1185
-    target 4051
-    weight 445
-  ]
-  edge [
-    source 1185
-    target 3917
-    weight 180
-  ]
-  edge [
-    source 1185
-    target 1757
-    weight 85
-  ]
-  edge [
-    source 1185
-    target 3962
-    weight 95
-  ]
-  edge [
-    source 1185
-    target 1195
-    weight 32
-  ]
-  edge [
-    source 1185
-    target 2191
-    weight 109
-  ]
-  edge [
-    source 1185
-    target 3408
-    weight 25
-  ]
-  edge [
-    source 1185
-    target 3377
-    weight 34
-  ]
-  edge [
-    source 1185
-    target 3542
-    weight 152
-  ]
-  edge [
-    source 1185
-    target 3884
-    weight 34
-  ]
-  edge [
-    source 1185
-    target 1254
-    weight 136
-  ]
-  edge [
-    source 1185
-    target 2857
-    weight 154
-  ]
-  edge [
-    source 1185
-    target 3420
-    weight 79
-  ]
-  edge [
-    source 1185
-    target 1507
-    weight 66
-  ]
-  edge [
-    source 1185
-    target 3006
-    weight 124
-  ]
-  edge [
-    source 1185
-    target 4162
-    weight 61
-  ]
-  edge [
-    source 1185
-    target 4154
-    weight 120
-  ]
-  edge [
-    source 1185
-    target 3432
-    weight 22
-  ]
-  edge [
-    source 1185
-    target 2543
-    weight 72
-  ]
-  edge [
-    source 1185
-    target 3282
-    weight 165
-  ]
-  edge [
-    source 1185
-    target 1523
-    weight 56
-  ]
-  edge [
-    source 1185
-    target 2870
-    weight 101
-  ]
-  edge [
-    source 1185
-    target 2329
-    weight 25
-  ]
-  edge [
-    source 1185
-    target 1322
-    weight 31
-  ]
-  edge [
-    source 1185
-    target 3077
-    weight 34
-  ]
-  edge [
-    source 1185
-    target 1577
-    weight 29
-  ]
-  edge [
-    source 1185
-    target 1707
-    weight 47
-  ]
-  edge [
-    source 1185
-    target 3295
-    weight 63
-  ]
-  edge [
-    source 1185
-    target 1360
-    weight 54
-  ]
-  edge [
-    source 1185
-    target 3954
-    weight 135
-  ]
-  edge [
-    source 1185
-    target 1938
-    weight 50
-  ]
-  edge [
-    source 1185
-    target 1420
-    weight 48
-  ]
-  edge [
-    source 1185
-    target 3860
-    weight 22
-  ]
-  edge [
-    source 1185
-    target 3052
-    weight 68
-  ]
-  edge [
-    source 1185
-    target 3847
-    weight 40
-  ]
-  edge [
-    source 1185
-    target 4027
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 3066
-    weight 103
-  ]
-  edge [
-    source 1185
-    target 1461
-    weight 25
-  ]
-  edge [
-    source 1185
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 1185
-    target 1280
-    weight 55
-  ]
-  edge [
-    source 1185
-    target 3877
-    weight 37
-  ]
-  edge [
-    source 1185
-    target 2810
-    weight 38
-  ]
-  edge [
-    source 1185
-    target 2058
-    weight 77
-  ]
-  edge [
-    source 1185
-    target 3177
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 3196
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 1766
-    weight 22
-  ]
-  edge [
-    source 1185
-    target 2078
-    weight 28
-  ]
-  edge [
-    source 1185
-    target 1943
-    weight 22
-  ]
-  edge [
-    source 1195
-    target 1616
-    weight 178
-  ]
-  edge [
-    source 1195
-    target 3954
-    weight 70
-  ]
-  edge [
-    source 1195
-    target 4051
-    weight 162
-  ]
-  edge [
-    source 1195
-    target 3174
-    weight 77
-  ]
-  edge [
-    source 1195
-    target 3521
-    weight 182
-  ]
-  edge [
-    source 1195
-    target 2071
-    weight 152
-  ]
-  edge [
-    source 1195
-    target 1887
-    weight 159
-  ]
-  edge [
-    source 1195
-    target 3066
-    weight 60
-  ]
-  edge [
-    source 1195
-    target 2861
-    weight 137
-  ]
-  edge [
-    source 1195
-    target 1647
-    weight 73
-  ]
-  edge [
-    source 1195
-    target 3141
-    weight 156
-  ]
-  edge [
-    source 1195
-    target 3565
-    weight 56
-  ]
-  edge [
-    source 1195
-    target 1632
-    weight 93
-  ]
-  edge [
-    source 1195
-    target 1995
-    weight 95
-  ]
-  edge [
-    source 1195
-    target 3040
-    weight 62
-  ]
-  edge [
-    source 1195
-    target 3642
-    weight 61
-  ]
-  edge [
-    source 1195
-    target 3993
-    weight 92
-  ]
-  edge [
-    source 1195
-    target 1461
-    weight 21
-  ]
-  edge [
-    source 1195
-    target 3253
-    weight 33
-  ]
-  edge [
-    source 1195
-    target 3145
-    weight 115
-  ]
-  edge [
-    source 1195
-    target 3006
-    weight 64
-  ]
-  edge [
-    source 1195
-    target 2287
-    weight 64
-  ]
-  edge [
-    source 1195
-    target 3282
-    weight 65
-  ]
-  edge [
-    source 1195
-    target 3600
-    weight 95
-  ]
-  edge [
-    source 1195
-    target 4162
-    weight 45
-  ]
-  edge [
-    source 1195
-    target 3636
-    weight 41
-  ]
-  edge [
-    source 1195
-    target 1487
-    weight 109
-  ]
-  edge [
-    source 1195
-    target 4154
-    weight 44
-  ]
-  edge [
-    source 1195
-    target 3423
-    weight 42
-  ]
-  edge [
-    source 1195
-    target 2890
-    weight 31
-  ]
-  edge [
-    source 1195
-    target 1582
-    weight 71
-  ]
-  edge [
-    source 1195
-    target 2700
-    weight 102
-  ]
-  edge [
-    source 1195
-    target 3443
-    weight 39
-  ]
-  edge [
-    source 1195
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 1195
-    target 1322
-    weight 28
-  ]
-  edge [
-    source 1195
-    target 3542
-    weight 61
-  ]
-  edge [
-    source 1195
-    target 3295
-    weight 21
-  ]
-  edge [
-    source 1195
-    target 2543
-    weight 42
-  ]
-  edge [
-    source 1195
-    target 1254
-    weight 57
-  ]
-  edge [
-    source 1195
-    target 2870
-    weight 51
-  ]
-  edge [
-    source 1195
-    target 3052
-    weight 26
-  ]
-  edge [
-    source 1195
-    target 3374
-    weight 33
-  ]
-  edge [
-    source 1195
-    target 1938
-    weight 25
-  ]
-  edge [
-    source 1195
-    target 2857
-    weight 50
-  ]
-  edge [
-    source 1195
-    target 1757
-    weight 28
-  ]
-  edge [
-    source 1195
-    target 3276
-    weight 87
-  ]
-  edge [
-    source 1195
-    target 1707
-    weight 26
-  ]
-  edge [
-    source 1195
-    target 1505
-    weight 59
-  ]
-  edge [
-    source 1195
-    target 3420
-    weight 27
-  ]
-  edge [
-    source 1195
-    target 1507
-    weight 25
-  ]
-  edge [
-    source 1195
-    target 3917
-    weight 51
-  ]
-  edge [
-    source 1195
-    target 1360
-    weight 25
-  ]
-  edge [
-    source 1195
-    target 2003
-    weight 21
-  ]
-  edge [
-    source 1195
-    target 2204
-    weight 39
-  ]
-  edge [
-    source 1195
-    target 2519
-    weight 53
-  ]
-  edge [
-    source 1195
-    target 2058
-    weight 22
-  ]
-  edge [
-    source 1199
-    target 3600
-    weight 48
-  ]
-  edge [
-    source 1199
-    target 2861
-    weight 33
-  ]
-  edge [
-    source 1199
-    target 1887
-    weight 40
-  ]
-  edge [
-    source 1199
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 1199
-    target 2071
-    weight 39
-  ]
-  edge [
-    source 1199
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 1199
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 1199
-    target 4051
-    weight 39
-  ]
-  edge [
-    source 1199
-    target 3276
-    weight 22
-  ]
-  edge [
-    source 1199
-    target 1616
-    weight 45
-  ]
-  edge [
-    source 1216
-    target 3521
-    weight 135
-  ]
-  edge [
-    source 1216
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 1216
-    target 2071
-    weight 21
-  ]
-  edge [
-    source 1216
-    target 3222
-    weight 51
-  ]
-  edge [
-    source 1232
-    target 1616
-    weight 46
-  ]
-  edge [
-    source 1232
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 1232
-    target 2861
-    weight 32
-  ]
-  edge [
-    source 1232
-    target 1487
-    weight 54
-  ]
-  edge [
-    source 1232
-    target 3521
-    weight 51
-  ]
-  edge [
-    source 1232
-    target 3374
-    weight 21
-  ]
-  edge [
-    source 1232
-    target 2071
-    weight 44
-  ]
-  edge [
-    source 1232
-    target 3141
-    weight 41
-  ]
-  edge [
-    source 1232
-    target 1887
-    weight 39
-  ]
-  edge [
-    source 1232
-    target 4051
-    weight 37
-  ]
-  edge [
-    source 1232
-    target 2191
-    weight 23
-  ]
-  edge [
-    source 1232
-    target 3993
-    weight 21
-  ]
-  edge [
-    source 1232
-    target 3423
-    weight 27
-  ]
-  edge [
-    source 1232
-    target 3145
-    weight 23
-  ]
-  edge [
-    source 1239
-    target 3521
-    weight 57
-  ]
-  edge [
-    source 1239
-    target 2861
-    weight 32
-  ]
-  edge [
-    source 1239
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 1254
-    target 1616
-    weight 1109
-  ]
-  edge [
-    source 1254
-    target 3521
-    weight 1212
-  ]
-  edge [
-    source 1254
-    target 3600
-    weight 589
-  ]
-  edge [
-    source 1254
-    target 1487
-    weight 796
-  ]
-  edge [
-    source 1254
-    target 1507
-    weight 136
-  ]
-  edge [
-    source 1254
-    target 2058
-    weight 194
-  ]
-  edge [
-    source 1254
-    target 3145
-    weight 689
-  ]
-  edge [
-    source 1254
-    target 2861
-    weight 767
-  ]
-  edge [
-    source 1254
-    target 2191
-    weight 185
-  ]
-  edge [
-    source 1254
-    target 3565
-    weight 212
-  ]
-  edge [
-    source 1254
-    target 3276
-    weight 566
-  ]
-  edge [
-    source 1254
-    target 3077
-    weight 81
-  ]
-  edge [
-    source 1254
-    target 3374
-    weight 267
-  ]
-  edge [
-    source 1254
-    target 3377
-    weight 74
-  ]
-  edge [
-    source 1254
-    target 3141
-    weight 982
-  ]
-  edge [
-    source 1254
-    target 3962
-    weight 150
-  ]
-  edge [
-    source 1254
-    target 2543
-    weight 209
-  ]
-  edge [
-    source 1254
-    target 1647
-    weight 439
-  ]
-  edge [
-    source 1254
-    target 1995
-    weight 517
-  ]
-  edge [
-    source 1254
-    target 3642
-    weight 360
-  ]
-  edge [
-    source 1254
-    target 2800
-    weight 99
-  ]
-  edge [
-    source 1254
-    target 3420
-    weight 128
-  ]
-  edge [
-    source 1254
-    target 3993
-    weight 491
-  ]
-  edge [
-    source 1254
-    target 2614
-    weight 42
-  ]
-  edge [
-    source 1254
-    target 3253
-    weight 142
-  ]
-  edge [
-    source 1254
-    target 3066
-    weight 242
-  ]
-  edge [
-    source 1254
-    target 2519
-    weight 285
-  ]
-  edge [
-    source 1254
-    target 4027
-    weight 44
-  ]
-  edge [
-    source 1254
-    target 4051
-    weight 990
-  ]
-  edge [
-    source 1254
-    target 1420
-    weight 52
-  ]
-  edge [
-    source 1254
-    target 2071
-    weight 940
-  ]
-  edge [
-    source 1254
-    target 1582
-    weight 433
-  ]
-  edge [
-    source 1254
-    target 1887
-    weight 935
-  ]
-  edge [
-    source 1254
-    target 3636
-    weight 165
-  ]
-  edge [
-    source 1254
-    target 2700
-    weight 529
-  ]
-  edge [
-    source 1254
-    target 1409
-    weight 134
-  ]
-  edge [
-    source 1254
-    target 1632
-    weight 386
-  ]
-  edge [
-    source 1254
-    target 3006
-    weight 195
-  ]
-  edge [
-    source 1254
-    target 1505
-    weight 337
-  ]
-  edge [
-    source 1254
-    target 2232
-    weight 22
-  ]
-  edge [
-    source 1254
-    target 3052
-    weight 152
-  ]
-  edge [
-    source 1254
-    target 3542
-    weight 266
-  ]
-  edge [
-    source 1254
-    target 2287
-    weight 202
-  ]
-  edge [
-    source 1254
-    target 4160
-    weight 25
-  ]
-  edge [
-    source 1254
-    target 1943
-    weight 52
-  ]
-  edge [
-    source 1254
-    target 3954
-    weight 302
-  ]
-  edge [
-    source 1254
-    target 2204
-    weight 194
-  ]
-  edge [
-    source 1254
-    target 2870
-    weight 219
-  ]
-  edge [
-    source 1254
-    target 3174
-    weight 644
-  ]
-  edge [
-    source 1254
-    target 1360
-    weight 133
-  ]
-  edge [
-    source 1254
-    target 2099
-    weight 44
-  ]
-  edge [
-    source 1254
-    target 3408
-    weight 55
-  ]
-  edge [
-    source 1254
-    target 3295
-    weight 112
-  ]
-  edge [
-    source 1254
-    target 2857
-    weight 359
-  ]
-  edge [
-    source 1254
-    target 1766
-    weight 22
-  ]
-  edge [
-    source 1254
-    target 1461
-    weight 40
-  ]
-  edge [
-    source 1254
-    target 4040
-    weight 56
-  ]
-  edge [
-    source 1254
-    target 1938
-    weight 89
-  ]
-  edge [
-    source 1254
-    target 1757
-    weight 151
-  ]
-  edge [
-    source 1254
-    target 1333
-    weight 31
-  ]
-  edge [
-    source 1254
-    target 3282
-    weight 310
-  ]
-  edge [
-    source 1254
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 1254
-    target 3040
-    weight 234
-  ]
-  edge [
-    source 1254
-    target 1322
-    weight 53
-  ]
-  edge [
-    source 1254
-    target 3847
-    weight 49
-  ]
-  edge [
-    source 1254
-    target 3884
-    weight 45
-  ]
-  edge [
-    source 1254
-    target 2609
-    weight 23
-  ]
-  edge [
-    source 1254
-    target 2329
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 1517
-    weight 47
-  ]
-  edge [
-    source 1254
-    target 3177
-    weight 49
-  ]
-  edge [
-    source 1254
-    target 2711
-    weight 36
-  ]
-  edge [
-    source 1254
-    target 2011
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 3937
-    weight 62
-  ]
-  edge [
-    source 1254
-    target 2227
-    weight 35
-  ]
-  edge [
-    source 1254
-    target 4152
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 4098
-    weight 26
-  ]
-  edge [
-    source 1254
-    target 4154
-    weight 230
-  ]
-  edge [
-    source 1254
-    target 2890
-    weight 172
-  ]
-  edge [
-    source 1254
-    target 3917
-    weight 402
-  ]
-  edge [
-    source 1254
-    target 3860
-    weight 26
-  ]
-  edge [
-    source 1254
-    target 1798
-    weight 36
-  ]
-  edge [
-    source 1254
-    target 2061
-    weight 23
-  ]
-  edge [
-    source 1254
-    target 2570
-    weight 21
-  ]
-  edge [
-    source 1254
-    target 3196
-    weight 43
-  ]
-  edge [
-    source 1254
-    target 1419
-    weight 21
-  ]
-  edge [
-    source 1254
-    target 2003
-    weight 26
-  ]
-  edge [
-    source 1254
-    target 1523
-    weight 90
-  ]
-  edge [
-    source 1254
-    target 2553
-    weight 110
-  ]
-  edge [
-    source 1254
-    target 2531
-    weight 36
-  ]
-  edge [
-    source 1254
-    target 3443
-    weight 170
-  ]
-  edge [
-    source 1254
-    target 3641
-    weight 27
-  ]
-  edge [
-    source 1254
-    target 4187
-    weight 40
-  ]
-  edge [
-    source 1254
-    target 3432
-    weight 33
-  ]
-  edge [
-    source 1254
-    target 2810
-    weight 55
-  ]
-  edge [
-    source 1254
-    target 3423
-    weight 258
-  ]
-  edge [
-    source 1254
-    target 4162
-    weight 82
-  ]
-  edge [
-    source 1254
-    target 3877
-    weight 63
-  ]
-  edge [
-    source 1254
-    target 3968
-    weight 29
-  ]
-  edge [
-    source 1254
-    target 1707
-    weight 62
-  ]
-  edge [
-    source 1254
-    target 3071
-    weight 27
-  ]
-  edge [
-    source 1254
-    target 1280
-    weight 52
-  ]
-  edge [
-    source 1254
-    target 1952
-    weight 32
-  ]
-  edge [
-    source 1254
-    target 1970
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 1391
-    weight 29
-  ]
-  edge [
-    source 1254
-    target 1802
-    weight 27
-  ]
-  edge [
-    source 1254
-    target 2078
-    weight 43
-  ]
-  edge [
-    source 1254
-    target 3876
-    weight 25
-  ]
-  edge [
-    source 1258
-    target 3521
-    weight 123
-  ]
-  edge [
-    source 1258
-    target 1487
-    weight 75
-  ]
-  edge [
-    source 1258
-    target 2861
-    weight 89
-  ]
-  edge [
-    source 1258
-    target 3565
-    weight 45
-  ]
-  edge [
-    source 1258
-    target 1995
-    weight 72
-  ]
-  edge [
-    source 1258
-    target 1616
-    weight 107
-  ]
-  edge [
-    source 1258
-    target 3141
-    weight 101
-  ]
-  edge [
-    source 1258
-    target 3600
-    weight 70
-  ]
-  edge [
-    source 1258
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 1258
-    target 3276
-    weight 51
-  ]
-  edge [
-    source 1258
-    target 1887
-    weight 95
-  ]
-  edge [
-    source 1258
-    target 2071
-    weight 102
-  ]
-  edge [
-    source 1258
-    target 1647
-    weight 59
-  ]
-  edge [
-    source 1258
-    target 3145
-    weight 50
-  ]
-  edge [
-    source 1258
-    target 3636
-    weight 27
-  ]
-  edge [
-    source 1258
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 1258
-    target 3040
-    weight 27
-  ]
-  edge [
-    source 1258
-    target 2287
-    weight 29
-  ]
-  edge [
-    source 1258
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 1258
-    target 1409
-    weight 23
-  ]
-  edge [
-    source 1258
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 1258
-    target 3174
-    weight 51
-  ]
-  edge [
-    source 1258
-    target 2890
-    weight 24
-  ]
-  edge [
-    source 1258
-    target 3917
-    weight 29
-  ]
-  edge [
-    source 1258
-    target 4051
-    weight 104
-  ]
-  edge [
-    source 1258
-    target 1632
-    weight 43
-  ]
-  edge [
-    source 1258
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 1258
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 1258
-    target 1582
-    weight 49
-  ]
-  edge [
-    source 1258
-    target 3282
-    weight 29
-  ]
-  edge [
-    source 1258
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1258
-    target 2870
-    weight 25
-  ]
-  edge [
-    source 1258
-    target 3542
-    weight 22
-  ]
-  edge [
-    source 1258
-    target 2857
-    weight 24
-  ]
-  edge [
-    source 1258
-    target 2519
-    weight 25
-  ]
-  edge [
-    source 1280
-    target 1616
-    weight 259
-  ]
-  edge [
-    source 1280
-    target 3521
-    weight 305
-  ]
-  edge [
-    source 1280
-    target 2861
-    weight 189
-  ]
-  edge [
-    source 1280
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 1280
-    target 1995
-    weight 154
-  ]
-  edge [
-    source 1280
-    target 3141
-    weight 246
-  ]
-  edge [
-    source 1280
-    target 1887
-    weight 221
-  ]
-  edge [
-    source 1280
-    target 3565
-    weight 56
-  ]
-  edge [
-    source 1280
-    target 2071
-    weight 235
-  ]
-  edge [
-    source 1280
-    target 1647
-    weight 105
-  ]
-  edge [
-    source 1280
-    target 3040
-    weight 75
-  ]
-  edge [
-    source 1280
-    target 2700
-    weight 115
-  ]
-  edge [
-    source 1280
-    target 3145
-    weight 145
-  ]
-  edge [
-    source 1280
-    target 3006
-    weight 50
-  ]
-  edge [
-    source 1280
-    target 3600
-    weight 140
-  ]
-  edge [
-    source 1280
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1280
-    target 1582
-    weight 112
-  ]
-  edge [
-    source 1280
-    target 4162
-    weight 30
-  ]
-  edge [
-    source 1280
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 1280
-    target 2800
-    weight 27
-  ]
-  edge [
-    source 1280
-    target 3917
-    weight 73
-  ]
-  edge [
-    source 1280
-    target 1632
-    weight 90
-  ]
-  edge [
-    source 1280
-    target 3282
-    weight 65
-  ]
-  edge [
-    source 1280
-    target 4051
-    weight 235
-  ]
-  edge [
-    source 1280
-    target 3542
-    weight 64
-  ]
-  edge [
-    source 1280
-    target 3443
-    weight 48
-  ]
-  edge [
-    source 1280
-    target 2191
-    weight 44
-  ]
-  edge [
-    source 1280
-    target 3276
-    weight 122
-  ]
-  edge [
-    source 1280
-    target 3954
-    weight 58
-  ]
-  edge [
-    source 1280
-    target 1487
-    weight 198
-  ]
-  edge [
-    source 1280
-    target 2857
-    weight 73
-  ]
-  edge [
-    source 1280
-    target 3052
-    weight 28
-  ]
-  edge [
-    source 1280
-    target 3174
-    weight 125
-  ]
-  edge [
-    source 1280
-    target 3423
-    weight 78
-  ]
-  edge [
-    source 1280
-    target 3374
-    weight 52
-  ]
-  edge [
-    source 1280
-    target 2543
-    weight 31
-  ]
-  edge [
-    source 1280
-    target 1757
-    weight 47
-  ]
-  edge [
-    source 1280
-    target 4154
-    weight 59
-  ]
-  edge [
-    source 1280
-    target 3420
-    weight 33
-  ]
-  edge [
-    source 1280
-    target 1507
-    weight 25
-  ]
-  edge [
-    source 1280
-    target 2204
-    weight 39
-  ]
-  edge [
-    source 1280
-    target 2287
-    weight 47
-  ]
-  edge [
-    source 1280
-    target 3993
-    weight 128
-  ]
-  edge [
-    source 1280
-    target 3636
-    weight 50
-  ]
-  edge [
-    source 1280
-    target 2519
-    weight 63
-  ]
-  edge [
-    source 1280
-    target 3066
-    weight 40
-  ]
-  edge [
-    source 1280
-    target 3253
-    weight 26
-  ]
-  edge [
-    source 1280
-    target 1505
-    weight 72
-  ]
-  edge [
-    source 1280
-    target 1523
-    weight 21
-  ]
-  edge [
-    source 1280
-    target 2870
-    weight 47
-  ]
-  edge [
-    source 1280
-    target 1409
-    weight 36
-  ]
-  edge [
-    source 1280
-    target 3962
-    weight 41
-  ]
-  edge [
-    source 1280
-    target 4040
-    weight 21
-  ]
-  edge [
-    source 1280
-    target 1360
-    weight 29
-  ]
-  edge [
-    source 1280
-    target 2553
-    weight 27
-  ]
-  edge [
-    source 1280
-    target 2058
-    weight 34
-  ]
-  edge [
-    source 1299
-    target 2861
-    weight 28
-  ]
-  edge [
-    source 1299
-    target 1616
-    weight 34
-  ]
-  edge [
-    source 1299
-    target 1887
-    weight 26
-  ]
-  edge [
-    source 1299
-    target 4051
-    weight 29
-  ]
-  edge [
-    source 1299
-    target 3521
-    weight 35
-  ]
-  edge [
-    source 1299
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 1299
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 1318
-    target 1487
-    weight 46
-  ]
-  edge [
-    source 1318
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1322
-    target 3600
-    weight 110
-  ]
-  edge [
-    source 1322
-    target 3141
-    weight 192
-  ]
-  edge [
-    source 1322
-    target 3993
-    weight 104
-  ]
-  edge [
-    source 1322
-    target 1887
-    weight 187
-  ]
-  edge [
-    source 1322
-    target 3521
-    weight 215
-  ]
-  edge [
-    source 1322
-    target 2071
-    weight 169
-  ]
-  edge [
-    source 1322
-    target 2870
-    weight 72
-  ]
-  edge [
-    source 1322
-    target 3282
-    weight 110
-  ]
-  edge [
-    source 1322
-    target 1632
-    weight 103
-  ]
-  edge [
-    source 1322
-    target 3847
-    weight 35
-  ]
-  edge [
-    source 1322
-    target 2329
-    weight 22
-  ]
-  edge [
-    source 1322
-    target 2570
-    weight 26
-  ]
-  edge [
-    source 1322
-    target 3954
-    weight 55
-  ]
-  edge [
-    source 1322
-    target 3276
-    weight 105
-  ]
-  edge [
-    source 1322
-    target 1360
-    weight 27
-  ]
-  edge [
-    source 1322
-    target 3642
-    weight 72
-  ]
-  edge [
-    source 1322
-    target 1616
-    weight 185
-  ]
-  edge [
-    source 1322
-    target 1707
-    weight 29
-  ]
-  edge [
-    source 1322
-    target 2543
-    weight 50
-  ]
-  edge [
-    source 1322
-    target 1461
-    weight 24
-  ]
-  edge [
-    source 1322
-    target 2861
-    weight 140
-  ]
-  edge [
-    source 1322
-    target 4051
-    weight 167
-  ]
-  edge [
-    source 1322
-    target 1505
-    weight 61
-  ]
-  edge [
-    source 1322
-    target 1487
-    weight 119
-  ]
-  edge [
-    source 1322
-    target 2204
-    weight 57
-  ]
-  edge [
-    source 1322
-    target 2700
-    weight 139
-  ]
-  edge [
-    source 1322
-    target 1757
-    weight 70
-  ]
-  edge [
-    source 1322
-    target 1647
-    weight 110
-  ]
-  edge [
-    source 1322
-    target 3145
-    weight 130
-  ]
-  edge [
-    source 1322
-    target 2191
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 3174
-    weight 105
-  ]
-  edge [
-    source 1322
-    target 3066
-    weight 62
-  ]
-  edge [
-    source 1322
-    target 3253
-    weight 48
-  ]
-  edge [
-    source 1322
-    target 2857
-    weight 82
-  ]
-  edge [
-    source 1322
-    target 2800
-    weight 38
-  ]
-  edge [
-    source 1322
-    target 3565
-    weight 61
-  ]
-  edge [
-    source 1322
-    target 3420
-    weight 52
-  ]
-  edge [
-    source 1322
-    target 4162
-    weight 27
-  ]
-  edge [
-    source 1322
-    target 2287
-    weight 66
-  ]
-  edge [
-    source 1322
-    target 3377
-    weight 21
-  ]
-  edge [
-    source 1322
-    target 4154
-    weight 59
-  ]
-  edge [
-    source 1322
-    target 1995
-    weight 104
-  ]
-  edge [
-    source 1322
-    target 3006
-    weight 49
-  ]
-  edge [
-    source 1322
-    target 3040
-    weight 51
-  ]
-  edge [
-    source 1322
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 3052
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 1322
-    target 3636
-    weight 54
-  ]
-  edge [
-    source 1322
-    target 3917
-    weight 90
-  ]
-  edge [
-    source 1322
-    target 3443
-    weight 68
-  ]
-  edge [
-    source 1322
-    target 1938
-    weight 47
-  ]
-  edge [
-    source 1322
-    target 3295
-    weight 26
-  ]
-  edge [
-    source 1322
-    target 1582
-    weight 109
-  ]
-  edge [
-    source 1322
-    target 1507
-    weight 21
-  ]
-  edge [
-    source 1322
-    target 3542
-    weight 77
-  ]
-  edge [
-    source 1322
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 1322
-    target 3374
-    weight 31
-  ]
-  edge [
-    source 1322
-    target 2519
-    weight 80
-  ]
-  edge [
-    source 1322
-    target 2553
-    weight 48
-  ]
-  edge [
-    source 1322
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 1322
-    target 1409
-    weight 38
-  ]
-  edge [
-    source 1322
-    target 2890
-    weight 56
-  ]
-  edge [
-    source 1322
-    target 2810
-    weight 23
-  ]
-  edge [
-    source 1322
-    target 4040
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 1420
-    weight 22
-  ]
-  edge [
-    source 1322
-    target 2058
-    weight 43
-  ]
-  edge [
-    source 1326
-    target 1616
-    weight 23
-  ]
-  edge [
-    source 1326
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 1326
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 1887
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 2071
-    weight 21
-  ]
-  edge [
-    source 1333
-    target 2861
-    weight 126
-  ]
-  edge [
-    source 1333
-    target 1616
-    weight 184
-  ]
-  edge [
-    source 1333
-    target 2191
-    weight 64
-  ]
-  edge [
-    source 1333
-    target 1487
-    weight 258
-  ]
-  edge [
-    source 1333
-    target 3521
-    weight 238
-  ]
-  edge [
-    source 1333
-    target 1647
-    weight 79
-  ]
-  edge [
-    source 1333
-    target 3565
-    weight 27
-  ]
-  edge [
-    source 1333
-    target 2071
-    weight 192
-  ]
-  edge [
-    source 1333
-    target 3077
-    weight 77
-  ]
-  edge [
-    source 1333
-    target 3962
-    weight 121
-  ]
-  edge [
-    source 1333
-    target 1409
-    weight 45
-  ]
-  edge [
-    source 1333
-    target 3600
-    weight 111
-  ]
-  edge [
-    source 1333
-    target 1995
-    weight 49
-  ]
-  edge [
-    source 1333
-    target 3040
-    weight 26
-  ]
-  edge [
-    source 1333
-    target 2227
-    weight 45
-  ]
-  edge [
-    source 1333
-    target 2597
-    weight 29
-  ]
-  edge [
-    source 1333
-    target 1952
-    weight 24
-  ]
-  edge [
-    source 1333
-    target 3423
-    weight 92
-  ]
-  edge [
-    source 1333
-    target 1887
-    weight 163
-  ]
-  edge [
-    source 1333
-    target 3141
-    weight 166
-  ]
-  edge [
-    source 1333
-    target 3993
-    weight 93
-  ]
-  edge [
-    source 1333
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 1333
-    target 3917
-    weight 64
-  ]
-  edge [
-    source 1333
-    target 3276
-    weight 91
-  ]
-  edge [
-    source 1333
-    target 3374
-    weight 56
-  ]
-  edge [
-    source 1333
-    target 3408
-    weight 31
-  ]
-  edge [
-    source 1333
-    target 4154
-    weight 23
-  ]
-  edge [
-    source 1333
-    target 3145
-    weight 96
-  ]
-  edge [
-    source 1333
-    target 2058
-    weight 37
-  ]
-  edge [
-    source 1333
-    target 2870
-    weight 23
-  ]
-  edge [
-    source 1333
-    target 2519
-    weight 43
-  ]
-  edge [
-    source 1333
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 1333
-    target 2890
-    weight 24
-  ]
-  edge [
-    source 1333
-    target 4051
-    weight 156
-  ]
-  edge [
-    source 1333
-    target 1582
-    weight 73
-  ]
-  edge [
-    source 1333
-    target 1757
-    weight 26
-  ]
-  edge [
-    source 1333
-    target 3174
-    weight 81
-  ]
-  edge [
-    source 1333
-    target 1505
-    weight 46
-  ]
-  edge [
-    source 1333
-    target 3642
-    weight 40
-  ]
-  edge [
-    source 1333
-    target 2857
-    weight 47
-  ]
-  edge [
-    source 1333
-    target 3542
-    weight 29
-  ]
-  edge [
-    source 1333
-    target 3282
-    weight 29
-  ]
-  edge [
-    source 1333
-    target 2287
-    weight 25
-  ]
-  edge [
-    source 1333
-    target 1632
-    weight 33
-  ]
-  edge [
-    source 1349
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 1349
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1349
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 1349
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 1349
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 1360
-    target 2543
-    weight 100
-  ]
-  edge [
-    source 1360
-    target 3253
-    weight 56
-  ]
-  edge [
-    source 1360
-    target 4051
-    weight 274
-  ]
-  edge [
-    source 1360
-    target 3174
-    weight 252
-  ]
-  edge [
-    source 1360
-    target 3521
-    weight 328
-  ]
-  edge [
-    source 1360
-    target 1887
-    weight 279
-  ]
-  edge [
-    source 1360
-    target 1707
-    weight 29
-  ]
-  edge [
-    source 1360
-    target 3141
-    weight 292
-  ]
-  edge [
-    source 1360
-    target 2071
-    weight 269
-  ]
-  edge [
-    source 1360
-    target 3600
-    weight 153
-  ]
-  edge [
-    source 1360
-    target 3954
-    weight 102
-  ]
-  edge [
-    source 1360
-    target 3993
-    weight 142
-  ]
-  edge [
-    source 1360
-    target 3276
-    weight 163
-  ]
-  edge [
-    source 1360
-    target 1616
-    weight 311
-  ]
-  edge [
-    source 1360
-    target 3282
-    weight 113
-  ]
-  edge [
-    source 1360
-    target 1632
-    weight 133
-  ]
-  edge [
-    source 1360
-    target 3847
-    weight 26
-  ]
-  edge [
-    source 1360
-    target 3642
-    weight 115
-  ]
-  edge [
-    source 1360
-    target 2870
-    weight 77
-  ]
-  edge [
-    source 1360
-    target 1461
-    weight 29
-  ]
-  edge [
-    source 1360
-    target 3917
-    weight 118
-  ]
-  edge [
-    source 1360
-    target 1487
-    weight 194
-  ]
-  edge [
-    source 1360
-    target 1647
-    weight 125
-  ]
-  edge [
-    source 1360
-    target 3066
-    weight 87
-  ]
-  edge [
-    source 1360
-    target 2861
-    weight 220
-  ]
-  edge [
-    source 1360
-    target 1505
-    weight 104
-  ]
-  edge [
-    source 1360
-    target 2857
-    weight 106
-  ]
-  edge [
-    source 1360
-    target 3145
-    weight 211
-  ]
-  edge [
-    source 1360
-    target 2191
-    weight 55
-  ]
-  edge [
-    source 1360
-    target 2700
-    weight 168
-  ]
-  edge [
-    source 1360
-    target 1582
-    weight 134
-  ]
-  edge [
-    source 1360
-    target 2800
-    weight 48
-  ]
-  edge [
-    source 1360
-    target 3420
-    weight 60
-  ]
-  edge [
-    source 1360
-    target 3295
-    weight 44
-  ]
-  edge [
-    source 1360
-    target 3196
-    weight 29
-  ]
-  edge [
-    source 1360
-    target 1409
-    weight 40
-  ]
-  edge [
-    source 1360
-    target 1517
-    weight 25
-  ]
-  edge [
-    source 1360
-    target 1938
-    weight 40
-  ]
-  edge [
-    source 1360
-    target 3542
-    weight 105
-  ]
-  edge [
-    source 1360
-    target 3565
-    weight 68
-  ]
-  edge [
-    source 1360
-    target 3052
-    weight 63
-  ]
-  edge [
-    source 1360
-    target 3040
-    weight 79
-  ]
-  edge [
-    source 1360
-    target 1995
-    weight 163
-  ]
-  edge [
-    source 1360
-    target 1757
-    weight 46
-  ]
-  edge [
-    source 1360
-    target 3636
-    weight 73
-  ]
-  edge [
-    source 1360
-    target 3006
-    weight 77
-  ]
-  edge [
-    source 1360
-    target 4154
-    weight 86
-  ]
-  edge [
-    source 1360
-    target 2287
-    weight 86
-  ]
-  edge [
-    source 1360
-    target 3884
-    weight 21
-  ]
-  edge [
-    source 1360
-    target 3962
-    weight 31
-  ]
-  edge [
-    source 1360
-    target 3443
-    weight 61
-  ]
-  edge [
-    source 1360
-    target 2204
-    weight 63
-  ]
-  edge [
-    source 1360
-    target 4040
-    weight 26
-  ]
-  edge [
-    source 1360
-    target 3423
-    weight 79
-  ]
-  edge [
-    source 1360
-    target 2519
-    weight 99
-  ]
-  edge [
-    source 1360
-    target 3374
-    weight 67
-  ]
-  edge [
-    source 1360
-    target 1507
-    weight 49
-  ]
-  edge [
-    source 1360
-    target 1523
-    weight 41
-  ]
-  edge [
-    source 1360
-    target 3377
-    weight 31
-  ]
-  edge [
-    source 1360
-    target 2553
-    weight 44
-  ]
-  edge [
-    source 1360
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1360
-    target 4162
-    weight 42
-  ]
-  edge [
-    source 1360
-    target 1943
-    weight 22
-  ]
-  edge [
-    source 1360
-    target 3877
-    weight 30
-  ]
-  edge [
-    source 1360
-    target 2058
-    weight 48
-  ]
-  edge [
-    source 1374
-    target 3600
-    weight 43
-  ]
-  edge [
-    source 1374
-    target 2861
-    weight 56
-  ]
-  edge [
-    source 1374
-    target 1616
-    weight 85
-  ]
-  edge [
-    source 1374
-    target 1487
-    weight 108
-  ]
-  edge [
-    source 1374
-    target 3521
-    weight 107
-  ]
-  edge [
-    source 1374
-    target 2191
-    weight 26
-  ]
-  edge [
-    source 1374
-    target 1995
-    weight 33
-  ]
-  edge [
-    source 1374
-    target 3077
-    weight 22
-  ]
-  edge [
-    source 1374
-    target 2071
-    weight 85
-  ]
-  edge [
-    source 1374
-    target 1647
-    weight 29
-  ]
-  edge [
-    source 1374
-    target 3141
-    weight 71
-  ]
-  edge [
-    source 1374
-    target 4051
-    weight 72
-  ]
-  edge [
-    source 1374
-    target 1887
-    weight 67
-  ]
-  edge [
-    source 1374
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 1374
-    target 3423
-    weight 56
-  ]
-  edge [
-    source 1374
-    target 3993
-    weight 37
-  ]
-  edge [
-    source 1374
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1374
-    target 3374
-    weight 28
-  ]
-  edge [
-    source 1374
-    target 3145
-    weight 34
-  ]
-  edge [
-    source 1374
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 1374
-    target 1582
-    weight 26
-  ]
-  edge [
-    source 1374
-    target 3174
-    weight 27
-  ]
-  edge [
-    source 1377
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 1377
-    target 1616
-    weight 27
-  ]
-  edge [
-    source 1377
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 1391
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 1391
-    target 1487
-    weight 83
-  ]
-  edge [
-    source 1391
-    target 3521
-    weight 111
-  ]
-  edge [
-    source 1391
-    target 3374
-    weight 55
-  ]
-  edge [
-    source 1391
-    target 2861
-    weight 64
-  ]
-  edge [
-    source 1391
-    target 1616
-    weight 92
-  ]
-  edge [
-    source 1391
-    target 2071
-    weight 89
-  ]
-  edge [
-    source 1391
-    target 1887
-    weight 80
-  ]
-  edge [
-    source 1391
-    target 3145
-    weight 54
-  ]
-  edge [
-    source 1391
-    target 3141
-    weight 84
-  ]
-  edge [
-    source 1391
-    target 1647
-    weight 44
-  ]
-  edge [
-    source 1391
-    target 3600
-    weight 50
-  ]
-  edge [
-    source 1391
-    target 3423
-    weight 31
-  ]
-  edge [
-    source 1391
-    target 4051
-    weight 86
-  ]
-  edge [
-    source 1391
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 1391
-    target 1995
-    weight 47
-  ]
-  edge [
-    source 1391
-    target 3276
-    weight 44
-  ]
-  edge [
-    source 1391
-    target 2700
-    weight 44
-  ]
-  edge [
-    source 1391
-    target 3174
-    weight 52
-  ]
-  edge [
-    source 1391
-    target 3642
-    weight 25
-  ]
-  edge [
-    source 1391
-    target 2857
-    weight 33
-  ]
-  edge [
-    source 1391
-    target 3954
-    weight 22
-  ]
-  edge [
-    source 1391
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 1391
-    target 1632
-    weight 32
-  ]
-  edge [
-    source 1391
-    target 3542
-    weight 24
-  ]
-  edge [
-    source 1391
-    target 1582
-    weight 38
-  ]
-  edge [
-    source 1391
-    target 3040
-    weight 22
-  ]
-  edge [
-    source 1391
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 1391
-    target 2519
-    weight 26
-  ]
-  edge [
-    source 1391
-    target 1505
-    weight 31
-  ]
-  edge [
-    source 1397
-    target 3521
-    weight 33
-  ]
-  edge [
-    source 1397
-    target 1887
-    weight 32
-  ]
-  edge [
-    source 1397
-    target 3141
-    weight 33
-  ]
-  edge [
-    source 1397
-    target 1616
-    weight 30
-  ]
-  edge [
-    source 1397
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 1397
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 1409
-    target 3600
-    weight 483
-  ]
-  edge [
-    source 1409
-    target 2861
-    weight 566
-  ]
-  edge [
-    source 1409
-    target 1616
-    weight 756
-  ]
-  edge [
-    source 1409
-    target 3641
-    weight 24
-  ]
-  edge [
-    source 1409
-    target 1487
-    weight 747
-  ]
-  edge [
-    source 1409
-    target 3521
-    weight 931
-  ]
-  edge [
-    source 1409
-    target 1647
-    weight 431
-  ]
-  edge [
-    source 1409
-    target 3642
-    weight 250
-  ]
-  edge [
-    source 1409
-    target 3276
-    weight 341
-  ]
-  edge [
-    source 1409
-    target 3420
-    weight 105
-  ]
-  edge [
-    source 1409
-    target 3917
-    weight 232
-  ]
-  edge [
-    source 1409
-    target 3024
-    weight 47
-  ]
-  edge [
-    source 1409
-    target 3542
-    weight 151
-  ]
-  edge [
-    source 1409
-    target 2700
-    weight 352
-  ]
-  edge [
-    source 1409
-    target 3423
-    weight 265
-  ]
-  edge [
-    source 1409
-    target 3141
-    weight 722
-  ]
-  edge [
-    source 1409
-    target 4051
-    weight 672
-  ]
-  edge [
-    source 1409
-    target 3565
-    weight 199
-  ]
-  edge [
-    source 1409
-    target 2071
-    weight 802
-  ]
-  edge [
-    source 1409
-    target 3145
-    weight 389
-  ]
-  edge [
-    source 1409
-    target 3282
-    weight 198
-  ]
-  edge [
-    source 1409
-    target 2810
-    weight 55
-  ]
-  edge [
-    source 1409
-    target 1789
-    weight 24
-  ]
-  edge [
-    source 1409
-    target 2191
-    weight 165
-  ]
-  edge [
-    source 1409
-    target 3077
-    weight 94
-  ]
-  edge [
-    source 1409
-    target 1887
-    weight 658
-  ]
-  edge [
-    source 1409
-    target 1995
-    weight 322
-  ]
-  edge [
-    source 1409
-    target 2287
-    weight 133
-  ]
-  edge [
-    source 1409
-    target 2204
-    weight 103
-  ]
-  edge [
-    source 1409
-    target 2890
-    weight 124
-  ]
-  edge [
-    source 1409
-    target 2058
-    weight 128
-  ]
-  edge [
-    source 1409
-    target 3962
-    weight 192
-  ]
-  edge [
-    source 1409
-    target 3377
-    weight 24
-  ]
-  edge [
-    source 1409
-    target 3937
-    weight 59
-  ]
-  edge [
-    source 1409
-    target 3040
-    weight 133
-  ]
-  edge [
-    source 1409
-    target 3636
-    weight 132
-  ]
-  edge [
-    source 1409
-    target 1505
-    weight 200
-  ]
-  edge [
-    source 1409
-    target 2800
-    weight 59
-  ]
-  edge [
-    source 1409
-    target 3443
-    weight 124
-  ]
-  edge [
-    source 1409
-    target 3993
-    weight 404
-  ]
-  edge [
-    source 1409
-    target 4187
-    weight 25
-  ]
-  edge [
-    source 1409
-    target 3174
-    weight 342
-  ]
-  edge [
-    source 1409
-    target 2870
-    weight 162
-  ]
-  edge [
-    source 1409
-    target 1632
-    weight 224
-  ]
-  edge [
-    source 1409
-    target 1757
-    weight 141
-  ]
-  edge [
-    source 1409
-    target 3006
-    weight 107
-  ]
-  edge [
-    source 1409
-    target 3253
-    weight 72
-  ]
-  edge [
-    source 1409
-    target 1582
-    weight 308
-  ]
-  edge [
-    source 1409
-    target 3374
-    weight 140
-  ]
-  edge [
-    source 1409
-    target 1952
-    weight 42
-  ]
-  edge [
-    source 1409
-    target 3177
-    weight 41
-  ]
-  edge [
-    source 1409
-    target 4152
-    weight 26
-  ]
-  edge [
-    source 1409
-    target 2553
-    weight 58
-  ]
-  edge [
-    source 1409
-    target 4154
-    weight 102
-  ]
-  edge [
-    source 1409
-    target 1507
-    weight 35
-  ]
-  edge [
-    source 1409
-    target 3954
-    weight 114
-  ]
-  edge [
-    source 1409
-    target 3408
-    weight 49
-  ]
-  edge [
-    source 1409
-    target 1707
-    weight 34
-  ]
-  edge [
-    source 1409
-    target 2857
-    weight 186
-  ]
-  edge [
-    source 1409
-    target 4040
-    weight 29
-  ]
-  edge [
-    source 1409
-    target 1938
-    weight 46
-  ]
-  edge [
-    source 1409
-    target 3295
-    weight 67
-  ]
-  edge [
-    source 1409
-    target 3052
-    weight 43
-  ]
-  edge [
-    source 1409
-    target 3847
-    weight 37
-  ]
-  edge [
-    source 1409
-    target 1523
-    weight 44
-  ]
-  edge [
-    source 1409
-    target 2543
-    weight 74
-  ]
-  edge [
-    source 1409
-    target 2227
-    weight 60
-  ]
-  edge [
-    source 1409
-    target 2519
-    weight 176
-  ]
-  edge [
-    source 1409
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 1409
-    target 3066
-    weight 92
-  ]
-  edge [
-    source 1409
-    target 3877
-    weight 36
-  ]
-  edge [
-    source 1409
-    target 1943
-    weight 27
-  ]
-  edge [
-    source 1409
-    target 2614
-    weight 28
-  ]
-  edge [
-    source 1409
-    target 4162
-    weight 31
-  ]
-  edge [
-    source 1409
-    target 1420
-    weight 47
-  ]
-  edge [
-    source 1409
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 1409
-    target 1970
-    weight 21
-  ]
-  edge [
-    source 1409
-    target 2078
-    weight 45
-  ]
-  edge [
-    source 1415
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1419
-    target 3521
-    weight 87
-  ]
-  edge [
-    source 1419
-    target 3141
-    weight 72
-  ]
-  edge [
-    source 1419
-    target 1616
-    weight 69
-  ]
-  edge [
-    source 1419
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1419
-    target 1995
-    weight 33
-  ]
-  edge [
-    source 1419
-    target 2071
-    weight 69
-  ]
-  edge [
-    source 1419
-    target 1887
-    weight 70
-  ]
-  edge [
-    source 1419
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 1419
-    target 1647
-    weight 36
-  ]
-  edge [
-    source 1419
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1419
-    target 3993
-    weight 28
-  ]
-  edge [
-    source 1419
-    target 1582
-    weight 33
-  ]
-  edge [
-    source 1419
-    target 3145
-    weight 51
-  ]
-  edge [
-    source 1419
-    target 3600
-    weight 45
-  ]
-  edge [
-    source 1419
-    target 4051
-    weight 66
-  ]
-  edge [
-    source 1419
-    target 1505
-    weight 26
-  ]
-  edge [
-    source 1419
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1419
-    target 1487
-    weight 51
-  ]
-  edge [
-    source 1419
-    target 3174
-    weight 40
-  ]
-  edge [
-    source 1419
-    target 3276
-    weight 37
-  ]
-  edge [
-    source 1419
-    target 2700
-    weight 31
-  ]
-  edge [
-    source 1420
-    target 3521
-    weight 207
-  ]
-  edge [
-    source 1420
-    target 1616
-    weight 179
-  ]
-  edge [
-    source 1420
-    target 3145
-    weight 144
-  ]
-  edge [
-    source 1420
-    target 2861
-    weight 136
-  ]
-  edge [
-    source 1420
-    target 1887
-    weight 188
-  ]
-  edge [
-    source 1420
-    target 1487
-    weight 138
-  ]
-  edge [
-    source 1420
-    target 3174
-    weight 100
-  ]
-  edge [
-    source 1420
-    target 3420
-    weight 51
-  ]
-  edge [
-    source 1420
-    target 2071
-    weight 172
-  ]
-  edge [
-    source 1420
-    target 3141
-    weight 188
-  ]
-  edge [
-    source 1420
-    target 2700
-    weight 122
-  ]
-  edge [
-    source 1420
-    target 1505
-    weight 72
-  ]
-  edge [
-    source 1420
-    target 3282
-    weight 96
-  ]
-  edge [
-    source 1420
-    target 3642
-    weight 76
-  ]
-  edge [
-    source 1420
-    target 3917
-    weight 108
-  ]
-  edge [
-    source 1420
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1420
-    target 1995
-    weight 96
-  ]
-  edge [
-    source 1420
-    target 3600
-    weight 124
-  ]
-  edge [
-    source 1420
-    target 4051
-    weight 164
-  ]
-  edge [
-    source 1420
-    target 3276
-    weight 121
-  ]
-  edge [
-    source 1420
-    target 4154
-    weight 56
-  ]
-  edge [
-    source 1420
-    target 1632
-    weight 85
-  ]
-  edge [
-    source 1420
-    target 3565
-    weight 57
-  ]
-  edge [
-    source 1420
-    target 1647
-    weight 104
-  ]
-  edge [
-    source 1420
-    target 1582
-    weight 119
-  ]
-  edge [
-    source 1420
-    target 1938
-    weight 28
-  ]
-  edge [
-    source 1420
-    target 2857
-    weight 87
-  ]
-  edge [
-    source 1420
-    target 3443
-    weight 72
-  ]
-  edge [
-    source 1420
-    target 3993
-    weight 113
-  ]
-  edge [
-    source 1420
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 1420
-    target 3542
-    weight 81
-  ]
-  edge [
-    source 1420
-    target 2519
-    weight 89
-  ]
-  edge [
-    source 1420
-    target 3374
-    weight 46
-  ]
-  edge [
-    source 1420
-    target 3962
-    weight 39
-  ]
-  edge [
-    source 1420
-    target 3636
-    weight 55
-  ]
-  edge [
-    source 1420
-    target 2191
-    weight 46
-  ]
-  edge [
-    source 1420
-    target 2870
-    weight 59
-  ]
-  edge [
-    source 1420
-    target 2204
-    weight 55
-  ]
-  edge [
-    source 1420
-    target 1757
-    weight 51
-  ]
-  edge [
-    source 1420
-    target 3423
-    weight 54
-  ]
-  edge [
-    source 1420
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 1420
-    target 3066
-    weight 46
-  ]
-  edge [
-    source 1420
-    target 3006
-    weight 37
-  ]
-  edge [
-    source 1420
-    target 2287
-    weight 48
-  ]
-  edge [
-    source 1420
-    target 2058
-    weight 52
-  ]
-  edge [
-    source 1420
-    target 2553
-    weight 31
-  ]
-  edge [
-    source 1420
-    target 3052
-    weight 36
-  ]
-  edge [
-    source 1420
-    target 2543
-    weight 36
-  ]
-  edge [
-    source 1420
-    target 2800
-    weight 32
-  ]
-  edge [
-    source 1420
-    target 1707
-    weight 24
-  ]
-  edge [
-    source 1420
-    target 3040
-    weight 44
-  ]
-  edge [
-    source 1420
-    target 1507
-    weight 27
-  ]
-  edge [
-    source 1420
-    target 3954
-    weight 50
-  ]
-  edge [
-    source 1420
-    target 1523
-    weight 21
-  ]
-  edge [
-    source 1420
-    target 3937
-    weight 29
-  ]
-  edge [
-    source 1425
-    target 1616
-    weight 50
-  ]
-  edge [
-    source 1425
-    target 3521
-    weight 52
-  ]
-  edge [
-    source 1425
-    target 2861
-    weight 38
-  ]
-  edge [
-    source 1425
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 1425
-    target 4051
-    weight 45
-  ]
-  edge [
-    source 1425
-    target 1487
-    weight 31
-  ]
-  edge [
-    source 1425
-    target 3141
-    weight 40
-  ]
-  edge [
-    source 1425
-    target 2071
-    weight 46
-  ]
-  edge [
-    source 1425
-    target 1887
-    weight 40
-  ]
-  edge [
-    source 1425
-    target 3174
-    weight 23
-  ]
-  edge [
-    source 1425
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 1425
-    target 1582
-    weight 23
-  ]
-  edge [
-    source 1425
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 1425
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1425
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1425
-    target 1995
-    weight 30
-  ]
-  edge [
-    source 1425
-    target 3145
-    weight 34
-  ]
-  edge [
-    source 1425
-    target 1632
-    weight 21
-  ]
-  edge [
-    source 1461
-    target 3295
-    weight 23
-  ]
-  edge [
-    source 1461
-    target 3141
-    weight 107
-  ]
-  edge [
-    source 1461
-    target 2543
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 1616
-    weight 135
-  ]
-  edge [
-    source 1461
-    target 2700
-    weight 64
-  ]
-  edge [
-    source 1461
-    target 3282
-    weight 53
-  ]
-  edge [
-    source 1461
-    target 3642
-    weight 63
-  ]
-  edge [
-    source 1461
-    target 2861
-    weight 93
-  ]
-  edge [
-    source 1461
-    target 4051
-    weight 109
-  ]
-  edge [
-    source 1461
-    target 1887
-    weight 108
-  ]
-  edge [
-    source 1461
-    target 3521
-    weight 134
-  ]
-  edge [
-    source 1461
-    target 2071
-    weight 94
-  ]
-  edge [
-    source 1461
-    target 1632
-    weight 71
-  ]
-  edge [
-    source 1461
-    target 1995
-    weight 61
-  ]
-  edge [
-    source 1461
-    target 3954
-    weight 60
-  ]
-  edge [
-    source 1461
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 1461
-    target 3040
-    weight 47
-  ]
-  edge [
-    source 1461
-    target 1647
-    weight 45
-  ]
-  edge [
-    source 1461
-    target 1707
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 2870
-    weight 39
-  ]
-  edge [
-    source 1461
-    target 3006
-    weight 45
-  ]
-  edge [
-    source 1461
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 1461
-    target 3066
-    weight 41
-  ]
-  edge [
-    source 1461
-    target 3145
-    weight 70
-  ]
-  edge [
-    source 1461
-    target 1505
-    weight 31
-  ]
-  edge [
-    source 1461
-    target 3600
-    weight 47
-  ]
-  edge [
-    source 1461
-    target 1487
-    weight 58
-  ]
-  edge [
-    source 1461
-    target 3276
-    weight 54
-  ]
-  edge [
-    source 1461
-    target 3174
-    weight 56
-  ]
-  edge [
-    source 1461
-    target 1938
-    weight 23
-  ]
-  edge [
-    source 1461
-    target 4162
-    weight 22
-  ]
-  edge [
-    source 1461
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 1461
-    target 4154
-    weight 43
-  ]
-  edge [
-    source 1461
-    target 3565
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 1461
-    target 2287
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 1461
-    target 1757
-    weight 25
-  ]
-  edge [
-    source 1461
-    target 2890
-    weight 23
-  ]
-  edge [
-    source 1461
-    target 3420
-    weight 27
-  ]
-  edge [
-    source 1461
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 1461
-    target 2204
-    weight 25
-  ]
-  edge [
-    source 1461
-    target 1582
-    weight 41
-  ]
-  edge [
-    source 1461
-    target 2519
-    weight 32
-  ]
-  edge [
-    source 1461
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 1487
-    target 2191
-    weight 1117
-  ]
-  edge [
-    source 1487
-    target 3521
-    weight 16575
-  ]
-  edge [
-    source 1487
-    target 1647
-    weight 3130
-  ]
-  edge [
-    source 1487
-    target 1616
-    weight 12135
-  ]
-  edge [
-    source 1487
-    target 2861
-    weight 8162
-  ]
-  edge [
-    source 1487
-    target 3565
-    weight 1286
-  ]
-  edge [
-    source 1487
-    target 3600
-    weight 5728
-  ]
-  edge [
-    source 1487
-    target 2421
-    weight 23
-  ]
-  edge [
-    source 1487
-    target 1789
-    weight 223
-  ]
-  edge [
-    source 1487
-    target 3112
-    weight 39
-  ]
-  edge [
-    source 1487
-    target 1582
-    weight 3158
-  ]
-  edge [
-    source 1487
-    target 3641
-    weight 108
-  ]
-  edge [
-    source 1487
-    target 3374
-    weight 1173
-  ]
-  edge [
-    source 1487
-    target 3077
-    weight 724
-  ]
-  edge [
-    source 1487
-    target 3276
-    weight 3660
-  ]
-  edge [
-    source 1487
-    target 4051
-    weight 9640
-  ]
-  edge [
-    source 1487
-    target 2058
-    weight 749
-  ]
-  edge [
-    source 1487
-    target 3423
-    weight 2226
-  ]
-  edge [
-    source 1487
-    target 3420
-    weight 385
-  ]
-  edge [
-    source 1487
-    target 2227
-    weight 435
-  ]
-  edge [
-    source 1487
-    target 1931
-    weight 70
-  ]
-  edge [
-    source 1487
-    target 3642
-    weight 2101
-  ]
-  edge [
-    source 1487
-    target 3937
-    weight 236
-  ]
-  edge [
-    source 1487
-    target 4187
-    weight 133
-  ]
-  edge [
-    source 1487
-    target 3693
-    weight 89
-  ]
-  edge [
-    source 1487
-    target 3917
-    weight 1544
-  ]
-  edge [
-    source 1487
-    target 3071
-    weight 72
-  ]
-  edge [
-    source 1487
-    target 3970
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 1887
-    weight 9274
-  ]
-  edge [
-    source 1487
-    target 3024
-    weight 79
-  ]
-  edge [
-    source 1487
-    target 1952
-    weight 161
-  ]
-  edge [
-    source 1487
-    target 3177
-    weight 165
-  ]
-  edge [
-    source 1487
-    target 3861
-    weight 73
-  ]
-  edge [
-    source 1487
-    target 3542
-    weight 736
-  ]
-  edge [
-    source 1487
-    target 3174
-    weight 3643
-  ]
-  edge [
-    source 1487
-    target 2071
-    weight 11114
-  ]
-  edge [
-    source 1487
-    target 3145
-    weight 3328
-  ]
-  edge [
-    source 1487
-    target 2700
-    weight 2657
-  ]
-  edge [
-    source 1487
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 2243
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 2857
-    weight 895
-  ]
-  edge [
-    source 1487
-    target 1505
-    weight 1139
-  ]
-  edge [
-    source 1487
-    target 3985
-    weight 52
-  ]
-  edge [
-    source 1487
-    target 4027
-    weight 84
-  ]
-  edge [
-    source 1487
-    target 3432
-    weight 82
-  ]
-  edge [
-    source 1487
-    target 3968
-    weight 101
-  ]
-  edge [
-    source 1487
-    target 3993
-    weight 2911
-  ]
-  edge [
-    source 1487
-    target 3962
-    weight 959
-  ]
-  edge [
-    source 1487
-    target 3357
-    weight 118
-  ]
-  edge [
-    source 1487
-    target 2810
-    weight 179
-  ]
-  edge [
-    source 1487
-    target 3443
-    weight 692
-  ]
-  edge [
-    source 1487
-    target 2800
-    weight 269
-  ]
-  edge [
-    source 1487
-    target 3377
-    weight 154
-  ]
-  edge [
-    source 1487
-    target 1995
-    weight 2672
-  ]
-  edge [
-    source 1487
-    target 3141
-    weight 10481
-  ]
-  edge [
-    source 1487
-    target 2870
-    weight 584
-  ]
-  edge [
-    source 1487
-    target 2978
-    weight 33
-  ]
-  edge [
-    source 1487
-    target 3066
-    weight 469
-  ]
-  edge [
-    source 1487
-    target 3636
-    weight 504
-  ]
-  edge [
-    source 1487
-    target 1757
-    weight 504
-  ]
-  edge [
-    source 1487
-    target 1943
-    weight 115
-  ]
-  edge [
-    source 1487
-    target 3282
-    weight 941
-  ]
-  edge [
-    source 1487
-    target 3954
-    weight 569
-  ]
-  edge [
-    source 1487
-    target 2198
-    weight 78
-  ]
-  edge [
-    source 1487
-    target 1632
-    weight 1198
-  ]
-  edge [
-    source 1487
-    target 3295
-    weight 294
-  ]
-  edge [
-    source 1487
-    target 3052
-    weight 229
-  ]
-  edge [
-    source 1487
-    target 2597
-    weight 135
-  ]
-  edge [
-    source 1487
-    target 2287
-    weight 577
-  ]
-  edge [
-    source 1487
-    target 2204
-    weight 415
-  ]
-  edge [
-    source 1487
-    target 4098
-    weight 70
-  ]
-  edge [
-    source 1487
-    target 2890
-    weight 850
-  ]
-  edge [
-    source 1487
-    target 1848
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 3006
-    weight 466
-  ]
-  edge [
-    source 1487
-    target 3040
-    weight 669
-  ]
-  edge [
-    source 1487
-    target 2519
-    weight 929
-  ]
-  edge [
-    source 1487
-    target 4007
-    weight 36
-  ]
-  edge [
-    source 1487
-    target 2726
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 3408
-    weight 393
-  ]
-  edge [
-    source 1487
-    target 4154
-    weight 713
-  ]
-  edge [
-    source 1487
-    target 2543
-    weight 386
-  ]
-  edge [
-    source 1487
-    target 2217
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 2061
-    weight 62
-  ]
-  edge [
-    source 1487
-    target 4100
-    weight 28
-  ]
-  edge [
-    source 1487
-    target 3253
-    weight 375
-  ]
-  edge [
-    source 1487
-    target 2009
-    weight 28
-  ]
-  edge [
-    source 1487
-    target 1492
-    weight 36
-  ]
-  edge [
-    source 1487
-    target 1517
-    weight 110
-  ]
-  edge [
-    source 1487
-    target 3772
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 2600
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 1856
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 1543
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 4162
-    weight 258
-  ]
-  edge [
-    source 1487
-    target 2099
-    weight 142
-  ]
-  edge [
-    source 1487
-    target 4152
-    weight 82
-  ]
-  edge [
-    source 1487
-    target 3877
-    weight 227
-  ]
-  edge [
-    source 1487
-    target 2553
-    weight 239
-  ]
-  edge [
-    source 1487
-    target 1691
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 1707
-    weight 119
-  ]
-  edge [
-    source 1487
-    target 1507
-    weight 241
-  ]
-  edge [
-    source 1487
-    target 3162
-    weight 60
-  ]
-  edge [
-    source 1487
-    target 3956
-    weight 28
-  ]
-  edge [
-    source 1487
-    target 2844
-    weight 35
-  ]
-  edge [
-    source 1487
-    target 3697
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 3196
-    weight 62
-  ]
-  edge [
-    source 1487
-    target 2711
-    weight 69
-  ]
-  edge [
-    source 1487
-    target 2003
-    weight 70
-  ]
-  edge [
-    source 1487
-    target 2570
-    weight 53
-  ]
-  edge [
-    source 1487
-    target 3847
-    weight 142
-  ]
-  edge [
-    source 1487
-    target 1798
-    weight 67
-  ]
-  edge [
-    source 1487
-    target 1676
-    weight 25
-  ]
-  edge [
-    source 1487
-    target 2082
-    weight 29
-  ]
-  edge [
-    source 1487
-    target 2614
-    weight 106
-  ]
-  edge [
-    source 1487
-    target 3324
-    weight 41
-  ]
-  edge [
-    source 1487
-    target 3210
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 1938
-    weight 212
-  ]
-  edge [
-    source 1487
-    target 2329
-    weight 75
-  ]
-  edge [
-    source 1487
-    target 4040
-    weight 154
-  ]
-  edge [
-    source 1487
-    target 1577
-    weight 37
-  ]
-  edge [
-    source 1487
-    target 3884
-    weight 81
-  ]
-  edge [
-    source 1487
-    target 2573
-    weight 38
-  ]
-  edge [
-    source 1487
-    target 2373
-    weight 33
-  ]
-  edge [
-    source 1487
-    target 4160
-    weight 66
-  ]
-  edge [
-    source 1487
-    target 3935
-    weight 37
-  ]
-  edge [
-    source 1487
-    target 3108
-    weight 32
-  ]
-  edge [
-    source 1487
-    target 1822
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 3860
-    weight 63
-  ]
-  edge [
-    source 1487
-    target 2450
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 2531
-    weight 58
-  ]
-  edge [
-    source 1487
-    target 1631
-    weight 33
-  ]
-  edge [
-    source 1487
-    target 2924
-    weight 44
-  ]
-  edge [
-    source 1487
-    target 1523
-    weight 212
-  ]
-  edge [
-    source 1487
-    target 4081
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 2609
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 3050
-    weight 47
-  ]
-  edge [
-    source 1487
-    target 2743
-    weight 30
-  ]
-  edge [
-    source 1487
-    target 1554
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 1802
-    weight 84
-  ]
-  edge [
-    source 1487
-    target 3309
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 2983
-    weight 25
-  ]
-  edge [
-    source 1487
-    target 1766
-    weight 32
-  ]
-  edge [
-    source 1487
-    target 2955
-    weight 42
-  ]
-  edge [
-    source 1487
-    target 2181
-    weight 36
-  ]
-  edge [
-    source 1487
-    target 3677
-    weight 68
-  ]
-  edge [
-    source 1487
-    target 3856
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 2822
-    weight 73
-  ]
-  edge [
-    source 1487
-    target 3872
-    weight 44
-  ]
-  edge [
-    source 1487
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 1487
-    target 1832
-    weight 31
-  ]
-  edge [
-    source 1487
-    target 1634
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 2115
-    weight 32
-  ]
-  edge [
-    source 1487
-    target 2634
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 3737
-    weight 42
-  ]
-  edge [
-    source 1487
-    target 2556
-    weight 43
-  ]
-  edge [
-    source 1487
-    target 1970
-    weight 117
-  ]
-  edge [
-    source 1487
-    target 3559
-    weight 31
-  ]
-  edge [
-    source 1487
-    target 2836
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 3633
-    weight 54
-  ]
-  edge [
-    source 1487
-    target 2232
-    weight 31
-  ]
-  edge [
-    source 1487
-    target 3462
-    weight 39
-  ]
-  edge [
-    source 1487
-    target 3011
-    weight 30
-  ]
-  edge [
-    source 1487
-    target 3876
-    weight 42
-  ]
-  edge [
-    source 1487
-    target 1528
-    weight 46
-  ]
-  edge [
-    source 1487
-    target 2054
-    weight 35
-  ]
-  edge [
-    source 1487
-    target 2011
-    weight 84
-  ]
-  edge [
-    source 1487
-    target 2078
-    weight 168
-  ]
-  edge [
-    source 1487
-    target 1900
-    weight 23
-  ]
-  edge [
-    source 1492
-    target 3600
-    weight 24
-  ]
-  edge [
-    source 1492
-    target 3521
-    weight 57
-  ]
-  edge [
-    source 1492
-    target 3276
-    weight 31
-  ]
-  edge [
-    source 1492
-    target 2071
-    weight 38
-  ]
-  edge [
-    source 1492
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 1492
-    target 1616
-    weight 50
-  ]
-  edge [
-    source 1492
-    target 3141
-    weight 45
-  ]
-  edge [
-    source 1492
-    target 1887
-    weight 39
-  ]
-  edge [
-    source 1492
-    target 2861
-    weight 38
-  ]
-  edge [
-    source 1492
-    target 2700
-    weight 25
-  ]
-  edge [
-    source 1492
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 1492
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1505
-    target 3521
-    weight 1624
-  ]
-  edge [
-    source 1505
-    target 2861
-    weight 978
-  ]
-  edge [
-    source 1505
-    target 1616
-    weight 1431
-  ]
-  edge [
-    source 1505
-    target 3993
-    weight 786
-  ]
-  edge [
-    source 1505
-    target 3276
-    weight 844
-  ]
-  edge [
-    source 1505
-    target 3420
-    weight 164
-  ]
-  edge [
-    source 1505
-    target 2700
-    weight 679
-  ]
-  edge [
-    source 1505
-    target 3641
-    weight 40
-  ]
-  edge [
-    source 1505
-    target 1647
-    weight 745
-  ]
-  edge [
-    source 1505
-    target 1887
-    weight 1202
-  ]
-  edge [
-    source 1505
-    target 3600
-    weight 1030
-  ]
-  edge [
-    source 1505
-    target 1582
-    weight 625
-  ]
-  edge [
-    source 1505
-    target 3565
-    weight 266
-  ]
-  edge [
-    source 1505
-    target 2870
-    weight 338
-  ]
-  edge [
-    source 1505
-    target 3066
-    weight 271
-  ]
-  edge [
-    source 1505
-    target 3141
-    weight 1336
-  ]
-  edge [
-    source 1505
-    target 4051
-    weight 1258
-  ]
-  edge [
-    source 1505
-    target 3174
-    weight 764
-  ]
-  edge [
-    source 1505
-    target 3374
-    weight 305
-  ]
-  edge [
-    source 1505
-    target 2071
-    weight 1308
-  ]
-  edge [
-    source 1505
-    target 3917
-    weight 490
-  ]
-  edge [
-    source 1505
-    target 1995
-    weight 673
-  ]
-  edge [
-    source 1505
-    target 2191
-    weight 254
-  ]
-  edge [
-    source 1505
-    target 3636
-    weight 221
-  ]
-  edge [
-    source 1505
-    target 3282
-    weight 396
-  ]
-  edge [
-    source 1505
-    target 1632
-    weight 477
-  ]
-  edge [
-    source 1505
-    target 3253
-    weight 156
-  ]
-  edge [
-    source 1505
-    target 3006
-    weight 184
-  ]
-  edge [
-    source 1505
-    target 3052
-    weight 123
-  ]
-  edge [
-    source 1505
-    target 3937
-    weight 92
-  ]
-  edge [
-    source 1505
-    target 3040
-    weight 299
-  ]
-  edge [
-    source 1505
-    target 3145
-    weight 865
-  ]
-  edge [
-    source 1505
-    target 2800
-    weight 119
-  ]
-  edge [
-    source 1505
-    target 2287
-    weight 333
-  ]
-  edge [
-    source 1505
-    target 3642
-    weight 433
-  ]
-  edge [
-    source 1505
-    target 2924
-    weight 26
-  ]
-  edge [
-    source 1505
-    target 4187
-    weight 61
-  ]
-  edge [
-    source 1505
-    target 3443
-    weight 284
-  ]
-  edge [
-    source 1505
-    target 2553
-    weight 132
-  ]
-  edge [
-    source 1505
-    target 2204
-    weight 187
-  ]
-  edge [
-    source 1505
-    target 2543
-    weight 196
-  ]
-  edge [
-    source 1505
-    target 2890
-    weight 245
-  ]
-  edge [
-    source 1505
-    target 3954
-    weight 255
-  ]
-  edge [
-    source 1505
-    target 4152
-    weight 36
-  ]
-  edge [
-    source 1505
-    target 1757
-    weight 199
-  ]
-  edge [
-    source 1505
-    target 4027
-    weight 39
-  ]
-  edge [
-    source 1505
-    target 2061
-    weight 24
-  ]
-  edge [
-    source 1505
-    target 2857
-    weight 391
-  ]
-  edge [
-    source 1505
-    target 1707
-    weight 66
-  ]
-  edge [
-    source 1505
-    target 3071
-    weight 38
-  ]
-  edge [
-    source 1505
-    target 3377
-    weight 65
-  ]
-  edge [
-    source 1505
-    target 3884
-    weight 46
-  ]
-  edge [
-    source 1505
-    target 3423
-    weight 411
-  ]
-  edge [
-    source 1505
-    target 1507
-    weight 99
-  ]
-  edge [
-    source 1505
-    target 2711
-    weight 51
-  ]
-  edge [
-    source 1505
-    target 3542
-    weight 316
-  ]
-  edge [
-    source 1505
-    target 1943
-    weight 80
-  ]
-  edge [
-    source 1505
-    target 2810
-    weight 77
-  ]
-  edge [
-    source 1505
-    target 1798
-    weight 24
-  ]
-  edge [
-    source 1505
-    target 1577
-    weight 23
-  ]
-  edge [
-    source 1505
-    target 3295
-    weight 133
-  ]
-  edge [
-    source 1505
-    target 2570
-    weight 28
-  ]
-  edge [
-    source 1505
-    target 1952
-    weight 46
-  ]
-  edge [
-    source 1505
-    target 3162
-    weight 30
-  ]
-  edge [
-    source 1505
-    target 1517
-    weight 50
-  ]
-  edge [
-    source 1505
-    target 4154
-    weight 248
-  ]
-  edge [
-    source 1505
-    target 3847
-    weight 70
-  ]
-  edge [
-    source 1505
-    target 3860
-    weight 36
-  ]
-  edge [
-    source 1505
-    target 4040
-    weight 69
-  ]
-  edge [
-    source 1505
-    target 4162
-    weight 101
-  ]
-  edge [
-    source 1505
-    target 1938
-    weight 112
-  ]
-  edge [
-    source 1505
-    target 2329
-    weight 42
-  ]
-  edge [
-    source 1505
-    target 3050
-    weight 44
-  ]
-  edge [
-    source 1505
-    target 2227
-    weight 51
-  ]
-  edge [
-    source 1505
-    target 3962
-    weight 217
-  ]
-  edge [
-    source 1505
-    target 1523
-    weight 95
-  ]
-  edge [
-    source 1505
-    target 2058
-    weight 258
-  ]
-  edge [
-    source 1505
-    target 3077
-    weight 117
-  ]
-  edge [
-    source 1505
-    target 2844
-    weight 21
-  ]
-  edge [
-    source 1505
-    target 2519
-    weight 352
-  ]
-  edge [
-    source 1505
-    target 2531
-    weight 23
-  ]
-  edge [
-    source 1505
-    target 3432
-    weight 32
-  ]
-  edge [
-    source 1505
-    target 4098
-    weight 27
-  ]
-  edge [
-    source 1505
-    target 3968
-    weight 28
-  ]
-  edge [
-    source 1505
-    target 2614
-    weight 59
-  ]
-  edge [
-    source 1505
-    target 3877
-    weight 74
-  ]
-  edge [
-    source 1505
-    target 3177
-    weight 75
-  ]
-  edge [
-    source 1505
-    target 1789
-    weight 21
-  ]
-  edge [
-    source 1505
-    target 3196
-    weight 40
-  ]
-  edge [
-    source 1505
-    target 2099
-    weight 33
-  ]
-  edge [
-    source 1505
-    target 2003
-    weight 25
-  ]
-  edge [
-    source 1505
-    target 2011
-    weight 32
-  ]
-  edge [
-    source 1505
-    target 1970
-    weight 33
-  ]
-  edge [
-    source 1505
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 1505
-    target 2556
-    weight 22
-  ]
-  edge [
-    source 1505
-    target 1802
-    weight 37
-  ]
-  edge [
-    source 1505
-    target 3408
-    weight 80
-  ]
-  edge [
-    source 1505
-    target 2078
-    weight 45
-  ]
-  edge [
-    source 1505
-    target 3876
-    weight 23
-  ]
-  edge [
-    source 1507
-    target 3521
-    weight 377
-  ]
-  edge [
-    source 1507
-    target 2861
-    weight 254
-  ]
-  edge [
-    source 1507
-    target 1616
-    weight 358
-  ]
-  edge [
-    source 1507
-    target 3642
-    weight 110
-  ]
-  edge [
-    source 1507
-    target 2191
-    weight 63
-  ]
-  edge [
-    source 1507
-    target 2543
-    weight 66
-  ]
-  edge [
-    source 1507
-    target 1887
-    weight 281
-  ]
-  edge [
-    source 1507
-    target 3066
-    weight 83
-  ]
-  edge [
-    source 1507
-    target 3141
-    weight 295
-  ]
-  edge [
-    source 1507
-    target 3443
-    weight 65
-  ]
-  edge [
-    source 1507
-    target 2857
-    weight 99
-  ]
-  edge [
-    source 1507
-    target 3600
-    weight 169
-  ]
-  edge [
-    source 1507
-    target 4051
-    weight 307
-  ]
-  edge [
-    source 1507
-    target 2700
-    weight 170
-  ]
-  edge [
-    source 1507
-    target 3565
-    weight 56
-  ]
-  edge [
-    source 1507
-    target 3006
-    weight 100
-  ]
-  edge [
-    source 1507
-    target 1647
-    weight 125
-  ]
-  edge [
-    source 1507
-    target 4154
-    weight 113
-  ]
-  edge [
-    source 1507
-    target 3542
-    weight 94
-  ]
-  edge [
-    source 1507
-    target 3374
-    weight 80
-  ]
-  edge [
-    source 1507
-    target 2071
-    weight 290
-  ]
-  edge [
-    source 1507
-    target 3145
-    weight 215
-  ]
-  edge [
-    source 1507
-    target 3253
-    weight 59
-  ]
-  edge [
-    source 1507
-    target 3174
-    weight 192
-  ]
-  edge [
-    source 1507
-    target 1995
-    weight 194
-  ]
-  edge [
-    source 1507
-    target 3295
-    weight 44
-  ]
-  edge [
-    source 1507
-    target 4162
-    weight 44
-  ]
-  edge [
-    source 1507
-    target 2800
-    weight 44
-  ]
-  edge [
-    source 1507
-    target 2531
-    weight 33
-  ]
-  edge [
-    source 1507
-    target 3423
-    weight 105
-  ]
-  edge [
-    source 1507
-    target 3276
-    weight 170
-  ]
-  edge [
-    source 1507
-    target 1632
-    weight 134
-  ]
-  edge [
-    source 1507
-    target 3282
-    weight 89
-  ]
-  edge [
-    source 1507
-    target 1757
-    weight 47
-  ]
-  edge [
-    source 1507
-    target 3420
-    weight 55
-  ]
-  edge [
-    source 1507
-    target 2204
-    weight 56
-  ]
-  edge [
-    source 1507
-    target 2287
-    weight 73
-  ]
-  edge [
-    source 1507
-    target 3993
-    weight 147
-  ]
-  edge [
-    source 1507
-    target 3377
-    weight 22
-  ]
-  edge [
-    source 1507
-    target 3636
-    weight 60
-  ]
-  edge [
-    source 1507
-    target 4040
-    weight 28
-  ]
-  edge [
-    source 1507
-    target 3954
-    weight 114
-  ]
-  edge [
-    source 1507
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1507
-    target 2058
-    weight 53
-  ]
-  edge [
-    source 1507
-    target 1582
-    weight 130
-  ]
-  edge [
-    source 1507
-    target 2870
-    weight 68
-  ]
-  edge [
-    source 1507
-    target 2519
-    weight 91
-  ]
-  edge [
-    source 1507
-    target 3917
-    weight 122
-  ]
-  edge [
-    source 1507
-    target 3040
-    weight 85
-  ]
-  edge [
-    source 1507
-    target 1517
-    weight 29
-  ]
-  edge [
-    source 1507
-    target 1707
-    weight 27
-  ]
-  edge [
-    source 1507
-    target 3052
-    weight 45
-  ]
-  edge [
-    source 1507
-    target 3077
-    weight 24
-  ]
-  edge [
-    source 1507
-    target 1523
-    weight 28
-  ]
-  edge [
-    source 1507
-    target 3877
-    weight 22
-  ]
-  edge [
-    source 1507
-    target 3962
-    weight 48
-  ]
-  edge [
-    source 1507
-    target 2810
-    weight 27
-  ]
-  edge [
-    source 1507
-    target 1938
-    weight 34
-  ]
-  edge [
-    source 1507
-    target 2553
-    weight 42
-  ]
-  edge [
-    source 1507
-    target 3937
-    weight 23
-  ]
-  edge [
-    source 1517
-    target 2861
-    weight 140
-  ]
-  edge [
-    source 1517
-    target 1616
-    weight 156
-  ]
-  edge [
-    source 1517
-    target 1647
-    weight 56
-  ]
-  edge [
-    source 1517
-    target 2071
-    weight 145
-  ]
-  edge [
-    source 1517
-    target 1995
-    weight 80
-  ]
-  edge [
-    source 1517
-    target 1887
-    weight 130
-  ]
-  edge [
-    source 1517
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 1517
-    target 1632
-    weight 51
-  ]
-  edge [
-    source 1517
-    target 3006
-    weight 34
-  ]
-  edge [
-    source 1517
-    target 2519
-    weight 35
-  ]
-  edge [
-    source 1517
-    target 3141
-    weight 133
-  ]
-  edge [
-    source 1517
-    target 3993
-    weight 57
-  ]
-  edge [
-    source 1517
-    target 3521
-    weight 160
-  ]
-  edge [
-    source 1517
-    target 3066
-    weight 32
-  ]
-  edge [
-    source 1517
-    target 2543
-    weight 32
-  ]
-  edge [
-    source 1517
-    target 4051
-    weight 147
-  ]
-  edge [
-    source 1517
-    target 3276
-    weight 58
-  ]
-  edge [
-    source 1517
-    target 3917
-    weight 52
-  ]
-  edge [
-    source 1517
-    target 3174
-    weight 67
-  ]
-  edge [
-    source 1517
-    target 3145
-    weight 86
-  ]
-  edge [
-    source 1517
-    target 3040
-    weight 49
-  ]
-  edge [
-    source 1517
-    target 3642
-    weight 49
-  ]
-  edge [
-    source 1517
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 1517
-    target 2700
-    weight 61
-  ]
-  edge [
-    source 1517
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 1517
-    target 3052
-    weight 26
-  ]
-  edge [
-    source 1517
-    target 3600
-    weight 73
-  ]
-  edge [
-    source 1517
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 1517
-    target 3253
-    weight 24
-  ]
-  edge [
-    source 1517
-    target 3954
-    weight 44
-  ]
-  edge [
-    source 1517
-    target 2287
-    weight 35
-  ]
-  edge [
-    source 1517
-    target 2890
-    weight 30
-  ]
-  edge [
-    source 1517
-    target 3282
-    weight 37
-  ]
-  edge [
-    source 1517
-    target 1582
-    weight 63
-  ]
-  edge [
-    source 1517
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 1517
-    target 2857
-    weight 39
-  ]
-  edge [
-    source 1517
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 1517
-    target 3374
-    weight 30
-  ]
-  edge [
-    source 1517
-    target 3423
-    weight 29
-  ]
-  edge [
-    source 1523
-    target 3521
-    weight 322
-  ]
-  edge [
-    source 1523
-    target 2861
-    weight 229
-  ]
-  edge [
-    source 1523
-    target 3141
-    weight 288
-  ]
-  edge [
-    source 1523
-    target 1887
-    weight 280
-  ]
-  edge [
-    source 1523
-    target 3993
-    weight 148
-  ]
-  edge [
-    source 1523
-    target 2071
-    weight 263
-  ]
-  edge [
-    source 1523
-    target 4051
-    weight 278
-  ]
-  edge [
-    source 1523
-    target 3145
-    weight 200
-  ]
-  edge [
-    source 1523
-    target 1616
-    weight 300
-  ]
-  edge [
-    source 1523
-    target 1582
-    weight 156
-  ]
-  edge [
-    source 1523
-    target 2857
-    weight 103
-  ]
-  edge [
-    source 1523
-    target 1995
-    weight 155
-  ]
-  edge [
-    source 1523
-    target 3253
-    weight 91
-  ]
-  edge [
-    source 1523
-    target 3642
-    weight 113
-  ]
-  edge [
-    source 1523
-    target 3174
-    weight 192
-  ]
-  edge [
-    source 1523
-    target 3565
-    weight 61
-  ]
-  edge [
-    source 1523
-    target 3917
-    weight 116
-  ]
-  edge [
-    source 1523
-    target 2870
-    weight 82
-  ]
-  edge [
-    source 1523
-    target 3542
-    weight 119
-  ]
-  edge [
-    source 1523
-    target 2890
-    weight 74
-  ]
-  edge [
-    source 1523
-    target 2700
-    weight 153
-  ]
-  edge [
-    source 1523
-    target 3282
-    weight 94
-  ]
-  edge [
-    source 1523
-    target 4154
-    weight 75
-  ]
-  edge [
-    source 1523
-    target 2800
-    weight 31
-  ]
-  edge [
-    source 1523
-    target 1938
-    weight 45
-  ]
-  edge [
-    source 1523
-    target 3006
-    weight 65
-  ]
-  edge [
-    source 1523
-    target 3040
-    weight 78
-  ]
-  edge [
-    source 1523
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 1523
-    target 3600
-    weight 179
-  ]
-  edge [
-    source 1523
-    target 1647
-    weight 140
-  ]
-  edge [
-    source 1523
-    target 3276
-    weight 158
-  ]
-  edge [
-    source 1523
-    target 2204
-    weight 55
-  ]
-  edge [
-    source 1523
-    target 1632
-    weight 125
-  ]
-  edge [
-    source 1523
-    target 2543
-    weight 70
-  ]
-  edge [
-    source 1523
-    target 3636
-    weight 60
-  ]
-  edge [
-    source 1523
-    target 3052
-    weight 45
-  ]
-  edge [
-    source 1523
-    target 2519
-    weight 88
-  ]
-  edge [
-    source 1523
-    target 3937
-    weight 21
-  ]
-  edge [
-    source 1523
-    target 1757
-    weight 39
-  ]
-  edge [
-    source 1523
-    target 3423
-    weight 71
-  ]
-  edge [
-    source 1523
-    target 3954
-    weight 75
-  ]
-  edge [
-    source 1523
-    target 3443
-    weight 68
-  ]
-  edge [
-    source 1523
-    target 2191
-    weight 58
-  ]
-  edge [
-    source 1523
-    target 3196
-    weight 33
-  ]
-  edge [
-    source 1523
-    target 3295
-    weight 62
-  ]
-  edge [
-    source 1523
-    target 1707
-    weight 30
-  ]
-  edge [
-    source 1523
-    target 3847
-    weight 29
-  ]
-  edge [
-    source 1523
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1523
-    target 2553
-    weight 52
-  ]
-  edge [
-    source 1523
-    target 4040
-    weight 22
-  ]
-  edge [
-    source 1523
-    target 3962
-    weight 45
-  ]
-  edge [
-    source 1523
-    target 2287
-    weight 58
-  ]
-  edge [
-    source 1523
-    target 3066
-    weight 60
-  ]
-  edge [
-    source 1523
-    target 2058
-    weight 44
-  ]
-  edge [
-    source 1523
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 1523
-    target 3374
-    weight 62
-  ]
-  edge [
-    source 1523
-    target 3877
-    weight 23
-  ]
-  edge [
-    source 1528
-    target 3145
-    weight 28
-  ]
-  edge [
-    source 1528
-    target 1616
-    weight 45
-  ]
-  edge [
-    source 1528
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 1528
-    target 2071
-    weight 50
-  ]
-  edge [
-    source 1528
-    target 2700
-    weight 23
-  ]
-  edge [
-    source 1528
-    target 3276
-    weight 33
-  ]
-  edge [
-    source 1528
-    target 4051
-    weight 45
-  ]
-  edge [
-    source 1528
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 1528
-    target 1887
-    weight 43
-  ]
-  edge [
-    source 1528
-    target 3600
-    weight 34
-  ]
-  edge [
-    source 1528
-    target 2861
-    weight 26
-  ]
-  edge [
-    source 1528
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1528
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 1528
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 1543
-    target 1616
-    weight 26
-  ]
-  edge [
-    source 1543
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 1543
-    target 2861
-    weight 27
-  ]
-  edge [
-    source 1543
-    target 1887
-    weight 29
-  ]
-  edge [
-    source 1543
-    target 2071
-    weight 34
-  ]
-  edge [
-    source 1543
-    target 4051
-    weight 28
-  ]
-  edge [
-    source 1543
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 1554
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 1554
-    target 3521
-    weight 64
-  ]
-  edge [
-    source 1554
-    target 2071
-    weight 43
-  ]
-  edge [
-    source 1554
-    target 2861
-    weight 33
-  ]
-  edge [
-    source 1554
-    target 1616
-    weight 46
-  ]
-  edge [
-    source 1554
-    target 1887
-    weight 42
-  ]
-  edge [
-    source 1554
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 1554
-    target 3141
-    weight 41
-  ]
-  edge [
-    source 1554
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1554
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1554
-    target 3600
-    weight 22
-  ]
-  edge [
-    source 1554
-    target 3145
-    weight 21
-  ]
-  edge [
-    source 1577
-    target 1995
-    weight 48
-  ]
-  edge [
-    source 1577
-    target 2861
-    weight 50
-  ]
-  edge [
-    source 1577
-    target 3521
-    weight 62
-  ]
-  edge [
-    source 1577
-    target 1647
-    weight 30
-  ]
-  edge [
-    source 1577
-    target 1616
-    weight 53
-  ]
-  edge [
-    source 1577
-    target 1887
-    weight 50
-  ]
-  edge [
-    source 1577
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 1577
-    target 2071
-    weight 55
-  ]
-  edge [
-    source 1577
-    target 3636
-    weight 25
-  ]
-  edge [
-    source 1577
-    target 1632
-    weight 26
-  ]
-  edge [
-    source 1577
-    target 3642
-    weight 24
-  ]
-  edge [
-    source 1577
-    target 3040
-    weight 24
-  ]
-  edge [
-    source 1577
-    target 4051
-    weight 55
-  ]
-  edge [
-    source 1577
-    target 3145
-    weight 35
-  ]
-  edge [
-    source 1577
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 1577
-    target 3141
-    weight 49
-  ]
-  edge [
-    source 1577
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1577
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 1577
-    target 1582
-    weight 29
-  ]
-  edge [
-    source 1577
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1577
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 3521
-    weight 5207
-  ]
-  edge [
-    source 1582
-    target 1616
-    weight 4378
-  ]
-  edge [
-    source 1582
-    target 1647
-    weight 1533
-  ]
-  edge [
-    source 1582
-    target 3600
-    weight 2610
-  ]
-  edge [
-    source 1582
-    target 2861
-    weight 2993
-  ]
-  edge [
-    source 1582
-    target 3565
-    weight 779
-  ]
-  edge [
-    source 1582
-    target 3077
-    weight 158
-  ]
-  edge [
-    source 1582
-    target 2700
-    weight 1708
-  ]
-  edge [
-    source 1582
-    target 2857
-    weight 572
-  ]
-  edge [
-    source 1582
-    target 3993
-    weight 1398
-  ]
-  edge [
-    source 1582
-    target 3141
-    weight 4356
-  ]
-  edge [
-    source 1582
-    target 2191
-    weight 406
-  ]
-  edge [
-    source 1582
-    target 3071
-    weight 46
-  ]
-  edge [
-    source 1582
-    target 2071
-    weight 3814
-  ]
-  edge [
-    source 1582
-    target 3641
-    weight 53
-  ]
-  edge [
-    source 1582
-    target 2204
-    weight 270
-  ]
-  edge [
-    source 1582
-    target 3177
-    weight 98
-  ]
-  edge [
-    source 1582
-    target 1887
-    weight 4027
-  ]
-  edge [
-    source 1582
-    target 3542
-    weight 750
-  ]
-  edge [
-    source 1582
-    target 3917
-    weight 948
-  ]
-  edge [
-    source 1582
-    target 4051
-    weight 3806
-  ]
-  edge [
-    source 1582
-    target 3276
-    weight 1923
-  ]
-  edge [
-    source 1582
-    target 3282
-    weight 693
-  ]
-  edge [
-    source 1582
-    target 3443
-    weight 470
-  ]
-  edge [
-    source 1582
-    target 2181
-    weight 28
-  ]
-  edge [
-    source 1582
-    target 3145
-    weight 1841
-  ]
-  edge [
-    source 1582
-    target 1757
-    weight 291
-  ]
-  edge [
-    source 1582
-    target 2329
-    weight 53
-  ]
-  edge [
-    source 1582
-    target 1995
-    weight 1411
-  ]
-  edge [
-    source 1582
-    target 2227
-    weight 64
-  ]
-  edge [
-    source 1582
-    target 2058
-    weight 387
-  ]
-  edge [
-    source 1582
-    target 2519
-    weight 610
-  ]
-  edge [
-    source 1582
-    target 2543
-    weight 241
-  ]
-  edge [
-    source 1582
-    target 4027
-    weight 42
-  ]
-  edge [
-    source 1582
-    target 3377
-    weight 82
-  ]
-  edge [
-    source 1582
-    target 3642
-    weight 1133
-  ]
-  edge [
-    source 1582
-    target 3374
-    weight 410
-  ]
-  edge [
-    source 1582
-    target 3985
-    weight 27
-  ]
-  edge [
-    source 1582
-    target 3174
-    weight 1784
-  ]
-  edge [
-    source 1582
-    target 3636
-    weight 355
-  ]
-  edge [
-    source 1582
-    target 3954
-    weight 392
-  ]
-  edge [
-    source 1582
-    target 1938
-    weight 256
-  ]
-  edge [
-    source 1582
-    target 3847
-    weight 165
-  ]
-  edge [
-    source 1582
-    target 3420
-    weight 282
-  ]
-  edge [
-    source 1582
-    target 2374
-    weight 29
-  ]
-  edge [
-    source 1582
-    target 2890
-    weight 555
-  ]
-  edge [
-    source 1582
-    target 3040
-    weight 382
-  ]
-  edge [
-    source 1582
-    target 4154
-    weight 575
-  ]
-  edge [
-    source 1582
-    target 1632
-    weight 783
-  ]
-  edge [
-    source 1582
-    target 3937
-    weight 125
-  ]
-  edge [
-    source 1582
-    target 3423
-    weight 730
-  ]
-  edge [
-    source 1582
-    target 3253
-    weight 299
-  ]
-  edge [
-    source 1582
-    target 3050
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 4040
-    weight 106
-  ]
-  edge [
-    source 1582
-    target 3052
-    weight 160
-  ]
-  edge [
-    source 1582
-    target 2553
-    weight 178
-  ]
-  edge [
-    source 1582
-    target 2870
-    weight 447
-  ]
-  edge [
-    source 1582
-    target 3066
-    weight 307
-  ]
-  edge [
-    source 1582
-    target 3295
-    weight 211
-  ]
-  edge [
-    source 1582
-    target 3006
-    weight 264
-  ]
-  edge [
-    source 1582
-    target 3884
-    weight 61
-  ]
-  edge [
-    source 1582
-    target 2287
-    weight 340
-  ]
-  edge [
-    source 1582
-    target 3962
-    weight 352
-  ]
-  edge [
-    source 1582
-    target 2844
-    weight 22
-  ]
-  edge [
-    source 1582
-    target 2800
-    weight 163
-  ]
-  edge [
-    source 1582
-    target 2262
-    weight 23
-  ]
-  edge [
-    source 1582
-    target 2531
-    weight 30
-  ]
-  edge [
-    source 1582
-    target 3432
-    weight 47
-  ]
-  edge [
-    source 1582
-    target 3162
-    weight 42
-  ]
-  edge [
-    source 1582
-    target 3877
-    weight 121
-  ]
-  edge [
-    source 1582
-    target 3196
-    weight 39
-  ]
-  edge [
-    source 1582
-    target 3935
-    weight 26
-  ]
-  edge [
-    source 1582
-    target 1707
-    weight 78
-  ]
-  edge [
-    source 1582
-    target 2450
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 2955
-    weight 29
-  ]
-  edge [
-    source 1582
-    target 2570
-    weight 40
-  ]
-  edge [
-    source 1582
-    target 3024
-    weight 39
-  ]
-  edge [
-    source 1582
-    target 3952
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 1631
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 4152
-    weight 59
-  ]
-  edge [
-    source 1582
-    target 4160
-    weight 30
-  ]
-  edge [
-    source 1582
-    target 4162
-    weight 178
-  ]
-  edge [
-    source 1582
-    target 3968
-    weight 50
-  ]
-  edge [
-    source 1582
-    target 1952
-    weight 75
-  ]
-  edge [
-    source 1582
-    target 2082
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 3510
-    weight 23
-  ]
-  edge [
-    source 1582
-    target 3860
-    weight 45
-  ]
-  edge [
-    source 1582
-    target 2614
-    weight 80
-  ]
-  edge [
-    source 1582
-    target 1931
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 2711
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 3108
-    weight 27
-  ]
-  edge [
-    source 1582
-    target 3861
-    weight 31
-  ]
-  edge [
-    source 1582
-    target 1798
-    weight 40
-  ]
-  edge [
-    source 1582
-    target 1691
-    weight 22
-  ]
-  edge [
-    source 1582
-    target 4187
-    weight 58
-  ]
-  edge [
-    source 1582
-    target 3677
-    weight 51
-  ]
-  edge [
-    source 1582
-    target 1802
-    weight 59
-  ]
-  edge [
-    source 1582
-    target 2822
-    weight 46
-  ]
-  edge [
-    source 1582
-    target 3872
-    weight 33
-  ]
-  edge [
-    source 1582
-    target 1766
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 2924
-    weight 39
-  ]
-  edge [
-    source 1582
-    target 3440
-    weight 21
-  ]
-  edge [
-    source 1582
-    target 2810
-    weight 96
-  ]
-  edge [
-    source 1582
-    target 1789
-    weight 40
-  ]
-  edge [
-    source 1582
-    target 4098
-    weight 32
-  ]
-  edge [
-    source 1582
-    target 3357
-    weight 32
-  ]
-  edge [
-    source 1582
-    target 2573
-    weight 21
-  ]
-  edge [
-    source 1582
-    target 1943
-    weight 66
-  ]
-  edge [
-    source 1582
-    target 1970
-    weight 67
-  ]
-  edge [
-    source 1582
-    target 2003
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 2011
-    weight 53
-  ]
-  edge [
-    source 1582
-    target 3633
-    weight 38
-  ]
-  edge [
-    source 1582
-    target 3408
-    weight 100
-  ]
-  edge [
-    source 1582
-    target 2099
-    weight 57
-  ]
-  edge [
-    source 1582
-    target 2061
-    weight 28
-  ]
-  edge [
-    source 1582
-    target 2556
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 2232
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 2597
-    weight 36
-  ]
-  edge [
-    source 1582
-    target 2743
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 2078
-    weight 95
-  ]
-  edge [
-    source 1582
-    target 3876
-    weight 21
-  ]
-  edge [
-    source 1616
-    target 3521
-    weight 27580
-  ]
-  edge [
-    source 1616
-    target 3565
-    weight 2192
-  ]
-  edge [
-    source 1616
-    target 2861
-    weight 11961
-  ]
-  edge [
-    source 1616
-    target 1647
-    weight 3750
-  ]
-  edge [
-    source 1616
-    target 3600
-    weight 7211
-  ]
-  edge [
-    source 1616
-    target 2191
-    weight 1037
-  ]
-  edge [
-    source 1616
-    target 2421
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3642
-    weight 3660
-  ]
-  edge [
-    source 1616
-    target 3641
-    weight 105
-  ]
-  edge [
-    source 1616
-    target 1789
-    weight 127
-  ]
-  edge [
-    source 1616
-    target 3374
-    weight 1059
-  ]
-  edge [
-    source 1616
-    target 3276
-    weight 4843
-  ]
-  edge [
-    source 1616
-    target 4051
-    weight 15364
-  ]
-  edge [
-    source 1616
-    target 2058
-    weight 770
-  ]
-  edge [
-    source 1616
-    target 3423
-    weight 1886
-  ]
-  edge [
-    source 1616
-    target 3077
-    weight 476
-  ]
-  edge [
-    source 1616
-    target 3443
-    weight 906
-  ]
-  edge [
-    source 1616
-    target 3420
-    weight 537
-  ]
-  edge [
-    source 1616
-    target 3917
-    weight 1887
-  ]
-  edge [
-    source 1616
-    target 3071
-    weight 79
-  ]
-  edge [
-    source 1616
-    target 1769
-    weight 21
-  ]
-  edge [
-    source 1616
-    target 2071
-    weight 14155
-  ]
-  edge [
-    source 1616
-    target 2181
-    weight 50
-  ]
-  edge [
-    source 1616
-    target 3968
-    weight 122
-  ]
-  edge [
-    source 1616
-    target 2628
-    weight 24
-  ]
-  edge [
-    source 1616
-    target 3962
-    weight 865
-  ]
-  edge [
-    source 1616
-    target 3024
-    weight 85
-  ]
-  edge [
-    source 1616
-    target 2227
-    weight 247
-  ]
-  edge [
-    source 1616
-    target 1952
-    weight 137
-  ]
-  edge [
-    source 1616
-    target 3377
-    weight 229
-  ]
-  edge [
-    source 1616
-    target 3177
-    weight 173
-  ]
-  edge [
-    source 1616
-    target 3861
-    weight 67
-  ]
-  edge [
-    source 1616
-    target 2329
-    weight 121
-  ]
-  edge [
-    source 1616
-    target 3993
-    weight 3363
-  ]
-  edge [
-    source 1616
-    target 3542
-    weight 1148
-  ]
-  edge [
-    source 1616
-    target 3066
-    weight 737
-  ]
-  edge [
-    source 1616
-    target 2700
-    weight 4099
-  ]
-  edge [
-    source 1616
-    target 3937
-    weight 229
-  ]
-  edge [
-    source 1616
-    target 3174
-    weight 5678
-  ]
-  edge [
-    source 1616
-    target 2978
-    weight 35
-  ]
-  edge [
-    source 1616
-    target 2857
-    weight 1192
-  ]
-  edge [
-    source 1616
-    target 1995
-    weight 4255
-  ]
-  edge [
-    source 1616
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3141
-    weight 16049
-  ]
-  edge [
-    source 1616
-    target 3145
-    weight 4500
-  ]
-  edge [
-    source 1616
-    target 3432
-    weight 99
-  ]
-  edge [
-    source 1616
-    target 3112
-    weight 32
-  ]
-  edge [
-    source 1616
-    target 1887
-    weight 14580
-  ]
-  edge [
-    source 1616
-    target 1943
-    weight 140
-  ]
-  edge [
-    source 1616
-    target 2543
-    weight 634
-  ]
-  edge [
-    source 1616
-    target 4187
-    weight 139
-  ]
-  edge [
-    source 1616
-    target 3357
-    weight 78
-  ]
-  edge [
-    source 1616
-    target 1757
-    weight 650
-  ]
-  edge [
-    source 1616
-    target 2614
-    weight 148
-  ]
-  edge [
-    source 1616
-    target 3985
-    weight 74
-  ]
-  edge [
-    source 1616
-    target 3282
-    weight 1354
-  ]
-  edge [
-    source 1616
-    target 2870
-    weight 897
-  ]
-  edge [
-    source 1616
-    target 2810
-    weight 199
-  ]
-  edge [
-    source 1616
-    target 2800
-    weight 318
-  ]
-  edge [
-    source 1616
-    target 1631
-    weight 40
-  ]
-  edge [
-    source 1616
-    target 3253
-    weight 554
-  ]
-  edge [
-    source 1616
-    target 4027
-    weight 101
-  ]
-  edge [
-    source 1616
-    target 1931
-    weight 66
-  ]
-  edge [
-    source 1616
-    target 1632
-    weight 2020
-  ]
-  edge [
-    source 1616
-    target 3636
-    weight 778
-  ]
-  edge [
-    source 1616
-    target 2573
-    weight 51
-  ]
-  edge [
-    source 1616
-    target 4152
-    weight 100
-  ]
-  edge [
-    source 1616
-    target 3954
-    weight 969
-  ]
-  edge [
-    source 1616
-    target 2204
-    weight 580
-  ]
-  edge [
-    source 1616
-    target 2230
-    weight 23
-  ]
-  edge [
-    source 1616
-    target 2924
-    weight 59
-  ]
-  edge [
-    source 1616
-    target 2054
-    weight 61
-  ]
-  edge [
-    source 1616
-    target 2519
-    weight 1230
-  ]
-  edge [
-    source 1616
-    target 1938
-    weight 328
-  ]
-  edge [
-    source 1616
-    target 2597
-    weight 90
-  ]
-  edge [
-    source 1616
-    target 2198
-    weight 43
-  ]
-  edge [
-    source 1616
-    target 3693
-    weight 53
-  ]
-  edge [
-    source 1616
-    target 2287
-    weight 776
-  ]
-  edge [
-    source 1616
-    target 3295
-    weight 553
-  ]
-  edge [
-    source 1616
-    target 2232
-    weight 57
-  ]
-  edge [
-    source 1616
-    target 3146
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 3006
-    weight 763
-  ]
-  edge [
-    source 1616
-    target 2082
-    weight 52
-  ]
-  edge [
-    source 1616
-    target 3040
-    weight 1012
-  ]
-  edge [
-    source 1616
-    target 2890
-    weight 1139
-  ]
-  edge [
-    source 1616
-    target 3559
-    weight 44
-  ]
-  edge [
-    source 1616
-    target 3052
-    weight 327
-  ]
-  edge [
-    source 1616
-    target 4098
-    weight 91
-  ]
-  edge [
-    source 1616
-    target 1691
-    weight 48
-  ]
-  edge [
-    source 1616
-    target 4040
-    weight 243
-  ]
-  edge [
-    source 1616
-    target 2531
-    weight 97
-  ]
-  edge [
-    source 1616
-    target 3884
-    weight 127
-  ]
-  edge [
-    source 1616
-    target 2743
-    weight 57
-  ]
-  edge [
-    source 1616
-    target 2003
-    weight 121
-  ]
-  edge [
-    source 1616
-    target 3935
-    weight 66
-  ]
-  edge [
-    source 1616
-    target 4154
-    weight 1248
-  ]
-  edge [
-    source 1616
-    target 1707
-    weight 185
-  ]
-  edge [
-    source 1616
-    target 2009
-    weight 36
-  ]
-  edge [
-    source 1616
-    target 4160
-    weight 98
-  ]
-  edge [
-    source 1616
-    target 3847
-    weight 281
-  ]
-  edge [
-    source 1616
-    target 1766
-    weight 61
-  ]
-  edge [
-    source 1616
-    target 2553
-    weight 346
-  ]
-  edge [
-    source 1616
-    target 4007
-    weight 41
-  ]
-  edge [
-    source 1616
-    target 2726
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 1856
-    weight 29
-  ]
-  edge [
-    source 1616
-    target 2450
-    weight 42
-  ]
-  edge [
-    source 1616
-    target 2832
-    weight 38
-  ]
-  edge [
-    source 1616
-    target 2061
-    weight 61
-  ]
-  edge [
-    source 1616
-    target 2570
-    weight 75
-  ]
-  edge [
-    source 1616
-    target 1775
-    weight 24
-  ]
-  edge [
-    source 1616
-    target 3663
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 2556
-    weight 70
-  ]
-  edge [
-    source 1616
-    target 4100
-    weight 37
-  ]
-  edge [
-    source 1616
-    target 3860
-    weight 83
-  ]
-  edge [
-    source 1616
-    target 3050
-    weight 59
-  ]
-  edge [
-    source 1616
-    target 2600
-    weight 27
-  ]
-  edge [
-    source 1616
-    target 2953
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3196
-    weight 102
-  ]
-  edge [
-    source 1616
-    target 2652
-    weight 23
-  ]
-  edge [
-    source 1616
-    target 1798
-    weight 73
-  ]
-  edge [
-    source 1616
-    target 2801
-    weight 31
-  ]
-  edge [
-    source 1616
-    target 4162
-    weight 392
-  ]
-  edge [
-    source 1616
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 1616
-    target 3408
-    weight 275
-  ]
-  edge [
-    source 1616
-    target 2011
-    weight 125
-  ]
-  edge [
-    source 1616
-    target 2955
-    weight 65
-  ]
-  edge [
-    source 1616
-    target 2711
-    weight 93
-  ]
-  edge [
-    source 1616
-    target 3375
-    weight 27
-  ]
-  edge [
-    source 1616
-    target 2609
-    weight 39
-  ]
-  edge [
-    source 1616
-    target 1676
-    weight 37
-  ]
-  edge [
-    source 1616
-    target 3952
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3462
-    weight 57
-  ]
-  edge [
-    source 1616
-    target 3162
-    weight 83
-  ]
-  edge [
-    source 1616
-    target 3956
-    weight 53
-  ]
-  edge [
-    source 1616
-    target 2844
-    weight 58
-  ]
-  edge [
-    source 1616
-    target 1664
-    weight 25
-  ]
-  edge [
-    source 1616
-    target 2434
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 3877
-    weight 261
-  ]
-  edge [
-    source 1616
-    target 2836
-    weight 34
-  ]
-  edge [
-    source 1616
-    target 3324
-    weight 31
-  ]
-  edge [
-    source 1616
-    target 1802
-    weight 102
-  ]
-  edge [
-    source 1616
-    target 3309
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3108
-    weight 40
-  ]
-  edge [
-    source 1616
-    target 2115
-    weight 38
-  ]
-  edge [
-    source 1616
-    target 3465
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 3074
-    weight 21
-  ]
-  edge [
-    source 1616
-    target 2983
-    weight 34
-  ]
-  edge [
-    source 1616
-    target 1832
-    weight 47
-  ]
-  edge [
-    source 1616
-    target 3692
-    weight 27
-  ]
-  edge [
-    source 1616
-    target 1922
-    weight 30
-  ]
-  edge [
-    source 1616
-    target 1634
-    weight 33
-  ]
-  edge [
-    source 1616
-    target 2997
-    weight 22
-  ]
-  edge [
-    source 1616
-    target 3011
-    weight 32
-  ]
-  edge [
-    source 1616
-    target 2099
-    weight 128
-  ]
-  edge [
-    source 1616
-    target 3677
-    weight 77
-  ]
-  edge [
-    source 1616
-    target 3856
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 2822
-    weight 87
-  ]
-  edge [
-    source 1616
-    target 3872
-    weight 53
-  ]
-  edge [
-    source 1616
-    target 3440
-    weight 36
-  ]
-  edge [
-    source 1616
-    target 2634
-    weight 30
-  ]
-  edge [
-    source 1616
-    target 3737
-    weight 42
-  ]
-  edge [
-    source 1616
-    target 1970
-    weight 145
-  ]
-  edge [
-    source 1616
-    target 1900
-    weight 31
-  ]
-  edge [
-    source 1616
-    target 3633
-    weight 63
-  ]
-  edge [
-    source 1616
-    target 2078
-    weight 175
-  ]
-  edge [
-    source 1616
-    target 3876
-    weight 49
-  ]
-  edge [
-    source 1631
-    target 2861
-    weight 37
-  ]
-  edge [
-    source 1631
-    target 3282
-    weight 23
-  ]
-  edge [
-    source 1631
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 1631
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 1631
-    target 1647
-    weight 27
-  ]
-  edge [
-    source 1631
-    target 2071
-    weight 42
-  ]
-  edge [
-    source 1631
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 1631
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 1631
-    target 1887
-    weight 41
-  ]
-  edge [
-    source 1631
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 1631
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 1631
-    target 3600
-    weight 31
-  ]
-  edge [
-    source 1631
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 1631
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1631
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 1631
-    target 3917
-    weight 24
-  ]
-  edge [
-    source 1631
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 1632
-    target 2861
-    weight 1501
-  ]
-  edge [
-    source 1632
-    target 4051
-    weight 1801
-  ]
-  edge [
-    source 1632
-    target 3521
-    weight 2158
-  ]
-  edge [
-    source 1632
-    target 3565
-    weight 565
-  ]
-  edge [
-    source 1632
-    target 2181
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 2810
-    weight 112
-  ]
-  edge [
-    source 1632
-    target 2700
-    weight 1085
-  ]
-  edge [
-    source 1632
-    target 4027
-    weight 46
-  ]
-  edge [
-    source 1632
-    target 3636
-    weight 325
-  ]
-  edge [
-    source 1632
-    target 3420
-    weight 259
-  ]
-  edge [
-    source 1632
-    target 3276
-    weight 909
-  ]
-  edge [
-    source 1632
-    target 3600
-    weight 1074
-  ]
-  edge [
-    source 1632
-    target 3443
-    weight 325
-  ]
-  edge [
-    source 1632
-    target 3993
-    weight 860
-  ]
-  edge [
-    source 1632
-    target 2071
-    weight 1698
-  ]
-  edge [
-    source 1632
-    target 3377
-    weight 99
-  ]
-  edge [
-    source 1632
-    target 3642
-    weight 768
-  ]
-  edge [
-    source 1632
-    target 3145
-    weight 1124
-  ]
-  edge [
-    source 1632
-    target 3141
-    weight 1807
-  ]
-  edge [
-    source 1632
-    target 1647
-    weight 882
-  ]
-  edge [
-    source 1632
-    target 2800
-    weight 151
-  ]
-  edge [
-    source 1632
-    target 1995
-    weight 1060
-  ]
-  edge [
-    source 1632
-    target 3968
-    weight 43
-  ]
-  edge [
-    source 1632
-    target 3253
-    weight 216
-  ]
-  edge [
-    source 1632
-    target 3006
-    weight 384
-  ]
-  edge [
-    source 1632
-    target 2082
-    weight 30
-  ]
-  edge [
-    source 1632
-    target 2232
-    weight 28
-  ]
-  edge [
-    source 1632
-    target 3559
-    weight 21
-  ]
-  edge [
-    source 1632
-    target 3066
-    weight 357
-  ]
-  edge [
-    source 1632
-    target 3052
-    weight 137
-  ]
-  edge [
-    source 1632
-    target 2191
-    weight 237
-  ]
-  edge [
-    source 1632
-    target 1887
-    weight 1788
-  ]
-  edge [
-    source 1632
-    target 2543
-    weight 275
-  ]
-  edge [
-    source 1632
-    target 3954
-    weight 536
-  ]
-  edge [
-    source 1632
-    target 3295
-    weight 205
-  ]
-  edge [
-    source 1632
-    target 1707
-    weight 126
-  ]
-  edge [
-    source 1632
-    target 3282
-    weight 629
-  ]
-  edge [
-    source 1632
-    target 2870
-    weight 412
-  ]
-  edge [
-    source 1632
-    target 3847
-    weight 148
-  ]
-  edge [
-    source 1632
-    target 2329
-    weight 52
-  ]
-  edge [
-    source 1632
-    target 2570
-    weight 43
-  ]
-  edge [
-    source 1632
-    target 3985
-    weight 30
-  ]
-  edge [
-    source 1632
-    target 2287
-    weight 347
-  ]
-  edge [
-    source 1632
-    target 2890
-    weight 316
-  ]
-  edge [
-    source 1632
-    target 3937
-    weight 109
-  ]
-  edge [
-    source 1632
-    target 3423
-    weight 409
-  ]
-  edge [
-    source 1632
-    target 3174
-    weight 969
-  ]
-  edge [
-    source 1632
-    target 3917
-    weight 625
-  ]
-  edge [
-    source 1632
-    target 1757
-    weight 240
-  ]
-  edge [
-    source 1632
-    target 4160
-    weight 37
-  ]
-  edge [
-    source 1632
-    target 3641
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 3040
-    weight 465
-  ]
-  edge [
-    source 1632
-    target 2204
-    weight 247
-  ]
-  edge [
-    source 1632
-    target 4040
-    weight 90
-  ]
-  edge [
-    source 1632
-    target 2519
-    weight 462
-  ]
-  edge [
-    source 1632
-    target 4154
-    weight 369
-  ]
-  edge [
-    source 1632
-    target 2011
-    weight 46
-  ]
-  edge [
-    source 1632
-    target 3962
-    weight 239
-  ]
-  edge [
-    source 1632
-    target 1943
-    weight 72
-  ]
-  edge [
-    source 1632
-    target 2857
-    weight 483
-  ]
-  edge [
-    source 1632
-    target 2450
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 3542
-    weight 447
-  ]
-  edge [
-    source 1632
-    target 3884
-    weight 70
-  ]
-  edge [
-    source 1632
-    target 3956
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 4187
-    weight 36
-  ]
-  edge [
-    source 1632
-    target 3935
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 3196
-    weight 36
-  ]
-  edge [
-    source 1632
-    target 1938
-    weight 166
-  ]
-  edge [
-    source 1632
-    target 1766
-    weight 35
-  ]
-  edge [
-    source 1632
-    target 4162
-    weight 162
-  ]
-  edge [
-    source 1632
-    target 1856
-    weight 21
-  ]
-  edge [
-    source 1632
-    target 2743
-    weight 31
-  ]
-  edge [
-    source 1632
-    target 3374
-    weight 273
-  ]
-  edge [
-    source 1632
-    target 2614
-    weight 74
-  ]
-  edge [
-    source 1632
-    target 2573
-    weight 22
-  ]
-  edge [
-    source 1632
-    target 3408
-    weight 44
-  ]
-  edge [
-    source 1632
-    target 1952
-    weight 39
-  ]
-  edge [
-    source 1632
-    target 3071
-    weight 31
-  ]
-  edge [
-    source 1632
-    target 3162
-    weight 26
-  ]
-  edge [
-    source 1632
-    target 2531
-    weight 37
-  ]
-  edge [
-    source 1632
-    target 3860
-    weight 42
-  ]
-  edge [
-    source 1632
-    target 3177
-    weight 76
-  ]
-  edge [
-    source 1632
-    target 2061
-    weight 25
-  ]
-  edge [
-    source 1632
-    target 2054
-    weight 31
-  ]
-  edge [
-    source 1632
-    target 4098
-    weight 39
-  ]
-  edge [
-    source 1632
-    target 2711
-    weight 42
-  ]
-  edge [
-    source 1632
-    target 2553
-    weight 180
-  ]
-  edge [
-    source 1632
-    target 2003
-    weight 53
-  ]
-  edge [
-    source 1632
-    target 2058
-    weight 239
-  ]
-  edge [
-    source 1632
-    target 1798
-    weight 25
-  ]
-  edge [
-    source 1632
-    target 3677
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 1632
-    target 2924
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 3432
-    weight 43
-  ]
-  edge [
-    source 1632
-    target 2099
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 3077
-    weight 74
-  ]
-  edge [
-    source 1632
-    target 2227
-    weight 29
-  ]
-  edge [
-    source 1632
-    target 1634
-    weight 22
-  ]
-  edge [
-    source 1632
-    target 1970
-    weight 45
-  ]
-  edge [
-    source 1632
-    target 3877
-    weight 74
-  ]
-  edge [
-    source 1632
-    target 1802
-    weight 42
-  ]
-  edge [
-    source 1632
-    target 2556
-    weight 29
-  ]
-  edge [
-    source 1632
-    target 2822
-    weight 21
-  ]
-  edge [
-    source 1632
-    target 2078
-    weight 64
-  ]
-  edge [
-    source 1632
-    target 3876
-    weight 22
-  ]
-  edge [
-    source 1634
-    target 3954
-    weight 23
-  ]
-  edge [
-    source 1634
-    target 3521
-    weight 35
-  ]
-  edge [
-    source 1634
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 1634
-    target 3145
-    weight 25
-  ]
-  edge [
-    source 1634
-    target 2861
-    weight 28
-  ]
-  edge [
-    source 1634
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 1634
-    target 3141
-    weight 33
-  ]
-  edge [
-    source 1634
-    target 2071
-    weight 32
-  ]
-  edge [
-    source 1634
-    target 1887
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 3521
-    weight 4834
-  ]
-  edge [
-    source 1647
-    target 3600
-    weight 2769
-  ]
-  edge [
-    source 1647
-    target 2861
-    weight 3019
-  ]
-  edge [
-    source 1647
-    target 3565
-    weight 927
-  ]
-  edge [
-    source 1647
-    target 2191
-    weight 616
-  ]
-  edge [
-    source 1647
-    target 3641
-    weight 64
-  ]
-  edge [
-    source 1647
-    target 3642
-    weight 966
-  ]
-  edge [
-    source 1647
-    target 3937
-    weight 185
-  ]
-  edge [
-    source 1647
-    target 4187
-    weight 101
-  ]
-  edge [
-    source 1647
-    target 3276
-    weight 1773
-  ]
-  edge [
-    source 1647
-    target 3420
-    weight 325
-  ]
-  edge [
-    source 1647
-    target 3917
-    weight 961
-  ]
-  edge [
-    source 1647
-    target 3071
-    weight 54
-  ]
-  edge [
-    source 1647
-    target 1887
-    weight 3292
-  ]
-  edge [
-    source 1647
-    target 3962
-    weight 452
-  ]
-  edge [
-    source 1647
-    target 3443
-    weight 488
-  ]
-  edge [
-    source 1647
-    target 4051
-    weight 3305
-  ]
-  edge [
-    source 1647
-    target 1952
-    weight 82
-  ]
-  edge [
-    source 1647
-    target 3374
-    weight 474
-  ]
-  edge [
-    source 1647
-    target 3177
-    weight 120
-  ]
-  edge [
-    source 1647
-    target 3423
-    weight 921
-  ]
-  edge [
-    source 1647
-    target 2329
-    weight 60
-  ]
-  edge [
-    source 1647
-    target 3542
-    weight 531
-  ]
-  edge [
-    source 1647
-    target 3066
-    weight 330
-  ]
-  edge [
-    source 1647
-    target 2071
-    weight 3833
-  ]
-  edge [
-    source 1647
-    target 3968
-    weight 57
-  ]
-  edge [
-    source 1647
-    target 2857
-    weight 607
-  ]
-  edge [
-    source 1647
-    target 2700
-    weight 1653
-  ]
-  edge [
-    source 1647
-    target 2978
-    weight 30
-  ]
-  edge [
-    source 1647
-    target 3141
-    weight 3692
-  ]
-  edge [
-    source 1647
-    target 3993
-    weight 1861
-  ]
-  edge [
-    source 1647
-    target 3432
-    weight 56
-  ]
-  edge [
-    source 1647
-    target 1789
-    weight 47
-  ]
-  edge [
-    source 1647
-    target 3174
-    weight 1544
-  ]
-  edge [
-    source 1647
-    target 3985
-    weight 40
-  ]
-  edge [
-    source 1647
-    target 2058
-    weight 454
-  ]
-  edge [
-    source 1647
-    target 2227
-    weight 72
-  ]
-  edge [
-    source 1647
-    target 3282
-    weight 728
-  ]
-  edge [
-    source 1647
-    target 1995
-    weight 1686
-  ]
-  edge [
-    source 1647
-    target 2810
-    weight 148
-  ]
-  edge [
-    source 1647
-    target 2181
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 2870
-    weight 480
-  ]
-  edge [
-    source 1647
-    target 3636
-    weight 398
-  ]
-  edge [
-    source 1647
-    target 1931
-    weight 38
-  ]
-  edge [
-    source 1647
-    target 4152
-    weight 51
-  ]
-  edge [
-    source 1647
-    target 2800
-    weight 208
-  ]
-  edge [
-    source 1647
-    target 1757
-    weight 354
-  ]
-  edge [
-    source 1647
-    target 3145
-    weight 1739
-  ]
-  edge [
-    source 1647
-    target 3077
-    weight 186
-  ]
-  edge [
-    source 1647
-    target 3253
-    weight 251
-  ]
-  edge [
-    source 1647
-    target 1943
-    weight 95
-  ]
-  edge [
-    source 1647
-    target 3024
-    weight 49
-  ]
-  edge [
-    source 1647
-    target 2614
-    weight 81
-  ]
-  edge [
-    source 1647
-    target 3954
-    weight 407
-  ]
-  edge [
-    source 1647
-    target 2924
-    weight 35
-  ]
-  edge [
-    source 1647
-    target 2519
-    weight 595
-  ]
-  edge [
-    source 1647
-    target 2543
-    weight 247
-  ]
-  edge [
-    source 1647
-    target 4027
-    weight 51
-  ]
-  edge [
-    source 1647
-    target 3377
-    weight 95
-  ]
-  edge [
-    source 1647
-    target 2204
-    weight 309
-  ]
-  edge [
-    source 1647
-    target 2287
-    weight 435
-  ]
-  edge [
-    source 1647
-    target 4100
-    weight 24
-  ]
-  edge [
-    source 1647
-    target 2890
-    weight 547
-  ]
-  edge [
-    source 1647
-    target 3006
-    weight 309
-  ]
-  edge [
-    source 1647
-    target 3052
-    weight 151
-  ]
-  edge [
-    source 1647
-    target 3040
-    weight 496
-  ]
-  edge [
-    source 1647
-    target 2597
-    weight 37
-  ]
-  edge [
-    source 1647
-    target 2009
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 1938
-    weight 170
-  ]
-  edge [
-    source 1647
-    target 3935
-    weight 37
-  ]
-  edge [
-    source 1647
-    target 4154
-    weight 440
-  ]
-  edge [
-    source 1647
-    target 3884
-    weight 76
-  ]
-  edge [
-    source 1647
-    target 3847
-    weight 132
-  ]
-  edge [
-    source 1647
-    target 3295
-    weight 196
-  ]
-  edge [
-    source 1647
-    target 4007
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 1707
-    weight 85
-  ]
-  edge [
-    source 1647
-    target 3408
-    weight 107
-  ]
-  edge [
-    source 1647
-    target 2553
-    weight 197
-  ]
-  edge [
-    source 1647
-    target 4162
-    weight 159
-  ]
-  edge [
-    source 1647
-    target 2003
-    weight 38
-  ]
-  edge [
-    source 1647
-    target 2531
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 2556
-    weight 50
-  ]
-  edge [
-    source 1647
-    target 2082
-    weight 23
-  ]
-  edge [
-    source 1647
-    target 3861
-    weight 41
-  ]
-  edge [
-    source 1647
-    target 2570
-    weight 44
-  ]
-  edge [
-    source 1647
-    target 3860
-    weight 48
-  ]
-  edge [
-    source 1647
-    target 4160
-    weight 37
-  ]
-  edge [
-    source 1647
-    target 2011
-    weight 59
-  ]
-  edge [
-    source 1647
-    target 2711
-    weight 57
-  ]
-  edge [
-    source 1647
-    target 4040
-    weight 109
-  ]
-  edge [
-    source 1647
-    target 2054
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 2573
-    weight 22
-  ]
-  edge [
-    source 1647
-    target 4098
-    weight 47
-  ]
-  edge [
-    source 1647
-    target 1798
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 2061
-    weight 36
-  ]
-  edge [
-    source 1647
-    target 3050
-    weight 30
-  ]
-  edge [
-    source 1647
-    target 2955
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 3162
-    weight 40
-  ]
-  edge [
-    source 1647
-    target 1802
-    weight 57
-  ]
-  edge [
-    source 1647
-    target 1856
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 3677
-    weight 42
-  ]
-  edge [
-    source 1647
-    target 2822
-    weight 32
-  ]
-  edge [
-    source 1647
-    target 3877
-    weight 125
-  ]
-  edge [
-    source 1647
-    target 3872
-    weight 32
-  ]
-  edge [
-    source 1647
-    target 2099
-    weight 50
-  ]
-  edge [
-    source 1647
-    target 2743
-    weight 25
-  ]
-  edge [
-    source 1647
-    target 2844
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 3440
-    weight 23
-  ]
-  edge [
-    source 1647
-    target 3108
-    weight 24
-  ]
-  edge [
-    source 1647
-    target 3737
-    weight 25
-  ]
-  edge [
-    source 1647
-    target 1766
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 1970
-    weight 75
-  ]
-  edge [
-    source 1647
-    target 3633
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 2078
-    weight 109
-  ]
-  edge [
-    source 1647
-    target 3196
-    weight 49
-  ]
-  edge [
-    source 1647
-    target 3876
-    weight 29
-  ]
-  edge [
-    source 1664
-    target 4051
-    weight 24
-  ]
-  edge [
-    source 1664
-    target 1887
-    weight 24
-  ]
-  edge [
-    source 1664
-    target 3141
-    weight 24
-  ]
-  edge [
-    source 1664
-    target 3521
-    weight 26
-  ]
-  edge [
-    source 1664
-    target 1995
-    weight 21
-  ]
-  edge [
-    source 1664
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 1676
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 1676
-    target 1887
-    weight 33
-  ]
-  edge [
-    source 1676
-    target 3145
-    weight 23
-  ]
-  edge [
-    source 1676
-    target 2861
-    weight 25
-  ]
-  edge [
-    source 1676
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 1676
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1676
-    target 3141
-    weight 37
-  ]
-  edge [
-    source 1676
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 1676
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 1691
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1691
-    target 3141
-    weight 45
-  ]
-  edge [
-    source 1691
-    target 2071
-    weight 45
-  ]
-  edge [
-    source 1691
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 1691
-    target 1887
-    weight 47
-  ]
-  edge [
-    source 1691
-    target 2861
-    weight 34
-  ]
-  edge [
-    source 1691
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 1691
-    target 3521
-    weight 55
-  ]
-  edge [
-    source 1691
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 1691
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 1691
-    target 1995
-    weight 23
-  ]
-  edge [
-    source 1691
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 1707
-    target 2543
-    weight 57
-  ]
-  edge [
-    source 1707
-    target 4051
-    weight 170
-  ]
-  edge [
-    source 1707
-    target 3174
-    weight 95
-  ]
-  edge [
-    source 1707
-    target 3521
-    weight 189
-  ]
-  edge [
-    source 1707
-    target 1887
-    weight 168
-  ]
-  edge [
-    source 1707
-    target 3253
-    weight 48
-  ]
-  edge [
-    source 1707
-    target 3066
-    weight 71
-  ]
-  edge [
-    source 1707
-    target 2071
-    weight 165
-  ]
-  edge [
-    source 1707
-    target 3282
-    weight 79
-  ]
-  edge [
-    source 1707
-    target 3141
-    weight 168
-  ]
-  edge [
-    source 1707
-    target 3847
-    weight 22
-  ]
-  edge [
-    source 1707
-    target 3642
-    weight 98
-  ]
-  edge [
-    source 1707
-    target 2870
-    weight 56
-  ]
-  edge [
-    source 1707
-    target 2810
-    weight 22
-  ]
-  edge [
-    source 1707
-    target 2861
-    weight 159
-  ]
-  edge [
-    source 1707
-    target 3423
-    weight 38
-  ]
-  edge [
-    source 1707
-    target 3006
-    weight 82
-  ]
-  edge [
-    source 1707
-    target 3040
-    weight 71
-  ]
-  edge [
-    source 1707
-    target 3145
-    weight 129
-  ]
-  edge [
-    source 1707
-    target 1995
-    weight 123
-  ]
-  edge [
-    source 1707
-    target 3954
-    weight 86
-  ]
-  edge [
-    source 1707
-    target 3636
-    weight 65
-  ]
-  edge [
-    source 1707
-    target 3917
-    weight 81
-  ]
-  edge [
-    source 1707
-    target 2287
-    weight 64
-  ]
-  edge [
-    source 1707
-    target 3295
-    weight 30
-  ]
-  edge [
-    source 1707
-    target 3565
-    weight 52
-  ]
-  edge [
-    source 1707
-    target 2700
-    weight 112
-  ]
-  edge [
-    source 1707
-    target 2058
-    weight 33
-  ]
-  edge [
-    source 1707
-    target 3600
-    weight 102
-  ]
-  edge [
-    source 1707
-    target 1757
-    weight 46
-  ]
-  edge [
-    source 1707
-    target 2191
-    weight 39
-  ]
-  edge [
-    source 1707
-    target 3276
-    weight 86
-  ]
-  edge [
-    source 1707
-    target 2519
-    weight 62
-  ]
-  edge [
-    source 1707
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 1707
-    target 2553
-    weight 33
-  ]
-  edge [
-    source 1707
-    target 3052
-    weight 31
-  ]
-  edge [
-    source 1707
-    target 3443
-    weight 48
-  ]
-  edge [
-    source 1707
-    target 3937
-    weight 26
-  ]
-  edge [
-    source 1707
-    target 3420
-    weight 48
-  ]
-  edge [
-    source 1707
-    target 3993
-    weight 88
-  ]
-  edge [
-    source 1707
-    target 2204
-    weight 49
-  ]
-  edge [
-    source 1707
-    target 1938
-    weight 40
-  ]
-  edge [
-    source 1707
-    target 3374
-    weight 40
-  ]
-  edge [
-    source 1707
-    target 2890
-    weight 36
-  ]
-  edge [
-    source 1707
-    target 3542
-    weight 69
-  ]
-  edge [
-    source 1707
-    target 4154
-    weight 58
-  ]
-  edge [
-    source 1707
-    target 3377
-    weight 21
-  ]
-  edge [
-    source 1707
-    target 2857
-    weight 65
-  ]
-  edge [
-    source 1707
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1741
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3521
-    weight 789
-  ]
-  edge [
-    source 1757
-    target 2861
-    weight 467
-  ]
-  edge [
-    source 1757
-    target 3542
-    weight 173
-  ]
-  edge [
-    source 1757
-    target 3141
-    weight 638
-  ]
-  edge [
-    source 1757
-    target 3600
-    weight 392
-  ]
-  edge [
-    source 1757
-    target 2810
-    weight 50
-  ]
-  edge [
-    source 1757
-    target 3642
-    weight 195
-  ]
-  edge [
-    source 1757
-    target 2191
-    weight 137
-  ]
-  edge [
-    source 1757
-    target 4051
-    weight 579
-  ]
-  edge [
-    source 1757
-    target 1995
-    weight 343
-  ]
-  edge [
-    source 1757
-    target 3565
-    weight 179
-  ]
-  edge [
-    source 1757
-    target 2071
-    weight 636
-  ]
-  edge [
-    source 1757
-    target 3993
-    weight 336
-  ]
-  edge [
-    source 1757
-    target 3077
-    weight 43
-  ]
-  edge [
-    source 1757
-    target 1887
-    weight 617
-  ]
-  edge [
-    source 1757
-    target 3937
-    weight 66
-  ]
-  edge [
-    source 1757
-    target 3423
-    weight 185
-  ]
-  edge [
-    source 1757
-    target 3174
-    weight 306
-  ]
-  edge [
-    source 1757
-    target 2890
-    weight 141
-  ]
-  edge [
-    source 1757
-    target 3917
-    weight 232
-  ]
-  edge [
-    source 1757
-    target 2700
-    weight 354
-  ]
-  edge [
-    source 1757
-    target 3276
-    weight 330
-  ]
-  edge [
-    source 1757
-    target 2870
-    weight 168
-  ]
-  edge [
-    source 1757
-    target 3443
-    weight 158
-  ]
-  edge [
-    source 1757
-    target 2204
-    weight 165
-  ]
-  edge [
-    source 1757
-    target 3253
-    weight 95
-  ]
-  edge [
-    source 1757
-    target 3052
-    weight 54
-  ]
-  edge [
-    source 1757
-    target 3847
-    weight 53
-  ]
-  edge [
-    source 1757
-    target 3282
-    weight 241
-  ]
-  edge [
-    source 1757
-    target 4154
-    weight 110
-  ]
-  edge [
-    source 1757
-    target 3636
-    weight 167
-  ]
-  edge [
-    source 1757
-    target 3954
-    weight 142
-  ]
-  edge [
-    source 1757
-    target 3145
-    weight 411
-  ]
-  edge [
-    source 1757
-    target 2844
-    weight 29
-  ]
-  edge [
-    source 1757
-    target 2543
-    weight 98
-  ]
-  edge [
-    source 1757
-    target 4040
-    weight 40
-  ]
-  edge [
-    source 1757
-    target 2553
-    weight 69
-  ]
-  edge [
-    source 1757
-    target 3040
-    weight 125
-  ]
-  edge [
-    source 1757
-    target 2287
-    weight 125
-  ]
-  edge [
-    source 1757
-    target 2800
-    weight 83
-  ]
-  edge [
-    source 1757
-    target 4187
-    weight 24
-  ]
-  edge [
-    source 1757
-    target 3374
-    weight 137
-  ]
-  edge [
-    source 1757
-    target 3962
-    weight 152
-  ]
-  edge [
-    source 1757
-    target 2329
-    weight 35
-  ]
-  edge [
-    source 1757
-    target 3420
-    weight 126
-  ]
-  edge [
-    source 1757
-    target 3066
-    weight 117
-  ]
-  edge [
-    source 1757
-    target 2711
-    weight 24
-  ]
-  edge [
-    source 1757
-    target 2614
-    weight 37
-  ]
-  edge [
-    source 1757
-    target 3884
-    weight 48
-  ]
-  edge [
-    source 1757
-    target 2519
-    weight 160
-  ]
-  edge [
-    source 1757
-    target 3006
-    weight 115
-  ]
-  edge [
-    source 1757
-    target 1938
-    weight 70
-  ]
-  edge [
-    source 1757
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 1757
-    target 2570
-    weight 24
-  ]
-  edge [
-    source 1757
-    target 3408
-    weight 29
-  ]
-  edge [
-    source 1757
-    target 2857
-    weight 196
-  ]
-  edge [
-    source 1757
-    target 3860
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3295
-    weight 57
-  ]
-  edge [
-    source 1757
-    target 4162
-    weight 54
-  ]
-  edge [
-    source 1757
-    target 3377
-    weight 27
-  ]
-  edge [
-    source 1757
-    target 1952
-    weight 33
-  ]
-  edge [
-    source 1757
-    target 2058
-    weight 121
-  ]
-  edge [
-    source 1757
-    target 1943
-    weight 29
-  ]
-  edge [
-    source 1757
-    target 3024
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3177
-    weight 47
-  ]
-  edge [
-    source 1757
-    target 2822
-    weight 22
-  ]
-  edge [
-    source 1757
-    target 3432
-    weight 26
-  ]
-  edge [
-    source 1757
-    target 3641
-    weight 22
-  ]
-  edge [
-    source 1757
-    target 2227
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3877
-    weight 30
-  ]
-  edge [
-    source 1757
-    target 1802
-    weight 23
-  ]
-  edge [
-    source 1757
-    target 2078
-    weight 23
-  ]
-  edge [
-    source 1766
-    target 3521
-    weight 60
-  ]
-  edge [
-    source 1766
-    target 4051
-    weight 54
-  ]
-  edge [
-    source 1766
-    target 1995
-    weight 42
-  ]
-  edge [
-    source 1766
-    target 2861
-    weight 46
-  ]
-  edge [
-    source 1766
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 1766
-    target 3006
-    weight 26
-  ]
-  edge [
-    source 1766
-    target 3066
-    weight 23
-  ]
-  edge [
-    source 1766
-    target 3174
-    weight 29
-  ]
-  edge [
-    source 1766
-    target 3141
-    weight 51
-  ]
-  edge [
-    source 1766
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1766
-    target 2071
-    weight 51
-  ]
-  edge [
-    source 1766
-    target 1887
-    weight 51
-  ]
-  edge [
-    source 1766
-    target 3600
-    weight 30
-  ]
-  edge [
-    source 1766
-    target 2700
-    weight 31
-  ]
-  edge [
-    source 1766
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1766
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 1766
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 1766
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 1766
-    target 3145
-    weight 35
-  ]
-  edge [
-    source 1769
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1769
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 1775
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 1775
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 1775
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 1775
-    target 2071
-    weight 23
-  ]
-  edge [
-    source 1789
-    target 3521
-    weight 299
-  ]
-  edge [
-    source 1789
-    target 2861
-    weight 134
-  ]
-  edge [
-    source 1789
-    target 2191
-    weight 43
-  ]
-  edge [
-    source 1789
-    target 2071
-    weight 129
-  ]
-  edge [
-    source 1789
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 1789
-    target 3145
-    weight 50
-  ]
-  edge [
-    source 1789
-    target 1995
-    weight 32
-  ]
-  edge [
-    source 1789
-    target 3141
-    weight 102
-  ]
-  edge [
-    source 1789
-    target 1887
-    weight 96
-  ]
-  edge [
-    source 1789
-    target 3642
-    weight 28
-  ]
-  edge [
-    source 1789
-    target 3993
-    weight 53
-  ]
-  edge [
-    source 1789
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 1789
-    target 3600
-    weight 73
-  ]
-  edge [
-    source 1789
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 1789
-    target 4051
-    weight 110
-  ]
-  edge [
-    source 1789
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 1789
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 1789
-    target 3174
-    weight 37
-  ]
-  edge [
-    source 1789
-    target 2058
-    weight 25
-  ]
-  edge [
-    source 1789
-    target 3276
-    weight 50
-  ]
-  edge [
-    source 1789
-    target 3374
-    weight 26
-  ]
-  edge [
-    source 1798
-    target 3521
-    weight 86
-  ]
-  edge [
-    source 1798
-    target 3276
-    weight 44
-  ]
-  edge [
-    source 1798
-    target 4051
-    weight 68
-  ]
-  edge [
-    source 1798
-    target 3917
-    weight 33
-  ]
-  edge [
-    source 1798
-    target 3141
-    weight 68
-  ]
-  edge [
-    source 1798
-    target 2071
-    weight 71
-  ]
-  edge [
-    source 1798
-    target 3145
-    weight 52
-  ]
-  edge [
-    source 1798
-    target 3600
-    weight 36
-  ]
-  edge [
-    source 1798
-    target 1887
-    weight 66
-  ]
-  edge [
-    source 1798
-    target 3174
-    weight 35
-  ]
-  edge [
-    source 1798
-    target 2861
-    weight 56
-  ]
-  edge [
-    source 1798
-    target 3954
-    weight 27
-  ]
-  edge [
-    source 1798
-    target 3642
-    weight 30
-  ]
-  edge [
-    source 1798
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 1798
-    target 3993
-    weight 37
-  ]
-  edge [
-    source 1798
-    target 3066
-    weight 22
-  ]
-  edge [
-    source 1798
-    target 3423
-    weight 23
-  ]
-  edge [
-    source 1798
-    target 3282
-    weight 21
-  ]
-  edge [
-    source 1798
-    target 2857
-    weight 35
-  ]
-  edge [
-    source 1798
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 1798
-    target 3542
-    weight 23
-  ]
-  edge [
-    source 1798
-    target 1995
-    weight 36
-  ]
-  edge [
-    source 1802
-    target 3521
-    weight 117
-  ]
-  edge [
-    source 1802
-    target 1887
-    weight 105
-  ]
-  edge [
-    source 1802
-    target 3276
-    weight 63
-  ]
-  edge [
-    source 1802
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 1802
-    target 2890
-    weight 35
-  ]
-  edge [
-    source 1802
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 1802
-    target 1995
-    weight 54
-  ]
-  edge [
-    source 1802
-    target 2071
-    weight 101
-  ]
-  edge [
-    source 1802
-    target 3040
-    weight 29
-  ]
-  edge [
-    source 1802
-    target 3420
-    weight 22
-  ]
-  edge [
-    source 1802
-    target 3145
-    weight 73
-  ]
-  edge [
-    source 1802
-    target 3600
-    weight 84
-  ]
-  edge [
-    source 1802
-    target 3174
-    weight 53
-  ]
-  edge [
-    source 1802
-    target 2861
-    weight 77
-  ]
-  edge [
-    source 1802
-    target 3917
-    weight 57
-  ]
-  edge [
-    source 1802
-    target 3642
-    weight 43
-  ]
-  edge [
-    source 1802
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 1802
-    target 2700
-    weight 57
-  ]
-  edge [
-    source 1802
-    target 2191
-    weight 21
-  ]
-  edge [
-    source 1802
-    target 4154
-    weight 41
-  ]
-  edge [
-    source 1802
-    target 4051
-    weight 94
-  ]
-  edge [
-    source 1802
-    target 2058
-    weight 27
-  ]
-  edge [
-    source 1802
-    target 2870
-    weight 26
-  ]
-  edge [
-    source 1802
-    target 3443
-    weight 34
-  ]
-  edge [
-    source 1802
-    target 2519
-    weight 40
-  ]
-  edge [
-    source 1802
-    target 3993
-    weight 63
-  ]
-  edge [
-    source 1802
-    target 3282
-    weight 40
-  ]
-  edge [
-    source 1802
-    target 2857
-    weight 50
-  ]
-  edge [
-    source 1802
-    target 3066
-    weight 24
-  ]
-  edge [
-    source 1802
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 1802
-    target 3423
-    weight 33
-  ]
-  edge [
-    source 1802
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 1802
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 1802
-    target 3962
-    weight 24
-  ]
-  edge [
-    source 1802
-    target 2287
-    weight 24
-  ]
-  edge [
-    source 1802
-    target 3374
-    weight 27
-  ]
-  edge [
-    source 1822
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 1822
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 1832
-    target 3521
-    weight 55
-  ]
-  edge [
-    source 1832
-    target 2861
-    weight 30
-  ]
-  edge [
-    source 1832
-    target 1995
-    weight 33
-  ]
-  edge [
-    source 1832
-    target 3141
-    weight 40
-  ]
-  edge [
-    source 1832
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 1832
-    target 1887
-    weight 41
-  ]
-  edge [
-    source 1832
-    target 4051
-    weight 37
-  ]
-  edge [
-    source 1832
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 1832
-    target 3145
-    weight 21
-  ]
-  edge [
-    source 1856
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 1856
-    target 3141
-    weight 26
-  ]
-  edge [
-    source 1856
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 1856
-    target 1887
-    weight 24
-  ]
-  edge [
-    source 1856
-    target 3521
-    weight 32
-  ]
-  edge [
-    source 1856
-    target 2071
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 3521
-    weight 17933
-  ]
-  edge [
-    source 1887
-    target 3600
-    weight 6187
-  ]
-  edge [
-    source 1887
-    target 3432
-    weight 86
-  ]
-  edge [
-    source 1887
-    target 1952
-    weight 138
-  ]
-  edge [
-    source 1887
-    target 3565
-    weight 1695
-  ]
-  edge [
-    source 1887
-    target 3937
-    weight 221
-  ]
-  edge [
-    source 1887
-    target 4051
-    weight 11627
-  ]
-  edge [
-    source 1887
-    target 3174
-    weight 4848
-  ]
-  edge [
-    source 1887
-    target 2543
-    weight 515
-  ]
-  edge [
-    source 1887
-    target 3253
-    weight 539
-  ]
-  edge [
-    source 1887
-    target 3423
-    weight 1637
-  ]
-  edge [
-    source 1887
-    target 2861
-    weight 8785
-  ]
-  edge [
-    source 1887
-    target 2181
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 3066
-    weight 644
-  ]
-  edge [
-    source 1887
-    target 3276
-    weight 4479
-  ]
-  edge [
-    source 1887
-    target 1995
-    weight 3447
-  ]
-  edge [
-    source 1887
-    target 3282
-    weight 1384
-  ]
-  edge [
-    source 1887
-    target 2071
-    weight 11577
-  ]
-  edge [
-    source 1887
-    target 3145
-    weight 4099
-  ]
-  edge [
-    source 1887
-    target 3420
-    weight 516
-  ]
-  edge [
-    source 1887
-    target 3141
-    weight 13616
-  ]
-  edge [
-    source 1887
-    target 3985
-    weight 63
-  ]
-  edge [
-    source 1887
-    target 3542
-    weight 1132
-  ]
-  edge [
-    source 1887
-    target 3917
-    weight 1805
-  ]
-  edge [
-    source 1887
-    target 2191
-    weight 852
-  ]
-  edge [
-    source 1887
-    target 3642
-    weight 2866
-  ]
-  edge [
-    source 1887
-    target 3993
-    weight 3147
-  ]
-  edge [
-    source 1887
-    target 2700
-    weight 3914
-  ]
-  edge [
-    source 1887
-    target 3443
-    weight 906
-  ]
-  edge [
-    source 1887
-    target 3954
-    weight 808
-  ]
-  edge [
-    source 1887
-    target 1943
-    weight 134
-  ]
-  edge [
-    source 1887
-    target 2810
-    weight 175
-  ]
-  edge [
-    source 1887
-    target 2519
-    weight 1167
-  ]
-  edge [
-    source 1887
-    target 4027
-    weight 85
-  ]
-  edge [
-    source 1887
-    target 3377
-    weight 190
-  ]
-  edge [
-    source 1887
-    target 1931
-    weight 53
-  ]
-  edge [
-    source 1887
-    target 2870
-    weight 844
-  ]
-  edge [
-    source 1887
-    target 3962
-    weight 779
-  ]
-  edge [
-    source 1887
-    target 3374
-    weight 883
-  ]
-  edge [
-    source 1887
-    target 2058
-    weight 714
-  ]
-  edge [
-    source 1887
-    target 3636
-    weight 721
-  ]
-  edge [
-    source 1887
-    target 3860
-    weight 85
-  ]
-  edge [
-    source 1887
-    target 2857
-    weight 1149
-  ]
-  edge [
-    source 1887
-    target 3071
-    weight 77
-  ]
-  edge [
-    source 1887
-    target 3295
-    weight 482
-  ]
-  edge [
-    source 1887
-    target 2890
-    weight 1127
-  ]
-  edge [
-    source 1887
-    target 3040
-    weight 854
-  ]
-  edge [
-    source 1887
-    target 2232
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 3006
-    weight 637
-  ]
-  edge [
-    source 1887
-    target 2800
-    weight 311
-  ]
-  edge [
-    source 1887
-    target 2287
-    weight 697
-  ]
-  edge [
-    source 1887
-    target 4154
-    weight 1134
-  ]
-  edge [
-    source 1887
-    target 3112
-    weight 28
-  ]
-  edge [
-    source 1887
-    target 3641
-    weight 89
-  ]
-  edge [
-    source 1887
-    target 1938
-    weight 333
-  ]
-  edge [
-    source 1887
-    target 2924
-    weight 53
-  ]
-  edge [
-    source 1887
-    target 3847
-    weight 279
-  ]
-  edge [
-    source 1887
-    target 2329
-    weight 113
-  ]
-  edge [
-    source 1887
-    target 2570
-    weight 78
-  ]
-  edge [
-    source 1887
-    target 4187
-    weight 110
-  ]
-  edge [
-    source 1887
-    target 2061
-    weight 58
-  ]
-  edge [
-    source 1887
-    target 3952
-    weight 31
-  ]
-  edge [
-    source 1887
-    target 2556
-    weight 68
-  ]
-  edge [
-    source 1887
-    target 3935
-    weight 65
-  ]
-  edge [
-    source 1887
-    target 2450
-    weight 38
-  ]
-  edge [
-    source 1887
-    target 2553
-    weight 361
-  ]
-  edge [
-    source 1887
-    target 2204
-    weight 560
-  ]
-  edge [
-    source 1887
-    target 2743
-    weight 46
-  ]
-  edge [
-    source 1887
-    target 4100
-    weight 34
-  ]
-  edge [
-    source 1887
-    target 3050
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 4040
-    weight 209
-  ]
-  edge [
-    source 1887
-    target 2082
-    weight 48
-  ]
-  edge [
-    source 1887
-    target 2953
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 2600
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 4152
-    weight 97
-  ]
-  edge [
-    source 1887
-    target 3375
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 3884
-    weight 126
-  ]
-  edge [
-    source 1887
-    target 2011
-    weight 110
-  ]
-  edge [
-    source 1887
-    target 3052
-    weight 300
-  ]
-  edge [
-    source 1887
-    target 3956
-    weight 41
-  ]
-  edge [
-    source 1887
-    target 2609
-    weight 33
-  ]
-  edge [
-    source 1887
-    target 2832
-    weight 30
-  ]
-  edge [
-    source 1887
-    target 4162
-    weight 351
-  ]
-  edge [
-    source 1887
-    target 2227
-    weight 156
-  ]
-  edge [
-    source 1887
-    target 2434
-    weight 25
-  ]
-  edge [
-    source 1887
-    target 2003
-    weight 100
-  ]
-  edge [
-    source 1887
-    target 2844
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 2711
-    weight 83
-  ]
-  edge [
-    source 1887
-    target 3177
-    weight 156
-  ]
-  edge [
-    source 1887
-    target 2955
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 3196
-    weight 88
-  ]
-  edge [
-    source 1887
-    target 2531
-    weight 73
-  ]
-  edge [
-    source 1887
-    target 3024
-    weight 72
-  ]
-  edge [
-    source 1887
-    target 3693
-    weight 28
-  ]
-  edge [
-    source 1887
-    target 3861
-    weight 60
-  ]
-  edge [
-    source 1887
-    target 2614
-    weight 140
-  ]
-  edge [
-    source 1887
-    target 4007
-    weight 36
-  ]
-  edge [
-    source 1887
-    target 4160
-    weight 74
-  ]
-  edge [
-    source 1887
-    target 3077
-    weight 350
-  ]
-  edge [
-    source 1887
-    target 2054
-    weight 51
-  ]
-  edge [
-    source 1887
-    target 3968
-    weight 97
-  ]
-  edge [
-    source 1887
-    target 2573
-    weight 36
-  ]
-  edge [
-    source 1887
-    target 3162
-    weight 84
-  ]
-  edge [
-    source 1887
-    target 2115
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3877
-    weight 230
-  ]
-  edge [
-    source 1887
-    target 3408
-    weight 210
-  ]
-  edge [
-    source 1887
-    target 3108
-    weight 46
-  ]
-  edge [
-    source 1887
-    target 2198
-    weight 37
-  ]
-  edge [
-    source 1887
-    target 2983
-    weight 34
-  ]
-  edge [
-    source 1887
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 3559
-    weight 35
-  ]
-  edge [
-    source 1887
-    target 3465
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 2978
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3510
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 2009
-    weight 36
-  ]
-  edge [
-    source 1887
-    target 3692
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3462
-    weight 37
-  ]
-  edge [
-    source 1887
-    target 1922
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 3309
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 2099
-    weight 93
-  ]
-  edge [
-    source 1887
-    target 4098
-    weight 76
-  ]
-  edge [
-    source 1887
-    target 3146
-    weight 25
-  ]
-  edge [
-    source 1887
-    target 2801
-    weight 24
-  ]
-  edge [
-    source 1887
-    target 2262
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 3011
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 2997
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 3074
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 2597
-    weight 77
-  ]
-  edge [
-    source 1887
-    target 3677
-    weight 80
-  ]
-  edge [
-    source 1887
-    target 3856
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 2822
-    weight 85
-  ]
-  edge [
-    source 1887
-    target 3440
-    weight 31
-  ]
-  edge [
-    source 1887
-    target 3357
-    weight 50
-  ]
-  edge [
-    source 1887
-    target 3872
-    weight 54
-  ]
-  edge [
-    source 1887
-    target 2634
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 3737
-    weight 32
-  ]
-  edge [
-    source 1887
-    target 1970
-    weight 111
-  ]
-  edge [
-    source 1887
-    target 2836
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3633
-    weight 62
-  ]
-  edge [
-    source 1887
-    target 2078
-    weight 148
-  ]
-  edge [
-    source 1887
-    target 1900
-    weight 28
-  ]
-  edge [
-    source 1887
-    target 3876
-    weight 41
-  ]
-  edge [
-    source 1900
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 1900
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 1900
-    target 2861
-    weight 23
-  ]
-  edge [
-    source 1900
-    target 2071
-    weight 27
-  ]
-  edge [
-    source 1900
-    target 4051
-    weight 29
-  ]
-  edge [
-    source 1922
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 1922
-    target 2071
-    weight 28
-  ]
-  edge [
-    source 1922
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 1922
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 1922
-    target 3521
-    weight 37
-  ]
-  edge [
-    source 1922
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 1931
-    target 3521
-    weight 87
-  ]
-  edge [
-    source 1931
-    target 2861
-    weight 66
-  ]
-  edge [
-    source 1931
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 1931
-    target 4051
-    weight 60
-  ]
-  edge [
-    source 1931
-    target 3600
-    weight 37
-  ]
-  edge [
-    source 1931
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 1931
-    target 2071
-    weight 71
-  ]
-  edge [
-    source 1931
-    target 3141
-    weight 64
-  ]
-  edge [
-    source 1931
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 1931
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1931
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 1931
-    target 1995
-    weight 35
-  ]
-  edge [
-    source 1931
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 1931
-    target 3423
-    weight 27
-  ]
-  edge [
-    source 1931
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 1931
-    target 3145
-    weight 36
-  ]
-  edge [
-    source 1931
-    target 3276
-    weight 29
-  ]
-  edge [
-    source 1931
-    target 3374
-    weight 23
-  ]
-  edge [
-    source 1931
-    target 3917
-    weight 23
-  ]
-  edge [
-    source 1938
-    target 3542
-    weight 199
-  ]
-  edge [
-    source 1938
-    target 1995
-    weight 172
-  ]
-  edge [
-    source 1938
-    target 3521
-    weight 397
-  ]
-  edge [
-    source 1938
-    target 3276
-    weight 177
-  ]
-  edge [
-    source 1938
-    target 2870
-    weight 124
-  ]
-  edge [
-    source 1938
-    target 3600
-    weight 215
-  ]
-  edge [
-    source 1938
-    target 2204
-    weight 74
-  ]
-  edge [
-    source 1938
-    target 3962
-    weight 58
-  ]
-  edge [
-    source 1938
-    target 3847
-    weight 71
-  ]
-  edge [
-    source 1938
-    target 3066
-    weight 85
-  ]
-  edge [
-    source 1938
-    target 3565
-    weight 125
-  ]
-  edge [
-    source 1938
-    target 3253
-    weight 78
-  ]
-  edge [
-    source 1938
-    target 4051
-    weight 295
-  ]
-  edge [
-    source 1938
-    target 2329
-    weight 21
-  ]
-  edge [
-    source 1938
-    target 3636
-    weight 101
-  ]
-  edge [
-    source 1938
-    target 2553
-    weight 56
-  ]
-  edge [
-    source 1938
-    target 2071
-    weight 312
-  ]
-  edge [
-    source 1938
-    target 2700
-    weight 222
-  ]
-  edge [
-    source 1938
-    target 3141
-    weight 343
-  ]
-  edge [
-    source 1938
-    target 2861
-    weight 252
-  ]
-  edge [
-    source 1938
-    target 3174
-    weight 176
-  ]
-  edge [
-    source 1938
-    target 3282
-    weight 164
-  ]
-  edge [
-    source 1938
-    target 3884
-    weight 21
-  ]
-  edge [
-    source 1938
-    target 3642
-    weight 128
-  ]
-  edge [
-    source 1938
-    target 3954
-    weight 87
-  ]
-  edge [
-    source 1938
-    target 2614
-    weight 23
-  ]
-  edge [
-    source 1938
-    target 3006
-    weight 74
-  ]
-  edge [
-    source 1938
-    target 4154
-    weight 109
-  ]
-  edge [
-    source 1938
-    target 2543
-    weight 68
-  ]
-  edge [
-    source 1938
-    target 3993
-    weight 170
-  ]
-  edge [
-    source 1938
-    target 2810
-    weight 34
-  ]
-  edge [
-    source 1938
-    target 3040
-    weight 77
-  ]
-  edge [
-    source 1938
-    target 2519
-    weight 99
-  ]
-  edge [
-    source 1938
-    target 3917
-    weight 136
-  ]
-  edge [
-    source 1938
-    target 2800
-    weight 52
-  ]
-  edge [
-    source 1938
-    target 3420
-    weight 74
-  ]
-  edge [
-    source 1938
-    target 3443
-    weight 80
-  ]
-  edge [
-    source 1938
-    target 3145
-    weight 187
-  ]
-  edge [
-    source 1938
-    target 2890
-    weight 73
-  ]
-  edge [
-    source 1938
-    target 2287
-    weight 67
-  ]
-  edge [
-    source 1938
-    target 3295
-    weight 52
-  ]
-  edge [
-    source 1938
-    target 4040
-    weight 33
-  ]
-  edge [
-    source 1938
-    target 3423
-    weight 76
-  ]
-  edge [
-    source 1938
-    target 2191
-    weight 44
-  ]
-  edge [
-    source 1938
-    target 3374
-    weight 57
-  ]
-  edge [
-    source 1938
-    target 3052
-    weight 42
-  ]
-  edge [
-    source 1938
-    target 3937
-    weight 35
-  ]
-  edge [
-    source 1938
-    target 2857
-    weight 113
-  ]
-  edge [
-    source 1938
-    target 3877
-    weight 21
-  ]
-  edge [
-    source 1938
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1938
-    target 2058
-    weight 57
-  ]
-  edge [
-    source 1943
-    target 3521
-    weight 155
-  ]
-  edge [
-    source 1943
-    target 3600
-    weight 105
-  ]
-  edge [
-    source 1943
-    target 3993
-    weight 90
-  ]
-  edge [
-    source 1943
-    target 4051
-    weight 134
-  ]
-  edge [
-    source 1943
-    target 2861
-    weight 123
-  ]
-  edge [
-    source 1943
-    target 3565
-    weight 35
-  ]
-  edge [
-    source 1943
-    target 1995
-    weight 92
-  ]
-  edge [
-    source 1943
-    target 2071
-    weight 143
-  ]
-  edge [
-    source 1943
-    target 3642
-    weight 55
-  ]
-  edge [
-    source 1943
-    target 2191
-    weight 39
-  ]
-  edge [
-    source 1943
-    target 3636
-    weight 39
-  ]
-  edge [
-    source 1943
-    target 3443
-    weight 37
-  ]
-  edge [
-    source 1943
-    target 2543
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 3253
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 3066
-    weight 56
-  ]
-  edge [
-    source 1943
-    target 3040
-    weight 51
-  ]
-  edge [
-    source 1943
-    target 3423
-    weight 55
-  ]
-  edge [
-    source 1943
-    target 3917
-    weight 62
-  ]
-  edge [
-    source 1943
-    target 3052
-    weight 27
-  ]
-  edge [
-    source 1943
-    target 3006
-    weight 28
-  ]
-  edge [
-    source 1943
-    target 3141
-    weight 139
-  ]
-  edge [
-    source 1943
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 1943
-    target 3145
-    weight 100
-  ]
-  edge [
-    source 1943
-    target 3282
-    weight 53
-  ]
-  edge [
-    source 1943
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 1943
-    target 2287
-    weight 84
-  ]
-  edge [
-    source 1943
-    target 3954
-    weight 45
-  ]
-  edge [
-    source 1943
-    target 3174
-    weight 89
-  ]
-  edge [
-    source 1943
-    target 3276
-    weight 83
-  ]
-  edge [
-    source 1943
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 1943
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 1943
-    target 2870
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 2204
-    weight 37
-  ]
-  edge [
-    source 1943
-    target 2890
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 3420
-    weight 30
-  ]
-  edge [
-    source 1943
-    target 2700
-    weight 85
-  ]
-  edge [
-    source 1943
-    target 3374
-    weight 55
-  ]
-  edge [
-    source 1943
-    target 3962
-    weight 25
-  ]
-  edge [
-    source 1943
-    target 2519
-    weight 48
-  ]
-  edge [
-    source 1943
-    target 2553
-    weight 24
-  ]
-  edge [
-    source 1943
-    target 2058
-    weight 39
-  ]
-  edge [
-    source 1952
-    target 3600
-    weight 104
-  ]
-  edge [
-    source 1952
-    target 3521
-    weight 173
-  ]
-  edge [
-    source 1952
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 1952
-    target 3937
-    weight 25
-  ]
-  edge [
-    source 1952
-    target 3423
-    weight 82
-  ]
-  edge [
-    source 1952
-    target 3443
-    weight 26
-  ]
-  edge [
-    source 1952
-    target 2191
-    weight 59
-  ]
-  edge [
-    source 1952
-    target 2071
-    weight 158
-  ]
-  edge [
-    source 1952
-    target 1995
-    weight 66
-  ]
-  edge [
-    source 1952
-    target 3077
-    weight 34
-  ]
-  edge [
-    source 1952
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3040
-    weight 36
-  ]
-  edge [
-    source 1952
-    target 2861
-    weight 112
-  ]
-  edge [
-    source 1952
-    target 3962
-    weight 72
-  ]
-  edge [
-    source 1952
-    target 3177
-    weight 25
-  ]
-  edge [
-    source 1952
-    target 3642
-    weight 51
-  ]
-  edge [
-    source 1952
-    target 3917
-    weight 68
-  ]
-  edge [
-    source 1952
-    target 3141
-    weight 141
-  ]
-  edge [
-    source 1952
-    target 3993
-    weight 101
-  ]
-  edge [
-    source 1952
-    target 3066
-    weight 23
-  ]
-  edge [
-    source 1952
-    target 4154
-    weight 28
-  ]
-  edge [
-    source 1952
-    target 2890
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 1952
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3282
-    weight 48
-  ]
-  edge [
-    source 1952
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 1952
-    target 4051
-    weight 128
-  ]
-  edge [
-    source 1952
-    target 2870
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3276
-    weight 88
-  ]
-  edge [
-    source 1952
-    target 2204
-    weight 22
-  ]
-  edge [
-    source 1952
-    target 3174
-    weight 64
-  ]
-  edge [
-    source 1952
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 1952
-    target 2553
-    weight 21
-  ]
-  edge [
-    source 1952
-    target 2700
-    weight 73
-  ]
-  edge [
-    source 1952
-    target 3145
-    weight 107
-  ]
-  edge [
-    source 1952
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 1952
-    target 2058
-    weight 47
-  ]
-  edge [
-    source 1952
-    target 2519
-    weight 44
-  ]
-  edge [
-    source 1952
-    target 3374
-    weight 43
-  ]
-  edge [
-    source 1952
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 1952
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 1952
-    target 2857
-    weight 49
-  ]
-  edge [
-    source 1952
-    target 3253
-    weight 27
-  ]
-  edge [
-    source 1970
-    target 3565
-    weight 33
-  ]
-  edge [
-    source 1970
-    target 2861
-    weight 107
-  ]
-  edge [
-    source 1970
-    target 3521
-    weight 153
-  ]
-  edge [
-    source 1970
-    target 3141
-    weight 125
-  ]
-  edge [
-    source 1970
-    target 3420
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 3295
-    weight 22
-  ]
-  edge [
-    source 1970
-    target 2890
-    weight 35
-  ]
-  edge [
-    source 1970
-    target 3636
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 3600
-    weight 87
-  ]
-  edge [
-    source 1970
-    target 3443
-    weight 30
-  ]
-  edge [
-    source 1970
-    target 3993
-    weight 68
-  ]
-  edge [
-    source 1970
-    target 1995
-    weight 72
-  ]
-  edge [
-    source 1970
-    target 4051
-    weight 128
-  ]
-  edge [
-    source 1970
-    target 2071
-    weight 128
-  ]
-  edge [
-    source 1970
-    target 4154
-    weight 31
-  ]
-  edge [
-    source 1970
-    target 3145
-    weight 88
-  ]
-  edge [
-    source 1970
-    target 3174
-    weight 72
-  ]
-  edge [
-    source 1970
-    target 3642
-    weight 58
-  ]
-  edge [
-    source 1970
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 1970
-    target 2191
-    weight 27
-  ]
-  edge [
-    source 1970
-    target 3276
-    weight 69
-  ]
-  edge [
-    source 1970
-    target 3917
-    weight 54
-  ]
-  edge [
-    source 1970
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 1970
-    target 2287
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 3954
-    weight 33
-  ]
-  edge [
-    source 1970
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 1970
-    target 3282
-    weight 29
-  ]
-  edge [
-    source 1970
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 1970
-    target 2519
-    weight 36
-  ]
-  edge [
-    source 1970
-    target 2543
-    weight 23
-  ]
-  edge [
-    source 1970
-    target 3542
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 2058
-    weight 22
-  ]
-  edge [
-    source 1970
-    target 3040
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 2861
-    weight 3211
-  ]
-  edge [
-    source 1995
-    target 3521
-    weight 4928
-  ]
-  edge [
-    source 1995
-    target 2071
-    weight 3681
-  ]
-  edge [
-    source 1995
-    target 2191
-    weight 419
-  ]
-  edge [
-    source 1995
-    target 4051
-    weight 3650
-  ]
-  edge [
-    source 1995
-    target 3565
-    weight 869
-  ]
-  edge [
-    source 1995
-    target 3066
-    weight 426
-  ]
-  edge [
-    source 1995
-    target 3985
-    weight 51
-  ]
-  edge [
-    source 1995
-    target 3141
-    weight 3660
-  ]
-  edge [
-    source 1995
-    target 3145
-    weight 1737
-  ]
-  edge [
-    source 1995
-    target 3600
-    weight 2229
-  ]
-  edge [
-    source 1995
-    target 2870
-    weight 465
-  ]
-  edge [
-    source 1995
-    target 3276
-    weight 1722
-  ]
-  edge [
-    source 1995
-    target 3253
-    weight 306
-  ]
-  edge [
-    source 1995
-    target 3642
-    weight 1254
-  ]
-  edge [
-    source 1995
-    target 3993
-    weight 1481
-  ]
-  edge [
-    source 1995
-    target 2700
-    weight 1738
-  ]
-  edge [
-    source 1995
-    target 4187
-    weight 66
-  ]
-  edge [
-    source 1995
-    target 2800
-    weight 178
-  ]
-  edge [
-    source 1995
-    target 2978
-    weight 22
-  ]
-  edge [
-    source 1995
-    target 4152
-    weight 52
-  ]
-  edge [
-    source 1995
-    target 2810
-    weight 114
-  ]
-  edge [
-    source 1995
-    target 3420
-    weight 292
-  ]
-  edge [
-    source 1995
-    target 3937
-    weight 134
-  ]
-  edge [
-    source 1995
-    target 3962
-    weight 354
-  ]
-  edge [
-    source 1995
-    target 3377
-    weight 114
-  ]
-  edge [
-    source 1995
-    target 3917
-    weight 867
-  ]
-  edge [
-    source 1995
-    target 3174
-    weight 1843
-  ]
-  edge [
-    source 1995
-    target 3542
-    weight 545
-  ]
-  edge [
-    source 1995
-    target 3443
-    weight 455
-  ]
-  edge [
-    source 1995
-    target 2614
-    weight 105
-  ]
-  edge [
-    source 1995
-    target 3968
-    weight 53
-  ]
-  edge [
-    source 1995
-    target 3636
-    weight 488
-  ]
-  edge [
-    source 1995
-    target 3282
-    weight 690
-  ]
-  edge [
-    source 1995
-    target 2543
-    weight 337
-  ]
-  edge [
-    source 1995
-    target 2227
-    weight 59
-  ]
-  edge [
-    source 1995
-    target 2058
-    weight 343
-  ]
-  edge [
-    source 1995
-    target 2924
-    weight 34
-  ]
-  edge [
-    source 1995
-    target 3954
-    weight 561
-  ]
-  edge [
-    source 1995
-    target 2857
-    weight 593
-  ]
-  edge [
-    source 1995
-    target 2181
-    weight 25
-  ]
-  edge [
-    source 1995
-    target 3374
-    weight 437
-  ]
-  edge [
-    source 1995
-    target 2204
-    weight 341
-  ]
-  edge [
-    source 1995
-    target 2287
-    weight 483
-  ]
-  edge [
-    source 1995
-    target 3295
-    weight 244
-  ]
-  edge [
-    source 1995
-    target 2232
-    weight 31
-  ]
-  edge [
-    source 1995
-    target 3006
-    weight 430
-  ]
-  edge [
-    source 1995
-    target 2082
-    weight 35
-  ]
-  edge [
-    source 1995
-    target 3040
-    weight 706
-  ]
-  edge [
-    source 1995
-    target 3559
-    weight 24
-  ]
-  edge [
-    source 1995
-    target 3052
-    weight 183
-  ]
-  edge [
-    source 1995
-    target 3884
-    weight 104
-  ]
-  edge [
-    source 1995
-    target 3423
-    weight 750
-  ]
-  edge [
-    source 1995
-    target 4098
-    weight 43
-  ]
-  edge [
-    source 1995
-    target 2890
-    weight 477
-  ]
-  edge [
-    source 1995
-    target 2597
-    weight 27
-  ]
-  edge [
-    source 1995
-    target 3077
-    weight 128
-  ]
-  edge [
-    source 1995
-    target 3357
-    weight 27
-  ]
-  edge [
-    source 1995
-    target 2519
-    weight 583
-  ]
-  edge [
-    source 1995
-    target 2329
-    weight 79
-  ]
-  edge [
-    source 1995
-    target 2003
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 2609
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 1995
-    target 3935
-    weight 53
-  ]
-  edge [
-    source 1995
-    target 3860
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 4160
-    weight 56
-  ]
-  edge [
-    source 1995
-    target 3847
-    weight 157
-  ]
-  edge [
-    source 1995
-    target 4100
-    weight 26
-  ]
-  edge [
-    source 1995
-    target 2531
-    weight 55
-  ]
-  edge [
-    source 1995
-    target 2553
-    weight 185
-  ]
-  edge [
-    source 1995
-    target 4154
-    weight 542
-  ]
-  edge [
-    source 1995
-    target 2556
-    weight 42
-  ]
-  edge [
-    source 1995
-    target 2011
-    weight 65
-  ]
-  edge [
-    source 1995
-    target 3392
-    weight 21
-  ]
-  edge [
-    source 1995
-    target 2955
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 2450
-    weight 22
-  ]
-  edge [
-    source 1995
-    target 2570
-    weight 40
-  ]
-  edge [
-    source 1995
-    target 3071
-    weight 47
-  ]
-  edge [
-    source 1995
-    target 3641
-    weight 49
-  ]
-  edge [
-    source 1995
-    target 3177
-    weight 87
-  ]
-  edge [
-    source 1995
-    target 2434
-    weight 21
-  ]
-  edge [
-    source 1995
-    target 4040
-    weight 119
-  ]
-  edge [
-    source 1995
-    target 3050
-    weight 32
-  ]
-  edge [
-    source 1995
-    target 2844
-    weight 31
-  ]
-  edge [
-    source 1995
-    target 3462
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 3877
-    weight 118
-  ]
-  edge [
-    source 1995
-    target 3108
-    weight 25
-  ]
-  edge [
-    source 1995
-    target 3956
-    weight 26
-  ]
-  edge [
-    source 1995
-    target 2573
-    weight 33
-  ]
-  edge [
-    source 1995
-    target 3408
-    weight 86
-  ]
-  edge [
-    source 1995
-    target 2711
-    weight 61
-  ]
-  edge [
-    source 1995
-    target 2061
-    weight 37
-  ]
-  edge [
-    source 1995
-    target 2054
-    weight 27
-  ]
-  edge [
-    source 1995
-    target 2099
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 4162
-    weight 177
-  ]
-  edge [
-    source 1995
-    target 3162
-    weight 38
-  ]
-  edge [
-    source 1995
-    target 2743
-    weight 30
-  ]
-  edge [
-    source 1995
-    target 2983
-    weight 21
-  ]
-  edge [
-    source 1995
-    target 3196
-    weight 49
-  ]
-  edge [
-    source 1995
-    target 3861
-    weight 31
-  ]
-  edge [
-    source 1995
-    target 3677
-    weight 41
-  ]
-  edge [
-    source 1995
-    target 3432
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 4027
-    weight 55
-  ]
-  edge [
-    source 1995
-    target 2822
-    weight 29
-  ]
-  edge [
-    source 1995
-    target 3024
-    weight 34
-  ]
-  edge [
-    source 1995
-    target 3633
-    weight 25
-  ]
-  edge [
-    source 1995
-    target 3876
-    weight 22
-  ]
-  edge [
-    source 1995
-    target 2078
-    weight 74
-  ]
-  edge [
-    source 2003
-    target 2861
-    weight 97
-  ]
-  edge [
-    source 2003
-    target 4051
-    weight 118
-  ]
-  edge [
-    source 2003
-    target 3642
-    weight 46
-  ]
-  edge [
-    source 2003
-    target 3521
-    weight 126
-  ]
-  edge [
-    source 2003
-    target 3423
-    weight 25
-  ]
-  edge [
-    source 2003
-    target 3565
-    weight 25
-  ]
-  edge [
-    source 2003
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 2003
-    target 3954
-    weight 58
-  ]
-  edge [
-    source 2003
-    target 2543
-    weight 40
-  ]
-  edge [
-    source 2003
-    target 3141
-    weight 91
-  ]
-  edge [
-    source 2003
-    target 3174
-    weight 56
-  ]
-  edge [
-    source 2003
-    target 2071
-    weight 90
-  ]
-  edge [
-    source 2003
-    target 2700
-    weight 47
-  ]
-  edge [
-    source 2003
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 2003
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 2003
-    target 3066
-    weight 36
-  ]
-  edge [
-    source 2003
-    target 3600
-    weight 38
-  ]
-  edge [
-    source 2003
-    target 3145
-    weight 58
-  ]
-  edge [
-    source 2003
-    target 3420
-    weight 21
-  ]
-  edge [
-    source 2003
-    target 3917
-    weight 28
-  ]
-  edge [
-    source 2003
-    target 2857
-    weight 29
-  ]
-  edge [
-    source 2003
-    target 3276
-    weight 34
-  ]
-  edge [
-    source 2003
-    target 3542
-    weight 30
-  ]
-  edge [
-    source 2003
-    target 2870
-    weight 24
-  ]
-  edge [
-    source 2003
-    target 3040
-    weight 31
-  ]
-  edge [
-    source 2003
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 2003
-    target 2519
-    weight 33
-  ]
-  edge [
-    source 2009
-    target 3521
-    weight 42
-  ]
-  edge [
-    source 2009
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 2009
-    target 2071
-    weight 35
-  ]
-  edge [
-    source 2009
-    target 3141
-    weight 39
-  ]
-  edge [
-    source 2009
-    target 3145
-    weight 28
-  ]
-  edge [
-    source 2009
-    target 3600
-    weight 24
-  ]
-  edge [
-    source 2009
-    target 4051
-    weight 28
-  ]
-  edge [
-    source 2009
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 2011
-    target 3521
-    weight 148
-  ]
-  edge [
-    source 2011
-    target 3565
-    weight 28
-  ]
-  edge [
-    source 2011
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 2011
-    target 3954
-    weight 38
-  ]
-  edge [
-    source 2011
-    target 3642
-    weight 47
-  ]
-  edge [
-    source 2011
-    target 4051
-    weight 113
-  ]
-  edge [
-    source 2011
-    target 2071
-    weight 109
-  ]
-  edge [
-    source 2011
-    target 2861
-    weight 84
-  ]
-  edge [
-    source 2011
-    target 2700
-    weight 57
-  ]
-  edge [
-    source 2011
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 2011
-    target 3282
-    weight 33
-  ]
-  edge [
-    source 2011
-    target 3141
-    weight 116
-  ]
-  edge [
-    source 2011
-    target 3006
-    weight 21
-  ]
-  edge [
-    source 2011
-    target 3040
-    weight 31
-  ]
-  edge [
-    source 2011
-    target 3993
-    weight 56
-  ]
-  edge [
-    source 2011
-    target 3066
-    weight 29
-  ]
-  edge [
-    source 2011
-    target 3276
-    weight 67
-  ]
-  edge [
-    source 2011
-    target 2890
-    weight 41
-  ]
-  edge [
-    source 2011
-    target 2519
-    weight 29
-  ]
-  edge [
-    source 2011
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 2011
-    target 3174
-    weight 67
-  ]
-  edge [
-    source 2011
-    target 3145
-    weight 84
-  ]
-  edge [
-    source 2011
-    target 3917
-    weight 53
-  ]
-  edge [
-    source 2011
-    target 3600
-    weight 65
-  ]
-  edge [
-    source 2011
-    target 3542
-    weight 25
-  ]
-  edge [
-    source 2011
-    target 2287
-    weight 23
-  ]
-  edge [
-    source 2011
-    target 3374
-    weight 21
-  ]
-  edge [
-    source 2011
-    target 2857
-    weight 36
-  ]
-  edge [
-    source 2011
-    target 3443
-    weight 26
-  ]
-  edge [
-    source 2011
-    target 3423
-    weight 33
-  ]
-  edge [
-    source 2011
-    target 2058
-    weight 22
-  ]
-  edge [
-    source 2054
-    target 3521
-    weight 60
-  ]
-  edge [
-    source 2054
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 2054
-    target 4051
-    weight 56
-  ]
-  edge [
-    source 2054
-    target 2861
-    weight 41
-  ]
-  edge [
-    source 2054
-    target 3141
-    weight 52
-  ]
-  edge [
-    source 2054
-    target 2071
-    weight 47
-  ]
-  edge [
-    source 2054
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 2054
-    target 3174
-    weight 22
-  ]
-  edge [
-    source 2054
-    target 3006
-    weight 22
-  ]
-  edge [
-    source 2054
-    target 2700
-    weight 31
-  ]
-  edge [
-    source 2054
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 2054
-    target 3600
-    weight 25
-  ]
-  edge [
-    source 2058
-    target 3600
-    weight 611
-  ]
-  edge [
-    source 2058
-    target 2861
-    weight 553
-  ]
-  edge [
-    source 2058
-    target 4051
-    weight 708
-  ]
-  edge [
-    source 2058
-    target 3521
-    weight 896
-  ]
-  edge [
-    source 2058
-    target 3565
-    weight 179
-  ]
-  edge [
-    source 2058
-    target 3276
-    weight 558
-  ]
-  edge [
-    source 2058
-    target 3374
-    weight 247
-  ]
-  edge [
-    source 2058
-    target 3423
-    weight 309
-  ]
-  edge [
-    source 2058
-    target 3377
-    weight 34
-  ]
-  edge [
-    source 2058
-    target 3962
-    weight 157
-  ]
-  edge [
-    source 2058
-    target 3917
-    weight 400
-  ]
-  edge [
-    source 2058
-    target 2071
-    weight 782
-  ]
-  edge [
-    source 2058
-    target 3641
-    weight 36
-  ]
-  edge [
-    source 2058
-    target 3937
-    weight 65
-  ]
-  edge [
-    source 2058
-    target 3141
-    weight 796
-  ]
-  edge [
-    source 2058
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 2058
-    target 2227
-    weight 36
-  ]
-  edge [
-    source 2058
-    target 2191
-    weight 192
-  ]
-  edge [
-    source 2058
-    target 3993
-    weight 523
-  ]
-  edge [
-    source 2058
-    target 3860
-    weight 28
-  ]
-  edge [
-    source 2058
-    target 3542
-    weight 173
-  ]
-  edge [
-    source 2058
-    target 3420
-    weight 115
-  ]
-  edge [
-    source 2058
-    target 2700
-    weight 406
-  ]
-  edge [
-    source 2058
-    target 3954
-    weight 130
-  ]
-  edge [
-    source 2058
-    target 2287
-    weight 143
-  ]
-  edge [
-    source 2058
-    target 3642
-    weight 282
-  ]
-  edge [
-    source 2058
-    target 3077
-    weight 89
-  ]
-  edge [
-    source 2058
-    target 3282
-    weight 255
-  ]
-  edge [
-    source 2058
-    target 3177
-    weight 55
-  ]
-  edge [
-    source 2058
-    target 2204
-    weight 108
-  ]
-  edge [
-    source 2058
-    target 4154
-    weight 138
-  ]
-  edge [
-    source 2058
-    target 3174
-    weight 412
-  ]
-  edge [
-    source 2058
-    target 2857
-    weight 275
-  ]
-  edge [
-    source 2058
-    target 3295
-    weight 72
-  ]
-  edge [
-    source 2058
-    target 2890
-    weight 187
-  ]
-  edge [
-    source 2058
-    target 3066
-    weight 124
-  ]
-  edge [
-    source 2058
-    target 3443
-    weight 208
-  ]
-  edge [
-    source 2058
-    target 4162
-    weight 49
-  ]
-  edge [
-    source 2058
-    target 3636
-    weight 114
-  ]
-  edge [
-    source 2058
-    target 2543
-    weight 95
-  ]
-  edge [
-    source 2058
-    target 3006
-    weight 94
-  ]
-  edge [
-    source 2058
-    target 2870
-    weight 154
-  ]
-  edge [
-    source 2058
-    target 3145
-    weight 580
-  ]
-  edge [
-    source 2058
-    target 2553
-    weight 79
-  ]
-  edge [
-    source 2058
-    target 2519
-    weight 237
-  ]
-  edge [
-    source 2058
-    target 3071
-    weight 31
-  ]
-  edge [
-    source 2058
-    target 3040
-    weight 144
-  ]
-  edge [
-    source 2058
-    target 2800
-    weight 82
-  ]
-  edge [
-    source 2058
-    target 4187
-    weight 45
-  ]
-  edge [
-    source 2058
-    target 2810
-    weight 51
-  ]
-  edge [
-    source 2058
-    target 2099
-    weight 24
-  ]
-  edge [
-    source 2058
-    target 3847
-    weight 33
-  ]
-  edge [
-    source 2058
-    target 3253
-    weight 102
-  ]
-  edge [
-    source 2058
-    target 3877
-    weight 52
-  ]
-  edge [
-    source 2058
-    target 4040
-    weight 37
-  ]
-  edge [
-    source 2058
-    target 3052
-    weight 65
-  ]
-  edge [
-    source 2058
-    target 3884
-    weight 29
-  ]
-  edge [
-    source 2058
-    target 3408
-    weight 51
-  ]
-  edge [
-    source 2058
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 2058
-    target 2078
-    weight 48
-  ]
-  edge [
-    source 2058
-    target 3196
-    weight 21
-  ]
-  edge [
-    source 2058
-    target 2614
-    weight 29
-  ]
-  edge [
-    source 2058
-    target 3677
-    weight 21
-  ]
-  edge [
-    source 2061
-    target 3600
-    weight 39
-  ]
-  edge [
-    source 2061
-    target 3141
-    weight 59
-  ]
-  edge [
-    source 2061
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 2061
-    target 3521
-    weight 72
-  ]
-  edge [
-    source 2061
-    target 2071
-    weight 70
-  ]
-  edge [
-    source 2061
-    target 3276
-    weight 32
-  ]
-  edge [
-    source 2061
-    target 2861
-    weight 50
-  ]
-  edge [
-    source 2061
-    target 4051
-    weight 57
-  ]
-  edge [
-    source 2061
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 2061
-    target 3423
-    weight 36
-  ]
-  edge [
-    source 2061
-    target 3145
-    weight 41
-  ]
-  edge [
-    source 2061
-    target 2191
-    weight 32
-  ]
-  edge [
-    source 2061
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2061
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 2061
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 2061
-    target 3962
-    weight 24
-  ]
-  edge [
-    source 2061
-    target 3374
-    weight 22
-  ]
-  edge [
-    source 2071
-    target 2861
-    weight 10340
-  ]
-  edge [
-    source 2071
-    target 3521
-    weight 20806
-  ]
-  edge [
-    source 2071
-    target 3600
-    weight 6583
-  ]
-  edge [
-    source 2071
-    target 2191
-    weight 1074
-  ]
-  edge [
-    source 2071
-    target 3177
-    weight 190
-  ]
-  edge [
-    source 2071
-    target 3565
-    weight 1775
-  ]
-  edge [
-    source 2071
-    target 3374
-    weight 1042
-  ]
-  edge [
-    source 2071
-    target 3993
-    weight 3358
-  ]
-  edge [
-    source 2071
-    target 4051
-    weight 12265
-  ]
-  edge [
-    source 2071
-    target 3968
-    weight 116
-  ]
-  edge [
-    source 2071
-    target 2329
-    weight 111
-  ]
-  edge [
-    source 2071
-    target 2700
-    weight 3574
-  ]
-  edge [
-    source 2071
-    target 3423
-    weight 2070
-  ]
-  edge [
-    source 2071
-    target 3141
-    weight 13060
-  ]
-  edge [
-    source 2071
-    target 3642
-    weight 2674
-  ]
-  edge [
-    source 2071
-    target 3420
-    weight 508
-  ]
-  edge [
-    source 2071
-    target 3937
-    weight 251
-  ]
-  edge [
-    source 2071
-    target 3276
-    weight 4290
-  ]
-  edge [
-    source 2071
-    target 3985
-    weight 81
-  ]
-  edge [
-    source 2071
-    target 3145
-    weight 3926
-  ]
-  edge [
-    source 2071
-    target 2421
-    weight 27
-  ]
-  edge [
-    source 2071
-    target 3962
-    weight 946
-  ]
-  edge [
-    source 2071
-    target 2810
-    weight 220
-  ]
-  edge [
-    source 2071
-    target 2978
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 3752
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3282
-    weight 1261
-  ]
-  edge [
-    source 2071
-    target 2870
-    weight 829
-  ]
-  edge [
-    source 2071
-    target 3542
-    weight 993
-  ]
-  edge [
-    source 2071
-    target 3066
-    weight 633
-  ]
-  edge [
-    source 2071
-    target 3917
-    weight 1809
-  ]
-  edge [
-    source 2071
-    target 4152
-    weight 108
-  ]
-  edge [
-    source 2071
-    target 4187
-    weight 142
-  ]
-  edge [
-    source 2071
-    target 2800
-    weight 332
-  ]
-  edge [
-    source 2071
-    target 3024
-    weight 83
-  ]
-  edge [
-    source 2071
-    target 2227
-    weight 232
-  ]
-  edge [
-    source 2071
-    target 3357
-    weight 82
-  ]
-  edge [
-    source 2071
-    target 2614
-    weight 146
-  ]
-  edge [
-    source 2071
-    target 3954
-    weight 800
-  ]
-  edge [
-    source 2071
-    target 3443
-    weight 821
-  ]
-  edge [
-    source 2071
-    target 2543
-    weight 493
-  ]
-  edge [
-    source 2071
-    target 2519
-    weight 1113
-  ]
-  edge [
-    source 2071
-    target 4027
-    weight 92
-  ]
-  edge [
-    source 2071
-    target 3377
-    weight 195
-  ]
-  edge [
-    source 2071
-    target 3641
-    weight 100
-  ]
-  edge [
-    source 2071
-    target 3861
-    weight 77
-  ]
-  edge [
-    source 2071
-    target 3174
-    weight 4374
-  ]
-  edge [
-    source 2071
-    target 2198
-    weight 49
-  ]
-  edge [
-    source 2071
-    target 2628
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 2857
-    weight 1113
-  ]
-  edge [
-    source 2071
-    target 2924
-    weight 51
-  ]
-  edge [
-    source 2071
-    target 2181
-    weight 49
-  ]
-  edge [
-    source 2071
-    target 3253
-    weight 476
-  ]
-  edge [
-    source 2071
-    target 3112
-    weight 36
-  ]
-  edge [
-    source 2071
-    target 3636
-    weight 706
-  ]
-  edge [
-    source 2071
-    target 3071
-    weight 76
-  ]
-  edge [
-    source 2071
-    target 2204
-    weight 551
-  ]
-  edge [
-    source 2071
-    target 2287
-    weight 741
-  ]
-  edge [
-    source 2071
-    target 3295
-    weight 395
-  ]
-  edge [
-    source 2071
-    target 3884
-    weight 123
-  ]
-  edge [
-    source 2071
-    target 2417
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 2890
-    weight 1071
-  ]
-  edge [
-    source 2071
-    target 3040
-    weight 922
-  ]
-  edge [
-    source 2071
-    target 3006
-    weight 643
-  ]
-  edge [
-    source 2071
-    target 4040
-    weight 203
-  ]
-  edge [
-    source 2071
-    target 2609
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 4100
-    weight 33
-  ]
-  edge [
-    source 2071
-    target 3432
-    weight 93
-  ]
-  edge [
-    source 2071
-    target 2726
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3847
-    weight 228
-  ]
-  edge [
-    source 2071
-    target 3935
-    weight 63
-  ]
-  edge [
-    source 2071
-    target 3077
-    weight 495
-  ]
-  edge [
-    source 2071
-    target 3663
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 2743
-    weight 45
-  ]
-  edge [
-    source 2071
-    target 4162
-    weight 330
-  ]
-  edge [
-    source 2071
-    target 3050
-    weight 56
-  ]
-  edge [
-    source 2071
-    target 4154
-    weight 985
-  ]
-  edge [
-    source 2071
-    target 3196
-    weight 81
-  ]
-  edge [
-    source 2071
-    target 2553
-    weight 322
-  ]
-  edge [
-    source 2071
-    target 2600
-    weight 34
-  ]
-  edge [
-    source 2071
-    target 4007
-    weight 39
-  ]
-  edge [
-    source 2071
-    target 2082
-    weight 45
-  ]
-  edge [
-    source 2071
-    target 3162
-    weight 80
-  ]
-  edge [
-    source 2071
-    target 3408
-    weight 287
-  ]
-  edge [
-    source 2071
-    target 2955
-    weight 55
-  ]
-  edge [
-    source 2071
-    target 3375
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 3052
-    weight 301
-  ]
-  edge [
-    source 2071
-    target 2556
-    weight 64
-  ]
-  edge [
-    source 2071
-    target 2099
-    weight 127
-  ]
-  edge [
-    source 2071
-    target 2711
-    weight 96
-  ]
-  edge [
-    source 2071
-    target 2434
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 4160
-    weight 91
-  ]
-  edge [
-    source 2071
-    target 3324
-    weight 33
-  ]
-  edge [
-    source 2071
-    target 2832
-    weight 28
-  ]
-  edge [
-    source 2071
-    target 2570
-    weight 70
-  ]
-  edge [
-    source 2071
-    target 2844
-    weight 53
-  ]
-  edge [
-    source 2071
-    target 2573
-    weight 50
-  ]
-  edge [
-    source 2071
-    target 3693
-    weight 48
-  ]
-  edge [
-    source 2071
-    target 3956
-    weight 38
-  ]
-  edge [
-    source 2071
-    target 3860
-    weight 80
-  ]
-  edge [
-    source 2071
-    target 3877
-    weight 255
-  ]
-  edge [
-    source 2071
-    target 2597
-    weight 99
-  ]
-  edge [
-    source 2071
-    target 2450
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 2983
-    weight 34
-  ]
-  edge [
-    source 2071
-    target 3465
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3210
-    weight 22
-  ]
-  edge [
-    source 2071
-    target 3952
-    weight 25
-  ]
-  edge [
-    source 2071
-    target 4098
-    weight 89
-  ]
-  edge [
-    source 2071
-    target 2531
-    weight 80
-  ]
-  edge [
-    source 2071
-    target 3692
-    weight 28
-  ]
-  edge [
-    source 2071
-    target 3011
-    weight 31
-  ]
-  edge [
-    source 2071
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 2071
-    target 3559
-    weight 36
-  ]
-  edge [
-    source 2071
-    target 3677
-    weight 76
-  ]
-  edge [
-    source 2071
-    target 2822
-    weight 87
-  ]
-  edge [
-    source 2071
-    target 3309
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 2232
-    weight 51
-  ]
-  edge [
-    source 2071
-    target 3872
-    weight 49
-  ]
-  edge [
-    source 2071
-    target 3146
-    weight 25
-  ]
-  edge [
-    source 2071
-    target 2115
-    weight 32
-  ]
-  edge [
-    source 2071
-    target 3108
-    weight 38
-  ]
-  edge [
-    source 2071
-    target 2078
-    weight 173
-  ]
-  edge [
-    source 2071
-    target 2634
-    weight 25
-  ]
-  edge [
-    source 2071
-    target 3737
-    weight 41
-  ]
-  edge [
-    source 2071
-    target 2836
-    weight 28
-  ]
-  edge [
-    source 2071
-    target 3462
-    weight 46
-  ]
-  edge [
-    source 2071
-    target 3633
-    weight 59
-  ]
-  edge [
-    source 2071
-    target 2801
-    weight 27
-  ]
-  edge [
-    source 2071
-    target 3856
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 3876
-    weight 47
-  ]
-  edge [
-    source 2078
-    target 3521
-    weight 197
-  ]
-  edge [
-    source 2078
-    target 2861
-    weight 144
-  ]
-  edge [
-    source 2078
-    target 3141
-    weight 163
-  ]
-  edge [
-    source 2078
-    target 3565
-    weight 34
-  ]
-  edge [
-    source 2078
-    target 3636
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3253
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3993
-    weight 115
-  ]
-  edge [
-    source 2078
-    target 3542
-    weight 58
-  ]
-  edge [
-    source 2078
-    target 3423
-    weight 85
-  ]
-  edge [
-    source 2078
-    target 3917
-    weight 79
-  ]
-  edge [
-    source 2078
-    target 3174
-    weight 91
-  ]
-  edge [
-    source 2078
-    target 3642
-    weight 57
-  ]
-  edge [
-    source 2078
-    target 3145
-    weight 110
-  ]
-  edge [
-    source 2078
-    target 3282
-    weight 49
-  ]
-  edge [
-    source 2078
-    target 2519
-    weight 47
-  ]
-  edge [
-    source 2078
-    target 3006
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3600
-    weight 121
-  ]
-  edge [
-    source 2078
-    target 2204
-    weight 22
-  ]
-  edge [
-    source 2078
-    target 3954
-    weight 42
-  ]
-  edge [
-    source 2078
-    target 4051
-    weight 161
-  ]
-  edge [
-    source 2078
-    target 3276
-    weight 87
-  ]
-  edge [
-    source 2078
-    target 3420
-    weight 34
-  ]
-  edge [
-    source 2078
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 2078
-    target 2700
-    weight 88
-  ]
-  edge [
-    source 2078
-    target 2800
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 2078
-    target 2191
-    weight 63
-  ]
-  edge [
-    source 2078
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 2078
-    target 3962
-    weight 42
-  ]
-  edge [
-    source 2078
-    target 2890
-    weight 36
-  ]
-  edge [
-    source 2078
-    target 2870
-    weight 32
-  ]
-  edge [
-    source 2078
-    target 3937
-    weight 25
-  ]
-  edge [
-    source 2078
-    target 3040
-    weight 36
-  ]
-  edge [
-    source 2078
-    target 3374
-    weight 48
-  ]
-  edge [
-    source 2078
-    target 3443
-    weight 40
-  ]
-  edge [
-    source 2078
-    target 3066
-    weight 32
-  ]
-  edge [
-    source 2078
-    target 2287
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3077
-    weight 27
-  ]
-  edge [
-    source 2082
-    target 2861
-    weight 40
-  ]
-  edge [
-    source 2082
-    target 3521
-    weight 54
-  ]
-  edge [
-    source 2082
-    target 4051
-    weight 46
-  ]
-  edge [
-    source 2082
-    target 3145
-    weight 32
-  ]
-  edge [
-    source 2082
-    target 2870
-    weight 24
-  ]
-  edge [
-    source 2082
-    target 3636
-    weight 22
-  ]
-  edge [
-    source 2082
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 2082
-    target 3141
-    weight 47
-  ]
-  edge [
-    source 2082
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 2082
-    target 2700
-    weight 29
-  ]
-  edge [
-    source 2082
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2082
-    target 3542
-    weight 24
-  ]
-  edge [
-    source 2082
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 2082
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 2099
-    target 3521
-    weight 152
-  ]
-  edge [
-    source 2099
-    target 3374
-    weight 52
-  ]
-  edge [
-    source 2099
-    target 2700
-    weight 60
-  ]
-  edge [
-    source 2099
-    target 3423
-    weight 55
-  ]
-  edge [
-    source 2099
-    target 3600
-    weight 75
-  ]
-  edge [
-    source 2099
-    target 3077
-    weight 30
-  ]
-  edge [
-    source 2099
-    target 2287
-    weight 22
-  ]
-  edge [
-    source 2099
-    target 4051
-    weight 117
-  ]
-  edge [
-    source 2099
-    target 3408
-    weight 31
-  ]
-  edge [
-    source 2099
-    target 3276
-    weight 59
-  ]
-  edge [
-    source 2099
-    target 2191
-    weight 32
-  ]
-  edge [
-    source 2099
-    target 3145
-    weight 82
-  ]
-  edge [
-    source 2099
-    target 3066
-    weight 22
-  ]
-  edge [
-    source 2099
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 2099
-    target 2861
-    weight 99
-  ]
-  edge [
-    source 2099
-    target 3141
-    weight 118
-  ]
-  edge [
-    source 2099
-    target 3174
-    weight 60
-  ]
-  edge [
-    source 2099
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 2099
-    target 3917
-    weight 52
-  ]
-  edge [
-    source 2099
-    target 2890
-    weight 23
-  ]
-  edge [
-    source 2099
-    target 2519
-    weight 34
-  ]
-  edge [
-    source 2099
-    target 3962
-    weight 24
-  ]
-  edge [
-    source 2099
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 2099
-    target 3040
-    weight 27
-  ]
-  edge [
-    source 2099
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 2115
-    target 3521
-    weight 46
-  ]
-  edge [
-    source 2115
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2115
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 2115
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 2115
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 2115
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 2115
-    target 3276
-    weight 22
-  ]
-  edge [
-    source 2169
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 2181
-    target 2861
-    weight 39
-  ]
-  edge [
-    source 2181
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 2181
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 2181
-    target 3282
-    weight 31
-  ]
-  edge [
-    source 2181
-    target 3542
-    weight 25
-  ]
-  edge [
-    source 2181
-    target 3145
-    weight 39
-  ]
-  edge [
-    source 2181
-    target 2700
-    weight 35
-  ]
-  edge [
-    source 2181
-    target 3917
-    weight 33
-  ]
-  edge [
-    source 2181
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2181
-    target 3276
-    weight 36
-  ]
-  edge [
-    source 2181
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 2181
-    target 3141
-    weight 52
-  ]
-  edge [
-    source 2181
-    target 3600
-    weight 32
-  ]
-  edge [
-    source 2181
-    target 2857
-    weight 22
-  ]
-  edge [
-    source 2181
-    target 2519
-    weight 22
-  ]
-  edge [
-    source 2181
-    target 3993
-    weight 29
-  ]
-  edge [
-    source 2191
-    target 3600
-    weight 724
-  ]
-  edge [
-    source 2191
-    target 3521
-    weight 1291
-  ]
-  edge [
-    source 2191
-    target 2861
-    weight 835
-  ]
-  edge [
-    source 2191
-    target 3565
-    weight 259
-  ]
-  edge [
-    source 2191
-    target 3276
-    weight 497
-  ]
-  edge [
-    source 2191
-    target 3077
-    weight 150
-  ]
-  edge [
-    source 2191
-    target 3177
-    weight 56
-  ]
-  edge [
-    source 2191
-    target 3374
-    weight 262
-  ]
-  edge [
-    source 2191
-    target 4051
-    weight 935
-  ]
-  edge [
-    source 2191
-    target 3423
-    weight 497
-  ]
-  edge [
-    source 2191
-    target 3145
-    weight 541
-  ]
-  edge [
-    source 2191
-    target 3642
-    weight 261
-  ]
-  edge [
-    source 2191
-    target 3641
-    weight 42
-  ]
-  edge [
-    source 2191
-    target 3937
-    weight 99
-  ]
-  edge [
-    source 2191
-    target 3174
-    weight 455
-  ]
-  edge [
-    source 2191
-    target 2700
-    weight 414
-  ]
-  edge [
-    source 2191
-    target 3071
-    weight 27
-  ]
-  edge [
-    source 2191
-    target 3141
-    weight 956
-  ]
-  edge [
-    source 2191
-    target 3420
-    weight 123
-  ]
-  edge [
-    source 2191
-    target 3993
-    weight 566
-  ]
-  edge [
-    source 2191
-    target 3962
-    weight 200
-  ]
-  edge [
-    source 2191
-    target 3542
-    weight 155
-  ]
-  edge [
-    source 2191
-    target 2800
-    weight 71
-  ]
-  edge [
-    source 2191
-    target 3443
-    weight 162
-  ]
-  edge [
-    source 2191
-    target 3282
-    weight 197
-  ]
-  edge [
-    source 2191
-    target 3917
-    weight 324
-  ]
-  edge [
-    source 2191
-    target 2543
-    weight 110
-  ]
-  edge [
-    source 2191
-    target 2870
-    weight 124
-  ]
-  edge [
-    source 2191
-    target 3066
-    weight 107
-  ]
-  edge [
-    source 2191
-    target 2227
-    weight 59
-  ]
-  edge [
-    source 2191
-    target 3954
-    weight 144
-  ]
-  edge [
-    source 2191
-    target 2198
-    weight 23
-  ]
-  edge [
-    source 2191
-    target 2810
-    weight 63
-  ]
-  edge [
-    source 2191
-    target 3357
-    weight 22
-  ]
-  edge [
-    source 2191
-    target 3432
-    weight 28
-  ]
-  edge [
-    source 2191
-    target 4187
-    weight 49
-  ]
-  edge [
-    source 2191
-    target 2890
-    weight 150
-  ]
-  edge [
-    source 2191
-    target 3040
-    weight 164
-  ]
-  edge [
-    source 2191
-    target 3295
-    weight 63
-  ]
-  edge [
-    source 2191
-    target 3253
-    weight 97
-  ]
-  edge [
-    source 2191
-    target 3408
-    weight 66
-  ]
-  edge [
-    source 2191
-    target 3636
-    weight 126
-  ]
-  edge [
-    source 2191
-    target 2857
-    weight 217
-  ]
-  edge [
-    source 2191
-    target 2204
-    weight 77
-  ]
-  edge [
-    source 2191
-    target 4027
-    weight 28
-  ]
-  edge [
-    source 2191
-    target 3052
-    weight 54
-  ]
-  edge [
-    source 2191
-    target 2519
-    weight 185
-  ]
-  edge [
-    source 2191
-    target 2287
-    weight 150
-  ]
-  edge [
-    source 2191
-    target 4162
-    weight 63
-  ]
-  edge [
-    source 2191
-    target 3861
-    weight 23
-  ]
-  edge [
-    source 2191
-    target 4154
-    weight 133
-  ]
-  edge [
-    source 2191
-    target 3006
-    weight 109
-  ]
-  edge [
-    source 2191
-    target 3847
-    weight 33
-  ]
-  edge [
-    source 2191
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 2191
-    target 2597
-    weight 29
-  ]
-  edge [
-    source 2191
-    target 2553
-    weight 58
-  ]
-  edge [
-    source 2191
-    target 3877
-    weight 60
-  ]
-  edge [
-    source 2191
-    target 2614
-    weight 27
-  ]
-  edge [
-    source 2191
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 2191
-    target 3196
-    weight 22
-  ]
-  edge [
-    source 2191
-    target 4098
-    weight 26
-  ]
-  edge [
-    source 2191
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 2191
-    target 3377
-    weight 51
-  ]
-  edge [
-    source 2191
-    target 4040
-    weight 38
-  ]
-  edge [
-    source 2198
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 2198
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 2198
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 2198
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 2198
-    target 2861
-    weight 36
-  ]
-  edge [
-    source 2198
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 2198
-    target 3145
-    weight 21
-  ]
-  edge [
-    source 2198
-    target 3141
-    weight 36
-  ]
-  edge [
-    source 2198
-    target 3174
-    weight 24
-  ]
-  edge [
-    source 2204
-    target 3521
-    weight 692
-  ]
-  edge [
-    source 2204
-    target 3282
-    weight 232
-  ]
-  edge [
-    source 2204
-    target 2861
-    weight 418
-  ]
-  edge [
-    source 2204
-    target 3276
-    weight 332
-  ]
-  edge [
-    source 2204
-    target 3141
-    weight 587
-  ]
-  edge [
-    source 2204
-    target 2614
-    weight 47
-  ]
-  edge [
-    source 2204
-    target 3636
-    weight 178
-  ]
-  edge [
-    source 2204
-    target 3253
-    weight 121
-  ]
-  edge [
-    source 2204
-    target 3917
-    weight 230
-  ]
-  edge [
-    source 2204
-    target 4051
-    weight 530
-  ]
-  edge [
-    source 2204
-    target 3542
-    weight 181
-  ]
-  edge [
-    source 2204
-    target 3066
-    weight 154
-  ]
-  edge [
-    source 2204
-    target 2800
-    weight 80
-  ]
-  edge [
-    source 2204
-    target 2287
-    weight 154
-  ]
-  edge [
-    source 2204
-    target 3600
-    weight 359
-  ]
-  edge [
-    source 2204
-    target 3565
-    weight 157
-  ]
-  edge [
-    source 2204
-    target 2700
-    weight 343
-  ]
-  edge [
-    source 2204
-    target 3423
-    weight 129
-  ]
-  edge [
-    source 2204
-    target 2870
-    weight 179
-  ]
-  edge [
-    source 2204
-    target 3006
-    weight 115
-  ]
-  edge [
-    source 2204
-    target 3040
-    weight 121
-  ]
-  edge [
-    source 2204
-    target 3937
-    weight 42
-  ]
-  edge [
-    source 2204
-    target 3145
-    weight 361
-  ]
-  edge [
-    source 2204
-    target 3443
-    weight 150
-  ]
-  edge [
-    source 2204
-    target 3993
-    weight 308
-  ]
-  edge [
-    source 2204
-    target 4187
-    weight 23
-  ]
-  edge [
-    source 2204
-    target 3174
-    weight 275
-  ]
-  edge [
-    source 2204
-    target 3642
-    weight 207
-  ]
-  edge [
-    source 2204
-    target 3374
-    weight 117
-  ]
-  edge [
-    source 2204
-    target 2890
-    weight 135
-  ]
-  edge [
-    source 2204
-    target 2570
-    weight 26
-  ]
-  edge [
-    source 2204
-    target 3847
-    weight 64
-  ]
-  edge [
-    source 2204
-    target 3420
-    weight 119
-  ]
-  edge [
-    source 2204
-    target 4152
-    weight 21
-  ]
-  edge [
-    source 2204
-    target 2553
-    weight 88
-  ]
-  edge [
-    source 2204
-    target 2810
-    weight 42
-  ]
-  edge [
-    source 2204
-    target 2329
-    weight 37
-  ]
-  edge [
-    source 2204
-    target 3884
-    weight 51
-  ]
-  edge [
-    source 2204
-    target 2844
-    weight 42
-  ]
-  edge [
-    source 2204
-    target 3377
-    weight 32
-  ]
-  edge [
-    source 2204
-    target 2519
-    weight 152
-  ]
-  edge [
-    source 2204
-    target 3962
-    weight 115
-  ]
-  edge [
-    source 2204
-    target 4162
-    weight 47
-  ]
-  edge [
-    source 2204
-    target 2543
-    weight 105
-  ]
-  edge [
-    source 2204
-    target 4154
-    weight 134
-  ]
-  edge [
-    source 2204
-    target 2857
-    weight 202
-  ]
-  edge [
-    source 2204
-    target 3177
-    weight 41
-  ]
-  edge [
-    source 2204
-    target 4027
-    weight 24
-  ]
-  edge [
-    source 2204
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3408
-    weight 26
-  ]
-  edge [
-    source 2204
-    target 4040
-    weight 40
-  ]
-  edge [
-    source 2204
-    target 3954
-    weight 142
-  ]
-  edge [
-    source 2204
-    target 2556
-    weight 22
-  ]
-  edge [
-    source 2204
-    target 4160
-    weight 24
-  ]
-  edge [
-    source 2204
-    target 3295
-    weight 70
-  ]
-  edge [
-    source 2204
-    target 2711
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3432
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3052
-    weight 83
-  ]
-  edge [
-    source 2204
-    target 3077
-    weight 31
-  ]
-  edge [
-    source 2204
-    target 3877
-    weight 36
-  ]
-  edge [
-    source 2204
-    target 3985
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3196
-    weight 21
-  ]
-  edge [
-    source 2217
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 2227
-    target 3521
-    weight 348
-  ]
-  edge [
-    source 2227
-    target 3423
-    weight 114
-  ]
-  edge [
-    source 2227
-    target 2861
-    weight 153
-  ]
-  edge [
-    source 2227
-    target 3600
-    weight 125
-  ]
-  edge [
-    source 2227
-    target 3374
-    weight 63
-  ]
-  edge [
-    source 2227
-    target 2857
-    weight 36
-  ]
-  edge [
-    source 2227
-    target 3077
-    weight 57
-  ]
-  edge [
-    source 2227
-    target 4051
-    weight 178
-  ]
-  edge [
-    source 2227
-    target 3917
-    weight 49
-  ]
-  edge [
-    source 2227
-    target 3276
-    weight 83
-  ]
-  edge [
-    source 2227
-    target 3565
-    weight 32
-  ]
-  edge [
-    source 2227
-    target 3993
-    weight 85
-  ]
-  edge [
-    source 2227
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 2227
-    target 3962
-    weight 72
-  ]
-  edge [
-    source 2227
-    target 3642
-    weight 50
-  ]
-  edge [
-    source 2227
-    target 2700
-    weight 55
-  ]
-  edge [
-    source 2227
-    target 3772
-    weight 31
-  ]
-  edge [
-    source 2227
-    target 3141
-    weight 183
-  ]
-  edge [
-    source 2227
-    target 3408
-    weight 31
-  ]
-  edge [
-    source 2227
-    target 2890
-    weight 28
-  ]
-  edge [
-    source 2227
-    target 3145
-    weight 82
-  ]
-  edge [
-    source 2227
-    target 3174
-    weight 70
-  ]
-  edge [
-    source 2227
-    target 2519
-    weight 42
-  ]
-  edge [
-    source 2227
-    target 3443
-    weight 21
-  ]
-  edge [
-    source 2230
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 2230
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 2232
-    target 2861
-    weight 48
-  ]
-  edge [
-    source 2232
-    target 3521
-    weight 58
-  ]
-  edge [
-    source 2232
-    target 3006
-    weight 21
-  ]
-  edge [
-    source 2232
-    target 4051
-    weight 56
-  ]
-  edge [
-    source 2232
-    target 3066
-    weight 24
-  ]
-  edge [
-    source 2232
-    target 3141
-    weight 47
-  ]
-  edge [
-    source 2232
-    target 3954
-    weight 24
-  ]
-  edge [
-    source 2232
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 2232
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 2232
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 2232
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 2232
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 2232
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 2237
-    target 3521
-    weight 26
-  ]
-  edge [
-    source 2262
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 2287
-    target 3141
-    weight 737
-  ]
-  edge [
-    source 2287
-    target 2614
-    weight 43
-  ]
-  edge [
-    source 2287
-    target 3636
-    weight 177
-  ]
-  edge [
-    source 2287
-    target 3253
-    weight 114
-  ]
-  edge [
-    source 2287
-    target 3917
-    weight 299
-  ]
-  edge [
-    source 2287
-    target 4051
-    weight 723
-  ]
-  edge [
-    source 2287
-    target 3542
-    weight 212
-  ]
-  edge [
-    source 2287
-    target 2800
-    weight 86
-  ]
-  edge [
-    source 2287
-    target 3066
-    weight 200
-  ]
-  edge [
-    source 2287
-    target 3600
-    weight 520
-  ]
-  edge [
-    source 2287
-    target 2861
-    weight 605
-  ]
-  edge [
-    source 2287
-    target 3282
-    weight 290
-  ]
-  edge [
-    source 2287
-    target 3521
-    weight 856
-  ]
-  edge [
-    source 2287
-    target 3565
-    weight 196
-  ]
-  edge [
-    source 2287
-    target 3276
-    weight 431
-  ]
-  edge [
-    source 2287
-    target 3937
-    weight 74
-  ]
-  edge [
-    source 2287
-    target 3040
-    weight 234
-  ]
-  edge [
-    source 2287
-    target 3145
-    weight 511
-  ]
-  edge [
-    source 2287
-    target 2700
-    weight 433
-  ]
-  edge [
-    source 2287
-    target 3993
-    weight 432
-  ]
-  edge [
-    source 2287
-    target 4187
-    weight 46
-  ]
-  edge [
-    source 2287
-    target 3443
-    weight 170
-  ]
-  edge [
-    source 2287
-    target 3006
-    weight 182
-  ]
-  edge [
-    source 2287
-    target 3052
-    weight 81
-  ]
-  edge [
-    source 2287
-    target 3423
-    weight 223
-  ]
-  edge [
-    source 2287
-    target 2870
-    weight 222
-  ]
-  edge [
-    source 2287
-    target 4160
-    weight 23
-  ]
-  edge [
-    source 2287
-    target 3884
-    weight 48
-  ]
-  edge [
-    source 2287
-    target 3174
-    weight 410
-  ]
-  edge [
-    source 2287
-    target 3642
-    weight 278
-  ]
-  edge [
-    source 2287
-    target 4098
-    weight 25
-  ]
-  edge [
-    source 2287
-    target 3954
-    weight 221
-  ]
-  edge [
-    source 2287
-    target 3374
-    weight 193
-  ]
-  edge [
-    source 2287
-    target 2890
-    weight 174
-  ]
-  edge [
-    source 2287
-    target 2570
-    weight 21
-  ]
-  edge [
-    source 2287
-    target 3847
-    weight 58
-  ]
-  edge [
-    source 2287
-    target 3420
-    weight 133
-  ]
-  edge [
-    source 2287
-    target 2711
-    weight 56
-  ]
-  edge [
-    source 2287
-    target 4152
-    weight 27
-  ]
-  edge [
-    source 2287
-    target 2553
-    weight 87
-  ]
-  edge [
-    source 2287
-    target 2810
-    weight 65
-  ]
-  edge [
-    source 2287
-    target 3177
-    weight 49
-  ]
-  edge [
-    source 2287
-    target 3377
-    weight 50
-  ]
-  edge [
-    source 2287
-    target 4154
-    weight 198
-  ]
-  edge [
-    source 2287
-    target 4040
-    weight 54
-  ]
-  edge [
-    source 2287
-    target 4162
-    weight 84
-  ]
-  edge [
-    source 2287
-    target 3962
-    weight 133
-  ]
-  edge [
-    source 2287
-    target 3408
-    weight 35
-  ]
-  edge [
-    source 2287
-    target 2543
-    weight 142
-  ]
-  edge [
-    source 2287
-    target 4027
-    weight 30
-  ]
-  edge [
-    source 2287
-    target 3860
-    weight 26
-  ]
-  edge [
-    source 2287
-    target 3295
-    weight 71
-  ]
-  edge [
-    source 2287
-    target 2329
-    weight 32
-  ]
-  edge [
-    source 2287
-    target 3077
-    weight 50
-  ]
-  edge [
-    source 2287
-    target 2857
-    weight 246
-  ]
-  edge [
-    source 2287
-    target 2519
-    weight 220
-  ]
-  edge [
-    source 2287
-    target 3877
-    weight 48
-  ]
-  edge [
-    source 2287
-    target 3432
-    weight 33
-  ]
-  edge [
-    source 2287
-    target 2556
-    weight 21
-  ]
-  edge [
-    source 2287
-    target 3196
-    weight 25
-  ]
-  edge [
-    source 2299
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 2299
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 2329
-    target 3600
-    weight 79
-  ]
-  edge [
-    source 2329
-    target 2861
-    weight 92
-  ]
-  edge [
-    source 2329
-    target 3521
-    weight 149
-  ]
-  edge [
-    source 2329
-    target 2870
-    weight 40
-  ]
-  edge [
-    source 2329
-    target 3420
-    weight 22
-  ]
-  edge [
-    source 2329
-    target 2700
-    weight 70
-  ]
-  edge [
-    source 2329
-    target 3443
-    weight 38
-  ]
-  edge [
-    source 2329
-    target 3565
-    weight 42
-  ]
-  edge [
-    source 2329
-    target 3282
-    weight 56
-  ]
-  edge [
-    source 2329
-    target 3141
-    weight 128
-  ]
-  edge [
-    source 2329
-    target 3847
-    weight 28
-  ]
-  edge [
-    source 2329
-    target 3642
-    weight 49
-  ]
-  edge [
-    source 2329
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 2329
-    target 3993
-    weight 71
-  ]
-  edge [
-    source 2329
-    target 4051
-    weight 107
-  ]
-  edge [
-    source 2329
-    target 3040
-    weight 30
-  ]
-  edge [
-    source 2329
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 2329
-    target 3174
-    weight 54
-  ]
-  edge [
-    source 2329
-    target 3636
-    weight 44
-  ]
-  edge [
-    source 2329
-    target 3935
-    weight 23
-  ]
-  edge [
-    source 2329
-    target 3542
-    weight 35
-  ]
-  edge [
-    source 2329
-    target 3006
-    weight 24
-  ]
-  edge [
-    source 2329
-    target 4154
-    weight 26
-  ]
-  edge [
-    source 2329
-    target 2543
-    weight 26
-  ]
-  edge [
-    source 2329
-    target 3066
-    weight 28
-  ]
-  edge [
-    source 2329
-    target 3145
-    weight 80
-  ]
-  edge [
-    source 2329
-    target 2890
-    weight 30
-  ]
-  edge [
-    source 2329
-    target 2800
-    weight 23
-  ]
-  edge [
-    source 2329
-    target 3276
-    weight 53
-  ]
-  edge [
-    source 2329
-    target 2519
-    weight 39
-  ]
-  edge [
-    source 2329
-    target 3917
-    weight 39
-  ]
-  edge [
-    source 2329
-    target 2857
-    weight 33
-  ]
-  edge [
-    source 2373
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 2374
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 2374
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 2382
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 2417
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 2417
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 2417
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2417
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 2421
-    target 3521
-    weight 102
-  ]
-  edge [
-    source 2421
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2421
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 2421
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 2434
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2434
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 2434
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 2434
-    target 3141
-    weight 27
-  ]
-  edge [
-    source 2450
-    target 3521
-    weight 50
-  ]
-  edge [
-    source 2450
-    target 2870
-    weight 35
-  ]
-  edge [
-    source 2450
-    target 2861
-    weight 31
-  ]
-  edge [
-    source 2450
-    target 3141
-    weight 38
-  ]
-  edge [
-    source 2450
-    target 4051
-    weight 41
-  ]
-  edge [
-    source 2450
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 2450
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 2450
-    target 3565
-    weight 28
-  ]
-  edge [
-    source 2450
-    target 3600
-    weight 24
-  ]
-  edge [
-    source 2459
-    target 3521
-    weight 46
-  ]
-  edge [
-    source 2519
-    target 3521
-    weight 1386
-  ]
-  edge [
-    source 2519
-    target 3145
-    weight 985
-  ]
-  edge [
-    source 2519
-    target 3377
-    weight 64
-  ]
-  edge [
-    source 2519
-    target 2543
-    weight 170
-  ]
-  edge [
-    source 2519
-    target 3600
-    weight 772
-  ]
-  edge [
-    source 2519
-    target 2861
-    weight 913
-  ]
-  edge [
-    source 2519
-    target 4027
-    weight 39
-  ]
-  edge [
-    source 2519
-    target 4051
-    weight 1102
-  ]
-  edge [
-    source 2519
-    target 3565
-    weight 270
-  ]
-  edge [
-    source 2519
-    target 3276
-    weight 682
-  ]
-  edge [
-    source 2519
-    target 3993
-    weight 614
-  ]
-  edge [
-    source 2519
-    target 3642
-    weight 400
-  ]
-  edge [
-    source 2519
-    target 3917
-    weight 549
-  ]
-  edge [
-    source 2519
-    target 3174
-    weight 658
-  ]
-  edge [
-    source 2519
-    target 3141
-    weight 1199
-  ]
-  edge [
-    source 2519
-    target 3636
-    weight 221
-  ]
-  edge [
-    source 2519
-    target 3420
-    weight 164
-  ]
-  edge [
-    source 2519
-    target 3006
-    weight 186
-  ]
-  edge [
-    source 2519
-    target 2700
-    weight 697
-  ]
-  edge [
-    source 2519
-    target 3954
-    weight 242
-  ]
-  edge [
-    source 2519
-    target 3423
-    weight 310
-  ]
-  edge [
-    source 2519
-    target 3861
-    weight 21
-  ]
-  edge [
-    source 2519
-    target 3040
-    weight 244
-  ]
-  edge [
-    source 2519
-    target 3282
-    weight 384
-  ]
-  edge [
-    source 2519
-    target 3962
-    weight 198
-  ]
-  edge [
-    source 2519
-    target 2810
-    weight 71
-  ]
-  edge [
-    source 2519
-    target 3937
-    weight 68
-  ]
-  edge [
-    source 2519
-    target 3071
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 2890
-    weight 311
-  ]
-  edge [
-    source 2519
-    target 3443
-    weight 258
-  ]
-  edge [
-    source 2519
-    target 2553
-    weight 149
-  ]
-  edge [
-    source 2519
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 2519
-    target 3374
-    weight 239
-  ]
-  edge [
-    source 2519
-    target 2870
-    weight 247
-  ]
-  edge [
-    source 2519
-    target 3066
-    weight 213
-  ]
-  edge [
-    source 2519
-    target 3295
-    weight 121
-  ]
-  edge [
-    source 2519
-    target 4154
-    weight 255
-  ]
-  edge [
-    source 2519
-    target 2800
-    weight 119
-  ]
-  edge [
-    source 2519
-    target 3253
-    weight 190
-  ]
-  edge [
-    source 2519
-    target 3542
-    weight 299
-  ]
-  edge [
-    source 2519
-    target 3847
-    weight 66
-  ]
-  edge [
-    source 2519
-    target 4162
-    weight 100
-  ]
-  edge [
-    source 2519
-    target 4040
-    weight 76
-  ]
-  edge [
-    source 2519
-    target 3884
-    weight 44
-  ]
-  edge [
-    source 2519
-    target 3432
-    weight 35
-  ]
-  edge [
-    source 2519
-    target 3968
-    weight 31
-  ]
-  edge [
-    source 2519
-    target 2822
-    weight 29
-  ]
-  edge [
-    source 2519
-    target 3677
-    weight 43
-  ]
-  edge [
-    source 2519
-    target 2857
-    weight 392
-  ]
-  edge [
-    source 2519
-    target 3872
-    weight 31
-  ]
-  edge [
-    source 2519
-    target 2924
-    weight 21
-  ]
-  edge [
-    source 2519
-    target 2531
-    weight 25
-  ]
-  edge [
-    source 2519
-    target 2711
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 3177
-    weight 63
-  ]
-  edge [
-    source 2519
-    target 3196
-    weight 31
-  ]
-  edge [
-    source 2519
-    target 3162
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 3077
-    weight 63
-  ]
-  edge [
-    source 2519
-    target 3052
-    weight 113
-  ]
-  edge [
-    source 2519
-    target 2570
-    weight 26
-  ]
-  edge [
-    source 2519
-    target 3877
-    weight 72
-  ]
-  edge [
-    source 2519
-    target 2556
-    weight 28
-  ]
-  edge [
-    source 2519
-    target 3860
-    weight 28
-  ]
-  edge [
-    source 2519
-    target 2743
-    weight 21
-  ]
-  edge [
-    source 2519
-    target 3408
-    weight 48
-  ]
-  edge [
-    source 2519
-    target 3641
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 4187
-    weight 35
-  ]
-  edge [
-    source 2519
-    target 2614
-    weight 53
-  ]
-  edge [
-    source 2519
-    target 4098
-    weight 22
-  ]
-  edge [
-    source 2531
-    target 4051
-    weight 84
-  ]
-  edge [
-    source 2531
-    target 3642
-    weight 41
-  ]
-  edge [
-    source 2531
-    target 3521
-    weight 99
-  ]
-  edge [
-    source 2531
-    target 3174
-    weight 55
-  ]
-  edge [
-    source 2531
-    target 3066
-    weight 25
-  ]
-  edge [
-    source 2531
-    target 2861
-    weight 75
-  ]
-  edge [
-    source 2531
-    target 4154
-    weight 32
-  ]
-  edge [
-    source 2531
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 2531
-    target 3141
-    weight 78
-  ]
-  edge [
-    source 2531
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 2531
-    target 3276
-    weight 42
-  ]
-  edge [
-    source 2531
-    target 2700
-    weight 44
-  ]
-  edge [
-    source 2531
-    target 3145
-    weight 48
-  ]
-  edge [
-    source 2531
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 2531
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 2531
-    target 2857
-    weight 24
-  ]
-  edge [
-    source 2531
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 2531
-    target 3040
-    weight 24
-  ]
-  edge [
-    source 2531
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 2531
-    target 3600
-    weight 41
-  ]
-  edge [
-    source 2543
-    target 3521
-    weight 673
-  ]
-  edge [
-    source 2543
-    target 3066
-    weight 163
-  ]
-  edge [
-    source 2543
-    target 4051
-    weight 560
-  ]
-  edge [
-    source 2543
-    target 3174
-    weight 441
-  ]
-  edge [
-    source 2543
-    target 3253
-    weight 122
-  ]
-  edge [
-    source 2543
-    target 3377
-    weight 112
-  ]
-  edge [
-    source 2543
-    target 2861
-    weight 432
-  ]
-  edge [
-    source 2543
-    target 3642
-    weight 255
-  ]
-  edge [
-    source 2543
-    target 3145
-    weight 356
-  ]
-  edge [
-    source 2543
-    target 3600
-    weight 327
-  ]
-  edge [
-    source 2543
-    target 4027
-    weight 24
-  ]
-  edge [
-    source 2543
-    target 3565
-    weight 152
-  ]
-  edge [
-    source 2543
-    target 2800
-    weight 58
-  ]
-  edge [
-    source 2543
-    target 3276
-    weight 295
-  ]
-  edge [
-    source 2543
-    target 3295
-    weight 114
-  ]
-  edge [
-    source 2543
-    target 3954
-    weight 185
-  ]
-  edge [
-    source 2543
-    target 3141
-    weight 538
-  ]
-  edge [
-    source 2543
-    target 3993
-    weight 257
-  ]
-  edge [
-    source 2543
-    target 3542
-    weight 168
-  ]
-  edge [
-    source 2543
-    target 2700
-    weight 310
-  ]
-  edge [
-    source 2543
-    target 3282
-    weight 197
-  ]
-  edge [
-    source 2543
-    target 3006
-    weight 115
-  ]
-  edge [
-    source 2543
-    target 2870
-    weight 157
-  ]
-  edge [
-    source 2543
-    target 3636
-    weight 139
-  ]
-  edge [
-    source 2543
-    target 3443
-    weight 127
-  ]
-  edge [
-    source 2543
-    target 2810
-    weight 40
-  ]
-  edge [
-    source 2543
-    target 2553
-    weight 81
-  ]
-  edge [
-    source 2543
-    target 3847
-    weight 52
-  ]
-  edge [
-    source 2543
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 2543
-    target 2857
-    weight 181
-  ]
-  edge [
-    source 2543
-    target 3884
-    weight 40
-  ]
-  edge [
-    source 2543
-    target 3040
-    weight 126
-  ]
-  edge [
-    source 2543
-    target 2711
-    weight 25
-  ]
-  edge [
-    source 2543
-    target 3196
-    weight 33
-  ]
-  edge [
-    source 2543
-    target 4154
-    weight 143
-  ]
-  edge [
-    source 2543
-    target 3956
-    weight 34
-  ]
-  edge [
-    source 2543
-    target 3052
-    weight 84
-  ]
-  edge [
-    source 2543
-    target 3917
-    weight 200
-  ]
-  edge [
-    source 2543
-    target 2614
-    weight 34
-  ]
-  edge [
-    source 2543
-    target 3962
-    weight 91
-  ]
-  edge [
-    source 2543
-    target 3420
-    weight 100
-  ]
-  edge [
-    source 2543
-    target 3860
-    weight 26
-  ]
-  edge [
-    source 2543
-    target 3408
-    weight 23
-  ]
-  edge [
-    source 2543
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 2543
-    target 2890
-    weight 111
-  ]
-  edge [
-    source 2543
-    target 3423
-    weight 121
-  ]
-  edge [
-    source 2543
-    target 3374
-    weight 108
-  ]
-  edge [
-    source 2543
-    target 4162
-    weight 63
-  ]
-  edge [
-    source 2543
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 2543
-    target 3937
-    weight 43
-  ]
-  edge [
-    source 2543
-    target 3077
-    weight 32
-  ]
-  edge [
-    source 2543
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 2543
-    target 3177
-    weight 32
-  ]
-  edge [
-    source 2543
-    target 3641
-    weight 21
-  ]
-  edge [
-    source 2543
-    target 3877
-    weight 37
-  ]
-  edge [
-    source 2553
-    target 3521
-    weight 417
-  ]
-  edge [
-    source 2553
-    target 2857
-    weight 179
-  ]
-  edge [
-    source 2553
-    target 3276
-    weight 229
-  ]
-  edge [
-    source 2553
-    target 3642
-    weight 134
-  ]
-  edge [
-    source 2553
-    target 3917
-    weight 176
-  ]
-  edge [
-    source 2553
-    target 3993
-    weight 195
-  ]
-  edge [
-    source 2553
-    target 4051
-    weight 317
-  ]
-  edge [
-    source 2553
-    target 2700
-    weight 246
-  ]
-  edge [
-    source 2553
-    target 2810
-    weight 31
-  ]
-  edge [
-    source 2553
-    target 2870
-    weight 129
-  ]
-  edge [
-    source 2553
-    target 3282
-    weight 181
-  ]
-  edge [
-    source 2553
-    target 3565
-    weight 111
-  ]
-  edge [
-    source 2553
-    target 3600
-    weight 229
-  ]
-  edge [
-    source 2553
-    target 3847
-    weight 53
-  ]
-  edge [
-    source 2553
-    target 3542
-    weight 116
-  ]
-  edge [
-    source 2553
-    target 3636
-    weight 108
-  ]
-  edge [
-    source 2553
-    target 3141
-    weight 365
-  ]
-  edge [
-    source 2553
-    target 3937
-    weight 34
-  ]
-  edge [
-    source 2553
-    target 3040
-    weight 94
-  ]
-  edge [
-    source 2553
-    target 3145
-    weight 290
-  ]
-  edge [
-    source 2553
-    target 3174
-    weight 202
-  ]
-  edge [
-    source 2553
-    target 2890
-    weight 106
-  ]
-  edge [
-    source 2553
-    target 2861
-    weight 260
-  ]
-  edge [
-    source 2553
-    target 2800
-    weight 72
-  ]
-  edge [
-    source 2553
-    target 3443
-    weight 115
-  ]
-  edge [
-    source 2553
-    target 3374
-    weight 85
-  ]
-  edge [
-    source 2553
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 2553
-    target 3423
-    weight 104
-  ]
-  edge [
-    source 2553
-    target 2556
-    weight 21
-  ]
-  edge [
-    source 2553
-    target 3066
-    weight 97
-  ]
-  edge [
-    source 2553
-    target 3052
-    weight 58
-  ]
-  edge [
-    source 2553
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 2553
-    target 3295
-    weight 70
-  ]
-  edge [
-    source 2553
-    target 3420
-    weight 91
-  ]
-  edge [
-    source 2553
-    target 3006
-    weight 103
-  ]
-  edge [
-    source 2553
-    target 3954
-    weight 95
-  ]
-  edge [
-    source 2553
-    target 3962
-    weight 71
-  ]
-  edge [
-    source 2553
-    target 3253
-    weight 76
-  ]
-  edge [
-    source 2553
-    target 4154
-    weight 91
-  ]
-  edge [
-    source 2553
-    target 3377
-    weight 29
-  ]
-  edge [
-    source 2553
-    target 4162
-    weight 44
-  ]
-  edge [
-    source 2553
-    target 3177
-    weight 25
-  ]
-  edge [
-    source 2553
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 2553
-    target 3877
-    weight 28
-  ]
-  edge [
-    source 2556
-    target 3141
-    weight 78
-  ]
-  edge [
-    source 2556
-    target 3636
-    weight 26
-  ]
-  edge [
-    source 2556
-    target 3521
-    weight 88
-  ]
-  edge [
-    source 2556
-    target 3276
-    weight 47
-  ]
-  edge [
-    source 2556
-    target 2890
-    weight 33
-  ]
-  edge [
-    source 2556
-    target 3917
-    weight 40
-  ]
-  edge [
-    source 2556
-    target 2857
-    weight 27
-  ]
-  edge [
-    source 2556
-    target 2700
-    weight 46
-  ]
-  edge [
-    source 2556
-    target 2861
-    weight 53
-  ]
-  edge [
-    source 2556
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 2556
-    target 3600
-    weight 55
-  ]
-  edge [
-    source 2556
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 2556
-    target 4051
-    weight 59
-  ]
-  edge [
-    source 2556
-    target 3642
-    weight 24
-  ]
-  edge [
-    source 2556
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 2556
-    target 3145
-    weight 54
-  ]
-  edge [
-    source 2556
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 2556
-    target 2870
-    weight 22
-  ]
-  edge [
-    source 2570
-    target 2870
-    weight 29
-  ]
-  edge [
-    source 2570
-    target 3282
-    weight 38
-  ]
-  edge [
-    source 2570
-    target 3141
-    weight 82
-  ]
-  edge [
-    source 2570
-    target 3521
-    weight 90
-  ]
-  edge [
-    source 2570
-    target 3642
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 2570
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 2570
-    target 3276
-    weight 44
-  ]
-  edge [
-    source 2570
-    target 3993
-    weight 46
-  ]
-  edge [
-    source 2570
-    target 4051
-    weight 72
-  ]
-  edge [
-    source 2570
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 2570
-    target 3145
-    weight 51
-  ]
-  edge [
-    source 2570
-    target 2861
-    weight 57
-  ]
-  edge [
-    source 2570
-    target 3636
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3565
-    weight 27
-  ]
-  edge [
-    source 2570
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 2570
-    target 3066
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3954
-    weight 22
-  ]
-  edge [
-    source 2570
-    target 3542
-    weight 28
-  ]
-  edge [
-    source 2570
-    target 3600
-    weight 47
-  ]
-  edge [
-    source 2570
-    target 2890
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3443
-    weight 29
-  ]
-  edge [
-    source 2570
-    target 2857
-    weight 30
-  ]
-  edge [
-    source 2570
-    target 3174
-    weight 40
-  ]
-  edge [
-    source 2573
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 2573
-    target 2861
-    weight 46
-  ]
-  edge [
-    source 2573
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 2573
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 2573
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 2573
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2573
-    target 2700
-    weight 25
-  ]
-  edge [
-    source 2573
-    target 4051
-    weight 50
-  ]
-  edge [
-    source 2573
-    target 3993
-    weight 23
-  ]
-  edge [
-    source 2573
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 2597
-    target 3521
-    weight 113
-  ]
-  edge [
-    source 2597
-    target 3423
-    weight 47
-  ]
-  edge [
-    source 2597
-    target 2861
-    weight 64
-  ]
-  edge [
-    source 2597
-    target 3600
-    weight 53
-  ]
-  edge [
-    source 2597
-    target 3077
-    weight 29
-  ]
-  edge [
-    source 2597
-    target 3962
-    weight 59
-  ]
-  edge [
-    source 2597
-    target 4051
-    weight 72
-  ]
-  edge [
-    source 2597
-    target 3141
-    weight 79
-  ]
-  edge [
-    source 2597
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 2597
-    target 3993
-    weight 45
-  ]
-  edge [
-    source 2597
-    target 3145
-    weight 45
-  ]
-  edge [
-    source 2597
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 2597
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2597
-    target 3276
-    weight 43
-  ]
-  edge [
-    source 2600
-    target 2861
-    weight 36
-  ]
-  edge [
-    source 2600
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 2600
-    target 3521
-    weight 41
-  ]
-  edge [
-    source 2600
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2600
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 2609
-    target 4051
-    weight 37
-  ]
-  edge [
-    source 2609
-    target 3521
-    weight 43
-  ]
-  edge [
-    source 2609
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 2609
-    target 2861
-    weight 29
-  ]
-  edge [
-    source 2609
-    target 3145
-    weight 26
-  ]
-  edge [
-    source 2614
-    target 3521
-    weight 187
-  ]
-  edge [
-    source 2614
-    target 2861
-    weight 129
-  ]
-  edge [
-    source 2614
-    target 2800
-    weight 28
-  ]
-  edge [
-    source 2614
-    target 3636
-    weight 107
-  ]
-  edge [
-    source 2614
-    target 3565
-    weight 52
-  ]
-  edge [
-    source 2614
-    target 3066
-    weight 38
-  ]
-  edge [
-    source 2614
-    target 2870
-    weight 47
-  ]
-  edge [
-    source 2614
-    target 3420
-    weight 29
-  ]
-  edge [
-    source 2614
-    target 3253
-    weight 43
-  ]
-  edge [
-    source 2614
-    target 2700
-    weight 81
-  ]
-  edge [
-    source 2614
-    target 3276
-    weight 72
-  ]
-  edge [
-    source 2614
-    target 3917
-    weight 70
-  ]
-  edge [
-    source 2614
-    target 3141
-    weight 142
-  ]
-  edge [
-    source 2614
-    target 4051
-    weight 133
-  ]
-  edge [
-    source 2614
-    target 3542
-    weight 62
-  ]
-  edge [
-    source 2614
-    target 3642
-    weight 60
-  ]
-  edge [
-    source 2614
-    target 3174
-    weight 75
-  ]
-  edge [
-    source 2614
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 2614
-    target 3600
-    weight 100
-  ]
-  edge [
-    source 2614
-    target 3443
-    weight 42
-  ]
-  edge [
-    source 2614
-    target 3006
-    weight 34
-  ]
-  edge [
-    source 2614
-    target 3962
-    weight 34
-  ]
-  edge [
-    source 2614
-    target 3993
-    weight 85
-  ]
-  edge [
-    source 2614
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 2614
-    target 3374
-    weight 42
-  ]
-  edge [
-    source 2614
-    target 3145
-    weight 107
-  ]
-  edge [
-    source 2614
-    target 3282
-    weight 71
-  ]
-  edge [
-    source 2614
-    target 3052
-    weight 26
-  ]
-  edge [
-    source 2614
-    target 3040
-    weight 46
-  ]
-  edge [
-    source 2614
-    target 4154
-    weight 45
-  ]
-  edge [
-    source 2614
-    target 2890
-    weight 54
-  ]
-  edge [
-    source 2614
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 2614
-    target 4040
-    weight 21
-  ]
-  edge [
-    source 2614
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 2614
-    target 4162
-    weight 22
-  ]
-  edge [
-    source 2628
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 2628
-    target 3141
-    weight 26
-  ]
-  edge [
-    source 2628
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 2634
-    target 3600
-    weight 22
-  ]
-  edge [
-    source 2634
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 2634
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 2634
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2634
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 2634
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 2652
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 2688
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 2700
-    target 3521
-    weight 4799
-  ]
-  edge [
-    source 2700
-    target 3565
-    weight 829
-  ]
-  edge [
-    source 2700
-    target 2857
-    weight 686
-  ]
-  edge [
-    source 2700
-    target 3145
-    weight 2009
-  ]
-  edge [
-    source 2700
-    target 2861
-    weight 2745
-  ]
-  edge [
-    source 2700
-    target 3276
-    weight 1951
-  ]
-  edge [
-    source 2700
-    target 3420
-    weight 464
-  ]
-  edge [
-    source 2700
-    target 3071
-    weight 53
-  ]
-  edge [
-    source 2700
-    target 3600
-    weight 2530
-  ]
-  edge [
-    source 2700
-    target 3917
-    weight 1045
-  ]
-  edge [
-    source 2700
-    target 3641
-    weight 55
-  ]
-  edge [
-    source 2700
-    target 3642
-    weight 1207
-  ]
-  edge [
-    source 2700
-    target 3542
-    weight 603
-  ]
-  edge [
-    source 2700
-    target 3993
-    weight 1605
-  ]
-  edge [
-    source 2700
-    target 3141
-    weight 4048
-  ]
-  edge [
-    source 2700
-    target 4051
-    weight 3493
-  ]
-  edge [
-    source 2700
-    target 3174
-    weight 1910
-  ]
-  edge [
-    source 2700
-    target 3443
-    weight 553
-  ]
-  edge [
-    source 2700
-    target 3374
-    weight 419
-  ]
-  edge [
-    source 2700
-    target 4152
-    weight 55
-  ]
-  edge [
-    source 2700
-    target 3282
-    weight 863
-  ]
-  edge [
-    source 2700
-    target 3937
-    weight 122
-  ]
-  edge [
-    source 2700
-    target 4187
-    weight 71
-  ]
-  edge [
-    source 2700
-    target 4027
-    weight 49
-  ]
-  edge [
-    source 2700
-    target 3636
-    weight 431
-  ]
-  edge [
-    source 2700
-    target 3985
-    weight 47
-  ]
-  edge [
-    source 2700
-    target 2870
-    weight 575
-  ]
-  edge [
-    source 2700
-    target 3954
-    weight 481
-  ]
-  edge [
-    source 2700
-    target 2924
-    weight 48
-  ]
-  edge [
-    source 2700
-    target 3423
-    weight 735
-  ]
-  edge [
-    source 2700
-    target 2890
-    weight 567
-  ]
-  edge [
-    source 2700
-    target 4154
-    weight 595
-  ]
-  edge [
-    source 2700
-    target 3006
-    weight 370
-  ]
-  edge [
-    source 2700
-    target 2800
-    weight 196
-  ]
-  edge [
-    source 2700
-    target 3040
-    weight 487
-  ]
-  edge [
-    source 2700
-    target 3847
-    weight 179
-  ]
-  edge [
-    source 2700
-    target 3962
-    weight 403
-  ]
-  edge [
-    source 2700
-    target 3253
-    weight 271
-  ]
-  edge [
-    source 2700
-    target 3066
-    weight 392
-  ]
-  edge [
-    source 2700
-    target 3050
-    weight 25
-  ]
-  edge [
-    source 2700
-    target 4040
-    weight 126
-  ]
-  edge [
-    source 2700
-    target 3295
-    weight 214
-  ]
-  edge [
-    source 2700
-    target 2810
-    weight 119
-  ]
-  edge [
-    source 2700
-    target 3177
-    weight 109
-  ]
-  edge [
-    source 2700
-    target 3884
-    weight 83
-  ]
-  edge [
-    source 2700
-    target 2844
-    weight 34
-  ]
-  edge [
-    source 2700
-    target 2711
-    weight 49
-  ]
-  edge [
-    source 2700
-    target 2955
-    weight 30
-  ]
-  edge [
-    source 2700
-    target 3877
-    weight 120
-  ]
-  edge [
-    source 2700
-    target 3077
-    weight 137
-  ]
-  edge [
-    source 2700
-    target 3377
-    weight 102
-  ]
-  edge [
-    source 2700
-    target 4162
-    weight 178
-  ]
-  edge [
-    source 2700
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 2700
-    target 3052
-    weight 181
-  ]
-  edge [
-    source 2700
-    target 3024
-    weight 40
-  ]
-  edge [
-    source 2700
-    target 3935
-    weight 37
-  ]
-  edge [
-    source 2700
-    target 3408
-    weight 74
-  ]
-  edge [
-    source 2700
-    target 3108
-    weight 28
-  ]
-  edge [
-    source 2700
-    target 3968
-    weight 53
-  ]
-  edge [
-    source 2700
-    target 3196
-    weight 54
-  ]
-  edge [
-    source 2700
-    target 4160
-    weight 38
-  ]
-  edge [
-    source 2700
-    target 3432
-    weight 54
-  ]
-  edge [
-    source 2700
-    target 3162
-    weight 44
-  ]
-  edge [
-    source 2700
-    target 2743
-    weight 31
-  ]
-  edge [
-    source 2700
-    target 4098
-    weight 43
-  ]
-  edge [
-    source 2700
-    target 3861
-    weight 39
-  ]
-  edge [
-    source 2700
-    target 3677
-    weight 46
-  ]
-  edge [
-    source 2700
-    target 2822
-    weight 42
-  ]
-  edge [
-    source 2700
-    target 3559
-    weight 29
-  ]
-  edge [
-    source 2700
-    target 3440
-    weight 24
-  ]
-  edge [
-    source 2700
-    target 3872
-    weight 24
-  ]
-  edge [
-    source 2700
-    target 3357
-    weight 22
-  ]
-  edge [
-    source 2700
-    target 3633
-    weight 31
-  ]
-  edge [
-    source 2700
-    target 3876
-    weight 24
-  ]
-  edge [
-    source 2711
-    target 3521
-    weight 106
-  ]
-  edge [
-    source 2711
-    target 2800
-    weight 22
-  ]
-  edge [
-    source 2711
-    target 3141
-    weight 90
-  ]
-  edge [
-    source 2711
-    target 3145
-    weight 58
-  ]
-  edge [
-    source 2711
-    target 3600
-    weight 56
-  ]
-  edge [
-    source 2711
-    target 3253
-    weight 22
-  ]
-  edge [
-    source 2711
-    target 3174
-    weight 54
-  ]
-  edge [
-    source 2711
-    target 2861
-    weight 69
-  ]
-  edge [
-    source 2711
-    target 3954
-    weight 31
-  ]
-  edge [
-    source 2711
-    target 3642
-    weight 36
-  ]
-  edge [
-    source 2711
-    target 3993
-    weight 52
-  ]
-  edge [
-    source 2711
-    target 3276
-    weight 51
-  ]
-  edge [
-    source 2711
-    target 3066
-    weight 30
-  ]
-  edge [
-    source 2711
-    target 3282
-    weight 40
-  ]
-  edge [
-    source 2711
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 2711
-    target 4154
-    weight 22
-  ]
-  edge [
-    source 2711
-    target 3374
-    weight 28
-  ]
-  edge [
-    source 2711
-    target 3917
-    weight 41
-  ]
-  edge [
-    source 2711
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 2711
-    target 3420
-    weight 23
-  ]
-  edge [
-    source 2711
-    target 4051
-    weight 85
-  ]
-  edge [
-    source 2711
-    target 3006
-    weight 24
-  ]
-  edge [
-    source 2711
-    target 3542
-    weight 26
-  ]
-  edge [
-    source 2711
-    target 3040
-    weight 41
-  ]
-  edge [
-    source 2711
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 2711
-    target 3423
-    weight 30
-  ]
-  edge [
-    source 2711
-    target 2857
-    weight 37
-  ]
-  edge [
-    source 2726
-    target 2861
-    weight 25
-  ]
-  edge [
-    source 2726
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 2743
-    target 3521
-    weight 57
-  ]
-  edge [
-    source 2743
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 2743
-    target 3141
-    weight 46
-  ]
-  edge [
-    source 2743
-    target 4051
-    weight 55
-  ]
-  edge [
-    source 2743
-    target 3642
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3040
-    weight 23
-  ]
-  edge [
-    source 2743
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3006
-    weight 23
-  ]
-  edge [
-    source 2743
-    target 3954
-    weight 28
-  ]
-  edge [
-    source 2743
-    target 3145
-    weight 32
-  ]
-  edge [
-    source 2743
-    target 3600
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3282
-    weight 24
-  ]
-  edge [
-    source 2800
-    target 3521
-    weight 404
-  ]
-  edge [
-    source 2800
-    target 2861
-    weight 260
-  ]
-  edge [
-    source 2800
-    target 3962
-    weight 87
-  ]
-  edge [
-    source 2800
-    target 3636
-    weight 96
-  ]
-  edge [
-    source 2800
-    target 3600
-    weight 218
-  ]
-  edge [
-    source 2800
-    target 3565
-    weight 91
-  ]
-  edge [
-    source 2800
-    target 3420
-    weight 93
-  ]
-  edge [
-    source 2800
-    target 3917
-    weight 148
-  ]
-  edge [
-    source 2800
-    target 4051
-    weight 304
-  ]
-  edge [
-    source 2800
-    target 3141
-    weight 333
-  ]
-  edge [
-    source 2800
-    target 3145
-    weight 230
-  ]
-  edge [
-    source 2800
-    target 3642
-    weight 107
-  ]
-  edge [
-    source 2800
-    target 3443
-    weight 91
-  ]
-  edge [
-    source 2800
-    target 3993
-    weight 196
-  ]
-  edge [
-    source 2800
-    target 3276
-    weight 183
-  ]
-  edge [
-    source 2800
-    target 3377
-    weight 27
-  ]
-  edge [
-    source 2800
-    target 3253
-    weight 59
-  ]
-  edge [
-    source 2800
-    target 3542
-    weight 109
-  ]
-  edge [
-    source 2800
-    target 3066
-    weight 88
-  ]
-  edge [
-    source 2800
-    target 3937
-    weight 43
-  ]
-  edge [
-    source 2800
-    target 3040
-    weight 81
-  ]
-  edge [
-    source 2800
-    target 4187
-    weight 27
-  ]
-  edge [
-    source 2800
-    target 3174
-    weight 170
-  ]
-  edge [
-    source 2800
-    target 3374
-    weight 88
-  ]
-  edge [
-    source 2800
-    target 2890
-    weight 81
-  ]
-  edge [
-    source 2800
-    target 3954
-    weight 88
-  ]
-  edge [
-    source 2800
-    target 3423
-    weight 127
-  ]
-  edge [
-    source 2800
-    target 4154
-    weight 85
-  ]
-  edge [
-    source 2800
-    target 3282
-    weight 152
-  ]
-  edge [
-    source 2800
-    target 3006
-    weight 67
-  ]
-  edge [
-    source 2800
-    target 3847
-    weight 31
-  ]
-  edge [
-    source 2800
-    target 3052
-    weight 51
-  ]
-  edge [
-    source 2800
-    target 2857
-    weight 131
-  ]
-  edge [
-    source 2800
-    target 3295
-    weight 44
-  ]
-  edge [
-    source 2800
-    target 2810
-    weight 54
-  ]
-  edge [
-    source 2800
-    target 4162
-    weight 44
-  ]
-  edge [
-    source 2800
-    target 3177
-    weight 37
-  ]
-  edge [
-    source 2800
-    target 2870
-    weight 96
-  ]
-  edge [
-    source 2800
-    target 4040
-    weight 28
-  ]
-  edge [
-    source 2800
-    target 3884
-    weight 27
-  ]
-  edge [
-    source 2800
-    target 3877
-    weight 29
-  ]
-  edge [
-    source 2800
-    target 3077
-    weight 31
-  ]
-  edge [
-    source 2801
-    target 3521
-    weight 35
-  ]
-  edge [
-    source 2801
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 2801
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2801
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 2810
-    target 3521
-    weight 240
-  ]
-  edge [
-    source 2810
-    target 3374
-    weight 64
-  ]
-  edge [
-    source 2810
-    target 2861
-    weight 174
-  ]
-  edge [
-    source 2810
-    target 4051
-    weight 190
-  ]
-  edge [
-    source 2810
-    target 3565
-    weight 70
-  ]
-  edge [
-    source 2810
-    target 3423
-    weight 90
-  ]
-  edge [
-    source 2810
-    target 3420
-    weight 50
-  ]
-  edge [
-    source 2810
-    target 3141
-    weight 185
-  ]
-  edge [
-    source 2810
-    target 3642
-    weight 71
-  ]
-  edge [
-    source 2810
-    target 3600
-    weight 141
-  ]
-  edge [
-    source 2810
-    target 3993
-    weight 135
-  ]
-  edge [
-    source 2810
-    target 3282
-    weight 85
-  ]
-  edge [
-    source 2810
-    target 3962
-    weight 50
-  ]
-  edge [
-    source 2810
-    target 3174
-    weight 101
-  ]
-  edge [
-    source 2810
-    target 3276
-    weight 105
-  ]
-  edge [
-    source 2810
-    target 3295
-    weight 22
-  ]
-  edge [
-    source 2810
-    target 3145
-    weight 136
-  ]
-  edge [
-    source 2810
-    target 3636
-    weight 52
-  ]
-  edge [
-    source 2810
-    target 3443
-    weight 50
-  ]
-  edge [
-    source 2810
-    target 2870
-    weight 53
-  ]
-  edge [
-    source 2810
-    target 3006
-    weight 56
-  ]
-  edge [
-    source 2810
-    target 3040
-    weight 62
-  ]
-  edge [
-    source 2810
-    target 3066
-    weight 48
-  ]
-  edge [
-    source 2810
-    target 3847
-    weight 24
-  ]
-  edge [
-    source 2810
-    target 3917
-    weight 77
-  ]
-  edge [
-    source 2810
-    target 4154
-    weight 39
-  ]
-  edge [
-    source 2810
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 2810
-    target 2890
-    weight 44
-  ]
-  edge [
-    source 2810
-    target 3954
-    weight 57
-  ]
-  edge [
-    source 2810
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 2810
-    target 3937
-    weight 42
-  ]
-  edge [
-    source 2810
-    target 3542
-    weight 67
-  ]
-  edge [
-    source 2810
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 2810
-    target 3052
-    weight 31
-  ]
-  edge [
-    source 2810
-    target 2857
-    weight 67
-  ]
-  edge [
-    source 2822
-    target 3521
-    weight 98
-  ]
-  edge [
-    source 2822
-    target 3600
-    weight 54
-  ]
-  edge [
-    source 2822
-    target 3145
-    weight 87
-  ]
-  edge [
-    source 2822
-    target 3141
-    weight 85
-  ]
-  edge [
-    source 2822
-    target 3917
-    weight 44
-  ]
-  edge [
-    source 2822
-    target 3993
-    weight 41
-  ]
-  edge [
-    source 2822
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 2822
-    target 3276
-    weight 56
-  ]
-  edge [
-    source 2822
-    target 4051
-    weight 74
-  ]
-  edge [
-    source 2822
-    target 3282
-    weight 27
-  ]
-  edge [
-    source 2822
-    target 3423
-    weight 25
-  ]
-  edge [
-    source 2822
-    target 2857
-    weight 23
-  ]
-  edge [
-    source 2822
-    target 2890
-    weight 30
-  ]
-  edge [
-    source 2822
-    target 3174
-    weight 46
-  ]
-  edge [
-    source 2822
-    target 2861
-    weight 58
-  ]
-  edge [
-    source 2832
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 2832
-    target 3521
-    weight 41
-  ]
-  edge [
-    source 2832
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 2832
-    target 3174
-    weight 24
-  ]
-  edge [
-    source 2832
-    target 4051
-    weight 31
-  ]
-  edge [
-    source 2836
-    target 3521
-    weight 38
-  ]
-  edge [
-    source 2836
-    target 3141
-    weight 31
-  ]
-  edge [
-    source 2836
-    target 2861
-    weight 22
-  ]
-  edge [
-    source 2836
-    target 4051
-    weight 31
-  ]
-  edge [
-    source 2836
-    target 3600
-    weight 26
-  ]
-  edge [
-    source 2836
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 2844
-    target 2861
-    weight 37
-  ]
-  edge [
-    source 2844
-    target 4051
-    weight 48
-  ]
-  edge [
-    source 2844
-    target 3521
-    weight 67
-  ]
-  edge [
-    source 2844
-    target 3145
-    weight 39
-  ]
-  edge [
-    source 2844
-    target 3600
-    weight 37
-  ]
-  edge [
-    source 2844
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 2844
-    target 3276
-    weight 36
-  ]
-  edge [
-    source 2844
-    target 3141
-    weight 58
-  ]
-  edge [
-    source 2844
-    target 3917
-    weight 27
-  ]
-  edge [
-    source 2844
-    target 3282
-    weight 21
-  ]
-  edge [
-    source 2844
-    target 3993
-    weight 32
-  ]
-  edge [
-    source 2844
-    target 2857
-    weight 23
-  ]
-  edge [
-    source 2857
-    target 3521
-    weight 1368
-  ]
-  edge [
-    source 2857
-    target 3600
-    weight 778
-  ]
-  edge [
-    source 2857
-    target 3993
-    weight 643
-  ]
-  edge [
-    source 2857
-    target 3145
-    weight 913
-  ]
-  edge [
-    source 2857
-    target 3968
-    weight 28
-  ]
-  edge [
-    source 2857
-    target 3420
-    weight 197
-  ]
-  edge [
-    source 2857
-    target 3141
-    weight 1188
-  ]
-  edge [
-    source 2857
-    target 3432
-    weight 45
-  ]
-  edge [
-    source 2857
-    target 4027
-    weight 40
-  ]
-  edge [
-    source 2857
-    target 2861
-    weight 865
-  ]
-  edge [
-    source 2857
-    target 4051
-    weight 1107
-  ]
-  edge [
-    source 2857
-    target 3276
-    weight 732
-  ]
-  edge [
-    source 2857
-    target 3565
-    weight 282
-  ]
-  edge [
-    source 2857
-    target 3954
-    weight 287
-  ]
-  edge [
-    source 2857
-    target 3174
-    weight 652
-  ]
-  edge [
-    source 2857
-    target 3917
-    weight 546
-  ]
-  edge [
-    source 2857
-    target 3066
-    weight 289
-  ]
-  edge [
-    source 2857
-    target 2890
-    weight 300
-  ]
-  edge [
-    source 2857
-    target 3282
-    weight 440
-  ]
-  edge [
-    source 2857
-    target 3642
-    weight 435
-  ]
-  edge [
-    source 2857
-    target 4154
-    weight 266
-  ]
-  edge [
-    source 2857
-    target 3077
-    weight 87
-  ]
-  edge [
-    source 2857
-    target 2870
-    weight 303
-  ]
-  edge [
-    source 2857
-    target 3636
-    weight 244
-  ]
-  edge [
-    source 2857
-    target 4040
-    weight 80
-  ]
-  edge [
-    source 2857
-    target 3295
-    weight 123
-  ]
-  edge [
-    source 2857
-    target 3162
-    weight 23
-  ]
-  edge [
-    source 2857
-    target 3937
-    weight 94
-  ]
-  edge [
-    source 2857
-    target 3962
-    weight 207
-  ]
-  edge [
-    source 2857
-    target 3860
-    weight 28
-  ]
-  edge [
-    source 2857
-    target 3877
-    weight 80
-  ]
-  edge [
-    source 2857
-    target 4162
-    weight 93
-  ]
-  edge [
-    source 2857
-    target 3052
-    weight 143
-  ]
-  edge [
-    source 2857
-    target 3884
-    weight 48
-  ]
-  edge [
-    source 2857
-    target 3006
-    weight 197
-  ]
-  edge [
-    source 2857
-    target 3641
-    weight 26
-  ]
-  edge [
-    source 2857
-    target 3542
-    weight 325
-  ]
-  edge [
-    source 2857
-    target 4187
-    weight 42
-  ]
-  edge [
-    source 2857
-    target 3374
-    weight 295
-  ]
-  edge [
-    source 2857
-    target 3377
-    weight 61
-  ]
-  edge [
-    source 2857
-    target 3443
-    weight 287
-  ]
-  edge [
-    source 2857
-    target 3177
-    weight 69
-  ]
-  edge [
-    source 2857
-    target 3040
-    weight 282
-  ]
-  edge [
-    source 2857
-    target 3423
-    weight 338
-  ]
-  edge [
-    source 2857
-    target 3408
-    weight 52
-  ]
-  edge [
-    source 2857
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 2857
-    target 3253
-    weight 155
-  ]
-  edge [
-    source 2857
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 2857
-    target 3677
-    weight 27
-  ]
-  edge [
-    source 2857
-    target 3847
-    weight 66
-  ]
-  edge [
-    source 2857
-    target 2924
-    weight 26
-  ]
-  edge [
-    source 2857
-    target 3071
-    weight 32
-  ]
-  edge [
-    source 2857
-    target 4152
-    weight 35
-  ]
-  edge [
-    source 2857
-    target 3196
-    weight 34
-  ]
-  edge [
-    source 2857
-    target 3876
-    weight 23
-  ]
-  edge [
-    source 2861
-    target 3600
-    weight 4949
-  ]
-  edge [
-    source 2861
-    target 3521
-    weight 18104
-  ]
-  edge [
-    source 2861
-    target 3565
-    weight 1647
-  ]
-  edge [
-    source 2861
-    target 3641
-    weight 82
-  ]
-  edge [
-    source 2861
-    target 3276
-    weight 3250
-  ]
-  edge [
-    source 2861
-    target 3374
-    weight 765
-  ]
-  edge [
-    source 2861
-    target 4051
-    weight 10210
-  ]
-  edge [
-    source 2861
-    target 3423
-    weight 1333
-  ]
-  edge [
-    source 2861
-    target 3077
-    weight 326
-  ]
-  edge [
-    source 2861
-    target 3642
-    weight 2390
-  ]
-  edge [
-    source 2861
-    target 3420
-    weight 417
-  ]
-  edge [
-    source 2861
-    target 3917
-    weight 1481
-  ]
-  edge [
-    source 2861
-    target 3071
-    weight 66
-  ]
-  edge [
-    source 2861
-    target 3968
-    weight 94
-  ]
-  edge [
-    source 2861
-    target 3962
-    weight 633
-  ]
-  edge [
-    source 2861
-    target 3443
-    weight 649
-  ]
-  edge [
-    source 2861
-    target 3377
-    weight 159
-  ]
-  edge [
-    source 2861
-    target 3542
-    weight 829
-  ]
-  edge [
-    source 2861
-    target 3066
-    weight 561
-  ]
-  edge [
-    source 2861
-    target 3145
-    weight 2995
-  ]
-  edge [
-    source 2861
-    target 3752
-    weight 23
-  ]
-  edge [
-    source 2861
-    target 3141
-    weight 9884
-  ]
-  edge [
-    source 2861
-    target 3693
-    weight 32
-  ]
-  edge [
-    source 2861
-    target 3993
-    weight 2392
-  ]
-  edge [
-    source 2861
-    target 3177
-    weight 129
-  ]
-  edge [
-    source 2861
-    target 2870
-    weight 634
-  ]
-  edge [
-    source 2861
-    target 3174
-    weight 3505
-  ]
-  edge [
-    source 2861
-    target 3636
-    weight 622
-  ]
-  edge [
-    source 2861
-    target 3985
-    weight 70
-  ]
-  edge [
-    source 2861
-    target 3937
-    weight 199
-  ]
-  edge [
-    source 2861
-    target 4187
-    weight 104
-  ]
-  edge [
-    source 2861
-    target 3282
-    weight 952
-  ]
-  edge [
-    source 2861
-    target 3253
-    weight 417
-  ]
-  edge [
-    source 2861
-    target 2978
-    weight 38
-  ]
-  edge [
-    source 2861
-    target 4152
-    weight 82
-  ]
-  edge [
-    source 2861
-    target 3112
-    weight 36
-  ]
-  edge [
-    source 2861
-    target 3024
-    weight 60
-  ]
-  edge [
-    source 2861
-    target 4027
-    weight 77
-  ]
-  edge [
-    source 2861
-    target 3954
-    weight 753
-  ]
-  edge [
-    source 2861
-    target 2924
-    weight 48
-  ]
-  edge [
-    source 2861
-    target 3295
-    weight 348
-  ]
-  edge [
-    source 2861
-    target 3006
-    weight 671
-  ]
-  edge [
-    source 2861
-    target 2890
-    weight 818
-  ]
-  edge [
-    source 2861
-    target 3559
-    weight 34
-  ]
-  edge [
-    source 2861
-    target 3052
-    weight 254
-  ]
-  edge [
-    source 2861
-    target 3357
-    weight 51
-  ]
-  edge [
-    source 2861
-    target 4098
-    weight 71
-  ]
-  edge [
-    source 2861
-    target 3040
-    weight 842
-  ]
-  edge [
-    source 2861
-    target 3884
-    weight 103
-  ]
-  edge [
-    source 2861
-    target 4160
-    weight 78
-  ]
-  edge [
-    source 2861
-    target 4007
-    weight 34
-  ]
-  edge [
-    source 2861
-    target 3935
-    weight 53
-  ]
-  edge [
-    source 2861
-    target 3663
-    weight 23
-  ]
-  edge [
-    source 2861
-    target 4100
-    weight 27
-  ]
-  edge [
-    source 2861
-    target 3847
-    weight 208
-  ]
-  edge [
-    source 2861
-    target 3050
-    weight 38
-  ]
-  edge [
-    source 2861
-    target 4040
-    weight 170
-  ]
-  edge [
-    source 2861
-    target 4154
-    weight 795
-  ]
-  edge [
-    source 2861
-    target 3196
-    weight 64
-  ]
-  edge [
-    source 2861
-    target 3408
-    weight 200
-  ]
-  edge [
-    source 2861
-    target 2955
-    weight 33
-  ]
-  edge [
-    source 2861
-    target 3375
-    weight 24
-  ]
-  edge [
-    source 2861
-    target 3309
-    weight 25
-  ]
-  edge [
-    source 2861
-    target 3462
-    weight 40
-  ]
-  edge [
-    source 2861
-    target 4162
-    weight 297
-  ]
-  edge [
-    source 2861
-    target 3877
-    weight 209
-  ]
-  edge [
-    source 2861
-    target 3860
-    weight 71
-  ]
-  edge [
-    source 2861
-    target 3952
-    weight 22
-  ]
-  edge [
-    source 2861
-    target 3432
-    weight 74
-  ]
-  edge [
-    source 2861
-    target 3956
-    weight 34
-  ]
-  edge [
-    source 2861
-    target 3861
-    weight 45
-  ]
-  edge [
-    source 2861
-    target 2983
-    weight 28
-  ]
-  edge [
-    source 2861
-    target 3162
-    weight 62
-  ]
-  edge [
-    source 2861
-    target 3692
-    weight 24
-  ]
-  edge [
-    source 2861
-    target 3677
-    weight 65
-  ]
-  edge [
-    source 2861
-    target 3872
-    weight 38
-  ]
-  edge [
-    source 2861
-    target 3108
-    weight 31
-  ]
-  edge [
-    source 2861
-    target 3737
-    weight 33
-  ]
-  edge [
-    source 2861
-    target 3633
-    weight 50
-  ]
-  edge [
-    source 2861
-    target 3011
-    weight 21
-  ]
-  edge [
-    source 2861
-    target 3440
-    weight 28
-  ]
-  edge [
-    source 2861
-    target 3876
-    weight 35
-  ]
-  edge [
-    source 2870
-    target 3521
-    weight 1033
-  ]
-  edge [
-    source 2870
-    target 3420
-    weight 169
-  ]
-  edge [
-    source 2870
-    target 3600
-    weight 631
-  ]
-  edge [
-    source 2870
-    target 3565
-    weight 301
-  ]
-  edge [
-    source 2870
-    target 3282
-    weight 351
-  ]
-  edge [
-    source 2870
-    target 3141
-    weight 891
-  ]
-  edge [
-    source 2870
-    target 3066
-    weight 193
-  ]
-  edge [
-    source 2870
-    target 4051
-    weight 805
-  ]
-  edge [
-    source 2870
-    target 4187
-    weight 29
-  ]
-  edge [
-    source 2870
-    target 4152
-    weight 35
-  ]
-  edge [
-    source 2870
-    target 3276
-    weight 524
-  ]
-  edge [
-    source 2870
-    target 3962
-    weight 154
-  ]
-  edge [
-    source 2870
-    target 3993
-    weight 478
-  ]
-  edge [
-    source 2870
-    target 3917
-    weight 340
-  ]
-  edge [
-    source 2870
-    target 3145
-    weight 567
-  ]
-  edge [
-    source 2870
-    target 3006
-    weight 159
-  ]
-  edge [
-    source 2870
-    target 3847
-    weight 115
-  ]
-  edge [
-    source 2870
-    target 3642
-    weight 323
-  ]
-  edge [
-    source 2870
-    target 2890
-    weight 189
-  ]
-  edge [
-    source 2870
-    target 3542
-    weight 271
-  ]
-  edge [
-    source 2870
-    target 3423
-    weight 197
-  ]
-  edge [
-    source 2870
-    target 3040
-    weight 178
-  ]
-  edge [
-    source 2870
-    target 3954
-    weight 203
-  ]
-  edge [
-    source 2870
-    target 3174
-    weight 475
-  ]
-  edge [
-    source 2870
-    target 3432
-    weight 25
-  ]
-  edge [
-    source 2870
-    target 3052
-    weight 80
-  ]
-  edge [
-    source 2870
-    target 3253
-    weight 118
-  ]
-  edge [
-    source 2870
-    target 3295
-    weight 90
-  ]
-  edge [
-    source 2870
-    target 3636
-    weight 213
-  ]
-  edge [
-    source 2870
-    target 3162
-    weight 29
-  ]
-  edge [
-    source 2870
-    target 3374
-    weight 162
-  ]
-  edge [
-    source 2870
-    target 3884
-    weight 45
-  ]
-  edge [
-    source 2870
-    target 4154
-    weight 214
-  ]
-  edge [
-    source 2870
-    target 3443
-    weight 197
-  ]
-  edge [
-    source 2870
-    target 4040
-    weight 71
-  ]
-  edge [
-    source 2870
-    target 3377
-    weight 46
-  ]
-  edge [
-    source 2870
-    target 3077
-    weight 43
-  ]
-  edge [
-    source 2870
-    target 3860
-    weight 21
-  ]
-  edge [
-    source 2870
-    target 4162
-    weight 70
-  ]
-  edge [
-    source 2870
-    target 4160
-    weight 24
-  ]
-  edge [
-    source 2870
-    target 3968
-    weight 25
-  ]
-  edge [
-    source 2870
-    target 3937
-    weight 68
-  ]
-  edge [
-    source 2870
-    target 3177
-    weight 55
-  ]
-  edge [
-    source 2870
-    target 3877
-    weight 46
-  ]
-  edge [
-    source 2870
-    target 3408
-    weight 27
-  ]
-  edge [
-    source 2890
-    target 3443
-    weight 273
-  ]
-  edge [
-    source 2890
-    target 3521
-    weight 1307
-  ]
-  edge [
-    source 2890
-    target 3565
-    weight 249
-  ]
-  edge [
-    source 2890
-    target 3642
-    weight 348
-  ]
-  edge [
-    source 2890
-    target 3423
-    weight 278
-  ]
-  edge [
-    source 2890
-    target 4051
-    weight 987
-  ]
-  edge [
-    source 2890
-    target 3917
-    weight 466
-  ]
-  edge [
-    source 2890
-    target 3542
-    weight 218
-  ]
-  edge [
-    source 2890
-    target 3145
-    weight 726
-  ]
-  edge [
-    source 2890
-    target 3937
-    weight 59
-  ]
-  edge [
-    source 2890
-    target 3141
-    weight 1152
-  ]
-  edge [
-    source 2890
-    target 3993
-    weight 553
-  ]
-  edge [
-    source 2890
-    target 3006
-    weight 130
-  ]
-  edge [
-    source 2890
-    target 3276
-    weight 656
-  ]
-  edge [
-    source 2890
-    target 3174
-    weight 586
-  ]
-  edge [
-    source 2890
-    target 3282
-    weight 320
-  ]
-  edge [
-    source 2890
-    target 3600
-    weight 785
-  ]
-  edge [
-    source 2890
-    target 3253
-    weight 113
-  ]
-  edge [
-    source 2890
-    target 4040
-    weight 85
-  ]
-  edge [
-    source 2890
-    target 3954
-    weight 148
-  ]
-  edge [
-    source 2890
-    target 3066
-    weight 140
-  ]
-  edge [
-    source 2890
-    target 4154
-    weight 270
-  ]
-  edge [
-    source 2890
-    target 3040
-    weight 185
-  ]
-  edge [
-    source 2890
-    target 3636
-    weight 237
-  ]
-  edge [
-    source 2890
-    target 4187
-    weight 32
-  ]
-  edge [
-    source 2890
-    target 3374
-    weight 172
-  ]
-  edge [
-    source 2890
-    target 3295
-    weight 92
-  ]
-  edge [
-    source 2890
-    target 4152
-    weight 25
-  ]
-  edge [
-    source 2890
-    target 3420
-    weight 123
-  ]
-  edge [
-    source 2890
-    target 3884
-    weight 36
-  ]
-  edge [
-    source 2890
-    target 3962
-    weight 142
-  ]
-  edge [
-    source 2890
-    target 3377
-    weight 49
-  ]
-  edge [
-    source 2890
-    target 3641
-    weight 31
-  ]
-  edge [
-    source 2890
-    target 3052
-    weight 76
-  ]
-  edge [
-    source 2890
-    target 3432
-    weight 36
-  ]
-  edge [
-    source 2890
-    target 3162
-    weight 33
-  ]
-  edge [
-    source 2890
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 2890
-    target 4162
-    weight 88
-  ]
-  edge [
-    source 2890
-    target 3077
-    weight 48
-  ]
-  edge [
-    source 2890
-    target 3847
-    weight 59
-  ]
-  edge [
-    source 2890
-    target 3877
-    weight 66
-  ]
-  edge [
-    source 2890
-    target 3677
-    weight 26
-  ]
-  edge [
-    source 2890
-    target 3177
-    weight 42
-  ]
-  edge [
-    source 2890
-    target 3196
-    weight 22
-  ]
-  edge [
-    source 2890
-    target 3408
-    weight 46
-  ]
-  edge [
-    source 2924
-    target 3282
-    weight 33
-  ]
-  edge [
-    source 2924
-    target 3521
-    weight 68
-  ]
-  edge [
-    source 2924
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 2924
-    target 4051
-    weight 53
-  ]
-  edge [
-    source 2924
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 2924
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 2924
-    target 3145
-    weight 46
-  ]
-  edge [
-    source 2924
-    target 3141
-    weight 60
-  ]
-  edge [
-    source 2924
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 2924
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 2924
-    target 3993
-    weight 28
-  ]
-  edge [
-    source 2924
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 2924
-    target 3600
-    weight 40
-  ]
-  edge [
-    source 2924
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 2924
-    target 3917
-    weight 30
-  ]
-  edge [
-    source 2953
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 2953
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 2953
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 2955
-    target 3600
-    weight 36
-  ]
-  edge [
-    source 2955
-    target 3174
-    weight 33
-  ]
-  edge [
-    source 2955
-    target 3521
-    weight 79
-  ]
-  edge [
-    source 2955
-    target 3141
-    weight 60
-  ]
-  edge [
-    source 2955
-    target 4051
-    weight 51
-  ]
-  edge [
-    source 2955
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 2955
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 2955
-    target 3993
-    weight 23
-  ]
-  edge [
-    source 2978
-    target 3521
-    weight 54
-  ]
-  edge [
-    source 2978
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 2978
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2978
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 2983
-    target 4051
-    weight 35
-  ]
-  edge [
-    source 2983
-    target 3521
-    weight 41
-  ]
-  edge [
-    source 2983
-    target 3174
-    weight 38
-  ]
-  edge [
-    source 2983
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 2983
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 2983
-    target 3145
-    weight 25
-  ]
-  edge [
-    source 2983
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 2997
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 2997
-    target 3141
-    weight 25
-  ]
-  edge [
-    source 3004
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 3006
-    target 3253
-    weight 96
-  ]
-  edge [
-    source 3006
-    target 3521
-    weight 805
-  ]
-  edge [
-    source 3006
-    target 4051
-    weight 677
-  ]
-  edge [
-    source 3006
-    target 3066
-    weight 173
-  ]
-  edge [
-    source 3006
-    target 3052
-    weight 88
-  ]
-  edge [
-    source 3006
-    target 3642
-    weight 289
-  ]
-  edge [
-    source 3006
-    target 3077
-    weight 28
-  ]
-  edge [
-    source 3006
-    target 3040
-    weight 291
-  ]
-  edge [
-    source 3006
-    target 3962
-    weight 93
-  ]
-  edge [
-    source 3006
-    target 3141
-    weight 642
-  ]
-  edge [
-    source 3006
-    target 3993
-    weight 304
-  ]
-  edge [
-    source 3006
-    target 3174
-    weight 357
-  ]
-  edge [
-    source 3006
-    target 3276
-    weight 284
-  ]
-  edge [
-    source 3006
-    target 3145
-    weight 396
-  ]
-  edge [
-    source 3006
-    target 3954
-    weight 282
-  ]
-  edge [
-    source 3006
-    target 3282
-    weight 240
-  ]
-  edge [
-    source 3006
-    target 3600
-    weight 372
-  ]
-  edge [
-    source 3006
-    target 3423
-    weight 162
-  ]
-  edge [
-    source 3006
-    target 3565
-    weight 190
-  ]
-  edge [
-    source 3006
-    target 3917
-    weight 234
-  ]
-  edge [
-    source 3006
-    target 4160
-    weight 29
-  ]
-  edge [
-    source 3006
-    target 3636
-    weight 154
-  ]
-  edge [
-    source 3006
-    target 4154
-    weight 175
-  ]
-  edge [
-    source 3006
-    target 3420
-    weight 109
-  ]
-  edge [
-    source 3006
-    target 3542
-    weight 181
-  ]
-  edge [
-    source 3006
-    target 3847
-    weight 67
-  ]
-  edge [
-    source 3006
-    target 3884
-    weight 39
-  ]
-  edge [
-    source 3006
-    target 4162
-    weight 89
-  ]
-  edge [
-    source 3006
-    target 3877
-    weight 42
-  ]
-  edge [
-    source 3006
-    target 4040
-    weight 34
-  ]
-  edge [
-    source 3006
-    target 3443
-    weight 115
-  ]
-  edge [
-    source 3006
-    target 3377
-    weight 40
-  ]
-  edge [
-    source 3006
-    target 3408
-    weight 28
-  ]
-  edge [
-    source 3006
-    target 3374
-    weight 136
-  ]
-  edge [
-    source 3006
-    target 3295
-    weight 80
-  ]
-  edge [
-    source 3006
-    target 3937
-    weight 52
-  ]
-  edge [
-    source 3006
-    target 3177
-    weight 26
-  ]
-  edge [
-    source 3006
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3006
-    target 3432
-    weight 24
-  ]
-  edge [
-    source 3011
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 3011
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 3011
-    target 3521
-    weight 37
-  ]
-  edge [
-    source 3011
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 3011
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 3024
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 3024
-    target 3276
-    weight 34
-  ]
-  edge [
-    source 3024
-    target 3282
-    weight 26
-  ]
-  edge [
-    source 3024
-    target 3141
-    weight 78
-  ]
-  edge [
-    source 3024
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 3024
-    target 3145
-    weight 41
-  ]
-  edge [
-    source 3024
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 3024
-    target 3600
-    weight 54
-  ]
-  edge [
-    source 3024
-    target 4051
-    weight 70
-  ]
-  edge [
-    source 3024
-    target 3993
-    weight 42
-  ]
-  edge [
-    source 3024
-    target 3917
-    weight 27
-  ]
-  edge [
-    source 3040
-    target 3521
-    weight 1103
-  ]
-  edge [
-    source 3040
-    target 3954
-    weight 300
-  ]
-  edge [
-    source 3040
-    target 3993
-    weight 465
-  ]
-  edge [
-    source 3040
-    target 3884
-    weight 40
-  ]
-  edge [
-    source 3040
-    target 3077
-    weight 45
-  ]
-  edge [
-    source 3040
-    target 3962
-    weight 144
-  ]
-  edge [
-    source 3040
-    target 4051
-    weight 930
-  ]
-  edge [
-    source 3040
-    target 3937
-    weight 70
-  ]
-  edge [
-    source 3040
-    target 3145
-    weight 595
-  ]
-  edge [
-    source 3040
-    target 3636
-    weight 201
-  ]
-  edge [
-    source 3040
-    target 3600
-    weight 524
-  ]
-  edge [
-    source 3040
-    target 3276
-    weight 440
-  ]
-  edge [
-    source 3040
-    target 3642
-    weight 359
-  ]
-  edge [
-    source 3040
-    target 3565
-    weight 210
-  ]
-  edge [
-    source 3040
-    target 4187
-    weight 42
-  ]
-  edge [
-    source 3040
-    target 3443
-    weight 169
-  ]
-  edge [
-    source 3040
-    target 3282
-    weight 299
-  ]
-  edge [
-    source 3040
-    target 3423
-    weight 258
-  ]
-  edge [
-    source 3040
-    target 3917
-    weight 332
-  ]
-  edge [
-    source 3040
-    target 3542
-    weight 225
-  ]
-  edge [
-    source 3040
-    target 3847
-    weight 72
-  ]
-  edge [
-    source 3040
-    target 3174
-    weight 482
-  ]
-  edge [
-    source 3040
-    target 3141
-    weight 889
-  ]
-  edge [
-    source 3040
-    target 3374
-    weight 177
-  ]
-  edge [
-    source 3040
-    target 4152
-    weight 24
-  ]
-  edge [
-    source 3040
-    target 3295
-    weight 102
-  ]
-  edge [
-    source 3040
-    target 3066
-    weight 203
-  ]
-  edge [
-    source 3040
-    target 3253
-    weight 101
-  ]
-  edge [
-    source 3040
-    target 3420
-    weight 133
-  ]
-  edge [
-    source 3040
-    target 4154
-    weight 222
-  ]
-  edge [
-    source 3040
-    target 3052
-    weight 76
-  ]
-  edge [
-    source 3040
-    target 4162
-    weight 106
-  ]
-  edge [
-    source 3040
-    target 4040
-    weight 59
-  ]
-  edge [
-    source 3040
-    target 3408
-    weight 38
-  ]
-  edge [
-    source 3040
-    target 3177
-    weight 39
-  ]
-  edge [
-    source 3040
-    target 4098
-    weight 25
-  ]
-  edge [
-    source 3040
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 3040
-    target 4027
-    weight 33
-  ]
-  edge [
-    source 3040
-    target 3860
-    weight 23
-  ]
-  edge [
-    source 3040
-    target 3377
-    weight 41
-  ]
-  edge [
-    source 3040
-    target 3432
-    weight 24
-  ]
-  edge [
-    source 3040
-    target 3877
-    weight 60
-  ]
-  edge [
-    source 3040
-    target 3196
-    weight 31
-  ]
-  edge [
-    source 3050
-    target 3141
-    weight 58
-  ]
-  edge [
-    source 3050
-    target 4051
-    weight 53
-  ]
-  edge [
-    source 3050
-    target 3521
-    weight 67
-  ]
-  edge [
-    source 3050
-    target 3600
-    weight 47
-  ]
-  edge [
-    source 3050
-    target 3276
-    weight 35
-  ]
-  edge [
-    source 3050
-    target 3174
-    weight 43
-  ]
-  edge [
-    source 3050
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 3050
-    target 3993
-    weight 41
-  ]
-  edge [
-    source 3050
-    target 3145
-    weight 42
-  ]
-  edge [
-    source 3052
-    target 3253
-    weight 81
-  ]
-  edge [
-    source 3052
-    target 4051
-    weight 310
-  ]
-  edge [
-    source 3052
-    target 3521
-    weight 358
-  ]
-  edge [
-    source 3052
-    target 3066
-    weight 98
-  ]
-  edge [
-    source 3052
-    target 3600
-    weight 194
-  ]
-  edge [
-    source 3052
-    target 3954
-    weight 105
-  ]
-  edge [
-    source 3052
-    target 3141
-    weight 317
-  ]
-  edge [
-    source 3052
-    target 3565
-    weight 64
-  ]
-  edge [
-    source 3052
-    target 3295
-    weight 61
-  ]
-  edge [
-    source 3052
-    target 3642
-    weight 137
-  ]
-  edge [
-    source 3052
-    target 3847
-    weight 26
-  ]
-  edge [
-    source 3052
-    target 3282
-    weight 123
-  ]
-  edge [
-    source 3052
-    target 3145
-    weight 239
-  ]
-  edge [
-    source 3052
-    target 3174
-    weight 187
-  ]
-  edge [
-    source 3052
-    target 3993
-    weight 171
-  ]
-  edge [
-    source 3052
-    target 3276
-    weight 187
-  ]
-  edge [
-    source 3052
-    target 4154
-    weight 95
-  ]
-  edge [
-    source 3052
-    target 3884
-    weight 36
-  ]
-  edge [
-    source 3052
-    target 3374
-    weight 80
-  ]
-  edge [
-    source 3052
-    target 3636
-    weight 88
-  ]
-  edge [
-    source 3052
-    target 3542
-    weight 120
-  ]
-  edge [
-    source 3052
-    target 3420
-    weight 62
-  ]
-  edge [
-    source 3052
-    target 3917
-    weight 155
-  ]
-  edge [
-    source 3052
-    target 3443
-    weight 80
-  ]
-  edge [
-    source 3052
-    target 4040
-    weight 30
-  ]
-  edge [
-    source 3052
-    target 3937
-    weight 23
-  ]
-  edge [
-    source 3052
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 3052
-    target 3962
-    weight 59
-  ]
-  edge [
-    source 3052
-    target 4162
-    weight 33
-  ]
-  edge [
-    source 3052
-    target 3877
-    weight 29
-  ]
-  edge [
-    source 3052
-    target 3377
-    weight 27
-  ]
-  edge [
-    source 3052
-    target 3423
-    weight 82
-  ]
-  edge [
-    source 3066
-    target 3565
-    weight 207
-  ]
-  edge [
-    source 3066
-    target 3521
-    weight 776
-  ]
-  edge [
-    source 3066
-    target 3600
-    weight 397
-  ]
-  edge [
-    source 3066
-    target 3993
-    weight 330
-  ]
-  edge [
-    source 3066
-    target 3420
-    weight 131
-  ]
-  edge [
-    source 3066
-    target 3253
-    weight 124
-  ]
-  edge [
-    source 3066
-    target 3282
-    weight 268
-  ]
-  edge [
-    source 3066
-    target 3642
-    weight 271
-  ]
-  edge [
-    source 3066
-    target 3937
-    weight 49
-  ]
-  edge [
-    source 3066
-    target 4051
-    weight 686
-  ]
-  edge [
-    source 3066
-    target 3917
-    weight 294
-  ]
-  edge [
-    source 3066
-    target 3141
-    weight 666
-  ]
-  edge [
-    source 3066
-    target 3542
-    weight 211
-  ]
-  edge [
-    source 3066
-    target 3636
-    weight 175
-  ]
-  edge [
-    source 3066
-    target 3954
-    weight 254
-  ]
-  edge [
-    source 3066
-    target 3174
-    weight 388
-  ]
-  edge [
-    source 3066
-    target 4160
-    weight 25
-  ]
-  edge [
-    source 3066
-    target 3145
-    weight 456
-  ]
-  edge [
-    source 3066
-    target 3847
-    weight 48
-  ]
-  edge [
-    source 3066
-    target 4040
-    weight 53
-  ]
-  edge [
-    source 3066
-    target 3443
-    weight 158
-  ]
-  edge [
-    source 3066
-    target 4154
-    weight 144
-  ]
-  edge [
-    source 3066
-    target 3276
-    weight 386
-  ]
-  edge [
-    source 3066
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3066
-    target 3935
-    weight 24
-  ]
-  edge [
-    source 3066
-    target 3377
-    weight 62
-  ]
-  edge [
-    source 3066
-    target 3374
-    weight 142
-  ]
-  edge [
-    source 3066
-    target 3423
-    weight 176
-  ]
-  edge [
-    source 3066
-    target 3432
-    weight 24
-  ]
-  edge [
-    source 3066
-    target 3884
-    weight 49
-  ]
-  edge [
-    source 3066
-    target 3962
-    weight 102
-  ]
-  edge [
-    source 3066
-    target 3956
-    weight 21
-  ]
-  edge [
-    source 3066
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 3066
-    target 3295
-    weight 81
-  ]
-  edge [
-    source 3066
-    target 4098
-    weight 31
-  ]
-  edge [
-    source 3066
-    target 3968
-    weight 27
-  ]
-  edge [
-    source 3066
-    target 3196
-    weight 32
-  ]
-  edge [
-    source 3066
-    target 4162
-    weight 76
-  ]
-  edge [
-    source 3066
-    target 4187
-    weight 27
-  ]
-  edge [
-    source 3066
-    target 3077
-    weight 30
-  ]
-  edge [
-    source 3066
-    target 3177
-    weight 39
-  ]
-  edge [
-    source 3066
-    target 3877
-    weight 30
-  ]
-  edge [
-    source 3071
-    target 3600
-    weight 65
-  ]
-  edge [
-    source 3071
-    target 3917
-    weight 43
-  ]
-  edge [
-    source 3071
-    target 3521
-    weight 90
-  ]
-  edge [
-    source 3071
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 3071
-    target 3276
-    weight 73
-  ]
-  edge [
-    source 3071
-    target 3420
-    weight 23
-  ]
-  edge [
-    source 3071
-    target 3542
-    weight 26
-  ]
-  edge [
-    source 3071
-    target 4051
-    weight 71
-  ]
-  edge [
-    source 3071
-    target 3174
-    weight 47
-  ]
-  edge [
-    source 3071
-    target 3145
-    weight 65
-  ]
-  edge [
-    source 3071
-    target 3443
-    weight 34
-  ]
-  edge [
-    source 3071
-    target 3141
-    weight 82
-  ]
-  edge [
-    source 3071
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 3071
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 3071
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 3071
-    target 3423
-    weight 23
-  ]
-  edge [
-    source 3071
-    target 3282
-    weight 47
-  ]
-  edge [
-    source 3074
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 3074
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 3074
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 3077
-    target 3521
-    weight 641
-  ]
-  edge [
-    source 3077
-    target 3565
-    weight 72
-  ]
-  edge [
-    source 3077
-    target 3276
-    weight 211
-  ]
-  edge [
-    source 3077
-    target 3374
-    weight 168
-  ]
-  edge [
-    source 3077
-    target 3423
-    weight 306
-  ]
-  edge [
-    source 3077
-    target 3962
-    weight 123
-  ]
-  edge [
-    source 3077
-    target 3693
-    weight 57
-  ]
-  edge [
-    source 3077
-    target 3357
-    weight 33
-  ]
-  edge [
-    source 3077
-    target 3145
-    weight 226
-  ]
-  edge [
-    source 3077
-    target 3642
-    weight 102
-  ]
-  edge [
-    source 3077
-    target 3141
-    weight 417
-  ]
-  edge [
-    source 3077
-    target 3993
-    weight 207
-  ]
-  edge [
-    source 3077
-    target 3408
-    weight 88
-  ]
-  edge [
-    source 3077
-    target 3600
-    weight 283
-  ]
-  edge [
-    source 3077
-    target 3917
-    weight 124
-  ]
-  edge [
-    source 3077
-    target 3937
-    weight 37
-  ]
-  edge [
-    source 3077
-    target 4154
-    weight 39
-  ]
-  edge [
-    source 3077
-    target 4051
-    weight 388
-  ]
-  edge [
-    source 3077
-    target 3443
-    weight 57
-  ]
-  edge [
-    source 3077
-    target 3174
-    weight 169
-  ]
-  edge [
-    source 3077
-    target 3877
-    weight 31
-  ]
-  edge [
-    source 3077
-    target 3253
-    weight 33
-  ]
-  edge [
-    source 3077
-    target 3954
-    weight 41
-  ]
-  edge [
-    source 3077
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 3077
-    target 3636
-    weight 35
-  ]
-  edge [
-    source 3077
-    target 3420
-    weight 33
-  ]
-  edge [
-    source 3077
-    target 3641
-    weight 26
-  ]
-  edge [
-    source 3077
-    target 3282
-    weight 58
-  ]
-  edge [
-    source 3102
-    target 3521
-    weight 96
-  ]
-  edge [
-    source 3108
-    target 3521
-    weight 49
-  ]
-  edge [
-    source 3108
-    target 3443
-    weight 21
-  ]
-  edge [
-    source 3108
-    target 3282
-    weight 27
-  ]
-  edge [
-    source 3108
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 3108
-    target 4051
-    weight 38
-  ]
-  edge [
-    source 3108
-    target 3600
-    weight 30
-  ]
-  edge [
-    source 3108
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 3108
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 3108
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 3108
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 3108
-    target 3993
-    weight 29
-  ]
-  edge [
-    source 3108
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 3112
-    target 3521
-    weight 168
-  ]
-  edge [
-    source 3112
-    target 3849
-    weight 61
-  ]
-  edge [
-    source 3112
-    target 4051
-    weight 36
-  ]
-  edge [
-    source 3112
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 3141
-    target 3600
-    weight 6943
-  ]
-  edge [
-    source 3141
-    target 3423
-    weight 1813
-  ]
-  edge [
-    source 3141
-    target 4051
-    weight 12852
-  ]
-  edge [
-    source 3141
-    target 3521
-    weight 20908
-  ]
-  edge [
-    source 3141
-    target 3565
-    weight 1917
-  ]
-  edge [
-    source 3141
-    target 3642
-    weight 2966
-  ]
-  edge [
-    source 3141
-    target 3420
-    weight 542
-  ]
-  edge [
-    source 3141
-    target 3993
-    weight 3349
-  ]
-  edge [
-    source 3141
-    target 3985
-    weight 78
-  ]
-  edge [
-    source 3141
-    target 3968
-    weight 106
-  ]
-  edge [
-    source 3141
-    target 3282
-    weight 1462
-  ]
-  edge [
-    source 3141
-    target 3636
-    weight 765
-  ]
-  edge [
-    source 3141
-    target 4187
-    weight 124
-  ]
-  edge [
-    source 3141
-    target 4152
-    weight 106
-  ]
-  edge [
-    source 3141
-    target 3443
-    weight 938
-  ]
-  edge [
-    source 3141
-    target 3542
-    weight 1149
-  ]
-  edge [
-    source 3141
-    target 3937
-    weight 234
-  ]
-  edge [
-    source 3141
-    target 3962
-    weight 849
-  ]
-  edge [
-    source 3141
-    target 3917
-    weight 1925
-  ]
-  edge [
-    source 3141
-    target 3276
-    weight 4861
-  ]
-  edge [
-    source 3141
-    target 3253
-    weight 544
-  ]
-  edge [
-    source 3141
-    target 3374
-    weight 989
-  ]
-  edge [
-    source 3141
-    target 3145
-    weight 4254
-  ]
-  edge [
-    source 3141
-    target 3377
-    weight 206
-  ]
-  edge [
-    source 3141
-    target 3174
-    weight 4918
-  ]
-  edge [
-    source 3141
-    target 4154
-    weight 1141
-  ]
-  edge [
-    source 3141
-    target 3295
-    weight 490
-  ]
-  edge [
-    source 3141
-    target 4027
-    weight 89
-  ]
-  edge [
-    source 3141
-    target 3847
-    weight 281
-  ]
-  edge [
-    source 3141
-    target 3954
-    weight 823
-  ]
-  edge [
-    source 3141
-    target 4040
-    weight 229
-  ]
-  edge [
-    source 3141
-    target 4100
-    weight 36
-  ]
-  edge [
-    source 3141
-    target 3861
-    weight 70
-  ]
-  edge [
-    source 3141
-    target 4162
-    weight 340
-  ]
-  edge [
-    source 3141
-    target 3693
-    weight 42
-  ]
-  edge [
-    source 3141
-    target 3375
-    weight 22
-  ]
-  edge [
-    source 3141
-    target 3309
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3177
-    weight 172
-  ]
-  edge [
-    source 3141
-    target 3956
-    weight 35
-  ]
-  edge [
-    source 3141
-    target 3196
-    weight 96
-  ]
-  edge [
-    source 3141
-    target 3935
-    weight 64
-  ]
-  edge [
-    source 3141
-    target 4160
-    weight 82
-  ]
-  edge [
-    source 3141
-    target 3408
-    weight 245
-  ]
-  edge [
-    source 3141
-    target 3884
-    weight 131
-  ]
-  edge [
-    source 3141
-    target 3860
-    weight 87
-  ]
-  edge [
-    source 3141
-    target 3324
-    weight 27
-  ]
-  edge [
-    source 3141
-    target 3432
-    weight 91
-  ]
-  edge [
-    source 3141
-    target 3952
-    weight 33
-  ]
-  edge [
-    source 3141
-    target 3162
-    weight 86
-  ]
-  edge [
-    source 3141
-    target 3877
-    weight 253
-  ]
-  edge [
-    source 3141
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 3141
-    target 3465
-    weight 26
-  ]
-  edge [
-    source 3141
-    target 3641
-    weight 94
-  ]
-  edge [
-    source 3141
-    target 3559
-    weight 37
-  ]
-  edge [
-    source 3141
-    target 4098
-    weight 83
-  ]
-  edge [
-    source 3141
-    target 3663
-    weight 21
-  ]
-  edge [
-    source 3141
-    target 3692
-    weight 32
-  ]
-  edge [
-    source 3141
-    target 4007
-    weight 38
-  ]
-  edge [
-    source 3141
-    target 3752
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3677
-    weight 82
-  ]
-  edge [
-    source 3141
-    target 3633
-    weight 66
-  ]
-  edge [
-    source 3141
-    target 3872
-    weight 58
-  ]
-  edge [
-    source 3141
-    target 3462
-    weight 41
-  ]
-  edge [
-    source 3141
-    target 3146
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3856
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3737
-    weight 41
-  ]
-  edge [
-    source 3141
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 3141
-    target 3357
-    weight 62
-  ]
-  edge [
-    source 3141
-    target 3876
-    weight 48
-  ]
-  edge [
-    source 3145
-    target 3521
-    weight 5316
-  ]
-  edge [
-    source 3145
-    target 3985
-    weight 41
-  ]
-  edge [
-    source 3145
-    target 3276
-    weight 2219
-  ]
-  edge [
-    source 3145
-    target 3420
-    weight 384
-  ]
-  edge [
-    source 3145
-    target 3565
-    weight 779
-  ]
-  edge [
-    source 3145
-    target 3968
-    weight 80
-  ]
-  edge [
-    source 3145
-    target 3600
-    weight 2713
-  ]
-  edge [
-    source 3145
-    target 3641
-    weight 83
-  ]
-  edge [
-    source 3145
-    target 3174
-    weight 2154
-  ]
-  edge [
-    source 3145
-    target 3432
-    weight 79
-  ]
-  edge [
-    source 3145
-    target 3993
-    weight 1856
-  ]
-  edge [
-    source 3145
-    target 3443
-    weight 606
-  ]
-  edge [
-    source 3145
-    target 3282
-    weight 886
-  ]
-  edge [
-    source 3145
-    target 3917
-    weight 1473
-  ]
-  edge [
-    source 3145
-    target 3642
-    weight 1288
-  ]
-  edge [
-    source 3145
-    target 3542
-    weight 701
-  ]
-  edge [
-    source 3145
-    target 4051
-    weight 3768
-  ]
-  edge [
-    source 3145
-    target 3377
-    weight 145
-  ]
-  edge [
-    source 3145
-    target 4027
-    weight 75
-  ]
-  edge [
-    source 3145
-    target 3374
-    weight 643
-  ]
-  edge [
-    source 3145
-    target 3954
-    weight 554
-  ]
-  edge [
-    source 3145
-    target 3962
-    weight 523
-  ]
-  edge [
-    source 3145
-    target 3636
-    weight 495
-  ]
-  edge [
-    source 3145
-    target 3937
-    weight 162
-  ]
-  edge [
-    source 3145
-    target 3935
-    weight 36
-  ]
-  edge [
-    source 3145
-    target 4160
-    weight 41
-  ]
-  edge [
-    source 3145
-    target 4154
-    weight 685
-  ]
-  edge [
-    source 3145
-    target 4187
-    weight 86
-  ]
-  edge [
-    source 3145
-    target 3860
-    weight 66
-  ]
-  edge [
-    source 3145
-    target 4100
-    weight 23
-  ]
-  edge [
-    source 3145
-    target 3253
-    weight 379
-  ]
-  edge [
-    source 3145
-    target 3295
-    weight 258
-  ]
-  edge [
-    source 3145
-    target 4152
-    weight 56
-  ]
-  edge [
-    source 3145
-    target 3423
-    weight 1000
-  ]
-  edge [
-    source 3145
-    target 4007
-    weight 26
-  ]
-  edge [
-    source 3145
-    target 3861
-    weight 42
-  ]
-  edge [
-    source 3145
-    target 4162
-    weight 237
-  ]
-  edge [
-    source 3145
-    target 3162
-    weight 50
-  ]
-  edge [
-    source 3145
-    target 3177
-    weight 132
-  ]
-  edge [
-    source 3145
-    target 3847
-    weight 144
-  ]
-  edge [
-    source 3145
-    target 3877
-    weight 174
-  ]
-  edge [
-    source 3145
-    target 4098
-    weight 54
-  ]
-  edge [
-    source 3145
-    target 3884
-    weight 85
-  ]
-  edge [
-    source 3145
-    target 3752
-    weight 22
-  ]
-  edge [
-    source 3145
-    target 3956
-    weight 28
-  ]
-  edge [
-    source 3145
-    target 3408
-    weight 132
-  ]
-  edge [
-    source 3145
-    target 3196
-    weight 65
-  ]
-  edge [
-    source 3145
-    target 4040
-    weight 144
-  ]
-  edge [
-    source 3145
-    target 3693
-    weight 27
-  ]
-  edge [
-    source 3145
-    target 3677
-    weight 85
-  ]
-  edge [
-    source 3145
-    target 3559
-    weight 23
-  ]
-  edge [
-    source 3145
-    target 3872
-    weight 54
-  ]
-  edge [
-    source 3145
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 3145
-    target 3357
-    weight 37
-  ]
-  edge [
-    source 3145
-    target 3737
-    weight 24
-  ]
-  edge [
-    source 3145
-    target 3633
-    weight 35
-  ]
-  edge [
-    source 3145
-    target 3876
-    weight 41
-  ]
-  edge [
-    source 3146
-    target 3521
-    weight 30
-  ]
-  edge [
-    source 3146
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 3162
-    target 3521
-    weight 93
-  ]
-  edge [
-    source 3162
-    target 3642
-    weight 27
-  ]
-  edge [
-    source 3162
-    target 3600
-    weight 63
-  ]
-  edge [
-    source 3162
-    target 3276
-    weight 56
-  ]
-  edge [
-    source 3162
-    target 3282
-    weight 26
-  ]
-  edge [
-    source 3162
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 3162
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 3162
-    target 4051
-    weight 78
-  ]
-  edge [
-    source 3162
-    target 3174
-    weight 53
-  ]
-  edge [
-    source 3162
-    target 3423
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 3521
-    weight 6172
-  ]
-  edge [
-    source 3174
-    target 4051
-    weight 4511
-  ]
-  edge [
-    source 3174
-    target 3276
-    weight 2256
-  ]
-  edge [
-    source 3174
-    target 3600
-    weight 2654
-  ]
-  edge [
-    source 3174
-    target 3253
-    weight 300
-  ]
-  edge [
-    source 3174
-    target 3374
-    weight 518
-  ]
-  edge [
-    source 3174
-    target 3962
-    weight 378
-  ]
-  edge [
-    source 3174
-    target 3443
-    weight 483
-  ]
-  edge [
-    source 3174
-    target 3993
-    weight 1585
-  ]
-  edge [
-    source 3174
-    target 3642
-    weight 1485
-  ]
-  edge [
-    source 3174
-    target 3954
-    weight 496
-  ]
-  edge [
-    source 3174
-    target 3565
-    weight 669
-  ]
-  edge [
-    source 3174
-    target 3935
-    weight 31
-  ]
-  edge [
-    source 3174
-    target 3282
-    weight 712
-  ]
-  edge [
-    source 3174
-    target 4154
-    weight 629
-  ]
-  edge [
-    source 3174
-    target 3636
-    weight 343
-  ]
-  edge [
-    source 3174
-    target 3937
-    weight 124
-  ]
-  edge [
-    source 3174
-    target 3423
-    weight 892
-  ]
-  edge [
-    source 3174
-    target 3917
-    weight 1018
-  ]
-  edge [
-    source 3174
-    target 4187
-    weight 64
-  ]
-  edge [
-    source 3174
-    target 3420
-    weight 292
-  ]
-  edge [
-    source 3174
-    target 3295
-    weight 329
-  ]
-  edge [
-    source 3174
-    target 3196
-    weight 74
-  ]
-  edge [
-    source 3174
-    target 3377
-    weight 148
-  ]
-  edge [
-    source 3174
-    target 4152
-    weight 45
-  ]
-  edge [
-    source 3174
-    target 3884
-    weight 66
-  ]
-  edge [
-    source 3174
-    target 4027
-    weight 54
-  ]
-  edge [
-    source 3174
-    target 3542
-    weight 577
-  ]
-  edge [
-    source 3174
-    target 3847
-    weight 124
-  ]
-  edge [
-    source 3174
-    target 4040
-    weight 132
-  ]
-  edge [
-    source 3174
-    target 3956
-    weight 25
-  ]
-  edge [
-    source 3174
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 3174
-    target 3408
-    weight 113
-  ]
-  edge [
-    source 3174
-    target 3641
-    weight 58
-  ]
-  edge [
-    source 3174
-    target 3985
-    weight 26
-  ]
-  edge [
-    source 3174
-    target 3462
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 4160
-    weight 40
-  ]
-  edge [
-    source 3174
-    target 3968
-    weight 59
-  ]
-  edge [
-    source 3174
-    target 4098
-    weight 52
-  ]
-  edge [
-    source 3174
-    target 3877
-    weight 133
-  ]
-  edge [
-    source 3174
-    target 4162
-    weight 177
-  ]
-  edge [
-    source 3174
-    target 3861
-    weight 37
-  ]
-  edge [
-    source 3174
-    target 4007
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 3177
-    weight 105
-  ]
-  edge [
-    source 3174
-    target 3677
-    weight 51
-  ]
-  edge [
-    source 3174
-    target 3856
-    weight 30
-  ]
-  edge [
-    source 3174
-    target 3432
-    weight 51
-  ]
-  edge [
-    source 3174
-    target 3357
-    weight 33
-  ]
-  edge [
-    source 3174
-    target 3559
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 3872
-    weight 34
-  ]
-  edge [
-    source 3174
-    target 3633
-    weight 27
-  ]
-  edge [
-    source 3174
-    target 3876
-    weight 33
-  ]
-  edge [
-    source 3177
-    target 3600
-    weight 128
-  ]
-  edge [
-    source 3177
-    target 3521
-    weight 210
-  ]
-  edge [
-    source 3177
-    target 3937
-    weight 30
-  ]
-  edge [
-    source 3177
-    target 3423
-    weight 88
-  ]
-  edge [
-    source 3177
-    target 3443
-    weight 46
-  ]
-  edge [
-    source 3177
-    target 4051
-    weight 154
-  ]
-  edge [
-    source 3177
-    target 3642
-    weight 64
-  ]
-  edge [
-    source 3177
-    target 3282
-    weight 64
-  ]
-  edge [
-    source 3177
-    target 3276
-    weight 110
-  ]
-  edge [
-    source 3177
-    target 3917
-    weight 75
-  ]
-  edge [
-    source 3177
-    target 3636
-    weight 42
-  ]
-  edge [
-    source 3177
-    target 3962
-    weight 61
-  ]
-  edge [
-    source 3177
-    target 3993
-    weight 126
-  ]
-  edge [
-    source 3177
-    target 3420
-    weight 41
-  ]
-  edge [
-    source 3177
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 3177
-    target 3954
-    weight 47
-  ]
-  edge [
-    source 3177
-    target 3374
-    weight 52
-  ]
-  edge [
-    source 3177
-    target 3253
-    weight 31
-  ]
-  edge [
-    source 3177
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 3177
-    target 3565
-    weight 49
-  ]
-  edge [
-    source 3196
-    target 3600
-    weight 61
-  ]
-  edge [
-    source 3196
-    target 3521
-    weight 109
-  ]
-  edge [
-    source 3196
-    target 3642
-    weight 43
-  ]
-  edge [
-    source 3196
-    target 3993
-    weight 46
-  ]
-  edge [
-    source 3196
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 3196
-    target 3253
-    weight 39
-  ]
-  edge [
-    source 3196
-    target 4051
-    weight 87
-  ]
-  edge [
-    source 3196
-    target 3295
-    weight 38
-  ]
-  edge [
-    source 3196
-    target 3917
-    weight 35
-  ]
-  edge [
-    source 3196
-    target 3542
-    weight 44
-  ]
-  edge [
-    source 3196
-    target 3954
-    weight 32
-  ]
-  edge [
-    source 3196
-    target 3443
-    weight 26
-  ]
-  edge [
-    source 3196
-    target 3282
-    weight 33
-  ]
-  edge [
-    source 3196
-    target 3276
-    weight 55
-  ]
-  edge [
-    source 3196
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 3196
-    target 3423
-    weight 29
-  ]
-  edge [
-    source 3210
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 3222
-    target 3521
-    weight 26
-  ]
-  edge [
-    source 3253
-    target 4051
-    weight 490
-  ]
-  edge [
-    source 3253
-    target 3521
-    weight 637
-  ]
-  edge [
-    source 3253
-    target 3565
-    weight 134
-  ]
-  edge [
-    source 3253
-    target 3993
-    weight 253
-  ]
-  edge [
-    source 3253
-    target 3600
-    weight 319
-  ]
-  edge [
-    source 3253
-    target 3282
-    weight 197
-  ]
-  edge [
-    source 3253
-    target 3542
-    weight 227
-  ]
-  edge [
-    source 3253
-    target 3917
-    weight 224
-  ]
-  edge [
-    source 3253
-    target 3636
-    weight 146
-  ]
-  edge [
-    source 3253
-    target 3847
-    weight 57
-  ]
-  edge [
-    source 3253
-    target 3937
-    weight 34
-  ]
-  edge [
-    source 3253
-    target 3423
-    weight 115
-  ]
-  edge [
-    source 3253
-    target 3276
-    weight 310
-  ]
-  edge [
-    source 3253
-    target 3642
-    weight 220
-  ]
-  edge [
-    source 3253
-    target 3954
-    weight 122
-  ]
-  edge [
-    source 3253
-    target 3295
-    weight 102
-  ]
-  edge [
-    source 3253
-    target 3443
-    weight 115
-  ]
-  edge [
-    source 3253
-    target 3432
-    weight 26
-  ]
-  edge [
-    source 3253
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 3253
-    target 3884
-    weight 43
-  ]
-  edge [
-    source 3253
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 3253
-    target 3420
-    weight 83
-  ]
-  edge [
-    source 3253
-    target 4154
-    weight 118
-  ]
-  edge [
-    source 3253
-    target 3968
-    weight 27
-  ]
-  edge [
-    source 3253
-    target 3962
-    weight 88
-  ]
-  edge [
-    source 3253
-    target 3408
-    weight 22
-  ]
-  edge [
-    source 3253
-    target 3374
-    weight 106
-  ]
-  edge [
-    source 3253
-    target 3377
-    weight 41
-  ]
-  edge [
-    source 3253
-    target 4040
-    weight 32
-  ]
-  edge [
-    source 3253
-    target 4187
-    weight 21
-  ]
-  edge [
-    source 3253
-    target 3877
-    weight 29
-  ]
-  edge [
-    source 3253
-    target 4162
-    weight 50
-  ]
-  edge [
-    source 3276
-    target 3521
-    weight 5618
-  ]
-  edge [
-    source 3276
-    target 3600
-    weight 3163
-  ]
-  edge [
-    source 3276
-    target 3565
-    weight 753
-  ]
-  edge [
-    source 3276
-    target 3374
-    weight 579
-  ]
-  edge [
-    source 3276
-    target 4051
-    weight 4170
-  ]
-  edge [
-    source 3276
-    target 3423
-    weight 900
-  ]
-  edge [
-    source 3276
-    target 3641
-    weight 56
-  ]
-  edge [
-    source 3276
-    target 3642
-    weight 1294
-  ]
-  edge [
-    source 3276
-    target 3420
-    weight 297
-  ]
-  edge [
-    source 3276
-    target 3917
-    weight 1200
-  ]
-  edge [
-    source 3276
-    target 4187
-    weight 80
-  ]
-  edge [
-    source 3276
-    target 3542
-    weight 583
-  ]
-  edge [
-    source 3276
-    target 3993
-    weight 1906
-  ]
-  edge [
-    source 3276
-    target 3937
-    weight 129
-  ]
-  edge [
-    source 3276
-    target 3282
-    weight 810
-  ]
-  edge [
-    source 3276
-    target 3968
-    weight 48
-  ]
-  edge [
-    source 3276
-    target 3443
-    weight 587
-  ]
-  edge [
-    source 3276
-    target 3377
-    weight 121
-  ]
-  edge [
-    source 3276
-    target 3962
-    weight 447
-  ]
-  edge [
-    source 3276
-    target 3636
-    weight 402
-  ]
-  edge [
-    source 3276
-    target 4027
-    weight 45
-  ]
-  edge [
-    source 3276
-    target 3985
-    weight 31
-  ]
-  edge [
-    source 3276
-    target 4098
-    weight 51
-  ]
-  edge [
-    source 3276
-    target 4154
-    weight 537
-  ]
-  edge [
-    source 3276
-    target 3935
-    weight 34
-  ]
-  edge [
-    source 3276
-    target 3954
-    weight 440
-  ]
-  edge [
-    source 3276
-    target 3295
-    weight 239
-  ]
-  edge [
-    source 3276
-    target 3847
-    weight 114
-  ]
-  edge [
-    source 3276
-    target 4152
-    weight 57
-  ]
-  edge [
-    source 3276
-    target 3408
-    weight 130
-  ]
-  edge [
-    source 3276
-    target 3440
-    weight 22
-  ]
-  edge [
-    source 3276
-    target 4040
-    weight 122
-  ]
-  edge [
-    source 3276
-    target 4162
-    weight 165
-  ]
-  edge [
-    source 3276
-    target 3861
-    weight 37
-  ]
-  edge [
-    source 3276
-    target 3877
-    weight 156
-  ]
-  edge [
-    source 3276
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 3276
-    target 4160
-    weight 36
-  ]
-  edge [
-    source 3276
-    target 3884
-    weight 62
-  ]
-  edge [
-    source 3276
-    target 3432
-    weight 55
-  ]
-  edge [
-    source 3276
-    target 3677
-    weight 53
-  ]
-  edge [
-    source 3276
-    target 3872
-    weight 36
-  ]
-  edge [
-    source 3276
-    target 3357
-    weight 28
-  ]
-  edge [
-    source 3276
-    target 3737
-    weight 32
-  ]
-  edge [
-    source 3276
-    target 3633
-    weight 35
-  ]
-  edge [
-    source 3276
-    target 3876
-    weight 35
-  ]
-  edge [
-    source 3282
-    target 3521
-    weight 1562
-  ]
-  edge [
-    source 3282
-    target 4051
-    weight 1200
-  ]
-  edge [
-    source 3282
-    target 3600
-    weight 901
-  ]
-  edge [
-    source 3282
-    target 3565
-    weight 404
-  ]
-  edge [
-    source 3282
-    target 3642
-    weight 483
-  ]
-  edge [
-    source 3282
-    target 3420
-    weight 239
-  ]
-  edge [
-    source 3282
-    target 3443
-    weight 325
-  ]
-  edge [
-    source 3282
-    target 3542
-    weight 418
-  ]
-  edge [
-    source 3282
-    target 3917
-    weight 540
-  ]
-  edge [
-    source 3282
-    target 3993
-    weight 748
-  ]
-  edge [
-    source 3282
-    target 3636
-    weight 298
-  ]
-  edge [
-    source 3282
-    target 4154
-    weight 299
-  ]
-  edge [
-    source 3282
-    target 3847
-    weight 123
-  ]
-  edge [
-    source 3282
-    target 3985
-    weight 34
-  ]
-  edge [
-    source 3282
-    target 3968
-    weight 38
-  ]
-  edge [
-    source 3282
-    target 3374
-    weight 244
-  ]
-  edge [
-    source 3282
-    target 3423
-    weight 303
-  ]
-  edge [
-    source 3282
-    target 4040
-    weight 88
-  ]
-  edge [
-    source 3282
-    target 4152
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3884
-    weight 65
-  ]
-  edge [
-    source 3282
-    target 3954
-    weight 315
-  ]
-  edge [
-    source 3282
-    target 3377
-    weight 71
-  ]
-  edge [
-    source 3282
-    target 4162
-    weight 113
-  ]
-  edge [
-    source 3282
-    target 3935
-    weight 28
-  ]
-  edge [
-    source 3282
-    target 3937
-    weight 99
-  ]
-  edge [
-    source 3282
-    target 4027
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3295
-    weight 139
-  ]
-  edge [
-    source 3282
-    target 3860
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3962
-    weight 199
-  ]
-  edge [
-    source 3282
-    target 4160
-    weight 26
-  ]
-  edge [
-    source 3282
-    target 4187
-    weight 37
-  ]
-  edge [
-    source 3282
-    target 3677
-    weight 30
-  ]
-  edge [
-    source 3282
-    target 3432
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3641
-    weight 30
-  ]
-  edge [
-    source 3282
-    target 3877
-    weight 65
-  ]
-  edge [
-    source 3282
-    target 3408
-    weight 35
-  ]
-  edge [
-    source 3282
-    target 4098
-    weight 25
-  ]
-  edge [
-    source 3295
-    target 4051
-    weight 438
-  ]
-  edge [
-    source 3295
-    target 3521
-    weight 596
-  ]
-  edge [
-    source 3295
-    target 3565
-    weight 111
-  ]
-  edge [
-    source 3295
-    target 3642
-    weight 241
-  ]
-  edge [
-    source 3295
-    target 3954
-    weight 96
-  ]
-  edge [
-    source 3295
-    target 3636
-    weight 92
-  ]
-  edge [
-    source 3295
-    target 3443
-    weight 111
-  ]
-  edge [
-    source 3295
-    target 3847
-    weight 45
-  ]
-  edge [
-    source 3295
-    target 3600
-    weight 245
-  ]
-  edge [
-    source 3295
-    target 3917
-    weight 147
-  ]
-  edge [
-    source 3295
-    target 4162
-    weight 40
-  ]
-  edge [
-    source 3295
-    target 3993
-    weight 195
-  ]
-  edge [
-    source 3295
-    target 3542
-    weight 172
-  ]
-  edge [
-    source 3295
-    target 3423
-    weight 104
-  ]
-  edge [
-    source 3295
-    target 3374
-    weight 73
-  ]
-  edge [
-    source 3295
-    target 3884
-    weight 24
-  ]
-  edge [
-    source 3295
-    target 3377
-    weight 35
-  ]
-  edge [
-    source 3295
-    target 4154
-    weight 120
-  ]
-  edge [
-    source 3295
-    target 3420
-    weight 56
-  ]
-  edge [
-    source 3295
-    target 3962
-    weight 66
-  ]
-  edge [
-    source 3295
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 3295
-    target 3877
-    weight 22
-  ]
-  edge [
-    source 3309
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 3309
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 3324
-    target 3521
-    weight 38
-  ]
-  edge [
-    source 3324
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 3357
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 3357
-    target 3374
-    weight 38
-  ]
-  edge [
-    source 3357
-    target 4051
-    weight 71
-  ]
-  edge [
-    source 3357
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 3357
-    target 3600
-    weight 41
-  ]
-  edge [
-    source 3357
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 3357
-    target 3423
-    weight 46
-  ]
-  edge [
-    source 3374
-    target 4187
-    weight 60
-  ]
-  edge [
-    source 3374
-    target 3600
-    weight 658
-  ]
-  edge [
-    source 3374
-    target 3565
-    weight 210
-  ]
-  edge [
-    source 3374
-    target 3521
-    weight 1321
-  ]
-  edge [
-    source 3374
-    target 4051
-    weight 928
-  ]
-  edge [
-    source 3374
-    target 3423
-    weight 436
-  ]
-  edge [
-    source 3374
-    target 3641
-    weight 44
-  ]
-  edge [
-    source 3374
-    target 3937
-    weight 80
-  ]
-  edge [
-    source 3374
-    target 3642
-    weight 302
-  ]
-  edge [
-    source 3374
-    target 3917
-    weight 379
-  ]
-  edge [
-    source 3374
-    target 3968
-    weight 32
-  ]
-  edge [
-    source 3374
-    target 3993
-    weight 546
-  ]
-  edge [
-    source 3374
-    target 3636
-    weight 152
-  ]
-  edge [
-    source 3374
-    target 4098
-    weight 21
-  ]
-  edge [
-    source 3374
-    target 3420
-    weight 124
-  ]
-  edge [
-    source 3374
-    target 3954
-    weight 168
-  ]
-  edge [
-    source 3374
-    target 3443
-    weight 179
-  ]
-  edge [
-    source 3374
-    target 3408
-    weight 154
-  ]
-  edge [
-    source 3374
-    target 3542
-    weight 201
-  ]
-  edge [
-    source 3374
-    target 3377
-    weight 46
-  ]
-  edge [
-    source 3374
-    target 4027
-    weight 34
-  ]
-  edge [
-    source 3374
-    target 3884
-    weight 32
-  ]
-  edge [
-    source 3374
-    target 3962
-    weight 171
-  ]
-  edge [
-    source 3374
-    target 4154
-    weight 147
-  ]
-  edge [
-    source 3374
-    target 4162
-    weight 67
-  ]
-  edge [
-    source 3374
-    target 3677
-    weight 22
-  ]
-  edge [
-    source 3374
-    target 3432
-    weight 30
-  ]
-  edge [
-    source 3374
-    target 4040
-    weight 50
-  ]
-  edge [
-    source 3374
-    target 4160
-    weight 24
-  ]
-  edge [
-    source 3374
-    target 3877
-    weight 59
-  ]
-  edge [
-    source 3374
-    target 3847
-    weight 33
-  ]
-  edge [
-    source 3375
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 3375
-    target 4051
-    weight 24
-  ]
-  edge [
-    source 3377
-    target 3521
-    weight 252
-  ]
-  edge [
-    source 3377
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 3377
-    target 4051
-    weight 200
-  ]
-  edge [
-    source 3377
-    target 3600
-    weight 117
-  ]
-  edge [
-    source 3377
-    target 3962
-    weight 43
-  ]
-  edge [
-    source 3377
-    target 3565
-    weight 50
-  ]
-  edge [
-    source 3377
-    target 3443
-    weight 40
-  ]
-  edge [
-    source 3377
-    target 3993
-    weight 95
-  ]
-  edge [
-    source 3377
-    target 3420
-    weight 35
-  ]
-  edge [
-    source 3377
-    target 3954
-    weight 63
-  ]
-  edge [
-    source 3377
-    target 4162
-    weight 26
-  ]
-  edge [
-    source 3377
-    target 4154
-    weight 38
-  ]
-  edge [
-    source 3377
-    target 3917
-    weight 82
-  ]
-  edge [
-    source 3377
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 3377
-    target 3636
-    weight 42
-  ]
-  edge [
-    source 3377
-    target 3423
-    weight 53
-  ]
-  edge [
-    source 3392
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 3408
-    target 3521
-    weight 349
-  ]
-  edge [
-    source 3408
-    target 4051
-    weight 238
-  ]
-  edge [
-    source 3408
-    target 3600
-    weight 177
-  ]
-  edge [
-    source 3408
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 3408
-    target 3565
-    weight 28
-  ]
-  edge [
-    source 3408
-    target 3993
-    weight 135
-  ]
-  edge [
-    source 3408
-    target 3917
-    weight 76
-  ]
-  edge [
-    source 3408
-    target 3962
-    weight 57
-  ]
-  edge [
-    source 3408
-    target 3443
-    weight 32
-  ]
-  edge [
-    source 3408
-    target 3423
-    weight 141
-  ]
-  edge [
-    source 3408
-    target 3954
-    weight 24
-  ]
-  edge [
-    source 3408
-    target 4154
-    weight 24
-  ]
-  edge [
-    source 3408
-    target 3642
-    weight 52
-  ]
-  edge [
-    source 3408
-    target 3542
-    weight 35
-  ]
-  edge [
-    source 3420
-    target 3521
-    weight 619
-  ]
-  edge [
-    source 3420
-    target 3600
-    weight 367
-  ]
-  edge [
-    source 3420
-    target 3641
-    weight 28
-  ]
-  edge [
-    source 3420
-    target 3642
-    weight 207
-  ]
-  edge [
-    source 3420
-    target 3917
-    weight 236
-  ]
-  edge [
-    source 3420
-    target 4051
-    weight 489
-  ]
-  edge [
-    source 3420
-    target 3565
-    weight 193
-  ]
-  edge [
-    source 3420
-    target 3423
-    weight 138
-  ]
-  edge [
-    source 3420
-    target 3542
-    weight 160
-  ]
-  edge [
-    source 3420
-    target 3993
-    weight 296
-  ]
-  edge [
-    source 3420
-    target 3432
-    weight 22
-  ]
-  edge [
-    source 3420
-    target 3985
-    weight 22
-  ]
-  edge [
-    source 3420
-    target 4027
-    weight 21
-  ]
-  edge [
-    source 3420
-    target 3636
-    weight 149
-  ]
-  edge [
-    source 3420
-    target 3954
-    weight 129
-  ]
-  edge [
-    source 3420
-    target 3443
-    weight 143
-  ]
-  edge [
-    source 3420
-    target 3847
-    weight 59
-  ]
-  edge [
-    source 3420
-    target 4154
-    weight 133
-  ]
-  edge [
-    source 3420
-    target 4162
-    weight 53
-  ]
-  edge [
-    source 3420
-    target 3937
-    weight 54
-  ]
-  edge [
-    source 3420
-    target 3962
-    weight 107
-  ]
-  edge [
-    source 3420
-    target 3884
-    weight 34
-  ]
-  edge [
-    source 3420
-    target 3877
-    weight 44
-  ]
-  edge [
-    source 3420
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 3420
-    target 4152
-    weight 21
-  ]
-  edge [
-    source 3420
-    target 4187
-    weight 27
-  ]
-  edge [
-    source 3423
-    target 3600
-    weight 1245
-  ]
-  edge [
-    source 3423
-    target 4051
-    weight 1671
-  ]
-  edge [
-    source 3423
-    target 3521
-    weight 2415
-  ]
-  edge [
-    source 3423
-    target 3565
-    weight 283
-  ]
-  edge [
-    source 3423
-    target 3642
-    weight 474
-  ]
-  edge [
-    source 3423
-    target 4187
-    weight 64
-  ]
-  edge [
-    source 3423
-    target 3641
-    weight 51
-  ]
-  edge [
-    source 3423
-    target 3432
-    weight 32
-  ]
-  edge [
-    source 3423
-    target 3937
-    weight 159
-  ]
-  edge [
-    source 3423
-    target 3861
-    weight 64
-  ]
-  edge [
-    source 3423
-    target 3993
-    weight 1044
-  ]
-  edge [
-    source 3423
-    target 3968
-    weight 38
-  ]
-  edge [
-    source 3423
-    target 3443
-    weight 235
-  ]
-  edge [
-    source 3423
-    target 4098
-    weight 29
-  ]
-  edge [
-    source 3423
-    target 3917
-    weight 541
-  ]
-  edge [
-    source 3423
-    target 3954
-    weight 217
-  ]
-  edge [
-    source 3423
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 3423
-    target 3636
-    weight 182
-  ]
-  edge [
-    source 3423
-    target 3693
-    weight 35
-  ]
-  edge [
-    source 3423
-    target 3962
-    weight 363
-  ]
-  edge [
-    source 3423
-    target 4152
-    weight 31
-  ]
-  edge [
-    source 3423
-    target 4162
-    weight 94
-  ]
-  edge [
-    source 3423
-    target 4154
-    weight 235
-  ]
-  edge [
-    source 3423
-    target 4040
-    weight 72
-  ]
-  edge [
-    source 3423
-    target 3860
-    weight 30
-  ]
-  edge [
-    source 3423
-    target 3542
-    weight 260
-  ]
-  edge [
-    source 3423
-    target 3847
-    weight 44
-  ]
-  edge [
-    source 3423
-    target 4027
-    weight 31
-  ]
-  edge [
-    source 3423
-    target 3877
-    weight 66
-  ]
-  edge [
-    source 3423
-    target 3677
-    weight 29
-  ]
-  edge [
-    source 3423
-    target 3876
-    weight 21
-  ]
-  edge [
-    source 3432
-    target 3600
-    weight 63
-  ]
-  edge [
-    source 3432
-    target 3521
-    weight 110
-  ]
-  edge [
-    source 3432
-    target 3565
-    weight 29
-  ]
-  edge [
-    source 3432
-    target 3443
-    weight 25
-  ]
-  edge [
-    source 3432
-    target 3642
-    weight 44
-  ]
-  edge [
-    source 3432
-    target 4051
-    weight 90
-  ]
-  edge [
-    source 3432
-    target 3954
-    weight 28
-  ]
-  edge [
-    source 3432
-    target 3542
-    weight 26
-  ]
-  edge [
-    source 3432
-    target 3917
-    weight 60
-  ]
-  edge [
-    source 3432
-    target 3993
-    weight 60
-  ]
-  edge [
-    source 3432
-    target 3962
-    weight 21
-  ]
-  edge [
-    source 3432
-    target 3636
-    weight 32
-  ]
-  edge [
-    source 3437
-    target 3521
-    weight 46
-  ]
-  edge [
-    source 3440
-    target 3521
-    weight 40
-  ]
-  edge [
-    source 3440
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 3440
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 3440
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 3443
-    target 3521
-    weight 1023
-  ]
-  edge [
-    source 3443
-    target 3565
-    weight 232
-  ]
-  edge [
-    source 3443
-    target 3600
-    weight 609
-  ]
-  edge [
-    source 3443
-    target 3642
-    weight 342
-  ]
-  edge [
-    source 3443
-    target 3542
-    weight 239
-  ]
-  edge [
-    source 3443
-    target 3993
-    weight 503
-  ]
-  edge [
-    source 3443
-    target 3917
-    weight 397
-  ]
-  edge [
-    source 3443
-    target 4051
-    weight 785
-  ]
-  edge [
-    source 3443
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 3443
-    target 3937
-    weight 57
-  ]
-  edge [
-    source 3443
-    target 3636
-    weight 165
-  ]
-  edge [
-    source 3443
-    target 4187
-    weight 42
-  ]
-  edge [
-    source 3443
-    target 4040
-    weight 67
-  ]
-  edge [
-    source 3443
-    target 3954
-    weight 165
-  ]
-  edge [
-    source 3443
-    target 4154
-    weight 187
-  ]
-  edge [
-    source 3443
-    target 3884
-    weight 37
-  ]
-  edge [
-    source 3443
-    target 3962
-    weight 151
-  ]
-  edge [
-    source 3443
-    target 4162
-    weight 57
-  ]
-  edge [
-    source 3443
-    target 3847
-    weight 61
-  ]
-  edge [
-    source 3443
-    target 3860
-    weight 31
-  ]
-  edge [
-    source 3443
-    target 3641
-    weight 27
-  ]
-  edge [
-    source 3443
-    target 3677
-    weight 23
-  ]
-  edge [
-    source 3443
-    target 3877
-    weight 44
-  ]
-  edge [
-    source 3462
-    target 3521
-    weight 64
-  ]
-  edge [
-    source 3462
-    target 4051
-    weight 51
-  ]
-  edge [
-    source 3462
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 3465
-    target 3521
-    weight 30
-  ]
-  edge [
-    source 3465
-    target 4051
-    weight 24
-  ]
-  edge [
-    source 3521
-    target 3565
-    weight 2951
-  ]
-  edge [
-    source 3521
-    target 3600
-    weight 9323
-  ]
-  edge [
-    source 3521
-    target 3642
-    weight 3748
-  ]
-  edge [
-    source 3521
-    target 3641
-    weight 126
-  ]
-  edge [
-    source 3521
-    target 4051
-    weight 19009
-  ]
-  edge [
-    source 3521
-    target 3937
-    weight 273
-  ]
-  edge [
-    source 3521
-    target 4187
-    weight 156
-  ]
-  edge [
-    source 3521
-    target 3917
-    weight 2166
-  ]
-  edge [
-    source 3521
-    target 3985
-    weight 133
-  ]
-  edge [
-    source 3521
-    target 3968
-    weight 146
-  ]
-  edge [
-    source 3521
-    target 3962
-    weight 1102
-  ]
-  edge [
-    source 3521
-    target 3849
-    weight 28
-  ]
-  edge [
-    source 3521
-    target 3861
-    weight 86
-  ]
-  edge [
-    source 3521
-    target 3993
-    weight 4016
-  ]
-  edge [
-    source 3521
-    target 3542
-    weight 1295
-  ]
-  edge [
-    source 3521
-    target 3693
-    weight 73
-  ]
-  edge [
-    source 3521
-    target 3752
-    weight 28
-  ]
-  edge [
-    source 3521
-    target 4027
-    weight 113
-  ]
-  edge [
-    source 3521
-    target 3636
-    weight 922
-  ]
-  edge [
-    source 3521
-    target 4152
-    weight 123
-  ]
-  edge [
-    source 3521
-    target 3954
-    weight 995
-  ]
-  edge [
-    source 3521
-    target 3773
-    weight 24
-  ]
-  edge [
-    source 3521
-    target 3860
-    weight 94
-  ]
-  edge [
-    source 3521
-    target 3559
-    weight 49
-  ]
-  edge [
-    source 3521
-    target 4098
-    weight 98
-  ]
-  edge [
-    source 3521
-    target 4040
-    weight 267
-  ]
-  edge [
-    source 3521
-    target 4154
-    weight 1397
-  ]
-  edge [
-    source 3521
-    target 3884
-    weight 148
-  ]
-  edge [
-    source 3521
-    target 3847
-    weight 320
-  ]
-  edge [
-    source 3521
-    target 3935
-    weight 73
-  ]
-  edge [
-    source 3521
-    target 4160
-    weight 116
-  ]
-  edge [
-    source 3521
-    target 4007
-    weight 50
-  ]
-  edge [
-    source 3521
-    target 3952
-    weight 35
-  ]
-  edge [
-    source 3521
-    target 3877
-    weight 299
-  ]
-  edge [
-    source 3521
-    target 4100
-    weight 43
-  ]
-  edge [
-    source 3521
-    target 3956
-    weight 58
-  ]
-  edge [
-    source 3521
-    target 3772
-    weight 23
-  ]
-  edge [
-    source 3521
-    target 4162
-    weight 411
-  ]
-  edge [
-    source 3521
-    target 3674
-    weight 24
-  ]
-  edge [
-    source 3521
-    target 3663
-    weight 29
-  ]
-  edge [
-    source 3521
-    target 3692
-    weight 35
-  ]
-  edge [
-    source 3521
-    target 4081
-    weight 22
-  ]
-  edge [
-    source 3521
-    target 3677
-    weight 88
-  ]
-  edge [
-    source 3521
-    target 3856
-    weight 32
-  ]
-  edge [
-    source 3521
-    target 3633
-    weight 67
-  ]
-  edge [
-    source 3521
-    target 3872
-    weight 62
-  ]
-  edge [
-    source 3521
-    target 3737
-    weight 45
-  ]
-  edge [
-    source 3521
-    target 3876
-    weight 56
-  ]
-  edge [
-    source 3542
-    target 3600
-    weight 661
-  ]
-  edge [
-    source 3542
-    target 3917
-    weight 412
-  ]
-  edge [
-    source 3542
-    target 3641
-    weight 33
-  ]
-  edge [
-    source 3542
-    target 3642
-    weight 385
-  ]
-  edge [
-    source 3542
-    target 3993
-    weight 550
-  ]
-  edge [
-    source 3542
-    target 3937
-    weight 70
-  ]
-  edge [
-    source 3542
-    target 4051
-    weight 1039
-  ]
-  edge [
-    source 3542
-    target 3565
-    weight 298
-  ]
-  edge [
-    source 3542
-    target 3636
-    weight 250
-  ]
-  edge [
-    source 3542
-    target 4027
-    weight 28
-  ]
-  edge [
-    source 3542
-    target 3968
-    weight 28
-  ]
-  edge [
-    source 3542
-    target 3847
-    weight 103
-  ]
-  edge [
-    source 3542
-    target 3962
-    weight 149
-  ]
-  edge [
-    source 3542
-    target 3954
-    weight 236
-  ]
-  edge [
-    source 3542
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 3542
-    target 3884
-    weight 53
-  ]
-  edge [
-    source 3542
-    target 4154
-    weight 289
-  ]
-  edge [
-    source 3542
-    target 4162
-    weight 94
-  ]
-  edge [
-    source 3542
-    target 4040
-    weight 68
-  ]
-  edge [
-    source 3542
-    target 4098
-    weight 22
-  ]
-  edge [
-    source 3542
-    target 3985
-    weight 23
-  ]
-  edge [
-    source 3542
-    target 4160
-    weight 27
-  ]
-  edge [
-    source 3542
-    target 3677
-    weight 34
-  ]
-  edge [
-    source 3542
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 3542
-    target 4187
-    weight 30
-  ]
-  edge [
-    source 3542
-    target 3860
-    weight 32
-  ]
-  edge [
-    source 3542
-    target 3877
-    weight 57
-  ]
-  edge [
-    source 3559
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 3559
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 3565
-    target 3600
-    weight 1219
-  ]
-  edge [
-    source 3565
-    target 3642
-    weight 635
-  ]
-  edge [
-    source 3565
-    target 4051
-    weight 1755
-  ]
-  edge [
-    source 3565
-    target 3962
-    weight 207
-  ]
-  edge [
-    source 3565
-    target 3937
-    weight 64
-  ]
-  edge [
-    source 3565
-    target 3641
-    weight 37
-  ]
-  edge [
-    source 3565
-    target 3993
-    weight 639
-  ]
-  edge [
-    source 3565
-    target 3968
-    weight 40
-  ]
-  edge [
-    source 3565
-    target 3985
-    weight 45
-  ]
-  edge [
-    source 3565
-    target 3636
-    weight 264
-  ]
-  edge [
-    source 3565
-    target 3917
-    weight 414
-  ]
-  edge [
-    source 3565
-    target 4027
-    weight 21
-  ]
-  edge [
-    source 3565
-    target 3847
-    weight 137
-  ]
-  edge [
-    source 3565
-    target 3935
-    weight 29
-  ]
-  edge [
-    source 3565
-    target 3954
-    weight 252
-  ]
-  edge [
-    source 3565
-    target 4040
-    weight 78
-  ]
-  edge [
-    source 3565
-    target 4154
-    weight 247
-  ]
-  edge [
-    source 3565
-    target 3884
-    weight 42
-  ]
-  edge [
-    source 3565
-    target 4187
-    weight 28
-  ]
-  edge [
-    source 3565
-    target 4152
-    weight 25
-  ]
-  edge [
-    source 3565
-    target 4162
-    weight 85
-  ]
-  edge [
-    source 3565
-    target 3860
-    weight 27
-  ]
-  edge [
-    source 3565
-    target 4160
-    weight 28
-  ]
-  edge [
-    source 3565
-    target 3877
-    weight 53
-  ]
-  edge [
-    source 3600
-    target 3641
-    weight 75
-  ]
-  edge [
-    source 3600
-    target 4051
-    weight 6014
-  ]
-  edge [
-    source 3600
-    target 3642
-    weight 1625
-  ]
-  edge [
-    source 3600
-    target 3937
-    weight 193
-  ]
-  edge [
-    source 3600
-    target 4187
-    weight 101
-  ]
-  edge [
-    source 3600
-    target 3917
-    weight 1298
-  ]
-  edge [
-    source 3600
-    target 3993
-    weight 2510
-  ]
-  edge [
-    source 3600
-    target 3968
-    weight 57
-  ]
-  edge [
-    source 3600
-    target 3693
-    weight 25
-  ]
-  edge [
-    source 3600
-    target 4027
-    weight 54
-  ]
-  edge [
-    source 3600
-    target 4152
-    weight 70
-  ]
-  edge [
-    source 3600
-    target 3985
-    weight 44
-  ]
-  edge [
-    source 3600
-    target 3962
-    weight 595
-  ]
-  edge [
-    source 3600
-    target 3636
-    weight 448
-  ]
-  edge [
-    source 3600
-    target 3954
-    weight 488
-  ]
-  edge [
-    source 3600
-    target 4098
-    weight 57
-  ]
-  edge [
-    source 3600
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 3600
-    target 4154
-    weight 704
-  ]
-  edge [
-    source 3600
-    target 3847
-    weight 149
-  ]
-  edge [
-    source 3600
-    target 4100
-    weight 23
-  ]
-  edge [
-    source 3600
-    target 4162
-    weight 213
-  ]
-  edge [
-    source 3600
-    target 3884
-    weight 69
-  ]
-  edge [
-    source 3600
-    target 4040
-    weight 146
-  ]
-  edge [
-    source 3600
-    target 3956
-    weight 24
-  ]
-  edge [
-    source 3600
-    target 3861
-    weight 41
-  ]
-  edge [
-    source 3600
-    target 3935
-    weight 36
-  ]
-  edge [
-    source 3600
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 3600
-    target 4160
-    weight 53
-  ]
-  edge [
-    source 3600
-    target 3677
-    weight 60
-  ]
-  edge [
-    source 3600
-    target 3872
-    weight 38
-  ]
-  edge [
-    source 3600
-    target 3877
-    weight 170
-  ]
-  edge [
-    source 3600
-    target 3737
-    weight 31
-  ]
-  edge [
-    source 3600
-    target 3633
-    weight 44
-  ]
-  edge [
-    source 3600
-    target 3876
-    weight 40
-  ]
-  edge [
-    source 3633
-    target 3993
-    weight 30
-  ]
-  edge [
-    source 3633
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 3633
-    target 4051
-    weight 55
-  ]
-  edge [
-    source 3633
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 3636
-    target 3968
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 3985
-    weight 24
-  ]
-  edge [
-    source 3636
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 4051
-    weight 672
-  ]
-  edge [
-    source 3636
-    target 3917
-    weight 283
-  ]
-  edge [
-    source 3636
-    target 3993
-    weight 386
-  ]
-  edge [
-    source 3636
-    target 3937
-    weight 63
-  ]
-  edge [
-    source 3636
-    target 3642
-    weight 293
-  ]
-  edge [
-    source 3636
-    target 4187
-    weight 28
-  ]
-  edge [
-    source 3636
-    target 4154
-    weight 181
-  ]
-  edge [
-    source 3636
-    target 3847
-    weight 82
-  ]
-  edge [
-    source 3636
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 3954
-    weight 177
-  ]
-  edge [
-    source 3636
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 3636
-    target 3884
-    weight 54
-  ]
-  edge [
-    source 3636
-    target 4040
-    weight 79
-  ]
-  edge [
-    source 3636
-    target 4160
-    weight 23
-  ]
-  edge [
-    source 3636
-    target 3962
-    weight 127
-  ]
-  edge [
-    source 3636
-    target 4162
-    weight 67
-  ]
-  edge [
-    source 3636
-    target 3860
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 3877
-    weight 43
-  ]
-  edge [
-    source 3641
-    target 3642
-    weight 40
-  ]
-  edge [
-    source 3641
-    target 3917
-    weight 50
-  ]
-  edge [
-    source 3641
-    target 4051
-    weight 87
-  ]
-  edge [
-    source 3641
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 3641
-    target 3962
-    weight 40
-  ]
-  edge [
-    source 3642
-    target 3917
-    weight 645
-  ]
-  edge [
-    source 3642
-    target 4051
-    weight 2813
-  ]
-  edge [
-    source 3642
-    target 3985
-    weight 31
-  ]
-  edge [
-    source 3642
-    target 3993
-    weight 923
-  ]
-  edge [
-    source 3642
-    target 4027
-    weight 36
-  ]
-  edge [
-    source 3642
-    target 3962
-    weight 243
-  ]
-  edge [
-    source 3642
-    target 3968
-    weight 41
-  ]
-  edge [
-    source 3642
-    target 3954
-    weight 392
-  ]
-  edge [
-    source 3642
-    target 3884
-    weight 56
-  ]
-  edge [
-    source 3642
-    target 3847
-    weight 123
-  ]
-  edge [
-    source 3642
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 3642
-    target 3937
-    weight 78
-  ]
-  edge [
-    source 3642
-    target 4187
-    weight 40
-  ]
-  edge [
-    source 3642
-    target 4040
-    weight 79
-  ]
-  edge [
-    source 3642
-    target 4154
-    weight 383
-  ]
-  edge [
-    source 3642
-    target 4152
-    weight 39
-  ]
-  edge [
-    source 3642
-    target 3860
-    weight 43
-  ]
-  edge [
-    source 3642
-    target 4162
-    weight 129
-  ]
-  edge [
-    source 3642
-    target 4160
-    weight 30
-  ]
-  edge [
-    source 3642
-    target 3877
-    weight 88
-  ]
-  edge [
-    source 3642
-    target 4098
-    weight 30
-  ]
-  edge [
-    source 3642
-    target 3677
-    weight 27
-  ]
-  edge [
-    source 3674
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 3677
-    target 3993
-    weight 45
-  ]
-  edge [
-    source 3677
-    target 4051
-    weight 76
-  ]
-  edge [
-    source 3677
-    target 3917
-    weight 42
-  ]
-  edge [
-    source 3692
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 3693
-    target 4051
-    weight 41
-  ]
-  edge [
-    source 3737
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 3752
-    target 3993
-    weight 21
-  ]
-  edge [
-    source 3752
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 3847
-    target 3993
-    weight 125
-  ]
-  edge [
-    source 3847
-    target 3954
-    weight 68
-  ]
-  edge [
-    source 3847
-    target 4051
-    weight 236
-  ]
-  edge [
-    source 3847
-    target 4162
-    weight 25
-  ]
-  edge [
-    source 3847
-    target 4154
-    weight 65
-  ]
-  edge [
-    source 3847
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 3847
-    target 3917
-    weight 78
-  ]
-  edge [
-    source 3856
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 3860
-    target 4051
-    weight 75
-  ]
-  edge [
-    source 3860
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 3860
-    target 3993
-    weight 52
-  ]
-  edge [
-    source 3860
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 3860
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 3861
-    target 3993
-    weight 42
-  ]
-  edge [
-    source 3861
-    target 3917
-    weight 29
-  ]
-  edge [
-    source 3861
-    target 4051
-    weight 62
-  ]
-  edge [
-    source 3872
-    target 3917
-    weight 34
-  ]
-  edge [
-    source 3872
-    target 4051
-    weight 48
-  ]
-  edge [
-    source 3872
-    target 3993
-    weight 31
-  ]
-  edge [
-    source 3876
-    target 4051
-    weight 46
-  ]
-  edge [
-    source 3876
-    target 3917
-    weight 29
-  ]
-  edge [
-    source 3876
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 3877
-    target 3917
-    weight 124
-  ]
-  edge [
-    source 3877
-    target 4051
-    weight 232
-  ]
-  edge [
-    source 3877
-    target 4154
-    weight 46
-  ]
-  edge [
-    source 3877
-    target 3962
-    weight 53
-  ]
-  edge [
-    source 3877
-    target 3993
-    weight 122
-  ]
-  edge [
-    source 3877
-    target 3954
-    weight 42
-  ]
-  edge [
-    source 3884
-    target 3993
-    weight 63
-  ]
-  edge [
-    source 3884
-    target 3954
-    weight 43
-  ]
-  edge [
-    source 3884
-    target 4051
-    weight 123
-  ]
-  edge [
-    source 3884
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 3884
-    target 3917
-    weight 51
-  ]
-  edge [
-    source 3884
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 3884
-    target 4154
-    weight 37
-  ]
-  edge [
-    source 3917
-    target 3985
-    weight 27
-  ]
-  edge [
-    source 3917
-    target 4051
-    weight 1757
-  ]
-  edge [
-    source 3917
-    target 3937
-    weight 105
-  ]
-  edge [
-    source 3917
-    target 4187
-    weight 61
-  ]
-  edge [
-    source 3917
-    target 3993
-    weight 995
-  ]
-  edge [
-    source 3917
-    target 4152
-    weight 31
-  ]
-  edge [
-    source 3917
-    target 3962
-    weight 291
-  ]
-  edge [
-    source 3917
-    target 4154
-    weight 356
-  ]
-  edge [
-    source 3917
-    target 3954
-    weight 309
-  ]
-  edge [
-    source 3917
-    target 4162
-    weight 112
-  ]
-  edge [
-    source 3917
-    target 4040
-    weight 85
-  ]
-  edge [
-    source 3917
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 3917
-    target 4027
-    weight 43
-  ]
-  edge [
-    source 3917
-    target 3968
-    weight 43
-  ]
-  edge [
-    source 3917
-    target 4160
-    weight 22
-  ]
-  edge [
-    source 3917
-    target 4098
-    weight 34
-  ]
-  edge [
-    source 3935
-    target 4051
-    weight 62
-  ]
-  edge [
-    source 3935
-    target 3993
-    weight 36
-  ]
-  edge [
-    source 3937
-    target 4187
-    weight 24
-  ]
-  edge [
-    source 3937
-    target 4051
-    weight 220
-  ]
-  edge [
-    source 3937
-    target 3993
-    weight 171
-  ]
-  edge [
-    source 3937
-    target 3962
-    weight 70
-  ]
-  edge [
-    source 3937
-    target 3954
-    weight 62
-  ]
-  edge [
-    source 3937
-    target 4154
-    weight 55
-  ]
-  edge [
-    source 3937
-    target 4040
-    weight 21
-  ]
-  edge [
-    source 3937
-    target 4162
-    weight 32
-  ]
-  edge [
-    source 3952
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 3954
-    target 4051
-    weight 914
-  ]
-  edge [
-    source 3954
-    target 3993
-    weight 396
-  ]
-  edge [
-    source 3954
-    target 4027
-    weight 30
-  ]
-  edge [
-    source 3954
-    target 4154
-    weight 201
-  ]
-  edge [
-    source 3954
-    target 4098
-    weight 43
-  ]
-  edge [
-    source 3954
-    target 3968
-    weight 37
-  ]
-  edge [
-    source 3954
-    target 4160
-    weight 28
-  ]
-  edge [
-    source 3954
-    target 3956
-    weight 28
-  ]
-  edge [
-    source 3954
-    target 3962
-    weight 127
-  ]
-  edge [
-    source 3954
-    target 4040
-    weight 54
-  ]
-  edge [
-    source 3954
-    target 4162
-    weight 90
-  ]
-  edge [
-    source 3954
-    target 4152
-    weight 27
-  ]
-  edge [
-    source 3954
-    target 4187
-    weight 25
-  ]
-  edge [
-    source 3956
-    target 4051
-    weight 52
-  ]
-  edge [
-    source 3962
-    target 3985
-    weight 21
-  ]
-  edge [
-    source 3962
-    target 4051
-    weight 743
-  ]
-  edge [
-    source 3962
-    target 4187
-    weight 32
-  ]
-  edge [
-    source 3962
-    target 3993
-    weight 487
-  ]
-  edge [
-    source 3962
-    target 4154
-    weight 133
-  ]
-  edge [
-    source 3962
-    target 4040
-    weight 30
-  ]
-  edge [
-    source 3962
-    target 4162
-    weight 53
-  ]
-  edge [
-    source 3962
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3962
-    target 3968
-    weight 22
-  ]
-  edge [
-    source 3968
-    target 4051
-    weight 117
-  ]
-  edge [
-    source 3968
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 3985
-    target 4051
-    weight 67
-  ]
-  edge [
-    source 3985
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 3993
-    target 4051
-    weight 2957
-  ]
-  edge [
-    source 3993
-    target 4027
-    weight 50
-  ]
-  edge [
-    source 3993
-    target 4187
-    weight 80
-  ]
-  edge [
-    source 3993
-    target 4154
-    weight 453
-  ]
-  edge [
-    source 3993
-    target 4152
-    weight 52
-  ]
-  edge [
-    source 3993
-    target 4162
-    weight 170
-  ]
-  edge [
-    source 3993
-    target 4040
-    weight 122
-  ]
-  edge [
-    source 3993
-    target 4160
-    weight 35
-  ]
-  edge [
-    source 3993
-    target 4098
-    weight 44
-  ]
-  edge [
-    source 4007
-    target 4051
-    weight 44
-  ]
-  edge [
-    source 4027
-    target 4051
-    weight 95
-  ]
-  edge [
-    source 4040
-    target 4051
-    weight 206
-  ]
-  edge [
-    source 4040
-    target 4154
-    weight 95
-  ]
-  edge [
-    source 4040
-    target 4162
-    weight 26
-  ]
-  edge [
-    source 4051
-    target 4187
-    weight 120
-  ]
-  edge [
-    source 4051
-    target 4152
-    weight 89
-  ]
-  edge [
-    source 4051
-    target 4098
-    weight 91
-  ]
-  edge [
-    source 4051
-    target 4154
-    weight 1010
-  ]
-  edge [
-    source 4051
-    target 4160
-    weight 81
-  ]
-  edge [
-    source 4051
-    target 4162
-    weight 335
-  ]
-  edge [
-    source 4051
-    target 4100
-    weight 31
-  ]
-  edge [
-    source 4154
-    target 4162
-    weight 103
-  ]
-  edge [
-    source 4154
-    target 4187
-    weight 24
-  ]
-]
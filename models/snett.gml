@@ -1,3863 +0,0 @@
-graph [
-  node [
-    id 0
-    label "reddit.com"
-  ]
-  node [
-    id 1
-    label "pics"
-  ]
-  node [
-    id 2
-    label "worldnews"
-  ]
-  node [
-    id 3
-    label "programming"
-  ]
-  node [
-    id 4
-    label "math"
-  ]
-  node [
-    id 5
-    label "business"
-  ]
-  node [
-    id 6
-    label "politics"
-  ]
-  node [
-    id 7
-    label "obama"
-  ]
-  node [
-    id 8
-    label "science"
-  ]
-  node [
-    id 9
-    label "technology"
-  ]
-  node [
-    id 10
-    label "WTF"
-  ]
-  node [
-    id 11
-    label "AskReddit"
-  ]
-  node [
-    id 12
-    label "netsec"
-  ]
-  node [
-    id 13
-    label "philosophy"
-  ]
-  node [
-    id 14
-    label "videos"
-  ]
-  node [
-    id 15
-    label "offbeat"
-  ]
-  node [
-    id 16
-    label "funny"
-  ]
-  node [
-    id 17
-    label "entertainment"
-  ]
-  node [
-    id 18
-    label "linux"
-  ]
-  node [
-    id 19
-    label "geek"
-  ]
-  node [
-    id 20
-    label "gaming"
-  ]
-  node [
-    id 21
-    label "comics"
-  ]
-  node [
-    id 22
-    label "gadgets"
-  ]
-  node [
-    id 23
-    label "nsfw"
-  ]
-  node [
-    id 24
-    label "news"
-  ]
-  node [
-    id 25
-    label "environment"
-  ]
-  node [
-    id 26
-    label "atheism"
-  ]
-  node [
-    id 27
-    label "canada"
-  ]
-  node [
-    id 28
-    label "Economics"
-  ]
-  node [
-    id 29
-    label "scifi"
-  ]
-  node [
-    id 30
-    label "bestof"
-  ]
-  node [
-    id 31
-    label "cogsci"
-  ]
-  node [
-    id 32
-    label "joel"
-  ]
-  node [
-    id 33
-    label "Health"
-  ]
-  node [
-    id 34
-    label "guns"
-  ]
-  node [
-    id 35
-    label "photography"
-  ]
-  node [
-    id 36
-    label "software"
-  ]
-  node [
-    id 37
-    label "history"
-  ]
-  node [
-    id 38
-    label "ideas"
-  ]
-  edge [
-    source 0
-    target 17
-    weight 20012
-  ]
-  edge [
-    source 0
-    target 31
-    weight 1431
-  ]
-  edge [
-    source 0
-    target 33
-    weight 1762
-  ]
-  edge [
-    source 0
-    target 8
-    weight 20128
-  ]
-  edge [
-    source 0
-    target 1
-    weight 22179
-  ]
-  edge [
-    source 0
-    target 27
-    weight 888
-  ]
-  edge [
-    source 0
-    target 36
-    weight 443
-  ]
-  edge [
-    source 0
-    target 15
-    weight 8776
-  ]
-  edge [
-    source 0
-    target 28
-    weight 5698
-  ]
-  edge [
-    source 0
-    target 13
-    weight 1212
-  ]
-  edge [
-    source 0
-    target 3
-    weight 16575
-  ]
-  edge [
-    source 0
-    target 29
-    weight 1624
-  ]
-  edge [
-    source 0
-    target 23
-    weight 5207
-  ]
-  edge [
-    source 0
-    target 6
-    weight 27580
-  ]
-  edge [
-    source 0
-    target 24
-    weight 2158
-  ]
-  edge [
-    source 0
-    target 22
-    weight 4834
-  ]
-  edge [
-    source 0
-    target 35
-    weight 789
-  ]
-  edge [
-    source 0
-    target 32
-    weight 299
-  ]
-  edge [
-    source 0
-    target 10
-    weight 17933
-  ]
-  edge [
-    source 0
-    target 25
-    weight 4928
-  ]
-  edge [
-    source 0
-    target 9
-    weight 20806
-  ]
-  edge [
-    source 0
-    target 12
-    weight 1291
-  ]
-  edge [
-    source 0
-    target 14
-    weight 4799
-  ]
-  edge [
-    source 0
-    target 5
-    weight 18104
-  ]
-  edge [
-    source 0
-    target 37
-    weight 776
-  ]
-  edge [
-    source 0
-    target 16
-    weight 20908
-  ]
-  edge [
-    source 0
-    target 11
-    weight 5316
-  ]
-  edge [
-    source 0
-    target 26
-    weight 6172
-  ]
-  edge [
-    source 0
-    target 21
-    weight 5618
-  ]
-  edge [
-    source 0
-    target 4
-    weight 1321
-  ]
-  edge [
-    source 0
-    target 18
-    weight 2415
-  ]
-  edge [
-    source 0
-    target 20
-    weight 9323
-  ]
-  edge [
-    source 0
-    target 7
-    weight 3748
-  ]
-  edge [
-    source 0
-    target 2
-    weight 19009
-  ]
-  edge [
-    source 0
-    target 30
-    weight 2166
-  ]
-  edge [
-    source 0
-    target 19
-    weight 4016
-  ]
-  edge [
-    source 0
-    target 38
-    weight 113
-  ]
-  edge [
-    source 0
-    target 34
-    weight 411
-  ]
-  edge [
-    source 1
-    target 17
-    weight 12943
-  ]
-  edge [
-    source 1
-    target 31
-    weight 1223
-  ]
-  edge [
-    source 1
-    target 33
-    weight 1413
-  ]
-  edge [
-    source 1
-    target 8
-    weight 14549
-  ]
-  edge [
-    source 1
-    target 6
-    weight 17121
-  ]
-  edge [
-    source 1
-    target 21
-    weight 5010
-  ]
-  edge [
-    source 1
-    target 3
-    weight 11126
-  ]
-  edge [
-    source 1
-    target 20
-    weight 7267
-  ]
-  edge [
-    source 1
-    target 5
-    weight 10258
-  ]
-  edge [
-    source 1
-    target 22
-    weight 3823
-  ]
-  edge [
-    source 1
-    target 12
-    weight 1011
-  ]
-  edge [
-    source 1
-    target 16
-    weight 15982
-  ]
-  edge [
-    source 1
-    target 15
-    weight 7419
-  ]
-  edge [
-    source 1
-    target 30
-    weight 1961
-  ]
-  edge [
-    source 1
-    target 7
-    weight 3086
-  ]
-  edge [
-    source 1
-    target 23
-    weight 4619
-  ]
-  edge [
-    source 1
-    target 27
-    weight 742
-  ]
-  edge [
-    source 1
-    target 14
-    weight 4251
-  ]
-  edge [
-    source 1
-    target 11
-    weight 4511
-  ]
-  edge [
-    source 1
-    target 9
-    weight 13500
-  ]
-  edge [
-    source 1
-    target 19
-    weight 3479
-  ]
-  edge [
-    source 1
-    target 18
-    weight 1898
-  ]
-  edge [
-    source 1
-    target 28
-    weight 4339
-  ]
-  edge [
-    source 1
-    target 4
-    weight 1057
-  ]
-  edge [
-    source 1
-    target 2
-    weight 13513
-  ]
-  edge [
-    source 1
-    target 13
-    weight 1038
-  ]
-  edge [
-    source 1
-    target 37
-    weight 688
-  ]
-  edge [
-    source 1
-    target 26
-    weight 5140
-  ]
-  edge [
-    source 1
-    target 25
-    weight 3828
-  ]
-  edge [
-    source 1
-    target 10
-    weight 14210
-  ]
-  edge [
-    source 1
-    target 29
-    weight 1401
-  ]
-  edge [
-    source 1
-    target 35
-    weight 704
-  ]
-  edge [
-    source 1
-    target 36
-    weight 361
-  ]
-  edge [
-    source 1
-    target 24
-    weight 1837
-  ]
-  edge [
-    source 1
-    target 38
-    weight 91
-  ]
-  edge [
-    source 1
-    target 34
-    weight 350
-  ]
-  edge [
-    source 1
-    target 32
-    weight 107
-  ]
-  edge [
-    source 2
-    target 17
-    weight 11345
-  ]
-  edge [
-    source 2
-    target 31
-    weight 1141
-  ]
-  edge [
-    source 2
-    target 33
-    weight 1342
-  ]
-  edge [
-    source 2
-    target 8
-    weight 12991
-  ]
-  edge [
-    source 2
-    target 27
-    weight 688
-  ]
-  edge [
-    source 2
-    target 36
-    weight 326
-  ]
-  edge [
-    source 2
-    target 15
-    weight 6278
-  ]
-  edge [
-    source 2
-    target 28
-    weight 4330
-  ]
-  edge [
-    source 2
-    target 13
-    weight 990
-  ]
-  edge [
-    source 2
-    target 3
-    weight 9640
-  ]
-  edge [
-    source 2
-    target 29
-    weight 1258
-  ]
-  edge [
-    source 2
-    target 23
-    weight 3806
-  ]
-  edge [
-    source 2
-    target 6
-    weight 15364
-  ]
-  edge [
-    source 2
-    target 24
-    weight 1801
-  ]
-  edge [
-    source 2
-    target 22
-    weight 3305
-  ]
-  edge [
-    source 2
-    target 35
-    weight 579
-  ]
-  edge [
-    source 2
-    target 32
-    weight 110
-  ]
-  edge [
-    source 2
-    target 10
-    weight 11627
-  ]
-  edge [
-    source 2
-    target 25
-    weight 3650
-  ]
-  edge [
-    source 2
-    target 9
-    weight 12265
-  ]
-  edge [
-    source 2
-    target 12
-    weight 935
-  ]
-  edge [
-    source 2
-    target 14
-    weight 3493
-  ]
-  edge [
-    source 2
-    target 5
-    weight 10210
-  ]
-  edge [
-    source 2
-    target 37
-    weight 686
-  ]
-  edge [
-    source 2
-    target 16
-    weight 12852
-  ]
-  edge [
-    source 2
-    target 11
-    weight 3768
-  ]
-  edge [
-    source 2
-    target 26
-    weight 4511
-  ]
-  edge [
-    source 2
-    target 21
-    weight 4170
-  ]
-  edge [
-    source 2
-    target 4
-    weight 928
-  ]
-  edge [
-    source 2
-    target 18
-    weight 1671
-  ]
-  edge [
-    source 2
-    target 20
-    weight 6014
-  ]
-  edge [
-    source 2
-    target 7
-    weight 2813
-  ]
-  edge [
-    source 2
-    target 30
-    weight 1757
-  ]
-  edge [
-    source 2
-    target 19
-    weight 2957
-  ]
-  edge [
-    source 2
-    target 38
-    weight 95
-  ]
-  edge [
-    source 2
-    target 34
-    weight 335
-  ]
-  edge [
-    source 3
-    target 17
-    weight 9047
-  ]
-  edge [
-    source 3
-    target 31
-    weight 1063
-  ]
-  edge [
-    source 3
-    target 33
-    weight 924
-  ]
-  edge [
-    source 3
-    target 8
-    weight 10969
-  ]
-  edge [
-    source 3
-    target 27
-    weight 521
-  ]
-  edge [
-    source 3
-    target 36
-    weight 387
-  ]
-  edge [
-    source 3
-    target 15
-    weight 4818
-  ]
-  edge [
-    source 3
-    target 28
-    weight 3393
-  ]
-  edge [
-    source 3
-    target 13
-    weight 796
-  ]
-  edge [
-    source 3
-    target 12
-    weight 1117
-  ]
-  edge [
-    source 3
-    target 22
-    weight 3130
-  ]
-  edge [
-    source 3
-    target 6
-    weight 12135
-  ]
-  edge [
-    source 3
-    target 5
-    weight 8162
-  ]
-  edge [
-    source 3
-    target 20
-    weight 5728
-  ]
-  edge [
-    source 3
-    target 32
-    weight 223
-  ]
-  edge [
-    source 3
-    target 23
-    weight 3158
-  ]
-  edge [
-    source 3
-    target 4
-    weight 1173
-  ]
-  edge [
-    source 3
-    target 21
-    weight 3660
-  ]
-  edge [
-    source 3
-    target 18
-    weight 2226
-  ]
-  edge [
-    source 3
-    target 7
-    weight 2101
-  ]
-  edge [
-    source 3
-    target 30
-    weight 1544
-  ]
-  edge [
-    source 3
-    target 10
-    weight 9274
-  ]
-  edge [
-    source 3
-    target 26
-    weight 3643
-  ]
-  edge [
-    source 3
-    target 9
-    weight 11114
-  ]
-  edge [
-    source 3
-    target 11
-    weight 3328
-  ]
-  edge [
-    source 3
-    target 14
-    weight 2657
-  ]
-  edge [
-    source 3
-    target 29
-    weight 1139
-  ]
-  edge [
-    source 3
-    target 38
-    weight 84
-  ]
-  edge [
-    source 3
-    target 19
-    weight 2911
-  ]
-  edge [
-    source 3
-    target 25
-    weight 2672
-  ]
-  edge [
-    source 3
-    target 16
-    weight 10481
-  ]
-  edge [
-    source 3
-    target 37
-    weight 469
-  ]
-  edge [
-    source 3
-    target 35
-    weight 504
-  ]
-  edge [
-    source 3
-    target 24
-    weight 1198
-  ]
-  edge [
-    source 3
-    target 34
-    weight 258
-  ]
-  edge [
-    source 4
-    target 17
-    weight 858
-  ]
-  edge [
-    source 4
-    target 31
-    weight 367
-  ]
-  edge [
-    source 4
-    target 33
-    weight 246
-  ]
-  edge [
-    source 4
-    target 8
-    weight 1176
-  ]
-  edge [
-    source 4
-    target 27
-    weight 113
-  ]
-  edge [
-    source 4
-    target 36
-    weight 109
-  ]
-  edge [
-    source 4
-    target 15
-    weight 660
-  ]
-  edge [
-    source 4
-    target 28
-    weight 534
-  ]
-  edge [
-    source 4
-    target 13
-    weight 267
-  ]
-  edge [
-    source 4
-    target 29
-    weight 305
-  ]
-  edge [
-    source 4
-    target 23
-    weight 410
-  ]
-  edge [
-    source 4
-    target 6
-    weight 1059
-  ]
-  edge [
-    source 4
-    target 24
-    weight 273
-  ]
-  edge [
-    source 4
-    target 22
-    weight 474
-  ]
-  edge [
-    source 4
-    target 35
-    weight 137
-  ]
-  edge [
-    source 4
-    target 32
-    weight 26
-  ]
-  edge [
-    source 4
-    target 10
-    weight 883
-  ]
-  edge [
-    source 4
-    target 25
-    weight 437
-  ]
-  edge [
-    source 4
-    target 9
-    weight 1042
-  ]
-  edge [
-    source 4
-    target 12
-    weight 262
-  ]
-  edge [
-    source 4
-    target 14
-    weight 419
-  ]
-  edge [
-    source 4
-    target 5
-    weight 765
-  ]
-  edge [
-    source 4
-    target 37
-    weight 142
-  ]
-  edge [
-    source 4
-    target 16
-    weight 989
-  ]
-  edge [
-    source 4
-    target 11
-    weight 643
-  ]
-  edge [
-    source 4
-    target 26
-    weight 518
-  ]
-  edge [
-    source 4
-    target 21
-    weight 579
-  ]
-  edge [
-    source 4
-    target 20
-    weight 658
-  ]
-  edge [
-    source 4
-    target 18
-    weight 436
-  ]
-  edge [
-    source 4
-    target 7
-    weight 302
-  ]
-  edge [
-    source 4
-    target 30
-    weight 379
-  ]
-  edge [
-    source 4
-    target 19
-    weight 546
-  ]
-  edge [
-    source 4
-    target 38
-    weight 34
-  ]
-  edge [
-    source 4
-    target 34
-    weight 67
-  ]
-  edge [
-    source 5
-    target 17
-    weight 9346
-  ]
-  edge [
-    source 5
-    target 31
-    weight 963
-  ]
-  edge [
-    source 5
-    target 33
-    weight 1195
-  ]
-  edge [
-    source 5
-    target 8
-    weight 10360
-  ]
-  edge [
-    source 5
-    target 27
-    weight 525
-  ]
-  edge [
-    source 5
-    target 36
-    weight 289
-  ]
-  edge [
-    source 5
-    target 15
-    weight 5098
-  ]
-  edge [
-    source 5
-    target 28
-    weight 4371
-  ]
-  edge [
-    source 5
-    target 13
-    weight 767
-  ]
-  edge [
-    source 5
-    target 29
-    weight 978
-  ]
-  edge [
-    source 5
-    target 23
-    weight 2993
-  ]
-  edge [
-    source 5
-    target 6
-    weight 11961
-  ]
-  edge [
-    source 5
-    target 24
-    weight 1501
-  ]
-  edge [
-    source 5
-    target 22
-    weight 3019
-  ]
-  edge [
-    source 5
-    target 35
-    weight 467
-  ]
-  edge [
-    source 5
-    target 32
-    weight 134
-  ]
-  edge [
-    source 5
-    target 10
-    weight 8785
-  ]
-  edge [
-    source 5
-    target 25
-    weight 3211
-  ]
-  edge [
-    source 5
-    target 9
-    weight 10340
-  ]
-  edge [
-    source 5
-    target 12
-    weight 835
-  ]
-  edge [
-    source 5
-    target 14
-    weight 2745
-  ]
-  edge [
-    source 5
-    target 20
-    weight 4949
-  ]
-  edge [
-    source 5
-    target 21
-    weight 3250
-  ]
-  edge [
-    source 5
-    target 18
-    weight 1333
-  ]
-  edge [
-    source 5
-    target 7
-    weight 2390
-  ]
-  edge [
-    source 5
-    target 30
-    weight 1481
-  ]
-  edge [
-    source 5
-    target 37
-    weight 561
-  ]
-  edge [
-    source 5
-    target 11
-    weight 2995
-  ]
-  edge [
-    source 5
-    target 16
-    weight 9884
-  ]
-  edge [
-    source 5
-    target 19
-    weight 2392
-  ]
-  edge [
-    source 5
-    target 26
-    weight 3505
-  ]
-  edge [
-    source 5
-    target 38
-    weight 77
-  ]
-  edge [
-    source 5
-    target 34
-    weight 297
-  ]
-  edge [
-    source 6
-    target 17
-    weight 13593
-  ]
-  edge [
-    source 6
-    target 31
-    weight 1269
-  ]
-  edge [
-    source 6
-    target 33
-    weight 1508
-  ]
-  edge [
-    source 6
-    target 8
-    weight 15981
-  ]
-  edge [
-    source 6
-    target 27
-    weight 761
-  ]
-  edge [
-    source 6
-    target 36
-    weight 338
-  ]
-  edge [
-    source 6
-    target 15
-    weight 7356
-  ]
-  edge [
-    source 6
-    target 28
-    weight 5215
-  ]
-  edge [
-    source 6
-    target 13
-    weight 1109
-  ]
-  edge [
-    source 6
-    target 29
-    weight 1431
-  ]
-  edge [
-    source 6
-    target 23
-    weight 4378
-  ]
-  edge [
-    source 6
-    target 22
-    weight 3750
-  ]
-  edge [
-    source 6
-    target 20
-    weight 7211
-  ]
-  edge [
-    source 6
-    target 12
-    weight 1037
-  ]
-  edge [
-    source 6
-    target 7
-    weight 3660
-  ]
-  edge [
-    source 6
-    target 32
-    weight 127
-  ]
-  edge [
-    source 6
-    target 21
-    weight 4843
-  ]
-  edge [
-    source 6
-    target 18
-    weight 1886
-  ]
-  edge [
-    source 6
-    target 30
-    weight 1887
-  ]
-  edge [
-    source 6
-    target 9
-    weight 14155
-  ]
-  edge [
-    source 6
-    target 19
-    weight 3363
-  ]
-  edge [
-    source 6
-    target 37
-    weight 737
-  ]
-  edge [
-    source 6
-    target 14
-    weight 4099
-  ]
-  edge [
-    source 6
-    target 26
-    weight 5678
-  ]
-  edge [
-    source 6
-    target 25
-    weight 4255
-  ]
-  edge [
-    source 6
-    target 16
-    weight 16049
-  ]
-  edge [
-    source 6
-    target 11
-    weight 4500
-  ]
-  edge [
-    source 6
-    target 10
-    weight 14580
-  ]
-  edge [
-    source 6
-    target 35
-    weight 650
-  ]
-  edge [
-    source 6
-    target 38
-    weight 101
-  ]
-  edge [
-    source 6
-    target 24
-    weight 2020
-  ]
-  edge [
-    source 6
-    target 34
-    weight 392
-  ]
-  edge [
-    source 7
-    target 17
-    weight 2584
-  ]
-  edge [
-    source 7
-    target 31
-    weight 403
-  ]
-  edge [
-    source 7
-    target 33
-    weight 550
-  ]
-  edge [
-    source 7
-    target 8
-    weight 2864
-  ]
-  edge [
-    source 7
-    target 27
-    weight 213
-  ]
-  edge [
-    source 7
-    target 36
-    weight 93
-  ]
-  edge [
-    source 7
-    target 15
-    weight 1871
-  ]
-  edge [
-    source 7
-    target 28
-    weight 1432
-  ]
-  edge [
-    source 7
-    target 13
-    weight 360
-  ]
-  edge [
-    source 7
-    target 29
-    weight 433
-  ]
-  edge [
-    source 7
-    target 23
-    weight 1133
-  ]
-  edge [
-    source 7
-    target 24
-    weight 768
-  ]
-  edge [
-    source 7
-    target 22
-    weight 966
-  ]
-  edge [
-    source 7
-    target 35
-    weight 195
-  ]
-  edge [
-    source 7
-    target 32
-    weight 28
-  ]
-  edge [
-    source 7
-    target 10
-    weight 2866
-  ]
-  edge [
-    source 7
-    target 25
-    weight 1254
-  ]
-  edge [
-    source 7
-    target 9
-    weight 2674
-  ]
-  edge [
-    source 7
-    target 12
-    weight 261
-  ]
-  edge [
-    source 7
-    target 14
-    weight 1207
-  ]
-  edge [
-    source 7
-    target 37
-    weight 271
-  ]
-  edge [
-    source 7
-    target 16
-    weight 2966
-  ]
-  edge [
-    source 7
-    target 11
-    weight 1288
-  ]
-  edge [
-    source 7
-    target 26
-    weight 1485
-  ]
-  edge [
-    source 7
-    target 21
-    weight 1294
-  ]
-  edge [
-    source 7
-    target 18
-    weight 474
-  ]
-  edge [
-    source 7
-    target 20
-    weight 1625
-  ]
-  edge [
-    source 7
-    target 30
-    weight 645
-  ]
-  edge [
-    source 7
-    target 19
-    weight 923
-  ]
-  edge [
-    source 7
-    target 38
-    weight 36
-  ]
-  edge [
-    source 7
-    target 34
-    weight 129
-  ]
-  edge [
-    source 8
-    target 17
-    weight 12025
-  ]
-  edge [
-    source 8
-    target 31
-    weight 1314
-  ]
-  edge [
-    source 8
-    target 33
-    weight 1449
-  ]
-  edge [
-    source 8
-    target 20
-    weight 6806
-  ]
-  edge [
-    source 8
-    target 22
-    weight 3811
-  ]
-  edge [
-    source 8
-    target 12
-    weight 1069
-  ]
-  edge [
-    source 8
-    target 32
-    weight 124
-  ]
-  edge [
-    source 8
-    target 23
-    weight 4029
-  ]
-  edge [
-    source 8
-    target 21
-    weight 4586
-  ]
-  edge [
-    source 8
-    target 18
-    weight 1907
-  ]
-  edge [
-    source 8
-    target 28
-    weight 4413
-  ]
-  edge [
-    source 8
-    target 9
-    weight 13084
-  ]
-  edge [
-    source 8
-    target 15
-    weight 6720
-  ]
-  edge [
-    source 8
-    target 10
-    weight 12151
-  ]
-  edge [
-    source 8
-    target 19
-    weight 3335
-  ]
-  edge [
-    source 8
-    target 37
-    weight 702
-  ]
-  edge [
-    source 8
-    target 14
-    weight 3683
-  ]
-  edge [
-    source 8
-    target 25
-    weight 3945
-  ]
-  edge [
-    source 8
-    target 16
-    weight 13669
-  ]
-  edge [
-    source 8
-    target 11
-    weight 4174
-  ]
-  edge [
-    source 8
-    target 38
-    weight 95
-  ]
-  edge [
-    source 8
-    target 13
-    weight 1062
-  ]
-  edge [
-    source 8
-    target 29
-    weight 1441
-  ]
-  edge [
-    source 8
-    target 26
-    weight 4906
-  ]
-  edge [
-    source 8
-    target 30
-    weight 1871
-  ]
-  edge [
-    source 8
-    target 36
-    weight 350
-  ]
-  edge [
-    source 8
-    target 35
-    weight 639
-  ]
-  edge [
-    source 8
-    target 24
-    weight 1756
-  ]
-  edge [
-    source 8
-    target 27
-    weight 694
-  ]
-  edge [
-    source 8
-    target 34
-    weight 343
-  ]
-  edge [
-    source 9
-    target 17
-    weight 11522
-  ]
-  edge [
-    source 9
-    target 31
-    weight 1171
-  ]
-  edge [
-    source 9
-    target 33
-    weight 1347
-  ]
-  edge [
-    source 9
-    target 27
-    weight 647
-  ]
-  edge [
-    source 9
-    target 36
-    weight 394
-  ]
-  edge [
-    source 9
-    target 15
-    weight 6407
-  ]
-  edge [
-    source 9
-    target 28
-    weight 4211
-  ]
-  edge [
-    source 9
-    target 13
-    weight 940
-  ]
-  edge [
-    source 9
-    target 29
-    weight 1308
-  ]
-  edge [
-    source 9
-    target 23
-    weight 3814
-  ]
-  edge [
-    source 9
-    target 24
-    weight 1698
-  ]
-  edge [
-    source 9
-    target 22
-    weight 3833
-  ]
-  edge [
-    source 9
-    target 35
-    weight 636
-  ]
-  edge [
-    source 9
-    target 32
-    weight 129
-  ]
-  edge [
-    source 9
-    target 10
-    weight 11577
-  ]
-  edge [
-    source 9
-    target 25
-    weight 3681
-  ]
-  edge [
-    source 9
-    target 20
-    weight 6583
-  ]
-  edge [
-    source 9
-    target 12
-    weight 1074
-  ]
-  edge [
-    source 9
-    target 19
-    weight 3358
-  ]
-  edge [
-    source 9
-    target 14
-    weight 3574
-  ]
-  edge [
-    source 9
-    target 18
-    weight 2070
-  ]
-  edge [
-    source 9
-    target 16
-    weight 13060
-  ]
-  edge [
-    source 9
-    target 21
-    weight 4290
-  ]
-  edge [
-    source 9
-    target 11
-    weight 3926
-  ]
-  edge [
-    source 9
-    target 37
-    weight 633
-  ]
-  edge [
-    source 9
-    target 30
-    weight 1809
-  ]
-  edge [
-    source 9
-    target 38
-    weight 92
-  ]
-  edge [
-    source 9
-    target 26
-    weight 4374
-  ]
-  edge [
-    source 9
-    target 34
-    weight 330
-  ]
-  edge [
-    source 10
-    target 17
-    weight 10635
-  ]
-  edge [
-    source 10
-    target 31
-    weight 1058
-  ]
-  edge [
-    source 10
-    target 33
-    weight 1310
-  ]
-  edge [
-    source 10
-    target 27
-    weight 678
-  ]
-  edge [
-    source 10
-    target 36
-    weight 297
-  ]
-  edge [
-    source 10
-    target 15
-    weight 7020
-  ]
-  edge [
-    source 10
-    target 28
-    weight 4029
-  ]
-  edge [
-    source 10
-    target 13
-    weight 935
-  ]
-  edge [
-    source 10
-    target 29
-    weight 1202
-  ]
-  edge [
-    source 10
-    target 23
-    weight 4027
-  ]
-  edge [
-    source 10
-    target 24
-    weight 1788
-  ]
-  edge [
-    source 10
-    target 22
-    weight 3292
-  ]
-  edge [
-    source 10
-    target 35
-    weight 617
-  ]
-  edge [
-    source 10
-    target 32
-    weight 96
-  ]
-  edge [
-    source 10
-    target 20
-    weight 6187
-  ]
-  edge [
-    source 10
-    target 26
-    weight 4848
-  ]
-  edge [
-    source 10
-    target 18
-    weight 1637
-  ]
-  edge [
-    source 10
-    target 37
-    weight 644
-  ]
-  edge [
-    source 10
-    target 21
-    weight 4479
-  ]
-  edge [
-    source 10
-    target 25
-    weight 3447
-  ]
-  edge [
-    source 10
-    target 11
-    weight 4099
-  ]
-  edge [
-    source 10
-    target 16
-    weight 13616
-  ]
-  edge [
-    source 10
-    target 30
-    weight 1805
-  ]
-  edge [
-    source 10
-    target 12
-    weight 852
-  ]
-  edge [
-    source 10
-    target 19
-    weight 3147
-  ]
-  edge [
-    source 10
-    target 14
-    weight 3914
-  ]
-  edge [
-    source 10
-    target 38
-    weight 85
-  ]
-  edge [
-    source 10
-    target 34
-    weight 351
-  ]
-  edge [
-    source 11
-    target 17
-    weight 3709
-  ]
-  edge [
-    source 11
-    target 31
-    weight 825
-  ]
-  edge [
-    source 11
-    target 33
-    weight 839
-  ]
-  edge [
-    source 11
-    target 27
-    weight 392
-  ]
-  edge [
-    source 11
-    target 36
-    weight 217
-  ]
-  edge [
-    source 11
-    target 15
-    weight 3040
-  ]
-  edge [
-    source 11
-    target 28
-    weight 1767
-  ]
-  edge [
-    source 11
-    target 13
-    weight 689
-  ]
-  edge [
-    source 11
-    target 29
-    weight 865
-  ]
-  edge [
-    source 11
-    target 23
-    weight 1841
-  ]
-  edge [
-    source 11
-    target 24
-    weight 1124
-  ]
-  edge [
-    source 11
-    target 22
-    weight 1739
-  ]
-  edge [
-    source 11
-    target 35
-    weight 411
-  ]
-  edge [
-    source 11
-    target 32
-    weight 50
-  ]
-  edge [
-    source 11
-    target 25
-    weight 1737
-  ]
-  edge [
-    source 11
-    target 12
-    weight 541
-  ]
-  edge [
-    source 11
-    target 14
-    weight 2009
-  ]
-  edge [
-    source 11
-    target 37
-    weight 456
-  ]
-  edge [
-    source 11
-    target 16
-    weight 4254
-  ]
-  edge [
-    source 11
-    target 21
-    weight 2219
-  ]
-  edge [
-    source 11
-    target 20
-    weight 2713
-  ]
-  edge [
-    source 11
-    target 26
-    weight 2154
-  ]
-  edge [
-    source 11
-    target 19
-    weight 1856
-  ]
-  edge [
-    source 11
-    target 30
-    weight 1473
-  ]
-  edge [
-    source 11
-    target 38
-    weight 75
-  ]
-  edge [
-    source 11
-    target 18
-    weight 1000
-  ]
-  edge [
-    source 11
-    target 34
-    weight 237
-  ]
-  edge [
-    source 12
-    target 17
-    weight 917
-  ]
-  edge [
-    source 12
-    target 31
-    weight 281
-  ]
-  edge [
-    source 12
-    target 33
-    weight 210
-  ]
-  edge [
-    source 12
-    target 27
-    weight 90
-  ]
-  edge [
-    source 12
-    target 36
-    weight 147
-  ]
-  edge [
-    source 12
-    target 15
-    weight 653
-  ]
-  edge [
-    source 12
-    target 28
-    weight 441
-  ]
-  edge [
-    source 12
-    target 13
-    weight 185
-  ]
-  edge [
-    source 12
-    target 29
-    weight 254
-  ]
-  edge [
-    source 12
-    target 23
-    weight 406
-  ]
-  edge [
-    source 12
-    target 24
-    weight 237
-  ]
-  edge [
-    source 12
-    target 22
-    weight 616
-  ]
-  edge [
-    source 12
-    target 35
-    weight 137
-  ]
-  edge [
-    source 12
-    target 32
-    weight 43
-  ]
-  edge [
-    source 12
-    target 25
-    weight 419
-  ]
-  edge [
-    source 12
-    target 20
-    weight 724
-  ]
-  edge [
-    source 12
-    target 21
-    weight 497
-  ]
-  edge [
-    source 12
-    target 18
-    weight 497
-  ]
-  edge [
-    source 12
-    target 26
-    weight 455
-  ]
-  edge [
-    source 12
-    target 14
-    weight 414
-  ]
-  edge [
-    source 12
-    target 16
-    weight 956
-  ]
-  edge [
-    source 12
-    target 19
-    weight 566
-  ]
-  edge [
-    source 12
-    target 30
-    weight 324
-  ]
-  edge [
-    source 12
-    target 37
-    weight 107
-  ]
-  edge [
-    source 12
-    target 38
-    weight 28
-  ]
-  edge [
-    source 12
-    target 34
-    weight 63
-  ]
-  edge [
-    source 13
-    target 17
-    weight 866
-  ]
-  edge [
-    source 13
-    target 31
-    weight 448
-  ]
-  edge [
-    source 13
-    target 33
-    weight 322
-  ]
-  edge [
-    source 13
-    target 27
-    weight 129
-  ]
-  edge [
-    source 13
-    target 36
-    weight 95
-  ]
-  edge [
-    source 13
-    target 15
-    weight 722
-  ]
-  edge [
-    source 13
-    target 28
-    weight 588
-  ]
-  edge [
-    source 13
-    target 20
-    weight 589
-  ]
-  edge [
-    source 13
-    target 21
-    weight 566
-  ]
-  edge [
-    source 13
-    target 16
-    weight 982
-  ]
-  edge [
-    source 13
-    target 22
-    weight 439
-  ]
-  edge [
-    source 13
-    target 25
-    weight 517
-  ]
-  edge [
-    source 13
-    target 19
-    weight 491
-  ]
-  edge [
-    source 13
-    target 37
-    weight 242
-  ]
-  edge [
-    source 13
-    target 38
-    weight 44
-  ]
-  edge [
-    source 13
-    target 23
-    weight 433
-  ]
-  edge [
-    source 13
-    target 14
-    weight 529
-  ]
-  edge [
-    source 13
-    target 24
-    weight 386
-  ]
-  edge [
-    source 13
-    target 29
-    weight 337
-  ]
-  edge [
-    source 13
-    target 26
-    weight 644
-  ]
-  edge [
-    source 13
-    target 35
-    weight 151
-  ]
-  edge [
-    source 13
-    target 30
-    weight 402
-  ]
-  edge [
-    source 13
-    target 18
-    weight 258
-  ]
-  edge [
-    source 13
-    target 34
-    weight 82
-  ]
-  edge [
-    source 13
-    target 32
-    weight 20
-  ]
-  edge [
-    source 14
-    target 17
-    weight 3589
-  ]
-  edge [
-    source 14
-    target 31
-    weight 590
-  ]
-  edge [
-    source 14
-    target 33
-    weight 773
-  ]
-  edge [
-    source 14
-    target 27
-    weight 333
-  ]
-  edge [
-    source 14
-    target 36
-    weight 172
-  ]
-  edge [
-    source 14
-    target 15
-    weight 2990
-  ]
-  edge [
-    source 14
-    target 28
-    weight 1584
-  ]
-  edge [
-    source 14
-    target 29
-    weight 679
-  ]
-  edge [
-    source 14
-    target 23
-    weight 1708
-  ]
-  edge [
-    source 14
-    target 24
-    weight 1085
-  ]
-  edge [
-    source 14
-    target 22
-    weight 1653
-  ]
-  edge [
-    source 14
-    target 35
-    weight 354
-  ]
-  edge [
-    source 14
-    target 32
-    weight 30
-  ]
-  edge [
-    source 14
-    target 25
-    weight 1738
-  ]
-  edge [
-    source 14
-    target 21
-    weight 1951
-  ]
-  edge [
-    source 14
-    target 20
-    weight 2530
-  ]
-  edge [
-    source 14
-    target 30
-    weight 1045
-  ]
-  edge [
-    source 14
-    target 19
-    weight 1605
-  ]
-  edge [
-    source 14
-    target 16
-    weight 4048
-  ]
-  edge [
-    source 14
-    target 26
-    weight 1910
-  ]
-  edge [
-    source 14
-    target 38
-    weight 49
-  ]
-  edge [
-    source 14
-    target 18
-    weight 735
-  ]
-  edge [
-    source 14
-    target 37
-    weight 392
-  ]
-  edge [
-    source 14
-    target 34
-    weight 178
-  ]
-  edge [
-    source 15
-    target 17
-    weight 6444
-  ]
-  edge [
-    source 15
-    target 31
-    weight 909
-  ]
-  edge [
-    source 15
-    target 33
-    weight 1130
-  ]
-  edge [
-    source 15
-    target 27
-    weight 491
-  ]
-  edge [
-    source 15
-    target 36
-    weight 257
-  ]
-  edge [
-    source 15
-    target 21
-    weight 3246
-  ]
-  edge [
-    source 15
-    target 20
-    weight 4186
-  ]
-  edge [
-    source 15
-    target 22
-    weight 2656
-  ]
-  edge [
-    source 15
-    target 19
-    weight 2541
-  ]
-  edge [
-    source 15
-    target 25
-    weight 2811
-  ]
-  edge [
-    source 15
-    target 28
-    weight 2580
-  ]
-  edge [
-    source 15
-    target 23
-    weight 2704
-  ]
-  edge [
-    source 15
-    target 26
-    weight 3007
-  ]
-  edge [
-    source 15
-    target 16
-    weight 7207
-  ]
-  edge [
-    source 15
-    target 37
-    weight 552
-  ]
-  edge [
-    source 15
-    target 35
-    weight 508
-  ]
-  edge [
-    source 15
-    target 29
-    weight 991
-  ]
-  edge [
-    source 15
-    target 30
-    weight 1516
-  ]
-  edge [
-    source 15
-    target 24
-    weight 1482
-  ]
-  edge [
-    source 15
-    target 18
-    weight 1146
-  ]
-  edge [
-    source 15
-    target 32
-    weight 60
-  ]
-  edge [
-    source 15
-    target 38
-    weight 68
-  ]
-  edge [
-    source 15
-    target 34
-    weight 264
-  ]
-  edge [
-    source 16
-    target 17
-    weight 12625
-  ]
-  edge [
-    source 16
-    target 31
-    weight 1173
-  ]
-  edge [
-    source 16
-    target 33
-    weight 1375
-  ]
-  edge [
-    source 16
-    target 27
-    weight 694
-  ]
-  edge [
-    source 16
-    target 36
-    weight 329
-  ]
-  edge [
-    source 16
-    target 28
-    weight 4152
-  ]
-  edge [
-    source 16
-    target 29
-    weight 1336
-  ]
-  edge [
-    source 16
-    target 23
-    weight 4356
-  ]
-  edge [
-    source 16
-    target 24
-    weight 1807
-  ]
-  edge [
-    source 16
-    target 22
-    weight 3692
-  ]
-  edge [
-    source 16
-    target 35
-    weight 638
-  ]
-  edge [
-    source 16
-    target 32
-    weight 102
-  ]
-  edge [
-    source 16
-    target 25
-    weight 3660
-  ]
-  edge [
-    source 16
-    target 37
-    weight 666
-  ]
-  edge [
-    source 16
-    target 20
-    weight 6943
-  ]
-  edge [
-    source 16
-    target 18
-    weight 1813
-  ]
-  edge [
-    source 16
-    target 19
-    weight 3349
-  ]
-  edge [
-    source 16
-    target 30
-    weight 1925
-  ]
-  edge [
-    source 16
-    target 21
-    weight 4861
-  ]
-  edge [
-    source 16
-    target 26
-    weight 4918
-  ]
-  edge [
-    source 16
-    target 38
-    weight 89
-  ]
-  edge [
-    source 16
-    target 34
-    weight 340
-  ]
-  edge [
-    source 17
-    target 20
-    weight 6698
-  ]
-  edge [
-    source 17
-    target 23
-    weight 3958
-  ]
-  edge [
-    source 17
-    target 22
-    weight 3645
-  ]
-  edge [
-    source 17
-    target 31
-    weight 1084
-  ]
-  edge [
-    source 17
-    target 21
-    weight 4217
-  ]
-  edge [
-    source 17
-    target 18
-    weight 1533
-  ]
-  edge [
-    source 17
-    target 30
-    weight 1737
-  ]
-  edge [
-    source 17
-    target 28
-    weight 3644
-  ]
-  edge [
-    source 17
-    target 37
-    weight 607
-  ]
-  edge [
-    source 17
-    target 25
-    weight 3472
-  ]
-  edge [
-    source 17
-    target 19
-    weight 3066
-  ]
-  edge [
-    source 17
-    target 32
-    weight 101
-  ]
-  edge [
-    source 17
-    target 29
-    weight 1285
-  ]
-  edge [
-    source 17
-    target 26
-    weight 3986
-  ]
-  edge [
-    source 17
-    target 36
-    weight 315
-  ]
-  edge [
-    source 17
-    target 35
-    weight 593
-  ]
-  edge [
-    source 17
-    target 24
-    weight 1644
-  ]
-  edge [
-    source 17
-    target 38
-    weight 89
-  ]
-  edge [
-    source 17
-    target 33
-    weight 1292
-  ]
-  edge [
-    source 17
-    target 27
-    weight 579
-  ]
-  edge [
-    source 17
-    target 34
-    weight 298
-  ]
-  edge [
-    source 18
-    target 31
-    weight 352
-  ]
-  edge [
-    source 18
-    target 33
-    weight 321
-  ]
-  edge [
-    source 18
-    target 27
-    weight 168
-  ]
-  edge [
-    source 18
-    target 36
-    weight 211
-  ]
-  edge [
-    source 18
-    target 28
-    weight 771
-  ]
-  edge [
-    source 18
-    target 29
-    weight 411
-  ]
-  edge [
-    source 18
-    target 23
-    weight 730
-  ]
-  edge [
-    source 18
-    target 24
-    weight 409
-  ]
-  edge [
-    source 18
-    target 22
-    weight 921
-  ]
-  edge [
-    source 18
-    target 35
-    weight 185
-  ]
-  edge [
-    source 18
-    target 32
-    weight 45
-  ]
-  edge [
-    source 18
-    target 25
-    weight 750
-  ]
-  edge [
-    source 18
-    target 37
-    weight 176
-  ]
-  edge [
-    source 18
-    target 26
-    weight 892
-  ]
-  edge [
-    source 18
-    target 21
-    weight 900
-  ]
-  edge [
-    source 18
-    target 20
-    weight 1245
-  ]
-  edge [
-    source 18
-    target 19
-    weight 1044
-  ]
-  edge [
-    source 18
-    target 30
-    weight 541
-  ]
-  edge [
-    source 18
-    target 34
-    weight 94
-  ]
-  edge [
-    source 18
-    target 38
-    weight 31
-  ]
-  edge [
-    source 19
-    target 31
-    weight 670
-  ]
-  edge [
-    source 19
-    target 33
-    weight 630
-  ]
-  edge [
-    source 19
-    target 27
-    weight 291
-  ]
-  edge [
-    source 19
-    target 36
-    weight 247
-  ]
-  edge [
-    source 19
-    target 28
-    weight 1260
-  ]
-  edge [
-    source 19
-    target 29
-    weight 786
-  ]
-  edge [
-    source 19
-    target 23
-    weight 1398
-  ]
-  edge [
-    source 19
-    target 24
-    weight 860
-  ]
-  edge [
-    source 19
-    target 22
-    weight 1861
-  ]
-  edge [
-    source 19
-    target 35
-    weight 336
-  ]
-  edge [
-    source 19
-    target 32
-    weight 53
-  ]
-  edge [
-    source 19
-    target 25
-    weight 1481
-  ]
-  edge [
-    source 19
-    target 37
-    weight 330
-  ]
-  edge [
-    source 19
-    target 26
-    weight 1585
-  ]
-  edge [
-    source 19
-    target 21
-    weight 1906
-  ]
-  edge [
-    source 19
-    target 20
-    weight 2510
-  ]
-  edge [
-    source 19
-    target 30
-    weight 995
-  ]
-  edge [
-    source 19
-    target 38
-    weight 50
-  ]
-  edge [
-    source 19
-    target 34
-    weight 170
-  ]
-  edge [
-    source 20
-    target 31
-    weight 799
-  ]
-  edge [
-    source 20
-    target 33
-    weight 781
-  ]
-  edge [
-    source 20
-    target 27
-    weight 424
-  ]
-  edge [
-    source 20
-    target 36
-    weight 251
-  ]
-  edge [
-    source 20
-    target 28
-    weight 2187
-  ]
-  edge [
-    source 20
-    target 29
-    weight 1030
-  ]
-  edge [
-    source 20
-    target 23
-    weight 2610
-  ]
-  edge [
-    source 20
-    target 24
-    weight 1074
-  ]
-  edge [
-    source 20
-    target 22
-    weight 2769
-  ]
-  edge [
-    source 20
-    target 35
-    weight 392
-  ]
-  edge [
-    source 20
-    target 32
-    weight 73
-  ]
-  edge [
-    source 20
-    target 25
-    weight 2229
-  ]
-  edge [
-    source 20
-    target 37
-    weight 397
-  ]
-  edge [
-    source 20
-    target 26
-    weight 2654
-  ]
-  edge [
-    source 20
-    target 21
-    weight 3163
-  ]
-  edge [
-    source 20
-    target 30
-    weight 1298
-  ]
-  edge [
-    source 20
-    target 38
-    weight 54
-  ]
-  edge [
-    source 20
-    target 34
-    weight 213
-  ]
-  edge [
-    source 21
-    target 31
-    weight 705
-  ]
-  edge [
-    source 21
-    target 33
-    weight 648
-  ]
-  edge [
-    source 21
-    target 27
-    weight 341
-  ]
-  edge [
-    source 21
-    target 36
-    weight 191
-  ]
-  edge [
-    source 21
-    target 28
-    weight 1730
-  ]
-  edge [
-    source 21
-    target 29
-    weight 844
-  ]
-  edge [
-    source 21
-    target 23
-    weight 1923
-  ]
-  edge [
-    source 21
-    target 24
-    weight 909
-  ]
-  edge [
-    source 21
-    target 22
-    weight 1773
-  ]
-  edge [
-    source 21
-    target 35
-    weight 330
-  ]
-  edge [
-    source 21
-    target 32
-    weight 50
-  ]
-  edge [
-    source 21
-    target 25
-    weight 1722
-  ]
-  edge [
-    source 21
-    target 37
-    weight 386
-  ]
-  edge [
-    source 21
-    target 26
-    weight 2256
-  ]
-  edge [
-    source 21
-    target 30
-    weight 1200
-  ]
-  edge [
-    source 21
-    target 38
-    weight 45
-  ]
-  edge [
-    source 21
-    target 34
-    weight 165
-  ]
-  edge [
-    source 22
-    target 31
-    weight 658
-  ]
-  edge [
-    source 22
-    target 33
-    weight 680
-  ]
-  edge [
-    source 22
-    target 27
-    weight 270
-  ]
-  edge [
-    source 22
-    target 36
-    weight 241
-  ]
-  edge [
-    source 22
-    target 28
-    weight 1394
-  ]
-  edge [
-    source 22
-    target 29
-    weight 745
-  ]
-  edge [
-    source 22
-    target 23
-    weight 1533
-  ]
-  edge [
-    source 22
-    target 24
-    weight 882
-  ]
-  edge [
-    source 22
-    target 30
-    weight 961
-  ]
-  edge [
-    source 22
-    target 37
-    weight 330
-  ]
-  edge [
-    source 22
-    target 32
-    weight 47
-  ]
-  edge [
-    source 22
-    target 26
-    weight 1544
-  ]
-  edge [
-    source 22
-    target 25
-    weight 1686
-  ]
-  edge [
-    source 22
-    target 35
-    weight 354
-  ]
-  edge [
-    source 22
-    target 38
-    weight 51
-  ]
-  edge [
-    source 22
-    target 34
-    weight 159
-  ]
-  edge [
-    source 23
-    target 31
-    weight 525
-  ]
-  edge [
-    source 23
-    target 33
-    weight 592
-  ]
-  edge [
-    source 23
-    target 27
-    weight 256
-  ]
-  edge [
-    source 23
-    target 36
-    weight 157
-  ]
-  edge [
-    source 23
-    target 28
-    weight 1405
-  ]
-  edge [
-    source 23
-    target 29
-    weight 625
-  ]
-  edge [
-    source 23
-    target 30
-    weight 948
-  ]
-  edge [
-    source 23
-    target 35
-    weight 291
-  ]
-  edge [
-    source 23
-    target 25
-    weight 1411
-  ]
-  edge [
-    source 23
-    target 38
-    weight 42
-  ]
-  edge [
-    source 23
-    target 26
-    weight 1784
-  ]
-  edge [
-    source 23
-    target 24
-    weight 783
-  ]
-  edge [
-    source 23
-    target 37
-    weight 307
-  ]
-  edge [
-    source 23
-    target 34
-    weight 178
-  ]
-  edge [
-    source 23
-    target 32
-    weight 40
-  ]
-  edge [
-    source 24
-    target 31
-    weight 402
-  ]
-  edge [
-    source 24
-    target 33
-    weight 681
-  ]
-  edge [
-    source 24
-    target 27
-    weight 225
-  ]
-  edge [
-    source 24
-    target 36
-    weight 117
-  ]
-  edge [
-    source 24
-    target 28
-    weight 1064
-  ]
-  edge [
-    source 24
-    target 29
-    weight 477
-  ]
-  edge [
-    source 24
-    target 38
-    weight 46
-  ]
-  edge [
-    source 24
-    target 25
-    weight 1060
-  ]
-  edge [
-    source 24
-    target 37
-    weight 357
-  ]
-  edge [
-    source 24
-    target 26
-    weight 969
-  ]
-  edge [
-    source 24
-    target 30
-    weight 625
-  ]
-  edge [
-    source 24
-    target 35
-    weight 240
-  ]
-  edge [
-    source 24
-    target 34
-    weight 162
-  ]
-  edge [
-    source 24
-    target 32
-    weight 13
-  ]
-  edge [
-    source 25
-    target 31
-    weight 623
-  ]
-  edge [
-    source 25
-    target 33
-    weight 933
-  ]
-  edge [
-    source 25
-    target 27
-    weight 363
-  ]
-  edge [
-    source 25
-    target 36
-    weight 164
-  ]
-  edge [
-    source 25
-    target 28
-    weight 1983
-  ]
-  edge [
-    source 25
-    target 29
-    weight 673
-  ]
-  edge [
-    source 25
-    target 35
-    weight 343
-  ]
-  edge [
-    source 25
-    target 32
-    weight 32
-  ]
-  edge [
-    source 25
-    target 37
-    weight 426
-  ]
-  edge [
-    source 25
-    target 30
-    weight 867
-  ]
-  edge [
-    source 25
-    target 26
-    weight 1843
-  ]
-  edge [
-    source 25
-    target 34
-    weight 177
-  ]
-  edge [
-    source 25
-    target 38
-    weight 55
-  ]
-  edge [
-    source 26
-    target 31
-    weight 679
-  ]
-  edge [
-    source 26
-    target 33
-    weight 678
-  ]
-  edge [
-    source 26
-    target 27
-    weight 384
-  ]
-  edge [
-    source 26
-    target 36
-    weight 160
-  ]
-  edge [
-    source 26
-    target 28
-    weight 1962
-  ]
-  edge [
-    source 26
-    target 29
-    weight 764
-  ]
-  edge [
-    source 26
-    target 35
-    weight 306
-  ]
-  edge [
-    source 26
-    target 32
-    weight 37
-  ]
-  edge [
-    source 26
-    target 37
-    weight 388
-  ]
-  edge [
-    source 26
-    target 30
-    weight 1018
-  ]
-  edge [
-    source 26
-    target 38
-    weight 54
-  ]
-  edge [
-    source 26
-    target 34
-    weight 177
-  ]
-  edge [
-    source 27
-    target 31
-    weight 163
-  ]
-  edge [
-    source 27
-    target 33
-    weight 192
-  ]
-  edge [
-    source 27
-    target 36
-    weight 39
-  ]
-  edge [
-    source 27
-    target 30
-    weight 190
-  ]
-  edge [
-    source 27
-    target 29
-    weight 179
-  ]
-  edge [
-    source 27
-    target 28
-    weight 326
-  ]
-  edge [
-    source 27
-    target 35
-    weight 96
-  ]
-  edge [
-    source 27
-    target 37
-    weight 103
-  ]
-  edge [
-    source 27
-    target 32
-    weight 6
-  ]
-  edge [
-    source 27
-    target 34
-    weight 47
-  ]
-  edge [
-    source 27
-    target 38
-    weight 14
-  ]
-  edge [
-    source 28
-    target 31
-    weight 643
-  ]
-  edge [
-    source 28
-    target 33
-    weight 815
-  ]
-  edge [
-    source 28
-    target 36
-    weight 171
-  ]
-  edge [
-    source 28
-    target 37
-    weight 429
-  ]
-  edge [
-    source 28
-    target 35
-    weight 296
-  ]
-  edge [
-    source 28
-    target 29
-    weight 598
-  ]
-  edge [
-    source 28
-    target 30
-    weight 906
-  ]
-  edge [
-    source 28
-    target 38
-    weight 62
-  ]
-  edge [
-    source 28
-    target 34
-    weight 213
-  ]
-  edge [
-    source 28
-    target 32
-    weight 55
-  ]
-  edge [
-    source 29
-    target 31
-    weight 414
-  ]
-  edge [
-    source 29
-    target 33
-    weight 371
-  ]
-  edge [
-    source 29
-    target 36
-    weight 107
-  ]
-  edge [
-    source 29
-    target 37
-    weight 271
-  ]
-  edge [
-    source 29
-    target 30
-    weight 490
-  ]
-  edge [
-    source 29
-    target 35
-    weight 199
-  ]
-  edge [
-    source 29
-    target 38
-    weight 39
-  ]
-  edge [
-    source 29
-    target 34
-    weight 101
-  ]
-  edge [
-    source 29
-    target 32
-    weight 21
-  ]
-  edge [
-    source 30
-    target 31
-    weight 473
-  ]
-  edge [
-    source 30
-    target 33
-    weight 418
-  ]
-  edge [
-    source 30
-    target 36
-    weight 144
-  ]
-  edge [
-    source 30
-    target 35
-    weight 232
-  ]
-  edge [
-    source 30
-    target 32
-    weight 26
-  ]
-  edge [
-    source 30
-    target 37
-    weight 294
-  ]
-  edge [
-    source 30
-    target 34
-    weight 112
-  ]
-  edge [
-    source 30
-    target 38
-    weight 43
-  ]
-  edge [
-    source 31
-    target 37
-    weight 216
-  ]
-  edge [
-    source 31
-    target 32
-    weight 26
-  ]
-  edge [
-    source 31
-    target 38
-    weight 47
-  ]
-  edge [
-    source 31
-    target 33
-    weight 385
-  ]
-  edge [
-    source 31
-    target 35
-    weight 183
-  ]
-  edge [
-    source 31
-    target 36
-    weight 115
-  ]
-  edge [
-    source 31
-    target 34
-    weight 92
-  ]
-  edge [
-    source 32
-    target 33
-    weight 17
-  ]
-  edge [
-    source 32
-    target 36
-    weight 19
-  ]
-  edge [
-    source 32
-    target 35
-    weight 13
-  ]
-  edge [
-    source 32
-    target 37
-    weight 8
-  ]
-  edge [
-    source 32
-    target 34
-    weight 4
-  ]
-  edge [
-    source 32
-    target 38
-    weight 3
-  ]
-  edge [
-    source 33
-    target 37
-    weight 274
-  ]
-  edge [
-    source 33
-    target 35
-    weight 214
-  ]
-  edge [
-    source 33
-    target 34
-    weight 124
-  ]
-  edge [
-    source 33
-    target 36
-    weight 121
-  ]
-  edge [
-    source 33
-    target 38
-    weight 38
-  ]
-  edge [
-    source 34
-    target 36
-    weight 23
-  ]
-  edge [
-    source 34
-    target 35
-    weight 54
-  ]
-  edge [
-    source 34
-    target 37
-    weight 76
-  ]
-  edge [
-    source 34
-    target 38
-    weight 14
-  ]
-  edge [
-    source 35
-    target 36
-    weight 72
-  ]
-  edge [
-    source 35
-    target 37
-    weight 117
-  ]
-  edge [
-    source 35
-    target 38
-    weight 19
-  ]
-  edge [
-    source 36
-    target 37
-    weight 72
-  ]
-  edge [
-    source 36
-    target 38
-    weight 15
-  ]
-  edge [
-    source 37
-    target 38
-    weight 25
-  ]
-]
@@ -1,70522 +0,0 @@
-graph [
-  node [
-    id 0
-    label "myparkingsign"
-    color "4"
-  ]
-  node [
-    id 1
-    label "dezan"
-    color "4"
-  ]
-  node [
-    id 2
-    label "flying"
-    color "4"
-  ]
-  node [
-    id 3
-    label "marcusjjam"
-    color "4"
-  ]
-  node [
-    id 4
-    label "citylocalbelfast"
-    color "0"
-  ]
-  node [
-    id 5
-    label "as3"
-    color "4"
-  ]
-  node [
-    id 6
-    label "livableplaces"
-    color "0"
-  ]
-  node [
-    id 7
-    label "Jeannes"
-    color "0"
-  ]
-  node [
-    id 8
-    label "Rubens"
-    color "0"
-  ]
-  node [
-    id 9
-    label "bestentrepbooks"
-    color "4"
-  ]
-  node [
-    id 10
-    label "interesting"
-    color "0"
-  ]
-  node [
-    id 11
-    label "Ornella"
-    color "4"
-  ]
-  node [
-    id 12
-    label "jenkem"
-    color "4"
-  ]
-  node [
-    id 13
-    label "zeuux"
-    color "4"
-  ]
-  node [
-    id 14
-    label "Bellydance"
-    color "4"
-  ]
-  node [
-    id 15
-    label "ActivistNow"
-    color "4"
-  ]
-  node [
-    id 16
-    label "MarketingBabe"
-    color "4"
-  ]
-  node [
-    id 17
-    label "FunStuff"
-    color "0"
-  ]
-  node [
-    id 18
-    label "energyefficiency"
-    color "4"
-  ]
-  node [
-    id 19
-    label "noshit"
-    color "0"
-  ]
-  node [
-    id 20
-    label "rosslinks"
-    color "4"
-  ]
-  node [
-    id 21
-    label "CADCAM"
-    color "0"
-  ]
-  node [
-    id 22
-    label "CelebrityBabyGossip"
-    color "4"
-  ]
-  node [
-    id 23
-    label "washingtondc"
-    color "0"
-  ]
-  node [
-    id 24
-    label "jun"
-    color "4"
-  ]
-  node [
-    id 25
-    label "onlysc"
-    color "0"
-  ]
-  node [
-    id 26
-    label "Intubate"
-    color "4"
-  ]
-  node [
-    id 27
-    label "LittletonCoinCompany"
-    color "0"
-  ]
-  node [
-    id 28
-    label "ExecNetProperties"
-    color "0"
-  ]
-  node [
-    id 29
-    label "EntertainMe"
-    color "4"
-  ]
-  node [
-    id 30
-    label "clao"
-    color "4"
-  ]
-  node [
-    id 31
-    label "8bit"
-    color "4"
-  ]
-  node [
-    id 32
-    label "virtualworlds"
-    color "4"
-  ]
-  node [
-    id 33
-    label "sailing"
-    color "4"
-  ]
-  node [
-    id 34
-    label "PlanetaCiencia"
-    color "4"
-  ]
-  node [
-    id 35
-    label "webbuzzz"
-    color "4"
-  ]
-  node [
-    id 36
-    label "lullaby"
-    color "0"
-  ]
-  node [
-    id 37
-    label "prnine"
-    color "0"
-  ]
-  node [
-    id 38
-    label "financialmarkets"
-    color "4"
-  ]
-  node [
-    id 39
-    label "radhoo"
-    color "4"
-  ]
-  node [
-    id 40
-    label "Zharster"
-    color "4"
-  ]
-  node [
-    id 41
-    label "dostuff"
-    color "4"
-  ]
-  node [
-    id 42
-    label "sushi"
-    color "0"
-  ]
-  node [
-    id 43
-    label "Jennifer"
-    color "0"
-  ]
-  node [
-    id 44
-    label "AmericanHistory"
-    color "1"
-  ]
-  node [
-    id 45
-    label "charts"
-    color "0"
-  ]
-  node [
-    id 46
-    label "VotingReddit"
-    color "0"
-  ]
-  node [
-    id 47
-    label "GLIS663"
-    color "0"
-  ]
-  node [
-    id 48
-    label "interface_design"
-    color "4"
-  ]
-  node [
-    id 49
-    label "ClandestineMarketing"
-    color "0"
-  ]
-  node [
-    id 50
-    label "Dimas"
-    color "4"
-  ]
-  node [
-    id 51
-    label "ffxi"
-    color "0"
-  ]
-  node [
-    id 52
-    label "Wahido"
-    color "4"
-  ]
-  node [
-    id 53
-    label "Vietnameasytravel"
-    color "4"
-  ]
-  node [
-    id 54
-    label "Libertarian"
-    color "5"
-  ]
-  node [
-    id 55
-    label "editgrid"
-    color "4"
-  ]
-  node [
-    id 56
-    label "Tesla"
-    color "4"
-  ]
-  node [
-    id 57
-    label "EverythingThai"
-    color "0"
-  ]
-  node [
-    id 58
-    label "Richien"
-    color "0"
-  ]
-  node [
-    id 59
-    label "MMJ"
-    color "4"
-  ]
-  node [
-    id 60
-    label "rudiemods"
-    color "4"
-  ]
-  node [
-    id 61
-    label "tala"
-    color "4"
-  ]
-  node [
-    id 62
-    label "compaign"
-    color "0"
-  ]
-  node [
-    id 63
-    label "pinkfloyd"
-    color "0"
-  ]
-  node [
-    id 64
-    label "Boise"
-    color "4"
-  ]
-  node [
-    id 65
-    label "classicReddit"
-    color "4"
-  ]
-  node [
-    id 66
-    label "WiscMUG"
-    color "4"
-  ]
-  node [
-    id 67
-    label "furry"
-    color "1"
-  ]
-  node [
-    id 68
-    label "NatGeo"
-    color "0"
-  ]
-  node [
-    id 69
-    label "maxtou"
-    color "4"
-  ]
-  node [
-    id 70
-    label "beyou"
-    color "4"
-  ]
-  node [
-    id 71
-    label "chess"
-    color "4"
-  ]
-  node [
-    id 72
-    label "thetansonly"
-    color "0"
-  ]
-  node [
-    id 73
-    label "timelapses"
-    color "0"
-  ]
-  node [
-    id 74
-    label "Harvard"
-    color "0"
-  ]
-  node [
-    id 75
-    label "cityofangels"
-    color "4"
-  ]
-  node [
-    id 76
-    label "casinostags"
-    color "4"
-  ]
-  node [
-    id 77
-    label "muxtape"
-    color "4"
-  ]
-  node [
-    id 78
-    label "BloZip"
-    color "0"
-  ]
-  node [
-    id 79
-    label "podcasts"
-    color "1"
-  ]
-  node [
-    id 80
-    label "Webbook"
-    color "4"
-  ]
-  node [
-    id 81
-    label "Empowerednurse"
-    color "4"
-  ]
-  node [
-    id 82
-    label "culturalstudies"
-    color "0"
-  ]
-  node [
-    id 83
-    label "jobinterviews"
-    color "0"
-  ]
-  node [
-    id 84
-    label "thamiz"
-    color "4"
-  ]
-  node [
-    id 85
-    label "britishcolumbia"
-    color "4"
-  ]
-  node [
-    id 86
-    label "2008is1929"
-    color "4"
-  ]
-  node [
-    id 87
-    label "winhid"
-    color "4"
-  ]
-  node [
-    id 88
-    label "economics2"
-    color "0"
-  ]
-  node [
-    id 89
-    label "scrapir"
-    color "0"
-  ]
-  node [
-    id 90
-    label "Triduanus"
-    color "4"
-  ]
-  node [
-    id 91
-    label "mac"
-    color "1"
-  ]
-  node [
-    id 92
-    label "drblog"
-    color "0"
-  ]
-  node [
-    id 93
-    label "cute04"
-    color "4"
-  ]
-  node [
-    id 94
-    label "unfunny"
-    color "0"
-  ]
-  node [
-    id 95
-    label "spiritual"
-    color "4"
-  ]
-  node [
-    id 96
-    label "timperry42"
-    color "0"
-  ]
-  node [
-    id 97
-    label "Badass"
-    color "4"
-  ]
-  node [
-    id 98
-    label "gr8buy"
-    color "4"
-  ]
-  node [
-    id 99
-    label "depraved"
-    color "0"
-  ]
-  node [
-    id 100
-    label "Celtic"
-    color "4"
-  ]
-  node [
-    id 101
-    label "jengajam"
-    color "4"
-  ]
-  node [
-    id 102
-    label "London_News"
-    color "4"
-  ]
-  node [
-    id 103
-    label "TrafficSchool"
-    color "0"
-  ]
-  node [
-    id 104
-    label "algorithm"
-    color "0"
-  ]
-  node [
-    id 105
-    label "MICROTEST"
-    color "0"
-  ]
-  node [
-    id 106
-    label "smart"
-    color "0"
-  ]
-  node [
-    id 107
-    label "conspiracy"
-    color "5"
-  ]
-  node [
-    id 108
-    label "blackberrynation"
-    color "4"
-  ]
-  node [
-    id 109
-    label "thesayer"
-    color "4"
-  ]
-  node [
-    id 110
-    label "Teachforever"
-    color "4"
-  ]
-  node [
-    id 111
-    label "iran"
-    color "0"
-  ]
-  node [
-    id 112
-    label "finnish"
-    color "0"
-  ]
-  node [
-    id 113
-    label "MAXSPEED"
-    color "0"
-  ]
-  node [
-    id 114
-    label "Switzerland"
-    color "4"
-  ]
-  node [
-    id 115
-    label "longisland"
-    color "0"
-  ]
-  node [
-    id 116
-    label "Kristronline"
-    color "0"
-  ]
-  node [
-    id 117
-    label "fetish"
-    color "4"
-  ]
-  node [
-    id 118
-    label "entertainment"
-    color "5"
-  ]
-  node [
-    id 119
-    label "eberling"
-    color "0"
-  ]
-  node [
-    id 120
-    label "totosoft"
-    color "4"
-  ]
-  node [
-    id 121
-    label "Purdue"
-    color "4"
-  ]
-  node [
-    id 122
-    label "consultingblog"
-    color "0"
-  ]
-  node [
-    id 123
-    label "Jokes"
-    color "5"
-  ]
-  node [
-    id 124
-    label "Cephalopods"
-    color "0"
-  ]
-  node [
-    id 125
-    label "Honorcide"
-    color "4"
-  ]
-  node [
-    id 126
-    label "MomsRule"
-    color "4"
-  ]
-  node [
-    id 127
-    label "hilmy"
-    color "4"
-  ]
-  node [
-    id 128
-    label "Bratz"
-    color "4"
-  ]
-  node [
-    id 129
-    label "samokrutka"
-    color "0"
-  ]
-  node [
-    id 130
-    label "zope"
-    color "4"
-  ]
-  node [
-    id 131
-    label "Zinemaya"
-    color "4"
-  ]
-  node [
-    id 132
-    label "Woerterbuecher"
-    color "0"
-  ]
-  node [
-    id 133
-    label "Stardom"
-    color "0"
-  ]
-  node [
-    id 134
-    label "testreddittryitfornj"
-    color "4"
-  ]
-  node [
-    id 135
-    label "ScrapMetalPrices"
-    color "0"
-  ]
-  node [
-    id 136
-    label "programmingbooks"
-    color "0"
-  ]
-  node [
-    id 137
-    label "SocialNews"
-    color "4"
-  ]
-  node [
-    id 138
-    label "kansascity"
-    color "0"
-  ]
-  node [
-    id 139
-    label "womenofreddit"
-    color "4"
-  ]
-  node [
-    id 140
-    label "Stratfor"
-    color "4"
-  ]
-  node [
-    id 141
-    label "graphics"
-    color "0"
-  ]
-  node [
-    id 142
-    label "RockYourWeb"
-    color "4"
-  ]
-  node [
-    id 143
-    label "nightnightly"
-    color "0"
-  ]
-  node [
-    id 144
-    label "productivity"
-    color "5"
-  ]
-  node [
-    id 145
-    label "ja"
-    color "1"
-  ]
-  node [
-    id 146
-    label "altaVoz"
-    color "0"
-  ]
-  node [
-    id 147
-    label "anime"
-    color "5"
-  ]
-  node [
-    id 148
-    label "techculture"
-    color "0"
-  ]
-  node [
-    id 149
-    label "markymark"
-    color "4"
-  ]
-  node [
-    id 150
-    label "Wolffe"
-    color "0"
-  ]
-  node [
-    id 151
-    label "CODEcontent"
-    color "4"
-  ]
-  node [
-    id 152
-    label "ads"
-    color "5"
-  ]
-  node [
-    id 153
-    label "Buffalo"
-    color "4"
-  ]
-  node [
-    id 154
-    label "FelonReports"
-    color "4"
-  ]
-  node [
-    id 155
-    label "pancreaticcancer"
-    color "0"
-  ]
-  node [
-    id 156
-    label "graphicnovels"
-    color "4"
-  ]
-  node [
-    id 157
-    label "USMLEMD"
-    color "0"
-  ]
-  node [
-    id 158
-    label "AlquileresArgentina"
-    color "0"
-  ]
-  node [
-    id 159
-    label "visualeffects"
-    color "4"
-  ]
-  node [
-    id 160
-    label "lispclub"
-    color "4"
-  ]
-  node [
-    id 161
-    label "Lechnacom"
-    color "0"
-  ]
-  node [
-    id 162
-    label "Travelchacha"
-    color "0"
-  ]
-  node [
-    id 163
-    label "Zonker"
-    color "0"
-  ]
-  node [
-    id 164
-    label "explolab"
-    color "4"
-  ]
-  node [
-    id 165
-    label "ShowtimeTees"
-    color "4"
-  ]
-  node [
-    id 166
-    label "weed"
-    color "4"
-  ]
-  node [
-    id 167
-    label "orlando"
-    color "4"
-  ]
-  node [
-    id 168
-    label "meron5"
-    color "4"
-  ]
-  node [
-    id 169
-    label "PHANTOMAVRI"
-    color "4"
-  ]
-  node [
-    id 170
-    label "Slimemolds"
-    color "0"
-  ]
-  node [
-    id 171
-    label "JamesAddison"
-    color "0"
-  ]
-  node [
-    id 172
-    label "insideYC"
-    color "4"
-  ]
-  node [
-    id 173
-    label "bdsm"
-    color "4"
-  ]
-  node [
-    id 174
-    label "infosthetics"
-    color "4"
-  ]
-  node [
-    id 175
-    label "aldimeola"
-    color "0"
-  ]
-  node [
-    id 176
-    label "VenezuelaReddit"
-    color "0"
-  ]
-  node [
-    id 177
-    label "Rule_34"
-    color "0"
-  ]
-  node [
-    id 178
-    label "angrykeyboarder"
-    color "0"
-  ]
-  node [
-    id 179
-    label "cogsci"
-    color "5"
-  ]
-  node [
-    id 180
-    label "tabletucker"
-    color "0"
-  ]
-  node [
-    id 181
-    label "mike918999"
-    color "4"
-  ]
-  node [
-    id 182
-    label "SamReddit"
-    color "0"
-  ]
-  node [
-    id 183
-    label "Demoscene"
-    color "0"
-  ]
-  node [
-    id 184
-    label "BeyondWords"
-    color "0"
-  ]
-  node [
-    id 185
-    label "impoliteconversation"
-    color "0"
-  ]
-  node [
-    id 186
-    label "HouseGarden"
-    color "4"
-  ]
-  node [
-    id 187
-    label "bioreddit"
-    color "0"
-  ]
-  node [
-    id 188
-    label "TechDispenser"
-    color "0"
-  ]
-  node [
-    id 189
-    label "organic"
-    color "4"
-  ]
-  node [
-    id 190
-    label "EugeneOnline"
-    color "0"
-  ]
-  node [
-    id 191
-    label "Fran"
-    color "0"
-  ]
-  node [
-    id 192
-    label "dior_lei"
-    color "3"
-  ]
-  node [
-    id 193
-    label "redditCANADA"
-    color "4"
-  ]
-  node [
-    id 194
-    label "whinybitchcirclejerk"
-    color "4"
-  ]
-  node [
-    id 195
-    label "Dr_Horrible"
-    color "4"
-  ]
-  node [
-    id 196
-    label "braga"
-    color "4"
-  ]
-  node [
-    id 197
-    label "Fabrizio"
-    color "4"
-  ]
-  node [
-    id 198
-    label "DanSturgis"
-    color "4"
-  ]
-  node [
-    id 199
-    label "Subprime"
-    color "0"
-  ]
-  node [
-    id 200
-    label "amitshah"
-    color "4"
-  ]
-  node [
-    id 201
-    label "broccoli"
-    color "4"
-  ]
-  node [
-    id 202
-    label "webanalyticsblog"
-    color "4"
-  ]
-  node [
-    id 203
-    label "bangladesh"
-    color "0"
-  ]
-  node [
-    id 204
-    label "brentpurves"
-    color "0"
-  ]
-  node [
-    id 205
-    label "spanishlanguagenerds"
-    color "0"
-  ]
-  node [
-    id 206
-    label "swissinfo"
-    color "0"
-  ]
-  node [
-    id 207
-    label "redditAnswers"
-    color "0"
-  ]
-  node [
-    id 208
-    label "jac481"
-    color "4"
-  ]
-  node [
-    id 209
-    label "osbgroup"
-    color "4"
-  ]
-  node [
-    id 210
-    label "Tandberg"
-    color "0"
-  ]
-  node [
-    id 211
-    label "translation"
-    color "4"
-  ]
-  node [
-    id 212
-    label "ipv6"
-    color "0"
-  ]
-  node [
-    id 213
-    label "BlackBlog"
-    color "0"
-  ]
-  node [
-    id 214
-    label "inspirational"
-    color "0"
-  ]
-  node [
-    id 215
-    label "PoliticalHumor"
-    color "1"
-  ]
-  node [
-    id 216
-    label "wesnoth"
-    color "0"
-  ]
-  node [
-    id 217
-    label "bestdamntech"
-    color "4"
-  ]
-  node [
-    id 218
-    label "personalRss"
-    color "0"
-  ]
-  node [
-    id 219
-    label "ANALI"
-    color "0"
-  ]
-  node [
-    id 220
-    label "torus"
-    color "4"
-  ]
-  node [
-    id 221
-    label "amateurradio"
-    color "4"
-  ]
-  node [
-    id 222
-    label "hurricane"
-    color "4"
-  ]
-  node [
-    id 223
-    label "ftw"
-    color "0"
-  ]
-  node [
-    id 224
-    label "turkalo"
-    color "4"
-  ]
-  node [
-    id 225
-    label "persuasivecontent"
-    color "0"
-  ]
-  node [
-    id 226
-    label "woz"
-    color "4"
-  ]
-  node [
-    id 227
-    label "gamereviews"
-    color "4"
-  ]
-  node [
-    id 228
-    label "artofpickup"
-    color "4"
-  ]
-  node [
-    id 229
-    label "Qyam"
-    color "0"
-  ]
-  node [
-    id 230
-    label "Kucinich"
-    color "0"
-  ]
-  node [
-    id 231
-    label "cocoa"
-    color "0"
-  ]
-  node [
-    id 232
-    label "self2"
-    color "0"
-  ]
-  node [
-    id 233
-    label "networking"
-    color "4"
-  ]
-  node [
-    id 234
-    label "biassaid"
-    color "0"
-  ]
-  node [
-    id 235
-    label "geeky"
-    color "0"
-  ]
-  node [
-    id 236
-    label "Icreon"
-    color "0"
-  ]
-  node [
-    id 237
-    label "TasteCast"
-    color "4"
-  ]
-  node [
-    id 238
-    label "whowantslove"
-    color "4"
-  ]
-  node [
-    id 239
-    label "RBT"
-    color "4"
-  ]
-  node [
-    id 240
-    label "backdropsource"
-    color "4"
-  ]
-  node [
-    id 241
-    label "racing"
-    color "0"
-  ]
-  node [
-    id 242
-    label "churchvisions"
-    color "4"
-  ]
-  node [
-    id 243
-    label "thelazyslackerblog"
-    color "0"
-  ]
-  node [
-    id 244
-    label "James1234"
-    color "0"
-  ]
-  node [
-    id 245
-    label "vancec"
-    color "4"
-  ]
-  node [
-    id 246
-    label "pomppoker"
-    color "0"
-  ]
-  node [
-    id 247
-    label "GlobalEconomy"
-    color "0"
-  ]
-  node [
-    id 248
-    label "sheddit"
-    color "4"
-  ]
-  node [
-    id 249
-    label "RushLimbaugh"
-    color "0"
-  ]
-  node [
-    id 250
-    label "chicagotribune"
-    color "0"
-  ]
-  node [
-    id 251
-    label "technews"
-    color "0"
-  ]
-  node [
-    id 252
-    label "Dwight"
-    color "4"
-  ]
-  node [
-    id 253
-    label "RealLifeSketch"
-    color "4"
-  ]
-  node [
-    id 254
-    label "akilito"
-    color "4"
-  ]
-  node [
-    id 255
-    label "medicalscience"
-    color "0"
-  ]
-  node [
-    id 256
-    label "aww"
-    color "5"
-  ]
-  node [
-    id 257
-    label "Glorycamp"
-    color "0"
-  ]
-  node [
-    id 258
-    label "drudgereport"
-    color "4"
-  ]
-  node [
-    id 259
-    label "outdoorsmen"
-    color "4"
-  ]
-  node [
-    id 260
-    label "BMW"
-    color "4"
-  ]
-  node [
-    id 261
-    label "meetup"
-    color "4"
-  ]
-  node [
-    id 262
-    label "Anarcho_Capitalism"
-    color "0"
-  ]
-  node [
-    id 263
-    label "CallForPapers"
-    color "0"
-  ]
-  node [
-    id 264
-    label "virals"
-    color "0"
-  ]
-  node [
-    id 265
-    label "Diggolo"
-    color "0"
-  ]
-  node [
-    id 266
-    label "themintchicks"
-    color "0"
-  ]
-  node [
-    id 267
-    label "osx"
-    color "5"
-  ]
-  node [
-    id 268
-    label "duwanis"
-    color "0"
-  ]
-  node [
-    id 269
-    label "GlobalWarming"
-    color "4"
-  ]
-  node [
-    id 270
-    label "shaku1981"
-    color "0"
-  ]
-  node [
-    id 271
-    label "beef"
-    color "4"
-  ]
-  node [
-    id 272
-    label "Fivelead"
-    color "4"
-  ]
-  node [
-    id 273
-    label "Jaden"
-    color "4"
-  ]
-  node [
-    id 274
-    label "runetnews"
-    color "0"
-  ]
-  node [
-    id 275
-    label "lily"
-    color "0"
-  ]
-  node [
-    id 276
-    label "captainnachopants"
-    color "0"
-  ]
-  node [
-    id 277
-    label "mensa"
-    color "4"
-  ]
-  node [
-    id 278
-    label "Uberazzi"
-    color "4"
-  ]
-  node [
-    id 279
-    label "ben"
-    color "4"
-  ]
-  node [
-    id 280
-    label "vagina"
-    color "4"
-  ]
-  node [
-    id 281
-    label "onlinegames"
-    color "1"
-  ]
-  node [
-    id 282
-    label "FirefoxAddons"
-    color "0"
-  ]
-  node [
-    id 283
-    label "gossip"
-    color "1"
-  ]
-  node [
-    id 284
-    label "shtruc"
-    color "0"
-  ]
-  node [
-    id 285
-    label "LoveMugs"
-    color "4"
-  ]
-  node [
-    id 286
-    label "curiosity"
-    color "4"
-  ]
-  node [
-    id 287
-    label "serialkiller"
-    color "4"
-  ]
-  node [
-    id 288
-    label "FineArt"
-    color "0"
-  ]
-  node [
-    id 289
-    label "ASC"
-    color "4"
-  ]
-  node [
-    id 290
-    label "uponthousands"
-    color "4"
-  ]
-  node [
-    id 291
-    label "IPhoneApps"
-    color "4"
-  ]
-  node [
-    id 292
-    label "geyik"
-    color "4"
-  ]
-  node [
-    id 293
-    label "talespinner"
-    color "0"
-  ]
-  node [
-    id 294
-    label "WendyM"
-    color "0"
-  ]
-  node [
-    id 295
-    label "racism"
-    color "0"
-  ]
-  node [
-    id 296
-    label "Jacob"
-    color "4"
-  ]
-  node [
-    id 297
-    label "Igor"
-    color "4"
-  ]
-  node [
-    id 298
-    label "updates"
-    color "4"
-  ]
-  node [
-    id 299
-    label "quotes"
-    color "0"
-  ]
-  node [
-    id 300
-    label "IraqDeathToll"
-    color "4"
-  ]
-  node [
-    id 301
-    label "Music"
-    color "5"
-  ]
-  node [
-    id 302
-    label "efluential"
-    color "0"
-  ]
-  node [
-    id 303
-    label "BlackMarket"
-    color "4"
-  ]
-  node [
-    id 304
-    label "tanjit"
-    color "0"
-  ]
-  node [
-    id 305
-    label "travel"
-    color "5"
-  ]
-  node [
-    id 306
-    label "interviewquestions"
-    color "4"
-  ]
-  node [
-    id 307
-    label "Dipsy"
-    color "4"
-  ]
-  node [
-    id 308
-    label "Graffiti"
-    color "1"
-  ]
-  node [
-    id 309
-    label "arabic"
-    color "0"
-  ]
-  node [
-    id 310
-    label "clownpenis_fart"
-    color "0"
-  ]
-  node [
-    id 311
-    label "jobpostings"
-    color "4"
-  ]
-  node [
-    id 312
-    label "kuebasah"
-    color "4"
-  ]
-  node [
-    id 313
-    label "WFRE"
-    color "4"
-  ]
-  node [
-    id 314
-    label "australia"
-    color "5"
-  ]
-  node [
-    id 315
-    label "motorbikes"
-    color "0"
-  ]
-  node [
-    id 316
-    label "y2cl"
-    color "4"
-  ]
-  node [
-    id 317
-    label "tinfoilhat"
-    color "0"
-  ]
-  node [
-    id 318
-    label "carhire01"
-    color "4"
-  ]
-  node [
-    id 319
-    label "landscaping"
-    color "4"
-  ]
-  node [
-    id 320
-    label "CKL"
-    color "4"
-  ]
-  node [
-    id 321
-    label "Green"
-    color "5"
-  ]
-  node [
-    id 322
-    label "Pacifism"
-    color "0"
-  ]
-  node [
-    id 323
-    label "wristtattoo"
-    color "4"
-  ]
-  node [
-    id 324
-    label "try"
-    color "4"
-  ]
-  node [
-    id 325
-    label "FISA"
-    color "0"
-  ]
-  node [
-    id 326
-    label "electronic_cigarette"
-    color "0"
-  ]
-  node [
-    id 327
-    label "beauty"
-    color "0"
-  ]
-  node [
-    id 328
-    label "CARHIRE"
-    color "4"
-  ]
-  node [
-    id 329
-    label "vmware"
-    color "4"
-  ]
-  node [
-    id 330
-    label "MASA"
-    color "4"
-  ]
-  node [
-    id 331
-    label "tempatan"
-    color "0"
-  ]
-  node [
-    id 332
-    label "cheerwine"
-    color "0"
-  ]
-  node [
-    id 333
-    label "memphis"
-    color "0"
-  ]
-  node [
-    id 334
-    label "MacleansMagazine"
-    color "0"
-  ]
-  node [
-    id 335
-    label "Autoseatcushions"
-    color "0"
-  ]
-  node [
-    id 336
-    label "Tonya"
-    color "0"
-  ]
-  node [
-    id 337
-    label "Pankaj"
-    color "4"
-  ]
-  node [
-    id 338
-    label "IndiMusic"
-    color "4"
-  ]
-  node [
-    id 339
-    label "CriminalBR"
-    color "0"
-  ]
-  node [
-    id 340
-    label "7Gossip"
-    color "4"
-  ]
-  node [
-    id 341
-    label "getrealtest"
-    color "0"
-  ]
-  node [
-    id 342
-    label "oversightings"
-    color "0"
-  ]
-  node [
-    id 343
-    label "bpdc"
-    color "4"
-  ]
-  node [
-    id 344
-    label "codeprojects"
-    color "1"
-  ]
-  node [
-    id 345
-    label "bitch_n_complain"
-    color "4"
-  ]
-  node [
-    id 346
-    label "Babyluver"
-    color "4"
-  ]
-  node [
-    id 347
-    label "ohwhataworld"
-    color "5"
-  ]
-  node [
-    id 348
-    label "ScrewYouGuys"
-    color "0"
-  ]
-  node [
-    id 349
-    label "iCoCo"
-    color "0"
-  ]
-  node [
-    id 350
-    label "Media_Sharing"
-    color "4"
-  ]
-  node [
-    id 351
-    label "haxe"
-    color "4"
-  ]
-  node [
-    id 352
-    label "scales"
-    color "4"
-  ]
-  node [
-    id 353
-    label "Gothic"
-    color "0"
-  ]
-  node [
-    id 354
-    label "Smiffys"
-    color "0"
-  ]
-  node [
-    id 355
-    label "baduk"
-    color "0"
-  ]
-  node [
-    id 356
-    label "thingsthatarefun"
-    color "4"
-  ]
-  node [
-    id 357
-    label "RealEstate"
-    color "4"
-  ]
-  node [
-    id 358
-    label "unclibwebteam"
-    color "4"
-  ]
-  node [
-    id 359
-    label "webhosting"
-    color "4"
-  ]
-  node [
-    id 360
-    label "jews"
-    color "0"
-  ]
-  node [
-    id 361
-    label "Decisions"
-    color "0"
-  ]
-  node [
-    id 362
-    label "doomedamerica"
-    color "4"
-  ]
-  node [
-    id 363
-    label "soccer"
-    color "1"
-  ]
-  node [
-    id 364
-    label "ANYVIDEO"
-    color "4"
-  ]
-  node [
-    id 365
-    label "travelers"
-    color "4"
-  ]
-  node [
-    id 366
-    label "JACKgg"
-    color "4"
-  ]
-  node [
-    id 367
-    label "INDO_US_NUCLEAR_DEAL"
-    color "0"
-  ]
-  node [
-    id 368
-    label "kde"
-    color "4"
-  ]
-  node [
-    id 369
-    label "Descary"
-    color "0"
-  ]
-  node [
-    id 370
-    label "DoraTheExplora"
-    color "4"
-  ]
-  node [
-    id 371
-    label "KaptainCo"
-    color "0"
-  ]
-  node [
-    id 372
-    label "stereo"
-    color "4"
-  ]
-  node [
-    id 373
-    label "RareList"
-    color "4"
-  ]
-  node [
-    id 374
-    label "StupidNinjaSociety"
-    color "4"
-  ]
-  node [
-    id 375
-    label "Palm"
-    color "0"
-  ]
-  node [
-    id 376
-    label "screwed"
-    color "0"
-  ]
-  node [
-    id 377
-    label "SerialMurder"
-    color "4"
-  ]
-  node [
-    id 378
-    label "it"
-    color "6"
-  ]
-  node [
-    id 379
-    label "Gogogadgetwidget"
-    color "0"
-  ]
-  node [
-    id 380
-    label "Christians"
-    color "0"
-  ]
-  node [
-    id 381
-    label "PCH"
-    color "4"
-  ]
-  node [
-    id 382
-    label "fotografiaainternet"
-    color "4"
-  ]
-  node [
-    id 383
-    label "programing"
-    color "4"
-  ]
-  node [
-    id 384
-    label "Songwriting"
-    color "0"
-  ]
-  node [
-    id 385
-    label "kriminals"
-    color "0"
-  ]
-  node [
-    id 386
-    label "PhotoBlog"
-    color "0"
-  ]
-  node [
-    id 387
-    label "harneu"
-    color "0"
-  ]
-  node [
-    id 388
-    label "hip_hop"
-    color "4"
-  ]
-  node [
-    id 389
-    label "orangeinks"
-    color "0"
-  ]
-  node [
-    id 390
-    label "nanowrimo"
-    color "4"
-  ]
-  node [
-    id 391
-    label "spammers"
-    color "4"
-  ]
-  node [
-    id 392
-    label "StarWars"
-    color "0"
-  ]
-  node [
-    id 393
-    label "catswithbacon"
-    color "4"
-  ]
-  node [
-    id 394
-    label "Psychedelic"
-    color "4"
-  ]
-  node [
-    id 395
-    label "ProMigrant"
-    color "4"
-  ]
-  node [
-    id 396
-    label "UKBUBBLE"
-    color "4"
-  ]
-  node [
-    id 397
-    label "narwhals"
-    color "4"
-  ]
-  node [
-    id 398
-    label "SinoBeta"
-    color "4"
-  ]
-  node [
-    id 399
-    label "unitedkingdom"
-    color "5"
-  ]
-  node [
-    id 400
-    label "Poojabrahmi"
-    color "0"
-  ]
-  node [
-    id 401
-    label "musicandnoise"
-    color "4"
-  ]
-  node [
-    id 402
-    label "rbeder"
-    color "4"
-  ]
-  node [
-    id 403
-    label "ppbb"
-    color "4"
-  ]
-  node [
-    id 404
-    label "Shortfilms"
-    color "0"
-  ]
-  node [
-    id 405
-    label "cool"
-    color "4"
-  ]
-  node [
-    id 406
-    label "Morrisseysolo"
-    color "4"
-  ]
-  node [
-    id 407
-    label "NaturalWomen"
-    color "4"
-  ]
-  node [
-    id 408
-    label "5Cene"
-    color "4"
-  ]
-  node [
-    id 409
-    label "ProcurementLeaders"
-    color "4"
-  ]
-  node [
-    id 410
-    label "Steeletravel"
-    color "4"
-  ]
-  node [
-    id 411
-    label "future"
-    color "0"
-  ]
-  node [
-    id 412
-    label "womentravel"
-    color "0"
-  ]
-  node [
-    id 413
-    label "floridasux"
-    color "4"
-  ]
-  node [
-    id 414
-    label "WomenOfColor"
-    color "4"
-  ]
-  node [
-    id 415
-    label "PLUSMOOD"
-    color "4"
-  ]
-  node [
-    id 416
-    label "DanSaltman"
-    color "0"
-  ]
-  node [
-    id 417
-    label "selfhelp"
-    color "1"
-  ]
-  node [
-    id 418
-    label "MailMeShirts"
-    color "4"
-  ]
-  node [
-    id 419
-    label "java"
-    color "1"
-  ]
-  node [
-    id 420
-    label "Parkour"
-    color "0"
-  ]
-  node [
-    id 421
-    label "oppositeday"
-    color "4"
-  ]
-  node [
-    id 422
-    label "Drugs"
-    color "5"
-  ]
-  node [
-    id 423
-    label "digg"
-    color "1"
-  ]
-  node [
-    id 424
-    label "conspiracies"
-    color "5"
-  ]
-  node [
-    id 425
-    label "mplatz"
-    color "4"
-  ]
-  node [
-    id 426
-    label "Austin"
-    color "0"
-  ]
-  node [
-    id 427
-    label "galeej"
-    color "0"
-  ]
-  node [
-    id 428
-    label "circlejerk"
-    color "4"
-  ]
-  node [
-    id 429
-    label "budiman"
-    color "4"
-  ]
-  node [
-    id 430
-    label "COPYRIGHT"
-    color "0"
-  ]
-  node [
-    id 431
-    label "ijustreddit"
-    color "0"
-  ]
-  node [
-    id 432
-    label "fakenews"
-    color "0"
-  ]
-  node [
-    id 433
-    label "ComputerWeekly"
-    color "4"
-  ]
-  node [
-    id 434
-    label "Pre_Bacon"
-    color "0"
-  ]
-  node [
-    id 435
-    label "RATS"
-    color "4"
-  ]
-  node [
-    id 436
-    label "ASKPCExperts"
-    color "0"
-  ]
-  node [
-    id 437
-    label "ElementaryEducation"
-    color "4"
-  ]
-  node [
-    id 438
-    label "agnosticism"
-    color "4"
-  ]
-  node [
-    id 439
-    label "filmbuff"
-    color "0"
-  ]
-  node [
-    id 440
-    label "ZenHabits"
-    color "5"
-  ]
-  node [
-    id 441
-    label "artistic"
-    color "4"
-  ]
-  node [
-    id 442
-    label "Tinnagorn"
-    color "0"
-  ]
-  node [
-    id 443
-    label "WeAreTheFilmMakers"
-    color "4"
-  ]
-  node [
-    id 444
-    label "lolz"
-    color "0"
-  ]
-  node [
-    id 445
-    label "uls"
-    color "0"
-  ]
-  node [
-    id 446
-    label "BlogContests"
-    color "0"
-  ]
-  node [
-    id 447
-    label "redditorpics"
-    color "4"
-  ]
-  node [
-    id 448
-    label "sociology"
-    color "1"
-  ]
-  node [
-    id 449
-    label "shirts"
-    color "4"
-  ]
-  node [
-    id 450
-    label "blender"
-    color "4"
-  ]
-  node [
-    id 451
-    label "magamed"
-    color "4"
-  ]
-  node [
-    id 452
-    label "blownmortgage"
-    color "4"
-  ]
-  node [
-    id 453
-    label "TechRadar"
-    color "0"
-  ]
-  node [
-    id 454
-    label "TechDaysTour"
-    color "4"
-  ]
-  node [
-    id 455
-    label "basura"
-    color "4"
-  ]
-  node [
-    id 456
-    label "PalinProblem"
-    color "5"
-  ]
-  node [
-    id 457
-    label "NonAustrianEconomics"
-    color "0"
-  ]
-  node [
-    id 458
-    label "Ezekiel"
-    color "0"
-  ]
-  node [
-    id 459
-    label "csnews"
-    color "4"
-  ]
-  node [
-    id 460
-    label "prolog"
-    color "0"
-  ]
-  node [
-    id 461
-    label "Indiana"
-    color "4"
-  ]
-  node [
-    id 462
-    label "openerp"
-    color "4"
-  ]
-  node [
-    id 463
-    label "scholarscamp"
-    color "0"
-  ]
-  node [
-    id 464
-    label "GreenEnergyNews"
-    color "0"
-  ]
-  node [
-    id 465
-    label "BurningMan"
-    color "0"
-  ]
-  node [
-    id 466
-    label "2008Olympics"
-    color "4"
-  ]
-  node [
-    id 467
-    label "TRADEMARK"
-    color "4"
-  ]
-  node [
-    id 468
-    label "iPhoneNews"
-    color "0"
-  ]
-  node [
-    id 469
-    label "Leoparr"
-    color "0"
-  ]
-  node [
-    id 470
-    label "Pirate"
-    color "0"
-  ]
-  node [
-    id 471
-    label "Concert"
-    color "0"
-  ]
-  node [
-    id 472
-    label "scripting"
-    color "0"
-  ]
-  node [
-    id 473
-    label "metaverse"
-    color "0"
-  ]
-  node [
-    id 474
-    label "MotherAboutInsane"
-    color "0"
-  ]
-  node [
-    id 475
-    label "BIZWIZ"
-    color "0"
-  ]
-  node [
-    id 476
-    label "honestly"
-    color "0"
-  ]
-  node [
-    id 477
-    label "heavy_metal"
-    color "4"
-  ]
-  node [
-    id 478
-    label "GinsanaEnergy"
-    color "4"
-  ]
-  node [
-    id 479
-    label "supdeeht"
-    color "0"
-  ]
-  node [
-    id 480
-    label "ajax"
-    color "4"
-  ]
-  node [
-    id 481
-    label "resources"
-    color "4"
-  ]
-  node [
-    id 482
-    label "Atkins"
-    color "4"
-  ]
-  node [
-    id 483
-    label "outrage"
-    color "0"
-  ]
-  node [
-    id 484
-    label "Lawyer"
-    color "0"
-  ]
-  node [
-    id 485
-    label "wackynews"
-    color "4"
-  ]
-  node [
-    id 486
-    label "gtd"
-    color "0"
-  ]
-  node [
-    id 487
-    label "lego"
-    color "4"
-  ]
-  node [
-    id 488
-    label "Theaters"
-    color "4"
-  ]
-  node [
-    id 489
-    label "IndiaOnline"
-    color "4"
-  ]
-  node [
-    id 490
-    label "feminisms"
-    color "5"
-  ]
-  node [
-    id 491
-    label "Opeth"
-    color "0"
-  ]
-  node [
-    id 492
-    label "flyingpenis"
-    color "0"
-  ]
-  node [
-    id 493
-    label "implead"
-    color "4"
-  ]
-  node [
-    id 494
-    label "nasa"
-    color "4"
-  ]
-  node [
-    id 495
-    label "Bnews"
-    color "0"
-  ]
-  node [
-    id 496
-    label "tattoosofgirls2"
-    color "4"
-  ]
-  node [
-    id 497
-    label "LeonaLewis"
-    color "0"
-  ]
-  node [
-    id 498
-    label "WalKnDude"
-    color "4"
-  ]
-  node [
-    id 499
-    label "diggstolefromreddit"
-    color "0"
-  ]
-  node [
-    id 500
-    label "johnmccain"
-    color "4"
-  ]
-  node [
-    id 501
-    label "BDSMStores"
-    color "0"
-  ]
-  node [
-    id 502
-    label "opensource"
-    color "0"
-  ]
-  node [
-    id 503
-    label "computergraphics"
-    color "4"
-  ]
-  node [
-    id 504
-    label "Tamil_Blogs"
-    color "4"
-  ]
-  node [
-    id 505
-    label "Transhuman"
-    color "5"
-  ]
-  node [
-    id 506
-    label "martialarts"
-    color "4"
-  ]
-  node [
-    id 507
-    label "rgwtest"
-    color "4"
-  ]
-  node [
-    id 508
-    label "redditsucks"
-    color "0"
-  ]
-  node [
-    id 509
-    label "Clockwork"
-    color "0"
-  ]
-  node [
-    id 510
-    label "parsoc"
-    color "0"
-  ]
-  node [
-    id 511
-    label "MooreForWomen"
-    color "4"
-  ]
-  node [
-    id 512
-    label "fsharp"
-    color "4"
-  ]
-  node [
-    id 513
-    label "EPICBACON"
-    color "4"
-  ]
-  node [
-    id 514
-    label "Online"
-    color "0"
-  ]
-  node [
-    id 515
-    label "Nurseries"
-    color "4"
-  ]
-  node [
-    id 516
-    label "KILO_ALDIRICI"
-    color "0"
-  ]
-  node [
-    id 517
-    label "Omemo"
-    color "0"
-  ]
-  node [
-    id 518
-    label "Pflegehilfe"
-    color "0"
-  ]
-  node [
-    id 519
-    label "produkt"
-    color "0"
-  ]
-  node [
-    id 520
-    label "emergenze"
-    color "0"
-  ]
-  node [
-    id 521
-    label "Labour"
-    color "0"
-  ]
-  node [
-    id 522
-    label "Petitions"
-    color "4"
-  ]
-  node [
-    id 523
-    label "PRICXwatch"
-    color "4"
-  ]
-  node [
-    id 524
-    label "lift"
-    color "0"
-  ]
-  node [
-    id 525
-    label "Ezinewriter"
-    color "0"
-  ]
-  node [
-    id 526
-    label "omoibadan"
-    color "0"
-  ]
-  node [
-    id 527
-    label "chidchan"
-    color "0"
-  ]
-  node [
-    id 528
-    label "aqzaveri"
-    color "4"
-  ]
-  node [
-    id 529
-    label "ethandit"
-    color "4"
-  ]
-  node [
-    id 530
-    label "govstuff"
-    color "4"
-  ]
-  node [
-    id 531
-    label "MSN_ADRESLERi"
-    color "4"
-  ]
-  node [
-    id 532
-    label "MarketPicks"
-    color "4"
-  ]
-  node [
-    id 533
-    label "foreignaffairs"
-    color "0"
-  ]
-  node [
-    id 534
-    label "shemale"
-    color "4"
-  ]
-  node [
-    id 535
-    label "invest"
-    color "4"
-  ]
-  node [
-    id 536
-    label "Fliiby"
-    color "4"
-  ]
-  node [
-    id 537
-    label "Gopinath"
-    color "4"
-  ]
-  node [
-    id 538
-    label "AquariumFish"
-    color "0"
-  ]
-  node [
-    id 539
-    label "Lookieloo"
-    color "4"
-  ]
-  node [
-    id 540
-    label "tidder"
-    color "4"
-  ]
-  node [
-    id 541
-    label "blasphemyhaven"
-    color "4"
-  ]
-  node [
-    id 542
-    label "rockerhifi"
-    color "0"
-  ]
-  node [
-    id 543
-    label "programming_pics"
-    color "0"
-  ]
-  node [
-    id 544
-    label "herddit"
-    color "0"
-  ]
-  node [
-    id 545
-    label "cfi"
-    color "4"
-  ]
-  node [
-    id 546
-    label "badreddit"
-    color "4"
-  ]
-  node [
-    id 547
-    label "BlueCheese"
-    color "4"
-  ]
-  node [
-    id 548
-    label "ask"
-    color "1"
-  ]
-  node [
-    id 549
-    label "hurts_my_eyes"
-    color "5"
-  ]
-  node [
-    id 550
-    label "hivemind"
-    color "0"
-  ]
-  node [
-    id 551
-    label "SOA"
-    color "0"
-  ]
-  node [
-    id 552
-    label "kooks"
-    color "0"
-  ]
-  node [
-    id 553
-    label "theworld"
-    color "4"
-  ]
-  node [
-    id 554
-    label "TwilightGurl"
-    color "0"
-  ]
-  node [
-    id 555
-    label "hotselling"
-    color "0"
-  ]
-  node [
-    id 556
-    label "web20development"
-    color "4"
-  ]
-  node [
-    id 557
-    label "Woerterbuch"
-    color "4"
-  ]
-  node [
-    id 558
-    label "PCebooks"
-    color "0"
-  ]
-  node [
-    id 559
-    label "naphi"
-    color "0"
-  ]
-  node [
-    id 560
-    label "galaxyweblinks"
-    color "0"
-  ]
-  node [
-    id 561
-    label "hrw"
-    color "5"
-  ]
-  node [
-    id 562
-    label "Shopaholic"
-    color "4"
-  ]
-  node [
-    id 563
-    label "makhanhar"
-    color "0"
-  ]
-  node [
-    id 564
-    label "byu"
-    color "0"
-  ]
-  node [
-    id 565
-    label "Energy_Efficiency"
-    color "0"
-  ]
-  node [
-    id 566
-    label "ferdinando"
-    color "4"
-  ]
-  node [
-    id 567
-    label "CHHC"
-    color "4"
-  ]
-  node [
-    id 568
-    label "Conserve"
-    color "0"
-  ]
-  node [
-    id 569
-    label "Amazingdit"
-    color "4"
-  ]
-  node [
-    id 570
-    label "titan"
-    color "4"
-  ]
-  node [
-    id 571
-    label "BookSmarts"
-    color "0"
-  ]
-  node [
-    id 572
-    label "Roosta"
-    color "0"
-  ]
-  node [
-    id 573
-    label "Zensky"
-    color "4"
-  ]
-  node [
-    id 574
-    label "rest"
-    color "0"
-  ]
-  node [
-    id 575
-    label "CoolBikes"
-    color "4"
-  ]
-  node [
-    id 576
-    label "testing12332"
-    color "0"
-  ]
-  node [
-    id 577
-    label "gp2x"
-    color "4"
-  ]
-  node [
-    id 578
-    label "inflatable"
-    color "4"
-  ]
-  node [
-    id 579
-    label "sportscars"
-    color "0"
-  ]
-  node [
-    id 580
-    label "pylu"
-    color "4"
-  ]
-  node [
-    id 581
-    label "netaudio"
-    color "4"
-  ]
-  node [
-    id 582
-    label "hookah"
-    color "0"
-  ]
-  node [
-    id 583
-    label "word"
-    color "0"
-  ]
-  node [
-    id 584
-    label "Cruises"
-    color "4"
-  ]
-  node [
-    id 585
-    label "cros"
-    color "0"
-  ]
-  node [
-    id 586
-    label "lyrics"
-    color "4"
-  ]
-  node [
-    id 587
-    label "fredwissman"
-    color "4"
-  ]
-  node [
-    id 588
-    label "KarenLiberation"
-    color "4"
-  ]
-  node [
-    id 589
-    label "BABScience"
-    color "0"
-  ]
-  node [
-    id 590
-    label "reeemix"
-    color "0"
-  ]
-  node [
-    id 591
-    label "hockeysphere"
-    color "4"
-  ]
-  node [
-    id 592
-    label "sunsecurity"
-    color "0"
-  ]
-  node [
-    id 593
-    label "redneck"
-    color "4"
-  ]
-  node [
-    id 594
-    label "Woikr"
-    color "0"
-  ]
-  node [
-    id 595
-    label "ManchesterUTD"
-    color "0"
-  ]
-  node [
-    id 596
-    label "acriacao"
-    color "0"
-  ]
-  node [
-    id 597
-    label "_Descary"
-    color "0"
-  ]
-  node [
-    id 598
-    label "awesome"
-    color "0"
-  ]
-  node [
-    id 599
-    label "Domaining"
-    color "0"
-  ]
-  node [
-    id 600
-    label "Dumitru"
-    color "0"
-  ]
-  node [
-    id 601
-    label "dev"
-    color "4"
-  ]
-  node [
-    id 602
-    label "ronpaul"
-    color "5"
-  ]
-  node [
-    id 603
-    label "trackbike"
-    color "4"
-  ]
-  node [
-    id 604
-    label "writing"
-    color "5"
-  ]
-  node [
-    id 605
-    label "boardgames"
-    color "0"
-  ]
-  node [
-    id 606
-    label "Mackorisnik"
-    color "4"
-  ]
-  node [
-    id 607
-    label "enviroknow"
-    color "4"
-  ]
-  node [
-    id 608
-    label "WebGames"
-    color "5"
-  ]
-  node [
-    id 609
-    label "sweden"
-    color "4"
-  ]
-  node [
-    id 610
-    label "angelsflower"
-    color "0"
-  ]
-  node [
-    id 611
-    label "linkai"
-    color "4"
-  ]
-  node [
-    id 612
-    label "unlockiphoneliveseo"
-    color "4"
-  ]
-  node [
-    id 613
-    label "ComProg"
-    color "4"
-  ]
-  node [
-    id 614
-    label "SRRAR"
-    color "4"
-  ]
-  node [
-    id 615
-    label "WebsiteDevelopers"
-    color "0"
-  ]
-  node [
-    id 616
-    label "Besim"
-    color "0"
-  ]
-  node [
-    id 617
-    label "cooltales"
-    color "4"
-  ]
-  node [
-    id 618
-    label "Idea2Company"
-    color "4"
-  ]
-  node [
-    id 619
-    label "elain"
-    color "4"
-  ]
-  node [
-    id 620
-    label "Ringernation"
-    color "0"
-  ]
-  node [
-    id 621
-    label "TakeAction"
-    color "0"
-  ]
-  node [
-    id 622
-    label "redditman"
-    color "4"
-  ]
-  node [
-    id 623
-    label "Archaeology"
-    color "4"
-  ]
-  node [
-    id 624
-    label "eu"
-    color "4"
-  ]
-  node [
-    id 625
-    label "CollegeCounseling"
-    color "0"
-  ]
-  node [
-    id 626
-    label "greenmachinestour"
-    color "4"
-  ]
-  node [
-    id 627
-    label "puppies"
-    color "4"
-  ]
-  node [
-    id 628
-    label "WendyClem"
-    color "0"
-  ]
-  node [
-    id 629
-    label "Shinobi"
-    color "0"
-  ]
-  node [
-    id 630
-    label "literature"
-    color "5"
-  ]
-  node [
-    id 631
-    label "Marketallica"
-    color "0"
-  ]
-  node [
-    id 632
-    label "MMA"
-    color "5"
-  ]
-  node [
-    id 633
-    label "GreenMGSM"
-    color "4"
-  ]
-  node [
-    id 634
-    label "imprimerie"
-    color "4"
-  ]
-  node [
-    id 635
-    label "WildwoodNJ"
-    color "4"
-  ]
-  node [
-    id 636
-    label "Cathar"
-    color "4"
-  ]
-  node [
-    id 637
-    label "trippy"
-    color "4"
-  ]
-  node [
-    id 638
-    label "Eve"
-    color "4"
-  ]
-  node [
-    id 639
-    label "wwww"
-    color "0"
-  ]
-  node [
-    id 640
-    label "breakingBUZZ"
-    color "0"
-  ]
-  node [
-    id 641
-    label "ucf"
-    color "4"
-  ]
-  node [
-    id 642
-    label "DandD"
-    color "0"
-  ]
-  node [
-    id 643
-    label "testname"
-    color "0"
-  ]
-  node [
-    id 644
-    label "Esperanto"
-    color "0"
-  ]
-  node [
-    id 645
-    label "athiest"
-    color "0"
-  ]
-  node [
-    id 646
-    label "OperaMusic"
-    color "4"
-  ]
-  node [
-    id 647
-    label "ouddy"
-    color "4"
-  ]
-  node [
-    id 648
-    label "Chinese"
-    color "3"
-  ]
-  node [
-    id 649
-    label "LosAngeles"
-    color "4"
-  ]
-  node [
-    id 650
-    label "lamengao"
-    color "0"
-  ]
-  node [
-    id 651
-    label "Unanimous"
-    color "5"
-  ]
-  node [
-    id 652
-    label "spoilers"
-    color "4"
-  ]
-  node [
-    id 653
-    label "Socialize"
-    color "5"
-  ]
-  node [
-    id 654
-    label "sdcc1"
-    color "0"
-  ]
-  node [
-    id 655
-    label "RedditorCreations"
-    color "4"
-  ]
-  node [
-    id 656
-    label "Yamen"
-    color "4"
-  ]
-  node [
-    id 657
-    label "bodybuilding"
-    color "0"
-  ]
-  node [
-    id 658
-    label "ArunzFormula1"
-    color "0"
-  ]
-  node [
-    id 659
-    label "AmandaNRoy"
-    color "0"
-  ]
-  node [
-    id 660
-    label "Websites"
-    color "4"
-  ]
-  node [
-    id 661
-    label "snobs"
-    color "1"
-  ]
-  node [
-    id 662
-    label "socialinvesting"
-    color "4"
-  ]
-  node [
-    id 663
-    label "Vofferu"
-    color "0"
-  ]
-  node [
-    id 664
-    label "tattoos"
-    color "0"
-  ]
-  node [
-    id 665
-    label "Contractors"
-    color "4"
-  ]
-  node [
-    id 666
-    label "formula1"
-    color "4"
-  ]
-  node [
-    id 667
-    label "baltimore"
-    color "0"
-  ]
-  node [
-    id 668
-    label "webdeals"
-    color "0"
-  ]
-  node [
-    id 669
-    label "DarkPoetFawn"
-    color "0"
-  ]
-  node [
-    id 670
-    label "gadgetlab"
-    color "4"
-  ]
-  node [
-    id 671
-    label "google"
-    color "0"
-  ]
-  node [
-    id 672
-    label "reddit7752"
-    color "0"
-  ]
-  node [
-    id 673
-    label "PoliticalAction"
-    color "4"
-  ]
-  node [
-    id 674
-    label "adventuresports"
-    color "0"
-  ]
-  node [
-    id 675
-    label "gonewild"
-    color "5"
-  ]
-  node [
-    id 676
-    label "zoepster"
-    color "4"
-  ]
-  node [
-    id 677
-    label "Colorado"
-    color "4"
-  ]
-  node [
-    id 678
-    label "ExDiggers"
-    color "0"
-  ]
-  node [
-    id 679
-    label "fuckedinvestmentbank"
-    color "0"
-  ]
-  node [
-    id 680
-    label "taoism"
-    color "0"
-  ]
-  node [
-    id 681
-    label "smritinayar"
-    color "4"
-  ]
-  node [
-    id 682
-    label "funnyvideos"
-    color "0"
-  ]
-  node [
-    id 683
-    label "puns"
-    color "0"
-  ]
-  node [
-    id 684
-    label "sl"
-    color "0"
-  ]
-  node [
-    id 685
-    label "onlinelivemeeting"
-    color "4"
-  ]
-  node [
-    id 686
-    label "simon"
-    color "0"
-  ]
-  node [
-    id 687
-    label "cheat_sheets"
-    color "0"
-  ]
-  node [
-    id 688
-    label "FiestyCharlie"
-    color "4"
-  ]
-  node [
-    id 689
-    label "haskell"
-    color "9"
-  ]
-  node [
-    id 690
-    label "peaceulloan"
-    color "4"
-  ]
-  node [
-    id 691
-    label "Marxism"
-    color "4"
-  ]
-  node [
-    id 692
-    label "theflatlanders"
-    color "0"
-  ]
-  node [
-    id 693
-    label "toonsUp"
-    color "0"
-  ]
-  node [
-    id 694
-    label "Thaiblog"
-    color "0"
-  ]
-  node [
-    id 695
-    label "dotfiles"
-    color "0"
-  ]
-  node [
-    id 696
-    label "downvote"
-    color "0"
-  ]
-  node [
-    id 697
-    label "Ongofu"
-    color "4"
-  ]
-  node [
-    id 698
-    label "rankreddit"
-    color "0"
-  ]
-  node [
-    id 699
-    label "Mariakiru"
-    color "4"
-  ]
-  node [
-    id 700
-    label "franco_security"
-    color "0"
-  ]
-  node [
-    id 701
-    label "polyphasic"
-    color "4"
-  ]
-  node [
-    id 702
-    label "terrible"
-    color "4"
-  ]
-  node [
-    id 703
-    label "BEEINGE"
-    color "0"
-  ]
-  node [
-    id 704
-    label "LiverpoolFC"
-    color "0"
-  ]
-  node [
-    id 705
-    label "tiptopmovie"
-    color "0"
-  ]
-  node [
-    id 706
-    label "loosupaya"
-    color "0"
-  ]
-  node [
-    id 707
-    label "Asiaobserver"
-    color "0"
-  ]
-  node [
-    id 708
-    label "technobay"
-    color "4"
-  ]
-  node [
-    id 709
-    label "kokonios"
-    color "0"
-  ]
-  node [
-    id 710
-    label "AvaBea"
-    color "4"
-  ]
-  node [
-    id 711
-    label "Iwillblowupthelaptop"
-    color "0"
-  ]
-  node [
-    id 712
-    label "Fitness"
-    color "5"
-  ]
-  node [
-    id 713
-    label "startfs"
-    color "4"
-  ]
-  node [
-    id 714
-    label "sexytern"
-    color "4"
-  ]
-  node [
-    id 715
-    label "Missed_Opportunities"
-    color "0"
-  ]
-  node [
-    id 716
-    label "WorkHappyNow"
-    color "4"
-  ]
-  node [
-    id 717
-    label "AmericanGovernment"
-    color "5"
-  ]
-  node [
-    id 718
-    label "TrivaniTeam"
-    color "4"
-  ]
-  node [
-    id 719
-    label "microsoft"
-    color "5"
-  ]
-  node [
-    id 720
-    label "nobama"
-    color "0"
-  ]
-  node [
-    id 721
-    label "gaynsfw"
-    color "4"
-  ]
-  node [
-    id 722
-    label "waaagh"
-    color "4"
-  ]
-  node [
-    id 723
-    label "innovationGarage"
-    color "4"
-  ]
-  node [
-    id 724
-    label "government"
-    color "5"
-  ]
-  node [
-    id 725
-    label "devcanon"
-    color "4"
-  ]
-  node [
-    id 726
-    label "logocompetition"
-    color "4"
-  ]
-  node [
-    id 727
-    label "TheTechLabs"
-    color "0"
-  ]
-  node [
-    id 728
-    label "COMMARKETING"
-    color "0"
-  ]
-  node [
-    id 729
-    label "Peiman"
-    color "4"
-  ]
-  node [
-    id 730
-    label "Charlottesville"
-    color "0"
-  ]
-  node [
-    id 731
-    label "jissmiss"
-    color "4"
-  ]
-  node [
-    id 732
-    label "Manuj"
-    color "0"
-  ]
-  node [
-    id 733
-    label "socialmedia"
-    color "5"
-  ]
-  node [
-    id 734
-    label "accessibility"
-    color "0"
-  ]
-  node [
-    id 735
-    label "TipsterHosting"
-    color "0"
-  ]
-  node [
-    id 736
-    label "lunchatdolbey"
-    color "4"
-  ]
-  node [
-    id 737
-    label "foom"
-    color "0"
-  ]
-  node [
-    id 738
-    label "Health"
-    color "5"
-  ]
-  node [
-    id 739
-    label "ColorBlind"
-    color "0"
-  ]
-  node [
-    id 740
-    label "ANTISHARIA"
-    color "4"
-  ]
-  node [
-    id 741
-    label "flashlight"
-    color "0"
-  ]
-  node [
-    id 742
-    label "BayuAditya"
-    color "0"
-  ]
-  node [
-    id 743
-    label "davidhood189"
-    color "4"
-  ]
-  node [
-    id 744
-    label "amarok"
-    color "0"
-  ]
-  node [
-    id 745
-    label "poetscorner"
-    color "0"
-  ]
-  node [
-    id 746
-    label "FoodBlog"
-    color "4"
-  ]
-  node [
-    id 747
-    label "sunum"
-    color "0"
-  ]
-  node [
-    id 748
-    label "Reprap"
-    color "4"
-  ]
-  node [
-    id 749
-    label "youre_doing_it_wrong"
-    color "4"
-  ]
-  node [
-    id 750
-    label "pssdrafts"
-    color "4"
-  ]
-  node [
-    id 751
-    label "science"
-    color "5"
-  ]
-  node [
-    id 752
-    label "shell"
-    color "4"
-  ]
-  node [
-    id 753
-    label "wackyworld"
-    color "1"
-  ]
-  node [
-    id 754
-    label "Radixweb"
-    color "4"
-  ]
-  node [
-    id 755
-    label "badmusic"
-    color "4"
-  ]
-  node [
-    id 756
-    label "knitting"
-    color "4"
-  ]
-  node [
-    id 757
-    label "umass"
-    color "0"
-  ]
-  node [
-    id 758
-    label "bnm"
-    color "0"
-  ]
-  node [
-    id 759
-    label "Rachel61"
-    color "4"
-  ]
-  node [
-    id 760
-    label "theg33kshow"
-    color "4"
-  ]
-  node [
-    id 761
-    label "subvertising"
-    color "4"
-  ]
-  node [
-    id 762
-    label "Catholicism"
-    color "4"
-  ]
-  node [
-    id 763
-    label "binoshtb"
-    color "0"
-  ]
-  node [
-    id 764
-    label "zh"
-    color "1"
-  ]
-  node [
-    id 765
-    label "interactiondesign"
-    color "0"
-  ]
-  node [
-    id 766
-    label "wrexham"
-    color "0"
-  ]
-  node [
-    id 767
-    label "atrocity"
-    color "0"
-  ]
-  node [
-    id 768
-    label "TheOnion"
-    color "0"
-  ]
-  node [
-    id 769
-    label "deanver"
-    color "4"
-  ]
-  node [
-    id 770
-    label "pHwebdev"
-    color "0"
-  ]
-  node [
-    id 771
-    label "Solorya"
-    color "4"
-  ]
-  node [
-    id 772
-    label "MaryaSusan1"
-    color "0"
-  ]
-  node [
-    id 773
-    label "nintendo"
-    color "0"
-  ]
-  node [
-    id 774
-    label "pics"
-    color "5"
-  ]
-  node [
-    id 775
-    label "kenyoncreditservices"
-    color "0"
-  ]
-  node [
-    id 776
-    label "imageboards"
-    color "0"
-  ]
-  node [
-    id 777
-    label "bronson"
-    color "4"
-  ]
-  node [
-    id 778
-    label "Anxiety"
-    color "4"
-  ]
-  node [
-    id 779
-    label "Dhimmitude"
-    color "0"
-  ]
-  node [
-    id 780
-    label "singularity"
-    color "0"
-  ]
-  node [
-    id 781
-    label "ABCCouriers"
-    color "4"
-  ]
-  node [
-    id 782
-    label "environment2"
-    color "0"
-  ]
-  node [
-    id 783
-    label "war"
-    color "4"
-  ]
-  node [
-    id 784
-    label "criticalminds"
-    color "0"
-  ]
-  node [
-    id 785
-    label "limaumanis"
-    color "0"
-  ]
-  node [
-    id 786
-    label "AmerikanPolizei"
-    color "4"
-  ]
-  node [
-    id 787
-    label "Haah"
-    color "4"
-  ]
-  node [
-    id 788
-    label "statistics"
-    color "0"
-  ]
-  node [
-    id 789
-    label "Viajes"
-    color "0"
-  ]
-  node [
-    id 790
-    label "oldlive"
-    color "0"
-  ]
-  node [
-    id 791
-    label "AmateurPorn"
-    color "0"
-  ]
-  node [
-    id 792
-    label "Ohio_News"
-    color "0"
-  ]
-  node [
-    id 793
-    label "ca"
-    color "4"
-  ]
-  node [
-    id 794
-    label "ChanningTatum"
-    color "0"
-  ]
-  node [
-    id 795
-    label "Golfo"
-    color "0"
-  ]
-  node [
-    id 796
-    label "Tintomara"
-    color "4"
-  ]
-  node [
-    id 797
-    label "VGC"
-    color "4"
-  ]
-  node [
-    id 798
-    label "happy"
-    color "5"
-  ]
-  node [
-    id 799
-    label "videogames"
-    color "0"
-  ]
-  node [
-    id 800
-    label "bostonceltics"
-    color "4"
-  ]
-  node [
-    id 801
-    label "aviation"
-    color "1"
-  ]
-  node [
-    id 802
-    label "Confucianism"
-    color "4"
-  ]
-  node [
-    id 803
-    label "NaturalDisasters"
-    color "4"
-  ]
-  node [
-    id 804
-    label "extremeprogramming"
-    color "4"
-  ]
-  node [
-    id 805
-    label "lovethepast"
-    color "0"
-  ]
-  node [
-    id 806
-    label "Magic"
-    color "4"
-  ]
-  node [
-    id 807
-    label "beachweddings"
-    color "4"
-  ]
-  node [
-    id 808
-    label "Parenting"
-    color "1"
-  ]
-  node [
-    id 809
-    label "Fishing"
-    color "0"
-  ]
-  node [
-    id 810
-    label "eric"
-    color "0"
-  ]
-  node [
-    id 811
-    label "blog"
-    color "0"
-  ]
-  node [
-    id 812
-    label "Infosec2008"
-    color "4"
-  ]
-  node [
-    id 813
-    label "Urbandead"
-    color "0"
-  ]
-  node [
-    id 814
-    label "papercraft"
-    color "4"
-  ]
-  node [
-    id 815
-    label "Cappuccino"
-    color "0"
-  ]
-  node [
-    id 816
-    label "transhumanism"
-    color "0"
-  ]
-  node [
-    id 817
-    label "Tenurist"
-    color "0"
-  ]
-  node [
-    id 818
-    label "PGD"
-    color "0"
-  ]
-  node [
-    id 819
-    label "Cow"
-    color "4"
-  ]
-  node [
-    id 820
-    label "Sense"
-    color "4"
-  ]
-  node [
-    id 821
-    label "sceptics"
-    color "0"
-  ]
-  node [
-    id 822
-    label "redesign"
-    color "0"
-  ]
-  node [
-    id 823
-    label "Halo2x"
-    color "0"
-  ]
-  node [
-    id 824
-    label "operabrowser"
-    color "0"
-  ]
-  node [
-    id 825
-    label "Biography"
-    color "4"
-  ]
-  node [
-    id 826
-    label "sanfrancisco"
-    color "0"
-  ]
-  node [
-    id 827
-    label "moon"
-    color "4"
-  ]
-  node [
-    id 828
-    label "Mechatroniker"
-    color "0"
-  ]
-  node [
-    id 829
-    label "cristyano"
-    color "4"
-  ]
-  node [
-    id 830
-    label "wireless"
-    color "4"
-  ]
-  node [
-    id 831
-    label "Dinosaurs"
-    color "0"
-  ]
-  node [
-    id 832
-    label "gps"
-    color "4"
-  ]
-  node [
-    id 833
-    label "GeoAtreides"
-    color "0"
-  ]
-  node [
-    id 834
-    label "pycon2008"
-    color "0"
-  ]
-  node [
-    id 835
-    label "solucionesseo"
-    color "0"
-  ]
-  node [
-    id 836
-    label "triumphproperty"
-    color "4"
-  ]
-  node [
-    id 837
-    label "Crowdsourcing"
-    color "4"
-  ]
-  node [
-    id 838
-    label "CAKEWIN"
-    color "0"
-  ]
-  node [
-    id 839
-    label "Christmasparty"
-    color "4"
-  ]
-  node [
-    id 840
-    label "HernandoRealty"
-    color "4"
-  ]
-  node [
-    id 841
-    label "TwilightLinks"
-    color "0"
-  ]
-  node [
-    id 842
-    label "area51"
-    color "5"
-  ]
-  node [
-    id 843
-    label "not_bacon"
-    color "0"
-  ]
-  node [
-    id 844
-    label "trash"
-    color "0"
-  ]
-  node [
-    id 845
-    label "HowToDIY"
-    color "4"
-  ]
-  node [
-    id 846
-    label "Bluegrass"
-    color "0"
-  ]
-  node [
-    id 847
-    label "infp"
-    color "4"
-  ]
-  node [
-    id 848
-    label "Coq"
-    color "0"
-  ]
-  node [
-    id 849
-    label "KhmerLife"
-    color "0"
-  ]
-  node [
-    id 850
-    label "akhilbali"
-    color "4"
-  ]
-  node [
-    id 851
-    label "Blogging"
-    color "1"
-  ]
-  node [
-    id 852
-    label "YoDawg"
-    color "4"
-  ]
-  node [
-    id 853
-    label "DB2"
-    color "0"
-  ]
-  node [
-    id 854
-    label "IntellectualReddit"
-    color "4"
-  ]
-  node [
-    id 855
-    label "basis"
-    color "0"
-  ]
-  node [
-    id 856
-    label "spatula_city"
-    color "0"
-  ]
-  node [
-    id 857
-    label "diabetes"
-    color "0"
-  ]
-  node [
-    id 858
-    label "HorribleIdea"
-    color "4"
-  ]
-  node [
-    id 859
-    label "rdpriest"
-    color "0"
-  ]
-  node [
-    id 860
-    label "leBuzzdeLamar"
-    color "4"
-  ]
-  node [
-    id 861
-    label "telecom"
-    color "4"
-  ]
-  node [
-    id 862
-    label "Happynews"
-    color "4"
-  ]
-  node [
-    id 863
-    label "webcam"
-    color "0"
-  ]
-  node [
-    id 864
-    label "DarK"
-    color "4"
-  ]
-  node [
-    id 865
-    label "JetSetSocialite"
-    color "0"
-  ]
-  node [
-    id 866
-    label "gogame"
-    color "0"
-  ]
-  node [
-    id 867
-    label "bathrooms"
-    color "4"
-  ]
-  node [
-    id 868
-    label "matjackson"
-    color "0"
-  ]
-  node [
-    id 869
-    label "rpg"
-    color "5"
-  ]
-  node [
-    id 870
-    label "cms"
-    color "4"
-  ]
-  node [
-    id 871
-    label "euro"
-    color "5"
-  ]
-  node [
-    id 872
-    label "Quebec"
-    color "4"
-  ]
-  node [
-    id 873
-    label "tapefind"
-    color "0"
-  ]
-  node [
-    id 874
-    label "books"
-    color "5"
-  ]
-  node [
-    id 875
-    label "Apocalypse"
-    color "4"
-  ]
-  node [
-    id 876
-    label "bertels"
-    color "4"
-  ]
-  node [
-    id 877
-    label "recipes"
-    color "5"
-  ]
-  node [
-    id 878
-    label "grails"
-    color "4"
-  ]
-  node [
-    id 879
-    label "DaveRamsey"
-    color "0"
-  ]
-  node [
-    id 880
-    label "AcademicArticles"
-    color "0"
-  ]
-  node [
-    id 881
-    label "Uniongal"
-    color "0"
-  ]
-  node [
-    id 882
-    label "gis"
-    color "4"
-  ]
-  node [
-    id 883
-    label "rva"
-    color "0"
-  ]
-  node [
-    id 884
-    label "Webmasters"
-    color "0"
-  ]
-  node [
-    id 885
-    label "ATL"
-    color "4"
-  ]
-  node [
-    id 886
-    label "cuetians"
-    color "0"
-  ]
-  node [
-    id 887
-    label "ldingo"
-    color "4"
-  ]
-  node [
-    id 888
-    label "Monterrey"
-    color "0"
-  ]
-  node [
-    id 889
-    label "thestem"
-    color "0"
-  ]
-  node [
-    id 890
-    label "furniture"
-    color "0"
-  ]
-  node [
-    id 891
-    label "Francophone"
-    color "0"
-  ]
-  node [
-    id 892
-    label "Annoying"
-    color "0"
-  ]
-  node [
-    id 893
-    label "AsesoresInversiones"
-    color "0"
-  ]
-  node [
-    id 894
-    label "houseless"
-    color "4"
-  ]
-  node [
-    id 895
-    label "testingaufdeutsch"
-    color "4"
-  ]
-  node [
-    id 896
-    label "Leitmotivmedia"
-    color "0"
-  ]
-  node [
-    id 897
-    label "appdata"
-    color "4"
-  ]
-  node [
-    id 898
-    label "free_thought"
-    color "4"
-  ]
-  node [
-    id 899
-    label "homedreamtheater"
-    color "0"
-  ]
-  node [
-    id 900
-    label "BLS"
-    color "4"
-  ]
-  node [
-    id 901
-    label "maninee"
-    color "0"
-  ]
-  node [
-    id 902
-    label "Oberon"
-    color "4"
-  ]
-  node [
-    id 903
-    label "animations"
-    color "0"
-  ]
-  node [
-    id 904
-    label "medienytt"
-    color "0"
-  ]
-  node [
-    id 905
-    label "jos"
-    color "4"
-  ]
-  node [
-    id 906
-    label "weddingfavors"
-    color "0"
-  ]
-  node [
-    id 907
-    label "scion"
-    color "0"
-  ]
-  node [
-    id 908
-    label "request"
-    color "4"
-  ]
-  node [
-    id 909
-    label "captainreboot"
-    color "0"
-  ]
-  node [
-    id 910
-    label "letterwritingguide"
-    color "0"
-  ]
-  node [
-    id 911
-    label "csharp"
-    color "0"
-  ]
-  node [
-    id 912
-    label "KeralaWebWorks"
-    color "0"
-  ]
-  node [
-    id 913
-    label "GregSlevin"
-    color "4"
-  ]
-  node [
-    id 914
-    label "Weird"
-    color "0"
-  ]
-  node [
-    id 915
-    label "akira"
-    color "0"
-  ]
-  node [
-    id 916
-    label "cpp"
-    color "4"
-  ]
-  node [
-    id 917
-    label "NERInews"
-    color "0"
-  ]
-  node [
-    id 918
-    label "penis"
-    color "4"
-  ]
-  node [
-    id 919
-    label "OCPaddler"
-    color "4"
-  ]
-  node [
-    id 920
-    label "ArtBook"
-    color "4"
-  ]
-  node [
-    id 921
-    label "Dayspamiami"
-    color "0"
-  ]
-  node [
-    id 922
-    label "notusa"
-    color "0"
-  ]
-  node [
-    id 923
-    label "LegallyMinded"
-    color "4"
-  ]
-  node [
-    id 924
-    label "xotcl"
-    color "4"
-  ]
-  node [
-    id 925
-    label "Horoscop"
-    color "0"
-  ]
-  node [
-    id 926
-    label "BilaBila"
-    color "0"
-  ]
-  node [
-    id 927
-    label "DIY"
-    color "5"
-  ]
-  node [
-    id 928
-    label "Saltworks"
-    color "0"
-  ]
-  node [
-    id 929
-    label "RightsandLaw"
-    color "4"
-  ]
-  node [
-    id 930
-    label "consciousness"
-    color "0"
-  ]
-  node [
-    id 931
-    label "stephanerd"
-    color "0"
-  ]
-  node [
-    id 932
-    label "kimkardashian"
-    color "4"
-  ]
-  node [
-    id 933
-    label "shock"
-    color "0"
-  ]
-  node [
-    id 934
-    label "userscripts"
-    color "0"
-  ]
-  node [
-    id 935
-    label "srch"
-    color "0"
-  ]
-  node [
-    id 936
-    label "Freemark"
-    color "4"
-  ]
-  node [
-    id 937
-    label "blanket"
-    color "0"
-  ]
-  node [
-    id 938
-    label "PoliticsUK"
-    color "0"
-  ]
-  node [
-    id 939
-    label "MeeID"
-    color "0"
-  ]
-  node [
-    id 940
-    label "yoomeo"
-    color "4"
-  ]
-  node [
-    id 941
-    label "qclabels"
-    color "0"
-  ]
-  node [
-    id 942
-    label "arduino"
-    color "4"
-  ]
-  node [
-    id 943
-    label "ScottWhiskeyeBlog"
-    color "4"
-  ]
-  node [
-    id 944
-    label "Asiana"
-    color "4"
-  ]
-  node [
-    id 945
-    label "NEWWIDE"
-    color "4"
-  ]
-  node [
-    id 946
-    label "miscellaneous"
-    color "4"
-  ]
-  node [
-    id 947
-    label "sourceec"
-    color "4"
-  ]
-  node [
-    id 948
-    label "potatoarecool"
-    color "4"
-  ]
-  node [
-    id 949
-    label "Hapi"
-    color "0"
-  ]
-  node [
-    id 950
-    label "plazanetwork"
-    color "4"
-  ]
-  node [
-    id 951
-    label "Qtour"
-    color "0"
-  ]
-  node [
-    id 952
-    label "SensitiveHeadlines"
-    color "4"
-  ]
-  node [
-    id 953
-    label "breakingradio"
-    color "4"
-  ]
-  node [
-    id 954
-    label "my_little_interests"
-    color "4"
-  ]
-  node [
-    id 955
-    label "gianu"
-    color "4"
-  ]
-  node [
-    id 956
-    label "birding"
-    color "0"
-  ]
-  node [
-    id 957
-    label "sets"
-    color "4"
-  ]
-  node [
-    id 958
-    label "sambaja"
-    color "0"
-  ]
-  node [
-    id 959
-    label "Antiglobalism"
-    color "4"
-  ]
-  node [
-    id 960
-    label "webtools"
-    color "4"
-  ]
-  node [
-    id 961
-    label "chocolate"
-    color "4"
-  ]
-  node [
-    id 962
-    label "Africa"
-    color "0"
-  ]
-  node [
-    id 963
-    label "web"
-    color "0"
-  ]
-  node [
-    id 964
-    label "torrents"
-    color "5"
-  ]
-  node [
-    id 965
-    label "bootstrapping"
-    color "4"
-  ]
-  node [
-    id 966
-    label "ExclusivelyDogBeds"
-    color "4"
-  ]
-  node [
-    id 967
-    label "cccombobreaker"
-    color "4"
-  ]
-  node [
-    id 968
-    label "canada"
-    color "5"
-  ]
-  node [
-    id 969
-    label "housing"
-    color "0"
-  ]
-  node [
-    id 970
-    label "3Dpungo"
-    color "4"
-  ]
-  node [
-    id 971
-    label "batandball"
-    color "0"
-  ]
-  node [
-    id 972
-    label "wazayf"
-    color "4"
-  ]
-  node [
-    id 973
-    label "DADA"
-    color "0"
-  ]
-  node [
-    id 974
-    label "colliston"
-    color "0"
-  ]
-  node [
-    id 975
-    label "antibacon"
-    color "0"
-  ]
-  node [
-    id 976
-    label "nederlands"
-    color "4"
-  ]
-  node [
-    id 977
-    label "Teachers"
-    color "0"
-  ]
-  node [
-    id 978
-    label "Discussion"
-    color "0"
-  ]
-  node [
-    id 979
-    label "loghomes"
-    color "0"
-  ]
-  node [
-    id 980
-    label "WeAreTheMusicMakers"
-    color "5"
-  ]
-  node [
-    id 981
-    label "git"
-    color "0"
-  ]
-  node [
-    id 982
-    label "Men_at_home"
-    color "4"
-  ]
-  node [
-    id 983
-    label "occult"
-    color "1"
-  ]
-  node [
-    id 984
-    label "grist"
-    color "0"
-  ]
-  node [
-    id 985
-    label "Salsa"
-    color "4"
-  ]
-  node [
-    id 986
-    label "software"
-    color "0"
-  ]
-  node [
-    id 987
-    label "Nebraska"
-    color "0"
-  ]
-  node [
-    id 988
-    label "wrong_subreddit"
-    color "0"
-  ]
-  node [
-    id 989
-    label "sandiego"
-    color "0"
-  ]
-  node [
-    id 990
-    label "dezvoltarepersonala"
-    color "4"
-  ]
-  node [
-    id 991
-    label "agi"
-    color "4"
-  ]
-  node [
-    id 992
-    label "gwetzel"
-    color "4"
-  ]
-  node [
-    id 993
-    label "searchisbroken"
-    color "4"
-  ]
-  node [
-    id 994
-    label "nachos"
-    color "0"
-  ]
-  node [
-    id 995
-    label "policestateUSA"
-    color "0"
-  ]
-  node [
-    id 996
-    label "newengland"
-    color "0"
-  ]
-  node [
-    id 997
-    label "Gossimer"
-    color "4"
-  ]
-  node [
-    id 998
-    label "imoka"
-    color "4"
-  ]
-  node [
-    id 999
-    label "GreenCult"
-    color "4"
-  ]
-  node [
-    id 1000
-    label "monika"
-    color "4"
-  ]
-  node [
-    id 1001
-    label "Gracefullbabes"
-    color "0"
-  ]
-  node [
-    id 1002
-    label "StencilRevolution"
-    color "4"
-  ]
-  node [
-    id 1003
-    label "redesignreddit"
-    color "4"
-  ]
-  node [
-    id 1004
-    label "almakdad"
-    color "0"
-  ]
-  node [
-    id 1005
-    label "longvideos"
-    color "0"
-  ]
-  node [
-    id 1006
-    label "phapluat"
-    color "0"
-  ]
-  node [
-    id 1007
-    label "Libraries"
-    color "0"
-  ]
-  node [
-    id 1008
-    label "Wordpress"
-    color "4"
-  ]
-  node [
-    id 1009
-    label "CMMI"
-    color "0"
-  ]
-  node [
-    id 1010
-    label "fhyd"
-    color "0"
-  ]
-  node [
-    id 1011
-    label "lithuania"
-    color "4"
-  ]
-  node [
-    id 1012
-    label "minnesota"
-    color "0"
-  ]
-  node [
-    id 1013
-    label "OrangeCountyNY"
-    color "4"
-  ]
-  node [
-    id 1014
-    label "drupal"
-    color "0"
-  ]
-  node [
-    id 1015
-    label "SexyWomen"
-    color "0"
-  ]
-  node [
-    id 1016
-    label "pointless"
-    color "4"
-  ]
-  node [
-    id 1017
-    label "rbondi"
-    color "4"
-  ]
-  node [
-    id 1018
-    label "inshort"
-    color "0"
-  ]
-  node [
-    id 1019
-    label "illuminati"
-    color "0"
-  ]
-  node [
-    id 1020
-    label "jtdrct"
-    color "4"
-  ]
-  node [
-    id 1021
-    label "GSOH"
-    color "4"
-  ]
-  node [
-    id 1022
-    label "spirituality"
-    color "4"
-  ]
-  node [
-    id 1023
-    label "motorcycles"
-    color "1"
-  ]
-  node [
-    id 1024
-    label "refreshphoenix"
-    color "0"
-  ]
-  node [
-    id 1025
-    label "myth"
-    color "0"
-  ]
-  node [
-    id 1026
-    label "FlightSimulation"
-    color "4"
-  ]
-  node [
-    id 1027
-    label "tibet"
-    color "0"
-  ]
-  node [
-    id 1028
-    label "law"
-    color "5"
-  ]
-  node [
-    id 1029
-    label "VoteDownIf"
-    color "4"
-  ]
-  node [
-    id 1030
-    label "uymasadakodum"
-    color "0"
-  ]
-  node [
-    id 1031
-    label "swapmeet"
-    color "4"
-  ]
-  node [
-    id 1032
-    label "blogebreddit"
-    color "4"
-  ]
-  node [
-    id 1033
-    label "smellyfish"
-    color "4"
-  ]
-  node [
-    id 1034
-    label "steak"
-    color "0"
-  ]
-  node [
-    id 1035
-    label "alexrussia"
-    color "4"
-  ]
-  node [
-    id 1036
-    label "Brann"
-    color "4"
-  ]
-  node [
-    id 1037
-    label "Spore"
-    color "4"
-  ]
-  node [
-    id 1038
-    label "psychics"
-    color "0"
-  ]
-  node [
-    id 1039
-    label "sca"
-    color "0"
-  ]
-  node [
-    id 1040
-    label "youthparticipation"
-    color "0"
-  ]
-  node [
-    id 1041
-    label "facts"
-    color "0"
-  ]
-  node [
-    id 1042
-    label "men"
-    color "4"
-  ]
-  node [
-    id 1043
-    label "expert"
-    color "4"
-  ]
-  node [
-    id 1044
-    label "weboose"
-    color "4"
-  ]
-  node [
-    id 1045
-    label "Thaidarling"
-    color "4"
-  ]
-  node [
-    id 1046
-    label "grammar"
-    color "4"
-  ]
-  node [
-    id 1047
-    label "misc"
-    color "4"
-  ]
-  node [
-    id 1048
-    label "idcontent"
-    color "0"
-  ]
-  node [
-    id 1049
-    label "JesseAbram"
-    color "4"
-  ]
-  node [
-    id 1050
-    label "jemfinch"
-    color "4"
-  ]
-  node [
-    id 1051
-    label "exotic_cuisine"
-    color "4"
-  ]
-  node [
-    id 1052
-    label "ClothesBracelets"
-    color "4"
-  ]
-  node [
-    id 1053
-    label "offbeat"
-    color "5"
-  ]
-  node [
-    id 1054
-    label "Patty"
-    color "4"
-  ]
-  node [
-    id 1055
-    label "terroristrepublicans"
-    color "0"
-  ]
-  node [
-    id 1056
-    label "mtg"
-    color "4"
-  ]
-  node [
-    id 1057
-    label "aerospace"
-    color "0"
-  ]
-  node [
-    id 1058
-    label "Eugene"
-    color "4"
-  ]
-  node [
-    id 1059
-    label "PetsLoveJessica"
-    color "4"
-  ]
-  node [
-    id 1060
-    label "SEO"
-    color "4"
-  ]
-  node [
-    id 1061
-    label "trains"
-    color "0"
-  ]
-  node [
-    id 1062
-    label "Denmark"
-    color "0"
-  ]
-  node [
-    id 1063
-    label "Debt"
-    color "0"
-  ]
-  node [
-    id 1064
-    label "contraptions"
-    color "5"
-  ]
-  node [
-    id 1065
-    label "cyrusinnovation"
-    color "0"
-  ]
-  node [
-    id 1066
-    label "asm"
-    color "0"
-  ]
-  node [
-    id 1067
-    label "gaidep"
-    color "0"
-  ]
-  node [
-    id 1068
-    label "halo"
-    color "4"
-  ]
-  node [
-    id 1069
-    label "Bleachfinder"
-    color "0"
-  ]
-  node [
-    id 1070
-    label "prowrestling"
-    color "4"
-  ]
-  node [
-    id 1071
-    label "iloveeverything"
-    color "4"
-  ]
-  node [
-    id 1072
-    label "VoteUplf"
-    color "4"
-  ]
-  node [
-    id 1073
-    label "solaris"
-    color "0"
-  ]
-  node [
-    id 1074
-    label "ALP"
-    color "0"
-  ]
-  node [
-    id 1075
-    label "biology"
-    color "0"
-  ]
-  node [
-    id 1076
-    label "zinio"
-    color "0"
-  ]
-  node [
-    id 1077
-    label "Pornorati"
-    color "0"
-  ]
-  node [
-    id 1078
-    label "Humanisme"
-    color "0"
-  ]
-  node [
-    id 1079
-    label "Yeeher"
-    color "4"
-  ]
-  node [
-    id 1080
-    label "Economics"
-    color "5"
-  ]
-  node [
-    id 1081
-    label "sharkarts"
-    color "4"
-  ]
-  node [
-    id 1082
-    label "politicalnews"
-    color "4"
-  ]
-  node [
-    id 1083
-    label "CouchDB"
-    color "4"
-  ]
-  node [
-    id 1084
-    label "siliconflorist"
-    color "0"
-  ]
-  node [
-    id 1085
-    label "StopitNow"
-    color "4"
-  ]
-  node [
-    id 1086
-    label "VisitCrete"
-    color "0"
-  ]
-  node [
-    id 1087
-    label "International"
-    color "4"
-  ]
-  node [
-    id 1088
-    label "Radiology"
-    color "0"
-  ]
-  node [
-    id 1089
-    label "schadenfreude"
-    color "0"
-  ]
-  node [
-    id 1090
-    label "evolution"
-    color "5"
-  ]
-  node [
-    id 1091
-    label "OURANIMALFRIENDS"
-    color "4"
-  ]
-  node [
-    id 1092
-    label "cazzate"
-    color "4"
-  ]
-  node [
-    id 1093
-    label "miminco"
-    color "4"
-  ]
-  node [
-    id 1094
-    label "voteup"
-    color "0"
-  ]
-  node [
-    id 1095
-    label "NEIT"
-    color "4"
-  ]
-  node [
-    id 1096
-    label "Zigimeworkspace"
-    color "4"
-  ]
-  node [
-    id 1097
-    label "ThePerfectSmile"
-    color "0"
-  ]
-  node [
-    id 1098
-    label "Kile"
-    color "0"
-  ]
-  node [
-    id 1099
-    label "Cool_Pictures"
-    color "0"
-  ]
-  node [
-    id 1100
-    label "stocks"
-    color "4"
-  ]
-  node [
-    id 1101
-    label "allcrap"
-    color "4"
-  ]
-  node [
-    id 1102
-    label "HERMITS"
-    color "4"
-  ]
-  node [
-    id 1103
-    label "igr"
-    color "4"
-  ]
-  node [
-    id 1104
-    label "Wholesale_Products"
-    color "0"
-  ]
-  node [
-    id 1105
-    label "blingblog"
-    color "4"
-  ]
-  node [
-    id 1106
-    label "Drexel"
-    color "0"
-  ]
-  node [
-    id 1107
-    label "parislemon"
-    color "4"
-  ]
-  node [
-    id 1108
-    label "crownedregal"
-    color "0"
-  ]
-  node [
-    id 1109
-    label "8tracks"
-    color "4"
-  ]
-  node [
-    id 1110
-    label "pokerposted"
-    color "0"
-  ]
-  node [
-    id 1111
-    label "GrabberOrange"
-    color "4"
-  ]
-  node [
-    id 1112
-    label "BBCAMISMG"
-    color "4"
-  ]
-  node [
-    id 1113
-    label "pwnage"
-    color "0"
-  ]
-  node [
-    id 1114
-    label "map"
-    color "4"
-  ]
-  node [
-    id 1115
-    label "Database"
-    color "1"
-  ]
-  node [
-    id 1116
-    label "adekeda"
-    color "0"
-  ]
-  node [
-    id 1117
-    label "SophiesWorld"
-    color "0"
-  ]
-  node [
-    id 1118
-    label "bulgaria"
-    color "0"
-  ]
-  node [
-    id 1119
-    label "TheManifestStation"
-    color "4"
-  ]
-  node [
-    id 1120
-    label "Irony"
-    color "0"
-  ]
-  node [
-    id 1121
-    label "zhenyuan"
-    color "4"
-  ]
-  node [
-    id 1122
-    label "Madumbi76"
-    color "0"
-  ]
-  node [
-    id 1123
-    label "personals"
-    color "0"
-  ]
-  node [
-    id 1124
-    label "mathematics"
-    color "4"
-  ]
-  node [
-    id 1125
-    label "PS3"
-    color "5"
-  ]
-  node [
-    id 1126
-    label "mozilla"
-    color "4"
-  ]
-  node [
-    id 1127
-    label "USPE08"
-    color "5"
-  ]
-  node [
-    id 1128
-    label "Dunn4good"
-    color "4"
-  ]
-  node [
-    id 1129
-    label "shipping"
-    color "0"
-  ]
-  node [
-    id 1130
-    label "bhutan"
-    color "0"
-  ]
-  node [
-    id 1131
-    label "WebTechBlog"
-    color "4"
-  ]
-  node [
-    id 1132
-    label "chilereddit"
-    color "4"
-  ]
-  node [
-    id 1133
-    label "blenderbabies"
-    color "4"
-  ]
-  node [
-    id 1134
-    label "ThisIsMyTestRun"
-    color "0"
-  ]
-  node [
-    id 1135
-    label "teleco"
-    color "4"
-  ]
-  node [
-    id 1136
-    label "Desktop_Wallpaper"
-    color "0"
-  ]
-  node [
-    id 1137
-    label "mp3buff"
-    color "4"
-  ]
-  node [
-    id 1138
-    label "Embeddedavr"
-    color "4"
-  ]
-  node [
-    id 1139
-    label "ActressPhotos"
-    color "0"
-  ]
-  node [
-    id 1140
-    label "WhiteMenGoneWild"
-    color "5"
-  ]
-  node [
-    id 1141
-    label "uruguay"
-    color "4"
-  ]
-  node [
-    id 1142
-    label "Sudhir"
-    color "4"
-  ]
-  node [
-    id 1143
-    label "Social__Media"
-    color "0"
-  ]
-  node [
-    id 1144
-    label "Internet"
-    color "0"
-  ]
-  node [
-    id 1145
-    label "consumerist"
-    color "0"
-  ]
-  node [
-    id 1146
-    label "intj"
-    color "0"
-  ]
-  node [
-    id 1147
-    label "experience"
-    color "0"
-  ]
-  node [
-    id 1148
-    label "SuicideWatch"
-    color "5"
-  ]
-  node [
-    id 1149
-    label "brothels"
-    color "4"
-  ]
-  node [
-    id 1150
-    label "LawofSuccess"
-    color "4"
-  ]
-  node [
-    id 1151
-    label "stories"
-    color "4"
-  ]
-  node [
-    id 1152
-    label "merb"
-    color "4"
-  ]
-  node [
-    id 1153
-    label "Liang"
-    color "0"
-  ]
-  node [
-    id 1154
-    label "Design"
-    color "0"
-  ]
-  node [
-    id 1155
-    label "aynrandreddits"
-    color "4"
-  ]
-  node [
-    id 1156
-    label "Jesika"
-    color "4"
-  ]
-  node [
-    id 1157
-    label "ThriftyFinds"
-    color "0"
-  ]
-  node [
-    id 1158
-    label "GreenProducts"
-    color "4"
-  ]
-  node [
-    id 1159
-    label "mjd"
-    color "0"
-  ]
-  node [
-    id 1160
-    label "SocialMediaLinks"
-    color "4"
-  ]
-  node [
-    id 1161
-    label "Palestine"
-    color "4"
-  ]
-  node [
-    id 1162
-    label "freelance"
-    color "0"
-  ]
-  node [
-    id 1163
-    label "GoGreenUSA"
-    color "4"
-  ]
-  node [
-    id 1164
-    label "paulantoinem"
-    color "4"
-  ]
-  node [
-    id 1165
-    label "globalpoon"
-    color "0"
-  ]
-  node [
-    id 1166
-    label "BSD"
-    color "1"
-  ]
-  node [
-    id 1167
-    label "incidental"
-    color "4"
-  ]
-  node [
-    id 1168
-    label "SearchMarketing"
-    color "0"
-  ]
-  node [
-    id 1169
-    label "Christopher"
-    color "0"
-  ]
-  node [
-    id 1170
-    label "GraphicNerd"
-    color "0"
-  ]
-  node [
-    id 1171
-    label "Philippines"
-    color "4"
-  ]
-  node [
-    id 1172
-    label "ITnews"
-    color "4"
-  ]
-  node [
-    id 1173
-    label "romeguide"
-    color "4"
-  ]
-  node [
-    id 1174
-    label "Gin"
-    color "0"
-  ]
-  node [
-    id 1175
-    label "ko"
-    color "0"
-  ]
-  node [
-    id 1176
-    label "ZinioBest"
-    color "0"
-  ]
-  node [
-    id 1177
-    label "introweb"
-    color "4"
-  ]
-  node [
-    id 1178
-    label "desktops"
-    color "0"
-  ]
-  node [
-    id 1179
-    label "bilinkis"
-    color "4"
-  ]
-  node [
-    id 1180
-    label "kevinbcp"
-    color "4"
-  ]
-  node [
-    id 1181
-    label "Evil"
-    color "0"
-  ]
-  node [
-    id 1182
-    label "berkeley"
-    color "4"
-  ]
-  node [
-    id 1183
-    label "andrewdemm"
-    color "0"
-  ]
-  node [
-    id 1184
-    label "AppleApps"
-    color "4"
-  ]
-  node [
-    id 1185
-    label "Frugal"
-    color "5"
-  ]
-  node [
-    id 1186
-    label "aliyaleigh"
-    color "0"
-  ]
-  node [
-    id 1187
-    label "NorthernNewJersey"
-    color "4"
-  ]
-  node [
-    id 1188
-    label "labortech"
-    color "4"
-  ]
-  node [
-    id 1189
-    label "AmericanHondaSucks"
-    color "4"
-  ]
-  node [
-    id 1190
-    label "Indyapulse"
-    color "4"
-  ]
-  node [
-    id 1191
-    label "tazert"
-    color "0"
-  ]
-  node [
-    id 1192
-    label "XYON"
-    color "0"
-  ]
-  node [
-    id 1193
-    label "paris"
-    color "4"
-  ]
-  node [
-    id 1194
-    label "Rudyman"
-    color "4"
-  ]
-  node [
-    id 1195
-    label "Military"
-    color "5"
-  ]
-  node [
-    id 1196
-    label "uggit"
-    color "0"
-  ]
-  node [
-    id 1197
-    label "spotify"
-    color "0"
-  ]
-  node [
-    id 1198
-    label "pitchengine"
-    color "0"
-  ]
-  node [
-    id 1199
-    label "BestGamesEver"
-    color "1"
-  ]
-  node [
-    id 1200
-    label "AtulTanna"
-    color "0"
-  ]
-  node [
-    id 1201
-    label "Tiquicia"
-    color "0"
-  ]
-  node [
-    id 1202
-    label "QA_Tools"
-    color "0"
-  ]
-  node [
-    id 1203
-    label "clink"
-    color "0"
-  ]
-  node [
-    id 1204
-    label "AttentionSeekers"
-    color "0"
-  ]
-  node [
-    id 1205
-    label "arsenal"
-    color "0"
-  ]
-  node [
-    id 1206
-    label "arguments"
-    color "4"
-  ]
-  node [
-    id 1207
-    label "holidays"
-    color "4"
-  ]
-  node [
-    id 1208
-    label "mantriarun"
-    color "4"
-  ]
-  node [
-    id 1209
-    label "metalworking"
-    color "0"
-  ]
-  node [
-    id 1210
-    label "dilipm"
-    color "0"
-  ]
-  node [
-    id 1211
-    label "BerkshireHathaway"
-    color "0"
-  ]
-  node [
-    id 1212
-    label "christmas"
-    color "4"
-  ]
-  node [
-    id 1213
-    label "Canaddit"
-    color "0"
-  ]
-  node [
-    id 1214
-    label "Kristabell"
-    color "4"
-  ]
-  node [
-    id 1215
-    label "Melton"
-    color "4"
-  ]
-  node [
-    id 1216
-    label "ru"
-    color "2"
-  ]
-  node [
-    id 1217
-    label "blueoceandirect"
-    color "4"
-  ]
-  node [
-    id 1218
-    label "wantonegotone"
-    color "0"
-  ]
-  node [
-    id 1219
-    label "crl"
-    color "4"
-  ]
-  node [
-    id 1220
-    label "antiterrorism"
-    color "0"
-  ]
-  node [
-    id 1221
-    label "Addicting"
-    color "0"
-  ]
-  node [
-    id 1222
-    label "riezuan"
-    color "4"
-  ]
-  node [
-    id 1223
-    label "TakingLiberties"
-    color "0"
-  ]
-  node [
-    id 1224
-    label "ourex"
-    color "4"
-  ]
-  node [
-    id 1225
-    label "WillowVera"
-    color "0"
-  ]
-  node [
-    id 1226
-    label "faridi"
-    color "0"
-  ]
-  node [
-    id 1227
-    label "canon"
-    color "4"
-  ]
-  node [
-    id 1228
-    label "rhs"
-    color "0"
-  ]
-  node [
-    id 1229
-    label "Canuckgook"
-    color "0"
-  ]
-  node [
-    id 1230
-    label "Integral"
-    color "0"
-  ]
-  node [
-    id 1231
-    label "Toonih"
-    color "4"
-  ]
-  node [
-    id 1232
-    label "ReverseEngineering"
-    color "4"
-  ]
-  node [
-    id 1233
-    label "blackchasm"
-    color "0"
-  ]
-  node [
-    id 1234
-    label "VietNam_website"
-    color "4"
-  ]
-  node [
-    id 1235
-    label "Reruns"
-    color "4"
-  ]
-  node [
-    id 1236
-    label "ManageYourLifeNow"
-    color "0"
-  ]
-  node [
-    id 1237
-    label "rape"
-    color "0"
-  ]
-  node [
-    id 1238
-    label "anti"
-    color "4"
-  ]
-  node [
-    id 1239
-    label "formulaone"
-    color "1"
-  ]
-  node [
-    id 1240
-    label "bulgaria_theme"
-    color "4"
-  ]
-  node [
-    id 1241
-    label "ubiquity"
-    color "0"
-  ]
-  node [
-    id 1242
-    label "radio"
-    color "4"
-  ]
-  node [
-    id 1243
-    label "closedloopliving"
-    color "4"
-  ]
-  node [
-    id 1244
-    label "Tanah123"
-    color "0"
-  ]
-  node [
-    id 1245
-    label "Gusari"
-    color "0"
-  ]
-  node [
-    id 1246
-    label "Cera1503"
-    color "0"
-  ]
-  node [
-    id 1247
-    label "myblogroom"
-    color "0"
-  ]
-  node [
-    id 1248
-    label "cts"
-    color "0"
-  ]
-  node [
-    id 1249
-    label "UsedCars"
-    color "4"
-  ]
-  node [
-    id 1250
-    label "evensys"
-    color "0"
-  ]
-  node [
-    id 1251
-    label "delishio"
-    color "4"
-  ]
-  node [
-    id 1252
-    label "Dirtfloor"
-    color "4"
-  ]
-  node [
-    id 1253
-    label "PRunderground"
-    color "4"
-  ]
-  node [
-    id 1254
-    label "philosophy"
-    color "5"
-  ]
-  node [
-    id 1255
-    label "qgyh2"
-    color "4"
-  ]
-  node [
-    id 1256
-    label "noprop8"
-    color "4"
-  ]
-  node [
-    id 1257
-    label "realsurf"
-    color "0"
-  ]
-  node [
-    id 1258
-    label "auto"
-    color "5"
-  ]
-  node [
-    id 1259
-    label "OddSizeBeds"
-    color "0"
-  ]
-  node [
-    id 1260
-    label "Informatics"
-    color "4"
-  ]
-  node [
-    id 1261
-    label "none"
-    color "4"
-  ]
-  node [
-    id 1262
-    label "jamesbritt"
-    color "4"
-  ]
-  node [
-    id 1263
-    label "jira"
-    color "0"
-  ]
-  node [
-    id 1264
-    label "wma"
-    color "0"
-  ]
-  node [
-    id 1265
-    label "geekmusic"
-    color "0"
-  ]
-  node [
-    id 1266
-    label "3cs"
-    color "4"
-  ]
-  node [
-    id 1267
-    label "GraduateSchool"
-    color "4"
-  ]
-  node [
-    id 1268
-    label "ebruce"
-    color "4"
-  ]
-  node [
-    id 1269
-    label "glitchee"
-    color "0"
-  ]
-  node [
-    id 1270
-    label "yellowpagesturkey"
-    color "4"
-  ]
-  node [
-    id 1271
-    label "techsupport"
-    color "4"
-  ]
-  node [
-    id 1272
-    label "Tomas"
-    color "0"
-  ]
-  node [
-    id 1273
-    label "AnnikRubens"
-    color "0"
-  ]
-  node [
-    id 1274
-    label "ischool"
-    color "0"
-  ]
-  node [
-    id 1275
-    label "BCFood"
-    color "4"
-  ]
-  node [
-    id 1276
-    label "viajeros"
-    color "4"
-  ]
-  node [
-    id 1277
-    label "Thisisawesome"
-    color "4"
-  ]
-  node [
-    id 1278
-    label "tritit"
-    color "4"
-  ]
-  node [
-    id 1279
-    label "handexandi"
-    color "0"
-  ]
-  node [
-    id 1280
-    label "bicycling"
-    color "5"
-  ]
-  node [
-    id 1281
-    label "workathome"
-    color "0"
-  ]
-  node [
-    id 1282
-    label "motorsports"
-    color "4"
-  ]
-  node [
-    id 1283
-    label "forensics"
-    color "0"
-  ]
-  node [
-    id 1284
-    label "VideoGameReviews"
-    color "0"
-  ]
-  node [
-    id 1285
-    label "videogaming"
-    color "4"
-  ]
-  node [
-    id 1286
-    label "Epicenter"
-    color "4"
-  ]
-  node [
-    id 1287
-    label "invisibleclothes"
-    color "4"
-  ]
-  node [
-    id 1288
-    label "StevePohlit"
-    color "4"
-  ]
-  node [
-    id 1289
-    label "winternals"
-    color "4"
-  ]
-  node [
-    id 1290
-    label "hardbodies"
-    color "4"
-  ]
-  node [
-    id 1291
-    label "virtualization"
-    color "4"
-  ]
-  node [
-    id 1292
-    label "Algereddit"
-    color "0"
-  ]
-  node [
-    id 1293
-    label "IndustrialDesign"
-    color "4"
-  ]
-  node [
-    id 1294
-    label "lean"
-    color "0"
-  ]
-  node [
-    id 1295
-    label "starcraft"
-    color "0"
-  ]
-  node [
-    id 1296
-    label "Weblogicguru"
-    color "0"
-  ]
-  node [
-    id 1297
-    label "cheminformatics"
-    color "4"
-  ]
-  node [
-    id 1298
-    label "rentcentralpa"
-    color "0"
-  ]
-  node [
-    id 1299
-    label "media"
-    color "1"
-  ]
-  node [
-    id 1300
-    label "mediareddit"
-    color "4"
-  ]
-  node [
-    id 1301
-    label "rodjonsroadhouse"
-    color "0"
-  ]
-  node [
-    id 1302
-    label "cuilsucks"
-    color "4"
-  ]
-  node [
-    id 1303
-    label "Clothing"
-    color "4"
-  ]
-  node [
-    id 1304
-    label "CandyCrib"
-    color "0"
-  ]
-  node [
-    id 1305
-    label "chucktaco"
-    color "0"
-  ]
-  node [
-    id 1306
-    label "championsleague"
-    color "4"
-  ]
-  node [
-    id 1307
-    label "rrrd"
-    color "4"
-  ]
-  node [
-    id 1308
-    label "cheats"
-    color "0"
-  ]
-  node [
-    id 1309
-    label "investment"
-    color "0"
-  ]
-  node [
-    id 1310
-    label "bizjgreen"
-    color "4"
-  ]
-  node [
-    id 1311
-    label "neufbox"
-    color "0"
-  ]
-  node [
-    id 1312
-    label "geoFeed"
-    color "4"
-  ]
-  node [
-    id 1313
-    label "world_adekosis"
-    color "0"
-  ]
-  node [
-    id 1314
-    label "caregiving"
-    color "0"
-  ]
-  node [
-    id 1315
-    label "AlvinHe"
-    color "4"
-  ]
-  node [
-    id 1316
-    label "FreeOnlineGames"
-    color "0"
-  ]
-  node [
-    id 1317
-    label "bittersweet"
-    color "4"
-  ]
-  node [
-    id 1318
-    label "haskell_proposals"
-    color "9"
-  ]
-  node [
-    id 1319
-    label "providentestate"
-    color "4"
-  ]
-  node [
-    id 1320
-    label "earthsearch"
-    color "0"
-  ]
-  node [
-    id 1321
-    label "Bondage"
-    color "4"
-  ]
-  node [
-    id 1322
-    label "Pictures"
-    color "5"
-  ]
-  node [
-    id 1323
-    label "alexda"
-    color "0"
-  ]
-  node [
-    id 1324
-    label "InnoGage"
-    color "4"
-  ]
-  node [
-    id 1325
-    label "diabetesnews"
-    color "4"
-  ]
-  node [
-    id 1326
-    label "cannabis"
-    color "1"
-  ]
-  node [
-    id 1327
-    label "YourFindit"
-    color "0"
-  ]
-  node [
-    id 1328
-    label "humanitarian"
-    color "4"
-  ]
-  node [
-    id 1329
-    label "Models"
-    color "0"
-  ]
-  node [
-    id 1330
-    label "acdindia"
-    color "4"
-  ]
-  node [
-    id 1331
-    label "gothicandhorror"
-    color "4"
-  ]
-  node [
-    id 1332
-    label "fial"
-    color "4"
-  ]
-  node [
-    id 1333
-    label "javascript"
-    color "4"
-  ]
-  node [
-    id 1334
-    label "BSG"
-    color "4"
-  ]
-  node [
-    id 1335
-    label "sportwatches"
-    color "4"
-  ]
-  node [
-    id 1336
-    label "ClassifiedAds"
-    color "0"
-  ]
-  node [
-    id 1337
-    label "fantasyfootball"
-    color "4"
-  ]
-  node [
-    id 1338
-    label "Mustang"
-    color "4"
-  ]
-  node [
-    id 1339
-    label "pcmonteiro13"
-    color "0"
-  ]
-  node [
-    id 1340
-    label "SMS"
-    color "4"
-  ]
-  node [
-    id 1341
-    label "Invites"
-    color "0"
-  ]
-  node [
-    id 1342
-    label "weighttalk"
-    color "0"
-  ]
-  node [
-    id 1343
-    label "bendnews"
-    color "4"
-  ]
-  node [
-    id 1344
-    label "miglioramento"
-    color "4"
-  ]
-  node [
-    id 1345
-    label "allfacebook100"
-    color "0"
-  ]
-  node [
-    id 1346
-    label "spk"
-    color "4"
-  ]
-  node [
-    id 1347
-    label "venkey"
-    color "4"
-  ]
-  node [
-    id 1348
-    label "filesharing"
-    color "4"
-  ]
-  node [
-    id 1349
-    label "worstof"
-    color "1"
-  ]
-  node [
-    id 1350
-    label "mushroom"
-    color "4"
-  ]
-  node [
-    id 1351
-    label "chiptunes"
-    color "4"
-  ]
-  node [
-    id 1352
-    label "fringeelement"
-    color "4"
-  ]
-  node [
-    id 1353
-    label "MXO"
-    color "0"
-  ]
-  node [
-    id 1354
-    label "Detox"
-    color "0"
-  ]
-  node [
-    id 1355
-    label "freelancing"
-    color "0"
-  ]
-  node [
-    id 1356
-    label "RouletteSystem"
-    color "4"
-  ]
-  node [
-    id 1357
-    label "ForexMania"
-    color "0"
-  ]
-  node [
-    id 1358
-    label "selflanguage"
-    color "0"
-  ]
-  node [
-    id 1359
-    label "Freshhome"
-    color "4"
-  ]
-  node [
-    id 1360
-    label "Freethought"
-    color "5"
-  ]
-  node [
-    id 1361
-    label "SonyPS3"
-    color "4"
-  ]
-  node [
-    id 1362
-    label "kliqd"
-    color "0"
-  ]
-  node [
-    id 1363
-    label "MusicFail"
-    color "0"
-  ]
-  node [
-    id 1364
-    label "pronadji"
-    color "4"
-  ]
-  node [
-    id 1365
-    label "ChristmasSALE"
-    color "0"
-  ]
-  node [
-    id 1366
-    label "gentle"
-    color "0"
-  ]
-  node [
-    id 1367
-    label "shoebush"
-    color "0"
-  ]
-  node [
-    id 1368
-    label "sharepoint"
-    color "0"
-  ]
-  node [
-    id 1369
-    label "Hedging"
-    color "0"
-  ]
-  node [
-    id 1370
-    label "FunEbay"
-    color "4"
-  ]
-  node [
-    id 1371
-    label "guides"
-    color "4"
-  ]
-  node [
-    id 1372
-    label "comicbooks"
-    color "0"
-  ]
-  node [
-    id 1373
-    label "Aylol68"
-    color "0"
-  ]
-  node [
-    id 1374
-    label "perl"
-    color "4"
-  ]
-  node [
-    id 1375
-    label "Archana"
-    color "4"
-  ]
-  node [
-    id 1376
-    label "charter"
-    color "4"
-  ]
-  node [
-    id 1377
-    label "Seattle"
-    color "1"
-  ]
-  node [
-    id 1378
-    label "KarmaArmy"
-    color "0"
-  ]
-  node [
-    id 1379
-    label "springfieldMO"
-    color "0"
-  ]
-  node [
-    id 1380
-    label "pittsburgh"
-    color "0"
-  ]
-  node [
-    id 1381
-    label "photowalking"
-    color "0"
-  ]
-  node [
-    id 1382
-    label "fail"
-    color "4"
-  ]
-  node [
-    id 1383
-    label "DigitalDisasters"
-    color "4"
-  ]
-  node [
-    id 1384
-    label "thepale"
-    color "0"
-  ]
-  node [
-    id 1385
-    label "iMarketing"
-    color "4"
-  ]
-  node [
-    id 1386
-    label "darl"
-    color "0"
-  ]
-  node [
-    id 1387
-    label "magick"
-    color "4"
-  ]
-  node [
-    id 1388
-    label "JaneDing"
-    color "0"
-  ]
-  node [
-    id 1389
-    label "popetastic"
-    color "4"
-  ]
-  node [
-    id 1390
-    label "WorkingParents"
-    color "4"
-  ]
-  node [
-    id 1391
-    label "Physics"
-    color "5"
-  ]
-  node [
-    id 1392
-    label "beards"
-    color "4"
-  ]
-  node [
-    id 1393
-    label "bullshit"
-    color "4"
-  ]
-  node [
-    id 1394
-    label "wealdreamit"
-    color "0"
-  ]
-  node [
-    id 1395
-    label "grant_tda"
-    color "0"
-  ]
-  node [
-    id 1396
-    label "pgoramming"
-    color "0"
-  ]
-  node [
-    id 1397
-    label "bestofcraigslist"
-    color "1"
-  ]
-  node [
-    id 1398
-    label "audio"
-    color "0"
-  ]
-  node [
-    id 1399
-    label "templates"
-    color "4"
-  ]
-  node [
-    id 1400
-    label "avtorentacar"
-    color "0"
-  ]
-  node [
-    id 1401
-    label "chilipress"
-    color "4"
-  ]
-  node [
-    id 1402
-    label "semanticweb"
-    color "4"
-  ]
-  node [
-    id 1403
-    label "ArkansasShootings"
-    color "0"
-  ]
-  node [
-    id 1404
-    label "Horses"
-    color "0"
-  ]
-  node [
-    id 1405
-    label "propaganda"
-    color "0"
-  ]
-  node [
-    id 1406
-    label "nukethewhales"
-    color "0"
-  ]
-  node [
-    id 1407
-    label "userexperience"
-    color "4"
-  ]
-  node [
-    id 1408
-    label "Grecian"
-    color "4"
-  ]
-  node [
-    id 1409
-    label "apple"
-    color "5"
-  ]
-  node [
-    id 1410
-    label "venezuela"
-    color "0"
-  ]
-  node [
-    id 1411
-    label "TrueHorrorStories"
-    color "4"
-  ]
-  node [
-    id 1412
-    label "TotallyTennessee"
-    color "0"
-  ]
-  node [
-    id 1413
-    label "purity_products"
-    color "0"
-  ]
-  node [
-    id 1414
-    label "australian"
-    color "0"
-  ]
-  node [
-    id 1415
-    label "yardsale"
-    color "1"
-  ]
-  node [
-    id 1416
-    label "hizdamnut_personal"
-    color "4"
-  ]
-  node [
-    id 1417
-    label "crochet"
-    color "4"
-  ]
-  node [
-    id 1418
-    label "withoutlinks"
-    color "4"
-  ]
-  node [
-    id 1419
-    label "Metal"
-    color "5"
-  ]
-  node [
-    id 1420
-    label "craigslist"
-    color "5"
-  ]
-  node [
-    id 1421
-    label "redditua"
-    color "0"
-  ]
-  node [
-    id 1422
-    label "mybaseballcardspace"
-    color "4"
-  ]
-  node [
-    id 1423
-    label "cleavage"
-    color "0"
-  ]
-  node [
-    id 1424
-    label "WVGE"
-    color "4"
-  ]
-  node [
-    id 1425
-    label "Survival"
-    color "5"
-  ]
-  node [
-    id 1426
-    label "KISS"
-    color "4"
-  ]
-  node [
-    id 1427
-    label "freeclassifieds"
-    color "0"
-  ]
-  node [
-    id 1428
-    label "biphentinhealth"
-    color "4"
-  ]
-  node [
-    id 1429
-    label "TuyetVoi"
-    color "4"
-  ]
-  node [
-    id 1430
-    label "sirusdesign"
-    color "4"
-  ]
-  node [
-    id 1431
-    label "aii3e"
-    color "4"
-  ]
-  node [
-    id 1432
-    label "redditbay"
-    color "0"
-  ]
-  node [
-    id 1433
-    label "PhotoCenter"
-    color "0"
-  ]
-  node [
-    id 1434
-    label "dtsit"
-    color "0"
-  ]
-  node [
-    id 1435
-    label "avrham"
-    color "0"
-  ]
-  node [
-    id 1436
-    label "Webroads"
-    color "0"
-  ]
-  node [
-    id 1437
-    label "Slut"
-    color "0"
-  ]
-  node [
-    id 1438
-    label "Detroit"
-    color "4"
-  ]
-  node [
-    id 1439
-    label "greenbusiness"
-    color "4"
-  ]
-  node [
-    id 1440
-    label "melbourne"
-    color "4"
-  ]
-  node [
-    id 1441
-    label "OpenEd"
-    color "4"
-  ]
-  node [
-    id 1442
-    label "tf2"
-    color "0"
-  ]
-  node [
-    id 1443
-    label "PersonalLoanHelper"
-    color "0"
-  ]
-  node [
-    id 1444
-    label "likereddit"
-    color "4"
-  ]
-  node [
-    id 1445
-    label "MrChips"
-    color "4"
-  ]
-  node [
-    id 1446
-    label "app"
-    color "0"
-  ]
-  node [
-    id 1447
-    label "wfaulkner"
-    color "0"
-  ]
-  node [
-    id 1448
-    label "indierock"
-    color "4"
-  ]
-  node [
-    id 1449
-    label "vinyl"
-    color "0"
-  ]
-  node [
-    id 1450
-    label "Entertainment_Gossip"
-    color "0"
-  ]
-  node [
-    id 1451
-    label "Debtfreehispanic"
-    color "0"
-  ]
-  node [
-    id 1452
-    label "nba"
-    color "4"
-  ]
-  node [
-    id 1453
-    label "OSINT"
-    color "0"
-  ]
-  node [
-    id 1454
-    label "ltst"
-    color "4"
-  ]
-  node [
-    id 1455
-    label "davidw"
-    color "4"
-  ]
-  node [
-    id 1456
-    label "poppins_reddit"
-    color "0"
-  ]
-  node [
-    id 1457
-    label "Giants"
-    color "4"
-  ]
-  node [
-    id 1458
-    label "OMGWTF"
-    color "0"
-  ]
-  node [
-    id 1459
-    label "just4callie"
-    color "0"
-  ]
-  node [
-    id 1460
-    label "RobotUprising"
-    color "4"
-  ]
-  node [
-    id 1461
-    label "AmericanPolitics"
-    color "5"
-  ]
-  node [
-    id 1462
-    label "pcgaming"
-    color "4"
-  ]
-  node [
-    id 1463
-    label "TBarrett"
-    color "4"
-  ]
-  node [
-    id 1464
-    label "halloween"
-    color "0"
-  ]
-  node [
-    id 1465
-    label "gif"
-    color "0"
-  ]
-  node [
-    id 1466
-    label "SGBoise"
-    color "0"
-  ]
-  node [
-    id 1467
-    label "thisshouldbepolitics"
-    color "4"
-  ]
-  node [
-    id 1468
-    label "daily_mail"
-    color "0"
-  ]
-  node [
-    id 1469
-    label "be_Green"
-    color "4"
-  ]
-  node [
-    id 1470
-    label "ecreeds"
-    color "0"
-  ]
-  node [
-    id 1471
-    label "PlookaWebsite"
-    color "0"
-  ]
-  node [
-    id 1472
-    label "Cliche"
-    color "0"
-  ]
-  node [
-    id 1473
-    label "sexzone"
-    color "4"
-  ]
-  node [
-    id 1474
-    label "beta1776"
-    color "4"
-  ]
-  node [
-    id 1475
-    label "jeux_flash"
-    color "4"
-  ]
-  node [
-    id 1476
-    label "Mortgage"
-    color "4"
-  ]
-  node [
-    id 1477
-    label "Singles"
-    color "4"
-  ]
-  node [
-    id 1478
-    label "WolfFrameworks"
-    color "0"
-  ]
-  node [
-    id 1479
-    label "france"
-    color "0"
-  ]
-  node [
-    id 1480
-    label "neoknight"
-    color "4"
-  ]
-  node [
-    id 1481
-    label "Folk_Music"
-    color "0"
-  ]
-  node [
-    id 1482
-    label "breakglass"
-    color "4"
-  ]
-  node [
-    id 1483
-    label "aggieliberal"
-    color "4"
-  ]
-  node [
-    id 1484
-    label "ASPNET"
-    color "0"
-  ]
-  node [
-    id 1485
-    label "fixedgear"
-    color "0"
-  ]
-  node [
-    id 1486
-    label "INTP"
-    color "4"
-  ]
-  node [
-    id 1487
-    label "programming"
-    color "5"
-  ]
-  node [
-    id 1488
-    label "Catalogbiz"
-    color "4"
-  ]
-  node [
-    id 1489
-    label "lazyweb"
-    color "0"
-  ]
-  node [
-    id 1490
-    label "DIPPSEO"
-    color "4"
-  ]
-  node [
-    id 1491
-    label "GlobalistNews"
-    color "0"
-  ]
-  node [
-    id 1492
-    label "Poetry"
-    color "1"
-  ]
-  node [
-    id 1493
-    label "DataZilla"
-    color "0"
-  ]
-  node [
-    id 1494
-    label "eo"
-    color "4"
-  ]
-  node [
-    id 1495
-    label "ACL"
-    color "4"
-  ]
-  node [
-    id 1496
-    label "LOC"
-    color "0"
-  ]
-  node [
-    id 1497
-    label "tashad"
-    color "4"
-  ]
-  node [
-    id 1498
-    label "mzaeen"
-    color "0"
-  ]
-  node [
-    id 1499
-    label "CuteWriting"
-    color "4"
-  ]
-  node [
-    id 1500
-    label "Parties"
-    color "0"
-  ]
-  node [
-    id 1501
-    label "methlab"
-    color "4"
-  ]
-  node [
-    id 1502
-    label "experssregalo"
-    color "0"
-  ]
-  node [
-    id 1503
-    label "MyTotalKitchen"
-    color "4"
-  ]
-  node [
-    id 1504
-    label "nintin"
-    color "0"
-  ]
-  node [
-    id 1505
-    label "scifi"
-    color "5"
-  ]
-  node [
-    id 1506
-    label "anrinn188"
-    color "0"
-  ]
-  node [
-    id 1507
-    label "Anarchism"
-    color "5"
-  ]
-  node [
-    id 1508
-    label "MDVC"
-    color "4"
-  ]
-  node [
-    id 1509
-    label "elinaswain"
-    color "0"
-  ]
-  node [
-    id 1510
-    label "wii"
-    color "0"
-  ]
-  node [
-    id 1511
-    label "RawFitnessOnline"
-    color "4"
-  ]
-  node [
-    id 1512
-    label "Islamofascism"
-    color "0"
-  ]
-  node [
-    id 1513
-    label "nakajima"
-    color "4"
-  ]
-  node [
-    id 1514
-    label "reproduction"
-    color "0"
-  ]
-  node [
-    id 1515
-    label "algeria"
-    color "0"
-  ]
-  node [
-    id 1516
-    label "UUreddit"
-    color "0"
-  ]
-  node [
-    id 1517
-    label "collapse"
-    color "5"
-  ]
-  node [
-    id 1518
-    label "my_own_test_reddit"
-    color "0"
-  ]
-  node [
-    id 1519
-    label "analplay"
-    color "4"
-  ]
-  node [
-    id 1520
-    label "shashimaru28"
-    color "4"
-  ]
-  node [
-    id 1521
-    label "quiz"
-    color "4"
-  ]
-  node [
-    id 1522
-    label "bomboimantado"
-    color "0"
-  ]
-  node [
-    id 1523
-    label "MensRights"
-    color "5"
-  ]
-  node [
-    id 1524
-    label "osfanboyism"
-    color "0"
-  ]
-  node [
-    id 1525
-    label "Bagsforless"
-    color "0"
-  ]
-  node [
-    id 1526
-    label "VideoRemix"
-    color "4"
-  ]
-  node [
-    id 1527
-    label "whedon"
-    color "0"
-  ]
-  node [
-    id 1528
-    label "pssnaked"
-    color "5"
-  ]
-  node [
-    id 1529
-    label "tracetrack"
-    color "0"
-  ]
-  node [
-    id 1530
-    label "NHibernate"
-    color "4"
-  ]
-  node [
-    id 1531
-    label "autism"
-    color "4"
-  ]
-  node [
-    id 1532
-    label "joob"
-    color "0"
-  ]
-  node [
-    id 1533
-    label "OnceAgain"
-    color "0"
-  ]
-  node [
-    id 1534
-    label "PeanutButter"
-    color "4"
-  ]
-  node [
-    id 1535
-    label "FreeStuff"
-    color "0"
-  ]
-  node [
-    id 1536
-    label "phpfreelancer"
-    color "0"
-  ]
-  node [
-    id 1537
-    label "gingerbeer25"
-    color "4"
-  ]
-  node [
-    id 1538
-    label "jewscaused911"
-    color "4"
-  ]
-  node [
-    id 1539
-    label "Scotch"
-    color "0"
-  ]
-  node [
-    id 1540
-    label "kajiroom"
-    color "0"
-  ]
-  node [
-    id 1541
-    label "tablehockey"
-    color "0"
-  ]
-  node [
-    id 1542
-    label "Celebrity_Pictures"
-    color "4"
-  ]
-  node [
-    id 1543
-    label "Autos"
-    color "1"
-  ]
-  node [
-    id 1544
-    label "athiesm"
-    color "0"
-  ]
-  node [
-    id 1545
-    label "gratefuldead"
-    color "0"
-  ]
-  node [
-    id 1546
-    label "FirstMeditations"
-    color "4"
-  ]
-  node [
-    id 1547
-    label "AdultChildren"
-    color "4"
-  ]
-  node [
-    id 1548
-    label "Washington"
-    color "0"
-  ]
-  node [
-    id 1549
-    label "alcohol"
-    color "4"
-  ]
-  node [
-    id 1550
-    label "Jawad"
-    color "0"
-  ]
-  node [
-    id 1551
-    label "publishing"
-    color "4"
-  ]
-  node [
-    id 1552
-    label "loldogs"
-    color "0"
-  ]
-  node [
-    id 1553
-    label "TUPOEorg"
-    color "4"
-  ]
-  node [
-    id 1554
-    label "fashion"
-    color "1"
-  ]
-  node [
-    id 1555
-    label "Unbelievable"
-    color "4"
-  ]
-  node [
-    id 1556
-    label "Las_Vegas"
-    color "4"
-  ]
-  node [
-    id 1557
-    label "FuckingRepost"
-    color "4"
-  ]
-  node [
-    id 1558
-    label "Vanhomeless"
-    color "0"
-  ]
-  node [
-    id 1559
-    label "askkaens"
-    color "0"
-  ]
-  node [
-    id 1560
-    label "Mary"
-    color "4"
-  ]
-  node [
-    id 1561
-    label "writeright"
-    color "4"
-  ]
-  node [
-    id 1562
-    label "mysecuritysign"
-    color "4"
-  ]
-  node [
-    id 1563
-    label "nyisi"
-    color "0"
-  ]
-  node [
-    id 1564
-    label "CaughtMyAttention"
-    color "4"
-  ]
-  node [
-    id 1565
-    label "hamo2008"
-    color "0"
-  ]
-  node [
-    id 1566
-    label "Lipstick"
-    color "4"
-  ]
-  node [
-    id 1567
-    label "MMORPG"
-    color "4"
-  ]
-  node [
-    id 1568
-    label "1111111"
-    color "0"
-  ]
-  node [
-    id 1569
-    label "WhatIsLuxury"
-    color "0"
-  ]
-  node [
-    id 1570
-    label "Freshmobileus"
-    color "0"
-  ]
-  node [
-    id 1571
-    label "biberhapi"
-    color "4"
-  ]
-  node [
-    id 1572
-    label "prueba"
-    color "4"
-  ]
-  node [
-    id 1573
-    label "bngbng"
-    color "4"
-  ]
-  node [
-    id 1574
-    label "free_movies"
-    color "4"
-  ]
-  node [
-    id 1575
-    label "Emo"
-    color "4"
-  ]
-  node [
-    id 1576
-    label "motiongraphics"
-    color "4"
-  ]
-  node [
-    id 1577
-    label "gardening"
-    color "5"
-  ]
-  node [
-    id 1578
-    label "Rwanda"
-    color "0"
-  ]
-  node [
-    id 1579
-    label "Defcon"
-    color "4"
-  ]
-  node [
-    id 1580
-    label "BoilerExplosion"
-    color "4"
-  ]
-  node [
-    id 1581
-    label "Ethics"
-    color "4"
-  ]
-  node [
-    id 1582
-    label "nsfw"
-    color "5"
-  ]
-  node [
-    id 1583
-    label "loynomsc"
-    color "4"
-  ]
-  node [
-    id 1584
-    label "plt"
-    color "4"
-  ]
-  node [
-    id 1585
-    label "Rockband"
-    color "4"
-  ]
-  node [
-    id 1586
-    label "ARG"
-    color "4"
-  ]
-  node [
-    id 1587
-    label "CompEddit"
-    color "4"
-  ]
-  node [
-    id 1588
-    label "gaijin"
-    color "4"
-  ]
-  node [
-    id 1589
-    label "dating"
-    color "4"
-  ]
-  node [
-    id 1590
-    label "alife"
-    color "4"
-  ]
-  node [
-    id 1591
-    label "HurricaneIke"
-    color "0"
-  ]
-  node [
-    id 1592
-    label "LatinAmerica"
-    color "0"
-  ]
-  node [
-    id 1593
-    label "onlinebooks"
-    color "0"
-  ]
-  node [
-    id 1594
-    label "Domains"
-    color "4"
-  ]
-  node [
-    id 1595
-    label "SuperNova"
-    color "4"
-  ]
-  node [
-    id 1596
-    label "BooCooBay"
-    color "4"
-  ]
-  node [
-    id 1597
-    label "userstorylab"
-    color "4"
-  ]
-  node [
-    id 1598
-    label "muslims"
-    color "0"
-  ]
-  node [
-    id 1599
-    label "unhappy"
-    color "0"
-  ]
-  node [
-    id 1600
-    label "belgium"
-    color "4"
-  ]
-  node [
-    id 1601
-    label "cycling"
-    color "4"
-  ]
-  node [
-    id 1602
-    label "Chennai"
-    color "0"
-  ]
-  node [
-    id 1603
-    label "classicalmusic"
-    color "4"
-  ]
-  node [
-    id 1604
-    label "CSU"
-    color "4"
-  ]
-  node [
-    id 1605
-    label "thevoiceofdon"
-    color "0"
-  ]
-  node [
-    id 1606
-    label "vdm"
-    color "0"
-  ]
-  node [
-    id 1607
-    label "puerrit"
-    color "4"
-  ]
-  node [
-    id 1608
-    label "worldwidewar"
-    color "4"
-  ]
-  node [
-    id 1609
-    label "Galatron"
-    color "4"
-  ]
-  node [
-    id 1610
-    label "political_issues"
-    color "4"
-  ]
-  node [
-    id 1611
-    label "spain"
-    color "0"
-  ]
-  node [
-    id 1612
-    label "christfollowers"
-    color "0"
-  ]
-  node [
-    id 1613
-    label "faboccasion"
-    color "4"
-  ]
-  node [
-    id 1614
-    label "The_Wire"
-    color "0"
-  ]
-  node [
-    id 1615
-    label "photoshop"
-    color "0"
-  ]
-  node [
-    id 1616
-    label "politics"
-    color "5"
-  ]
-  node [
-    id 1617
-    label "Yalin"
-    color "0"
-  ]
-  node [
-    id 1618
-    label "elivepages"
-    color "4"
-  ]
-  node [
-    id 1619
-    label "311"
-    color "4"
-  ]
-  node [
-    id 1620
-    label "hotsauce"
-    color "0"
-  ]
-  node [
-    id 1621
-    label "AtlantisDivers"
-    color "4"
-  ]
-  node [
-    id 1622
-    label "oregon"
-    color "0"
-  ]
-  node [
-    id 1623
-    label "Basketball"
-    color "4"
-  ]
-  node [
-    id 1624
-    label "Cheese"
-    color "0"
-  ]
-  node [
-    id 1625
-    label "takeurseat1"
-    color "4"
-  ]
-  node [
-    id 1626
-    label "Explosions"
-    color "0"
-  ]
-  node [
-    id 1627
-    label "gal"
-    color "4"
-  ]
-  node [
-    id 1628
-    label "Agorism"
-    color "0"
-  ]
-  node [
-    id 1629
-    label "kebek"
-    color "0"
-  ]
-  node [
-    id 1630
-    label "eggs"
-    color "4"
-  ]
-  node [
-    id 1631
-    label "cute"
-    color "5"
-  ]
-  node [
-    id 1632
-    label "news"
-    color "5"
-  ]
-  node [
-    id 1633
-    label "hypatia"
-    color "4"
-  ]
-  node [
-    id 1634
-    label "geopolitics"
-    color "5"
-  ]
-  node [
-    id 1635
-    label "SubGenius"
-    color "4"
-  ]
-  node [
-    id 1636
-    label "gayporn"
-    color "4"
-  ]
-  node [
-    id 1637
-    label "esquivalience"
-    color "0"
-  ]
-  node [
-    id 1638
-    label "phishing"
-    color "0"
-  ]
-  node [
-    id 1639
-    label "MiaPresley"
-    color "4"
-  ]
-  node [
-    id 1640
-    label "forrtryout"
-    color "4"
-  ]
-  node [
-    id 1641
-    label "bestoutdoortowns"
-    color "4"
-  ]
-  node [
-    id 1642
-    label "merry"
-    color "4"
-  ]
-  node [
-    id 1643
-    label "www"
-    color "4"
-  ]
-  node [
-    id 1644
-    label "EeePC"
-    color "4"
-  ]
-  node [
-    id 1645
-    label "hotpockets"
-    color "0"
-  ]
-  node [
-    id 1646
-    label "theship"
-    color "4"
-  ]
-  node [
-    id 1647
-    label "gadgets"
-    color "5"
-  ]
-  node [
-    id 1648
-    label "GoBrandIt"
-    color "0"
-  ]
-  node [
-    id 1649
-    label "SantexQBlog"
-    color "0"
-  ]
-  node [
-    id 1650
-    label "tattoosofgirls"
-    color "4"
-  ]
-  node [
-    id 1651
-    label "Point_"
-    color "4"
-  ]
-  node [
-    id 1652
-    label "Simplyzigzag"
-    color "0"
-  ]
-  node [
-    id 1653
-    label "gridsix"
-    color "0"
-  ]
-  node [
-    id 1654
-    label "TradeMaster"
-    color "0"
-  ]
-  node [
-    id 1655
-    label "RedPrice"
-    color "4"
-  ]
-  node [
-    id 1656
-    label "chentao807"
-    color "4"
-  ]
-  node [
-    id 1657
-    label "owie"
-    color "4"
-  ]
-  node [
-    id 1658
-    label "Govvit"
-    color "4"
-  ]
-  node [
-    id 1659
-    label "Gossimerwebhosting"
-    color "0"
-  ]
-  node [
-    id 1660
-    label "koreangamenewstest1"
-    color "4"
-  ]
-  node [
-    id 1661
-    label "PlayadenBossa"
-    color "4"
-  ]
-  node [
-    id 1662
-    label "motorcycle"
-    color "4"
-  ]
-  node [
-    id 1663
-    label "HomeImprovement"
-    color "0"
-  ]
-  node [
-    id 1664
-    label "culture"
-    color "1"
-  ]
-  node [
-    id 1665
-    label "yeahisawthat"
-    color "4"
-  ]
-  node [
-    id 1666
-    label "timetravel"
-    color "0"
-  ]
-  node [
-    id 1667
-    label "Sakitha"
-    color "4"
-  ]
-  node [
-    id 1668
-    label "rusmoney"
-    color "4"
-  ]
-  node [
-    id 1669
-    label "ALALabAuto"
-    color "0"
-  ]
-  node [
-    id 1670
-    label "meme"
-    color "4"
-  ]
-  node [
-    id 1671
-    label "Entrepreneur"
-    color "4"
-  ]
-  node [
-    id 1672
-    label "Gristmill"
-    color "4"
-  ]
-  node [
-    id 1673
-    label "indonesia"
-    color "0"
-  ]
-  node [
-    id 1674
-    label "vero"
-    color "0"
-  ]
-  node [
-    id 1675
-    label "medicine"
-    color "0"
-  ]
-  node [
-    id 1676
-    label "nyc"
-    color "1"
-  ]
-  node [
-    id 1677
-    label "Lovecraft"
-    color "0"
-  ]
-  node [
-    id 1678
-    label "picture"
-    color "0"
-  ]
-  node [
-    id 1679
-    label "Storytellers"
-    color "0"
-  ]
-  node [
-    id 1680
-    label "artenovance"
-    color "0"
-  ]
-  node [
-    id 1681
-    label "AllAccess"
-    color "0"
-  ]
-  node [
-    id 1682
-    label "ido"
-    color "0"
-  ]
-  node [
-    id 1683
-    label "gracemassage"
-    color "4"
-  ]
-  node [
-    id 1684
-    label "SportsEvent"
-    color "0"
-  ]
-  node [
-    id 1685
-    label "LittleToddler"
-    color "0"
-  ]
-  node [
-    id 1686
-    label "HotWater"
-    color "4"
-  ]
-  node [
-    id 1687
-    label "jaggedaloc"
-    color "4"
-  ]
-  node [
-    id 1688
-    label "egistb"
-    color "0"
-  ]
-  node [
-    id 1689
-    label "singh85"
-    color "0"
-  ]
-  node [
-    id 1690
-    label "cera"
-    color "4"
-  ]
-  node [
-    id 1691
-    label "UFOs"
-    color "5"
-  ]
-  node [
-    id 1692
-    label "winson"
-    color "4"
-  ]
-  node [
-    id 1693
-    label "Bonsai"
-    color "4"
-  ]
-  node [
-    id 1694
-    label "Livestrip"
-    color "4"
-  ]
-  node [
-    id 1695
-    label "jecobsw"
-    color "0"
-  ]
-  node [
-    id 1696
-    label "Madhav"
-    color "4"
-  ]
-  node [
-    id 1697
-    label "designcontest"
-    color "0"
-  ]
-  node [
-    id 1698
-    label "yahuwaku"
-    color "0"
-  ]
-  node [
-    id 1699
-    label "Developernews"
-    color "4"
-  ]
-  node [
-    id 1700
-    label "techymarketer"
-    color "0"
-  ]
-  node [
-    id 1701
-    label "jobs"
-    color "0"
-  ]
-  node [
-    id 1702
-    label "Artists"
-    color "0"
-  ]
-  node [
-    id 1703
-    label "john_r"
-    color "0"
-  ]
-  node [
-    id 1704
-    label "justjim73"
-    color "0"
-  ]
-  node [
-    id 1705
-    label "teeshirtart"
-    color "4"
-  ]
-  node [
-    id 1706
-    label "tmichaelcart"
-    color "4"
-  ]
-  node [
-    id 1707
-    label "usa"
-    color "5"
-  ]
-  node [
-    id 1708
-    label "DebtReliefServices"
-    color "4"
-  ]
-  node [
-    id 1709
-    label "robot"
-    color "0"
-  ]
-  node [
-    id 1710
-    label "qtp"
-    color "4"
-  ]
-  node [
-    id 1711
-    label "crazybitch"
-    color "4"
-  ]
-  node [
-    id 1712
-    label "golf"
-    color "0"
-  ]
-  node [
-    id 1713
-    label "newhaven"
-    color "0"
-  ]
-  node [
-    id 1714
-    label "MilleniumForce"
-    color "0"
-  ]
-  node [
-    id 1715
-    label "whatsupp"
-    color "4"
-  ]
-  node [
-    id 1716
-    label "xandy"
-    color "0"
-  ]
-  node [
-    id 1717
-    label "DailyTrainings"
-    color "4"
-  ]
-  node [
-    id 1718
-    label "SuperSwedishGirls"
-    color "4"
-  ]
-  node [
-    id 1719
-    label "AmericanEconomy"
-    color "4"
-  ]
-  node [
-    id 1720
-    label "AruiZen"
-    color "0"
-  ]
-  node [
-    id 1721
-    label "death"
-    color "4"
-  ]
-  node [
-    id 1722
-    label "kingrobotic"
-    color "4"
-  ]
-  node [
-    id 1723
-    label "petshopplaneta"
-    color "0"
-  ]
-  node [
-    id 1724
-    label "Unicode"
-    color "4"
-  ]
-  node [
-    id 1725
-    label "Forex"
-    color "0"
-  ]
-  node [
-    id 1726
-    label "BustingDiva"
-    color "4"
-  ]
-  node [
-    id 1727
-    label "Lindy"
-    color "4"
-  ]
-  node [
-    id 1728
-    label "matija"
-    color "0"
-  ]
-  node [
-    id 1729
-    label "Nash8686"
-    color "0"
-  ]
-  node [
-    id 1730
-    label "ResearchCapital"
-    color "0"
-  ]
-  node [
-    id 1731
-    label "digitalove"
-    color "0"
-  ]
-  node [
-    id 1732
-    label "kaboom"
-    color "0"
-  ]
-  node [
-    id 1733
-    label "UIUC"
-    color "4"
-  ]
-  node [
-    id 1734
-    label "polls"
-    color "4"
-  ]
-  node [
-    id 1735
-    label "grrm"
-    color "0"
-  ]
-  node [
-    id 1736
-    label "slate"
-    color "4"
-  ]
-  node [
-    id 1737
-    label "Passion"
-    color "4"
-  ]
-  node [
-    id 1738
-    label "Americans"
-    color "0"
-  ]
-  node [
-    id 1739
-    label "RilySi"
-    color "4"
-  ]
-  node [
-    id 1740
-    label "algorithms"
-    color "4"
-  ]
-  node [
-    id 1741
-    label "haiku"
-    color "1"
-  ]
-  node [
-    id 1742
-    label "complaints"
-    color "0"
-  ]
-  node [
-    id 1743
-    label "hurd"
-    color "0"
-  ]
-  node [
-    id 1744
-    label "hate"
-    color "4"
-  ]
-  node [
-    id 1745
-    label "gambling"
-    color "4"
-  ]
-  node [
-    id 1746
-    label "ProgrammingLanguages"
-    color "0"
-  ]
-  node [
-    id 1747
-    label "fx15"
-    color "4"
-  ]
-  node [
-    id 1748
-    label "GGGGive"
-    color "4"
-  ]
-  node [
-    id 1749
-    label "pun"
-    color "4"
-  ]
-  node [
-    id 1750
-    label "Graphics4u"
-    color "4"
-  ]
-  node [
-    id 1751
-    label "PinklisarParadise"
-    color "4"
-  ]
-  node [
-    id 1752
-    label "favorites"
-    color "0"
-  ]
-  node [
-    id 1753
-    label "grecosonthefly"
-    color "0"
-  ]
-  node [
-    id 1754
-    label "su123jon"
-    color "4"
-  ]
-  node [
-    id 1755
-    label "Clemson"
-    color "0"
-  ]
-  node [
-    id 1756
-    label "ecm"
-    color "0"
-  ]
-  node [
-    id 1757
-    label "photography"
-    color "5"
-  ]
-  node [
-    id 1758
-    label "typography"
-    color "4"
-  ]
-  node [
-    id 1759
-    label "awards"
-    color "4"
-  ]
-  node [
-    id 1760
-    label "GatorArcade"
-    color "4"
-  ]
-  node [
-    id 1761
-    label "richlach"
-    color "4"
-  ]
-  node [
-    id 1762
-    label "whattttt"
-    color "4"
-  ]
-  node [
-    id 1763
-    label "KnittingReddit"
-    color "0"
-  ]
-  node [
-    id 1764
-    label "norge"
-    color "4"
-  ]
-  node [
-    id 1765
-    label "LaTeX"
-    color "4"
-  ]
-  node [
-    id 1766
-    label "Liberty"
-    color "5"
-  ]
-  node [
-    id 1767
-    label "LegalNews"
-    color "0"
-  ]
-  node [
-    id 1768
-    label "kratos"
-    color "4"
-  ]
-  node [
-    id 1769
-    label "bash"
-    color "1"
-  ]
-  node [
-    id 1770
-    label "LazyHour"
-    color "4"
-  ]
-  node [
-    id 1771
-    label "Designing"
-    color "4"
-  ]
-  node [
-    id 1772
-    label "incomingbooks"
-    color "4"
-  ]
-  node [
-    id 1773
-    label "WaybackMachine"
-    color "4"
-  ]
-  node [
-    id 1774
-    label "nomorecrapmusic"
-    color "4"
-  ]
-  node [
-    id 1775
-    label "hockey"
-    color "1"
-  ]
-  node [
-    id 1776
-    label "is_computer_on"
-    color "0"
-  ]
-  node [
-    id 1777
-    label "uvr"
-    color "0"
-  ]
-  node [
-    id 1778
-    label "SixHourStartup"
-    color "4"
-  ]
-  node [
-    id 1779
-    label "Maxwell"
-    color "0"
-  ]
-  node [
-    id 1780
-    label "ShepherdExpress"
-    color "0"
-  ]
-  node [
-    id 1781
-    label "powellendorsesdobama"
-    color "0"
-  ]
-  node [
-    id 1782
-    label "citeboomers"
-    color "4"
-  ]
-  node [
-    id 1783
-    label "ComputerworldUKNews"
-    color "0"
-  ]
-  node [
-    id 1784
-    label "ghostbusters"
-    color "4"
-  ]
-  node [
-    id 1785
-    label "Kehlocricket"
-    color "0"
-  ]
-  node [
-    id 1786
-    label "Tantra"
-    color "0"
-  ]
-  node [
-    id 1787
-    label "NOads"
-    color "4"
-  ]
-  node [
-    id 1788
-    label "Celebrity_Central"
-    color "0"
-  ]
-  node [
-    id 1789
-    label "joel"
-    color "4"
-  ]
-  node [
-    id 1790
-    label "uk_ecommerce"
-    color "0"
-  ]
-  node [
-    id 1791
-    label "Nails"
-    color "4"
-  ]
-  node [
-    id 1792
-    label "charlenejones"
-    color "0"
-  ]
-  node [
-    id 1793
-    label "finance2"
-    color "4"
-  ]
-  node [
-    id 1794
-    label "marjorie_L"
-    color "0"
-  ]
-  node [
-    id 1795
-    label "classics"
-    color "4"
-  ]
-  node [
-    id 1796
-    label "Filmzu"
-    color "4"
-  ]
-  node [
-    id 1797
-    label "Britain"
-    color "0"
-  ]
-  node [
-    id 1798
-    label "linguistics"
-    color "5"
-  ]
-  node [
-    id 1799
-    label "smokefree2009"
-    color "0"
-  ]
-  node [
-    id 1800
-    label "911_Truth"
-    color "4"
-  ]
-  node [
-    id 1801
-    label "wow"
-    color "4"
-  ]
-  node [
-    id 1802
-    label "4chan"
-    color "5"
-  ]
-  node [
-    id 1803
-    label "Personalized"
-    color "0"
-  ]
-  node [
-    id 1804
-    label "followup"
-    color "0"
-  ]
-  node [
-    id 1805
-    label "tacos"
-    color "0"
-  ]
-  node [
-    id 1806
-    label "CAPSLOCK"
-    color "0"
-  ]
-  node [
-    id 1807
-    label "RevDevsReddit"
-    color "4"
-  ]
-  node [
-    id 1808
-    label "ResistTyranny"
-    color "0"
-  ]
-  node [
-    id 1809
-    label "globalization"
-    color "0"
-  ]
-  node [
-    id 1810
-    label "pixint"
-    color "4"
-  ]
-  node [
-    id 1811
-    label "ciencia"
-    color "0"
-  ]
-  node [
-    id 1812
-    label "Suomi"
-    color "0"
-  ]
-  node [
-    id 1813
-    label "Hunting"
-    color "4"
-  ]
-  node [
-    id 1814
-    label "bianca"
-    color "0"
-  ]
-  node [
-    id 1815
-    label "cp_retailpos"
-    color "4"
-  ]
-  node [
-    id 1816
-    label "whereisliz"
-    color "0"
-  ]
-  node [
-    id 1817
-    label "Redditnecks"
-    color "4"
-  ]
-  node [
-    id 1818
-    label "Pauliespoint"
-    color "4"
-  ]
-  node [
-    id 1819
-    label "BlazersReddit"
-    color "4"
-  ]
-  node [
-    id 1820
-    label "macprogramming"
-    color "0"
-  ]
-  node [
-    id 1821
-    label "DNChamp"
-    color "4"
-  ]
-  node [
-    id 1822
-    label "electronics"
-    color "1"
-  ]
-  node [
-    id 1823
-    label "bedla"
-    color "0"
-  ]
-  node [
-    id 1824
-    label "PSP"
-    color "4"
-  ]
-  node [
-    id 1825
-    label "SQLServer"
-    color "4"
-  ]
-  node [
-    id 1826
-    label "citizenjournalism"
-    color "0"
-  ]
-  node [
-    id 1827
-    label "linuxgamedevelopment"
-    color "4"
-  ]
-  node [
-    id 1828
-    label "deepdata"
-    color "4"
-  ]
-  node [
-    id 1829
-    label "NotMadeInChina"
-    color "4"
-  ]
-  node [
-    id 1830
-    label "Emarketer"
-    color "4"
-  ]
-  node [
-    id 1831
-    label "computerviruses"
-    color "0"
-  ]
-  node [
-    id 1832
-    label "veg"
-    color "1"
-  ]
-  node [
-    id 1833
-    label "yahoo"
-    color "4"
-  ]
-  node [
-    id 1834
-    label "BusinessIntelligence"
-    color "4"
-  ]
-  node [
-    id 1835
-    label "avr"
-    color "0"
-  ]
-  node [
-    id 1836
-    label "psychoanalysis"
-    color "0"
-  ]
-  node [
-    id 1837
-    label "off_topic"
-    color "4"
-  ]
-  node [
-    id 1838
-    label "defc0n1"
-    color "4"
-  ]
-  node [
-    id 1839
-    label "Thirdsoul"
-    color "4"
-  ]
-  node [
-    id 1840
-    label "Wirelessgalaxy"
-    color "0"
-  ]
-  node [
-    id 1841
-    label "Scotland"
-    color "0"
-  ]
-  node [
-    id 1842
-    label "directrep"
-    color "4"
-  ]
-  node [
-    id 1843
-    label "CreativeInspiration"
-    color "0"
-  ]
-  node [
-    id 1844
-    label "plasma"
-    color "0"
-  ]
-  node [
-    id 1845
-    label "comedy"
-    color "4"
-  ]
-  node [
-    id 1846
-    label "Tripartisan"
-    color "4"
-  ]
-  node [
-    id 1847
-    label "pinoy"
-    color "4"
-  ]
-  node [
-    id 1848
-    label "scheme"
-    color "4"
-  ]
-  node [
-    id 1849
-    label "donrobert"
-    color "0"
-  ]
-  node [
-    id 1850
-    label "lesb"
-    color "0"
-  ]
-  node [
-    id 1851
-    label "twilight"
-    color "0"
-  ]
-  node [
-    id 1852
-    label "billebert"
-    color "4"
-  ]
-  node [
-    id 1853
-    label "superoutdoorsmen"
-    color "4"
-  ]
-  node [
-    id 1854
-    label "contrarian"
-    color "0"
-  ]
-  node [
-    id 1855
-    label "Ablacksheep"
-    color "4"
-  ]
-  node [
-    id 1856
-    label "WebNews"
-    color "1"
-  ]
-  node [
-    id 1857
-    label "Soccymartin"
-    color "0"
-  ]
-  node [
-    id 1858
-    label "Aiqbalawan"
-    color "0"
-  ]
-  node [
-    id 1859
-    label "tarot"
-    color "0"
-  ]
-  node [
-    id 1860
-    label "giftfruit"
-    color "4"
-  ]
-  node [
-    id 1861
-    label "sketches"
-    color "4"
-  ]
-  node [
-    id 1862
-    label "BluesMusic"
-    color "4"
-  ]
-  node [
-    id 1863
-    label "newzealand"
-    color "0"
-  ]
-  node [
-    id 1864
-    label "badger"
-    color "4"
-  ]
-  node [
-    id 1865
-    label "DigitalEdge"
-    color "4"
-  ]
-  node [
-    id 1866
-    label "gustav"
-    color "4"
-  ]
-  node [
-    id 1867
-    label "oreillymedia"
-    color "0"
-  ]
-  node [
-    id 1868
-    label "civilengineering"
-    color "4"
-  ]
-  node [
-    id 1869
-    label "DLP"
-    color "0"
-  ]
-  node [
-    id 1870
-    label "wisebread"
-    color "0"
-  ]
-  node [
-    id 1871
-    label "AmericanJewishPower"
-    color "0"
-  ]
-  node [
-    id 1872
-    label "esteem"
-    color "4"
-  ]
-  node [
-    id 1873
-    label "Realty"
-    color "4"
-  ]
-  node [
-    id 1874
-    label "Gays"
-    color "0"
-  ]
-  node [
-    id 1875
-    label "SuggestMusic"
-    color "4"
-  ]
-  node [
-    id 1876
-    label "futbol_haberleri"
-    color "4"
-  ]
-  node [
-    id 1877
-    label "Ofbeat"
-    color "4"
-  ]
-  node [
-    id 1878
-    label "humptydumptynews"
-    color "0"
-  ]
-  node [
-    id 1879
-    label "SatuKarimun"
-    color "4"
-  ]
-  node [
-    id 1880
-    label "pwang"
-    color "4"
-  ]
-  node [
-    id 1881
-    label "animalfriends"
-    color "0"
-  ]
-  node [
-    id 1882
-    label "left4dead"
-    color "4"
-  ]
-  node [
-    id 1883
-    label "korea"
-    color "0"
-  ]
-  node [
-    id 1884
-    label "Innerpreneurship"
-    color "4"
-  ]
-  node [
-    id 1885
-    label "london"
-    color "0"
-  ]
-  node [
-    id 1886
-    label "regassan"
-    color "4"
-  ]
-  node [
-    id 1887
-    label "WTF"
-    color "5"
-  ]
-  node [
-    id 1888
-    label "PreparedSociety"
-    color "4"
-  ]
-  node [
-    id 1889
-    label "newspapers"
-    color "4"
-  ]
-  node [
-    id 1890
-    label "haloforge"
-    color "4"
-  ]
-  node [
-    id 1891
-    label "CGSutra"
-    color "4"
-  ]
-  node [
-    id 1892
-    label "weirdgames"
-    color "4"
-  ]
-  node [
-    id 1893
-    label "Motorsport"
-    color "0"
-  ]
-  node [
-    id 1894
-    label "adown"
-    color "4"
-  ]
-  node [
-    id 1895
-    label "xrosswheeler"
-    color "4"
-  ]
-  node [
-    id 1896
-    label "Hopefuls"
-    color "4"
-  ]
-  node [
-    id 1897
-    label "blizzit"
-    color "4"
-  ]
-  node [
-    id 1898
-    label "Catalysts"
-    color "0"
-  ]
-  node [
-    id 1899
-    label "Trucking"
-    color "4"
-  ]
-  node [
-    id 1900
-    label "xTRUMANx"
-    color "1"
-  ]
-  node [
-    id 1901
-    label "Beers"
-    color "4"
-  ]
-  node [
-    id 1902
-    label "greetings"
-    color "0"
-  ]
-  node [
-    id 1903
-    label "telescopes"
-    color "0"
-  ]
-  node [
-    id 1904
-    label "Rural"
-    color "4"
-  ]
-  node [
-    id 1905
-    label "sumobackup"
-    color "0"
-  ]
-  node [
-    id 1906
-    label "metart"
-    color "4"
-  ]
-  node [
-    id 1907
-    label "hilary"
-    color "4"
-  ]
-  node [
-    id 1908
-    label "Muecs"
-    color "0"
-  ]
-  node [
-    id 1909
-    label "ArtMakers"
-    color "0"
-  ]
-  node [
-    id 1910
-    label "Gears"
-    color "0"
-  ]
-  node [
-    id 1911
-    label "Skepticism"
-    color "0"
-  ]
-  node [
-    id 1912
-    label "potus08"
-    color "4"
-  ]
-  node [
-    id 1913
-    label "anna7317"
-    color "0"
-  ]
-  node [
-    id 1914
-    label "bushlegacyproject"
-    color "0"
-  ]
-  node [
-    id 1915
-    label "EBM"
-    color "0"
-  ]
-  node [
-    id 1916
-    label "Kerala"
-    color "4"
-  ]
-  node [
-    id 1917
-    label "GreenBayPackers"
-    color "0"
-  ]
-  node [
-    id 1918
-    label "Jithin"
-    color "0"
-  ]
-  node [
-    id 1919
-    label "elections"
-    color "0"
-  ]
-  node [
-    id 1920
-    label "FatLoss"
-    color "0"
-  ]
-  node [
-    id 1921
-    label "videouselection2008"
-    color "0"
-  ]
-  node [
-    id 1922
-    label "celebrity"
-    color "1"
-  ]
-  node [
-    id 1923
-    label "Iowa"
-    color "0"
-  ]
-  node [
-    id 1924
-    label "otl"
-    color "4"
-  ]
-  node [
-    id 1925
-    label "CueSportTV"
-    color "4"
-  ]
-  node [
-    id 1926
-    label "ShmoozeIt"
-    color "4"
-  ]
-  node [
-    id 1927
-    label "WUOG"
-    color "0"
-  ]
-  node [
-    id 1928
-    label "vikramkaushal"
-    color "0"
-  ]
-  node [
-    id 1929
-    label "mental_helaht"
-    color "4"
-  ]
-  node [
-    id 1930
-    label "DulceBurro"
-    color "0"
-  ]
-  node [
-    id 1931
-    label "startups"
-    color "5"
-  ]
-  node [
-    id 1932
-    label "Niger"
-    color "4"
-  ]
-  node [
-    id 1933
-    label "subredditis"
-    color "0"
-  ]
-  node [
-    id 1934
-    label "NoDuh"
-    color "0"
-  ]
-  node [
-    id 1935
-    label "selfimprovement"
-    color "4"
-  ]
-  node [
-    id 1936
-    label "HotelsUK"
-    color "0"
-  ]
-  node [
-    id 1937
-    label "Jeffrey"
-    color "4"
-  ]
-  node [
-    id 1938
-    label "Sexy"
-    color "5"
-  ]
-  node [
-    id 1939
-    label "electronicmusic"
-    color "4"
-  ]
-  node [
-    id 1940
-    label "Turkey"
-    color "4"
-  ]
-  node [
-    id 1941
-    label "serbia"
-    color "4"
-  ]
-  node [
-    id 1942
-    label "fuckthedrugwar"
-    color "0"
-  ]
-  node [
-    id 1943
-    label "astro"
-    color "5"
-  ]
-  node [
-    id 1944
-    label "yourgovernmentatwork"
-    color "4"
-  ]
-  node [
-    id 1945
-    label "MichaelSeylar"
-    color "4"
-  ]
-  node [
-    id 1946
-    label "boingboing"
-    color "0"
-  ]
-  node [
-    id 1947
-    label "Amigos"
-    color "4"
-  ]
-  node [
-    id 1948
-    label "letsmakeagame"
-    color "4"
-  ]
-  node [
-    id 1949
-    label "CakeWatch"
-    color "0"
-  ]
-  node [
-    id 1950
-    label "dlatua"
-    color "4"
-  ]
-  node [
-    id 1951
-    label "BABEnvironment"
-    color "4"
-  ]
-  node [
-    id 1952
-    label "browsers"
-    color "0"
-  ]
-  node [
-    id 1953
-    label "iPhoneDev"
-    color "0"
-  ]
-  node [
-    id 1954
-    label "GrammarNazi"
-    color "4"
-  ]
-  node [
-    id 1955
-    label "pretty"
-    color "4"
-  ]
-  node [
-    id 1956
-    label "rolaqonline"
-    color "4"
-  ]
-  node [
-    id 1957
-    label "callingIT"
-    color "4"
-  ]
-  node [
-    id 1958
-    label "Bamze"
-    color "0"
-  ]
-  node [
-    id 1959
-    label "country"
-    color "4"
-  ]
-  node [
-    id 1960
-    label "petpeeve"
-    color "4"
-  ]
-  node [
-    id 1961
-    label "KLUG"
-    color "4"
-  ]
-  node [
-    id 1962
-    label "cuiltheory"
-    color "4"
-  ]
-  node [
-    id 1963
-    label "windows"
-    color "4"
-  ]
-  node [
-    id 1964
-    label "loveandroid"
-    color "0"
-  ]
-  node [
-    id 1965
-    label "Sparta"
-    color "0"
-  ]
-  node [
-    id 1966
-    label "venti"
-    color "4"
-  ]
-  node [
-    id 1967
-    label "younessi"
-    color "4"
-  ]
-  node [
-    id 1968
-    label "MotivatedPhotos"
-    color "4"
-  ]
-  node [
-    id 1969
-    label "Alex"
-    color "0"
-  ]
-  node [
-    id 1970
-    label "yourweek"
-    color "5"
-  ]
-  node [
-    id 1971
-    label "travelnews"
-    color "0"
-  ]
-  node [
-    id 1972
-    label "hentai"
-    color "4"
-  ]
-  node [
-    id 1973
-    label "Lighting"
-    color "0"
-  ]
-  node [
-    id 1974
-    label "ngongo"
-    color "4"
-  ]
-  node [
-    id 1975
-    label "Celebs_Gossiper"
-    color "4"
-  ]
-  node [
-    id 1976
-    label "fsm"
-    color "0"
-  ]
-  node [
-    id 1977
-    label "MonsterVine"
-    color "0"
-  ]
-  node [
-    id 1978
-    label "audible"
-    color "4"
-  ]
-  node [
-    id 1979
-    label "greentea"
-    color "0"
-  ]
-  node [
-    id 1980
-    label "10stepstohealth"
-    color "4"
-  ]
-  node [
-    id 1981
-    label "skating"
-    color "0"
-  ]
-  node [
-    id 1982
-    label "seduction"
-    color "4"
-  ]
-  node [
-    id 1983
-    label "Brooklyn"
-    color "0"
-  ]
-  node [
-    id 1984
-    label "bestactorofiran"
-    color "4"
-  ]
-  node [
-    id 1985
-    label "ashima28"
-    color "0"
-  ]
-  node [
-    id 1986
-    label "Rocking"
-    color "0"
-  ]
-  node [
-    id 1987
-    label "Innovationmeme"
-    color "0"
-  ]
-  node [
-    id 1988
-    label "AdaptogenNet"
-    color "0"
-  ]
-  node [
-    id 1989
-    label "ROHIT2SMART"
-    color "0"
-  ]
-  node [
-    id 1990
-    label "MGSM"
-    color "0"
-  ]
-  node [
-    id 1991
-    label "2012"
-    color "4"
-  ]
-  node [
-    id 1992
-    label "JessicaMooray"
-    color "0"
-  ]
-  node [
-    id 1993
-    label "wesley"
-    color "4"
-  ]
-  node [
-    id 1994
-    label "DietHealth"
-    color "4"
-  ]
-  node [
-    id 1995
-    label "environment"
-    color "5"
-  ]
-  node [
-    id 1996
-    label "HAM"
-    color "4"
-  ]
-  node [
-    id 1997
-    label "superhappy"
-    color "4"
-  ]
-  node [
-    id 1998
-    label "forum"
-    color "0"
-  ]
-  node [
-    id 1999
-    label "justwow"
-    color "0"
-  ]
-  node [
-    id 2000
-    label "OUI"
-    color "0"
-  ]
-  node [
-    id 2001
-    label "Stan"
-    color "4"
-  ]
-  node [
-    id 2002
-    label "Jameselle"
-    color "4"
-  ]
-  node [
-    id 2003
-    label "Israel"
-    color "5"
-  ]
-  node [
-    id 2004
-    label "OneMFriends"
-    color "0"
-  ]
-  node [
-    id 2005
-    label "anglotopia"
-    color "4"
-  ]
-  node [
-    id 2006
-    label "Mastercom"
-    color "0"
-  ]
-  node [
-    id 2007
-    label "Houseofbikers"
-    color "4"
-  ]
-  node [
-    id 2008
-    label "mcmattp"
-    color "0"
-  ]
-  node [
-    id 2009
-    label "animation"
-    color "5"
-  ]
-  node [
-    id 2010
-    label "management"
-    color "0"
-  ]
-  node [
-    id 2011
-    label "independent"
-    color "5"
-  ]
-  node [
-    id 2012
-    label "endless"
-    color "4"
-  ]
-  node [
-    id 2013
-    label "pkny23"
-    color "0"
-  ]
-  node [
-    id 2014
-    label "InboxMarketing"
-    color "4"
-  ]
-  node [
-    id 2015
-    label "philadelphia"
-    color "4"
-  ]
-  node [
-    id 2016
-    label "haneporg"
-    color "0"
-  ]
-  node [
-    id 2017
-    label "techinhiding"
-    color "0"
-  ]
-  node [
-    id 2018
-    label "za121n"
-    color "0"
-  ]
-  node [
-    id 2019
-    label "istanbul"
-    color "0"
-  ]
-  node [
-    id 2020
-    label "autrementleweb"
-    color "0"
-  ]
-  node [
-    id 2021
-    label "BiblicalArchaeology"
-    color "0"
-  ]
-  node [
-    id 2022
-    label "MyDailyDj"
-    color "0"
-  ]
-  node [
-    id 2023
-    label "Attenborough"
-    color "0"
-  ]
-  node [
-    id 2024
-    label "ebooks"
-    color "0"
-  ]
-  node [
-    id 2025
-    label "isariv"
-    color "4"
-  ]
-  node [
-    id 2026
-    label "cars"
-    color "0"
-  ]
-  node [
-    id 2027
-    label "MoneyAnswerTree"
-    color "0"
-  ]
-  node [
-    id 2028
-    label "Caterinca"
-    color "4"
-  ]
-  node [
-    id 2029
-    label "arunrocks"
-    color "4"
-  ]
-  node [
-    id 2030
-    label "positivethinker"
-    color "4"
-  ]
-  node [
-    id 2031
-    label "Celebs"
-    color "0"
-  ]
-  node [
-    id 2032
-    label "indocapitalfund"
-    color "0"
-  ]
-  node [
-    id 2033
-    label "dcpanganiban"
-    color "0"
-  ]
-  node [
-    id 2034
-    label "ThisAmericanLife"
-    color "4"
-  ]
-  node [
-    id 2035
-    label "TurkeyBacon"
-    color "4"
-  ]
-  node [
-    id 2036
-    label "WikiDashboard"
-    color "0"
-  ]
-  node [
-    id 2037
-    label "realestateinvesting"
-    color "4"
-  ]
-  node [
-    id 2038
-    label "agathaaden"
-    color "4"
-  ]
-  node [
-    id 2039
-    label "disc"
-    color "0"
-  ]
-  node [
-    id 2040
-    label "ATWT"
-    color "4"
-  ]
-  node [
-    id 2041
-    label "CougarPulse"
-    color "0"
-  ]
-  node [
-    id 2042
-    label "UnsolvedMysteries"
-    color "0"
-  ]
-  node [
-    id 2043
-    label "bonsaijon"
-    color "4"
-  ]
-  node [
-    id 2044
-    label "captioncontest"
-    color "0"
-  ]
-  node [
-    id 2045
-    label "AJokes"
-    color "4"
-  ]
-  node [
-    id 2046
-    label "Gossiptainment"
-    color "0"
-  ]
-  node [
-    id 2047
-    label "PeterSchiff"
-    color "4"
-  ]
-  node [
-    id 2048
-    label "Genseq"
-    color "0"
-  ]
-  node [
-    id 2049
-    label "d1g"
-    color "0"
-  ]
-  node [
-    id 2050
-    label "YFRIndia"
-    color "4"
-  ]
-  node [
-    id 2051
-    label "StupidCriminals"
-    color "0"
-  ]
-  node [
-    id 2052
-    label "xinh"
-    color "4"
-  ]
-  node [
-    id 2053
-    label "neoachorite"
-    color "4"
-  ]
-  node [
-    id 2054
-    label "911truth"
-    color "5"
-  ]
-  node [
-    id 2055
-    label "siliconvalley"
-    color "4"
-  ]
-  node [
-    id 2056
-    label "quake3"
-    color "0"
-  ]
-  node [
-    id 2057
-    label "Fantasy"
-    color "0"
-  ]
-  node [
-    id 2058
-    label "xkcd"
-    color "5"
-  ]
-  node [
-    id 2059
-    label "offensive"
-    color "4"
-  ]
-  node [
-    id 2060
-    label "Tippiz"
-    color "0"
-  ]
-  node [
-    id 2061
-    label "ComputerSecurity"
-    color "5"
-  ]
-  node [
-    id 2062
-    label "helpdesk"
-    color "4"
-  ]
-  node [
-    id 2063
-    label "asftechnology"
-    color "4"
-  ]
-  node [
-    id 2064
-    label "Ashish"
-    color "0"
-  ]
-  node [
-    id 2065
-    label "CarLeasing"
-    color "4"
-  ]
-  node [
-    id 2066
-    label "african_music"
-    color "0"
-  ]
-  node [
-    id 2067
-    label "hotvideos"
-    color "0"
-  ]
-  node [
-    id 2068
-    label "goats"
-    color "0"
-  ]
-  node [
-    id 2069
-    label "terryly"
-    color "0"
-  ]
-  node [
-    id 2070
-    label "tubing"
-    color "0"
-  ]
-  node [
-    id 2071
-    label "technology"
-    color "5"
-  ]
-  node [
-    id 2072
-    label "MoosePatrol"
-    color "4"
-  ]
-  node [
-    id 2073
-    label "FunnyFidos"
-    color "0"
-  ]
-  node [
-    id 2074
-    label "Amigoni"
-    color "0"
-  ]
-  node [
-    id 2075
-    label "visualization"
-    color "0"
-  ]
-  node [
-    id 2076
-    label "WEBFTW"
-    color "0"
-  ]
-  node [
-    id 2077
-    label "Guitarman51"
-    color "4"
-  ]
-  node [
-    id 2078
-    label "l33t"
-    color "5"
-  ]
-  node [
-    id 2079
-    label "Plugyoursite"
-    color "0"
-  ]
-  node [
-    id 2080
-    label "Big_Tits_old_Milfs"
-    color "4"
-  ]
-  node [
-    id 2081
-    label "vintagetwist"
-    color "4"
-  ]
-  node [
-    id 2082
-    label "crime"
-    color "5"
-  ]
-  node [
-    id 2083
-    label "cimigo"
-    color "4"
-  ]
-  node [
-    id 2084
-    label "funnylolcats"
-    color "4"
-  ]
-  node [
-    id 2085
-    label "harajuku"
-    color "0"
-  ]
-  node [
-    id 2086
-    label "Outdoors"
-    color "4"
-  ]
-  node [
-    id 2087
-    label "justforkids"
-    color "0"
-  ]
-  node [
-    id 2088
-    label "LAlofts"
-    color "4"
-  ]
-  node [
-    id 2089
-    label "NewsGuru"
-    color "4"
-  ]
-  node [
-    id 2090
-    label "Letsgetawesome"
-    color "4"
-  ]
-  node [
-    id 2091
-    label "porn"
-    color "0"
-  ]
-  node [
-    id 2092
-    label "bungaseruni"
-    color "0"
-  ]
-  node [
-    id 2093
-    label "PassionOnNow"
-    color "0"
-  ]
-  node [
-    id 2094
-    label "Bakugan"
-    color "0"
-  ]
-  node [
-    id 2095
-    label "GolfInstruction"
-    color "0"
-  ]
-  node [
-    id 2096
-    label "uxbuzz"
-    color "0"
-  ]
-  node [
-    id 2097
-    label "Quonews"
-    color "0"
-  ]
-  node [
-    id 2098
-    label "nanotechnology"
-    color "4"
-  ]
-  node [
-    id 2099
-    label "lectures"
-    color "4"
-  ]
-  node [
-    id 2100
-    label "NOLA"
-    color "0"
-  ]
-  node [
-    id 2101
-    label "actlocally"
-    color "0"
-  ]
-  node [
-    id 2102
-    label "Poo"
-    color "0"
-  ]
-  node [
-    id 2103
-    label "Joseph4u"
-    color "0"
-  ]
-  node [
-    id 2104
-    label "StupidVideos"
-    color "4"
-  ]
-  node [
-    id 2105
-    label "MACGREGOR"
-    color "4"
-  ]
-  node [
-    id 2106
-    label "harrypotter"
-    color "0"
-  ]
-  node [
-    id 2107
-    label "MontrealTechWatch"
-    color "4"
-  ]
-  node [
-    id 2108
-    label "ScrappyMusic"
-    color "0"
-  ]
-  node [
-    id 2109
-    label "OnlineBingoGala"
-    color "0"
-  ]
-  node [
-    id 2110
-    label "borondon"
-    color "0"
-  ]
-  node [
-    id 2111
-    label "Inflation_Watch"
-    color "0"
-  ]
-  node [
-    id 2112
-    label "RedditRetards"
-    color "4"
-  ]
-  node [
-    id 2113
-    label "ihavereadit"
-    color "4"
-  ]
-  node [
-    id 2114
-    label "blackculture"
-    color "0"
-  ]
-  node [
-    id 2115
-    label "zen"
-    color "1"
-  ]
-  node [
-    id 2116
-    label "obeygiant"
-    color "4"
-  ]
-  node [
-    id 2117
-    label "Cetatenie"
-    color "0"
-  ]
-  node [
-    id 2118
-    label "transit"
-    color "4"
-  ]
-  node [
-    id 2119
-    label "Julie"
-    color "0"
-  ]
-  node [
-    id 2120
-    label "hcwdb"
-    color "4"
-  ]
-  node [
-    id 2121
-    label "VideoBuzz"
-    color "4"
-  ]
-  node [
-    id 2122
-    label "chistes"
-    color "4"
-  ]
-  node [
-    id 2123
-    label "search"
-    color "4"
-  ]
-  node [
-    id 2124
-    label "mspianobug"
-    color "4"
-  ]
-  node [
-    id 2125
-    label "GossipMax"
-    color "0"
-  ]
-  node [
-    id 2126
-    label "xbox360games"
-    color "4"
-  ]
-  node [
-    id 2127
-    label "Hair"
-    color "4"
-  ]
-  node [
-    id 2128
-    label "matheducation"
-    color "0"
-  ]
-  node [
-    id 2129
-    label "earthhour"
-    color "4"
-  ]
-  node [
-    id 2130
-    label "Discounts"
-    color "4"
-  ]
-  node [
-    id 2131
-    label "NewOrleans"
-    color "4"
-  ]
-  node [
-    id 2132
-    label "Common_Lisp"
-    color "0"
-  ]
-  node [
-    id 2133
-    label "police"
-    color "4"
-  ]
-  node [
-    id 2134
-    label "wallpaper"
-    color "4"
-  ]
-  node [
-    id 2135
-    label "thiyagaraaj"
-    color "0"
-  ]
-  node [
-    id 2136
-    label "MassHighTech"
-    color "4"
-  ]
-  node [
-    id 2137
-    label "Reviews"
-    color "0"
-  ]
-  node [
-    id 2138
-    label "fuckXmas"
-    color "0"
-  ]
-  node [
-    id 2139
-    label "FedWorker"
-    color "4"
-  ]
-  node [
-    id 2140
-    label "pranks"
-    color "0"
-  ]
-  node [
-    id 2141
-    label "SocialTheory"
-    color "0"
-  ]
-  node [
-    id 2142
-    label "CollegeFootball"
-    color "4"
-  ]
-  node [
-    id 2143
-    label "Metamorphosis"
-    color "0"
-  ]
-  node [
-    id 2144
-    label "malwarecity"
-    color "0"
-  ]
-  node [
-    id 2145
-    label "zibb"
-    color "4"
-  ]
-  node [
-    id 2146
-    label "kikko"
-    color "0"
-  ]
-  node [
-    id 2147
-    label "punk"
-    color "4"
-  ]
-  node [
-    id 2148
-    label "extjs"
-    color "4"
-  ]
-  node [
-    id 2149
-    label "Fotobookmarks"
-    color "4"
-  ]
-  node [
-    id 2150
-    label "I_am_a_PC"
-    color "0"
-  ]
-  node [
-    id 2151
-    label "megaroyalti"
-    color "0"
-  ]
-  node [
-    id 2152
-    label "metareddit"
-    color "4"
-  ]
-  node [
-    id 2153
-    label "Mars"
-    color "4"
-  ]
-  node [
-    id 2154
-    label "kefke44"
-    color "0"
-  ]
-  node [
-    id 2155
-    label "Scary"
-    color "0"
-  ]
-  node [
-    id 2156
-    label "riaa"
-    color "4"
-  ]
-  node [
-    id 2157
-    label "information"
-    color "0"
-  ]
-  node [
-    id 2158
-    label "hypotheticals"
-    color "4"
-  ]
-  node [
-    id 2159
-    label "Anil"
-    color "4"
-  ]
-  node [
-    id 2160
-    label "zeppelins"
-    color "4"
-  ]
-  node [
-    id 2161
-    label "scissoring"
-    color "0"
-  ]
-  node [
-    id 2162
-    label "weather"
-    color "0"
-  ]
-  node [
-    id 2163
-    label "NewAgeReligion"
-    color "0"
-  ]
-  node [
-    id 2164
-    label "TennisGrandstand"
-    color "0"
-  ]
-  node [
-    id 2165
-    label "TORBooks"
-    color "4"
-  ]
-  node [
-    id 2166
-    label "rosilawani"
-    color "4"
-  ]
-  node [
-    id 2167
-    label "lazy"
-    color "4"
-  ]
-  node [
-    id 2168
-    label "gokhan"
-    color "4"
-  ]
-  node [
-    id 2169
-    label "dickoftheyear"
-    color "1"
-  ]
-  node [
-    id 2170
-    label "xmpp"
-    color "0"
-  ]
-  node [
-    id 2171
-    label "downloadfromyoutube"
-    color "4"
-  ]
-  node [
-    id 2172
-    label "gtoddv"
-    color "0"
-  ]
-  node [
-    id 2173
-    label "onlinejournalism"
-    color "4"
-  ]
-  node [
-    id 2174
-    label "Sexzy"
-    color "4"
-  ]
-  node [
-    id 2175
-    label "drunkenpigs"
-    color "0"
-  ]
-  node [
-    id 2176
-    label "Epilare"
-    color "0"
-  ]
-  node [
-    id 2177
-    label "subreddit_complaints"
-    color "0"
-  ]
-  node [
-    id 2178
-    label "sar"
-    color "4"
-  ]
-  node [
-    id 2179
-    label "tard"
-    color "4"
-  ]
-  node [
-    id 2180
-    label "PhilosophyCorner"
-    color "0"
-  ]
-  node [
-    id 2181
-    label "dailywtf"
-    color "5"
-  ]
-  node [
-    id 2182
-    label "nutechstuff"
-    color "4"
-  ]
-  node [
-    id 2183
-    label "Trays"
-    color "4"
-  ]
-  node [
-    id 2184
-    label "blogger"
-    color "0"
-  ]
-  node [
-    id 2185
-    label "cherrysave"
-    color "4"
-  ]
-  node [
-    id 2186
-    label "matrako"
-    color "4"
-  ]
-  node [
-    id 2187
-    label "college"
-    color "0"
-  ]
-  node [
-    id 2188
-    label "bestof_conspiracy"
-    color "0"
-  ]
-  node [
-    id 2189
-    label "renil"
-    color "0"
-  ]
-  node [
-    id 2190
-    label "monocle"
-    color "0"
-  ]
-  node [
-    id 2191
-    label "netsec"
-    color "5"
-  ]
-  node [
-    id 2192
-    label "motormaniac"
-    color "4"
-  ]
-  node [
-    id 2193
-    label "femto"
-    color "0"
-  ]
-  node [
-    id 2194
-    label "SexyLinks"
-    color "0"
-  ]
-  node [
-    id 2195
-    label "Neoogilvy"
-    color "4"
-  ]
-  node [
-    id 2196
-    label "nodoubt2"
-    color "0"
-  ]
-  node [
-    id 2197
-    label "omni"
-    color "4"
-  ]
-  node [
-    id 2198
-    label "erlang"
-    color "4"
-  ]
-  node [
-    id 2199
-    label "Capitalism"
-    color "4"
-  ]
-  node [
-    id 2200
-    label "urgentloan"
-    color "0"
-  ]
-  node [
-    id 2201
-    label "cuil"
-    color "4"
-  ]
-  node [
-    id 2202
-    label "j2me"
-    color "0"
-  ]
-  node [
-    id 2203
-    label "koreanmovies"
-    color "4"
-  ]
-  node [
-    id 2204
-    label "Art"
-    color "5"
-  ]
-  node [
-    id 2205
-    label "ekerala"
-    color "4"
-  ]
-  node [
-    id 2206
-    label "MixingItUp"
-    color "0"
-  ]
-  node [
-    id 2207
-    label "Catholic"
-    color "0"
-  ]
-  node [
-    id 2208
-    label "BusinessNetwork"
-    color "4"
-  ]
-  node [
-    id 2209
-    label "The_Fantasy_Art_Blog"
-    color "0"
-  ]
-  node [
-    id 2210
-    label "scene"
-    color "4"
-  ]
-  node [
-    id 2211
-    label "Articles"
-    color "0"
-  ]
-  node [
-    id 2212
-    label "feetish"
-    color "0"
-  ]
-  node [
-    id 2213
-    label "hotels"
-    color "4"
-  ]
-  node [
-    id 2214
-    label "AmericanBridal"
-    color "0"
-  ]
-  node [
-    id 2215
-    label "GameSkive"
-    color "4"
-  ]
-  node [
-    id 2216
-    label "SecurityReddit"
-    color "4"
-  ]
-  node [
-    id 2217
-    label "agile"
-    color "1"
-  ]
-  node [
-    id 2218
-    label "ddpulsa"
-    color "4"
-  ]
-  node [
-    id 2219
-    label "FAIRFederation"
-    color "0"
-  ]
-  node [
-    id 2220
-    label "Sitesbid"
-    color "4"
-  ]
-  node [
-    id 2221
-    label "csstest2"
-    color "4"
-  ]
-  node [
-    id 2222
-    label "words"
-    color "0"
-  ]
-  node [
-    id 2223
-    label "theater"
-    color "4"
-  ]
-  node [
-    id 2224
-    label "mysearch2008"
-    color "0"
-  ]
-  node [
-    id 2225
-    label "chicagoland"
-    color "4"
-  ]
-  node [
-    id 2226
-    label "KnobsHingesandMore"
-    color "4"
-  ]
-  node [
-    id 2227
-    label "ruby"
-    color "4"
-  ]
-  node [
-    id 2228
-    label "rben"
-    color "4"
-  ]
-  node [
-    id 2229
-    label "BeardsMotherfucker"
-    color "4"
-  ]
-  node [
-    id 2230
-    label "Conservative"
-    color "1"
-  ]
-  node [
-    id 2231
-    label "mypussyhurts"
-    color "0"
-  ]
-  node [
-    id 2232
-    label "BlackOps"
-    color "5"
-  ]
-  node [
-    id 2233
-    label "freesoftware"
-    color "0"
-  ]
-  node [
-    id 2234
-    label "ada"
-    color "0"
-  ]
-  node [
-    id 2235
-    label "Tryton"
-    color "4"
-  ]
-  node [
-    id 2236
-    label "Showboxx"
-    color "4"
-  ]
-  node [
-    id 2237
-    label "sv"
-    color "1"
-  ]
-  node [
-    id 2238
-    label "Exercises"
-    color "4"
-  ]
-  node [
-    id 2239
-    label "johncabellreads"
-    color "4"
-  ]
-  node [
-    id 2240
-    label "vibemetrix"
-    color "4"
-  ]
-  node [
-    id 2241
-    label "thetruth"
-    color "0"
-  ]
-  node [
-    id 2242
-    label "jacobwillread"
-    color "4"
-  ]
-  node [
-    id 2243
-    label "scala"
-    color "4"
-  ]
-  node [
-    id 2244
-    label "eOffice"
-    color "0"
-  ]
-  node [
-    id 2245
-    label "MyRevivl"
-    color "0"
-  ]
-  node [
-    id 2246
-    label "oliveoil"
-    color "4"
-  ]
-  node [
-    id 2247
-    label "Atlanta"
-    color "0"
-  ]
-  node [
-    id 2248
-    label "Composers"
-    color "0"
-  ]
-  node [
-    id 2249
-    label "Bikini"
-    color "4"
-  ]
-  node [
-    id 2250
-    label "EntenduQc"
-    color "4"
-  ]
-  node [
-    id 2251
-    label "songs"
-    color "4"
-  ]
-  node [
-    id 2252
-    label "bestsitesever"
-    color "4"
-  ]
-  node [
-    id 2253
-    label "panda"
-    color "0"
-  ]
-  node [
-    id 2254
-    label "action"
-    color "0"
-  ]
-  node [
-    id 2255
-    label "Hardcore"
-    color "4"
-  ]
-  node [
-    id 2256
-    label "mobileweb"
-    color "4"
-  ]
-  node [
-    id 2257
-    label "pitbulls"
-    color "0"
-  ]
-  node [
-    id 2258
-    label "hhjoo"
-    color "4"
-  ]
-  node [
-    id 2259
-    label "programming_ru"
-    color "4"
-  ]
-  node [
-    id 2260
-    label "latin"
-    color "4"
-  ]
-  node [
-    id 2261
-    label "wenyude"
-    color "4"
-  ]
-  node [
-    id 2262
-    label "Amateur"
-    color "1"
-  ]
-  node [
-    id 2263
-    label "JimDicken"
-    color "4"
-  ]
-  node [
-    id 2264
-    label "solarpowerreview"
-    color "4"
-  ]
-  node [
-    id 2265
-    label "yo_yo"
-    color "4"
-  ]
-  node [
-    id 2266
-    label "fffffffuuuuuuuuuuuu"
-    color "4"
-  ]
-  node [
-    id 2267
-    label "PoliticianRegistry"
-    color "0"
-  ]
-  node [
-    id 2268
-    label "vikash"
-    color "0"
-  ]
-  node [
-    id 2269
-    label "ideasfortheadmins"
-    color "0"
-  ]
-  node [
-    id 2270
-    label "jasonallenmiller"
-    color "4"
-  ]
-  node [
-    id 2271
-    label "answers"
-    color "4"
-  ]
-  node [
-    id 2272
-    label "redditcompetition"
-    color "0"
-  ]
-  node [
-    id 2273
-    label "harrisonburg"
-    color "0"
-  ]
-  node [
-    id 2274
-    label "minnesotavikings"
-    color "0"
-  ]
-  node [
-    id 2275
-    label "ryansjones"
-    color "4"
-  ]
-  node [
-    id 2276
-    label "schneier"
-    color "0"
-  ]
-  node [
-    id 2277
-    label "AnimatedGifs"
-    color "0"
-  ]
-  node [
-    id 2278
-    label "halanscott"
-    color "0"
-  ]
-  node [
-    id 2279
-    label "Belem40"
-    color "4"
-  ]
-  node [
-    id 2280
-    label "PangaeaTravel"
-    color "4"
-  ]
-  node [
-    id 2281
-    label "cocoadev"
-    color "0"
-  ]
-  node [
-    id 2282
-    label "streetview"
-    color "4"
-  ]
-  node [
-    id 2283
-    label "honesty"
-    color "4"
-  ]
-  node [
-    id 2284
-    label "ravi"
-    color "4"
-  ]
-  node [
-    id 2285
-    label "nsw"
-    color "4"
-  ]
-  node [
-    id 2286
-    label "origami"
-    color "0"
-  ]
-  node [
-    id 2287
-    label "space"
-    color "5"
-  ]
-  node [
-    id 2288
-    label "GregK"
-    color "4"
-  ]
-  node [
-    id 2289
-    label "thorlin"
-    color "0"
-  ]
-  node [
-    id 2290
-    label "gamedev"
-    color "4"
-  ]
-  node [
-    id 2291
-    label "NI4D"
-    color "4"
-  ]
-  node [
-    id 2292
-    label "JeremyElijah"
-    color "0"
-  ]
-  node [
-    id 2293
-    label "greenpartyhamilton"
-    color "4"
-  ]
-  node [
-    id 2294
-    label "FinancialTrading"
-    color "0"
-  ]
-  node [
-    id 2295
-    label "TheBible"
-    color "4"
-  ]
-  node [
-    id 2296
-    label "BDIU"
-    color "4"
-  ]
-  node [
-    id 2297
-    label "BCCResearch"
-    color "0"
-  ]
-  node [
-    id 2298
-    label "Artimaeis"
-    color "0"
-  ]
-  node [
-    id 2299
-    label "chemistry"
-    color "1"
-  ]
-  node [
-    id 2300
-    label "Bedrijfsevenementen"
-    color "4"
-  ]
-  node [
-    id 2301
-    label "memes"
-    color "4"
-  ]
-  node [
-    id 2302
-    label "hobbylazy"
-    color "4"
-  ]
-  node [
-    id 2303
-    label "gamedesignlondon"
-    color "4"
-  ]
-  node [
-    id 2304
-    label "Tobacco"
-    color "0"
-  ]
-  node [
-    id 2305
-    label "FTVgirls"
-    color "0"
-  ]
-  node [
-    id 2306
-    label "schwa"
-    color "0"
-  ]
-  node [
-    id 2307
-    label "pooplickingpromises"
-    color "0"
-  ]
-  node [
-    id 2308
-    label "cocktails"
-    color "4"
-  ]
-  node [
-    id 2309
-    label "celebritiesphotos"
-    color "0"
-  ]
-  node [
-    id 2310
-    label "indiemusic"
-    color "4"
-  ]
-  node [
-    id 2311
-    label "Crazy"
-    color "0"
-  ]
-  node [
-    id 2312
-    label "alexandra6"
-    color "0"
-  ]
-  node [
-    id 2313
-    label "Ihitztraffic"
-    color "4"
-  ]
-  node [
-    id 2314
-    label "motherapproves"
-    color "4"
-  ]
-  node [
-    id 2315
-    label "DMT"
-    color "0"
-  ]
-  node [
-    id 2316
-    label "no"
-    color "4"
-  ]
-  node [
-    id 2317
-    label "Candice"
-    color "4"
-  ]
-  node [
-    id 2318
-    label "solusiplus"
-    color "4"
-  ]
-  node [
-    id 2319
-    label "smallbiz"
-    color "4"
-  ]
-  node [
-    id 2320
-    label "cnbeta"
-    color "4"
-  ]
-  node [
-    id 2321
-    label "HairStraightener"
-    color "4"
-  ]
-  node [
-    id 2322
-    label "SeeIt4Fun"
-    color "0"
-  ]
-  node [
-    id 2323
-    label "Recursive"
-    color "0"
-  ]
-  node [
-    id 2324
-    label "cyberthinkinfotech"
-    color "0"
-  ]
-  node [
-    id 2325
-    label "CarpetRepair"
-    color "4"
-  ]
-  node [
-    id 2326
-    label "JLProps"
-    color "0"
-  ]
-  node [
-    id 2327
-    label "lagreenlife"
-    color "0"
-  ]
-  node [
-    id 2328
-    label "survivor"
-    color "0"
-  ]
-  node [
-    id 2329
-    label "Pets"
-    color "5"
-  ]
-  node [
-    id 2330
-    label "Francie"
-    color "4"
-  ]
-  node [
-    id 2331
-    label "Vegetarianism"
-    color "4"
-  ]
-  node [
-    id 2332
-    label "suave"
-    color "4"
-  ]
-  node [
-    id 2333
-    label "markedwardlewis"
-    color "0"
-  ]
-  node [
-    id 2334
-    label "Public_Domain"
-    color "4"
-  ]
-  node [
-    id 2335
-    label "evmsale"
-    color "4"
-  ]
-  node [
-    id 2336
-    label "thomas"
-    color "0"
-  ]
-  node [
-    id 2337
-    label "florida"
-    color "4"
-  ]
-  node [
-    id 2338
-    label "Garritan"
-    color "4"
-  ]
-  node [
-    id 2339
-    label "bees"
-    color "0"
-  ]
-  node [
-    id 2340
-    label "Wonderwedge"
-    color "4"
-  ]
-  node [
-    id 2341
-    label "sfmagazines"
-    color "4"
-  ]
-  node [
-    id 2342
-    label "ralphnader"
-    color "4"
-  ]
-  node [
-    id 2343
-    label "FoodPolitics"
-    color "4"
-  ]
-  node [
-    id 2344
-    label "UrbanExploring"
-    color "4"
-  ]
-  node [
-    id 2345
-    label "plavix"
-    color "0"
-  ]
-  node [
-    id 2346
-    label "BCG"
-    color "4"
-  ]
-  node [
-    id 2347
-    label "autonews"
-    color "4"
-  ]
-  node [
-    id 2348
-    label "random"
-    color "4"
-  ]
-  node [
-    id 2349
-    label "Sex_Offender_Issues"
-    color "4"
-  ]
-  node [
-    id 2350
-    label "LGBTReddit"
-    color "4"
-  ]
-  node [
-    id 2351
-    label "LuluTopContent"
-    color "0"
-  ]
-  node [
-    id 2352
-    label "ferrets"
-    color "4"
-  ]
-  node [
-    id 2353
-    label "giaoduc"
-    color "4"
-  ]
-  node [
-    id 2354
-    label "nin"
-    color "0"
-  ]
-  node [
-    id 2355
-    label "hotshots"
-    color "0"
-  ]
-  node [
-    id 2356
-    label "HallOfFame"
-    color "4"
-  ]
-  node [
-    id 2357
-    label "spark"
-    color "0"
-  ]
-  node [
-    id 2358
-    label "l3ib"
-    color "4"
-  ]
-  node [
-    id 2359
-    label "Astaqauliyah"
-    color "0"
-  ]
-  node [
-    id 2360
-    label "LechnaBlog"
-    color "4"
-  ]
-  node [
-    id 2361
-    label "Hardawrae"
-    color "0"
-  ]
-  node [
-    id 2362
-    label "footballzone"
-    color "0"
-  ]
-  node [
-    id 2363
-    label "futurenews"
-    color "0"
-  ]
-  node [
-    id 2364
-    label "siobs"
-    color "0"
-  ]
-  node [
-    id 2365
-    label "hitchhiking"
-    color "4"
-  ]
-  node [
-    id 2366
-    label "hacking"
-    color "0"
-  ]
-  node [
-    id 2367
-    label "sed"
-    color "4"
-  ]
-  node [
-    id 2368
-    label "BurnsideWriters"
-    color "4"
-  ]
-  node [
-    id 2369
-    label "dictionary"
-    color "0"
-  ]
-  node [
-    id 2370
-    label "CanadaFTW"
-    color "0"
-  ]
-  node [
-    id 2371
-    label "VillasMoraira"
-    color "4"
-  ]
-  node [
-    id 2372
-    label "Mesothelioma_treat"
-    color "0"
-  ]
-  node [
-    id 2373
-    label "emacs"
-    color "1"
-  ]
-  node [
-    id 2374
-    label "nsfwvideos"
-    color "1"
-  ]
-  node [
-    id 2375
-    label "Pantsless"
-    color "0"
-  ]
-  node [
-    id 2376
-    label "heresy"
-    color "4"
-  ]
-  node [
-    id 2377
-    label "MilwaukeeWebDesign"
-    color "0"
-  ]
-  node [
-    id 2378
-    label "disability"
-    color "4"
-  ]
-  node [
-    id 2379
-    label "masala"
-    color "0"
-  ]
-  node [
-    id 2380
-    label "PaulShort"
-    color "4"
-  ]
-  node [
-    id 2381
-    label "Terzostipendio"
-    color "0"
-  ]
-  node [
-    id 2382
-    label "ireland"
-    color "1"
-  ]
-  node [
-    id 2383
-    label "darlingasian"
-    color "0"
-  ]
-  node [
-    id 2384
-    label "BritishPolitics"
-    color "4"
-  ]
-  node [
-    id 2385
-    label "Heroes"
-    color "0"
-  ]
-  node [
-    id 2386
-    label "singapore"
-    color "0"
-  ]
-  node [
-    id 2387
-    label "bealemj"
-    color "0"
-  ]
-  node [
-    id 2388
-    label "mercurial"
-    color "0"
-  ]
-  node [
-    id 2389
-    label "WhiteCollarFraud"
-    color "0"
-  ]
-  node [
-    id 2390
-    label "vid"
-    color "4"
-  ]
-  node [
-    id 2391
-    label "BillCube"
-    color "4"
-  ]
-  node [
-    id 2392
-    label "europeansolutions"
-    color "0"
-  ]
-  node [
-    id 2393
-    label "mystupidtestreddit"
-    color "4"
-  ]
-  node [
-    id 2394
-    label "beyazonluk"
-    color "4"
-  ]
-  node [
-    id 2395
-    label "scouting"
-    color "0"
-  ]
-  node [
-    id 2396
-    label "snoindod"
-    color "4"
-  ]
-  node [
-    id 2397
-    label "InTraser"
-    color "0"
-  ]
-  node [
-    id 2398
-    label "CanadaVotes2008"
-    color "4"
-  ]
-  node [
-    id 2399
-    label "Shelia"
-    color "4"
-  ]
-  node [
-    id 2400
-    label "Hepsi"
-    color "0"
-  ]
-  node [
-    id 2401
-    label "Websitedevlopement"
-    color "4"
-  ]
-  node [
-    id 2402
-    label "Polilingua"
-    color "4"
-  ]
-  node [
-    id 2403
-    label "Temon"
-    color "4"
-  ]
-  node [
-    id 2404
-    label "censorship"
-    color "4"
-  ]
-  node [
-    id 2405
-    label "directory"
-    color "0"
-  ]
-  node [
-    id 2406
-    label "bugreports"
-    color "4"
-  ]
-  node [
-    id 2407
-    label "WebGol"
-    color "0"
-  ]
-  node [
-    id 2408
-    label "kevin332"
-    color "0"
-  ]
-  node [
-    id 2409
-    label "jameswatt"
-    color "4"
-  ]
-  node [
-    id 2410
-    label "irwanbee"
-    color "0"
-  ]
-  node [
-    id 2411
-    label "CiscoUCCE"
-    color "0"
-  ]
-  node [
-    id 2412
-    label "MegaJonasLova"
-    color "4"
-  ]
-  node [
-    id 2413
-    label "SignsUS"
-    color "4"
-  ]
-  node [
-    id 2414
-    label "sandbox"
-    color "4"
-  ]
-  node [
-    id 2415
-    label "Doom_And_Gloom"
-    color "0"
-  ]
-  node [
-    id 2416
-    label "parrots"
-    color "4"
-  ]
-  node [
-    id 2417
-    label "fascinating"
-    color "1"
-  ]
-  node [
-    id 2418
-    label "awwcute"
-    color "0"
-  ]
-  node [
-    id 2419
-    label "wc2010"
-    color "4"
-  ]
-  node [
-    id 2420
-    label "Launch_Strategies"
-    color "4"
-  ]
-  node [
-    id 2421
-    label "fr"
-    color "1"
-  ]
-  node [
-    id 2422
-    label "1keral"
-    color "0"
-  ]
-  node [
-    id 2423
-    label "melvin"
-    color "4"
-  ]
-  node [
-    id 2424
-    label "school"
-    color "0"
-  ]
-  node [
-    id 2425
-    label "proud12mama"
-    color "4"
-  ]
-  node [
-    id 2426
-    label "vedicastrology"
-    color "4"
-  ]
-  node [
-    id 2427
-    label "TheSystemInfo"
-    color "0"
-  ]
-  node [
-    id 2428
-    label "iTulip"
-    color "4"
-  ]
-  node [
-    id 2429
-    label "wagi"
-    color "0"
-  ]
-  node [
-    id 2430
-    label "dixipix"
-    color "4"
-  ]
-  node [
-    id 2431
-    label "Zeitgeist"
-    color "0"
-  ]
-  node [
-    id 2432
-    label "rumors"
-    color "4"
-  ]
-  node [
-    id 2433
-    label "argentina"
-    color "4"
-  ]
-  node [
-    id 2434
-    label "Anthropology"
-    color "1"
-  ]
-  node [
-    id 2435
-    label "xbox360"
-    color "4"
-  ]
-  node [
-    id 2436
-    label "malaysia"
-    color "4"
-  ]
-  node [
-    id 2437
-    label "alexandre"
-    color "4"
-  ]
-  node [
-    id 2438
-    label "EasyStreet"
-    color "0"
-  ]
-  node [
-    id 2439
-    label "StitchSimply"
-    color "4"
-  ]
-  node [
-    id 2440
-    label "getdomain"
-    color "0"
-  ]
-  node [
-    id 2441
-    label "techwriting"
-    color "0"
-  ]
-  node [
-    id 2442
-    label "GreaseMonkey"
-    color "4"
-  ]
-  node [
-    id 2443
-    label "smalltalk"
-    color "4"
-  ]
-  node [
-    id 2444
-    label "marketcrash"
-    color "0"
-  ]
-  node [
-    id 2445
-    label "Voto"
-    color "0"
-  ]
-  node [
-    id 2446
-    label "happyatwork"
-    color "4"
-  ]
-  node [
-    id 2447
-    label "lida"
-    color "4"
-  ]
-  node [
-    id 2448
-    label "oilexploration"
-    color "4"
-  ]
-  node [
-    id 2449
-    label "Essays"
-    color "4"
-  ]
-  node [
-    id 2450
-    label "television"
-    color "5"
-  ]
-  node [
-    id 2451
-    label "brighton"
-    color "0"
-  ]
-  node [
-    id 2452
-    label "newsben"
-    color "4"
-  ]
-  node [
-    id 2453
-    label "crypto"
-    color "4"
-  ]
-  node [
-    id 2454
-    label "alaska"
-    color "4"
-  ]
-  node [
-    id 2455
-    label "Airfare"
-    color "4"
-  ]
-  node [
-    id 2456
-    label "moonhoax"
-    color "0"
-  ]
-  node [
-    id 2457
-    label "questions"
-    color "0"
-  ]
-  node [
-    id 2458
-    label "shoppingbag"
-    color "0"
-  ]
-  node [
-    id 2459
-    label "tr"
-    color "1"
-  ]
-  node [
-    id 2460
-    label "rugby"
-    color "0"
-  ]
-  node [
-    id 2461
-    label "Iraq"
-    color "0"
-  ]
-  node [
-    id 2462
-    label "NoveltyUserNames"
-    color "0"
-  ]
-  node [
-    id 2463
-    label "Eienelle"
-    color "0"
-  ]
-  node [
-    id 2464
-    label "linkmingle"
-    color "0"
-  ]
-  node [
-    id 2465
-    label "nutrition"
-    color "4"
-  ]
-  node [
-    id 2466
-    label "jena"
-    color "0"
-  ]
-  node [
-    id 2467
-    label "FlyerWiki"
-    color "4"
-  ]
-  node [
-    id 2468
-    label "videointhetube"
-    color "0"
-  ]
-  node [
-    id 2469
-    label "tiantiankankan"
-    color "4"
-  ]
-  node [
-    id 2470
-    label "politics2"
-    color "0"
-  ]
-  node [
-    id 2471
-    label "Technologyzone"
-    color "0"
-  ]
-  node [
-    id 2472
-    label "Randomosity"
-    color "4"
-  ]
-  node [
-    id 2473
-    label "Quality"
-    color "0"
-  ]
-  node [
-    id 2474
-    label "The_Trainer"
-    color "0"
-  ]
-  node [
-    id 2475
-    label "suceel"
-    color "0"
-  ]
-  node [
-    id 2476
-    label "vinblackham"
-    color "0"
-  ]
-  node [
-    id 2477
-    label "nota"
-    color "4"
-  ]
-  node [
-    id 2478
-    label "revenge"
-    color "0"
-  ]
-  node [
-    id 2479
-    label "Xstaticarmchair"
-    color "4"
-  ]
-  node [
-    id 2480
-    label "url"
-    color "0"
-  ]
-  node [
-    id 2481
-    label "ipodsandappletalk"
-    color "4"
-  ]
-  node [
-    id 2482
-    label "c64"
-    color "0"
-  ]
-  node [
-    id 2483
-    label "GBGuide"
-    color "4"
-  ]
-  node [
-    id 2484
-    label "bloggerdal"
-    color "0"
-  ]
-  node [
-    id 2485
-    label "deism"
-    color "4"
-  ]
-  node [
-    id 2486
-    label "GamingIndustryNews"
-    color "4"
-  ]
-  node [
-    id 2487
-    label "RealtorWebDesign"
-    color "4"
-  ]
-  node [
-    id 2488
-    label "memetics"
-    color "0"
-  ]
-  node [
-    id 2489
-    label "outsourcing"
-    color "4"
-  ]
-  node [
-    id 2490
-    label "ChileRemix"
-    color "0"
-  ]
-  node [
-    id 2491
-    label "choppers"
-    color "4"
-  ]
-  node [
-    id 2492
-    label "lost"
-    color "4"
-  ]
-  node [
-    id 2493
-    label "nethack"
-    color "4"
-  ]
-  node [
-    id 2494
-    label "cleavepoetry"
-    color "4"
-  ]
-  node [
-    id 2495
-    label "prakash"
-    color "0"
-  ]
-  node [
-    id 2496
-    label "Packaging"
-    color "0"
-  ]
-  node [
-    id 2497
-    label "scaling"
-    color "4"
-  ]
-  node [
-    id 2498
-    label "OddStuff"
-    color "0"
-  ]
-  node [
-    id 2499
-    label "flash"
-    color "4"
-  ]
-  node [
-    id 2500
-    label "NewAthens"
-    color "0"
-  ]
-  node [
-    id 2501
-    label "MapleLinks"
-    color "0"
-  ]
-  node [
-    id 2502
-    label "AsianGirls"
-    color "4"
-  ]
-  node [
-    id 2503
-    label "empoweredinternet"
-    color "4"
-  ]
-  node [
-    id 2504
-    label "cons"
-    color "4"
-  ]
-  node [
-    id 2505
-    label "graffiticreator"
-    color "0"
-  ]
-  node [
-    id 2506
-    label "destinationclubs"
-    color "4"
-  ]
-  node [
-    id 2507
-    label "NLP"
-    color "4"
-  ]
-  node [
-    id 2508
-    label "insomnia"
-    color "0"
-  ]
-  node [
-    id 2509
-    label "left_blogs"
-    color "4"
-  ]
-  node [
-    id 2510
-    label "falcons"
-    color "0"
-  ]
-  node [
-    id 2511
-    label "AirDuctCleaning"
-    color "4"
-  ]
-  node [
-    id 2512
-    label "rocketry"
-    color "0"
-  ]
-  node [
-    id 2513
-    label "vids"
-    color "0"
-  ]
-  node [
-    id 2514
-    label "Kaede_Rukawa"
-    color "4"
-  ]
-  node [
-    id 2515
-    label "MillionaireMommy"
-    color "0"
-  ]
-  node [
-    id 2516
-    label "joufgirls"
-    color "0"
-  ]
-  node [
-    id 2517
-    label "MagicMushrooms"
-    color "0"
-  ]
-  node [
-    id 2518
-    label "FantasticContraption"
-    color "0"
-  ]
-  node [
-    id 2519
-    label "self"
-    color "5"
-  ]
-  node [
-    id 2520
-    label "JuicedMangoes"
-    color "0"
-  ]
-  node [
-    id 2521
-    label "Breakfast"
-    color "4"
-  ]
-  node [
-    id 2522
-    label "GWilliamCo"
-    color "0"
-  ]
-  node [
-    id 2523
-    label "Gabrella"
-    color "4"
-  ]
-  node [
-    id 2524
-    label "ObamasInagural"
-    color "4"
-  ]
-  node [
-    id 2525
-    label "MrWebmonster"
-    color "0"
-  ]
-  node [
-    id 2526
-    label "hiphop"
-    color "4"
-  ]
-  node [
-    id 2527
-    label "storesaver"
-    color "0"
-  ]
-  node [
-    id 2528
-    label "RetailHomeGoods"
-    color "4"
-  ]
-  node [
-    id 2529
-    label "poll"
-    color "4"
-  ]
-  node [
-    id 2530
-    label "THA"
-    color "0"
-  ]
-  node [
-    id 2531
-    label "socialism"
-    color "5"
-  ]
-  node [
-    id 2532
-    label "labor"
-    color "4"
-  ]
-  node [
-    id 2533
-    label "EnergyIndependence"
-    color "4"
-  ]
-  node [
-    id 2534
-    label "lumrax"
-    color "4"
-  ]
-  node [
-    id 2535
-    label "Trepanation"
-    color "0"
-  ]
-  node [
-    id 2536
-    label "culturehacking"
-    color "4"
-  ]
-  node [
-    id 2537
-    label "fashion360"
-    color "0"
-  ]
-  node [
-    id 2538
-    label "oseun"
-    color "4"
-  ]
-  node [
-    id 2539
-    label "wallpapers"
-    color "4"
-  ]
-  node [
-    id 2540
-    label "wedding"
-    color "4"
-  ]
-  node [
-    id 2541
-    label "dranger"
-    color "0"
-  ]
-  node [
-    id 2542
-    label "AmericanMilitary"
-    color "4"
-  ]
-  node [
-    id 2543
-    label "religion"
-    color "5"
-  ]
-  node [
-    id 2544
-    label "futurevision"
-    color "0"
-  ]
-  node [
-    id 2545
-    label "oil"
-    color "4"
-  ]
-  node [
-    id 2546
-    label "subreddit"
-    color "0"
-  ]
-  node [
-    id 2547
-    label "LUKEPICCO"
-    color "4"
-  ]
-  node [
-    id 2548
-    label "bizarrenews"
-    color "0"
-  ]
-  node [
-    id 2549
-    label "supermarkets"
-    color "4"
-  ]
-  node [
-    id 2550
-    label "Mold"
-    color "4"
-  ]
-  node [
-    id 2551
-    label "BellaBraxton"
-    color "4"
-  ]
-  node [
-    id 2552
-    label "mygame"
-    color "4"
-  ]
-  node [
-    id 2553
-    label "lists"
-    color "5"
-  ]
-  node [
-    id 2554
-    label "ewing2001"
-    color "0"
-  ]
-  node [
-    id 2555
-    label "DSP"
-    color "0"
-  ]
-  node [
-    id 2556
-    label "things"
-    color "5"
-  ]
-  node [
-    id 2557
-    label "artmine1"
-    color "4"
-  ]
-  node [
-    id 2558
-    label "naughtyamerica"
-    color "4"
-  ]
-  node [
-    id 2559
-    label "exboyfriendback"
-    color "4"
-  ]
-  node [
-    id 2560
-    label "Atheism2"
-    color "4"
-  ]
-  node [
-    id 2561
-    label "water"
-    color "0"
-  ]
-  node [
-    id 2562
-    label "PATENT"
-    color "0"
-  ]
-  node [
-    id 2563
-    label "turf"
-    color "0"
-  ]
-  node [
-    id 2564
-    label "closeoutcctv"
-    color "0"
-  ]
-  node [
-    id 2565
-    label "hdemici"
-    color "4"
-  ]
-  node [
-    id 2566
-    label "FREE"
-    color "0"
-  ]
-  node [
-    id 2567
-    label "motivationalspeech"
-    color "4"
-  ]
-  node [
-    id 2568
-    label "urbanplanning"
-    color "0"
-  ]
-  node [
-    id 2569
-    label "hotblooded"
-    color "4"
-  ]
-  node [
-    id 2570
-    label "pic"
-    color "5"
-  ]
-  node [
-    id 2571
-    label "amazon"
-    color "0"
-  ]
-  node [
-    id 2572
-    label "Smarty"
-    color "4"
-  ]
-  node [
-    id 2573
-    label "europe"
-    color "5"
-  ]
-  node [
-    id 2574
-    label "Politicalanalysis"
-    color "0"
-  ]
-  node [
-    id 2575
-    label "espneurofeed"
-    color "0"
-  ]
-  node [
-    id 2576
-    label "Iceland"
-    color "0"
-  ]
-  node [
-    id 2577
-    label "Bullet"
-    color "0"
-  ]
-  node [
-    id 2578
-    label "cpanratings"
-    color "0"
-  ]
-  node [
-    id 2579
-    label "Rickey"
-    color "4"
-  ]
-  node [
-    id 2580
-    label "handletime"
-    color "0"
-  ]
-  node [
-    id 2581
-    label "WorldHistory"
-    color "4"
-  ]
-  node [
-    id 2582
-    label "meat"
-    color "0"
-  ]
-  node [
-    id 2583
-    label "lansing"
-    color "4"
-  ]
-  node [
-    id 2584
-    label "xomobo"
-    color "4"
-  ]
-  node [
-    id 2585
-    label "yuen999"
-    color "0"
-  ]
-  node [
-    id 2586
-    label "BloodNi55a"
-    color "0"
-  ]
-  node [
-    id 2587
-    label "showroom"
-    color "4"
-  ]
-  node [
-    id 2588
-    label "EPA"
-    color "4"
-  ]
-  node [
-    id 2589
-    label "breadpig"
-    color "4"
-  ]
-  node [
-    id 2590
-    label "UndiesDrawer"
-    color "0"
-  ]
-  node [
-    id 2591
-    label "coins"
-    color "4"
-  ]
-  node [
-    id 2592
-    label "pl"
-    color "0"
-  ]
-  node [
-    id 2593
-    label "sydney"
-    color "4"
-  ]
-  node [
-    id 2594
-    label "Watches"
-    color "0"
-  ]
-  node [
-    id 2595
-    label "Dietandhealth"
-    color "0"
-  ]
-  node [
-    id 2596
-    label "luke"
-    color "4"
-  ]
-  node [
-    id 2597
-    label "PHP"
-    color "4"
-  ]
-  node [
-    id 2598
-    label "newyork"
-    color "4"
-  ]
-  node [
-    id 2599
-    label "PotterNerds"
-    color "4"
-  ]
-  node [
-    id 2600
-    label "marketing"
-    color "1"
-  ]
-  node [
-    id 2601
-    label "CSPapers"
-    color "0"
-  ]
-  node [
-    id 2602
-    label "IRO"
-    color "0"
-  ]
-  node [
-    id 2603
-    label "nerdcore"
-    color "0"
-  ]
-  node [
-    id 2604
-    label "LiberalHippies"
-    color "4"
-  ]
-  node [
-    id 2605
-    label "theselectionist"
-    color "4"
-  ]
-  node [
-    id 2606
-    label "Great"
-    color "0"
-  ]
-  node [
-    id 2607
-    label "arslion"
-    color "0"
-  ]
-  node [
-    id 2608
-    label "CPAWebGuy"
-    color "0"
-  ]
-  node [
-    id 2609
-    label "Buddhism"
-    color "5"
-  ]
-  node [
-    id 2610
-    label "Shemoidesigns"
-    color "4"
-  ]
-  node [
-    id 2611
-    label "Agriculture"
-    color "4"
-  ]
-  node [
-    id 2612
-    label "Clickry"
-    color "4"
-  ]
-  node [
-    id 2613
-    label "hopes"
-    color "0"
-  ]
-  node [
-    id 2614
-    label "Cooking"
-    color "5"
-  ]
-  node [
-    id 2615
-    label "computers"
-    color "0"
-  ]
-  node [
-    id 2616
-    label "Drozzzz"
-    color "4"
-  ]
-  node [
-    id 2617
-    label "testtest"
-    color "4"
-  ]
-  node [
-    id 2618
-    label "Divorce"
-    color "4"
-  ]
-  node [
-    id 2619
-    label "Virginia"
-    color "0"
-  ]
-  node [
-    id 2620
-    label "techbookreviews"
-    color "4"
-  ]
-  node [
-    id 2621
-    label "ponyexpress"
-    color "0"
-  ]
-  node [
-    id 2622
-    label "ReliableScience"
-    color "0"
-  ]
-  node [
-    id 2623
-    label "bebq"
-    color "4"
-  ]
-  node [
-    id 2624
-    label "Backingitup"
-    color "0"
-  ]
-  node [
-    id 2625
-    label "OSU"
-    color "0"
-  ]
-  node [
-    id 2626
-    label "foccart"
-    color "4"
-  ]
-  node [
-    id 2627
-    label "fallacy"
-    color "0"
-  ]
-  node [
-    id 2628
-    label "musicians"
-    color "1"
-  ]
-  node [
-    id 2629
-    label "Motivational"
-    color "0"
-  ]
-  node [
-    id 2630
-    label "BiblicalArcheology"
-    color "0"
-  ]
-  node [
-    id 2631
-    label "triangle"
-    color "0"
-  ]
-  node [
-    id 2632
-    label "sugarcrm"
-    color "0"
-  ]
-  node [
-    id 2633
-    label "Giuse"
-    color "0"
-  ]
-  node [
-    id 2634
-    label "askJeph"
-    color "1"
-  ]
-  node [
-    id 2635
-    label "AGo"
-    color "0"
-  ]
-  node [
-    id 2636
-    label "epicthread"
-    color "0"
-  ]
-  node [
-    id 2637
-    label "roundstone"
-    color "4"
-  ]
-  node [
-    id 2638
-    label "Tardonaut"
-    color "4"
-  ]
-  node [
-    id 2639
-    label "hugeboobs"
-    color "0"
-  ]
-  node [
-    id 2640
-    label "Stargate"
-    color "4"
-  ]
-  node [
-    id 2641
-    label "ukulele"
-    color "0"
-  ]
-  node [
-    id 2642
-    label "LibertarianSocialism"
-    color "4"
-  ]
-  node [
-    id 2643
-    label "ecommerce"
-    color "4"
-  ]
-  node [
-    id 2644
-    label "Steve"
-    color "4"
-  ]
-  node [
-    id 2645
-    label "AndySalmo"
-    color "4"
-  ]
-  node [
-    id 2646
-    label "bigjimslade"
-    color "4"
-  ]
-  node [
-    id 2647
-    label "conspiracyhub"
-    color "4"
-  ]
-  node [
-    id 2648
-    label "usability"
-    color "0"
-  ]
-  node [
-    id 2649
-    label "NuyoRiquena"
-    color "0"
-  ]
-  node [
-    id 2650
-    label "teknoloji"
-    color "4"
-  ]
-  node [
-    id 2651
-    label "ridiculous"
-    color "4"
-  ]
-  node [
-    id 2652
-    label "theology"
-    color "1"
-  ]
-  node [
-    id 2653
-    label "Demotivational"
-    color "0"
-  ]
-  node [
-    id 2654
-    label "sriganesh"
-    color "4"
-  ]
-  node [
-    id 2655
-    label "relaxinbathsalts"
-    color "4"
-  ]
-  node [
-    id 2656
-    label "leet"
-    color "4"
-  ]
-  node [
-    id 2657
-    label "skateboarding"
-    color "0"
-  ]
-  node [
-    id 2658
-    label "Mister"
-    color "4"
-  ]
-  node [
-    id 2659
-    label "madeinusa"
-    color "0"
-  ]
-  node [
-    id 2660
-    label "worldnews2"
-    color "0"
-  ]
-  node [
-    id 2661
-    label "WREDIT"
-    color "0"
-  ]
-  node [
-    id 2662
-    label "crossfit"
-    color "0"
-  ]
-  node [
-    id 2663
-    label "src_montbeliard"
-    color "0"
-  ]
-  node [
-    id 2664
-    label "dgjohnston"
-    color "4"
-  ]
-  node [
-    id 2665
-    label "brendoreddit"
-    color "0"
-  ]
-  node [
-    id 2666
-    label "postname"
-    color "4"
-  ]
-  node [
-    id 2667
-    label "CarlitoxX_Jair"
-    color "4"
-  ]
-  node [
-    id 2668
-    label "RamaOne"
-    color "4"
-  ]
-  node [
-    id 2669
-    label "ChildHealth"
-    color "0"
-  ]
-  node [
-    id 2670
-    label "sub"
-    color "4"
-  ]
-  node [
-    id 2671
-    label "Ninja"
-    color "4"
-  ]
-  node [
-    id 2672
-    label "ZeroPunctuation"
-    color "0"
-  ]
-  node [
-    id 2673
-    label "pencils"
-    color "4"
-  ]
-  node [
-    id 2674
-    label "FrancieFace"
-    color "4"
-  ]
-  node [
-    id 2675
-    label "wealthmanagement"
-    color "0"
-  ]
-  node [
-    id 2676
-    label "MoneySavers"
-    color "4"
-  ]
-  node [
-    id 2677
-    label "p2ptech"
-    color "0"
-  ]
-  node [
-    id 2678
-    label "macgamedev"
-    color "4"
-  ]
-  node [
-    id 2679
-    label "ogijun"
-    color "4"
-  ]
-  node [
-    id 2680
-    label "functional"
-    color "0"
-  ]
-  node [
-    id 2681
-    label "BABNews"
-    color "4"
-  ]
-  node [
-    id 2682
-    label "Googlepagerank"
-    color "0"
-  ]
-  node [
-    id 2683
-    label "ystore"
-    color "0"
-  ]
-  node [
-    id 2684
-    label "greenbiz"
-    color "0"
-  ]
-  node [
-    id 2685
-    label "orangered"
-    color "0"
-  ]
-  node [
-    id 2686
-    label "zubii"
-    color "4"
-  ]
-  node [
-    id 2687
-    label "Rikard"
-    color "0"
-  ]
-  node [
-    id 2688
-    label "askcheez"
-    color "1"
-  ]
-  node [
-    id 2689
-    label "IAMIL"
-    color "4"
-  ]
-  node [
-    id 2690
-    label "interactive"
-    color "0"
-  ]
-  node [
-    id 2691
-    label "submit"
-    color "4"
-  ]
-  node [
-    id 2692
-    label "legos"
-    color "4"
-  ]
-  node [
-    id 2693
-    label "psyapsy"
-    color "4"
-  ]
-  node [
-    id 2694
-    label "kherisno"
-    color "0"
-  ]
-  node [
-    id 2695
-    label "Twitter"
-    color "4"
-  ]
-  node [
-    id 2696
-    label "LegalTeens"
-    color "4"
-  ]
-  node [
-    id 2697
-    label "SinjeLuebbke"
-    color "0"
-  ]
-  node [
-    id 2698
-    label "Mickreddit"
-    color "0"
-  ]
-  node [
-    id 2699
-    label "Supplements"
-    color "4"
-  ]
-  node [
-    id 2700
-    label "videos"
-    color "5"
-  ]
-  node [
-    id 2701
-    label "Rhonda"
-    color "4"
-  ]
-  node [
-    id 2702
-    label "garden"
-    color "0"
-  ]
-  node [
-    id 2703
-    label "freeculture"
-    color "4"
-  ]
-  node [
-    id 2704
-    label "Cricket"
-    color "4"
-  ]
-  node [
-    id 2705
-    label "testingue2"
-    color "4"
-  ]
-  node [
-    id 2706
-    label "badassgirls"
-    color "4"
-  ]
-  node [
-    id 2707
-    label "WinCustomize"
-    color "0"
-  ]
-  node [
-    id 2708
-    label "2008Election"
-    color "4"
-  ]
-  node [
-    id 2709
-    label "SCUK"
-    color "4"
-  ]
-  node [
-    id 2710
-    label "wecreate"
-    color "4"
-  ]
-  node [
-    id 2711
-    label "Astronomy"
-    color "5"
-  ]
-  node [
-    id 2712
-    label "survivalfood"
-    color "4"
-  ]
-  node [
-    id 2713
-    label "StockMarket"
-    color "4"
-  ]
-  node [
-    id 2714
-    label "littlestar"
-    color "0"
-  ]
-  node [
-    id 2715
-    label "folk"
-    color "0"
-  ]
-  node [
-    id 2716
-    label "mauritius"
-    color "0"
-  ]
-  node [
-    id 2717
-    label "nottheonion"
-    color "0"
-  ]
-  node [
-    id 2718
-    label "flychina"
-    color "0"
-  ]
-  node [
-    id 2719
-    label "breakgame"
-    color "4"
-  ]
-  node [
-    id 2720
-    label "Tecnologia"
-    color "0"
-  ]
-  node [
-    id 2721
-    label "businessnews"
-    color "0"
-  ]
-  node [
-    id 2722
-    label "aakashlivetek"
-    color "0"
-  ]
-  node [
-    id 2723
-    label "dnorton"
-    color "4"
-  ]
-  node [
-    id 2724
-    label "frostih"
-    color "4"
-  ]
-  node [
-    id 2725
-    label "catonmat"
-    color "0"
-  ]
-  node [
-    id 2726
-    label "finance"
-    color "1"
-  ]
-  node [
-    id 2727
-    label "troyflorida"
-    color "4"
-  ]
-  node [
-    id 2728
-    label "tweets"
-    color "0"
-  ]
-  node [
-    id 2729
-    label "tips"
-    color "0"
-  ]
-  node [
-    id 2730
-    label "TELOSMYSTERY"
-    color "4"
-  ]
-  node [
-    id 2731
-    label "maaraj"
-    color "4"
-  ]
-  node [
-    id 2732
-    label "baseball"
-    color "4"
-  ]
-  node [
-    id 2733
-    label "exmafia"
-    color "4"
-  ]
-  node [
-    id 2734
-    label "jquery"
-    color "4"
-  ]
-  node [
-    id 2735
-    label "privacy"
-    color "4"
-  ]
-  node [
-    id 2736
-    label "dylan"
-    color "4"
-  ]
-  node [
-    id 2737
-    label "macdk"
-    color "4"
-  ]
-  node [
-    id 2738
-    label "WingChun"
-    color "0"
-  ]
-  node [
-    id 2739
-    label "robotlunch"
-    color "0"
-  ]
-  node [
-    id 2740
-    label "provocative"
-    color "4"
-  ]
-  node [
-    id 2741
-    label "surreal"
-    color "0"
-  ]
-  node [
-    id 2742
-    label "joomla"
-    color "4"
-  ]
-  node [
-    id 2743
-    label "WorldWideNews"
-    color "5"
-  ]
-  node [
-    id 2744
-    label "5edwin"
-    color "3"
-  ]
-  node [
-    id 2745
-    label "aodag"
-    color "4"
-  ]
-  node [
-    id 2746
-    label "railfanning"
-    color "4"
-  ]
-  node [
-    id 2747
-    label "QuadraIsland"
-    color "4"
-  ]
-  node [
-    id 2748
-    label "Tacticum"
-    color "0"
-  ]
-  node [
-    id 2749
-    label "Hindi"
-    color "4"
-  ]
-  node [
-    id 2750
-    label "buzznewsroom"
-    color "0"
-  ]
-  node [
-    id 2751
-    label "redundant"
-    color "4"
-  ]
-  node [
-    id 2752
-    label "Yutiti"
-    color "0"
-  ]
-  node [
-    id 2753
-    label "foodart"
-    color "0"
-  ]
-  node [
-    id 2754
-    label "wine"
-    color "0"
-  ]
-  node [
-    id 2755
-    label "Construction"
-    color "4"
-  ]
-  node [
-    id 2756
-    label "ItsNotOnion"
-    color "0"
-  ]
-  node [
-    id 2757
-    label "QueenSlimey"
-    color "4"
-  ]
-  node [
-    id 2758
-    label "nsfw2"
-    color "4"
-  ]
-  node [
-    id 2759
-    label "reddit_trolls"
-    color "0"
-  ]
-  node [
-    id 2760
-    label "CFB"
-    color "4"
-  ]
-  node [
-    id 2761
-    label "hiltingbury"
-    color "4"
-  ]
-  node [
-    id 2762
-    label "Allsmsmessages"
-    color "0"
-  ]
-  node [
-    id 2763
-    label "hacktivism"
-    color "4"
-  ]
-  node [
-    id 2764
-    label "anilobm"
-    color "0"
-  ]
-  node [
-    id 2765
-    label "WeeklyTA"
-    color "4"
-  ]
-  node [
-    id 2766
-    label "Pennsylvania"
-    color "4"
-  ]
-  node [
-    id 2767
-    label "Edwards"
-    color "0"
-  ]
-  node [
-    id 2768
-    label "babeplanet"
-    color "4"
-  ]
-  node [
-    id 2769
-    label "michaeldavid96"
-    color "0"
-  ]
-  node [
-    id 2770
-    label "mgive"
-    color "4"
-  ]
-  node [
-    id 2771
-    label "techdorks"
-    color "4"
-  ]
-  node [
-    id 2772
-    label "paygossiper"
-    color "0"
-  ]
-  node [
-    id 2773
-    label "piercing"
-    color "0"
-  ]
-  node [
-    id 2774
-    label "Multiplayergames"
-    color "4"
-  ]
-  node [
-    id 2775
-    label "howard_rosner_reddit"
-    color "0"
-  ]
-  node [
-    id 2776
-    label "Metaphysics"
-    color "4"
-  ]
-  node [
-    id 2777
-    label "linkhay"
-    color "4"
-  ]
-  node [
-    id 2778
-    label "21212"
-    color "4"
-  ]
-  node [
-    id 2779
-    label "refreshing"
-    color "4"
-  ]
-  node [
-    id 2780
-    label "stock"
-    color "4"
-  ]
-  node [
-    id 2781
-    label "getpresales"
-    color "4"
-  ]
-  node [
-    id 2782
-    label "policeabuse"
-    color "4"
-  ]
-  node [
-    id 2783
-    label "theSmallCapAlert"
-    color "0"
-  ]
-  node [
-    id 2784
-    label "SafetyNews"
-    color "0"
-  ]
-  node [
-    id 2785
-    label "lonely"
-    color "0"
-  ]
-  node [
-    id 2786
-    label "unix"
-    color "4"
-  ]
-  node [
-    id 2787
-    label "blackhatseo"
-    color "4"
-  ]
-  node [
-    id 2788
-    label "RantRave"
-    color "4"
-  ]
-  node [
-    id 2789
-    label "sporevote"
-    color "4"
-  ]
-  node [
-    id 2790
-    label "Younai"
-    color "4"
-  ]
-  node [
-    id 2791
-    label "rubyonrails"
-    color "4"
-  ]
-  node [
-    id 2792
-    label "scitech"
-    color "0"
-  ]
-  node [
-    id 2793
-    label "hotmanflesh"
-    color "0"
-  ]
-  node [
-    id 2794
-    label "skycars"
-    color "0"
-  ]
-  node [
-    id 2795
-    label "jeanculture"
-    color "0"
-  ]
-  node [
-    id 2796
-    label "douche"
-    color "4"
-  ]
-  node [
-    id 2797
-    label "Fun"
-    color "4"
-  ]
-  node [
-    id 2798
-    label "chrome"
-    color "0"
-  ]
-  node [
-    id 2799
-    label "mainfo"
-    color "0"
-  ]
-  node [
-    id 2800
-    label "howto"
-    color "5"
-  ]
-  node [
-    id 2801
-    label "chicago"
-    color "1"
-  ]
-  node [
-    id 2802
-    label "sport"
-    color "4"
-  ]
-  node [
-    id 2803
-    label "whatarekidssaying"
-    color "4"
-  ]
-  node [
-    id 2804
-    label "BestPsychTutorials"
-    color "0"
-  ]
-  node [
-    id 2805
-    label "PetsandSuch"
-    color "4"
-  ]
-  node [
-    id 2806
-    label "Senditcertified"
-    color "4"
-  ]
-  node [
-    id 2807
-    label "timecube"
-    color "4"
-  ]
-  node [
-    id 2808
-    label "secret"
-    color "0"
-  ]
-  node [
-    id 2809
-    label "god"
-    color "4"
-  ]
-  node [
-    id 2810
-    label "tech"
-    color "5"
-  ]
-  node [
-    id 2811
-    label "Storesonline"
-    color "0"
-  ]
-  node [
-    id 2812
-    label "shamaaz"
-    color "0"
-  ]
-  node [
-    id 2813
-    label "EducationWorld"
-    color "4"
-  ]
-  node [
-    id 2814
-    label "lindynews"
-    color "4"
-  ]
-  node [
-    id 2815
-    label "WedgieGirls"
-    color "0"
-  ]
-  node [
-    id 2816
-    label "FiduciaryInvestment"
-    color "0"
-  ]
-  node [
-    id 2817
-    label "BurrellColour"
-    color "4"
-  ]
-  node [
-    id 2818
-    label "FIFIK"
-    color "0"
-  ]
-  node [
-    id 2819
-    label "Danielsbestsites"
-    color "0"
-  ]
-  node [
-    id 2820
-    label "PUBLICADDS"
-    color "0"
-  ]
-  node [
-    id 2821
-    label "mormon"
-    color "0"
-  ]
-  node [
-    id 2822
-    label "windowshots"
-    color "5"
-  ]
-  node [
-    id 2823
-    label "fashionweek"
-    color "4"
-  ]
-  node [
-    id 2824
-    label "dooblets"
-    color "4"
-  ]
-  node [
-    id 2825
-    label "kitz007"
-    color "0"
-  ]
-  node [
-    id 2826
-    label "TechnoGameGripes"
-    color "4"
-  ]
-  node [
-    id 2827
-    label "weddingchapel"
-    color "4"
-  ]
-  node [
-    id 2828
-    label "nondual"
-    color "4"
-  ]
-  node [
-    id 2829
-    label "catfight"
-    color "0"
-  ]
-  node [
-    id 2830
-    label "oreilly"
-    color "4"
-  ]
-  node [
-    id 2831
-    label "nuclear"
-    color "4"
-  ]
-  node [
-    id 2832
-    label "Paranormal"
-    color "1"
-  ]
-  node [
-    id 2833
-    label "primetrend"
-    color "0"
-  ]
-  node [
-    id 2834
-    label "opinions"
-    color "4"
-  ]
-  node [
-    id 2835
-    label "kablamo"
-    color "0"
-  ]
-  node [
-    id 2836
-    label "freemusic"
-    color "1"
-  ]
-  node [
-    id 2837
-    label "sevenload"
-    color "0"
-  ]
-  node [
-    id 2838
-    label "unknownarmies"
-    color "4"
-  ]
-  node [
-    id 2839
-    label "trolling"
-    color "0"
-  ]
-  node [
-    id 2840
-    label "MilitantStuggles"
-    color "4"
-  ]
-  node [
-    id 2841
-    label "MitchHedberg"
-    color "0"
-  ]
-  node [
-    id 2842
-    label "impoliteconverstaion"
-    color "0"
-  ]
-  node [
-    id 2843
-    label "MensaPhilOpen"
-    color "0"
-  ]
-  node [
-    id 2844
-    label "ArtCrit"
-    color "5"
-  ]
-  node [
-    id 2845
-    label "Georgia"
-    color "0"
-  ]
-  node [
-    id 2846
-    label "DirtyJerz"
-    color "4"
-  ]
-  node [
-    id 2847
-    label "Tawn31"
-    color "0"
-  ]
-  node [
-    id 2848
-    label "dotnet30"
-    color "0"
-  ]
-  node [
-    id 2849
-    label "activism"
-    color "4"
-  ]
-  node [
-    id 2850
-    label "sridhar"
-    color "4"
-  ]
-  node [
-    id 2851
-    label "Lancement"
-    color "4"
-  ]
-  node [
-    id 2852
-    label "fastfood"
-    color "0"
-  ]
-  node [
-    id 2853
-    label "themes"
-    color "4"
-  ]
-  node [
-    id 2854
-    label "quant"
-    color "0"
-  ]
-  node [
-    id 2855
-    label "WahyuDewanto"
-    color "0"
-  ]
-  node [
-    id 2856
-    label "Providence_Swings"
-    color "4"
-  ]
-  node [
-    id 2857
-    label "wikipedia"
-    color "5"
-  ]
-  node [
-    id 2858
-    label "startrek"
-    color "0"
-  ]
-  node [
-    id 2859
-    label "California"
-    color "0"
-  ]
-  node [
-    id 2860
-    label "GreenTree"
-    color "4"
-  ]
-  node [
-    id 2861
-    label "business"
-    color "5"
-  ]
-  node [
-    id 2862
-    label "dap"
-    color "4"
-  ]
-  node [
-    id 2863
-    label "salesforce"
-    color "4"
-  ]
-  node [
-    id 2864
-    label "TSQL_MIDDLE_Command"
-    color "4"
-  ]
-  node [
-    id 2865
-    label "BargainShopping"
-    color "0"
-  ]
-  node [
-    id 2866
-    label "awallafashagba"
-    color "0"
-  ]
-  node [
-    id 2867
-    label "ducks"
-    color "0"
-  ]
-  node [
-    id 2868
-    label "israelis"
-    color "4"
-  ]
-  node [
-    id 2869
-    label "testowy"
-    color "0"
-  ]
-  node [
-    id 2870
-    label "movies"
-    color "5"
-  ]
-  node [
-    id 2871
-    label "MR4Real"
-    color "0"
-  ]
-  node [
-    id 2872
-    label "Product"
-    color "4"
-  ]
-  node [
-    id 2873
-    label "hinduism"
-    color "0"
-  ]
-  node [
-    id 2874
-    label "zora"
-    color "4"
-  ]
-  node [
-    id 2875
-    label "Protocols"
-    color "0"
-  ]
-  node [
-    id 2876
-    label "holyroller"
-    color "0"
-  ]
-  node [
-    id 2877
-    label "artition"
-    color "0"
-  ]
-  node [
-    id 2878
-    label "JustinaConway"
-    color "4"
-  ]
-  node [
-    id 2879
-    label "BagLovers"
-    color "4"
-  ]
-  node [
-    id 2880
-    label "screenshots"
-    color "0"
-  ]
-  node [
-    id 2881
-    label "Balls"
-    color "0"
-  ]
-  node [
-    id 2882
-    label "boating"
-    color "4"
-  ]
-  node [
-    id 2883
-    label "phish"
-    color "4"
-  ]
-  node [
-    id 2884
-    label "painting"
-    color "4"
-  ]
-  node [
-    id 2885
-    label "chakdeindia"
-    color "4"
-  ]
-  node [
-    id 2886
-    label "amv"
-    color "0"
-  ]
-  node [
-    id 2887
-    label "d_language"
-    color "0"
-  ]
-  node [
-    id 2888
-    label "ohmygod"
-    color "4"
-  ]
-  node [
-    id 2889
-    label "University"
-    color "4"
-  ]
-  node [
-    id 2890
-    label "Bacon"
-    color "5"
-  ]
-  node [
-    id 2891
-    label "nikolas"
-    color "0"
-  ]
-  node [
-    id 2892
-    label "rugbyunion"
-    color "0"
-  ]
-  node [
-    id 2893
-    label "SearchMyCampus"
-    color "4"
-  ]
-  node [
-    id 2894
-    label "shouldhavesentapoet"
-    color "0"
-  ]
-  node [
-    id 2895
-    label "HappinessSF"
-    color "0"
-  ]
-  node [
-    id 2896
-    label "digitaladvertising"
-    color "0"
-  ]
-  node [
-    id 2897
-    label "yro"
-    color "0"
-  ]
-  node [
-    id 2898
-    label "VietNam"
-    color "4"
-  ]
-  node [
-    id 2899
-    label "hotnesscelebritiess"
-    color "0"
-  ]
-  node [
-    id 2900
-    label "refactorphoenix"
-    color "4"
-  ]
-  node [
-    id 2901
-    label "censoredatreddit"
-    color "4"
-  ]
-  node [
-    id 2902
-    label "ChristopherLower"
-    color "0"
-  ]
-  node [
-    id 2903
-    label "classy"
-    color "4"
-  ]
-  node [
-    id 2904
-    label "testpassport"
-    color "4"
-  ]
-  node [
-    id 2905
-    label "Exercise"
-    color "4"
-  ]
-  node [
-    id 2906
-    label "redsox"
-    color "0"
-  ]
-  node [
-    id 2907
-    label "ManishSharma"
-    color "0"
-  ]
-  node [
-    id 2908
-    label "Grind_Vision"
-    color "0"
-  ]
-  node [
-    id 2909
-    label "oddities"
-    color "4"
-  ]
-  node [
-    id 2910
-    label "Tcl"
-    color "4"
-  ]
-  node [
-    id 2911
-    label "Bad_Cop_No_Donut"
-    color "0"
-  ]
-  node [
-    id 2912
-    label "Boxing"
-    color "4"
-  ]
-  node [
-    id 2913
-    label "teacherlibrarian"
-    color "4"
-  ]
-  node [
-    id 2914
-    label "bernsbarry"
-    color "4"
-  ]
-  node [
-    id 2915
-    label "bestbarsboulder"
-    color "0"
-  ]
-  node [
-    id 2916
-    label "ZioNews"
-    color "0"
-  ]
-  node [
-    id 2917
-    label "bdcburma"
-    color "0"
-  ]
-  node [
-    id 2918
-    label "blitzforum"
-    color "4"
-  ]
-  node [
-    id 2919
-    label "esolangs"
-    color "4"
-  ]
-  node [
-    id 2920
-    label "Deliverator"
-    color "0"
-  ]
-  node [
-    id 2921
-    label "JOrnstein"
-    color "0"
-  ]
-  node [
-    id 2922
-    label "MLM"
-    color "0"
-  ]
-  node [
-    id 2923
-    label "sbhockey"
-    color "4"
-  ]
-  node [
-    id 2924
-    label "youtube"
-    color "5"
-  ]
-  node [
-    id 2925
-    label "DBpooper"
-    color "0"
-  ]
-  node [
-    id 2926
-    label "onlycode"
-    color "0"
-  ]
-  node [
-    id 2927
-    label "RomulusCristea"
-    color "4"
-  ]
-  node [
-    id 2928
-    label "indianbirder"
-    color "0"
-  ]
-  node [
-    id 2929
-    label "matt"
-    color "0"
-  ]
-  node [
-    id 2930
-    label "nsfa"
-    color "4"
-  ]
-  node [
-    id 2931
-    label "nonprofit"
-    color "4"
-  ]
-  node [
-    id 2932
-    label "abandoned"
-    color "0"
-  ]
-  node [
-    id 2933
-    label "ohhdisss"
-    color "0"
-  ]
-  node [
-    id 2934
-    label "dak"
-    color "0"
-  ]
-  node [
-    id 2935
-    label "threed"
-    color "4"
-  ]
-  node [
-    id 2936
-    label "MaynardsConfusions"
-    color "4"
-  ]
-  node [
-    id 2937
-    label "lawns"
-    color "4"
-  ]
-  node [
-    id 2938
-    label "Psychonaut"
-    color "0"
-  ]
-  node [
-    id 2939
-    label "geography"
-    color "0"
-  ]
-  node [
-    id 2940
-    label "magicTCG"
-    color "0"
-  ]
-  node [
-    id 2941
-    label "Zionism"
-    color "0"
-  ]
-  node [
-    id 2942
-    label "banjo"
-    color "0"
-  ]
-  node [
-    id 2943
-    label "JeffPaul"
-    color "0"
-  ]
-  node [
-    id 2944
-    label "drunk"
-    color "4"
-  ]
-  node [
-    id 2945
-    label "Allin210"
-    color "0"
-  ]
-  node [
-    id 2946
-    label "houston"
-    color "0"
-  ]
-  node [
-    id 2947
-    label "Mirrors"
-    color "4"
-  ]
-  node [
-    id 2948
-    label "Shailendra"
-    color "4"
-  ]
-  node [
-    id 2949
-    label "PlayableWebGames"
-    color "4"
-  ]
-  node [
-    id 2950
-    label "Crazy_On_Tap"
-    color "0"
-  ]
-  node [
-    id 2951
-    label "BrooklynFriends"
-    color "0"
-  ]
-  node [
-    id 2952
-    label "trustart"
-    color "4"
-  ]
-  node [
-    id 2953
-    label "AnimalRights"
-    color "1"
-  ]
-  node [
-    id 2954
-    label "Abundance"
-    color "0"
-  ]
-  node [
-    id 2955
-    label "Guitar"
-    color "5"
-  ]
-  node [
-    id 2956
-    label "AHMED3"
-    color "4"
-  ]
-  node [
-    id 2957
-    label "wrong"
-    color "4"
-  ]
-  node [
-    id 2958
-    label "testtest22"
-    color "0"
-  ]
-  node [
-    id 2959
-    label "hacker"
-    color "0"
-  ]
-  node [
-    id 2960
-    label "Memorials"
-    color "0"
-  ]
-  node [
-    id 2961
-    label "bliptv"
-    color "0"
-  ]
-  node [
-    id 2962
-    label "teevee"
-    color "4"
-  ]
-  node [
-    id 2963
-    label "Heeroguy"
-    color "4"
-  ]
-  node [
-    id 2964
-    label "Antireligion"
-    color "4"
-  ]
-  node [
-    id 2965
-    label "CashbackCity"
-    color "0"
-  ]
-  node [
-    id 2966
-    label "ACGA"
-    color "4"
-  ]
-  node [
-    id 2967
-    label "mises"
-    color "4"
-  ]
-  node [
-    id 2968
-    label "Indiatrends"
-    color "0"
-  ]
-  node [
-    id 2969
-    label "test1234"
-    color "0"
-  ]
-  node [
-    id 2970
-    label "Cricketworld"
-    color "4"
-  ]
-  node [
-    id 2971
-    label "cake"
-    color "4"
-  ]
-  node [
-    id 2972
-    label "PrimetimePolitics"
-    color "0"
-  ]
-  node [
-    id 2973
-    label "latinoamerica"
-    color "4"
-  ]
-  node [
-    id 2974
-    label "Apologists"
-    color "4"
-  ]
-  node [
-    id 2975
-    label "testyreddit"
-    color "4"
-  ]
-  node [
-    id 2976
-    label "4geth"
-    color "0"
-  ]
-  node [
-    id 2977
-    label "German"
-    color "4"
-  ]
-  node [
-    id 2978
-    label "social_bookmarking"
-    color "1"
-  ]
-  node [
-    id 2979
-    label "Cafegadgets"
-    color "4"
-  ]
-  node [
-    id 2980
-    label "CoolSiteOfTheDay"
-    color "4"
-  ]
-  node [
-    id 2981
-    label "discussions"
-    color "0"
-  ]
-  node [
-    id 2982
-    label "jaichiru"
-    color "4"
-  ]
-  node [
-    id 2983
-    label "skeptic"
-    color "5"
-  ]
-  node [
-    id 2984
-    label "DefendersOwn"
-    color "4"
-  ]
-  node [
-    id 2985
-    label "Cplusplus"
-    color "0"
-  ]
-  node [
-    id 2986
-    label "altnet"
-    color "0"
-  ]
-  node [
-    id 2987
-    label "Event_Launch"
-    color "4"
-  ]
-  node [
-    id 2988
-    label "BestSoccerPlayers"
-    color "4"
-  ]
-  node [
-    id 2989
-    label "game"
-    color "0"
-  ]
-  node [
-    id 2990
-    label "JazzMusic"
-    color "0"
-  ]
-  node [
-    id 2991
-    label "lds"
-    color "4"
-  ]
-  node [
-    id 2992
-    label "walmartvitamins"
-    color "0"
-  ]
-  node [
-    id 2993
-    label "colorreddit"
-    color "0"
-  ]
-  node [
-    id 2994
-    label "thenikoo"
-    color "0"
-  ]
-  node [
-    id 2995
-    label "Garry"
-    color "0"
-  ]
-  node [
-    id 2996
-    label "PcSoftBuy"
-    color "4"
-  ]
-  node [
-    id 2997
-    label "love"
-    color "1"
-  ]
-  node [
-    id 2998
-    label "virtualworld"
-    color "4"
-  ]
-  node [
-    id 2999
-    label "YerbaMateCanada"
-    color "4"
-  ]
-  node [
-    id 3000
-    label "Clojure"
-    color "0"
-  ]
-  node [
-    id 3001
-    label "LipLock16"
-    color "4"
-  ]
-  node [
-    id 3002
-    label "JamesButterfield"
-    color "4"
-  ]
-  node [
-    id 3003
-    label "Tomcan"
-    color "0"
-  ]
-  node [
-    id 3004
-    label "poker"
-    color "1"
-  ]
-  node [
-    id 3005
-    label "MobileDepot"
-    color "4"
-  ]
-  node [
-    id 3006
-    label "economy"
-    color "5"
-  ]
-  node [
-    id 3007
-    label "edu2do"
-    color "4"
-  ]
-  node [
-    id 3008
-    label "lojban"
-    color "0"
-  ]
-  node [
-    id 3009
-    label "HPF"
-    color "0"
-  ]
-  node [
-    id 3010
-    label "kharis"
-    color "0"
-  ]
-  node [
-    id 3011
-    label "TestMySite"
-    color "1"
-  ]
-  node [
-    id 3012
-    label "foss"
-    color "4"
-  ]
-  node [
-    id 3013
-    label "pokemans"
-    color "4"
-  ]
-  node [
-    id 3014
-    label "pugot"
-    color "4"
-  ]
-  node [
-    id 3015
-    label "greatpinoy"
-    color "4"
-  ]
-  node [
-    id 3016
-    label "healthcare"
-    color "4"
-  ]
-  node [
-    id 3017
-    label "bizhonorsbooks"
-    color "0"
-  ]
-  node [
-    id 3018
-    label "longform"
-    color "0"
-  ]
-  node [
-    id 3019
-    label "BRBPodcast"
-    color "0"
-  ]
-  node [
-    id 3020
-    label "TravelinginThailand"
-    color "4"
-  ]
-  node [
-    id 3021
-    label "IRONMIKEHAMILTON"
-    color "4"
-  ]
-  node [
-    id 3022
-    label "changedotgov"
-    color "0"
-  ]
-  node [
-    id 3023
-    label "MEMS"
-    color "4"
-  ]
-  node [
-    id 3024
-    label "iphone"
-    color "5"
-  ]
-  node [
-    id 3025
-    label "neutralnews"
-    color "0"
-  ]
-  node [
-    id 3026
-    label "hacks"
-    color "0"
-  ]
-  node [
-    id 3027
-    label "nobik"
-    color "0"
-  ]
-  node [
-    id 3028
-    label "MoveFitness"
-    color "4"
-  ]
-  node [
-    id 3029
-    label "Composition"
-    color "0"
-  ]
-  node [
-    id 3030
-    label "trance"
-    color "4"
-  ]
-  node [
-    id 3031
-    label "NoMorePowellLinks"
-    color "0"
-  ]
-  node [
-    id 3032
-    label "betch"
-    color "4"
-  ]
-  node [
-    id 3033
-    label "DOCAM"
-    color "4"
-  ]
-  node [
-    id 3034
-    label "billoreilly"
-    color "0"
-  ]
-  node [
-    id 3035
-    label "voluptuous"
-    color "0"
-  ]
-  node [
-    id 3036
-    label "cosplay"
-    color "4"
-  ]
-  node [
-    id 3037
-    label "odd"
-    color "0"
-  ]
-  node [
-    id 3038
-    label "Theism"
-    color "4"
-  ]
-  node [
-    id 3039
-    label "Webmaster"
-    color "0"
-  ]
-  node [
-    id 3040
-    label "energy"
-    color "5"
-  ]
-  node [
-    id 3041
-    label "Vacations"
-    color "0"
-  ]
-  node [
-    id 3042
-    label "BBMeals"
-    color "4"
-  ]
-  node [
-    id 3043
-    label "optimism"
-    color "4"
-  ]
-  node [
-    id 3044
-    label "audioengineering"
-    color "0"
-  ]
-  node [
-    id 3045
-    label "grabeco"
-    color "4"
-  ]
-  node [
-    id 3046
-    label "gnu"
-    color "0"
-  ]
-  node [
-    id 3047
-    label "elsewhenreturns"
-    color "4"
-  ]
-  node [
-    id 3048
-    label "Coach4u"
-    color "0"
-  ]
-  node [
-    id 3049
-    label "pianoetudes"
-    color "4"
-  ]
-  node [
-    id 3050
-    label "doctorwho"
-    color "5"
-  ]
-  node [
-    id 3051
-    label "accurev"
-    color "0"
-  ]
-  node [
-    id 3052
-    label "psychology"
-    color "5"
-  ]
-  node [
-    id 3053
-    label "Stoner"
-    color "0"
-  ]
-  node [
-    id 3054
-    label "Arzum"
-    color "4"
-  ]
-  node [
-    id 3055
-    label "warhammeronline"
-    color "4"
-  ]
-  node [
-    id 3056
-    label "DazedenConfewzd"
-    color "4"
-  ]
-  node [
-    id 3057
-    label "test888"
-    color "4"
-  ]
-  node [
-    id 3058
-    label "mazarebacha"
-    color "4"
-  ]
-  node [
-    id 3059
-    label "altdotnettools"
-    color "0"
-  ]
-  node [
-    id 3060
-    label "Wales"
-    color "0"
-  ]
-  node [
-    id 3061
-    label "Promotionals"
-    color "0"
-  ]
-  node [
-    id 3062
-    label "Webometrics"
-    color "0"
-  ]
-  node [
-    id 3063
-    label "Ginkoba"
-    color "4"
-  ]
-  node [
-    id 3064
-    label "Fish"
-    color "4"
-  ]
-  node [
-    id 3065
-    label "sexyjapanx"
-    color "0"
-  ]
-  node [
-    id 3066
-    label "history"
-    color "5"
-  ]
-  node [
-    id 3067
-    label "IWTest"
-    color "4"
-  ]
-  node [
-    id 3068
-    label "maths"
-    color "4"
-  ]
-  node [
-    id 3069
-    label "Vote_up_if"
-    color "0"
-  ]
-  node [
-    id 3070
-    label "usuiela"
-    color "4"
-  ]
-  node [
-    id 3071
-    label "webcomics"
-    color "5"
-  ]
-  node [
-    id 3072
-    label "BrickImaging"
-    color "0"
-  ]
-  node [
-    id 3073
-    label "davebenzList"
-    color "0"
-  ]
-  node [
-    id 3074
-    label "Zombie"
-    color "1"
-  ]
-  node [
-    id 3075
-    label "punq"
-    color "4"
-  ]
-  node [
-    id 3076
-    label "Mandriva"
-    color "0"
-  ]
-  node [
-    id 3077
-    label "Python"
-    color "4"
-  ]
-  node [
-    id 3078
-    label "norulesMMA"
-    color "4"
-  ]
-  node [
-    id 3079
-    label "aws"
-    color "4"
-  ]
-  node [
-    id 3080
-    label "Ebay"
-    color "0"
-  ]
-  node [
-    id 3081
-    label "knowledgespeak"
-    color "4"
-  ]
-  node [
-    id 3082
-    label "Bible"
-    color "0"
-  ]
-  node [
-    id 3083
-    label "Souneil_Park"
-    color "4"
-  ]
-  node [
-    id 3084
-    label "Romeo"
-    color "0"
-  ]
-  node [
-    id 3085
-    label "achewood"
-    color "4"
-  ]
-  node [
-    id 3086
-    label "snowboarding"
-    color "0"
-  ]
-  node [
-    id 3087
-    label "newjersey"
-    color "0"
-  ]
-  node [
-    id 3088
-    label "familychild"
-    color "4"
-  ]
-  node [
-    id 3089
-    label "webdynamicideas"
-    color "0"
-  ]
-  node [
-    id 3090
-    label "redditSubscribers"
-    color "0"
-  ]
-  node [
-    id 3091
-    label "boston"
-    color "0"
-  ]
-  node [
-    id 3092
-    label "manliness"
-    color "4"
-  ]
-  node [
-    id 3093
-    label "RedBalloonDays"
-    color "0"
-  ]
-  node [
-    id 3094
-    label "SexyPeachy"
-    color "0"
-  ]
-  node [
-    id 3095
-    label "TechnologyBlogs"
-    color "0"
-  ]
-  node [
-    id 3096
-    label "FunnyOlympic"
-    color "0"
-  ]
-  node [
-    id 3097
-    label "civildraftinservice"
-    color "4"
-  ]
-  node [
-    id 3098
-    label "floridanursinghome"
-    color "0"
-  ]
-  node [
-    id 3099
-    label "ExplativeHeadlines"
-    color "0"
-  ]
-  node [
-    id 3100
-    label "mrpurple"
-    color "0"
-  ]
-  node [
-    id 3101
-    label "Quirked"
-    color "4"
-  ]
-  node [
-    id 3102
-    label "es"
-    color "1"
-  ]
-  node [
-    id 3103
-    label "PUAmethod"
-    color "0"
-  ]
-  node [
-    id 3104
-    label "loft20"
-    color "0"
-  ]
-  node [
-    id 3105
-    label "code"
-    color "4"
-  ]
-  node [
-    id 3106
-    label "nomigobo"
-    color "4"
-  ]
-  node [
-    id 3107
-    label "Stonecrypt"
-    color "4"
-  ]
-  node [
-    id 3108
-    label "lol"
-    color "5"
-  ]
-  node [
-    id 3109
-    label "PETA"
-    color "4"
-  ]
-  node [
-    id 3110
-    label "LBD"
-    color "4"
-  ]
-  node [
-    id 3111
-    label "games4u"
-    color "0"
-  ]
-  node [
-    id 3112
-    label "de"
-    color "7"
-  ]
-  node [
-    id 3113
-    label "taiwan"
-    color "0"
-  ]
-  node [
-    id 3114
-    label "psychopharmacology"
-    color "0"
-  ]
-  node [
-    id 3115
-    label "olivierg"
-    color "0"
-  ]
-  node [
-    id 3116
-    label "UpperCanada"
-    color "0"
-  ]
-  node [
-    id 3117
-    label "moleskine"
-    color "4"
-  ]
-  node [
-    id 3118
-    label "copyfight"
-    color "4"
-  ]
-  node [
-    id 3119
-    label "religionseriously"
-    color "0"
-  ]
-  node [
-    id 3120
-    label "NewsPlus"
-    color "0"
-  ]
-  node [
-    id 3121
-    label "diddit"
-    color "4"
-  ]
-  node [
-    id 3122
-    label "Homebrewing"
-    color "4"
-  ]
-  node [
-    id 3123
-    label "Askmoses"
-    color "4"
-  ]
-  node [
-    id 3124
-    label "GFT"
-    color "0"
-  ]
-  node [
-    id 3125
-    label "soccerleagueslive"
-    color "0"
-  ]
-  node [
-    id 3126
-    label "lybolt"
-    color "0"
-  ]
-  node [
-    id 3127
-    label "geeks"
-    color "0"
-  ]
-  node [
-    id 3128
-    label "Dealzin8"
-    color "4"
-  ]
-  node [
-    id 3129
-    label "weirdnews"
-    color "4"
-  ]
-  node [
-    id 3130
-    label "Tgirls"
-    color "0"
-  ]
-  node [
-    id 3131
-    label "humanresources"
-    color "0"
-  ]
-  node [
-    id 3132
-    label "Immunology"
-    color "0"
-  ]
-  node [
-    id 3133
-    label "Wormintheworks"
-    color "4"
-  ]
-  node [
-    id 3134
-    label "CorporateCreative"
-    color "4"
-  ]
-  node [
-    id 3135
-    label "BigFs5"
-    color "4"
-  ]
-  node [
-    id 3136
-    label "Journalism"
-    color "0"
-  ]
-  node [
-    id 3137
-    label "InternetMarketing"
-    color "4"
-  ]
-  node [
-    id 3138
-    label "listmania"
-    color "4"
-  ]
-  node [
-    id 3139
-    label "anonymus"
-    color "4"
-  ]
-  node [
-    id 3140
-    label "Musicoursoul"
-    color "4"
-  ]
-  node [
-    id 3141
-    label "funny"
-    color "5"
-  ]
-  node [
-    id 3142
-    label "espanol"
-    color "4"
-  ]
-  node [
-    id 3143
-    label "fundoo"
-    color "0"
-  ]
-  node [
-    id 3144
-    label "Altamente"
-    color "4"
-  ]
-  node [
-    id 3145
-    label "AskReddit"
-    color "5"
-  ]
-  node [
-    id 3146
-    label "vegan"
-    color "1"
-  ]
-  node [
-    id 3147
-    label "KiNov"
-    color "0"
-  ]
-  node [
-    id 3148
-    label "FixedGearBicycle"
-    color "0"
-  ]
-  node [
-    id 3149
-    label "solar"
-    color "4"
-  ]
-  node [
-    id 3150
-    label "wordrosia"
-    color "4"
-  ]
-  node [
-    id 3151
-    label "MVPSubmissions"
-    color "4"
-  ]
-  node [
-    id 3152
-    label "neopagan"
-    color "4"
-  ]
-  node [
-    id 3153
-    label "9jabuzz"
-    color "4"
-  ]
-  node [
-    id 3154
-    label "ptsd"
-    color "4"
-  ]
-  node [
-    id 3155
-    label "blackfriday"
-    color "4"
-  ]
-  node [
-    id 3156
-    label "Quakers"
-    color "4"
-  ]
-  node [
-    id 3157
-    label "LATIMES"
-    color "4"
-  ]
-  node [
-    id 3158
-    label "syok3gp"
-    color "4"
-  ]
-  node [
-    id 3159
-    label "Stuff"
-    color "4"
-  ]
-  node [
-    id 3160
-    label "GeorgiaAquarium"
-    color "0"
-  ]
-  node [
-    id 3161
-    label "Pampelmoose"
-    color "4"
-  ]
-  node [
-    id 3162
-    label "zombies"
-    color "5"
-  ]
-  node [
-    id 3163
-    label "microblogging"
-    color "0"
-  ]
-  node [
-    id 3164
-    label "vermont"
-    color "4"
-  ]
-  node [
-    id 3165
-    label "fashionnews"
-    color "0"
-  ]
-  node [
-    id 3166
-    label "llin"
-    color "4"
-  ]
-  node [
-    id 3167
-    label "militantatheist"
-    color "0"
-  ]
-  node [
-    id 3168
-    label "dave"
-    color "0"
-  ]
-  node [
-    id 3169
-    label "dogs"
-    color "4"
-  ]
-  node [
-    id 3170
-    label "freebies"
-    color "0"
-  ]
-  node [
-    id 3171
-    label "DrSpam"
-    color "0"
-  ]
-  node [
-    id 3172
-    label "PhiBetaSigma"
-    color "4"
-  ]
-  node [
-    id 3173
-    label "trailer"
-    color "0"
-  ]
-  node [
-    id 3174
-    label "atheism"
-    color "5"
-  ]
-  node [
-    id 3175
-    label "localecommerce"
-    color "4"
-  ]
-  node [
-    id 3176
-    label "Judaism"
-    color "4"
-  ]
-  node [
-    id 3177
-    label "firefox"
-    color "0"
-  ]
-  node [
-    id 3178
-    label "Reefing"
-    color "0"
-  ]
-  node [
-    id 3179
-    label "nhnews"
-    color "4"
-  ]
-  node [
-    id 3180
-    label "Gopher"
-    color "0"
-  ]
-  node [
-    id 3181
-    label "Mali"
-    color "0"
-  ]
-  node [
-    id 3182
-    label "VolvoRWD"
-    color "4"
-  ]
-  node [
-    id 3183
-    label "jruby"
-    color "4"
-  ]
-  node [
-    id 3184
-    label "Alexanderc"
-    color "0"
-  ]
-  node [
-    id 3185
-    label "revolution"
-    color "4"
-  ]
-  node [
-    id 3186
-    label "greenskeptics"
-    color "0"
-  ]
-  node [
-    id 3187
-    label "msu"
-    color "0"
-  ]
-  node [
-    id 3188
-    label "Mushrooms"
-    color "4"
-  ]
-  node [
-    id 3189
-    label "Ambientalmente"
-    color "4"
-  ]
-  node [
-    id 3190
-    label "cardsinnerpoker"
-    color "0"
-  ]
-  node [
-    id 3191
-    label "sysor"
-    color "4"
-  ]
-  node [
-    id 3192
-    label "germany"
-    color "0"
-  ]
-  node [
-    id 3193
-    label "squiggol"
-    color "0"
-  ]
-  node [
-    id 3194
-    label "ZUMBEEL"
-    color "0"
-  ]
-  node [
-    id 3195
-    label "psu"
-    color "0"
-  ]
-  node [
-    id 3196
-    label "egalitarian"
-    color "5"
-  ]
-  node [
-    id 3197
-    label "BritneySpears"
-    color "0"
-  ]
-  node [
-    id 3198
-    label "PhD"
-    color "4"
-  ]
-  node [
-    id 3199
-    label "QualityAssurance"
-    color "4"
-  ]
-  node [
-    id 3200
-    label "datarecover"
-    color "0"
-  ]
-  node [
-    id 3201
-    label "vod"
-    color "4"
-  ]
-  node [
-    id 3202
-    label "RenewLV"
-    color "0"
-  ]
-  node [
-    id 3203
-    label "Lanaiv"
-    color "4"
-  ]
-  node [
-    id 3204
-    label "Palachinka"
-    color "0"
-  ]
-  node [
-    id 3205
-    label "phoenix"
-    color "4"
-  ]
-  node [
-    id 3206
-    label "vim"
-    color "0"
-  ]
-  node [
-    id 3207
-    label "zapped"
-    color "0"
-  ]
-  node [
-    id 3208
-    label "Fixed"
-    color "0"
-  ]
-  node [
-    id 3209
-    label "aussierules"
-    color "0"
-  ]
-  node [
-    id 3210
-    label "Android"
-    color "1"
-  ]
-  node [
-    id 3211
-    label "artificial"
-    color "0"
-  ]
-  node [
-    id 3212
-    label "Genealogy"
-    color "4"
-  ]
-  node [
-    id 3213
-    label "pandorastations"
-    color "0"
-  ]
-  node [
-    id 3214
-    label "SNUBA"
-    color "0"
-  ]
-  node [
-    id 3215
-    label "lacy2430"
-    color "0"
-  ]
-  node [
-    id 3216
-    label "CASTELATED"
-    color "0"
-  ]
-  node [
-    id 3217
-    label "teddit"
-    color "0"
-  ]
-  node [
-    id 3218
-    label "safety"
-    color "4"
-  ]
-  node [
-    id 3219
-    label "ForgottenBookmarks"
-    color "0"
-  ]
-  node [
-    id 3220
-    label "KMY1980"
-    color "4"
-  ]
-  node [
-    id 3221
-    label "Tasers"
-    color "4"
-  ]
-  node [
-    id 3222
-    label "russia"
-    color "2"
-  ]
-  node [
-    id 3223
-    label "discgolf"
-    color "0"
-  ]
-  node [
-    id 3224
-    label "MusicVideos"
-    color "0"
-  ]
-  node [
-    id 3225
-    label "PrideNation"
-    color "4"
-  ]
-  node [
-    id 3226
-    label "sharingjesus"
-    color "4"
-  ]
-  node [
-    id 3227
-    label "newworldorder"
-    color "4"
-  ]
-  node [
-    id 3228
-    label "shortstories"
-    color "0"
-  ]
-  node [
-    id 3229
-    label "undead"
-    color "4"
-  ]
-  node [
-    id 3230
-    label "modelrocketry"
-    color "0"
-  ]
-  node [
-    id 3231
-    label "PersianDigg"
-    color "4"
-  ]
-  node [
-    id 3232
-    label "Phenocal"
-    color "4"
-  ]
-  node [
-    id 3233
-    label "slashdotxx"
-    color "4"
-  ]
-  node [
-    id 3234
-    label "CassandraTroy"
-    color "0"
-  ]
-  node [
-    id 3235
-    label "LowesRedApron"
-    color "4"
-  ]
-  node [
-    id 3236
-    label "33revolutions"
-    color "0"
-  ]
-  node [
-    id 3237
-    label "nuxeo"
-    color "0"
-  ]
-  node [
-    id 3238
-    label "ten31"
-    color "4"
-  ]
-  node [
-    id 3239
-    label "portugal"
-    color "4"
-  ]
-  node [
-    id 3240
-    label "SamuiBeachVillage"
-    color "0"
-  ]
-  node [
-    id 3241
-    label "OnlineShopping"
-    color "0"
-  ]
-  node [
-    id 3242
-    label "bioinformatics"
-    color "4"
-  ]
-  node [
-    id 3243
-    label "Shoes"
-    color "4"
-  ]
-  node [
-    id 3244
-    label "vegas"
-    color "4"
-  ]
-  node [
-    id 3245
-    label "uclanerds"
-    color "0"
-  ]
-  node [
-    id 3246
-    label "NorthCarolina"
-    color "4"
-  ]
-  node [
-    id 3247
-    label "mixes"
-    color "4"
-  ]
-  node [
-    id 3248
-    label "crashcourse"
-    color "4"
-  ]
-  node [
-    id 3249
-    label "Dealzin"
-    color "0"
-  ]
-  node [
-    id 3250
-    label "UsefulBlogs"
-    color "4"
-  ]
-  node [
-    id 3251
-    label "helpmereddit"
-    color "4"
-  ]
-  node [
-    id 3252
-    label "punthreads"
-    color "0"
-  ]
-  node [
-    id 3253
-    label "women"
-    color "5"
-  ]
-  node [
-    id 3254
-    label "AllTube"
-    color "4"
-  ]
-  node [
-    id 3255
-    label "unsigned"
-    color "0"
-  ]
-  node [
-    id 3256
-    label "EcoKindDesign"
-    color "0"
-  ]
-  node [
-    id 3257
-    label "WeGame"
-    color "4"
-  ]
-  node [
-    id 3258
-    label "gnome"
-    color "0"
-  ]
-  node [
-    id 3259
-    label "deferred"
-    color "4"
-  ]
-  node [
-    id 3260
-    label "Concerts"
-    color "4"
-  ]
-  node [
-    id 3261
-    label "sortrosia"
-    color "4"
-  ]
-  node [
-    id 3262
-    label "adekosis"
-    color "4"
-  ]
-  node [
-    id 3263
-    label "antiwar"
-    color "0"
-  ]
-  node [
-    id 3264
-    label "Koreus"
-    color "0"
-  ]
-  node [
-    id 3265
-    label "stefantochev"
-    color "4"
-  ]
-  node [
-    id 3266
-    label "Pocketsmith"
-    color "0"
-  ]
-  node [
-    id 3267
-    label "roddit"
-    color "4"
-  ]
-  node [
-    id 3268
-    label "mandrivafr"
-    color "4"
-  ]
-  node [
-    id 3269
-    label "NaplesWebDesign"
-    color "0"
-  ]
-  node [
-    id 3270
-    label "ChicagoREALTOR"
-    color "4"
-  ]
-  node [
-    id 3271
-    label "webmaster123"
-    color "0"
-  ]
-  node [
-    id 3272
-    label "PakistanHousing"
-    color "4"
-  ]
-  node [
-    id 3273
-    label "Oh2be16"
-    color "4"
-  ]
-  node [
-    id 3274
-    label "Quran"
-    color "4"
-  ]
-  node [
-    id 3275
-    label "files1000"
-    color "0"
-  ]
-  node [
-    id 3276
-    label "comics"
-    color "5"
-  ]
-  node [
-    id 3277
-    label "ChoosyHomeschoolers"
-    color "0"
-  ]
-  node [
-    id 3278
-    label "joomlatricks"
-    color "0"
-  ]
-  node [
-    id 3279
-    label "brewing"
-    color "0"
-  ]
-  node [
-    id 3280
-    label "photographers"
-    color "0"
-  ]
-  node [
-    id 3281
-    label "battletech"
-    color "4"
-  ]
-  node [
-    id 3282
-    label "humor"
-    color "5"
-  ]
-  node [
-    id 3283
-    label "THATPainterLady"
-    color "0"
-  ]
-  node [
-    id 3284
-    label "TimeTravellers"
-    color "4"
-  ]
-  node [
-    id 3285
-    label "Dissent"
-    color "4"
-  ]
-  node [
-    id 3286
-    label "Sukhpreet"
-    color "4"
-  ]
-  node [
-    id 3287
-    label "MovieGab"
-    color "4"
-  ]
-  node [
-    id 3288
-    label "Sports2Debate"
-    color "4"
-  ]
-  node [
-    id 3289
-    label "bjj"
-    color "4"
-  ]
-  node [
-    id 3290
-    label "retrogaming"
-    color "4"
-  ]
-  node [
-    id 3291
-    label "trolls"
-    color "4"
-  ]
-  node [
-    id 3292
-    label "Thailand"
-    color "4"
-  ]
-  node [
-    id 3293
-    label "goodoldays"
-    color "0"
-  ]
-  node [
-    id 3294
-    label "sdfsd"
-    color "0"
-  ]
-  node [
-    id 3295
-    label "lgbt"
-    color "5"
-  ]
-  node [
-    id 3296
-    label "embassysuitesniagara"
-    color "4"
-  ]
-  node [
-    id 3297
-    label "developer"
-    color "4"
-  ]
-  node [
-    id 3298
-    label "myshortfilms"
-    color "0"
-  ]
-  node [
-    id 3299
-    label "science2"
-    color "0"
-  ]
-  node [
-    id 3300
-    label "valleyvoice"
-    color "4"
-  ]
-  node [
-    id 3301
-    label "Krugman"
-    color "4"
-  ]
-  node [
-    id 3302
-    label "Today"
-    color "4"
-  ]
-  node [
-    id 3303
-    label "UseSmallWords"
-    color "0"
-  ]
-  node [
-    id 3304
-    label "Faildogs"
-    color "0"
-  ]
-  node [
-    id 3305
-    label "Homebrewing101"
-    color "4"
-  ]
-  node [
-    id 3306
-    label "kyonounnsei"
-    color "0"
-  ]
-  node [
-    id 3307
-    label "bingecat"
-    color "0"
-  ]
-  node [
-    id 3308
-    label "marion"
-    color "4"
-  ]
-  node [
-    id 3309
-    label "CommonLaw"
-    color "1"
-  ]
-  node [
-    id 3310
-    label "Fedora"
-    color "4"
-  ]
-  node [
-    id 3311
-    label "clikdicks"
-    color "4"
-  ]
-  node [
-    id 3312
-    label "PutinforPresident"
-    color "0"
-  ]
-  node [
-    id 3313
-    label "palin"
-    color "0"
-  ]
-  node [
-    id 3314
-    label "Squidoo"
-    color "0"
-  ]
-  node [
-    id 3315
-    label "jakobsenfred"
-    color "0"
-  ]
-  node [
-    id 3316
-    label "MST3K"
-    color "0"
-  ]
-  node [
-    id 3317
-    label "Preisvergleich"
-    color "4"
-  ]
-  node [
-    id 3318
-    label "siciliasud"
-    color "0"
-  ]
-  node [
-    id 3319
-    label "mileycyrus"
-    color "0"
-  ]
-  node [
-    id 3320
-    label "ConceptSeries"
-    color "0"
-  ]
-  node [
-    id 3321
-    label "advertising"
-    color "0"
-  ]
-  node [
-    id 3322
-    label "televizoare"
-    color "0"
-  ]
-  node [
-    id 3323
-    label "camping"
-    color "0"
-  ]
-  node [
-    id 3324
-    label "dotnet"
-    color "1"
-  ]
-  node [
-    id 3325
-    label "livemusic"
-    color "4"
-  ]
-  node [
-    id 3326
-    label "Kasey"
-    color "4"
-  ]
-  node [
-    id 3327
-    label "christianrap"
-    color "4"
-  ]
-  node [
-    id 3328
-    label "Nametagsnet"
-    color "0"
-  ]
-  node [
-    id 3329
-    label "Pocketbook"
-    color "0"
-  ]
-  node [
-    id 3330
-    label "processsecrets"
-    color "4"
-  ]
-  node [
-    id 3331
-    label "lakers"
-    color "4"
-  ]
-  node [
-    id 3332
-    label "USPE12"
-    color "4"
-  ]
-  node [
-    id 3333
-    label "azher"
-    color "0"
-  ]
-  node [
-    id 3334
-    label "Greatdit"
-    color "0"
-  ]
-  node [
-    id 3335
-    label "Rowing"
-    color "0"
-  ]
-  node [
-    id 3336
-    label "DoggieWeight"
-    color "0"
-  ]
-  node [
-    id 3337
-    label "JPK"
-    color "4"
-  ]
-  node [
-    id 3338
-    label "SoftwareEngineering"
-    color "4"
-  ]
-  node [
-    id 3339
-    label "SpoonBlog"
-    color "0"
-  ]
-  node [
-    id 3340
-    label "forestcityinstitute"
-    color "0"
-  ]
-  node [
-    id 3341
-    label "Shamanism"
-    color "0"
-  ]
-  node [
-    id 3342
-    label "debates"
-    color "4"
-  ]
-  node [
-    id 3343
-    label "Collapse_Peak_Oil"
-    color "4"
-  ]
-  node [
-    id 3344
-    label "obituaries"
-    color "0"
-  ]
-  node [
-    id 3345
-    label "LionsSummit"
-    color "4"
-  ]
-  node [
-    id 3346
-    label "orf"
-    color "0"
-  ]
-  node [
-    id 3347
-    label "shortentertainment"
-    color "4"
-  ]
-  node [
-    id 3348
-    label "geospatial"
-    color "0"
-  ]
-  node [
-    id 3349
-    label "microcontrollers"
-    color "0"
-  ]
-  node [
-    id 3350
-    label "karaoke"
-    color "4"
-  ]
-  node [
-    id 3351
-    label "abortionisprolife"
-    color "0"
-  ]
-  node [
-    id 3352
-    label "cinemablend"
-    color "0"
-  ]
-  node [
-    id 3353
-    label "surfing"
-    color "0"
-  ]
-  node [
-    id 3354
-    label "karma"
-    color "4"
-  ]
-  node [
-    id 3355
-    label "Paradise"
-    color "0"
-  ]
-  node [
-    id 3356
-    label "CrazyJoe"
-    color "4"
-  ]
-  node [
-    id 3357
-    label "lisp"
-    color "4"
-  ]
-  node [
-    id 3358
-    label "reeses"
-    color "0"
-  ]
-  node [
-    id 3359
-    label "toronto"
-    color "4"
-  ]
-  node [
-    id 3360
-    label "2moroX"
-    color "4"
-  ]
-  node [
-    id 3361
-    label "marriedtothesea"
-    color "0"
-  ]
-  node [
-    id 3362
-    label "EuroBookings"
-    color "0"
-  ]
-  node [
-    id 3363
-    label "FIlm"
-    color "4"
-  ]
-  node [
-    id 3364
-    label "mobile"
-    color "4"
-  ]
-  node [
-    id 3365
-    label "SwampSparrowSucks"
-    color "0"
-  ]
-  node [
-    id 3366
-    label "rickroll"
-    color "0"
-  ]
-  node [
-    id 3367
-    label "Money"
-    color "0"
-  ]
-  node [
-    id 3368
-    label "PawShow"
-    color "4"
-  ]
-  node [
-    id 3369
-    label "Nicole"
-    color "4"
-  ]
-  node [
-    id 3370
-    label "rap"
-    color "0"
-  ]
-  node [
-    id 3371
-    label "test54321"
-    color "0"
-  ]
-  node [
-    id 3372
-    label "PirateParty"
-    color "4"
-  ]
-  node [
-    id 3373
-    label "babychangingstation"
-    color "0"
-  ]
-  node [
-    id 3374
-    label "math"
-    color "5"
-  ]
-  node [
-    id 3375
-    label "scientific"
-    color "1"
-  ]
-  node [
-    id 3376
-    label "Gamer"
-    color "0"
-  ]
-  node [
-    id 3377
-    label "Christianity"
-    color "5"
-  ]
-  node [
-    id 3378
-    label "c_language"
-    color "4"
-  ]
-  node [
-    id 3379
-    label "PCFreak"
-    color "0"
-  ]
-  node [
-    id 3380
-    label "testa"
-    color "0"
-  ]
-  node [
-    id 3381
-    label "ebookcompiler"
-    color "0"
-  ]
-  node [
-    id 3382
-    label "Vriesema"
-    color "4"
-  ]
-  node [
-    id 3383
-    label "EnterpriseNation"
-    color "4"
-  ]
-  node [
-    id 3384
-    label "FinanceNews"
-    color "0"
-  ]
-  node [
-    id 3385
-    label "creditwrench"
-    color "4"
-  ]
-  node [
-    id 3386
-    label "icanhaz"
-    color "0"
-  ]
-  node [
-    id 3387
-    label "trt"
-    color "0"
-  ]
-  node [
-    id 3388
-    label "pcolinks"
-    color "0"
-  ]
-  node [
-    id 3389
-    label "Digital"
-    color "0"
-  ]
-  node [
-    id 3390
-    label "kundi"
-    color "4"
-  ]
-  node [
-    id 3391
-    label "Mullets"
-    color "4"
-  ]
-  node [
-    id 3392
-    label "climate"
-    color "5"
-  ]
-  node [
-    id 3393
-    label "MTB"
-    color "0"
-  ]
-  node [
-    id 3394
-    label "bollywood"
-    color "0"
-  ]
-  node [
-    id 3395
-    label "dnbmixes"
-    color "0"
-  ]
-  node [
-    id 3396
-    label "Pizza"
-    color "4"
-  ]
-  node [
-    id 3397
-    label "FourPanelsofFun"
-    color "0"
-  ]
-  node [
-    id 3398
-    label "revenue"
-    color "0"
-  ]
-  node [
-    id 3399
-    label "newspeak"
-    color "4"
-  ]
-  node [
-    id 3400
-    label "Williammooch"
-    color "4"
-  ]
-  node [
-    id 3401
-    label "China"
-    color "0"
-  ]
-  node [
-    id 3402
-    label "web_infrastructure"
-    color "0"
-  ]
-  node [
-    id 3403
-    label "nostalgia"
-    color "0"
-  ]
-  node [
-    id 3404
-    label "Cleveland"
-    color "0"
-  ]
-  node [
-    id 3405
-    label "MRMMO"
-    color "4"
-  ]
-  node [
-    id 3406
-    label "quickoats"
-    color "4"
-  ]
-  node [
-    id 3407
-    label "Virtual_Reality"
-    color "0"
-  ]
-  node [
-    id 3408
-    label "compsci"
-    color "4"
-  ]
-  node [
-    id 3409
-    label "AlertsCar"
-    color "0"
-  ]
-  node [
-    id 3410
-    label "newscrux"
-    color "0"
-  ]
-  node [
-    id 3411
-    label "xaluan"
-    color "0"
-  ]
-  node [
-    id 3412
-    label "VC2009"
-    color "4"
-  ]
-  node [
-    id 3413
-    label "vintagecomputing"
-    color "0"
-  ]
-  node [
-    id 3414
-    label "blogofilia"
-    color "0"
-  ]
-  node [
-    id 3415
-    label "Muskurahat"
-    color "0"
-  ]
-  node [
-    id 3416
-    label "Dance"
-    color "0"
-  ]
-  node [
-    id 3417
-    label "portblue"
-    color "4"
-  ]
-  node [
-    id 3418
-    label "toys"
-    color "0"
-  ]
-  node [
-    id 3419
-    label "manchester"
-    color "4"
-  ]
-  node [
-    id 3420
-    label "video"
-    color "5"
-  ]
-  node [
-    id 3421
-    label "DesignGrava"
-    color "0"
-  ]
-  node [
-    id 3422
-    label "RenaissanceRonin"
-    color "4"
-  ]
-  node [
-    id 3423
-    label "linux"
-    color "5"
-  ]
-  node [
-    id 3424
-    label "USHealthcarePolicy"
-    color "0"
-  ]
-  node [
-    id 3425
-    label "hu"
-    color "0"
-  ]
-  node [
-    id 3426
-    label "diggsucks"
-    color "4"
-  ]
-  node [
-    id 3427
-    label "TroubleFixers"
-    color "4"
-  ]
-  node [
-    id 3428
-    label "telaviv"
-    color "0"
-  ]
-  node [
-    id 3429
-    label "ltr"
-    color "4"
-  ]
-  node [
-    id 3430
-    label "southafrica"
-    color "4"
-  ]
-  node [
-    id 3431
-    label "voteups"
-    color "4"
-  ]
-  node [
-    id 3432
-    label "newreddits"
-    color "5"
-  ]
-  node [
-    id 3433
-    label "groovy"
-    color "0"
-  ]
-  node [
-    id 3434
-    label "DotSiamMove"
-    color "4"
-  ]
-  node [
-    id 3435
-    label "bitteroldmen"
-    color "4"
-  ]
-  node [
-    id 3436
-    label "searchengines"
-    color "0"
-  ]
-  node [
-    id 3437
-    label "nl"
-    color "1"
-  ]
-  node [
-    id 3438
-    label "echoe"
-    color "4"
-  ]
-  node [
-    id 3439
-    label "childwelfare"
-    color "4"
-  ]
-  node [
-    id 3440
-    label "redditdev"
-    color "5"
-  ]
-  node [
-    id 3441
-    label "ThirdWaveFeminism"
-    color "0"
-  ]
-  node [
-    id 3442
-    label "hotdeals"
-    color "0"
-  ]
-  node [
-    id 3443
-    label "lolcats"
-    color "5"
-  ]
-  node [
-    id 3444
-    label "allthingsutah"
-    color "0"
-  ]
-  node [
-    id 3445
-    label "atari"
-    color "4"
-  ]
-  node [
-    id 3446
-    label "Corruption"
-    color "0"
-  ]
-  node [
-    id 3447
-    label "ultimate"
-    color "0"
-  ]
-  node [
-    id 3448
-    label "hornio"
-    color "4"
-  ]
-  node [
-    id 3449
-    label "features"
-    color "4"
-  ]
-  node [
-    id 3450
-    label "mrsubtraction"
-    color "4"
-  ]
-  node [
-    id 3451
-    label "Cushings"
-    color "0"
-  ]
-  node [
-    id 3452
-    label "PikeCountyPA"
-    color "4"
-  ]
-  node [
-    id 3453
-    label "SubmitPro"
-    color "4"
-  ]
-  node [
-    id 3454
-    label "tango"
-    color "0"
-  ]
-  node [
-    id 3455
-    label "badasshub"
-    color "0"
-  ]
-  node [
-    id 3456
-    label "NepalNews"
-    color "4"
-  ]
-  node [
-    id 3457
-    label "UsInjins"
-    color "4"
-  ]
-  node [
-    id 3458
-    label "MillAvenue"
-    color "0"
-  ]
-  node [
-    id 3459
-    label "Designing_subreddits"
-    color "0"
-  ]
-  node [
-    id 3460
-    label "flatlanderjournal"
-    color "0"
-  ]
-  node [
-    id 3461
-    label "7mooode"
-    color "0"
-  ]
-  node [
-    id 3462
-    label "Cryptogon"
-    color "1"
-  ]
-  node [
-    id 3463
-    label "fortress"
-    color "4"
-  ]
-  node [
-    id 3464
-    label "black_metal"
-    color "4"
-  ]
-  node [
-    id 3465
-    label "Jazz"
-    color "1"
-  ]
-  node [
-    id 3466
-    label "Firnrg"
-    color "4"
-  ]
-  node [
-    id 3467
-    label "nanotech"
-    color "0"
-  ]
-  node [
-    id 3468
-    label "rosevictorreddit01"
-    color "0"
-  ]
-  node [
-    id 3469
-    label "amiga"
-    color "0"
-  ]
-  node [
-    id 3470
-    label "BigNoise"
-    color "4"
-  ]
-  node [
-    id 3471
-    label "ShirleyAtkinson"
-    color "0"
-  ]
-  node [
-    id 3472
-    label "Knowing"
-    color "4"
-  ]
-  node [
-    id 3473
-    label "OnlineDating"
-    color "0"
-  ]
-  node [
-    id 3474
-    label "tennismasters"
-    color "0"
-  ]
-  node [
-    id 3475
-    label "Kell"
-    color "4"
-  ]
-  node [
-    id 3476
-    label "Charity"
-    color "4"
-  ]
-  node [
-    id 3477
-    label "Games"
-    color "4"
-  ]
-  node [
-    id 3478
-    label "GlobalNews"
-    color "4"
-  ]
-  node [
-    id 3479
-    label "darkreddit"
-    color "0"
-  ]
-  node [
-    id 3480
-    label "language"
-    color "4"
-  ]
-  node [
-    id 3481
-    label "DjordjeZlatanovic"
-    color "4"
-  ]
-  node [
-    id 3482
-    label "hawk258"
-    color "4"
-  ]
-  node [
-    id 3483
-    label "AppEngine"
-    color "4"
-  ]
-  node [
-    id 3484
-    label "lightningrod"
-    color "0"
-  ]
-  node [
-    id 3485
-    label "mccainsgaffeoftheday"
-    color "0"
-  ]
-  node [
-    id 3486
-    label "Heavymetal"
-    color "0"
-  ]
-  node [
-    id 3487
-    label "QuickBooker"
-    color "4"
-  ]
-  node [
-    id 3488
-    label "azliensa"
-    color "4"
-  ]
-  node [
-    id 3489
-    label "iolanguage"
-    color "0"
-  ]
-  node [
-    id 3490
-    label "conservativenut"
-    color "0"
-  ]
-  node [
-    id 3491
-    label "tattoo"
-    color "4"
-  ]
-  node [
-    id 3492
-    label "jbrains"
-    color "4"
-  ]
-  node [
-    id 3493
-    label "death_metal"
-    color "0"
-  ]
-  node [
-    id 3494
-    label "Redants"
-    color "4"
-  ]
-  node [
-    id 3495
-    label "Minixr"
-    color "4"
-  ]
-  node [
-    id 3496
-    label "AlternativeHair"
-    color "4"
-  ]
-  node [
-    id 3497
-    label "SDOT4LIFE"
-    color "0"
-  ]
-  node [
-    id 3498
-    label "HouseMusic"
-    color "4"
-  ]
-  node [
-    id 3499
-    label "Charitable"
-    color "4"
-  ]
-  node [
-    id 3500
-    label "buskers"
-    color "0"
-  ]
-  node [
-    id 3501
-    label "seanmichael"
-    color "0"
-  ]
-  node [
-    id 3502
-    label "audai"
-    color "0"
-  ]
-  node [
-    id 3503
-    label "VoteUpIf"
-    color "4"
-  ]
-  node [
-    id 3504
-    label "GameTech"
-    color "0"
-  ]
-  node [
-    id 3505
-    label "splashsface"
-    color "4"
-  ]
-  node [
-    id 3506
-    label "coldfusion"
-    color "4"
-  ]
-  node [
-    id 3507
-    label "Crap"
-    color "0"
-  ]
-  node [
-    id 3508
-    label "AlternativeHistory"
-    color "0"
-  ]
-  node [
-    id 3509
-    label "djjroc"
-    color "4"
-  ]
-  node [
-    id 3510
-    label "ass"
-    color "8"
-  ]
-  node [
-    id 3511
-    label "restaurants"
-    color "4"
-  ]
-  node [
-    id 3512
-    label "bizarre"
-    color "0"
-  ]
-  node [
-    id 3513
-    label "Haknit"
-    color "0"
-  ]
-  node [
-    id 3514
-    label "shoe"
-    color "4"
-  ]
-  node [
-    id 3515
-    label "slashdot"
-    color "0"
-  ]
-  node [
-    id 3516
-    label "camerabattery"
-    color "4"
-  ]
-  node [
-    id 3517
-    label "outkast"
-    color "4"
-  ]
-  node [
-    id 3518
-    label "xfce"
-    color "4"
-  ]
-  node [
-    id 3519
-    label "cat"
-    color "4"
-  ]
-  node [
-    id 3520
-    label "pinchpenny"
-    color "4"
-  ]
-  node [
-    id 3521
-    label "reddit.com"
-    color "5"
-  ]
-  node [
-    id 3522
-    label "redditrevolution"
-    color "0"
-  ]
-  node [
-    id 3523
-    label "MemeMuseum"
-    color "0"
-  ]
-  node [
-    id 3524
-    label "mattraibert"
-    color "4"
-  ]
-  node [
-    id 3525
-    label "PoesLaw"
-    color "0"
-  ]
-  node [
-    id 3526
-    label "Pork"
-    color "0"
-  ]
-  node [
-    id 3527
-    label "morrissey"
-    color "4"
-  ]
-  node [
-    id 3528
-    label "Entrebloggers"
-    color "0"
-  ]
-  node [
-    id 3529
-    label "Clairepontino"
-    color "4"
-  ]
-  node [
-    id 3530
-    label "PYF"
-    color "4"
-  ]
-  node [
-    id 3531
-    label "functionallang"
-    color "0"
-  ]
-  node [
-    id 3532
-    label "Vipin"
-    color "0"
-  ]
-  node [
-    id 3533
-    label "Portland"
-    color "4"
-  ]
-  node [
-    id 3534
-    label "Sobhaneh"
-    color "0"
-  ]
-  node [
-    id 3535
-    label "fiction"
-    color "0"
-  ]
-  node [
-    id 3536
-    label "bears"
-    color "4"
-  ]
-  node [
-    id 3537
-    label "TnT"
-    color "4"
-  ]
-  node [
-    id 3538
-    label "Publicani"
-    color "4"
-  ]
-  node [
-    id 3539
-    label "KeysHappenings"
-    color "0"
-  ]
-  node [
-    id 3540
-    label "animalattacks"
-    color "4"
-  ]
-  node [
-    id 3541
-    label "JJKCrime"
-    color "0"
-  ]
-  node [
-    id 3542
-    label "sex"
-    color "5"
-  ]
-  node [
-    id 3543
-    label "todayilearned"
-    color "0"
-  ]
-  node [
-    id 3544
-    label "popper"
-    color "4"
-  ]
-  node [
-    id 3545
-    label "fukuro77"
-    color "0"
-  ]
-  node [
-    id 3546
-    label "hurribugs"
-    color "0"
-  ]
-  node [
-    id 3547
-    label "contests"
-    color "0"
-  ]
-  node [
-    id 3548
-    label "tennis"
-    color "4"
-  ]
-  node [
-    id 3549
-    label "kompassworld"
-    color "0"
-  ]
-  node [
-    id 3550
-    label "Beginnerpilot"
-    color "0"
-  ]
-  node [
-    id 3551
-    label "jobia"
-    color "0"
-  ]
-  node [
-    id 3552
-    label "PoplarGirl1"
-    color "4"
-  ]
-  node [
-    id 3553
-    label "GPSLLC"
-    color "0"
-  ]
-  node [
-    id 3554
-    label "DreamHomes"
-    color "0"
-  ]
-  node [
-    id 3555
-    label "mississippi"
-    color "0"
-  ]
-  node [
-    id 3556
-    label "connconcon"
-    color "4"
-  ]
-  node [
-    id 3557
-    label "PixelArt"
-    color "4"
-  ]
-  node [
-    id 3558
-    label "Authenticfashion"
-    color "4"
-  ]
-  node [
-    id 3559
-    label "Documentaries"
-    color "5"
-  ]
-  node [
-    id 3560
-    label "mattculbreth"
-    color "0"
-  ]
-  node [
-    id 3561
-    label "JimmyFallon"
-    color "4"
-  ]
-  node [
-    id 3562
-    label "migration"
-    color "4"
-  ]
-  node [
-    id 3563
-    label "employmentagencies"
-    color "0"
-  ]
-  node [
-    id 3564
-    label "talk"
-    color "0"
-  ]
-  node [
-    id 3565
-    label "sports"
-    color "5"
-  ]
-  node [
-    id 3566
-    label "Polska"
-    color "4"
-  ]
-  node [
-    id 3567
-    label "Survivalist"
-    color "0"
-  ]
-  node [
-    id 3568
-    label "BabesInBra"
-    color "4"
-  ]
-  node [
-    id 3569
-    label "whoa"
-    color "0"
-  ]
-  node [
-    id 3570
-    label "slowakei"
-    color "4"
-  ]
-  node [
-    id 3571
-    label "Ahken"
-    color "0"
-  ]
-  node [
-    id 3572
-    label "Futurism"
-    color "0"
-  ]
-  node [
-    id 3573
-    label "crybabies"
-    color "0"
-  ]
-  node [
-    id 3574
-    label "hundredstensunits"
-    color "4"
-  ]
-  node [
-    id 3575
-    label "Marrimiller"
-    color "4"
-  ]
-  node [
-    id 3576
-    label "poerty"
-    color "4"
-  ]
-  node [
-    id 3577
-    label "democracy"
-    color "4"
-  ]
-  node [
-    id 3578
-    label "web30"
-    color "4"
-  ]
-  node [
-    id 3579
-    label "bmx"
-    color "0"
-  ]
-  node [
-    id 3580
-    label "TheSpidedrWebSystem"
-    color "0"
-  ]
-  node [
-    id 3581
-    label "epicenterblog"
-    color "0"
-  ]
-  node [
-    id 3582
-    label "girlskissing"
-    color "4"
-  ]
-  node [
-    id 3583
-    label "Tees2Greens"
-    color "0"
-  ]
-  node [
-    id 3584
-    label "Programminginterests"
-    color "0"
-  ]
-  node [
-    id 3585
-    label "TechZulu"
-    color "4"
-  ]
-  node [
-    id 3586
-    label "RUI"
-    color "4"
-  ]
-  node [
-    id 3587
-    label "mertblog"
-    color "0"
-  ]
-  node [
-    id 3588
-    label "houseofsodom"
-    color "0"
-  ]
-  node [
-    id 3589
-    label "bernsteinslaw"
-    color "4"
-  ]
-  node [
-    id 3590
-    label "Knoxville"
-    color "4"
-  ]
-  node [
-    id 3591
-    label "GTA4"
-    color "4"
-  ]
-  node [
-    id 3592
-    label "LSD"
-    color "0"
-  ]
-  node [
-    id 3593
-    label "bicycles"
-    color "4"
-  ]
-  node [
-    id 3594
-    label "AntiHillary"
-    color "0"
-  ]
-  node [
-    id 3595
-    label "titox"
-    color "4"
-  ]
-  node [
-    id 3596
-    label "Warcraft"
-    color "4"
-  ]
-  node [
-    id 3597
-    label "otaku"
-    color "0"
-  ]
-  node [
-    id 3598
-    label "featurerequest"
-    color "0"
-  ]
-  node [
-    id 3599
-    label "Way2Send"
-    color "4"
-  ]
-  node [
-    id 3600
-    label "gaming"
-    color "5"
-  ]
-  node [
-    id 3601
-    label "phoenixarizona"
-    color "0"
-  ]
-  node [
-    id 3602
-    label "yahooanswers"
-    color "0"
-  ]
-  node [
-    id 3603
-    label "MusicLoft"
-    color "4"
-  ]
-  node [
-    id 3604
-    label "Nima"
-    color "0"
-  ]
-  node [
-    id 3605
-    label "tony"
-    color "4"
-  ]
-  node [
-    id 3606
-    label "xubuntu"
-    color "4"
-  ]
-  node [
-    id 3607
-    label "ARYA"
-    color "0"
-  ]
-  node [
-    id 3608
-    label "qualjobs"
-    color "0"
-  ]
-  node [
-    id 3609
-    label "Sudarshana"
-    color "0"
-  ]
-  node [
-    id 3610
-    label "puzzles"
-    color "4"
-  ]
-  node [
-    id 3611
-    label "NPR"
-    color "0"
-  ]
-  node [
-    id 3612
-    label "TinT"
-    color "4"
-  ]
-  node [
-    id 3613
-    label "GiftIdeas"
-    color "4"
-  ]
-  node [
-    id 3614
-    label "PersianToronto"
-    color "0"
-  ]
-  node [
-    id 3615
-    label "AnimalLiberation"
-    color "4"
-  ]
-  node [
-    id 3616
-    label "sustainability"
-    color "4"
-  ]
-  node [
-    id 3617
-    label "PuppiesWhoFightBears"
-    color "0"
-  ]
-  node [
-    id 3618
-    label "WaitWhat"
-    color "4"
-  ]
-  node [
-    id 3619
-    label "darwin"
-    color "4"
-  ]
-  node [
-    id 3620
-    label "austin8591"
-    color "0"
-  ]
-  node [
-    id 3621
-    label "shenzhen"
-    color "0"
-  ]
-  node [
-    id 3622
-    label "warpiggs"
-    color "4"
-  ]
-  node [
-    id 3623
-    label "slinger"
-    color "4"
-  ]
-  node [
-    id 3624
-    label "longtext"
-    color "4"
-  ]
-  node [
-    id 3625
-    label "vocabulary"
-    color "0"
-  ]
-  node [
-    id 3626
-    label "PinkNews"
-    color "0"
-  ]
-  node [
-    id 3627
-    label "xbmc"
-    color "4"
-  ]
-  node [
-    id 3628
-    label "Kesehatan"
-    color "0"
-  ]
-  node [
-    id 3629
-    label "Soambitious"
-    color "0"
-  ]
-  node [
-    id 3630
-    label "foradog"
-    color "0"
-  ]
-  node [
-    id 3631
-    label "GeekMyLove"
-    color "4"
-  ]
-  node [
-    id 3632
-    label "Mortgages"
-    color "4"
-  ]
-  node [
-    id 3633
-    label "SewerHorse"
-    color "5"
-  ]
-  node [
-    id 3634
-    label "rashme"
-    color "0"
-  ]
-  node [
-    id 3635
-    label "DominioDesign"
-    color "4"
-  ]
-  node [
-    id 3636
-    label "food"
-    color "5"
-  ]
-  node [
-    id 3637
-    label "olympics"
-    color "0"
-  ]
-  node [
-    id 3638
-    label "steampunk"
-    color "0"
-  ]
-  node [
-    id 3639
-    label "Dressupgurl"
-    color "0"
-  ]
-  node [
-    id 3640
-    label "pharma"
-    color "0"
-  ]
-  node [
-    id 3641
-    label "bugs"
-    color "5"
-  ]
-  node [
-    id 3642
-    label "obama"
-    color "5"
-  ]
-  node [
-    id 3643
-    label "C_Programming"
-    color "0"
-  ]
-  node [
-    id 3644
-    label "Brian01"
-    color "4"
-  ]
-  node [
-    id 3645
-    label "pua"
-    color "4"
-  ]
-  node [
-    id 3646
-    label "Claire"
-    color "0"
-  ]
-  node [
-    id 3647
-    label "CARTOON"
-    color "0"
-  ]
-  node [
-    id 3648
-    label "rem091"
-    color "0"
-  ]
-  node [
-    id 3649
-    label "apple89"
-    color "4"
-  ]
-  node [
-    id 3650
-    label "wealth"
-    color "4"
-  ]
-  node [
-    id 3651
-    label "obvious"
-    color "0"
-  ]
-  node [
-    id 3652
-    label "Wonderland"
-    color "0"
-  ]
-  node [
-    id 3653
-    label "SOF"
-    color "0"
-  ]
-  node [
-    id 3654
-    label "UsefulShit"
-    color "0"
-  ]
-  node [
-    id 3655
-    label "mechatronics"
-    color "4"
-  ]
-  node [
-    id 3656
-    label "interviewpuzzles"
-    color "0"
-  ]
-  node [
-    id 3657
-    label "shopingmania"
-    color "4"
-  ]
-  node [
-    id 3658
-    label "HomeBrewNews"
-    color "4"
-  ]
-  node [
-    id 3659
-    label "fuckFuck"
-    color "4"
-  ]
-  node [
-    id 3660
-    label "Educatedguess"
-    color "0"
-  ]
-  node [
-    id 3661
-    label "gay"
-    color "4"
-  ]
-  node [
-    id 3662
-    label "awk"
-    color "0"
-  ]
-  node [
-    id 3663
-    label "investing"
-    color "1"
-  ]
-  node [
-    id 3664
-    label "Objectivism"
-    color "0"
-  ]
-  node [
-    id 3665
-    label "NSCocoa"
-    color "4"
-  ]
-  node [
-    id 3666
-    label "Sexyf"
-    color "0"
-  ]
-  node [
-    id 3667
-    label "Voting"
-    color "0"
-  ]
-  node [
-    id 3668
-    label "asia"
-    color "4"
-  ]
-  node [
-    id 3669
-    label "nocrap"
-    color "4"
-  ]
-  node [
-    id 3670
-    label "recycled"
-    color "0"
-  ]
-  node [
-    id 3671
-    label "BintanLagoonResort"
-    color "4"
-  ]
-  node [
-    id 3672
-    label "Self_Defense_1"
-    color "4"
-  ]
-  node [
-    id 3673
-    label "CelebrityCaricatures"
-    color "0"
-  ]
-  node [
-    id 3674
-    label "interestingasfuck"
-    color "1"
-  ]
-  node [
-    id 3675
-    label "Baroque"
-    color "4"
-  ]
-  node [
-    id 3676
-    label "ChrisMerchant"
-    color "0"
-  ]
-  node [
-    id 3677
-    label "lovereddit"
-    color "5"
-  ]
-  node [
-    id 3678
-    label "vitaminsforhairloss"
-    color "0"
-  ]
-  node [
-    id 3679
-    label "myvideofight"
-    color "4"
-  ]
-  node [
-    id 3680
-    label "CarpetCleaning"
-    color "4"
-  ]
-  node [
-    id 3681
-    label "czech"
-    color "4"
-  ]
-  node [
-    id 3682
-    label "intelligent"
-    color "0"
-  ]
-  node [
-    id 3683
-    label "bork"
-    color "4"
-  ]
-  node [
-    id 3684
-    label "shqip"
-    color "0"
-  ]
-  node [
-    id 3685
-    label "TodaysNewsBlog"
-    color "0"
-  ]
-  node [
-    id 3686
-    label "engrish"
-    color "0"
-  ]
-  node [
-    id 3687
-    label "pinay"
-    color "0"
-  ]
-  node [
-    id 3688
-    label "Omorashi"
-    color "4"
-  ]
-  node [
-    id 3689
-    label "russian"
-    color "0"
-  ]
-  node [
-    id 3690
-    label "Ajohn"
-    color "0"
-  ]
-  node [
-    id 3691
-    label "astrology"
-    color "0"
-  ]
-  node [
-    id 3692
-    label "Coffee"
-    color "1"
-  ]
-  node [
-    id 3693
-    label "django"
-    color "4"
-  ]
-  node [
-    id 3694
-    label "late"
-    color "4"
-  ]
-  node [
-    id 3695
-    label "sportnographe"
-    color "4"
-  ]
-  node [
-    id 3696
-    label "Swarming"
-    color "4"
-  ]
-  node [
-    id 3697
-    label "types"
-    color "4"
-  ]
-  node [
-    id 3698
-    label "datacompression"
-    color "4"
-  ]
-  node [
-    id 3699
-    label "actuary"
-    color "0"
-  ]
-  node [
-    id 3700
-    label "binselman"
-    color "0"
-  ]
-  node [
-    id 3701
-    label "AsiaTalk"
-    color "0"
-  ]
-  node [
-    id 3702
-    label "creativitycentral"
-    color "0"
-  ]
-  node [
-    id 3703
-    label "bahai"
-    color "4"
-  ]
-  node [
-    id 3704
-    label "nightlife"
-    color "0"
-  ]
-  node [
-    id 3705
-    label "ObammunismWatch"
-    color "4"
-  ]
-  node [
-    id 3706
-    label "bots"
-    color "0"
-  ]
-  node [
-    id 3707
-    label "poppablues"
-    color "4"
-  ]
-  node [
-    id 3708
-    label "polydactyl"
-    color "4"
-  ]
-  node [
-    id 3709
-    label "DHgate"
-    color "0"
-  ]
-  node [
-    id 3710
-    label "Infos"
-    color "0"
-  ]
-  node [
-    id 3711
-    label "GreenEnergy"
-    color "4"
-  ]
-  node [
-    id 3712
-    label "InternetActivism"
-    color "0"
-  ]
-  node [
-    id 3713
-    label "Cybersquatting"
-    color "0"
-  ]
-  node [
-    id 3714
-    label "flowchart"
-    color "4"
-  ]
-  node [
-    id 3715
-    label "merecoincidence"
-    color "4"
-  ]
-  node [
-    id 3716
-    label "promos"
-    color "4"
-  ]
-  node [
-    id 3717
-    label "dynasty666"
-    color "4"
-  ]
-  node [
-    id 3718
-    label "redditfree2009"
-    color "0"
-  ]
-  node [
-    id 3719
-    label "Qualitydoor"
-    color "4"
-  ]
-  node [
-    id 3720
-    label "blueangel"
-    color "0"
-  ]
-  node [
-    id 3721
-    label "MediaServices"
-    color "4"
-  ]
-  node [
-    id 3722
-    label "tldr"
-    color "0"
-  ]
-  node [
-    id 3723
-    label "iaido"
-    color "4"
-  ]
-  node [
-    id 3724
-    label "hotel"
-    color "4"
-  ]
-  node [
-    id 3725
-    label "madG"
-    color "4"
-  ]
-  node [
-    id 3726
-    label "pie"
-    color "4"
-  ]
-  node [
-    id 3727
-    label "GGiPhone"
-    color "0"
-  ]
-  node [
-    id 3728
-    label "Autographs"
-    color "4"
-  ]
-  node [
-    id 3729
-    label "onemillion"
-    color "4"
-  ]
-  node [
-    id 3730
-    label "capetownnews"
-    color "4"
-  ]
-  node [
-    id 3731
-    label "Debate"
-    color "4"
-  ]
-  node [
-    id 3732
-    label "howardstern"
-    color "4"
-  ]
-  node [
-    id 3733
-    label "AspiringMarketer"
-    color "4"
-  ]
-  node [
-    id 3734
-    label "libattery"
-    color "4"
-  ]
-  node [
-    id 3735
-    label "nationwidepaintball"
-    color "4"
-  ]
-  node [
-    id 3736
-    label "fbl2"
-    color "4"
-  ]
-  node [
-    id 3737
-    label "askXKCD"
-    color "1"
-  ]
-  node [
-    id 3738
-    label "kayakotto"
-    color "0"
-  ]
-  node [
-    id 3739
-    label "gaurav"
-    color "0"
-  ]
-  node [
-    id 3740
-    label "IndependentBaseball"
-    color "0"
-  ]
-  node [
-    id 3741
-    label "hapaxlegomena"
-    color "4"
-  ]
-  node [
-    id 3742
-    label "BILD_com"
-    color "0"
-  ]
-  node [
-    id 3743
-    label "Shorpy"
-    color "0"
-  ]
-  node [
-    id 3744
-    label "docsmartz"
-    color "4"
-  ]
-  node [
-    id 3745
-    label "ScottishForums"
-    color "0"
-  ]
-  node [
-    id 3746
-    label "f4forex"
-    color "0"
-  ]
-  node [
-    id 3747
-    label "HeatherLutze"
-    color "0"
-  ]
-  node [
-    id 3748
-    label "bathroomfix11"
-    color "4"
-  ]
-  node [
-    id 3749
-    label "Gunners"
-    color "0"
-  ]
-  node [
-    id 3750
-    label "MONASTIC"
-    color "0"
-  ]
-  node [
-    id 3751
-    label "epilasyon"
-    color "0"
-  ]
-  node [
-    id 3752
-    label "meta"
-    color "1"
-  ]
-  node [
-    id 3753
-    label "StrangeUniverse"
-    color "4"
-  ]
-  node [
-    id 3754
-    label "opensourcescifi"
-    color "0"
-  ]
-  node [
-    id 3755
-    label "mentalhealth"
-    color "0"
-  ]
-  node [
-    id 3756
-    label "DickButt"
-    color "0"
-  ]
-  node [
-    id 3757
-    label "dvd"
-    color "4"
-  ]
-  node [
-    id 3758
-    label "mykittygifts"
-    color "4"
-  ]
-  node [
-    id 3759
-    label "Winworld"
-    color "0"
-  ]
-  node [
-    id 3760
-    label "yep"
-    color "0"
-  ]
-  node [
-    id 3761
-    label "sirichai"
-    color "0"
-  ]
-  node [
-    id 3762
-    label "til"
-    color "4"
-  ]
-  node [
-    id 3763
-    label "Zeeol"
-    color "0"
-  ]
-  node [
-    id 3764
-    label "thewayoftheweb"
-    color "4"
-  ]
-  node [
-    id 3765
-    label "confessions"
-    color "4"
-  ]
-  node [
-    id 3766
-    label "BDJobs"
-    color "0"
-  ]
-  node [
-    id 3767
-    label "Widgets"
-    color "0"
-  ]
-  node [
-    id 3768
-    label "EnAmerique"
-    color "0"
-  ]
-  node [
-    id 3769
-    label "TheRickyShow"
-    color "0"
-  ]
-  node [
-    id 3770
-    label "OhWord"
-    color "0"
-  ]
-  node [
-    id 3771
-    label "sexyfemale"
-    color "0"
-  ]
-  node [
-    id 3772
-    label "rails"
-    color "4"
-  ]
-  node [
-    id 3773
-    label "brasil"
-    color "1"
-  ]
-  node [
-    id 3774
-    label "thesingularity"
-    color "4"
-  ]
-  node [
-    id 3775
-    label "progressive"
-    color "4"
-  ]
-  node [
-    id 3776
-    label "girgor"
-    color "4"
-  ]
-  node [
-    id 3777
-    label "climateskeptics"
-    color "4"
-  ]
-  node [
-    id 3778
-    label "vfx"
-    color "4"
-  ]
-  node [
-    id 3779
-    label "security"
-    color "0"
-  ]
-  node [
-    id 3780
-    label "picdump"
-    color "4"
-  ]
-  node [
-    id 3781
-    label "openbsd"
-    color "4"
-  ]
-  node [
-    id 3782
-    label "calvinball"
-    color "4"
-  ]
-  node [
-    id 3783
-    label "SoundersFC"
-    color "0"
-  ]
-  node [
-    id 3784
-    label "beefgun"
-    color "4"
-  ]
-  node [
-    id 3785
-    label "italy"
-    color "6"
-  ]
-  node [
-    id 3786
-    label "Fyn"
-    color "0"
-  ]
-  node [
-    id 3787
-    label "nodoubt"
-    color "4"
-  ]
-  node [
-    id 3788
-    label "Exoplanetology"
-    color "0"
-  ]
-  node [
-    id 3789
-    label "Noospherism"
-    color "0"
-  ]
-  node [
-    id 3790
-    label "custombusinesscards"
-    color "4"
-  ]
-  node [
-    id 3791
-    label "secondlife"
-    color "4"
-  ]
-  node [
-    id 3792
-    label "Asbestos"
-    color "4"
-  ]
-  node [
-    id 3793
-    label "VAD"
-    color "4"
-  ]
-  node [
-    id 3794
-    label "Sherewizki"
-    color "0"
-  ]
-  node [
-    id 3795
-    label "vlogging"
-    color "4"
-  ]
-  node [
-    id 3796
-    label "YouPublish"
-    color "4"
-  ]
-  node [
-    id 3797
-    label "mufeedaanees1"
-    color "0"
-  ]
-  node [
-    id 3798
-    label "DearReddit"
-    color "4"
-  ]
-  node [
-    id 3799
-    label "Gopi"
-    color "0"
-  ]
-  node [
-    id 3800
-    label "yoyo"
-    color "4"
-  ]
-  node [
-    id 3801
-    label "skytourbeau"
-    color "4"
-  ]
-  node [
-    id 3802
-    label "solutions"
-    color "0"
-  ]
-  node [
-    id 3803
-    label "Egypt"
-    color "0"
-  ]
-  node [
-    id 3804
-    label "Michigan"
-    color "4"
-  ]
-  node [
-    id 3805
-    label "1_Irritated_Mother"
-    color "0"
-  ]
-  node [
-    id 3806
-    label "access"
-    color "4"
-  ]
-  node [
-    id 3807
-    label "cyberactivism"
-    color "0"
-  ]
-  node [
-    id 3808
-    label "martin"
-    color "4"
-  ]
-  node [
-    id 3809
-    label "sad"
-    color "4"
-  ]
-  node [
-    id 3810
-    label "askgod"
-    color "4"
-  ]
-  node [
-    id 3811
-    label "SUBZEROLOSANGELES"
-    color "0"
-  ]
-  node [
-    id 3812
-    label "work"
-    color "0"
-  ]
-  node [
-    id 3813
-    label "AegonReligare"
-    color "0"
-  ]
-  node [
-    id 3814
-    label "petshop"
-    color "0"
-  ]
-  node [
-    id 3815
-    label "brondo"
-    color "0"
-  ]
-  node [
-    id 3816
-    label "redditanonoymous"
-    color "0"
-  ]
-  node [
-    id 3817
-    label "karlitox"
-    color "0"
-  ]
-  node [
-    id 3818
-    label "myshill3"
-    color "4"
-  ]
-  node [
-    id 3819
-    label "stupid"
-    color "0"
-  ]
-  node [
-    id 3820
-    label "aklunder72"
-    color "4"
-  ]
-  node [
-    id 3821
-    label "Blind"
-    color "0"
-  ]
-  node [
-    id 3822
-    label "soundbites"
-    color "0"
-  ]
-  node [
-    id 3823
-    label "scrum"
-    color "0"
-  ]
-  node [
-    id 3824
-    label "search9"
-    color "0"
-  ]
-  node [
-    id 3825
-    label "soulmate"
-    color "0"
-  ]
-  node [
-    id 3826
-    label "777gambling"
-    color "4"
-  ]
-  node [
-    id 3827
-    label "Lemonchavs"
-    color "4"
-  ]
-  node [
-    id 3828
-    label "Chuams"
-    color "0"
-  ]
-  node [
-    id 3829
-    label "viet"
-    color "0"
-  ]
-  node [
-    id 3830
-    label "Janet"
-    color "0"
-  ]
-  node [
-    id 3831
-    label "cyoadventure"
-    color "4"
-  ]
-  node [
-    id 3832
-    label "Web_Analytics"
-    color "0"
-  ]
-  node [
-    id 3833
-    label "salakedan"
-    color "0"
-  ]
-  node [
-    id 3834
-    label "HarvardElection08"
-    color "4"
-  ]
-  node [
-    id 3835
-    label "arabicblogs"
-    color "4"
-  ]
-  node [
-    id 3836
-    label "unlawflcombatnt"
-    color "4"
-  ]
-  node [
-    id 3837
-    label "adnerds"
-    color "0"
-  ]
-  node [
-    id 3838
-    label "zine"
-    color "4"
-  ]
-  node [
-    id 3839
-    label "thebigbadwolf"
-    color "4"
-  ]
-  node [
-    id 3840
-    label "LinuxTutorials"
-    color "4"
-  ]
-  node [
-    id 3841
-    label "lifestyle"
-    color "0"
-  ]
-  node [
-    id 3842
-    label "LDbidz"
-    color "4"
-  ]
-  node [
-    id 3843
-    label "masangiklan"
-    color "4"
-  ]
-  node [
-    id 3844
-    label "mexico"
-    color "4"
-  ]
-  node [
-    id 3845
-    label "BestApparel"
-    color "4"
-  ]
-  node [
-    id 3846
-    label "Blinds2go"
-    color "4"
-  ]
-  node [
-    id 3847
-    label "celebrities"
-    color "5"
-  ]
-  node [
-    id 3848
-    label "Roofio81"
-    color "0"
-  ]
-  node [
-    id 3849
-    label "deutschland"
-    color "7"
-  ]
-  node [
-    id 3850
-    label "projecth3o"
-    color "0"
-  ]
-  node [
-    id 3851
-    label "MediaBias"
-    color "0"
-  ]
-  node [
-    id 3852
-    label "engineering"
-    color "4"
-  ]
-  node [
-    id 3853
-    label "StreetFighter"
-    color "4"
-  ]
-  node [
-    id 3854
-    label "monkeys"
-    color "0"
-  ]
-  node [
-    id 3855
-    label "D_programming"
-    color "4"
-  ]
-  node [
-    id 3856
-    label "religiousdebate"
-    color "1"
-  ]
-  node [
-    id 3857
-    label "Hillary"
-    color "0"
-  ]
-  node [
-    id 3858
-    label "Subzero"
-    color "4"
-  ]
-  node [
-    id 3859
-    label "Austria"
-    color "4"
-  ]
-  node [
-    id 3860
-    label "scientology"
-    color "5"
-  ]
-  node [
-    id 3861
-    label "Ubuntu"
-    color "5"
-  ]
-  node [
-    id 3862
-    label "youtubetester"
-    color "4"
-  ]
-  node [
-    id 3863
-    label "nader"
-    color "4"
-  ]
-  node [
-    id 3864
-    label "e2mars"
-    color "4"
-  ]
-  node [
-    id 3865
-    label "Sleeptreatment"
-    color "0"
-  ]
-  node [
-    id 3866
-    label "surf"
-    color "0"
-  ]
-  node [
-    id 3867
-    label "introduce"
-    color "0"
-  ]
-  node [
-    id 3868
-    label "ChristianPrayer"
-    color "4"
-  ]
-  node [
-    id 3869
-    label "BearlyaSubreddit"
-    color "4"
-  ]
-  node [
-    id 3870
-    label "productreview"
-    color "0"
-  ]
-  node [
-    id 3871
-    label "test"
-    color "0"
-  ]
-  node [
-    id 3872
-    label "giveaways"
-    color "5"
-  ]
-  node [
-    id 3873
-    label "sadao"
-    color "4"
-  ]
-  node [
-    id 3874
-    label "fuck"
-    color "0"
-  ]
-  node [
-    id 3875
-    label "Mosaic_Interactive"
-    color "0"
-  ]
-  node [
-    id 3876
-    label "bookclub"
-    color "5"
-  ]
-  node [
-    id 3877
-    label "idea"
-    color "5"
-  ]
-  node [
-    id 3878
-    label "Khao_Lak_Thailand"
-    color "0"
-  ]
-  node [
-    id 3879
-    label "Phonecasting"
-    color "0"
-  ]
-  node [
-    id 3880
-    label "theantirobot"
-    color "4"
-  ]
-  node [
-    id 3881
-    label "Madness"
-    color "0"
-  ]
-  node [
-    id 3882
-    label "PristineMerchandise"
-    color "4"
-  ]
-  node [
-    id 3883
-    label "encryption"
-    color "0"
-  ]
-  node [
-    id 3884
-    label "nature"
-    color "5"
-  ]
-  node [
-    id 3885
-    label "Risk"
-    color "4"
-  ]
-  node [
-    id 3886
-    label "SingaporeMarketing"
-    color "0"
-  ]
-  node [
-    id 3887
-    label "hairmetal"
-    color "0"
-  ]
-  node [
-    id 3888
-    label "SignPetitions"
-    color "0"
-  ]
-  node [
-    id 3889
-    label "STFU"
-    color "4"
-  ]
-  node [
-    id 3890
-    label "Pink"
-    color "4"
-  ]
-  node [
-    id 3891
-    label "BRAAAAINS"
-    color "4"
-  ]
-  node [
-    id 3892
-    label "sick"
-    color "0"
-  ]
-  node [
-    id 3893
-    label "ServerSupport"
-    color "0"
-  ]
-  node [
-    id 3894
-    label "eupolitics"
-    color "0"
-  ]
-  node [
-    id 3895
-    label "RivieraNayarit"
-    color "4"
-  ]
-  node [
-    id 3896
-    label "Sporn"
-    color "0"
-  ]
-  node [
-    id 3897
-    label "pbwiki"
-    color "0"
-  ]
-  node [
-    id 3898
-    label "parapsych"
-    color "4"
-  ]
-  node [
-    id 3899
-    label "transformers"
-    color "4"
-  ]
-  node [
-    id 3900
-    label "Deineip"
-    color "4"
-  ]
-  node [
-    id 3901
-    label "urbanexploration"
-    color "4"
-  ]
-  node [
-    id 3902
-    label "2600"
-    color "0"
-  ]
-  node [
-    id 3903
-    label "HPC"
-    color "4"
-  ]
-  node [
-    id 3904
-    label "texas"
-    color "0"
-  ]
-  node [
-    id 3905
-    label "cfcamerica"
-    color "4"
-  ]
-  node [
-    id 3906
-    label "bitch"
-    color "0"
-  ]
-  node [
-    id 3907
-    label "genetic_algorithms"
-    color "4"
-  ]
-  node [
-    id 3908
-    label "SEC"
-    color "4"
-  ]
-  node [
-    id 3909
-    label "Gail"
-    color "4"
-  ]
-  node [
-    id 3910
-    label "HealthInsurance"
-    color "0"
-  ]
-  node [
-    id 3911
-    label "joos"
-    color "4"
-  ]
-  node [
-    id 3912
-    label "Indeye"
-    color "0"
-  ]
-  node [
-    id 3913
-    label "survivalism"
-    color "0"
-  ]
-  node [
-    id 3914
-    label "chinaacrylicbeads"
-    color "0"
-  ]
-  node [
-    id 3915
-    label "INTELLECTUALPROPERTY"
-    color "0"
-  ]
-  node [
-    id 3916
-    label "drburn"
-    color "4"
-  ]
-  node [
-    id 3917
-    label "bestof"
-    color "5"
-  ]
-  node [
-    id 3918
-    label "WebInfoList"
-    color "0"
-  ]
-  node [
-    id 3919
-    label "myst"
-    color "0"
-  ]
-  node [
-    id 3920
-    label "CaseMate"
-    color "0"
-  ]
-  node [
-    id 3921
-    label "LifeHacker"
-    color "0"
-  ]
-  node [
-    id 3922
-    label "videomakers"
-    color "4"
-  ]
-  node [
-    id 3923
-    label "HealthcareErrors"
-    color "0"
-  ]
-  node [
-    id 3924
-    label "invasion"
-    color "4"
-  ]
-  node [
-    id 3925
-    label "Who"
-    color "4"
-  ]
-  node [
-    id 3926
-    label "arbejdsglaede"
-    color "4"
-  ]
-  node [
-    id 3927
-    label "mente_mecanica"
-    color "0"
-  ]
-  node [
-    id 3928
-    label "nick"
-    color "4"
-  ]
-  node [
-    id 3929
-    label "floss"
-    color "4"
-  ]
-  node [
-    id 3930
-    label "BlogVibrations"
-    color "4"
-  ]
-  node [
-    id 3931
-    label "modula3"
-    color "4"
-  ]
-  node [
-    id 3932
-    label "PCHhumor"
-    color "4"
-  ]
-  node [
-    id 3933
-    label "awesomereddit"
-    color "4"
-  ]
-  node [
-    id 3934
-    label "Gifts"
-    color "0"
-  ]
-  node [
-    id 3935
-    label "Animals"
-    color "5"
-  ]
-  node [
-    id 3936
-    label "deandrown"
-    color "4"
-  ]
-  node [
-    id 3937
-    label "hardware"
-    color "0"
-  ]
-  node [
-    id 3938
-    label "sawwit"
-    color "4"
-  ]
-  node [
-    id 3939
-    label "Chloetay"
-    color "0"
-  ]
-  node [
-    id 3940
-    label "RWM"
-    color "0"
-  ]
-  node [
-    id 3941
-    label "leagueofnonvoters"
-    color "4"
-  ]
-  node [
-    id 3942
-    label "xprogramming"
-    color "4"
-  ]
-  node [
-    id 3943
-    label "chachadeals"
-    color "0"
-  ]
-  node [
-    id 3944
-    label "cncrk"
-    color "4"
-  ]
-  node [
-    id 3945
-    label "Armoloy"
-    color "4"
-  ]
-  node [
-    id 3946
-    label "LoanModification"
-    color "0"
-  ]
-  node [
-    id 3947
-    label "pupunk"
-    color "4"
-  ]
-  node [
-    id 3948
-    label "Tabs"
-    color "4"
-  ]
-  node [
-    id 3949
-    label "ipostme"
-    color "4"
-  ]
-  node [
-    id 3950
-    label "Zensurf"
-    color "0"
-  ]
-  node [
-    id 3951
-    label "emerfv"
-    color "0"
-  ]
-  node [
-    id 3952
-    label "Boobies"
-    color "1"
-  ]
-  node [
-    id 3953
-    label "Jurors"
-    color "0"
-  ]
-  node [
-    id 3954
-    label "worldpolitics"
-    color "5"
-  ]
-  node [
-    id 3955
-    label "baseballcard"
-    color "4"
-  ]
-  node [
-    id 3956
-    label "islam"
-    color "5"
-  ]
-  node [
-    id 3957
-    label "douchebag"
-    color "0"
-  ]
-  node [
-    id 3958
-    label "reference"
-    color "0"
-  ]
-  node [
-    id 3959
-    label "daily"
-    color "0"
-  ]
-  node [
-    id 3960
-    label "DailyShow"
-    color "0"
-  ]
-  node [
-    id 3961
-    label "RedditComplaints"
-    color "4"
-  ]
-  node [
-    id 3962
-    label "web_design"
-    color "5"
-  ]
-  node [
-    id 3963
-    label "Posters"
-    color "4"
-  ]
-  node [
-    id 3964
-    label "MathComics"
-    color "4"
-  ]
-  node [
-    id 3965
-    label "Turkiye"
-    color "4"
-  ]
-  node [
-    id 3966
-    label "playthecrowd"
-    color "0"
-  ]
-  node [
-    id 3967
-    label "livesex"
-    color "4"
-  ]
-  node [
-    id 3968
-    label "india"
-    color "5"
-  ]
-  node [
-    id 3969
-    label "socialmediastuff"
-    color "4"
-  ]
-  node [
-    id 3970
-    label "ocaml"
-    color "4"
-  ]
-  node [
-    id 3971
-    label "radiocontrol"
-    color "0"
-  ]
-  node [
-    id 3972
-    label "ByTheStreet"
-    color "4"
-  ]
-  node [
-    id 3973
-    label "comic"
-    color "0"
-  ]
-  node [
-    id 3974
-    label "anonymous"
-    color "0"
-  ]
-  node [
-    id 3975
-    label "newcapitalclub"
-    color "4"
-  ]
-  node [
-    id 3976
-    label "geostuff"
-    color "0"
-  ]
-  node [
-    id 3977
-    label "homeschool"
-    color "4"
-  ]
-  node [
-    id 3978
-    label "bestshoes"
-    color "4"
-  ]
-  node [
-    id 3979
-    label "FlowerWindowBoxes"
-    color "4"
-  ]
-  node [
-    id 3980
-    label "JHaHa"
-    color "4"
-  ]
-  node [
-    id 3981
-    label "Payday"
-    color "0"
-  ]
-  node [
-    id 3982
-    label "triathlon"
-    color "0"
-  ]
-  node [
-    id 3983
-    label "SadNews"
-    color "0"
-  ]
-  node [
-    id 3984
-    label "RacistReddit"
-    color "0"
-  ]
-  node [
-    id 3985
-    label "blogs"
-    color "5"
-  ]
-  node [
-    id 3986
-    label "Punkrockin"
-    color "4"
-  ]
-  node [
-    id 3987
-    label "YomiuriGiants"
-    color "0"
-  ]
-  node [
-    id 3988
-    label "designerly"
-    color "0"
-  ]
-  node [
-    id 3989
-    label "ryerson"
-    color "4"
-  ]
-  node [
-    id 3990
-    label "HotPads"
-    color "0"
-  ]
-  node [
-    id 3991
-    label "slackware"
-    color "0"
-  ]
-  node [
-    id 3992
-    label "NileshRathi"
-    color "0"
-  ]
-  node [
-    id 3993
-    label "geek"
-    color "5"
-  ]
-  node [
-    id 3994
-    label "CFL"
-    color "4"
-  ]
-  node [
-    id 3995
-    label "kogoa"
-    color "0"
-  ]
-  node [
-    id 3996
-    label "pennystocks"
-    color "0"
-  ]
-  node [
-    id 3997
-    label "chwakcha"
-    color "4"
-  ]
-  node [
-    id 3998
-    label "causes"
-    color "0"
-  ]
-  node [
-    id 3999
-    label "lexlinguae"
-    color "4"
-  ]
-  node [
-    id 4000
-    label "greece"
-    color "0"
-  ]
-  node [
-    id 4001
-    label "onejerusalem"
-    color "0"
-  ]
-  node [
-    id 4002
-    label "tamil"
-    color "0"
-  ]
-  node [
-    id 4003
-    label "computerscience"
-    color "0"
-  ]
-  node [
-    id 4004
-    label "geovanimartinez"
-    color "0"
-  ]
-  node [
-    id 4005
-    label "overmoderated"
-    color "4"
-  ]
-  node [
-    id 4006
-    label "industry"
-    color "0"
-  ]
-  node [
-    id 4007
-    label "england"
-    color "5"
-  ]
-  node [
-    id 4008
-    label "nightbloom"
-    color "4"
-  ]
-  node [
-    id 4009
-    label "parent"
-    color "0"
-  ]
-  node [
-    id 4010
-    label "java_webframeworks"
-    color "0"
-  ]
-  node [
-    id 4011
-    label "Miami"
-    color "0"
-  ]
-  node [
-    id 4012
-    label "newsfusion"
-    color "0"
-  ]
-  node [
-    id 4013
-    label "Joe_zhang"
-    color "4"
-  ]
-  node [
-    id 4014
-    label "CliveRichards"
-    color "0"
-  ]
-  node [
-    id 4015
-    label "albino"
-    color "4"
-  ]
-  node [
-    id 4016
-    label "ntoLabs"
-    color "4"
-  ]
-  node [
-    id 4017
-    label "TheBeautyAcademy"
-    color "4"
-  ]
-  node [
-    id 4018
-    label "hugs"
-    color "4"
-  ]
-  node [
-    id 4019
-    label "naturism"
-    color "0"
-  ]
-  node [
-    id 4020
-    label "CampingandHiking"
-    color "0"
-  ]
-  node [
-    id 4021
-    label "interviews"
-    color "0"
-  ]
-  node [
-    id 4022
-    label "Scribd"
-    color "4"
-  ]
-  node [
-    id 4023
-    label "mytestreddittwo"
-    color "4"
-  ]
-  node [
-    id 4024
-    label "awsomemusic"
-    color "4"
-  ]
-  node [
-    id 4025
-    label "dancemusik"
-    color "4"
-  ]
-  node [
-    id 4026
-    label "p41n"
-    color "4"
-  ]
-  node [
-    id 4027
-    label "ideas"
-    color "5"
-  ]
-  node [
-    id 4028
-    label "signofthefox"
-    color "4"
-  ]
-  node [
-    id 4029
-    label "WeAreStillinBeta"
-    color "4"
-  ]
-  node [
-    id 4030
-    label "sem"
-    color "0"
-  ]
-  node [
-    id 4031
-    label "trailers"
-    color "0"
-  ]
-  node [
-    id 4032
-    label "Weird_Science"
-    color "4"
-  ]
-  node [
-    id 4033
-    label "Interior"
-    color "0"
-  ]
-  node [
-    id 4034
-    label "redheads"
-    color "4"
-  ]
-  node [
-    id 4035
-    label "Omaha"
-    color "0"
-  ]
-  node [
-    id 4036
-    label "oracle"
-    color "4"
-  ]
-  node [
-    id 4037
-    label "tonutest"
-    color "4"
-  ]
-  node [
-    id 4038
-    label "librarians"
-    color "4"
-  ]
-  node [
-    id 4039
-    label "straightedge"
-    color "4"
-  ]
-  node [
-    id 4040
-    label "beer"
-    color "5"
-  ]
-  node [
-    id 4041
-    label "albachtimi"
-    color "0"
-  ]
-  node [
-    id 4042
-    label "Hot_Babes"
-    color "0"
-  ]
-  node [
-    id 4043
-    label "nfsw"
-    color "0"
-  ]
-  node [
-    id 4044
-    label "Shedworking"
-    color "4"
-  ]
-  node [
-    id 4045
-    label "secularism"
-    color "0"
-  ]
-  node [
-    id 4046
-    label "Impeachment"
-    color "0"
-  ]
-  node [
-    id 4047
-    label "jltff"
-    color "4"
-  ]
-  node [
-    id 4048
-    label "HOUMAN"
-    color "4"
-  ]
-  node [
-    id 4049
-    label "sales"
-    color "0"
-  ]
-  node [
-    id 4050
-    label "techoops"
-    color "0"
-  ]
-  node [
-    id 4051
-    label "worldnews"
-    color "5"
-  ]
-  node [
-    id 4052
-    label "merealty"
-    color "0"
-  ]
-  node [
-    id 4053
-    label "Headlines"
-    color "4"
-  ]
-  node [
-    id 4054
-    label "running"
-    color "4"
-  ]
-  node [
-    id 4055
-    label "ryanbulmer"
-    color "4"
-  ]
-  node [
-    id 4056
-    label "Spirits"
-    color "0"
-  ]
-  node [
-    id 4057
-    label "Everton"
-    color "4"
-  ]
-  node [
-    id 4058
-    label "kidsfacepainting"
-    color "4"
-  ]
-  node [
-    id 4059
-    label "freebooks"
-    color "4"
-  ]
-  node [
-    id 4060
-    label "Demolition"
-    color "0"
-  ]
-  node [
-    id 4061
-    label "Ibollywoodvideos"
-    color "0"
-  ]
-  node [
-    id 4062
-    label "gender"
-    color "0"
-  ]
-  node [
-    id 4063
-    label "celebnsfw"
-    color "0"
-  ]
-  node [
-    id 4064
-    label "RooR"
-    color "0"
-  ]
-  node [
-    id 4065
-    label "ambusha"
-    color "0"
-  ]
-  node [
-    id 4066
-    label "notreallynews"
-    color "4"
-  ]
-  node [
-    id 4067
-    label "3ren"
-    color "0"
-  ]
-  node [
-    id 4068
-    label "lifehacks"
-    color "4"
-  ]
-  node [
-    id 4069
-    label "Denver"
-    color "4"
-  ]
-  node [
-    id 4070
-    label "dpolly"
-    color "4"
-  ]
-  node [
-    id 4071
-    label "RedditTakesAction"
-    color "4"
-  ]
-  node [
-    id 4072
-    label "tedtalks"
-    color "4"
-  ]
-  node [
-    id 4073
-    label "dico"
-    color "4"
-  ]
-  node [
-    id 4074
-    label "baltimorednd"
-    color "4"
-  ]
-  node [
-    id 4075
-    label "J2EE"
-    color "4"
-  ]
-  node [
-    id 4076
-    label "Datingsites"
-    color "0"
-  ]
-  node [
-    id 4077
-    label "debian"
-    color "4"
-  ]
-  node [
-    id 4078
-    label "Enlighten"
-    color "4"
-  ]
-  node [
-    id 4079
-    label "Cisco"
-    color "0"
-  ]
-  node [
-    id 4080
-    label "lechna"
-    color "4"
-  ]
-  node [
-    id 4081
-    label "softwaredevelopment"
-    color "1"
-  ]
-  node [
-    id 4082
-    label "dilbert"
-    color "4"
-  ]
-  node [
-    id 4083
-    label "TopPosition"
-    color "0"
-  ]
-  node [
-    id 4084
-    label "orkut"
-    color "0"
-  ]
-  node [
-    id 4085
-    label "SouthAfricanTravel"
-    color "0"
-  ]
-  node [
-    id 4086
-    label "Ferrari"
-    color "0"
-  ]
-  node [
-    id 4087
-    label "OurChinese"
-    color "4"
-  ]
-  node [
-    id 4088
-    label "Powerplay"
-    color "4"
-  ]
-  node [
-    id 4089
-    label "BLESSIE"
-    color "4"
-  ]
-  node [
-    id 4090
-    label "footballcupleague"
-    color "4"
-  ]
-  node [
-    id 4091
-    label "Owls"
-    color "4"
-  ]
-  node [
-    id 4092
-    label "mobwisdom"
-    color "0"
-  ]
-  node [
-    id 4093
-    label "SugarCoatings"
-    color "0"
-  ]
-  node [
-    id 4094
-    label "diplomacy"
-    color "4"
-  ]
-  node [
-    id 4095
-    label "flashlights"
-    color "0"
-  ]
-  node [
-    id 4096
-    label "balkanpolitics"
-    color "4"
-  ]
-  node [
-    id 4097
-    label "PropertyLawyer"
-    color "4"
-  ]
-  node [
-    id 4098
-    label "ukpolitics"
-    color "5"
-  ]
-  node [
-    id 4099
-    label "ariyes"
-    color "0"
-  ]
-  node [
-    id 4100
-    label "architecture"
-    color "1"
-  ]
-  node [
-    id 4101
-    label "sgportal"
-    color "0"
-  ]
-  node [
-    id 4102
-    label "Cubicleddit"
-    color "0"
-  ]
-  node [
-    id 4103
-    label "TENTRACKS"
-    color "0"
-  ]
-  node [
-    id 4104
-    label "deaf"
-    color "4"
-  ]
-  node [
-    id 4105
-    label "Viamedic"
-    color "4"
-  ]
-  node [
-    id 4106
-    label "foreignpolicy"
-    color "4"
-  ]
-  node [
-    id 4107
-    label "stacktrace"
-    color "4"
-  ]
-  node [
-    id 4108
-    label "puzzlegames"
-    color "4"
-  ]
-  node [
-    id 4109
-    label "Marius93"
-    color "0"
-  ]
-  node [
-    id 4110
-    label "NYPolitics"
-    color "0"
-  ]
-  node [
-    id 4111
-    label "Xnews"
-    color "4"
-  ]
-  node [
-    id 4112
-    label "milf"
-    color "0"
-  ]
-  node [
-    id 4113
-    label "HeyShae"
-    color "4"
-  ]
-  node [
-    id 4114
-    label "CoolCars"
-    color "0"
-  ]
-  node [
-    id 4115
-    label "pakistan"
-    color "4"
-  ]
-  node [
-    id 4116
-    label "mndoci"
-    color "4"
-  ]
-  node [
-    id 4117
-    label "SavedComments"
-    color "4"
-  ]
-  node [
-    id 4118
-    label "mixtape"
-    color "4"
-  ]
-  node [
-    id 4119
-    label "CLVideos"
-    color "0"
-  ]
-  node [
-    id 4120
-    label "startup"
-    color "0"
-  ]
-  node [
-    id 4121
-    label "Taringames"
-    color "0"
-  ]
-  node [
-    id 4122
-    label "apod"
-    color "0"
-  ]
-  node [
-    id 4123
-    label "Victoria"
-    color "4"
-  ]
-  node [
-    id 4124
-    label "orsiko"
-    color "0"
-  ]
-  node [
-    id 4125
-    label "wood"
-    color "4"
-  ]
-  node [
-    id 4126
-    label "Addicted2Salsa"
-    color "4"
-  ]
-  node [
-    id 4127
-    label "srpski"
-    color "4"
-  ]
-  node [
-    id 4128
-    label "radiofreereddit"
-    color "4"
-  ]
-  node [
-    id 4129
-    label "electroraggahiphop"
-    color "4"
-  ]
-  node [
-    id 4130
-    label "relationships"
-    color "4"
-  ]
-  node [
-    id 4131
-    label "SexToys"
-    color "0"
-  ]
-  node [
-    id 4132
-    label "BitterVotersforObama"
-    color "0"
-  ]
-  node [
-    id 4133
-    label "PoliticalPhilosophy"
-    color "0"
-  ]
-  node [
-    id 4134
-    label "FootballCentral"
-    color "0"
-  ]
-  node [
-    id 4135
-    label "guitartuts"
-    color "4"
-  ]
-  node [
-    id 4136
-    label "inconcievable"
-    color "0"
-  ]
-  node [
-    id 4137
-    label "reggae"
-    color "0"
-  ]
-  node [
-    id 4138
-    label "responsetoemail"
-    color "4"
-  ]
-  node [
-    id 4139
-    label "horror"
-    color "4"
-  ]
-  node [
-    id 4140
-    label "tokiohotelamerica"
-    color "4"
-  ]
-  node [
-    id 4141
-    label "HealthAndFitness"
-    color "0"
-  ]
-  node [
-    id 4142
-    label "BlogIndians"
-    color "0"
-  ]
-  node [
-    id 4143
-    label "bayarea"
-    color "0"
-  ]
-  node [
-    id 4144
-    label "xna"
-    color "4"
-  ]
-  node [
-    id 4145
-    label "aikido"
-    color "4"
-  ]
-  node [
-    id 4146
-    label "EstwingTools"
-    color "4"
-  ]
-  node [
-    id 4147
-    label "nsedreams"
-    color "4"
-  ]
-  node [
-    id 4148
-    label "YankeeFlipperFeeder"
-    color "0"
-  ]
-  node [
-    id 4149
-    label "aurismarketing"
-    color "4"
-  ]
-  node [
-    id 4150
-    label "TellReddit"
-    color "4"
-  ]
-  node [
-    id 4151
-    label "IntelligentVideos"
-    color "0"
-  ]
-  node [
-    id 4152
-    label "japan"
-    color "5"
-  ]
-  node [
-    id 4153
-    label "rubybr"
-    color "4"
-  ]
-  node [
-    id 4154
-    label "Marijuana"
-    color "5"
-  ]
-  node [
-    id 4155
-    label "Oliviaryan"
-    color "4"
-  ]
-  node [
-    id 4156
-    label "dwhost"
-    color "0"
-  ]
-  node [
-    id 4157
-    label "CarteBlanche"
-    color "4"
-  ]
-  node [
-    id 4158
-    label "EmbracetheChaos"
-    color "4"
-  ]
-  node [
-    id 4159
-    label "agnostic"
-    color "4"
-  ]
-  node [
-    id 4160
-    label "education"
-    color "5"
-  ]
-  node [
-    id 4161
-    label "nrl"
-    color "0"
-  ]
-  node [
-    id 4162
-    label "guns"
-    color "5"
-  ]
-  node [
-    id 4163
-    label "cakephp"
-    color "0"
-  ]
-  node [
-    id 4164
-    label "facebook"
-    color "0"
-  ]
-  node [
-    id 4165
-    label "mysafetysign"
-    color "0"
-  ]
-  node [
-    id 4166
-    label "campusvideos"
-    color "4"
-  ]
-  node [
-    id 4167
-    label "luisalonsoja"
-    color "4"
-  ]
-  node [
-    id 4168
-    label "Paunchiness"
-    color "4"
-  ]
-  node [
-    id 4169
-    label "wayne79au"
-    color "4"
-  ]
-  node [
-    id 4170
-    label "Cufflinks"
-    color "4"
-  ]
-  node [
-    id 4171
-    label "experiment1"
-    color "0"
-  ]
-  node [
-    id 4172
-    label "TeamFortress2"
-    color "0"
-  ]
-  node [
-    id 4173
-    label "angry"
-    color "4"
-  ]
-  node [
-    id 4174
-    label "npr_test"
-    color "0"
-  ]
-  node [
-    id 4175
-    label "Brandsaloon"
-    color "4"
-  ]
-  node [
-    id 4176
-    label "Nurse_dot_com"
-    color "0"
-  ]
-  node [
-    id 4177
-    label "genetics"
-    color "4"
-  ]
-  node [
-    id 4178
-    label "marcog"
-    color "0"
-  ]
-  node [
-    id 4179
-    label "guysharp"
-    color "0"
-  ]
-  node [
-    id 4180
-    label "vi"
-    color "0"
-  ]
-  node [
-    id 4181
-    label "Josie"
-    color "4"
-  ]
-  node [
-    id 4182
-    label "ASCII"
-    color "4"
-  ]
-  node [
-    id 4183
-    label "specialplace"
-    color "4"
-  ]
-  node [
-    id 4184
-    label "thailandhotels"
-    color "0"
-  ]
-  node [
-    id 4185
-    label "Impel"
-    color "0"
-  ]
-  node [
-    id 4186
-    label "DigitalDivide"
-    color "0"
-  ]
-  node [
-    id 4187
-    label "robotics"
-    color "5"
-  ]
-  node [
-    id 4188
-    label "WorldWidePolitics"
-    color "0"
-  ]
-  node [
-    id 4189
-    label "paintball"
-    color "4"
-  ]
-  node [
-    id 4190
-    label "ants"
-    color "0"
-  ]
-  edge [
-    source 44
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 44
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 44
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 54
-    target 3521
-    weight 1379
-  ]
-  edge [
-    source 54
-    target 1616
-    weight 1362
-  ]
-  edge [
-    source 54
-    target 1487
-    weight 828
-  ]
-  edge [
-    source 54
-    target 2861
-    weight 1003
-  ]
-  edge [
-    source 54
-    target 751
-    weight 1103
-  ]
-  edge [
-    source 54
-    target 1127
-    weight 101
-  ]
-  edge [
-    source 54
-    target 602
-    weight 226
-  ]
-  edge [
-    source 54
-    target 3145
-    weight 684
-  ]
-  edge [
-    source 54
-    target 3937
-    weight 54
-  ]
-  edge [
-    source 54
-    target 2058
-    weight 149
-  ]
-  edge [
-    source 54
-    target 152
-    weight 41
-  ]
-  edge [
-    source 54
-    target 3993
-    weight 510
-  ]
-  edge [
-    source 54
-    target 1995
-    weight 566
-  ]
-  edge [
-    source 54
-    target 2071
-    weight 1039
-  ]
-  edge [
-    source 54
-    target 3174
-    weight 715
-  ]
-  edge [
-    source 54
-    target 502
-    weight 39
-  ]
-  edge [
-    source 54
-    target 2227
-    weight 26
-  ]
-  edge [
-    source 54
-    target 1154
-    weight 46
-  ]
-  edge [
-    source 54
-    target 3077
-    weight 48
-  ]
-  edge [
-    source 54
-    target 3962
-    weight 129
-  ]
-  edge [
-    source 54
-    target 1080
-    weight 786
-  ]
-  edge [
-    source 54
-    target 118
-    weight 960
-  ]
-  edge [
-    source 54
-    target 4051
-    weight 1091
-  ]
-  edge [
-    source 54
-    target 3565
-    weight 224
-  ]
-  edge [
-    source 54
-    target 3642
-    weight 401
-  ]
-  edge [
-    source 54
-    target 3040
-    weight 283
-  ]
-  edge [
-    source 54
-    target 3006
-    weight 282
-  ]
-  edge [
-    source 54
-    target 1195
-    weight 64
-  ]
-  edge [
-    source 54
-    target 3954
-    weight 268
-  ]
-  edge [
-    source 54
-    target 2543
-    weight 153
-  ]
-  edge [
-    source 54
-    target 3141
-    weight 1075
-  ]
-  edge [
-    source 54
-    target 3295
-    weight 137
-  ]
-  edge [
-    source 54
-    target 1461
-    weight 55
-  ]
-  edge [
-    source 54
-    target 3066
-    weight 188
-  ]
-  edge [
-    source 54
-    target 1707
-    weight 72
-  ]
-  edge [
-    source 54
-    target 1632
-    weight 452
-  ]
-  edge [
-    source 54
-    target 4160
-    weight 21
-  ]
-  edge [
-    source 54
-    target 1887
-    weight 1050
-  ]
-  edge [
-    source 54
-    target 4162
-    weight 162
-  ]
-  edge [
-    source 54
-    target 4154
-    weight 269
-  ]
-  edge [
-    source 54
-    target 3847
-    weight 62
-  ]
-  edge [
-    source 54
-    target 107
-    weight 189
-  ]
-  edge [
-    source 54
-    target 774
-    weight 1118
-  ]
-  edge [
-    source 54
-    target 1507
-    weight 154
-  ]
-  edge [
-    source 54
-    target 3420
-    weight 121
-  ]
-  edge [
-    source 54
-    target 3600
-    weight 653
-  ]
-  edge [
-    source 54
-    target 1647
-    weight 471
-  ]
-  edge [
-    source 54
-    target 1409
-    weight 108
-  ]
-  edge [
-    source 54
-    target 3917
-    weight 333
-  ]
-  edge [
-    source 54
-    target 3542
-    weight 228
-  ]
-  edge [
-    source 54
-    target 301
-    weight 425
-  ]
-  edge [
-    source 54
-    target 2700
-    weight 541
-  ]
-  edge [
-    source 54
-    target 3276
-    weight 531
-  ]
-  edge [
-    source 54
-    target 1952
-    weight 31
-  ]
-  edge [
-    source 54
-    target 3443
-    weight 173
-  ]
-  edge [
-    source 54
-    target 1582
-    weight 459
-  ]
-  edge [
-    source 54
-    target 1053
-    weight 768
-  ]
-  edge [
-    source 54
-    target 724
-    weight 108
-  ]
-  edge [
-    source 54
-    target 738
-    weight 324
-  ]
-  edge [
-    source 54
-    target 179
-    weight 274
-  ]
-  edge [
-    source 54
-    target 1360
-    weight 106
-  ]
-  edge [
-    source 54
-    target 3377
-    weight 65
-  ]
-  edge [
-    source 54
-    target 2890
-    weight 202
-  ]
-  edge [
-    source 54
-    target 2191
-    weight 170
-  ]
-  edge [
-    source 54
-    target 1766
-    weight 37
-  ]
-  edge [
-    source 54
-    target 3636
-    weight 145
-  ]
-  edge [
-    source 54
-    target 608
-    weight 28
-  ]
-  edge [
-    source 54
-    target 321
-    weight 53
-  ]
-  edge [
-    source 54
-    target 3374
-    weight 173
-  ]
-  edge [
-    source 54
-    target 1517
-    weight 42
-  ]
-  edge [
-    source 54
-    target 3282
-    weight 274
-  ]
-  edge [
-    source 54
-    target 798
-    weight 234
-  ]
-  edge [
-    source 54
-    target 604
-    weight 63
-  ]
-  edge [
-    source 54
-    target 927
-    weight 27
-  ]
-  edge [
-    source 54
-    target 1254
-    weight 261
-  ]
-  edge [
-    source 54
-    target 869
-    weight 25
-  ]
-  edge [
-    source 54
-    target 1280
-    weight 50
-  ]
-  edge [
-    source 54
-    target 1505
-    weight 273
-  ]
-  edge [
-    source 54
-    target 2054
-    weight 29
-  ]
-  edge [
-    source 54
-    target 717
-    weight 38
-  ]
-  edge [
-    source 54
-    target 2614
-    weight 33
-  ]
-  edge [
-    source 54
-    target 1757
-    weight 114
-  ]
-  edge [
-    source 54
-    target 1322
-    weight 48
-  ]
-  edge [
-    source 54
-    target 3884
-    weight 33
-  ]
-  edge [
-    source 54
-    target 305
-    weight 23
-  ]
-  edge [
-    source 54
-    target 1938
-    weight 75
-  ]
-  edge [
-    source 54
-    target 2870
-    weight 170
-  ]
-  edge [
-    source 54
-    target 3408
-    weight 49
-  ]
-  edge [
-    source 54
-    target 986
-    weight 60
-  ]
-  edge [
-    source 54
-    target 1185
-    weight 126
-  ]
-  edge [
-    source 54
-    target 2204
-    weight 120
-  ]
-  edge [
-    source 54
-    target 561
-    weight 28
-  ]
-  edge [
-    source 54
-    target 3196
-    weight 31
-  ]
-  edge [
-    source 54
-    target 2061
-    weight 21
-  ]
-  edge [
-    source 54
-    target 2287
-    weight 192
-  ]
-  edge [
-    source 54
-    target 422
-    weight 113
-  ]
-  edge [
-    source 54
-    target 147
-    weight 24
-  ]
-  edge [
-    source 54
-    target 2857
-    weight 263
-  ]
-  edge [
-    source 54
-    target 3423
-    weight 294
-  ]
-  edge [
-    source 54
-    target 1523
-    weight 99
-  ]
-  edge [
-    source 54
-    target 3253
-    weight 133
-  ]
-  edge [
-    source 54
-    target 256
-    weight 115
-  ]
-  edge [
-    source 54
-    target 4098
-    weight 23
-  ]
-  edge [
-    source 54
-    target 1802
-    weight 25
-  ]
-  edge [
-    source 54
-    target 2553
-    weight 89
-  ]
-  edge [
-    source 54
-    target 4040
-    weight 60
-  ]
-  edge [
-    source 54
-    target 874
-    weight 107
-  ]
-  edge [
-    source 54
-    target 456
-    weight 27
-  ]
-  edge [
-    source 54
-    target 2800
-    weight 69
-  ]
-  edge [
-    source 54
-    target 1420
-    weight 43
-  ]
-  edge [
-    source 54
-    target 671
-    weight 22
-  ]
-  edge [
-    source 54
-    target 968
-    weight 110
-  ]
-  edge [
-    source 54
-    target 1943
-    weight 36
-  ]
-  edge [
-    source 54
-    target 3177
-    weight 31
-  ]
-  edge [
-    source 54
-    target 2329
-    weight 25
-  ]
-  edge [
-    source 54
-    target 490
-    weight 63
-  ]
-  edge [
-    source 54
-    target 424
-    weight 52
-  ]
-  edge [
-    source 54
-    target 2519
-    weight 261
-  ]
-  edge [
-    source 54
-    target 2099
-    weight 22
-  ]
-  edge [
-    source 54
-    target 3877
-    weight 47
-  ]
-  edge [
-    source 54
-    target 2810
-    weight 41
-  ]
-  edge [
-    source 54
-    target 842
-    weight 31
-  ]
-  edge [
-    source 54
-    target 2531
-    weight 32
-  ]
-  edge [
-    source 54
-    target 2003
-    weight 37
-  ]
-  edge [
-    source 54
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 54
-    target 314
-    weight 36
-  ]
-  edge [
-    source 54
-    target 3052
-    weight 88
-  ]
-  edge [
-    source 54
-    target 1125
-    weight 25
-  ]
-  edge [
-    source 54
-    target 4187
-    weight 22
-  ]
-  edge [
-    source 54
-    target 980
-    weight 44
-  ]
-  edge [
-    source 54
-    target 1970
-    weight 24
-  ]
-  edge [
-    source 54
-    target 2078
-    weight 40
-  ]
-  edge [
-    source 67
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 67
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 67
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 67
-    target 1616
-    weight 21
-  ]
-  edge [
-    source 67
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 67
-    target 751
-    weight 23
-  ]
-  edge [
-    source 67
-    target 774
-    weight 23
-  ]
-  edge [
-    source 67
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 67
-    target 1487
-    weight 22
-  ]
-  edge [
-    source 79
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 91
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 91
-    target 118
-    weight 30
-  ]
-  edge [
-    source 91
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 91
-    target 1409
-    weight 23
-  ]
-  edge [
-    source 91
-    target 1616
-    weight 31
-  ]
-  edge [
-    source 91
-    target 1487
-    weight 30
-  ]
-  edge [
-    source 91
-    target 3521
-    weight 36
-  ]
-  edge [
-    source 91
-    target 774
-    weight 31
-  ]
-  edge [
-    source 91
-    target 751
-    weight 30
-  ]
-  edge [
-    source 91
-    target 2071
-    weight 37
-  ]
-  edge [
-    source 91
-    target 1887
-    weight 28
-  ]
-  edge [
-    source 91
-    target 3141
-    weight 33
-  ]
-  edge [
-    source 91
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 91
-    target 1053
-    weight 23
-  ]
-  edge [
-    source 107
-    target 179
-    weight 125
-  ]
-  edge [
-    source 107
-    target 1409
-    weight 39
-  ]
-  edge [
-    source 107
-    target 1616
-    weight 492
-  ]
-  edge [
-    source 107
-    target 3521
-    weight 508
-  ]
-  edge [
-    source 107
-    target 1647
-    weight 196
-  ]
-  edge [
-    source 107
-    target 751
-    weight 424
-  ]
-  edge [
-    source 107
-    target 1632
-    weight 220
-  ]
-  edge [
-    source 107
-    target 1707
-    weight 44
-  ]
-  edge [
-    source 107
-    target 1127
-    weight 58
-  ]
-  edge [
-    source 107
-    target 1360
-    weight 76
-  ]
-  edge [
-    source 107
-    target 4051
-    weight 442
-  ]
-  edge [
-    source 107
-    target 3006
-    weight 151
-  ]
-  edge [
-    source 107
-    target 3917
-    weight 172
-  ]
-  edge [
-    source 107
-    target 2861
-    weight 363
-  ]
-  edge [
-    source 107
-    target 1487
-    weight 283
-  ]
-  edge [
-    source 107
-    target 602
-    weight 95
-  ]
-  edge [
-    source 107
-    target 3174
-    weight 255
-  ]
-  edge [
-    source 107
-    target 3954
-    weight 169
-  ]
-  edge [
-    source 107
-    target 1995
-    weight 246
-  ]
-  edge [
-    source 107
-    target 424
-    weight 80
-  ]
-  edge [
-    source 107
-    target 1080
-    weight 284
-  ]
-  edge [
-    source 107
-    target 3847
-    weight 47
-  ]
-  edge [
-    source 107
-    target 842
-    weight 38
-  ]
-  edge [
-    source 107
-    target 3565
-    weight 94
-  ]
-  edge [
-    source 107
-    target 3066
-    weight 135
-  ]
-  edge [
-    source 107
-    target 1053
-    weight 334
-  ]
-  edge [
-    source 107
-    target 3141
-    weight 434
-  ]
-  edge [
-    source 107
-    target 1887
-    weight 445
-  ]
-  edge [
-    source 107
-    target 4154
-    weight 169
-  ]
-  edge [
-    source 107
-    target 1507
-    weight 74
-  ]
-  edge [
-    source 107
-    target 774
-    weight 446
-  ]
-  edge [
-    source 107
-    target 3253
-    weight 70
-  ]
-  edge [
-    source 107
-    target 3276
-    weight 203
-  ]
-  edge [
-    source 107
-    target 1517
-    weight 40
-  ]
-  edge [
-    source 107
-    target 1582
-    weight 203
-  ]
-  edge [
-    source 107
-    target 118
-    weight 379
-  ]
-  edge [
-    source 107
-    target 3642
-    weight 175
-  ]
-  edge [
-    source 107
-    target 1757
-    weight 61
-  ]
-  edge [
-    source 107
-    target 2071
-    weight 394
-  ]
-  edge [
-    source 107
-    target 321
-    weight 41
-  ]
-  edge [
-    source 107
-    target 3420
-    weight 81
-  ]
-  edge [
-    source 107
-    target 3636
-    weight 84
-  ]
-  edge [
-    source 107
-    target 2191
-    weight 60
-  ]
-  edge [
-    source 107
-    target 3040
-    weight 145
-  ]
-  edge [
-    source 107
-    target 2054
-    weight 36
-  ]
-  edge [
-    source 107
-    target 314
-    weight 27
-  ]
-  edge [
-    source 107
-    target 3542
-    weight 131
-  ]
-  edge [
-    source 107
-    target 3374
-    weight 72
-  ]
-  edge [
-    source 107
-    target 1254
-    weight 139
-  ]
-  edge [
-    source 107
-    target 968
-    weight 79
-  ]
-  edge [
-    source 107
-    target 717
-    weight 34
-  ]
-  edge [
-    source 107
-    target 738
-    weight 169
-  ]
-  edge [
-    source 107
-    target 2543
-    weight 92
-  ]
-  edge [
-    source 107
-    target 456
-    weight 22
-  ]
-  edge [
-    source 107
-    target 490
-    weight 38
-  ]
-  edge [
-    source 107
-    target 3295
-    weight 55
-  ]
-  edge [
-    source 107
-    target 301
-    weight 203
-  ]
-  edge [
-    source 107
-    target 2870
-    weight 122
-  ]
-  edge [
-    source 107
-    target 2857
-    weight 140
-  ]
-  edge [
-    source 107
-    target 3282
-    weight 161
-  ]
-  edge [
-    source 107
-    target 3600
-    weight 235
-  ]
-  edge [
-    source 107
-    target 2890
-    weight 89
-  ]
-  edge [
-    source 107
-    target 2700
-    weight 284
-  ]
-  edge [
-    source 107
-    target 3993
-    weight 189
-  ]
-  edge [
-    source 107
-    target 3145
-    weight 293
-  ]
-  edge [
-    source 107
-    target 798
-    weight 120
-  ]
-  edge [
-    source 107
-    target 1322
-    weight 39
-  ]
-  edge [
-    source 107
-    target 256
-    weight 64
-  ]
-  edge [
-    source 107
-    target 724
-    weight 76
-  ]
-  edge [
-    source 107
-    target 2204
-    weight 74
-  ]
-  edge [
-    source 107
-    target 4162
-    weight 71
-  ]
-  edge [
-    source 107
-    target 422
-    weight 71
-  ]
-  edge [
-    source 107
-    target 2287
-    weight 113
-  ]
-  edge [
-    source 107
-    target 3443
-    weight 84
-  ]
-  edge [
-    source 107
-    target 1280
-    weight 35
-  ]
-  edge [
-    source 107
-    target 3377
-    weight 46
-  ]
-  edge [
-    source 107
-    target 1461
-    weight 34
-  ]
-  edge [
-    source 107
-    target 1195
-    weight 47
-  ]
-  edge [
-    source 107
-    target 3423
-    weight 98
-  ]
-  edge [
-    source 107
-    target 3052
-    weight 70
-  ]
-  edge [
-    source 107
-    target 1185
-    weight 76
-  ]
-  edge [
-    source 107
-    target 152
-    weight 23
-  ]
-  edge [
-    source 107
-    target 874
-    weight 67
-  ]
-  edge [
-    source 107
-    target 604
-    weight 35
-  ]
-  edge [
-    source 107
-    target 1523
-    weight 50
-  ]
-  edge [
-    source 107
-    target 2800
-    weight 49
-  ]
-  edge [
-    source 107
-    target 2519
-    weight 137
-  ]
-  edge [
-    source 107
-    target 1505
-    weight 130
-  ]
-  edge [
-    source 107
-    target 3884
-    weight 25
-  ]
-  edge [
-    source 107
-    target 1938
-    weight 48
-  ]
-  edge [
-    source 107
-    target 980
-    weight 38
-  ]
-  edge [
-    source 107
-    target 502
-    weight 23
-  ]
-  edge [
-    source 107
-    target 3962
-    weight 61
-  ]
-  edge [
-    source 107
-    target 2003
-    weight 33
-  ]
-  edge [
-    source 107
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 107
-    target 1154
-    weight 25
-  ]
-  edge [
-    source 107
-    target 4040
-    weight 27
-  ]
-  edge [
-    source 107
-    target 2232
-    weight 26
-  ]
-  edge [
-    source 107
-    target 2553
-    weight 65
-  ]
-  edge [
-    source 107
-    target 3877
-    weight 24
-  ]
-  edge [
-    source 107
-    target 986
-    weight 26
-  ]
-  edge [
-    source 107
-    target 2614
-    weight 23
-  ]
-  edge [
-    source 107
-    target 1420
-    weight 29
-  ]
-  edge [
-    source 107
-    target 3937
-    weight 25
-  ]
-  edge [
-    source 107
-    target 2058
-    weight 55
-  ]
-  edge [
-    source 107
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 118
-    target 3521
-    weight 20012
-  ]
-  edge [
-    source 118
-    target 751
-    weight 12025
-  ]
-  edge [
-    source 118
-    target 1616
-    weight 13593
-  ]
-  edge [
-    source 118
-    target 2861
-    weight 9346
-  ]
-  edge [
-    source 118
-    target 3565
-    weight 2136
-  ]
-  edge [
-    source 118
-    target 3600
-    weight 6698
-  ]
-  edge [
-    source 118
-    target 1582
-    weight 3958
-  ]
-  edge [
-    source 118
-    target 1647
-    weight 3645
-  ]
-  edge [
-    source 118
-    target 2421
-    weight 29
-  ]
-  edge [
-    source 118
-    target 1487
-    weight 9047
-  ]
-  edge [
-    source 118
-    target 2191
-    weight 917
-  ]
-  edge [
-    source 118
-    target 1216
-    weight 21
-  ]
-  edge [
-    source 118
-    target 152
-    weight 253
-  ]
-  edge [
-    source 118
-    target 3641
-    weight 91
-  ]
-  edge [
-    source 118
-    target 378
-    weight 29
-  ]
-  edge [
-    source 118
-    target 179
-    weight 1084
-  ]
-  edge [
-    source 118
-    target 3642
-    weight 2584
-  ]
-  edge [
-    source 118
-    target 964
-    weight 60
-  ]
-  edge [
-    source 118
-    target 3276
-    weight 4217
-  ]
-  edge [
-    source 118
-    target 3374
-    weight 858
-  ]
-  edge [
-    source 118
-    target 602
-    weight 300
-  ]
-  edge [
-    source 118
-    target 4051
-    weight 11345
-  ]
-  edge [
-    source 118
-    target 2058
-    weight 730
-  ]
-  edge [
-    source 118
-    target 3423
-    weight 1533
-  ]
-  edge [
-    source 118
-    target 719
-    weight 50
-  ]
-  edge [
-    source 118
-    target 1409
-    weight 693
-  ]
-  edge [
-    source 118
-    target 2227
-    weight 170
-  ]
-  edge [
-    source 118
-    target 774
-    weight 12943
-  ]
-  edge [
-    source 118
-    target 3420
-    weight 507
-  ]
-  edge [
-    source 118
-    target 3917
-    weight 1737
-  ]
-  edge [
-    source 118
-    target 3071
-    weight 74
-  ]
-  edge [
-    source 118
-    target 267
-    weight 41
-  ]
-  edge [
-    source 118
-    target 1769
-    weight 21
-  ]
-  edge [
-    source 118
-    target 2071
-    weight 11522
-  ]
-  edge [
-    source 118
-    target 2181
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1053
-    weight 6444
-  ]
-  edge [
-    source 118
-    target 561
-    weight 75
-  ]
-  edge [
-    source 118
-    target 3962
-    weight 775
-  ]
-  edge [
-    source 118
-    target 3443
-    weight 846
-  ]
-  edge [
-    source 118
-    target 1952
-    weight 130
-  ]
-  edge [
-    source 118
-    target 3377
-    weight 177
-  ]
-  edge [
-    source 118
-    target 3177
-    weight 160
-  ]
-  edge [
-    source 118
-    target 874
-    weight 520
-  ]
-  edge [
-    source 118
-    target 3077
-    weight 362
-  ]
-  edge [
-    source 118
-    target 671
-    weight 94
-  ]
-  edge [
-    source 118
-    target 1080
-    weight 3644
-  ]
-  edge [
-    source 118
-    target 2329
-    weight 105
-  ]
-  edge [
-    source 118
-    target 3542
-    weight 1032
-  ]
-  edge [
-    source 118
-    target 3066
-    weight 607
-  ]
-  edge [
-    source 118
-    target 604
-    weight 327
-  ]
-  edge [
-    source 118
-    target 3937
-    weight 215
-  ]
-  edge [
-    source 118
-    target 1333
-    weight 148
-  ]
-  edge [
-    source 118
-    target 1995
-    weight 3472
-  ]
-  edge [
-    source 118
-    target 3968
-    weight 93
-  ]
-  edge [
-    source 118
-    target 798
-    weight 1404
-  ]
-  edge [
-    source 118
-    target 2700
-    weight 3589
-  ]
-  edge [
-    source 118
-    target 3752
-    weight 21
-  ]
-  edge [
-    source 118
-    target 2857
-    weight 1070
-  ]
-  edge [
-    source 118
-    target 2978
-    weight 35
-  ]
-  edge [
-    source 118
-    target 3993
-    weight 3066
-  ]
-  edge [
-    source 118
-    target 3985
-    weight 89
-  ]
-  edge [
-    source 118
-    target 1127
-    weight 237
-  ]
-  edge [
-    source 118
-    target 3145
-    weight 3709
-  ]
-  edge [
-    source 118
-    target 3432
-    weight 92
-  ]
-  edge [
-    source 118
-    target 301
-    weight 2570
-  ]
-  edge [
-    source 118
-    target 1789
-    weight 101
-  ]
-  edge [
-    source 118
-    target 147
-    weight 133
-  ]
-  edge [
-    source 118
-    target 1505
-    weight 1285
-  ]
-  edge [
-    source 118
-    target 3112
-    weight 38
-  ]
-  edge [
-    source 118
-    target 3141
-    weight 12625
-  ]
-  edge [
-    source 118
-    target 1258
-    weight 93
-  ]
-  edge [
-    source 118
-    target 144
-    weight 101
-  ]
-  edge [
-    source 118
-    target 1887
-    weight 10635
-  ]
-  edge [
-    source 118
-    target 347
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1943
-    weight 127
-  ]
-  edge [
-    source 118
-    target 1425
-    weight 35
-  ]
-  edge [
-    source 118
-    target 1374
-    weight 64
-  ]
-  edge [
-    source 118
-    target 3357
-    weight 47
-  ]
-  edge [
-    source 118
-    target 3174
-    weight 3986
-  ]
-  edge [
-    source 118
-    target 2573
-    weight 45
-  ]
-  edge [
-    source 118
-    target 2614
-    weight 136
-  ]
-  edge [
-    source 118
-    target 877
-    weight 40
-  ]
-  edge [
-    source 118
-    target 3282
-    weight 1262
-  ]
-  edge [
-    source 118
-    target 986
-    weight 315
-  ]
-  edge [
-    source 118
-    target 2870
-    weight 914
-  ]
-  edge [
-    source 118
-    target 2810
-    weight 181
-  ]
-  edge [
-    source 118
-    target 1631
-    weight 42
-  ]
-  edge [
-    source 118
-    target 3253
-    weight 487
-  ]
-  edge [
-    source 118
-    target 502
-    weight 186
-  ]
-  edge [
-    source 118
-    target 1757
-    weight 593
-  ]
-  edge [
-    source 118
-    target 1254
-    weight 866
-  ]
-  edge [
-    source 118
-    target 505
-    weight 56
-  ]
-  edge [
-    source 118
-    target 1632
-    weight 1644
-  ]
-  edge [
-    source 118
-    target 2800
-    weight 303
-  ]
-  edge [
-    source 118
-    target 3636
-    weight 699
-  ]
-  edge [
-    source 118
-    target 4187
-    weight 111
-  ]
-  edge [
-    source 118
-    target 1931
-    weight 54
-  ]
-  edge [
-    source 118
-    target 4152
-    weight 97
-  ]
-  edge [
-    source 118
-    target 927
-    weight 122
-  ]
-  edge [
-    source 118
-    target 256
-    weight 506
-  ]
-  edge [
-    source 118
-    target 842
-    weight 88
-  ]
-  edge [
-    source 118
-    target 1349
-    weight 22
-  ]
-  edge [
-    source 118
-    target 123
-    weight 62
-  ]
-  edge [
-    source 118
-    target 689
-    weight 65
-  ]
-  edge [
-    source 118
-    target 2519
-    weight 1067
-  ]
-  edge [
-    source 118
-    target 422
-    weight 338
-  ]
-  edge [
-    source 118
-    target 2204
-    weight 536
-  ]
-  edge [
-    source 118
-    target 2924
-    weight 52
-  ]
-  edge [
-    source 118
-    target 3024
-    weight 72
-  ]
-  edge [
-    source 118
-    target 2543
-    weight 491
-  ]
-  edge [
-    source 118
-    target 4027
-    weight 89
-  ]
-  edge [
-    source 118
-    target 3954
-    weight 760
-  ]
-  edge [
-    source 118
-    target 2597
-    weight 65
-  ]
-  edge [
-    source 118
-    target 2417
-    weight 21
-  ]
-  edge [
-    source 118
-    target 2198
-    weight 31
-  ]
-  edge [
-    source 118
-    target 321
-    weight 181
-  ]
-  edge [
-    source 118
-    target 424
-    weight 106
-  ]
-  edge [
-    source 118
-    target 3693
-    weight 35
-  ]
-  edge [
-    source 118
-    target 724
-    weight 235
-  ]
-  edge [
-    source 118
-    target 738
-    weight 1292
-  ]
-  edge [
-    source 118
-    target 2287
-    weight 675
-  ]
-  edge [
-    source 118
-    target 3295
-    weight 394
-  ]
-  edge [
-    source 118
-    target 2890
-    weight 1019
-  ]
-  edge [
-    source 118
-    target 283
-    weight 172
-  ]
-  edge [
-    source 118
-    target 4098
-    weight 74
-  ]
-  edge [
-    source 118
-    target 968
-    weight 579
-  ]
-  edge [
-    source 118
-    target 215
-    weight 31
-  ]
-  edge [
-    source 118
-    target 3006
-    weight 584
-  ]
-  edge [
-    source 118
-    target 3052
-    weight 282
-  ]
-  edge [
-    source 118
-    target 3847
-    weight 296
-  ]
-  edge [
-    source 118
-    target 3884
-    weight 112
-  ]
-  edge [
-    source 118
-    target 448
-    weight 29
-  ]
-  edge [
-    source 118
-    target 305
-    weight 152
-  ]
-  edge [
-    source 118
-    target 2003
-    weight 77
-  ]
-  edge [
-    source 118
-    target 456
-    weight 128
-  ]
-  edge [
-    source 118
-    target 1554
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1397
-    weight 27
-  ]
-  edge [
-    source 118
-    target 1154
-    weight 256
-  ]
-  edge [
-    source 118
-    target 3040
-    weight 778
-  ]
-  edge [
-    source 118
-    target 314
-    weight 202
-  ]
-  edge [
-    source 118
-    target 1938
-    weight 330
-  ]
-  edge [
-    source 118
-    target 1322
-    weight 178
-  ]
-  edge [
-    source 118
-    target 2570
-    weight 71
-  ]
-  edge [
-    source 118
-    target 733
-    weight 130
-  ]
-  edge [
-    source 118
-    target 1185
-    weight 418
-  ]
-  edge [
-    source 118
-    target 2553
-    weight 335
-  ]
-  edge [
-    source 118
-    target 4007
-    weight 37
-  ]
-  edge [
-    source 118
-    target 3935
-    weight 55
-  ]
-  edge [
-    source 118
-    target 4154
-    weight 985
-  ]
-  edge [
-    source 118
-    target 3559
-    weight 34
-  ]
-  edge [
-    source 118
-    target 2082
-    weight 42
-  ]
-  edge [
-    source 118
-    target 2232
-    weight 46
-  ]
-  edge [
-    source 118
-    target 490
-    weight 204
-  ]
-  edge [
-    source 118
-    target 4160
-    weight 79
-  ]
-  edge [
-    source 118
-    target 869
-    weight 95
-  ]
-  edge [
-    source 118
-    target 2450
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1299
-    weight 29
-  ]
-  edge [
-    source 118
-    target 1507
-    weight 255
-  ]
-  edge [
-    source 118
-    target 308
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1707
-    weight 164
-  ]
-  edge [
-    source 118
-    target 630
-    weight 50
-  ]
-  edge [
-    source 118
-    target 4100
-    weight 32
-  ]
-  edge [
-    source 118
-    target 1280
-    weight 208
-  ]
-  edge [
-    source 118
-    target 1461
-    weight 85
-  ]
-  edge [
-    source 118
-    target 1360
-    weight 246
-  ]
-  edge [
-    source 118
-    target 3050
-    weight 54
-  ]
-  edge [
-    source 118
-    target 4040
-    weight 198
-  ]
-  edge [
-    source 118
-    target 2600
-    weight 33
-  ]
-  edge [
-    source 118
-    target 2054
-    weight 43
-  ]
-  edge [
-    source 118
-    target 1543
-    weight 28
-  ]
-  edge [
-    source 118
-    target 2801
-    weight 24
-  ]
-  edge [
-    source 118
-    target 3860
-    weight 83
-  ]
-  edge [
-    source 118
-    target 4162
-    weight 298
-  ]
-  edge [
-    source 118
-    target 3408
-    weight 211
-  ]
-  edge [
-    source 118
-    target 1232
-    weight 39
-  ]
-  edge [
-    source 118
-    target 363
-    weight 28
-  ]
-  edge [
-    source 118
-    target 440
-    weight 49
-  ]
-  edge [
-    source 118
-    target 2011
-    weight 100
-  ]
-  edge [
-    source 118
-    target 1125
-    weight 161
-  ]
-  edge [
-    source 118
-    target 1798
-    weight 61
-  ]
-  edge [
-    source 118
-    target 1922
-    weight 38
-  ]
-  edge [
-    source 118
-    target 808
-    weight 34
-  ]
-  edge [
-    source 118
-    target 3462
-    weight 38
-  ]
-  edge [
-    source 118
-    target 3956
-    weight 35
-  ]
-  edge [
-    source 118
-    target 1195
-    weight 141
-  ]
-  edge [
-    source 118
-    target 2844
-    weight 53
-  ]
-  edge [
-    source 118
-    target 423
-    weight 31
-  ]
-  edge [
-    source 118
-    target 2556
-    weight 65
-  ]
-  edge [
-    source 118
-    target 2434
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1691
-    weight 41
-  ]
-  edge [
-    source 118
-    target 980
-    weight 304
-  ]
-  edge [
-    source 118
-    target 548
-    weight 22
-  ]
-  edge [
-    source 118
-    target 1856
-    weight 24
-  ]
-  edge [
-    source 118
-    target 717
-    weight 53
-  ]
-  edge [
-    source 118
-    target 2743
-    weight 39
-  ]
-  edge [
-    source 118
-    target 1577
-    weight 44
-  ]
-  edge [
-    source 118
-    target 3324
-    weight 25
-  ]
-  edge [
-    source 118
-    target 712
-    weight 40
-  ]
-  edge [
-    source 118
-    target 1676
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1492
-    weight 38
-  ]
-  edge [
-    source 118
-    target 661
-    weight 26
-  ]
-  edge [
-    source 118
-    target 608
-    weight 129
-  ]
-  edge [
-    source 118
-    target 1199
-    weight 39
-  ]
-  edge [
-    source 118
-    target 2531
-    weight 77
-  ]
-  edge [
-    source 118
-    target 871
-    weight 42
-  ]
-  edge [
-    source 118
-    target 1523
-    weight 257
-  ]
-  edge [
-    source 118
-    target 3877
-    weight 221
-  ]
-  edge [
-    source 118
-    target 3162
-    weight 74
-  ]
-  edge [
-    source 118
-    target 3861
-    weight 62
-  ]
-  edge [
-    source 118
-    target 2832
-    weight 32
-  ]
-  edge [
-    source 118
-    target 2711
-    weight 82
-  ]
-  edge [
-    source 118
-    target 3375
-    weight 22
-  ]
-  edge [
-    source 118
-    target 2061
-    weight 52
-  ]
-  edge [
-    source 118
-    target 3196
-    weight 78
-  ]
-  edge [
-    source 118
-    target 3952
-    weight 31
-  ]
-  edge [
-    source 118
-    target 1664
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1775
-    weight 23
-  ]
-  edge [
-    source 118
-    target 1028
-    weight 48
-  ]
-  edge [
-    source 118
-    target 2609
-    weight 33
-  ]
-  edge [
-    source 118
-    target 1832
-    weight 35
-  ]
-  edge [
-    source 118
-    target 1420
-    weight 176
-  ]
-  edge [
-    source 118
-    target 2009
-    weight 38
-  ]
-  edge [
-    source 118
-    target 3692
-    weight 24
-  ]
-  edge [
-    source 118
-    target 399
-    weight 57
-  ]
-  edge [
-    source 118
-    target 2953
-    weight 22
-  ]
-  edge [
-    source 118
-    target 1517
-    weight 118
-  ]
-  edge [
-    source 118
-    target 2997
-    weight 24
-  ]
-  edge [
-    source 118
-    target 3465
-    weight 25
-  ]
-  edge [
-    source 118
-    target 1802
-    weight 95
-  ]
-  edge [
-    source 118
-    target 2983
-    weight 35
-  ]
-  edge [
-    source 118
-    target 651
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1090
-    weight 36
-  ]
-  edge [
-    source 118
-    target 1419
-    weight 67
-  ]
-  edge [
-    source 118
-    target 2955
-    weight 61
-  ]
-  edge [
-    source 118
-    target 549
-    weight 84
-  ]
-  edge [
-    source 118
-    target 3011
-    weight 29
-  ]
-  edge [
-    source 118
-    target 1140
-    weight 51
-  ]
-  edge [
-    source 118
-    target 1766
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1148
-    weight 72
-  ]
-  edge [
-    source 118
-    target 632
-    weight 79
-  ]
-  edge [
-    source 118
-    target 1634
-    weight 28
-  ]
-  edge [
-    source 118
-    target 3677
-    weight 74
-  ]
-  edge [
-    source 118
-    target 1064
-    weight 40
-  ]
-  edge [
-    source 118
-    target 2822
-    weight 78
-  ]
-  edge [
-    source 118
-    target 344
-    weight 40
-  ]
-  edge [
-    source 118
-    target 653
-    weight 30
-  ]
-  edge [
-    source 118
-    target 3872
-    weight 46
-  ]
-  edge [
-    source 118
-    target 675
-    weight 100
-  ]
-  edge [
-    source 118
-    target 1166
-    weight 22
-  ]
-  edge [
-    source 118
-    target 1391
-    weight 69
-  ]
-  edge [
-    source 118
-    target 2078
-    weight 153
-  ]
-  edge [
-    source 118
-    target 3108
-    weight 41
-  ]
-  edge [
-    source 118
-    target 2115
-    weight 31
-  ]
-  edge [
-    source 118
-    target 2634
-    weight 27
-  ]
-  edge [
-    source 118
-    target 3737
-    weight 39
-  ]
-  edge [
-    source 118
-    target 2099
-    weight 105
-  ]
-  edge [
-    source 118
-    target 1970
-    weight 123
-  ]
-  edge [
-    source 118
-    target 2836
-    weight 33
-  ]
-  edge [
-    source 118
-    target 916
-    weight 69
-  ]
-  edge [
-    source 118
-    target 3309
-    weight 22
-  ]
-  edge [
-    source 118
-    target 3633
-    weight 62
-  ]
-  edge [
-    source 118
-    target 3440
-    weight 31
-  ]
-  edge [
-    source 118
-    target 368
-    weight 40
-  ]
-  edge [
-    source 118
-    target 1900
-    weight 24
-  ]
-  edge [
-    source 118
-    target 3876
-    weight 48
-  ]
-  edge [
-    source 118
-    target 1528
-    weight 45
-  ]
-  edge [
-    source 123
-    target 3521
-    weight 79
-  ]
-  edge [
-    source 123
-    target 3600
-    weight 39
-  ]
-  edge [
-    source 123
-    target 774
-    weight 76
-  ]
-  edge [
-    source 123
-    target 2861
-    weight 52
-  ]
-  edge [
-    source 123
-    target 751
-    weight 66
-  ]
-  edge [
-    source 123
-    target 1616
-    weight 73
-  ]
-  edge [
-    source 123
-    target 3141
-    weight 71
-  ]
-  edge [
-    source 123
-    target 1487
-    weight 47
-  ]
-  edge [
-    source 123
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 123
-    target 1647
-    weight 34
-  ]
-  edge [
-    source 123
-    target 3636
-    weight 25
-  ]
-  edge [
-    source 123
-    target 1080
-    weight 41
-  ]
-  edge [
-    source 123
-    target 1995
-    weight 40
-  ]
-  edge [
-    source 123
-    target 4051
-    weight 63
-  ]
-  edge [
-    source 123
-    target 3145
-    weight 52
-  ]
-  edge [
-    source 123
-    target 2870
-    weight 21
-  ]
-  edge [
-    source 123
-    target 3282
-    weight 39
-  ]
-  edge [
-    source 123
-    target 1632
-    weight 34
-  ]
-  edge [
-    source 123
-    target 1887
-    weight 71
-  ]
-  edge [
-    source 123
-    target 1053
-    weight 59
-  ]
-  edge [
-    source 123
-    target 3642
-    weight 25
-  ]
-  edge [
-    source 123
-    target 3276
-    weight 45
-  ]
-  edge [
-    source 123
-    target 2700
-    weight 41
-  ]
-  edge [
-    source 123
-    target 2071
-    weight 64
-  ]
-  edge [
-    source 123
-    target 798
-    weight 36
-  ]
-  edge [
-    source 123
-    target 3174
-    weight 43
-  ]
-  edge [
-    source 123
-    target 3542
-    weight 27
-  ]
-  edge [
-    source 123
-    target 301
-    weight 34
-  ]
-  edge [
-    source 123
-    target 738
-    weight 31
-  ]
-  edge [
-    source 123
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 123
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 123
-    target 1582
-    weight 39
-  ]
-  edge [
-    source 123
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 123
-    target 2287
-    weight 22
-  ]
-  edge [
-    source 123
-    target 179
-    weight 23
-  ]
-  edge [
-    source 123
-    target 1254
-    weight 22
-  ]
-  edge [
-    source 123
-    target 3066
-    weight 21
-  ]
-  edge [
-    source 123
-    target 1505
-    weight 28
-  ]
-  edge [
-    source 123
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 123
-    target 3917
-    weight 33
-  ]
-  edge [
-    source 123
-    target 3006
-    weight 23
-  ]
-  edge [
-    source 123
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 123
-    target 2058
-    weight 21
-  ]
-  edge [
-    source 123
-    target 2519
-    weight 28
-  ]
-  edge [
-    source 144
-    target 3521
-    weight 133
-  ]
-  edge [
-    source 144
-    target 3276
-    weight 69
-  ]
-  edge [
-    source 144
-    target 774
-    weight 108
-  ]
-  edge [
-    source 144
-    target 3145
-    weight 96
-  ]
-  edge [
-    source 144
-    target 1582
-    weight 57
-  ]
-  edge [
-    source 144
-    target 1616
-    weight 120
-  ]
-  edge [
-    source 144
-    target 1080
-    weight 75
-  ]
-  edge [
-    source 144
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 144
-    target 3993
-    weight 71
-  ]
-  edge [
-    source 144
-    target 798
-    weight 47
-  ]
-  edge [
-    source 144
-    target 2857
-    weight 55
-  ]
-  edge [
-    source 144
-    target 1647
-    weight 75
-  ]
-  edge [
-    source 144
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 144
-    target 1995
-    weight 69
-  ]
-  edge [
-    source 144
-    target 751
-    weight 120
-  ]
-  edge [
-    source 144
-    target 2861
-    weight 102
-  ]
-  edge [
-    source 144
-    target 3282
-    weight 52
-  ]
-  edge [
-    source 144
-    target 3642
-    weight 56
-  ]
-  edge [
-    source 144
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 144
-    target 2191
-    weight 35
-  ]
-  edge [
-    source 144
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 144
-    target 3917
-    weight 60
-  ]
-  edge [
-    source 144
-    target 1053
-    weight 93
-  ]
-  edge [
-    source 144
-    target 1487
-    weight 101
-  ]
-  edge [
-    source 144
-    target 3600
-    weight 73
-  ]
-  edge [
-    source 144
-    target 2800
-    weight 36
-  ]
-  edge [
-    source 144
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 144
-    target 2519
-    weight 42
-  ]
-  edge [
-    source 144
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 144
-    target 1254
-    weight 47
-  ]
-  edge [
-    source 144
-    target 1409
-    weight 27
-  ]
-  edge [
-    source 144
-    target 4051
-    weight 109
-  ]
-  edge [
-    source 144
-    target 1887
-    weight 106
-  ]
-  edge [
-    source 144
-    target 2071
-    weight 113
-  ]
-  edge [
-    source 144
-    target 3565
-    weight 36
-  ]
-  edge [
-    source 144
-    target 179
-    weight 57
-  ]
-  edge [
-    source 144
-    target 604
-    weight 31
-  ]
-  edge [
-    source 144
-    target 738
-    weight 53
-  ]
-  edge [
-    source 144
-    target 3636
-    weight 35
-  ]
-  edge [
-    source 144
-    target 3040
-    weight 35
-  ]
-  edge [
-    source 144
-    target 968
-    weight 24
-  ]
-  edge [
-    source 144
-    target 1505
-    weight 52
-  ]
-  edge [
-    source 144
-    target 2287
-    weight 27
-  ]
-  edge [
-    source 144
-    target 1185
-    weight 38
-  ]
-  edge [
-    source 144
-    target 2204
-    weight 29
-  ]
-  edge [
-    source 144
-    target 301
-    weight 65
-  ]
-  edge [
-    source 144
-    target 3174
-    weight 74
-  ]
-  edge [
-    source 144
-    target 3374
-    weight 47
-  ]
-  edge [
-    source 144
-    target 2890
-    weight 27
-  ]
-  edge [
-    source 144
-    target 2553
-    weight 26
-  ]
-  edge [
-    source 144
-    target 256
-    weight 27
-  ]
-  edge [
-    source 144
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 144
-    target 3423
-    weight 52
-  ]
-  edge [
-    source 144
-    target 3006
-    weight 29
-  ]
-  edge [
-    source 144
-    target 1757
-    weight 30
-  ]
-  edge [
-    source 144
-    target 3954
-    weight 39
-  ]
-  edge [
-    source 144
-    target 1632
-    weight 49
-  ]
-  edge [
-    source 144
-    target 3066
-    weight 33
-  ]
-  edge [
-    source 144
-    target 874
-    weight 38
-  ]
-  edge [
-    source 144
-    target 2810
-    weight 27
-  ]
-  edge [
-    source 144
-    target 2058
-    weight 40
-  ]
-  edge [
-    source 144
-    target 502
-    weight 21
-  ]
-  edge [
-    source 144
-    target 986
-    weight 31
-  ]
-  edge [
-    source 144
-    target 3420
-    weight 31
-  ]
-  edge [
-    source 144
-    target 3253
-    weight 31
-  ]
-  edge [
-    source 144
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 145
-    target 3521
-    weight 78
-  ]
-  edge [
-    source 145
-    target 2861
-    weight 22
-  ]
-  edge [
-    source 145
-    target 1487
-    weight 29
-  ]
-  edge [
-    source 145
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 145
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 147
-    target 3521
-    weight 164
-  ]
-  edge [
-    source 147
-    target 3600
-    weight 128
-  ]
-  edge [
-    source 147
-    target 1647
-    weight 85
-  ]
-  edge [
-    source 147
-    target 751
-    weight 138
-  ]
-  edge [
-    source 147
-    target 2861
-    weight 87
-  ]
-  edge [
-    source 147
-    target 1616
-    weight 140
-  ]
-  edge [
-    source 147
-    target 1487
-    weight 110
-  ]
-  edge [
-    source 147
-    target 3276
-    weight 103
-  ]
-  edge [
-    source 147
-    target 2700
-    weight 68
-  ]
-  edge [
-    source 147
-    target 3993
-    weight 82
-  ]
-  edge [
-    source 147
-    target 1505
-    weight 57
-  ]
-  edge [
-    source 147
-    target 1053
-    weight 88
-  ]
-  edge [
-    source 147
-    target 774
-    weight 145
-  ]
-  edge [
-    source 147
-    target 2857
-    weight 36
-  ]
-  edge [
-    source 147
-    target 1582
-    weight 70
-  ]
-  edge [
-    source 147
-    target 2191
-    weight 27
-  ]
-  edge [
-    source 147
-    target 4051
-    weight 122
-  ]
-  edge [
-    source 147
-    target 1080
-    weight 51
-  ]
-  edge [
-    source 147
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 147
-    target 3917
-    weight 55
-  ]
-  edge [
-    source 147
-    target 2071
-    weight 128
-  ]
-  edge [
-    source 147
-    target 3145
-    weight 85
-  ]
-  edge [
-    source 147
-    target 1887
-    weight 134
-  ]
-  edge [
-    source 147
-    target 1995
-    weight 52
-  ]
-  edge [
-    source 147
-    target 3174
-    weight 72
-  ]
-  edge [
-    source 147
-    target 3962
-    weight 25
-  ]
-  edge [
-    source 147
-    target 3443
-    weight 32
-  ]
-  edge [
-    source 147
-    target 738
-    weight 23
-  ]
-  edge [
-    source 147
-    target 3141
-    weight 140
-  ]
-  edge [
-    source 147
-    target 3282
-    weight 45
-  ]
-  edge [
-    source 147
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 147
-    target 1632
-    weight 37
-  ]
-  edge [
-    source 147
-    target 2287
-    weight 29
-  ]
-  edge [
-    source 147
-    target 3642
-    weight 42
-  ]
-  edge [
-    source 147
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 147
-    target 301
-    weight 58
-  ]
-  edge [
-    source 147
-    target 179
-    weight 36
-  ]
-  edge [
-    source 147
-    target 798
-    weight 41
-  ]
-  edge [
-    source 147
-    target 2519
-    weight 28
-  ]
-  edge [
-    source 147
-    target 1254
-    weight 33
-  ]
-  edge [
-    source 147
-    target 2870
-    weight 30
-  ]
-  edge [
-    source 147
-    target 256
-    weight 21
-  ]
-  edge [
-    source 147
-    target 2890
-    weight 29
-  ]
-  edge [
-    source 147
-    target 3542
-    weight 28
-  ]
-  edge [
-    source 147
-    target 2058
-    weight 30
-  ]
-  edge [
-    source 147
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 152
-    target 3521
-    weight 525
-  ]
-  edge [
-    source 152
-    target 751
-    weight 280
-  ]
-  edge [
-    source 152
-    target 3565
-    weight 70
-  ]
-  edge [
-    source 152
-    target 2861
-    weight 245
-  ]
-  edge [
-    source 152
-    target 1616
-    weight 284
-  ]
-  edge [
-    source 152
-    target 1487
-    weight 248
-  ]
-  edge [
-    source 152
-    target 3600
-    weight 183
-  ]
-  edge [
-    source 152
-    target 1647
-    weight 149
-  ]
-  edge [
-    source 152
-    target 774
-    weight 278
-  ]
-  edge [
-    source 152
-    target 1582
-    weight 132
-  ]
-  edge [
-    source 152
-    target 798
-    weight 69
-  ]
-  edge [
-    source 152
-    target 2857
-    weight 57
-  ]
-  edge [
-    source 152
-    target 2700
-    weight 127
-  ]
-  edge [
-    source 152
-    target 3993
-    weight 110
-  ]
-  edge [
-    source 152
-    target 3077
-    weight 29
-  ]
-  edge [
-    source 152
-    target 1080
-    weight 125
-  ]
-  edge [
-    source 152
-    target 3141
-    weight 278
-  ]
-  edge [
-    source 152
-    target 986
-    weight 28
-  ]
-  edge [
-    source 152
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 152
-    target 1053
-    weight 167
-  ]
-  edge [
-    source 152
-    target 2058
-    weight 49
-  ]
-  edge [
-    source 152
-    target 3276
-    weight 143
-  ]
-  edge [
-    source 152
-    target 4051
-    weight 268
-  ]
-  edge [
-    source 152
-    target 3145
-    weight 150
-  ]
-  edge [
-    source 152
-    target 2071
-    weight 285
-  ]
-  edge [
-    source 152
-    target 1887
-    weight 237
-  ]
-  edge [
-    source 152
-    target 968
-    weight 32
-  ]
-  edge [
-    source 152
-    target 2543
-    weight 28
-  ]
-  edge [
-    source 152
-    target 1995
-    weight 113
-  ]
-  edge [
-    source 152
-    target 3423
-    weight 69
-  ]
-  edge [
-    source 152
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 152
-    target 738
-    weight 62
-  ]
-  edge [
-    source 152
-    target 1505
-    weight 55
-  ]
-  edge [
-    source 152
-    target 1409
-    weight 41
-  ]
-  edge [
-    source 152
-    target 3917
-    weight 94
-  ]
-  edge [
-    source 152
-    target 4162
-    weight 21
-  ]
-  edge [
-    source 152
-    target 256
-    weight 30
-  ]
-  edge [
-    source 152
-    target 3443
-    weight 55
-  ]
-  edge [
-    source 152
-    target 3295
-    weight 23
-  ]
-  edge [
-    source 152
-    target 1632
-    weight 75
-  ]
-  edge [
-    source 152
-    target 301
-    weight 90
-  ]
-  edge [
-    source 152
-    target 2191
-    weight 61
-  ]
-  edge [
-    source 152
-    target 2890
-    weight 63
-  ]
-  edge [
-    source 152
-    target 1757
-    weight 31
-  ]
-  edge [
-    source 152
-    target 3542
-    weight 57
-  ]
-  edge [
-    source 152
-    target 1254
-    weight 43
-  ]
-  edge [
-    source 152
-    target 1507
-    weight 21
-  ]
-  edge [
-    source 152
-    target 874
-    weight 45
-  ]
-  edge [
-    source 152
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 152
-    target 2519
-    weight 71
-  ]
-  edge [
-    source 152
-    target 3006
-    weight 33
-  ]
-  edge [
-    source 152
-    target 3174
-    weight 108
-  ]
-  edge [
-    source 152
-    target 604
-    weight 27
-  ]
-  edge [
-    source 152
-    target 3282
-    weight 71
-  ]
-  edge [
-    source 152
-    target 3052
-    weight 21
-  ]
-  edge [
-    source 152
-    target 3420
-    weight 34
-  ]
-  edge [
-    source 152
-    target 3066
-    weight 37
-  ]
-  edge [
-    source 152
-    target 4154
-    weight 42
-  ]
-  edge [
-    source 152
-    target 3374
-    weight 50
-  ]
-  edge [
-    source 152
-    target 3962
-    weight 47
-  ]
-  edge [
-    source 152
-    target 179
-    weight 58
-  ]
-  edge [
-    source 152
-    target 2287
-    weight 41
-  ]
-  edge [
-    source 152
-    target 3954
-    weight 36
-  ]
-  edge [
-    source 152
-    target 2870
-    weight 44
-  ]
-  edge [
-    source 152
-    target 2204
-    weight 33
-  ]
-  edge [
-    source 152
-    target 2800
-    weight 22
-  ]
-  edge [
-    source 152
-    target 3040
-    weight 41
-  ]
-  edge [
-    source 152
-    target 602
-    weight 24
-  ]
-  edge [
-    source 152
-    target 3636
-    weight 32
-  ]
-  edge [
-    source 152
-    target 1185
-    weight 26
-  ]
-  edge [
-    source 152
-    target 2553
-    weight 25
-  ]
-  edge [
-    source 152
-    target 3877
-    weight 25
-  ]
-  edge [
-    source 179
-    target 3521
-    weight 1431
-  ]
-  edge [
-    source 179
-    target 3600
-    weight 799
-  ]
-  edge [
-    source 179
-    target 751
-    weight 1314
-  ]
-  edge [
-    source 179
-    target 3641
-    weight 35
-  ]
-  edge [
-    source 179
-    target 1487
-    weight 1063
-  ]
-  edge [
-    source 179
-    target 2861
-    weight 963
-  ]
-  edge [
-    source 179
-    target 1616
-    weight 1269
-  ]
-  edge [
-    source 179
-    target 1647
-    weight 658
-  ]
-  edge [
-    source 179
-    target 2071
-    weight 1171
-  ]
-  edge [
-    source 179
-    target 1080
-    weight 643
-  ]
-  edge [
-    source 179
-    target 3174
-    weight 679
-  ]
-  edge [
-    source 179
-    target 2191
-    weight 281
-  ]
-  edge [
-    source 179
-    target 3565
-    weight 245
-  ]
-  edge [
-    source 179
-    target 3276
-    weight 705
-  ]
-  edge [
-    source 179
-    target 3077
-    weight 107
-  ]
-  edge [
-    source 179
-    target 561
-    weight 34
-  ]
-  edge [
-    source 179
-    target 301
-    weight 517
-  ]
-  edge [
-    source 179
-    target 3374
-    weight 367
-  ]
-  edge [
-    source 179
-    target 1995
-    weight 623
-  ]
-  edge [
-    source 179
-    target 1053
-    weight 909
-  ]
-  edge [
-    source 179
-    target 774
-    weight 1223
-  ]
-  edge [
-    source 179
-    target 3145
-    weight 825
-  ]
-  edge [
-    source 179
-    target 1254
-    weight 448
-  ]
-  edge [
-    source 179
-    target 1409
-    weight 163
-  ]
-  edge [
-    source 179
-    target 3141
-    weight 1173
-  ]
-  edge [
-    source 179
-    target 3968
-    weight 31
-  ]
-  edge [
-    source 179
-    target 3177
-    weight 67
-  ]
-  edge [
-    source 179
-    target 2329
-    weight 31
-  ]
-  edge [
-    source 179
-    target 2857
-    weight 383
-  ]
-  edge [
-    source 179
-    target 1505
-    weight 414
-  ]
-  edge [
-    source 179
-    target 3993
-    weight 670
-  ]
-  edge [
-    source 179
-    target 4051
-    weight 1141
-  ]
-  edge [
-    source 179
-    target 3066
-    weight 216
-  ]
-  edge [
-    source 179
-    target 1789
-    weight 26
-  ]
-  edge [
-    source 179
-    target 1943
-    weight 67
-  ]
-  edge [
-    source 179
-    target 1887
-    weight 1058
-  ]
-  edge [
-    source 179
-    target 4187
-    weight 74
-  ]
-  edge [
-    source 179
-    target 3642
-    weight 403
-  ]
-  edge [
-    source 179
-    target 3542
-    weight 312
-  ]
-  edge [
-    source 179
-    target 3420
-    weight 149
-  ]
-  edge [
-    source 179
-    target 2700
-    weight 590
-  ]
-  edge [
-    source 179
-    target 1582
-    weight 525
-  ]
-  edge [
-    source 179
-    target 3917
-    weight 473
-  ]
-  edge [
-    source 179
-    target 3253
-    weight 155
-  ]
-  edge [
-    source 179
-    target 422
-    weight 121
-  ]
-  edge [
-    source 179
-    target 3282
-    weight 334
-  ]
-  edge [
-    source 179
-    target 3443
-    weight 229
-  ]
-  edge [
-    source 179
-    target 1420
-    weight 69
-  ]
-  edge [
-    source 179
-    target 2227
-    weight 43
-  ]
-  edge [
-    source 179
-    target 2058
-    weight 246
-  ]
-  edge [
-    source 179
-    target 2204
-    weight 186
-  ]
-  edge [
-    source 179
-    target 874
-    weight 201
-  ]
-  edge [
-    source 179
-    target 927
-    weight 53
-  ]
-  edge [
-    source 179
-    target 798
-    weight 376
-  ]
-  edge [
-    source 179
-    target 1632
-    weight 402
-  ]
-  edge [
-    source 179
-    target 3377
-    weight 57
-  ]
-  edge [
-    source 179
-    target 2800
-    weight 117
-  ]
-  edge [
-    source 179
-    target 424
-    weight 39
-  ]
-  edge [
-    source 179
-    target 2543
-    weight 182
-  ]
-  edge [
-    source 179
-    target 3636
-    weight 199
-  ]
-  edge [
-    source 179
-    target 4027
-    weight 47
-  ]
-  edge [
-    source 179
-    target 2870
-    weight 232
-  ]
-  edge [
-    source 179
-    target 2614
-    weight 65
-  ]
-  edge [
-    source 179
-    target 738
-    weight 385
-  ]
-  edge [
-    source 179
-    target 2287
-    weight 250
-  ]
-  edge [
-    source 179
-    target 604
-    weight 131
-  ]
-  edge [
-    source 179
-    target 1127
-    weight 75
-  ]
-  edge [
-    source 179
-    target 456
-    weight 37
-  ]
-  edge [
-    source 179
-    target 1507
-    weight 108
-  ]
-  edge [
-    source 179
-    target 3040
-    weight 270
-  ]
-  edge [
-    source 179
-    target 1154
-    weight 71
-  ]
-  edge [
-    source 179
-    target 964
-    weight 21
-  ]
-  edge [
-    source 179
-    target 1185
-    weight 157
-  ]
-  edge [
-    source 179
-    target 3937
-    weight 85
-  ]
-  edge [
-    source 179
-    target 968
-    weight 163
-  ]
-  edge [
-    source 179
-    target 502
-    weight 85
-  ]
-  edge [
-    source 179
-    target 3006
-    weight 194
-  ]
-  edge [
-    source 179
-    target 3357
-    weight 21
-  ]
-  edge [
-    source 179
-    target 1333
-    weight 55
-  ]
-  edge [
-    source 179
-    target 3962
-    weight 194
-  ]
-  edge [
-    source 179
-    target 1952
-    weight 45
-  ]
-  edge [
-    source 179
-    target 689
-    weight 27
-  ]
-  edge [
-    source 179
-    target 916
-    weight 21
-  ]
-  edge [
-    source 179
-    target 1757
-    weight 183
-  ]
-  edge [
-    source 179
-    target 3196
-    weight 43
-  ]
-  edge [
-    source 179
-    target 2890
-    weight 216
-  ]
-  edge [
-    source 179
-    target 3954
-    weight 255
-  ]
-  edge [
-    source 179
-    target 3408
-    weight 85
-  ]
-  edge [
-    source 179
-    target 4152
-    weight 27
-  ]
-  edge [
-    source 179
-    target 2553
-    weight 105
-  ]
-  edge [
-    source 179
-    target 256
-    weight 143
-  ]
-  edge [
-    source 179
-    target 505
-    weight 41
-  ]
-  edge [
-    source 179
-    target 3423
-    weight 352
-  ]
-  edge [
-    source 179
-    target 4154
-    weight 236
-  ]
-  edge [
-    source 179
-    target 1707
-    weight 59
-  ]
-  edge [
-    source 179
-    target 2810
-    weight 74
-  ]
-  edge [
-    source 179
-    target 3052
-    weight 177
-  ]
-  edge [
-    source 179
-    target 2711
-    weight 41
-  ]
-  edge [
-    source 179
-    target 1195
-    weight 44
-  ]
-  edge [
-    source 179
-    target 980
-    weight 68
-  ]
-  edge [
-    source 179
-    target 2570
-    weight 24
-  ]
-  edge [
-    source 179
-    target 1280
-    weight 70
-  ]
-  edge [
-    source 179
-    target 314
-    weight 65
-  ]
-  edge [
-    source 179
-    target 3295
-    weight 136
-  ]
-  edge [
-    source 179
-    target 1517
-    weight 47
-  ]
-  edge [
-    source 179
-    target 3432
-    weight 39
-  ]
-  edge [
-    source 179
-    target 1798
-    weight 41
-  ]
-  edge [
-    source 179
-    target 608
-    weight 31
-  ]
-  edge [
-    source 179
-    target 4160
-    weight 28
-  ]
-  edge [
-    source 179
-    target 3024
-    weight 24
-  ]
-  edge [
-    source 179
-    target 1523
-    weight 87
-  ]
-  edge [
-    source 179
-    target 2609
-    weight 22
-  ]
-  edge [
-    source 179
-    target 321
-    weight 55
-  ]
-  edge [
-    source 179
-    target 1391
-    weight 36
-  ]
-  edge [
-    source 179
-    target 2519
-    weight 296
-  ]
-  edge [
-    source 179
-    target 1360
-    weight 110
-  ]
-  edge [
-    source 179
-    target 4040
-    weight 68
-  ]
-  edge [
-    source 179
-    target 448
-    weight 21
-  ]
-  edge [
-    source 179
-    target 2531
-    weight 24
-  ]
-  edge [
-    source 179
-    target 3884
-    weight 54
-  ]
-  edge [
-    source 179
-    target 986
-    weight 115
-  ]
-  edge [
-    source 179
-    target 1461
-    weight 31
-  ]
-  edge [
-    source 179
-    target 549
-    weight 22
-  ]
-  edge [
-    source 179
-    target 671
-    weight 37
-  ]
-  edge [
-    source 179
-    target 2099
-    weight 50
-  ]
-  edge [
-    source 179
-    target 490
-    weight 96
-  ]
-  edge [
-    source 179
-    target 1148
-    weight 23
-  ]
-  edge [
-    source 179
-    target 3677
-    weight 21
-  ]
-  edge [
-    source 179
-    target 4162
-    weight 92
-  ]
-  edge [
-    source 179
-    target 1125
-    weight 41
-  ]
-  edge [
-    source 179
-    target 1322
-    weight 52
-  ]
-  edge [
-    source 179
-    target 724
-    weight 74
-  ]
-  edge [
-    source 179
-    target 3847
-    weight 43
-  ]
-  edge [
-    source 179
-    target 2003
-    weight 21
-  ]
-  edge [
-    source 179
-    target 3877
-    weight 76
-  ]
-  edge [
-    source 179
-    target 1938
-    weight 85
-  ]
-  edge [
-    source 179
-    target 3860
-    weight 32
-  ]
-  edge [
-    source 179
-    target 4098
-    weight 23
-  ]
-  edge [
-    source 179
-    target 675
-    weight 24
-  ]
-  edge [
-    source 179
-    target 3071
-    weight 34
-  ]
-  edge [
-    source 179
-    target 305
-    weight 23
-  ]
-  edge [
-    source 179
-    target 1931
-    weight 22
-  ]
-  edge [
-    source 179
-    target 602
-    weight 88
-  ]
-  edge [
-    source 179
-    target 1970
-    weight 41
-  ]
-  edge [
-    source 179
-    target 733
-    weight 30
-  ]
-  edge [
-    source 179
-    target 3861
-    weight 21
-  ]
-  edge [
-    source 179
-    target 842
-    weight 39
-  ]
-  edge [
-    source 179
-    target 2822
-    weight 27
-  ]
-  edge [
-    source 179
-    target 1802
-    weight 40
-  ]
-  edge [
-    source 179
-    target 877
-    weight 22
-  ]
-  edge [
-    source 179
-    target 3162
-    weight 22
-  ]
-  edge [
-    source 179
-    target 2011
-    weight 34
-  ]
-  edge [
-    source 179
-    target 1028
-    weight 22
-  ]
-  edge [
-    source 179
-    target 2078
-    weight 51
-  ]
-  edge [
-    source 179
-    target 869
-    weight 33
-  ]
-  edge [
-    source 179
-    target 3876
-    weight 25
-  ]
-  edge [
-    source 192
-    target 648
-    weight 28
-  ]
-  edge [
-    source 215
-    target 2861
-    weight 23
-  ]
-  edge [
-    source 215
-    target 751
-    weight 29
-  ]
-  edge [
-    source 215
-    target 1616
-    weight 37
-  ]
-  edge [
-    source 215
-    target 4051
-    weight 32
-  ]
-  edge [
-    source 215
-    target 1487
-    weight 21
-  ]
-  edge [
-    source 215
-    target 3521
-    weight 37
-  ]
-  edge [
-    source 215
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 215
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 215
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 215
-    target 1053
-    weight 25
-  ]
-  edge [
-    source 215
-    target 774
-    weight 32
-  ]
-  edge [
-    source 215
-    target 3141
-    weight 35
-  ]
-  edge [
-    source 256
-    target 751
-    weight 538
-  ]
-  edge [
-    source 256
-    target 1582
-    weight 255
-  ]
-  edge [
-    source 256
-    target 1487
-    weight 384
-  ]
-  edge [
-    source 256
-    target 3521
-    weight 627
-  ]
-  edge [
-    source 256
-    target 3077
-    weight 26
-  ]
-  edge [
-    source 256
-    target 1505
-    weight 170
-  ]
-  edge [
-    source 256
-    target 1616
-    weight 538
-  ]
-  edge [
-    source 256
-    target 3145
-    weight 402
-  ]
-  edge [
-    source 256
-    target 3600
-    weight 357
-  ]
-  edge [
-    source 256
-    target 1887
-    weight 561
-  ]
-  edge [
-    source 256
-    target 1647
-    weight 280
-  ]
-  edge [
-    source 256
-    target 4051
-    weight 492
-  ]
-  edge [
-    source 256
-    target 1757
-    weight 118
-  ]
-  edge [
-    source 256
-    target 1080
-    weight 223
-  ]
-  edge [
-    source 256
-    target 774
-    weight 593
-  ]
-  edge [
-    source 256
-    target 3423
-    weight 136
-  ]
-  edge [
-    source 256
-    target 561
-    weight 22
-  ]
-  edge [
-    source 256
-    target 1053
-    weight 461
-  ]
-  edge [
-    source 256
-    target 2700
-    weight 329
-  ]
-  edge [
-    source 256
-    target 2861
-    weight 374
-  ]
-  edge [
-    source 256
-    target 3443
-    weight 229
-  ]
-  edge [
-    source 256
-    target 3565
-    weight 134
-  ]
-  edge [
-    source 256
-    target 842
-    weight 24
-  ]
-  edge [
-    source 256
-    target 3141
-    weight 577
-  ]
-  edge [
-    source 256
-    target 2890
-    weight 183
-  ]
-  edge [
-    source 256
-    target 1995
-    weight 293
-  ]
-  edge [
-    source 256
-    target 2071
-    weight 488
-  ]
-  edge [
-    source 256
-    target 738
-    weight 194
-  ]
-  edge [
-    source 256
-    target 968
-    weight 72
-  ]
-  edge [
-    source 256
-    target 3071
-    weight 23
-  ]
-  edge [
-    source 256
-    target 3917
-    weight 235
-  ]
-  edge [
-    source 256
-    target 2191
-    weight 93
-  ]
-  edge [
-    source 256
-    target 1409
-    weight 89
-  ]
-  edge [
-    source 256
-    target 2543
-    weight 92
-  ]
-  edge [
-    source 256
-    target 1360
-    weight 55
-  ]
-  edge [
-    source 256
-    target 3253
-    weight 110
-  ]
-  edge [
-    source 256
-    target 3174
-    weight 288
-  ]
-  edge [
-    source 256
-    target 1707
-    weight 33
-  ]
-  edge [
-    source 256
-    target 3937
-    weight 43
-  ]
-  edge [
-    source 256
-    target 3276
-    weight 335
-  ]
-  edge [
-    source 256
-    target 301
-    weight 266
-  ]
-  edge [
-    source 256
-    target 1632
-    weight 220
-  ]
-  edge [
-    source 256
-    target 3954
-    weight 113
-  ]
-  edge [
-    source 256
-    target 1127
-    weight 51
-  ]
-  edge [
-    source 256
-    target 456
-    weight 29
-  ]
-  edge [
-    source 256
-    target 3993
-    weight 310
-  ]
-  edge [
-    source 256
-    target 3642
-    weight 199
-  ]
-  edge [
-    source 256
-    target 321
-    weight 39
-  ]
-  edge [
-    source 256
-    target 3040
-    weight 105
-  ]
-  edge [
-    source 256
-    target 3884
-    weight 43
-  ]
-  edge [
-    source 256
-    target 2329
-    weight 45
-  ]
-  edge [
-    source 256
-    target 3847
-    weight 49
-  ]
-  edge [
-    source 256
-    target 2556
-    weight 23
-  ]
-  edge [
-    source 256
-    target 3636
-    weight 146
-  ]
-  edge [
-    source 256
-    target 2287
-    weight 117
-  ]
-  edge [
-    source 256
-    target 3432
-    weight 27
-  ]
-  edge [
-    source 256
-    target 3282
-    weight 233
-  ]
-  edge [
-    source 256
-    target 2800
-    weight 71
-  ]
-  edge [
-    source 256
-    target 927
-    weight 28
-  ]
-  edge [
-    source 256
-    target 4154
-    weight 123
-  ]
-  edge [
-    source 256
-    target 3374
-    weight 113
-  ]
-  edge [
-    source 256
-    target 3295
-    weight 74
-  ]
-  edge [
-    source 256
-    target 3420
-    weight 104
-  ]
-  edge [
-    source 256
-    target 798
-    weight 257
-  ]
-  edge [
-    source 256
-    target 2204
-    weight 119
-  ]
-  edge [
-    source 256
-    target 724
-    weight 45
-  ]
-  edge [
-    source 256
-    target 2870
-    weight 150
-  ]
-  edge [
-    source 256
-    target 1154
-    weight 43
-  ]
-  edge [
-    source 256
-    target 3542
-    weight 155
-  ]
-  edge [
-    source 256
-    target 2553
-    weight 87
-  ]
-  edge [
-    source 256
-    target 1185
-    weight 70
-  ]
-  edge [
-    source 256
-    target 4187
-    weight 25
-  ]
-  edge [
-    source 256
-    target 314
-    weight 30
-  ]
-  edge [
-    source 256
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 256
-    target 305
-    weight 31
-  ]
-  edge [
-    source 256
-    target 1938
-    weight 57
-  ]
-  edge [
-    source 256
-    target 1195
-    weight 31
-  ]
-  edge [
-    source 256
-    target 3066
-    weight 106
-  ]
-  edge [
-    source 256
-    target 2857
-    weight 199
-  ]
-  edge [
-    source 256
-    target 733
-    weight 23
-  ]
-  edge [
-    source 256
-    target 986
-    weight 45
-  ]
-  edge [
-    source 256
-    target 3006
-    weight 82
-  ]
-  edge [
-    source 256
-    target 3377
-    weight 33
-  ]
-  edge [
-    source 256
-    target 283
-    weight 21
-  ]
-  edge [
-    source 256
-    target 422
-    weight 64
-  ]
-  edge [
-    source 256
-    target 4162
-    weight 57
-  ]
-  edge [
-    source 256
-    target 2614
-    weight 36
-  ]
-  edge [
-    source 256
-    target 1254
-    weight 122
-  ]
-  edge [
-    source 256
-    target 874
-    weight 96
-  ]
-  edge [
-    source 256
-    target 490
-    weight 43
-  ]
-  edge [
-    source 256
-    target 2810
-    weight 43
-  ]
-  edge [
-    source 256
-    target 3962
-    weight 97
-  ]
-  edge [
-    source 256
-    target 1322
-    weight 55
-  ]
-  edge [
-    source 256
-    target 980
-    weight 33
-  ]
-  edge [
-    source 256
-    target 424
-    weight 21
-  ]
-  edge [
-    source 256
-    target 3177
-    weight 35
-  ]
-  edge [
-    source 256
-    target 2058
-    weight 130
-  ]
-  edge [
-    source 256
-    target 4040
-    weight 37
-  ]
-  edge [
-    source 256
-    target 1943
-    weight 23
-  ]
-  edge [
-    source 256
-    target 1523
-    weight 48
-  ]
-  edge [
-    source 256
-    target 3052
-    weight 57
-  ]
-  edge [
-    source 256
-    target 2519
-    weight 178
-  ]
-  edge [
-    source 256
-    target 2011
-    weight 21
-  ]
-  edge [
-    source 256
-    target 502
-    weight 26
-  ]
-  edge [
-    source 256
-    target 1507
-    weight 39
-  ]
-  edge [
-    source 256
-    target 1280
-    weight 29
-  ]
-  edge [
-    source 256
-    target 602
-    weight 44
-  ]
-  edge [
-    source 256
-    target 604
-    weight 51
-  ]
-  edge [
-    source 256
-    target 1420
-    weight 58
-  ]
-  edge [
-    source 256
-    target 608
-    weight 30
-  ]
-  edge [
-    source 256
-    target 3877
-    weight 31
-  ]
-  edge [
-    source 256
-    target 1970
-    weight 21
-  ]
-  edge [
-    source 256
-    target 2099
-    weight 21
-  ]
-  edge [
-    source 256
-    target 1802
-    weight 22
-  ]
-  edge [
-    source 267
-    target 3600
-    weight 35
-  ]
-  edge [
-    source 267
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 267
-    target 1409
-    weight 28
-  ]
-  edge [
-    source 267
-    target 2861
-    weight 30
-  ]
-  edge [
-    source 267
-    target 1616
-    weight 39
-  ]
-  edge [
-    source 267
-    target 1487
-    weight 42
-  ]
-  edge [
-    source 267
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 267
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 267
-    target 774
-    weight 44
-  ]
-  edge [
-    source 267
-    target 2700
-    weight 21
-  ]
-  edge [
-    source 267
-    target 301
-    weight 21
-  ]
-  edge [
-    source 267
-    target 3145
-    weight 27
-  ]
-  edge [
-    source 267
-    target 751
-    weight 40
-  ]
-  edge [
-    source 267
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 267
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 267
-    target 3174
-    weight 22
-  ]
-  edge [
-    source 267
-    target 2071
-    weight 45
-  ]
-  edge [
-    source 267
-    target 1582
-    weight 23
-  ]
-  edge [
-    source 267
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 267
-    target 1053
-    weight 26
-  ]
-  edge [
-    source 267
-    target 3993
-    weight 30
-  ]
-  edge [
-    source 281
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 281
-    target 774
-    weight 21
-  ]
-  edge [
-    source 283
-    target 3521
-    weight 667
-  ]
-  edge [
-    source 283
-    target 3565
-    weight 58
-  ]
-  edge [
-    source 283
-    target 1616
-    weight 100
-  ]
-  edge [
-    source 283
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 283
-    target 798
-    weight 24
-  ]
-  edge [
-    source 283
-    target 3276
-    weight 37
-  ]
-  edge [
-    source 283
-    target 3642
-    weight 39
-  ]
-  edge [
-    source 283
-    target 2071
-    weight 135
-  ]
-  edge [
-    source 283
-    target 1053
-    weight 71
-  ]
-  edge [
-    source 283
-    target 3847
-    weight 41
-  ]
-  edge [
-    source 283
-    target 774
-    weight 116
-  ]
-  edge [
-    source 283
-    target 2861
-    weight 149
-  ]
-  edge [
-    source 283
-    target 1582
-    weight 55
-  ]
-  edge [
-    source 283
-    target 738
-    weight 36
-  ]
-  edge [
-    source 283
-    target 1887
-    weight 101
-  ]
-  edge [
-    source 283
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 283
-    target 3600
-    weight 45
-  ]
-  edge [
-    source 283
-    target 751
-    weight 82
-  ]
-  edge [
-    source 283
-    target 1995
-    weight 42
-  ]
-  edge [
-    source 283
-    target 1647
-    weight 34
-  ]
-  edge [
-    source 283
-    target 3141
-    weight 116
-  ]
-  edge [
-    source 283
-    target 1080
-    weight 40
-  ]
-  edge [
-    source 283
-    target 4051
-    weight 133
-  ]
-  edge [
-    source 283
-    target 301
-    weight 50
-  ]
-  edge [
-    source 283
-    target 1632
-    weight 38
-  ]
-  edge [
-    source 283
-    target 1487
-    weight 47
-  ]
-  edge [
-    source 283
-    target 2700
-    weight 46
-  ]
-  edge [
-    source 283
-    target 3542
-    weight 28
-  ]
-  edge [
-    source 283
-    target 2870
-    weight 36
-  ]
-  edge [
-    source 283
-    target 3282
-    weight 23
-  ]
-  edge [
-    source 283
-    target 3993
-    weight 30
-  ]
-  edge [
-    source 283
-    target 3145
-    weight 32
-  ]
-  edge [
-    source 283
-    target 3174
-    weight 32
-  ]
-  edge [
-    source 301
-    target 2861
-    weight 1794
-  ]
-  edge [
-    source 301
-    target 751
-    weight 2494
-  ]
-  edge [
-    source 301
-    target 1616
-    weight 2806
-  ]
-  edge [
-    source 301
-    target 1080
-    weight 1081
-  ]
-  edge [
-    source 301
-    target 1487
-    weight 1890
-  ]
-  edge [
-    source 301
-    target 3521
-    weight 3388
-  ]
-  edge [
-    source 301
-    target 3565
-    weight 739
-  ]
-  edge [
-    source 301
-    target 3276
-    weight 1396
-  ]
-  edge [
-    source 301
-    target 3077
-    weight 133
-  ]
-  edge [
-    source 301
-    target 2191
-    weight 320
-  ]
-  edge [
-    source 301
-    target 561
-    weight 43
-  ]
-  edge [
-    source 301
-    target 3600
-    weight 1774
-  ]
-  edge [
-    source 301
-    target 3374
-    weight 397
-  ]
-  edge [
-    source 301
-    target 774
-    weight 2833
-  ]
-  edge [
-    source 301
-    target 3985
-    weight 45
-  ]
-  edge [
-    source 301
-    target 1254
-    weight 496
-  ]
-  edge [
-    source 301
-    target 2870
-    weight 571
-  ]
-  edge [
-    source 301
-    target 2614
-    weight 84
-  ]
-  edge [
-    source 301
-    target 874
-    weight 311
-  ]
-  edge [
-    source 301
-    target 2329
-    weight 69
-  ]
-  edge [
-    source 301
-    target 3420
-    weight 304
-  ]
-  edge [
-    source 301
-    target 1647
-    weight 1161
-  ]
-  edge [
-    source 301
-    target 3282
-    weight 672
-  ]
-  edge [
-    source 301
-    target 3542
-    weight 537
-  ]
-  edge [
-    source 301
-    target 602
-    weight 147
-  ]
-  edge [
-    source 301
-    target 3071
-    weight 44
-  ]
-  edge [
-    source 301
-    target 964
-    weight 34
-  ]
-  edge [
-    source 301
-    target 1127
-    weight 138
-  ]
-  edge [
-    source 301
-    target 1409
-    weight 325
-  ]
-  edge [
-    source 301
-    target 3917
-    weight 804
-  ]
-  edge [
-    source 301
-    target 3641
-    weight 49
-  ]
-  edge [
-    source 301
-    target 3642
-    weight 858
-  ]
-  edge [
-    source 301
-    target 2700
-    weight 1484
-  ]
-  edge [
-    source 301
-    target 3145
-    weight 1632
-  ]
-  edge [
-    source 301
-    target 1053
-    weight 2044
-  ]
-  edge [
-    source 301
-    target 1995
-    weight 1205
-  ]
-  edge [
-    source 301
-    target 4051
-    weight 2318
-  ]
-  edge [
-    source 301
-    target 3177
-    weight 96
-  ]
-  edge [
-    source 301
-    target 2071
-    weight 2405
-  ]
-  edge [
-    source 301
-    target 3636
-    weight 411
-  ]
-  edge [
-    source 301
-    target 1420
-    weight 120
-  ]
-  edge [
-    source 301
-    target 1887
-    weight 2572
-  ]
-  edge [
-    source 301
-    target 3066
-    weight 343
-  ]
-  edge [
-    source 301
-    target 1582
-    weight 1141
-  ]
-  edge [
-    source 301
-    target 3993
-    weight 1197
-  ]
-  edge [
-    source 301
-    target 798
-    weight 608
-  ]
-  edge [
-    source 301
-    target 3141
-    weight 2739
-  ]
-  edge [
-    source 301
-    target 3295
-    weight 200
-  ]
-  edge [
-    source 301
-    target 3443
-    weight 413
-  ]
-  edge [
-    source 301
-    target 630
-    weight 31
-  ]
-  edge [
-    source 301
-    target 3174
-    weight 1271
-  ]
-  edge [
-    source 301
-    target 4154
-    weight 560
-  ]
-  edge [
-    source 301
-    target 733
-    weight 68
-  ]
-  edge [
-    source 301
-    target 724
-    weight 143
-  ]
-  edge [
-    source 301
-    target 502
-    weight 84
-  ]
-  edge [
-    source 301
-    target 1333
-    weight 61
-  ]
-  edge [
-    source 301
-    target 2857
-    weight 596
-  ]
-  edge [
-    source 301
-    target 1938
-    weight 199
-  ]
-  edge [
-    source 301
-    target 1154
-    weight 149
-  ]
-  edge [
-    source 301
-    target 3962
-    weight 373
-  ]
-  edge [
-    source 301
-    target 3253
-    weight 271
-  ]
-  edge [
-    source 301
-    target 3847
-    weight 179
-  ]
-  edge [
-    source 301
-    target 1554
-    weight 30
-  ]
-  edge [
-    source 301
-    target 399
-    weight 24
-  ]
-  edge [
-    source 301
-    target 2204
-    weight 365
-  ]
-  edge [
-    source 301
-    target 1185
-    weight 224
-  ]
-  edge [
-    source 301
-    target 3937
-    weight 124
-  ]
-  edge [
-    source 301
-    target 3040
-    weight 381
-  ]
-  edge [
-    source 301
-    target 968
-    weight 262
-  ]
-  edge [
-    source 301
-    target 1505
-    weight 566
-  ]
-  edge [
-    source 301
-    target 1258
-    weight 40
-  ]
-  edge [
-    source 301
-    target 2287
-    weight 374
-  ]
-  edge [
-    source 301
-    target 2800
-    weight 172
-  ]
-  edge [
-    source 301
-    target 738
-    weight 673
-  ]
-  edge [
-    source 301
-    target 4187
-    weight 48
-  ]
-  edge [
-    source 301
-    target 2556
-    weight 36
-  ]
-  edge [
-    source 301
-    target 3006
-    weight 283
-  ]
-  edge [
-    source 301
-    target 3423
-    weight 582
-  ]
-  edge [
-    source 301
-    target 305
-    weight 79
-  ]
-  edge [
-    source 301
-    target 1632
-    weight 823
-  ]
-  edge [
-    source 301
-    target 2450
-    weight 35
-  ]
-  edge [
-    source 301
-    target 1028
-    weight 25
-  ]
-  edge [
-    source 301
-    target 3432
-    weight 48
-  ]
-  edge [
-    source 301
-    target 980
-    weight 252
-  ]
-  edge [
-    source 301
-    target 456
-    weight 66
-  ]
-  edge [
-    source 301
-    target 2890
-    weight 492
-  ]
-  edge [
-    source 301
-    target 1757
-    weight 326
-  ]
-  edge [
-    source 301
-    target 2553
-    weight 219
-  ]
-  edge [
-    source 301
-    target 3884
-    weight 73
-  ]
-  edge [
-    source 301
-    target 986
-    weight 155
-  ]
-  edge [
-    source 301
-    target 321
-    weight 98
-  ]
-  edge [
-    source 301
-    target 1419
-    weight 49
-  ]
-  edge [
-    source 301
-    target 3968
-    weight 39
-  ]
-  edge [
-    source 301
-    target 604
-    weight 190
-  ]
-  edge [
-    source 301
-    target 927
-    weight 65
-  ]
-  edge [
-    source 301
-    target 2181
-    weight 23
-  ]
-  edge [
-    source 301
-    target 4152
-    weight 51
-  ]
-  edge [
-    source 301
-    target 440
-    weight 22
-  ]
-  edge [
-    source 301
-    target 3408
-    weight 76
-  ]
-  edge [
-    source 301
-    target 1492
-    weight 27
-  ]
-  edge [
-    source 301
-    target 1676
-    weight 24
-  ]
-  edge [
-    source 301
-    target 1631
-    weight 28
-  ]
-  edge [
-    source 301
-    target 2810
-    weight 86
-  ]
-  edge [
-    source 301
-    target 1322
-    weight 113
-  ]
-  edge [
-    source 301
-    target 1360
-    weight 137
-  ]
-  edge [
-    source 301
-    target 1691
-    weight 25
-  ]
-  edge [
-    source 301
-    target 3954
-    weight 383
-  ]
-  edge [
-    source 301
-    target 2543
-    weight 260
-  ]
-  edge [
-    source 301
-    target 4027
-    weight 41
-  ]
-  edge [
-    source 301
-    target 2061
-    weight 25
-  ]
-  edge [
-    source 301
-    target 1461
-    weight 45
-  ]
-  edge [
-    source 301
-    target 2519
-    weight 571
-  ]
-  edge [
-    source 301
-    target 2009
-    weight 23
-  ]
-  edge [
-    source 301
-    target 2844
-    weight 37
-  ]
-  edge [
-    source 301
-    target 4040
-    weight 131
-  ]
-  edge [
-    source 301
-    target 1280
-    weight 107
-  ]
-  edge [
-    source 301
-    target 2711
-    weight 40
-  ]
-  edge [
-    source 301
-    target 2836
-    weight 32
-  ]
-  edge [
-    source 301
-    target 2955
-    weight 46
-  ]
-  edge [
-    source 301
-    target 424
-    weight 56
-  ]
-  edge [
-    source 301
-    target 1798
-    weight 25
-  ]
-  edge [
-    source 301
-    target 314
-    weight 116
-  ]
-  edge [
-    source 301
-    target 3935
-    weight 32
-  ]
-  edge [
-    source 301
-    target 1952
-    weight 78
-  ]
-  edge [
-    source 301
-    target 3162
-    weight 39
-  ]
-  edge [
-    source 301
-    target 3377
-    weight 98
-  ]
-  edge [
-    source 301
-    target 632
-    weight 34
-  ]
-  edge [
-    source 301
-    target 3861
-    weight 34
-  ]
-  edge [
-    source 301
-    target 422
-    weight 215
-  ]
-  edge [
-    source 301
-    target 1507
-    weight 137
-  ]
-  edge [
-    source 301
-    target 2924
-    weight 34
-  ]
-  edge [
-    source 301
-    target 3196
-    weight 47
-  ]
-  edge [
-    source 301
-    target 490
-    weight 96
-  ]
-  edge [
-    source 301
-    target 3052
-    weight 165
-  ]
-  edge [
-    source 301
-    target 2531
-    weight 32
-  ]
-  edge [
-    source 301
-    target 1577
-    weight 25
-  ]
-  edge [
-    source 301
-    target 1195
-    weight 65
-  ]
-  edge [
-    source 301
-    target 1517
-    weight 53
-  ]
-  edge [
-    source 301
-    target 717
-    weight 25
-  ]
-  edge [
-    source 301
-    target 4162
-    weight 136
-  ]
-  edge [
-    source 301
-    target 4160
-    weight 38
-  ]
-  edge [
-    source 301
-    target 2082
-    weight 30
-  ]
-  edge [
-    source 301
-    target 1943
-    weight 66
-  ]
-  edge [
-    source 301
-    target 3860
-    weight 47
-  ]
-  edge [
-    source 301
-    target 3877
-    weight 105
-  ]
-  edge [
-    source 301
-    target 3559
-    weight 25
-  ]
-  edge [
-    source 301
-    target 4098
-    weight 37
-  ]
-  edge [
-    source 301
-    target 1707
-    weight 92
-  ]
-  edge [
-    source 301
-    target 2003
-    weight 40
-  ]
-  edge [
-    source 301
-    target 2227
-    weight 58
-  ]
-  edge [
-    source 301
-    target 671
-    weight 64
-  ]
-  edge [
-    source 301
-    target 1523
-    weight 131
-  ]
-  edge [
-    source 301
-    target 712
-    weight 27
-  ]
-  edge [
-    source 301
-    target 3108
-    weight 23
-  ]
-  edge [
-    source 301
-    target 2011
-    weight 48
-  ]
-  edge [
-    source 301
-    target 3024
-    weight 34
-  ]
-  edge [
-    source 301
-    target 842
-    weight 50
-  ]
-  edge [
-    source 301
-    target 2570
-    weight 42
-  ]
-  edge [
-    source 301
-    target 608
-    weight 68
-  ]
-  edge [
-    source 301
-    target 719
-    weight 25
-  ]
-  edge [
-    source 301
-    target 505
-    weight 23
-  ]
-  edge [
-    source 301
-    target 1064
-    weight 23
-  ]
-  edge [
-    source 301
-    target 3465
-    weight 25
-  ]
-  edge [
-    source 301
-    target 2099
-    weight 42
-  ]
-  edge [
-    source 301
-    target 2743
-    weight 22
-  ]
-  edge [
-    source 301
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 301
-    target 1802
-    weight 55
-  ]
-  edge [
-    source 301
-    target 2058
-    weight 333
-  ]
-  edge [
-    source 301
-    target 689
-    weight 30
-  ]
-  edge [
-    source 301
-    target 549
-    weight 43
-  ]
-  edge [
-    source 301
-    target 1140
-    weight 23
-  ]
-  edge [
-    source 301
-    target 1125
-    weight 65
-  ]
-  edge [
-    source 301
-    target 1148
-    weight 32
-  ]
-  edge [
-    source 301
-    target 3677
-    weight 38
-  ]
-  edge [
-    source 301
-    target 2822
-    weight 34
-  ]
-  edge [
-    source 301
-    target 3872
-    weight 21
-  ]
-  edge [
-    source 301
-    target 675
-    weight 47
-  ]
-  edge [
-    source 301
-    target 347
-    weight 24
-  ]
-  edge [
-    source 301
-    target 2115
-    weight 23
-  ]
-  edge [
-    source 301
-    target 1391
-    weight 41
-  ]
-  edge [
-    source 301
-    target 1789
-    weight 24
-  ]
-  edge [
-    source 301
-    target 1970
-    weight 53
-  ]
-  edge [
-    source 301
-    target 3633
-    weight 21
-  ]
-  edge [
-    source 301
-    target 3050
-    weight 24
-  ]
-  edge [
-    source 301
-    target 869
-    weight 41
-  ]
-  edge [
-    source 301
-    target 3876
-    weight 25
-  ]
-  edge [
-    source 301
-    target 2232
-    weight 23
-  ]
-  edge [
-    source 301
-    target 2078
-    weight 72
-  ]
-  edge [
-    source 305
-    target 4051
-    weight 142
-  ]
-  edge [
-    source 305
-    target 3636
-    weight 65
-  ]
-  edge [
-    source 305
-    target 1053
-    weight 119
-  ]
-  edge [
-    source 305
-    target 3521
-    weight 214
-  ]
-  edge [
-    source 305
-    target 1995
-    weight 96
-  ]
-  edge [
-    source 305
-    target 774
-    weight 153
-  ]
-  edge [
-    source 305
-    target 3282
-    weight 57
-  ]
-  edge [
-    source 305
-    target 2071
-    weight 148
-  ]
-  edge [
-    source 305
-    target 3600
-    weight 85
-  ]
-  edge [
-    source 305
-    target 751
-    weight 142
-  ]
-  edge [
-    source 305
-    target 3423
-    weight 35
-  ]
-  edge [
-    source 305
-    target 2204
-    weight 39
-  ]
-  edge [
-    source 305
-    target 3565
-    weight 73
-  ]
-  edge [
-    source 305
-    target 1647
-    weight 61
-  ]
-  edge [
-    source 305
-    target 1409
-    weight 22
-  ]
-  edge [
-    source 305
-    target 2861
-    weight 134
-  ]
-  edge [
-    source 305
-    target 1616
-    weight 144
-  ]
-  edge [
-    source 305
-    target 3917
-    weight 44
-  ]
-  edge [
-    source 305
-    target 1487
-    weight 98
-  ]
-  edge [
-    source 305
-    target 2287
-    weight 36
-  ]
-  edge [
-    source 305
-    target 2870
-    weight 41
-  ]
-  edge [
-    source 305
-    target 738
-    weight 87
-  ]
-  edge [
-    source 305
-    target 3276
-    weight 62
-  ]
-  edge [
-    source 305
-    target 3006
-    weight 33
-  ]
-  edge [
-    source 305
-    target 3040
-    weight 30
-  ]
-  edge [
-    source 305
-    target 2543
-    weight 24
-  ]
-  edge [
-    source 305
-    target 3642
-    weight 52
-  ]
-  edge [
-    source 305
-    target 1632
-    weight 72
-  ]
-  edge [
-    source 305
-    target 1154
-    weight 24
-  ]
-  edge [
-    source 305
-    target 2191
-    weight 22
-  ]
-  edge [
-    source 305
-    target 3847
-    weight 25
-  ]
-  edge [
-    source 305
-    target 3962
-    weight 29
-  ]
-  edge [
-    source 305
-    target 3141
-    weight 157
-  ]
-  edge [
-    source 305
-    target 1887
-    weight 136
-  ]
-  edge [
-    source 305
-    target 1757
-    weight 35
-  ]
-  edge [
-    source 305
-    target 968
-    weight 21
-  ]
-  edge [
-    source 305
-    target 3253
-    weight 38
-  ]
-  edge [
-    source 305
-    target 3174
-    weight 53
-  ]
-  edge [
-    source 305
-    target 2890
-    weight 33
-  ]
-  edge [
-    source 305
-    target 1582
-    weight 61
-  ]
-  edge [
-    source 305
-    target 2700
-    weight 78
-  ]
-  edge [
-    source 305
-    target 1080
-    weight 64
-  ]
-  edge [
-    source 305
-    target 1938
-    weight 28
-  ]
-  edge [
-    source 305
-    target 2329
-    weight 24
-  ]
-  edge [
-    source 305
-    target 3954
-    weight 34
-  ]
-  edge [
-    source 305
-    target 1185
-    weight 34
-  ]
-  edge [
-    source 305
-    target 3542
-    weight 45
-  ]
-  edge [
-    source 305
-    target 3993
-    weight 57
-  ]
-  edge [
-    source 305
-    target 3145
-    weight 66
-  ]
-  edge [
-    source 305
-    target 798
-    weight 42
-  ]
-  edge [
-    source 305
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 305
-    target 3066
-    weight 34
-  ]
-  edge [
-    source 305
-    target 874
-    weight 30
-  ]
-  edge [
-    source 305
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 305
-    target 604
-    weight 27
-  ]
-  edge [
-    source 305
-    target 1505
-    weight 29
-  ]
-  edge [
-    source 305
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 305
-    target 2519
-    weight 32
-  ]
-  edge [
-    source 305
-    target 1254
-    weight 22
-  ]
-  edge [
-    source 308
-    target 774
-    weight 28
-  ]
-  edge [
-    source 308
-    target 2071
-    weight 23
-  ]
-  edge [
-    source 308
-    target 751
-    weight 24
-  ]
-  edge [
-    source 308
-    target 1887
-    weight 25
-  ]
-  edge [
-    source 308
-    target 1616
-    weight 23
-  ]
-  edge [
-    source 308
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 308
-    target 3141
-    weight 25
-  ]
-  edge [
-    source 314
-    target 3521
-    weight 309
-  ]
-  edge [
-    source 314
-    target 751
-    weight 239
-  ]
-  edge [
-    source 314
-    target 968
-    weight 28
-  ]
-  edge [
-    source 314
-    target 774
-    weight 260
-  ]
-  edge [
-    source 314
-    target 2861
-    weight 170
-  ]
-  edge [
-    source 314
-    target 2058
-    weight 50
-  ]
-  edge [
-    source 314
-    target 1995
-    weight 121
-  ]
-  edge [
-    source 314
-    target 4051
-    weight 250
-  ]
-  edge [
-    source 314
-    target 1887
-    weight 245
-  ]
-  edge [
-    source 314
-    target 3565
-    weight 57
-  ]
-  edge [
-    source 314
-    target 798
-    weight 67
-  ]
-  edge [
-    source 314
-    target 2071
-    weight 231
-  ]
-  edge [
-    source 314
-    target 1647
-    weight 114
-  ]
-  edge [
-    source 314
-    target 1053
-    weight 180
-  ]
-  edge [
-    source 314
-    target 1616
-    weight 236
-  ]
-  edge [
-    source 314
-    target 3600
-    weight 157
-  ]
-  edge [
-    source 314
-    target 3276
-    weight 110
-  ]
-  edge [
-    source 314
-    target 1487
-    weight 196
-  ]
-  edge [
-    source 314
-    target 3145
-    weight 151
-  ]
-  edge [
-    source 314
-    target 2700
-    weight 121
-  ]
-  edge [
-    source 314
-    target 3642
-    weight 63
-  ]
-  edge [
-    source 314
-    target 3282
-    weight 57
-  ]
-  edge [
-    source 314
-    target 1632
-    weight 87
-  ]
-  edge [
-    source 314
-    target 3141
-    weight 235
-  ]
-  edge [
-    source 314
-    target 2890
-    weight 50
-  ]
-  edge [
-    source 314
-    target 1582
-    weight 110
-  ]
-  edge [
-    source 314
-    target 3443
-    weight 43
-  ]
-  edge [
-    source 314
-    target 738
-    weight 65
-  ]
-  edge [
-    source 314
-    target 1080
-    weight 111
-  ]
-  edge [
-    source 314
-    target 3066
-    weight 42
-  ]
-  edge [
-    source 314
-    target 4154
-    weight 46
-  ]
-  edge [
-    source 314
-    target 3542
-    weight 65
-  ]
-  edge [
-    source 314
-    target 3374
-    weight 51
-  ]
-  edge [
-    source 314
-    target 2870
-    weight 50
-  ]
-  edge [
-    source 314
-    target 1757
-    weight 42
-  ]
-  edge [
-    source 314
-    target 2287
-    weight 60
-  ]
-  edge [
-    source 314
-    target 3295
-    weight 29
-  ]
-  edge [
-    source 314
-    target 2204
-    weight 38
-  ]
-  edge [
-    source 314
-    target 2857
-    weight 67
-  ]
-  edge [
-    source 314
-    target 3917
-    weight 81
-  ]
-  edge [
-    source 314
-    target 3962
-    weight 41
-  ]
-  edge [
-    source 314
-    target 3423
-    weight 65
-  ]
-  edge [
-    source 314
-    target 3174
-    weight 131
-  ]
-  edge [
-    source 314
-    target 422
-    weight 27
-  ]
-  edge [
-    source 314
-    target 3993
-    weight 116
-  ]
-  edge [
-    source 314
-    target 1185
-    weight 28
-  ]
-  edge [
-    source 314
-    target 1505
-    weight 72
-  ]
-  edge [
-    source 314
-    target 874
-    weight 33
-  ]
-  edge [
-    source 314
-    target 2543
-    weight 48
-  ]
-  edge [
-    source 314
-    target 2519
-    weight 65
-  ]
-  edge [
-    source 314
-    target 3954
-    weight 59
-  ]
-  edge [
-    source 314
-    target 3006
-    weight 35
-  ]
-  edge [
-    source 314
-    target 3636
-    weight 48
-  ]
-  edge [
-    source 314
-    target 3253
-    weight 41
-  ]
-  edge [
-    source 314
-    target 2553
-    weight 30
-  ]
-  edge [
-    source 314
-    target 1409
-    weight 30
-  ]
-  edge [
-    source 314
-    target 2191
-    weight 40
-  ]
-  edge [
-    source 314
-    target 3177
-    weight 21
-  ]
-  edge [
-    source 314
-    target 3040
-    weight 40
-  ]
-  edge [
-    source 314
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 314
-    target 1938
-    weight 21
-  ]
-  edge [
-    source 314
-    target 1254
-    weight 56
-  ]
-  edge [
-    source 321
-    target 2519
-    weight 56
-  ]
-  edge [
-    source 321
-    target 2071
-    weight 208
-  ]
-  edge [
-    source 321
-    target 1254
-    weight 55
-  ]
-  edge [
-    source 321
-    target 602
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3145
-    weight 114
-  ]
-  edge [
-    source 321
-    target 3600
-    weight 108
-  ]
-  edge [
-    source 321
-    target 751
-    weight 213
-  ]
-  edge [
-    source 321
-    target 1887
-    weight 192
-  ]
-  edge [
-    source 321
-    target 3565
-    weight 61
-  ]
-  edge [
-    source 321
-    target 1647
-    weight 112
-  ]
-  edge [
-    source 321
-    target 2861
-    weight 178
-  ]
-  edge [
-    source 321
-    target 1582
-    weight 73
-  ]
-  edge [
-    source 321
-    target 1616
-    weight 227
-  ]
-  edge [
-    source 321
-    target 4051
-    weight 204
-  ]
-  edge [
-    source 321
-    target 2543
-    weight 43
-  ]
-  edge [
-    source 321
-    target 3521
-    weight 246
-  ]
-  edge [
-    source 321
-    target 3276
-    weight 88
-  ]
-  edge [
-    source 321
-    target 724
-    weight 37
-  ]
-  edge [
-    source 321
-    target 1995
-    weight 192
-  ]
-  edge [
-    source 321
-    target 3954
-    weight 80
-  ]
-  edge [
-    source 321
-    target 1127
-    weight 36
-  ]
-  edge [
-    source 321
-    target 3993
-    weight 101
-  ]
-  edge [
-    source 321
-    target 3040
-    weight 105
-  ]
-  edge [
-    source 321
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 321
-    target 3642
-    weight 85
-  ]
-  edge [
-    source 321
-    target 1053
-    weight 169
-  ]
-  edge [
-    source 321
-    target 1185
-    weight 59
-  ]
-  edge [
-    source 321
-    target 1080
-    weight 141
-  ]
-  edge [
-    source 321
-    target 3636
-    weight 72
-  ]
-  edge [
-    source 321
-    target 1632
-    weight 112
-  ]
-  edge [
-    source 321
-    target 1461
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3847
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3917
-    weight 71
-  ]
-  edge [
-    source 321
-    target 1938
-    weight 21
-  ]
-  edge [
-    source 321
-    target 738
-    weight 127
-  ]
-  edge [
-    source 321
-    target 3253
-    weight 41
-  ]
-  edge [
-    source 321
-    target 774
-    weight 207
-  ]
-  edge [
-    source 321
-    target 798
-    weight 66
-  ]
-  edge [
-    source 321
-    target 2204
-    weight 50
-  ]
-  edge [
-    source 321
-    target 3006
-    weight 60
-  ]
-  edge [
-    source 321
-    target 3066
-    weight 54
-  ]
-  edge [
-    source 321
-    target 3423
-    weight 51
-  ]
-  edge [
-    source 321
-    target 1487
-    weight 142
-  ]
-  edge [
-    source 321
-    target 733
-    weight 21
-  ]
-  edge [
-    source 321
-    target 2287
-    weight 62
-  ]
-  edge [
-    source 321
-    target 2191
-    weight 40
-  ]
-  edge [
-    source 321
-    target 3282
-    weight 83
-  ]
-  edge [
-    source 321
-    target 3141
-    weight 200
-  ]
-  edge [
-    source 321
-    target 1505
-    weight 59
-  ]
-  edge [
-    source 321
-    target 1707
-    weight 25
-  ]
-  edge [
-    source 321
-    target 2810
-    weight 24
-  ]
-  edge [
-    source 321
-    target 1757
-    weight 45
-  ]
-  edge [
-    source 321
-    target 422
-    weight 31
-  ]
-  edge [
-    source 321
-    target 1154
-    weight 39
-  ]
-  edge [
-    source 321
-    target 2614
-    weight 21
-  ]
-  edge [
-    source 321
-    target 3420
-    weight 37
-  ]
-  edge [
-    source 321
-    target 2890
-    weight 38
-  ]
-  edge [
-    source 321
-    target 2870
-    weight 53
-  ]
-  edge [
-    source 321
-    target 1322
-    weight 23
-  ]
-  edge [
-    source 321
-    target 3443
-    weight 47
-  ]
-  edge [
-    source 321
-    target 3174
-    weight 97
-  ]
-  edge [
-    source 321
-    target 3052
-    weight 40
-  ]
-  edge [
-    source 321
-    target 4154
-    weight 54
-  ]
-  edge [
-    source 321
-    target 3962
-    weight 42
-  ]
-  edge [
-    source 321
-    target 3374
-    weight 39
-  ]
-  edge [
-    source 321
-    target 1409
-    weight 43
-  ]
-  edge [
-    source 321
-    target 1360
-    weight 27
-  ]
-  edge [
-    source 321
-    target 2700
-    weight 108
-  ]
-  edge [
-    source 321
-    target 2553
-    weight 37
-  ]
-  edge [
-    source 321
-    target 968
-    weight 37
-  ]
-  edge [
-    source 321
-    target 874
-    weight 39
-  ]
-  edge [
-    source 321
-    target 3542
-    weight 64
-  ]
-  edge [
-    source 321
-    target 1523
-    weight 22
-  ]
-  edge [
-    source 321
-    target 2800
-    weight 35
-  ]
-  edge [
-    source 321
-    target 3295
-    weight 30
-  ]
-  edge [
-    source 321
-    target 1280
-    weight 26
-  ]
-  edge [
-    source 321
-    target 986
-    weight 23
-  ]
-  edge [
-    source 321
-    target 3937
-    weight 21
-  ]
-  edge [
-    source 321
-    target 1507
-    weight 34
-  ]
-  edge [
-    source 321
-    target 2857
-    weight 65
-  ]
-  edge [
-    source 321
-    target 2058
-    weight 34
-  ]
-  edge [
-    source 344
-    target 1487
-    weight 83
-  ]
-  edge [
-    source 344
-    target 2861
-    weight 35
-  ]
-  edge [
-    source 344
-    target 1616
-    weight 48
-  ]
-  edge [
-    source 344
-    target 3521
-    weight 62
-  ]
-  edge [
-    source 344
-    target 774
-    weight 52
-  ]
-  edge [
-    source 344
-    target 751
-    weight 44
-  ]
-  edge [
-    source 344
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 344
-    target 3145
-    weight 24
-  ]
-  edge [
-    source 344
-    target 3141
-    weight 51
-  ]
-  edge [
-    source 344
-    target 1887
-    weight 40
-  ]
-  edge [
-    source 344
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 344
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 344
-    target 2071
-    weight 55
-  ]
-  edge [
-    source 344
-    target 1053
-    weight 23
-  ]
-  edge [
-    source 344
-    target 3423
-    weight 22
-  ]
-  edge [
-    source 347
-    target 3521
-    weight 40
-  ]
-  edge [
-    source 347
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 347
-    target 2861
-    weight 32
-  ]
-  edge [
-    source 347
-    target 1616
-    weight 38
-  ]
-  edge [
-    source 347
-    target 1647
-    weight 25
-  ]
-  edge [
-    source 347
-    target 1053
-    weight 37
-  ]
-  edge [
-    source 347
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 347
-    target 3141
-    weight 38
-  ]
-  edge [
-    source 347
-    target 2071
-    weight 37
-  ]
-  edge [
-    source 347
-    target 3600
-    weight 26
-  ]
-  edge [
-    source 347
-    target 3174
-    weight 24
-  ]
-  edge [
-    source 347
-    target 1995
-    weight 24
-  ]
-  edge [
-    source 347
-    target 751
-    weight 35
-  ]
-  edge [
-    source 347
-    target 1632
-    weight 26
-  ]
-  edge [
-    source 347
-    target 2700
-    weight 29
-  ]
-  edge [
-    source 347
-    target 1487
-    weight 28
-  ]
-  edge [
-    source 347
-    target 4051
-    weight 38
-  ]
-  edge [
-    source 347
-    target 774
-    weight 39
-  ]
-  edge [
-    source 347
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 347
-    target 798
-    weight 21
-  ]
-  edge [
-    source 347
-    target 1887
-    weight 38
-  ]
-  edge [
-    source 347
-    target 1080
-    weight 22
-  ]
-  edge [
-    source 347
-    target 2857
-    weight 26
-  ]
-  edge [
-    source 347
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 347
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 363
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 363
-    target 3521
-    weight 43
-  ]
-  edge [
-    source 363
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 363
-    target 774
-    weight 32
-  ]
-  edge [
-    source 363
-    target 751
-    weight 31
-  ]
-  edge [
-    source 363
-    target 4051
-    weight 32
-  ]
-  edge [
-    source 363
-    target 1887
-    weight 31
-  ]
-  edge [
-    source 363
-    target 2071
-    weight 32
-  ]
-  edge [
-    source 363
-    target 1053
-    weight 25
-  ]
-  edge [
-    source 363
-    target 1616
-    weight 29
-  ]
-  edge [
-    source 363
-    target 1487
-    weight 21
-  ]
-  edge [
-    source 363
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 368
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 368
-    target 1487
-    weight 58
-  ]
-  edge [
-    source 368
-    target 3600
-    weight 31
-  ]
-  edge [
-    source 368
-    target 3423
-    weight 53
-  ]
-  edge [
-    source 368
-    target 2071
-    weight 54
-  ]
-  edge [
-    source 368
-    target 1053
-    weight 28
-  ]
-  edge [
-    source 368
-    target 1616
-    weight 44
-  ]
-  edge [
-    source 368
-    target 4051
-    weight 45
-  ]
-  edge [
-    source 368
-    target 751
-    weight 48
-  ]
-  edge [
-    source 368
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 368
-    target 3141
-    weight 45
-  ]
-  edge [
-    source 368
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 368
-    target 2191
-    weight 21
-  ]
-  edge [
-    source 368
-    target 1647
-    weight 35
-  ]
-  edge [
-    source 368
-    target 774
-    weight 43
-  ]
-  edge [
-    source 368
-    target 1995
-    weight 25
-  ]
-  edge [
-    source 368
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 368
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 368
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 368
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 368
-    target 2861
-    weight 34
-  ]
-  edge [
-    source 378
-    target 3521
-    weight 129
-  ]
-  edge [
-    source 378
-    target 1487
-    weight 25
-  ]
-  edge [
-    source 378
-    target 1616
-    weight 28
-  ]
-  edge [
-    source 378
-    target 2071
-    weight 32
-  ]
-  edge [
-    source 378
-    target 3785
-    weight 26
-  ]
-  edge [
-    source 378
-    target 774
-    weight 27
-  ]
-  edge [
-    source 378
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 399
-    target 751
-    weight 63
-  ]
-  edge [
-    source 399
-    target 1616
-    weight 66
-  ]
-  edge [
-    source 399
-    target 3954
-    weight 26
-  ]
-  edge [
-    source 399
-    target 4051
-    weight 70
-  ]
-  edge [
-    source 399
-    target 3174
-    weight 31
-  ]
-  edge [
-    source 399
-    target 3521
-    weight 81
-  ]
-  edge [
-    source 399
-    target 2071
-    weight 68
-  ]
-  edge [
-    source 399
-    target 1080
-    weight 40
-  ]
-  edge [
-    source 399
-    target 2861
-    weight 52
-  ]
-  edge [
-    source 399
-    target 738
-    weight 28
-  ]
-  edge [
-    source 399
-    target 1053
-    weight 44
-  ]
-  edge [
-    source 399
-    target 3040
-    weight 21
-  ]
-  edge [
-    source 399
-    target 3141
-    weight 64
-  ]
-  edge [
-    source 399
-    target 3600
-    weight 42
-  ]
-  edge [
-    source 399
-    target 1487
-    weight 54
-  ]
-  edge [
-    source 399
-    target 774
-    weight 65
-  ]
-  edge [
-    source 399
-    target 3917
-    weight 23
-  ]
-  edge [
-    source 399
-    target 1887
-    weight 58
-  ]
-  edge [
-    source 399
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 399
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 399
-    target 1995
-    weight 34
-  ]
-  edge [
-    source 399
-    target 3276
-    weight 30
-  ]
-  edge [
-    source 399
-    target 3993
-    weight 31
-  ]
-  edge [
-    source 399
-    target 3145
-    weight 39
-  ]
-  edge [
-    source 399
-    target 1632
-    weight 28
-  ]
-  edge [
-    source 399
-    target 3423
-    weight 27
-  ]
-  edge [
-    source 399
-    target 1647
-    weight 27
-  ]
-  edge [
-    source 417
-    target 3521
-    weight 30
-  ]
-  edge [
-    source 417
-    target 774
-    weight 21
-  ]
-  edge [
-    source 417
-    target 751
-    weight 21
-  ]
-  edge [
-    source 417
-    target 1616
-    weight 21
-  ]
-  edge [
-    source 417
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 419
-    target 1487
-    weight 33
-  ]
-  edge [
-    source 419
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 419
-    target 2071
-    weight 25
-  ]
-  edge [
-    source 419
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 422
-    target 3521
-    weight 434
-  ]
-  edge [
-    source 422
-    target 1995
-    weight 204
-  ]
-  edge [
-    source 422
-    target 774
-    weight 400
-  ]
-  edge [
-    source 422
-    target 751
-    weight 380
-  ]
-  edge [
-    source 422
-    target 2861
-    weight 287
-  ]
-  edge [
-    source 422
-    target 3600
-    weight 220
-  ]
-  edge [
-    source 422
-    target 1616
-    weight 399
-  ]
-  edge [
-    source 422
-    target 3253
-    weight 72
-  ]
-  edge [
-    source 422
-    target 3993
-    weight 184
-  ]
-  edge [
-    source 422
-    target 4051
-    weight 348
-  ]
-  edge [
-    source 422
-    target 1647
-    weight 191
-  ]
-  edge [
-    source 422
-    target 3282
-    weight 132
-  ]
-  edge [
-    source 422
-    target 3542
-    weight 143
-  ]
-  edge [
-    source 422
-    target 3141
-    weight 381
-  ]
-  edge [
-    source 422
-    target 4027
-    weight 21
-  ]
-  edge [
-    source 422
-    target 1632
-    weight 179
-  ]
-  edge [
-    source 422
-    target 3420
-    weight 72
-  ]
-  edge [
-    source 422
-    target 2700
-    weight 227
-  ]
-  edge [
-    source 422
-    target 3636
-    weight 92
-  ]
-  edge [
-    source 422
-    target 1080
-    weight 194
-  ]
-  edge [
-    source 422
-    target 1487
-    weight 252
-  ]
-  edge [
-    source 422
-    target 798
-    weight 119
-  ]
-  edge [
-    source 422
-    target 3006
-    weight 84
-  ]
-  edge [
-    source 422
-    target 2071
-    weight 337
-  ]
-  edge [
-    source 422
-    target 3040
-    weight 95
-  ]
-  edge [
-    source 422
-    target 1127
-    weight 43
-  ]
-  edge [
-    source 422
-    target 724
-    weight 59
-  ]
-  edge [
-    source 422
-    target 1887
-    weight 372
-  ]
-  edge [
-    source 422
-    target 1195
-    weight 36
-  ]
-  edge [
-    source 422
-    target 3954
-    weight 104
-  ]
-  edge [
-    source 422
-    target 3847
-    weight 35
-  ]
-  edge [
-    source 422
-    target 3642
-    weight 124
-  ]
-  edge [
-    source 422
-    target 3884
-    weight 23
-  ]
-  edge [
-    source 422
-    target 738
-    weight 158
-  ]
-  edge [
-    source 422
-    target 1461
-    weight 28
-  ]
-  edge [
-    source 422
-    target 2329
-    weight 21
-  ]
-  edge [
-    source 422
-    target 1053
-    weight 291
-  ]
-  edge [
-    source 422
-    target 3565
-    weight 102
-  ]
-  edge [
-    source 422
-    target 424
-    weight 36
-  ]
-  edge [
-    source 422
-    target 1322
-    weight 35
-  ]
-  edge [
-    source 422
-    target 2543
-    weight 80
-  ]
-  edge [
-    source 422
-    target 3174
-    weight 219
-  ]
-  edge [
-    source 422
-    target 4154
-    weight 222
-  ]
-  edge [
-    source 422
-    target 927
-    weight 21
-  ]
-  edge [
-    source 422
-    target 2204
-    weight 89
-  ]
-  edge [
-    source 422
-    target 4162
-    weight 41
-  ]
-  edge [
-    source 422
-    target 2287
-    weight 94
-  ]
-  edge [
-    source 422
-    target 3276
-    weight 192
-  ]
-  edge [
-    source 422
-    target 3377
-    weight 22
-  ]
-  edge [
-    source 422
-    target 1254
-    weight 128
-  ]
-  edge [
-    source 422
-    target 502
-    weight 33
-  ]
-  edge [
-    source 422
-    target 1505
-    weight 105
-  ]
-  edge [
-    source 422
-    target 3917
-    weight 159
-  ]
-  edge [
-    source 422
-    target 1707
-    weight 35
-  ]
-  edge [
-    source 422
-    target 3066
-    weight 74
-  ]
-  edge [
-    source 422
-    target 2810
-    weight 33
-  ]
-  edge [
-    source 422
-    target 3052
-    weight 63
-  ]
-  edge [
-    source 422
-    target 2553
-    weight 55
-  ]
-  edge [
-    source 422
-    target 986
-    weight 24
-  ]
-  edge [
-    source 422
-    target 2857
-    weight 137
-  ]
-  edge [
-    source 422
-    target 2890
-    weight 105
-  ]
-  edge [
-    source 422
-    target 1582
-    weight 202
-  ]
-  edge [
-    source 422
-    target 4040
-    weight 34
-  ]
-  edge [
-    source 422
-    target 1185
-    weight 71
-  ]
-  edge [
-    source 422
-    target 1154
-    weight 30
-  ]
-  edge [
-    source 422
-    target 3077
-    weight 22
-  ]
-  edge [
-    source 422
-    target 3962
-    weight 50
-  ]
-  edge [
-    source 422
-    target 1952
-    weight 22
-  ]
-  edge [
-    source 422
-    target 2191
-    weight 72
-  ]
-  edge [
-    source 422
-    target 1938
-    weight 57
-  ]
-  edge [
-    source 422
-    target 1757
-    weight 64
-  ]
-  edge [
-    source 422
-    target 1507
-    weight 61
-  ]
-  edge [
-    source 422
-    target 1280
-    weight 27
-  ]
-  edge [
-    source 422
-    target 3443
-    weight 85
-  ]
-  edge [
-    source 422
-    target 2519
-    weight 128
-  ]
-  edge [
-    source 422
-    target 1409
-    weight 41
-  ]
-  edge [
-    source 422
-    target 1523
-    weight 40
-  ]
-  edge [
-    source 422
-    target 2800
-    weight 47
-  ]
-  edge [
-    source 422
-    target 2614
-    weight 26
-  ]
-  edge [
-    source 422
-    target 874
-    weight 74
-  ]
-  edge [
-    source 422
-    target 2870
-    weight 106
-  ]
-  edge [
-    source 422
-    target 3145
-    weight 262
-  ]
-  edge [
-    source 422
-    target 968
-    weight 55
-  ]
-  edge [
-    source 422
-    target 1360
-    weight 43
-  ]
-  edge [
-    source 422
-    target 604
-    weight 39
-  ]
-  edge [
-    source 422
-    target 3423
-    weight 102
-  ]
-  edge [
-    source 422
-    target 3937
-    weight 36
-  ]
-  edge [
-    source 422
-    target 1420
-    weight 34
-  ]
-  edge [
-    source 422
-    target 3877
-    weight 26
-  ]
-  edge [
-    source 422
-    target 3374
-    weight 78
-  ]
-  edge [
-    source 422
-    target 980
-    weight 30
-  ]
-  edge [
-    source 422
-    target 490
-    weight 27
-  ]
-  edge [
-    source 422
-    target 602
-    weight 48
-  ]
-  edge [
-    source 422
-    target 3295
-    weight 50
-  ]
-  edge [
-    source 422
-    target 842
-    weight 24
-  ]
-  edge [
-    source 422
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 422
-    target 2058
-    weight 56
-  ]
-  edge [
-    source 422
-    target 2078
-    weight 26
-  ]
-  edge [
-    source 423
-    target 3521
-    weight 34
-  ]
-  edge [
-    source 423
-    target 1053
-    weight 27
-  ]
-  edge [
-    source 423
-    target 2861
-    weight 28
-  ]
-  edge [
-    source 423
-    target 1887
-    weight 34
-  ]
-  edge [
-    source 423
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 423
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 423
-    target 751
-    weight 30
-  ]
-  edge [
-    source 423
-    target 1616
-    weight 34
-  ]
-  edge [
-    source 423
-    target 774
-    weight 32
-  ]
-  edge [
-    source 423
-    target 1995
-    weight 24
-  ]
-  edge [
-    source 423
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 423
-    target 3145
-    weight 22
-  ]
-  edge [
-    source 423
-    target 3600
-    weight 25
-  ]
-  edge [
-    source 423
-    target 1647
-    weight 23
-  ]
-  edge [
-    source 423
-    target 1487
-    weight 29
-  ]
-  edge [
-    source 423
-    target 2700
-    weight 23
-  ]
-  edge [
-    source 424
-    target 774
-    weight 114
-  ]
-  edge [
-    source 424
-    target 1632
-    weight 73
-  ]
-  edge [
-    source 424
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 424
-    target 2071
-    weight 109
-  ]
-  edge [
-    source 424
-    target 3145
-    weight 85
-  ]
-  edge [
-    source 424
-    target 3600
-    weight 54
-  ]
-  edge [
-    source 424
-    target 751
-    weight 120
-  ]
-  edge [
-    source 424
-    target 874
-    weight 21
-  ]
-  edge [
-    source 424
-    target 1616
-    weight 130
-  ]
-  edge [
-    source 424
-    target 4051
-    weight 118
-  ]
-  edge [
-    source 424
-    target 1487
-    weight 79
-  ]
-  edge [
-    source 424
-    target 3642
-    weight 48
-  ]
-  edge [
-    source 424
-    target 3443
-    weight 27
-  ]
-  edge [
-    source 424
-    target 2800
-    weight 23
-  ]
-  edge [
-    source 424
-    target 3993
-    weight 56
-  ]
-  edge [
-    source 424
-    target 3276
-    weight 57
-  ]
-  edge [
-    source 424
-    target 3521
-    weight 133
-  ]
-  edge [
-    source 424
-    target 1053
-    weight 83
-  ]
-  edge [
-    source 424
-    target 3377
-    weight 21
-  ]
-  edge [
-    source 424
-    target 2861
-    weight 108
-  ]
-  edge [
-    source 424
-    target 1995
-    weight 68
-  ]
-  edge [
-    source 424
-    target 3253
-    weight 27
-  ]
-  edge [
-    source 424
-    target 3006
-    weight 49
-  ]
-  edge [
-    source 424
-    target 3066
-    weight 48
-  ]
-  edge [
-    source 424
-    target 738
-    weight 56
-  ]
-  edge [
-    source 424
-    target 3052
-    weight 28
-  ]
-  edge [
-    source 424
-    target 1505
-    weight 41
-  ]
-  edge [
-    source 424
-    target 724
-    weight 36
-  ]
-  edge [
-    source 424
-    target 1254
-    weight 48
-  ]
-  edge [
-    source 424
-    target 2287
-    weight 45
-  ]
-  edge [
-    source 424
-    target 1080
-    weight 70
-  ]
-  edge [
-    source 424
-    target 3565
-    weight 26
-  ]
-  edge [
-    source 424
-    target 3174
-    weight 71
-  ]
-  edge [
-    source 424
-    target 3954
-    weight 55
-  ]
-  edge [
-    source 424
-    target 1887
-    weight 117
-  ]
-  edge [
-    source 424
-    target 1360
-    weight 33
-  ]
-  edge [
-    source 424
-    target 2700
-    weight 71
-  ]
-  edge [
-    source 424
-    target 2543
-    weight 38
-  ]
-  edge [
-    source 424
-    target 1461
-    weight 22
-  ]
-  edge [
-    source 424
-    target 3636
-    weight 33
-  ]
-  edge [
-    source 424
-    target 3282
-    weight 48
-  ]
-  edge [
-    source 424
-    target 798
-    weight 43
-  ]
-  edge [
-    source 424
-    target 3040
-    weight 37
-  ]
-  edge [
-    source 424
-    target 1647
-    weight 60
-  ]
-  edge [
-    source 424
-    target 4154
-    weight 48
-  ]
-  edge [
-    source 424
-    target 2870
-    weight 45
-  ]
-  edge [
-    source 424
-    target 1582
-    weight 55
-  ]
-  edge [
-    source 424
-    target 2204
-    weight 27
-  ]
-  edge [
-    source 424
-    target 2519
-    weight 42
-  ]
-  edge [
-    source 424
-    target 1185
-    weight 30
-  ]
-  edge [
-    source 424
-    target 4162
-    weight 30
-  ]
-  edge [
-    source 424
-    target 3420
-    weight 29
-  ]
-  edge [
-    source 424
-    target 602
-    weight 30
-  ]
-  edge [
-    source 424
-    target 3374
-    weight 24
-  ]
-  edge [
-    source 424
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 424
-    target 2857
-    weight 44
-  ]
-  edge [
-    source 424
-    target 1938
-    weight 22
-  ]
-  edge [
-    source 424
-    target 1507
-    weight 28
-  ]
-  edge [
-    source 424
-    target 3917
-    weight 47
-  ]
-  edge [
-    source 424
-    target 3423
-    weight 31
-  ]
-  edge [
-    source 440
-    target 3600
-    weight 30
-  ]
-  edge [
-    source 440
-    target 751
-    weight 56
-  ]
-  edge [
-    source 440
-    target 2861
-    weight 53
-  ]
-  edge [
-    source 440
-    target 1616
-    weight 59
-  ]
-  edge [
-    source 440
-    target 3521
-    weight 100
-  ]
-  edge [
-    source 440
-    target 2071
-    weight 55
-  ]
-  edge [
-    source 440
-    target 774
-    weight 60
-  ]
-  edge [
-    source 440
-    target 1995
-    weight 26
-  ]
-  edge [
-    source 440
-    target 3141
-    weight 56
-  ]
-  edge [
-    source 440
-    target 3145
-    weight 30
-  ]
-  edge [
-    source 440
-    target 1887
-    weight 53
-  ]
-  edge [
-    source 440
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 440
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 440
-    target 1487
-    weight 41
-  ]
-  edge [
-    source 440
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 440
-    target 738
-    weight 27
-  ]
-  edge [
-    source 440
-    target 1080
-    weight 27
-  ]
-  edge [
-    source 440
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 440
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 440
-    target 1053
-    weight 39
-  ]
-  edge [
-    source 440
-    target 4051
-    weight 51
-  ]
-  edge [
-    source 448
-    target 774
-    weight 36
-  ]
-  edge [
-    source 448
-    target 751
-    weight 34
-  ]
-  edge [
-    source 448
-    target 1616
-    weight 36
-  ]
-  edge [
-    source 448
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 448
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 448
-    target 2861
-    weight 27
-  ]
-  edge [
-    source 448
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 448
-    target 1053
-    weight 25
-  ]
-  edge [
-    source 448
-    target 1887
-    weight 28
-  ]
-  edge [
-    source 448
-    target 2071
-    weight 34
-  ]
-  edge [
-    source 448
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 448
-    target 1487
-    weight 22
-  ]
-  edge [
-    source 456
-    target 1995
-    weight 79
-  ]
-  edge [
-    source 456
-    target 1616
-    weight 166
-  ]
-  edge [
-    source 456
-    target 3521
-    weight 164
-  ]
-  edge [
-    source 456
-    target 3040
-    weight 36
-  ]
-  edge [
-    source 456
-    target 3141
-    weight 137
-  ]
-  edge [
-    source 456
-    target 2071
-    weight 124
-  ]
-  edge [
-    source 456
-    target 751
-    weight 133
-  ]
-  edge [
-    source 456
-    target 3295
-    weight 28
-  ]
-  edge [
-    source 456
-    target 1887
-    weight 143
-  ]
-  edge [
-    source 456
-    target 3565
-    weight 44
-  ]
-  edge [
-    source 456
-    target 2861
-    weight 117
-  ]
-  edge [
-    source 456
-    target 4051
-    weight 132
-  ]
-  edge [
-    source 456
-    target 1487
-    weight 84
-  ]
-  edge [
-    source 456
-    target 3642
-    weight 102
-  ]
-  edge [
-    source 456
-    target 1080
-    weight 87
-  ]
-  edge [
-    source 456
-    target 1053
-    weight 113
-  ]
-  edge [
-    source 456
-    target 3636
-    weight 39
-  ]
-  edge [
-    source 456
-    target 1127
-    weight 32
-  ]
-  edge [
-    source 456
-    target 3443
-    weight 33
-  ]
-  edge [
-    source 456
-    target 3600
-    weight 74
-  ]
-  edge [
-    source 456
-    target 774
-    weight 148
-  ]
-  edge [
-    source 456
-    target 3954
-    weight 47
-  ]
-  edge [
-    source 456
-    target 3993
-    weight 69
-  ]
-  edge [
-    source 456
-    target 3276
-    weight 73
-  ]
-  edge [
-    source 456
-    target 3282
-    weight 57
-  ]
-  edge [
-    source 456
-    target 1647
-    weight 64
-  ]
-  edge [
-    source 456
-    target 738
-    weight 56
-  ]
-  edge [
-    source 456
-    target 2700
-    weight 84
-  ]
-  edge [
-    source 456
-    target 2543
-    weight 30
-  ]
-  edge [
-    source 456
-    target 798
-    weight 45
-  ]
-  edge [
-    source 456
-    target 2870
-    weight 35
-  ]
-  edge [
-    source 456
-    target 3145
-    weight 88
-  ]
-  edge [
-    source 456
-    target 2857
-    weight 40
-  ]
-  edge [
-    source 456
-    target 3066
-    weight 31
-  ]
-  edge [
-    source 456
-    target 3006
-    weight 39
-  ]
-  edge [
-    source 456
-    target 2890
-    weight 40
-  ]
-  edge [
-    source 456
-    target 3253
-    weight 33
-  ]
-  edge [
-    source 456
-    target 1582
-    weight 59
-  ]
-  edge [
-    source 456
-    target 1505
-    weight 33
-  ]
-  edge [
-    source 456
-    target 604
-    weight 24
-  ]
-  edge [
-    source 456
-    target 1632
-    weight 70
-  ]
-  edge [
-    source 456
-    target 3423
-    weight 21
-  ]
-  edge [
-    source 456
-    target 3174
-    weight 80
-  ]
-  edge [
-    source 456
-    target 3917
-    weight 58
-  ]
-  edge [
-    source 456
-    target 2191
-    weight 22
-  ]
-  edge [
-    source 456
-    target 1254
-    weight 31
-  ]
-  edge [
-    source 456
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 456
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 456
-    target 2204
-    weight 25
-  ]
-  edge [
-    source 456
-    target 3542
-    weight 36
-  ]
-  edge [
-    source 456
-    target 2519
-    weight 30
-  ]
-  edge [
-    source 490
-    target 1995
-    weight 150
-  ]
-  edge [
-    source 490
-    target 2861
-    weight 171
-  ]
-  edge [
-    source 490
-    target 1616
-    weight 240
-  ]
-  edge [
-    source 490
-    target 3521
-    weight 259
-  ]
-  edge [
-    source 490
-    target 3253
-    weight 103
-  ]
-  edge [
-    source 490
-    target 3006
-    weight 47
-  ]
-  edge [
-    source 490
-    target 3040
-    weight 45
-  ]
-  edge [
-    source 490
-    target 4051
-    weight 206
-  ]
-  edge [
-    source 490
-    target 1632
-    weight 94
-  ]
-  edge [
-    source 490
-    target 3066
-    weight 59
-  ]
-  edge [
-    source 490
-    target 738
-    weight 105
-  ]
-  edge [
-    source 490
-    target 3052
-    weight 49
-  ]
-  edge [
-    source 490
-    target 751
-    weight 231
-  ]
-  edge [
-    source 490
-    target 1505
-    weight 79
-  ]
-  edge [
-    source 490
-    target 724
-    weight 28
-  ]
-  edge [
-    source 490
-    target 1254
-    weight 79
-  ]
-  edge [
-    source 490
-    target 2287
-    weight 45
-  ]
-  edge [
-    source 490
-    target 1053
-    weight 179
-  ]
-  edge [
-    source 490
-    target 3642
-    weight 109
-  ]
-  edge [
-    source 490
-    target 3954
-    weight 49
-  ]
-  edge [
-    source 490
-    target 3295
-    weight 79
-  ]
-  edge [
-    source 490
-    target 3141
-    weight 216
-  ]
-  edge [
-    source 490
-    target 1487
-    weight 155
-  ]
-  edge [
-    source 490
-    target 2543
-    weight 55
-  ]
-  edge [
-    source 490
-    target 3196
-    weight 27
-  ]
-  edge [
-    source 490
-    target 3600
-    weight 141
-  ]
-  edge [
-    source 490
-    target 774
-    weight 219
-  ]
-  edge [
-    source 490
-    target 2071
-    weight 198
-  ]
-  edge [
-    source 490
-    target 1360
-    weight 34
-  ]
-  edge [
-    source 490
-    target 3174
-    weight 152
-  ]
-  edge [
-    source 490
-    target 1887
-    weight 209
-  ]
-  edge [
-    source 490
-    target 1707
-    weight 25
-  ]
-  edge [
-    source 490
-    target 1080
-    weight 122
-  ]
-  edge [
-    source 490
-    target 3565
-    weight 45
-  ]
-  edge [
-    source 490
-    target 3993
-    weight 107
-  ]
-  edge [
-    source 490
-    target 3276
-    weight 120
-  ]
-  edge [
-    source 490
-    target 3443
-    weight 53
-  ]
-  edge [
-    source 490
-    target 3145
-    weight 160
-  ]
-  edge [
-    source 490
-    target 1507
-    weight 28
-  ]
-  edge [
-    source 490
-    target 2700
-    weight 99
-  ]
-  edge [
-    source 490
-    target 2191
-    weight 42
-  ]
-  edge [
-    source 490
-    target 1582
-    weight 101
-  ]
-  edge [
-    source 490
-    target 1185
-    weight 54
-  ]
-  edge [
-    source 490
-    target 874
-    weight 52
-  ]
-  edge [
-    source 490
-    target 3636
-    weight 48
-  ]
-  edge [
-    source 490
-    target 2890
-    weight 48
-  ]
-  edge [
-    source 490
-    target 1523
-    weight 67
-  ]
-  edge [
-    source 490
-    target 3542
-    weight 88
-  ]
-  edge [
-    source 490
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 490
-    target 604
-    weight 41
-  ]
-  edge [
-    source 490
-    target 1647
-    weight 100
-  ]
-  edge [
-    source 490
-    target 3917
-    weight 87
-  ]
-  edge [
-    source 490
-    target 4154
-    weight 41
-  ]
-  edge [
-    source 490
-    target 2519
-    weight 66
-  ]
-  edge [
-    source 490
-    target 2204
-    weight 52
-  ]
-  edge [
-    source 490
-    target 1127
-    weight 27
-  ]
-  edge [
-    source 490
-    target 3374
-    weight 50
-  ]
-  edge [
-    source 490
-    target 798
-    weight 94
-  ]
-  edge [
-    source 490
-    target 1757
-    weight 31
-  ]
-  edge [
-    source 490
-    target 968
-    weight 40
-  ]
-  edge [
-    source 490
-    target 3423
-    weight 54
-  ]
-  edge [
-    source 490
-    target 1409
-    weight 25
-  ]
-  edge [
-    source 490
-    target 2857
-    weight 72
-  ]
-  edge [
-    source 490
-    target 3282
-    weight 68
-  ]
-  edge [
-    source 490
-    target 3962
-    weight 28
-  ]
-  edge [
-    source 490
-    target 2870
-    weight 57
-  ]
-  edge [
-    source 490
-    target 1938
-    weight 28
-  ]
-  edge [
-    source 490
-    target 4162
-    weight 28
-  ]
-  edge [
-    source 490
-    target 2058
-    weight 36
-  ]
-  edge [
-    source 490
-    target 1154
-    weight 22
-  ]
-  edge [
-    source 490
-    target 2553
-    weight 36
-  ]
-  edge [
-    source 502
-    target 3423
-    weight 179
-  ]
-  edge [
-    source 502
-    target 1487
-    weight 251
-  ]
-  edge [
-    source 502
-    target 3600
-    weight 133
-  ]
-  edge [
-    source 502
-    target 2861
-    weight 170
-  ]
-  edge [
-    source 502
-    target 751
-    weight 226
-  ]
-  edge [
-    source 502
-    target 2191
-    weight 92
-  ]
-  edge [
-    source 502
-    target 3565
-    weight 38
-  ]
-  edge [
-    source 502
-    target 1647
-    weight 141
-  ]
-  edge [
-    source 502
-    target 1080
-    weight 108
-  ]
-  edge [
-    source 502
-    target 3521
-    weight 275
-  ]
-  edge [
-    source 502
-    target 1616
-    weight 208
-  ]
-  edge [
-    source 502
-    target 986
-    weight 63
-  ]
-  edge [
-    source 502
-    target 1995
-    weight 112
-  ]
-  edge [
-    source 502
-    target 2071
-    weight 249
-  ]
-  edge [
-    source 502
-    target 774
-    weight 209
-  ]
-  edge [
-    source 502
-    target 3937
-    weight 50
-  ]
-  edge [
-    source 502
-    target 671
-    weight 28
-  ]
-  edge [
-    source 502
-    target 3177
-    weight 23
-  ]
-  edge [
-    source 502
-    target 1053
-    weight 140
-  ]
-  edge [
-    source 502
-    target 1887
-    weight 187
-  ]
-  edge [
-    source 502
-    target 3917
-    weight 90
-  ]
-  edge [
-    source 502
-    target 1582
-    weight 90
-  ]
-  edge [
-    source 502
-    target 602
-    weight 24
-  ]
-  edge [
-    source 502
-    target 2058
-    weight 56
-  ]
-  edge [
-    source 502
-    target 4051
-    weight 198
-  ]
-  edge [
-    source 502
-    target 3993
-    weight 127
-  ]
-  edge [
-    source 502
-    target 1154
-    weight 25
-  ]
-  edge [
-    source 502
-    target 3077
-    weight 59
-  ]
-  edge [
-    source 502
-    target 2227
-    weight 21
-  ]
-  edge [
-    source 502
-    target 3962
-    weight 80
-  ]
-  edge [
-    source 502
-    target 3066
-    weight 44
-  ]
-  edge [
-    source 502
-    target 3040
-    weight 46
-  ]
-  edge [
-    source 502
-    target 3642
-    weight 59
-  ]
-  edge [
-    source 502
-    target 3006
-    weight 39
-  ]
-  edge [
-    source 502
-    target 1952
-    weight 27
-  ]
-  edge [
-    source 502
-    target 1333
-    weight 22
-  ]
-  edge [
-    source 502
-    target 1254
-    weight 60
-  ]
-  edge [
-    source 502
-    target 3636
-    weight 36
-  ]
-  edge [
-    source 502
-    target 3141
-    weight 207
-  ]
-  edge [
-    source 502
-    target 2204
-    weight 38
-  ]
-  edge [
-    source 502
-    target 1632
-    weight 84
-  ]
-  edge [
-    source 502
-    target 2810
-    weight 34
-  ]
-  edge [
-    source 502
-    target 2700
-    weight 94
-  ]
-  edge [
-    source 502
-    target 1409
-    weight 55
-  ]
-  edge [
-    source 502
-    target 3145
-    weight 138
-  ]
-  edge [
-    source 502
-    target 738
-    weight 68
-  ]
-  edge [
-    source 502
-    target 1505
-    weight 80
-  ]
-  edge [
-    source 502
-    target 3174
-    weight 102
-  ]
-  edge [
-    source 502
-    target 1757
-    weight 45
-  ]
-  edge [
-    source 502
-    target 2287
-    weight 55
-  ]
-  edge [
-    source 502
-    target 4154
-    weight 38
-  ]
-  edge [
-    source 502
-    target 2543
-    weight 27
-  ]
-  edge [
-    source 502
-    target 968
-    weight 32
-  ]
-  edge [
-    source 502
-    target 3253
-    weight 32
-  ]
-  edge [
-    source 502
-    target 3282
-    weight 64
-  ]
-  edge [
-    source 502
-    target 2870
-    weight 51
-  ]
-  edge [
-    source 502
-    target 3276
-    weight 107
-  ]
-  edge [
-    source 502
-    target 3408
-    weight 26
-  ]
-  edge [
-    source 502
-    target 3374
-    weight 68
-  ]
-  edge [
-    source 502
-    target 2800
-    weight 41
-  ]
-  edge [
-    source 502
-    target 3443
-    weight 42
-  ]
-  edge [
-    source 502
-    target 604
-    weight 21
-  ]
-  edge [
-    source 502
-    target 2519
-    weight 59
-  ]
-  edge [
-    source 502
-    target 3420
-    weight 46
-  ]
-  edge [
-    source 502
-    target 798
-    weight 61
-  ]
-  edge [
-    source 502
-    target 2857
-    weight 65
-  ]
-  edge [
-    source 502
-    target 874
-    weight 40
-  ]
-  edge [
-    source 502
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 502
-    target 2890
-    weight 34
-  ]
-  edge [
-    source 502
-    target 3954
-    weight 48
-  ]
-  edge [
-    source 502
-    target 1185
-    weight 44
-  ]
-  edge [
-    source 502
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 502
-    target 2553
-    weight 28
-  ]
-  edge [
-    source 502
-    target 2078
-    weight 25
-  ]
-  edge [
-    source 502
-    target 1507
-    weight 23
-  ]
-  edge [
-    source 505
-    target 751
-    weight 67
-  ]
-  edge [
-    source 505
-    target 1616
-    weight 63
-  ]
-  edge [
-    source 505
-    target 3521
-    weight 68
-  ]
-  edge [
-    source 505
-    target 3276
-    weight 34
-  ]
-  edge [
-    source 505
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 505
-    target 2071
-    weight 60
-  ]
-  edge [
-    source 505
-    target 774
-    weight 65
-  ]
-  edge [
-    source 505
-    target 1995
-    weight 34
-  ]
-  edge [
-    source 505
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 505
-    target 1487
-    weight 52
-  ]
-  edge [
-    source 505
-    target 1080
-    weight 33
-  ]
-  edge [
-    source 505
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 505
-    target 3374
-    weight 24
-  ]
-  edge [
-    source 505
-    target 3141
-    weight 56
-  ]
-  edge [
-    source 505
-    target 2861
-    weight 48
-  ]
-  edge [
-    source 505
-    target 4051
-    weight 58
-  ]
-  edge [
-    source 505
-    target 1254
-    weight 24
-  ]
-  edge [
-    source 505
-    target 1887
-    weight 51
-  ]
-  edge [
-    source 505
-    target 1647
-    weight 34
-  ]
-  edge [
-    source 505
-    target 1505
-    weight 36
-  ]
-  edge [
-    source 505
-    target 738
-    weight 27
-  ]
-  edge [
-    source 505
-    target 3993
-    weight 38
-  ]
-  edge [
-    source 505
-    target 3600
-    weight 45
-  ]
-  edge [
-    source 505
-    target 1053
-    weight 41
-  ]
-  edge [
-    source 505
-    target 1632
-    weight 21
-  ]
-  edge [
-    source 505
-    target 3145
-    weight 40
-  ]
-  edge [
-    source 505
-    target 2857
-    weight 22
-  ]
-  edge [
-    source 505
-    target 1582
-    weight 26
-  ]
-  edge [
-    source 505
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 548
-    target 774
-    weight 24
-  ]
-  edge [
-    source 548
-    target 751
-    weight 24
-  ]
-  edge [
-    source 548
-    target 1616
-    weight 23
-  ]
-  edge [
-    source 548
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 548
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 548
-    target 3521
-    weight 27
-  ]
-  edge [
-    source 548
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 549
-    target 3521
-    weight 121
-  ]
-  edge [
-    source 549
-    target 1616
-    weight 108
-  ]
-  edge [
-    source 549
-    target 1487
-    weight 81
-  ]
-  edge [
-    source 549
-    target 774
-    weight 113
-  ]
-  edge [
-    source 549
-    target 2890
-    weight 37
-  ]
-  edge [
-    source 549
-    target 1080
-    weight 42
-  ]
-  edge [
-    source 549
-    target 1887
-    weight 113
-  ]
-  edge [
-    source 549
-    target 3145
-    weight 74
-  ]
-  edge [
-    source 549
-    target 751
-    weight 97
-  ]
-  edge [
-    source 549
-    target 1053
-    weight 72
-  ]
-  edge [
-    source 549
-    target 3600
-    weight 70
-  ]
-  edge [
-    source 549
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 549
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 549
-    target 2700
-    weight 54
-  ]
-  edge [
-    source 549
-    target 2861
-    weight 64
-  ]
-  edge [
-    source 549
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 549
-    target 3276
-    weight 65
-  ]
-  edge [
-    source 549
-    target 2071
-    weight 99
-  ]
-  edge [
-    source 549
-    target 3174
-    weight 59
-  ]
-  edge [
-    source 549
-    target 4051
-    weight 85
-  ]
-  edge [
-    source 549
-    target 3423
-    weight 28
-  ]
-  edge [
-    source 549
-    target 1582
-    weight 52
-  ]
-  edge [
-    source 549
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 549
-    target 1647
-    weight 48
-  ]
-  edge [
-    source 549
-    target 1632
-    weight 22
-  ]
-  edge [
-    source 549
-    target 798
-    weight 24
-  ]
-  edge [
-    source 549
-    target 3993
-    weight 44
-  ]
-  edge [
-    source 549
-    target 1995
-    weight 43
-  ]
-  edge [
-    source 549
-    target 3642
-    weight 34
-  ]
-  edge [
-    source 549
-    target 2519
-    weight 30
-  ]
-  edge [
-    source 549
-    target 3443
-    weight 22
-  ]
-  edge [
-    source 549
-    target 3282
-    weight 25
-  ]
-  edge [
-    source 549
-    target 2058
-    weight 21
-  ]
-  edge [
-    source 561
-    target 751
-    weight 86
-  ]
-  edge [
-    source 561
-    target 1616
-    weight 91
-  ]
-  edge [
-    source 561
-    target 1487
-    weight 72
-  ]
-  edge [
-    source 561
-    target 3521
-    weight 93
-  ]
-  edge [
-    source 561
-    target 2861
-    weight 69
-  ]
-  edge [
-    source 561
-    target 1080
-    weight 56
-  ]
-  edge [
-    source 561
-    target 2191
-    weight 25
-  ]
-  edge [
-    source 561
-    target 3276
-    weight 50
-  ]
-  edge [
-    source 561
-    target 774
-    weight 87
-  ]
-  edge [
-    source 561
-    target 3374
-    weight 23
-  ]
-  edge [
-    source 561
-    target 1254
-    weight 33
-  ]
-  edge [
-    source 561
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 561
-    target 1053
-    weight 65
-  ]
-  edge [
-    source 561
-    target 2700
-    weight 47
-  ]
-  edge [
-    source 561
-    target 4051
-    weight 87
-  ]
-  edge [
-    source 561
-    target 2890
-    weight 22
-  ]
-  edge [
-    source 561
-    target 1995
-    weight 56
-  ]
-  edge [
-    source 561
-    target 2071
-    weight 80
-  ]
-  edge [
-    source 561
-    target 738
-    weight 35
-  ]
-  edge [
-    source 561
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 561
-    target 1887
-    weight 82
-  ]
-  edge [
-    source 561
-    target 3174
-    weight 65
-  ]
-  edge [
-    source 561
-    target 1632
-    weight 37
-  ]
-  edge [
-    source 561
-    target 3253
-    weight 29
-  ]
-  edge [
-    source 561
-    target 1582
-    weight 39
-  ]
-  edge [
-    source 561
-    target 3600
-    weight 51
-  ]
-  edge [
-    source 561
-    target 2543
-    weight 34
-  ]
-  edge [
-    source 561
-    target 1360
-    weight 23
-  ]
-  edge [
-    source 561
-    target 3141
-    weight 84
-  ]
-  edge [
-    source 561
-    target 798
-    weight 35
-  ]
-  edge [
-    source 561
-    target 3642
-    weight 37
-  ]
-  edge [
-    source 561
-    target 1647
-    weight 40
-  ]
-  edge [
-    source 561
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 561
-    target 3993
-    weight 38
-  ]
-  edge [
-    source 561
-    target 3145
-    weight 60
-  ]
-  edge [
-    source 561
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 561
-    target 2870
-    weight 24
-  ]
-  edge [
-    source 561
-    target 3542
-    weight 33
-  ]
-  edge [
-    source 561
-    target 3282
-    weight 36
-  ]
-  edge [
-    source 561
-    target 1505
-    weight 32
-  ]
-  edge [
-    source 561
-    target 3052
-    weight 23
-  ]
-  edge [
-    source 561
-    target 2287
-    weight 23
-  ]
-  edge [
-    source 561
-    target 3066
-    weight 27
-  ]
-  edge [
-    source 561
-    target 2857
-    weight 35
-  ]
-  edge [
-    source 561
-    target 2058
-    weight 24
-  ]
-  edge [
-    source 561
-    target 2519
-    weight 29
-  ]
-  edge [
-    source 561
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 602
-    target 3521
-    weight 434
-  ]
-  edge [
-    source 602
-    target 1616
-    weight 431
-  ]
-  edge [
-    source 602
-    target 1487
-    weight 257
-  ]
-  edge [
-    source 602
-    target 2861
-    weight 321
-  ]
-  edge [
-    source 602
-    target 3600
-    weight 211
-  ]
-  edge [
-    source 602
-    target 751
-    weight 352
-  ]
-  edge [
-    source 602
-    target 3565
-    weight 99
-  ]
-  edge [
-    source 602
-    target 3276
-    weight 154
-  ]
-  edge [
-    source 602
-    target 3374
-    weight 66
-  ]
-  edge [
-    source 602
-    target 4051
-    weight 355
-  ]
-  edge [
-    source 602
-    target 2058
-    weight 60
-  ]
-  edge [
-    source 602
-    target 3423
-    weight 95
-  ]
-  edge [
-    source 602
-    target 3443
-    weight 69
-  ]
-  edge [
-    source 602
-    target 774
-    weight 363
-  ]
-  edge [
-    source 602
-    target 3420
-    weight 62
-  ]
-  edge [
-    source 602
-    target 1647
-    weight 165
-  ]
-  edge [
-    source 602
-    target 1409
-    weight 52
-  ]
-  edge [
-    source 602
-    target 3917
-    weight 137
-  ]
-  edge [
-    source 602
-    target 3642
-    weight 146
-  ]
-  edge [
-    source 602
-    target 3542
-    weight 96
-  ]
-  edge [
-    source 602
-    target 2700
-    weight 201
-  ]
-  edge [
-    source 602
-    target 1127
-    weight 50
-  ]
-  edge [
-    source 602
-    target 1887
-    weight 358
-  ]
-  edge [
-    source 602
-    target 1053
-    weight 240
-  ]
-  edge [
-    source 602
-    target 3282
-    weight 97
-  ]
-  edge [
-    source 602
-    target 3141
-    weight 348
-  ]
-  edge [
-    source 602
-    target 3145
-    weight 220
-  ]
-  edge [
-    source 602
-    target 2810
-    weight 25
-  ]
-  edge [
-    source 602
-    target 1995
-    weight 185
-  ]
-  edge [
-    source 602
-    target 2071
-    weight 335
-  ]
-  edge [
-    source 602
-    target 3377
-    weight 34
-  ]
-  edge [
-    source 602
-    target 2519
-    weight 107
-  ]
-  edge [
-    source 602
-    target 2543
-    weight 66
-  ]
-  edge [
-    source 602
-    target 1254
-    weight 103
-  ]
-  edge [
-    source 602
-    target 1582
-    weight 160
-  ]
-  edge [
-    source 602
-    target 724
-    weight 61
-  ]
-  edge [
-    source 602
-    target 3295
-    weight 50
-  ]
-  edge [
-    source 602
-    target 1461
-    weight 24
-  ]
-  edge [
-    source 602
-    target 1080
-    weight 255
-  ]
-  edge [
-    source 602
-    target 3636
-    weight 52
-  ]
-  edge [
-    source 602
-    target 3006
-    weight 107
-  ]
-  edge [
-    source 602
-    target 3040
-    weight 109
-  ]
-  edge [
-    source 602
-    target 738
-    weight 126
-  ]
-  edge [
-    source 602
-    target 3954
-    weight 114
-  ]
-  edge [
-    source 602
-    target 2287
-    weight 79
-  ]
-  edge [
-    source 602
-    target 1360
-    weight 34
-  ]
-  edge [
-    source 602
-    target 3174
-    weight 201
-  ]
-  edge [
-    source 602
-    target 3253
-    weight 53
-  ]
-  edge [
-    source 602
-    target 4162
-    weight 71
-  ]
-  edge [
-    source 602
-    target 1195
-    weight 32
-  ]
-  edge [
-    source 602
-    target 1632
-    weight 168
-  ]
-  edge [
-    source 602
-    target 1507
-    weight 57
-  ]
-  edge [
-    source 602
-    target 1505
-    weight 85
-  ]
-  edge [
-    source 602
-    target 2870
-    weight 80
-  ]
-  edge [
-    source 602
-    target 717
-    weight 21
-  ]
-  edge [
-    source 602
-    target 4154
-    weight 112
-  ]
-  edge [
-    source 602
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 602
-    target 2191
-    weight 67
-  ]
-  edge [
-    source 602
-    target 1185
-    weight 52
-  ]
-  edge [
-    source 602
-    target 1523
-    weight 33
-  ]
-  edge [
-    source 602
-    target 3962
-    weight 55
-  ]
-  edge [
-    source 602
-    target 3066
-    weight 80
-  ]
-  edge [
-    source 602
-    target 2890
-    weight 64
-  ]
-  edge [
-    source 602
-    target 1766
-    weight 23
-  ]
-  edge [
-    source 602
-    target 986
-    weight 24
-  ]
-  edge [
-    source 602
-    target 3993
-    weight 154
-  ]
-  edge [
-    source 602
-    target 1420
-    weight 28
-  ]
-  edge [
-    source 602
-    target 1938
-    weight 32
-  ]
-  edge [
-    source 602
-    target 1707
-    weight 35
-  ]
-  edge [
-    source 602
-    target 874
-    weight 46
-  ]
-  edge [
-    source 602
-    target 798
-    weight 84
-  ]
-  edge [
-    source 602
-    target 968
-    weight 38
-  ]
-  edge [
-    source 602
-    target 2204
-    weight 44
-  ]
-  edge [
-    source 602
-    target 3937
-    weight 24
-  ]
-  edge [
-    source 602
-    target 3052
-    weight 35
-  ]
-  edge [
-    source 602
-    target 2553
-    weight 41
-  ]
-  edge [
-    source 602
-    target 1757
-    weight 43
-  ]
-  edge [
-    source 602
-    target 2857
-    weight 85
-  ]
-  edge [
-    source 602
-    target 3847
-    weight 24
-  ]
-  edge [
-    source 604
-    target 751
-    weight 352
-  ]
-  edge [
-    source 604
-    target 2861
-    weight 274
-  ]
-  edge [
-    source 604
-    target 1616
-    weight 357
-  ]
-  edge [
-    source 604
-    target 1487
-    weight 256
-  ]
-  edge [
-    source 604
-    target 3521
-    weight 433
-  ]
-  edge [
-    source 604
-    target 3276
-    weight 216
-  ]
-  edge [
-    source 604
-    target 3420
-    weight 48
-  ]
-  edge [
-    source 604
-    target 2700
-    weight 159
-  ]
-  edge [
-    source 604
-    target 3993
-    weight 166
-  ]
-  edge [
-    source 604
-    target 1505
-    weight 146
-  ]
-  edge [
-    source 604
-    target 3377
-    weight 29
-  ]
-  edge [
-    source 604
-    target 1254
-    weight 142
-  ]
-  edge [
-    source 604
-    target 3565
-    weight 104
-  ]
-  edge [
-    source 604
-    target 2543
-    weight 65
-  ]
-  edge [
-    source 604
-    target 3600
-    weight 217
-  ]
-  edge [
-    source 604
-    target 2191
-    weight 59
-  ]
-  edge [
-    source 604
-    target 1647
-    weight 159
-  ]
-  edge [
-    source 604
-    target 3962
-    weight 69
-  ]
-  edge [
-    source 604
-    target 2071
-    weight 320
-  ]
-  edge [
-    source 604
-    target 2810
-    weight 26
-  ]
-  edge [
-    source 604
-    target 3141
-    weight 346
-  ]
-  edge [
-    source 604
-    target 1053
-    weight 261
-  ]
-  edge [
-    source 604
-    target 4051
-    weight 320
-  ]
-  edge [
-    source 604
-    target 3917
-    weight 154
-  ]
-  edge [
-    source 604
-    target 3937
-    weight 24
-  ]
-  edge [
-    source 604
-    target 874
-    weight 110
-  ]
-  edge [
-    source 604
-    target 798
-    weight 134
-  ]
-  edge [
-    source 604
-    target 1887
-    weight 309
-  ]
-  edge [
-    source 604
-    target 774
-    weight 353
-  ]
-  edge [
-    source 604
-    target 3642
-    weight 138
-  ]
-  edge [
-    source 604
-    target 1995
-    weight 163
-  ]
-  edge [
-    source 604
-    target 3282
-    weight 123
-  ]
-  edge [
-    source 604
-    target 3145
-    weight 237
-  ]
-  edge [
-    source 604
-    target 927
-    weight 22
-  ]
-  edge [
-    source 604
-    target 1582
-    weight 155
-  ]
-  edge [
-    source 604
-    target 3542
-    weight 96
-  ]
-  edge [
-    source 604
-    target 3443
-    weight 75
-  ]
-  edge [
-    source 604
-    target 3040
-    weight 71
-  ]
-  edge [
-    source 604
-    target 1127
-    weight 31
-  ]
-  edge [
-    source 604
-    target 1080
-    weight 178
-  ]
-  edge [
-    source 604
-    target 1420
-    weight 30
-  ]
-  edge [
-    source 604
-    target 3066
-    weight 88
-  ]
-  edge [
-    source 604
-    target 2204
-    weight 95
-  ]
-  edge [
-    source 604
-    target 2870
-    weight 88
-  ]
-  edge [
-    source 604
-    target 2553
-    weight 60
-  ]
-  edge [
-    source 604
-    target 738
-    weight 125
-  ]
-  edge [
-    source 604
-    target 3847
-    weight 29
-  ]
-  edge [
-    source 604
-    target 3071
-    weight 21
-  ]
-  edge [
-    source 604
-    target 3077
-    weight 29
-  ]
-  edge [
-    source 604
-    target 3253
-    weight 78
-  ]
-  edge [
-    source 604
-    target 968
-    weight 42
-  ]
-  edge [
-    source 604
-    target 1938
-    weight 37
-  ]
-  edge [
-    source 604
-    target 3636
-    weight 87
-  ]
-  edge [
-    source 604
-    target 1280
-    weight 24
-  ]
-  edge [
-    source 604
-    target 3295
-    weight 47
-  ]
-  edge [
-    source 604
-    target 3954
-    weight 84
-  ]
-  edge [
-    source 604
-    target 3174
-    weight 163
-  ]
-  edge [
-    source 604
-    target 1632
-    weight 132
-  ]
-  edge [
-    source 604
-    target 2800
-    weight 51
-  ]
-  edge [
-    source 604
-    target 1757
-    weight 69
-  ]
-  edge [
-    source 604
-    target 2287
-    weight 71
-  ]
-  edge [
-    source 604
-    target 2519
-    weight 105
-  ]
-  edge [
-    source 604
-    target 4154
-    weight 66
-  ]
-  edge [
-    source 604
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 604
-    target 1185
-    weight 61
-  ]
-  edge [
-    source 604
-    target 3006
-    weight 70
-  ]
-  edge [
-    source 604
-    target 3052
-    weight 63
-  ]
-  edge [
-    source 604
-    target 1154
-    weight 30
-  ]
-  edge [
-    source 604
-    target 1360
-    weight 37
-  ]
-  edge [
-    source 604
-    target 2614
-    weight 21
-  ]
-  edge [
-    source 604
-    target 1322
-    weight 27
-  ]
-  edge [
-    source 604
-    target 3423
-    weight 74
-  ]
-  edge [
-    source 604
-    target 733
-    weight 21
-  ]
-  edge [
-    source 604
-    target 3884
-    weight 24
-  ]
-  edge [
-    source 604
-    target 1492
-    weight 22
-  ]
-  edge [
-    source 604
-    target 3374
-    weight 68
-  ]
-  edge [
-    source 604
-    target 1523
-    weight 40
-  ]
-  edge [
-    source 604
-    target 2329
-    weight 24
-  ]
-  edge [
-    source 604
-    target 2857
-    weight 125
-  ]
-  edge [
-    source 604
-    target 986
-    weight 31
-  ]
-  edge [
-    source 604
-    target 1707
-    weight 29
-  ]
-  edge [
-    source 604
-    target 724
-    weight 44
-  ]
-  edge [
-    source 604
-    target 1507
-    weight 35
-  ]
-  edge [
-    source 604
-    target 3877
-    weight 27
-  ]
-  edge [
-    source 604
-    target 1517
-    weight 21
-  ]
-  edge [
-    source 604
-    target 980
-    weight 25
-  ]
-  edge [
-    source 604
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 604
-    target 3177
-    weight 25
-  ]
-  edge [
-    source 604
-    target 1409
-    weight 52
-  ]
-  edge [
-    source 604
-    target 2058
-    weight 63
-  ]
-  edge [
-    source 604
-    target 1943
-    weight 21
-  ]
-  edge [
-    source 604
-    target 4162
-    weight 28
-  ]
-  edge [
-    source 608
-    target 751
-    weight 142
-  ]
-  edge [
-    source 608
-    target 1616
-    weight 136
-  ]
-  edge [
-    source 608
-    target 3174
-    weight 67
-  ]
-  edge [
-    source 608
-    target 3521
-    weight 174
-  ]
-  edge [
-    source 608
-    target 3276
-    weight 86
-  ]
-  edge [
-    source 608
-    target 774
-    weight 156
-  ]
-  edge [
-    source 608
-    target 3600
-    weight 122
-  ]
-  edge [
-    source 608
-    target 2071
-    weight 141
-  ]
-  edge [
-    source 608
-    target 3066
-    weight 21
-  ]
-  edge [
-    source 608
-    target 3141
-    weight 149
-  ]
-  edge [
-    source 608
-    target 1632
-    weight 46
-  ]
-  edge [
-    source 608
-    target 2861
-    weight 90
-  ]
-  edge [
-    source 608
-    target 3565
-    weight 34
-  ]
-  edge [
-    source 608
-    target 3636
-    weight 26
-  ]
-  edge [
-    source 608
-    target 1887
-    weight 138
-  ]
-  edge [
-    source 608
-    target 3917
-    weight 60
-  ]
-  edge [
-    source 608
-    target 738
-    weight 29
-  ]
-  edge [
-    source 608
-    target 1053
-    weight 106
-  ]
-  edge [
-    source 608
-    target 3443
-    weight 28
-  ]
-  edge [
-    source 608
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 608
-    target 1487
-    weight 108
-  ]
-  edge [
-    source 608
-    target 1080
-    weight 58
-  ]
-  edge [
-    source 608
-    target 2700
-    weight 85
-  ]
-  edge [
-    source 608
-    target 3993
-    weight 66
-  ]
-  edge [
-    source 608
-    target 2204
-    weight 23
-  ]
-  edge [
-    source 608
-    target 1995
-    weight 58
-  ]
-  edge [
-    source 608
-    target 3423
-    weight 41
-  ]
-  edge [
-    source 608
-    target 1647
-    weight 71
-  ]
-  edge [
-    source 608
-    target 3374
-    weight 29
-  ]
-  edge [
-    source 608
-    target 4051
-    weight 117
-  ]
-  edge [
-    source 608
-    target 3145
-    weight 95
-  ]
-  edge [
-    source 608
-    target 1505
-    weight 35
-  ]
-  edge [
-    source 608
-    target 3282
-    weight 49
-  ]
-  edge [
-    source 608
-    target 3542
-    weight 27
-  ]
-  edge [
-    source 608
-    target 2890
-    weight 37
-  ]
-  edge [
-    source 608
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 608
-    target 1582
-    weight 66
-  ]
-  edge [
-    source 608
-    target 798
-    weight 45
-  ]
-  edge [
-    source 608
-    target 2519
-    weight 37
-  ]
-  edge [
-    source 608
-    target 3642
-    weight 44
-  ]
-  edge [
-    source 608
-    target 1254
-    weight 29
-  ]
-  edge [
-    source 608
-    target 1185
-    weight 24
-  ]
-  edge [
-    source 608
-    target 2870
-    weight 34
-  ]
-  edge [
-    source 608
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 608
-    target 2058
-    weight 24
-  ]
-  edge [
-    source 608
-    target 874
-    weight 21
-  ]
-  edge [
-    source 630
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 630
-    target 774
-    weight 60
-  ]
-  edge [
-    source 630
-    target 751
-    weight 59
-  ]
-  edge [
-    source 630
-    target 3141
-    weight 60
-  ]
-  edge [
-    source 630
-    target 1887
-    weight 53
-  ]
-  edge [
-    source 630
-    target 3521
-    weight 71
-  ]
-  edge [
-    source 630
-    target 2071
-    weight 46
-  ]
-  edge [
-    source 630
-    target 1254
-    weight 29
-  ]
-  edge [
-    source 630
-    target 1616
-    weight 58
-  ]
-  edge [
-    source 630
-    target 3954
-    weight 22
-  ]
-  edge [
-    source 630
-    target 1053
-    weight 51
-  ]
-  edge [
-    source 630
-    target 3276
-    weight 30
-  ]
-  edge [
-    source 630
-    target 1080
-    weight 31
-  ]
-  edge [
-    source 630
-    target 1995
-    weight 26
-  ]
-  edge [
-    source 630
-    target 1632
-    weight 28
-  ]
-  edge [
-    source 630
-    target 2861
-    weight 38
-  ]
-  edge [
-    source 630
-    target 4051
-    weight 58
-  ]
-  edge [
-    source 630
-    target 738
-    weight 23
-  ]
-  edge [
-    source 630
-    target 3174
-    weight 38
-  ]
-  edge [
-    source 630
-    target 1647
-    weight 22
-  ]
-  edge [
-    source 630
-    target 1487
-    weight 38
-  ]
-  edge [
-    source 630
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 630
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 630
-    target 2700
-    weight 25
-  ]
-  edge [
-    source 630
-    target 1582
-    weight 27
-  ]
-  edge [
-    source 632
-    target 3141
-    weight 89
-  ]
-  edge [
-    source 632
-    target 774
-    weight 89
-  ]
-  edge [
-    source 632
-    target 2700
-    weight 48
-  ]
-  edge [
-    source 632
-    target 1616
-    weight 91
-  ]
-  edge [
-    source 632
-    target 3565
-    weight 38
-  ]
-  edge [
-    source 632
-    target 1887
-    weight 83
-  ]
-  edge [
-    source 632
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 632
-    target 3600
-    weight 60
-  ]
-  edge [
-    source 632
-    target 1487
-    weight 55
-  ]
-  edge [
-    source 632
-    target 2861
-    weight 67
-  ]
-  edge [
-    source 632
-    target 751
-    weight 80
-  ]
-  edge [
-    source 632
-    target 1080
-    weight 38
-  ]
-  edge [
-    source 632
-    target 4051
-    weight 75
-  ]
-  edge [
-    source 632
-    target 2071
-    weight 75
-  ]
-  edge [
-    source 632
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 632
-    target 1582
-    weight 40
-  ]
-  edge [
-    source 632
-    target 1995
-    weight 32
-  ]
-  edge [
-    source 632
-    target 1053
-    weight 56
-  ]
-  edge [
-    source 632
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 632
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 632
-    target 3145
-    weight 49
-  ]
-  edge [
-    source 632
-    target 1647
-    weight 37
-  ]
-  edge [
-    source 632
-    target 3276
-    weight 33
-  ]
-  edge [
-    source 632
-    target 3993
-    weight 33
-  ]
-  edge [
-    source 632
-    target 3282
-    weight 23
-  ]
-  edge [
-    source 632
-    target 1632
-    weight 31
-  ]
-  edge [
-    source 632
-    target 738
-    weight 27
-  ]
-  edge [
-    source 632
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 632
-    target 3917
-    weight 28
-  ]
-  edge [
-    source 648
-    target 2744
-    weight 28
-  ]
-  edge [
-    source 648
-    target 3521
-    weight 27
-  ]
-  edge [
-    source 651
-    target 3917
-    weight 31
-  ]
-  edge [
-    source 651
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 651
-    target 3145
-    weight 42
-  ]
-  edge [
-    source 651
-    target 1053
-    weight 32
-  ]
-  edge [
-    source 651
-    target 1080
-    weight 23
-  ]
-  edge [
-    source 651
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 651
-    target 774
-    weight 42
-  ]
-  edge [
-    source 651
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 651
-    target 2071
-    weight 39
-  ]
-  edge [
-    source 651
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 651
-    target 3174
-    weight 27
-  ]
-  edge [
-    source 651
-    target 2861
-    weight 34
-  ]
-  edge [
-    source 651
-    target 1616
-    weight 39
-  ]
-  edge [
-    source 651
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 651
-    target 4051
-    weight 39
-  ]
-  edge [
-    source 651
-    target 751
-    weight 38
-  ]
-  edge [
-    source 651
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 651
-    target 1887
-    weight 41
-  ]
-  edge [
-    source 651
-    target 1582
-    weight 23
-  ]
-  edge [
-    source 651
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 653
-    target 774
-    weight 34
-  ]
-  edge [
-    source 653
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 653
-    target 1616
-    weight 33
-  ]
-  edge [
-    source 653
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 653
-    target 1887
-    weight 33
-  ]
-  edge [
-    source 653
-    target 3521
-    weight 34
-  ]
-  edge [
-    source 653
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 653
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 653
-    target 1487
-    weight 26
-  ]
-  edge [
-    source 653
-    target 4051
-    weight 30
-  ]
-  edge [
-    source 653
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 653
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 653
-    target 1053
-    weight 30
-  ]
-  edge [
-    source 653
-    target 751
-    weight 32
-  ]
-  edge [
-    source 661
-    target 3521
-    weight 32
-  ]
-  edge [
-    source 661
-    target 1616
-    weight 28
-  ]
-  edge [
-    source 661
-    target 774
-    weight 30
-  ]
-  edge [
-    source 661
-    target 751
-    weight 26
-  ]
-  edge [
-    source 661
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 661
-    target 1887
-    weight 21
-  ]
-  edge [
-    source 661
-    target 1053
-    weight 23
-  ]
-  edge [
-    source 661
-    target 3141
-    weight 27
-  ]
-  edge [
-    source 661
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 661
-    target 3145
-    weight 22
-  ]
-  edge [
-    source 671
-    target 3600
-    weight 88
-  ]
-  edge [
-    source 671
-    target 751
-    weight 115
-  ]
-  edge [
-    source 671
-    target 774
-    weight 116
-  ]
-  edge [
-    source 671
-    target 1616
-    weight 109
-  ]
-  edge [
-    source 671
-    target 2191
-    weight 45
-  ]
-  edge [
-    source 671
-    target 1487
-    weight 116
-  ]
-  edge [
-    source 671
-    target 3521
-    weight 144
-  ]
-  edge [
-    source 671
-    target 1647
-    weight 83
-  ]
-  edge [
-    source 671
-    target 3177
-    weight 21
-  ]
-  edge [
-    source 671
-    target 1053
-    weight 86
-  ]
-  edge [
-    source 671
-    target 2071
-    weight 127
-  ]
-  edge [
-    source 671
-    target 2861
-    weight 97
-  ]
-  edge [
-    source 671
-    target 3066
-    weight 35
-  ]
-  edge [
-    source 671
-    target 3937
-    weight 23
-  ]
-  edge [
-    source 671
-    target 3565
-    weight 40
-  ]
-  edge [
-    source 671
-    target 1409
-    weight 39
-  ]
-  edge [
-    source 671
-    target 986
-    weight 30
-  ]
-  edge [
-    source 671
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 671
-    target 3282
-    weight 53
-  ]
-  edge [
-    source 671
-    target 4051
-    weight 107
-  ]
-  edge [
-    source 671
-    target 3993
-    weight 79
-  ]
-  edge [
-    source 671
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 671
-    target 2519
-    weight 50
-  ]
-  edge [
-    source 671
-    target 1995
-    weight 70
-  ]
-  edge [
-    source 671
-    target 1080
-    weight 57
-  ]
-  edge [
-    source 671
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 671
-    target 3145
-    weight 80
-  ]
-  edge [
-    source 671
-    target 1254
-    weight 29
-  ]
-  edge [
-    source 671
-    target 1887
-    weight 104
-  ]
-  edge [
-    source 671
-    target 3276
-    weight 65
-  ]
-  edge [
-    source 671
-    target 2287
-    weight 43
-  ]
-  edge [
-    source 671
-    target 3420
-    weight 38
-  ]
-  edge [
-    source 671
-    target 3253
-    weight 23
-  ]
-  edge [
-    source 671
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 671
-    target 1582
-    weight 56
-  ]
-  edge [
-    source 671
-    target 798
-    weight 39
-  ]
-  edge [
-    source 671
-    target 2204
-    weight 30
-  ]
-  edge [
-    source 671
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 671
-    target 2857
-    weight 47
-  ]
-  edge [
-    source 671
-    target 3174
-    weight 57
-  ]
-  edge [
-    source 671
-    target 3006
-    weight 26
-  ]
-  edge [
-    source 671
-    target 738
-    weight 45
-  ]
-  edge [
-    source 671
-    target 3917
-    weight 56
-  ]
-  edge [
-    source 671
-    target 2553
-    weight 24
-  ]
-  edge [
-    source 671
-    target 3636
-    weight 27
-  ]
-  edge [
-    source 671
-    target 3423
-    weight 61
-  ]
-  edge [
-    source 671
-    target 1757
-    weight 29
-  ]
-  edge [
-    source 671
-    target 3542
-    weight 33
-  ]
-  edge [
-    source 671
-    target 2890
-    weight 26
-  ]
-  edge [
-    source 671
-    target 1154
-    weight 24
-  ]
-  edge [
-    source 671
-    target 3962
-    weight 45
-  ]
-  edge [
-    source 671
-    target 3443
-    weight 31
-  ]
-  edge [
-    source 671
-    target 3374
-    weight 39
-  ]
-  edge [
-    source 671
-    target 1632
-    weight 54
-  ]
-  edge [
-    source 671
-    target 3040
-    weight 32
-  ]
-  edge [
-    source 671
-    target 2870
-    weight 43
-  ]
-  edge [
-    source 671
-    target 1505
-    weight 40
-  ]
-  edge [
-    source 671
-    target 2543
-    weight 24
-  ]
-  edge [
-    source 671
-    target 2800
-    weight 28
-  ]
-  edge [
-    source 671
-    target 3642
-    weight 38
-  ]
-  edge [
-    source 671
-    target 874
-    weight 33
-  ]
-  edge [
-    source 671
-    target 2058
-    weight 30
-  ]
-  edge [
-    source 675
-    target 1582
-    weight 92
-  ]
-  edge [
-    source 675
-    target 3521
-    weight 130
-  ]
-  edge [
-    source 675
-    target 3174
-    weight 68
-  ]
-  edge [
-    source 675
-    target 1616
-    weight 117
-  ]
-  edge [
-    source 675
-    target 2519
-    weight 35
-  ]
-  edge [
-    source 675
-    target 3642
-    weight 37
-  ]
-  edge [
-    source 675
-    target 3993
-    weight 54
-  ]
-  edge [
-    source 675
-    target 3917
-    weight 49
-  ]
-  edge [
-    source 675
-    target 774
-    weight 120
-  ]
-  edge [
-    source 675
-    target 3141
-    weight 117
-  ]
-  edge [
-    source 675
-    target 1887
-    weight 117
-  ]
-  edge [
-    source 675
-    target 1487
-    weight 92
-  ]
-  edge [
-    source 675
-    target 2071
-    weight 104
-  ]
-  edge [
-    source 675
-    target 2890
-    weight 35
-  ]
-  edge [
-    source 675
-    target 3145
-    weight 78
-  ]
-  edge [
-    source 675
-    target 1053
-    weight 80
-  ]
-  edge [
-    source 675
-    target 751
-    weight 105
-  ]
-  edge [
-    source 675
-    target 3423
-    weight 34
-  ]
-  edge [
-    source 675
-    target 4051
-    weight 106
-  ]
-  edge [
-    source 675
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 675
-    target 3253
-    weight 24
-  ]
-  edge [
-    source 675
-    target 2857
-    weight 29
-  ]
-  edge [
-    source 675
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 675
-    target 2058
-    weight 27
-  ]
-  edge [
-    source 675
-    target 3276
-    weight 66
-  ]
-  edge [
-    source 675
-    target 798
-    weight 36
-  ]
-  edge [
-    source 675
-    target 2861
-    weight 85
-  ]
-  edge [
-    source 675
-    target 3542
-    weight 39
-  ]
-  edge [
-    source 675
-    target 1080
-    weight 47
-  ]
-  edge [
-    source 675
-    target 3600
-    weight 70
-  ]
-  edge [
-    source 675
-    target 1995
-    weight 41
-  ]
-  edge [
-    source 675
-    target 1647
-    weight 52
-  ]
-  edge [
-    source 675
-    target 1505
-    weight 25
-  ]
-  edge [
-    source 675
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 675
-    target 738
-    weight 22
-  ]
-  edge [
-    source 675
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 675
-    target 1632
-    weight 32
-  ]
-  edge [
-    source 675
-    target 3282
-    weight 32
-  ]
-  edge [
-    source 689
-    target 3521
-    weight 135
-  ]
-  edge [
-    source 689
-    target 1487
-    weight 176
-  ]
-  edge [
-    source 689
-    target 3145
-    weight 47
-  ]
-  edge [
-    source 689
-    target 2861
-    weight 70
-  ]
-  edge [
-    source 689
-    target 1616
-    weight 105
-  ]
-  edge [
-    source 689
-    target 751
-    weight 117
-  ]
-  edge [
-    source 689
-    target 3374
-    weight 75
-  ]
-  edge [
-    source 689
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 689
-    target 4051
-    weight 88
-  ]
-  edge [
-    source 689
-    target 2071
-    weight 107
-  ]
-  edge [
-    source 689
-    target 3993
-    weight 36
-  ]
-  edge [
-    source 689
-    target 2191
-    weight 29
-  ]
-  edge [
-    source 689
-    target 3600
-    weight 59
-  ]
-  edge [
-    source 689
-    target 3276
-    weight 43
-  ]
-  edge [
-    source 689
-    target 1995
-    weight 24
-  ]
-  edge [
-    source 689
-    target 3077
-    weight 36
-  ]
-  edge [
-    source 689
-    target 1080
-    weight 42
-  ]
-  edge [
-    source 689
-    target 3917
-    weight 30
-  ]
-  edge [
-    source 689
-    target 3423
-    weight 59
-  ]
-  edge [
-    source 689
-    target 3141
-    weight 91
-  ]
-  edge [
-    source 689
-    target 1887
-    weight 77
-  ]
-  edge [
-    source 689
-    target 3408
-    weight 41
-  ]
-  edge [
-    source 689
-    target 1318
-    weight 26
-  ]
-  edge [
-    source 689
-    target 1053
-    weight 37
-  ]
-  edge [
-    source 689
-    target 3174
-    weight 40
-  ]
-  edge [
-    source 689
-    target 774
-    weight 101
-  ]
-  edge [
-    source 689
-    target 2700
-    weight 22
-  ]
-  edge [
-    source 689
-    target 1582
-    weight 30
-  ]
-  edge [
-    source 712
-    target 3521
-    weight 60
-  ]
-  edge [
-    source 712
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 712
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 712
-    target 751
-    weight 49
-  ]
-  edge [
-    source 712
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 712
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 712
-    target 1616
-    weight 49
-  ]
-  edge [
-    source 712
-    target 2071
-    weight 46
-  ]
-  edge [
-    source 712
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 712
-    target 1995
-    weight 26
-  ]
-  edge [
-    source 712
-    target 1080
-    weight 24
-  ]
-  edge [
-    source 712
-    target 2861
-    weight 39
-  ]
-  edge [
-    source 712
-    target 3145
-    weight 30
-  ]
-  edge [
-    source 712
-    target 738
-    weight 35
-  ]
-  edge [
-    source 712
-    target 2700
-    weight 22
-  ]
-  edge [
-    source 712
-    target 4051
-    weight 44
-  ]
-  edge [
-    source 712
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 712
-    target 774
-    weight 45
-  ]
-  edge [
-    source 712
-    target 1053
-    weight 30
-  ]
-  edge [
-    source 712
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 712
-    target 3276
-    weight 22
-  ]
-  edge [
-    source 717
-    target 2861
-    weight 56
-  ]
-  edge [
-    source 717
-    target 1616
-    weight 71
-  ]
-  edge [
-    source 717
-    target 3141
-    weight 61
-  ]
-  edge [
-    source 717
-    target 4051
-    weight 67
-  ]
-  edge [
-    source 717
-    target 1887
-    weight 64
-  ]
-  edge [
-    source 717
-    target 3521
-    weight 74
-  ]
-  edge [
-    source 717
-    target 2071
-    weight 61
-  ]
-  edge [
-    source 717
-    target 1461
-    weight 21
-  ]
-  edge [
-    source 717
-    target 1080
-    weight 53
-  ]
-  edge [
-    source 717
-    target 751
-    weight 66
-  ]
-  edge [
-    source 717
-    target 738
-    weight 33
-  ]
-  edge [
-    source 717
-    target 3145
-    weight 42
-  ]
-  edge [
-    source 717
-    target 724
-    weight 23
-  ]
-  edge [
-    source 717
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 717
-    target 3066
-    weight 25
-  ]
-  edge [
-    source 717
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 717
-    target 1995
-    weight 35
-  ]
-  edge [
-    source 717
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 717
-    target 4154
-    weight 22
-  ]
-  edge [
-    source 717
-    target 3954
-    weight 35
-  ]
-  edge [
-    source 717
-    target 2543
-    weight 24
-  ]
-  edge [
-    source 717
-    target 798
-    weight 22
-  ]
-  edge [
-    source 717
-    target 1254
-    weight 22
-  ]
-  edge [
-    source 717
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 717
-    target 1053
-    weight 40
-  ]
-  edge [
-    source 717
-    target 1632
-    weight 38
-  ]
-  edge [
-    source 717
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 717
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 717
-    target 3040
-    weight 25
-  ]
-  edge [
-    source 717
-    target 1487
-    weight 39
-  ]
-  edge [
-    source 717
-    target 2287
-    weight 23
-  ]
-  edge [
-    source 717
-    target 3282
-    weight 26
-  ]
-  edge [
-    source 717
-    target 774
-    weight 59
-  ]
-  edge [
-    source 717
-    target 1647
-    weight 28
-  ]
-  edge [
-    source 717
-    target 2519
-    weight 25
-  ]
-  edge [
-    source 717
-    target 1582
-    weight 27
-  ]
-  edge [
-    source 717
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 717
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 719
-    target 3600
-    weight 41
-  ]
-  edge [
-    source 719
-    target 751
-    weight 55
-  ]
-  edge [
-    source 719
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 719
-    target 3423
-    weight 38
-  ]
-  edge [
-    source 719
-    target 1616
-    weight 60
-  ]
-  edge [
-    source 719
-    target 4051
-    weight 48
-  ]
-  edge [
-    source 719
-    target 1487
-    weight 59
-  ]
-  edge [
-    source 719
-    target 3521
-    weight 67
-  ]
-  edge [
-    source 719
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 719
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 719
-    target 1582
-    weight 25
-  ]
-  edge [
-    source 719
-    target 2700
-    weight 35
-  ]
-  edge [
-    source 719
-    target 774
-    weight 50
-  ]
-  edge [
-    source 719
-    target 1647
-    weight 38
-  ]
-  edge [
-    source 719
-    target 3993
-    weight 41
-  ]
-  edge [
-    source 719
-    target 1080
-    weight 29
-  ]
-  edge [
-    source 719
-    target 3141
-    weight 52
-  ]
-  edge [
-    source 719
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 719
-    target 3917
-    weight 23
-  ]
-  edge [
-    source 719
-    target 2071
-    weight 58
-  ]
-  edge [
-    source 719
-    target 1053
-    weight 36
-  ]
-  edge [
-    source 719
-    target 1887
-    weight 44
-  ]
-  edge [
-    source 719
-    target 1995
-    weight 27
-  ]
-  edge [
-    source 719
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 719
-    target 1409
-    weight 23
-  ]
-  edge [
-    source 719
-    target 3282
-    weight 25
-  ]
-  edge [
-    source 719
-    target 738
-    weight 21
-  ]
-  edge [
-    source 719
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 719
-    target 1632
-    weight 23
-  ]
-  edge [
-    source 719
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 724
-    target 2519
-    weight 93
-  ]
-  edge [
-    source 724
-    target 2071
-    weight 245
-  ]
-  edge [
-    source 724
-    target 1254
-    weight 106
-  ]
-  edge [
-    source 724
-    target 3145
-    weight 187
-  ]
-  edge [
-    source 724
-    target 3600
-    weight 145
-  ]
-  edge [
-    source 724
-    target 751
-    weight 255
-  ]
-  edge [
-    source 724
-    target 1887
-    weight 236
-  ]
-  edge [
-    source 724
-    target 3565
-    weight 85
-  ]
-  edge [
-    source 724
-    target 1647
-    weight 125
-  ]
-  edge [
-    source 724
-    target 2861
-    weight 232
-  ]
-  edge [
-    source 724
-    target 1582
-    weight 122
-  ]
-  edge [
-    source 724
-    target 1616
-    weight 281
-  ]
-  edge [
-    source 724
-    target 4051
-    weight 247
-  ]
-  edge [
-    source 724
-    target 2543
-    weight 79
-  ]
-  edge [
-    source 724
-    target 3276
-    weight 140
-  ]
-  edge [
-    source 724
-    target 3521
-    weight 283
-  ]
-  edge [
-    source 724
-    target 3377
-    weight 31
-  ]
-  edge [
-    source 724
-    target 1995
-    weight 181
-  ]
-  edge [
-    source 724
-    target 1632
-    weight 183
-  ]
-  edge [
-    source 724
-    target 3006
-    weight 111
-  ]
-  edge [
-    source 724
-    target 1505
-    weight 103
-  ]
-  edge [
-    source 724
-    target 3253
-    weight 48
-  ]
-  edge [
-    source 724
-    target 3052
-    weight 51
-  ]
-  edge [
-    source 724
-    target 738
-    weight 132
-  ]
-  edge [
-    source 724
-    target 3066
-    weight 98
-  ]
-  edge [
-    source 724
-    target 3282
-    weight 117
-  ]
-  edge [
-    source 724
-    target 3174
-    weight 151
-  ]
-  edge [
-    source 724
-    target 4154
-    weight 90
-  ]
-  edge [
-    source 724
-    target 1766
-    weight 22
-  ]
-  edge [
-    source 724
-    target 1127
-    weight 56
-  ]
-  edge [
-    source 724
-    target 3636
-    weight 78
-  ]
-  edge [
-    source 724
-    target 2287
-    weight 87
-  ]
-  edge [
-    source 724
-    target 1053
-    weight 213
-  ]
-  edge [
-    source 724
-    target 3954
-    weight 131
-  ]
-  edge [
-    source 724
-    target 1080
-    weight 194
-  ]
-  edge [
-    source 724
-    target 1461
-    weight 36
-  ]
-  edge [
-    source 724
-    target 1757
-    weight 52
-  ]
-  edge [
-    source 724
-    target 774
-    weight 255
-  ]
-  edge [
-    source 724
-    target 1487
-    weight 169
-  ]
-  edge [
-    source 724
-    target 3642
-    weight 119
-  ]
-  edge [
-    source 724
-    target 3141
-    weight 251
-  ]
-  edge [
-    source 724
-    target 2204
-    weight 66
-  ]
-  edge [
-    source 724
-    target 3993
-    weight 131
-  ]
-  edge [
-    source 724
-    target 798
-    weight 92
-  ]
-  edge [
-    source 724
-    target 3847
-    weight 26
-  ]
-  edge [
-    source 724
-    target 3420
-    weight 60
-  ]
-  edge [
-    source 724
-    target 2700
-    weight 164
-  ]
-  edge [
-    source 724
-    target 3040
-    weight 111
-  ]
-  edge [
-    source 724
-    target 1195
-    weight 36
-  ]
-  edge [
-    source 724
-    target 3884
-    weight 22
-  ]
-  edge [
-    source 724
-    target 874
-    weight 46
-  ]
-  edge [
-    source 724
-    target 1938
-    weight 41
-  ]
-  edge [
-    source 724
-    target 3542
-    weight 103
-  ]
-  edge [
-    source 724
-    target 1360
-    weight 48
-  ]
-  edge [
-    source 724
-    target 4162
-    weight 59
-  ]
-  edge [
-    source 724
-    target 1322
-    weight 28
-  ]
-  edge [
-    source 724
-    target 1280
-    weight 22
-  ]
-  edge [
-    source 724
-    target 2870
-    weight 91
-  ]
-  edge [
-    source 724
-    target 3917
-    weight 105
-  ]
-  edge [
-    source 724
-    target 2890
-    weight 63
-  ]
-  edge [
-    source 724
-    target 1507
-    weight 58
-  ]
-  edge [
-    source 724
-    target 3443
-    weight 65
-  ]
-  edge [
-    source 724
-    target 2857
-    weight 102
-  ]
-  edge [
-    source 724
-    target 1185
-    weight 53
-  ]
-  edge [
-    source 724
-    target 1707
-    weight 51
-  ]
-  edge [
-    source 724
-    target 2058
-    weight 47
-  ]
-  edge [
-    source 724
-    target 968
-    weight 52
-  ]
-  edge [
-    source 724
-    target 3374
-    weight 57
-  ]
-  edge [
-    source 724
-    target 2800
-    weight 40
-  ]
-  edge [
-    source 724
-    target 2810
-    weight 28
-  ]
-  edge [
-    source 724
-    target 1943
-    weight 23
-  ]
-  edge [
-    source 724
-    target 2191
-    weight 64
-  ]
-  edge [
-    source 724
-    target 3295
-    weight 45
-  ]
-  edge [
-    source 724
-    target 2553
-    weight 58
-  ]
-  edge [
-    source 724
-    target 3423
-    weight 76
-  ]
-  edge [
-    source 724
-    target 3962
-    weight 52
-  ]
-  edge [
-    source 724
-    target 1523
-    weight 26
-  ]
-  edge [
-    source 724
-    target 1409
-    weight 50
-  ]
-  edge [
-    source 724
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 724
-    target 986
-    weight 27
-  ]
-  edge [
-    source 724
-    target 1420
-    weight 30
-  ]
-  edge [
-    source 733
-    target 774
-    weight 119
-  ]
-  edge [
-    source 733
-    target 751
-    weight 119
-  ]
-  edge [
-    source 733
-    target 3141
-    weight 123
-  ]
-  edge [
-    source 733
-    target 1887
-    weight 115
-  ]
-  edge [
-    source 733
-    target 3174
-    weight 44
-  ]
-  edge [
-    source 733
-    target 3521
-    weight 163
-  ]
-  edge [
-    source 733
-    target 3993
-    weight 74
-  ]
-  edge [
-    source 733
-    target 2857
-    weight 32
-  ]
-  edge [
-    source 733
-    target 2700
-    weight 76
-  ]
-  edge [
-    source 733
-    target 1053
-    weight 104
-  ]
-  edge [
-    source 733
-    target 2861
-    weight 127
-  ]
-  edge [
-    source 733
-    target 1080
-    weight 78
-  ]
-  edge [
-    source 733
-    target 1254
-    weight 25
-  ]
-  edge [
-    source 733
-    target 3636
-    weight 38
-  ]
-  edge [
-    source 733
-    target 1154
-    weight 34
-  ]
-  edge [
-    source 733
-    target 1616
-    weight 128
-  ]
-  edge [
-    source 733
-    target 2071
-    weight 140
-  ]
-  edge [
-    source 733
-    target 986
-    weight 30
-  ]
-  edge [
-    source 733
-    target 2204
-    weight 34
-  ]
-  edge [
-    source 733
-    target 2890
-    weight 26
-  ]
-  edge [
-    source 733
-    target 3565
-    weight 52
-  ]
-  edge [
-    source 733
-    target 1995
-    weight 88
-  ]
-  edge [
-    source 733
-    target 3954
-    weight 28
-  ]
-  edge [
-    source 733
-    target 738
-    weight 70
-  ]
-  edge [
-    source 733
-    target 4051
-    weight 109
-  ]
-  edge [
-    source 733
-    target 3066
-    weight 22
-  ]
-  edge [
-    source 733
-    target 1647
-    weight 77
-  ]
-  edge [
-    source 733
-    target 3253
-    weight 27
-  ]
-  edge [
-    source 733
-    target 3642
-    weight 42
-  ]
-  edge [
-    source 733
-    target 3600
-    weight 71
-  ]
-  edge [
-    source 733
-    target 3282
-    weight 42
-  ]
-  edge [
-    source 733
-    target 1487
-    weight 92
-  ]
-  edge [
-    source 733
-    target 1582
-    weight 52
-  ]
-  edge [
-    source 733
-    target 3276
-    weight 52
-  ]
-  edge [
-    source 733
-    target 2553
-    weight 26
-  ]
-  edge [
-    source 733
-    target 3423
-    weight 32
-  ]
-  edge [
-    source 733
-    target 2287
-    weight 30
-  ]
-  edge [
-    source 733
-    target 2191
-    weight 25
-  ]
-  edge [
-    source 733
-    target 4154
-    weight 25
-  ]
-  edge [
-    source 733
-    target 3040
-    weight 41
-  ]
-  edge [
-    source 733
-    target 1757
-    weight 22
-  ]
-  edge [
-    source 733
-    target 1409
-    weight 36
-  ]
-  edge [
-    source 733
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 733
-    target 2870
-    weight 40
-  ]
-  edge [
-    source 733
-    target 1632
-    weight 55
-  ]
-  edge [
-    source 733
-    target 3542
-    weight 34
-  ]
-  edge [
-    source 733
-    target 3006
-    weight 46
-  ]
-  edge [
-    source 733
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 733
-    target 3917
-    weight 34
-  ]
-  edge [
-    source 733
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 733
-    target 3374
-    weight 24
-  ]
-  edge [
-    source 733
-    target 1505
-    weight 31
-  ]
-  edge [
-    source 733
-    target 3145
-    weight 63
-  ]
-  edge [
-    source 733
-    target 798
-    weight 31
-  ]
-  edge [
-    source 733
-    target 874
-    weight 23
-  ]
-  edge [
-    source 733
-    target 2810
-    weight 23
-  ]
-  edge [
-    source 733
-    target 2519
-    weight 39
-  ]
-  edge [
-    source 738
-    target 3521
-    weight 1762
-  ]
-  edge [
-    source 738
-    target 751
-    weight 1449
-  ]
-  edge [
-    source 738
-    target 1995
-    weight 933
-  ]
-  edge [
-    source 738
-    target 774
-    weight 1413
-  ]
-  edge [
-    source 738
-    target 3141
-    weight 1375
-  ]
-  edge [
-    source 738
-    target 2614
-    weight 74
-  ]
-  edge [
-    source 738
-    target 798
-    weight 362
-  ]
-  edge [
-    source 738
-    target 2071
-    weight 1347
-  ]
-  edge [
-    source 738
-    target 3636
-    weight 356
-  ]
-  edge [
-    source 738
-    target 3253
-    weight 237
-  ]
-  edge [
-    source 738
-    target 1647
-    weight 680
-  ]
-  edge [
-    source 738
-    target 1616
-    weight 1508
-  ]
-  edge [
-    source 738
-    target 3917
-    weight 418
-  ]
-  edge [
-    source 738
-    target 4051
-    weight 1342
-  ]
-  edge [
-    source 738
-    target 3542
-    weight 399
-  ]
-  edge [
-    source 738
-    target 1080
-    weight 815
-  ]
-  edge [
-    source 738
-    target 3066
-    weight 274
-  ]
-  edge [
-    source 738
-    target 1053
-    weight 1130
-  ]
-  edge [
-    source 738
-    target 2204
-    weight 237
-  ]
-  edge [
-    source 738
-    target 2800
-    weight 126
-  ]
-  edge [
-    source 738
-    target 2287
-    weight 305
-  ]
-  edge [
-    source 738
-    target 2861
-    weight 1195
-  ]
-  edge [
-    source 738
-    target 1632
-    weight 681
-  ]
-  edge [
-    source 738
-    target 3006
-    weight 318
-  ]
-  edge [
-    source 738
-    target 2082
-    weight 29
-  ]
-  edge [
-    source 738
-    target 2232
-    weight 23
-  ]
-  edge [
-    source 738
-    target 3052
-    weight 154
-  ]
-  edge [
-    source 738
-    target 3282
-    weight 459
-  ]
-  edge [
-    source 738
-    target 2978
-    weight 22
-  ]
-  edge [
-    source 738
-    target 3600
-    weight 781
-  ]
-  edge [
-    source 738
-    target 3565
-    weight 449
-  ]
-  edge [
-    source 738
-    target 1409
-    weight 187
-  ]
-  edge [
-    source 738
-    target 1487
-    weight 924
-  ]
-  edge [
-    source 738
-    target 3276
-    weight 648
-  ]
-  edge [
-    source 738
-    target 3423
-    weight 321
-  ]
-  edge [
-    source 738
-    target 2890
-    weight 251
-  ]
-  edge [
-    source 738
-    target 2700
-    weight 773
-  ]
-  edge [
-    source 738
-    target 968
-    weight 192
-  ]
-  edge [
-    source 738
-    target 1582
-    weight 592
-  ]
-  edge [
-    source 738
-    target 1887
-    weight 1310
-  ]
-  edge [
-    source 738
-    target 3642
-    weight 550
-  ]
-  edge [
-    source 738
-    target 2191
-    weight 210
-  ]
-  edge [
-    source 738
-    target 1505
-    weight 371
-  ]
-  edge [
-    source 738
-    target 3040
-    weight 382
-  ]
-  edge [
-    source 738
-    target 1154
-    weight 98
-  ]
-  edge [
-    source 738
-    target 3993
-    weight 630
-  ]
-  edge [
-    source 738
-    target 3145
-    weight 839
-  ]
-  edge [
-    source 738
-    target 1258
-    weight 37
-  ]
-  edge [
-    source 738
-    target 3937
-    weight 88
-  ]
-  edge [
-    source 738
-    target 3954
-    weight 363
-  ]
-  edge [
-    source 738
-    target 2857
-    weight 370
-  ]
-  edge [
-    source 738
-    target 3174
-    weight 678
-  ]
-  edge [
-    source 738
-    target 1254
-    weight 322
-  ]
-  edge [
-    source 738
-    target 2924
-    weight 29
-  ]
-  edge [
-    source 738
-    target 4187
-    weight 39
-  ]
-  edge [
-    source 738
-    target 3443
-    weight 252
-  ]
-  edge [
-    source 738
-    target 1185
-    weight 202
-  ]
-  edge [
-    source 738
-    target 2870
-    weight 323
-  ]
-  edge [
-    source 738
-    target 1757
-    weight 214
-  ]
-  edge [
-    source 738
-    target 4160
-    weight 59
-  ]
-  edge [
-    source 738
-    target 2553
-    weight 169
-  ]
-  edge [
-    source 738
-    target 877
-    weight 21
-  ]
-  edge [
-    source 738
-    target 2543
-    weight 227
-  ]
-  edge [
-    source 738
-    target 3295
-    weight 184
-  ]
-  edge [
-    source 738
-    target 1943
-    weight 57
-  ]
-  edge [
-    source 738
-    target 2810
-    weight 85
-  ]
-  edge [
-    source 738
-    target 1127
-    weight 110
-  ]
-  edge [
-    source 738
-    target 3847
-    weight 132
-  ]
-  edge [
-    source 738
-    target 3985
-    weight 31
-  ]
-  edge [
-    source 738
-    target 2329
-    weight 73
-  ]
-  edge [
-    source 738
-    target 4040
-    weight 88
-  ]
-  edge [
-    source 738
-    target 1766
-    weight 26
-  ]
-  edge [
-    source 738
-    target 1280
-    weight 84
-  ]
-  edge [
-    source 738
-    target 3374
-    weight 246
-  ]
-  edge [
-    source 738
-    target 2519
-    weight 373
-  ]
-  edge [
-    source 738
-    target 4154
-    weight 299
-  ]
-  edge [
-    source 738
-    target 1938
-    weight 129
-  ]
-  edge [
-    source 738
-    target 3935
-    weight 36
-  ]
-  edge [
-    source 738
-    target 1461
-    weight 58
-  ]
-  edge [
-    source 738
-    target 927
-    weight 53
-  ]
-  edge [
-    source 738
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 738
-    target 3884
-    weight 84
-  ]
-  edge [
-    source 738
-    target 1554
-    weight 27
-  ]
-  edge [
-    source 738
-    target 1090
-    weight 21
-  ]
-  edge [
-    source 738
-    target 2011
-    weight 32
-  ]
-  edge [
-    source 738
-    target 2570
-    weight 36
-  ]
-  edge [
-    source 738
-    target 808
-    weight 22
-  ]
-  edge [
-    source 738
-    target 1195
-    weight 77
-  ]
-  edge [
-    source 738
-    target 1707
-    weight 102
-  ]
-  edge [
-    source 738
-    target 2743
-    weight 26
-  ]
-  edge [
-    source 738
-    target 874
-    weight 217
-  ]
-  edge [
-    source 738
-    target 4162
-    weight 124
-  ]
-  edge [
-    source 738
-    target 1517
-    weight 41
-  ]
-  edge [
-    source 738
-    target 1577
-    weight 30
-  ]
-  edge [
-    source 738
-    target 3962
-    weight 215
-  ]
-  edge [
-    source 738
-    target 986
-    weight 121
-  ]
-  edge [
-    source 738
-    target 1322
-    weight 88
-  ]
-  edge [
-    source 738
-    target 3860
-    weight 32
-  ]
-  edge [
-    source 738
-    target 3071
-    weight 32
-  ]
-  edge [
-    source 738
-    target 2054
-    weight 24
-  ]
-  edge [
-    source 738
-    target 1028
-    weight 24
-  ]
-  edge [
-    source 738
-    target 1507
-    weight 118
-  ]
-  edge [
-    source 738
-    target 1523
-    weight 113
-  ]
-  edge [
-    source 738
-    target 3077
-    weight 65
-  ]
-  edge [
-    source 738
-    target 2227
-    weight 21
-  ]
-  edge [
-    source 738
-    target 1333
-    weight 33
-  ]
-  edge [
-    source 738
-    target 1952
-    weight 40
-  ]
-  edge [
-    source 738
-    target 1360
-    weight 115
-  ]
-  edge [
-    source 738
-    target 3420
-    weight 194
-  ]
-  edge [
-    source 738
-    target 1420
-    weight 71
-  ]
-  edge [
-    source 738
-    target 3408
-    weight 38
-  ]
-  edge [
-    source 738
-    target 3377
-    weight 73
-  ]
-  edge [
-    source 738
-    target 3162
-    weight 22
-  ]
-  edge [
-    source 738
-    target 3177
-    weight 65
-  ]
-  edge [
-    source 738
-    target 2058
-    weight 189
-  ]
-  edge [
-    source 738
-    target 3641
-    weight 32
-  ]
-  edge [
-    source 738
-    target 2061
-    weight 25
-  ]
-  edge [
-    source 738
-    target 3196
-    weight 43
-  ]
-  edge [
-    source 738
-    target 2556
-    weight 33
-  ]
-  edge [
-    source 738
-    target 2531
-    weight 31
-  ]
-  edge [
-    source 738
-    target 2711
-    weight 48
-  ]
-  edge [
-    source 738
-    target 2450
-    weight 22
-  ]
-  edge [
-    source 738
-    target 1391
-    weight 34
-  ]
-  edge [
-    source 738
-    target 1798
-    weight 27
-  ]
-  edge [
-    source 738
-    target 980
-    weight 66
-  ]
-  edge [
-    source 738
-    target 4027
-    weight 38
-  ]
-  edge [
-    source 738
-    target 842
-    weight 42
-  ]
-  edge [
-    source 738
-    target 3968
-    weight 46
-  ]
-  edge [
-    source 738
-    target 4098
-    weight 34
-  ]
-  edge [
-    source 738
-    target 1125
-    weight 46
-  ]
-  edge [
-    source 738
-    target 2003
-    weight 37
-  ]
-  edge [
-    source 738
-    target 3432
-    weight 37
-  ]
-  edge [
-    source 738
-    target 1148
-    weight 26
-  ]
-  edge [
-    source 738
-    target 3877
-    weight 71
-  ]
-  edge [
-    source 738
-    target 3677
-    weight 21
-  ]
-  edge [
-    source 738
-    target 3861
-    weight 22
-  ]
-  edge [
-    source 738
-    target 2078
-    weight 44
-  ]
-  edge [
-    source 738
-    target 2099
-    weight 26
-  ]
-  edge [
-    source 738
-    target 1802
-    weight 29
-  ]
-  edge [
-    source 738
-    target 1970
-    weight 37
-  ]
-  edge [
-    source 738
-    target 869
-    weight 23
-  ]
-  edge [
-    source 751
-    target 1616
-    weight 15981
-  ]
-  edge [
-    source 751
-    target 3521
-    weight 20128
-  ]
-  edge [
-    source 751
-    target 1487
-    weight 10969
-  ]
-  edge [
-    source 751
-    target 3565
-    weight 1879
-  ]
-  edge [
-    source 751
-    target 3600
-    weight 6806
-  ]
-  edge [
-    source 751
-    target 1647
-    weight 3811
-  ]
-  edge [
-    source 751
-    target 2861
-    weight 10360
-  ]
-  edge [
-    source 751
-    target 2191
-    weight 1069
-  ]
-  edge [
-    source 751
-    target 1789
-    weight 124
-  ]
-  edge [
-    source 751
-    target 1582
-    weight 4029
-  ]
-  edge [
-    source 751
-    target 3642
-    weight 2864
-  ]
-  edge [
-    source 751
-    target 3641
-    weight 108
-  ]
-  edge [
-    source 751
-    target 2421
-    weight 24
-  ]
-  edge [
-    source 751
-    target 3374
-    weight 1176
-  ]
-  edge [
-    source 751
-    target 774
-    weight 14549
-  ]
-  edge [
-    source 751
-    target 3077
-    weight 492
-  ]
-  edge [
-    source 751
-    target 3276
-    weight 4586
-  ]
-  edge [
-    source 751
-    target 4051
-    weight 12991
-  ]
-  edge [
-    source 751
-    target 2058
-    weight 827
-  ]
-  edge [
-    source 751
-    target 3423
-    weight 1907
-  ]
-  edge [
-    source 751
-    target 1080
-    weight 4413
-  ]
-  edge [
-    source 751
-    target 3937
-    weight 248
-  ]
-  edge [
-    source 751
-    target 4187
-    weight 147
-  ]
-  edge [
-    source 751
-    target 1374
-    weight 84
-  ]
-  edge [
-    source 751
-    target 2071
-    weight 13084
-  ]
-  edge [
-    source 751
-    target 2181
-    weight 49
-  ]
-  edge [
-    source 751
-    target 1053
-    weight 6720
-  ]
-  edge [
-    source 751
-    target 3968
-    weight 111
-  ]
-  edge [
-    source 751
-    target 2628
-    weight 21
-  ]
-  edge [
-    source 751
-    target 1166
-    weight 27
-  ]
-  edge [
-    source 751
-    target 1887
-    weight 12151
-  ]
-  edge [
-    source 751
-    target 3443
-    weight 866
-  ]
-  edge [
-    source 751
-    target 1952
-    weight 143
-  ]
-  edge [
-    source 751
-    target 3377
-    weight 206
-  ]
-  edge [
-    source 751
-    target 3177
-    weight 176
-  ]
-  edge [
-    source 751
-    target 3420
-    weight 514
-  ]
-  edge [
-    source 751
-    target 2329
-    weight 119
-  ]
-  edge [
-    source 751
-    target 874
-    weight 568
-  ]
-  edge [
-    source 751
-    target 3993
-    weight 3335
-  ]
-  edge [
-    source 751
-    target 1258
-    weight 104
-  ]
-  edge [
-    source 751
-    target 3066
-    weight 702
-  ]
-  edge [
-    source 751
-    target 2700
-    weight 3683
-  ]
-  edge [
-    source 751
-    target 1995
-    weight 3945
-  ]
-  edge [
-    source 751
-    target 798
-    weight 1475
-  ]
-  edge [
-    source 751
-    target 3071
-    weight 79
-  ]
-  edge [
-    source 751
-    target 964
-    weight 63
-  ]
-  edge [
-    source 751
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 751
-    target 3141
-    weight 13669
-  ]
-  edge [
-    source 751
-    target 3145
-    weight 4174
-  ]
-  edge [
-    source 751
-    target 3693
-    weight 42
-  ]
-  edge [
-    source 751
-    target 4027
-    weight 95
-  ]
-  edge [
-    source 751
-    target 1254
-    weight 1062
-  ]
-  edge [
-    source 751
-    target 3432
-    weight 94
-  ]
-  edge [
-    source 751
-    target 1505
-    weight 1441
-  ]
-  edge [
-    source 751
-    target 3174
-    weight 4906
-  ]
-  edge [
-    source 751
-    target 3636
-    weight 735
-  ]
-  edge [
-    source 751
-    target 1943
-    weight 153
-  ]
-  edge [
-    source 751
-    target 2543
-    weight 552
-  ]
-  edge [
-    source 751
-    target 2857
-    weight 1181
-  ]
-  edge [
-    source 751
-    target 3917
-    weight 1871
-  ]
-  edge [
-    source 751
-    target 1409
-    weight 740
-  ]
-  edge [
-    source 751
-    target 3962
-    weight 846
-  ]
-  edge [
-    source 751
-    target 1707
-    weight 170
-  ]
-  edge [
-    source 751
-    target 3357
-    weight 87
-  ]
-  edge [
-    source 751
-    target 3253
-    weight 521
-  ]
-  edge [
-    source 751
-    target 3985
-    weight 72
-  ]
-  edge [
-    source 751
-    target 877
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1127
-    weight 238
-  ]
-  edge [
-    source 751
-    target 986
-    weight 350
-  ]
-  edge [
-    source 751
-    target 2227
-    weight 200
-  ]
-  edge [
-    source 751
-    target 2810
-    weight 201
-  ]
-  edge [
-    source 751
-    target 2870
-    weight 830
-  ]
-  edge [
-    source 751
-    target 3282
-    weight 1290
-  ]
-  edge [
-    source 751
-    target 2800
-    weight 319
-  ]
-  edge [
-    source 751
-    target 1757
-    weight 639
-  ]
-  edge [
-    source 751
-    target 1632
-    weight 1756
-  ]
-  edge [
-    source 751
-    target 2978
-    weight 33
-  ]
-  edge [
-    source 751
-    target 3861
-    weight 74
-  ]
-  edge [
-    source 751
-    target 1931
-    weight 62
-  ]
-  edge [
-    source 751
-    target 927
-    weight 135
-  ]
-  edge [
-    source 751
-    target 1507
-    weight 310
-  ]
-  edge [
-    source 751
-    target 4152
-    weight 103
-  ]
-  edge [
-    source 751
-    target 3542
-    weight 1063
-  ]
-  edge [
-    source 751
-    target 2573
-    weight 52
-  ]
-  edge [
-    source 751
-    target 842
-    weight 99
-  ]
-  edge [
-    source 751
-    target 2614
-    weight 149
-  ]
-  edge [
-    source 751
-    target 1425
-    weight 47
-  ]
-  edge [
-    source 751
-    target 3954
-    weight 862
-  ]
-  edge [
-    source 751
-    target 968
-    weight 694
-  ]
-  edge [
-    source 751
-    target 2519
-    weight 1153
-  ]
-  edge [
-    source 751
-    target 1420
-    weight 171
-  ]
-  edge [
-    source 751
-    target 2078
-    weight 167
-  ]
-  edge [
-    source 751
-    target 2204
-    weight 575
-  ]
-  edge [
-    source 751
-    target 2597
-    weight 78
-  ]
-  edge [
-    source 751
-    target 2417
-    weight 23
-  ]
-  edge [
-    source 751
-    target 2198
-    weight 50
-  ]
-  edge [
-    source 751
-    target 2924
-    weight 52
-  ]
-  edge [
-    source 751
-    target 2287
-    weight 795
-  ]
-  edge [
-    source 751
-    target 3295
-    weight 458
-  ]
-  edge [
-    source 751
-    target 2890
-    weight 1092
-  ]
-  edge [
-    source 751
-    target 1360
-    weight 299
-  ]
-  edge [
-    source 751
-    target 1154
-    weight 258
-  ]
-  edge [
-    source 751
-    target 4098
-    weight 91
-  ]
-  edge [
-    source 751
-    target 1195
-    weight 162
-  ]
-  edge [
-    source 751
-    target 4154
-    weight 1093
-  ]
-  edge [
-    source 751
-    target 3006
-    weight 673
-  ]
-  edge [
-    source 751
-    target 3052
-    weight 328
-  ]
-  edge [
-    source 751
-    target 3040
-    weight 965
-  ]
-  edge [
-    source 751
-    target 3884
-    weight 132
-  ]
-  edge [
-    source 751
-    target 3559
-    weight 39
-  ]
-  edge [
-    source 751
-    target 2082
-    weight 45
-  ]
-  edge [
-    source 751
-    target 2232
-    weight 52
-  ]
-  edge [
-    source 751
-    target 2003
-    weight 99
-  ]
-  edge [
-    source 751
-    target 2299
-    weight 22
-  ]
-  edge [
-    source 751
-    target 3112
-    weight 38
-  ]
-  edge [
-    source 751
-    target 1322
-    weight 178
-  ]
-  edge [
-    source 751
-    target 1554
-    weight 34
-  ]
-  edge [
-    source 751
-    target 1691
-    weight 46
-  ]
-  edge [
-    source 751
-    target 916
-    weight 91
-  ]
-  edge [
-    source 751
-    target 2009
-    weight 35
-  ]
-  edge [
-    source 751
-    target 4160
-    weight 89
-  ]
-  edge [
-    source 751
-    target 1938
-    weight 296
-  ]
-  edge [
-    source 751
-    target 1185
-    weight 475
-  ]
-  edge [
-    source 751
-    target 2061
-    weight 64
-  ]
-  edge [
-    source 751
-    target 1125
-    weight 164
-  ]
-  edge [
-    source 751
-    target 4007
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1333
-    weight 185
-  ]
-  edge [
-    source 751
-    target 3935
-    weight 62
-  ]
-  edge [
-    source 751
-    target 2553
-    weight 342
-  ]
-  edge [
-    source 751
-    target 2832
-    weight 33
-  ]
-  edge [
-    source 751
-    target 869
-    weight 112
-  ]
-  edge [
-    source 751
-    target 1766
-    weight 54
-  ]
-  edge [
-    source 751
-    target 1299
-    weight 30
-  ]
-  edge [
-    source 751
-    target 4100
-    weight 34
-  ]
-  edge [
-    source 751
-    target 2556
-    weight 60
-  ]
-  edge [
-    source 751
-    target 1461
-    weight 105
-  ]
-  edge [
-    source 751
-    target 3050
-    weight 60
-  ]
-  edge [
-    source 751
-    target 4040
-    weight 216
-  ]
-  edge [
-    source 751
-    target 3196
-    weight 91
-  ]
-  edge [
-    source 751
-    target 1391
-    weight 109
-  ]
-  edge [
-    source 751
-    target 3847
-    weight 227
-  ]
-  edge [
-    source 751
-    target 1543
-    weight 29
-  ]
-  edge [
-    source 751
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 751
-    target 3408
-    weight 304
-  ]
-  edge [
-    source 751
-    target 2011
-    weight 110
-  ]
-  edge [
-    source 751
-    target 4162
-    weight 343
-  ]
-  edge [
-    source 751
-    target 1232
-    weight 46
-  ]
-  edge [
-    source 751
-    target 2099
-    weight 139
-  ]
-  edge [
-    source 751
-    target 1090
-    weight 46
-  ]
-  edge [
-    source 751
-    target 2955
-    weight 62
-  ]
-  edge [
-    source 751
-    target 2711
-    weight 101
-  ]
-  edge [
-    source 751
-    target 3375
-    weight 28
-  ]
-  edge [
-    source 751
-    target 1492
-    weight 44
-  ]
-  edge [
-    source 751
-    target 3309
-    weight 26
-  ]
-  edge [
-    source 751
-    target 2570
-    weight 76
-  ]
-  edge [
-    source 751
-    target 2609
-    weight 38
-  ]
-  edge [
-    source 751
-    target 808
-    weight 33
-  ]
-  edge [
-    source 751
-    target 801
-    weight 25
-  ]
-  edge [
-    source 751
-    target 3162
-    weight 83
-  ]
-  edge [
-    source 751
-    target 2844
-    weight 53
-  ]
-  edge [
-    source 751
-    target 1523
-    weight 285
-  ]
-  edge [
-    source 751
-    target 2450
-    weight 33
-  ]
-  edge [
-    source 751
-    target 2434
-    weight 25
-  ]
-  edge [
-    source 751
-    target 1517
-    weight 142
-  ]
-  edge [
-    source 751
-    target 980
-    weight 323
-  ]
-  edge [
-    source 751
-    target 1577
-    weight 56
-  ]
-  edge [
-    source 751
-    target 1798
-    weight 81
-  ]
-  edge [
-    source 751
-    target 3956
-    weight 43
-  ]
-  edge [
-    source 751
-    target 2600
-    weight 24
-  ]
-  edge [
-    source 751
-    target 1280
-    weight 243
-  ]
-  edge [
-    source 751
-    target 1676
-    weight 34
-  ]
-  edge [
-    source 751
-    target 3324
-    weight 31
-  ]
-  edge [
-    source 751
-    target 1631
-    weight 42
-  ]
-  edge [
-    source 751
-    target 3860
-    weight 85
-  ]
-  edge [
-    source 751
-    target 1419
-    weight 71
-  ]
-  edge [
-    source 751
-    target 2054
-    weight 52
-  ]
-  edge [
-    source 751
-    target 3952
-    weight 28
-  ]
-  edge [
-    source 751
-    target 1199
-    weight 43
-  ]
-  edge [
-    source 751
-    target 1028
-    weight 61
-  ]
-  edge [
-    source 751
-    target 871
-    weight 51
-  ]
-  edge [
-    source 751
-    target 3024
-    weight 75
-  ]
-  edge [
-    source 751
-    target 3877
-    weight 248
-  ]
-  edge [
-    source 751
-    target 1856
-    weight 28
-  ]
-  edge [
-    source 751
-    target 2743
-    weight 48
-  ]
-  edge [
-    source 751
-    target 2983
-    weight 37
-  ]
-  edge [
-    source 751
-    target 2531
-    weight 86
-  ]
-  edge [
-    source 751
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 751
-    target 3146
-    weight 26
-  ]
-  edge [
-    source 751
-    target 1775
-    weight 23
-  ]
-  edge [
-    source 751
-    target 3465
-    weight 23
-  ]
-  edge [
-    source 751
-    target 1664
-    weight 25
-  ]
-  edge [
-    source 751
-    target 1832
-    weight 41
-  ]
-  edge [
-    source 751
-    target 3692
-    weight 28
-  ]
-  edge [
-    source 751
-    target 1528
-    weight 48
-  ]
-  edge [
-    source 751
-    target 1377
-    weight 21
-  ]
-  edge [
-    source 751
-    target 2953
-    weight 21
-  ]
-  edge [
-    source 751
-    target 3108
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1922
-    weight 21
-  ]
-  edge [
-    source 751
-    target 1064
-    weight 42
-  ]
-  edge [
-    source 751
-    target 1140
-    weight 55
-  ]
-  edge [
-    source 751
-    target 3663
-    weight 22
-  ]
-  edge [
-    source 751
-    target 1802
-    weight 103
-  ]
-  edge [
-    source 751
-    target 1397
-    weight 29
-  ]
-  edge [
-    source 751
-    target 3011
-    weight 29
-  ]
-  edge [
-    source 751
-    target 2115
-    weight 41
-  ]
-  edge [
-    source 751
-    target 1148
-    weight 77
-  ]
-  edge [
-    source 751
-    target 3677
-    weight 77
-  ]
-  edge [
-    source 751
-    target 3856
-    weight 29
-  ]
-  edge [
-    source 751
-    target 2822
-    weight 83
-  ]
-  edge [
-    source 751
-    target 1326
-    weight 23
-  ]
-  edge [
-    source 751
-    target 1822
-    weight 22
-  ]
-  edge [
-    source 751
-    target 3872
-    weight 49
-  ]
-  edge [
-    source 751
-    target 1634
-    weight 32
-  ]
-  edge [
-    source 751
-    target 1349
-    weight 21
-  ]
-  edge [
-    source 751
-    target 2634
-    weight 27
-  ]
-  edge [
-    source 751
-    target 3737
-    weight 40
-  ]
-  edge [
-    source 751
-    target 1970
-    weight 132
-  ]
-  edge [
-    source 751
-    target 2836
-    weight 31
-  ]
-  edge [
-    source 751
-    target 3633
-    weight 63
-  ]
-  edge [
-    source 751
-    target 2801
-    weight 28
-  ]
-  edge [
-    source 751
-    target 3876
-    weight 51
-  ]
-  edge [
-    source 751
-    target 3462
-    weight 48
-  ]
-  edge [
-    source 751
-    target 1900
-    weight 27
-  ]
-  edge [
-    source 753
-    target 1887
-    weight 24
-  ]
-  edge [
-    source 753
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 753
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 753
-    target 1053
-    weight 22
-  ]
-  edge [
-    source 764
-    target 3521
-    weight 135
-  ]
-  edge [
-    source 764
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 774
-    target 3521
-    weight 22179
-  ]
-  edge [
-    source 774
-    target 1616
-    weight 17121
-  ]
-  edge [
-    source 774
-    target 3276
-    weight 5010
-  ]
-  edge [
-    source 774
-    target 1487
-    weight 11126
-  ]
-  edge [
-    source 774
-    target 3600
-    weight 7267
-  ]
-  edge [
-    source 774
-    target 3565
-    weight 1933
-  ]
-  edge [
-    source 774
-    target 2861
-    weight 10258
-  ]
-  edge [
-    source 774
-    target 1647
-    weight 3823
-  ]
-  edge [
-    source 774
-    target 1769
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2191
-    weight 1011
-  ]
-  edge [
-    source 774
-    target 3177
-    weight 184
-  ]
-  edge [
-    source 774
-    target 3141
-    weight 15982
-  ]
-  edge [
-    source 774
-    target 1053
-    weight 7419
-  ]
-  edge [
-    source 774
-    target 3071
-    weight 85
-  ]
-  edge [
-    source 774
-    target 964
-    weight 66
-  ]
-  edge [
-    source 774
-    target 3420
-    weight 561
-  ]
-  edge [
-    source 774
-    target 1409
-    weight 772
-  ]
-  edge [
-    source 774
-    target 3917
-    weight 1961
-  ]
-  edge [
-    source 774
-    target 3641
-    weight 101
-  ]
-  edge [
-    source 774
-    target 3642
-    weight 3086
-  ]
-  edge [
-    source 774
-    target 3542
-    weight 1172
-  ]
-  edge [
-    source 774
-    target 1582
-    weight 4619
-  ]
-  edge [
-    source 774
-    target 968
-    weight 742
-  ]
-  edge [
-    source 774
-    target 2700
-    weight 4251
-  ]
-  edge [
-    source 774
-    target 3145
-    weight 4511
-  ]
-  edge [
-    source 774
-    target 798
-    weight 1519
-  ]
-  edge [
-    source 774
-    target 2978
-    weight 36
-  ]
-  edge [
-    source 774
-    target 2071
-    weight 13500
-  ]
-  edge [
-    source 774
-    target 2857
-    weight 1241
-  ]
-  edge [
-    source 774
-    target 3993
-    weight 3479
-  ]
-  edge [
-    source 774
-    target 3423
-    weight 1898
-  ]
-  edge [
-    source 774
-    target 1080
-    weight 4339
-  ]
-  edge [
-    source 774
-    target 3077
-    weight 450
-  ]
-  edge [
-    source 774
-    target 3374
-    weight 1057
-  ]
-  edge [
-    source 774
-    target 3024
-    weight 81
-  ]
-  edge [
-    source 774
-    target 4051
-    weight 13513
-  ]
-  edge [
-    source 774
-    target 1127
-    weight 255
-  ]
-  edge [
-    source 774
-    target 874
-    weight 583
-  ]
-  edge [
-    source 774
-    target 3112
-    weight 34
-  ]
-  edge [
-    source 774
-    target 1254
-    weight 1038
-  ]
-  edge [
-    source 774
-    target 3066
-    weight 688
-  ]
-  edge [
-    source 774
-    target 3937
-    weight 242
-  ]
-  edge [
-    source 774
-    target 3174
-    weight 5140
-  ]
-  edge [
-    source 774
-    target 1995
-    weight 3828
-  ]
-  edge [
-    source 774
-    target 1258
-    weight 107
-  ]
-  edge [
-    source 774
-    target 1887
-    weight 14210
-  ]
-  edge [
-    source 774
-    target 2543
-    weight 555
-  ]
-  edge [
-    source 774
-    target 1707
-    weight 166
-  ]
-  edge [
-    source 774
-    target 3253
-    weight 552
-  ]
-  edge [
-    source 774
-    target 2870
-    weight 920
-  ]
-  edge [
-    source 774
-    target 2614
-    weight 153
-  ]
-  edge [
-    source 774
-    target 2329
-    weight 134
-  ]
-  edge [
-    source 774
-    target 3443
-    weight 974
-  ]
-  edge [
-    source 774
-    target 877
-    weight 43
-  ]
-  edge [
-    source 774
-    target 3968
-    weight 116
-  ]
-  edge [
-    source 774
-    target 3985
-    weight 76
-  ]
-  edge [
-    source 774
-    target 2810
-    weight 202
-  ]
-  edge [
-    source 774
-    target 3636
-    weight 784
-  ]
-  edge [
-    source 774
-    target 2204
-    weight 616
-  ]
-  edge [
-    source 774
-    target 1505
-    weight 1401
-  ]
-  edge [
-    source 774
-    target 1943
-    weight 142
-  ]
-  edge [
-    source 774
-    target 1425
-    weight 43
-  ]
-  edge [
-    source 774
-    target 3282
-    weight 1430
-  ]
-  edge [
-    source 774
-    target 4152
-    weight 111
-  ]
-  edge [
-    source 774
-    target 4187
-    weight 132
-  ]
-  edge [
-    source 774
-    target 842
-    weight 97
-  ]
-  edge [
-    source 774
-    target 3962
-    weight 904
-  ]
-  edge [
-    source 774
-    target 1931
-    weight 55
-  ]
-  edge [
-    source 774
-    target 1757
-    weight 704
-  ]
-  edge [
-    source 774
-    target 2058
-    weight 806
-  ]
-  edge [
-    source 774
-    target 986
-    weight 361
-  ]
-  edge [
-    source 774
-    target 1333
-    weight 178
-  ]
-  edge [
-    source 774
-    target 2181
-    weight 55
-  ]
-  edge [
-    source 774
-    target 2800
-    weight 334
-  ]
-  edge [
-    source 774
-    target 3693
-    weight 50
-  ]
-  edge [
-    source 774
-    target 1632
-    weight 1837
-  ]
-  edge [
-    source 774
-    target 3954
-    weight 851
-  ]
-  edge [
-    source 774
-    target 2227
-    weight 212
-  ]
-  edge [
-    source 774
-    target 3377
-    weight 216
-  ]
-  edge [
-    source 774
-    target 3432
-    weight 95
-  ]
-  edge [
-    source 774
-    target 1952
-    weight 136
-  ]
-  edge [
-    source 774
-    target 3860
-    weight 86
-  ]
-  edge [
-    source 774
-    target 2287
-    weight 767
-  ]
-  edge [
-    source 774
-    target 1360
-    weight 294
-  ]
-  edge [
-    source 774
-    target 2890
-    weight 1200
-  ]
-  edge [
-    source 774
-    target 2519
-    weight 1259
-  ]
-  edge [
-    source 774
-    target 2597
-    weight 88
-  ]
-  edge [
-    source 774
-    target 4154
-    weight 1190
-  ]
-  edge [
-    source 774
-    target 3006
-    weight 668
-  ]
-  edge [
-    source 774
-    target 1195
-    weight 169
-  ]
-  edge [
-    source 774
-    target 3847
-    weight 279
-  ]
-  edge [
-    source 774
-    target 3040
-    weight 907
-  ]
-  edge [
-    source 774
-    target 1154
-    weight 289
-  ]
-  edge [
-    source 774
-    target 1322
-    weight 207
-  ]
-  edge [
-    source 774
-    target 1554
-    weight 47
-  ]
-  edge [
-    source 774
-    target 1397
-    weight 30
-  ]
-  edge [
-    source 774
-    target 4027
-    weight 91
-  ]
-  edge [
-    source 774
-    target 2924
-    weight 58
-  ]
-  edge [
-    source 774
-    target 1938
-    weight 368
-  ]
-  edge [
-    source 774
-    target 2570
-    weight 85
-  ]
-  edge [
-    source 774
-    target 1185
-    weight 476
-  ]
-  edge [
-    source 774
-    target 2061
-    weight 63
-  ]
-  edge [
-    source 774
-    target 2232
-    weight 49
-  ]
-  edge [
-    source 774
-    target 1507
-    weight 312
-  ]
-  edge [
-    source 774
-    target 3935
-    weight 64
-  ]
-  edge [
-    source 774
-    target 2374
-    weight 22
-  ]
-  edge [
-    source 774
-    target 2553
-    weight 383
-  ]
-  edge [
-    source 774
-    target 1691
-    weight 47
-  ]
-  edge [
-    source 774
-    target 3408
-    weight 260
-  ]
-  edge [
-    source 774
-    target 1299
-    weight 27
-  ]
-  edge [
-    source 774
-    target 1577
-    weight 52
-  ]
-  edge [
-    source 774
-    target 1419
-    weight 77
-  ]
-  edge [
-    source 774
-    target 4100
-    weight 40
-  ]
-  edge [
-    source 774
-    target 2556
-    weight 70
-  ]
-  edge [
-    source 774
-    target 1461
-    weight 104
-  ]
-  edge [
-    source 774
-    target 1377
-    weight 26
-  ]
-  edge [
-    source 774
-    target 3050
-    weight 57
-  ]
-  edge [
-    source 774
-    target 4040
-    weight 233
-  ]
-  edge [
-    source 774
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 774
-    target 2600
-    weight 27
-  ]
-  edge [
-    source 774
-    target 4007
-    weight 41
-  ]
-  edge [
-    source 774
-    target 1280
-    weight 251
-  ]
-  edge [
-    source 774
-    target 927
-    weight 125
-  ]
-  edge [
-    source 774
-    target 3295
-    weight 500
-  ]
-  edge [
-    source 774
-    target 3956
-    weight 48
-  ]
-  edge [
-    source 774
-    target 4162
-    weight 350
-  ]
-  edge [
-    source 774
-    target 983
-    weight 22
-  ]
-  edge [
-    source 774
-    target 3375
-    weight 24
-  ]
-  edge [
-    source 774
-    target 3884
-    weight 136
-  ]
-  edge [
-    source 774
-    target 1140
-    weight 59
-  ]
-  edge [
-    source 774
-    target 2573
-    weight 48
-  ]
-  edge [
-    source 774
-    target 2531
-    weight 79
-  ]
-  edge [
-    source 774
-    target 1326
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2099
-    weight 131
-  ]
-  edge [
-    source 774
-    target 801
-    weight 25
-  ]
-  edge [
-    source 774
-    target 4160
-    weight 92
-  ]
-  edge [
-    source 774
-    target 2844
-    weight 62
-  ]
-  edge [
-    source 774
-    target 1523
-    weight 293
-  ]
-  edge [
-    source 774
-    target 1125
-    weight 173
-  ]
-  edge [
-    source 774
-    target 1166
-    weight 24
-  ]
-  edge [
-    source 774
-    target 2434
-    weight 28
-  ]
-  edge [
-    source 774
-    target 980
-    weight 339
-  ]
-  edge [
-    source 774
-    target 2711
-    weight 92
-  ]
-  edge [
-    source 774
-    target 2082
-    weight 47
-  ]
-  edge [
-    source 774
-    target 3196
-    weight 95
-  ]
-  edge [
-    source 774
-    target 1798
-    weight 70
-  ]
-  edge [
-    source 774
-    target 3861
-    weight 70
-  ]
-  edge [
-    source 774
-    target 3877
-    weight 255
-  ]
-  edge [
-    source 774
-    target 2955
-    weight 68
-  ]
-  edge [
-    source 774
-    target 1543
-    weight 35
-  ]
-  edge [
-    source 774
-    target 2009
-    weight 36
-  ]
-  edge [
-    source 774
-    target 1374
-    weight 75
-  ]
-  edge [
-    source 774
-    target 1492
-    weight 46
-  ]
-  edge [
-    source 774
-    target 3162
-    weight 89
-  ]
-  edge [
-    source 774
-    target 3052
-    weight 328
-  ]
-  edge [
-    source 774
-    target 1199
-    weight 48
-  ]
-  edge [
-    source 774
-    target 1232
-    weight 42
-  ]
-  edge [
-    source 774
-    target 871
-    weight 44
-  ]
-  edge [
-    source 774
-    target 1775
-    weight 26
-  ]
-  edge [
-    source 774
-    target 2832
-    weight 33
-  ]
-  edge [
-    source 774
-    target 3952
-    weight 34
-  ]
-  edge [
-    source 774
-    target 808
-    weight 30
-  ]
-  edge [
-    source 774
-    target 2450
-    weight 42
-  ]
-  edge [
-    source 774
-    target 1517
-    weight 136
-  ]
-  edge [
-    source 774
-    target 1631
-    weight 46
-  ]
-  edge [
-    source 774
-    target 3674
-    weight 24
-  ]
-  edge [
-    source 774
-    target 3108
-    weight 46
-  ]
-  edge [
-    source 774
-    target 1028
-    weight 58
-  ]
-  edge [
-    source 774
-    target 4098
-    weight 87
-  ]
-  edge [
-    source 774
-    target 1922
-    weight 33
-  ]
-  edge [
-    source 774
-    target 1856
-    weight 27
-  ]
-  edge [
-    source 774
-    target 1676
-    weight 38
-  ]
-  edge [
-    source 774
-    target 2003
-    weight 103
-  ]
-  edge [
-    source 774
-    target 1832
-    weight 44
-  ]
-  edge [
-    source 774
-    target 3692
-    weight 33
-  ]
-  edge [
-    source 774
-    target 1664
-    weight 24
-  ]
-  edge [
-    source 774
-    target 2628
-    weight 23
-  ]
-  edge [
-    source 774
-    target 3559
-    weight 38
-  ]
-  edge [
-    source 774
-    target 2011
-    weight 119
-  ]
-  edge [
-    source 774
-    target 2652
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2609
-    weight 35
-  ]
-  edge [
-    source 774
-    target 1766
-    weight 52
-  ]
-  edge [
-    source 774
-    target 3146
-    weight 26
-  ]
-  edge [
-    source 774
-    target 1391
-    weight 93
-  ]
-  edge [
-    source 774
-    target 1420
-    weight 192
-  ]
-  edge [
-    source 774
-    target 3465
-    weight 25
-  ]
-  edge [
-    source 774
-    target 3324
-    weight 26
-  ]
-  edge [
-    source 774
-    target 2743
-    weight 49
-  ]
-  edge [
-    source 774
-    target 3074
-    weight 23
-  ]
-  edge [
-    source 774
-    target 1802
-    weight 108
-  ]
-  edge [
-    source 774
-    target 2953
-    weight 21
-  ]
-  edge [
-    source 774
-    target 2262
-    weight 23
-  ]
-  edge [
-    source 774
-    target 2983
-    weight 31
-  ]
-  edge [
-    source 774
-    target 3210
-    weight 23
-  ]
-  edge [
-    source 774
-    target 2054
-    weight 50
-  ]
-  edge [
-    source 774
-    target 3011
-    weight 33
-  ]
-  edge [
-    source 774
-    target 1148
-    weight 84
-  ]
-  edge [
-    source 774
-    target 2997
-    weight 22
-  ]
-  edge [
-    source 774
-    target 1528
-    weight 46
-  ]
-  edge [
-    source 774
-    target 3677
-    weight 84
-  ]
-  edge [
-    source 774
-    target 3856
-    weight 27
-  ]
-  edge [
-    source 774
-    target 3309
-    weight 24
-  ]
-  edge [
-    source 774
-    target 2822
-    weight 96
-  ]
-  edge [
-    source 774
-    target 1789
-    weight 107
-  ]
-  edge [
-    source 774
-    target 1064
-    weight 44
-  ]
-  edge [
-    source 774
-    target 3440
-    weight 36
-  ]
-  edge [
-    source 774
-    target 869
-    weight 108
-  ]
-  edge [
-    source 774
-    target 3872
-    weight 57
-  ]
-  edge [
-    source 774
-    target 1634
-    weight 32
-  ]
-  edge [
-    source 774
-    target 2115
-    weight 37
-  ]
-  edge [
-    source 774
-    target 3357
-    weight 68
-  ]
-  edge [
-    source 774
-    target 2634
-    weight 28
-  ]
-  edge [
-    source 774
-    target 1090
-    weight 42
-  ]
-  edge [
-    source 774
-    target 3737
-    weight 41
-  ]
-  edge [
-    source 774
-    target 2801
-    weight 29
-  ]
-  edge [
-    source 774
-    target 3462
-    weight 41
-  ]
-  edge [
-    source 774
-    target 1415
-    weight 21
-  ]
-  edge [
-    source 774
-    target 1970
-    weight 132
-  ]
-  edge [
-    source 774
-    target 2198
-    weight 41
-  ]
-  edge [
-    source 774
-    target 2836
-    weight 36
-  ]
-  edge [
-    source 774
-    target 2078
-    weight 172
-  ]
-  edge [
-    source 774
-    target 3633
-    weight 65
-  ]
-  edge [
-    source 774
-    target 916
-    weight 73
-  ]
-  edge [
-    source 774
-    target 3876
-    weight 48
-  ]
-  edge [
-    source 774
-    target 1900
-    weight 28
-  ]
-  edge [
-    source 798
-    target 3521
-    weight 1737
-  ]
-  edge [
-    source 798
-    target 1616
-    weight 1494
-  ]
-  edge [
-    source 798
-    target 1582
-    weight 715
-  ]
-  edge [
-    source 798
-    target 2700
-    weight 699
-  ]
-  edge [
-    source 798
-    target 2857
-    weight 399
-  ]
-  edge [
-    source 798
-    target 2861
-    weight 1110
-  ]
-  edge [
-    source 798
-    target 1487
-    weight 1116
-  ]
-  edge [
-    source 798
-    target 3565
-    weight 371
-  ]
-  edge [
-    source 798
-    target 1647
-    weight 723
-  ]
-  edge [
-    source 798
-    target 3145
-    weight 909
-  ]
-  edge [
-    source 798
-    target 3993
-    weight 715
-  ]
-  edge [
-    source 798
-    target 1080
-    weight 622
-  ]
-  edge [
-    source 798
-    target 3141
-    weight 1485
-  ]
-  edge [
-    source 798
-    target 1053
-    weight 1143
-  ]
-  edge [
-    source 798
-    target 4051
-    weight 1341
-  ]
-  edge [
-    source 798
-    target 1995
-    weight 699
-  ]
-  edge [
-    source 798
-    target 3542
-    weight 330
-  ]
-  edge [
-    source 798
-    target 2800
-    weight 132
-  ]
-  edge [
-    source 798
-    target 3917
-    weight 570
-  ]
-  edge [
-    source 798
-    target 2071
-    weight 1347
-  ]
-  edge [
-    source 798
-    target 1887
-    weight 1363
-  ]
-  edge [
-    source 798
-    target 3985
-    weight 30
-  ]
-  edge [
-    source 798
-    target 3600
-    weight 983
-  ]
-  edge [
-    source 798
-    target 2227
-    weight 33
-  ]
-  edge [
-    source 798
-    target 2058
-    weight 276
-  ]
-  edge [
-    source 798
-    target 2191
-    weight 242
-  ]
-  edge [
-    source 798
-    target 3276
-    weight 831
-  ]
-  edge [
-    source 798
-    target 927
-    weight 59
-  ]
-  edge [
-    source 798
-    target 4152
-    weight 30
-  ]
-  edge [
-    source 798
-    target 842
-    weight 45
-  ]
-  edge [
-    source 798
-    target 3962
-    weight 207
-  ]
-  edge [
-    source 798
-    target 2870
-    weight 272
-  ]
-  edge [
-    source 798
-    target 4187
-    weight 47
-  ]
-  edge [
-    source 798
-    target 3420
-    weight 206
-  ]
-  edge [
-    source 798
-    target 3282
-    weight 431
-  ]
-  edge [
-    source 798
-    target 2181
-    weight 23
-  ]
-  edge [
-    source 798
-    target 3443
-    weight 343
-  ]
-  edge [
-    source 798
-    target 3253
-    weight 202
-  ]
-  edge [
-    source 798
-    target 3642
-    weight 538
-  ]
-  edge [
-    source 798
-    target 3066
-    weight 226
-  ]
-  edge [
-    source 798
-    target 3636
-    weight 238
-  ]
-  edge [
-    source 798
-    target 2614
-    weight 65
-  ]
-  edge [
-    source 798
-    target 2204
-    weight 192
-  ]
-  edge [
-    source 798
-    target 2287
-    weight 253
-  ]
-  edge [
-    source 798
-    target 2329
-    weight 57
-  ]
-  edge [
-    source 798
-    target 3935
-    weight 30
-  ]
-  edge [
-    source 798
-    target 2553
-    weight 158
-  ]
-  edge [
-    source 798
-    target 3174
-    weight 697
-  ]
-  edge [
-    source 798
-    target 3040
-    weight 240
-  ]
-  edge [
-    source 798
-    target 2810
-    weight 77
-  ]
-  edge [
-    source 798
-    target 1127
-    weight 88
-  ]
-  edge [
-    source 798
-    target 3847
-    weight 92
-  ]
-  edge [
-    source 798
-    target 2570
-    weight 32
-  ]
-  edge [
-    source 798
-    target 2543
-    weight 154
-  ]
-  edge [
-    source 798
-    target 3954
-    weight 250
-  ]
-  edge [
-    source 798
-    target 2890
-    weight 299
-  ]
-  edge [
-    source 798
-    target 3884
-    weight 60
-  ]
-  edge [
-    source 798
-    target 1461
-    weight 36
-  ]
-  edge [
-    source 798
-    target 1195
-    weight 52
-  ]
-  edge [
-    source 798
-    target 1409
-    weight 164
-  ]
-  edge [
-    source 798
-    target 1254
-    weight 300
-  ]
-  edge [
-    source 798
-    target 874
-    weight 186
-  ]
-  edge [
-    source 798
-    target 3006
-    weight 177
-  ]
-  edge [
-    source 798
-    target 3377
-    weight 74
-  ]
-  edge [
-    source 798
-    target 4162
-    weight 93
-  ]
-  edge [
-    source 798
-    target 1360
-    weight 100
-  ]
-  edge [
-    source 798
-    target 1938
-    weight 115
-  ]
-  edge [
-    source 798
-    target 2519
-    weight 369
-  ]
-  edge [
-    source 798
-    target 3295
-    weight 136
-  ]
-  edge [
-    source 798
-    target 1258
-    weight 24
-  ]
-  edge [
-    source 798
-    target 1322
-    weight 71
-  ]
-  edge [
-    source 798
-    target 4154
-    weight 236
-  ]
-  edge [
-    source 798
-    target 1632
-    weight 456
-  ]
-  edge [
-    source 798
-    target 1280
-    weight 69
-  ]
-  edge [
-    source 798
-    target 877
-    weight 23
-  ]
-  edge [
-    source 798
-    target 1523
-    weight 110
-  ]
-  edge [
-    source 798
-    target 3052
-    weight 129
-  ]
-  edge [
-    source 798
-    target 1757
-    weight 203
-  ]
-  edge [
-    source 798
-    target 1154
-    weight 73
-  ]
-  edge [
-    source 798
-    target 1505
-    weight 359
-  ]
-  edge [
-    source 798
-    target 3374
-    weight 244
-  ]
-  edge [
-    source 798
-    target 2011
-    weight 31
-  ]
-  edge [
-    source 798
-    target 1185
-    weight 171
-  ]
-  edge [
-    source 798
-    target 3423
-    weight 326
-  ]
-  edge [
-    source 798
-    target 1507
-    weight 75
-  ]
-  edge [
-    source 798
-    target 1517
-    weight 32
-  ]
-  edge [
-    source 798
-    target 3196
-    weight 40
-  ]
-  edge [
-    source 798
-    target 2924
-    weight 25
-  ]
-  edge [
-    source 798
-    target 968
-    weight 158
-  ]
-  edge [
-    source 798
-    target 3408
-    weight 46
-  ]
-  edge [
-    source 798
-    target 3937
-    weight 71
-  ]
-  edge [
-    source 798
-    target 3968
-    weight 30
-  ]
-  edge [
-    source 798
-    target 986
-    weight 96
-  ]
-  edge [
-    source 798
-    target 4040
-    weight 65
-  ]
-  edge [
-    source 798
-    target 1707
-    weight 58
-  ]
-  edge [
-    source 798
-    target 4160
-    weight 22
-  ]
-  edge [
-    source 798
-    target 3860
-    weight 36
-  ]
-  edge [
-    source 798
-    target 1798
-    weight 25
-  ]
-  edge [
-    source 798
-    target 980
-    weight 60
-  ]
-  edge [
-    source 798
-    target 4027
-    weight 30
-  ]
-  edge [
-    source 798
-    target 2711
-    weight 38
-  ]
-  edge [
-    source 798
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 798
-    target 3432
-    weight 39
-  ]
-  edge [
-    source 798
-    target 2844
-    weight 23
-  ]
-  edge [
-    source 798
-    target 3877
-    weight 82
-  ]
-  edge [
-    source 798
-    target 3677
-    weight 24
-  ]
-  edge [
-    source 798
-    target 964
-    weight 22
-  ]
-  edge [
-    source 798
-    target 2822
-    weight 31
-  ]
-  edge [
-    source 798
-    target 3071
-    weight 39
-  ]
-  edge [
-    source 798
-    target 1148
-    weight 29
-  ]
-  edge [
-    source 798
-    target 3641
-    weight 40
-  ]
-  edge [
-    source 798
-    target 2099
-    weight 31
-  ]
-  edge [
-    source 798
-    target 3077
-    weight 70
-  ]
-  edge [
-    source 798
-    target 3108
-    weight 22
-  ]
-  edge [
-    source 798
-    target 1943
-    weight 60
-  ]
-  edge [
-    source 798
-    target 1125
-    weight 39
-  ]
-  edge [
-    source 798
-    target 1420
-    weight 86
-  ]
-  edge [
-    source 798
-    target 1952
-    weight 47
-  ]
-  edge [
-    source 798
-    target 1970
-    weight 32
-  ]
-  edge [
-    source 798
-    target 3177
-    weight 63
-  ]
-  edge [
-    source 798
-    target 3633
-    weight 24
-  ]
-  edge [
-    source 798
-    target 3162
-    weight 23
-  ]
-  edge [
-    source 798
-    target 2003
-    weight 21
-  ]
-  edge [
-    source 798
-    target 1802
-    weight 40
-  ]
-  edge [
-    source 798
-    target 869
-    weight 27
-  ]
-  edge [
-    source 798
-    target 2556
-    weight 24
-  ]
-  edge [
-    source 798
-    target 1333
-    weight 35
-  ]
-  edge [
-    source 798
-    target 2078
-    weight 53
-  ]
-  edge [
-    source 801
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 801
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 801
-    target 1887
-    weight 26
-  ]
-  edge [
-    source 801
-    target 2861
-    weight 22
-  ]
-  edge [
-    source 801
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 801
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 808
-    target 1616
-    weight 32
-  ]
-  edge [
-    source 808
-    target 3521
-    weight 42
-  ]
-  edge [
-    source 808
-    target 1053
-    weight 28
-  ]
-  edge [
-    source 808
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 808
-    target 1887
-    weight 29
-  ]
-  edge [
-    source 808
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 808
-    target 2861
-    weight 31
-  ]
-  edge [
-    source 808
-    target 4051
-    weight 32
-  ]
-  edge [
-    source 808
-    target 3141
-    weight 39
-  ]
-  edge [
-    source 842
-    target 3600
-    weight 58
-  ]
-  edge [
-    source 842
-    target 1995
-    weight 60
-  ]
-  edge [
-    source 842
-    target 2870
-    weight 39
-  ]
-  edge [
-    source 842
-    target 2861
-    weight 78
-  ]
-  edge [
-    source 842
-    target 1616
-    weight 97
-  ]
-  edge [
-    source 842
-    target 3141
-    weight 93
-  ]
-  edge [
-    source 842
-    target 4051
-    weight 91
-  ]
-  edge [
-    source 842
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 842
-    target 1053
-    weight 78
-  ]
-  edge [
-    source 842
-    target 1647
-    weight 59
-  ]
-  edge [
-    source 842
-    target 3962
-    weight 29
-  ]
-  edge [
-    source 842
-    target 2071
-    weight 88
-  ]
-  edge [
-    source 842
-    target 1487
-    weight 72
-  ]
-  edge [
-    source 842
-    target 3565
-    weight 26
-  ]
-  edge [
-    source 842
-    target 3443
-    weight 31
-  ]
-  edge [
-    source 842
-    target 3917
-    weight 49
-  ]
-  edge [
-    source 842
-    target 3145
-    weight 70
-  ]
-  edge [
-    source 842
-    target 1887
-    weight 95
-  ]
-  edge [
-    source 842
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 842
-    target 1080
-    weight 46
-  ]
-  edge [
-    source 842
-    target 3066
-    weight 28
-  ]
-  edge [
-    source 842
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 842
-    target 2519
-    weight 40
-  ]
-  edge [
-    source 842
-    target 3636
-    weight 27
-  ]
-  edge [
-    source 842
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 842
-    target 2890
-    weight 24
-  ]
-  edge [
-    source 842
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 842
-    target 2700
-    weight 60
-  ]
-  edge [
-    source 842
-    target 2204
-    weight 25
-  ]
-  edge [
-    source 842
-    target 3282
-    weight 40
-  ]
-  edge [
-    source 842
-    target 874
-    weight 24
-  ]
-  edge [
-    source 842
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 842
-    target 3276
-    weight 50
-  ]
-  edge [
-    source 842
-    target 1632
-    weight 47
-  ]
-  edge [
-    source 842
-    target 1757
-    weight 27
-  ]
-  edge [
-    source 842
-    target 1409
-    weight 21
-  ]
-  edge [
-    source 842
-    target 3954
-    weight 33
-  ]
-  edge [
-    source 842
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 842
-    target 1254
-    weight 41
-  ]
-  edge [
-    source 842
-    target 1505
-    weight 41
-  ]
-  edge [
-    source 842
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 842
-    target 3174
-    weight 56
-  ]
-  edge [
-    source 842
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 842
-    target 1582
-    weight 56
-  ]
-  edge [
-    source 842
-    target 3374
-    weight 26
-  ]
-  edge [
-    source 842
-    target 1185
-    weight 23
-  ]
-  edge [
-    source 842
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 842
-    target 3006
-    weight 25
-  ]
-  edge [
-    source 842
-    target 2857
-    weight 48
-  ]
-  edge [
-    source 842
-    target 3040
-    weight 34
-  ]
-  edge [
-    source 842
-    target 3423
-    weight 35
-  ]
-  edge [
-    source 842
-    target 2058
-    weight 23
-  ]
-  edge [
-    source 851
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 869
-    target 3521
-    weight 129
-  ]
-  edge [
-    source 869
-    target 3600
-    weight 112
-  ]
-  edge [
-    source 869
-    target 3993
-    weight 82
-  ]
-  edge [
-    source 869
-    target 1487
-    weight 91
-  ]
-  edge [
-    source 869
-    target 1616
-    weight 116
-  ]
-  edge [
-    source 869
-    target 2191
-    weight 21
-  ]
-  edge [
-    source 869
-    target 2071
-    weight 104
-  ]
-  edge [
-    source 869
-    target 1505
-    weight 57
-  ]
-  edge [
-    source 869
-    target 1080
-    weight 41
-  ]
-  edge [
-    source 869
-    target 3141
-    weight 107
-  ]
-  edge [
-    source 869
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 869
-    target 1887
-    weight 96
-  ]
-  edge [
-    source 869
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 869
-    target 1053
-    weight 65
-  ]
-  edge [
-    source 869
-    target 2861
-    weight 76
-  ]
-  edge [
-    source 869
-    target 2700
-    weight 47
-  ]
-  edge [
-    source 869
-    target 3145
-    weight 60
-  ]
-  edge [
-    source 869
-    target 1582
-    weight 54
-  ]
-  edge [
-    source 869
-    target 2857
-    weight 28
-  ]
-  edge [
-    source 869
-    target 3174
-    weight 60
-  ]
-  edge [
-    source 869
-    target 3423
-    weight 37
-  ]
-  edge [
-    source 869
-    target 1632
-    weight 29
-  ]
-  edge [
-    source 869
-    target 3276
-    weight 72
-  ]
-  edge [
-    source 869
-    target 1995
-    weight 46
-  ]
-  edge [
-    source 869
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 869
-    target 1647
-    weight 49
-  ]
-  edge [
-    source 869
-    target 4051
-    weight 99
-  ]
-  edge [
-    source 869
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 869
-    target 3282
-    weight 39
-  ]
-  edge [
-    source 869
-    target 3066
-    weight 24
-  ]
-  edge [
-    source 869
-    target 1254
-    weight 33
-  ]
-  edge [
-    source 869
-    target 874
-    weight 30
-  ]
-  edge [
-    source 869
-    target 2890
-    weight 27
-  ]
-  edge [
-    source 869
-    target 3542
-    weight 29
-  ]
-  edge [
-    source 869
-    target 3642
-    weight 31
-  ]
-  edge [
-    source 869
-    target 2519
-    weight 32
-  ]
-  edge [
-    source 871
-    target 3521
-    weight 55
-  ]
-  edge [
-    source 871
-    target 4051
-    weight 53
-  ]
-  edge [
-    source 871
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 871
-    target 1616
-    weight 47
-  ]
-  edge [
-    source 871
-    target 1487
-    weight 33
-  ]
-  edge [
-    source 871
-    target 2071
-    weight 45
-  ]
-  edge [
-    source 871
-    target 1887
-    weight 36
-  ]
-  edge [
-    source 871
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 871
-    target 1053
-    weight 27
-  ]
-  edge [
-    source 871
-    target 1080
-    weight 28
-  ]
-  edge [
-    source 871
-    target 3174
-    weight 22
-  ]
-  edge [
-    source 871
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 871
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 871
-    target 3141
-    weight 41
-  ]
-  edge [
-    source 871
-    target 1647
-    weight 30
-  ]
-  edge [
-    source 871
-    target 3145
-    weight 26
-  ]
-  edge [
-    source 874
-    target 3521
-    weight 688
-  ]
-  edge [
-    source 874
-    target 3565
-    weight 138
-  ]
-  edge [
-    source 874
-    target 1616
-    weight 608
-  ]
-  edge [
-    source 874
-    target 2861
-    weight 440
-  ]
-  edge [
-    source 874
-    target 3642
-    weight 199
-  ]
-  edge [
-    source 874
-    target 3377
-    weight 28
-  ]
-  edge [
-    source 874
-    target 2614
-    weight 44
-  ]
-  edge [
-    source 874
-    target 1080
-    weight 293
-  ]
-  edge [
-    source 874
-    target 3066
-    weight 143
-  ]
-  edge [
-    source 874
-    target 3600
-    weight 367
-  ]
-  edge [
-    source 874
-    target 3993
-    weight 293
-  ]
-  edge [
-    source 874
-    target 2800
-    weight 82
-  ]
-  edge [
-    source 874
-    target 4051
-    weight 529
-  ]
-  edge [
-    source 874
-    target 1487
-    weight 430
-  ]
-  edge [
-    source 874
-    target 2543
-    weight 117
-  ]
-  edge [
-    source 874
-    target 3174
-    weight 327
-  ]
-  edge [
-    source 874
-    target 3636
-    weight 160
-  ]
-  edge [
-    source 874
-    target 2329
-    weight 28
-  ]
-  edge [
-    source 874
-    target 3937
-    weight 57
-  ]
-  edge [
-    source 874
-    target 2870
-    weight 180
-  ]
-  edge [
-    source 874
-    target 3420
-    weight 95
-  ]
-  edge [
-    source 874
-    target 1507
-    weight 63
-  ]
-  edge [
-    source 874
-    target 2191
-    weight 122
-  ]
-  edge [
-    source 874
-    target 1995
-    weight 299
-  ]
-  edge [
-    source 874
-    target 1254
-    weight 220
-  ]
-  edge [
-    source 874
-    target 1053
-    weight 429
-  ]
-  edge [
-    source 874
-    target 3253
-    weight 116
-  ]
-  edge [
-    source 874
-    target 2700
-    weight 310
-  ]
-  edge [
-    source 874
-    target 3276
-    weight 345
-  ]
-  edge [
-    source 874
-    target 2071
-    weight 531
-  ]
-  edge [
-    source 874
-    target 1647
-    weight 281
-  ]
-  edge [
-    source 874
-    target 1887
-    weight 517
-  ]
-  edge [
-    source 874
-    target 3542
-    weight 168
-  ]
-  edge [
-    source 874
-    target 1632
-    weight 220
-  ]
-  edge [
-    source 874
-    target 3141
-    weight 549
-  ]
-  edge [
-    source 874
-    target 3145
-    weight 419
-  ]
-  edge [
-    source 874
-    target 3443
-    weight 122
-  ]
-  edge [
-    source 874
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 874
-    target 1505
-    weight 251
-  ]
-  edge [
-    source 874
-    target 3968
-    weight 27
-  ]
-  edge [
-    source 874
-    target 1127
-    weight 45
-  ]
-  edge [
-    source 874
-    target 3954
-    weight 156
-  ]
-  edge [
-    source 874
-    target 1154
-    weight 53
-  ]
-  edge [
-    source 874
-    target 2204
-    weight 136
-  ]
-  edge [
-    source 874
-    target 1757
-    weight 115
-  ]
-  edge [
-    source 874
-    target 1360
-    weight 61
-  ]
-  edge [
-    source 874
-    target 3282
-    weight 189
-  ]
-  edge [
-    source 874
-    target 3006
-    weight 116
-  ]
-  edge [
-    source 874
-    target 1943
-    weight 35
-  ]
-  edge [
-    source 874
-    target 3295
-    weight 68
-  ]
-  edge [
-    source 874
-    target 2857
-    weight 223
-  ]
-  edge [
-    source 874
-    target 1322
-    weight 42
-  ]
-  edge [
-    source 874
-    target 986
-    weight 56
-  ]
-  edge [
-    source 874
-    target 1461
-    weight 23
-  ]
-  edge [
-    source 874
-    target 3052
-    weight 87
-  ]
-  edge [
-    source 874
-    target 1938
-    weight 55
-  ]
-  edge [
-    source 874
-    target 3917
-    weight 253
-  ]
-  edge [
-    source 874
-    target 3071
-    weight 28
-  ]
-  edge [
-    source 874
-    target 1582
-    weight 270
-  ]
-  edge [
-    source 874
-    target 3077
-    weight 52
-  ]
-  edge [
-    source 874
-    target 1798
-    weight 26
-  ]
-  edge [
-    source 874
-    target 3408
-    weight 37
-  ]
-  edge [
-    source 874
-    target 3962
-    weight 94
-  ]
-  edge [
-    source 874
-    target 4160
-    weight 21
-  ]
-  edge [
-    source 874
-    target 968
-    weight 80
-  ]
-  edge [
-    source 874
-    target 2531
-    weight 22
-  ]
-  edge [
-    source 874
-    target 1517
-    weight 30
-  ]
-  edge [
-    source 874
-    target 4152
-    weight 28
-  ]
-  edge [
-    source 874
-    target 2711
-    weight 28
-  ]
-  edge [
-    source 874
-    target 4040
-    weight 41
-  ]
-  edge [
-    source 874
-    target 2553
-    weight 91
-  ]
-  edge [
-    source 874
-    target 3884
-    weight 44
-  ]
-  edge [
-    source 874
-    target 4154
-    weight 140
-  ]
-  edge [
-    source 874
-    target 1523
-    weight 62
-  ]
-  edge [
-    source 874
-    target 1185
-    weight 102
-  ]
-  edge [
-    source 874
-    target 2890
-    weight 121
-  ]
-  edge [
-    source 874
-    target 3847
-    weight 41
-  ]
-  edge [
-    source 874
-    target 2287
-    weight 137
-  ]
-  edge [
-    source 874
-    target 1409
-    weight 92
-  ]
-  edge [
-    source 874
-    target 1420
-    weight 53
-  ]
-  edge [
-    source 874
-    target 3423
-    weight 177
-  ]
-  edge [
-    source 874
-    target 2810
-    weight 39
-  ]
-  edge [
-    source 874
-    target 2519
-    weight 178
-  ]
-  edge [
-    source 874
-    target 2058
-    weight 125
-  ]
-  edge [
-    source 874
-    target 4187
-    weight 30
-  ]
-  edge [
-    source 874
-    target 3374
-    weight 153
-  ]
-  edge [
-    source 874
-    target 1333
-    weight 23
-  ]
-  edge [
-    source 874
-    target 3040
-    weight 136
-  ]
-  edge [
-    source 874
-    target 3432
-    weight 22
-  ]
-  edge [
-    source 874
-    target 927
-    weight 33
-  ]
-  edge [
-    source 874
-    target 4162
-    weight 55
-  ]
-  edge [
-    source 874
-    target 3860
-    weight 23
-  ]
-  edge [
-    source 874
-    target 1707
-    weight 38
-  ]
-  edge [
-    source 874
-    target 2099
-    weight 31
-  ]
-  edge [
-    source 874
-    target 980
-    weight 37
-  ]
-  edge [
-    source 874
-    target 1195
-    weight 30
-  ]
-  edge [
-    source 874
-    target 3177
-    weight 36
-  ]
-  edge [
-    source 874
-    target 3877
-    weight 41
-  ]
-  edge [
-    source 874
-    target 1280
-    weight 38
-  ]
-  edge [
-    source 874
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 874
-    target 3876
-    weight 32
-  ]
-  edge [
-    source 874
-    target 1952
-    weight 28
-  ]
-  edge [
-    source 877
-    target 3521
-    weight 54
-  ]
-  edge [
-    source 877
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 877
-    target 2861
-    weight 35
-  ]
-  edge [
-    source 877
-    target 1487
-    weight 37
-  ]
-  edge [
-    source 877
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 877
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 877
-    target 1616
-    weight 41
-  ]
-  edge [
-    source 877
-    target 3636
-    weight 40
-  ]
-  edge [
-    source 877
-    target 1080
-    weight 22
-  ]
-  edge [
-    source 877
-    target 1995
-    weight 28
-  ]
-  edge [
-    source 877
-    target 4051
-    weight 35
-  ]
-  edge [
-    source 877
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 877
-    target 3282
-    weight 21
-  ]
-  edge [
-    source 877
-    target 1887
-    weight 39
-  ]
-  edge [
-    source 877
-    target 1053
-    weight 31
-  ]
-  edge [
-    source 877
-    target 2700
-    weight 26
-  ]
-  edge [
-    source 877
-    target 2614
-    weight 22
-  ]
-  edge [
-    source 877
-    target 2071
-    weight 44
-  ]
-  edge [
-    source 877
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 877
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 916
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 916
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 916
-    target 2861
-    weight 59
-  ]
-  edge [
-    source 916
-    target 1487
-    weight 130
-  ]
-  edge [
-    source 916
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 916
-    target 1080
-    weight 39
-  ]
-  edge [
-    source 916
-    target 3521
-    weight 102
-  ]
-  edge [
-    source 916
-    target 1616
-    weight 81
-  ]
-  edge [
-    source 916
-    target 2071
-    weight 92
-  ]
-  edge [
-    source 916
-    target 1505
-    weight 24
-  ]
-  edge [
-    source 916
-    target 4051
-    weight 76
-  ]
-  edge [
-    source 916
-    target 3408
-    weight 24
-  ]
-  edge [
-    source 916
-    target 3423
-    weight 49
-  ]
-  edge [
-    source 916
-    target 3145
-    weight 36
-  ]
-  edge [
-    source 916
-    target 3374
-    weight 33
-  ]
-  edge [
-    source 916
-    target 3276
-    weight 38
-  ]
-  edge [
-    source 916
-    target 1582
-    weight 26
-  ]
-  edge [
-    source 916
-    target 3600
-    weight 53
-  ]
-  edge [
-    source 916
-    target 1647
-    weight 36
-  ]
-  edge [
-    source 916
-    target 3174
-    weight 37
-  ]
-  edge [
-    source 916
-    target 1053
-    weight 42
-  ]
-  edge [
-    source 916
-    target 3141
-    weight 70
-  ]
-  edge [
-    source 916
-    target 1887
-    weight 62
-  ]
-  edge [
-    source 916
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 927
-    target 2861
-    weight 108
-  ]
-  edge [
-    source 927
-    target 1616
-    weight 132
-  ]
-  edge [
-    source 927
-    target 3521
-    weight 157
-  ]
-  edge [
-    source 927
-    target 1647
-    weight 90
-  ]
-  edge [
-    source 927
-    target 3565
-    weight 35
-  ]
-  edge [
-    source 927
-    target 3066
-    weight 29
-  ]
-  edge [
-    source 927
-    target 1053
-    weight 107
-  ]
-  edge [
-    source 927
-    target 2870
-    weight 33
-  ]
-  edge [
-    source 927
-    target 1505
-    weight 57
-  ]
-  edge [
-    source 927
-    target 3443
-    weight 30
-  ]
-  edge [
-    source 927
-    target 2191
-    weight 31
-  ]
-  edge [
-    source 927
-    target 3145
-    weight 99
-  ]
-  edge [
-    source 927
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 927
-    target 3282
-    weight 54
-  ]
-  edge [
-    source 927
-    target 3600
-    weight 86
-  ]
-  edge [
-    source 927
-    target 1080
-    weight 67
-  ]
-  edge [
-    source 927
-    target 3542
-    weight 42
-  ]
-  edge [
-    source 927
-    target 1582
-    weight 62
-  ]
-  edge [
-    source 927
-    target 1995
-    weight 89
-  ]
-  edge [
-    source 927
-    target 2800
-    weight 36
-  ]
-  edge [
-    source 927
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 927
-    target 2071
-    weight 133
-  ]
-  edge [
-    source 927
-    target 1254
-    weight 37
-  ]
-  edge [
-    source 927
-    target 3993
-    weight 78
-  ]
-  edge [
-    source 927
-    target 3917
-    weight 57
-  ]
-  edge [
-    source 927
-    target 1887
-    weight 123
-  ]
-  edge [
-    source 927
-    target 1487
-    weight 104
-  ]
-  edge [
-    source 927
-    target 4051
-    weight 121
-  ]
-  edge [
-    source 927
-    target 3642
-    weight 51
-  ]
-  edge [
-    source 927
-    target 3040
-    weight 37
-  ]
-  edge [
-    source 927
-    target 3276
-    weight 67
-  ]
-  edge [
-    source 927
-    target 3141
-    weight 133
-  ]
-  edge [
-    source 927
-    target 2204
-    weight 38
-  ]
-  edge [
-    source 927
-    target 2287
-    weight 40
-  ]
-  edge [
-    source 927
-    target 3006
-    weight 29
-  ]
-  edge [
-    source 927
-    target 2890
-    weight 40
-  ]
-  edge [
-    source 927
-    target 3636
-    weight 43
-  ]
-  edge [
-    source 927
-    target 3253
-    weight 31
-  ]
-  edge [
-    source 927
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 927
-    target 4154
-    weight 35
-  ]
-  edge [
-    source 927
-    target 3954
-    weight 31
-  ]
-  edge [
-    source 927
-    target 1632
-    weight 55
-  ]
-  edge [
-    source 927
-    target 1757
-    weight 33
-  ]
-  edge [
-    source 927
-    target 1409
-    weight 27
-  ]
-  edge [
-    source 927
-    target 2857
-    weight 50
-  ]
-  edge [
-    source 927
-    target 2543
-    weight 25
-  ]
-  edge [
-    source 927
-    target 3374
-    weight 34
-  ]
-  edge [
-    source 927
-    target 3174
-    weight 60
-  ]
-  edge [
-    source 927
-    target 1185
-    weight 42
-  ]
-  edge [
-    source 927
-    target 3423
-    weight 49
-  ]
-  edge [
-    source 927
-    target 2058
-    weight 27
-  ]
-  edge [
-    source 927
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 927
-    target 2519
-    weight 44
-  ]
-  edge [
-    source 927
-    target 968
-    weight 24
-  ]
-  edge [
-    source 964
-    target 3600
-    weight 46
-  ]
-  edge [
-    source 964
-    target 2861
-    weight 51
-  ]
-  edge [
-    source 964
-    target 1616
-    weight 61
-  ]
-  edge [
-    source 964
-    target 1487
-    weight 58
-  ]
-  edge [
-    source 964
-    target 3521
-    weight 72
-  ]
-  edge [
-    source 964
-    target 1647
-    weight 48
-  ]
-  edge [
-    source 964
-    target 3423
-    weight 32
-  ]
-  edge [
-    source 964
-    target 3276
-    weight 39
-  ]
-  edge [
-    source 964
-    target 3917
-    weight 32
-  ]
-  edge [
-    source 964
-    target 4051
-    weight 58
-  ]
-  edge [
-    source 964
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 964
-    target 2700
-    weight 36
-  ]
-  edge [
-    source 964
-    target 3141
-    weight 64
-  ]
-  edge [
-    source 964
-    target 2071
-    weight 67
-  ]
-  edge [
-    source 964
-    target 1080
-    weight 25
-  ]
-  edge [
-    source 964
-    target 2191
-    weight 31
-  ]
-  edge [
-    source 964
-    target 3145
-    weight 51
-  ]
-  edge [
-    source 964
-    target 3374
-    weight 22
-  ]
-  edge [
-    source 964
-    target 1887
-    weight 55
-  ]
-  edge [
-    source 964
-    target 1995
-    weight 32
-  ]
-  edge [
-    source 964
-    target 1053
-    weight 42
-  ]
-  edge [
-    source 964
-    target 2857
-    weight 24
-  ]
-  edge [
-    source 964
-    target 3993
-    weight 44
-  ]
-  edge [
-    source 964
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 964
-    target 3174
-    weight 32
-  ]
-  edge [
-    source 964
-    target 1582
-    weight 35
-  ]
-  edge [
-    source 964
-    target 1632
-    weight 25
-  ]
-  edge [
-    source 964
-    target 2519
-    weight 24
-  ]
-  edge [
-    source 964
-    target 3282
-    weight 24
-  ]
-  edge [
-    source 968
-    target 3521
-    weight 888
-  ]
-  edge [
-    source 968
-    target 1616
-    weight 761
-  ]
-  edge [
-    source 968
-    target 1487
-    weight 521
-  ]
-  edge [
-    source 968
-    target 986
-    weight 39
-  ]
-  edge [
-    source 968
-    target 1995
-    weight 363
-  ]
-  edge [
-    source 968
-    target 3423
-    weight 168
-  ]
-  edge [
-    source 968
-    target 4051
-    weight 688
-  ]
-  edge [
-    source 968
-    target 2890
-    weight 123
-  ]
-  edge [
-    source 968
-    target 2071
-    weight 647
-  ]
-  edge [
-    source 968
-    target 2700
-    weight 333
-  ]
-  edge [
-    source 968
-    target 1053
-    weight 491
-  ]
-  edge [
-    source 968
-    target 3917
-    weight 190
-  ]
-  edge [
-    source 968
-    target 1505
-    weight 179
-  ]
-  edge [
-    source 968
-    target 2191
-    weight 90
-  ]
-  edge [
-    source 968
-    target 1887
-    weight 678
-  ]
-  edge [
-    source 968
-    target 1409
-    weight 99
-  ]
-  edge [
-    source 968
-    target 3642
-    weight 213
-  ]
-  edge [
-    source 968
-    target 3937
-    weight 32
-  ]
-  edge [
-    source 968
-    target 3040
-    weight 123
-  ]
-  edge [
-    source 968
-    target 3145
-    weight 392
-  ]
-  edge [
-    source 968
-    target 3636
-    weight 115
-  ]
-  edge [
-    source 968
-    target 3600
-    weight 424
-  ]
-  edge [
-    source 968
-    target 1647
-    weight 270
-  ]
-  edge [
-    source 968
-    target 2861
-    weight 525
-  ]
-  edge [
-    source 968
-    target 2800
-    weight 50
-  ]
-  edge [
-    source 968
-    target 1080
-    weight 326
-  ]
-  edge [
-    source 968
-    target 3993
-    weight 291
-  ]
-  edge [
-    source 968
-    target 3276
-    weight 341
-  ]
-  edge [
-    source 968
-    target 2287
-    weight 115
-  ]
-  edge [
-    source 968
-    target 1154
-    weight 31
-  ]
-  edge [
-    source 968
-    target 4187
-    weight 22
-  ]
-  edge [
-    source 968
-    target 3443
-    weight 99
-  ]
-  edge [
-    source 968
-    target 1185
-    weight 82
-  ]
-  edge [
-    source 968
-    target 3565
-    weight 147
-  ]
-  edge [
-    source 968
-    target 3174
-    weight 384
-  ]
-  edge [
-    source 968
-    target 1632
-    weight 225
-  ]
-  edge [
-    source 968
-    target 1757
-    weight 96
-  ]
-  edge [
-    source 968
-    target 2553
-    weight 60
-  ]
-  edge [
-    source 968
-    target 3141
-    weight 694
-  ]
-  edge [
-    source 968
-    target 1582
-    weight 256
-  ]
-  edge [
-    source 968
-    target 2204
-    weight 76
-  ]
-  edge [
-    source 968
-    target 3253
-    weight 82
-  ]
-  edge [
-    source 968
-    target 3954
-    weight 147
-  ]
-  edge [
-    source 968
-    target 3374
-    weight 113
-  ]
-  edge [
-    source 968
-    target 3006
-    weight 102
-  ]
-  edge [
-    source 968
-    target 3066
-    weight 103
-  ]
-  edge [
-    source 968
-    target 1707
-    weight 38
-  ]
-  edge [
-    source 968
-    target 3542
-    weight 146
-  ]
-  edge [
-    source 968
-    target 3282
-    weight 168
-  ]
-  edge [
-    source 968
-    target 3295
-    weight 71
-  ]
-  edge [
-    source 968
-    target 3847
-    weight 40
-  ]
-  edge [
-    source 968
-    target 1254
-    weight 129
-  ]
-  edge [
-    source 968
-    target 2543
-    weight 88
-  ]
-  edge [
-    source 968
-    target 1507
-    weight 54
-  ]
-  edge [
-    source 968
-    target 4154
-    weight 155
-  ]
-  edge [
-    source 968
-    target 2870
-    weight 118
-  ]
-  edge [
-    source 968
-    target 1943
-    weight 24
-  ]
-  edge [
-    source 968
-    target 2810
-    weight 33
-  ]
-  edge [
-    source 968
-    target 2857
-    weight 173
-  ]
-  edge [
-    source 968
-    target 1517
-    weight 22
-  ]
-  edge [
-    source 968
-    target 1523
-    weight 51
-  ]
-  edge [
-    source 968
-    target 1322
-    weight 33
-  ]
-  edge [
-    source 968
-    target 3968
-    weight 21
-  ]
-  edge [
-    source 968
-    target 1280
-    weight 38
-  ]
-  edge [
-    source 968
-    target 3962
-    weight 86
-  ]
-  edge [
-    source 968
-    target 3052
-    weight 52
-  ]
-  edge [
-    source 968
-    target 980
-    weight 30
-  ]
-  edge [
-    source 968
-    target 1127
-    weight 43
-  ]
-  edge [
-    source 968
-    target 4040
-    weight 25
-  ]
-  edge [
-    source 968
-    target 3377
-    weight 28
-  ]
-  edge [
-    source 968
-    target 1360
-    weight 52
-  ]
-  edge [
-    source 968
-    target 3077
-    weight 36
-  ]
-  edge [
-    source 968
-    target 2519
-    weight 154
-  ]
-  edge [
-    source 968
-    target 1938
-    weight 51
-  ]
-  edge [
-    source 968
-    target 3420
-    weight 80
-  ]
-  edge [
-    source 968
-    target 2058
-    weight 94
-  ]
-  edge [
-    source 968
-    target 1125
-    weight 26
-  ]
-  edge [
-    source 968
-    target 4162
-    weight 47
-  ]
-  edge [
-    source 968
-    target 1420
-    weight 27
-  ]
-  edge [
-    source 968
-    target 3177
-    weight 28
-  ]
-  edge [
-    source 968
-    target 1195
-    weight 25
-  ]
-  edge [
-    source 968
-    target 3877
-    weight 23
-  ]
-  edge [
-    source 968
-    target 3408
-    weight 22
-  ]
-  edge [
-    source 968
-    target 2078
-    weight 23
-  ]
-  edge [
-    source 980
-    target 1616
-    weight 347
-  ]
-  edge [
-    source 980
-    target 3141
-    weight 326
-  ]
-  edge [
-    source 980
-    target 3521
-    weight 401
-  ]
-  edge [
-    source 980
-    target 3642
-    weight 83
-  ]
-  edge [
-    source 980
-    target 3600
-    weight 221
-  ]
-  edge [
-    source 980
-    target 2071
-    weight 306
-  ]
-  edge [
-    source 980
-    target 2204
-    weight 49
-  ]
-  edge [
-    source 980
-    target 4051
-    weight 281
-  ]
-  edge [
-    source 980
-    target 1582
-    weight 118
-  ]
-  edge [
-    source 980
-    target 1409
-    weight 46
-  ]
-  edge [
-    source 980
-    target 3253
-    weight 30
-  ]
-  edge [
-    source 980
-    target 3423
-    weight 80
-  ]
-  edge [
-    source 980
-    target 1887
-    weight 308
-  ]
-  edge [
-    source 980
-    target 3565
-    weight 55
-  ]
-  edge [
-    source 980
-    target 1647
-    weight 147
-  ]
-  edge [
-    source 980
-    target 1487
-    weight 283
-  ]
-  edge [
-    source 980
-    target 3443
-    weight 47
-  ]
-  edge [
-    source 980
-    target 2191
-    weight 41
-  ]
-  edge [
-    source 980
-    target 1053
-    weight 214
-  ]
-  edge [
-    source 980
-    target 1360
-    weight 23
-  ]
-  edge [
-    source 980
-    target 3174
-    weight 156
-  ]
-  edge [
-    source 980
-    target 3420
-    weight 30
-  ]
-  edge [
-    source 980
-    target 2700
-    weight 153
-  ]
-  edge [
-    source 980
-    target 2800
-    weight 27
-  ]
-  edge [
-    source 980
-    target 3282
-    weight 67
-  ]
-  edge [
-    source 980
-    target 2861
-    weight 221
-  ]
-  edge [
-    source 980
-    target 3993
-    weight 165
-  ]
-  edge [
-    source 980
-    target 2287
-    weight 32
-  ]
-  edge [
-    source 980
-    target 1080
-    weight 131
-  ]
-  edge [
-    source 980
-    target 2543
-    weight 28
-  ]
-  edge [
-    source 980
-    target 1185
-    weight 35
-  ]
-  edge [
-    source 980
-    target 1757
-    weight 42
-  ]
-  edge [
-    source 980
-    target 3917
-    weight 105
-  ]
-  edge [
-    source 980
-    target 3145
-    weight 191
-  ]
-  edge [
-    source 980
-    target 1254
-    weight 62
-  ]
-  edge [
-    source 980
-    target 4154
-    weight 71
-  ]
-  edge [
-    source 980
-    target 2890
-    weight 57
-  ]
-  edge [
-    source 980
-    target 2519
-    weight 74
-  ]
-  edge [
-    source 980
-    target 1505
-    weight 69
-  ]
-  edge [
-    source 980
-    target 3052
-    weight 30
-  ]
-  edge [
-    source 980
-    target 3954
-    weight 46
-  ]
-  edge [
-    source 980
-    target 3276
-    weight 156
-  ]
-  edge [
-    source 980
-    target 3066
-    weight 36
-  ]
-  edge [
-    source 980
-    target 3962
-    weight 62
-  ]
-  edge [
-    source 980
-    target 3542
-    weight 56
-  ]
-  edge [
-    source 980
-    target 2857
-    weight 58
-  ]
-  edge [
-    source 980
-    target 1995
-    weight 120
-  ]
-  edge [
-    source 980
-    target 3006
-    weight 38
-  ]
-  edge [
-    source 980
-    target 4162
-    weight 21
-  ]
-  edge [
-    source 980
-    target 3374
-    weight 57
-  ]
-  edge [
-    source 980
-    target 3636
-    weight 35
-  ]
-  edge [
-    source 980
-    target 1154
-    weight 21
-  ]
-  edge [
-    source 980
-    target 2870
-    weight 44
-  ]
-  edge [
-    source 980
-    target 1632
-    weight 71
-  ]
-  edge [
-    source 980
-    target 2553
-    weight 23
-  ]
-  edge [
-    source 980
-    target 2058
-    weight 42
-  ]
-  edge [
-    source 980
-    target 3040
-    weight 51
-  ]
-  edge [
-    source 980
-    target 1507
-    weight 22
-  ]
-  edge [
-    source 983
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 986
-    target 3521
-    weight 443
-  ]
-  edge [
-    source 986
-    target 2861
-    weight 289
-  ]
-  edge [
-    source 986
-    target 1647
-    weight 241
-  ]
-  edge [
-    source 986
-    target 3600
-    weight 251
-  ]
-  edge [
-    source 986
-    target 4051
-    weight 326
-  ]
-  edge [
-    source 986
-    target 1487
-    weight 387
-  ]
-  edge [
-    source 986
-    target 1616
-    weight 338
-  ]
-  edge [
-    source 986
-    target 3423
-    weight 211
-  ]
-  edge [
-    source 986
-    target 2071
-    weight 394
-  ]
-  edge [
-    source 986
-    target 3993
-    weight 247
-  ]
-  edge [
-    source 986
-    target 1943
-    weight 21
-  ]
-  edge [
-    source 986
-    target 3565
-    weight 92
-  ]
-  edge [
-    source 986
-    target 2191
-    weight 147
-  ]
-  edge [
-    source 986
-    target 1053
-    weight 257
-  ]
-  edge [
-    source 986
-    target 3141
-    weight 329
-  ]
-  edge [
-    source 986
-    target 1757
-    weight 72
-  ]
-  edge [
-    source 986
-    target 3542
-    weight 94
-  ]
-  edge [
-    source 986
-    target 2810
-    weight 44
-  ]
-  edge [
-    source 986
-    target 1080
-    weight 171
-  ]
-  edge [
-    source 986
-    target 3937
-    weight 72
-  ]
-  edge [
-    source 986
-    target 3282
-    weight 126
-  ]
-  edge [
-    source 986
-    target 1995
-    weight 164
-  ]
-  edge [
-    source 986
-    target 3917
-    weight 144
-  ]
-  edge [
-    source 986
-    target 1887
-    weight 297
-  ]
-  edge [
-    source 986
-    target 1938
-    weight 39
-  ]
-  edge [
-    source 986
-    target 2700
-    weight 172
-  ]
-  edge [
-    source 986
-    target 3174
-    weight 160
-  ]
-  edge [
-    source 986
-    target 2857
-    weight 112
-  ]
-  edge [
-    source 986
-    target 2890
-    weight 66
-  ]
-  edge [
-    source 986
-    target 1582
-    weight 157
-  ]
-  edge [
-    source 986
-    target 3636
-    weight 67
-  ]
-  edge [
-    source 986
-    target 3954
-    weight 82
-  ]
-  edge [
-    source 986
-    target 2800
-    weight 65
-  ]
-  edge [
-    source 986
-    target 1154
-    weight 42
-  ]
-  edge [
-    source 986
-    target 3177
-    weight 53
-  ]
-  edge [
-    source 986
-    target 2519
-    weight 101
-  ]
-  edge [
-    source 986
-    target 3145
-    weight 217
-  ]
-  edge [
-    source 986
-    target 2553
-    weight 46
-  ]
-  edge [
-    source 986
-    target 3276
-    weight 191
-  ]
-  edge [
-    source 986
-    target 2058
-    weight 99
-  ]
-  edge [
-    source 986
-    target 2287
-    weight 84
-  ]
-  edge [
-    source 986
-    target 1254
-    weight 95
-  ]
-  edge [
-    source 986
-    target 3040
-    weight 71
-  ]
-  edge [
-    source 986
-    target 3066
-    weight 72
-  ]
-  edge [
-    source 986
-    target 2204
-    weight 58
-  ]
-  edge [
-    source 986
-    target 1632
-    weight 117
-  ]
-  edge [
-    source 986
-    target 3641
-    weight 28
-  ]
-  edge [
-    source 986
-    target 3962
-    weight 126
-  ]
-  edge [
-    source 986
-    target 3077
-    weight 56
-  ]
-  edge [
-    source 986
-    target 1409
-    weight 91
-  ]
-  edge [
-    source 986
-    target 2543
-    weight 39
-  ]
-  edge [
-    source 986
-    target 3295
-    weight 30
-  ]
-  edge [
-    source 986
-    target 3052
-    weight 27
-  ]
-  edge [
-    source 986
-    target 1322
-    weight 32
-  ]
-  edge [
-    source 986
-    target 3408
-    weight 27
-  ]
-  edge [
-    source 986
-    target 3642
-    weight 93
-  ]
-  edge [
-    source 986
-    target 3374
-    weight 109
-  ]
-  edge [
-    source 986
-    target 1952
-    weight 35
-  ]
-  edge [
-    source 986
-    target 3420
-    weight 70
-  ]
-  edge [
-    source 986
-    target 2870
-    weight 77
-  ]
-  edge [
-    source 986
-    target 1185
-    weight 47
-  ]
-  edge [
-    source 986
-    target 3253
-    weight 37
-  ]
-  edge [
-    source 986
-    target 3443
-    weight 70
-  ]
-  edge [
-    source 986
-    target 1360
-    weight 21
-  ]
-  edge [
-    source 986
-    target 3006
-    weight 67
-  ]
-  edge [
-    source 986
-    target 4187
-    weight 26
-  ]
-  edge [
-    source 986
-    target 3847
-    weight 25
-  ]
-  edge [
-    source 986
-    target 1505
-    weight 107
-  ]
-  edge [
-    source 986
-    target 3377
-    weight 25
-  ]
-  edge [
-    source 986
-    target 2227
-    weight 23
-  ]
-  edge [
-    source 986
-    target 1333
-    weight 32
-  ]
-  edge [
-    source 986
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 986
-    target 4154
-    weight 45
-  ]
-  edge [
-    source 986
-    target 3877
-    weight 21
-  ]
-  edge [
-    source 986
-    target 1420
-    weight 26
-  ]
-  edge [
-    source 986
-    target 1507
-    weight 30
-  ]
-  edge [
-    source 986
-    target 2078
-    weight 27
-  ]
-  edge [
-    source 1023
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 1028
-    target 1616
-    weight 71
-  ]
-  edge [
-    source 1028
-    target 1080
-    weight 44
-  ]
-  edge [
-    source 1028
-    target 3521
-    weight 70
-  ]
-  edge [
-    source 1028
-    target 1254
-    weight 27
-  ]
-  edge [
-    source 1028
-    target 3642
-    weight 28
-  ]
-  edge [
-    source 1028
-    target 1487
-    weight 38
-  ]
-  edge [
-    source 1028
-    target 1995
-    weight 31
-  ]
-  edge [
-    source 1028
-    target 3141
-    weight 54
-  ]
-  edge [
-    source 1028
-    target 2071
-    weight 58
-  ]
-  edge [
-    source 1028
-    target 1887
-    weight 54
-  ]
-  edge [
-    source 1028
-    target 1647
-    weight 23
-  ]
-  edge [
-    source 1028
-    target 4051
-    weight 61
-  ]
-  edge [
-    source 1028
-    target 3993
-    weight 21
-  ]
-  edge [
-    source 1028
-    target 1053
-    weight 41
-  ]
-  edge [
-    source 1028
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1028
-    target 1632
-    weight 30
-  ]
-  edge [
-    source 1028
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 1028
-    target 2861
-    weight 54
-  ]
-  edge [
-    source 1028
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 1028
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 1028
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1028
-    target 1582
-    weight 21
-  ]
-  edge [
-    source 1028
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1053
-    target 3521
-    weight 8776
-  ]
-  edge [
-    source 1053
-    target 1616
-    weight 7356
-  ]
-  edge [
-    source 1053
-    target 4051
-    weight 6278
-  ]
-  edge [
-    source 1053
-    target 3276
-    weight 3246
-  ]
-  edge [
-    source 1053
-    target 3565
-    weight 1374
-  ]
-  edge [
-    source 1053
-    target 3600
-    weight 4186
-  ]
-  edge [
-    source 1053
-    target 1487
-    weight 4818
-  ]
-  edge [
-    source 1053
-    target 2870
-    weight 742
-  ]
-  edge [
-    source 1053
-    target 2191
-    weight 653
-  ]
-  edge [
-    source 1053
-    target 1647
-    weight 2656
-  ]
-  edge [
-    source 1053
-    target 3177
-    weight 139
-  ]
-  edge [
-    source 1053
-    target 3993
-    weight 2541
-  ]
-  edge [
-    source 1053
-    target 2071
-    weight 6407
-  ]
-  edge [
-    source 1053
-    target 2861
-    weight 5098
-  ]
-  edge [
-    source 1053
-    target 3968
-    weight 75
-  ]
-  edge [
-    source 1053
-    target 2329
-    weight 110
-  ]
-  edge [
-    source 1053
-    target 1995
-    weight 2811
-  ]
-  edge [
-    source 1053
-    target 1080
-    weight 2580
-  ]
-  edge [
-    source 1053
-    target 1582
-    weight 2704
-  ]
-  edge [
-    source 1053
-    target 3174
-    weight 3007
-  ]
-  edge [
-    source 1053
-    target 1887
-    weight 7020
-  ]
-  edge [
-    source 1053
-    target 3443
-    weight 730
-  ]
-  edge [
-    source 1053
-    target 3642
-    weight 1871
-  ]
-  edge [
-    source 1053
-    target 3937
-    weight 190
-  ]
-  edge [
-    source 1053
-    target 2543
-    weight 430
-  ]
-  edge [
-    source 1053
-    target 1707
-    weight 157
-  ]
-  edge [
-    source 1053
-    target 2700
-    weight 2990
-  ]
-  edge [
-    source 1053
-    target 3374
-    weight 660
-  ]
-  edge [
-    source 1053
-    target 2857
-    weight 947
-  ]
-  edge [
-    source 1053
-    target 3253
-    weight 450
-  ]
-  edge [
-    source 1053
-    target 3985
-    weight 65
-  ]
-  edge [
-    source 1053
-    target 3141
-    weight 7207
-  ]
-  edge [
-    source 1053
-    target 3962
-    weight 594
-  ]
-  edge [
-    source 1053
-    target 3145
-    weight 3040
-  ]
-  edge [
-    source 1053
-    target 3282
-    weight 1190
-  ]
-  edge [
-    source 1053
-    target 1631
-    weight 37
-  ]
-  edge [
-    source 1053
-    target 3066
-    weight 552
-  ]
-  edge [
-    source 1053
-    target 1757
-    weight 508
-  ]
-  edge [
-    source 1053
-    target 2978
-    weight 27
-  ]
-  edge [
-    source 1053
-    target 3542
-    weight 900
-  ]
-  edge [
-    source 1053
-    target 4187
-    weight 89
-  ]
-  edge [
-    source 1053
-    target 1505
-    weight 991
-  ]
-  edge [
-    source 1053
-    target 4152
-    weight 77
-  ]
-  edge [
-    source 1053
-    target 1254
-    weight 722
-  ]
-  edge [
-    source 1053
-    target 2204
-    weight 481
-  ]
-  edge [
-    source 1053
-    target 2800
-    weight 268
-  ]
-  edge [
-    source 1053
-    target 3420
-    weight 444
-  ]
-  edge [
-    source 1053
-    target 3917
-    weight 1516
-  ]
-  edge [
-    source 1053
-    target 1943
-    weight 115
-  ]
-  edge [
-    source 1053
-    target 2810
-    weight 164
-  ]
-  edge [
-    source 1053
-    target 1632
-    weight 1482
-  ]
-  edge [
-    source 1053
-    target 2181
-    weight 40
-  ]
-  edge [
-    source 1053
-    target 1931
-    weight 39
-  ]
-  edge [
-    source 1053
-    target 2058
-    weight 595
-  ]
-  edge [
-    source 1053
-    target 3377
-    weight 151
-  ]
-  edge [
-    source 1053
-    target 1409
-    weight 526
-  ]
-  edge [
-    source 1053
-    target 3024
-    weight 52
-  ]
-  edge [
-    source 1053
-    target 3423
-    weight 1146
-  ]
-  edge [
-    source 1053
-    target 1349
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 2614
-    weight 127
-  ]
-  edge [
-    source 1053
-    target 3954
-    weight 659
-  ]
-  edge [
-    source 1053
-    target 2227
-    weight 88
-  ]
-  edge [
-    source 1053
-    target 1789
-    weight 60
-  ]
-  edge [
-    source 1053
-    target 2417
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 2924
-    weight 48
-  ]
-  edge [
-    source 1053
-    target 3636
-    weight 641
-  ]
-  edge [
-    source 1053
-    target 3641
-    weight 66
-  ]
-  edge [
-    source 1053
-    target 2287
-    weight 591
-  ]
-  edge [
-    source 1053
-    target 3295
-    weight 353
-  ]
-  edge [
-    source 1053
-    target 1360
-    weight 234
-  ]
-  edge [
-    source 1053
-    target 2890
-    weight 862
-  ]
-  edge [
-    source 1053
-    target 3071
-    weight 69
-  ]
-  edge [
-    source 1053
-    target 2832
-    weight 27
-  ]
-  edge [
-    source 1053
-    target 3884
-    weight 120
-  ]
-  edge [
-    source 1053
-    target 1195
-    weight 127
-  ]
-  edge [
-    source 1053
-    target 2519
-    weight 940
-  ]
-  edge [
-    source 1053
-    target 3006
-    weight 506
-  ]
-  edge [
-    source 1053
-    target 1258
-    weight 79
-  ]
-  edge [
-    source 1053
-    target 3040
-    weight 688
-  ]
-  edge [
-    source 1053
-    target 1154
-    weight 207
-  ]
-  edge [
-    source 1053
-    target 1127
-    weight 203
-  ]
-  edge [
-    source 1053
-    target 2609
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 1554
-    weight 34
-  ]
-  edge [
-    source 1053
-    target 1397
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 1938
-    weight 281
-  ]
-  edge [
-    source 1053
-    target 3847
-    weight 228
-  ]
-  edge [
-    source 1053
-    target 1322
-    weight 167
-  ]
-  edge [
-    source 1053
-    target 2570
-    weight 70
-  ]
-  edge [
-    source 1053
-    target 1185
-    weight 376
-  ]
-  edge [
-    source 1053
-    target 4027
-    weight 68
-  ]
-  edge [
-    source 1053
-    target 2061
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 3935
-    weight 64
-  ]
-  edge [
-    source 1053
-    target 3559
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 2082
-    weight 48
-  ]
-  edge [
-    source 1053
-    target 2232
-    weight 36
-  ]
-  edge [
-    source 1053
-    target 3052
-    weight 254
-  ]
-  edge [
-    source 1053
-    target 2553
-    weight 324
-  ]
-  edge [
-    source 1053
-    target 1461
-    weight 81
-  ]
-  edge [
-    source 1053
-    target 4160
-    weight 59
-  ]
-  edge [
-    source 1053
-    target 1798
-    weight 57
-  ]
-  edge [
-    source 1053
-    target 4100
-    weight 25
-  ]
-  edge [
-    source 1053
-    target 2556
-    weight 64
-  ]
-  edge [
-    source 1053
-    target 3050
-    weight 43
-  ]
-  edge [
-    source 1053
-    target 4040
-    weight 182
-  ]
-  edge [
-    source 1053
-    target 4154
-    weight 845
-  ]
-  edge [
-    source 1053
-    target 1492
-    weight 36
-  ]
-  edge [
-    source 1053
-    target 2600
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1280
-    weight 175
-  ]
-  edge [
-    source 1053
-    target 3432
-    weight 74
-  ]
-  edge [
-    source 1053
-    target 1952
-    weight 106
-  ]
-  edge [
-    source 1053
-    target 1543
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 3408
-    weight 130
-  ]
-  edge [
-    source 1053
-    target 1691
-    weight 42
-  ]
-  edge [
-    source 1053
-    target 2955
-    weight 49
-  ]
-  edge [
-    source 1053
-    target 1517
-    weight 93
-  ]
-  edge [
-    source 1053
-    target 3375
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 1299
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2844
-    weight 47
-  ]
-  edge [
-    source 1053
-    target 3077
-    weight 201
-  ]
-  edge [
-    source 1053
-    target 2434
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2711
-    weight 72
-  ]
-  edge [
-    source 1053
-    target 1419
-    weight 48
-  ]
-  edge [
-    source 1053
-    target 2011
-    weight 84
-  ]
-  edge [
-    source 1053
-    target 1507
-    weight 207
-  ]
-  edge [
-    source 1053
-    target 3196
-    weight 66
-  ]
-  edge [
-    source 1053
-    target 2531
-    weight 57
-  ]
-  edge [
-    source 1053
-    target 4162
-    weight 264
-  ]
-  edge [
-    source 1053
-    target 1676
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 3861
-    weight 46
-  ]
-  edge [
-    source 1053
-    target 1766
-    weight 40
-  ]
-  edge [
-    source 1053
-    target 4007
-    weight 29
-  ]
-  edge [
-    source 1053
-    target 1140
-    weight 36
-  ]
-  edge [
-    source 1053
-    target 3860
-    weight 75
-  ]
-  edge [
-    source 1053
-    target 3952
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1199
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 2573
-    weight 35
-  ]
-  edge [
-    source 1053
-    target 1577
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 1523
-    weight 235
-  ]
-  edge [
-    source 1053
-    target 3693
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 3956
-    weight 31
-  ]
-  edge [
-    source 1053
-    target 2450
-    weight 32
-  ]
-  edge [
-    source 1053
-    target 3877
-    weight 162
-  ]
-  edge [
-    source 1053
-    target 1922
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2003
-    weight 60
-  ]
-  edge [
-    source 1053
-    target 1775
-    weight 21
-  ]
-  edge [
-    source 1053
-    target 1832
-    weight 32
-  ]
-  edge [
-    source 1053
-    target 1420
-    weight 162
-  ]
-  edge [
-    source 1053
-    target 1664
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 3692
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 1125
-    weight 115
-  ]
-  edge [
-    source 1053
-    target 1232
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 4098
-    weight 63
-  ]
-  edge [
-    source 1053
-    target 1064
-    weight 29
-  ]
-  edge [
-    source 1053
-    target 2743
-    weight 42
-  ]
-  edge [
-    source 1053
-    target 1374
-    weight 35
-  ]
-  edge [
-    source 1053
-    target 3162
-    weight 55
-  ]
-  edge [
-    source 1053
-    target 2983
-    weight 31
-  ]
-  edge [
-    source 1053
-    target 3011
-    weight 22
-  ]
-  edge [
-    source 1053
-    target 2054
-    weight 30
-  ]
-  edge [
-    source 1053
-    target 1148
-    weight 60
-  ]
-  edge [
-    source 1053
-    target 1856
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1634
-    weight 25
-  ]
-  edge [
-    source 1053
-    target 3677
-    weight 71
-  ]
-  edge [
-    source 1053
-    target 1802
-    weight 82
-  ]
-  edge [
-    source 1053
-    target 2822
-    weight 62
-  ]
-  edge [
-    source 1053
-    target 3872
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 1333
-    weight 104
-  ]
-  edge [
-    source 1053
-    target 3440
-    weight 26
-  ]
-  edge [
-    source 1053
-    target 2597
-    weight 53
-  ]
-  edge [
-    source 1053
-    target 2099
-    weight 65
-  ]
-  edge [
-    source 1053
-    target 2115
-    weight 24
-  ]
-  edge [
-    source 1053
-    target 3108
-    weight 38
-  ]
-  edge [
-    source 1053
-    target 3357
-    weight 29
-  ]
-  edge [
-    source 1053
-    target 1425
-    weight 31
-  ]
-  edge [
-    source 1053
-    target 1090
-    weight 33
-  ]
-  edge [
-    source 1053
-    target 3737
-    weight 25
-  ]
-  edge [
-    source 1053
-    target 2009
-    weight 23
-  ]
-  edge [
-    source 1053
-    target 1391
-    weight 54
-  ]
-  edge [
-    source 1053
-    target 1970
-    weight 88
-  ]
-  edge [
-    source 1053
-    target 2836
-    weight 24
-  ]
-  edge [
-    source 1053
-    target 3633
-    weight 44
-  ]
-  edge [
-    source 1053
-    target 2078
-    weight 124
-  ]
-  edge [
-    source 1053
-    target 1528
-    weight 28
-  ]
-  edge [
-    source 1053
-    target 3876
-    weight 32
-  ]
-  edge [
-    source 1064
-    target 1616
-    weight 43
-  ]
-  edge [
-    source 1064
-    target 3521
-    weight 51
-  ]
-  edge [
-    source 1064
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 1064
-    target 1887
-    weight 44
-  ]
-  edge [
-    source 1064
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 1064
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 1064
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 1064
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 1064
-    target 3423
-    weight 21
-  ]
-  edge [
-    source 1064
-    target 3141
-    weight 46
-  ]
-  edge [
-    source 1064
-    target 1487
-    weight 40
-  ]
-  edge [
-    source 1064
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 1064
-    target 2071
-    weight 42
-  ]
-  edge [
-    source 1064
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1064
-    target 2861
-    weight 25
-  ]
-  edge [
-    source 1064
-    target 4051
-    weight 36
-  ]
-  edge [
-    source 1080
-    target 2861
-    weight 4371
-  ]
-  edge [
-    source 1080
-    target 1616
-    weight 5215
-  ]
-  edge [
-    source 1080
-    target 1487
-    weight 3393
-  ]
-  edge [
-    source 1080
-    target 3521
-    weight 5698
-  ]
-  edge [
-    source 1080
-    target 3077
-    weight 167
-  ]
-  edge [
-    source 1080
-    target 3565
-    weight 791
-  ]
-  edge [
-    source 1080
-    target 3276
-    weight 1730
-  ]
-  edge [
-    source 1080
-    target 2191
-    weight 441
-  ]
-  edge [
-    source 1080
-    target 2071
-    weight 4211
-  ]
-  edge [
-    source 1080
-    target 3066
-    weight 429
-  ]
-  edge [
-    source 1080
-    target 3374
-    weight 534
-  ]
-  edge [
-    source 1080
-    target 1995
-    weight 1983
-  ]
-  edge [
-    source 1080
-    target 1647
-    weight 1394
-  ]
-  edge [
-    source 1080
-    target 3642
-    weight 1432
-  ]
-  edge [
-    source 1080
-    target 3377
-    weight 100
-  ]
-  edge [
-    source 1080
-    target 3600
-    weight 2187
-  ]
-  edge [
-    source 1080
-    target 3968
-    weight 58
-  ]
-  edge [
-    source 1080
-    target 2329
-    weight 59
-  ]
-  edge [
-    source 1080
-    target 1582
-    weight 1405
-  ]
-  edge [
-    source 1080
-    target 3993
-    weight 1260
-  ]
-  edge [
-    source 1080
-    target 2857
-    weight 567
-  ]
-  edge [
-    source 1080
-    target 2700
-    weight 1584
-  ]
-  edge [
-    source 1080
-    target 1254
-    weight 588
-  ]
-  edge [
-    source 1080
-    target 3141
-    weight 4152
-  ]
-  edge [
-    source 1080
-    target 4051
-    weight 4330
-  ]
-  edge [
-    source 1080
-    target 1409
-    weight 310
-  ]
-  edge [
-    source 1080
-    target 3024
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 3177
-    weight 71
-  ]
-  edge [
-    source 1080
-    target 2543
-    weight 302
-  ]
-  edge [
-    source 1080
-    target 3174
-    weight 1962
-  ]
-  edge [
-    source 1080
-    target 3985
-    weight 35
-  ]
-  edge [
-    source 1080
-    target 3443
-    weight 393
-  ]
-  edge [
-    source 1080
-    target 3282
-    weight 626
-  ]
-  edge [
-    source 1080
-    target 1757
-    weight 296
-  ]
-  edge [
-    source 1080
-    target 1931
-    weight 37
-  ]
-  edge [
-    source 1080
-    target 1507
-    weight 229
-  ]
-  edge [
-    source 1080
-    target 2800
-    weight 157
-  ]
-  edge [
-    source 1080
-    target 3542
-    weight 514
-  ]
-  edge [
-    source 1080
-    target 3420
-    weight 274
-  ]
-  edge [
-    source 1080
-    target 1887
-    weight 4029
-  ]
-  edge [
-    source 1080
-    target 1505
-    weight 598
-  ]
-  edge [
-    source 1080
-    target 3636
-    weight 380
-  ]
-  edge [
-    source 1080
-    target 2614
-    weight 83
-  ]
-  edge [
-    source 1080
-    target 3917
-    weight 906
-  ]
-  edge [
-    source 1080
-    target 2870
-    weight 391
-  ]
-  edge [
-    source 1080
-    target 3954
-    weight 613
-  ]
-  edge [
-    source 1080
-    target 2924
-    weight 28
-  ]
-  edge [
-    source 1080
-    target 3641
-    weight 53
-  ]
-  edge [
-    source 1080
-    target 4027
-    weight 62
-  ]
-  edge [
-    source 1080
-    target 3253
-    weight 277
-  ]
-  edge [
-    source 1080
-    target 2204
-    weight 278
-  ]
-  edge [
-    source 1080
-    target 2287
-    weight 390
-  ]
-  edge [
-    source 1080
-    target 2227
-    weight 81
-  ]
-  edge [
-    source 1080
-    target 1154
-    weight 127
-  ]
-  edge [
-    source 1080
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 3962
-    weight 344
-  ]
-  edge [
-    source 1080
-    target 3357
-    weight 38
-  ]
-  edge [
-    source 1080
-    target 2198
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 1374
-    weight 34
-  ]
-  edge [
-    source 1080
-    target 2058
-    weight 356
-  ]
-  edge [
-    source 1080
-    target 1632
-    weight 1064
-  ]
-  edge [
-    source 1080
-    target 3295
-    weight 210
-  ]
-  edge [
-    source 1080
-    target 3006
-    weight 613
-  ]
-  edge [
-    source 1080
-    target 2519
-    weight 565
-  ]
-  edge [
-    source 1080
-    target 2232
-    weight 37
-  ]
-  edge [
-    source 1080
-    target 3040
-    weight 661
-  ]
-  edge [
-    source 1080
-    target 2003
-    weight 68
-  ]
-  edge [
-    source 1080
-    target 3937
-    weight 127
-  ]
-  edge [
-    source 1080
-    target 3145
-    weight 1767
-  ]
-  edge [
-    source 1080
-    target 1258
-    weight 51
-  ]
-  edge [
-    source 1080
-    target 1943
-    weight 71
-  ]
-  edge [
-    source 1080
-    target 2810
-    weight 122
-  ]
-  edge [
-    source 1080
-    target 1195
-    weight 109
-  ]
-  edge [
-    source 1080
-    target 2556
-    weight 34
-  ]
-  edge [
-    source 1080
-    target 3423
-    weight 771
-  ]
-  edge [
-    source 1080
-    target 2890
-    weight 455
-  ]
-  edge [
-    source 1080
-    target 1185
-    weight 290
-  ]
-  edge [
-    source 1080
-    target 4187
-    weight 59
-  ]
-  edge [
-    source 1080
-    target 1517
-    weight 111
-  ]
-  edge [
-    source 1080
-    target 2726
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 1952
-    weight 71
-  ]
-  edge [
-    source 1080
-    target 1333
-    weight 60
-  ]
-  edge [
-    source 1080
-    target 1691
-    weight 28
-  ]
-  edge [
-    source 1080
-    target 1127
-    weight 179
-  ]
-  edge [
-    source 1080
-    target 1299
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 4154
-    weight 493
-  ]
-  edge [
-    source 1080
-    target 3050
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 4040
-    weight 106
-  ]
-  edge [
-    source 1080
-    target 1492
-    weight 29
-  ]
-  edge [
-    source 1080
-    target 2600
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 3847
-    weight 122
-  ]
-  edge [
-    source 1080
-    target 2531
-    weight 64
-  ]
-  edge [
-    source 1080
-    target 1280
-    weight 118
-  ]
-  edge [
-    source 1080
-    target 2011
-    weight 58
-  ]
-  edge [
-    source 1080
-    target 3462
-    weight 31
-  ]
-  edge [
-    source 1080
-    target 1461
-    weight 77
-  ]
-  edge [
-    source 1080
-    target 1420
-    weight 92
-  ]
-  edge [
-    source 1080
-    target 1090
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 1707
-    weight 126
-  ]
-  edge [
-    source 1080
-    target 1766
-    weight 41
-  ]
-  edge [
-    source 1080
-    target 2743
-    weight 38
-  ]
-  edge [
-    source 1080
-    target 4152
-    weight 49
-  ]
-  edge [
-    source 1080
-    target 4098
-    weight 58
-  ]
-  edge [
-    source 1080
-    target 2553
-    weight 165
-  ]
-  edge [
-    source 1080
-    target 3408
-    weight 117
-  ]
-  edge [
-    source 1080
-    target 1938
-    weight 156
-  ]
-  edge [
-    source 1080
-    target 2181
-    weight 24
-  ]
-  edge [
-    source 1080
-    target 2844
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 3309
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 4162
-    weight 213
-  ]
-  edge [
-    source 1080
-    target 4160
-    weight 51
-  ]
-  edge [
-    source 1080
-    target 3956
-    weight 25
-  ]
-  edge [
-    source 1080
-    target 3860
-    weight 48
-  ]
-  edge [
-    source 1080
-    target 1360
-    weight 159
-  ]
-  edge [
-    source 1080
-    target 1577
-    weight 35
-  ]
-  edge [
-    source 1080
-    target 3559
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 1789
-    weight 55
-  ]
-  edge [
-    source 1080
-    target 3432
-    weight 54
-  ]
-  edge [
-    source 1080
-    target 3162
-    weight 33
-  ]
-  edge [
-    source 1080
-    target 2082
-    weight 34
-  ]
-  edge [
-    source 1080
-    target 3884
-    weight 69
-  ]
-  edge [
-    source 1080
-    target 2570
-    weight 42
-  ]
-  edge [
-    source 1080
-    target 2573
-    weight 39
-  ]
-  edge [
-    source 1080
-    target 1798
-    weight 39
-  ]
-  edge [
-    source 1080
-    target 2054
-    weight 30
-  ]
-  edge [
-    source 1080
-    target 3196
-    weight 48
-  ]
-  edge [
-    source 1080
-    target 3877
-    weight 120
-  ]
-  edge [
-    source 1080
-    target 1322
-    weight 100
-  ]
-  edge [
-    source 1080
-    target 3935
-    weight 29
-  ]
-  edge [
-    source 1080
-    target 1676
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 2061
-    weight 38
-  ]
-  edge [
-    source 1080
-    target 2711
-    weight 49
-  ]
-  edge [
-    source 1080
-    target 3052
-    weight 189
-  ]
-  edge [
-    source 1080
-    target 1832
-    weight 24
-  ]
-  edge [
-    source 1080
-    target 3071
-    weight 46
-  ]
-  edge [
-    source 1080
-    target 2609
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 1523
-    weight 172
-  ]
-  edge [
-    source 1080
-    target 1528
-    weight 21
-  ]
-  edge [
-    source 1080
-    target 1391
-    weight 50
-  ]
-  edge [
-    source 1080
-    target 2955
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 1080
-    target 1419
-    weight 22
-  ]
-  edge [
-    source 1080
-    target 1140
-    weight 32
-  ]
-  edge [
-    source 1080
-    target 3861
-    weight 25
-  ]
-  edge [
-    source 1080
-    target 2099
-    weight 62
-  ]
-  edge [
-    source 1080
-    target 1148
-    weight 33
-  ]
-  edge [
-    source 1080
-    target 1634
-    weight 27
-  ]
-  edge [
-    source 1080
-    target 3677
-    weight 40
-  ]
-  edge [
-    source 1080
-    target 1425
-    weight 26
-  ]
-  edge [
-    source 1080
-    target 2822
-    weight 31
-  ]
-  edge [
-    source 1080
-    target 1125
-    weight 63
-  ]
-  edge [
-    source 1080
-    target 1970
-    weight 62
-  ]
-  edge [
-    source 1080
-    target 3633
-    weight 23
-  ]
-  edge [
-    source 1080
-    target 1802
-    weight 44
-  ]
-  edge [
-    source 1080
-    target 2078
-    weight 88
-  ]
-  edge [
-    source 1090
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 1090
-    target 1616
-    weight 47
-  ]
-  edge [
-    source 1090
-    target 1632
-    weight 26
-  ]
-  edge [
-    source 1090
-    target 2861
-    weight 33
-  ]
-  edge [
-    source 1090
-    target 2071
-    weight 42
-  ]
-  edge [
-    source 1090
-    target 4051
-    weight 43
-  ]
-  edge [
-    source 1090
-    target 3174
-    weight 39
-  ]
-  edge [
-    source 1090
-    target 3521
-    weight 49
-  ]
-  edge [
-    source 1090
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 1090
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 1090
-    target 1887
-    weight 33
-  ]
-  edge [
-    source 1090
-    target 3141
-    weight 40
-  ]
-  edge [
-    source 1090
-    target 3145
-    weight 34
-  ]
-  edge [
-    source 1090
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1090
-    target 1487
-    weight 32
-  ]
-  edge [
-    source 1090
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 1090
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1090
-    target 1582
-    weight 21
-  ]
-  edge [
-    source 1115
-    target 1487
-    weight 22
-  ]
-  edge [
-    source 1115
-    target 3521
-    weight 22
-  ]
-  edge [
-    source 1125
-    target 1887
-    weight 161
-  ]
-  edge [
-    source 1125
-    target 1616
-    weight 172
-  ]
-  edge [
-    source 1125
-    target 3600
-    weight 159
-  ]
-  edge [
-    source 1125
-    target 1487
-    weight 137
-  ]
-  edge [
-    source 1125
-    target 3521
-    weight 210
-  ]
-  edge [
-    source 1125
-    target 1647
-    weight 106
-  ]
-  edge [
-    source 1125
-    target 2861
-    weight 122
-  ]
-  edge [
-    source 1125
-    target 3423
-    weight 49
-  ]
-  edge [
-    source 1125
-    target 3141
-    weight 165
-  ]
-  edge [
-    source 1125
-    target 2191
-    weight 30
-  ]
-  edge [
-    source 1125
-    target 4051
-    weight 152
-  ]
-  edge [
-    source 1125
-    target 3565
-    weight 43
-  ]
-  edge [
-    source 1125
-    target 3642
-    weight 55
-  ]
-  edge [
-    source 1125
-    target 2071
-    weight 158
-  ]
-  edge [
-    source 1125
-    target 3917
-    weight 54
-  ]
-  edge [
-    source 1125
-    target 3993
-    weight 81
-  ]
-  edge [
-    source 1125
-    target 1409
-    weight 34
-  ]
-  edge [
-    source 1125
-    target 3954
-    weight 27
-  ]
-  edge [
-    source 1125
-    target 3145
-    weight 93
-  ]
-  edge [
-    source 1125
-    target 1505
-    weight 49
-  ]
-  edge [
-    source 1125
-    target 1582
-    weight 81
-  ]
-  edge [
-    source 1125
-    target 4154
-    weight 44
-  ]
-  edge [
-    source 1125
-    target 1995
-    weight 73
-  ]
-  edge [
-    source 1125
-    target 3174
-    weight 81
-  ]
-  edge [
-    source 1125
-    target 2890
-    weight 55
-  ]
-  edge [
-    source 1125
-    target 3962
-    weight 29
-  ]
-  edge [
-    source 1125
-    target 2870
-    weight 39
-  ]
-  edge [
-    source 1125
-    target 3443
-    weight 34
-  ]
-  edge [
-    source 1125
-    target 3040
-    weight 38
-  ]
-  edge [
-    source 1125
-    target 2700
-    weight 83
-  ]
-  edge [
-    source 1125
-    target 2287
-    weight 34
-  ]
-  edge [
-    source 1125
-    target 1757
-    weight 27
-  ]
-  edge [
-    source 1125
-    target 3636
-    weight 29
-  ]
-  edge [
-    source 1125
-    target 3276
-    weight 79
-  ]
-  edge [
-    source 1125
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 1125
-    target 1632
-    weight 52
-  ]
-  edge [
-    source 1125
-    target 2519
-    weight 37
-  ]
-  edge [
-    source 1125
-    target 2857
-    weight 45
-  ]
-  edge [
-    source 1125
-    target 3282
-    weight 45
-  ]
-  edge [
-    source 1125
-    target 1254
-    weight 23
-  ]
-  edge [
-    source 1125
-    target 3374
-    weight 23
-  ]
-  edge [
-    source 1125
-    target 3542
-    weight 29
-  ]
-  edge [
-    source 1125
-    target 1185
-    weight 22
-  ]
-  edge [
-    source 1125
-    target 2058
-    weight 25
-  ]
-  edge [
-    source 1127
-    target 3521
-    weight 293
-  ]
-  edge [
-    source 1127
-    target 2861
-    weight 218
-  ]
-  edge [
-    source 1127
-    target 1616
-    weight 291
-  ]
-  edge [
-    source 1127
-    target 3420
-    weight 64
-  ]
-  edge [
-    source 1127
-    target 3600
-    weight 138
-  ]
-  edge [
-    source 1127
-    target 1647
-    weight 124
-  ]
-  edge [
-    source 1127
-    target 1409
-    weight 48
-  ]
-  edge [
-    source 1127
-    target 3917
-    weight 106
-  ]
-  edge [
-    source 1127
-    target 1487
-    weight 164
-  ]
-  edge [
-    source 1127
-    target 3642
-    weight 186
-  ]
-  edge [
-    source 1127
-    target 3542
-    weight 83
-  ]
-  edge [
-    source 1127
-    target 2700
-    weight 160
-  ]
-  edge [
-    source 1127
-    target 3276
-    weight 134
-  ]
-  edge [
-    source 1127
-    target 1995
-    weight 177
-  ]
-  edge [
-    source 1127
-    target 3565
-    weight 101
-  ]
-  edge [
-    source 1127
-    target 3066
-    weight 83
-  ]
-  edge [
-    source 1127
-    target 3145
-    weight 168
-  ]
-  edge [
-    source 1127
-    target 4051
-    weight 234
-  ]
-  edge [
-    source 1127
-    target 1887
-    weight 249
-  ]
-  edge [
-    source 1127
-    target 3141
-    weight 252
-  ]
-  edge [
-    source 1127
-    target 3993
-    weight 137
-  ]
-  edge [
-    source 1127
-    target 2071
-    weight 235
-  ]
-  edge [
-    source 1127
-    target 3954
-    weight 121
-  ]
-  edge [
-    source 1127
-    target 3040
-    weight 102
-  ]
-  edge [
-    source 1127
-    target 1254
-    weight 80
-  ]
-  edge [
-    source 1127
-    target 3295
-    weight 49
-  ]
-  edge [
-    source 1127
-    target 2543
-    weight 69
-  ]
-  edge [
-    source 1127
-    target 1461
-    weight 40
-  ]
-  edge [
-    source 1127
-    target 3006
-    weight 90
-  ]
-  edge [
-    source 1127
-    target 1632
-    weight 169
-  ]
-  edge [
-    source 1127
-    target 2870
-    weight 90
-  ]
-  edge [
-    source 1127
-    target 3282
-    weight 119
-  ]
-  edge [
-    source 1127
-    target 3847
-    weight 28
-  ]
-  edge [
-    source 1127
-    target 1322
-    weight 25
-  ]
-  edge [
-    source 1127
-    target 1707
-    weight 46
-  ]
-  edge [
-    source 1127
-    target 1360
-    weight 39
-  ]
-  edge [
-    source 1127
-    target 1582
-    weight 127
-  ]
-  edge [
-    source 1127
-    target 3443
-    weight 65
-  ]
-  edge [
-    source 1127
-    target 2191
-    weight 50
-  ]
-  edge [
-    source 1127
-    target 4154
-    weight 70
-  ]
-  edge [
-    source 1127
-    target 2890
-    weight 59
-  ]
-  edge [
-    source 1127
-    target 2800
-    weight 33
-  ]
-  edge [
-    source 1127
-    target 3377
-    weight 23
-  ]
-  edge [
-    source 1127
-    target 3174
-    weight 155
-  ]
-  edge [
-    source 1127
-    target 3636
-    weight 71
-  ]
-  edge [
-    source 1127
-    target 1195
-    weight 25
-  ]
-  edge [
-    source 1127
-    target 1938
-    weight 46
-  ]
-  edge [
-    source 1127
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1127
-    target 3253
-    weight 50
-  ]
-  edge [
-    source 1127
-    target 1507
-    weight 37
-  ]
-  edge [
-    source 1127
-    target 1505
-    weight 84
-  ]
-  edge [
-    source 1127
-    target 3052
-    weight 39
-  ]
-  edge [
-    source 1127
-    target 2857
-    weight 93
-  ]
-  edge [
-    source 1127
-    target 3423
-    weight 60
-  ]
-  edge [
-    source 1127
-    target 1185
-    weight 47
-  ]
-  edge [
-    source 1127
-    target 1523
-    weight 31
-  ]
-  edge [
-    source 1127
-    target 1757
-    weight 57
-  ]
-  edge [
-    source 1127
-    target 1154
-    weight 22
-  ]
-  edge [
-    source 1127
-    target 2204
-    weight 57
-  ]
-  edge [
-    source 1127
-    target 2519
-    weight 83
-  ]
-  edge [
-    source 1127
-    target 2810
-    weight 29
-  ]
-  edge [
-    source 1127
-    target 2553
-    weight 38
-  ]
-  edge [
-    source 1127
-    target 3962
-    weight 49
-  ]
-  edge [
-    source 1127
-    target 2058
-    weight 47
-  ]
-  edge [
-    source 1127
-    target 2287
-    weight 68
-  ]
-  edge [
-    source 1127
-    target 3374
-    weight 53
-  ]
-  edge [
-    source 1127
-    target 1420
-    weight 22
-  ]
-  edge [
-    source 1127
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 1140
-    target 3521
-    weight 61
-  ]
-  edge [
-    source 1140
-    target 1616
-    weight 57
-  ]
-  edge [
-    source 1140
-    target 4051
-    weight 49
-  ]
-  edge [
-    source 1140
-    target 1487
-    weight 47
-  ]
-  edge [
-    source 1140
-    target 3600
-    weight 37
-  ]
-  edge [
-    source 1140
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1140
-    target 1887
-    weight 57
-  ]
-  edge [
-    source 1140
-    target 3642
-    weight 30
-  ]
-  edge [
-    source 1140
-    target 3141
-    weight 58
-  ]
-  edge [
-    source 1140
-    target 2861
-    weight 40
-  ]
-  edge [
-    source 1140
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 1140
-    target 3145
-    weight 30
-  ]
-  edge [
-    source 1140
-    target 3174
-    weight 32
-  ]
-  edge [
-    source 1140
-    target 2071
-    weight 53
-  ]
-  edge [
-    source 1140
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 1140
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1140
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 1140
-    target 3565
-    weight 22
-  ]
-  edge [
-    source 1140
-    target 3276
-    weight 27
-  ]
-  edge [
-    source 1140
-    target 1582
-    weight 29
-  ]
-  edge [
-    source 1140
-    target 1632
-    weight 22
-  ]
-  edge [
-    source 1148
-    target 3600
-    weight 48
-  ]
-  edge [
-    source 1148
-    target 3141
-    weight 82
-  ]
-  edge [
-    source 1148
-    target 4051
-    weight 68
-  ]
-  edge [
-    source 1148
-    target 3521
-    weight 86
-  ]
-  edge [
-    source 1148
-    target 2071
-    weight 70
-  ]
-  edge [
-    source 1148
-    target 1647
-    weight 36
-  ]
-  edge [
-    source 1148
-    target 3145
-    weight 79
-  ]
-  edge [
-    source 1148
-    target 2700
-    weight 43
-  ]
-  edge [
-    source 1148
-    target 1254
-    weight 25
-  ]
-  edge [
-    source 1148
-    target 2861
-    weight 58
-  ]
-  edge [
-    source 1148
-    target 1616
-    weight 79
-  ]
-  edge [
-    source 1148
-    target 1887
-    weight 80
-  ]
-  edge [
-    source 1148
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 1148
-    target 3282
-    weight 24
-  ]
-  edge [
-    source 1148
-    target 3174
-    weight 52
-  ]
-  edge [
-    source 1148
-    target 3917
-    weight 42
-  ]
-  edge [
-    source 1148
-    target 1487
-    weight 62
-  ]
-  edge [
-    source 1148
-    target 2890
-    weight 27
-  ]
-  edge [
-    source 1148
-    target 1632
-    weight 21
-  ]
-  edge [
-    source 1148
-    target 1995
-    weight 35
-  ]
-  edge [
-    source 1148
-    target 3276
-    weight 51
-  ]
-  edge [
-    source 1148
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 1148
-    target 2857
-    weight 21
-  ]
-  edge [
-    source 1148
-    target 2519
-    weight 35
-  ]
-  edge [
-    source 1148
-    target 3253
-    weight 23
-  ]
-  edge [
-    source 1148
-    target 1582
-    weight 50
-  ]
-  edge [
-    source 1148
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1647
-    weight 175
-  ]
-  edge [
-    source 1154
-    target 2861
-    weight 219
-  ]
-  edge [
-    source 1154
-    target 1487
-    weight 228
-  ]
-  edge [
-    source 1154
-    target 3521
-    weight 328
-  ]
-  edge [
-    source 1154
-    target 3962
-    weight 128
-  ]
-  edge [
-    source 1154
-    target 1995
-    weight 161
-  ]
-  edge [
-    source 1154
-    target 3040
-    weight 61
-  ]
-  edge [
-    source 1154
-    target 3006
-    weight 52
-  ]
-  edge [
-    source 1154
-    target 3565
-    weight 88
-  ]
-  edge [
-    source 1154
-    target 2071
-    weight 281
-  ]
-  edge [
-    source 1154
-    target 3937
-    weight 35
-  ]
-  edge [
-    source 1154
-    target 3145
-    weight 145
-  ]
-  edge [
-    source 1154
-    target 3636
-    weight 75
-  ]
-  edge [
-    source 1154
-    target 1505
-    weight 73
-  ]
-  edge [
-    source 1154
-    target 3600
-    weight 174
-  ]
-  edge [
-    source 1154
-    target 1887
-    weight 251
-  ]
-  edge [
-    source 1154
-    target 1616
-    weight 273
-  ]
-  edge [
-    source 1154
-    target 2700
-    weight 158
-  ]
-  edge [
-    source 1154
-    target 2287
-    weight 70
-  ]
-  edge [
-    source 1154
-    target 2800
-    weight 42
-  ]
-  edge [
-    source 1154
-    target 3993
-    weight 158
-  ]
-  edge [
-    source 1154
-    target 3276
-    weight 140
-  ]
-  edge [
-    source 1154
-    target 3443
-    weight 57
-  ]
-  edge [
-    source 1154
-    target 1185
-    weight 42
-  ]
-  edge [
-    source 1154
-    target 1409
-    weight 80
-  ]
-  edge [
-    source 1154
-    target 1952
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1333
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1254
-    weight 54
-  ]
-  edge [
-    source 1154
-    target 3141
-    weight 272
-  ]
-  edge [
-    source 1154
-    target 4051
-    weight 241
-  ]
-  edge [
-    source 1154
-    target 1757
-    weight 86
-  ]
-  edge [
-    source 1154
-    target 2204
-    weight 104
-  ]
-  edge [
-    source 1154
-    target 2870
-    weight 82
-  ]
-  edge [
-    source 1154
-    target 3174
-    weight 115
-  ]
-  edge [
-    source 1154
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 1154
-    target 3374
-    weight 55
-  ]
-  edge [
-    source 1154
-    target 3423
-    weight 81
-  ]
-  edge [
-    source 1154
-    target 2890
-    weight 69
-  ]
-  edge [
-    source 1154
-    target 3847
-    weight 30
-  ]
-  edge [
-    source 1154
-    target 2553
-    weight 32
-  ]
-  edge [
-    source 1154
-    target 1322
-    weight 31
-  ]
-  edge [
-    source 1154
-    target 1938
-    weight 35
-  ]
-  edge [
-    source 1154
-    target 3066
-    weight 60
-  ]
-  edge [
-    source 1154
-    target 4154
-    weight 51
-  ]
-  edge [
-    source 1154
-    target 3253
-    weight 49
-  ]
-  edge [
-    source 1154
-    target 2191
-    weight 44
-  ]
-  edge [
-    source 1154
-    target 3884
-    weight 24
-  ]
-  edge [
-    source 1154
-    target 3954
-    weight 56
-  ]
-  edge [
-    source 1154
-    target 3295
-    weight 28
-  ]
-  edge [
-    source 1154
-    target 3420
-    weight 52
-  ]
-  edge [
-    source 1154
-    target 2857
-    weight 76
-  ]
-  edge [
-    source 1154
-    target 1632
-    weight 94
-  ]
-  edge [
-    source 1154
-    target 3917
-    weight 95
-  ]
-  edge [
-    source 1154
-    target 3282
-    weight 88
-  ]
-  edge [
-    source 1154
-    target 2614
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 2543
-    weight 45
-  ]
-  edge [
-    source 1154
-    target 1523
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 3542
-    weight 80
-  ]
-  edge [
-    source 1154
-    target 1582
-    weight 123
-  ]
-  edge [
-    source 1154
-    target 2519
-    weight 66
-  ]
-  edge [
-    source 1154
-    target 3052
-    weight 32
-  ]
-  edge [
-    source 1154
-    target 3177
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 2058
-    weight 40
-  ]
-  edge [
-    source 1154
-    target 2810
-    weight 33
-  ]
-  edge [
-    source 1154
-    target 4162
-    weight 21
-  ]
-  edge [
-    source 1154
-    target 1507
-    weight 26
-  ]
-  edge [
-    source 1154
-    target 3877
-    weight 24
-  ]
-  edge [
-    source 1166
-    target 3521
-    weight 33
-  ]
-  edge [
-    source 1166
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 1166
-    target 1887
-    weight 21
-  ]
-  edge [
-    source 1166
-    target 3423
-    weight 22
-  ]
-  edge [
-    source 1166
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 1166
-    target 1616
-    weight 26
-  ]
-  edge [
-    source 1166
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 1166
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 1995
-    weight 279
-  ]
-  edge [
-    source 1185
-    target 1616
-    weight 505
-  ]
-  edge [
-    source 1185
-    target 3636
-    weight 152
-  ]
-  edge [
-    source 1185
-    target 1887
-    weight 427
-  ]
-  edge [
-    source 1185
-    target 1517
-    weight 43
-  ]
-  edge [
-    source 1185
-    target 3937
-    weight 50
-  ]
-  edge [
-    source 1185
-    target 2071
-    weight 452
-  ]
-  edge [
-    source 1185
-    target 3040
-    weight 162
-  ]
-  edge [
-    source 1185
-    target 3145
-    weight 333
-  ]
-  edge [
-    source 1185
-    target 1505
-    weight 149
-  ]
-  edge [
-    source 1185
-    target 3600
-    weight 273
-  ]
-  edge [
-    source 1185
-    target 1647
-    weight 259
-  ]
-  edge [
-    source 1185
-    target 2861
-    weight 399
-  ]
-  edge [
-    source 1185
-    target 1487
-    weight 352
-  ]
-  edge [
-    source 1185
-    target 2700
-    weight 245
-  ]
-  edge [
-    source 1185
-    target 2287
-    weight 96
-  ]
-  edge [
-    source 1185
-    target 2800
-    weight 77
-  ]
-  edge [
-    source 1185
-    target 3443
-    weight 103
-  ]
-  edge [
-    source 1185
-    target 3993
-    weight 252
-  ]
-  edge [
-    source 1185
-    target 3276
-    weight 226
-  ]
-  edge [
-    source 1185
-    target 3521
-    weight 557
-  ]
-  edge [
-    source 1185
-    target 4187
-    weight 21
-  ]
-  edge [
-    source 1185
-    target 1409
-    weight 68
-  ]
-  edge [
-    source 1185
-    target 1632
-    weight 211
-  ]
-  edge [
-    source 1185
-    target 2204
-    weight 100
-  ]
-  edge [
-    source 1185
-    target 3174
-    weight 236
-  ]
-  edge [
-    source 1185
-    target 3141
-    weight 470
-  ]
-  edge [
-    source 1185
-    target 3642
-    weight 181
-  ]
-  edge [
-    source 1185
-    target 3374
-    weight 105
-  ]
-  edge [
-    source 1185
-    target 2519
-    weight 143
-  ]
-  edge [
-    source 1185
-    target 2614
-    weight 36
-  ]
-  edge [
-    source 1185
-    target 2890
-    weight 121
-  ]
-  edge [
-    source 1185
-    target 3565
-    weight 121
-  ]
-  edge [
-    source 1185
-    target 1582
-    weight 233
-  ]
-  edge [
-    source 1185
-    target 2553
-    weight 77
-  ]
-  edge [
-    source 1185
-    target 3253
-    weight 93
-  ]
-  edge [
-    source 1185
-    target 3423
-    weight 153
-  ]
-  edge [
-    source 1185
-    target 4051
-    weight 445
-  ]
-  edge [
-    source 1185
-    target 3917
-    weight 180
-  ]
-  edge [
-    source 1185
-    target 1757
-    weight 85
-  ]
-  edge [
-    source 1185
-    target 3962
-    weight 95
-  ]
-  edge [
-    source 1185
-    target 1195
-    weight 32
-  ]
-  edge [
-    source 1185
-    target 2191
-    weight 109
-  ]
-  edge [
-    source 1185
-    target 3408
-    weight 25
-  ]
-  edge [
-    source 1185
-    target 3377
-    weight 34
-  ]
-  edge [
-    source 1185
-    target 3542
-    weight 152
-  ]
-  edge [
-    source 1185
-    target 3884
-    weight 34
-  ]
-  edge [
-    source 1185
-    target 1254
-    weight 136
-  ]
-  edge [
-    source 1185
-    target 2857
-    weight 154
-  ]
-  edge [
-    source 1185
-    target 3420
-    weight 79
-  ]
-  edge [
-    source 1185
-    target 1507
-    weight 66
-  ]
-  edge [
-    source 1185
-    target 3006
-    weight 124
-  ]
-  edge [
-    source 1185
-    target 4162
-    weight 61
-  ]
-  edge [
-    source 1185
-    target 4154
-    weight 120
-  ]
-  edge [
-    source 1185
-    target 3432
-    weight 22
-  ]
-  edge [
-    source 1185
-    target 2543
-    weight 72
-  ]
-  edge [
-    source 1185
-    target 3282
-    weight 165
-  ]
-  edge [
-    source 1185
-    target 1523
-    weight 56
-  ]
-  edge [
-    source 1185
-    target 2870
-    weight 101
-  ]
-  edge [
-    source 1185
-    target 2329
-    weight 25
-  ]
-  edge [
-    source 1185
-    target 1322
-    weight 31
-  ]
-  edge [
-    source 1185
-    target 3077
-    weight 34
-  ]
-  edge [
-    source 1185
-    target 1577
-    weight 29
-  ]
-  edge [
-    source 1185
-    target 1707
-    weight 47
-  ]
-  edge [
-    source 1185
-    target 3295
-    weight 63
-  ]
-  edge [
-    source 1185
-    target 1360
-    weight 54
-  ]
-  edge [
-    source 1185
-    target 3954
-    weight 135
-  ]
-  edge [
-    source 1185
-    target 1938
-    weight 50
-  ]
-  edge [
-    source 1185
-    target 1420
-    weight 48
-  ]
-  edge [
-    source 1185
-    target 3860
-    weight 22
-  ]
-  edge [
-    source 1185
-    target 3052
-    weight 68
-  ]
-  edge [
-    source 1185
-    target 3847
-    weight 40
-  ]
-  edge [
-    source 1185
-    target 4027
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 3066
-    weight 103
-  ]
-  edge [
-    source 1185
-    target 1461
-    weight 25
-  ]
-  edge [
-    source 1185
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 1185
-    target 1280
-    weight 55
-  ]
-  edge [
-    source 1185
-    target 3877
-    weight 37
-  ]
-  edge [
-    source 1185
-    target 2810
-    weight 38
-  ]
-  edge [
-    source 1185
-    target 2058
-    weight 77
-  ]
-  edge [
-    source 1185
-    target 3177
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 3196
-    weight 23
-  ]
-  edge [
-    source 1185
-    target 1766
-    weight 22
-  ]
-  edge [
-    source 1185
-    target 2078
-    weight 28
-  ]
-  edge [
-    source 1185
-    target 1943
-    weight 22
-  ]
-  edge [
-    source 1195
-    target 1616
-    weight 178
-  ]
-  edge [
-    source 1195
-    target 3954
-    weight 70
-  ]
-  edge [
-    source 1195
-    target 4051
-    weight 162
-  ]
-  edge [
-    source 1195
-    target 3174
-    weight 77
-  ]
-  edge [
-    source 1195
-    target 3521
-    weight 182
-  ]
-  edge [
-    source 1195
-    target 2071
-    weight 152
-  ]
-  edge [
-    source 1195
-    target 1887
-    weight 159
-  ]
-  edge [
-    source 1195
-    target 3066
-    weight 60
-  ]
-  edge [
-    source 1195
-    target 2861
-    weight 137
-  ]
-  edge [
-    source 1195
-    target 1647
-    weight 73
-  ]
-  edge [
-    source 1195
-    target 3141
-    weight 156
-  ]
-  edge [
-    source 1195
-    target 3565
-    weight 56
-  ]
-  edge [
-    source 1195
-    target 1632
-    weight 93
-  ]
-  edge [
-    source 1195
-    target 1995
-    weight 95
-  ]
-  edge [
-    source 1195
-    target 3040
-    weight 62
-  ]
-  edge [
-    source 1195
-    target 3642
-    weight 61
-  ]
-  edge [
-    source 1195
-    target 3993
-    weight 92
-  ]
-  edge [
-    source 1195
-    target 1461
-    weight 21
-  ]
-  edge [
-    source 1195
-    target 3253
-    weight 33
-  ]
-  edge [
-    source 1195
-    target 3145
-    weight 115
-  ]
-  edge [
-    source 1195
-    target 3006
-    weight 64
-  ]
-  edge [
-    source 1195
-    target 2287
-    weight 64
-  ]
-  edge [
-    source 1195
-    target 3282
-    weight 65
-  ]
-  edge [
-    source 1195
-    target 3600
-    weight 95
-  ]
-  edge [
-    source 1195
-    target 4162
-    weight 45
-  ]
-  edge [
-    source 1195
-    target 3636
-    weight 41
-  ]
-  edge [
-    source 1195
-    target 1487
-    weight 109
-  ]
-  edge [
-    source 1195
-    target 4154
-    weight 44
-  ]
-  edge [
-    source 1195
-    target 3423
-    weight 42
-  ]
-  edge [
-    source 1195
-    target 2890
-    weight 31
-  ]
-  edge [
-    source 1195
-    target 1582
-    weight 71
-  ]
-  edge [
-    source 1195
-    target 2700
-    weight 102
-  ]
-  edge [
-    source 1195
-    target 3443
-    weight 39
-  ]
-  edge [
-    source 1195
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 1195
-    target 1322
-    weight 28
-  ]
-  edge [
-    source 1195
-    target 3542
-    weight 61
-  ]
-  edge [
-    source 1195
-    target 3295
-    weight 21
-  ]
-  edge [
-    source 1195
-    target 2543
-    weight 42
-  ]
-  edge [
-    source 1195
-    target 1254
-    weight 57
-  ]
-  edge [
-    source 1195
-    target 2870
-    weight 51
-  ]
-  edge [
-    source 1195
-    target 3052
-    weight 26
-  ]
-  edge [
-    source 1195
-    target 3374
-    weight 33
-  ]
-  edge [
-    source 1195
-    target 1938
-    weight 25
-  ]
-  edge [
-    source 1195
-    target 2857
-    weight 50
-  ]
-  edge [
-    source 1195
-    target 1757
-    weight 28
-  ]
-  edge [
-    source 1195
-    target 3276
-    weight 87
-  ]
-  edge [
-    source 1195
-    target 1707
-    weight 26
-  ]
-  edge [
-    source 1195
-    target 1505
-    weight 59
-  ]
-  edge [
-    source 1195
-    target 3420
-    weight 27
-  ]
-  edge [
-    source 1195
-    target 1507
-    weight 25
-  ]
-  edge [
-    source 1195
-    target 3917
-    weight 51
-  ]
-  edge [
-    source 1195
-    target 1360
-    weight 25
-  ]
-  edge [
-    source 1195
-    target 2003
-    weight 21
-  ]
-  edge [
-    source 1195
-    target 2204
-    weight 39
-  ]
-  edge [
-    source 1195
-    target 2519
-    weight 53
-  ]
-  edge [
-    source 1195
-    target 2058
-    weight 22
-  ]
-  edge [
-    source 1199
-    target 3600
-    weight 48
-  ]
-  edge [
-    source 1199
-    target 2861
-    weight 33
-  ]
-  edge [
-    source 1199
-    target 1887
-    weight 40
-  ]
-  edge [
-    source 1199
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 1199
-    target 2071
-    weight 39
-  ]
-  edge [
-    source 1199
-    target 1487
-    weight 36
-  ]
-  edge [
-    source 1199
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 1199
-    target 4051
-    weight 39
-  ]
-  edge [
-    source 1199
-    target 3276
-    weight 22
-  ]
-  edge [
-    source 1199
-    target 1616
-    weight 45
-  ]
-  edge [
-    source 1216
-    target 3521
-    weight 135
-  ]
-  edge [
-    source 1216
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 1216
-    target 2071
-    weight 21
-  ]
-  edge [
-    source 1216
-    target 3222
-    weight 51
-  ]
-  edge [
-    source 1232
-    target 1616
-    weight 46
-  ]
-  edge [
-    source 1232
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 1232
-    target 2861
-    weight 32
-  ]
-  edge [
-    source 1232
-    target 1487
-    weight 54
-  ]
-  edge [
-    source 1232
-    target 3521
-    weight 51
-  ]
-  edge [
-    source 1232
-    target 3374
-    weight 21
-  ]
-  edge [
-    source 1232
-    target 2071
-    weight 44
-  ]
-  edge [
-    source 1232
-    target 3141
-    weight 41
-  ]
-  edge [
-    source 1232
-    target 1887
-    weight 39
-  ]
-  edge [
-    source 1232
-    target 4051
-    weight 37
-  ]
-  edge [
-    source 1232
-    target 2191
-    weight 23
-  ]
-  edge [
-    source 1232
-    target 3993
-    weight 21
-  ]
-  edge [
-    source 1232
-    target 3423
-    weight 27
-  ]
-  edge [
-    source 1232
-    target 3145
-    weight 23
-  ]
-  edge [
-    source 1239
-    target 3521
-    weight 57
-  ]
-  edge [
-    source 1239
-    target 2861
-    weight 32
-  ]
-  edge [
-    source 1239
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 1254
-    target 1616
-    weight 1109
-  ]
-  edge [
-    source 1254
-    target 3521
-    weight 1212
-  ]
-  edge [
-    source 1254
-    target 3600
-    weight 589
-  ]
-  edge [
-    source 1254
-    target 1487
-    weight 796
-  ]
-  edge [
-    source 1254
-    target 1507
-    weight 136
-  ]
-  edge [
-    source 1254
-    target 2058
-    weight 194
-  ]
-  edge [
-    source 1254
-    target 3145
-    weight 689
-  ]
-  edge [
-    source 1254
-    target 2861
-    weight 767
-  ]
-  edge [
-    source 1254
-    target 2191
-    weight 185
-  ]
-  edge [
-    source 1254
-    target 3565
-    weight 212
-  ]
-  edge [
-    source 1254
-    target 3276
-    weight 566
-  ]
-  edge [
-    source 1254
-    target 3077
-    weight 81
-  ]
-  edge [
-    source 1254
-    target 3374
-    weight 267
-  ]
-  edge [
-    source 1254
-    target 3377
-    weight 74
-  ]
-  edge [
-    source 1254
-    target 3141
-    weight 982
-  ]
-  edge [
-    source 1254
-    target 3962
-    weight 150
-  ]
-  edge [
-    source 1254
-    target 2543
-    weight 209
-  ]
-  edge [
-    source 1254
-    target 1647
-    weight 439
-  ]
-  edge [
-    source 1254
-    target 1995
-    weight 517
-  ]
-  edge [
-    source 1254
-    target 3642
-    weight 360
-  ]
-  edge [
-    source 1254
-    target 2800
-    weight 99
-  ]
-  edge [
-    source 1254
-    target 3420
-    weight 128
-  ]
-  edge [
-    source 1254
-    target 3993
-    weight 491
-  ]
-  edge [
-    source 1254
-    target 2614
-    weight 42
-  ]
-  edge [
-    source 1254
-    target 3253
-    weight 142
-  ]
-  edge [
-    source 1254
-    target 3066
-    weight 242
-  ]
-  edge [
-    source 1254
-    target 2519
-    weight 285
-  ]
-  edge [
-    source 1254
-    target 4027
-    weight 44
-  ]
-  edge [
-    source 1254
-    target 4051
-    weight 990
-  ]
-  edge [
-    source 1254
-    target 1420
-    weight 52
-  ]
-  edge [
-    source 1254
-    target 2071
-    weight 940
-  ]
-  edge [
-    source 1254
-    target 1582
-    weight 433
-  ]
-  edge [
-    source 1254
-    target 1887
-    weight 935
-  ]
-  edge [
-    source 1254
-    target 3636
-    weight 165
-  ]
-  edge [
-    source 1254
-    target 2700
-    weight 529
-  ]
-  edge [
-    source 1254
-    target 1409
-    weight 134
-  ]
-  edge [
-    source 1254
-    target 1632
-    weight 386
-  ]
-  edge [
-    source 1254
-    target 3006
-    weight 195
-  ]
-  edge [
-    source 1254
-    target 1505
-    weight 337
-  ]
-  edge [
-    source 1254
-    target 2232
-    weight 22
-  ]
-  edge [
-    source 1254
-    target 3052
-    weight 152
-  ]
-  edge [
-    source 1254
-    target 3542
-    weight 266
-  ]
-  edge [
-    source 1254
-    target 2287
-    weight 202
-  ]
-  edge [
-    source 1254
-    target 4160
-    weight 25
-  ]
-  edge [
-    source 1254
-    target 1943
-    weight 52
-  ]
-  edge [
-    source 1254
-    target 3954
-    weight 302
-  ]
-  edge [
-    source 1254
-    target 2204
-    weight 194
-  ]
-  edge [
-    source 1254
-    target 2870
-    weight 219
-  ]
-  edge [
-    source 1254
-    target 3174
-    weight 644
-  ]
-  edge [
-    source 1254
-    target 1360
-    weight 133
-  ]
-  edge [
-    source 1254
-    target 2099
-    weight 44
-  ]
-  edge [
-    source 1254
-    target 3408
-    weight 55
-  ]
-  edge [
-    source 1254
-    target 3295
-    weight 112
-  ]
-  edge [
-    source 1254
-    target 2857
-    weight 359
-  ]
-  edge [
-    source 1254
-    target 1766
-    weight 22
-  ]
-  edge [
-    source 1254
-    target 1461
-    weight 40
-  ]
-  edge [
-    source 1254
-    target 4040
-    weight 56
-  ]
-  edge [
-    source 1254
-    target 1938
-    weight 89
-  ]
-  edge [
-    source 1254
-    target 1757
-    weight 151
-  ]
-  edge [
-    source 1254
-    target 1333
-    weight 31
-  ]
-  edge [
-    source 1254
-    target 3282
-    weight 310
-  ]
-  edge [
-    source 1254
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 1254
-    target 3040
-    weight 234
-  ]
-  edge [
-    source 1254
-    target 1322
-    weight 53
-  ]
-  edge [
-    source 1254
-    target 3847
-    weight 49
-  ]
-  edge [
-    source 1254
-    target 3884
-    weight 45
-  ]
-  edge [
-    source 1254
-    target 2609
-    weight 23
-  ]
-  edge [
-    source 1254
-    target 2329
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 1517
-    weight 47
-  ]
-  edge [
-    source 1254
-    target 3177
-    weight 49
-  ]
-  edge [
-    source 1254
-    target 2711
-    weight 36
-  ]
-  edge [
-    source 1254
-    target 2011
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 3937
-    weight 62
-  ]
-  edge [
-    source 1254
-    target 2227
-    weight 35
-  ]
-  edge [
-    source 1254
-    target 4152
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 4098
-    weight 26
-  ]
-  edge [
-    source 1254
-    target 4154
-    weight 230
-  ]
-  edge [
-    source 1254
-    target 2890
-    weight 172
-  ]
-  edge [
-    source 1254
-    target 3917
-    weight 402
-  ]
-  edge [
-    source 1254
-    target 3860
-    weight 26
-  ]
-  edge [
-    source 1254
-    target 1798
-    weight 36
-  ]
-  edge [
-    source 1254
-    target 2061
-    weight 23
-  ]
-  edge [
-    source 1254
-    target 2570
-    weight 21
-  ]
-  edge [
-    source 1254
-    target 3196
-    weight 43
-  ]
-  edge [
-    source 1254
-    target 1419
-    weight 21
-  ]
-  edge [
-    source 1254
-    target 2003
-    weight 26
-  ]
-  edge [
-    source 1254
-    target 1523
-    weight 90
-  ]
-  edge [
-    source 1254
-    target 2553
-    weight 110
-  ]
-  edge [
-    source 1254
-    target 2531
-    weight 36
-  ]
-  edge [
-    source 1254
-    target 3443
-    weight 170
-  ]
-  edge [
-    source 1254
-    target 3641
-    weight 27
-  ]
-  edge [
-    source 1254
-    target 4187
-    weight 40
-  ]
-  edge [
-    source 1254
-    target 3432
-    weight 33
-  ]
-  edge [
-    source 1254
-    target 2810
-    weight 55
-  ]
-  edge [
-    source 1254
-    target 3423
-    weight 258
-  ]
-  edge [
-    source 1254
-    target 4162
-    weight 82
-  ]
-  edge [
-    source 1254
-    target 3877
-    weight 63
-  ]
-  edge [
-    source 1254
-    target 3968
-    weight 29
-  ]
-  edge [
-    source 1254
-    target 1707
-    weight 62
-  ]
-  edge [
-    source 1254
-    target 3071
-    weight 27
-  ]
-  edge [
-    source 1254
-    target 1280
-    weight 52
-  ]
-  edge [
-    source 1254
-    target 1952
-    weight 32
-  ]
-  edge [
-    source 1254
-    target 1970
-    weight 28
-  ]
-  edge [
-    source 1254
-    target 1391
-    weight 29
-  ]
-  edge [
-    source 1254
-    target 1802
-    weight 27
-  ]
-  edge [
-    source 1254
-    target 2078
-    weight 43
-  ]
-  edge [
-    source 1254
-    target 3876
-    weight 25
-  ]
-  edge [
-    source 1258
-    target 3521
-    weight 123
-  ]
-  edge [
-    source 1258
-    target 1487
-    weight 75
-  ]
-  edge [
-    source 1258
-    target 2861
-    weight 89
-  ]
-  edge [
-    source 1258
-    target 3565
-    weight 45
-  ]
-  edge [
-    source 1258
-    target 1995
-    weight 72
-  ]
-  edge [
-    source 1258
-    target 1616
-    weight 107
-  ]
-  edge [
-    source 1258
-    target 3141
-    weight 101
-  ]
-  edge [
-    source 1258
-    target 3600
-    weight 70
-  ]
-  edge [
-    source 1258
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 1258
-    target 3276
-    weight 51
-  ]
-  edge [
-    source 1258
-    target 1887
-    weight 95
-  ]
-  edge [
-    source 1258
-    target 2071
-    weight 102
-  ]
-  edge [
-    source 1258
-    target 1647
-    weight 59
-  ]
-  edge [
-    source 1258
-    target 3145
-    weight 50
-  ]
-  edge [
-    source 1258
-    target 3636
-    weight 27
-  ]
-  edge [
-    source 1258
-    target 2700
-    weight 62
-  ]
-  edge [
-    source 1258
-    target 3040
-    weight 27
-  ]
-  edge [
-    source 1258
-    target 2287
-    weight 29
-  ]
-  edge [
-    source 1258
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 1258
-    target 1409
-    weight 23
-  ]
-  edge [
-    source 1258
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 1258
-    target 3174
-    weight 51
-  ]
-  edge [
-    source 1258
-    target 2890
-    weight 24
-  ]
-  edge [
-    source 1258
-    target 3917
-    weight 29
-  ]
-  edge [
-    source 1258
-    target 4051
-    weight 104
-  ]
-  edge [
-    source 1258
-    target 1632
-    weight 43
-  ]
-  edge [
-    source 1258
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 1258
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 1258
-    target 1582
-    weight 49
-  ]
-  edge [
-    source 1258
-    target 3282
-    weight 29
-  ]
-  edge [
-    source 1258
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1258
-    target 2870
-    weight 25
-  ]
-  edge [
-    source 1258
-    target 3542
-    weight 22
-  ]
-  edge [
-    source 1258
-    target 2857
-    weight 24
-  ]
-  edge [
-    source 1258
-    target 2519
-    weight 25
-  ]
-  edge [
-    source 1280
-    target 1616
-    weight 259
-  ]
-  edge [
-    source 1280
-    target 3521
-    weight 305
-  ]
-  edge [
-    source 1280
-    target 2861
-    weight 189
-  ]
-  edge [
-    source 1280
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 1280
-    target 1995
-    weight 154
-  ]
-  edge [
-    source 1280
-    target 3141
-    weight 246
-  ]
-  edge [
-    source 1280
-    target 1887
-    weight 221
-  ]
-  edge [
-    source 1280
-    target 3565
-    weight 56
-  ]
-  edge [
-    source 1280
-    target 2071
-    weight 235
-  ]
-  edge [
-    source 1280
-    target 1647
-    weight 105
-  ]
-  edge [
-    source 1280
-    target 3040
-    weight 75
-  ]
-  edge [
-    source 1280
-    target 2700
-    weight 115
-  ]
-  edge [
-    source 1280
-    target 3145
-    weight 145
-  ]
-  edge [
-    source 1280
-    target 3006
-    weight 50
-  ]
-  edge [
-    source 1280
-    target 3600
-    weight 140
-  ]
-  edge [
-    source 1280
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1280
-    target 1582
-    weight 112
-  ]
-  edge [
-    source 1280
-    target 4162
-    weight 30
-  ]
-  edge [
-    source 1280
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 1280
-    target 2800
-    weight 27
-  ]
-  edge [
-    source 1280
-    target 3917
-    weight 73
-  ]
-  edge [
-    source 1280
-    target 1632
-    weight 90
-  ]
-  edge [
-    source 1280
-    target 3282
-    weight 65
-  ]
-  edge [
-    source 1280
-    target 4051
-    weight 235
-  ]
-  edge [
-    source 1280
-    target 3542
-    weight 64
-  ]
-  edge [
-    source 1280
-    target 3443
-    weight 48
-  ]
-  edge [
-    source 1280
-    target 2191
-    weight 44
-  ]
-  edge [
-    source 1280
-    target 3276
-    weight 122
-  ]
-  edge [
-    source 1280
-    target 3954
-    weight 58
-  ]
-  edge [
-    source 1280
-    target 1487
-    weight 198
-  ]
-  edge [
-    source 1280
-    target 2857
-    weight 73
-  ]
-  edge [
-    source 1280
-    target 3052
-    weight 28
-  ]
-  edge [
-    source 1280
-    target 3174
-    weight 125
-  ]
-  edge [
-    source 1280
-    target 3423
-    weight 78
-  ]
-  edge [
-    source 1280
-    target 3374
-    weight 52
-  ]
-  edge [
-    source 1280
-    target 2543
-    weight 31
-  ]
-  edge [
-    source 1280
-    target 1757
-    weight 47
-  ]
-  edge [
-    source 1280
-    target 4154
-    weight 59
-  ]
-  edge [
-    source 1280
-    target 3420
-    weight 33
-  ]
-  edge [
-    source 1280
-    target 1507
-    weight 25
-  ]
-  edge [
-    source 1280
-    target 2204
-    weight 39
-  ]
-  edge [
-    source 1280
-    target 2287
-    weight 47
-  ]
-  edge [
-    source 1280
-    target 3993
-    weight 128
-  ]
-  edge [
-    source 1280
-    target 3636
-    weight 50
-  ]
-  edge [
-    source 1280
-    target 2519
-    weight 63
-  ]
-  edge [
-    source 1280
-    target 3066
-    weight 40
-  ]
-  edge [
-    source 1280
-    target 3253
-    weight 26
-  ]
-  edge [
-    source 1280
-    target 1505
-    weight 72
-  ]
-  edge [
-    source 1280
-    target 1523
-    weight 21
-  ]
-  edge [
-    source 1280
-    target 2870
-    weight 47
-  ]
-  edge [
-    source 1280
-    target 1409
-    weight 36
-  ]
-  edge [
-    source 1280
-    target 3962
-    weight 41
-  ]
-  edge [
-    source 1280
-    target 4040
-    weight 21
-  ]
-  edge [
-    source 1280
-    target 1360
-    weight 29
-  ]
-  edge [
-    source 1280
-    target 2553
-    weight 27
-  ]
-  edge [
-    source 1280
-    target 2058
-    weight 34
-  ]
-  edge [
-    source 1299
-    target 2861
-    weight 28
-  ]
-  edge [
-    source 1299
-    target 1616
-    weight 34
-  ]
-  edge [
-    source 1299
-    target 1887
-    weight 26
-  ]
-  edge [
-    source 1299
-    target 4051
-    weight 29
-  ]
-  edge [
-    source 1299
-    target 3521
-    weight 35
-  ]
-  edge [
-    source 1299
-    target 2071
-    weight 30
-  ]
-  edge [
-    source 1299
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 1318
-    target 1487
-    weight 46
-  ]
-  edge [
-    source 1318
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1322
-    target 3600
-    weight 110
-  ]
-  edge [
-    source 1322
-    target 3141
-    weight 192
-  ]
-  edge [
-    source 1322
-    target 3993
-    weight 104
-  ]
-  edge [
-    source 1322
-    target 1887
-    weight 187
-  ]
-  edge [
-    source 1322
-    target 3521
-    weight 215
-  ]
-  edge [
-    source 1322
-    target 2071
-    weight 169
-  ]
-  edge [
-    source 1322
-    target 2870
-    weight 72
-  ]
-  edge [
-    source 1322
-    target 3282
-    weight 110
-  ]
-  edge [
-    source 1322
-    target 1632
-    weight 103
-  ]
-  edge [
-    source 1322
-    target 3847
-    weight 35
-  ]
-  edge [
-    source 1322
-    target 2329
-    weight 22
-  ]
-  edge [
-    source 1322
-    target 2570
-    weight 26
-  ]
-  edge [
-    source 1322
-    target 3954
-    weight 55
-  ]
-  edge [
-    source 1322
-    target 3276
-    weight 105
-  ]
-  edge [
-    source 1322
-    target 1360
-    weight 27
-  ]
-  edge [
-    source 1322
-    target 3642
-    weight 72
-  ]
-  edge [
-    source 1322
-    target 1616
-    weight 185
-  ]
-  edge [
-    source 1322
-    target 1707
-    weight 29
-  ]
-  edge [
-    source 1322
-    target 2543
-    weight 50
-  ]
-  edge [
-    source 1322
-    target 1461
-    weight 24
-  ]
-  edge [
-    source 1322
-    target 2861
-    weight 140
-  ]
-  edge [
-    source 1322
-    target 4051
-    weight 167
-  ]
-  edge [
-    source 1322
-    target 1505
-    weight 61
-  ]
-  edge [
-    source 1322
-    target 1487
-    weight 119
-  ]
-  edge [
-    source 1322
-    target 2204
-    weight 57
-  ]
-  edge [
-    source 1322
-    target 2700
-    weight 139
-  ]
-  edge [
-    source 1322
-    target 1757
-    weight 70
-  ]
-  edge [
-    source 1322
-    target 1647
-    weight 110
-  ]
-  edge [
-    source 1322
-    target 3145
-    weight 130
-  ]
-  edge [
-    source 1322
-    target 2191
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 3174
-    weight 105
-  ]
-  edge [
-    source 1322
-    target 3066
-    weight 62
-  ]
-  edge [
-    source 1322
-    target 3253
-    weight 48
-  ]
-  edge [
-    source 1322
-    target 2857
-    weight 82
-  ]
-  edge [
-    source 1322
-    target 2800
-    weight 38
-  ]
-  edge [
-    source 1322
-    target 3565
-    weight 61
-  ]
-  edge [
-    source 1322
-    target 3420
-    weight 52
-  ]
-  edge [
-    source 1322
-    target 4162
-    weight 27
-  ]
-  edge [
-    source 1322
-    target 2287
-    weight 66
-  ]
-  edge [
-    source 1322
-    target 3377
-    weight 21
-  ]
-  edge [
-    source 1322
-    target 4154
-    weight 59
-  ]
-  edge [
-    source 1322
-    target 1995
-    weight 104
-  ]
-  edge [
-    source 1322
-    target 3006
-    weight 49
-  ]
-  edge [
-    source 1322
-    target 3040
-    weight 51
-  ]
-  edge [
-    source 1322
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 3052
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 1322
-    target 3636
-    weight 54
-  ]
-  edge [
-    source 1322
-    target 3917
-    weight 90
-  ]
-  edge [
-    source 1322
-    target 3443
-    weight 68
-  ]
-  edge [
-    source 1322
-    target 1938
-    weight 47
-  ]
-  edge [
-    source 1322
-    target 3295
-    weight 26
-  ]
-  edge [
-    source 1322
-    target 1582
-    weight 109
-  ]
-  edge [
-    source 1322
-    target 1507
-    weight 21
-  ]
-  edge [
-    source 1322
-    target 3542
-    weight 77
-  ]
-  edge [
-    source 1322
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 1322
-    target 3374
-    weight 31
-  ]
-  edge [
-    source 1322
-    target 2519
-    weight 80
-  ]
-  edge [
-    source 1322
-    target 2553
-    weight 48
-  ]
-  edge [
-    source 1322
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 1322
-    target 1409
-    weight 38
-  ]
-  edge [
-    source 1322
-    target 2890
-    weight 56
-  ]
-  edge [
-    source 1322
-    target 2810
-    weight 23
-  ]
-  edge [
-    source 1322
-    target 4040
-    weight 28
-  ]
-  edge [
-    source 1322
-    target 1420
-    weight 22
-  ]
-  edge [
-    source 1322
-    target 2058
-    weight 43
-  ]
-  edge [
-    source 1326
-    target 1616
-    weight 23
-  ]
-  edge [
-    source 1326
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 1326
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 1887
-    weight 21
-  ]
-  edge [
-    source 1326
-    target 2071
-    weight 21
-  ]
-  edge [
-    source 1333
-    target 2861
-    weight 126
-  ]
-  edge [
-    source 1333
-    target 1616
-    weight 184
-  ]
-  edge [
-    source 1333
-    target 2191
-    weight 64
-  ]
-  edge [
-    source 1333
-    target 1487
-    weight 258
-  ]
-  edge [
-    source 1333
-    target 3521
-    weight 238
-  ]
-  edge [
-    source 1333
-    target 1647
-    weight 79
-  ]
-  edge [
-    source 1333
-    target 3565
-    weight 27
-  ]
-  edge [
-    source 1333
-    target 2071
-    weight 192
-  ]
-  edge [
-    source 1333
-    target 3077
-    weight 77
-  ]
-  edge [
-    source 1333
-    target 3962
-    weight 121
-  ]
-  edge [
-    source 1333
-    target 1409
-    weight 45
-  ]
-  edge [
-    source 1333
-    target 3600
-    weight 111
-  ]
-  edge [
-    source 1333
-    target 1995
-    weight 49
-  ]
-  edge [
-    source 1333
-    target 3040
-    weight 26
-  ]
-  edge [
-    source 1333
-    target 2227
-    weight 45
-  ]
-  edge [
-    source 1333
-    target 2597
-    weight 29
-  ]
-  edge [
-    source 1333
-    target 1952
-    weight 24
-  ]
-  edge [
-    source 1333
-    target 3423
-    weight 92
-  ]
-  edge [
-    source 1333
-    target 1887
-    weight 163
-  ]
-  edge [
-    source 1333
-    target 3141
-    weight 166
-  ]
-  edge [
-    source 1333
-    target 3993
-    weight 93
-  ]
-  edge [
-    source 1333
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 1333
-    target 3917
-    weight 64
-  ]
-  edge [
-    source 1333
-    target 3276
-    weight 91
-  ]
-  edge [
-    source 1333
-    target 3374
-    weight 56
-  ]
-  edge [
-    source 1333
-    target 3408
-    weight 31
-  ]
-  edge [
-    source 1333
-    target 4154
-    weight 23
-  ]
-  edge [
-    source 1333
-    target 3145
-    weight 96
-  ]
-  edge [
-    source 1333
-    target 2058
-    weight 37
-  ]
-  edge [
-    source 1333
-    target 2870
-    weight 23
-  ]
-  edge [
-    source 1333
-    target 2519
-    weight 43
-  ]
-  edge [
-    source 1333
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 1333
-    target 2890
-    weight 24
-  ]
-  edge [
-    source 1333
-    target 4051
-    weight 156
-  ]
-  edge [
-    source 1333
-    target 1582
-    weight 73
-  ]
-  edge [
-    source 1333
-    target 1757
-    weight 26
-  ]
-  edge [
-    source 1333
-    target 3174
-    weight 81
-  ]
-  edge [
-    source 1333
-    target 1505
-    weight 46
-  ]
-  edge [
-    source 1333
-    target 3642
-    weight 40
-  ]
-  edge [
-    source 1333
-    target 2857
-    weight 47
-  ]
-  edge [
-    source 1333
-    target 3542
-    weight 29
-  ]
-  edge [
-    source 1333
-    target 3282
-    weight 29
-  ]
-  edge [
-    source 1333
-    target 2287
-    weight 25
-  ]
-  edge [
-    source 1333
-    target 1632
-    weight 33
-  ]
-  edge [
-    source 1349
-    target 1616
-    weight 22
-  ]
-  edge [
-    source 1349
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1349
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 1349
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 1349
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 1360
-    target 2543
-    weight 100
-  ]
-  edge [
-    source 1360
-    target 3253
-    weight 56
-  ]
-  edge [
-    source 1360
-    target 4051
-    weight 274
-  ]
-  edge [
-    source 1360
-    target 3174
-    weight 252
-  ]
-  edge [
-    source 1360
-    target 3521
-    weight 328
-  ]
-  edge [
-    source 1360
-    target 1887
-    weight 279
-  ]
-  edge [
-    source 1360
-    target 1707
-    weight 29
-  ]
-  edge [
-    source 1360
-    target 3141
-    weight 292
-  ]
-  edge [
-    source 1360
-    target 2071
-    weight 269
-  ]
-  edge [
-    source 1360
-    target 3600
-    weight 153
-  ]
-  edge [
-    source 1360
-    target 3954
-    weight 102
-  ]
-  edge [
-    source 1360
-    target 3993
-    weight 142
-  ]
-  edge [
-    source 1360
-    target 3276
-    weight 163
-  ]
-  edge [
-    source 1360
-    target 1616
-    weight 311
-  ]
-  edge [
-    source 1360
-    target 3282
-    weight 113
-  ]
-  edge [
-    source 1360
-    target 1632
-    weight 133
-  ]
-  edge [
-    source 1360
-    target 3847
-    weight 26
-  ]
-  edge [
-    source 1360
-    target 3642
-    weight 115
-  ]
-  edge [
-    source 1360
-    target 2870
-    weight 77
-  ]
-  edge [
-    source 1360
-    target 1461
-    weight 29
-  ]
-  edge [
-    source 1360
-    target 3917
-    weight 118
-  ]
-  edge [
-    source 1360
-    target 1487
-    weight 194
-  ]
-  edge [
-    source 1360
-    target 1647
-    weight 125
-  ]
-  edge [
-    source 1360
-    target 3066
-    weight 87
-  ]
-  edge [
-    source 1360
-    target 2861
-    weight 220
-  ]
-  edge [
-    source 1360
-    target 1505
-    weight 104
-  ]
-  edge [
-    source 1360
-    target 2857
-    weight 106
-  ]
-  edge [
-    source 1360
-    target 3145
-    weight 211
-  ]
-  edge [
-    source 1360
-    target 2191
-    weight 55
-  ]
-  edge [
-    source 1360
-    target 2700
-    weight 168
-  ]
-  edge [
-    source 1360
-    target 1582
-    weight 134
-  ]
-  edge [
-    source 1360
-    target 2800
-    weight 48
-  ]
-  edge [
-    source 1360
-    target 3420
-    weight 60
-  ]
-  edge [
-    source 1360
-    target 3295
-    weight 44
-  ]
-  edge [
-    source 1360
-    target 3196
-    weight 29
-  ]
-  edge [
-    source 1360
-    target 1409
-    weight 40
-  ]
-  edge [
-    source 1360
-    target 1517
-    weight 25
-  ]
-  edge [
-    source 1360
-    target 1938
-    weight 40
-  ]
-  edge [
-    source 1360
-    target 3542
-    weight 105
-  ]
-  edge [
-    source 1360
-    target 3565
-    weight 68
-  ]
-  edge [
-    source 1360
-    target 3052
-    weight 63
-  ]
-  edge [
-    source 1360
-    target 3040
-    weight 79
-  ]
-  edge [
-    source 1360
-    target 1995
-    weight 163
-  ]
-  edge [
-    source 1360
-    target 1757
-    weight 46
-  ]
-  edge [
-    source 1360
-    target 3636
-    weight 73
-  ]
-  edge [
-    source 1360
-    target 3006
-    weight 77
-  ]
-  edge [
-    source 1360
-    target 4154
-    weight 86
-  ]
-  edge [
-    source 1360
-    target 2287
-    weight 86
-  ]
-  edge [
-    source 1360
-    target 3884
-    weight 21
-  ]
-  edge [
-    source 1360
-    target 3962
-    weight 31
-  ]
-  edge [
-    source 1360
-    target 3443
-    weight 61
-  ]
-  edge [
-    source 1360
-    target 2204
-    weight 63
-  ]
-  edge [
-    source 1360
-    target 4040
-    weight 26
-  ]
-  edge [
-    source 1360
-    target 3423
-    weight 79
-  ]
-  edge [
-    source 1360
-    target 2519
-    weight 99
-  ]
-  edge [
-    source 1360
-    target 3374
-    weight 67
-  ]
-  edge [
-    source 1360
-    target 1507
-    weight 49
-  ]
-  edge [
-    source 1360
-    target 1523
-    weight 41
-  ]
-  edge [
-    source 1360
-    target 3377
-    weight 31
-  ]
-  edge [
-    source 1360
-    target 2553
-    weight 44
-  ]
-  edge [
-    source 1360
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1360
-    target 4162
-    weight 42
-  ]
-  edge [
-    source 1360
-    target 1943
-    weight 22
-  ]
-  edge [
-    source 1360
-    target 3877
-    weight 30
-  ]
-  edge [
-    source 1360
-    target 2058
-    weight 48
-  ]
-  edge [
-    source 1374
-    target 3600
-    weight 43
-  ]
-  edge [
-    source 1374
-    target 2861
-    weight 56
-  ]
-  edge [
-    source 1374
-    target 1616
-    weight 85
-  ]
-  edge [
-    source 1374
-    target 1487
-    weight 108
-  ]
-  edge [
-    source 1374
-    target 3521
-    weight 107
-  ]
-  edge [
-    source 1374
-    target 2191
-    weight 26
-  ]
-  edge [
-    source 1374
-    target 1995
-    weight 33
-  ]
-  edge [
-    source 1374
-    target 3077
-    weight 22
-  ]
-  edge [
-    source 1374
-    target 2071
-    weight 85
-  ]
-  edge [
-    source 1374
-    target 1647
-    weight 29
-  ]
-  edge [
-    source 1374
-    target 3141
-    weight 71
-  ]
-  edge [
-    source 1374
-    target 4051
-    weight 72
-  ]
-  edge [
-    source 1374
-    target 1887
-    weight 67
-  ]
-  edge [
-    source 1374
-    target 1505
-    weight 21
-  ]
-  edge [
-    source 1374
-    target 3423
-    weight 56
-  ]
-  edge [
-    source 1374
-    target 3993
-    weight 37
-  ]
-  edge [
-    source 1374
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1374
-    target 3374
-    weight 28
-  ]
-  edge [
-    source 1374
-    target 3145
-    weight 34
-  ]
-  edge [
-    source 1374
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 1374
-    target 1582
-    weight 26
-  ]
-  edge [
-    source 1374
-    target 3174
-    weight 27
-  ]
-  edge [
-    source 1377
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 1377
-    target 1616
-    weight 27
-  ]
-  edge [
-    source 1377
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 1391
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 1391
-    target 1487
-    weight 83
-  ]
-  edge [
-    source 1391
-    target 3521
-    weight 111
-  ]
-  edge [
-    source 1391
-    target 3374
-    weight 55
-  ]
-  edge [
-    source 1391
-    target 2861
-    weight 64
-  ]
-  edge [
-    source 1391
-    target 1616
-    weight 92
-  ]
-  edge [
-    source 1391
-    target 2071
-    weight 89
-  ]
-  edge [
-    source 1391
-    target 1887
-    weight 80
-  ]
-  edge [
-    source 1391
-    target 3145
-    weight 54
-  ]
-  edge [
-    source 1391
-    target 3141
-    weight 84
-  ]
-  edge [
-    source 1391
-    target 1647
-    weight 44
-  ]
-  edge [
-    source 1391
-    target 3600
-    weight 50
-  ]
-  edge [
-    source 1391
-    target 3423
-    weight 31
-  ]
-  edge [
-    source 1391
-    target 4051
-    weight 86
-  ]
-  edge [
-    source 1391
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 1391
-    target 1995
-    weight 47
-  ]
-  edge [
-    source 1391
-    target 3276
-    weight 44
-  ]
-  edge [
-    source 1391
-    target 2700
-    weight 44
-  ]
-  edge [
-    source 1391
-    target 3174
-    weight 52
-  ]
-  edge [
-    source 1391
-    target 3642
-    weight 25
-  ]
-  edge [
-    source 1391
-    target 2857
-    weight 33
-  ]
-  edge [
-    source 1391
-    target 3954
-    weight 22
-  ]
-  edge [
-    source 1391
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 1391
-    target 1632
-    weight 32
-  ]
-  edge [
-    source 1391
-    target 3542
-    weight 24
-  ]
-  edge [
-    source 1391
-    target 1582
-    weight 38
-  ]
-  edge [
-    source 1391
-    target 3040
-    weight 22
-  ]
-  edge [
-    source 1391
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 1391
-    target 2519
-    weight 26
-  ]
-  edge [
-    source 1391
-    target 1505
-    weight 31
-  ]
-  edge [
-    source 1397
-    target 3521
-    weight 33
-  ]
-  edge [
-    source 1397
-    target 1887
-    weight 32
-  ]
-  edge [
-    source 1397
-    target 3141
-    weight 33
-  ]
-  edge [
-    source 1397
-    target 1616
-    weight 30
-  ]
-  edge [
-    source 1397
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 1397
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 1409
-    target 3600
-    weight 483
-  ]
-  edge [
-    source 1409
-    target 2861
-    weight 566
-  ]
-  edge [
-    source 1409
-    target 1616
-    weight 756
-  ]
-  edge [
-    source 1409
-    target 3641
-    weight 24
-  ]
-  edge [
-    source 1409
-    target 1487
-    weight 747
-  ]
-  edge [
-    source 1409
-    target 3521
-    weight 931
-  ]
-  edge [
-    source 1409
-    target 1647
-    weight 431
-  ]
-  edge [
-    source 1409
-    target 3642
-    weight 250
-  ]
-  edge [
-    source 1409
-    target 3276
-    weight 341
-  ]
-  edge [
-    source 1409
-    target 3420
-    weight 105
-  ]
-  edge [
-    source 1409
-    target 3917
-    weight 232
-  ]
-  edge [
-    source 1409
-    target 3024
-    weight 47
-  ]
-  edge [
-    source 1409
-    target 3542
-    weight 151
-  ]
-  edge [
-    source 1409
-    target 2700
-    weight 352
-  ]
-  edge [
-    source 1409
-    target 3423
-    weight 265
-  ]
-  edge [
-    source 1409
-    target 3141
-    weight 722
-  ]
-  edge [
-    source 1409
-    target 4051
-    weight 672
-  ]
-  edge [
-    source 1409
-    target 3565
-    weight 199
-  ]
-  edge [
-    source 1409
-    target 2071
-    weight 802
-  ]
-  edge [
-    source 1409
-    target 3145
-    weight 389
-  ]
-  edge [
-    source 1409
-    target 3282
-    weight 198
-  ]
-  edge [
-    source 1409
-    target 2810
-    weight 55
-  ]
-  edge [
-    source 1409
-    target 1789
-    weight 24
-  ]
-  edge [
-    source 1409
-    target 2191
-    weight 165
-  ]
-  edge [
-    source 1409
-    target 3077
-    weight 94
-  ]
-  edge [
-    source 1409
-    target 1887
-    weight 658
-  ]
-  edge [
-    source 1409
-    target 1995
-    weight 322
-  ]
-  edge [
-    source 1409
-    target 2287
-    weight 133
-  ]
-  edge [
-    source 1409
-    target 2204
-    weight 103
-  ]
-  edge [
-    source 1409
-    target 2890
-    weight 124
-  ]
-  edge [
-    source 1409
-    target 2058
-    weight 128
-  ]
-  edge [
-    source 1409
-    target 3962
-    weight 192
-  ]
-  edge [
-    source 1409
-    target 3377
-    weight 24
-  ]
-  edge [
-    source 1409
-    target 3937
-    weight 59
-  ]
-  edge [
-    source 1409
-    target 3040
-    weight 133
-  ]
-  edge [
-    source 1409
-    target 3636
-    weight 132
-  ]
-  edge [
-    source 1409
-    target 1505
-    weight 200
-  ]
-  edge [
-    source 1409
-    target 2800
-    weight 59
-  ]
-  edge [
-    source 1409
-    target 3443
-    weight 124
-  ]
-  edge [
-    source 1409
-    target 3993
-    weight 404
-  ]
-  edge [
-    source 1409
-    target 4187
-    weight 25
-  ]
-  edge [
-    source 1409
-    target 3174
-    weight 342
-  ]
-  edge [
-    source 1409
-    target 2870
-    weight 162
-  ]
-  edge [
-    source 1409
-    target 1632
-    weight 224
-  ]
-  edge [
-    source 1409
-    target 1757
-    weight 141
-  ]
-  edge [
-    source 1409
-    target 3006
-    weight 107
-  ]
-  edge [
-    source 1409
-    target 3253
-    weight 72
-  ]
-  edge [
-    source 1409
-    target 1582
-    weight 308
-  ]
-  edge [
-    source 1409
-    target 3374
-    weight 140
-  ]
-  edge [
-    source 1409
-    target 1952
-    weight 42
-  ]
-  edge [
-    source 1409
-    target 3177
-    weight 41
-  ]
-  edge [
-    source 1409
-    target 4152
-    weight 26
-  ]
-  edge [
-    source 1409
-    target 2553
-    weight 58
-  ]
-  edge [
-    source 1409
-    target 4154
-    weight 102
-  ]
-  edge [
-    source 1409
-    target 1507
-    weight 35
-  ]
-  edge [
-    source 1409
-    target 3954
-    weight 114
-  ]
-  edge [
-    source 1409
-    target 3408
-    weight 49
-  ]
-  edge [
-    source 1409
-    target 1707
-    weight 34
-  ]
-  edge [
-    source 1409
-    target 2857
-    weight 186
-  ]
-  edge [
-    source 1409
-    target 4040
-    weight 29
-  ]
-  edge [
-    source 1409
-    target 1938
-    weight 46
-  ]
-  edge [
-    source 1409
-    target 3295
-    weight 67
-  ]
-  edge [
-    source 1409
-    target 3052
-    weight 43
-  ]
-  edge [
-    source 1409
-    target 3847
-    weight 37
-  ]
-  edge [
-    source 1409
-    target 1523
-    weight 44
-  ]
-  edge [
-    source 1409
-    target 2543
-    weight 74
-  ]
-  edge [
-    source 1409
-    target 2227
-    weight 60
-  ]
-  edge [
-    source 1409
-    target 2519
-    weight 176
-  ]
-  edge [
-    source 1409
-    target 1802
-    weight 21
-  ]
-  edge [
-    source 1409
-    target 3066
-    weight 92
-  ]
-  edge [
-    source 1409
-    target 3877
-    weight 36
-  ]
-  edge [
-    source 1409
-    target 1943
-    weight 27
-  ]
-  edge [
-    source 1409
-    target 2614
-    weight 28
-  ]
-  edge [
-    source 1409
-    target 4162
-    weight 31
-  ]
-  edge [
-    source 1409
-    target 1420
-    weight 47
-  ]
-  edge [
-    source 1409
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 1409
-    target 1970
-    weight 21
-  ]
-  edge [
-    source 1409
-    target 2078
-    weight 45
-  ]
-  edge [
-    source 1415
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1419
-    target 3521
-    weight 87
-  ]
-  edge [
-    source 1419
-    target 3141
-    weight 72
-  ]
-  edge [
-    source 1419
-    target 1616
-    weight 69
-  ]
-  edge [
-    source 1419
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1419
-    target 1995
-    weight 33
-  ]
-  edge [
-    source 1419
-    target 2071
-    weight 69
-  ]
-  edge [
-    source 1419
-    target 1887
-    weight 70
-  ]
-  edge [
-    source 1419
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 1419
-    target 1647
-    weight 36
-  ]
-  edge [
-    source 1419
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1419
-    target 3993
-    weight 28
-  ]
-  edge [
-    source 1419
-    target 1582
-    weight 33
-  ]
-  edge [
-    source 1419
-    target 3145
-    weight 51
-  ]
-  edge [
-    source 1419
-    target 3600
-    weight 45
-  ]
-  edge [
-    source 1419
-    target 4051
-    weight 66
-  ]
-  edge [
-    source 1419
-    target 1505
-    weight 26
-  ]
-  edge [
-    source 1419
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1419
-    target 1487
-    weight 51
-  ]
-  edge [
-    source 1419
-    target 3174
-    weight 40
-  ]
-  edge [
-    source 1419
-    target 3276
-    weight 37
-  ]
-  edge [
-    source 1419
-    target 2700
-    weight 31
-  ]
-  edge [
-    source 1420
-    target 3521
-    weight 207
-  ]
-  edge [
-    source 1420
-    target 1616
-    weight 179
-  ]
-  edge [
-    source 1420
-    target 3145
-    weight 144
-  ]
-  edge [
-    source 1420
-    target 2861
-    weight 136
-  ]
-  edge [
-    source 1420
-    target 1887
-    weight 188
-  ]
-  edge [
-    source 1420
-    target 1487
-    weight 138
-  ]
-  edge [
-    source 1420
-    target 3174
-    weight 100
-  ]
-  edge [
-    source 1420
-    target 3420
-    weight 51
-  ]
-  edge [
-    source 1420
-    target 2071
-    weight 172
-  ]
-  edge [
-    source 1420
-    target 3141
-    weight 188
-  ]
-  edge [
-    source 1420
-    target 2700
-    weight 122
-  ]
-  edge [
-    source 1420
-    target 1505
-    weight 72
-  ]
-  edge [
-    source 1420
-    target 3282
-    weight 96
-  ]
-  edge [
-    source 1420
-    target 3642
-    weight 76
-  ]
-  edge [
-    source 1420
-    target 3917
-    weight 108
-  ]
-  edge [
-    source 1420
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1420
-    target 1995
-    weight 96
-  ]
-  edge [
-    source 1420
-    target 3600
-    weight 124
-  ]
-  edge [
-    source 1420
-    target 4051
-    weight 164
-  ]
-  edge [
-    source 1420
-    target 3276
-    weight 121
-  ]
-  edge [
-    source 1420
-    target 4154
-    weight 56
-  ]
-  edge [
-    source 1420
-    target 1632
-    weight 85
-  ]
-  edge [
-    source 1420
-    target 3565
-    weight 57
-  ]
-  edge [
-    source 1420
-    target 1647
-    weight 104
-  ]
-  edge [
-    source 1420
-    target 1582
-    weight 119
-  ]
-  edge [
-    source 1420
-    target 1938
-    weight 28
-  ]
-  edge [
-    source 1420
-    target 2857
-    weight 87
-  ]
-  edge [
-    source 1420
-    target 3443
-    weight 72
-  ]
-  edge [
-    source 1420
-    target 3993
-    weight 113
-  ]
-  edge [
-    source 1420
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 1420
-    target 3542
-    weight 81
-  ]
-  edge [
-    source 1420
-    target 2519
-    weight 89
-  ]
-  edge [
-    source 1420
-    target 3374
-    weight 46
-  ]
-  edge [
-    source 1420
-    target 3962
-    weight 39
-  ]
-  edge [
-    source 1420
-    target 3636
-    weight 55
-  ]
-  edge [
-    source 1420
-    target 2191
-    weight 46
-  ]
-  edge [
-    source 1420
-    target 2870
-    weight 59
-  ]
-  edge [
-    source 1420
-    target 2204
-    weight 55
-  ]
-  edge [
-    source 1420
-    target 1757
-    weight 51
-  ]
-  edge [
-    source 1420
-    target 3423
-    weight 54
-  ]
-  edge [
-    source 1420
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 1420
-    target 3066
-    weight 46
-  ]
-  edge [
-    source 1420
-    target 3006
-    weight 37
-  ]
-  edge [
-    source 1420
-    target 2287
-    weight 48
-  ]
-  edge [
-    source 1420
-    target 2058
-    weight 52
-  ]
-  edge [
-    source 1420
-    target 2553
-    weight 31
-  ]
-  edge [
-    source 1420
-    target 3052
-    weight 36
-  ]
-  edge [
-    source 1420
-    target 2543
-    weight 36
-  ]
-  edge [
-    source 1420
-    target 2800
-    weight 32
-  ]
-  edge [
-    source 1420
-    target 1707
-    weight 24
-  ]
-  edge [
-    source 1420
-    target 3040
-    weight 44
-  ]
-  edge [
-    source 1420
-    target 1507
-    weight 27
-  ]
-  edge [
-    source 1420
-    target 3954
-    weight 50
-  ]
-  edge [
-    source 1420
-    target 1523
-    weight 21
-  ]
-  edge [
-    source 1420
-    target 3937
-    weight 29
-  ]
-  edge [
-    source 1425
-    target 1616
-    weight 50
-  ]
-  edge [
-    source 1425
-    target 3521
-    weight 52
-  ]
-  edge [
-    source 1425
-    target 2861
-    weight 38
-  ]
-  edge [
-    source 1425
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 1425
-    target 4051
-    weight 45
-  ]
-  edge [
-    source 1425
-    target 1487
-    weight 31
-  ]
-  edge [
-    source 1425
-    target 3141
-    weight 40
-  ]
-  edge [
-    source 1425
-    target 2071
-    weight 46
-  ]
-  edge [
-    source 1425
-    target 1887
-    weight 40
-  ]
-  edge [
-    source 1425
-    target 3174
-    weight 23
-  ]
-  edge [
-    source 1425
-    target 1647
-    weight 21
-  ]
-  edge [
-    source 1425
-    target 1582
-    weight 23
-  ]
-  edge [
-    source 1425
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 1425
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1425
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1425
-    target 1995
-    weight 30
-  ]
-  edge [
-    source 1425
-    target 3145
-    weight 34
-  ]
-  edge [
-    source 1425
-    target 1632
-    weight 21
-  ]
-  edge [
-    source 1461
-    target 3295
-    weight 23
-  ]
-  edge [
-    source 1461
-    target 3141
-    weight 107
-  ]
-  edge [
-    source 1461
-    target 2543
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 1616
-    weight 135
-  ]
-  edge [
-    source 1461
-    target 2700
-    weight 64
-  ]
-  edge [
-    source 1461
-    target 3282
-    weight 53
-  ]
-  edge [
-    source 1461
-    target 3642
-    weight 63
-  ]
-  edge [
-    source 1461
-    target 2861
-    weight 93
-  ]
-  edge [
-    source 1461
-    target 4051
-    weight 109
-  ]
-  edge [
-    source 1461
-    target 1887
-    weight 108
-  ]
-  edge [
-    source 1461
-    target 3521
-    weight 134
-  ]
-  edge [
-    source 1461
-    target 2071
-    weight 94
-  ]
-  edge [
-    source 1461
-    target 1632
-    weight 71
-  ]
-  edge [
-    source 1461
-    target 1995
-    weight 61
-  ]
-  edge [
-    source 1461
-    target 3954
-    weight 60
-  ]
-  edge [
-    source 1461
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 1461
-    target 3040
-    weight 47
-  ]
-  edge [
-    source 1461
-    target 1647
-    weight 45
-  ]
-  edge [
-    source 1461
-    target 1707
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 2870
-    weight 39
-  ]
-  edge [
-    source 1461
-    target 3006
-    weight 45
-  ]
-  edge [
-    source 1461
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 1461
-    target 3066
-    weight 41
-  ]
-  edge [
-    source 1461
-    target 3145
-    weight 70
-  ]
-  edge [
-    source 1461
-    target 1505
-    weight 31
-  ]
-  edge [
-    source 1461
-    target 3600
-    weight 47
-  ]
-  edge [
-    source 1461
-    target 1487
-    weight 58
-  ]
-  edge [
-    source 1461
-    target 3276
-    weight 54
-  ]
-  edge [
-    source 1461
-    target 3174
-    weight 56
-  ]
-  edge [
-    source 1461
-    target 1938
-    weight 23
-  ]
-  edge [
-    source 1461
-    target 4162
-    weight 22
-  ]
-  edge [
-    source 1461
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 1461
-    target 4154
-    weight 43
-  ]
-  edge [
-    source 1461
-    target 3565
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 3052
-    weight 22
-  ]
-  edge [
-    source 1461
-    target 2287
-    weight 34
-  ]
-  edge [
-    source 1461
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 1461
-    target 1757
-    weight 25
-  ]
-  edge [
-    source 1461
-    target 2890
-    weight 23
-  ]
-  edge [
-    source 1461
-    target 3420
-    weight 27
-  ]
-  edge [
-    source 1461
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 1461
-    target 2204
-    weight 25
-  ]
-  edge [
-    source 1461
-    target 1582
-    weight 41
-  ]
-  edge [
-    source 1461
-    target 2519
-    weight 32
-  ]
-  edge [
-    source 1461
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 1487
-    target 2191
-    weight 1117
-  ]
-  edge [
-    source 1487
-    target 3521
-    weight 16575
-  ]
-  edge [
-    source 1487
-    target 1647
-    weight 3130
-  ]
-  edge [
-    source 1487
-    target 1616
-    weight 12135
-  ]
-  edge [
-    source 1487
-    target 2861
-    weight 8162
-  ]
-  edge [
-    source 1487
-    target 3565
-    weight 1286
-  ]
-  edge [
-    source 1487
-    target 3600
-    weight 5728
-  ]
-  edge [
-    source 1487
-    target 2421
-    weight 23
-  ]
-  edge [
-    source 1487
-    target 1789
-    weight 223
-  ]
-  edge [
-    source 1487
-    target 3112
-    weight 39
-  ]
-  edge [
-    source 1487
-    target 1582
-    weight 3158
-  ]
-  edge [
-    source 1487
-    target 3641
-    weight 108
-  ]
-  edge [
-    source 1487
-    target 3374
-    weight 1173
-  ]
-  edge [
-    source 1487
-    target 3077
-    weight 724
-  ]
-  edge [
-    source 1487
-    target 3276
-    weight 3660
-  ]
-  edge [
-    source 1487
-    target 4051
-    weight 9640
-  ]
-  edge [
-    source 1487
-    target 2058
-    weight 749
-  ]
-  edge [
-    source 1487
-    target 3423
-    weight 2226
-  ]
-  edge [
-    source 1487
-    target 3420
-    weight 385
-  ]
-  edge [
-    source 1487
-    target 2227
-    weight 435
-  ]
-  edge [
-    source 1487
-    target 1931
-    weight 70
-  ]
-  edge [
-    source 1487
-    target 3642
-    weight 2101
-  ]
-  edge [
-    source 1487
-    target 3937
-    weight 236
-  ]
-  edge [
-    source 1487
-    target 4187
-    weight 133
-  ]
-  edge [
-    source 1487
-    target 3693
-    weight 89
-  ]
-  edge [
-    source 1487
-    target 3917
-    weight 1544
-  ]
-  edge [
-    source 1487
-    target 3071
-    weight 72
-  ]
-  edge [
-    source 1487
-    target 3970
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 1887
-    weight 9274
-  ]
-  edge [
-    source 1487
-    target 3024
-    weight 79
-  ]
-  edge [
-    source 1487
-    target 1952
-    weight 161
-  ]
-  edge [
-    source 1487
-    target 3177
-    weight 165
-  ]
-  edge [
-    source 1487
-    target 3861
-    weight 73
-  ]
-  edge [
-    source 1487
-    target 3542
-    weight 736
-  ]
-  edge [
-    source 1487
-    target 3174
-    weight 3643
-  ]
-  edge [
-    source 1487
-    target 2071
-    weight 11114
-  ]
-  edge [
-    source 1487
-    target 3145
-    weight 3328
-  ]
-  edge [
-    source 1487
-    target 2700
-    weight 2657
-  ]
-  edge [
-    source 1487
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 2243
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 2857
-    weight 895
-  ]
-  edge [
-    source 1487
-    target 1505
-    weight 1139
-  ]
-  edge [
-    source 1487
-    target 3985
-    weight 52
-  ]
-  edge [
-    source 1487
-    target 4027
-    weight 84
-  ]
-  edge [
-    source 1487
-    target 3432
-    weight 82
-  ]
-  edge [
-    source 1487
-    target 3968
-    weight 101
-  ]
-  edge [
-    source 1487
-    target 3993
-    weight 2911
-  ]
-  edge [
-    source 1487
-    target 3962
-    weight 959
-  ]
-  edge [
-    source 1487
-    target 3357
-    weight 118
-  ]
-  edge [
-    source 1487
-    target 2810
-    weight 179
-  ]
-  edge [
-    source 1487
-    target 3443
-    weight 692
-  ]
-  edge [
-    source 1487
-    target 2800
-    weight 269
-  ]
-  edge [
-    source 1487
-    target 3377
-    weight 154
-  ]
-  edge [
-    source 1487
-    target 1995
-    weight 2672
-  ]
-  edge [
-    source 1487
-    target 3141
-    weight 10481
-  ]
-  edge [
-    source 1487
-    target 2870
-    weight 584
-  ]
-  edge [
-    source 1487
-    target 2978
-    weight 33
-  ]
-  edge [
-    source 1487
-    target 3066
-    weight 469
-  ]
-  edge [
-    source 1487
-    target 3636
-    weight 504
-  ]
-  edge [
-    source 1487
-    target 1757
-    weight 504
-  ]
-  edge [
-    source 1487
-    target 1943
-    weight 115
-  ]
-  edge [
-    source 1487
-    target 3282
-    weight 941
-  ]
-  edge [
-    source 1487
-    target 3954
-    weight 569
-  ]
-  edge [
-    source 1487
-    target 2198
-    weight 78
-  ]
-  edge [
-    source 1487
-    target 1632
-    weight 1198
-  ]
-  edge [
-    source 1487
-    target 3295
-    weight 294
-  ]
-  edge [
-    source 1487
-    target 3052
-    weight 229
-  ]
-  edge [
-    source 1487
-    target 2597
-    weight 135
-  ]
-  edge [
-    source 1487
-    target 2287
-    weight 577
-  ]
-  edge [
-    source 1487
-    target 2204
-    weight 415
-  ]
-  edge [
-    source 1487
-    target 4098
-    weight 70
-  ]
-  edge [
-    source 1487
-    target 2890
-    weight 850
-  ]
-  edge [
-    source 1487
-    target 1848
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 3006
-    weight 466
-  ]
-  edge [
-    source 1487
-    target 3040
-    weight 669
-  ]
-  edge [
-    source 1487
-    target 2519
-    weight 929
-  ]
-  edge [
-    source 1487
-    target 4007
-    weight 36
-  ]
-  edge [
-    source 1487
-    target 2726
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 3408
-    weight 393
-  ]
-  edge [
-    source 1487
-    target 4154
-    weight 713
-  ]
-  edge [
-    source 1487
-    target 2543
-    weight 386
-  ]
-  edge [
-    source 1487
-    target 2217
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 2061
-    weight 62
-  ]
-  edge [
-    source 1487
-    target 4100
-    weight 28
-  ]
-  edge [
-    source 1487
-    target 3253
-    weight 375
-  ]
-  edge [
-    source 1487
-    target 2009
-    weight 28
-  ]
-  edge [
-    source 1487
-    target 1492
-    weight 36
-  ]
-  edge [
-    source 1487
-    target 1517
-    weight 110
-  ]
-  edge [
-    source 1487
-    target 3772
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 2600
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 1856
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 1543
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 4162
-    weight 258
-  ]
-  edge [
-    source 1487
-    target 2099
-    weight 142
-  ]
-  edge [
-    source 1487
-    target 4152
-    weight 82
-  ]
-  edge [
-    source 1487
-    target 3877
-    weight 227
-  ]
-  edge [
-    source 1487
-    target 2553
-    weight 239
-  ]
-  edge [
-    source 1487
-    target 1691
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 1707
-    weight 119
-  ]
-  edge [
-    source 1487
-    target 1507
-    weight 241
-  ]
-  edge [
-    source 1487
-    target 3162
-    weight 60
-  ]
-  edge [
-    source 1487
-    target 3956
-    weight 28
-  ]
-  edge [
-    source 1487
-    target 2844
-    weight 35
-  ]
-  edge [
-    source 1487
-    target 3697
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 3196
-    weight 62
-  ]
-  edge [
-    source 1487
-    target 2711
-    weight 69
-  ]
-  edge [
-    source 1487
-    target 2003
-    weight 70
-  ]
-  edge [
-    source 1487
-    target 2570
-    weight 53
-  ]
-  edge [
-    source 1487
-    target 3847
-    weight 142
-  ]
-  edge [
-    source 1487
-    target 1798
-    weight 67
-  ]
-  edge [
-    source 1487
-    target 1676
-    weight 25
-  ]
-  edge [
-    source 1487
-    target 2082
-    weight 29
-  ]
-  edge [
-    source 1487
-    target 2614
-    weight 106
-  ]
-  edge [
-    source 1487
-    target 3324
-    weight 41
-  ]
-  edge [
-    source 1487
-    target 3210
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 1938
-    weight 212
-  ]
-  edge [
-    source 1487
-    target 2329
-    weight 75
-  ]
-  edge [
-    source 1487
-    target 4040
-    weight 154
-  ]
-  edge [
-    source 1487
-    target 1577
-    weight 37
-  ]
-  edge [
-    source 1487
-    target 3884
-    weight 81
-  ]
-  edge [
-    source 1487
-    target 2573
-    weight 38
-  ]
-  edge [
-    source 1487
-    target 2373
-    weight 33
-  ]
-  edge [
-    source 1487
-    target 4160
-    weight 66
-  ]
-  edge [
-    source 1487
-    target 3935
-    weight 37
-  ]
-  edge [
-    source 1487
-    target 3108
-    weight 32
-  ]
-  edge [
-    source 1487
-    target 1822
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 3860
-    weight 63
-  ]
-  edge [
-    source 1487
-    target 2450
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 2531
-    weight 58
-  ]
-  edge [
-    source 1487
-    target 1631
-    weight 33
-  ]
-  edge [
-    source 1487
-    target 2924
-    weight 44
-  ]
-  edge [
-    source 1487
-    target 1523
-    weight 212
-  ]
-  edge [
-    source 1487
-    target 4081
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 2609
-    weight 26
-  ]
-  edge [
-    source 1487
-    target 3050
-    weight 47
-  ]
-  edge [
-    source 1487
-    target 2743
-    weight 30
-  ]
-  edge [
-    source 1487
-    target 1554
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 1802
-    weight 84
-  ]
-  edge [
-    source 1487
-    target 3309
-    weight 22
-  ]
-  edge [
-    source 1487
-    target 2983
-    weight 25
-  ]
-  edge [
-    source 1487
-    target 1766
-    weight 32
-  ]
-  edge [
-    source 1487
-    target 2955
-    weight 42
-  ]
-  edge [
-    source 1487
-    target 2181
-    weight 36
-  ]
-  edge [
-    source 1487
-    target 3677
-    weight 68
-  ]
-  edge [
-    source 1487
-    target 3856
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 2822
-    weight 73
-  ]
-  edge [
-    source 1487
-    target 3872
-    weight 44
-  ]
-  edge [
-    source 1487
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 1487
-    target 1832
-    weight 31
-  ]
-  edge [
-    source 1487
-    target 1634
-    weight 24
-  ]
-  edge [
-    source 1487
-    target 2115
-    weight 32
-  ]
-  edge [
-    source 1487
-    target 2634
-    weight 27
-  ]
-  edge [
-    source 1487
-    target 3737
-    weight 42
-  ]
-  edge [
-    source 1487
-    target 2556
-    weight 43
-  ]
-  edge [
-    source 1487
-    target 1970
-    weight 117
-  ]
-  edge [
-    source 1487
-    target 3559
-    weight 31
-  ]
-  edge [
-    source 1487
-    target 2836
-    weight 21
-  ]
-  edge [
-    source 1487
-    target 3633
-    weight 54
-  ]
-  edge [
-    source 1487
-    target 2232
-    weight 31
-  ]
-  edge [
-    source 1487
-    target 3462
-    weight 39
-  ]
-  edge [
-    source 1487
-    target 3011
-    weight 30
-  ]
-  edge [
-    source 1487
-    target 3876
-    weight 42
-  ]
-  edge [
-    source 1487
-    target 1528
-    weight 46
-  ]
-  edge [
-    source 1487
-    target 2054
-    weight 35
-  ]
-  edge [
-    source 1487
-    target 2011
-    weight 84
-  ]
-  edge [
-    source 1487
-    target 2078
-    weight 168
-  ]
-  edge [
-    source 1487
-    target 1900
-    weight 23
-  ]
-  edge [
-    source 1492
-    target 3600
-    weight 24
-  ]
-  edge [
-    source 1492
-    target 3521
-    weight 57
-  ]
-  edge [
-    source 1492
-    target 3276
-    weight 31
-  ]
-  edge [
-    source 1492
-    target 2071
-    weight 38
-  ]
-  edge [
-    source 1492
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 1492
-    target 1616
-    weight 50
-  ]
-  edge [
-    source 1492
-    target 3141
-    weight 45
-  ]
-  edge [
-    source 1492
-    target 1887
-    weight 39
-  ]
-  edge [
-    source 1492
-    target 2861
-    weight 38
-  ]
-  edge [
-    source 1492
-    target 2700
-    weight 25
-  ]
-  edge [
-    source 1492
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 1492
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1505
-    target 3521
-    weight 1624
-  ]
-  edge [
-    source 1505
-    target 2861
-    weight 978
-  ]
-  edge [
-    source 1505
-    target 1616
-    weight 1431
-  ]
-  edge [
-    source 1505
-    target 3993
-    weight 786
-  ]
-  edge [
-    source 1505
-    target 3276
-    weight 844
-  ]
-  edge [
-    source 1505
-    target 3420
-    weight 164
-  ]
-  edge [
-    source 1505
-    target 2700
-    weight 679
-  ]
-  edge [
-    source 1505
-    target 3641
-    weight 40
-  ]
-  edge [
-    source 1505
-    target 1647
-    weight 745
-  ]
-  edge [
-    source 1505
-    target 1887
-    weight 1202
-  ]
-  edge [
-    source 1505
-    target 3600
-    weight 1030
-  ]
-  edge [
-    source 1505
-    target 1582
-    weight 625
-  ]
-  edge [
-    source 1505
-    target 3565
-    weight 266
-  ]
-  edge [
-    source 1505
-    target 2870
-    weight 338
-  ]
-  edge [
-    source 1505
-    target 3066
-    weight 271
-  ]
-  edge [
-    source 1505
-    target 3141
-    weight 1336
-  ]
-  edge [
-    source 1505
-    target 4051
-    weight 1258
-  ]
-  edge [
-    source 1505
-    target 3174
-    weight 764
-  ]
-  edge [
-    source 1505
-    target 3374
-    weight 305
-  ]
-  edge [
-    source 1505
-    target 2071
-    weight 1308
-  ]
-  edge [
-    source 1505
-    target 3917
-    weight 490
-  ]
-  edge [
-    source 1505
-    target 1995
-    weight 673
-  ]
-  edge [
-    source 1505
-    target 2191
-    weight 254
-  ]
-  edge [
-    source 1505
-    target 3636
-    weight 221
-  ]
-  edge [
-    source 1505
-    target 3282
-    weight 396
-  ]
-  edge [
-    source 1505
-    target 1632
-    weight 477
-  ]
-  edge [
-    source 1505
-    target 3253
-    weight 156
-  ]
-  edge [
-    source 1505
-    target 3006
-    weight 184
-  ]
-  edge [
-    source 1505
-    target 3052
-    weight 123
-  ]
-  edge [
-    source 1505
-    target 3937
-    weight 92
-  ]
-  edge [
-    source 1505
-    target 3040
-    weight 299
-  ]
-  edge [
-    source 1505
-    target 3145
-    weight 865
-  ]
-  edge [
-    source 1505
-    target 2800
-    weight 119
-  ]
-  edge [
-    source 1505
-    target 2287
-    weight 333
-  ]
-  edge [
-    source 1505
-    target 3642
-    weight 433
-  ]
-  edge [
-    source 1505
-    target 2924
-    weight 26
-  ]
-  edge [
-    source 1505
-    target 4187
-    weight 61
-  ]
-  edge [
-    source 1505
-    target 3443
-    weight 284
-  ]
-  edge [
-    source 1505
-    target 2553
-    weight 132
-  ]
-  edge [
-    source 1505
-    target 2204
-    weight 187
-  ]
-  edge [
-    source 1505
-    target 2543
-    weight 196
-  ]
-  edge [
-    source 1505
-    target 2890
-    weight 245
-  ]
-  edge [
-    source 1505
-    target 3954
-    weight 255
-  ]
-  edge [
-    source 1505
-    target 4152
-    weight 36
-  ]
-  edge [
-    source 1505
-    target 1757
-    weight 199
-  ]
-  edge [
-    source 1505
-    target 4027
-    weight 39
-  ]
-  edge [
-    source 1505
-    target 2061
-    weight 24
-  ]
-  edge [
-    source 1505
-    target 2857
-    weight 391
-  ]
-  edge [
-    source 1505
-    target 1707
-    weight 66
-  ]
-  edge [
-    source 1505
-    target 3071
-    weight 38
-  ]
-  edge [
-    source 1505
-    target 3377
-    weight 65
-  ]
-  edge [
-    source 1505
-    target 3884
-    weight 46
-  ]
-  edge [
-    source 1505
-    target 3423
-    weight 411
-  ]
-  edge [
-    source 1505
-    target 1507
-    weight 99
-  ]
-  edge [
-    source 1505
-    target 2711
-    weight 51
-  ]
-  edge [
-    source 1505
-    target 3542
-    weight 316
-  ]
-  edge [
-    source 1505
-    target 1943
-    weight 80
-  ]
-  edge [
-    source 1505
-    target 2810
-    weight 77
-  ]
-  edge [
-    source 1505
-    target 1798
-    weight 24
-  ]
-  edge [
-    source 1505
-    target 1577
-    weight 23
-  ]
-  edge [
-    source 1505
-    target 3295
-    weight 133
-  ]
-  edge [
-    source 1505
-    target 2570
-    weight 28
-  ]
-  edge [
-    source 1505
-    target 1952
-    weight 46
-  ]
-  edge [
-    source 1505
-    target 3162
-    weight 30
-  ]
-  edge [
-    source 1505
-    target 1517
-    weight 50
-  ]
-  edge [
-    source 1505
-    target 4154
-    weight 248
-  ]
-  edge [
-    source 1505
-    target 3847
-    weight 70
-  ]
-  edge [
-    source 1505
-    target 3860
-    weight 36
-  ]
-  edge [
-    source 1505
-    target 4040
-    weight 69
-  ]
-  edge [
-    source 1505
-    target 4162
-    weight 101
-  ]
-  edge [
-    source 1505
-    target 1938
-    weight 112
-  ]
-  edge [
-    source 1505
-    target 2329
-    weight 42
-  ]
-  edge [
-    source 1505
-    target 3050
-    weight 44
-  ]
-  edge [
-    source 1505
-    target 2227
-    weight 51
-  ]
-  edge [
-    source 1505
-    target 3962
-    weight 217
-  ]
-  edge [
-    source 1505
-    target 1523
-    weight 95
-  ]
-  edge [
-    source 1505
-    target 2058
-    weight 258
-  ]
-  edge [
-    source 1505
-    target 3077
-    weight 117
-  ]
-  edge [
-    source 1505
-    target 2844
-    weight 21
-  ]
-  edge [
-    source 1505
-    target 2519
-    weight 352
-  ]
-  edge [
-    source 1505
-    target 2531
-    weight 23
-  ]
-  edge [
-    source 1505
-    target 3432
-    weight 32
-  ]
-  edge [
-    source 1505
-    target 4098
-    weight 27
-  ]
-  edge [
-    source 1505
-    target 3968
-    weight 28
-  ]
-  edge [
-    source 1505
-    target 2614
-    weight 59
-  ]
-  edge [
-    source 1505
-    target 3877
-    weight 74
-  ]
-  edge [
-    source 1505
-    target 3177
-    weight 75
-  ]
-  edge [
-    source 1505
-    target 1789
-    weight 21
-  ]
-  edge [
-    source 1505
-    target 3196
-    weight 40
-  ]
-  edge [
-    source 1505
-    target 2099
-    weight 33
-  ]
-  edge [
-    source 1505
-    target 2003
-    weight 25
-  ]
-  edge [
-    source 1505
-    target 2011
-    weight 32
-  ]
-  edge [
-    source 1505
-    target 1970
-    weight 33
-  ]
-  edge [
-    source 1505
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 1505
-    target 2556
-    weight 22
-  ]
-  edge [
-    source 1505
-    target 1802
-    weight 37
-  ]
-  edge [
-    source 1505
-    target 3408
-    weight 80
-  ]
-  edge [
-    source 1505
-    target 2078
-    weight 45
-  ]
-  edge [
-    source 1505
-    target 3876
-    weight 23
-  ]
-  edge [
-    source 1507
-    target 3521
-    weight 377
-  ]
-  edge [
-    source 1507
-    target 2861
-    weight 254
-  ]
-  edge [
-    source 1507
-    target 1616
-    weight 358
-  ]
-  edge [
-    source 1507
-    target 3642
-    weight 110
-  ]
-  edge [
-    source 1507
-    target 2191
-    weight 63
-  ]
-  edge [
-    source 1507
-    target 2543
-    weight 66
-  ]
-  edge [
-    source 1507
-    target 1887
-    weight 281
-  ]
-  edge [
-    source 1507
-    target 3066
-    weight 83
-  ]
-  edge [
-    source 1507
-    target 3141
-    weight 295
-  ]
-  edge [
-    source 1507
-    target 3443
-    weight 65
-  ]
-  edge [
-    source 1507
-    target 2857
-    weight 99
-  ]
-  edge [
-    source 1507
-    target 3600
-    weight 169
-  ]
-  edge [
-    source 1507
-    target 4051
-    weight 307
-  ]
-  edge [
-    source 1507
-    target 2700
-    weight 170
-  ]
-  edge [
-    source 1507
-    target 3565
-    weight 56
-  ]
-  edge [
-    source 1507
-    target 3006
-    weight 100
-  ]
-  edge [
-    source 1507
-    target 1647
-    weight 125
-  ]
-  edge [
-    source 1507
-    target 4154
-    weight 113
-  ]
-  edge [
-    source 1507
-    target 3542
-    weight 94
-  ]
-  edge [
-    source 1507
-    target 3374
-    weight 80
-  ]
-  edge [
-    source 1507
-    target 2071
-    weight 290
-  ]
-  edge [
-    source 1507
-    target 3145
-    weight 215
-  ]
-  edge [
-    source 1507
-    target 3253
-    weight 59
-  ]
-  edge [
-    source 1507
-    target 3174
-    weight 192
-  ]
-  edge [
-    source 1507
-    target 1995
-    weight 194
-  ]
-  edge [
-    source 1507
-    target 3295
-    weight 44
-  ]
-  edge [
-    source 1507
-    target 4162
-    weight 44
-  ]
-  edge [
-    source 1507
-    target 2800
-    weight 44
-  ]
-  edge [
-    source 1507
-    target 2531
-    weight 33
-  ]
-  edge [
-    source 1507
-    target 3423
-    weight 105
-  ]
-  edge [
-    source 1507
-    target 3276
-    weight 170
-  ]
-  edge [
-    source 1507
-    target 1632
-    weight 134
-  ]
-  edge [
-    source 1507
-    target 3282
-    weight 89
-  ]
-  edge [
-    source 1507
-    target 1757
-    weight 47
-  ]
-  edge [
-    source 1507
-    target 3420
-    weight 55
-  ]
-  edge [
-    source 1507
-    target 2204
-    weight 56
-  ]
-  edge [
-    source 1507
-    target 2287
-    weight 73
-  ]
-  edge [
-    source 1507
-    target 3993
-    weight 147
-  ]
-  edge [
-    source 1507
-    target 3377
-    weight 22
-  ]
-  edge [
-    source 1507
-    target 3636
-    weight 60
-  ]
-  edge [
-    source 1507
-    target 4040
-    weight 28
-  ]
-  edge [
-    source 1507
-    target 3954
-    weight 114
-  ]
-  edge [
-    source 1507
-    target 2890
-    weight 62
-  ]
-  edge [
-    source 1507
-    target 2058
-    weight 53
-  ]
-  edge [
-    source 1507
-    target 1582
-    weight 130
-  ]
-  edge [
-    source 1507
-    target 2870
-    weight 68
-  ]
-  edge [
-    source 1507
-    target 2519
-    weight 91
-  ]
-  edge [
-    source 1507
-    target 3917
-    weight 122
-  ]
-  edge [
-    source 1507
-    target 3040
-    weight 85
-  ]
-  edge [
-    source 1507
-    target 1517
-    weight 29
-  ]
-  edge [
-    source 1507
-    target 1707
-    weight 27
-  ]
-  edge [
-    source 1507
-    target 3052
-    weight 45
-  ]
-  edge [
-    source 1507
-    target 3077
-    weight 24
-  ]
-  edge [
-    source 1507
-    target 1523
-    weight 28
-  ]
-  edge [
-    source 1507
-    target 3877
-    weight 22
-  ]
-  edge [
-    source 1507
-    target 3962
-    weight 48
-  ]
-  edge [
-    source 1507
-    target 2810
-    weight 27
-  ]
-  edge [
-    source 1507
-    target 1938
-    weight 34
-  ]
-  edge [
-    source 1507
-    target 2553
-    weight 42
-  ]
-  edge [
-    source 1507
-    target 3937
-    weight 23
-  ]
-  edge [
-    source 1517
-    target 2861
-    weight 140
-  ]
-  edge [
-    source 1517
-    target 1616
-    weight 156
-  ]
-  edge [
-    source 1517
-    target 1647
-    weight 56
-  ]
-  edge [
-    source 1517
-    target 2071
-    weight 145
-  ]
-  edge [
-    source 1517
-    target 1995
-    weight 80
-  ]
-  edge [
-    source 1517
-    target 1887
-    weight 130
-  ]
-  edge [
-    source 1517
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 1517
-    target 1632
-    weight 51
-  ]
-  edge [
-    source 1517
-    target 3006
-    weight 34
-  ]
-  edge [
-    source 1517
-    target 2519
-    weight 35
-  ]
-  edge [
-    source 1517
-    target 3141
-    weight 133
-  ]
-  edge [
-    source 1517
-    target 3993
-    weight 57
-  ]
-  edge [
-    source 1517
-    target 3521
-    weight 160
-  ]
-  edge [
-    source 1517
-    target 3066
-    weight 32
-  ]
-  edge [
-    source 1517
-    target 2543
-    weight 32
-  ]
-  edge [
-    source 1517
-    target 4051
-    weight 147
-  ]
-  edge [
-    source 1517
-    target 3276
-    weight 58
-  ]
-  edge [
-    source 1517
-    target 3917
-    weight 52
-  ]
-  edge [
-    source 1517
-    target 3174
-    weight 67
-  ]
-  edge [
-    source 1517
-    target 3145
-    weight 86
-  ]
-  edge [
-    source 1517
-    target 3040
-    weight 49
-  ]
-  edge [
-    source 1517
-    target 3642
-    weight 49
-  ]
-  edge [
-    source 1517
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 1517
-    target 2700
-    weight 61
-  ]
-  edge [
-    source 1517
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 1517
-    target 3052
-    weight 26
-  ]
-  edge [
-    source 1517
-    target 3600
-    weight 73
-  ]
-  edge [
-    source 1517
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 1517
-    target 3253
-    weight 24
-  ]
-  edge [
-    source 1517
-    target 3954
-    weight 44
-  ]
-  edge [
-    source 1517
-    target 2287
-    weight 35
-  ]
-  edge [
-    source 1517
-    target 2890
-    weight 30
-  ]
-  edge [
-    source 1517
-    target 3282
-    weight 37
-  ]
-  edge [
-    source 1517
-    target 1582
-    weight 63
-  ]
-  edge [
-    source 1517
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 1517
-    target 2857
-    weight 39
-  ]
-  edge [
-    source 1517
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 1517
-    target 3374
-    weight 30
-  ]
-  edge [
-    source 1517
-    target 3423
-    weight 29
-  ]
-  edge [
-    source 1523
-    target 3521
-    weight 322
-  ]
-  edge [
-    source 1523
-    target 2861
-    weight 229
-  ]
-  edge [
-    source 1523
-    target 3141
-    weight 288
-  ]
-  edge [
-    source 1523
-    target 1887
-    weight 280
-  ]
-  edge [
-    source 1523
-    target 3993
-    weight 148
-  ]
-  edge [
-    source 1523
-    target 2071
-    weight 263
-  ]
-  edge [
-    source 1523
-    target 4051
-    weight 278
-  ]
-  edge [
-    source 1523
-    target 3145
-    weight 200
-  ]
-  edge [
-    source 1523
-    target 1616
-    weight 300
-  ]
-  edge [
-    source 1523
-    target 1582
-    weight 156
-  ]
-  edge [
-    source 1523
-    target 2857
-    weight 103
-  ]
-  edge [
-    source 1523
-    target 1995
-    weight 155
-  ]
-  edge [
-    source 1523
-    target 3253
-    weight 91
-  ]
-  edge [
-    source 1523
-    target 3642
-    weight 113
-  ]
-  edge [
-    source 1523
-    target 3174
-    weight 192
-  ]
-  edge [
-    source 1523
-    target 3565
-    weight 61
-  ]
-  edge [
-    source 1523
-    target 3917
-    weight 116
-  ]
-  edge [
-    source 1523
-    target 2870
-    weight 82
-  ]
-  edge [
-    source 1523
-    target 3542
-    weight 119
-  ]
-  edge [
-    source 1523
-    target 2890
-    weight 74
-  ]
-  edge [
-    source 1523
-    target 2700
-    weight 153
-  ]
-  edge [
-    source 1523
-    target 3282
-    weight 94
-  ]
-  edge [
-    source 1523
-    target 4154
-    weight 75
-  ]
-  edge [
-    source 1523
-    target 2800
-    weight 31
-  ]
-  edge [
-    source 1523
-    target 1938
-    weight 45
-  ]
-  edge [
-    source 1523
-    target 3006
-    weight 65
-  ]
-  edge [
-    source 1523
-    target 3040
-    weight 78
-  ]
-  edge [
-    source 1523
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 1523
-    target 3600
-    weight 179
-  ]
-  edge [
-    source 1523
-    target 1647
-    weight 140
-  ]
-  edge [
-    source 1523
-    target 3276
-    weight 158
-  ]
-  edge [
-    source 1523
-    target 2204
-    weight 55
-  ]
-  edge [
-    source 1523
-    target 1632
-    weight 125
-  ]
-  edge [
-    source 1523
-    target 2543
-    weight 70
-  ]
-  edge [
-    source 1523
-    target 3636
-    weight 60
-  ]
-  edge [
-    source 1523
-    target 3052
-    weight 45
-  ]
-  edge [
-    source 1523
-    target 2519
-    weight 88
-  ]
-  edge [
-    source 1523
-    target 3937
-    weight 21
-  ]
-  edge [
-    source 1523
-    target 1757
-    weight 39
-  ]
-  edge [
-    source 1523
-    target 3423
-    weight 71
-  ]
-  edge [
-    source 1523
-    target 3954
-    weight 75
-  ]
-  edge [
-    source 1523
-    target 3443
-    weight 68
-  ]
-  edge [
-    source 1523
-    target 2191
-    weight 58
-  ]
-  edge [
-    source 1523
-    target 3196
-    weight 33
-  ]
-  edge [
-    source 1523
-    target 3295
-    weight 62
-  ]
-  edge [
-    source 1523
-    target 1707
-    weight 30
-  ]
-  edge [
-    source 1523
-    target 3847
-    weight 29
-  ]
-  edge [
-    source 1523
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1523
-    target 2553
-    weight 52
-  ]
-  edge [
-    source 1523
-    target 4040
-    weight 22
-  ]
-  edge [
-    source 1523
-    target 3962
-    weight 45
-  ]
-  edge [
-    source 1523
-    target 2287
-    weight 58
-  ]
-  edge [
-    source 1523
-    target 3066
-    weight 60
-  ]
-  edge [
-    source 1523
-    target 2058
-    weight 44
-  ]
-  edge [
-    source 1523
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 1523
-    target 3374
-    weight 62
-  ]
-  edge [
-    source 1523
-    target 3877
-    weight 23
-  ]
-  edge [
-    source 1528
-    target 3145
-    weight 28
-  ]
-  edge [
-    source 1528
-    target 1616
-    weight 45
-  ]
-  edge [
-    source 1528
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 1528
-    target 2071
-    weight 50
-  ]
-  edge [
-    source 1528
-    target 2700
-    weight 23
-  ]
-  edge [
-    source 1528
-    target 3276
-    weight 33
-  ]
-  edge [
-    source 1528
-    target 4051
-    weight 45
-  ]
-  edge [
-    source 1528
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 1528
-    target 1887
-    weight 43
-  ]
-  edge [
-    source 1528
-    target 3600
-    weight 34
-  ]
-  edge [
-    source 1528
-    target 2861
-    weight 26
-  ]
-  edge [
-    source 1528
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1528
-    target 1647
-    weight 24
-  ]
-  edge [
-    source 1528
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 1543
-    target 1616
-    weight 26
-  ]
-  edge [
-    source 1543
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 1543
-    target 2861
-    weight 27
-  ]
-  edge [
-    source 1543
-    target 1887
-    weight 29
-  ]
-  edge [
-    source 1543
-    target 2071
-    weight 34
-  ]
-  edge [
-    source 1543
-    target 4051
-    weight 28
-  ]
-  edge [
-    source 1543
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 1554
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 1554
-    target 3521
-    weight 64
-  ]
-  edge [
-    source 1554
-    target 2071
-    weight 43
-  ]
-  edge [
-    source 1554
-    target 2861
-    weight 33
-  ]
-  edge [
-    source 1554
-    target 1616
-    weight 46
-  ]
-  edge [
-    source 1554
-    target 1887
-    weight 42
-  ]
-  edge [
-    source 1554
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 1554
-    target 3141
-    weight 41
-  ]
-  edge [
-    source 1554
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1554
-    target 1582
-    weight 22
-  ]
-  edge [
-    source 1554
-    target 3600
-    weight 22
-  ]
-  edge [
-    source 1554
-    target 3145
-    weight 21
-  ]
-  edge [
-    source 1577
-    target 1995
-    weight 48
-  ]
-  edge [
-    source 1577
-    target 2861
-    weight 50
-  ]
-  edge [
-    source 1577
-    target 3521
-    weight 62
-  ]
-  edge [
-    source 1577
-    target 1647
-    weight 30
-  ]
-  edge [
-    source 1577
-    target 1616
-    weight 53
-  ]
-  edge [
-    source 1577
-    target 1887
-    weight 50
-  ]
-  edge [
-    source 1577
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 1577
-    target 2071
-    weight 55
-  ]
-  edge [
-    source 1577
-    target 3636
-    weight 25
-  ]
-  edge [
-    source 1577
-    target 1632
-    weight 26
-  ]
-  edge [
-    source 1577
-    target 3642
-    weight 24
-  ]
-  edge [
-    source 1577
-    target 3040
-    weight 24
-  ]
-  edge [
-    source 1577
-    target 4051
-    weight 55
-  ]
-  edge [
-    source 1577
-    target 3145
-    weight 35
-  ]
-  edge [
-    source 1577
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 1577
-    target 3141
-    weight 49
-  ]
-  edge [
-    source 1577
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1577
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 1577
-    target 1582
-    weight 29
-  ]
-  edge [
-    source 1577
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 1577
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 3521
-    weight 5207
-  ]
-  edge [
-    source 1582
-    target 1616
-    weight 4378
-  ]
-  edge [
-    source 1582
-    target 1647
-    weight 1533
-  ]
-  edge [
-    source 1582
-    target 3600
-    weight 2610
-  ]
-  edge [
-    source 1582
-    target 2861
-    weight 2993
-  ]
-  edge [
-    source 1582
-    target 3565
-    weight 779
-  ]
-  edge [
-    source 1582
-    target 3077
-    weight 158
-  ]
-  edge [
-    source 1582
-    target 2700
-    weight 1708
-  ]
-  edge [
-    source 1582
-    target 2857
-    weight 572
-  ]
-  edge [
-    source 1582
-    target 3993
-    weight 1398
-  ]
-  edge [
-    source 1582
-    target 3141
-    weight 4356
-  ]
-  edge [
-    source 1582
-    target 2191
-    weight 406
-  ]
-  edge [
-    source 1582
-    target 3071
-    weight 46
-  ]
-  edge [
-    source 1582
-    target 2071
-    weight 3814
-  ]
-  edge [
-    source 1582
-    target 3641
-    weight 53
-  ]
-  edge [
-    source 1582
-    target 2204
-    weight 270
-  ]
-  edge [
-    source 1582
-    target 3177
-    weight 98
-  ]
-  edge [
-    source 1582
-    target 1887
-    weight 4027
-  ]
-  edge [
-    source 1582
-    target 3542
-    weight 750
-  ]
-  edge [
-    source 1582
-    target 3917
-    weight 948
-  ]
-  edge [
-    source 1582
-    target 4051
-    weight 3806
-  ]
-  edge [
-    source 1582
-    target 3276
-    weight 1923
-  ]
-  edge [
-    source 1582
-    target 3282
-    weight 693
-  ]
-  edge [
-    source 1582
-    target 3443
-    weight 470
-  ]
-  edge [
-    source 1582
-    target 2181
-    weight 28
-  ]
-  edge [
-    source 1582
-    target 3145
-    weight 1841
-  ]
-  edge [
-    source 1582
-    target 1757
-    weight 291
-  ]
-  edge [
-    source 1582
-    target 2329
-    weight 53
-  ]
-  edge [
-    source 1582
-    target 1995
-    weight 1411
-  ]
-  edge [
-    source 1582
-    target 2227
-    weight 64
-  ]
-  edge [
-    source 1582
-    target 2058
-    weight 387
-  ]
-  edge [
-    source 1582
-    target 2519
-    weight 610
-  ]
-  edge [
-    source 1582
-    target 2543
-    weight 241
-  ]
-  edge [
-    source 1582
-    target 4027
-    weight 42
-  ]
-  edge [
-    source 1582
-    target 3377
-    weight 82
-  ]
-  edge [
-    source 1582
-    target 3642
-    weight 1133
-  ]
-  edge [
-    source 1582
-    target 3374
-    weight 410
-  ]
-  edge [
-    source 1582
-    target 3985
-    weight 27
-  ]
-  edge [
-    source 1582
-    target 3174
-    weight 1784
-  ]
-  edge [
-    source 1582
-    target 3636
-    weight 355
-  ]
-  edge [
-    source 1582
-    target 3954
-    weight 392
-  ]
-  edge [
-    source 1582
-    target 1938
-    weight 256
-  ]
-  edge [
-    source 1582
-    target 3847
-    weight 165
-  ]
-  edge [
-    source 1582
-    target 3420
-    weight 282
-  ]
-  edge [
-    source 1582
-    target 2374
-    weight 29
-  ]
-  edge [
-    source 1582
-    target 2890
-    weight 555
-  ]
-  edge [
-    source 1582
-    target 3040
-    weight 382
-  ]
-  edge [
-    source 1582
-    target 4154
-    weight 575
-  ]
-  edge [
-    source 1582
-    target 1632
-    weight 783
-  ]
-  edge [
-    source 1582
-    target 3937
-    weight 125
-  ]
-  edge [
-    source 1582
-    target 3423
-    weight 730
-  ]
-  edge [
-    source 1582
-    target 3253
-    weight 299
-  ]
-  edge [
-    source 1582
-    target 3050
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 4040
-    weight 106
-  ]
-  edge [
-    source 1582
-    target 3052
-    weight 160
-  ]
-  edge [
-    source 1582
-    target 2553
-    weight 178
-  ]
-  edge [
-    source 1582
-    target 2870
-    weight 447
-  ]
-  edge [
-    source 1582
-    target 3066
-    weight 307
-  ]
-  edge [
-    source 1582
-    target 3295
-    weight 211
-  ]
-  edge [
-    source 1582
-    target 3006
-    weight 264
-  ]
-  edge [
-    source 1582
-    target 3884
-    weight 61
-  ]
-  edge [
-    source 1582
-    target 2287
-    weight 340
-  ]
-  edge [
-    source 1582
-    target 3962
-    weight 352
-  ]
-  edge [
-    source 1582
-    target 2844
-    weight 22
-  ]
-  edge [
-    source 1582
-    target 2800
-    weight 163
-  ]
-  edge [
-    source 1582
-    target 2262
-    weight 23
-  ]
-  edge [
-    source 1582
-    target 2531
-    weight 30
-  ]
-  edge [
-    source 1582
-    target 3432
-    weight 47
-  ]
-  edge [
-    source 1582
-    target 3162
-    weight 42
-  ]
-  edge [
-    source 1582
-    target 3877
-    weight 121
-  ]
-  edge [
-    source 1582
-    target 3196
-    weight 39
-  ]
-  edge [
-    source 1582
-    target 3935
-    weight 26
-  ]
-  edge [
-    source 1582
-    target 1707
-    weight 78
-  ]
-  edge [
-    source 1582
-    target 2450
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 2955
-    weight 29
-  ]
-  edge [
-    source 1582
-    target 2570
-    weight 40
-  ]
-  edge [
-    source 1582
-    target 3024
-    weight 39
-  ]
-  edge [
-    source 1582
-    target 3952
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 1631
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 4152
-    weight 59
-  ]
-  edge [
-    source 1582
-    target 4160
-    weight 30
-  ]
-  edge [
-    source 1582
-    target 4162
-    weight 178
-  ]
-  edge [
-    source 1582
-    target 3968
-    weight 50
-  ]
-  edge [
-    source 1582
-    target 1952
-    weight 75
-  ]
-  edge [
-    source 1582
-    target 2082
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 3510
-    weight 23
-  ]
-  edge [
-    source 1582
-    target 3860
-    weight 45
-  ]
-  edge [
-    source 1582
-    target 2614
-    weight 80
-  ]
-  edge [
-    source 1582
-    target 1931
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 2711
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 3108
-    weight 27
-  ]
-  edge [
-    source 1582
-    target 3861
-    weight 31
-  ]
-  edge [
-    source 1582
-    target 1798
-    weight 40
-  ]
-  edge [
-    source 1582
-    target 1691
-    weight 22
-  ]
-  edge [
-    source 1582
-    target 4187
-    weight 58
-  ]
-  edge [
-    source 1582
-    target 3677
-    weight 51
-  ]
-  edge [
-    source 1582
-    target 1802
-    weight 59
-  ]
-  edge [
-    source 1582
-    target 2822
-    weight 46
-  ]
-  edge [
-    source 1582
-    target 3872
-    weight 33
-  ]
-  edge [
-    source 1582
-    target 1766
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 2924
-    weight 39
-  ]
-  edge [
-    source 1582
-    target 3440
-    weight 21
-  ]
-  edge [
-    source 1582
-    target 2810
-    weight 96
-  ]
-  edge [
-    source 1582
-    target 1789
-    weight 40
-  ]
-  edge [
-    source 1582
-    target 4098
-    weight 32
-  ]
-  edge [
-    source 1582
-    target 3357
-    weight 32
-  ]
-  edge [
-    source 1582
-    target 2573
-    weight 21
-  ]
-  edge [
-    source 1582
-    target 1943
-    weight 66
-  ]
-  edge [
-    source 1582
-    target 1970
-    weight 67
-  ]
-  edge [
-    source 1582
-    target 2003
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 2011
-    weight 53
-  ]
-  edge [
-    source 1582
-    target 3633
-    weight 38
-  ]
-  edge [
-    source 1582
-    target 3408
-    weight 100
-  ]
-  edge [
-    source 1582
-    target 2099
-    weight 57
-  ]
-  edge [
-    source 1582
-    target 2061
-    weight 28
-  ]
-  edge [
-    source 1582
-    target 2556
-    weight 35
-  ]
-  edge [
-    source 1582
-    target 2232
-    weight 24
-  ]
-  edge [
-    source 1582
-    target 2597
-    weight 36
-  ]
-  edge [
-    source 1582
-    target 2743
-    weight 25
-  ]
-  edge [
-    source 1582
-    target 2078
-    weight 95
-  ]
-  edge [
-    source 1582
-    target 3876
-    weight 21
-  ]
-  edge [
-    source 1616
-    target 3521
-    weight 27580
-  ]
-  edge [
-    source 1616
-    target 3565
-    weight 2192
-  ]
-  edge [
-    source 1616
-    target 2861
-    weight 11961
-  ]
-  edge [
-    source 1616
-    target 1647
-    weight 3750
-  ]
-  edge [
-    source 1616
-    target 3600
-    weight 7211
-  ]
-  edge [
-    source 1616
-    target 2191
-    weight 1037
-  ]
-  edge [
-    source 1616
-    target 2421
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3642
-    weight 3660
-  ]
-  edge [
-    source 1616
-    target 3641
-    weight 105
-  ]
-  edge [
-    source 1616
-    target 1789
-    weight 127
-  ]
-  edge [
-    source 1616
-    target 3374
-    weight 1059
-  ]
-  edge [
-    source 1616
-    target 3276
-    weight 4843
-  ]
-  edge [
-    source 1616
-    target 4051
-    weight 15364
-  ]
-  edge [
-    source 1616
-    target 2058
-    weight 770
-  ]
-  edge [
-    source 1616
-    target 3423
-    weight 1886
-  ]
-  edge [
-    source 1616
-    target 3077
-    weight 476
-  ]
-  edge [
-    source 1616
-    target 3443
-    weight 906
-  ]
-  edge [
-    source 1616
-    target 3420
-    weight 537
-  ]
-  edge [
-    source 1616
-    target 3917
-    weight 1887
-  ]
-  edge [
-    source 1616
-    target 3071
-    weight 79
-  ]
-  edge [
-    source 1616
-    target 1769
-    weight 21
-  ]
-  edge [
-    source 1616
-    target 2071
-    weight 14155
-  ]
-  edge [
-    source 1616
-    target 2181
-    weight 50
-  ]
-  edge [
-    source 1616
-    target 3968
-    weight 122
-  ]
-  edge [
-    source 1616
-    target 2628
-    weight 24
-  ]
-  edge [
-    source 1616
-    target 3962
-    weight 865
-  ]
-  edge [
-    source 1616
-    target 3024
-    weight 85
-  ]
-  edge [
-    source 1616
-    target 2227
-    weight 247
-  ]
-  edge [
-    source 1616
-    target 1952
-    weight 137
-  ]
-  edge [
-    source 1616
-    target 3377
-    weight 229
-  ]
-  edge [
-    source 1616
-    target 3177
-    weight 173
-  ]
-  edge [
-    source 1616
-    target 3861
-    weight 67
-  ]
-  edge [
-    source 1616
-    target 2329
-    weight 121
-  ]
-  edge [
-    source 1616
-    target 3993
-    weight 3363
-  ]
-  edge [
-    source 1616
-    target 3542
-    weight 1148
-  ]
-  edge [
-    source 1616
-    target 3066
-    weight 737
-  ]
-  edge [
-    source 1616
-    target 2700
-    weight 4099
-  ]
-  edge [
-    source 1616
-    target 3937
-    weight 229
-  ]
-  edge [
-    source 1616
-    target 3174
-    weight 5678
-  ]
-  edge [
-    source 1616
-    target 2978
-    weight 35
-  ]
-  edge [
-    source 1616
-    target 2857
-    weight 1192
-  ]
-  edge [
-    source 1616
-    target 1995
-    weight 4255
-  ]
-  edge [
-    source 1616
-    target 3752
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3141
-    weight 16049
-  ]
-  edge [
-    source 1616
-    target 3145
-    weight 4500
-  ]
-  edge [
-    source 1616
-    target 3432
-    weight 99
-  ]
-  edge [
-    source 1616
-    target 3112
-    weight 32
-  ]
-  edge [
-    source 1616
-    target 1887
-    weight 14580
-  ]
-  edge [
-    source 1616
-    target 1943
-    weight 140
-  ]
-  edge [
-    source 1616
-    target 2543
-    weight 634
-  ]
-  edge [
-    source 1616
-    target 4187
-    weight 139
-  ]
-  edge [
-    source 1616
-    target 3357
-    weight 78
-  ]
-  edge [
-    source 1616
-    target 1757
-    weight 650
-  ]
-  edge [
-    source 1616
-    target 2614
-    weight 148
-  ]
-  edge [
-    source 1616
-    target 3985
-    weight 74
-  ]
-  edge [
-    source 1616
-    target 3282
-    weight 1354
-  ]
-  edge [
-    source 1616
-    target 2870
-    weight 897
-  ]
-  edge [
-    source 1616
-    target 2810
-    weight 199
-  ]
-  edge [
-    source 1616
-    target 2800
-    weight 318
-  ]
-  edge [
-    source 1616
-    target 1631
-    weight 40
-  ]
-  edge [
-    source 1616
-    target 3253
-    weight 554
-  ]
-  edge [
-    source 1616
-    target 4027
-    weight 101
-  ]
-  edge [
-    source 1616
-    target 1931
-    weight 66
-  ]
-  edge [
-    source 1616
-    target 1632
-    weight 2020
-  ]
-  edge [
-    source 1616
-    target 3636
-    weight 778
-  ]
-  edge [
-    source 1616
-    target 2573
-    weight 51
-  ]
-  edge [
-    source 1616
-    target 4152
-    weight 100
-  ]
-  edge [
-    source 1616
-    target 3954
-    weight 969
-  ]
-  edge [
-    source 1616
-    target 2204
-    weight 580
-  ]
-  edge [
-    source 1616
-    target 2230
-    weight 23
-  ]
-  edge [
-    source 1616
-    target 2924
-    weight 59
-  ]
-  edge [
-    source 1616
-    target 2054
-    weight 61
-  ]
-  edge [
-    source 1616
-    target 2519
-    weight 1230
-  ]
-  edge [
-    source 1616
-    target 1938
-    weight 328
-  ]
-  edge [
-    source 1616
-    target 2597
-    weight 90
-  ]
-  edge [
-    source 1616
-    target 2198
-    weight 43
-  ]
-  edge [
-    source 1616
-    target 3693
-    weight 53
-  ]
-  edge [
-    source 1616
-    target 2287
-    weight 776
-  ]
-  edge [
-    source 1616
-    target 3295
-    weight 553
-  ]
-  edge [
-    source 1616
-    target 2232
-    weight 57
-  ]
-  edge [
-    source 1616
-    target 3146
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 3006
-    weight 763
-  ]
-  edge [
-    source 1616
-    target 2082
-    weight 52
-  ]
-  edge [
-    source 1616
-    target 3040
-    weight 1012
-  ]
-  edge [
-    source 1616
-    target 2890
-    weight 1139
-  ]
-  edge [
-    source 1616
-    target 3559
-    weight 44
-  ]
-  edge [
-    source 1616
-    target 3052
-    weight 327
-  ]
-  edge [
-    source 1616
-    target 4098
-    weight 91
-  ]
-  edge [
-    source 1616
-    target 1691
-    weight 48
-  ]
-  edge [
-    source 1616
-    target 4040
-    weight 243
-  ]
-  edge [
-    source 1616
-    target 2531
-    weight 97
-  ]
-  edge [
-    source 1616
-    target 3884
-    weight 127
-  ]
-  edge [
-    source 1616
-    target 2743
-    weight 57
-  ]
-  edge [
-    source 1616
-    target 2003
-    weight 121
-  ]
-  edge [
-    source 1616
-    target 3935
-    weight 66
-  ]
-  edge [
-    source 1616
-    target 4154
-    weight 1248
-  ]
-  edge [
-    source 1616
-    target 1707
-    weight 185
-  ]
-  edge [
-    source 1616
-    target 2009
-    weight 36
-  ]
-  edge [
-    source 1616
-    target 4160
-    weight 98
-  ]
-  edge [
-    source 1616
-    target 3847
-    weight 281
-  ]
-  edge [
-    source 1616
-    target 1766
-    weight 61
-  ]
-  edge [
-    source 1616
-    target 2553
-    weight 346
-  ]
-  edge [
-    source 1616
-    target 4007
-    weight 41
-  ]
-  edge [
-    source 1616
-    target 2726
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 1856
-    weight 29
-  ]
-  edge [
-    source 1616
-    target 2450
-    weight 42
-  ]
-  edge [
-    source 1616
-    target 2832
-    weight 38
-  ]
-  edge [
-    source 1616
-    target 2061
-    weight 61
-  ]
-  edge [
-    source 1616
-    target 2570
-    weight 75
-  ]
-  edge [
-    source 1616
-    target 1775
-    weight 24
-  ]
-  edge [
-    source 1616
-    target 3663
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 2556
-    weight 70
-  ]
-  edge [
-    source 1616
-    target 4100
-    weight 37
-  ]
-  edge [
-    source 1616
-    target 3860
-    weight 83
-  ]
-  edge [
-    source 1616
-    target 3050
-    weight 59
-  ]
-  edge [
-    source 1616
-    target 2600
-    weight 27
-  ]
-  edge [
-    source 1616
-    target 2953
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3196
-    weight 102
-  ]
-  edge [
-    source 1616
-    target 2652
-    weight 23
-  ]
-  edge [
-    source 1616
-    target 1798
-    weight 73
-  ]
-  edge [
-    source 1616
-    target 2801
-    weight 31
-  ]
-  edge [
-    source 1616
-    target 4162
-    weight 392
-  ]
-  edge [
-    source 1616
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 1616
-    target 3408
-    weight 275
-  ]
-  edge [
-    source 1616
-    target 2011
-    weight 125
-  ]
-  edge [
-    source 1616
-    target 2955
-    weight 65
-  ]
-  edge [
-    source 1616
-    target 2711
-    weight 93
-  ]
-  edge [
-    source 1616
-    target 3375
-    weight 27
-  ]
-  edge [
-    source 1616
-    target 2609
-    weight 39
-  ]
-  edge [
-    source 1616
-    target 1676
-    weight 37
-  ]
-  edge [
-    source 1616
-    target 3952
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3462
-    weight 57
-  ]
-  edge [
-    source 1616
-    target 3162
-    weight 83
-  ]
-  edge [
-    source 1616
-    target 3956
-    weight 53
-  ]
-  edge [
-    source 1616
-    target 2844
-    weight 58
-  ]
-  edge [
-    source 1616
-    target 1664
-    weight 25
-  ]
-  edge [
-    source 1616
-    target 2434
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 3877
-    weight 261
-  ]
-  edge [
-    source 1616
-    target 2836
-    weight 34
-  ]
-  edge [
-    source 1616
-    target 3324
-    weight 31
-  ]
-  edge [
-    source 1616
-    target 1802
-    weight 102
-  ]
-  edge [
-    source 1616
-    target 3309
-    weight 26
-  ]
-  edge [
-    source 1616
-    target 3108
-    weight 40
-  ]
-  edge [
-    source 1616
-    target 2115
-    weight 38
-  ]
-  edge [
-    source 1616
-    target 3465
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 3074
-    weight 21
-  ]
-  edge [
-    source 1616
-    target 2983
-    weight 34
-  ]
-  edge [
-    source 1616
-    target 1832
-    weight 47
-  ]
-  edge [
-    source 1616
-    target 3692
-    weight 27
-  ]
-  edge [
-    source 1616
-    target 1922
-    weight 30
-  ]
-  edge [
-    source 1616
-    target 1634
-    weight 33
-  ]
-  edge [
-    source 1616
-    target 2997
-    weight 22
-  ]
-  edge [
-    source 1616
-    target 3011
-    weight 32
-  ]
-  edge [
-    source 1616
-    target 2099
-    weight 128
-  ]
-  edge [
-    source 1616
-    target 3677
-    weight 77
-  ]
-  edge [
-    source 1616
-    target 3856
-    weight 28
-  ]
-  edge [
-    source 1616
-    target 2822
-    weight 87
-  ]
-  edge [
-    source 1616
-    target 3872
-    weight 53
-  ]
-  edge [
-    source 1616
-    target 3440
-    weight 36
-  ]
-  edge [
-    source 1616
-    target 2634
-    weight 30
-  ]
-  edge [
-    source 1616
-    target 3737
-    weight 42
-  ]
-  edge [
-    source 1616
-    target 1970
-    weight 145
-  ]
-  edge [
-    source 1616
-    target 1900
-    weight 31
-  ]
-  edge [
-    source 1616
-    target 3633
-    weight 63
-  ]
-  edge [
-    source 1616
-    target 2078
-    weight 175
-  ]
-  edge [
-    source 1616
-    target 3876
-    weight 49
-  ]
-  edge [
-    source 1631
-    target 2861
-    weight 37
-  ]
-  edge [
-    source 1631
-    target 3282
-    weight 23
-  ]
-  edge [
-    source 1631
-    target 3141
-    weight 43
-  ]
-  edge [
-    source 1631
-    target 3521
-    weight 53
-  ]
-  edge [
-    source 1631
-    target 1647
-    weight 27
-  ]
-  edge [
-    source 1631
-    target 2071
-    weight 42
-  ]
-  edge [
-    source 1631
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 1631
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 1631
-    target 1887
-    weight 41
-  ]
-  edge [
-    source 1631
-    target 1995
-    weight 29
-  ]
-  edge [
-    source 1631
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 1631
-    target 3600
-    weight 31
-  ]
-  edge [
-    source 1631
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 1631
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 1631
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 1631
-    target 3917
-    weight 24
-  ]
-  edge [
-    source 1631
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 1632
-    target 2861
-    weight 1501
-  ]
-  edge [
-    source 1632
-    target 4051
-    weight 1801
-  ]
-  edge [
-    source 1632
-    target 3521
-    weight 2158
-  ]
-  edge [
-    source 1632
-    target 3565
-    weight 565
-  ]
-  edge [
-    source 1632
-    target 2181
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 2810
-    weight 112
-  ]
-  edge [
-    source 1632
-    target 2700
-    weight 1085
-  ]
-  edge [
-    source 1632
-    target 4027
-    weight 46
-  ]
-  edge [
-    source 1632
-    target 3636
-    weight 325
-  ]
-  edge [
-    source 1632
-    target 3420
-    weight 259
-  ]
-  edge [
-    source 1632
-    target 3276
-    weight 909
-  ]
-  edge [
-    source 1632
-    target 3600
-    weight 1074
-  ]
-  edge [
-    source 1632
-    target 3443
-    weight 325
-  ]
-  edge [
-    source 1632
-    target 3993
-    weight 860
-  ]
-  edge [
-    source 1632
-    target 2071
-    weight 1698
-  ]
-  edge [
-    source 1632
-    target 3377
-    weight 99
-  ]
-  edge [
-    source 1632
-    target 3642
-    weight 768
-  ]
-  edge [
-    source 1632
-    target 3145
-    weight 1124
-  ]
-  edge [
-    source 1632
-    target 3141
-    weight 1807
-  ]
-  edge [
-    source 1632
-    target 1647
-    weight 882
-  ]
-  edge [
-    source 1632
-    target 2800
-    weight 151
-  ]
-  edge [
-    source 1632
-    target 1995
-    weight 1060
-  ]
-  edge [
-    source 1632
-    target 3968
-    weight 43
-  ]
-  edge [
-    source 1632
-    target 3253
-    weight 216
-  ]
-  edge [
-    source 1632
-    target 3006
-    weight 384
-  ]
-  edge [
-    source 1632
-    target 2082
-    weight 30
-  ]
-  edge [
-    source 1632
-    target 2232
-    weight 28
-  ]
-  edge [
-    source 1632
-    target 3559
-    weight 21
-  ]
-  edge [
-    source 1632
-    target 3066
-    weight 357
-  ]
-  edge [
-    source 1632
-    target 3052
-    weight 137
-  ]
-  edge [
-    source 1632
-    target 2191
-    weight 237
-  ]
-  edge [
-    source 1632
-    target 1887
-    weight 1788
-  ]
-  edge [
-    source 1632
-    target 2543
-    weight 275
-  ]
-  edge [
-    source 1632
-    target 3954
-    weight 536
-  ]
-  edge [
-    source 1632
-    target 3295
-    weight 205
-  ]
-  edge [
-    source 1632
-    target 1707
-    weight 126
-  ]
-  edge [
-    source 1632
-    target 3282
-    weight 629
-  ]
-  edge [
-    source 1632
-    target 2870
-    weight 412
-  ]
-  edge [
-    source 1632
-    target 3847
-    weight 148
-  ]
-  edge [
-    source 1632
-    target 2329
-    weight 52
-  ]
-  edge [
-    source 1632
-    target 2570
-    weight 43
-  ]
-  edge [
-    source 1632
-    target 3985
-    weight 30
-  ]
-  edge [
-    source 1632
-    target 2287
-    weight 347
-  ]
-  edge [
-    source 1632
-    target 2890
-    weight 316
-  ]
-  edge [
-    source 1632
-    target 3937
-    weight 109
-  ]
-  edge [
-    source 1632
-    target 3423
-    weight 409
-  ]
-  edge [
-    source 1632
-    target 3174
-    weight 969
-  ]
-  edge [
-    source 1632
-    target 3917
-    weight 625
-  ]
-  edge [
-    source 1632
-    target 1757
-    weight 240
-  ]
-  edge [
-    source 1632
-    target 4160
-    weight 37
-  ]
-  edge [
-    source 1632
-    target 3641
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 3040
-    weight 465
-  ]
-  edge [
-    source 1632
-    target 2204
-    weight 247
-  ]
-  edge [
-    source 1632
-    target 4040
-    weight 90
-  ]
-  edge [
-    source 1632
-    target 2519
-    weight 462
-  ]
-  edge [
-    source 1632
-    target 4154
-    weight 369
-  ]
-  edge [
-    source 1632
-    target 2011
-    weight 46
-  ]
-  edge [
-    source 1632
-    target 3962
-    weight 239
-  ]
-  edge [
-    source 1632
-    target 1943
-    weight 72
-  ]
-  edge [
-    source 1632
-    target 2857
-    weight 483
-  ]
-  edge [
-    source 1632
-    target 2450
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 3542
-    weight 447
-  ]
-  edge [
-    source 1632
-    target 3884
-    weight 70
-  ]
-  edge [
-    source 1632
-    target 3956
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 4187
-    weight 36
-  ]
-  edge [
-    source 1632
-    target 3935
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 3196
-    weight 36
-  ]
-  edge [
-    source 1632
-    target 1938
-    weight 166
-  ]
-  edge [
-    source 1632
-    target 1766
-    weight 35
-  ]
-  edge [
-    source 1632
-    target 4162
-    weight 162
-  ]
-  edge [
-    source 1632
-    target 1856
-    weight 21
-  ]
-  edge [
-    source 1632
-    target 2743
-    weight 31
-  ]
-  edge [
-    source 1632
-    target 3374
-    weight 273
-  ]
-  edge [
-    source 1632
-    target 2614
-    weight 74
-  ]
-  edge [
-    source 1632
-    target 2573
-    weight 22
-  ]
-  edge [
-    source 1632
-    target 3408
-    weight 44
-  ]
-  edge [
-    source 1632
-    target 1952
-    weight 39
-  ]
-  edge [
-    source 1632
-    target 3071
-    weight 31
-  ]
-  edge [
-    source 1632
-    target 3162
-    weight 26
-  ]
-  edge [
-    source 1632
-    target 2531
-    weight 37
-  ]
-  edge [
-    source 1632
-    target 3860
-    weight 42
-  ]
-  edge [
-    source 1632
-    target 3177
-    weight 76
-  ]
-  edge [
-    source 1632
-    target 2061
-    weight 25
-  ]
-  edge [
-    source 1632
-    target 2054
-    weight 31
-  ]
-  edge [
-    source 1632
-    target 4098
-    weight 39
-  ]
-  edge [
-    source 1632
-    target 2711
-    weight 42
-  ]
-  edge [
-    source 1632
-    target 2553
-    weight 180
-  ]
-  edge [
-    source 1632
-    target 2003
-    weight 53
-  ]
-  edge [
-    source 1632
-    target 2058
-    weight 239
-  ]
-  edge [
-    source 1632
-    target 1798
-    weight 25
-  ]
-  edge [
-    source 1632
-    target 3677
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 1632
-    target 2924
-    weight 32
-  ]
-  edge [
-    source 1632
-    target 3432
-    weight 43
-  ]
-  edge [
-    source 1632
-    target 2099
-    weight 27
-  ]
-  edge [
-    source 1632
-    target 3077
-    weight 74
-  ]
-  edge [
-    source 1632
-    target 2227
-    weight 29
-  ]
-  edge [
-    source 1632
-    target 1634
-    weight 22
-  ]
-  edge [
-    source 1632
-    target 1970
-    weight 45
-  ]
-  edge [
-    source 1632
-    target 3877
-    weight 74
-  ]
-  edge [
-    source 1632
-    target 1802
-    weight 42
-  ]
-  edge [
-    source 1632
-    target 2556
-    weight 29
-  ]
-  edge [
-    source 1632
-    target 2822
-    weight 21
-  ]
-  edge [
-    source 1632
-    target 2078
-    weight 64
-  ]
-  edge [
-    source 1632
-    target 3876
-    weight 22
-  ]
-  edge [
-    source 1634
-    target 3954
-    weight 23
-  ]
-  edge [
-    source 1634
-    target 3521
-    weight 35
-  ]
-  edge [
-    source 1634
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 1634
-    target 3145
-    weight 25
-  ]
-  edge [
-    source 1634
-    target 2861
-    weight 28
-  ]
-  edge [
-    source 1634
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 1634
-    target 3141
-    weight 33
-  ]
-  edge [
-    source 1634
-    target 2071
-    weight 32
-  ]
-  edge [
-    source 1634
-    target 1887
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 3521
-    weight 4834
-  ]
-  edge [
-    source 1647
-    target 3600
-    weight 2769
-  ]
-  edge [
-    source 1647
-    target 2861
-    weight 3019
-  ]
-  edge [
-    source 1647
-    target 3565
-    weight 927
-  ]
-  edge [
-    source 1647
-    target 2191
-    weight 616
-  ]
-  edge [
-    source 1647
-    target 3641
-    weight 64
-  ]
-  edge [
-    source 1647
-    target 3642
-    weight 966
-  ]
-  edge [
-    source 1647
-    target 3937
-    weight 185
-  ]
-  edge [
-    source 1647
-    target 4187
-    weight 101
-  ]
-  edge [
-    source 1647
-    target 3276
-    weight 1773
-  ]
-  edge [
-    source 1647
-    target 3420
-    weight 325
-  ]
-  edge [
-    source 1647
-    target 3917
-    weight 961
-  ]
-  edge [
-    source 1647
-    target 3071
-    weight 54
-  ]
-  edge [
-    source 1647
-    target 1887
-    weight 3292
-  ]
-  edge [
-    source 1647
-    target 3962
-    weight 452
-  ]
-  edge [
-    source 1647
-    target 3443
-    weight 488
-  ]
-  edge [
-    source 1647
-    target 4051
-    weight 3305
-  ]
-  edge [
-    source 1647
-    target 1952
-    weight 82
-  ]
-  edge [
-    source 1647
-    target 3374
-    weight 474
-  ]
-  edge [
-    source 1647
-    target 3177
-    weight 120
-  ]
-  edge [
-    source 1647
-    target 3423
-    weight 921
-  ]
-  edge [
-    source 1647
-    target 2329
-    weight 60
-  ]
-  edge [
-    source 1647
-    target 3542
-    weight 531
-  ]
-  edge [
-    source 1647
-    target 3066
-    weight 330
-  ]
-  edge [
-    source 1647
-    target 2071
-    weight 3833
-  ]
-  edge [
-    source 1647
-    target 3968
-    weight 57
-  ]
-  edge [
-    source 1647
-    target 2857
-    weight 607
-  ]
-  edge [
-    source 1647
-    target 2700
-    weight 1653
-  ]
-  edge [
-    source 1647
-    target 2978
-    weight 30
-  ]
-  edge [
-    source 1647
-    target 3141
-    weight 3692
-  ]
-  edge [
-    source 1647
-    target 3993
-    weight 1861
-  ]
-  edge [
-    source 1647
-    target 3432
-    weight 56
-  ]
-  edge [
-    source 1647
-    target 1789
-    weight 47
-  ]
-  edge [
-    source 1647
-    target 3174
-    weight 1544
-  ]
-  edge [
-    source 1647
-    target 3985
-    weight 40
-  ]
-  edge [
-    source 1647
-    target 2058
-    weight 454
-  ]
-  edge [
-    source 1647
-    target 2227
-    weight 72
-  ]
-  edge [
-    source 1647
-    target 3282
-    weight 728
-  ]
-  edge [
-    source 1647
-    target 1995
-    weight 1686
-  ]
-  edge [
-    source 1647
-    target 2810
-    weight 148
-  ]
-  edge [
-    source 1647
-    target 2181
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 2870
-    weight 480
-  ]
-  edge [
-    source 1647
-    target 3636
-    weight 398
-  ]
-  edge [
-    source 1647
-    target 1931
-    weight 38
-  ]
-  edge [
-    source 1647
-    target 4152
-    weight 51
-  ]
-  edge [
-    source 1647
-    target 2800
-    weight 208
-  ]
-  edge [
-    source 1647
-    target 1757
-    weight 354
-  ]
-  edge [
-    source 1647
-    target 3145
-    weight 1739
-  ]
-  edge [
-    source 1647
-    target 3077
-    weight 186
-  ]
-  edge [
-    source 1647
-    target 3253
-    weight 251
-  ]
-  edge [
-    source 1647
-    target 1943
-    weight 95
-  ]
-  edge [
-    source 1647
-    target 3024
-    weight 49
-  ]
-  edge [
-    source 1647
-    target 2614
-    weight 81
-  ]
-  edge [
-    source 1647
-    target 3954
-    weight 407
-  ]
-  edge [
-    source 1647
-    target 2924
-    weight 35
-  ]
-  edge [
-    source 1647
-    target 2519
-    weight 595
-  ]
-  edge [
-    source 1647
-    target 2543
-    weight 247
-  ]
-  edge [
-    source 1647
-    target 4027
-    weight 51
-  ]
-  edge [
-    source 1647
-    target 3377
-    weight 95
-  ]
-  edge [
-    source 1647
-    target 2204
-    weight 309
-  ]
-  edge [
-    source 1647
-    target 2287
-    weight 435
-  ]
-  edge [
-    source 1647
-    target 4100
-    weight 24
-  ]
-  edge [
-    source 1647
-    target 2890
-    weight 547
-  ]
-  edge [
-    source 1647
-    target 3006
-    weight 309
-  ]
-  edge [
-    source 1647
-    target 3052
-    weight 151
-  ]
-  edge [
-    source 1647
-    target 3040
-    weight 496
-  ]
-  edge [
-    source 1647
-    target 2597
-    weight 37
-  ]
-  edge [
-    source 1647
-    target 2009
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 1938
-    weight 170
-  ]
-  edge [
-    source 1647
-    target 3935
-    weight 37
-  ]
-  edge [
-    source 1647
-    target 4154
-    weight 440
-  ]
-  edge [
-    source 1647
-    target 3884
-    weight 76
-  ]
-  edge [
-    source 1647
-    target 3847
-    weight 132
-  ]
-  edge [
-    source 1647
-    target 3295
-    weight 196
-  ]
-  edge [
-    source 1647
-    target 4007
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 1707
-    weight 85
-  ]
-  edge [
-    source 1647
-    target 3408
-    weight 107
-  ]
-  edge [
-    source 1647
-    target 2553
-    weight 197
-  ]
-  edge [
-    source 1647
-    target 4162
-    weight 159
-  ]
-  edge [
-    source 1647
-    target 2003
-    weight 38
-  ]
-  edge [
-    source 1647
-    target 2531
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 2556
-    weight 50
-  ]
-  edge [
-    source 1647
-    target 2082
-    weight 23
-  ]
-  edge [
-    source 1647
-    target 3861
-    weight 41
-  ]
-  edge [
-    source 1647
-    target 2570
-    weight 44
-  ]
-  edge [
-    source 1647
-    target 3860
-    weight 48
-  ]
-  edge [
-    source 1647
-    target 4160
-    weight 37
-  ]
-  edge [
-    source 1647
-    target 2011
-    weight 59
-  ]
-  edge [
-    source 1647
-    target 2711
-    weight 57
-  ]
-  edge [
-    source 1647
-    target 4040
-    weight 109
-  ]
-  edge [
-    source 1647
-    target 2054
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 2573
-    weight 22
-  ]
-  edge [
-    source 1647
-    target 4098
-    weight 47
-  ]
-  edge [
-    source 1647
-    target 1798
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 2061
-    weight 36
-  ]
-  edge [
-    source 1647
-    target 3050
-    weight 30
-  ]
-  edge [
-    source 1647
-    target 2955
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 3162
-    weight 40
-  ]
-  edge [
-    source 1647
-    target 1802
-    weight 57
-  ]
-  edge [
-    source 1647
-    target 1856
-    weight 21
-  ]
-  edge [
-    source 1647
-    target 3677
-    weight 42
-  ]
-  edge [
-    source 1647
-    target 2822
-    weight 32
-  ]
-  edge [
-    source 1647
-    target 3877
-    weight 125
-  ]
-  edge [
-    source 1647
-    target 3872
-    weight 32
-  ]
-  edge [
-    source 1647
-    target 2099
-    weight 50
-  ]
-  edge [
-    source 1647
-    target 2743
-    weight 25
-  ]
-  edge [
-    source 1647
-    target 2844
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 3440
-    weight 23
-  ]
-  edge [
-    source 1647
-    target 3108
-    weight 24
-  ]
-  edge [
-    source 1647
-    target 3737
-    weight 25
-  ]
-  edge [
-    source 1647
-    target 1766
-    weight 29
-  ]
-  edge [
-    source 1647
-    target 1970
-    weight 75
-  ]
-  edge [
-    source 1647
-    target 3633
-    weight 27
-  ]
-  edge [
-    source 1647
-    target 2078
-    weight 109
-  ]
-  edge [
-    source 1647
-    target 3196
-    weight 49
-  ]
-  edge [
-    source 1647
-    target 3876
-    weight 29
-  ]
-  edge [
-    source 1664
-    target 4051
-    weight 24
-  ]
-  edge [
-    source 1664
-    target 1887
-    weight 24
-  ]
-  edge [
-    source 1664
-    target 3141
-    weight 24
-  ]
-  edge [
-    source 1664
-    target 3521
-    weight 26
-  ]
-  edge [
-    source 1664
-    target 1995
-    weight 21
-  ]
-  edge [
-    source 1664
-    target 2071
-    weight 22
-  ]
-  edge [
-    source 1676
-    target 3521
-    weight 44
-  ]
-  edge [
-    source 1676
-    target 1887
-    weight 33
-  ]
-  edge [
-    source 1676
-    target 3145
-    weight 23
-  ]
-  edge [
-    source 1676
-    target 2861
-    weight 25
-  ]
-  edge [
-    source 1676
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 1676
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1676
-    target 3141
-    weight 37
-  ]
-  edge [
-    source 1676
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 1676
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 1691
-    target 2700
-    weight 24
-  ]
-  edge [
-    source 1691
-    target 3141
-    weight 45
-  ]
-  edge [
-    source 1691
-    target 2071
-    weight 45
-  ]
-  edge [
-    source 1691
-    target 3600
-    weight 29
-  ]
-  edge [
-    source 1691
-    target 1887
-    weight 47
-  ]
-  edge [
-    source 1691
-    target 2861
-    weight 34
-  ]
-  edge [
-    source 1691
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 1691
-    target 3521
-    weight 55
-  ]
-  edge [
-    source 1691
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 1691
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 1691
-    target 1995
-    weight 23
-  ]
-  edge [
-    source 1691
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 1707
-    target 2543
-    weight 57
-  ]
-  edge [
-    source 1707
-    target 4051
-    weight 170
-  ]
-  edge [
-    source 1707
-    target 3174
-    weight 95
-  ]
-  edge [
-    source 1707
-    target 3521
-    weight 189
-  ]
-  edge [
-    source 1707
-    target 1887
-    weight 168
-  ]
-  edge [
-    source 1707
-    target 3253
-    weight 48
-  ]
-  edge [
-    source 1707
-    target 3066
-    weight 71
-  ]
-  edge [
-    source 1707
-    target 2071
-    weight 165
-  ]
-  edge [
-    source 1707
-    target 3282
-    weight 79
-  ]
-  edge [
-    source 1707
-    target 3141
-    weight 168
-  ]
-  edge [
-    source 1707
-    target 3847
-    weight 22
-  ]
-  edge [
-    source 1707
-    target 3642
-    weight 98
-  ]
-  edge [
-    source 1707
-    target 2870
-    weight 56
-  ]
-  edge [
-    source 1707
-    target 2810
-    weight 22
-  ]
-  edge [
-    source 1707
-    target 2861
-    weight 159
-  ]
-  edge [
-    source 1707
-    target 3423
-    weight 38
-  ]
-  edge [
-    source 1707
-    target 3006
-    weight 82
-  ]
-  edge [
-    source 1707
-    target 3040
-    weight 71
-  ]
-  edge [
-    source 1707
-    target 3145
-    weight 129
-  ]
-  edge [
-    source 1707
-    target 1995
-    weight 123
-  ]
-  edge [
-    source 1707
-    target 3954
-    weight 86
-  ]
-  edge [
-    source 1707
-    target 3636
-    weight 65
-  ]
-  edge [
-    source 1707
-    target 3917
-    weight 81
-  ]
-  edge [
-    source 1707
-    target 2287
-    weight 64
-  ]
-  edge [
-    source 1707
-    target 3295
-    weight 30
-  ]
-  edge [
-    source 1707
-    target 3565
-    weight 52
-  ]
-  edge [
-    source 1707
-    target 2700
-    weight 112
-  ]
-  edge [
-    source 1707
-    target 2058
-    weight 33
-  ]
-  edge [
-    source 1707
-    target 3600
-    weight 102
-  ]
-  edge [
-    source 1707
-    target 1757
-    weight 46
-  ]
-  edge [
-    source 1707
-    target 2191
-    weight 39
-  ]
-  edge [
-    source 1707
-    target 3276
-    weight 86
-  ]
-  edge [
-    source 1707
-    target 2519
-    weight 62
-  ]
-  edge [
-    source 1707
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 1707
-    target 2553
-    weight 33
-  ]
-  edge [
-    source 1707
-    target 3052
-    weight 31
-  ]
-  edge [
-    source 1707
-    target 3443
-    weight 48
-  ]
-  edge [
-    source 1707
-    target 3937
-    weight 26
-  ]
-  edge [
-    source 1707
-    target 3420
-    weight 48
-  ]
-  edge [
-    source 1707
-    target 3993
-    weight 88
-  ]
-  edge [
-    source 1707
-    target 2204
-    weight 49
-  ]
-  edge [
-    source 1707
-    target 1938
-    weight 40
-  ]
-  edge [
-    source 1707
-    target 3374
-    weight 40
-  ]
-  edge [
-    source 1707
-    target 2890
-    weight 36
-  ]
-  edge [
-    source 1707
-    target 3542
-    weight 69
-  ]
-  edge [
-    source 1707
-    target 4154
-    weight 58
-  ]
-  edge [
-    source 1707
-    target 3377
-    weight 21
-  ]
-  edge [
-    source 1707
-    target 2857
-    weight 65
-  ]
-  edge [
-    source 1707
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1741
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3521
-    weight 789
-  ]
-  edge [
-    source 1757
-    target 2861
-    weight 467
-  ]
-  edge [
-    source 1757
-    target 3542
-    weight 173
-  ]
-  edge [
-    source 1757
-    target 3141
-    weight 638
-  ]
-  edge [
-    source 1757
-    target 3600
-    weight 392
-  ]
-  edge [
-    source 1757
-    target 2810
-    weight 50
-  ]
-  edge [
-    source 1757
-    target 3642
-    weight 195
-  ]
-  edge [
-    source 1757
-    target 2191
-    weight 137
-  ]
-  edge [
-    source 1757
-    target 4051
-    weight 579
-  ]
-  edge [
-    source 1757
-    target 1995
-    weight 343
-  ]
-  edge [
-    source 1757
-    target 3565
-    weight 179
-  ]
-  edge [
-    source 1757
-    target 2071
-    weight 636
-  ]
-  edge [
-    source 1757
-    target 3993
-    weight 336
-  ]
-  edge [
-    source 1757
-    target 3077
-    weight 43
-  ]
-  edge [
-    source 1757
-    target 1887
-    weight 617
-  ]
-  edge [
-    source 1757
-    target 3937
-    weight 66
-  ]
-  edge [
-    source 1757
-    target 3423
-    weight 185
-  ]
-  edge [
-    source 1757
-    target 3174
-    weight 306
-  ]
-  edge [
-    source 1757
-    target 2890
-    weight 141
-  ]
-  edge [
-    source 1757
-    target 3917
-    weight 232
-  ]
-  edge [
-    source 1757
-    target 2700
-    weight 354
-  ]
-  edge [
-    source 1757
-    target 3276
-    weight 330
-  ]
-  edge [
-    source 1757
-    target 2870
-    weight 168
-  ]
-  edge [
-    source 1757
-    target 3443
-    weight 158
-  ]
-  edge [
-    source 1757
-    target 2204
-    weight 165
-  ]
-  edge [
-    source 1757
-    target 3253
-    weight 95
-  ]
-  edge [
-    source 1757
-    target 3052
-    weight 54
-  ]
-  edge [
-    source 1757
-    target 3847
-    weight 53
-  ]
-  edge [
-    source 1757
-    target 3282
-    weight 241
-  ]
-  edge [
-    source 1757
-    target 4154
-    weight 110
-  ]
-  edge [
-    source 1757
-    target 3636
-    weight 167
-  ]
-  edge [
-    source 1757
-    target 3954
-    weight 142
-  ]
-  edge [
-    source 1757
-    target 3145
-    weight 411
-  ]
-  edge [
-    source 1757
-    target 2844
-    weight 29
-  ]
-  edge [
-    source 1757
-    target 2543
-    weight 98
-  ]
-  edge [
-    source 1757
-    target 4040
-    weight 40
-  ]
-  edge [
-    source 1757
-    target 2553
-    weight 69
-  ]
-  edge [
-    source 1757
-    target 3040
-    weight 125
-  ]
-  edge [
-    source 1757
-    target 2287
-    weight 125
-  ]
-  edge [
-    source 1757
-    target 2800
-    weight 83
-  ]
-  edge [
-    source 1757
-    target 4187
-    weight 24
-  ]
-  edge [
-    source 1757
-    target 3374
-    weight 137
-  ]
-  edge [
-    source 1757
-    target 3962
-    weight 152
-  ]
-  edge [
-    source 1757
-    target 2329
-    weight 35
-  ]
-  edge [
-    source 1757
-    target 3420
-    weight 126
-  ]
-  edge [
-    source 1757
-    target 3066
-    weight 117
-  ]
-  edge [
-    source 1757
-    target 2711
-    weight 24
-  ]
-  edge [
-    source 1757
-    target 2614
-    weight 37
-  ]
-  edge [
-    source 1757
-    target 3884
-    weight 48
-  ]
-  edge [
-    source 1757
-    target 2519
-    weight 160
-  ]
-  edge [
-    source 1757
-    target 3006
-    weight 115
-  ]
-  edge [
-    source 1757
-    target 1938
-    weight 70
-  ]
-  edge [
-    source 1757
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 1757
-    target 2570
-    weight 24
-  ]
-  edge [
-    source 1757
-    target 3408
-    weight 29
-  ]
-  edge [
-    source 1757
-    target 2857
-    weight 196
-  ]
-  edge [
-    source 1757
-    target 3860
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3295
-    weight 57
-  ]
-  edge [
-    source 1757
-    target 4162
-    weight 54
-  ]
-  edge [
-    source 1757
-    target 3377
-    weight 27
-  ]
-  edge [
-    source 1757
-    target 1952
-    weight 33
-  ]
-  edge [
-    source 1757
-    target 2058
-    weight 121
-  ]
-  edge [
-    source 1757
-    target 1943
-    weight 29
-  ]
-  edge [
-    source 1757
-    target 3024
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3177
-    weight 47
-  ]
-  edge [
-    source 1757
-    target 2822
-    weight 22
-  ]
-  edge [
-    source 1757
-    target 3432
-    weight 26
-  ]
-  edge [
-    source 1757
-    target 3641
-    weight 22
-  ]
-  edge [
-    source 1757
-    target 2227
-    weight 21
-  ]
-  edge [
-    source 1757
-    target 3877
-    weight 30
-  ]
-  edge [
-    source 1757
-    target 1802
-    weight 23
-  ]
-  edge [
-    source 1757
-    target 2078
-    weight 23
-  ]
-  edge [
-    source 1766
-    target 3521
-    weight 60
-  ]
-  edge [
-    source 1766
-    target 4051
-    weight 54
-  ]
-  edge [
-    source 1766
-    target 1995
-    weight 42
-  ]
-  edge [
-    source 1766
-    target 2861
-    weight 46
-  ]
-  edge [
-    source 1766
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 1766
-    target 3006
-    weight 26
-  ]
-  edge [
-    source 1766
-    target 3066
-    weight 23
-  ]
-  edge [
-    source 1766
-    target 3174
-    weight 29
-  ]
-  edge [
-    source 1766
-    target 3141
-    weight 51
-  ]
-  edge [
-    source 1766
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 1766
-    target 2071
-    weight 51
-  ]
-  edge [
-    source 1766
-    target 1887
-    weight 51
-  ]
-  edge [
-    source 1766
-    target 3600
-    weight 30
-  ]
-  edge [
-    source 1766
-    target 2700
-    weight 31
-  ]
-  edge [
-    source 1766
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 1766
-    target 3993
-    weight 24
-  ]
-  edge [
-    source 1766
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 1766
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 1766
-    target 3145
-    weight 35
-  ]
-  edge [
-    source 1769
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 1769
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 1775
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 1775
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 1775
-    target 1887
-    weight 22
-  ]
-  edge [
-    source 1775
-    target 2071
-    weight 23
-  ]
-  edge [
-    source 1789
-    target 3521
-    weight 299
-  ]
-  edge [
-    source 1789
-    target 2861
-    weight 134
-  ]
-  edge [
-    source 1789
-    target 2191
-    weight 43
-  ]
-  edge [
-    source 1789
-    target 2071
-    weight 129
-  ]
-  edge [
-    source 1789
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 1789
-    target 3145
-    weight 50
-  ]
-  edge [
-    source 1789
-    target 1995
-    weight 32
-  ]
-  edge [
-    source 1789
-    target 3141
-    weight 102
-  ]
-  edge [
-    source 1789
-    target 1887
-    weight 96
-  ]
-  edge [
-    source 1789
-    target 3642
-    weight 28
-  ]
-  edge [
-    source 1789
-    target 3993
-    weight 53
-  ]
-  edge [
-    source 1789
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 1789
-    target 3600
-    weight 73
-  ]
-  edge [
-    source 1789
-    target 3962
-    weight 27
-  ]
-  edge [
-    source 1789
-    target 4051
-    weight 110
-  ]
-  edge [
-    source 1789
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 1789
-    target 2700
-    weight 30
-  ]
-  edge [
-    source 1789
-    target 3174
-    weight 37
-  ]
-  edge [
-    source 1789
-    target 2058
-    weight 25
-  ]
-  edge [
-    source 1789
-    target 3276
-    weight 50
-  ]
-  edge [
-    source 1789
-    target 3374
-    weight 26
-  ]
-  edge [
-    source 1798
-    target 3521
-    weight 86
-  ]
-  edge [
-    source 1798
-    target 3276
-    weight 44
-  ]
-  edge [
-    source 1798
-    target 4051
-    weight 68
-  ]
-  edge [
-    source 1798
-    target 3917
-    weight 33
-  ]
-  edge [
-    source 1798
-    target 3141
-    weight 68
-  ]
-  edge [
-    source 1798
-    target 2071
-    weight 71
-  ]
-  edge [
-    source 1798
-    target 3145
-    weight 52
-  ]
-  edge [
-    source 1798
-    target 3600
-    weight 36
-  ]
-  edge [
-    source 1798
-    target 1887
-    weight 66
-  ]
-  edge [
-    source 1798
-    target 3174
-    weight 35
-  ]
-  edge [
-    source 1798
-    target 2861
-    weight 56
-  ]
-  edge [
-    source 1798
-    target 3954
-    weight 27
-  ]
-  edge [
-    source 1798
-    target 3642
-    weight 30
-  ]
-  edge [
-    source 1798
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 1798
-    target 3993
-    weight 37
-  ]
-  edge [
-    source 1798
-    target 3066
-    weight 22
-  ]
-  edge [
-    source 1798
-    target 3423
-    weight 23
-  ]
-  edge [
-    source 1798
-    target 3282
-    weight 21
-  ]
-  edge [
-    source 1798
-    target 2857
-    weight 35
-  ]
-  edge [
-    source 1798
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 1798
-    target 3542
-    weight 23
-  ]
-  edge [
-    source 1798
-    target 1995
-    weight 36
-  ]
-  edge [
-    source 1802
-    target 3521
-    weight 117
-  ]
-  edge [
-    source 1802
-    target 1887
-    weight 105
-  ]
-  edge [
-    source 1802
-    target 3276
-    weight 63
-  ]
-  edge [
-    source 1802
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 1802
-    target 2890
-    weight 35
-  ]
-  edge [
-    source 1802
-    target 3141
-    weight 108
-  ]
-  edge [
-    source 1802
-    target 1995
-    weight 54
-  ]
-  edge [
-    source 1802
-    target 2071
-    weight 101
-  ]
-  edge [
-    source 1802
-    target 3040
-    weight 29
-  ]
-  edge [
-    source 1802
-    target 3420
-    weight 22
-  ]
-  edge [
-    source 1802
-    target 3145
-    weight 73
-  ]
-  edge [
-    source 1802
-    target 3600
-    weight 84
-  ]
-  edge [
-    source 1802
-    target 3174
-    weight 53
-  ]
-  edge [
-    source 1802
-    target 2861
-    weight 77
-  ]
-  edge [
-    source 1802
-    target 3917
-    weight 57
-  ]
-  edge [
-    source 1802
-    target 3642
-    weight 43
-  ]
-  edge [
-    source 1802
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 1802
-    target 2700
-    weight 57
-  ]
-  edge [
-    source 1802
-    target 2191
-    weight 21
-  ]
-  edge [
-    source 1802
-    target 4154
-    weight 41
-  ]
-  edge [
-    source 1802
-    target 4051
-    weight 94
-  ]
-  edge [
-    source 1802
-    target 2058
-    weight 27
-  ]
-  edge [
-    source 1802
-    target 2870
-    weight 26
-  ]
-  edge [
-    source 1802
-    target 3443
-    weight 34
-  ]
-  edge [
-    source 1802
-    target 2519
-    weight 40
-  ]
-  edge [
-    source 1802
-    target 3993
-    weight 63
-  ]
-  edge [
-    source 1802
-    target 3282
-    weight 40
-  ]
-  edge [
-    source 1802
-    target 2857
-    weight 50
-  ]
-  edge [
-    source 1802
-    target 3066
-    weight 24
-  ]
-  edge [
-    source 1802
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 1802
-    target 3423
-    weight 33
-  ]
-  edge [
-    source 1802
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 1802
-    target 2204
-    weight 21
-  ]
-  edge [
-    source 1802
-    target 3962
-    weight 24
-  ]
-  edge [
-    source 1802
-    target 2287
-    weight 24
-  ]
-  edge [
-    source 1802
-    target 3374
-    weight 27
-  ]
-  edge [
-    source 1822
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 1822
-    target 2071
-    weight 24
-  ]
-  edge [
-    source 1832
-    target 3521
-    weight 55
-  ]
-  edge [
-    source 1832
-    target 2861
-    weight 30
-  ]
-  edge [
-    source 1832
-    target 1995
-    weight 33
-  ]
-  edge [
-    source 1832
-    target 3141
-    weight 40
-  ]
-  edge [
-    source 1832
-    target 2071
-    weight 31
-  ]
-  edge [
-    source 1832
-    target 1887
-    weight 41
-  ]
-  edge [
-    source 1832
-    target 4051
-    weight 37
-  ]
-  edge [
-    source 1832
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 1832
-    target 3145
-    weight 21
-  ]
-  edge [
-    source 1856
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 1856
-    target 3141
-    weight 26
-  ]
-  edge [
-    source 1856
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 1856
-    target 1887
-    weight 24
-  ]
-  edge [
-    source 1856
-    target 3521
-    weight 32
-  ]
-  edge [
-    source 1856
-    target 2071
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 3521
-    weight 17933
-  ]
-  edge [
-    source 1887
-    target 3600
-    weight 6187
-  ]
-  edge [
-    source 1887
-    target 3432
-    weight 86
-  ]
-  edge [
-    source 1887
-    target 1952
-    weight 138
-  ]
-  edge [
-    source 1887
-    target 3565
-    weight 1695
-  ]
-  edge [
-    source 1887
-    target 3937
-    weight 221
-  ]
-  edge [
-    source 1887
-    target 4051
-    weight 11627
-  ]
-  edge [
-    source 1887
-    target 3174
-    weight 4848
-  ]
-  edge [
-    source 1887
-    target 2543
-    weight 515
-  ]
-  edge [
-    source 1887
-    target 3253
-    weight 539
-  ]
-  edge [
-    source 1887
-    target 3423
-    weight 1637
-  ]
-  edge [
-    source 1887
-    target 2861
-    weight 8785
-  ]
-  edge [
-    source 1887
-    target 2181
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 3066
-    weight 644
-  ]
-  edge [
-    source 1887
-    target 3276
-    weight 4479
-  ]
-  edge [
-    source 1887
-    target 1995
-    weight 3447
-  ]
-  edge [
-    source 1887
-    target 3282
-    weight 1384
-  ]
-  edge [
-    source 1887
-    target 2071
-    weight 11577
-  ]
-  edge [
-    source 1887
-    target 3145
-    weight 4099
-  ]
-  edge [
-    source 1887
-    target 3420
-    weight 516
-  ]
-  edge [
-    source 1887
-    target 3141
-    weight 13616
-  ]
-  edge [
-    source 1887
-    target 3985
-    weight 63
-  ]
-  edge [
-    source 1887
-    target 3542
-    weight 1132
-  ]
-  edge [
-    source 1887
-    target 3917
-    weight 1805
-  ]
-  edge [
-    source 1887
-    target 2191
-    weight 852
-  ]
-  edge [
-    source 1887
-    target 3642
-    weight 2866
-  ]
-  edge [
-    source 1887
-    target 3993
-    weight 3147
-  ]
-  edge [
-    source 1887
-    target 2700
-    weight 3914
-  ]
-  edge [
-    source 1887
-    target 3443
-    weight 906
-  ]
-  edge [
-    source 1887
-    target 3954
-    weight 808
-  ]
-  edge [
-    source 1887
-    target 1943
-    weight 134
-  ]
-  edge [
-    source 1887
-    target 2810
-    weight 175
-  ]
-  edge [
-    source 1887
-    target 2519
-    weight 1167
-  ]
-  edge [
-    source 1887
-    target 4027
-    weight 85
-  ]
-  edge [
-    source 1887
-    target 3377
-    weight 190
-  ]
-  edge [
-    source 1887
-    target 1931
-    weight 53
-  ]
-  edge [
-    source 1887
-    target 2870
-    weight 844
-  ]
-  edge [
-    source 1887
-    target 3962
-    weight 779
-  ]
-  edge [
-    source 1887
-    target 3374
-    weight 883
-  ]
-  edge [
-    source 1887
-    target 2058
-    weight 714
-  ]
-  edge [
-    source 1887
-    target 3636
-    weight 721
-  ]
-  edge [
-    source 1887
-    target 3860
-    weight 85
-  ]
-  edge [
-    source 1887
-    target 2857
-    weight 1149
-  ]
-  edge [
-    source 1887
-    target 3071
-    weight 77
-  ]
-  edge [
-    source 1887
-    target 3295
-    weight 482
-  ]
-  edge [
-    source 1887
-    target 2890
-    weight 1127
-  ]
-  edge [
-    source 1887
-    target 3040
-    weight 854
-  ]
-  edge [
-    source 1887
-    target 2232
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 3006
-    weight 637
-  ]
-  edge [
-    source 1887
-    target 2800
-    weight 311
-  ]
-  edge [
-    source 1887
-    target 2287
-    weight 697
-  ]
-  edge [
-    source 1887
-    target 4154
-    weight 1134
-  ]
-  edge [
-    source 1887
-    target 3112
-    weight 28
-  ]
-  edge [
-    source 1887
-    target 3641
-    weight 89
-  ]
-  edge [
-    source 1887
-    target 1938
-    weight 333
-  ]
-  edge [
-    source 1887
-    target 2924
-    weight 53
-  ]
-  edge [
-    source 1887
-    target 3847
-    weight 279
-  ]
-  edge [
-    source 1887
-    target 2329
-    weight 113
-  ]
-  edge [
-    source 1887
-    target 2570
-    weight 78
-  ]
-  edge [
-    source 1887
-    target 4187
-    weight 110
-  ]
-  edge [
-    source 1887
-    target 2061
-    weight 58
-  ]
-  edge [
-    source 1887
-    target 3952
-    weight 31
-  ]
-  edge [
-    source 1887
-    target 2556
-    weight 68
-  ]
-  edge [
-    source 1887
-    target 3935
-    weight 65
-  ]
-  edge [
-    source 1887
-    target 2450
-    weight 38
-  ]
-  edge [
-    source 1887
-    target 2553
-    weight 361
-  ]
-  edge [
-    source 1887
-    target 2204
-    weight 560
-  ]
-  edge [
-    source 1887
-    target 2743
-    weight 46
-  ]
-  edge [
-    source 1887
-    target 4100
-    weight 34
-  ]
-  edge [
-    source 1887
-    target 3050
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 4040
-    weight 209
-  ]
-  edge [
-    source 1887
-    target 2082
-    weight 48
-  ]
-  edge [
-    source 1887
-    target 2953
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 2600
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 4152
-    weight 97
-  ]
-  edge [
-    source 1887
-    target 3375
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 3884
-    weight 126
-  ]
-  edge [
-    source 1887
-    target 2011
-    weight 110
-  ]
-  edge [
-    source 1887
-    target 3052
-    weight 300
-  ]
-  edge [
-    source 1887
-    target 3956
-    weight 41
-  ]
-  edge [
-    source 1887
-    target 2609
-    weight 33
-  ]
-  edge [
-    source 1887
-    target 2832
-    weight 30
-  ]
-  edge [
-    source 1887
-    target 4162
-    weight 351
-  ]
-  edge [
-    source 1887
-    target 2227
-    weight 156
-  ]
-  edge [
-    source 1887
-    target 2434
-    weight 25
-  ]
-  edge [
-    source 1887
-    target 2003
-    weight 100
-  ]
-  edge [
-    source 1887
-    target 2844
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 2711
-    weight 83
-  ]
-  edge [
-    source 1887
-    target 3177
-    weight 156
-  ]
-  edge [
-    source 1887
-    target 2955
-    weight 52
-  ]
-  edge [
-    source 1887
-    target 3196
-    weight 88
-  ]
-  edge [
-    source 1887
-    target 2531
-    weight 73
-  ]
-  edge [
-    source 1887
-    target 3024
-    weight 72
-  ]
-  edge [
-    source 1887
-    target 3693
-    weight 28
-  ]
-  edge [
-    source 1887
-    target 3861
-    weight 60
-  ]
-  edge [
-    source 1887
-    target 2614
-    weight 140
-  ]
-  edge [
-    source 1887
-    target 4007
-    weight 36
-  ]
-  edge [
-    source 1887
-    target 4160
-    weight 74
-  ]
-  edge [
-    source 1887
-    target 3077
-    weight 350
-  ]
-  edge [
-    source 1887
-    target 2054
-    weight 51
-  ]
-  edge [
-    source 1887
-    target 3968
-    weight 97
-  ]
-  edge [
-    source 1887
-    target 2573
-    weight 36
-  ]
-  edge [
-    source 1887
-    target 3162
-    weight 84
-  ]
-  edge [
-    source 1887
-    target 2115
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3877
-    weight 230
-  ]
-  edge [
-    source 1887
-    target 3408
-    weight 210
-  ]
-  edge [
-    source 1887
-    target 3108
-    weight 46
-  ]
-  edge [
-    source 1887
-    target 2198
-    weight 37
-  ]
-  edge [
-    source 1887
-    target 2983
-    weight 34
-  ]
-  edge [
-    source 1887
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 3559
-    weight 35
-  ]
-  edge [
-    source 1887
-    target 3465
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 2978
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3510
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 2009
-    weight 36
-  ]
-  edge [
-    source 1887
-    target 3692
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3462
-    weight 37
-  ]
-  edge [
-    source 1887
-    target 1922
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 3309
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 2099
-    weight 93
-  ]
-  edge [
-    source 1887
-    target 4098
-    weight 76
-  ]
-  edge [
-    source 1887
-    target 3146
-    weight 25
-  ]
-  edge [
-    source 1887
-    target 2801
-    weight 24
-  ]
-  edge [
-    source 1887
-    target 2262
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 3011
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 2997
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 3074
-    weight 22
-  ]
-  edge [
-    source 1887
-    target 2597
-    weight 77
-  ]
-  edge [
-    source 1887
-    target 3677
-    weight 80
-  ]
-  edge [
-    source 1887
-    target 3856
-    weight 26
-  ]
-  edge [
-    source 1887
-    target 2822
-    weight 85
-  ]
-  edge [
-    source 1887
-    target 3440
-    weight 31
-  ]
-  edge [
-    source 1887
-    target 3357
-    weight 50
-  ]
-  edge [
-    source 1887
-    target 3872
-    weight 54
-  ]
-  edge [
-    source 1887
-    target 2634
-    weight 21
-  ]
-  edge [
-    source 1887
-    target 3737
-    weight 32
-  ]
-  edge [
-    source 1887
-    target 1970
-    weight 111
-  ]
-  edge [
-    source 1887
-    target 2836
-    weight 29
-  ]
-  edge [
-    source 1887
-    target 3633
-    weight 62
-  ]
-  edge [
-    source 1887
-    target 2078
-    weight 148
-  ]
-  edge [
-    source 1887
-    target 1900
-    weight 28
-  ]
-  edge [
-    source 1887
-    target 3876
-    weight 41
-  ]
-  edge [
-    source 1900
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 1900
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 1900
-    target 2861
-    weight 23
-  ]
-  edge [
-    source 1900
-    target 2071
-    weight 27
-  ]
-  edge [
-    source 1900
-    target 4051
-    weight 29
-  ]
-  edge [
-    source 1922
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 1922
-    target 2071
-    weight 28
-  ]
-  edge [
-    source 1922
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 1922
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 1922
-    target 3521
-    weight 37
-  ]
-  edge [
-    source 1922
-    target 1995
-    weight 22
-  ]
-  edge [
-    source 1931
-    target 3521
-    weight 87
-  ]
-  edge [
-    source 1931
-    target 2861
-    weight 66
-  ]
-  edge [
-    source 1931
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 1931
-    target 4051
-    weight 60
-  ]
-  edge [
-    source 1931
-    target 3600
-    weight 37
-  ]
-  edge [
-    source 1931
-    target 2191
-    weight 24
-  ]
-  edge [
-    source 1931
-    target 2071
-    weight 71
-  ]
-  edge [
-    source 1931
-    target 3141
-    weight 64
-  ]
-  edge [
-    source 1931
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 1931
-    target 3565
-    weight 21
-  ]
-  edge [
-    source 1931
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 1931
-    target 1995
-    weight 35
-  ]
-  edge [
-    source 1931
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 1931
-    target 3423
-    weight 27
-  ]
-  edge [
-    source 1931
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 1931
-    target 3145
-    weight 36
-  ]
-  edge [
-    source 1931
-    target 3276
-    weight 29
-  ]
-  edge [
-    source 1931
-    target 3374
-    weight 23
-  ]
-  edge [
-    source 1931
-    target 3917
-    weight 23
-  ]
-  edge [
-    source 1938
-    target 3542
-    weight 199
-  ]
-  edge [
-    source 1938
-    target 1995
-    weight 172
-  ]
-  edge [
-    source 1938
-    target 3521
-    weight 397
-  ]
-  edge [
-    source 1938
-    target 3276
-    weight 177
-  ]
-  edge [
-    source 1938
-    target 2870
-    weight 124
-  ]
-  edge [
-    source 1938
-    target 3600
-    weight 215
-  ]
-  edge [
-    source 1938
-    target 2204
-    weight 74
-  ]
-  edge [
-    source 1938
-    target 3962
-    weight 58
-  ]
-  edge [
-    source 1938
-    target 3847
-    weight 71
-  ]
-  edge [
-    source 1938
-    target 3066
-    weight 85
-  ]
-  edge [
-    source 1938
-    target 3565
-    weight 125
-  ]
-  edge [
-    source 1938
-    target 3253
-    weight 78
-  ]
-  edge [
-    source 1938
-    target 4051
-    weight 295
-  ]
-  edge [
-    source 1938
-    target 2329
-    weight 21
-  ]
-  edge [
-    source 1938
-    target 3636
-    weight 101
-  ]
-  edge [
-    source 1938
-    target 2553
-    weight 56
-  ]
-  edge [
-    source 1938
-    target 2071
-    weight 312
-  ]
-  edge [
-    source 1938
-    target 2700
-    weight 222
-  ]
-  edge [
-    source 1938
-    target 3141
-    weight 343
-  ]
-  edge [
-    source 1938
-    target 2861
-    weight 252
-  ]
-  edge [
-    source 1938
-    target 3174
-    weight 176
-  ]
-  edge [
-    source 1938
-    target 3282
-    weight 164
-  ]
-  edge [
-    source 1938
-    target 3884
-    weight 21
-  ]
-  edge [
-    source 1938
-    target 3642
-    weight 128
-  ]
-  edge [
-    source 1938
-    target 3954
-    weight 87
-  ]
-  edge [
-    source 1938
-    target 2614
-    weight 23
-  ]
-  edge [
-    source 1938
-    target 3006
-    weight 74
-  ]
-  edge [
-    source 1938
-    target 4154
-    weight 109
-  ]
-  edge [
-    source 1938
-    target 2543
-    weight 68
-  ]
-  edge [
-    source 1938
-    target 3993
-    weight 170
-  ]
-  edge [
-    source 1938
-    target 2810
-    weight 34
-  ]
-  edge [
-    source 1938
-    target 3040
-    weight 77
-  ]
-  edge [
-    source 1938
-    target 2519
-    weight 99
-  ]
-  edge [
-    source 1938
-    target 3917
-    weight 136
-  ]
-  edge [
-    source 1938
-    target 2800
-    weight 52
-  ]
-  edge [
-    source 1938
-    target 3420
-    weight 74
-  ]
-  edge [
-    source 1938
-    target 3443
-    weight 80
-  ]
-  edge [
-    source 1938
-    target 3145
-    weight 187
-  ]
-  edge [
-    source 1938
-    target 2890
-    weight 73
-  ]
-  edge [
-    source 1938
-    target 2287
-    weight 67
-  ]
-  edge [
-    source 1938
-    target 3295
-    weight 52
-  ]
-  edge [
-    source 1938
-    target 4040
-    weight 33
-  ]
-  edge [
-    source 1938
-    target 3423
-    weight 76
-  ]
-  edge [
-    source 1938
-    target 2191
-    weight 44
-  ]
-  edge [
-    source 1938
-    target 3374
-    weight 57
-  ]
-  edge [
-    source 1938
-    target 3052
-    weight 42
-  ]
-  edge [
-    source 1938
-    target 3937
-    weight 35
-  ]
-  edge [
-    source 1938
-    target 2857
-    weight 113
-  ]
-  edge [
-    source 1938
-    target 3877
-    weight 21
-  ]
-  edge [
-    source 1938
-    target 4162
-    weight 36
-  ]
-  edge [
-    source 1938
-    target 2058
-    weight 57
-  ]
-  edge [
-    source 1943
-    target 3521
-    weight 155
-  ]
-  edge [
-    source 1943
-    target 3600
-    weight 105
-  ]
-  edge [
-    source 1943
-    target 3993
-    weight 90
-  ]
-  edge [
-    source 1943
-    target 4051
-    weight 134
-  ]
-  edge [
-    source 1943
-    target 2861
-    weight 123
-  ]
-  edge [
-    source 1943
-    target 3565
-    weight 35
-  ]
-  edge [
-    source 1943
-    target 1995
-    weight 92
-  ]
-  edge [
-    source 1943
-    target 2071
-    weight 143
-  ]
-  edge [
-    source 1943
-    target 3642
-    weight 55
-  ]
-  edge [
-    source 1943
-    target 2191
-    weight 39
-  ]
-  edge [
-    source 1943
-    target 3636
-    weight 39
-  ]
-  edge [
-    source 1943
-    target 3443
-    weight 37
-  ]
-  edge [
-    source 1943
-    target 2543
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 3253
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 3066
-    weight 56
-  ]
-  edge [
-    source 1943
-    target 3040
-    weight 51
-  ]
-  edge [
-    source 1943
-    target 3423
-    weight 55
-  ]
-  edge [
-    source 1943
-    target 3917
-    weight 62
-  ]
-  edge [
-    source 1943
-    target 3052
-    weight 27
-  ]
-  edge [
-    source 1943
-    target 3006
-    weight 28
-  ]
-  edge [
-    source 1943
-    target 3141
-    weight 139
-  ]
-  edge [
-    source 1943
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 1943
-    target 3145
-    weight 100
-  ]
-  edge [
-    source 1943
-    target 3282
-    weight 53
-  ]
-  edge [
-    source 1943
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 1943
-    target 2287
-    weight 84
-  ]
-  edge [
-    source 1943
-    target 3954
-    weight 45
-  ]
-  edge [
-    source 1943
-    target 3174
-    weight 89
-  ]
-  edge [
-    source 1943
-    target 3276
-    weight 83
-  ]
-  edge [
-    source 1943
-    target 3542
-    weight 41
-  ]
-  edge [
-    source 1943
-    target 4154
-    weight 34
-  ]
-  edge [
-    source 1943
-    target 2870
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 2204
-    weight 37
-  ]
-  edge [
-    source 1943
-    target 2890
-    weight 32
-  ]
-  edge [
-    source 1943
-    target 3420
-    weight 30
-  ]
-  edge [
-    source 1943
-    target 2700
-    weight 85
-  ]
-  edge [
-    source 1943
-    target 3374
-    weight 55
-  ]
-  edge [
-    source 1943
-    target 3962
-    weight 25
-  ]
-  edge [
-    source 1943
-    target 2519
-    weight 48
-  ]
-  edge [
-    source 1943
-    target 2553
-    weight 24
-  ]
-  edge [
-    source 1943
-    target 2058
-    weight 39
-  ]
-  edge [
-    source 1952
-    target 3600
-    weight 104
-  ]
-  edge [
-    source 1952
-    target 3521
-    weight 173
-  ]
-  edge [
-    source 1952
-    target 3565
-    weight 30
-  ]
-  edge [
-    source 1952
-    target 3937
-    weight 25
-  ]
-  edge [
-    source 1952
-    target 3423
-    weight 82
-  ]
-  edge [
-    source 1952
-    target 3443
-    weight 26
-  ]
-  edge [
-    source 1952
-    target 2191
-    weight 59
-  ]
-  edge [
-    source 1952
-    target 2071
-    weight 158
-  ]
-  edge [
-    source 1952
-    target 1995
-    weight 66
-  ]
-  edge [
-    source 1952
-    target 3077
-    weight 34
-  ]
-  edge [
-    source 1952
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3040
-    weight 36
-  ]
-  edge [
-    source 1952
-    target 2861
-    weight 112
-  ]
-  edge [
-    source 1952
-    target 3962
-    weight 72
-  ]
-  edge [
-    source 1952
-    target 3177
-    weight 25
-  ]
-  edge [
-    source 1952
-    target 3642
-    weight 51
-  ]
-  edge [
-    source 1952
-    target 3917
-    weight 68
-  ]
-  edge [
-    source 1952
-    target 3141
-    weight 141
-  ]
-  edge [
-    source 1952
-    target 3993
-    weight 101
-  ]
-  edge [
-    source 1952
-    target 3066
-    weight 23
-  ]
-  edge [
-    source 1952
-    target 4154
-    weight 28
-  ]
-  edge [
-    source 1952
-    target 2890
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3420
-    weight 26
-  ]
-  edge [
-    source 1952
-    target 2287
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3282
-    weight 48
-  ]
-  edge [
-    source 1952
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 1952
-    target 4051
-    weight 128
-  ]
-  edge [
-    source 1952
-    target 2870
-    weight 31
-  ]
-  edge [
-    source 1952
-    target 3276
-    weight 88
-  ]
-  edge [
-    source 1952
-    target 2204
-    weight 22
-  ]
-  edge [
-    source 1952
-    target 3174
-    weight 64
-  ]
-  edge [
-    source 1952
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 1952
-    target 2553
-    weight 21
-  ]
-  edge [
-    source 1952
-    target 2700
-    weight 73
-  ]
-  edge [
-    source 1952
-    target 3145
-    weight 107
-  ]
-  edge [
-    source 1952
-    target 3542
-    weight 40
-  ]
-  edge [
-    source 1952
-    target 2058
-    weight 47
-  ]
-  edge [
-    source 1952
-    target 2519
-    weight 44
-  ]
-  edge [
-    source 1952
-    target 3374
-    weight 43
-  ]
-  edge [
-    source 1952
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 1952
-    target 2800
-    weight 24
-  ]
-  edge [
-    source 1952
-    target 2857
-    weight 49
-  ]
-  edge [
-    source 1952
-    target 3253
-    weight 27
-  ]
-  edge [
-    source 1970
-    target 3565
-    weight 33
-  ]
-  edge [
-    source 1970
-    target 2861
-    weight 107
-  ]
-  edge [
-    source 1970
-    target 3521
-    weight 153
-  ]
-  edge [
-    source 1970
-    target 3141
-    weight 125
-  ]
-  edge [
-    source 1970
-    target 3420
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 3295
-    weight 22
-  ]
-  edge [
-    source 1970
-    target 2890
-    weight 35
-  ]
-  edge [
-    source 1970
-    target 3636
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 3600
-    weight 87
-  ]
-  edge [
-    source 1970
-    target 3443
-    weight 30
-  ]
-  edge [
-    source 1970
-    target 3993
-    weight 68
-  ]
-  edge [
-    source 1970
-    target 1995
-    weight 72
-  ]
-  edge [
-    source 1970
-    target 4051
-    weight 128
-  ]
-  edge [
-    source 1970
-    target 2071
-    weight 128
-  ]
-  edge [
-    source 1970
-    target 4154
-    weight 31
-  ]
-  edge [
-    source 1970
-    target 3145
-    weight 88
-  ]
-  edge [
-    source 1970
-    target 3174
-    weight 72
-  ]
-  edge [
-    source 1970
-    target 3642
-    weight 58
-  ]
-  edge [
-    source 1970
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 1970
-    target 2191
-    weight 27
-  ]
-  edge [
-    source 1970
-    target 3276
-    weight 69
-  ]
-  edge [
-    source 1970
-    target 3917
-    weight 54
-  ]
-  edge [
-    source 1970
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 1970
-    target 2287
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 3954
-    weight 33
-  ]
-  edge [
-    source 1970
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 1970
-    target 3282
-    weight 29
-  ]
-  edge [
-    source 1970
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 1970
-    target 2519
-    weight 36
-  ]
-  edge [
-    source 1970
-    target 2543
-    weight 23
-  ]
-  edge [
-    source 1970
-    target 3542
-    weight 24
-  ]
-  edge [
-    source 1970
-    target 2058
-    weight 22
-  ]
-  edge [
-    source 1970
-    target 3040
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 2861
-    weight 3211
-  ]
-  edge [
-    source 1995
-    target 3521
-    weight 4928
-  ]
-  edge [
-    source 1995
-    target 2071
-    weight 3681
-  ]
-  edge [
-    source 1995
-    target 2191
-    weight 419
-  ]
-  edge [
-    source 1995
-    target 4051
-    weight 3650
-  ]
-  edge [
-    source 1995
-    target 3565
-    weight 869
-  ]
-  edge [
-    source 1995
-    target 3066
-    weight 426
-  ]
-  edge [
-    source 1995
-    target 3985
-    weight 51
-  ]
-  edge [
-    source 1995
-    target 3141
-    weight 3660
-  ]
-  edge [
-    source 1995
-    target 3145
-    weight 1737
-  ]
-  edge [
-    source 1995
-    target 3600
-    weight 2229
-  ]
-  edge [
-    source 1995
-    target 2870
-    weight 465
-  ]
-  edge [
-    source 1995
-    target 3276
-    weight 1722
-  ]
-  edge [
-    source 1995
-    target 3253
-    weight 306
-  ]
-  edge [
-    source 1995
-    target 3642
-    weight 1254
-  ]
-  edge [
-    source 1995
-    target 3993
-    weight 1481
-  ]
-  edge [
-    source 1995
-    target 2700
-    weight 1738
-  ]
-  edge [
-    source 1995
-    target 4187
-    weight 66
-  ]
-  edge [
-    source 1995
-    target 2800
-    weight 178
-  ]
-  edge [
-    source 1995
-    target 2978
-    weight 22
-  ]
-  edge [
-    source 1995
-    target 4152
-    weight 52
-  ]
-  edge [
-    source 1995
-    target 2810
-    weight 114
-  ]
-  edge [
-    source 1995
-    target 3420
-    weight 292
-  ]
-  edge [
-    source 1995
-    target 3937
-    weight 134
-  ]
-  edge [
-    source 1995
-    target 3962
-    weight 354
-  ]
-  edge [
-    source 1995
-    target 3377
-    weight 114
-  ]
-  edge [
-    source 1995
-    target 3917
-    weight 867
-  ]
-  edge [
-    source 1995
-    target 3174
-    weight 1843
-  ]
-  edge [
-    source 1995
-    target 3542
-    weight 545
-  ]
-  edge [
-    source 1995
-    target 3443
-    weight 455
-  ]
-  edge [
-    source 1995
-    target 2614
-    weight 105
-  ]
-  edge [
-    source 1995
-    target 3968
-    weight 53
-  ]
-  edge [
-    source 1995
-    target 3636
-    weight 488
-  ]
-  edge [
-    source 1995
-    target 3282
-    weight 690
-  ]
-  edge [
-    source 1995
-    target 2543
-    weight 337
-  ]
-  edge [
-    source 1995
-    target 2227
-    weight 59
-  ]
-  edge [
-    source 1995
-    target 2058
-    weight 343
-  ]
-  edge [
-    source 1995
-    target 2924
-    weight 34
-  ]
-  edge [
-    source 1995
-    target 3954
-    weight 561
-  ]
-  edge [
-    source 1995
-    target 2857
-    weight 593
-  ]
-  edge [
-    source 1995
-    target 2181
-    weight 25
-  ]
-  edge [
-    source 1995
-    target 3374
-    weight 437
-  ]
-  edge [
-    source 1995
-    target 2204
-    weight 341
-  ]
-  edge [
-    source 1995
-    target 2287
-    weight 483
-  ]
-  edge [
-    source 1995
-    target 3295
-    weight 244
-  ]
-  edge [
-    source 1995
-    target 2232
-    weight 31
-  ]
-  edge [
-    source 1995
-    target 3006
-    weight 430
-  ]
-  edge [
-    source 1995
-    target 2082
-    weight 35
-  ]
-  edge [
-    source 1995
-    target 3040
-    weight 706
-  ]
-  edge [
-    source 1995
-    target 3559
-    weight 24
-  ]
-  edge [
-    source 1995
-    target 3052
-    weight 183
-  ]
-  edge [
-    source 1995
-    target 3884
-    weight 104
-  ]
-  edge [
-    source 1995
-    target 3423
-    weight 750
-  ]
-  edge [
-    source 1995
-    target 4098
-    weight 43
-  ]
-  edge [
-    source 1995
-    target 2890
-    weight 477
-  ]
-  edge [
-    source 1995
-    target 2597
-    weight 27
-  ]
-  edge [
-    source 1995
-    target 3077
-    weight 128
-  ]
-  edge [
-    source 1995
-    target 3357
-    weight 27
-  ]
-  edge [
-    source 1995
-    target 2519
-    weight 583
-  ]
-  edge [
-    source 1995
-    target 2329
-    weight 79
-  ]
-  edge [
-    source 1995
-    target 2003
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 2609
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 1995
-    target 3935
-    weight 53
-  ]
-  edge [
-    source 1995
-    target 3860
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 4160
-    weight 56
-  ]
-  edge [
-    source 1995
-    target 3847
-    weight 157
-  ]
-  edge [
-    source 1995
-    target 4100
-    weight 26
-  ]
-  edge [
-    source 1995
-    target 2531
-    weight 55
-  ]
-  edge [
-    source 1995
-    target 2553
-    weight 185
-  ]
-  edge [
-    source 1995
-    target 4154
-    weight 542
-  ]
-  edge [
-    source 1995
-    target 2556
-    weight 42
-  ]
-  edge [
-    source 1995
-    target 2011
-    weight 65
-  ]
-  edge [
-    source 1995
-    target 3392
-    weight 21
-  ]
-  edge [
-    source 1995
-    target 2955
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 2450
-    weight 22
-  ]
-  edge [
-    source 1995
-    target 2570
-    weight 40
-  ]
-  edge [
-    source 1995
-    target 3071
-    weight 47
-  ]
-  edge [
-    source 1995
-    target 3641
-    weight 49
-  ]
-  edge [
-    source 1995
-    target 3177
-    weight 87
-  ]
-  edge [
-    source 1995
-    target 2434
-    weight 21
-  ]
-  edge [
-    source 1995
-    target 4040
-    weight 119
-  ]
-  edge [
-    source 1995
-    target 3050
-    weight 32
-  ]
-  edge [
-    source 1995
-    target 2844
-    weight 31
-  ]
-  edge [
-    source 1995
-    target 3462
-    weight 23
-  ]
-  edge [
-    source 1995
-    target 3877
-    weight 118
-  ]
-  edge [
-    source 1995
-    target 3108
-    weight 25
-  ]
-  edge [
-    source 1995
-    target 3956
-    weight 26
-  ]
-  edge [
-    source 1995
-    target 2573
-    weight 33
-  ]
-  edge [
-    source 1995
-    target 3408
-    weight 86
-  ]
-  edge [
-    source 1995
-    target 2711
-    weight 61
-  ]
-  edge [
-    source 1995
-    target 2061
-    weight 37
-  ]
-  edge [
-    source 1995
-    target 2054
-    weight 27
-  ]
-  edge [
-    source 1995
-    target 2099
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 4162
-    weight 177
-  ]
-  edge [
-    source 1995
-    target 3162
-    weight 38
-  ]
-  edge [
-    source 1995
-    target 2743
-    weight 30
-  ]
-  edge [
-    source 1995
-    target 2983
-    weight 21
-  ]
-  edge [
-    source 1995
-    target 3196
-    weight 49
-  ]
-  edge [
-    source 1995
-    target 3861
-    weight 31
-  ]
-  edge [
-    source 1995
-    target 3677
-    weight 41
-  ]
-  edge [
-    source 1995
-    target 3432
-    weight 50
-  ]
-  edge [
-    source 1995
-    target 4027
-    weight 55
-  ]
-  edge [
-    source 1995
-    target 2822
-    weight 29
-  ]
-  edge [
-    source 1995
-    target 3024
-    weight 34
-  ]
-  edge [
-    source 1995
-    target 3633
-    weight 25
-  ]
-  edge [
-    source 1995
-    target 3876
-    weight 22
-  ]
-  edge [
-    source 1995
-    target 2078
-    weight 74
-  ]
-  edge [
-    source 2003
-    target 2861
-    weight 97
-  ]
-  edge [
-    source 2003
-    target 4051
-    weight 118
-  ]
-  edge [
-    source 2003
-    target 3642
-    weight 46
-  ]
-  edge [
-    source 2003
-    target 3521
-    weight 126
-  ]
-  edge [
-    source 2003
-    target 3423
-    weight 25
-  ]
-  edge [
-    source 2003
-    target 3565
-    weight 25
-  ]
-  edge [
-    source 2003
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 2003
-    target 3954
-    weight 58
-  ]
-  edge [
-    source 2003
-    target 2543
-    weight 40
-  ]
-  edge [
-    source 2003
-    target 3141
-    weight 91
-  ]
-  edge [
-    source 2003
-    target 3174
-    weight 56
-  ]
-  edge [
-    source 2003
-    target 2071
-    weight 90
-  ]
-  edge [
-    source 2003
-    target 2700
-    weight 47
-  ]
-  edge [
-    source 2003
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 2003
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 2003
-    target 3066
-    weight 36
-  ]
-  edge [
-    source 2003
-    target 3600
-    weight 38
-  ]
-  edge [
-    source 2003
-    target 3145
-    weight 58
-  ]
-  edge [
-    source 2003
-    target 3420
-    weight 21
-  ]
-  edge [
-    source 2003
-    target 3917
-    weight 28
-  ]
-  edge [
-    source 2003
-    target 2857
-    weight 29
-  ]
-  edge [
-    source 2003
-    target 3276
-    weight 34
-  ]
-  edge [
-    source 2003
-    target 3542
-    weight 30
-  ]
-  edge [
-    source 2003
-    target 2870
-    weight 24
-  ]
-  edge [
-    source 2003
-    target 3040
-    weight 31
-  ]
-  edge [
-    source 2003
-    target 3993
-    weight 26
-  ]
-  edge [
-    source 2003
-    target 2519
-    weight 33
-  ]
-  edge [
-    source 2009
-    target 3521
-    weight 42
-  ]
-  edge [
-    source 2009
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 2009
-    target 2071
-    weight 35
-  ]
-  edge [
-    source 2009
-    target 3141
-    weight 39
-  ]
-  edge [
-    source 2009
-    target 3145
-    weight 28
-  ]
-  edge [
-    source 2009
-    target 3600
-    weight 24
-  ]
-  edge [
-    source 2009
-    target 4051
-    weight 28
-  ]
-  edge [
-    source 2009
-    target 3276
-    weight 26
-  ]
-  edge [
-    source 2011
-    target 3521
-    weight 148
-  ]
-  edge [
-    source 2011
-    target 3565
-    weight 28
-  ]
-  edge [
-    source 2011
-    target 2543
-    weight 21
-  ]
-  edge [
-    source 2011
-    target 3954
-    weight 38
-  ]
-  edge [
-    source 2011
-    target 3642
-    weight 47
-  ]
-  edge [
-    source 2011
-    target 4051
-    weight 113
-  ]
-  edge [
-    source 2011
-    target 2071
-    weight 109
-  ]
-  edge [
-    source 2011
-    target 2861
-    weight 84
-  ]
-  edge [
-    source 2011
-    target 2700
-    weight 57
-  ]
-  edge [
-    source 2011
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 2011
-    target 3282
-    weight 33
-  ]
-  edge [
-    source 2011
-    target 3141
-    weight 116
-  ]
-  edge [
-    source 2011
-    target 3006
-    weight 21
-  ]
-  edge [
-    source 2011
-    target 3040
-    weight 31
-  ]
-  edge [
-    source 2011
-    target 3993
-    weight 56
-  ]
-  edge [
-    source 2011
-    target 3066
-    weight 29
-  ]
-  edge [
-    source 2011
-    target 3276
-    weight 67
-  ]
-  edge [
-    source 2011
-    target 2890
-    weight 41
-  ]
-  edge [
-    source 2011
-    target 2519
-    weight 29
-  ]
-  edge [
-    source 2011
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 2011
-    target 3174
-    weight 67
-  ]
-  edge [
-    source 2011
-    target 3145
-    weight 84
-  ]
-  edge [
-    source 2011
-    target 3917
-    weight 53
-  ]
-  edge [
-    source 2011
-    target 3600
-    weight 65
-  ]
-  edge [
-    source 2011
-    target 3542
-    weight 25
-  ]
-  edge [
-    source 2011
-    target 2287
-    weight 23
-  ]
-  edge [
-    source 2011
-    target 3374
-    weight 21
-  ]
-  edge [
-    source 2011
-    target 2857
-    weight 36
-  ]
-  edge [
-    source 2011
-    target 3443
-    weight 26
-  ]
-  edge [
-    source 2011
-    target 3423
-    weight 33
-  ]
-  edge [
-    source 2011
-    target 2058
-    weight 22
-  ]
-  edge [
-    source 2054
-    target 3521
-    weight 60
-  ]
-  edge [
-    source 2054
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 2054
-    target 4051
-    weight 56
-  ]
-  edge [
-    source 2054
-    target 2861
-    weight 41
-  ]
-  edge [
-    source 2054
-    target 3141
-    weight 52
-  ]
-  edge [
-    source 2054
-    target 2071
-    weight 47
-  ]
-  edge [
-    source 2054
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 2054
-    target 3174
-    weight 22
-  ]
-  edge [
-    source 2054
-    target 3006
-    weight 22
-  ]
-  edge [
-    source 2054
-    target 2700
-    weight 31
-  ]
-  edge [
-    source 2054
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 2054
-    target 3600
-    weight 25
-  ]
-  edge [
-    source 2058
-    target 3600
-    weight 611
-  ]
-  edge [
-    source 2058
-    target 2861
-    weight 553
-  ]
-  edge [
-    source 2058
-    target 4051
-    weight 708
-  ]
-  edge [
-    source 2058
-    target 3521
-    weight 896
-  ]
-  edge [
-    source 2058
-    target 3565
-    weight 179
-  ]
-  edge [
-    source 2058
-    target 3276
-    weight 558
-  ]
-  edge [
-    source 2058
-    target 3374
-    weight 247
-  ]
-  edge [
-    source 2058
-    target 3423
-    weight 309
-  ]
-  edge [
-    source 2058
-    target 3377
-    weight 34
-  ]
-  edge [
-    source 2058
-    target 3962
-    weight 157
-  ]
-  edge [
-    source 2058
-    target 3917
-    weight 400
-  ]
-  edge [
-    source 2058
-    target 2071
-    weight 782
-  ]
-  edge [
-    source 2058
-    target 3641
-    weight 36
-  ]
-  edge [
-    source 2058
-    target 3937
-    weight 65
-  ]
-  edge [
-    source 2058
-    target 3141
-    weight 796
-  ]
-  edge [
-    source 2058
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 2058
-    target 2227
-    weight 36
-  ]
-  edge [
-    source 2058
-    target 2191
-    weight 192
-  ]
-  edge [
-    source 2058
-    target 3993
-    weight 523
-  ]
-  edge [
-    source 2058
-    target 3860
-    weight 28
-  ]
-  edge [
-    source 2058
-    target 3542
-    weight 173
-  ]
-  edge [
-    source 2058
-    target 3420
-    weight 115
-  ]
-  edge [
-    source 2058
-    target 2700
-    weight 406
-  ]
-  edge [
-    source 2058
-    target 3954
-    weight 130
-  ]
-  edge [
-    source 2058
-    target 2287
-    weight 143
-  ]
-  edge [
-    source 2058
-    target 3642
-    weight 282
-  ]
-  edge [
-    source 2058
-    target 3077
-    weight 89
-  ]
-  edge [
-    source 2058
-    target 3282
-    weight 255
-  ]
-  edge [
-    source 2058
-    target 3177
-    weight 55
-  ]
-  edge [
-    source 2058
-    target 2204
-    weight 108
-  ]
-  edge [
-    source 2058
-    target 4154
-    weight 138
-  ]
-  edge [
-    source 2058
-    target 3174
-    weight 412
-  ]
-  edge [
-    source 2058
-    target 2857
-    weight 275
-  ]
-  edge [
-    source 2058
-    target 3295
-    weight 72
-  ]
-  edge [
-    source 2058
-    target 2890
-    weight 187
-  ]
-  edge [
-    source 2058
-    target 3066
-    weight 124
-  ]
-  edge [
-    source 2058
-    target 3443
-    weight 208
-  ]
-  edge [
-    source 2058
-    target 4162
-    weight 49
-  ]
-  edge [
-    source 2058
-    target 3636
-    weight 114
-  ]
-  edge [
-    source 2058
-    target 2543
-    weight 95
-  ]
-  edge [
-    source 2058
-    target 3006
-    weight 94
-  ]
-  edge [
-    source 2058
-    target 2870
-    weight 154
-  ]
-  edge [
-    source 2058
-    target 3145
-    weight 580
-  ]
-  edge [
-    source 2058
-    target 2553
-    weight 79
-  ]
-  edge [
-    source 2058
-    target 2519
-    weight 237
-  ]
-  edge [
-    source 2058
-    target 3071
-    weight 31
-  ]
-  edge [
-    source 2058
-    target 3040
-    weight 144
-  ]
-  edge [
-    source 2058
-    target 2800
-    weight 82
-  ]
-  edge [
-    source 2058
-    target 4187
-    weight 45
-  ]
-  edge [
-    source 2058
-    target 2810
-    weight 51
-  ]
-  edge [
-    source 2058
-    target 2099
-    weight 24
-  ]
-  edge [
-    source 2058
-    target 3847
-    weight 33
-  ]
-  edge [
-    source 2058
-    target 3253
-    weight 102
-  ]
-  edge [
-    source 2058
-    target 3877
-    weight 52
-  ]
-  edge [
-    source 2058
-    target 4040
-    weight 37
-  ]
-  edge [
-    source 2058
-    target 3052
-    weight 65
-  ]
-  edge [
-    source 2058
-    target 3884
-    weight 29
-  ]
-  edge [
-    source 2058
-    target 3408
-    weight 51
-  ]
-  edge [
-    source 2058
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 2058
-    target 2078
-    weight 48
-  ]
-  edge [
-    source 2058
-    target 3196
-    weight 21
-  ]
-  edge [
-    source 2058
-    target 2614
-    weight 29
-  ]
-  edge [
-    source 2058
-    target 3677
-    weight 21
-  ]
-  edge [
-    source 2061
-    target 3600
-    weight 39
-  ]
-  edge [
-    source 2061
-    target 3141
-    weight 59
-  ]
-  edge [
-    source 2061
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 2061
-    target 3521
-    weight 72
-  ]
-  edge [
-    source 2061
-    target 2071
-    weight 70
-  ]
-  edge [
-    source 2061
-    target 3276
-    weight 32
-  ]
-  edge [
-    source 2061
-    target 2861
-    weight 50
-  ]
-  edge [
-    source 2061
-    target 4051
-    weight 57
-  ]
-  edge [
-    source 2061
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 2061
-    target 3423
-    weight 36
-  ]
-  edge [
-    source 2061
-    target 3145
-    weight 41
-  ]
-  edge [
-    source 2061
-    target 2191
-    weight 32
-  ]
-  edge [
-    source 2061
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2061
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 2061
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 2061
-    target 3962
-    weight 24
-  ]
-  edge [
-    source 2061
-    target 3374
-    weight 22
-  ]
-  edge [
-    source 2071
-    target 2861
-    weight 10340
-  ]
-  edge [
-    source 2071
-    target 3521
-    weight 20806
-  ]
-  edge [
-    source 2071
-    target 3600
-    weight 6583
-  ]
-  edge [
-    source 2071
-    target 2191
-    weight 1074
-  ]
-  edge [
-    source 2071
-    target 3177
-    weight 190
-  ]
-  edge [
-    source 2071
-    target 3565
-    weight 1775
-  ]
-  edge [
-    source 2071
-    target 3374
-    weight 1042
-  ]
-  edge [
-    source 2071
-    target 3993
-    weight 3358
-  ]
-  edge [
-    source 2071
-    target 4051
-    weight 12265
-  ]
-  edge [
-    source 2071
-    target 3968
-    weight 116
-  ]
-  edge [
-    source 2071
-    target 2329
-    weight 111
-  ]
-  edge [
-    source 2071
-    target 2700
-    weight 3574
-  ]
-  edge [
-    source 2071
-    target 3423
-    weight 2070
-  ]
-  edge [
-    source 2071
-    target 3141
-    weight 13060
-  ]
-  edge [
-    source 2071
-    target 3642
-    weight 2674
-  ]
-  edge [
-    source 2071
-    target 3420
-    weight 508
-  ]
-  edge [
-    source 2071
-    target 3937
-    weight 251
-  ]
-  edge [
-    source 2071
-    target 3276
-    weight 4290
-  ]
-  edge [
-    source 2071
-    target 3985
-    weight 81
-  ]
-  edge [
-    source 2071
-    target 3145
-    weight 3926
-  ]
-  edge [
-    source 2071
-    target 2421
-    weight 27
-  ]
-  edge [
-    source 2071
-    target 3962
-    weight 946
-  ]
-  edge [
-    source 2071
-    target 2810
-    weight 220
-  ]
-  edge [
-    source 2071
-    target 2978
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 3752
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3282
-    weight 1261
-  ]
-  edge [
-    source 2071
-    target 2870
-    weight 829
-  ]
-  edge [
-    source 2071
-    target 3542
-    weight 993
-  ]
-  edge [
-    source 2071
-    target 3066
-    weight 633
-  ]
-  edge [
-    source 2071
-    target 3917
-    weight 1809
-  ]
-  edge [
-    source 2071
-    target 4152
-    weight 108
-  ]
-  edge [
-    source 2071
-    target 4187
-    weight 142
-  ]
-  edge [
-    source 2071
-    target 2800
-    weight 332
-  ]
-  edge [
-    source 2071
-    target 3024
-    weight 83
-  ]
-  edge [
-    source 2071
-    target 2227
-    weight 232
-  ]
-  edge [
-    source 2071
-    target 3357
-    weight 82
-  ]
-  edge [
-    source 2071
-    target 2614
-    weight 146
-  ]
-  edge [
-    source 2071
-    target 3954
-    weight 800
-  ]
-  edge [
-    source 2071
-    target 3443
-    weight 821
-  ]
-  edge [
-    source 2071
-    target 2543
-    weight 493
-  ]
-  edge [
-    source 2071
-    target 2519
-    weight 1113
-  ]
-  edge [
-    source 2071
-    target 4027
-    weight 92
-  ]
-  edge [
-    source 2071
-    target 3377
-    weight 195
-  ]
-  edge [
-    source 2071
-    target 3641
-    weight 100
-  ]
-  edge [
-    source 2071
-    target 3861
-    weight 77
-  ]
-  edge [
-    source 2071
-    target 3174
-    weight 4374
-  ]
-  edge [
-    source 2071
-    target 2198
-    weight 49
-  ]
-  edge [
-    source 2071
-    target 2628
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 2857
-    weight 1113
-  ]
-  edge [
-    source 2071
-    target 2924
-    weight 51
-  ]
-  edge [
-    source 2071
-    target 2181
-    weight 49
-  ]
-  edge [
-    source 2071
-    target 3253
-    weight 476
-  ]
-  edge [
-    source 2071
-    target 3112
-    weight 36
-  ]
-  edge [
-    source 2071
-    target 3636
-    weight 706
-  ]
-  edge [
-    source 2071
-    target 3071
-    weight 76
-  ]
-  edge [
-    source 2071
-    target 2204
-    weight 551
-  ]
-  edge [
-    source 2071
-    target 2287
-    weight 741
-  ]
-  edge [
-    source 2071
-    target 3295
-    weight 395
-  ]
-  edge [
-    source 2071
-    target 3884
-    weight 123
-  ]
-  edge [
-    source 2071
-    target 2417
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 2890
-    weight 1071
-  ]
-  edge [
-    source 2071
-    target 3040
-    weight 922
-  ]
-  edge [
-    source 2071
-    target 3006
-    weight 643
-  ]
-  edge [
-    source 2071
-    target 4040
-    weight 203
-  ]
-  edge [
-    source 2071
-    target 2609
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 4100
-    weight 33
-  ]
-  edge [
-    source 2071
-    target 3432
-    weight 93
-  ]
-  edge [
-    source 2071
-    target 2726
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3847
-    weight 228
-  ]
-  edge [
-    source 2071
-    target 3935
-    weight 63
-  ]
-  edge [
-    source 2071
-    target 3077
-    weight 495
-  ]
-  edge [
-    source 2071
-    target 3663
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 2743
-    weight 45
-  ]
-  edge [
-    source 2071
-    target 4162
-    weight 330
-  ]
-  edge [
-    source 2071
-    target 3050
-    weight 56
-  ]
-  edge [
-    source 2071
-    target 4154
-    weight 985
-  ]
-  edge [
-    source 2071
-    target 3196
-    weight 81
-  ]
-  edge [
-    source 2071
-    target 2553
-    weight 322
-  ]
-  edge [
-    source 2071
-    target 2600
-    weight 34
-  ]
-  edge [
-    source 2071
-    target 4007
-    weight 39
-  ]
-  edge [
-    source 2071
-    target 2082
-    weight 45
-  ]
-  edge [
-    source 2071
-    target 3162
-    weight 80
-  ]
-  edge [
-    source 2071
-    target 3408
-    weight 287
-  ]
-  edge [
-    source 2071
-    target 2955
-    weight 55
-  ]
-  edge [
-    source 2071
-    target 3375
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 3052
-    weight 301
-  ]
-  edge [
-    source 2071
-    target 2556
-    weight 64
-  ]
-  edge [
-    source 2071
-    target 2099
-    weight 127
-  ]
-  edge [
-    source 2071
-    target 2711
-    weight 96
-  ]
-  edge [
-    source 2071
-    target 2434
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 4160
-    weight 91
-  ]
-  edge [
-    source 2071
-    target 3324
-    weight 33
-  ]
-  edge [
-    source 2071
-    target 2832
-    weight 28
-  ]
-  edge [
-    source 2071
-    target 2570
-    weight 70
-  ]
-  edge [
-    source 2071
-    target 2844
-    weight 53
-  ]
-  edge [
-    source 2071
-    target 2573
-    weight 50
-  ]
-  edge [
-    source 2071
-    target 3693
-    weight 48
-  ]
-  edge [
-    source 2071
-    target 3956
-    weight 38
-  ]
-  edge [
-    source 2071
-    target 3860
-    weight 80
-  ]
-  edge [
-    source 2071
-    target 3877
-    weight 255
-  ]
-  edge [
-    source 2071
-    target 2597
-    weight 99
-  ]
-  edge [
-    source 2071
-    target 2450
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 2983
-    weight 34
-  ]
-  edge [
-    source 2071
-    target 3465
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3210
-    weight 22
-  ]
-  edge [
-    source 2071
-    target 3952
-    weight 25
-  ]
-  edge [
-    source 2071
-    target 4098
-    weight 89
-  ]
-  edge [
-    source 2071
-    target 2531
-    weight 80
-  ]
-  edge [
-    source 2071
-    target 3692
-    weight 28
-  ]
-  edge [
-    source 2071
-    target 3011
-    weight 31
-  ]
-  edge [
-    source 2071
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 2071
-    target 3559
-    weight 36
-  ]
-  edge [
-    source 2071
-    target 3677
-    weight 76
-  ]
-  edge [
-    source 2071
-    target 2822
-    weight 87
-  ]
-  edge [
-    source 2071
-    target 3309
-    weight 24
-  ]
-  edge [
-    source 2071
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 2071
-    target 2232
-    weight 51
-  ]
-  edge [
-    source 2071
-    target 3872
-    weight 49
-  ]
-  edge [
-    source 2071
-    target 3146
-    weight 25
-  ]
-  edge [
-    source 2071
-    target 2115
-    weight 32
-  ]
-  edge [
-    source 2071
-    target 3108
-    weight 38
-  ]
-  edge [
-    source 2071
-    target 2078
-    weight 173
-  ]
-  edge [
-    source 2071
-    target 2634
-    weight 25
-  ]
-  edge [
-    source 2071
-    target 3737
-    weight 41
-  ]
-  edge [
-    source 2071
-    target 2836
-    weight 28
-  ]
-  edge [
-    source 2071
-    target 3462
-    weight 46
-  ]
-  edge [
-    source 2071
-    target 3633
-    weight 59
-  ]
-  edge [
-    source 2071
-    target 2801
-    weight 27
-  ]
-  edge [
-    source 2071
-    target 3856
-    weight 23
-  ]
-  edge [
-    source 2071
-    target 3876
-    weight 47
-  ]
-  edge [
-    source 2078
-    target 3521
-    weight 197
-  ]
-  edge [
-    source 2078
-    target 2861
-    weight 144
-  ]
-  edge [
-    source 2078
-    target 3141
-    weight 163
-  ]
-  edge [
-    source 2078
-    target 3565
-    weight 34
-  ]
-  edge [
-    source 2078
-    target 3636
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3253
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3993
-    weight 115
-  ]
-  edge [
-    source 2078
-    target 3542
-    weight 58
-  ]
-  edge [
-    source 2078
-    target 3423
-    weight 85
-  ]
-  edge [
-    source 2078
-    target 3917
-    weight 79
-  ]
-  edge [
-    source 2078
-    target 3174
-    weight 91
-  ]
-  edge [
-    source 2078
-    target 3642
-    weight 57
-  ]
-  edge [
-    source 2078
-    target 3145
-    weight 110
-  ]
-  edge [
-    source 2078
-    target 3282
-    weight 49
-  ]
-  edge [
-    source 2078
-    target 2519
-    weight 47
-  ]
-  edge [
-    source 2078
-    target 3006
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3600
-    weight 121
-  ]
-  edge [
-    source 2078
-    target 2204
-    weight 22
-  ]
-  edge [
-    source 2078
-    target 3954
-    weight 42
-  ]
-  edge [
-    source 2078
-    target 4051
-    weight 161
-  ]
-  edge [
-    source 2078
-    target 3276
-    weight 87
-  ]
-  edge [
-    source 2078
-    target 3420
-    weight 34
-  ]
-  edge [
-    source 2078
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 2078
-    target 2700
-    weight 88
-  ]
-  edge [
-    source 2078
-    target 2800
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 2810
-    weight 21
-  ]
-  edge [
-    source 2078
-    target 2191
-    weight 63
-  ]
-  edge [
-    source 2078
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 2078
-    target 3962
-    weight 42
-  ]
-  edge [
-    source 2078
-    target 2890
-    weight 36
-  ]
-  edge [
-    source 2078
-    target 2870
-    weight 32
-  ]
-  edge [
-    source 2078
-    target 3937
-    weight 25
-  ]
-  edge [
-    source 2078
-    target 3040
-    weight 36
-  ]
-  edge [
-    source 2078
-    target 3374
-    weight 48
-  ]
-  edge [
-    source 2078
-    target 3443
-    weight 40
-  ]
-  edge [
-    source 2078
-    target 3066
-    weight 32
-  ]
-  edge [
-    source 2078
-    target 2287
-    weight 29
-  ]
-  edge [
-    source 2078
-    target 3077
-    weight 27
-  ]
-  edge [
-    source 2082
-    target 2861
-    weight 40
-  ]
-  edge [
-    source 2082
-    target 3521
-    weight 54
-  ]
-  edge [
-    source 2082
-    target 4051
-    weight 46
-  ]
-  edge [
-    source 2082
-    target 3145
-    weight 32
-  ]
-  edge [
-    source 2082
-    target 2870
-    weight 24
-  ]
-  edge [
-    source 2082
-    target 3636
-    weight 22
-  ]
-  edge [
-    source 2082
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 2082
-    target 3141
-    weight 47
-  ]
-  edge [
-    source 2082
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 2082
-    target 2700
-    weight 29
-  ]
-  edge [
-    source 2082
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2082
-    target 3542
-    weight 24
-  ]
-  edge [
-    source 2082
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 2082
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 2099
-    target 3521
-    weight 152
-  ]
-  edge [
-    source 2099
-    target 3374
-    weight 52
-  ]
-  edge [
-    source 2099
-    target 2700
-    weight 60
-  ]
-  edge [
-    source 2099
-    target 3423
-    weight 55
-  ]
-  edge [
-    source 2099
-    target 3600
-    weight 75
-  ]
-  edge [
-    source 2099
-    target 3077
-    weight 30
-  ]
-  edge [
-    source 2099
-    target 2287
-    weight 22
-  ]
-  edge [
-    source 2099
-    target 4051
-    weight 117
-  ]
-  edge [
-    source 2099
-    target 3408
-    weight 31
-  ]
-  edge [
-    source 2099
-    target 3276
-    weight 59
-  ]
-  edge [
-    source 2099
-    target 2191
-    weight 32
-  ]
-  edge [
-    source 2099
-    target 3145
-    weight 82
-  ]
-  edge [
-    source 2099
-    target 3066
-    weight 22
-  ]
-  edge [
-    source 2099
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 2099
-    target 2861
-    weight 99
-  ]
-  edge [
-    source 2099
-    target 3141
-    weight 118
-  ]
-  edge [
-    source 2099
-    target 3174
-    weight 60
-  ]
-  edge [
-    source 2099
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 2099
-    target 3917
-    weight 52
-  ]
-  edge [
-    source 2099
-    target 2890
-    weight 23
-  ]
-  edge [
-    source 2099
-    target 2519
-    weight 34
-  ]
-  edge [
-    source 2099
-    target 3962
-    weight 24
-  ]
-  edge [
-    source 2099
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 2099
-    target 3040
-    weight 27
-  ]
-  edge [
-    source 2099
-    target 2857
-    weight 31
-  ]
-  edge [
-    source 2115
-    target 3521
-    weight 46
-  ]
-  edge [
-    source 2115
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2115
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 2115
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 2115
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 2115
-    target 3174
-    weight 21
-  ]
-  edge [
-    source 2115
-    target 3276
-    weight 22
-  ]
-  edge [
-    source 2169
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 2181
-    target 2861
-    weight 39
-  ]
-  edge [
-    source 2181
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 2181
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 2181
-    target 3282
-    weight 31
-  ]
-  edge [
-    source 2181
-    target 3542
-    weight 25
-  ]
-  edge [
-    source 2181
-    target 3145
-    weight 39
-  ]
-  edge [
-    source 2181
-    target 2700
-    weight 35
-  ]
-  edge [
-    source 2181
-    target 3917
-    weight 33
-  ]
-  edge [
-    source 2181
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2181
-    target 3276
-    weight 36
-  ]
-  edge [
-    source 2181
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 2181
-    target 3141
-    weight 52
-  ]
-  edge [
-    source 2181
-    target 3600
-    weight 32
-  ]
-  edge [
-    source 2181
-    target 2857
-    weight 22
-  ]
-  edge [
-    source 2181
-    target 2519
-    weight 22
-  ]
-  edge [
-    source 2181
-    target 3993
-    weight 29
-  ]
-  edge [
-    source 2191
-    target 3600
-    weight 724
-  ]
-  edge [
-    source 2191
-    target 3521
-    weight 1291
-  ]
-  edge [
-    source 2191
-    target 2861
-    weight 835
-  ]
-  edge [
-    source 2191
-    target 3565
-    weight 259
-  ]
-  edge [
-    source 2191
-    target 3276
-    weight 497
-  ]
-  edge [
-    source 2191
-    target 3077
-    weight 150
-  ]
-  edge [
-    source 2191
-    target 3177
-    weight 56
-  ]
-  edge [
-    source 2191
-    target 3374
-    weight 262
-  ]
-  edge [
-    source 2191
-    target 4051
-    weight 935
-  ]
-  edge [
-    source 2191
-    target 3423
-    weight 497
-  ]
-  edge [
-    source 2191
-    target 3145
-    weight 541
-  ]
-  edge [
-    source 2191
-    target 3642
-    weight 261
-  ]
-  edge [
-    source 2191
-    target 3641
-    weight 42
-  ]
-  edge [
-    source 2191
-    target 3937
-    weight 99
-  ]
-  edge [
-    source 2191
-    target 3174
-    weight 455
-  ]
-  edge [
-    source 2191
-    target 2700
-    weight 414
-  ]
-  edge [
-    source 2191
-    target 3071
-    weight 27
-  ]
-  edge [
-    source 2191
-    target 3141
-    weight 956
-  ]
-  edge [
-    source 2191
-    target 3420
-    weight 123
-  ]
-  edge [
-    source 2191
-    target 3993
-    weight 566
-  ]
-  edge [
-    source 2191
-    target 3962
-    weight 200
-  ]
-  edge [
-    source 2191
-    target 3542
-    weight 155
-  ]
-  edge [
-    source 2191
-    target 2800
-    weight 71
-  ]
-  edge [
-    source 2191
-    target 3443
-    weight 162
-  ]
-  edge [
-    source 2191
-    target 3282
-    weight 197
-  ]
-  edge [
-    source 2191
-    target 3917
-    weight 324
-  ]
-  edge [
-    source 2191
-    target 2543
-    weight 110
-  ]
-  edge [
-    source 2191
-    target 2870
-    weight 124
-  ]
-  edge [
-    source 2191
-    target 3066
-    weight 107
-  ]
-  edge [
-    source 2191
-    target 2227
-    weight 59
-  ]
-  edge [
-    source 2191
-    target 3954
-    weight 144
-  ]
-  edge [
-    source 2191
-    target 2198
-    weight 23
-  ]
-  edge [
-    source 2191
-    target 2810
-    weight 63
-  ]
-  edge [
-    source 2191
-    target 3357
-    weight 22
-  ]
-  edge [
-    source 2191
-    target 3432
-    weight 28
-  ]
-  edge [
-    source 2191
-    target 4187
-    weight 49
-  ]
-  edge [
-    source 2191
-    target 2890
-    weight 150
-  ]
-  edge [
-    source 2191
-    target 3040
-    weight 164
-  ]
-  edge [
-    source 2191
-    target 3295
-    weight 63
-  ]
-  edge [
-    source 2191
-    target 3253
-    weight 97
-  ]
-  edge [
-    source 2191
-    target 3408
-    weight 66
-  ]
-  edge [
-    source 2191
-    target 3636
-    weight 126
-  ]
-  edge [
-    source 2191
-    target 2857
-    weight 217
-  ]
-  edge [
-    source 2191
-    target 2204
-    weight 77
-  ]
-  edge [
-    source 2191
-    target 4027
-    weight 28
-  ]
-  edge [
-    source 2191
-    target 3052
-    weight 54
-  ]
-  edge [
-    source 2191
-    target 2519
-    weight 185
-  ]
-  edge [
-    source 2191
-    target 2287
-    weight 150
-  ]
-  edge [
-    source 2191
-    target 4162
-    weight 63
-  ]
-  edge [
-    source 2191
-    target 3861
-    weight 23
-  ]
-  edge [
-    source 2191
-    target 4154
-    weight 133
-  ]
-  edge [
-    source 2191
-    target 3006
-    weight 109
-  ]
-  edge [
-    source 2191
-    target 3847
-    weight 33
-  ]
-  edge [
-    source 2191
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 2191
-    target 2597
-    weight 29
-  ]
-  edge [
-    source 2191
-    target 2553
-    weight 58
-  ]
-  edge [
-    source 2191
-    target 3877
-    weight 60
-  ]
-  edge [
-    source 2191
-    target 2614
-    weight 27
-  ]
-  edge [
-    source 2191
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 2191
-    target 3196
-    weight 22
-  ]
-  edge [
-    source 2191
-    target 4098
-    weight 26
-  ]
-  edge [
-    source 2191
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 2191
-    target 3377
-    weight 51
-  ]
-  edge [
-    source 2191
-    target 4040
-    weight 38
-  ]
-  edge [
-    source 2198
-    target 4051
-    weight 42
-  ]
-  edge [
-    source 2198
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 2198
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 2198
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 2198
-    target 2861
-    weight 36
-  ]
-  edge [
-    source 2198
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 2198
-    target 3145
-    weight 21
-  ]
-  edge [
-    source 2198
-    target 3141
-    weight 36
-  ]
-  edge [
-    source 2198
-    target 3174
-    weight 24
-  ]
-  edge [
-    source 2204
-    target 3521
-    weight 692
-  ]
-  edge [
-    source 2204
-    target 3282
-    weight 232
-  ]
-  edge [
-    source 2204
-    target 2861
-    weight 418
-  ]
-  edge [
-    source 2204
-    target 3276
-    weight 332
-  ]
-  edge [
-    source 2204
-    target 3141
-    weight 587
-  ]
-  edge [
-    source 2204
-    target 2614
-    weight 47
-  ]
-  edge [
-    source 2204
-    target 3636
-    weight 178
-  ]
-  edge [
-    source 2204
-    target 3253
-    weight 121
-  ]
-  edge [
-    source 2204
-    target 3917
-    weight 230
-  ]
-  edge [
-    source 2204
-    target 4051
-    weight 530
-  ]
-  edge [
-    source 2204
-    target 3542
-    weight 181
-  ]
-  edge [
-    source 2204
-    target 3066
-    weight 154
-  ]
-  edge [
-    source 2204
-    target 2800
-    weight 80
-  ]
-  edge [
-    source 2204
-    target 2287
-    weight 154
-  ]
-  edge [
-    source 2204
-    target 3600
-    weight 359
-  ]
-  edge [
-    source 2204
-    target 3565
-    weight 157
-  ]
-  edge [
-    source 2204
-    target 2700
-    weight 343
-  ]
-  edge [
-    source 2204
-    target 3423
-    weight 129
-  ]
-  edge [
-    source 2204
-    target 2870
-    weight 179
-  ]
-  edge [
-    source 2204
-    target 3006
-    weight 115
-  ]
-  edge [
-    source 2204
-    target 3040
-    weight 121
-  ]
-  edge [
-    source 2204
-    target 3937
-    weight 42
-  ]
-  edge [
-    source 2204
-    target 3145
-    weight 361
-  ]
-  edge [
-    source 2204
-    target 3443
-    weight 150
-  ]
-  edge [
-    source 2204
-    target 3993
-    weight 308
-  ]
-  edge [
-    source 2204
-    target 4187
-    weight 23
-  ]
-  edge [
-    source 2204
-    target 3174
-    weight 275
-  ]
-  edge [
-    source 2204
-    target 3642
-    weight 207
-  ]
-  edge [
-    source 2204
-    target 3374
-    weight 117
-  ]
-  edge [
-    source 2204
-    target 2890
-    weight 135
-  ]
-  edge [
-    source 2204
-    target 2570
-    weight 26
-  ]
-  edge [
-    source 2204
-    target 3847
-    weight 64
-  ]
-  edge [
-    source 2204
-    target 3420
-    weight 119
-  ]
-  edge [
-    source 2204
-    target 4152
-    weight 21
-  ]
-  edge [
-    source 2204
-    target 2553
-    weight 88
-  ]
-  edge [
-    source 2204
-    target 2810
-    weight 42
-  ]
-  edge [
-    source 2204
-    target 2329
-    weight 37
-  ]
-  edge [
-    source 2204
-    target 3884
-    weight 51
-  ]
-  edge [
-    source 2204
-    target 2844
-    weight 42
-  ]
-  edge [
-    source 2204
-    target 3377
-    weight 32
-  ]
-  edge [
-    source 2204
-    target 2519
-    weight 152
-  ]
-  edge [
-    source 2204
-    target 3962
-    weight 115
-  ]
-  edge [
-    source 2204
-    target 4162
-    weight 47
-  ]
-  edge [
-    source 2204
-    target 2543
-    weight 105
-  ]
-  edge [
-    source 2204
-    target 4154
-    weight 134
-  ]
-  edge [
-    source 2204
-    target 2857
-    weight 202
-  ]
-  edge [
-    source 2204
-    target 3177
-    weight 41
-  ]
-  edge [
-    source 2204
-    target 4027
-    weight 24
-  ]
-  edge [
-    source 2204
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3408
-    weight 26
-  ]
-  edge [
-    source 2204
-    target 4040
-    weight 40
-  ]
-  edge [
-    source 2204
-    target 3954
-    weight 142
-  ]
-  edge [
-    source 2204
-    target 2556
-    weight 22
-  ]
-  edge [
-    source 2204
-    target 4160
-    weight 24
-  ]
-  edge [
-    source 2204
-    target 3295
-    weight 70
-  ]
-  edge [
-    source 2204
-    target 2711
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3432
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3052
-    weight 83
-  ]
-  edge [
-    source 2204
-    target 3077
-    weight 31
-  ]
-  edge [
-    source 2204
-    target 3877
-    weight 36
-  ]
-  edge [
-    source 2204
-    target 3985
-    weight 25
-  ]
-  edge [
-    source 2204
-    target 3196
-    weight 21
-  ]
-  edge [
-    source 2217
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 2227
-    target 3521
-    weight 348
-  ]
-  edge [
-    source 2227
-    target 3423
-    weight 114
-  ]
-  edge [
-    source 2227
-    target 2861
-    weight 153
-  ]
-  edge [
-    source 2227
-    target 3600
-    weight 125
-  ]
-  edge [
-    source 2227
-    target 3374
-    weight 63
-  ]
-  edge [
-    source 2227
-    target 2857
-    weight 36
-  ]
-  edge [
-    source 2227
-    target 3077
-    weight 57
-  ]
-  edge [
-    source 2227
-    target 4051
-    weight 178
-  ]
-  edge [
-    source 2227
-    target 3917
-    weight 49
-  ]
-  edge [
-    source 2227
-    target 3276
-    weight 83
-  ]
-  edge [
-    source 2227
-    target 3565
-    weight 32
-  ]
-  edge [
-    source 2227
-    target 3993
-    weight 85
-  ]
-  edge [
-    source 2227
-    target 2597
-    weight 22
-  ]
-  edge [
-    source 2227
-    target 3962
-    weight 72
-  ]
-  edge [
-    source 2227
-    target 3642
-    weight 50
-  ]
-  edge [
-    source 2227
-    target 2700
-    weight 55
-  ]
-  edge [
-    source 2227
-    target 3772
-    weight 31
-  ]
-  edge [
-    source 2227
-    target 3141
-    weight 183
-  ]
-  edge [
-    source 2227
-    target 3408
-    weight 31
-  ]
-  edge [
-    source 2227
-    target 2890
-    weight 28
-  ]
-  edge [
-    source 2227
-    target 3145
-    weight 82
-  ]
-  edge [
-    source 2227
-    target 3174
-    weight 70
-  ]
-  edge [
-    source 2227
-    target 2519
-    weight 42
-  ]
-  edge [
-    source 2227
-    target 3443
-    weight 21
-  ]
-  edge [
-    source 2230
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 2230
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 2232
-    target 2861
-    weight 48
-  ]
-  edge [
-    source 2232
-    target 3521
-    weight 58
-  ]
-  edge [
-    source 2232
-    target 3006
-    weight 21
-  ]
-  edge [
-    source 2232
-    target 4051
-    weight 56
-  ]
-  edge [
-    source 2232
-    target 3066
-    weight 24
-  ]
-  edge [
-    source 2232
-    target 3141
-    weight 47
-  ]
-  edge [
-    source 2232
-    target 3954
-    weight 24
-  ]
-  edge [
-    source 2232
-    target 3642
-    weight 22
-  ]
-  edge [
-    source 2232
-    target 2700
-    weight 28
-  ]
-  edge [
-    source 2232
-    target 3276
-    weight 24
-  ]
-  edge [
-    source 2232
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 2232
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 2232
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 2237
-    target 3521
-    weight 26
-  ]
-  edge [
-    source 2262
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 2287
-    target 3141
-    weight 737
-  ]
-  edge [
-    source 2287
-    target 2614
-    weight 43
-  ]
-  edge [
-    source 2287
-    target 3636
-    weight 177
-  ]
-  edge [
-    source 2287
-    target 3253
-    weight 114
-  ]
-  edge [
-    source 2287
-    target 3917
-    weight 299
-  ]
-  edge [
-    source 2287
-    target 4051
-    weight 723
-  ]
-  edge [
-    source 2287
-    target 3542
-    weight 212
-  ]
-  edge [
-    source 2287
-    target 2800
-    weight 86
-  ]
-  edge [
-    source 2287
-    target 3066
-    weight 200
-  ]
-  edge [
-    source 2287
-    target 3600
-    weight 520
-  ]
-  edge [
-    source 2287
-    target 2861
-    weight 605
-  ]
-  edge [
-    source 2287
-    target 3282
-    weight 290
-  ]
-  edge [
-    source 2287
-    target 3521
-    weight 856
-  ]
-  edge [
-    source 2287
-    target 3565
-    weight 196
-  ]
-  edge [
-    source 2287
-    target 3276
-    weight 431
-  ]
-  edge [
-    source 2287
-    target 3937
-    weight 74
-  ]
-  edge [
-    source 2287
-    target 3040
-    weight 234
-  ]
-  edge [
-    source 2287
-    target 3145
-    weight 511
-  ]
-  edge [
-    source 2287
-    target 2700
-    weight 433
-  ]
-  edge [
-    source 2287
-    target 3993
-    weight 432
-  ]
-  edge [
-    source 2287
-    target 4187
-    weight 46
-  ]
-  edge [
-    source 2287
-    target 3443
-    weight 170
-  ]
-  edge [
-    source 2287
-    target 3006
-    weight 182
-  ]
-  edge [
-    source 2287
-    target 3052
-    weight 81
-  ]
-  edge [
-    source 2287
-    target 3423
-    weight 223
-  ]
-  edge [
-    source 2287
-    target 2870
-    weight 222
-  ]
-  edge [
-    source 2287
-    target 4160
-    weight 23
-  ]
-  edge [
-    source 2287
-    target 3884
-    weight 48
-  ]
-  edge [
-    source 2287
-    target 3174
-    weight 410
-  ]
-  edge [
-    source 2287
-    target 3642
-    weight 278
-  ]
-  edge [
-    source 2287
-    target 4098
-    weight 25
-  ]
-  edge [
-    source 2287
-    target 3954
-    weight 221
-  ]
-  edge [
-    source 2287
-    target 3374
-    weight 193
-  ]
-  edge [
-    source 2287
-    target 2890
-    weight 174
-  ]
-  edge [
-    source 2287
-    target 2570
-    weight 21
-  ]
-  edge [
-    source 2287
-    target 3847
-    weight 58
-  ]
-  edge [
-    source 2287
-    target 3420
-    weight 133
-  ]
-  edge [
-    source 2287
-    target 2711
-    weight 56
-  ]
-  edge [
-    source 2287
-    target 4152
-    weight 27
-  ]
-  edge [
-    source 2287
-    target 2553
-    weight 87
-  ]
-  edge [
-    source 2287
-    target 2810
-    weight 65
-  ]
-  edge [
-    source 2287
-    target 3177
-    weight 49
-  ]
-  edge [
-    source 2287
-    target 3377
-    weight 50
-  ]
-  edge [
-    source 2287
-    target 4154
-    weight 198
-  ]
-  edge [
-    source 2287
-    target 4040
-    weight 54
-  ]
-  edge [
-    source 2287
-    target 4162
-    weight 84
-  ]
-  edge [
-    source 2287
-    target 3962
-    weight 133
-  ]
-  edge [
-    source 2287
-    target 3408
-    weight 35
-  ]
-  edge [
-    source 2287
-    target 2543
-    weight 142
-  ]
-  edge [
-    source 2287
-    target 4027
-    weight 30
-  ]
-  edge [
-    source 2287
-    target 3860
-    weight 26
-  ]
-  edge [
-    source 2287
-    target 3295
-    weight 71
-  ]
-  edge [
-    source 2287
-    target 2329
-    weight 32
-  ]
-  edge [
-    source 2287
-    target 3077
-    weight 50
-  ]
-  edge [
-    source 2287
-    target 2857
-    weight 246
-  ]
-  edge [
-    source 2287
-    target 2519
-    weight 220
-  ]
-  edge [
-    source 2287
-    target 3877
-    weight 48
-  ]
-  edge [
-    source 2287
-    target 3432
-    weight 33
-  ]
-  edge [
-    source 2287
-    target 2556
-    weight 21
-  ]
-  edge [
-    source 2287
-    target 3196
-    weight 25
-  ]
-  edge [
-    source 2299
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 2299
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 2329
-    target 3600
-    weight 79
-  ]
-  edge [
-    source 2329
-    target 2861
-    weight 92
-  ]
-  edge [
-    source 2329
-    target 3521
-    weight 149
-  ]
-  edge [
-    source 2329
-    target 2870
-    weight 40
-  ]
-  edge [
-    source 2329
-    target 3420
-    weight 22
-  ]
-  edge [
-    source 2329
-    target 2700
-    weight 70
-  ]
-  edge [
-    source 2329
-    target 3443
-    weight 38
-  ]
-  edge [
-    source 2329
-    target 3565
-    weight 42
-  ]
-  edge [
-    source 2329
-    target 3282
-    weight 56
-  ]
-  edge [
-    source 2329
-    target 3141
-    weight 128
-  ]
-  edge [
-    source 2329
-    target 3847
-    weight 28
-  ]
-  edge [
-    source 2329
-    target 3642
-    weight 49
-  ]
-  edge [
-    source 2329
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 2329
-    target 3993
-    weight 71
-  ]
-  edge [
-    source 2329
-    target 4051
-    weight 107
-  ]
-  edge [
-    source 2329
-    target 3040
-    weight 30
-  ]
-  edge [
-    source 2329
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 2329
-    target 3174
-    weight 54
-  ]
-  edge [
-    source 2329
-    target 3636
-    weight 44
-  ]
-  edge [
-    source 2329
-    target 3935
-    weight 23
-  ]
-  edge [
-    source 2329
-    target 3542
-    weight 35
-  ]
-  edge [
-    source 2329
-    target 3006
-    weight 24
-  ]
-  edge [
-    source 2329
-    target 4154
-    weight 26
-  ]
-  edge [
-    source 2329
-    target 2543
-    weight 26
-  ]
-  edge [
-    source 2329
-    target 3066
-    weight 28
-  ]
-  edge [
-    source 2329
-    target 3145
-    weight 80
-  ]
-  edge [
-    source 2329
-    target 2890
-    weight 30
-  ]
-  edge [
-    source 2329
-    target 2800
-    weight 23
-  ]
-  edge [
-    source 2329
-    target 3276
-    weight 53
-  ]
-  edge [
-    source 2329
-    target 2519
-    weight 39
-  ]
-  edge [
-    source 2329
-    target 3917
-    weight 39
-  ]
-  edge [
-    source 2329
-    target 2857
-    weight 33
-  ]
-  edge [
-    source 2373
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 2374
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 2374
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 2382
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 2417
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 2417
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 2417
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2417
-    target 3141
-    weight 21
-  ]
-  edge [
-    source 2421
-    target 3521
-    weight 102
-  ]
-  edge [
-    source 2421
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2421
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 2421
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 2434
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2434
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 2434
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 2434
-    target 3141
-    weight 27
-  ]
-  edge [
-    source 2450
-    target 3521
-    weight 50
-  ]
-  edge [
-    source 2450
-    target 2870
-    weight 35
-  ]
-  edge [
-    source 2450
-    target 2861
-    weight 31
-  ]
-  edge [
-    source 2450
-    target 3141
-    weight 38
-  ]
-  edge [
-    source 2450
-    target 4051
-    weight 41
-  ]
-  edge [
-    source 2450
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 2450
-    target 2700
-    weight 27
-  ]
-  edge [
-    source 2450
-    target 3565
-    weight 28
-  ]
-  edge [
-    source 2450
-    target 3600
-    weight 24
-  ]
-  edge [
-    source 2459
-    target 3521
-    weight 46
-  ]
-  edge [
-    source 2519
-    target 3521
-    weight 1386
-  ]
-  edge [
-    source 2519
-    target 3145
-    weight 985
-  ]
-  edge [
-    source 2519
-    target 3377
-    weight 64
-  ]
-  edge [
-    source 2519
-    target 2543
-    weight 170
-  ]
-  edge [
-    source 2519
-    target 3600
-    weight 772
-  ]
-  edge [
-    source 2519
-    target 2861
-    weight 913
-  ]
-  edge [
-    source 2519
-    target 4027
-    weight 39
-  ]
-  edge [
-    source 2519
-    target 4051
-    weight 1102
-  ]
-  edge [
-    source 2519
-    target 3565
-    weight 270
-  ]
-  edge [
-    source 2519
-    target 3276
-    weight 682
-  ]
-  edge [
-    source 2519
-    target 3993
-    weight 614
-  ]
-  edge [
-    source 2519
-    target 3642
-    weight 400
-  ]
-  edge [
-    source 2519
-    target 3917
-    weight 549
-  ]
-  edge [
-    source 2519
-    target 3174
-    weight 658
-  ]
-  edge [
-    source 2519
-    target 3141
-    weight 1199
-  ]
-  edge [
-    source 2519
-    target 3636
-    weight 221
-  ]
-  edge [
-    source 2519
-    target 3420
-    weight 164
-  ]
-  edge [
-    source 2519
-    target 3006
-    weight 186
-  ]
-  edge [
-    source 2519
-    target 2700
-    weight 697
-  ]
-  edge [
-    source 2519
-    target 3954
-    weight 242
-  ]
-  edge [
-    source 2519
-    target 3423
-    weight 310
-  ]
-  edge [
-    source 2519
-    target 3861
-    weight 21
-  ]
-  edge [
-    source 2519
-    target 3040
-    weight 244
-  ]
-  edge [
-    source 2519
-    target 3282
-    weight 384
-  ]
-  edge [
-    source 2519
-    target 3962
-    weight 198
-  ]
-  edge [
-    source 2519
-    target 2810
-    weight 71
-  ]
-  edge [
-    source 2519
-    target 3937
-    weight 68
-  ]
-  edge [
-    source 2519
-    target 3071
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 2890
-    weight 311
-  ]
-  edge [
-    source 2519
-    target 3443
-    weight 258
-  ]
-  edge [
-    source 2519
-    target 2553
-    weight 149
-  ]
-  edge [
-    source 2519
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 2519
-    target 3374
-    weight 239
-  ]
-  edge [
-    source 2519
-    target 2870
-    weight 247
-  ]
-  edge [
-    source 2519
-    target 3066
-    weight 213
-  ]
-  edge [
-    source 2519
-    target 3295
-    weight 121
-  ]
-  edge [
-    source 2519
-    target 4154
-    weight 255
-  ]
-  edge [
-    source 2519
-    target 2800
-    weight 119
-  ]
-  edge [
-    source 2519
-    target 3253
-    weight 190
-  ]
-  edge [
-    source 2519
-    target 3542
-    weight 299
-  ]
-  edge [
-    source 2519
-    target 3847
-    weight 66
-  ]
-  edge [
-    source 2519
-    target 4162
-    weight 100
-  ]
-  edge [
-    source 2519
-    target 4040
-    weight 76
-  ]
-  edge [
-    source 2519
-    target 3884
-    weight 44
-  ]
-  edge [
-    source 2519
-    target 3432
-    weight 35
-  ]
-  edge [
-    source 2519
-    target 3968
-    weight 31
-  ]
-  edge [
-    source 2519
-    target 2822
-    weight 29
-  ]
-  edge [
-    source 2519
-    target 3677
-    weight 43
-  ]
-  edge [
-    source 2519
-    target 2857
-    weight 392
-  ]
-  edge [
-    source 2519
-    target 3872
-    weight 31
-  ]
-  edge [
-    source 2519
-    target 2924
-    weight 21
-  ]
-  edge [
-    source 2519
-    target 2531
-    weight 25
-  ]
-  edge [
-    source 2519
-    target 2711
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 3177
-    weight 63
-  ]
-  edge [
-    source 2519
-    target 3196
-    weight 31
-  ]
-  edge [
-    source 2519
-    target 3162
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 3077
-    weight 63
-  ]
-  edge [
-    source 2519
-    target 3052
-    weight 113
-  ]
-  edge [
-    source 2519
-    target 2570
-    weight 26
-  ]
-  edge [
-    source 2519
-    target 3877
-    weight 72
-  ]
-  edge [
-    source 2519
-    target 2556
-    weight 28
-  ]
-  edge [
-    source 2519
-    target 3860
-    weight 28
-  ]
-  edge [
-    source 2519
-    target 2743
-    weight 21
-  ]
-  edge [
-    source 2519
-    target 3408
-    weight 48
-  ]
-  edge [
-    source 2519
-    target 3641
-    weight 30
-  ]
-  edge [
-    source 2519
-    target 4187
-    weight 35
-  ]
-  edge [
-    source 2519
-    target 2614
-    weight 53
-  ]
-  edge [
-    source 2519
-    target 4098
-    weight 22
-  ]
-  edge [
-    source 2531
-    target 4051
-    weight 84
-  ]
-  edge [
-    source 2531
-    target 3642
-    weight 41
-  ]
-  edge [
-    source 2531
-    target 3521
-    weight 99
-  ]
-  edge [
-    source 2531
-    target 3174
-    weight 55
-  ]
-  edge [
-    source 2531
-    target 3066
-    weight 25
-  ]
-  edge [
-    source 2531
-    target 2861
-    weight 75
-  ]
-  edge [
-    source 2531
-    target 4154
-    weight 32
-  ]
-  edge [
-    source 2531
-    target 3423
-    weight 26
-  ]
-  edge [
-    source 2531
-    target 3141
-    weight 78
-  ]
-  edge [
-    source 2531
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 2531
-    target 3276
-    weight 42
-  ]
-  edge [
-    source 2531
-    target 2700
-    weight 44
-  ]
-  edge [
-    source 2531
-    target 3145
-    weight 48
-  ]
-  edge [
-    source 2531
-    target 3006
-    weight 31
-  ]
-  edge [
-    source 2531
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 2531
-    target 2857
-    weight 24
-  ]
-  edge [
-    source 2531
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 2531
-    target 3040
-    weight 24
-  ]
-  edge [
-    source 2531
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 2531
-    target 3600
-    weight 41
-  ]
-  edge [
-    source 2543
-    target 3521
-    weight 673
-  ]
-  edge [
-    source 2543
-    target 3066
-    weight 163
-  ]
-  edge [
-    source 2543
-    target 4051
-    weight 560
-  ]
-  edge [
-    source 2543
-    target 3174
-    weight 441
-  ]
-  edge [
-    source 2543
-    target 3253
-    weight 122
-  ]
-  edge [
-    source 2543
-    target 3377
-    weight 112
-  ]
-  edge [
-    source 2543
-    target 2861
-    weight 432
-  ]
-  edge [
-    source 2543
-    target 3642
-    weight 255
-  ]
-  edge [
-    source 2543
-    target 3145
-    weight 356
-  ]
-  edge [
-    source 2543
-    target 3600
-    weight 327
-  ]
-  edge [
-    source 2543
-    target 4027
-    weight 24
-  ]
-  edge [
-    source 2543
-    target 3565
-    weight 152
-  ]
-  edge [
-    source 2543
-    target 2800
-    weight 58
-  ]
-  edge [
-    source 2543
-    target 3276
-    weight 295
-  ]
-  edge [
-    source 2543
-    target 3295
-    weight 114
-  ]
-  edge [
-    source 2543
-    target 3954
-    weight 185
-  ]
-  edge [
-    source 2543
-    target 3141
-    weight 538
-  ]
-  edge [
-    source 2543
-    target 3993
-    weight 257
-  ]
-  edge [
-    source 2543
-    target 3542
-    weight 168
-  ]
-  edge [
-    source 2543
-    target 2700
-    weight 310
-  ]
-  edge [
-    source 2543
-    target 3282
-    weight 197
-  ]
-  edge [
-    source 2543
-    target 3006
-    weight 115
-  ]
-  edge [
-    source 2543
-    target 2870
-    weight 157
-  ]
-  edge [
-    source 2543
-    target 3636
-    weight 139
-  ]
-  edge [
-    source 2543
-    target 3443
-    weight 127
-  ]
-  edge [
-    source 2543
-    target 2810
-    weight 40
-  ]
-  edge [
-    source 2543
-    target 2553
-    weight 81
-  ]
-  edge [
-    source 2543
-    target 3847
-    weight 52
-  ]
-  edge [
-    source 2543
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 2543
-    target 2857
-    weight 181
-  ]
-  edge [
-    source 2543
-    target 3884
-    weight 40
-  ]
-  edge [
-    source 2543
-    target 3040
-    weight 126
-  ]
-  edge [
-    source 2543
-    target 2711
-    weight 25
-  ]
-  edge [
-    source 2543
-    target 3196
-    weight 33
-  ]
-  edge [
-    source 2543
-    target 4154
-    weight 143
-  ]
-  edge [
-    source 2543
-    target 3956
-    weight 34
-  ]
-  edge [
-    source 2543
-    target 3052
-    weight 84
-  ]
-  edge [
-    source 2543
-    target 3917
-    weight 200
-  ]
-  edge [
-    source 2543
-    target 2614
-    weight 34
-  ]
-  edge [
-    source 2543
-    target 3962
-    weight 91
-  ]
-  edge [
-    source 2543
-    target 3420
-    weight 100
-  ]
-  edge [
-    source 2543
-    target 3860
-    weight 26
-  ]
-  edge [
-    source 2543
-    target 3408
-    weight 23
-  ]
-  edge [
-    source 2543
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 2543
-    target 2890
-    weight 111
-  ]
-  edge [
-    source 2543
-    target 3423
-    weight 121
-  ]
-  edge [
-    source 2543
-    target 3374
-    weight 108
-  ]
-  edge [
-    source 2543
-    target 4162
-    weight 63
-  ]
-  edge [
-    source 2543
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 2543
-    target 3937
-    weight 43
-  ]
-  edge [
-    source 2543
-    target 3077
-    weight 32
-  ]
-  edge [
-    source 2543
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 2543
-    target 3177
-    weight 32
-  ]
-  edge [
-    source 2543
-    target 3641
-    weight 21
-  ]
-  edge [
-    source 2543
-    target 3877
-    weight 37
-  ]
-  edge [
-    source 2553
-    target 3521
-    weight 417
-  ]
-  edge [
-    source 2553
-    target 2857
-    weight 179
-  ]
-  edge [
-    source 2553
-    target 3276
-    weight 229
-  ]
-  edge [
-    source 2553
-    target 3642
-    weight 134
-  ]
-  edge [
-    source 2553
-    target 3917
-    weight 176
-  ]
-  edge [
-    source 2553
-    target 3993
-    weight 195
-  ]
-  edge [
-    source 2553
-    target 4051
-    weight 317
-  ]
-  edge [
-    source 2553
-    target 2700
-    weight 246
-  ]
-  edge [
-    source 2553
-    target 2810
-    weight 31
-  ]
-  edge [
-    source 2553
-    target 2870
-    weight 129
-  ]
-  edge [
-    source 2553
-    target 3282
-    weight 181
-  ]
-  edge [
-    source 2553
-    target 3565
-    weight 111
-  ]
-  edge [
-    source 2553
-    target 3600
-    weight 229
-  ]
-  edge [
-    source 2553
-    target 3847
-    weight 53
-  ]
-  edge [
-    source 2553
-    target 3542
-    weight 116
-  ]
-  edge [
-    source 2553
-    target 3636
-    weight 108
-  ]
-  edge [
-    source 2553
-    target 3141
-    weight 365
-  ]
-  edge [
-    source 2553
-    target 3937
-    weight 34
-  ]
-  edge [
-    source 2553
-    target 3040
-    weight 94
-  ]
-  edge [
-    source 2553
-    target 3145
-    weight 290
-  ]
-  edge [
-    source 2553
-    target 3174
-    weight 202
-  ]
-  edge [
-    source 2553
-    target 2890
-    weight 106
-  ]
-  edge [
-    source 2553
-    target 2861
-    weight 260
-  ]
-  edge [
-    source 2553
-    target 2800
-    weight 72
-  ]
-  edge [
-    source 2553
-    target 3443
-    weight 115
-  ]
-  edge [
-    source 2553
-    target 3374
-    weight 85
-  ]
-  edge [
-    source 2553
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 2553
-    target 3423
-    weight 104
-  ]
-  edge [
-    source 2553
-    target 2556
-    weight 21
-  ]
-  edge [
-    source 2553
-    target 3066
-    weight 97
-  ]
-  edge [
-    source 2553
-    target 3052
-    weight 58
-  ]
-  edge [
-    source 2553
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 2553
-    target 3295
-    weight 70
-  ]
-  edge [
-    source 2553
-    target 3420
-    weight 91
-  ]
-  edge [
-    source 2553
-    target 3006
-    weight 103
-  ]
-  edge [
-    source 2553
-    target 3954
-    weight 95
-  ]
-  edge [
-    source 2553
-    target 3962
-    weight 71
-  ]
-  edge [
-    source 2553
-    target 3253
-    weight 76
-  ]
-  edge [
-    source 2553
-    target 4154
-    weight 91
-  ]
-  edge [
-    source 2553
-    target 3377
-    weight 29
-  ]
-  edge [
-    source 2553
-    target 4162
-    weight 44
-  ]
-  edge [
-    source 2553
-    target 3177
-    weight 25
-  ]
-  edge [
-    source 2553
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 2553
-    target 3877
-    weight 28
-  ]
-  edge [
-    source 2556
-    target 3141
-    weight 78
-  ]
-  edge [
-    source 2556
-    target 3636
-    weight 26
-  ]
-  edge [
-    source 2556
-    target 3521
-    weight 88
-  ]
-  edge [
-    source 2556
-    target 3276
-    weight 47
-  ]
-  edge [
-    source 2556
-    target 2890
-    weight 33
-  ]
-  edge [
-    source 2556
-    target 3917
-    weight 40
-  ]
-  edge [
-    source 2556
-    target 2857
-    weight 27
-  ]
-  edge [
-    source 2556
-    target 2700
-    weight 46
-  ]
-  edge [
-    source 2556
-    target 2861
-    weight 53
-  ]
-  edge [
-    source 2556
-    target 3443
-    weight 23
-  ]
-  edge [
-    source 2556
-    target 3600
-    weight 55
-  ]
-  edge [
-    source 2556
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 2556
-    target 4051
-    weight 59
-  ]
-  edge [
-    source 2556
-    target 3642
-    weight 24
-  ]
-  edge [
-    source 2556
-    target 3282
-    weight 30
-  ]
-  edge [
-    source 2556
-    target 3145
-    weight 54
-  ]
-  edge [
-    source 2556
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 2556
-    target 2870
-    weight 22
-  ]
-  edge [
-    source 2570
-    target 2870
-    weight 29
-  ]
-  edge [
-    source 2570
-    target 3282
-    weight 38
-  ]
-  edge [
-    source 2570
-    target 3141
-    weight 82
-  ]
-  edge [
-    source 2570
-    target 3521
-    weight 90
-  ]
-  edge [
-    source 2570
-    target 3642
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 2570
-    target 2700
-    weight 65
-  ]
-  edge [
-    source 2570
-    target 3276
-    weight 44
-  ]
-  edge [
-    source 2570
-    target 3993
-    weight 46
-  ]
-  edge [
-    source 2570
-    target 4051
-    weight 72
-  ]
-  edge [
-    source 2570
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 2570
-    target 3145
-    weight 51
-  ]
-  edge [
-    source 2570
-    target 2861
-    weight 57
-  ]
-  edge [
-    source 2570
-    target 3636
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3565
-    weight 27
-  ]
-  edge [
-    source 2570
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 2570
-    target 3066
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3954
-    weight 22
-  ]
-  edge [
-    source 2570
-    target 3542
-    weight 28
-  ]
-  edge [
-    source 2570
-    target 3600
-    weight 47
-  ]
-  edge [
-    source 2570
-    target 2890
-    weight 26
-  ]
-  edge [
-    source 2570
-    target 3443
-    weight 29
-  ]
-  edge [
-    source 2570
-    target 2857
-    weight 30
-  ]
-  edge [
-    source 2570
-    target 3174
-    weight 40
-  ]
-  edge [
-    source 2573
-    target 3521
-    weight 59
-  ]
-  edge [
-    source 2573
-    target 2861
-    weight 46
-  ]
-  edge [
-    source 2573
-    target 3600
-    weight 28
-  ]
-  edge [
-    source 2573
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 2573
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 2573
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2573
-    target 2700
-    weight 25
-  ]
-  edge [
-    source 2573
-    target 4051
-    weight 50
-  ]
-  edge [
-    source 2573
-    target 3993
-    weight 23
-  ]
-  edge [
-    source 2573
-    target 3145
-    weight 31
-  ]
-  edge [
-    source 2597
-    target 3521
-    weight 113
-  ]
-  edge [
-    source 2597
-    target 3423
-    weight 47
-  ]
-  edge [
-    source 2597
-    target 2861
-    weight 64
-  ]
-  edge [
-    source 2597
-    target 3600
-    weight 53
-  ]
-  edge [
-    source 2597
-    target 3077
-    weight 29
-  ]
-  edge [
-    source 2597
-    target 3962
-    weight 59
-  ]
-  edge [
-    source 2597
-    target 4051
-    weight 72
-  ]
-  edge [
-    source 2597
-    target 3141
-    weight 79
-  ]
-  edge [
-    source 2597
-    target 2700
-    weight 32
-  ]
-  edge [
-    source 2597
-    target 3993
-    weight 45
-  ]
-  edge [
-    source 2597
-    target 3145
-    weight 45
-  ]
-  edge [
-    source 2597
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 2597
-    target 3174
-    weight 28
-  ]
-  edge [
-    source 2597
-    target 3276
-    weight 43
-  ]
-  edge [
-    source 2600
-    target 2861
-    weight 36
-  ]
-  edge [
-    source 2600
-    target 3141
-    weight 28
-  ]
-  edge [
-    source 2600
-    target 3521
-    weight 41
-  ]
-  edge [
-    source 2600
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2600
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 2609
-    target 4051
-    weight 37
-  ]
-  edge [
-    source 2609
-    target 3521
-    weight 43
-  ]
-  edge [
-    source 2609
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 2609
-    target 2861
-    weight 29
-  ]
-  edge [
-    source 2609
-    target 3145
-    weight 26
-  ]
-  edge [
-    source 2614
-    target 3521
-    weight 187
-  ]
-  edge [
-    source 2614
-    target 2861
-    weight 129
-  ]
-  edge [
-    source 2614
-    target 2800
-    weight 28
-  ]
-  edge [
-    source 2614
-    target 3636
-    weight 107
-  ]
-  edge [
-    source 2614
-    target 3565
-    weight 52
-  ]
-  edge [
-    source 2614
-    target 3066
-    weight 38
-  ]
-  edge [
-    source 2614
-    target 2870
-    weight 47
-  ]
-  edge [
-    source 2614
-    target 3420
-    weight 29
-  ]
-  edge [
-    source 2614
-    target 3253
-    weight 43
-  ]
-  edge [
-    source 2614
-    target 2700
-    weight 81
-  ]
-  edge [
-    source 2614
-    target 3276
-    weight 72
-  ]
-  edge [
-    source 2614
-    target 3917
-    weight 70
-  ]
-  edge [
-    source 2614
-    target 3141
-    weight 142
-  ]
-  edge [
-    source 2614
-    target 4051
-    weight 133
-  ]
-  edge [
-    source 2614
-    target 3542
-    weight 62
-  ]
-  edge [
-    source 2614
-    target 3642
-    weight 60
-  ]
-  edge [
-    source 2614
-    target 3174
-    weight 75
-  ]
-  edge [
-    source 2614
-    target 2857
-    weight 51
-  ]
-  edge [
-    source 2614
-    target 3600
-    weight 100
-  ]
-  edge [
-    source 2614
-    target 3443
-    weight 42
-  ]
-  edge [
-    source 2614
-    target 3006
-    weight 34
-  ]
-  edge [
-    source 2614
-    target 3962
-    weight 34
-  ]
-  edge [
-    source 2614
-    target 3993
-    weight 85
-  ]
-  edge [
-    source 2614
-    target 3423
-    weight 45
-  ]
-  edge [
-    source 2614
-    target 3374
-    weight 42
-  ]
-  edge [
-    source 2614
-    target 3145
-    weight 107
-  ]
-  edge [
-    source 2614
-    target 3282
-    weight 71
-  ]
-  edge [
-    source 2614
-    target 3052
-    weight 26
-  ]
-  edge [
-    source 2614
-    target 3040
-    weight 46
-  ]
-  edge [
-    source 2614
-    target 4154
-    weight 45
-  ]
-  edge [
-    source 2614
-    target 2890
-    weight 54
-  ]
-  edge [
-    source 2614
-    target 3295
-    weight 24
-  ]
-  edge [
-    source 2614
-    target 4040
-    weight 21
-  ]
-  edge [
-    source 2614
-    target 3954
-    weight 37
-  ]
-  edge [
-    source 2614
-    target 4162
-    weight 22
-  ]
-  edge [
-    source 2628
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 2628
-    target 3141
-    weight 26
-  ]
-  edge [
-    source 2628
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 2634
-    target 3600
-    weight 22
-  ]
-  edge [
-    source 2634
-    target 3141
-    weight 29
-  ]
-  edge [
-    source 2634
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 2634
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2634
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 2634
-    target 3276
-    weight 23
-  ]
-  edge [
-    source 2652
-    target 3521
-    weight 23
-  ]
-  edge [
-    source 2688
-    target 3521
-    weight 25
-  ]
-  edge [
-    source 2700
-    target 3521
-    weight 4799
-  ]
-  edge [
-    source 2700
-    target 3565
-    weight 829
-  ]
-  edge [
-    source 2700
-    target 2857
-    weight 686
-  ]
-  edge [
-    source 2700
-    target 3145
-    weight 2009
-  ]
-  edge [
-    source 2700
-    target 2861
-    weight 2745
-  ]
-  edge [
-    source 2700
-    target 3276
-    weight 1951
-  ]
-  edge [
-    source 2700
-    target 3420
-    weight 464
-  ]
-  edge [
-    source 2700
-    target 3071
-    weight 53
-  ]
-  edge [
-    source 2700
-    target 3600
-    weight 2530
-  ]
-  edge [
-    source 2700
-    target 3917
-    weight 1045
-  ]
-  edge [
-    source 2700
-    target 3641
-    weight 55
-  ]
-  edge [
-    source 2700
-    target 3642
-    weight 1207
-  ]
-  edge [
-    source 2700
-    target 3542
-    weight 603
-  ]
-  edge [
-    source 2700
-    target 3993
-    weight 1605
-  ]
-  edge [
-    source 2700
-    target 3141
-    weight 4048
-  ]
-  edge [
-    source 2700
-    target 4051
-    weight 3493
-  ]
-  edge [
-    source 2700
-    target 3174
-    weight 1910
-  ]
-  edge [
-    source 2700
-    target 3443
-    weight 553
-  ]
-  edge [
-    source 2700
-    target 3374
-    weight 419
-  ]
-  edge [
-    source 2700
-    target 4152
-    weight 55
-  ]
-  edge [
-    source 2700
-    target 3282
-    weight 863
-  ]
-  edge [
-    source 2700
-    target 3937
-    weight 122
-  ]
-  edge [
-    source 2700
-    target 4187
-    weight 71
-  ]
-  edge [
-    source 2700
-    target 4027
-    weight 49
-  ]
-  edge [
-    source 2700
-    target 3636
-    weight 431
-  ]
-  edge [
-    source 2700
-    target 3985
-    weight 47
-  ]
-  edge [
-    source 2700
-    target 2870
-    weight 575
-  ]
-  edge [
-    source 2700
-    target 3954
-    weight 481
-  ]
-  edge [
-    source 2700
-    target 2924
-    weight 48
-  ]
-  edge [
-    source 2700
-    target 3423
-    weight 735
-  ]
-  edge [
-    source 2700
-    target 2890
-    weight 567
-  ]
-  edge [
-    source 2700
-    target 4154
-    weight 595
-  ]
-  edge [
-    source 2700
-    target 3006
-    weight 370
-  ]
-  edge [
-    source 2700
-    target 2800
-    weight 196
-  ]
-  edge [
-    source 2700
-    target 3040
-    weight 487
-  ]
-  edge [
-    source 2700
-    target 3847
-    weight 179
-  ]
-  edge [
-    source 2700
-    target 3962
-    weight 403
-  ]
-  edge [
-    source 2700
-    target 3253
-    weight 271
-  ]
-  edge [
-    source 2700
-    target 3066
-    weight 392
-  ]
-  edge [
-    source 2700
-    target 3050
-    weight 25
-  ]
-  edge [
-    source 2700
-    target 4040
-    weight 126
-  ]
-  edge [
-    source 2700
-    target 3295
-    weight 214
-  ]
-  edge [
-    source 2700
-    target 2810
-    weight 119
-  ]
-  edge [
-    source 2700
-    target 3177
-    weight 109
-  ]
-  edge [
-    source 2700
-    target 3884
-    weight 83
-  ]
-  edge [
-    source 2700
-    target 2844
-    weight 34
-  ]
-  edge [
-    source 2700
-    target 2711
-    weight 49
-  ]
-  edge [
-    source 2700
-    target 2955
-    weight 30
-  ]
-  edge [
-    source 2700
-    target 3877
-    weight 120
-  ]
-  edge [
-    source 2700
-    target 3077
-    weight 137
-  ]
-  edge [
-    source 2700
-    target 3377
-    weight 102
-  ]
-  edge [
-    source 2700
-    target 4162
-    weight 178
-  ]
-  edge [
-    source 2700
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 2700
-    target 3052
-    weight 181
-  ]
-  edge [
-    source 2700
-    target 3024
-    weight 40
-  ]
-  edge [
-    source 2700
-    target 3935
-    weight 37
-  ]
-  edge [
-    source 2700
-    target 3408
-    weight 74
-  ]
-  edge [
-    source 2700
-    target 3108
-    weight 28
-  ]
-  edge [
-    source 2700
-    target 3968
-    weight 53
-  ]
-  edge [
-    source 2700
-    target 3196
-    weight 54
-  ]
-  edge [
-    source 2700
-    target 4160
-    weight 38
-  ]
-  edge [
-    source 2700
-    target 3432
-    weight 54
-  ]
-  edge [
-    source 2700
-    target 3162
-    weight 44
-  ]
-  edge [
-    source 2700
-    target 2743
-    weight 31
-  ]
-  edge [
-    source 2700
-    target 4098
-    weight 43
-  ]
-  edge [
-    source 2700
-    target 3861
-    weight 39
-  ]
-  edge [
-    source 2700
-    target 3677
-    weight 46
-  ]
-  edge [
-    source 2700
-    target 2822
-    weight 42
-  ]
-  edge [
-    source 2700
-    target 3559
-    weight 29
-  ]
-  edge [
-    source 2700
-    target 3440
-    weight 24
-  ]
-  edge [
-    source 2700
-    target 3872
-    weight 24
-  ]
-  edge [
-    source 2700
-    target 3357
-    weight 22
-  ]
-  edge [
-    source 2700
-    target 3633
-    weight 31
-  ]
-  edge [
-    source 2700
-    target 3876
-    weight 24
-  ]
-  edge [
-    source 2711
-    target 3521
-    weight 106
-  ]
-  edge [
-    source 2711
-    target 2800
-    weight 22
-  ]
-  edge [
-    source 2711
-    target 3141
-    weight 90
-  ]
-  edge [
-    source 2711
-    target 3145
-    weight 58
-  ]
-  edge [
-    source 2711
-    target 3600
-    weight 56
-  ]
-  edge [
-    source 2711
-    target 3253
-    weight 22
-  ]
-  edge [
-    source 2711
-    target 3174
-    weight 54
-  ]
-  edge [
-    source 2711
-    target 2861
-    weight 69
-  ]
-  edge [
-    source 2711
-    target 3954
-    weight 31
-  ]
-  edge [
-    source 2711
-    target 3642
-    weight 36
-  ]
-  edge [
-    source 2711
-    target 3993
-    weight 52
-  ]
-  edge [
-    source 2711
-    target 3276
-    weight 51
-  ]
-  edge [
-    source 2711
-    target 3066
-    weight 30
-  ]
-  edge [
-    source 2711
-    target 3282
-    weight 40
-  ]
-  edge [
-    source 2711
-    target 2870
-    weight 28
-  ]
-  edge [
-    source 2711
-    target 4154
-    weight 22
-  ]
-  edge [
-    source 2711
-    target 3374
-    weight 28
-  ]
-  edge [
-    source 2711
-    target 3917
-    weight 41
-  ]
-  edge [
-    source 2711
-    target 3443
-    weight 24
-  ]
-  edge [
-    source 2711
-    target 3420
-    weight 23
-  ]
-  edge [
-    source 2711
-    target 4051
-    weight 85
-  ]
-  edge [
-    source 2711
-    target 3006
-    weight 24
-  ]
-  edge [
-    source 2711
-    target 3542
-    weight 26
-  ]
-  edge [
-    source 2711
-    target 3040
-    weight 41
-  ]
-  edge [
-    source 2711
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 2711
-    target 3423
-    weight 30
-  ]
-  edge [
-    source 2711
-    target 2857
-    weight 37
-  ]
-  edge [
-    source 2726
-    target 2861
-    weight 25
-  ]
-  edge [
-    source 2726
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 2743
-    target 3521
-    weight 57
-  ]
-  edge [
-    source 2743
-    target 2861
-    weight 45
-  ]
-  edge [
-    source 2743
-    target 3141
-    weight 46
-  ]
-  edge [
-    source 2743
-    target 4051
-    weight 55
-  ]
-  edge [
-    source 2743
-    target 3642
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3040
-    weight 23
-  ]
-  edge [
-    source 2743
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3006
-    weight 23
-  ]
-  edge [
-    source 2743
-    target 3954
-    weight 28
-  ]
-  edge [
-    source 2743
-    target 3145
-    weight 32
-  ]
-  edge [
-    source 2743
-    target 3600
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3276
-    weight 25
-  ]
-  edge [
-    source 2743
-    target 3282
-    weight 24
-  ]
-  edge [
-    source 2800
-    target 3521
-    weight 404
-  ]
-  edge [
-    source 2800
-    target 2861
-    weight 260
-  ]
-  edge [
-    source 2800
-    target 3962
-    weight 87
-  ]
-  edge [
-    source 2800
-    target 3636
-    weight 96
-  ]
-  edge [
-    source 2800
-    target 3600
-    weight 218
-  ]
-  edge [
-    source 2800
-    target 3565
-    weight 91
-  ]
-  edge [
-    source 2800
-    target 3420
-    weight 93
-  ]
-  edge [
-    source 2800
-    target 3917
-    weight 148
-  ]
-  edge [
-    source 2800
-    target 4051
-    weight 304
-  ]
-  edge [
-    source 2800
-    target 3141
-    weight 333
-  ]
-  edge [
-    source 2800
-    target 3145
-    weight 230
-  ]
-  edge [
-    source 2800
-    target 3642
-    weight 107
-  ]
-  edge [
-    source 2800
-    target 3443
-    weight 91
-  ]
-  edge [
-    source 2800
-    target 3993
-    weight 196
-  ]
-  edge [
-    source 2800
-    target 3276
-    weight 183
-  ]
-  edge [
-    source 2800
-    target 3377
-    weight 27
-  ]
-  edge [
-    source 2800
-    target 3253
-    weight 59
-  ]
-  edge [
-    source 2800
-    target 3542
-    weight 109
-  ]
-  edge [
-    source 2800
-    target 3066
-    weight 88
-  ]
-  edge [
-    source 2800
-    target 3937
-    weight 43
-  ]
-  edge [
-    source 2800
-    target 3040
-    weight 81
-  ]
-  edge [
-    source 2800
-    target 4187
-    weight 27
-  ]
-  edge [
-    source 2800
-    target 3174
-    weight 170
-  ]
-  edge [
-    source 2800
-    target 3374
-    weight 88
-  ]
-  edge [
-    source 2800
-    target 2890
-    weight 81
-  ]
-  edge [
-    source 2800
-    target 3954
-    weight 88
-  ]
-  edge [
-    source 2800
-    target 3423
-    weight 127
-  ]
-  edge [
-    source 2800
-    target 4154
-    weight 85
-  ]
-  edge [
-    source 2800
-    target 3282
-    weight 152
-  ]
-  edge [
-    source 2800
-    target 3006
-    weight 67
-  ]
-  edge [
-    source 2800
-    target 3847
-    weight 31
-  ]
-  edge [
-    source 2800
-    target 3052
-    weight 51
-  ]
-  edge [
-    source 2800
-    target 2857
-    weight 131
-  ]
-  edge [
-    source 2800
-    target 3295
-    weight 44
-  ]
-  edge [
-    source 2800
-    target 2810
-    weight 54
-  ]
-  edge [
-    source 2800
-    target 4162
-    weight 44
-  ]
-  edge [
-    source 2800
-    target 3177
-    weight 37
-  ]
-  edge [
-    source 2800
-    target 2870
-    weight 96
-  ]
-  edge [
-    source 2800
-    target 4040
-    weight 28
-  ]
-  edge [
-    source 2800
-    target 3884
-    weight 27
-  ]
-  edge [
-    source 2800
-    target 3877
-    weight 29
-  ]
-  edge [
-    source 2800
-    target 3077
-    weight 31
-  ]
-  edge [
-    source 2801
-    target 3521
-    weight 35
-  ]
-  edge [
-    source 2801
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 2801
-    target 2861
-    weight 21
-  ]
-  edge [
-    source 2801
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 2810
-    target 3521
-    weight 240
-  ]
-  edge [
-    source 2810
-    target 3374
-    weight 64
-  ]
-  edge [
-    source 2810
-    target 2861
-    weight 174
-  ]
-  edge [
-    source 2810
-    target 4051
-    weight 190
-  ]
-  edge [
-    source 2810
-    target 3565
-    weight 70
-  ]
-  edge [
-    source 2810
-    target 3423
-    weight 90
-  ]
-  edge [
-    source 2810
-    target 3420
-    weight 50
-  ]
-  edge [
-    source 2810
-    target 3141
-    weight 185
-  ]
-  edge [
-    source 2810
-    target 3642
-    weight 71
-  ]
-  edge [
-    source 2810
-    target 3600
-    weight 141
-  ]
-  edge [
-    source 2810
-    target 3993
-    weight 135
-  ]
-  edge [
-    source 2810
-    target 3282
-    weight 85
-  ]
-  edge [
-    source 2810
-    target 3962
-    weight 50
-  ]
-  edge [
-    source 2810
-    target 3174
-    weight 101
-  ]
-  edge [
-    source 2810
-    target 3276
-    weight 105
-  ]
-  edge [
-    source 2810
-    target 3295
-    weight 22
-  ]
-  edge [
-    source 2810
-    target 3145
-    weight 136
-  ]
-  edge [
-    source 2810
-    target 3636
-    weight 52
-  ]
-  edge [
-    source 2810
-    target 3443
-    weight 50
-  ]
-  edge [
-    source 2810
-    target 2870
-    weight 53
-  ]
-  edge [
-    source 2810
-    target 3006
-    weight 56
-  ]
-  edge [
-    source 2810
-    target 3040
-    weight 62
-  ]
-  edge [
-    source 2810
-    target 3066
-    weight 48
-  ]
-  edge [
-    source 2810
-    target 3847
-    weight 24
-  ]
-  edge [
-    source 2810
-    target 3917
-    weight 77
-  ]
-  edge [
-    source 2810
-    target 4154
-    weight 39
-  ]
-  edge [
-    source 2810
-    target 3253
-    weight 40
-  ]
-  edge [
-    source 2810
-    target 2890
-    weight 44
-  ]
-  edge [
-    source 2810
-    target 3954
-    weight 57
-  ]
-  edge [
-    source 2810
-    target 4162
-    weight 23
-  ]
-  edge [
-    source 2810
-    target 3937
-    weight 42
-  ]
-  edge [
-    source 2810
-    target 3542
-    weight 67
-  ]
-  edge [
-    source 2810
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 2810
-    target 3052
-    weight 31
-  ]
-  edge [
-    source 2810
-    target 2857
-    weight 67
-  ]
-  edge [
-    source 2822
-    target 3521
-    weight 98
-  ]
-  edge [
-    source 2822
-    target 3600
-    weight 54
-  ]
-  edge [
-    source 2822
-    target 3145
-    weight 87
-  ]
-  edge [
-    source 2822
-    target 3141
-    weight 85
-  ]
-  edge [
-    source 2822
-    target 3917
-    weight 44
-  ]
-  edge [
-    source 2822
-    target 3993
-    weight 41
-  ]
-  edge [
-    source 2822
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 2822
-    target 3276
-    weight 56
-  ]
-  edge [
-    source 2822
-    target 4051
-    weight 74
-  ]
-  edge [
-    source 2822
-    target 3282
-    weight 27
-  ]
-  edge [
-    source 2822
-    target 3423
-    weight 25
-  ]
-  edge [
-    source 2822
-    target 2857
-    weight 23
-  ]
-  edge [
-    source 2822
-    target 2890
-    weight 30
-  ]
-  edge [
-    source 2822
-    target 3174
-    weight 46
-  ]
-  edge [
-    source 2822
-    target 2861
-    weight 58
-  ]
-  edge [
-    source 2832
-    target 2861
-    weight 24
-  ]
-  edge [
-    source 2832
-    target 3521
-    weight 41
-  ]
-  edge [
-    source 2832
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 2832
-    target 3174
-    weight 24
-  ]
-  edge [
-    source 2832
-    target 4051
-    weight 31
-  ]
-  edge [
-    source 2836
-    target 3521
-    weight 38
-  ]
-  edge [
-    source 2836
-    target 3141
-    weight 31
-  ]
-  edge [
-    source 2836
-    target 2861
-    weight 22
-  ]
-  edge [
-    source 2836
-    target 4051
-    weight 31
-  ]
-  edge [
-    source 2836
-    target 3600
-    weight 26
-  ]
-  edge [
-    source 2836
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 2844
-    target 2861
-    weight 37
-  ]
-  edge [
-    source 2844
-    target 4051
-    weight 48
-  ]
-  edge [
-    source 2844
-    target 3521
-    weight 67
-  ]
-  edge [
-    source 2844
-    target 3145
-    weight 39
-  ]
-  edge [
-    source 2844
-    target 3600
-    weight 37
-  ]
-  edge [
-    source 2844
-    target 3174
-    weight 26
-  ]
-  edge [
-    source 2844
-    target 3276
-    weight 36
-  ]
-  edge [
-    source 2844
-    target 3141
-    weight 58
-  ]
-  edge [
-    source 2844
-    target 3917
-    weight 27
-  ]
-  edge [
-    source 2844
-    target 3282
-    weight 21
-  ]
-  edge [
-    source 2844
-    target 3993
-    weight 32
-  ]
-  edge [
-    source 2844
-    target 2857
-    weight 23
-  ]
-  edge [
-    source 2857
-    target 3521
-    weight 1368
-  ]
-  edge [
-    source 2857
-    target 3600
-    weight 778
-  ]
-  edge [
-    source 2857
-    target 3993
-    weight 643
-  ]
-  edge [
-    source 2857
-    target 3145
-    weight 913
-  ]
-  edge [
-    source 2857
-    target 3968
-    weight 28
-  ]
-  edge [
-    source 2857
-    target 3420
-    weight 197
-  ]
-  edge [
-    source 2857
-    target 3141
-    weight 1188
-  ]
-  edge [
-    source 2857
-    target 3432
-    weight 45
-  ]
-  edge [
-    source 2857
-    target 4027
-    weight 40
-  ]
-  edge [
-    source 2857
-    target 2861
-    weight 865
-  ]
-  edge [
-    source 2857
-    target 4051
-    weight 1107
-  ]
-  edge [
-    source 2857
-    target 3276
-    weight 732
-  ]
-  edge [
-    source 2857
-    target 3565
-    weight 282
-  ]
-  edge [
-    source 2857
-    target 3954
-    weight 287
-  ]
-  edge [
-    source 2857
-    target 3174
-    weight 652
-  ]
-  edge [
-    source 2857
-    target 3917
-    weight 546
-  ]
-  edge [
-    source 2857
-    target 3066
-    weight 289
-  ]
-  edge [
-    source 2857
-    target 2890
-    weight 300
-  ]
-  edge [
-    source 2857
-    target 3282
-    weight 440
-  ]
-  edge [
-    source 2857
-    target 3642
-    weight 435
-  ]
-  edge [
-    source 2857
-    target 4154
-    weight 266
-  ]
-  edge [
-    source 2857
-    target 3077
-    weight 87
-  ]
-  edge [
-    source 2857
-    target 2870
-    weight 303
-  ]
-  edge [
-    source 2857
-    target 3636
-    weight 244
-  ]
-  edge [
-    source 2857
-    target 4040
-    weight 80
-  ]
-  edge [
-    source 2857
-    target 3295
-    weight 123
-  ]
-  edge [
-    source 2857
-    target 3162
-    weight 23
-  ]
-  edge [
-    source 2857
-    target 3937
-    weight 94
-  ]
-  edge [
-    source 2857
-    target 3962
-    weight 207
-  ]
-  edge [
-    source 2857
-    target 3860
-    weight 28
-  ]
-  edge [
-    source 2857
-    target 3877
-    weight 80
-  ]
-  edge [
-    source 2857
-    target 4162
-    weight 93
-  ]
-  edge [
-    source 2857
-    target 3052
-    weight 143
-  ]
-  edge [
-    source 2857
-    target 3884
-    weight 48
-  ]
-  edge [
-    source 2857
-    target 3006
-    weight 197
-  ]
-  edge [
-    source 2857
-    target 3641
-    weight 26
-  ]
-  edge [
-    source 2857
-    target 3542
-    weight 325
-  ]
-  edge [
-    source 2857
-    target 4187
-    weight 42
-  ]
-  edge [
-    source 2857
-    target 3374
-    weight 295
-  ]
-  edge [
-    source 2857
-    target 3377
-    weight 61
-  ]
-  edge [
-    source 2857
-    target 3443
-    weight 287
-  ]
-  edge [
-    source 2857
-    target 3177
-    weight 69
-  ]
-  edge [
-    source 2857
-    target 3040
-    weight 282
-  ]
-  edge [
-    source 2857
-    target 3423
-    weight 338
-  ]
-  edge [
-    source 2857
-    target 3408
-    weight 52
-  ]
-  edge [
-    source 2857
-    target 4098
-    weight 24
-  ]
-  edge [
-    source 2857
-    target 3253
-    weight 155
-  ]
-  edge [
-    source 2857
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 2857
-    target 3677
-    weight 27
-  ]
-  edge [
-    source 2857
-    target 3847
-    weight 66
-  ]
-  edge [
-    source 2857
-    target 2924
-    weight 26
-  ]
-  edge [
-    source 2857
-    target 3071
-    weight 32
-  ]
-  edge [
-    source 2857
-    target 4152
-    weight 35
-  ]
-  edge [
-    source 2857
-    target 3196
-    weight 34
-  ]
-  edge [
-    source 2857
-    target 3876
-    weight 23
-  ]
-  edge [
-    source 2861
-    target 3600
-    weight 4949
-  ]
-  edge [
-    source 2861
-    target 3521
-    weight 18104
-  ]
-  edge [
-    source 2861
-    target 3565
-    weight 1647
-  ]
-  edge [
-    source 2861
-    target 3641
-    weight 82
-  ]
-  edge [
-    source 2861
-    target 3276
-    weight 3250
-  ]
-  edge [
-    source 2861
-    target 3374
-    weight 765
-  ]
-  edge [
-    source 2861
-    target 4051
-    weight 10210
-  ]
-  edge [
-    source 2861
-    target 3423
-    weight 1333
-  ]
-  edge [
-    source 2861
-    target 3077
-    weight 326
-  ]
-  edge [
-    source 2861
-    target 3642
-    weight 2390
-  ]
-  edge [
-    source 2861
-    target 3420
-    weight 417
-  ]
-  edge [
-    source 2861
-    target 3917
-    weight 1481
-  ]
-  edge [
-    source 2861
-    target 3071
-    weight 66
-  ]
-  edge [
-    source 2861
-    target 3968
-    weight 94
-  ]
-  edge [
-    source 2861
-    target 3962
-    weight 633
-  ]
-  edge [
-    source 2861
-    target 3443
-    weight 649
-  ]
-  edge [
-    source 2861
-    target 3377
-    weight 159
-  ]
-  edge [
-    source 2861
-    target 3542
-    weight 829
-  ]
-  edge [
-    source 2861
-    target 3066
-    weight 561
-  ]
-  edge [
-    source 2861
-    target 3145
-    weight 2995
-  ]
-  edge [
-    source 2861
-    target 3752
-    weight 23
-  ]
-  edge [
-    source 2861
-    target 3141
-    weight 9884
-  ]
-  edge [
-    source 2861
-    target 3693
-    weight 32
-  ]
-  edge [
-    source 2861
-    target 3993
-    weight 2392
-  ]
-  edge [
-    source 2861
-    target 3177
-    weight 129
-  ]
-  edge [
-    source 2861
-    target 2870
-    weight 634
-  ]
-  edge [
-    source 2861
-    target 3174
-    weight 3505
-  ]
-  edge [
-    source 2861
-    target 3636
-    weight 622
-  ]
-  edge [
-    source 2861
-    target 3985
-    weight 70
-  ]
-  edge [
-    source 2861
-    target 3937
-    weight 199
-  ]
-  edge [
-    source 2861
-    target 4187
-    weight 104
-  ]
-  edge [
-    source 2861
-    target 3282
-    weight 952
-  ]
-  edge [
-    source 2861
-    target 3253
-    weight 417
-  ]
-  edge [
-    source 2861
-    target 2978
-    weight 38
-  ]
-  edge [
-    source 2861
-    target 4152
-    weight 82
-  ]
-  edge [
-    source 2861
-    target 3112
-    weight 36
-  ]
-  edge [
-    source 2861
-    target 3024
-    weight 60
-  ]
-  edge [
-    source 2861
-    target 4027
-    weight 77
-  ]
-  edge [
-    source 2861
-    target 3954
-    weight 753
-  ]
-  edge [
-    source 2861
-    target 2924
-    weight 48
-  ]
-  edge [
-    source 2861
-    target 3295
-    weight 348
-  ]
-  edge [
-    source 2861
-    target 3006
-    weight 671
-  ]
-  edge [
-    source 2861
-    target 2890
-    weight 818
-  ]
-  edge [
-    source 2861
-    target 3559
-    weight 34
-  ]
-  edge [
-    source 2861
-    target 3052
-    weight 254
-  ]
-  edge [
-    source 2861
-    target 3357
-    weight 51
-  ]
-  edge [
-    source 2861
-    target 4098
-    weight 71
-  ]
-  edge [
-    source 2861
-    target 3040
-    weight 842
-  ]
-  edge [
-    source 2861
-    target 3884
-    weight 103
-  ]
-  edge [
-    source 2861
-    target 4160
-    weight 78
-  ]
-  edge [
-    source 2861
-    target 4007
-    weight 34
-  ]
-  edge [
-    source 2861
-    target 3935
-    weight 53
-  ]
-  edge [
-    source 2861
-    target 3663
-    weight 23
-  ]
-  edge [
-    source 2861
-    target 4100
-    weight 27
-  ]
-  edge [
-    source 2861
-    target 3847
-    weight 208
-  ]
-  edge [
-    source 2861
-    target 3050
-    weight 38
-  ]
-  edge [
-    source 2861
-    target 4040
-    weight 170
-  ]
-  edge [
-    source 2861
-    target 4154
-    weight 795
-  ]
-  edge [
-    source 2861
-    target 3196
-    weight 64
-  ]
-  edge [
-    source 2861
-    target 3408
-    weight 200
-  ]
-  edge [
-    source 2861
-    target 2955
-    weight 33
-  ]
-  edge [
-    source 2861
-    target 3375
-    weight 24
-  ]
-  edge [
-    source 2861
-    target 3309
-    weight 25
-  ]
-  edge [
-    source 2861
-    target 3462
-    weight 40
-  ]
-  edge [
-    source 2861
-    target 4162
-    weight 297
-  ]
-  edge [
-    source 2861
-    target 3877
-    weight 209
-  ]
-  edge [
-    source 2861
-    target 3860
-    weight 71
-  ]
-  edge [
-    source 2861
-    target 3952
-    weight 22
-  ]
-  edge [
-    source 2861
-    target 3432
-    weight 74
-  ]
-  edge [
-    source 2861
-    target 3956
-    weight 34
-  ]
-  edge [
-    source 2861
-    target 3861
-    weight 45
-  ]
-  edge [
-    source 2861
-    target 2983
-    weight 28
-  ]
-  edge [
-    source 2861
-    target 3162
-    weight 62
-  ]
-  edge [
-    source 2861
-    target 3692
-    weight 24
-  ]
-  edge [
-    source 2861
-    target 3677
-    weight 65
-  ]
-  edge [
-    source 2861
-    target 3872
-    weight 38
-  ]
-  edge [
-    source 2861
-    target 3108
-    weight 31
-  ]
-  edge [
-    source 2861
-    target 3737
-    weight 33
-  ]
-  edge [
-    source 2861
-    target 3633
-    weight 50
-  ]
-  edge [
-    source 2861
-    target 3011
-    weight 21
-  ]
-  edge [
-    source 2861
-    target 3440
-    weight 28
-  ]
-  edge [
-    source 2861
-    target 3876
-    weight 35
-  ]
-  edge [
-    source 2870
-    target 3521
-    weight 1033
-  ]
-  edge [
-    source 2870
-    target 3420
-    weight 169
-  ]
-  edge [
-    source 2870
-    target 3600
-    weight 631
-  ]
-  edge [
-    source 2870
-    target 3565
-    weight 301
-  ]
-  edge [
-    source 2870
-    target 3282
-    weight 351
-  ]
-  edge [
-    source 2870
-    target 3141
-    weight 891
-  ]
-  edge [
-    source 2870
-    target 3066
-    weight 193
-  ]
-  edge [
-    source 2870
-    target 4051
-    weight 805
-  ]
-  edge [
-    source 2870
-    target 4187
-    weight 29
-  ]
-  edge [
-    source 2870
-    target 4152
-    weight 35
-  ]
-  edge [
-    source 2870
-    target 3276
-    weight 524
-  ]
-  edge [
-    source 2870
-    target 3962
-    weight 154
-  ]
-  edge [
-    source 2870
-    target 3993
-    weight 478
-  ]
-  edge [
-    source 2870
-    target 3917
-    weight 340
-  ]
-  edge [
-    source 2870
-    target 3145
-    weight 567
-  ]
-  edge [
-    source 2870
-    target 3006
-    weight 159
-  ]
-  edge [
-    source 2870
-    target 3847
-    weight 115
-  ]
-  edge [
-    source 2870
-    target 3642
-    weight 323
-  ]
-  edge [
-    source 2870
-    target 2890
-    weight 189
-  ]
-  edge [
-    source 2870
-    target 3542
-    weight 271
-  ]
-  edge [
-    source 2870
-    target 3423
-    weight 197
-  ]
-  edge [
-    source 2870
-    target 3040
-    weight 178
-  ]
-  edge [
-    source 2870
-    target 3954
-    weight 203
-  ]
-  edge [
-    source 2870
-    target 3174
-    weight 475
-  ]
-  edge [
-    source 2870
-    target 3432
-    weight 25
-  ]
-  edge [
-    source 2870
-    target 3052
-    weight 80
-  ]
-  edge [
-    source 2870
-    target 3253
-    weight 118
-  ]
-  edge [
-    source 2870
-    target 3295
-    weight 90
-  ]
-  edge [
-    source 2870
-    target 3636
-    weight 213
-  ]
-  edge [
-    source 2870
-    target 3162
-    weight 29
-  ]
-  edge [
-    source 2870
-    target 3374
-    weight 162
-  ]
-  edge [
-    source 2870
-    target 3884
-    weight 45
-  ]
-  edge [
-    source 2870
-    target 4154
-    weight 214
-  ]
-  edge [
-    source 2870
-    target 3443
-    weight 197
-  ]
-  edge [
-    source 2870
-    target 4040
-    weight 71
-  ]
-  edge [
-    source 2870
-    target 3377
-    weight 46
-  ]
-  edge [
-    source 2870
-    target 3077
-    weight 43
-  ]
-  edge [
-    source 2870
-    target 3860
-    weight 21
-  ]
-  edge [
-    source 2870
-    target 4162
-    weight 70
-  ]
-  edge [
-    source 2870
-    target 4160
-    weight 24
-  ]
-  edge [
-    source 2870
-    target 3968
-    weight 25
-  ]
-  edge [
-    source 2870
-    target 3937
-    weight 68
-  ]
-  edge [
-    source 2870
-    target 3177
-    weight 55
-  ]
-  edge [
-    source 2870
-    target 3877
-    weight 46
-  ]
-  edge [
-    source 2870
-    target 3408
-    weight 27
-  ]
-  edge [
-    source 2890
-    target 3443
-    weight 273
-  ]
-  edge [
-    source 2890
-    target 3521
-    weight 1307
-  ]
-  edge [
-    source 2890
-    target 3565
-    weight 249
-  ]
-  edge [
-    source 2890
-    target 3642
-    weight 348
-  ]
-  edge [
-    source 2890
-    target 3423
-    weight 278
-  ]
-  edge [
-    source 2890
-    target 4051
-    weight 987
-  ]
-  edge [
-    source 2890
-    target 3917
-    weight 466
-  ]
-  edge [
-    source 2890
-    target 3542
-    weight 218
-  ]
-  edge [
-    source 2890
-    target 3145
-    weight 726
-  ]
-  edge [
-    source 2890
-    target 3937
-    weight 59
-  ]
-  edge [
-    source 2890
-    target 3141
-    weight 1152
-  ]
-  edge [
-    source 2890
-    target 3993
-    weight 553
-  ]
-  edge [
-    source 2890
-    target 3006
-    weight 130
-  ]
-  edge [
-    source 2890
-    target 3276
-    weight 656
-  ]
-  edge [
-    source 2890
-    target 3174
-    weight 586
-  ]
-  edge [
-    source 2890
-    target 3282
-    weight 320
-  ]
-  edge [
-    source 2890
-    target 3600
-    weight 785
-  ]
-  edge [
-    source 2890
-    target 3253
-    weight 113
-  ]
-  edge [
-    source 2890
-    target 4040
-    weight 85
-  ]
-  edge [
-    source 2890
-    target 3954
-    weight 148
-  ]
-  edge [
-    source 2890
-    target 3066
-    weight 140
-  ]
-  edge [
-    source 2890
-    target 4154
-    weight 270
-  ]
-  edge [
-    source 2890
-    target 3040
-    weight 185
-  ]
-  edge [
-    source 2890
-    target 3636
-    weight 237
-  ]
-  edge [
-    source 2890
-    target 4187
-    weight 32
-  ]
-  edge [
-    source 2890
-    target 3374
-    weight 172
-  ]
-  edge [
-    source 2890
-    target 3295
-    weight 92
-  ]
-  edge [
-    source 2890
-    target 4152
-    weight 25
-  ]
-  edge [
-    source 2890
-    target 3420
-    weight 123
-  ]
-  edge [
-    source 2890
-    target 3884
-    weight 36
-  ]
-  edge [
-    source 2890
-    target 3962
-    weight 142
-  ]
-  edge [
-    source 2890
-    target 3377
-    weight 49
-  ]
-  edge [
-    source 2890
-    target 3641
-    weight 31
-  ]
-  edge [
-    source 2890
-    target 3052
-    weight 76
-  ]
-  edge [
-    source 2890
-    target 3432
-    weight 36
-  ]
-  edge [
-    source 2890
-    target 3162
-    weight 33
-  ]
-  edge [
-    source 2890
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 2890
-    target 4162
-    weight 88
-  ]
-  edge [
-    source 2890
-    target 3077
-    weight 48
-  ]
-  edge [
-    source 2890
-    target 3847
-    weight 59
-  ]
-  edge [
-    source 2890
-    target 3877
-    weight 66
-  ]
-  edge [
-    source 2890
-    target 3677
-    weight 26
-  ]
-  edge [
-    source 2890
-    target 3177
-    weight 42
-  ]
-  edge [
-    source 2890
-    target 3196
-    weight 22
-  ]
-  edge [
-    source 2890
-    target 3408
-    weight 46
-  ]
-  edge [
-    source 2924
-    target 3282
-    weight 33
-  ]
-  edge [
-    source 2924
-    target 3521
-    weight 68
-  ]
-  edge [
-    source 2924
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 2924
-    target 4051
-    weight 53
-  ]
-  edge [
-    source 2924
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 2924
-    target 3174
-    weight 30
-  ]
-  edge [
-    source 2924
-    target 3145
-    weight 46
-  ]
-  edge [
-    source 2924
-    target 3141
-    weight 60
-  ]
-  edge [
-    source 2924
-    target 4154
-    weight 21
-  ]
-  edge [
-    source 2924
-    target 3420
-    weight 32
-  ]
-  edge [
-    source 2924
-    target 3993
-    weight 28
-  ]
-  edge [
-    source 2924
-    target 3642
-    weight 23
-  ]
-  edge [
-    source 2924
-    target 3600
-    weight 40
-  ]
-  edge [
-    source 2924
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 2924
-    target 3917
-    weight 30
-  ]
-  edge [
-    source 2953
-    target 3141
-    weight 23
-  ]
-  edge [
-    source 2953
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 2953
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 2955
-    target 3600
-    weight 36
-  ]
-  edge [
-    source 2955
-    target 3174
-    weight 33
-  ]
-  edge [
-    source 2955
-    target 3521
-    weight 79
-  ]
-  edge [
-    source 2955
-    target 3141
-    weight 60
-  ]
-  edge [
-    source 2955
-    target 4051
-    weight 51
-  ]
-  edge [
-    source 2955
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 2955
-    target 3145
-    weight 29
-  ]
-  edge [
-    source 2955
-    target 3993
-    weight 23
-  ]
-  edge [
-    source 2978
-    target 3521
-    weight 54
-  ]
-  edge [
-    source 2978
-    target 3141
-    weight 34
-  ]
-  edge [
-    source 2978
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 2978
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 2983
-    target 4051
-    weight 35
-  ]
-  edge [
-    source 2983
-    target 3521
-    weight 41
-  ]
-  edge [
-    source 2983
-    target 3174
-    weight 38
-  ]
-  edge [
-    source 2983
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 2983
-    target 3276
-    weight 21
-  ]
-  edge [
-    source 2983
-    target 3145
-    weight 25
-  ]
-  edge [
-    source 2983
-    target 3993
-    weight 22
-  ]
-  edge [
-    source 2997
-    target 3521
-    weight 31
-  ]
-  edge [
-    source 2997
-    target 3141
-    weight 25
-  ]
-  edge [
-    source 3004
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 3006
-    target 3253
-    weight 96
-  ]
-  edge [
-    source 3006
-    target 3521
-    weight 805
-  ]
-  edge [
-    source 3006
-    target 4051
-    weight 677
-  ]
-  edge [
-    source 3006
-    target 3066
-    weight 173
-  ]
-  edge [
-    source 3006
-    target 3052
-    weight 88
-  ]
-  edge [
-    source 3006
-    target 3642
-    weight 289
-  ]
-  edge [
-    source 3006
-    target 3077
-    weight 28
-  ]
-  edge [
-    source 3006
-    target 3040
-    weight 291
-  ]
-  edge [
-    source 3006
-    target 3962
-    weight 93
-  ]
-  edge [
-    source 3006
-    target 3141
-    weight 642
-  ]
-  edge [
-    source 3006
-    target 3993
-    weight 304
-  ]
-  edge [
-    source 3006
-    target 3174
-    weight 357
-  ]
-  edge [
-    source 3006
-    target 3276
-    weight 284
-  ]
-  edge [
-    source 3006
-    target 3145
-    weight 396
-  ]
-  edge [
-    source 3006
-    target 3954
-    weight 282
-  ]
-  edge [
-    source 3006
-    target 3282
-    weight 240
-  ]
-  edge [
-    source 3006
-    target 3600
-    weight 372
-  ]
-  edge [
-    source 3006
-    target 3423
-    weight 162
-  ]
-  edge [
-    source 3006
-    target 3565
-    weight 190
-  ]
-  edge [
-    source 3006
-    target 3917
-    weight 234
-  ]
-  edge [
-    source 3006
-    target 4160
-    weight 29
-  ]
-  edge [
-    source 3006
-    target 3636
-    weight 154
-  ]
-  edge [
-    source 3006
-    target 4154
-    weight 175
-  ]
-  edge [
-    source 3006
-    target 3420
-    weight 109
-  ]
-  edge [
-    source 3006
-    target 3542
-    weight 181
-  ]
-  edge [
-    source 3006
-    target 3847
-    weight 67
-  ]
-  edge [
-    source 3006
-    target 3884
-    weight 39
-  ]
-  edge [
-    source 3006
-    target 4162
-    weight 89
-  ]
-  edge [
-    source 3006
-    target 3877
-    weight 42
-  ]
-  edge [
-    source 3006
-    target 4040
-    weight 34
-  ]
-  edge [
-    source 3006
-    target 3443
-    weight 115
-  ]
-  edge [
-    source 3006
-    target 3377
-    weight 40
-  ]
-  edge [
-    source 3006
-    target 3408
-    weight 28
-  ]
-  edge [
-    source 3006
-    target 3374
-    weight 136
-  ]
-  edge [
-    source 3006
-    target 3295
-    weight 80
-  ]
-  edge [
-    source 3006
-    target 3937
-    weight 52
-  ]
-  edge [
-    source 3006
-    target 3177
-    weight 26
-  ]
-  edge [
-    source 3006
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3006
-    target 3432
-    weight 24
-  ]
-  edge [
-    source 3011
-    target 3141
-    weight 32
-  ]
-  edge [
-    source 3011
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 3011
-    target 3521
-    weight 37
-  ]
-  edge [
-    source 3011
-    target 3600
-    weight 23
-  ]
-  edge [
-    source 3011
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 3024
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 3024
-    target 3276
-    weight 34
-  ]
-  edge [
-    source 3024
-    target 3282
-    weight 26
-  ]
-  edge [
-    source 3024
-    target 3141
-    weight 78
-  ]
-  edge [
-    source 3024
-    target 3642
-    weight 29
-  ]
-  edge [
-    source 3024
-    target 3145
-    weight 41
-  ]
-  edge [
-    source 3024
-    target 3174
-    weight 41
-  ]
-  edge [
-    source 3024
-    target 3600
-    weight 54
-  ]
-  edge [
-    source 3024
-    target 4051
-    weight 70
-  ]
-  edge [
-    source 3024
-    target 3993
-    weight 42
-  ]
-  edge [
-    source 3024
-    target 3917
-    weight 27
-  ]
-  edge [
-    source 3040
-    target 3521
-    weight 1103
-  ]
-  edge [
-    source 3040
-    target 3954
-    weight 300
-  ]
-  edge [
-    source 3040
-    target 3993
-    weight 465
-  ]
-  edge [
-    source 3040
-    target 3884
-    weight 40
-  ]
-  edge [
-    source 3040
-    target 3077
-    weight 45
-  ]
-  edge [
-    source 3040
-    target 3962
-    weight 144
-  ]
-  edge [
-    source 3040
-    target 4051
-    weight 930
-  ]
-  edge [
-    source 3040
-    target 3937
-    weight 70
-  ]
-  edge [
-    source 3040
-    target 3145
-    weight 595
-  ]
-  edge [
-    source 3040
-    target 3636
-    weight 201
-  ]
-  edge [
-    source 3040
-    target 3600
-    weight 524
-  ]
-  edge [
-    source 3040
-    target 3276
-    weight 440
-  ]
-  edge [
-    source 3040
-    target 3642
-    weight 359
-  ]
-  edge [
-    source 3040
-    target 3565
-    weight 210
-  ]
-  edge [
-    source 3040
-    target 4187
-    weight 42
-  ]
-  edge [
-    source 3040
-    target 3443
-    weight 169
-  ]
-  edge [
-    source 3040
-    target 3282
-    weight 299
-  ]
-  edge [
-    source 3040
-    target 3423
-    weight 258
-  ]
-  edge [
-    source 3040
-    target 3917
-    weight 332
-  ]
-  edge [
-    source 3040
-    target 3542
-    weight 225
-  ]
-  edge [
-    source 3040
-    target 3847
-    weight 72
-  ]
-  edge [
-    source 3040
-    target 3174
-    weight 482
-  ]
-  edge [
-    source 3040
-    target 3141
-    weight 889
-  ]
-  edge [
-    source 3040
-    target 3374
-    weight 177
-  ]
-  edge [
-    source 3040
-    target 4152
-    weight 24
-  ]
-  edge [
-    source 3040
-    target 3295
-    weight 102
-  ]
-  edge [
-    source 3040
-    target 3066
-    weight 203
-  ]
-  edge [
-    source 3040
-    target 3253
-    weight 101
-  ]
-  edge [
-    source 3040
-    target 3420
-    weight 133
-  ]
-  edge [
-    source 3040
-    target 4154
-    weight 222
-  ]
-  edge [
-    source 3040
-    target 3052
-    weight 76
-  ]
-  edge [
-    source 3040
-    target 4162
-    weight 106
-  ]
-  edge [
-    source 3040
-    target 4040
-    weight 59
-  ]
-  edge [
-    source 3040
-    target 3408
-    weight 38
-  ]
-  edge [
-    source 3040
-    target 3177
-    weight 39
-  ]
-  edge [
-    source 3040
-    target 4098
-    weight 25
-  ]
-  edge [
-    source 3040
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 3040
-    target 4027
-    weight 33
-  ]
-  edge [
-    source 3040
-    target 3860
-    weight 23
-  ]
-  edge [
-    source 3040
-    target 3377
-    weight 41
-  ]
-  edge [
-    source 3040
-    target 3432
-    weight 24
-  ]
-  edge [
-    source 3040
-    target 3877
-    weight 60
-  ]
-  edge [
-    source 3040
-    target 3196
-    weight 31
-  ]
-  edge [
-    source 3050
-    target 3141
-    weight 58
-  ]
-  edge [
-    source 3050
-    target 4051
-    weight 53
-  ]
-  edge [
-    source 3050
-    target 3521
-    weight 67
-  ]
-  edge [
-    source 3050
-    target 3600
-    weight 47
-  ]
-  edge [
-    source 3050
-    target 3276
-    weight 35
-  ]
-  edge [
-    source 3050
-    target 3174
-    weight 43
-  ]
-  edge [
-    source 3050
-    target 3917
-    weight 22
-  ]
-  edge [
-    source 3050
-    target 3993
-    weight 41
-  ]
-  edge [
-    source 3050
-    target 3145
-    weight 42
-  ]
-  edge [
-    source 3052
-    target 3253
-    weight 81
-  ]
-  edge [
-    source 3052
-    target 4051
-    weight 310
-  ]
-  edge [
-    source 3052
-    target 3521
-    weight 358
-  ]
-  edge [
-    source 3052
-    target 3066
-    weight 98
-  ]
-  edge [
-    source 3052
-    target 3600
-    weight 194
-  ]
-  edge [
-    source 3052
-    target 3954
-    weight 105
-  ]
-  edge [
-    source 3052
-    target 3141
-    weight 317
-  ]
-  edge [
-    source 3052
-    target 3565
-    weight 64
-  ]
-  edge [
-    source 3052
-    target 3295
-    weight 61
-  ]
-  edge [
-    source 3052
-    target 3642
-    weight 137
-  ]
-  edge [
-    source 3052
-    target 3847
-    weight 26
-  ]
-  edge [
-    source 3052
-    target 3282
-    weight 123
-  ]
-  edge [
-    source 3052
-    target 3145
-    weight 239
-  ]
-  edge [
-    source 3052
-    target 3174
-    weight 187
-  ]
-  edge [
-    source 3052
-    target 3993
-    weight 171
-  ]
-  edge [
-    source 3052
-    target 3276
-    weight 187
-  ]
-  edge [
-    source 3052
-    target 4154
-    weight 95
-  ]
-  edge [
-    source 3052
-    target 3884
-    weight 36
-  ]
-  edge [
-    source 3052
-    target 3374
-    weight 80
-  ]
-  edge [
-    source 3052
-    target 3636
-    weight 88
-  ]
-  edge [
-    source 3052
-    target 3542
-    weight 120
-  ]
-  edge [
-    source 3052
-    target 3420
-    weight 62
-  ]
-  edge [
-    source 3052
-    target 3917
-    weight 155
-  ]
-  edge [
-    source 3052
-    target 3443
-    weight 80
-  ]
-  edge [
-    source 3052
-    target 4040
-    weight 30
-  ]
-  edge [
-    source 3052
-    target 3937
-    weight 23
-  ]
-  edge [
-    source 3052
-    target 3077
-    weight 21
-  ]
-  edge [
-    source 3052
-    target 3962
-    weight 59
-  ]
-  edge [
-    source 3052
-    target 4162
-    weight 33
-  ]
-  edge [
-    source 3052
-    target 3877
-    weight 29
-  ]
-  edge [
-    source 3052
-    target 3377
-    weight 27
-  ]
-  edge [
-    source 3052
-    target 3423
-    weight 82
-  ]
-  edge [
-    source 3066
-    target 3565
-    weight 207
-  ]
-  edge [
-    source 3066
-    target 3521
-    weight 776
-  ]
-  edge [
-    source 3066
-    target 3600
-    weight 397
-  ]
-  edge [
-    source 3066
-    target 3993
-    weight 330
-  ]
-  edge [
-    source 3066
-    target 3420
-    weight 131
-  ]
-  edge [
-    source 3066
-    target 3253
-    weight 124
-  ]
-  edge [
-    source 3066
-    target 3282
-    weight 268
-  ]
-  edge [
-    source 3066
-    target 3642
-    weight 271
-  ]
-  edge [
-    source 3066
-    target 3937
-    weight 49
-  ]
-  edge [
-    source 3066
-    target 4051
-    weight 686
-  ]
-  edge [
-    source 3066
-    target 3917
-    weight 294
-  ]
-  edge [
-    source 3066
-    target 3141
-    weight 666
-  ]
-  edge [
-    source 3066
-    target 3542
-    weight 211
-  ]
-  edge [
-    source 3066
-    target 3636
-    weight 175
-  ]
-  edge [
-    source 3066
-    target 3954
-    weight 254
-  ]
-  edge [
-    source 3066
-    target 3174
-    weight 388
-  ]
-  edge [
-    source 3066
-    target 4160
-    weight 25
-  ]
-  edge [
-    source 3066
-    target 3145
-    weight 456
-  ]
-  edge [
-    source 3066
-    target 3847
-    weight 48
-  ]
-  edge [
-    source 3066
-    target 4040
-    weight 53
-  ]
-  edge [
-    source 3066
-    target 3443
-    weight 158
-  ]
-  edge [
-    source 3066
-    target 4154
-    weight 144
-  ]
-  edge [
-    source 3066
-    target 3276
-    weight 386
-  ]
-  edge [
-    source 3066
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3066
-    target 3935
-    weight 24
-  ]
-  edge [
-    source 3066
-    target 3377
-    weight 62
-  ]
-  edge [
-    source 3066
-    target 3374
-    weight 142
-  ]
-  edge [
-    source 3066
-    target 3423
-    weight 176
-  ]
-  edge [
-    source 3066
-    target 3432
-    weight 24
-  ]
-  edge [
-    source 3066
-    target 3884
-    weight 49
-  ]
-  edge [
-    source 3066
-    target 3962
-    weight 102
-  ]
-  edge [
-    source 3066
-    target 3956
-    weight 21
-  ]
-  edge [
-    source 3066
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 3066
-    target 3295
-    weight 81
-  ]
-  edge [
-    source 3066
-    target 4098
-    weight 31
-  ]
-  edge [
-    source 3066
-    target 3968
-    weight 27
-  ]
-  edge [
-    source 3066
-    target 3196
-    weight 32
-  ]
-  edge [
-    source 3066
-    target 4162
-    weight 76
-  ]
-  edge [
-    source 3066
-    target 4187
-    weight 27
-  ]
-  edge [
-    source 3066
-    target 3077
-    weight 30
-  ]
-  edge [
-    source 3066
-    target 3177
-    weight 39
-  ]
-  edge [
-    source 3066
-    target 3877
-    weight 30
-  ]
-  edge [
-    source 3071
-    target 3600
-    weight 65
-  ]
-  edge [
-    source 3071
-    target 3917
-    weight 43
-  ]
-  edge [
-    source 3071
-    target 3521
-    weight 90
-  ]
-  edge [
-    source 3071
-    target 3642
-    weight 35
-  ]
-  edge [
-    source 3071
-    target 3276
-    weight 73
-  ]
-  edge [
-    source 3071
-    target 3420
-    weight 23
-  ]
-  edge [
-    source 3071
-    target 3542
-    weight 26
-  ]
-  edge [
-    source 3071
-    target 4051
-    weight 71
-  ]
-  edge [
-    source 3071
-    target 3174
-    weight 47
-  ]
-  edge [
-    source 3071
-    target 3145
-    weight 65
-  ]
-  edge [
-    source 3071
-    target 3443
-    weight 34
-  ]
-  edge [
-    source 3071
-    target 3141
-    weight 82
-  ]
-  edge [
-    source 3071
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 3071
-    target 3636
-    weight 30
-  ]
-  edge [
-    source 3071
-    target 3374
-    weight 25
-  ]
-  edge [
-    source 3071
-    target 3423
-    weight 23
-  ]
-  edge [
-    source 3071
-    target 3282
-    weight 47
-  ]
-  edge [
-    source 3074
-    target 3521
-    weight 24
-  ]
-  edge [
-    source 3074
-    target 4051
-    weight 21
-  ]
-  edge [
-    source 3074
-    target 3141
-    weight 22
-  ]
-  edge [
-    source 3077
-    target 3521
-    weight 641
-  ]
-  edge [
-    source 3077
-    target 3565
-    weight 72
-  ]
-  edge [
-    source 3077
-    target 3276
-    weight 211
-  ]
-  edge [
-    source 3077
-    target 3374
-    weight 168
-  ]
-  edge [
-    source 3077
-    target 3423
-    weight 306
-  ]
-  edge [
-    source 3077
-    target 3962
-    weight 123
-  ]
-  edge [
-    source 3077
-    target 3693
-    weight 57
-  ]
-  edge [
-    source 3077
-    target 3357
-    weight 33
-  ]
-  edge [
-    source 3077
-    target 3145
-    weight 226
-  ]
-  edge [
-    source 3077
-    target 3642
-    weight 102
-  ]
-  edge [
-    source 3077
-    target 3141
-    weight 417
-  ]
-  edge [
-    source 3077
-    target 3993
-    weight 207
-  ]
-  edge [
-    source 3077
-    target 3408
-    weight 88
-  ]
-  edge [
-    source 3077
-    target 3600
-    weight 283
-  ]
-  edge [
-    source 3077
-    target 3917
-    weight 124
-  ]
-  edge [
-    source 3077
-    target 3937
-    weight 37
-  ]
-  edge [
-    source 3077
-    target 4154
-    weight 39
-  ]
-  edge [
-    source 3077
-    target 4051
-    weight 388
-  ]
-  edge [
-    source 3077
-    target 3443
-    weight 57
-  ]
-  edge [
-    source 3077
-    target 3174
-    weight 169
-  ]
-  edge [
-    source 3077
-    target 3877
-    weight 31
-  ]
-  edge [
-    source 3077
-    target 3253
-    weight 33
-  ]
-  edge [
-    source 3077
-    target 3954
-    weight 41
-  ]
-  edge [
-    source 3077
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 3077
-    target 3636
-    weight 35
-  ]
-  edge [
-    source 3077
-    target 3420
-    weight 33
-  ]
-  edge [
-    source 3077
-    target 3641
-    weight 26
-  ]
-  edge [
-    source 3077
-    target 3282
-    weight 58
-  ]
-  edge [
-    source 3102
-    target 3521
-    weight 96
-  ]
-  edge [
-    source 3108
-    target 3521
-    weight 49
-  ]
-  edge [
-    source 3108
-    target 3443
-    weight 21
-  ]
-  edge [
-    source 3108
-    target 3282
-    weight 27
-  ]
-  edge [
-    source 3108
-    target 3141
-    weight 44
-  ]
-  edge [
-    source 3108
-    target 4051
-    weight 38
-  ]
-  edge [
-    source 3108
-    target 3600
-    weight 30
-  ]
-  edge [
-    source 3108
-    target 3145
-    weight 33
-  ]
-  edge [
-    source 3108
-    target 3174
-    weight 25
-  ]
-  edge [
-    source 3108
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 3108
-    target 3542
-    weight 21
-  ]
-  edge [
-    source 3108
-    target 3993
-    weight 29
-  ]
-  edge [
-    source 3108
-    target 3276
-    weight 28
-  ]
-  edge [
-    source 3112
-    target 3521
-    weight 168
-  ]
-  edge [
-    source 3112
-    target 3849
-    weight 61
-  ]
-  edge [
-    source 3112
-    target 4051
-    weight 36
-  ]
-  edge [
-    source 3112
-    target 3141
-    weight 30
-  ]
-  edge [
-    source 3141
-    target 3600
-    weight 6943
-  ]
-  edge [
-    source 3141
-    target 3423
-    weight 1813
-  ]
-  edge [
-    source 3141
-    target 4051
-    weight 12852
-  ]
-  edge [
-    source 3141
-    target 3521
-    weight 20908
-  ]
-  edge [
-    source 3141
-    target 3565
-    weight 1917
-  ]
-  edge [
-    source 3141
-    target 3642
-    weight 2966
-  ]
-  edge [
-    source 3141
-    target 3420
-    weight 542
-  ]
-  edge [
-    source 3141
-    target 3993
-    weight 3349
-  ]
-  edge [
-    source 3141
-    target 3985
-    weight 78
-  ]
-  edge [
-    source 3141
-    target 3968
-    weight 106
-  ]
-  edge [
-    source 3141
-    target 3282
-    weight 1462
-  ]
-  edge [
-    source 3141
-    target 3636
-    weight 765
-  ]
-  edge [
-    source 3141
-    target 4187
-    weight 124
-  ]
-  edge [
-    source 3141
-    target 4152
-    weight 106
-  ]
-  edge [
-    source 3141
-    target 3443
-    weight 938
-  ]
-  edge [
-    source 3141
-    target 3542
-    weight 1149
-  ]
-  edge [
-    source 3141
-    target 3937
-    weight 234
-  ]
-  edge [
-    source 3141
-    target 3962
-    weight 849
-  ]
-  edge [
-    source 3141
-    target 3917
-    weight 1925
-  ]
-  edge [
-    source 3141
-    target 3276
-    weight 4861
-  ]
-  edge [
-    source 3141
-    target 3253
-    weight 544
-  ]
-  edge [
-    source 3141
-    target 3374
-    weight 989
-  ]
-  edge [
-    source 3141
-    target 3145
-    weight 4254
-  ]
-  edge [
-    source 3141
-    target 3377
-    weight 206
-  ]
-  edge [
-    source 3141
-    target 3174
-    weight 4918
-  ]
-  edge [
-    source 3141
-    target 4154
-    weight 1141
-  ]
-  edge [
-    source 3141
-    target 3295
-    weight 490
-  ]
-  edge [
-    source 3141
-    target 4027
-    weight 89
-  ]
-  edge [
-    source 3141
-    target 3847
-    weight 281
-  ]
-  edge [
-    source 3141
-    target 3954
-    weight 823
-  ]
-  edge [
-    source 3141
-    target 4040
-    weight 229
-  ]
-  edge [
-    source 3141
-    target 4100
-    weight 36
-  ]
-  edge [
-    source 3141
-    target 3861
-    weight 70
-  ]
-  edge [
-    source 3141
-    target 4162
-    weight 340
-  ]
-  edge [
-    source 3141
-    target 3693
-    weight 42
-  ]
-  edge [
-    source 3141
-    target 3375
-    weight 22
-  ]
-  edge [
-    source 3141
-    target 3309
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3177
-    weight 172
-  ]
-  edge [
-    source 3141
-    target 3956
-    weight 35
-  ]
-  edge [
-    source 3141
-    target 3196
-    weight 96
-  ]
-  edge [
-    source 3141
-    target 3935
-    weight 64
-  ]
-  edge [
-    source 3141
-    target 4160
-    weight 82
-  ]
-  edge [
-    source 3141
-    target 3408
-    weight 245
-  ]
-  edge [
-    source 3141
-    target 3884
-    weight 131
-  ]
-  edge [
-    source 3141
-    target 3860
-    weight 87
-  ]
-  edge [
-    source 3141
-    target 3324
-    weight 27
-  ]
-  edge [
-    source 3141
-    target 3432
-    weight 91
-  ]
-  edge [
-    source 3141
-    target 3952
-    weight 33
-  ]
-  edge [
-    source 3141
-    target 3162
-    weight 86
-  ]
-  edge [
-    source 3141
-    target 3877
-    weight 253
-  ]
-  edge [
-    source 3141
-    target 3674
-    weight 22
-  ]
-  edge [
-    source 3141
-    target 3465
-    weight 26
-  ]
-  edge [
-    source 3141
-    target 3641
-    weight 94
-  ]
-  edge [
-    source 3141
-    target 3559
-    weight 37
-  ]
-  edge [
-    source 3141
-    target 4098
-    weight 83
-  ]
-  edge [
-    source 3141
-    target 3663
-    weight 21
-  ]
-  edge [
-    source 3141
-    target 3692
-    weight 32
-  ]
-  edge [
-    source 3141
-    target 4007
-    weight 38
-  ]
-  edge [
-    source 3141
-    target 3752
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3677
-    weight 82
-  ]
-  edge [
-    source 3141
-    target 3633
-    weight 66
-  ]
-  edge [
-    source 3141
-    target 3872
-    weight 58
-  ]
-  edge [
-    source 3141
-    target 3462
-    weight 41
-  ]
-  edge [
-    source 3141
-    target 3146
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3856
-    weight 25
-  ]
-  edge [
-    source 3141
-    target 3737
-    weight 41
-  ]
-  edge [
-    source 3141
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 3141
-    target 3357
-    weight 62
-  ]
-  edge [
-    source 3141
-    target 3876
-    weight 48
-  ]
-  edge [
-    source 3145
-    target 3521
-    weight 5316
-  ]
-  edge [
-    source 3145
-    target 3985
-    weight 41
-  ]
-  edge [
-    source 3145
-    target 3276
-    weight 2219
-  ]
-  edge [
-    source 3145
-    target 3420
-    weight 384
-  ]
-  edge [
-    source 3145
-    target 3565
-    weight 779
-  ]
-  edge [
-    source 3145
-    target 3968
-    weight 80
-  ]
-  edge [
-    source 3145
-    target 3600
-    weight 2713
-  ]
-  edge [
-    source 3145
-    target 3641
-    weight 83
-  ]
-  edge [
-    source 3145
-    target 3174
-    weight 2154
-  ]
-  edge [
-    source 3145
-    target 3432
-    weight 79
-  ]
-  edge [
-    source 3145
-    target 3993
-    weight 1856
-  ]
-  edge [
-    source 3145
-    target 3443
-    weight 606
-  ]
-  edge [
-    source 3145
-    target 3282
-    weight 886
-  ]
-  edge [
-    source 3145
-    target 3917
-    weight 1473
-  ]
-  edge [
-    source 3145
-    target 3642
-    weight 1288
-  ]
-  edge [
-    source 3145
-    target 3542
-    weight 701
-  ]
-  edge [
-    source 3145
-    target 4051
-    weight 3768
-  ]
-  edge [
-    source 3145
-    target 3377
-    weight 145
-  ]
-  edge [
-    source 3145
-    target 4027
-    weight 75
-  ]
-  edge [
-    source 3145
-    target 3374
-    weight 643
-  ]
-  edge [
-    source 3145
-    target 3954
-    weight 554
-  ]
-  edge [
-    source 3145
-    target 3962
-    weight 523
-  ]
-  edge [
-    source 3145
-    target 3636
-    weight 495
-  ]
-  edge [
-    source 3145
-    target 3937
-    weight 162
-  ]
-  edge [
-    source 3145
-    target 3935
-    weight 36
-  ]
-  edge [
-    source 3145
-    target 4160
-    weight 41
-  ]
-  edge [
-    source 3145
-    target 4154
-    weight 685
-  ]
-  edge [
-    source 3145
-    target 4187
-    weight 86
-  ]
-  edge [
-    source 3145
-    target 3860
-    weight 66
-  ]
-  edge [
-    source 3145
-    target 4100
-    weight 23
-  ]
-  edge [
-    source 3145
-    target 3253
-    weight 379
-  ]
-  edge [
-    source 3145
-    target 3295
-    weight 258
-  ]
-  edge [
-    source 3145
-    target 4152
-    weight 56
-  ]
-  edge [
-    source 3145
-    target 3423
-    weight 1000
-  ]
-  edge [
-    source 3145
-    target 4007
-    weight 26
-  ]
-  edge [
-    source 3145
-    target 3861
-    weight 42
-  ]
-  edge [
-    source 3145
-    target 4162
-    weight 237
-  ]
-  edge [
-    source 3145
-    target 3162
-    weight 50
-  ]
-  edge [
-    source 3145
-    target 3177
-    weight 132
-  ]
-  edge [
-    source 3145
-    target 3847
-    weight 144
-  ]
-  edge [
-    source 3145
-    target 3877
-    weight 174
-  ]
-  edge [
-    source 3145
-    target 4098
-    weight 54
-  ]
-  edge [
-    source 3145
-    target 3884
-    weight 85
-  ]
-  edge [
-    source 3145
-    target 3752
-    weight 22
-  ]
-  edge [
-    source 3145
-    target 3956
-    weight 28
-  ]
-  edge [
-    source 3145
-    target 3408
-    weight 132
-  ]
-  edge [
-    source 3145
-    target 3196
-    weight 65
-  ]
-  edge [
-    source 3145
-    target 4040
-    weight 144
-  ]
-  edge [
-    source 3145
-    target 3693
-    weight 27
-  ]
-  edge [
-    source 3145
-    target 3677
-    weight 85
-  ]
-  edge [
-    source 3145
-    target 3559
-    weight 23
-  ]
-  edge [
-    source 3145
-    target 3872
-    weight 54
-  ]
-  edge [
-    source 3145
-    target 3440
-    weight 35
-  ]
-  edge [
-    source 3145
-    target 3357
-    weight 37
-  ]
-  edge [
-    source 3145
-    target 3737
-    weight 24
-  ]
-  edge [
-    source 3145
-    target 3633
-    weight 35
-  ]
-  edge [
-    source 3145
-    target 3876
-    weight 41
-  ]
-  edge [
-    source 3146
-    target 3521
-    weight 30
-  ]
-  edge [
-    source 3146
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 3162
-    target 3521
-    weight 93
-  ]
-  edge [
-    source 3162
-    target 3642
-    weight 27
-  ]
-  edge [
-    source 3162
-    target 3600
-    weight 63
-  ]
-  edge [
-    source 3162
-    target 3276
-    weight 56
-  ]
-  edge [
-    source 3162
-    target 3282
-    weight 26
-  ]
-  edge [
-    source 3162
-    target 3917
-    weight 36
-  ]
-  edge [
-    source 3162
-    target 3993
-    weight 39
-  ]
-  edge [
-    source 3162
-    target 4051
-    weight 78
-  ]
-  edge [
-    source 3162
-    target 3174
-    weight 53
-  ]
-  edge [
-    source 3162
-    target 3423
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 3521
-    weight 6172
-  ]
-  edge [
-    source 3174
-    target 4051
-    weight 4511
-  ]
-  edge [
-    source 3174
-    target 3276
-    weight 2256
-  ]
-  edge [
-    source 3174
-    target 3600
-    weight 2654
-  ]
-  edge [
-    source 3174
-    target 3253
-    weight 300
-  ]
-  edge [
-    source 3174
-    target 3374
-    weight 518
-  ]
-  edge [
-    source 3174
-    target 3962
-    weight 378
-  ]
-  edge [
-    source 3174
-    target 3443
-    weight 483
-  ]
-  edge [
-    source 3174
-    target 3993
-    weight 1585
-  ]
-  edge [
-    source 3174
-    target 3642
-    weight 1485
-  ]
-  edge [
-    source 3174
-    target 3954
-    weight 496
-  ]
-  edge [
-    source 3174
-    target 3565
-    weight 669
-  ]
-  edge [
-    source 3174
-    target 3935
-    weight 31
-  ]
-  edge [
-    source 3174
-    target 3282
-    weight 712
-  ]
-  edge [
-    source 3174
-    target 4154
-    weight 629
-  ]
-  edge [
-    source 3174
-    target 3636
-    weight 343
-  ]
-  edge [
-    source 3174
-    target 3937
-    weight 124
-  ]
-  edge [
-    source 3174
-    target 3423
-    weight 892
-  ]
-  edge [
-    source 3174
-    target 3917
-    weight 1018
-  ]
-  edge [
-    source 3174
-    target 4187
-    weight 64
-  ]
-  edge [
-    source 3174
-    target 3420
-    weight 292
-  ]
-  edge [
-    source 3174
-    target 3295
-    weight 329
-  ]
-  edge [
-    source 3174
-    target 3196
-    weight 74
-  ]
-  edge [
-    source 3174
-    target 3377
-    weight 148
-  ]
-  edge [
-    source 3174
-    target 4152
-    weight 45
-  ]
-  edge [
-    source 3174
-    target 3884
-    weight 66
-  ]
-  edge [
-    source 3174
-    target 4027
-    weight 54
-  ]
-  edge [
-    source 3174
-    target 3542
-    weight 577
-  ]
-  edge [
-    source 3174
-    target 3847
-    weight 124
-  ]
-  edge [
-    source 3174
-    target 4040
-    weight 132
-  ]
-  edge [
-    source 3174
-    target 3956
-    weight 25
-  ]
-  edge [
-    source 3174
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 3174
-    target 3408
-    weight 113
-  ]
-  edge [
-    source 3174
-    target 3641
-    weight 58
-  ]
-  edge [
-    source 3174
-    target 3985
-    weight 26
-  ]
-  edge [
-    source 3174
-    target 3462
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 4160
-    weight 40
-  ]
-  edge [
-    source 3174
-    target 3968
-    weight 59
-  ]
-  edge [
-    source 3174
-    target 4098
-    weight 52
-  ]
-  edge [
-    source 3174
-    target 3877
-    weight 133
-  ]
-  edge [
-    source 3174
-    target 4162
-    weight 177
-  ]
-  edge [
-    source 3174
-    target 3861
-    weight 37
-  ]
-  edge [
-    source 3174
-    target 4007
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 3177
-    weight 105
-  ]
-  edge [
-    source 3174
-    target 3677
-    weight 51
-  ]
-  edge [
-    source 3174
-    target 3856
-    weight 30
-  ]
-  edge [
-    source 3174
-    target 3432
-    weight 51
-  ]
-  edge [
-    source 3174
-    target 3357
-    weight 33
-  ]
-  edge [
-    source 3174
-    target 3559
-    weight 21
-  ]
-  edge [
-    source 3174
-    target 3872
-    weight 34
-  ]
-  edge [
-    source 3174
-    target 3633
-    weight 27
-  ]
-  edge [
-    source 3174
-    target 3876
-    weight 33
-  ]
-  edge [
-    source 3177
-    target 3600
-    weight 128
-  ]
-  edge [
-    source 3177
-    target 3521
-    weight 210
-  ]
-  edge [
-    source 3177
-    target 3937
-    weight 30
-  ]
-  edge [
-    source 3177
-    target 3423
-    weight 88
-  ]
-  edge [
-    source 3177
-    target 3443
-    weight 46
-  ]
-  edge [
-    source 3177
-    target 4051
-    weight 154
-  ]
-  edge [
-    source 3177
-    target 3642
-    weight 64
-  ]
-  edge [
-    source 3177
-    target 3282
-    weight 64
-  ]
-  edge [
-    source 3177
-    target 3276
-    weight 110
-  ]
-  edge [
-    source 3177
-    target 3917
-    weight 75
-  ]
-  edge [
-    source 3177
-    target 3636
-    weight 42
-  ]
-  edge [
-    source 3177
-    target 3962
-    weight 61
-  ]
-  edge [
-    source 3177
-    target 3993
-    weight 126
-  ]
-  edge [
-    source 3177
-    target 3420
-    weight 41
-  ]
-  edge [
-    source 3177
-    target 4154
-    weight 30
-  ]
-  edge [
-    source 3177
-    target 3954
-    weight 47
-  ]
-  edge [
-    source 3177
-    target 3374
-    weight 52
-  ]
-  edge [
-    source 3177
-    target 3253
-    weight 31
-  ]
-  edge [
-    source 3177
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 3177
-    target 3565
-    weight 49
-  ]
-  edge [
-    source 3196
-    target 3600
-    weight 61
-  ]
-  edge [
-    source 3196
-    target 3521
-    weight 109
-  ]
-  edge [
-    source 3196
-    target 3642
-    weight 43
-  ]
-  edge [
-    source 3196
-    target 3993
-    weight 46
-  ]
-  edge [
-    source 3196
-    target 3636
-    weight 23
-  ]
-  edge [
-    source 3196
-    target 3253
-    weight 39
-  ]
-  edge [
-    source 3196
-    target 4051
-    weight 87
-  ]
-  edge [
-    source 3196
-    target 3295
-    weight 38
-  ]
-  edge [
-    source 3196
-    target 3917
-    weight 35
-  ]
-  edge [
-    source 3196
-    target 3542
-    weight 44
-  ]
-  edge [
-    source 3196
-    target 3954
-    weight 32
-  ]
-  edge [
-    source 3196
-    target 3443
-    weight 26
-  ]
-  edge [
-    source 3196
-    target 3282
-    weight 33
-  ]
-  edge [
-    source 3196
-    target 3276
-    weight 55
-  ]
-  edge [
-    source 3196
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 3196
-    target 3423
-    weight 29
-  ]
-  edge [
-    source 3210
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 3222
-    target 3521
-    weight 26
-  ]
-  edge [
-    source 3253
-    target 4051
-    weight 490
-  ]
-  edge [
-    source 3253
-    target 3521
-    weight 637
-  ]
-  edge [
-    source 3253
-    target 3565
-    weight 134
-  ]
-  edge [
-    source 3253
-    target 3993
-    weight 253
-  ]
-  edge [
-    source 3253
-    target 3600
-    weight 319
-  ]
-  edge [
-    source 3253
-    target 3282
-    weight 197
-  ]
-  edge [
-    source 3253
-    target 3542
-    weight 227
-  ]
-  edge [
-    source 3253
-    target 3917
-    weight 224
-  ]
-  edge [
-    source 3253
-    target 3636
-    weight 146
-  ]
-  edge [
-    source 3253
-    target 3847
-    weight 57
-  ]
-  edge [
-    source 3253
-    target 3937
-    weight 34
-  ]
-  edge [
-    source 3253
-    target 3423
-    weight 115
-  ]
-  edge [
-    source 3253
-    target 3276
-    weight 310
-  ]
-  edge [
-    source 3253
-    target 3642
-    weight 220
-  ]
-  edge [
-    source 3253
-    target 3954
-    weight 122
-  ]
-  edge [
-    source 3253
-    target 3295
-    weight 102
-  ]
-  edge [
-    source 3253
-    target 3443
-    weight 115
-  ]
-  edge [
-    source 3253
-    target 3432
-    weight 26
-  ]
-  edge [
-    source 3253
-    target 4027
-    weight 22
-  ]
-  edge [
-    source 3253
-    target 3884
-    weight 43
-  ]
-  edge [
-    source 3253
-    target 3860
-    weight 24
-  ]
-  edge [
-    source 3253
-    target 3420
-    weight 83
-  ]
-  edge [
-    source 3253
-    target 4154
-    weight 118
-  ]
-  edge [
-    source 3253
-    target 3968
-    weight 27
-  ]
-  edge [
-    source 3253
-    target 3962
-    weight 88
-  ]
-  edge [
-    source 3253
-    target 3408
-    weight 22
-  ]
-  edge [
-    source 3253
-    target 3374
-    weight 106
-  ]
-  edge [
-    source 3253
-    target 3377
-    weight 41
-  ]
-  edge [
-    source 3253
-    target 4040
-    weight 32
-  ]
-  edge [
-    source 3253
-    target 4187
-    weight 21
-  ]
-  edge [
-    source 3253
-    target 3877
-    weight 29
-  ]
-  edge [
-    source 3253
-    target 4162
-    weight 50
-  ]
-  edge [
-    source 3276
-    target 3521
-    weight 5618
-  ]
-  edge [
-    source 3276
-    target 3600
-    weight 3163
-  ]
-  edge [
-    source 3276
-    target 3565
-    weight 753
-  ]
-  edge [
-    source 3276
-    target 3374
-    weight 579
-  ]
-  edge [
-    source 3276
-    target 4051
-    weight 4170
-  ]
-  edge [
-    source 3276
-    target 3423
-    weight 900
-  ]
-  edge [
-    source 3276
-    target 3641
-    weight 56
-  ]
-  edge [
-    source 3276
-    target 3642
-    weight 1294
-  ]
-  edge [
-    source 3276
-    target 3420
-    weight 297
-  ]
-  edge [
-    source 3276
-    target 3917
-    weight 1200
-  ]
-  edge [
-    source 3276
-    target 4187
-    weight 80
-  ]
-  edge [
-    source 3276
-    target 3542
-    weight 583
-  ]
-  edge [
-    source 3276
-    target 3993
-    weight 1906
-  ]
-  edge [
-    source 3276
-    target 3937
-    weight 129
-  ]
-  edge [
-    source 3276
-    target 3282
-    weight 810
-  ]
-  edge [
-    source 3276
-    target 3968
-    weight 48
-  ]
-  edge [
-    source 3276
-    target 3443
-    weight 587
-  ]
-  edge [
-    source 3276
-    target 3377
-    weight 121
-  ]
-  edge [
-    source 3276
-    target 3962
-    weight 447
-  ]
-  edge [
-    source 3276
-    target 3636
-    weight 402
-  ]
-  edge [
-    source 3276
-    target 4027
-    weight 45
-  ]
-  edge [
-    source 3276
-    target 3985
-    weight 31
-  ]
-  edge [
-    source 3276
-    target 4098
-    weight 51
-  ]
-  edge [
-    source 3276
-    target 4154
-    weight 537
-  ]
-  edge [
-    source 3276
-    target 3935
-    weight 34
-  ]
-  edge [
-    source 3276
-    target 3954
-    weight 440
-  ]
-  edge [
-    source 3276
-    target 3295
-    weight 239
-  ]
-  edge [
-    source 3276
-    target 3847
-    weight 114
-  ]
-  edge [
-    source 3276
-    target 4152
-    weight 57
-  ]
-  edge [
-    source 3276
-    target 3408
-    weight 130
-  ]
-  edge [
-    source 3276
-    target 3440
-    weight 22
-  ]
-  edge [
-    source 3276
-    target 4040
-    weight 122
-  ]
-  edge [
-    source 3276
-    target 4162
-    weight 165
-  ]
-  edge [
-    source 3276
-    target 3861
-    weight 37
-  ]
-  edge [
-    source 3276
-    target 3877
-    weight 156
-  ]
-  edge [
-    source 3276
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 3276
-    target 4160
-    weight 36
-  ]
-  edge [
-    source 3276
-    target 3884
-    weight 62
-  ]
-  edge [
-    source 3276
-    target 3432
-    weight 55
-  ]
-  edge [
-    source 3276
-    target 3677
-    weight 53
-  ]
-  edge [
-    source 3276
-    target 3872
-    weight 36
-  ]
-  edge [
-    source 3276
-    target 3357
-    weight 28
-  ]
-  edge [
-    source 3276
-    target 3737
-    weight 32
-  ]
-  edge [
-    source 3276
-    target 3633
-    weight 35
-  ]
-  edge [
-    source 3276
-    target 3876
-    weight 35
-  ]
-  edge [
-    source 3282
-    target 3521
-    weight 1562
-  ]
-  edge [
-    source 3282
-    target 4051
-    weight 1200
-  ]
-  edge [
-    source 3282
-    target 3600
-    weight 901
-  ]
-  edge [
-    source 3282
-    target 3565
-    weight 404
-  ]
-  edge [
-    source 3282
-    target 3642
-    weight 483
-  ]
-  edge [
-    source 3282
-    target 3420
-    weight 239
-  ]
-  edge [
-    source 3282
-    target 3443
-    weight 325
-  ]
-  edge [
-    source 3282
-    target 3542
-    weight 418
-  ]
-  edge [
-    source 3282
-    target 3917
-    weight 540
-  ]
-  edge [
-    source 3282
-    target 3993
-    weight 748
-  ]
-  edge [
-    source 3282
-    target 3636
-    weight 298
-  ]
-  edge [
-    source 3282
-    target 4154
-    weight 299
-  ]
-  edge [
-    source 3282
-    target 3847
-    weight 123
-  ]
-  edge [
-    source 3282
-    target 3985
-    weight 34
-  ]
-  edge [
-    source 3282
-    target 3968
-    weight 38
-  ]
-  edge [
-    source 3282
-    target 3374
-    weight 244
-  ]
-  edge [
-    source 3282
-    target 3423
-    weight 303
-  ]
-  edge [
-    source 3282
-    target 4040
-    weight 88
-  ]
-  edge [
-    source 3282
-    target 4152
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3884
-    weight 65
-  ]
-  edge [
-    source 3282
-    target 3954
-    weight 315
-  ]
-  edge [
-    source 3282
-    target 3377
-    weight 71
-  ]
-  edge [
-    source 3282
-    target 4162
-    weight 113
-  ]
-  edge [
-    source 3282
-    target 3935
-    weight 28
-  ]
-  edge [
-    source 3282
-    target 3937
-    weight 99
-  ]
-  edge [
-    source 3282
-    target 4027
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3295
-    weight 139
-  ]
-  edge [
-    source 3282
-    target 3860
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3962
-    weight 199
-  ]
-  edge [
-    source 3282
-    target 4160
-    weight 26
-  ]
-  edge [
-    source 3282
-    target 4187
-    weight 37
-  ]
-  edge [
-    source 3282
-    target 3677
-    weight 30
-  ]
-  edge [
-    source 3282
-    target 3432
-    weight 33
-  ]
-  edge [
-    source 3282
-    target 3641
-    weight 30
-  ]
-  edge [
-    source 3282
-    target 3877
-    weight 65
-  ]
-  edge [
-    source 3282
-    target 3408
-    weight 35
-  ]
-  edge [
-    source 3282
-    target 4098
-    weight 25
-  ]
-  edge [
-    source 3295
-    target 4051
-    weight 438
-  ]
-  edge [
-    source 3295
-    target 3521
-    weight 596
-  ]
-  edge [
-    source 3295
-    target 3565
-    weight 111
-  ]
-  edge [
-    source 3295
-    target 3642
-    weight 241
-  ]
-  edge [
-    source 3295
-    target 3954
-    weight 96
-  ]
-  edge [
-    source 3295
-    target 3636
-    weight 92
-  ]
-  edge [
-    source 3295
-    target 3443
-    weight 111
-  ]
-  edge [
-    source 3295
-    target 3847
-    weight 45
-  ]
-  edge [
-    source 3295
-    target 3600
-    weight 245
-  ]
-  edge [
-    source 3295
-    target 3917
-    weight 147
-  ]
-  edge [
-    source 3295
-    target 4162
-    weight 40
-  ]
-  edge [
-    source 3295
-    target 3993
-    weight 195
-  ]
-  edge [
-    source 3295
-    target 3542
-    weight 172
-  ]
-  edge [
-    source 3295
-    target 3423
-    weight 104
-  ]
-  edge [
-    source 3295
-    target 3374
-    weight 73
-  ]
-  edge [
-    source 3295
-    target 3884
-    weight 24
-  ]
-  edge [
-    source 3295
-    target 3377
-    weight 35
-  ]
-  edge [
-    source 3295
-    target 4154
-    weight 120
-  ]
-  edge [
-    source 3295
-    target 3420
-    weight 56
-  ]
-  edge [
-    source 3295
-    target 3962
-    weight 66
-  ]
-  edge [
-    source 3295
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 3295
-    target 3877
-    weight 22
-  ]
-  edge [
-    source 3309
-    target 3521
-    weight 28
-  ]
-  edge [
-    source 3309
-    target 4051
-    weight 26
-  ]
-  edge [
-    source 3324
-    target 3521
-    weight 38
-  ]
-  edge [
-    source 3324
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 3357
-    target 3521
-    weight 104
-  ]
-  edge [
-    source 3357
-    target 3374
-    weight 38
-  ]
-  edge [
-    source 3357
-    target 4051
-    weight 71
-  ]
-  edge [
-    source 3357
-    target 3993
-    weight 27
-  ]
-  edge [
-    source 3357
-    target 3600
-    weight 41
-  ]
-  edge [
-    source 3357
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 3357
-    target 3423
-    weight 46
-  ]
-  edge [
-    source 3374
-    target 4187
-    weight 60
-  ]
-  edge [
-    source 3374
-    target 3600
-    weight 658
-  ]
-  edge [
-    source 3374
-    target 3565
-    weight 210
-  ]
-  edge [
-    source 3374
-    target 3521
-    weight 1321
-  ]
-  edge [
-    source 3374
-    target 4051
-    weight 928
-  ]
-  edge [
-    source 3374
-    target 3423
-    weight 436
-  ]
-  edge [
-    source 3374
-    target 3641
-    weight 44
-  ]
-  edge [
-    source 3374
-    target 3937
-    weight 80
-  ]
-  edge [
-    source 3374
-    target 3642
-    weight 302
-  ]
-  edge [
-    source 3374
-    target 3917
-    weight 379
-  ]
-  edge [
-    source 3374
-    target 3968
-    weight 32
-  ]
-  edge [
-    source 3374
-    target 3993
-    weight 546
-  ]
-  edge [
-    source 3374
-    target 3636
-    weight 152
-  ]
-  edge [
-    source 3374
-    target 4098
-    weight 21
-  ]
-  edge [
-    source 3374
-    target 3420
-    weight 124
-  ]
-  edge [
-    source 3374
-    target 3954
-    weight 168
-  ]
-  edge [
-    source 3374
-    target 3443
-    weight 179
-  ]
-  edge [
-    source 3374
-    target 3408
-    weight 154
-  ]
-  edge [
-    source 3374
-    target 3542
-    weight 201
-  ]
-  edge [
-    source 3374
-    target 3377
-    weight 46
-  ]
-  edge [
-    source 3374
-    target 4027
-    weight 34
-  ]
-  edge [
-    source 3374
-    target 3884
-    weight 32
-  ]
-  edge [
-    source 3374
-    target 3962
-    weight 171
-  ]
-  edge [
-    source 3374
-    target 4154
-    weight 147
-  ]
-  edge [
-    source 3374
-    target 4162
-    weight 67
-  ]
-  edge [
-    source 3374
-    target 3677
-    weight 22
-  ]
-  edge [
-    source 3374
-    target 3432
-    weight 30
-  ]
-  edge [
-    source 3374
-    target 4040
-    weight 50
-  ]
-  edge [
-    source 3374
-    target 4160
-    weight 24
-  ]
-  edge [
-    source 3374
-    target 3877
-    weight 59
-  ]
-  edge [
-    source 3374
-    target 3847
-    weight 33
-  ]
-  edge [
-    source 3375
-    target 3521
-    weight 29
-  ]
-  edge [
-    source 3375
-    target 4051
-    weight 24
-  ]
-  edge [
-    source 3377
-    target 3521
-    weight 252
-  ]
-  edge [
-    source 3377
-    target 3642
-    weight 82
-  ]
-  edge [
-    source 3377
-    target 4051
-    weight 200
-  ]
-  edge [
-    source 3377
-    target 3600
-    weight 117
-  ]
-  edge [
-    source 3377
-    target 3962
-    weight 43
-  ]
-  edge [
-    source 3377
-    target 3565
-    weight 50
-  ]
-  edge [
-    source 3377
-    target 3443
-    weight 40
-  ]
-  edge [
-    source 3377
-    target 3993
-    weight 95
-  ]
-  edge [
-    source 3377
-    target 3420
-    weight 35
-  ]
-  edge [
-    source 3377
-    target 3954
-    weight 63
-  ]
-  edge [
-    source 3377
-    target 4162
-    weight 26
-  ]
-  edge [
-    source 3377
-    target 4154
-    weight 38
-  ]
-  edge [
-    source 3377
-    target 3917
-    weight 82
-  ]
-  edge [
-    source 3377
-    target 3542
-    weight 50
-  ]
-  edge [
-    source 3377
-    target 3636
-    weight 42
-  ]
-  edge [
-    source 3377
-    target 3423
-    weight 53
-  ]
-  edge [
-    source 3392
-    target 3521
-    weight 21
-  ]
-  edge [
-    source 3408
-    target 3521
-    weight 349
-  ]
-  edge [
-    source 3408
-    target 4051
-    weight 238
-  ]
-  edge [
-    source 3408
-    target 3600
-    weight 177
-  ]
-  edge [
-    source 3408
-    target 3937
-    weight 22
-  ]
-  edge [
-    source 3408
-    target 3565
-    weight 28
-  ]
-  edge [
-    source 3408
-    target 3993
-    weight 135
-  ]
-  edge [
-    source 3408
-    target 3917
-    weight 76
-  ]
-  edge [
-    source 3408
-    target 3962
-    weight 57
-  ]
-  edge [
-    source 3408
-    target 3443
-    weight 32
-  ]
-  edge [
-    source 3408
-    target 3423
-    weight 141
-  ]
-  edge [
-    source 3408
-    target 3954
-    weight 24
-  ]
-  edge [
-    source 3408
-    target 4154
-    weight 24
-  ]
-  edge [
-    source 3408
-    target 3642
-    weight 52
-  ]
-  edge [
-    source 3408
-    target 3542
-    weight 35
-  ]
-  edge [
-    source 3420
-    target 3521
-    weight 619
-  ]
-  edge [
-    source 3420
-    target 3600
-    weight 367
-  ]
-  edge [
-    source 3420
-    target 3641
-    weight 28
-  ]
-  edge [
-    source 3420
-    target 3642
-    weight 207
-  ]
-  edge [
-    source 3420
-    target 3917
-    weight 236
-  ]
-  edge [
-    source 3420
-    target 4051
-    weight 489
-  ]
-  edge [
-    source 3420
-    target 3565
-    weight 193
-  ]
-  edge [
-    source 3420
-    target 3423
-    weight 138
-  ]
-  edge [
-    source 3420
-    target 3542
-    weight 160
-  ]
-  edge [
-    source 3420
-    target 3993
-    weight 296
-  ]
-  edge [
-    source 3420
-    target 3432
-    weight 22
-  ]
-  edge [
-    source 3420
-    target 3985
-    weight 22
-  ]
-  edge [
-    source 3420
-    target 4027
-    weight 21
-  ]
-  edge [
-    source 3420
-    target 3636
-    weight 149
-  ]
-  edge [
-    source 3420
-    target 3954
-    weight 129
-  ]
-  edge [
-    source 3420
-    target 3443
-    weight 143
-  ]
-  edge [
-    source 3420
-    target 3847
-    weight 59
-  ]
-  edge [
-    source 3420
-    target 4154
-    weight 133
-  ]
-  edge [
-    source 3420
-    target 4162
-    weight 53
-  ]
-  edge [
-    source 3420
-    target 3937
-    weight 54
-  ]
-  edge [
-    source 3420
-    target 3962
-    weight 107
-  ]
-  edge [
-    source 3420
-    target 3884
-    weight 34
-  ]
-  edge [
-    source 3420
-    target 3877
-    weight 44
-  ]
-  edge [
-    source 3420
-    target 4040
-    weight 39
-  ]
-  edge [
-    source 3420
-    target 4152
-    weight 21
-  ]
-  edge [
-    source 3420
-    target 4187
-    weight 27
-  ]
-  edge [
-    source 3423
-    target 3600
-    weight 1245
-  ]
-  edge [
-    source 3423
-    target 4051
-    weight 1671
-  ]
-  edge [
-    source 3423
-    target 3521
-    weight 2415
-  ]
-  edge [
-    source 3423
-    target 3565
-    weight 283
-  ]
-  edge [
-    source 3423
-    target 3642
-    weight 474
-  ]
-  edge [
-    source 3423
-    target 4187
-    weight 64
-  ]
-  edge [
-    source 3423
-    target 3641
-    weight 51
-  ]
-  edge [
-    source 3423
-    target 3432
-    weight 32
-  ]
-  edge [
-    source 3423
-    target 3937
-    weight 159
-  ]
-  edge [
-    source 3423
-    target 3861
-    weight 64
-  ]
-  edge [
-    source 3423
-    target 3993
-    weight 1044
-  ]
-  edge [
-    source 3423
-    target 3968
-    weight 38
-  ]
-  edge [
-    source 3423
-    target 3443
-    weight 235
-  ]
-  edge [
-    source 3423
-    target 4098
-    weight 29
-  ]
-  edge [
-    source 3423
-    target 3917
-    weight 541
-  ]
-  edge [
-    source 3423
-    target 3954
-    weight 217
-  ]
-  edge [
-    source 3423
-    target 3884
-    weight 28
-  ]
-  edge [
-    source 3423
-    target 3636
-    weight 182
-  ]
-  edge [
-    source 3423
-    target 3693
-    weight 35
-  ]
-  edge [
-    source 3423
-    target 3962
-    weight 363
-  ]
-  edge [
-    source 3423
-    target 4152
-    weight 31
-  ]
-  edge [
-    source 3423
-    target 4162
-    weight 94
-  ]
-  edge [
-    source 3423
-    target 4154
-    weight 235
-  ]
-  edge [
-    source 3423
-    target 4040
-    weight 72
-  ]
-  edge [
-    source 3423
-    target 3860
-    weight 30
-  ]
-  edge [
-    source 3423
-    target 3542
-    weight 260
-  ]
-  edge [
-    source 3423
-    target 3847
-    weight 44
-  ]
-  edge [
-    source 3423
-    target 4027
-    weight 31
-  ]
-  edge [
-    source 3423
-    target 3877
-    weight 66
-  ]
-  edge [
-    source 3423
-    target 3677
-    weight 29
-  ]
-  edge [
-    source 3423
-    target 3876
-    weight 21
-  ]
-  edge [
-    source 3432
-    target 3600
-    weight 63
-  ]
-  edge [
-    source 3432
-    target 3521
-    weight 110
-  ]
-  edge [
-    source 3432
-    target 3565
-    weight 29
-  ]
-  edge [
-    source 3432
-    target 3443
-    weight 25
-  ]
-  edge [
-    source 3432
-    target 3642
-    weight 44
-  ]
-  edge [
-    source 3432
-    target 4051
-    weight 90
-  ]
-  edge [
-    source 3432
-    target 3954
-    weight 28
-  ]
-  edge [
-    source 3432
-    target 3542
-    weight 26
-  ]
-  edge [
-    source 3432
-    target 3917
-    weight 60
-  ]
-  edge [
-    source 3432
-    target 3993
-    weight 60
-  ]
-  edge [
-    source 3432
-    target 3962
-    weight 21
-  ]
-  edge [
-    source 3432
-    target 3636
-    weight 32
-  ]
-  edge [
-    source 3437
-    target 3521
-    weight 46
-  ]
-  edge [
-    source 3440
-    target 3521
-    weight 40
-  ]
-  edge [
-    source 3440
-    target 3600
-    weight 27
-  ]
-  edge [
-    source 3440
-    target 4051
-    weight 34
-  ]
-  edge [
-    source 3440
-    target 3917
-    weight 21
-  ]
-  edge [
-    source 3443
-    target 3521
-    weight 1023
-  ]
-  edge [
-    source 3443
-    target 3565
-    weight 232
-  ]
-  edge [
-    source 3443
-    target 3600
-    weight 609
-  ]
-  edge [
-    source 3443
-    target 3642
-    weight 342
-  ]
-  edge [
-    source 3443
-    target 3542
-    weight 239
-  ]
-  edge [
-    source 3443
-    target 3993
-    weight 503
-  ]
-  edge [
-    source 3443
-    target 3917
-    weight 397
-  ]
-  edge [
-    source 3443
-    target 4051
-    weight 785
-  ]
-  edge [
-    source 3443
-    target 3968
-    weight 23
-  ]
-  edge [
-    source 3443
-    target 3937
-    weight 57
-  ]
-  edge [
-    source 3443
-    target 3636
-    weight 165
-  ]
-  edge [
-    source 3443
-    target 4187
-    weight 42
-  ]
-  edge [
-    source 3443
-    target 4040
-    weight 67
-  ]
-  edge [
-    source 3443
-    target 3954
-    weight 165
-  ]
-  edge [
-    source 3443
-    target 4154
-    weight 187
-  ]
-  edge [
-    source 3443
-    target 3884
-    weight 37
-  ]
-  edge [
-    source 3443
-    target 3962
-    weight 151
-  ]
-  edge [
-    source 3443
-    target 4162
-    weight 57
-  ]
-  edge [
-    source 3443
-    target 3847
-    weight 61
-  ]
-  edge [
-    source 3443
-    target 3860
-    weight 31
-  ]
-  edge [
-    source 3443
-    target 3641
-    weight 27
-  ]
-  edge [
-    source 3443
-    target 3677
-    weight 23
-  ]
-  edge [
-    source 3443
-    target 3877
-    weight 44
-  ]
-  edge [
-    source 3462
-    target 3521
-    weight 64
-  ]
-  edge [
-    source 3462
-    target 4051
-    weight 51
-  ]
-  edge [
-    source 3462
-    target 3600
-    weight 21
-  ]
-  edge [
-    source 3465
-    target 3521
-    weight 30
-  ]
-  edge [
-    source 3465
-    target 4051
-    weight 24
-  ]
-  edge [
-    source 3521
-    target 3565
-    weight 2951
-  ]
-  edge [
-    source 3521
-    target 3600
-    weight 9323
-  ]
-  edge [
-    source 3521
-    target 3642
-    weight 3748
-  ]
-  edge [
-    source 3521
-    target 3641
-    weight 126
-  ]
-  edge [
-    source 3521
-    target 4051
-    weight 19009
-  ]
-  edge [
-    source 3521
-    target 3937
-    weight 273
-  ]
-  edge [
-    source 3521
-    target 4187
-    weight 156
-  ]
-  edge [
-    source 3521
-    target 3917
-    weight 2166
-  ]
-  edge [
-    source 3521
-    target 3985
-    weight 133
-  ]
-  edge [
-    source 3521
-    target 3968
-    weight 146
-  ]
-  edge [
-    source 3521
-    target 3962
-    weight 1102
-  ]
-  edge [
-    source 3521
-    target 3849
-    weight 28
-  ]
-  edge [
-    source 3521
-    target 3861
-    weight 86
-  ]
-  edge [
-    source 3521
-    target 3993
-    weight 4016
-  ]
-  edge [
-    source 3521
-    target 3542
-    weight 1295
-  ]
-  edge [
-    source 3521
-    target 3693
-    weight 73
-  ]
-  edge [
-    source 3521
-    target 3752
-    weight 28
-  ]
-  edge [
-    source 3521
-    target 4027
-    weight 113
-  ]
-  edge [
-    source 3521
-    target 3636
-    weight 922
-  ]
-  edge [
-    source 3521
-    target 4152
-    weight 123
-  ]
-  edge [
-    source 3521
-    target 3954
-    weight 995
-  ]
-  edge [
-    source 3521
-    target 3773
-    weight 24
-  ]
-  edge [
-    source 3521
-    target 3860
-    weight 94
-  ]
-  edge [
-    source 3521
-    target 3559
-    weight 49
-  ]
-  edge [
-    source 3521
-    target 4098
-    weight 98
-  ]
-  edge [
-    source 3521
-    target 4040
-    weight 267
-  ]
-  edge [
-    source 3521
-    target 4154
-    weight 1397
-  ]
-  edge [
-    source 3521
-    target 3884
-    weight 148
-  ]
-  edge [
-    source 3521
-    target 3847
-    weight 320
-  ]
-  edge [
-    source 3521
-    target 3935
-    weight 73
-  ]
-  edge [
-    source 3521
-    target 4160
-    weight 116
-  ]
-  edge [
-    source 3521
-    target 4007
-    weight 50
-  ]
-  edge [
-    source 3521
-    target 3952
-    weight 35
-  ]
-  edge [
-    source 3521
-    target 3877
-    weight 299
-  ]
-  edge [
-    source 3521
-    target 4100
-    weight 43
-  ]
-  edge [
-    source 3521
-    target 3956
-    weight 58
-  ]
-  edge [
-    source 3521
-    target 3772
-    weight 23
-  ]
-  edge [
-    source 3521
-    target 4162
-    weight 411
-  ]
-  edge [
-    source 3521
-    target 3674
-    weight 24
-  ]
-  edge [
-    source 3521
-    target 3663
-    weight 29
-  ]
-  edge [
-    source 3521
-    target 3692
-    weight 35
-  ]
-  edge [
-    source 3521
-    target 4081
-    weight 22
-  ]
-  edge [
-    source 3521
-    target 3677
-    weight 88
-  ]
-  edge [
-    source 3521
-    target 3856
-    weight 32
-  ]
-  edge [
-    source 3521
-    target 3633
-    weight 67
-  ]
-  edge [
-    source 3521
-    target 3872
-    weight 62
-  ]
-  edge [
-    source 3521
-    target 3737
-    weight 45
-  ]
-  edge [
-    source 3521
-    target 3876
-    weight 56
-  ]
-  edge [
-    source 3542
-    target 3600
-    weight 661
-  ]
-  edge [
-    source 3542
-    target 3917
-    weight 412
-  ]
-  edge [
-    source 3542
-    target 3641
-    weight 33
-  ]
-  edge [
-    source 3542
-    target 3642
-    weight 385
-  ]
-  edge [
-    source 3542
-    target 3993
-    weight 550
-  ]
-  edge [
-    source 3542
-    target 3937
-    weight 70
-  ]
-  edge [
-    source 3542
-    target 4051
-    weight 1039
-  ]
-  edge [
-    source 3542
-    target 3565
-    weight 298
-  ]
-  edge [
-    source 3542
-    target 3636
-    weight 250
-  ]
-  edge [
-    source 3542
-    target 4027
-    weight 28
-  ]
-  edge [
-    source 3542
-    target 3968
-    weight 28
-  ]
-  edge [
-    source 3542
-    target 3847
-    weight 103
-  ]
-  edge [
-    source 3542
-    target 3962
-    weight 149
-  ]
-  edge [
-    source 3542
-    target 3954
-    weight 236
-  ]
-  edge [
-    source 3542
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 3542
-    target 3884
-    weight 53
-  ]
-  edge [
-    source 3542
-    target 4154
-    weight 289
-  ]
-  edge [
-    source 3542
-    target 4162
-    weight 94
-  ]
-  edge [
-    source 3542
-    target 4040
-    weight 68
-  ]
-  edge [
-    source 3542
-    target 4098
-    weight 22
-  ]
-  edge [
-    source 3542
-    target 3985
-    weight 23
-  ]
-  edge [
-    source 3542
-    target 4160
-    weight 27
-  ]
-  edge [
-    source 3542
-    target 3677
-    weight 34
-  ]
-  edge [
-    source 3542
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 3542
-    target 4187
-    weight 30
-  ]
-  edge [
-    source 3542
-    target 3860
-    weight 32
-  ]
-  edge [
-    source 3542
-    target 3877
-    weight 57
-  ]
-  edge [
-    source 3559
-    target 4051
-    weight 40
-  ]
-  edge [
-    source 3559
-    target 3954
-    weight 21
-  ]
-  edge [
-    source 3565
-    target 3600
-    weight 1219
-  ]
-  edge [
-    source 3565
-    target 3642
-    weight 635
-  ]
-  edge [
-    source 3565
-    target 4051
-    weight 1755
-  ]
-  edge [
-    source 3565
-    target 3962
-    weight 207
-  ]
-  edge [
-    source 3565
-    target 3937
-    weight 64
-  ]
-  edge [
-    source 3565
-    target 3641
-    weight 37
-  ]
-  edge [
-    source 3565
-    target 3993
-    weight 639
-  ]
-  edge [
-    source 3565
-    target 3968
-    weight 40
-  ]
-  edge [
-    source 3565
-    target 3985
-    weight 45
-  ]
-  edge [
-    source 3565
-    target 3636
-    weight 264
-  ]
-  edge [
-    source 3565
-    target 3917
-    weight 414
-  ]
-  edge [
-    source 3565
-    target 4027
-    weight 21
-  ]
-  edge [
-    source 3565
-    target 3847
-    weight 137
-  ]
-  edge [
-    source 3565
-    target 3935
-    weight 29
-  ]
-  edge [
-    source 3565
-    target 3954
-    weight 252
-  ]
-  edge [
-    source 3565
-    target 4040
-    weight 78
-  ]
-  edge [
-    source 3565
-    target 4154
-    weight 247
-  ]
-  edge [
-    source 3565
-    target 3884
-    weight 42
-  ]
-  edge [
-    source 3565
-    target 4187
-    weight 28
-  ]
-  edge [
-    source 3565
-    target 4152
-    weight 25
-  ]
-  edge [
-    source 3565
-    target 4162
-    weight 85
-  ]
-  edge [
-    source 3565
-    target 3860
-    weight 27
-  ]
-  edge [
-    source 3565
-    target 4160
-    weight 28
-  ]
-  edge [
-    source 3565
-    target 3877
-    weight 53
-  ]
-  edge [
-    source 3600
-    target 3641
-    weight 75
-  ]
-  edge [
-    source 3600
-    target 4051
-    weight 6014
-  ]
-  edge [
-    source 3600
-    target 3642
-    weight 1625
-  ]
-  edge [
-    source 3600
-    target 3937
-    weight 193
-  ]
-  edge [
-    source 3600
-    target 4187
-    weight 101
-  ]
-  edge [
-    source 3600
-    target 3917
-    weight 1298
-  ]
-  edge [
-    source 3600
-    target 3993
-    weight 2510
-  ]
-  edge [
-    source 3600
-    target 3968
-    weight 57
-  ]
-  edge [
-    source 3600
-    target 3693
-    weight 25
-  ]
-  edge [
-    source 3600
-    target 4027
-    weight 54
-  ]
-  edge [
-    source 3600
-    target 4152
-    weight 70
-  ]
-  edge [
-    source 3600
-    target 3985
-    weight 44
-  ]
-  edge [
-    source 3600
-    target 3962
-    weight 595
-  ]
-  edge [
-    source 3600
-    target 3636
-    weight 448
-  ]
-  edge [
-    source 3600
-    target 3954
-    weight 488
-  ]
-  edge [
-    source 3600
-    target 4098
-    weight 57
-  ]
-  edge [
-    source 3600
-    target 4007
-    weight 24
-  ]
-  edge [
-    source 3600
-    target 4154
-    weight 704
-  ]
-  edge [
-    source 3600
-    target 3847
-    weight 149
-  ]
-  edge [
-    source 3600
-    target 4100
-    weight 23
-  ]
-  edge [
-    source 3600
-    target 4162
-    weight 213
-  ]
-  edge [
-    source 3600
-    target 3884
-    weight 69
-  ]
-  edge [
-    source 3600
-    target 4040
-    weight 146
-  ]
-  edge [
-    source 3600
-    target 3956
-    weight 24
-  ]
-  edge [
-    source 3600
-    target 3861
-    weight 41
-  ]
-  edge [
-    source 3600
-    target 3935
-    weight 36
-  ]
-  edge [
-    source 3600
-    target 3860
-    weight 56
-  ]
-  edge [
-    source 3600
-    target 4160
-    weight 53
-  ]
-  edge [
-    source 3600
-    target 3677
-    weight 60
-  ]
-  edge [
-    source 3600
-    target 3872
-    weight 38
-  ]
-  edge [
-    source 3600
-    target 3877
-    weight 170
-  ]
-  edge [
-    source 3600
-    target 3737
-    weight 31
-  ]
-  edge [
-    source 3600
-    target 3633
-    weight 44
-  ]
-  edge [
-    source 3600
-    target 3876
-    weight 40
-  ]
-  edge [
-    source 3633
-    target 3993
-    weight 30
-  ]
-  edge [
-    source 3633
-    target 3917
-    weight 26
-  ]
-  edge [
-    source 3633
-    target 4051
-    weight 55
-  ]
-  edge [
-    source 3633
-    target 3642
-    weight 21
-  ]
-  edge [
-    source 3636
-    target 3968
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 3985
-    weight 24
-  ]
-  edge [
-    source 3636
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 4051
-    weight 672
-  ]
-  edge [
-    source 3636
-    target 3917
-    weight 283
-  ]
-  edge [
-    source 3636
-    target 3993
-    weight 386
-  ]
-  edge [
-    source 3636
-    target 3937
-    weight 63
-  ]
-  edge [
-    source 3636
-    target 3642
-    weight 293
-  ]
-  edge [
-    source 3636
-    target 4187
-    weight 28
-  ]
-  edge [
-    source 3636
-    target 4154
-    weight 181
-  ]
-  edge [
-    source 3636
-    target 3847
-    weight 82
-  ]
-  edge [
-    source 3636
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 3954
-    weight 177
-  ]
-  edge [
-    source 3636
-    target 4152
-    weight 37
-  ]
-  edge [
-    source 3636
-    target 3884
-    weight 54
-  ]
-  edge [
-    source 3636
-    target 4040
-    weight 79
-  ]
-  edge [
-    source 3636
-    target 4160
-    weight 23
-  ]
-  edge [
-    source 3636
-    target 3962
-    weight 127
-  ]
-  edge [
-    source 3636
-    target 4162
-    weight 67
-  ]
-  edge [
-    source 3636
-    target 3860
-    weight 25
-  ]
-  edge [
-    source 3636
-    target 3877
-    weight 43
-  ]
-  edge [
-    source 3641
-    target 3642
-    weight 40
-  ]
-  edge [
-    source 3641
-    target 3917
-    weight 50
-  ]
-  edge [
-    source 3641
-    target 4051
-    weight 87
-  ]
-  edge [
-    source 3641
-    target 3993
-    weight 59
-  ]
-  edge [
-    source 3641
-    target 3962
-    weight 40
-  ]
-  edge [
-    source 3642
-    target 3917
-    weight 645
-  ]
-  edge [
-    source 3642
-    target 4051
-    weight 2813
-  ]
-  edge [
-    source 3642
-    target 3985
-    weight 31
-  ]
-  edge [
-    source 3642
-    target 3993
-    weight 923
-  ]
-  edge [
-    source 3642
-    target 4027
-    weight 36
-  ]
-  edge [
-    source 3642
-    target 3962
-    weight 243
-  ]
-  edge [
-    source 3642
-    target 3968
-    weight 41
-  ]
-  edge [
-    source 3642
-    target 3954
-    weight 392
-  ]
-  edge [
-    source 3642
-    target 3884
-    weight 56
-  ]
-  edge [
-    source 3642
-    target 3847
-    weight 123
-  ]
-  edge [
-    source 3642
-    target 3935
-    weight 25
-  ]
-  edge [
-    source 3642
-    target 3937
-    weight 78
-  ]
-  edge [
-    source 3642
-    target 4187
-    weight 40
-  ]
-  edge [
-    source 3642
-    target 4040
-    weight 79
-  ]
-  edge [
-    source 3642
-    target 4154
-    weight 383
-  ]
-  edge [
-    source 3642
-    target 4152
-    weight 39
-  ]
-  edge [
-    source 3642
-    target 3860
-    weight 43
-  ]
-  edge [
-    source 3642
-    target 4162
-    weight 129
-  ]
-  edge [
-    source 3642
-    target 4160
-    weight 30
-  ]
-  edge [
-    source 3642
-    target 3877
-    weight 88
-  ]
-  edge [
-    source 3642
-    target 4098
-    weight 30
-  ]
-  edge [
-    source 3642
-    target 3677
-    weight 27
-  ]
-  edge [
-    source 3674
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 3677
-    target 3993
-    weight 45
-  ]
-  edge [
-    source 3677
-    target 4051
-    weight 76
-  ]
-  edge [
-    source 3677
-    target 3917
-    weight 42
-  ]
-  edge [
-    source 3692
-    target 4051
-    weight 23
-  ]
-  edge [
-    source 3693
-    target 4051
-    weight 41
-  ]
-  edge [
-    source 3737
-    target 4051
-    weight 33
-  ]
-  edge [
-    source 3752
-    target 3993
-    weight 21
-  ]
-  edge [
-    source 3752
-    target 4051
-    weight 25
-  ]
-  edge [
-    source 3847
-    target 3993
-    weight 125
-  ]
-  edge [
-    source 3847
-    target 3954
-    weight 68
-  ]
-  edge [
-    source 3847
-    target 4051
-    weight 236
-  ]
-  edge [
-    source 3847
-    target 4162
-    weight 25
-  ]
-  edge [
-    source 3847
-    target 4154
-    weight 65
-  ]
-  edge [
-    source 3847
-    target 3962
-    weight 38
-  ]
-  edge [
-    source 3847
-    target 3917
-    weight 78
-  ]
-  edge [
-    source 3856
-    target 4051
-    weight 22
-  ]
-  edge [
-    source 3860
-    target 4051
-    weight 75
-  ]
-  edge [
-    source 3860
-    target 3954
-    weight 25
-  ]
-  edge [
-    source 3860
-    target 3993
-    weight 52
-  ]
-  edge [
-    source 3860
-    target 4154
-    weight 29
-  ]
-  edge [
-    source 3860
-    target 3917
-    weight 45
-  ]
-  edge [
-    source 3861
-    target 3993
-    weight 42
-  ]
-  edge [
-    source 3861
-    target 3917
-    weight 29
-  ]
-  edge [
-    source 3861
-    target 4051
-    weight 62
-  ]
-  edge [
-    source 3872
-    target 3917
-    weight 34
-  ]
-  edge [
-    source 3872
-    target 4051
-    weight 48
-  ]
-  edge [
-    source 3872
-    target 3993
-    weight 31
-  ]
-  edge [
-    source 3876
-    target 4051
-    weight 46
-  ]
-  edge [
-    source 3876
-    target 3917
-    weight 29
-  ]
-  edge [
-    source 3876
-    target 3993
-    weight 25
-  ]
-  edge [
-    source 3877
-    target 3917
-    weight 124
-  ]
-  edge [
-    source 3877
-    target 4051
-    weight 232
-  ]
-  edge [
-    source 3877
-    target 4154
-    weight 46
-  ]
-  edge [
-    source 3877
-    target 3962
-    weight 53
-  ]
-  edge [
-    source 3877
-    target 3993
-    weight 122
-  ]
-  edge [
-    source 3877
-    target 3954
-    weight 42
-  ]
-  edge [
-    source 3884
-    target 3993
-    weight 63
-  ]
-  edge [
-    source 3884
-    target 3954
-    weight 43
-  ]
-  edge [
-    source 3884
-    target 4051
-    weight 123
-  ]
-  edge [
-    source 3884
-    target 3935
-    weight 21
-  ]
-  edge [
-    source 3884
-    target 3917
-    weight 51
-  ]
-  edge [
-    source 3884
-    target 3962
-    weight 23
-  ]
-  edge [
-    source 3884
-    target 4154
-    weight 37
-  ]
-  edge [
-    source 3917
-    target 3985
-    weight 27
-  ]
-  edge [
-    source 3917
-    target 4051
-    weight 1757
-  ]
-  edge [
-    source 3917
-    target 3937
-    weight 105
-  ]
-  edge [
-    source 3917
-    target 4187
-    weight 61
-  ]
-  edge [
-    source 3917
-    target 3993
-    weight 995
-  ]
-  edge [
-    source 3917
-    target 4152
-    weight 31
-  ]
-  edge [
-    source 3917
-    target 3962
-    weight 291
-  ]
-  edge [
-    source 3917
-    target 4154
-    weight 356
-  ]
-  edge [
-    source 3917
-    target 3954
-    weight 309
-  ]
-  edge [
-    source 3917
-    target 4162
-    weight 112
-  ]
-  edge [
-    source 3917
-    target 4040
-    weight 85
-  ]
-  edge [
-    source 3917
-    target 3935
-    weight 22
-  ]
-  edge [
-    source 3917
-    target 4027
-    weight 43
-  ]
-  edge [
-    source 3917
-    target 3968
-    weight 43
-  ]
-  edge [
-    source 3917
-    target 4160
-    weight 22
-  ]
-  edge [
-    source 3917
-    target 4098
-    weight 34
-  ]
-  edge [
-    source 3935
-    target 4051
-    weight 62
-  ]
-  edge [
-    source 3935
-    target 3993
-    weight 36
-  ]
-  edge [
-    source 3937
-    target 4187
-    weight 24
-  ]
-  edge [
-    source 3937
-    target 4051
-    weight 220
-  ]
-  edge [
-    source 3937
-    target 3993
-    weight 171
-  ]
-  edge [
-    source 3937
-    target 3962
-    weight 70
-  ]
-  edge [
-    source 3937
-    target 3954
-    weight 62
-  ]
-  edge [
-    source 3937
-    target 4154
-    weight 55
-  ]
-  edge [
-    source 3937
-    target 4040
-    weight 21
-  ]
-  edge [
-    source 3937
-    target 4162
-    weight 32
-  ]
-  edge [
-    source 3952
-    target 4051
-    weight 27
-  ]
-  edge [
-    source 3954
-    target 4051
-    weight 914
-  ]
-  edge [
-    source 3954
-    target 3993
-    weight 396
-  ]
-  edge [
-    source 3954
-    target 4027
-    weight 30
-  ]
-  edge [
-    source 3954
-    target 4154
-    weight 201
-  ]
-  edge [
-    source 3954
-    target 4098
-    weight 43
-  ]
-  edge [
-    source 3954
-    target 3968
-    weight 37
-  ]
-  edge [
-    source 3954
-    target 4160
-    weight 28
-  ]
-  edge [
-    source 3954
-    target 3956
-    weight 28
-  ]
-  edge [
-    source 3954
-    target 3962
-    weight 127
-  ]
-  edge [
-    source 3954
-    target 4040
-    weight 54
-  ]
-  edge [
-    source 3954
-    target 4162
-    weight 90
-  ]
-  edge [
-    source 3954
-    target 4152
-    weight 27
-  ]
-  edge [
-    source 3954
-    target 4187
-    weight 25
-  ]
-  edge [
-    source 3956
-    target 4051
-    weight 52
-  ]
-  edge [
-    source 3962
-    target 3985
-    weight 21
-  ]
-  edge [
-    source 3962
-    target 4051
-    weight 743
-  ]
-  edge [
-    source 3962
-    target 4187
-    weight 32
-  ]
-  edge [
-    source 3962
-    target 3993
-    weight 487
-  ]
-  edge [
-    source 3962
-    target 4154
-    weight 133
-  ]
-  edge [
-    source 3962
-    target 4040
-    weight 30
-  ]
-  edge [
-    source 3962
-    target 4162
-    weight 53
-  ]
-  edge [
-    source 3962
-    target 4027
-    weight 25
-  ]
-  edge [
-    source 3962
-    target 3968
-    weight 22
-  ]
-  edge [
-    source 3968
-    target 4051
-    weight 117
-  ]
-  edge [
-    source 3968
-    target 3993
-    weight 47
-  ]
-  edge [
-    source 3985
-    target 4051
-    weight 67
-  ]
-  edge [
-    source 3985
-    target 3993
-    weight 34
-  ]
-  edge [
-    source 3993
-    target 4051
-    weight 2957
-  ]
-  edge [
-    source 3993
-    target 4027
-    weight 50
-  ]
-  edge [
-    source 3993
-    target 4187
-    weight 80
-  ]
-  edge [
-    source 3993
-    target 4154
-    weight 453
-  ]
-  edge [
-    source 3993
-    target 4152
-    weight 52
-  ]
-  edge [
-    source 3993
-    target 4162
-    weight 170
-  ]
-  edge [
-    source 3993
-    target 4040
-    weight 122
-  ]
-  edge [
-    source 3993
-    target 4160
-    weight 35
-  ]
-  edge [
-    source 3993
-    target 4098
-    weight 44
-  ]
-  edge [
-    source 4007
-    target 4051
-    weight 44
-  ]
-  edge [
-    source 4027
-    target 4051
-    weight 95
-  ]
-  edge [
-    source 4040
-    target 4051
-    weight 206
-  ]
-  edge [
-    source 4040
-    target 4154
-    weight 95
-  ]
-  edge [
-    source 4040
-    target 4162
-    weight 26
-  ]
-  edge [
-    source 4051
-    target 4187
-    weight 120
-  ]
-  edge [
-    source 4051
-    target 4152
-    weight 89
-  ]
-  edge [
-    source 4051
-    target 4098
-    weight 91
-  ]
-  edge [
-    source 4051
-    target 4154
-    weight 1010
-  ]
-  edge [
-    source 4051
-    target 4160
-    weight 81
-  ]
-  edge [
-    source 4051
-    target 4162
-    weight 335
-  ]
-  edge [
-    source 4051
-    target 4100
-    weight 31
-  ]
-  edge [
-    source 4154
-    target 4162
-    weight 103
-  ]
-  edge [
-    source 4154
-    target 4187
-    weight 24
-  ]
-]
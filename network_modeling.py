@@ -1,6 +1,27 @@
+import time
+
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from cleaned_store import read_cleaned_batches, read_cleaned_data
+from graph_storage import (decode_labels, encode_labels, load_stored_graph, masked_graph, permuted_graph, save_graph,
+                           save_stored_graph)
+
+SUBREDDIT_FILTER = ["reddit.com", "pics", "worldnews", "programming", "math",
+                    "business", "politics", "obama", "science", "technology",
+                    "WTF", "AskReddit", "netsec", "philosophy", "videos", "offbeat",
+                    "funny", "entertainment", "linux", "geek", "gaming", "comics",
+                    "gadgets", "nsfw", "news", "environment", "atheism", "canada",
+                    "Economics", "scifi", "bestof", "cogsci", "joel", "Health",
+                    "guns", "photography", "software", "history", "ideas"]
+
+WEIGHT_THRESHOLD = 20
+SWEEP_THRESHOLDS = list(range(0, 105, 5))
 
 
 def set_from_column(column, *data_frames):
@@ -12,7 +33,7 @@ def set_from_column(column, *data_frames):
     return result
 
 
-def connect_subreddits(graph, *data_frames):
+def connect_subreddits_iterative(graph, *data_frames):
     user_map = {}
 
     def connect_nodes(subreddit_set, new_subreddit):
@@ -35,32 +56,175 @@ def connect_subreddits(graph, *data_frames):
                 user_map[user] = {subreddit_to_add}
 
 
-def generate_snet(target_nodes):
-    submissions = pd.read_pickle("dataset/cleaned/submissions")
-    comments = pd.read_pickle("dataset/cleaned/comments")
+def subreddit_comembership(*data_frames):
+    activity = pd.concat([data_frame[["author", "subreddit"]] for data_frame in data_frames], ignore_index=True)
+
+    author_codes, _ = pd.factorize(activity["author"], use_na_sentinel=False)
+    subreddit_codes, subreddits = pd.factorize(activity["subreddit"], use_na_sentinel=False)
+
+    # user x subreddit incidence, binarized so that repeated activity counts once
+    incidence = sparse.csr_matrix((np.ones(len(activity), dtype=np.int64), (author_codes, subreddit_codes)),
+                                  shape=(author_codes.max(initial=-1) + 1, len(subreddits)))
+    incidence.data[:] = 1
+
+    # weight of (a, b) is the number of users active in both subreddits
+    comembership = sparse.triu(incidence.T @ incidence, k=1).tocoo()
+
+    return subreddits, comembership
+
+
+def add_comembership_edges(graph, subreddits, comembership):
+    graph.add_weighted_edges_from(zip(subreddits[comembership.row].tolist(),
+                                      subreddits[comembership.col].tolist(),
+                                      comembership.data.tolist()))
+
+
+def connect_subreddits(graph, *data_frames):
+    subreddits, comembership = subreddit_comembership(*data_frames)
+    add_comembership_edges(graph, subreddits, comembership)
+
+
+class ComembershipAccumulator:
+    # Merges per-chunk co-membership counts. Memory is bounded by the user x subreddit
+    # incidence and the subreddit x subreddit weights, never by the number of rows seen.
+
+    def __init__(self):
+        self.author_codes = {}
+        self.subreddit_codes = {}
+        self.incidence = sparse.csr_matrix((0, 0), dtype=np.int64)
+        self.comembership = sparse.csr_matrix((0, 0), dtype=np.int64)
+
+    @staticmethod
+    def encode(codebook, column):
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        unique_codes = np.fromiter((codebook.setdefault(value, len(codebook)) for value in uniques),
+                                   dtype=np.int64, count=len(uniques))
+        return unique_codes[codes]
+
+    def update(self, data_frame):
+        author_codes = self.encode(self.author_codes, data_frame["author"])
+        subreddit_codes = self.encode(self.subreddit_codes, data_frame["subreddit"])
+        shape = (len(self.author_codes), len(self.subreddit_codes))
+
+        chunk = sparse.csr_matrix((np.ones(len(data_frame), dtype=np.int64), (author_codes, subreddit_codes)),
+                                  shape=shape)
+        chunk.data[:] = 1
+
+        self.incidence.resize(shape)
+        self.comembership.resize((shape[1], shape[1]))
+
+        # only (user, subreddit) pairs never seen in an earlier chunk add new co-memberships
+        new = chunk - chunk.multiply(self.incidence)
+        new.eliminate_zeros()
+
+        # (B + N)^T (B + N) - B^T B = N^T N + N^T B + B^T N
+        cross = new.T @ self.incidence
+        delta = new.T @ new + cross + cross.T
+
+        self.incidence = (self.incidence + new).tocsr()
+        self.comembership = (self.comembership + sparse.triu(delta, k=1)).tocsr()
+
+        return delta
+
+    def subreddits(self):
+        return pd.Index(list(self.subreddit_codes))
+
+    def to_graph(self, graph):
+        graph.add_nodes_from(self.subreddit_codes)
+        add_comembership_edges(graph, self.subreddits(), self.comembership.tocoo())
+
+    def save(self, path):
+        author_data, author_offsets = encode_labels(self.author_codes)
+        subreddit_data, subreddit_offsets = encode_labels(self.subreddit_codes)
+
+        np.savez(path, author_data=author_data, author_offsets=author_offsets,
+                 subreddit_data=subreddit_data, subreddit_offsets=subreddit_offsets,
+                 incidence_indptr=self.incidence.indptr, incidence_indices=self.incidence.indices,
+                 comembership_indptr=self.comembership.indptr, comembership_indices=self.comembership.indices,
+                 comembership_data=self.comembership.data)
+
+    @classmethod
+    def load(cls, path):
+        accumulator = cls()
+
+        with np.load(path) as state:
+            authors = decode_labels(state["author_data"], state["author_offsets"])
+            subreddits = decode_labels(state["subreddit_data"], state["subreddit_offsets"])
+
+            accumulator.author_codes = {author: code for code, author in enumerate(authors)}
+            accumulator.subreddit_codes = {subreddit: code for code, subreddit in enumerate(subreddits)}
+
+            indices = state["incidence_indices"]
+            accumulator.incidence = sparse.csr_matrix(
+                (np.ones(len(indices), dtype=np.int64), indices, state["incidence_indptr"]),
+                shape=(len(authors), len(subreddits)))
+            accumulator.comembership = sparse.csr_matrix(
+                (state["comembership_data"], state["comembership_indices"], state["comembership_indptr"]),
+                shape=(len(subreddits), len(subreddits)))
+
+        return accumulator
+
+
+def build_accumulator(chunk_size, months=None):
+    accumulator = ComembershipAccumulator()
+
+    for name in ["submissions", "comments"]:
+        for chunk in read_cleaned_batches(name, ["author", "subreddit"], chunk_size, months):
+            accumulator.update(chunk)
+
+    return accumulator
+
 
-    subreddits = set_from_column("subreddit", submissions, comments)
+def connect_subreddits_streaming(graph, chunk_size, months=None):
+    build_accumulator(chunk_size, months).to_graph(graph)
 
+
+def benchmark_connect_subreddits(*data_frames):
+    def build(connect):
+        graph = nx.Graph()
+        start = time.perf_counter()
+        connect(graph, *data_frames)
+        return graph, time.perf_counter() - start
+
+    iterative_graph, iterative_time = build(connect_subreddits_iterative)
+    sparse_graph, sparse_time = build(connect_subreddits)
+
+    iterative_weights = {frozenset(edge): weight for *edge, weight in iterative_graph.edges(data="weight")}
+    sparse_weights = {frozenset(edge): weight for *edge, weight in sparse_graph.edges(data="weight")}
+
+    print(f"Iterative loop: {iterative_time:.3f}s")
+    print(f"Sparse product: {sparse_time:.3f}s ({iterative_time / max(sparse_time, 1e-9):.1f}x faster)")
+    print(f"Identical edge weights: {iterative_weights == sparse_weights}")
+
+    return iterative_weights == sparse_weights
+
+
+def generate_snet(target_nodes, chunk_size=None, months=None):
     SNet = nx.Graph()
-    SNet.add_nodes_from(subreddits)
+
+    if chunk_size is None:
+        submissions = read_cleaned_data("submissions", ["author", "subreddit"], months)
+        comments = read_cleaned_data("comments", ["author", "subreddit"], months)
+
+        subreddits = set_from_column("subreddit", submissions, comments)
+        SNet.add_nodes_from(subreddits)
+
+        connect_subreddits(SNet, submissions, comments)
+    else:
+        connect_subreddits_streaming(SNet, chunk_size, months)
 
     attribute_map = dict([(node, node in target_nodes) for node in SNet])
     nx.set_node_attributes(SNet, attribute_map, "target")
 
-    connect_subreddits(SNet, submissions, comments)
-
-    nx.write_gml(SNet, "models/snet.gml")
+    save_graph(SNet, "models/snet")
     print("Generated SNet - Subreddit Network")
 
     return SNet
 
 
-def edge_weight_visualization(graph, threshold):
-    edge_weight = [int(graph.edges[edge]["weight"]) for edge in graph.edges]
-
-    edge_weight_keys = list(set(edge_weight))
-    edge_weight_keys.sort()
-    edge_weight_values = list(map(lambda edge: edge_weight.count(edge), edge_weight_keys))
+def edge_weight_visualization(stored, threshold):
+    edge_weight = np.asarray(stored.edge_attributes["weight"])[stored.edge_mask()].astype(np.int64)
+    edge_weight_keys, edge_weight_values = np.unique(edge_weight, return_counts=True)
 
     fig, axs = plt.subplots(1, 2)
 
@@ -76,100 +240,194 @@ def edge_weight_visualization(graph, threshold):
     plt.show()
 
 
-def generate_snet_filtered(graph, threshold):
-    SNetF = nx.Graph(graph)
+def weight_mask(stored, threshold):
+    return np.asarray(stored.edge_attributes["weight"]) > threshold
+
+
+def node_set_mask(stored, nodes):
+    # membership through integer node codes instead of per-edge label lookups
+    index = {label: i for i, label in enumerate(stored.labels)}
+    mask = np.zeros(stored.number_of_nodes, dtype=bool)
+    mask[[index[node] for node in nodes if node in index]] = True
+    return mask
+
 
-    print(f"Number of edges before filtration: {SNetF.number_of_edges()}")
+def count_edges(stored, edge_mask=None):
+    kept = np.ones(len(stored.indices), dtype=bool) if edge_mask is None else edge_mask
+    return int(np.count_nonzero(kept[stored.edge_mask()]))
 
-    edges_to_remove = [(a, b) for a, b, attrs in SNetF.edges(data=True) if attrs["weight"] <= threshold]
-    SNetF.remove_edges_from(edges_to_remove)
 
-    print(f"Number of edges after filtration: {SNetF.number_of_edges()}")
+def generate_snet_filtered(stored, threshold):
+    print(f"Number of edges before filtration: {count_edges(stored)}")
 
-    nx.write_gml(SNetF, "models/snetf.gml")
+    SNetF = masked_graph(stored, weight_mask(stored, threshold))
+
+    print(f"Number of edges after filtration: {count_edges(SNetF)}")
+
+    save_stored_graph(SNetF, "models/snetf")
     print("Generated SNetF - Filtered Subreddit Network")
 
     return SNetF
 
 
-def generate_snet_target(graph, target_nodes):
-    print(f"Complete number of subreddits: {graph.number_of_nodes()}")
+def generate_snet_target(stored, target_nodes):
+    print(f"Complete number of subreddits: {stored.number_of_nodes}")
     print(f"Number of subreddits related to economic crisis: {len(target_nodes)}")
 
-    SNetT = nx.Graph()
-    SNetT.add_nodes_from(target_nodes)
+    SNetT = masked_graph(stored, node_mask=node_set_mask(stored, target_nodes))
+    SNetT.node_attributes = {}
 
-    for a, b, attrs in graph.edges(data=True):
-        if a in target_nodes and b in target_nodes:
-            SNetT.add_edge(a, b, weight=attrs["weight"])
+    # target subreddits missing from SNet are kept as isolated nodes
+    present = set(SNetT.labels)
+    missing = [node for node in dict.fromkeys(target_nodes) if node not in present]
+    SNetT.labels += missing
+    SNetT.indptr = np.concatenate([SNetT.indptr, np.full(len(missing), SNetT.indptr[-1])])
 
-    nx.write_gml(SNetT, "models/snett.gml")
+    # nodes follow the order of target_nodes, as they did when SNetT was built node by node
+    index = {label: i for i, label in enumerate(SNetT.labels)}
+    SNetT = permuted_graph(SNetT, [index[node] for node in dict.fromkeys(target_nodes)])
+
+    save_stored_graph(SNetT, "models/snett")
     print("Generated SNetT - Targeted Subreddit Network")
 
     return SNetT
 
 
-# noinspection PyBroadException
-def connect_users(graph, submissions, comments):
-    comments["link_id"] = comments["link_id"].str.slice(3)
-    comments["parent_id"] = comments["parent_id"].str.slice(3)
+def threshold_sweep(stored, thresholds, file_name="result_tables/snet_threshold_sweep.csv"):
+    # every threshold masks the same weight column; only the kept entries are expanded for components
+    sources = stored.sources()
+    weights = np.asarray(stored.edge_attributes["weight"])
+    n = stored.number_of_nodes
+    rows = []
 
-    result1 = submissions.merge(comments, how="inner", left_on="submission_id", right_on="link_id")
-    result2 = comments.merge(comments, how="inner", left_on="parent_id", right_on="comment_id")
+    for threshold in thresholds:
+        keep = weights > threshold
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources[keep], minlength=n), out=indptr[1:])
+        structure = sparse.csr_matrix((np.ones(int(keep.sum())), stored.indices[keep], indptr), shape=(n, n))
 
-    result1 = result1.groupby(["author_x", "author_y"]).size().reset_index().rename(columns={0: "weight"})
-    result2 = result2.groupby(["author_x", "author_y"]).size().reset_index().rename(columns={0: "weight"})
+        _, components = connected_components(structure, directed=stored.directed, connection="weak")
+        connected = np.diff(indptr) > 0
+        if stored.directed:
+            connected |= np.bincount(stored.indices[keep], minlength=n) > 0
 
-    result1 = result1[result1["author_x"] != result1["author_y"]]
-    result2 = result2[result2["author_x"] != result2["author_y"]]
+        sizes = np.sort(np.bincount(components[connected]))[::-1]
+        sizes = sizes[sizes > 0]
 
-    result = pd.merge(result1, result2, how="inner",
-                      left_on=["author_x", "author_y"], right_on=["author_x", "author_y"])
+        rows.append({"threshold": threshold, "nodes": int(connected.sum()), "edges": count_edges(stored, keep),
+                     "components": len(sizes), "giant_component": int(sizes[0]) if len(sizes) else 0,
+                     "second_component": int(sizes[1]) if len(sizes) > 1 else 0})
 
-    result = result.fillna(0.0)
-    result["weight"] = result["weight_x"] + result["weight_y"]
+    data_frame = pd.DataFrame(rows).set_index("threshold")
+    print(data_frame.to_string())
+    data_frame.to_csv(file_name)
 
-    print(result)
+    return data_frame
+
+
+def lookup(keys, index, values):
+    # values of the rows whose id is the key without its "t1_"/"t3_" prefix, -1 where there is none
+    keys = keys.astype("category")
+    positions = index.get_indexer(keys.cat.categories.str.slice(3))
+    found = np.where(positions >= 0, values[positions], -1)
+
+    codes = keys.cat.codes.to_numpy()
+    return np.where(codes >= 0, found[codes], -1)
+
+
+class InteractionAccumulator:
+    # Sums (source, target) interaction counts between integer author codes over batches of comments:
+    # commenter -> submitter for every comment and parent author -> replier for every reply.
+
+    def __init__(self, submissions, parent_comments):
+        submissions = submissions.drop_duplicates("submission_id")
+        parent_comments = parent_comments.drop_duplicates("comment_id")
+
+        authors = union_categoricals([submissions["author"].astype("category"),
+                                      parent_comments["author"].astype("category")])
+        codes = authors.codes.astype(np.int64)
+
+        self.authors = authors.categories
+        self.submission_index = pd.Index(submissions["submission_id"])
+        self.submission_authors = codes[:len(submissions)]
+        self.comment_index = pd.Index(parent_comments["comment_id"])
+        self.comment_authors = codes[len(submissions):]
+        self.interactions = sparse.csr_matrix((len(self.authors), len(self.authors)))
+
+    def author_codes(self, authors):
+        authors = authors.astype("category")
+        positions = self.authors.get_indexer(authors.cat.categories)
+
+        codes = authors.cat.codes.to_numpy()
+        return np.where(codes >= 0, positions[codes], -1)
+
+    def update(self, comments):
+        commenters = self.author_codes(comments["author"])
+        submitters = lookup(comments["link_id"], self.submission_index, self.submission_authors)
+        parents = lookup(comments["parent_id"], self.comment_index, self.comment_authors)
+
+        sources = np.concatenate([commenters, parents])
+        targets = np.concatenate([submitters, commenters])
+        kept = (sources >= 0) & (targets >= 0) & (sources != targets)
+
+        # duplicate pairs are summed, so both kinds of interaction add up to one weight per pair
+        delta = sparse.csr_matrix((np.ones(kept.sum()), (sources[kept], targets[kept])),
+                                  shape=self.interactions.shape)
+        self.interactions = self.interactions + delta
+
+        return delta
+
+    def edges(self, matrix=None):
+        matrix = (self.interactions if matrix is None else matrix).tocoo()
+        return zip(self.authors[matrix.row], self.authors[matrix.col], matrix.data.tolist())
+
+    def to_graph(self, graph):
+        graph.add_weighted_edges_from(self.edges())
+
+
+def connect_users(graph, submissions, comments):
+    accumulator = InteractionAccumulator(submissions, comments)
+    accumulator.update(comments)
+    accumulator.to_graph(graph)
 
-    for _, row in result.iterrows():
-        graph.add_edge(row["author_y"], row["author_x"], weight=row["weight"])
 
+def generate_user_network(months=None, chunk_size=1_000_000):
+    # only the id -> author lookups are held in memory, the comments themselves are streamed
+    submissions = read_cleaned_data("submissions", ["submission_id", "author"], months)
+    parent_comments = read_cleaned_data("comments", ["comment_id", "author"], months)
+    accumulator = InteractionAccumulator(submissions, parent_comments)
 
-def generate_user_network():
-    submissions = pd.read_pickle("dataset/cleaned/submissions")
-    comments = pd.read_pickle("dataset/cleaned/comments")
+    for chunk in read_cleaned_batches("comments", ["author", "link_id", "parent_id"], chunk_size, months):
+        accumulator.update(chunk)
 
     UserNet = nx.DiGraph()
-    connect_users(UserNet, submissions, comments)
+    accumulator.to_graph(UserNet)
 
-    nx.write_gml(UserNet, "models/usernet.gml")
+    save_graph(UserNet, "models/usernet")
     print("Generated UserNet - Reddit User Network")
 
     return UserNet
 
 
 def create_networks(networks):
-    subreddit_filter = ["reddit.com", "pics", "worldnews", "programming", "math",
-                        "business", "politics", "obama", "science", "technology",
-                        "WTF", "AskReddit", "netsec", "philosophy", "videos", "offbeat",
-                        "funny", "entertainment", "linux", "geek", "gaming", "comics",
-                        "gadgets", "nsfw", "news", "environment", "atheism", "canada",
-                        "Economics", "scifi", "bestof", "cogsci", "joel", "Health",
-                        "guns", "photography", "software", "history", "ideas"]
+    if "SNet" in networks:
+        generate_snet(SUBREDDIT_FILTER)
 
-    SNet = generate_snet(subreddit_filter) if "SNet" in networks else nx.read_gml("models/snet.gml")
+    # the derived networks are masks over the stored SNet arrays
+    SNet = load_stored_graph("models/snet")
 
     if "SNetF" in networks:
-        w_threshold = 20
-        edge_weight_visualization(SNet, w_threshold)
+        edge_weight_visualization(SNet, WEIGHT_THRESHOLD)
+        threshold_sweep(SNet, SWEEP_THRESHOLDS)
 
-        generate_snet_filtered(SNet, w_threshold)
+        generate_snet_filtered(SNet, WEIGHT_THRESHOLD)
 
     if "SNetT" in networks:
-        generate_snet_target(SNet, subreddit_filter)
+        generate_snet_target(SNet, SUBREDDIT_FILTER)
 
     if "UserNet" in networks:
         generate_user_network()
 
 
-create_networks(["SNet"])
+if __name__ == "__main__":
+    create_networks(["SNet"])
@@ -0,0 +1,181 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+
+from workers import worker_count
+
+REPLICAS = 20
+SWAPS_PER_EDGE = 10
+
+_worker_edges = None
+_worker_node_count = None
+_worker_directed = None
+_worker_weights = None
+
+
+def edge_array(graph):
+    # int64 (m, 2) edge array in graph node order, without self-loops
+    index = {node: i for i, node in enumerate(graph)}
+    edges = np.array([(index[u], index[v]) for u, v in graph.edges() if u != v], dtype=np.int64)
+    return edges.reshape(-1, 2), len(index)
+
+
+def edge_weights(graph, weight="weight"):
+    # weights in edge_array order
+    return np.array([w for u, v, w in graph.edges(data=weight, default=1) if u != v], dtype=np.float64)
+
+
+def adjacency(edges, node_count, directed=False, weights=None):
+    rows, columns = edges[:, 0], edges[:, 1]
+    weights = np.ones(len(edges)) if weights is None else weights
+
+    if not directed:
+        rows, columns = np.concatenate([rows, columns]), np.concatenate([columns, rows])
+        weights = np.concatenate([weights, weights])
+
+    return sparse.csr_matrix((weights, (rows, columns)), shape=(node_count, node_count))
+
+
+def edge_keys(u, v, node_count, directed=False):
+    if directed:
+        return u * node_count + v
+
+    return np.minimum(u, v) * node_count + np.maximum(u, v)
+
+
+def _from_keys(keys, node_count):
+    return np.column_stack([keys // node_count, keys % node_count])
+
+
+def _simple(edges, node_count, directed):
+    # erased model: drop self-loops and repeated edges
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    return _from_keys(np.unique(edge_keys(edges[:, 0], edges[:, 1], node_count, directed)), node_count)
+
+
+def gnm_edges(node_count, edge_count, rng, directed=False):
+    # uniform G(n, m): rejection sampling of node pairs, O(m) for sparse graphs
+    pairs = node_count * (node_count - 1) // (1 if directed else 2)
+    edge_count = min(edge_count, pairs)
+    keys = np.empty(0, dtype=np.int64)
+
+    while len(keys) < edge_count:
+        draws = rng.integers(0, node_count, size=(2 * (edge_count - len(keys)) + 16, 2))
+        draws = draws[draws[:, 0] != draws[:, 1]]
+        keys = np.unique(np.concatenate([keys, edge_keys(draws[:, 0], draws[:, 1], node_count, directed)]))
+
+    # every subset of the distinct pairs is equally likely, so a random subset stays uniform
+    keys = rng.choice(keys, edge_count, replace=False)
+    return _from_keys(np.sort(keys), node_count)
+
+
+def configuration_edges(edges, node_count, rng, directed=False):
+    # random stub matching with the degree sequence of `edges`
+    if directed:
+        sources, targets = rng.permutation(edges[:, 0]), rng.permutation(edges[:, 1])
+    else:
+        stubs = rng.permutation(edges.ravel())
+        sources, targets = stubs[0::2], stubs[1::2]
+
+    return _simple(np.column_stack([sources, targets]), node_count, directed)
+
+
+def swap_edges(edges, node_count, swaps_per_edge, rng, directed=False, lattice=False):
+    # degree-preserving double edge swaps (a, b), (c, d) -> (a, d), (c, b), attempted for disjoint edge
+    # pairs in vectorized rounds; the lattice variant only keeps swaps that move edges towards a ring
+    edges = edges.copy()
+    edge_count = len(edges)
+
+    if edge_count < 2:
+        return edges
+
+    for _ in range(2 * swaps_per_edge):
+        keys = np.sort(edge_keys(edges[:, 0], edges[:, 1], node_count, directed))
+        order = rng.permutation(edge_count)
+        first, second = order[:edge_count // 2], order[edge_count // 2:2 * (edge_count // 2)]
+
+        a, b = edges[first, 0], edges[first, 1]
+        c, d = edges[second, 0], edges[second, 1]
+
+        if not directed:
+            flip = rng.random(len(second)) < 0.5
+            c, d = np.where(flip, d, c), np.where(flip, c, d)
+
+        new_first, new_second = edge_keys(a, d, node_count, directed), edge_keys(c, b, node_count, directed)
+        valid = (a != d) & (c != b) & (new_first != new_second)
+        valid &= ~np.isin(new_first, keys) & ~np.isin(new_second, keys)
+
+        if lattice:
+            valid &= (_ring_distance(a, d, node_count) + _ring_distance(c, b, node_count) <
+                      _ring_distance(a, b, node_count) + _ring_distance(c, d, node_count))
+
+        # two swaps of one round must not create the same edge
+        created, counts = np.unique(np.concatenate([new_first[valid], new_second[valid]]), return_counts=True)
+        duplicated = created[counts > 1]
+        valid &= ~np.isin(new_first, duplicated) & ~np.isin(new_second, duplicated)
+
+        edges[first[valid]] = np.column_stack([a[valid], d[valid]])
+        edges[second[valid]] = np.column_stack([c[valid], b[valid]])
+
+    return edges
+
+
+def _ring_distance(u, v, node_count):
+    distance = np.abs(u - v)
+    return np.minimum(distance, node_count - distance)
+
+
+def null_edges(model, edges, node_count, rng, directed=False, swaps_per_edge=SWAPS_PER_EDGE):
+    if model == "gnm":
+        return gnm_edges(node_count, len(edges), rng, directed)
+    if model == "configuration":
+        return configuration_edges(edges, node_count, rng, directed)
+    if model == "swap":
+        return swap_edges(edges, node_count, swaps_per_edge, rng, directed)
+
+    raise ValueError(f"Unknown null model: {model}")
+
+
+def _init_worker(edges, node_count, directed, weights):
+    global _worker_edges, _worker_node_count, _worker_directed, _worker_weights
+    _worker_edges, _worker_node_count, _worker_directed, _worker_weights = edges, node_count, directed, weights
+
+
+def _replica(model, seed, metric, swaps_per_edge):
+    rng = np.random.default_rng(seed)
+    edges = null_edges(model, _worker_edges, _worker_node_count, rng, _worker_directed, swaps_per_edge)
+
+    # observed weights are reshuffled over the replica's edges
+    weights = None if _worker_weights is None else rng.permutation(_worker_weights)[:len(edges)]
+
+    return np.asarray(metric(adjacency(edges, _worker_node_count, _worker_directed, weights), _worker_directed))
+
+
+def ensemble(graph, metric, model="swap", replicas=REPLICAS, seed=42, swaps_per_edge=SWAPS_PER_EDGE,
+             weight=None, processes=None):
+    # metric(adjacency, directed) evaluated on `replicas` seeded null graphs; one row per replica
+    edges, node_count = edge_array(graph)
+    weights = None if weight is None else edge_weights(graph, weight)
+    initargs = (edges, node_count, graph.is_directed(), weights)
+
+    seeds = np.random.SeedSequence(seed).generate_state(replicas).tolist()
+    arguments = [[model] * replicas, seeds, [metric] * replicas, [swaps_per_edge] * replicas]
+
+    processes = worker_count(processes)
+
+    if processes == 1 or replicas == 1:
+        _init_worker(*initargs)
+        samples = list(map(_replica, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=initargs) as executor:
+            samples = list(executor.map(_replica, *arguments))
+
+    return np.stack(samples)
+
+
+def z_scores(observed, samples):
+    mean, deviation = samples.mean(axis=0), samples.std(axis=0, ddof=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(deviation > 0, (np.asarray(observed) - mean) / deviation, np.nan)
@@ -0,0 +1,86 @@
+import glob
+import os
+import re
+
+import networkx as nx
+import numpy as np
+
+from graph_storage import load_graph, save_graph
+
+
+def partition_paths(path):
+    return os.path.join(path, "partitions.npz"), os.path.join(path, "topology")
+
+
+def save_partitions(graph, path, partitions):
+    # partitions maps a key (e.g. the number of clusters k) to one label per node in graph order
+    labels_path, topology_path = partition_paths(path)
+    os.makedirs(path, exist_ok=True)
+
+    keys = np.array(list(partitions))
+    labels = np.column_stack([np.asarray(partitions[key]) for key in keys])
+    labels = labels.astype(np.int16 if labels.max(initial=0) < np.iinfo(np.int16).max else np.int32)
+
+    np.savez(labels_path, keys=keys, labels=labels)
+
+    save_graph(graph, topology_path)
+
+
+class PartitionView:
+    # Node x partition label matrix over a topology stored once; colored graphs are built on demand.
+
+    def __init__(self, path):
+        labels_path, self.topology_path = partition_paths(path)
+
+        with np.load(labels_path) as partitions:
+            self.keys = partitions["keys"].tolist()
+            self.labels = partitions["labels"]
+
+        self.topology = None
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def __getitem__(self, key):
+        return self.labels[:, self.keys.index(key)]
+
+    def colored_graph(self, key, attribute="color"):
+        if self.topology is None:
+            self.topology = load_graph(self.topology_path)
+
+        colored_graph = self.topology.copy()
+        nx.set_node_attributes(colored_graph, dict(zip(colored_graph, map(str, self[key].tolist()))), attribute)
+
+        return colored_graph
+
+    def write_gml(self, key, path):
+        nx.write_gml(self.colored_graph(key), path)
+
+
+def convert_spectral_gml(path):
+    # collapses <graph>_spectral_<k>.gml files into one label matrix plus one topology
+    gml_files = glob.glob(os.path.join(path, "*_spectral_*.gml"))
+    ks = sorted(int(re.search(r"_spectral_(\d+)\.gml$", gml_file).group(1)) for gml_file in gml_files)
+
+    if not ks:
+        return
+
+    partitions = {}
+    topology = None
+
+    for k in ks:
+        colored_graph = nx.read_gml(next(f for f in gml_files if f.endswith(f"_spectral_{k}.gml")))
+        topology = topology or colored_graph
+        colors = nx.get_node_attributes(colored_graph, "color")
+        partitions[k] = [int(colors[node]) for node in topology]
+
+    for attributes in (attrs for _, attrs in topology.nodes(data=True)):
+        attributes.pop("color", None)
+
+    save_partitions(topology, path, partitions)
+    print(f"Converted {len(ks)} spectral partitions in {path}")
+
+
+if __name__ == "__main__":
+    for spectral_directory in sorted(glob.glob("models/spectral/*")):
+        convert_spectral_gml(spectral_directory)
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import powerlaw
+
+from workers import worker_count
+
+FITS_PATH = "models/power_law"
+
+# the xmin search stops where fewer than this many degrees remain in the tail
+MIN_TAIL = 50
+COMPARISONS = ["exponential", "truncated_power_law"]
+
+
+def degree_sequences(graph):
+    def sequence(degree_view):
+        return np.fromiter((degree for _, degree in degree_view), dtype=np.int64, count=len(graph))
+
+    if graph.is_directed():
+        return {"in": sequence(graph.in_degree()), "out": sequence(graph.out_degree()),
+                "total": sequence(graph.degree())}
+
+    return {"total": sequence(graph.degree())}
+
+
+def xmin_range(degrees, min_tail=MIN_TAIL):
+    positive = np.sort(degrees[degrees > 0])
+
+    if len(positive) <= min_tail:
+        return None
+
+    return float(positive[0]), float(positive[-min_tail])
+
+
+def fit_key(degrees, discrete, min_tail):
+    digest = hashlib.sha256(np.sort(degrees).astype(np.int64).tobytes())
+    digest.update(f"{discrete}-{min_tail}".encode())
+    return digest.hexdigest()
+
+
+def fit_degrees(degrees, discrete=False, min_tail=MIN_TAIL):
+    results = powerlaw.Fit(degrees, discrete=discrete, xmin=xmin_range(degrees, min_tail))
+    fit = {"xmin": float(results.power_law.xmin)}
+
+    if math.isnan(fit["xmin"]):
+        return fit
+
+    fit["alpha"] = float(results.power_law.alpha)
+    fit["sigma"] = float(results.power_law.sigma)
+
+    for distribution in COMPARISONS:
+        R, p = results.distribution_compare("power_law", distribution)
+        fit[distribution] = {"R": float(R), "p": float(p)}
+
+    return fit
+
+
+def fit_degree_sequences(sequences, discrete=False, min_tail=MIN_TAIL, processes=None):
+    # fits are stored by a hash of the sorted sequence, so reruns and unchanged graphs skip refitting
+    os.makedirs(FITS_PATH, exist_ok=True)
+
+    paths = {kind: os.path.join(FITS_PATH, f"{fit_key(degrees, discrete, min_tail)}.json")
+             for kind, degrees in sequences.items()}
+    fits = {}
+
+    for kind, path in paths.items():
+        if os.path.exists(path):
+            with open(path) as file:
+                fits[kind] = json.load(file)
+
+    missing = [kind for kind in sequences if kind not in fits]
+    processes = min(worker_count(processes), max(len(missing), 1))
+
+    if processes == 1:
+        computed = [fit_degrees(sequences[kind], discrete, min_tail) for kind in missing]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            computed = list(executor.map(fit_degrees, [sequences[kind] for kind in missing],
+                                         [discrete] * len(missing), [min_tail] * len(missing)))
+
+    for kind, fit in zip(missing, computed):
+        with open(paths[kind], "w") as file:
+            json.dump(fit, file, indent=4)
+
+        fits[kind] = fit
+
+    return fits
@@ -0,0 +1,57 @@
+from functools import partial
+
+import numpy as np
+from scipy import sparse
+
+from null_models import REPLICAS, SWAPS_PER_EDGE, ensemble
+from sparse_centrality import to_csr
+
+
+def _edges(matrix):
+    # upper-triangle edges with weights and the unweighted degree of every node
+    upper = sparse.triu(matrix, k=1).tocoo()
+    degree = np.bincount(np.concatenate([upper.row, upper.col]), minlength=matrix.shape[0])
+    return upper.row, upper.col, upper.data, degree
+
+
+def rich_club_profile(matrix, directed=False, weighted=False):
+    # coefficient for every degree threshold k with more than one node of degree > k, in one sweep
+    # over the edges sorted by their smaller endpoint degree; the weighted variant is Opsahl et al.'s
+    rows, columns, weights, degree = _edges(matrix)
+    max_degree = degree.max(initial=0)
+
+    richer_nodes = len(degree) - np.cumsum(np.bincount(degree, minlength=max_degree + 1))
+    thresholds = np.flatnonzero(richer_nodes > 1)
+
+    # edges whose endpoints both have degree > k
+    smaller_degree = np.minimum(degree[rows], degree[columns])
+    richer_edges = len(rows) - np.cumsum(np.bincount(smaller_degree, minlength=max_degree + 1))
+
+    if not weighted:
+        nodes = richer_nodes[thresholds]
+        return 2 * richer_edges[thresholds] / (nodes * (nodes - 1))
+
+    # weight among the rich nodes over the weight of as many of the strongest edges in the network
+    richer_weight = weights.sum() - np.cumsum(np.bincount(smaller_degree, weights, minlength=max_degree + 1))
+    strongest = np.concatenate([[0.0], np.cumsum(np.sort(weights)[::-1])])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(richer_edges[thresholds] > 0,
+                        richer_weight[thresholds] / strongest[richer_edges[thresholds]], 0.0)
+
+
+def rich_club_coefficient(graph, weight=None):
+    return rich_club_profile(to_csr(graph, weight), weighted=weight is not None)
+
+
+def normalized_rich_club(graph, weight=None, replicas=REPLICAS, swaps_per_edge=SWAPS_PER_EDGE, seed=42,
+                         processes=None):
+    # observed coefficients over the mean of degree-preserving randomizations, which share the degree
+    # sequence and therefore the thresholds; weighted nulls also reshuffle the observed weights
+    observed = rich_club_coefficient(graph, weight)
+    samples = ensemble(graph, partial(rich_club_profile, weighted=weight is not None), model="swap",
+                       replicas=replicas, seed=seed, swaps_per_edge=swaps_per_edge, weight=weight,
+                       processes=processes)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return observed, observed / samples.mean(axis=0), samples
@@ -0,0 +1,87 @@
+import json
+import os
+
+import numpy as np
+
+
+class ShardedIndex:
+    # Key -> value map kept as sorted, memory-mapped shards; every update appends one shard, so neither
+    # adding nor looking up keys reads more than the binary-searched entries of the existing shards.
+
+    def __init__(self, path):
+        self.path = path
+        self.shards, self.size = 0, 0
+
+        if os.path.exists(self._meta_path()):
+            with open(self._meta_path()) as meta_file:
+                meta = json.load(meta_file)
+            self.shards, self.size = meta["shards"], meta["size"]
+
+    def _meta_path(self):
+        return os.path.join(self.path, "meta.json")
+
+    def _shard(self, shard):
+        return (np.load(os.path.join(self.path, f"keys_{shard}.npy"), mmap_mode="r"),
+                np.load(os.path.join(self.path, f"values_{shard}.npy"), mmap_mode="r"))
+
+    def __len__(self):
+        return self.size
+
+    def exists(self):
+        return os.path.exists(self._meta_path())
+
+    def _positions(self, keys):
+        # (shard, position) of every key, shard -1 where no shard holds it
+        shards = np.full(len(keys), -1, dtype=np.int64)
+        positions = np.zeros(len(keys), dtype=np.int64)
+
+        for shard in range(self.shards):
+            shard_keys, _ = self._shard(shard)
+            missing = np.flatnonzero(shards < 0)
+            if not len(shard_keys) or not len(missing):
+                continue
+
+            found = np.minimum(np.searchsorted(shard_keys, keys[missing]), len(shard_keys) - 1)
+            hit = np.asarray(shard_keys[found]) == keys[missing]
+            shards[missing[hit]] = shard
+            positions[missing[hit]] = found[hit]
+
+        return shards, positions
+
+    def contains(self, keys):
+        return self._positions(np.asarray(keys))[0] >= 0
+
+    def lookup(self, keys, missing):
+        keys = np.asarray(keys)
+        shards, positions = self._positions(keys)
+
+        dtypes = [self._shard(shard)[1].dtype for shard in range(self.shards)]
+        values = np.full(len(keys), missing, dtype=np.result_type(np.asarray(missing), *dtypes))
+
+        for shard in np.unique(shards[shards >= 0]).tolist():
+            selected = shards == shard
+            values[selected] = self._shard(shard)[1][positions[selected]]
+
+        return values
+
+    def add(self, keys, values):
+        # keys already stored, or repeated within the batch, keep their first value
+        keys, first = np.unique(np.asarray(keys), return_index=True)
+        values = np.asarray(values)[first]
+
+        new = ~self.contains(keys)
+        if not new.any():
+            return 0
+
+        os.makedirs(self.path, exist_ok=True)
+        np.save(os.path.join(self.path, f"keys_{self.shards}.npy"), keys[new])
+        np.save(os.path.join(self.path, f"values_{self.shards}.npy"), values[new])
+
+        self.shards += 1
+        self.size += int(new.sum())
+
+        # the meta file is written last, so an interrupted update leaves the previous shards in effect
+        with open(self._meta_path(), "w") as meta_file:
+            json.dump({"shards": self.shards, "size": self.size}, meta_file)
+
+        return int(new.sum())
@@ -0,0 +1,149 @@
+import math
+import time
+from multiprocessing import Pool
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csgraph
+
+from clustering import (average_clustering, binary_clustering, clustering_coefficients, matrix_transitivity,
+                        transitivity)
+from null_models import SWAPS_PER_EDGE, adjacency, edge_array, swap_edges
+from workers import worker_count
+
+REFERENCE_COUNT = 10
+PATH_SOURCES = 200
+TIME_BUDGET = 600
+Z_SCORE = 1.96
+
+_worker_edges = None
+_worker_node_count = None
+
+
+def path_length(matrix, sources, rng):
+    # mean shortest path length from sampled BFS sources, with its standard error
+    node_count = matrix.shape[0]
+    sources = np.arange(node_count) if sources >= node_count else rng.choice(node_count, sources, replace=False)
+
+    distances = csgraph.shortest_path(matrix, directed=False, unweighted=True, indices=sources)
+    reachable = np.isfinite(distances) & (distances > 0)
+    distances[~reachable] = 0.0
+
+    per_source = distances.sum(axis=1) / np.maximum(reachable.sum(axis=1), 1)
+    per_source = per_source[reachable.any(axis=1)]
+
+    if len(sources) == node_count or len(per_source) < 2:
+        return float(per_source.mean()), 0.0
+
+    return float(per_source.mean()), float(per_source.std(ddof=1) / math.sqrt(len(per_source)))
+
+
+def _init_worker(edges, node_count):
+    global _worker_edges, _worker_node_count
+    _worker_edges, _worker_node_count = edges, node_count
+
+
+def _reference(lattice, seed, swaps_per_edge, sources):
+    rng = np.random.default_rng(seed)
+    edges = swap_edges(_worker_edges, _worker_node_count, swaps_per_edge, rng, lattice=lattice)
+    matrix = adjacency(edges, _worker_node_count)
+
+    coefficients, reference_transitivity = binary_clustering(matrix, processes=1)
+    length, _ = path_length(matrix, sources, rng)
+
+    return lattice, float(coefficients.mean()), reference_transitivity, length
+
+
+def _mean(values):
+    values = np.asarray(values, dtype=np.float64)
+    error = values.std(ddof=1) / math.sqrt(len(values)) if len(values) > 1 else 0.0
+    return float(values.mean()), float(error)
+
+
+def _ratio(numerator, denominator):
+    return numerator / denominator if denominator else math.nan
+
+
+def giant_component(graph):
+    if nx.is_connected(graph):
+        return graph
+
+    return graph.subgraph(max(nx.connected_components(graph), key=len))
+
+
+def small_world_coefficients(graph, references=REFERENCE_COUNT, swaps_per_edge=SWAPS_PER_EDGE,
+                             sources=PATH_SOURCES, time_budget=TIME_BUDGET, seed=42, processes=None):
+    # sigma and omega with standard errors, from as many reference graphs as fit into time_budget seconds
+    start = time.perf_counter()
+    giant = giant_component(graph)
+    edges, node_count = edge_array(giant)
+    matrix = adjacency(edges, node_count)
+
+    if giant is graph:
+        clustering, clustering_transitivity = average_clustering(graph), transitivity(graph)
+    else:
+        # local clustering does not depend on other components, so the analysis results are reused
+        mask = np.fromiter((node in giant for node in graph), dtype=bool, count=len(graph))
+        clustering = float(clustering_coefficients(graph)[mask].mean())
+        clustering_transitivity = matrix_transitivity(matrix, False)
+        print(f"Using the giant component: {len(giant)} of {len(graph)} nodes")
+
+    results = {False: [], True: []}
+
+    if not len(edges):
+        print("No edges, the small-world coefficients are undefined")
+        return {"sigma": math.nan, "sigma_error": math.nan, "omega": math.nan, "omega_error": math.nan,
+                "random_references": 0, "lattice_references": 0, "seconds": time.perf_counter() - start}
+
+    rng = np.random.default_rng(seed)
+    length, length_error = path_length(matrix, sources, rng)
+
+    seeds = np.random.SeedSequence(seed).generate_state(2 * references).tolist()
+    tasks = [(lattice, seeds[2 * i + lattice]) for i in range(references) for lattice in (False, True)]
+
+    # leaving the pool terminates the workers still building references once the budget is spent
+    processes = worker_count(processes)
+    with Pool(processes, initializer=_init_worker, initargs=(edges, node_count)) as pool:
+        pending = [pool.apply_async(_reference, (lattice, task_seed, swaps_per_edge, sources))
+                   for lattice, task_seed in tasks]
+
+        for result in pending:
+            result.wait(max(time_budget - (time.perf_counter() - start), 0))
+
+        for result in pending:
+            if result.ready():
+                lattice, *values = result.get()
+                results[lattice].append(values)
+
+    if len(results[False]) < 1 or len(results[True]) < 1:
+        raise TimeoutError(f"No reference graphs finished within {time_budget} s")
+
+    _, random_transitivity, random_length = map(list, zip(*results[False]))
+    lattice_clustering, _, _ = map(list, zip(*results[True]))
+
+    random_transitivity, random_transitivity_error = _mean(random_transitivity)
+    random_length, random_length_error = _mean(random_length)
+    lattice_clustering, lattice_clustering_error = _mean(lattice_clustering)
+
+    # same definitions as nx.sigma and nx.omega; errors propagated to first order, undefined ratios are NaN
+    gamma, ratio = _ratio(clustering_transitivity, random_transitivity), _ratio(length, random_length)
+    sigma = _ratio(gamma, ratio)
+    sigma_error = sigma * math.sqrt(_ratio(random_transitivity_error, random_transitivity) ** 2 +
+                                    _ratio(length_error, length) ** 2 +
+                                    _ratio(random_length_error, random_length) ** 2)
+
+    omega = _ratio(random_length, length) - _ratio(clustering, lattice_clustering)
+    omega_error = math.hypot(_ratio(random_length, length) * math.hypot(_ratio(random_length_error, random_length),
+                                                                        _ratio(length_error, length)),
+                             _ratio(clustering, lattice_clustering) * _ratio(lattice_clustering_error,
+                                                                            lattice_clustering))
+
+    return {
+        "sigma": sigma,
+        "sigma_error": sigma_error,
+        "omega": omega,
+        "omega_error": omega_error,
+        "random_references": len(results[False]),
+        "lattice_references": len(results[True]),
+        "seconds": time.perf_counter() - start
+    }
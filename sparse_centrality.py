@@ -0,0 +1,154 @@
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+from scipy.sparse.linalg import eigs, eigsh
+
+from graph_storage import StoredGraph
+from workers import worker_count
+
+# distance rows held in memory per BFS batch (batch size x node count)
+BATCH_ENTRIES = 1 << 24
+
+_matrices = weakref.WeakKeyDictionary()
+_distance_cache = weakref.WeakKeyDictionary()
+_worker_matrix = None
+
+
+def to_csr(graph, weight="weight"):
+    matrices = _matrices.setdefault(graph, {})
+
+    if weight not in matrices and isinstance(graph, StoredGraph):
+        matrices[weight] = graph.csr(weight)
+    elif weight not in matrices:
+        matrices[weight] = sparse.csr_matrix(nx.to_scipy_sparse_array(graph, nodelist=list(graph), weight=weight,
+                                                                      dtype=np.float64, format="csr"))
+
+    return matrices[weight]
+
+
+def forget(graph):
+    # drop cached matrices and distances after the graph has been modified in place
+    _matrices.pop(graph, None)
+    _distance_cache.pop(graph, None)
+
+
+def leading_eigenpair(matrix, symmetric, v0=None, tol=0):
+    # v0 warm-starts ARPACK from a previous solution
+    if symmetric:
+        values, vectors = eigsh(matrix, k=1, which="LA", v0=v0, tol=tol)
+    else:
+        values, vectors = eigs(matrix, k=1, which="LR", v0=v0, tol=tol)
+
+    vector = vectors[:, 0].real
+    vector /= np.sign(vector.sum()) * np.linalg.norm(vector)
+
+    return float(values[0].real), vector
+
+
+def eigenvector_centrality(graph, weight="weight", tol=0):
+    nodes = list(graph)
+
+    if len(nodes) < 3:
+        return nx.eigenvector_centrality_numpy(graph, weight=weight)
+
+    # centrality flows along in-edges, so the left eigenvector is needed for directed graphs
+    matrix = to_csr(graph, weight)
+    _, vector = leading_eigenpair(matrix.T if graph.is_directed() else matrix, not graph.is_directed(), tol=tol)
+
+    return dict(zip(nodes, vector.tolist()))
+
+
+def _init_worker(matrix):
+    global _worker_matrix
+    _worker_matrix = matrix
+
+
+def _distance_sums(batch, weighted):
+    # undirected adjacency is stored symmetric, so the directed search is exact and faster
+    distances = csgraph.shortest_path(_worker_matrix, method="D", directed=True, unweighted=not weighted,
+                                      indices=batch)
+
+    reachable = np.isfinite(distances)
+    distances[~reachable] = 0.0
+
+    with np.errstate(divide="ignore"):
+        reciprocal = np.where(distances > 0, 1.0 / distances, 0.0)
+
+    return batch, distances.sum(axis=1), reachable.sum(axis=1), reciprocal.sum(axis=1)
+
+
+def distance_centralities(graph, distance=None, processes=None):
+    # one multi-source BFS/Dijkstra pass yields both closeness and harmonic closeness
+    results = _distance_cache.setdefault(graph, {})
+
+    if distance in results:
+        return results[distance]
+
+    nodes = list(graph)
+    n = len(nodes)
+
+    # incoming distances, as in NetworkX: search the reversed graph from every node
+    matrix = to_csr(graph, distance)
+    matrix = matrix.T.tocsr() if graph.is_directed() else matrix
+
+    batch_size = max(1, min(n, BATCH_ENTRIES // max(n, 1)))
+    batches = [np.arange(start, min(start + batch_size, n)) for start in range(0, n, batch_size)]
+    arguments = [batches, [distance is not None] * len(batches)]
+
+    processes = worker_count(processes)
+
+    if processes == 1 or len(batches) == 1:
+        _init_worker(matrix)
+        partial_sums = list(map(_distance_sums, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(matrix,)) as executor:
+            partial_sums = list(executor.map(_distance_sums, *arguments))
+
+    total_distance, reachable, harmonic = np.zeros(n), np.zeros(n), np.zeros(n)
+    for batch, batch_distance, batch_reachable, batch_harmonic in partial_sums:
+        total_distance[batch], reachable[batch], harmonic[batch] = batch_distance, batch_reachable, batch_harmonic
+
+    # Wasserman and Faust scaling for graphs with several components
+    with np.errstate(divide="ignore", invalid="ignore"):
+        closeness = np.where(total_distance > 0, (reachable - 1) / total_distance, 0.0)
+        closeness *= (reachable - 1) / (n - 1) if n > 1 else 0.0
+
+    results[distance] = (dict(zip(nodes, closeness.tolist())), dict(zip(nodes, harmonic.tolist())))
+    return results[distance]
+
+
+def closeness_centrality(graph, distance=None, processes=None):
+    return distance_centralities(graph, distance, processes)[0]
+
+
+def harmonic_centrality(graph, distance=None, processes=None):
+    return distance_centralities(graph, distance, processes)[1]
+
+
+def benchmark(graph):
+    def timed(function):
+        start = time.perf_counter()
+        return function(), time.perf_counter() - start
+
+    def report(name, reference_time, backend_time, errors):
+        print(f"{name}: NetworkX {reference_time:.3f}s, sparse {backend_time:.3f}s "
+              f"({reference_time / max(backend_time, 1e-9):.1f}x), max absolute difference {max(errors):.2e}")
+
+    _matrices.pop(graph, None)
+    _distance_cache.pop(graph, None)
+
+    (expected_closeness, expected_harmonic), reference_time = timed(
+        lambda: (nx.closeness_centrality(graph), nx.harmonic_centrality(graph)))
+    (closeness, harmonic), backend_time = timed(lambda: distance_centralities(graph))
+    report("CC + HC", reference_time, backend_time,
+           [abs(expected_closeness[node] - closeness[node]) for node in graph] +
+           [abs(expected_harmonic[node] - harmonic[node]) for node in graph])
+
+    expected, reference_time = timed(lambda: nx.eigenvector_centrality(graph, weight="weight", max_iter=1000))
+    actual, backend_time = timed(lambda: eigenvector_centrality(graph, weight="weight"))
+    report("EVC", reference_time, backend_time, [abs(expected[node] - actual[node]) for node in graph])
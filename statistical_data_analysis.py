@@ -2,11 +2,13 @@ import matplotlib.pyplot as plt
 import pandas as pd
 from scipy.stats import pearsonr
 
+from cleaned_store import read_cleaned_data
+
 
 def groupby_and_count(groupby_column, aggregate_column, *data_frames):
     data_frame = pd.concat(data_frames, ignore_index=True)
 
-    grouped_data_frame = data_frame.groupby(groupby_column)
+    grouped_data_frame = data_frame.groupby(groupby_column, observed=True)
     grouped_data_frame = grouped_data_frame.agg({aggregate_column: "nunique"})
     grouped_data_frame = grouped_data_frame.reset_index()
     grouped_data_frame = grouped_data_frame.sort_values(aggregate_column, ascending=False)
@@ -15,14 +17,14 @@ def groupby_and_count(groupby_column, aggregate_column, *data_frames):
 
 
 def user_count(data_frame):
-    grouped_data_frame = data_frame.groupby("author").size().reset_index(name="count")
+    grouped_data_frame = data_frame.groupby("author", observed=True).size().reset_index(name="count")
     grouped_data_frame = grouped_data_frame.sort_values("count", ascending=False)
     return grouped_data_frame
 
 
 def pearson_correlation(submissions_data_frame, comments_data_frame):
-    grouped_submissions = submissions_data_frame.groupby("author").size().reset_index(name="submission_count")
-    grouped_comments = comments_data_frame.groupby("author").size().reset_index(name="comment_count")
+    grouped_submissions = submissions_data_frame.groupby("author", observed=True).size().reset_index(name="submission_count")
+    grouped_comments = comments_data_frame.groupby("author", observed=True).size().reset_index(name="comment_count")
 
     result = pd.concat([grouped_submissions.set_index("author"), grouped_comments.set_index("author")],
                        axis=1, join="outer").reset_index()
@@ -91,13 +93,14 @@ def submission_analysis(submissions, comments):
         submission_most_comments.to_csv("result_tables/submission_most_comments.csv")
 
 
-def analyze():
-    submissions = pd.read_pickle("dataset/cleaned/submissions")
-    comments = pd.read_pickle("dataset/cleaned/comments")
+def analyze(months=None):
+    submissions = read_cleaned_data("submissions", months=months)
+    comments = read_cleaned_data("comments", ["author", "subreddit", "link_id"], months)
 
     subreddit_analysis(submissions, comments)
     user_analysis(submissions, comments)
     submission_analysis(submissions, comments)
 
 
-analyze()
+if __name__ == "__main__":
+    analyze()
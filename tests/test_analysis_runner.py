@@ -0,0 +1,60 @@
+import os
+
+import networkx as nx
+import pytest
+
+import analysis_runner
+from analysis_runner import graph_hash, task_key
+from graph_session import resolve_analyses
+from graph_storage import save_graph
+
+
+def weighted_graph(weight):
+    graph = nx.karate_club_graph()
+    nx.set_edge_attributes(graph, weight, "weight")
+    return graph
+
+
+def save(graph, path, shift):
+    save_graph(graph, path)
+    # move the modification time on, as it would be on a later rewrite
+    for file in os.listdir(path):
+        stamp = os.path.getmtime(os.path.join(path, file)) + shift
+        os.utime(os.path.join(path, file), (stamp, stamp))
+
+
+@pytest.fixture
+def stored_networks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(analysis_runner, "_graph_hashes", {})
+    save(weighted_graph(1), "models/snett", 0)
+    save(weighted_graph(1), "models/snetf", 0)
+
+
+def test_key_follows_graph_content(stored_networks):
+    [(name, analysis)] = resolve_analyses(["fundamental.components"])
+    key = task_key(name, analysis, "SNetT")
+
+    assert task_key(name, analysis, "SNetT") == key
+    assert task_key(name, analysis, "SNetF") != key
+
+    # same file sizes, different weights
+    save(weighted_graph(2), "models/snett", 10)
+    changed = task_key(name, analysis, "SNetT")
+    assert changed != key
+
+    # rewriting identical content keeps the key
+    save(weighted_graph(2), "models/snett", 20)
+    assert task_key(name, analysis, "SNetT") == changed
+
+
+def test_graph_hash_is_remembered_until_files_change(stored_networks):
+    digest = graph_hash("models/snett")
+    stamp = analysis_runner._graph_hashes["models/snett"][0]
+
+    assert graph_hash("models/snett") == digest
+    assert analysis_runner._graph_hashes["models/snett"][0] == stamp
+
+    save(weighted_graph(3), "models/snett", 10)
+    assert graph_hash("models/snett") != digest
+    assert analysis_runner._graph_hashes["models/snett"][0] != stamp
@@ -0,0 +1,47 @@
+import networkx as nx
+import pytest
+
+from assortativity import attribute_assortativity, degree_assortativity, node_degrees
+
+
+def weighted_graph(directed):
+    graph = nx.gnp_random_graph(50, 0.1, seed=4, directed=directed)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 1 + (u * v) % 4
+    graph.add_edge(2, 2, weight=3)
+    nx.set_node_attributes(graph, {node: ["a", "b", "c"][node % 3] for node in graph}, "group")
+    return graph
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_degree_assortativity_matches_networkx(directed):
+    graph = weighted_graph(directed)
+    coefficients = degree_assortativity(graph)
+
+    assert len(coefficients) == (8 if directed else 2)
+    for (x, y, weight), coefficient in coefficients.items():
+        if directed:
+            expected = nx.degree_assortativity_coefficient(graph, x=x, y=y, weight=weight)
+        else:
+            expected = nx.degree_assortativity_coefficient(graph, weight=weight)
+        assert coefficient == pytest.approx(expected), (x, y, weight)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_node_degrees_match_networkx(directed):
+    graph = weighted_graph(directed)
+    degrees = node_degrees(graph, "weight")
+
+    if directed:
+        assert degrees["out"].tolist() == [degree for _, degree in graph.out_degree(weight="weight")]
+        assert degrees["in"].tolist() == [degree for _, degree in graph.in_degree(weight="weight")]
+    else:
+        assert degrees["total"].tolist() == [degree for _, degree in graph.degree(weight="weight")]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_attribute_assortativity_matches_networkx(directed):
+    graph = weighted_graph(directed)
+    expected = nx.attribute_assortativity_coefficient(graph, "group")
+
+    assert attribute_assortativity(graph, "group") == pytest.approx(expected)
@@ -0,0 +1,59 @@
+import networkx as nx
+import pytest
+
+from betweenness import betweenness_centrality, sample_size
+
+
+def weighted_graph():
+    graph = nx.karate_club_graph()
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 1 + (u * v) % 4
+    return graph
+
+
+def test_exact_matches_networkx():
+    graph = weighted_graph()
+    expected = nx.betweenness_centrality(graph, weight="weight")
+    result = betweenness_centrality(graph, weight="weight", processes=1)
+
+    assert result == pytest.approx(expected)
+
+
+def test_directed_unnormalized_matches_networkx():
+    graph = nx.gnp_random_graph(30, 0.15, seed=1, directed=True)
+    expected = nx.betweenness_centrality(graph, normalized=False)
+
+    assert betweenness_centrality(graph, normalized=False, processes=1) == pytest.approx(expected)
+
+
+def test_pivots_covering_every_node_are_exact():
+    graph = weighted_graph()
+    exact = betweenness_centrality(graph, processes=1)
+
+    assert betweenness_centrality(graph, k=len(graph), processes=1) == pytest.approx(exact)
+
+
+def test_cache_sees_weight_changes():
+    graph = weighted_graph()
+    before = betweenness_centrality(graph, weight="weight", processes=1)
+
+    # same node and edge counts, different shortest paths
+    graph[0][1]["weight"] = 100
+    after = betweenness_centrality(graph, weight="weight", processes=1)
+
+    assert after == pytest.approx(nx.betweenness_centrality(graph, weight="weight"))
+    assert after != before
+
+
+def test_sample_size_shrinks_with_looser_bounds():
+    assert sample_size(1000, 0.01) > sample_size(1000, 0.05) > 0
+
+
+def test_weighted_and_unweighted_results_are_cached_separately():
+    graph = weighted_graph()
+    unweighted = betweenness_centrality(graph, processes=1)
+    weighted = betweenness_centrality(graph, weight="weight", processes=1)
+
+    assert unweighted == pytest.approx(nx.betweenness_centrality(graph))
+    assert weighted == pytest.approx(nx.betweenness_centrality(graph, weight="weight"))
+    assert betweenness_centrality(graph, processes=1) is unweighted
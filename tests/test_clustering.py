@@ -0,0 +1,39 @@
+import networkx as nx
+import pytest
+
+from clustering import average_clustering, clustering, transitivity
+
+
+def fractional_graph(directed=False):
+    graph = nx.gnp_random_graph(30, 0.25, seed=2, directed=directed)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 0.05 + ((u * 7 + v * 3) % 9) / 20
+    return graph
+
+
+def test_weights_below_one_are_normalized_by_the_largest_weight():
+    graph = nx.complete_graph(4)
+    nx.set_edge_attributes(graph, 0.5, "weight")
+
+    assert clustering(graph, weight="weight", processes=1) == pytest.approx({node: 1.0 for node in graph})
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_matches_networkx(directed, weight):
+    graph = fractional_graph(directed)
+    graph.add_edge(0, 0, weight=0.9)
+
+    assert clustering(graph, weight=weight, processes=1) == pytest.approx(nx.clustering(graph, weight=weight))
+    assert average_clustering(graph, weight=weight, processes=1) == \
+        pytest.approx(nx.average_clustering(graph, weight=weight))
+
+
+def test_transitivity_matches_networkx():
+    graph = fractional_graph()
+    assert transitivity(graph, processes=1) == pytest.approx(nx.transitivity(graph))
+
+
+def test_graph_without_edges():
+    graph = nx.empty_graph(3)
+    assert clustering(graph, weight="weight", processes=1) == {0: 0.0, 1: 0.0, 2: 0.0}
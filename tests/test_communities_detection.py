@@ -0,0 +1,63 @@
+from itertools import islice
+
+import networkx as nx
+import pytest
+from scipy.cluster.hierarchy import is_monotonic, is_valid_linkage
+
+from communities_detection import girvan_newman_splits, splits_to_linkage
+
+
+def two_component_graph():
+    # two components, so the roots are merged above the recorded splits
+    return nx.disjoint_union(nx.karate_club_graph(), nx.barbell_graph(4, 1))
+
+
+def partitions_from_linkage(linkage, leaves):
+    # replay the merges from the top, yielding the partition below every merge
+    clusters = {i: frozenset(leaf) for i, leaf in enumerate(leaves)}
+    for i, (first, second, _, _) in enumerate(linkage, start=len(leaves)):
+        clusters[i] = clusters[int(first)] | clusters[int(second)]
+
+    current = {clusters[len(clusters) - 1]}
+    partitions = []
+    for i in range(len(clusters) - 1, len(leaves) - 1, -1):
+        first, second = int(linkage[i - len(leaves), 0]), int(linkage[i - len(leaves), 1])
+        current = current - {clusters[i]} | {clusters[first], clusters[second]}
+        partitions.append(set(current))
+
+    return partitions
+
+
+@pytest.mark.parametrize("max_splits", [None, 5])
+def test_splits_replay_networkx_girvan_newman(max_splits):
+    graph = two_component_graph()
+    roots, splits, leaves = girvan_newman_splits(graph, max_splits)
+
+    expected = [set(map(frozenset, partition)) for partition in islice(nx.community.girvan_newman(graph), max_splits)]
+    assert set(roots) == set(map(frozenset, nx.connected_components(graph)))
+    assert len(splits) == len(expected) and leaves == expected[-1]
+
+    communities = set(roots)
+    for (parent, first, second), partition in zip(splits, expected):
+        assert parent == first | second and not first & second
+        communities = communities - {parent} | {first, second}
+        assert communities == partition
+
+
+def test_linkage_encodes_the_splits():
+    graph = two_component_graph()
+    roots, splits, leaves = girvan_newman_splits(graph, 8)
+    linkage, ordered = splits_to_linkage(roots, splits, leaves)
+
+    assert is_valid_linkage(linkage) and is_monotonic(linkage)
+    assert len(linkage) == len(ordered) - 1 and set(ordered) == leaves
+    assert linkage[-1, 3] == len(ordered)
+
+    # below the root merge, the merges undo the splits in recorded order
+    partitions = partitions_from_linkage(linkage, ordered)
+    assert partitions[0] == set(roots)
+
+    communities = set(roots)
+    for (parent, first, second), partition in zip(splits, partitions[len(roots) - 1:]):
+        communities = communities - {parent} | {first, second}
+        assert communities == partition
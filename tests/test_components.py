@@ -0,0 +1,81 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from components import (component_labels, component_sizes, distance_matrix, eccentricity_bounds,
+                        giant_component, sampled_eccentricities, union_find)
+from sparse_centrality import to_csr
+
+
+def components_graph():
+    # a giant component with leaves, a smaller cycle, a single edge and an isolated node
+    graph = nx.barbell_graph(5, 3)
+    graph.add_edges_from([(100, 101), (101, 102), (102, 100), (200, 201)])
+    graph.add_edges_from([(0, 300), (12, 301)])
+    graph.add_node(400)
+    return graph
+
+
+def test_union_find_roots():
+    parent = union_find(6, np.array([0, 2, 4, 3]), np.array([1, 3, 5, 4]))
+    assert parent.tolist() == [0, 0, 2, 2, 2, 2]
+
+
+def test_component_sizes_match_networkx():
+    graph = components_graph()
+    labels = component_labels(to_csr(graph, None))
+
+    expected = sorted((len(component) for component in nx.connected_components(graph)), reverse=True)
+    assert component_sizes(labels).tolist() == expected
+
+
+@pytest.mark.parametrize("connection", ["weak", "strong"])
+def test_directed_component_sizes_match_networkx(connection):
+    graph = nx.gnp_random_graph(60, 0.03, seed=5, directed=True)
+    labels = component_labels(to_csr(graph, None), connection)
+
+    components = nx.weakly_connected_components(graph) if connection == "weak" \
+        else nx.strongly_connected_components(graph)
+    assert component_sizes(labels).tolist() == sorted(map(len, components), reverse=True)
+
+
+def test_giant_component_slices_the_largest_component():
+    graph = components_graph()
+    nodes, giant = giant_component(to_csr(graph, None))
+
+    labels = list(graph)
+    expected = max(nx.connected_components(graph), key=len)
+    assert {labels[node] for node in nodes} == expected
+    assert giant.nnz == 2 * graph.subgraph(expected).number_of_edges()
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_eccentricity_bounds_are_exact_without_a_limit(directed):
+    if directed:
+        graph = nx.DiGraph(nx.cycle_graph(12, create_using=nx.DiGraph))
+        graph.add_edges_from([(0, 6), (3, 9), (9, 3)])
+    else:
+        graph = components_graph()
+
+    nodes, giant, strong = distance_matrix(graph, "strong" if directed else "weak")
+    lower, upper, _ = eccentricity_bounds(giant, strong)
+
+    labels = list(graph)
+    expected = nx.eccentricity(graph.subgraph([labels[node] for node in nodes]))
+    assert np.array_equal(lower, upper)
+    assert lower.tolist() == [expected[labels[node]] for node in nodes]
+
+
+def test_bounds_hold_when_the_search_limit_is_hit():
+    graph = nx.random_labeled_tree(80, seed=3)
+    _, giant, _ = distance_matrix(graph)
+    lower, upper, searches = eccentricity_bounds(giant, bfs_limit=2)
+
+    exact = np.array([nx.eccentricity(graph)[node] for node in graph])
+    assert searches == 2
+    assert np.all((lower <= exact) & (exact <= upper))
+
+
+def test_sampled_eccentricities_cover_every_node_of_small_graphs():
+    graph = nx.path_graph(5)
+    assert sorted(sampled_eccentricities(to_csr(graph, None)).tolist()) == [2, 3, 3, 4, 4]
@@ -0,0 +1,102 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_storage import (add_edge_weights, from_networkx, load_graph, load_stored_graph, masked_graph,
+                           permuted_graph, save_graph, save_stored_graph, to_networkx)
+
+
+def weighted_graph(directed=False):
+    graph = nx.DiGraph() if directed else nx.Graph()
+    graph.add_node("isolated", target=False)
+    graph.add_edge("a", "b", weight=3)
+    graph.add_edge("b", "c", weight=1)
+    graph.add_edge("c", "a", weight=7)
+    graph.add_edge("c", "c", weight=2)
+    for node in ["a", "b", "c"]:
+        graph.nodes[node]["target"] = node != "b"
+    return graph
+
+
+def same_graph(first, second):
+    return (list(first) == list(second) and dict(first.nodes(data=True)) == dict(second.nodes(data=True))
+            and nx.utils.edges_equal(first.edges(data=True), second.edges(data=True)))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_round_trip(tmp_path, directed):
+    graph = weighted_graph(directed)
+    save_graph(graph, str(tmp_path / "graph"))
+
+    for memory_map in [True, False]:
+        assert same_graph(load_graph(str(tmp_path / "graph"), memory_map), graph)
+
+
+def test_undirected_storage_is_symmetric_with_single_loops():
+    stored = from_networkx(weighted_graph())
+    matrix = stored.csr().toarray()
+
+    assert np.array_equal(matrix, matrix.T)
+    assert len(stored.indices) == 2 * 3 + 1
+    assert all(np.all(np.diff(stored.indices[start:end]) > 0)
+               for start, end in zip(stored.indptr[:-1], stored.indptr[1:]))
+
+
+def test_masked_graph_keeps_heavy_edges_between_kept_nodes():
+    stored = from_networkx(weighted_graph())
+    heavy = np.asarray(stored.edge_attributes["weight"]) > 1
+    nodes = np.array([label != "b" for label in stored.labels])
+
+    masked = to_networkx(masked_graph(stored, heavy, nodes))
+    assert list(masked) == ["isolated", "a", "c"]
+    assert sorted(masked.edges(data="weight")) == [("a", "c", 7), ("c", "c", 2)]
+
+
+def test_permuted_graph_reorders_nodes():
+    graph = weighted_graph(directed=True)
+    stored = from_networkx(graph)
+    order = [3, 1, 0, 2]
+
+    permuted = permuted_graph(stored, order)
+    assert permuted.labels == [stored.labels[i] for i in order]
+    assert nx.utils.edges_equal(to_networkx(permuted).edges(data=True), graph.edges(data=True))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_add_edge_weights(tmp_path, directed):
+    path = str(tmp_path / "graph")
+    graph = weighted_graph(directed)
+    save_graph(graph, path)
+
+    # existing edges only: updated in place
+    labels = load_stored_graph(path).labels
+    a, b, c = (labels.index(node) for node in "abc")
+    assert add_edge_weights(path, [a, c], [b, c], [2, 1]).tolist() == [5, 3]
+
+    # a new edge, a new node and a repeated pair
+    d = len(labels)
+    weights = add_edge_weights(path, [b, d, a, a], [a, c, b, b], [1, 4, 1, 1], ["d"], {"target": [True]})
+
+    graph["a"]["b"]["weight"] = 5
+    graph["c"]["c"]["weight"] = 3
+    graph.add_node("d", target=True)
+    graph.add_edge("d", "c", weight=4)
+    if directed:
+        graph["a"]["b"]["weight"] = 7
+        graph.add_edge("b", "a", weight=1)
+        assert weights.tolist() == [1, 4, 7, 7]
+    else:
+        graph["a"]["b"]["weight"] = 8
+        assert weights.tolist() == [8, 4, 8, 8]
+
+    assert same_graph(load_graph(path), graph)
+
+
+def test_save_replaces_memory_mapped_files(tmp_path):
+    path = str(tmp_path / "graph")
+    save_graph(weighted_graph(), path)
+    loaded = load_stored_graph(path)
+
+    save_stored_graph(from_networkx(nx.path_graph(3)), path)
+    assert len(loaded.labels) == 4 and np.asarray(loaded.indices).sum() >= 0
+    assert len(load_stored_graph(path).labels) == 3
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_cleaning import prepare_data
+from incremental_update import network_edges, rebuild_networks, update_month
+from sharded_index import ShardedIndex
+
+# skewed activity, so co-membership weights cross the SNetF threshold between months; r6 only appears later
+SUBREDDITS = ["pics", "funny", "science", "politics", "r1", "r2", "r3", "r4", "r5", "r6"]
+ACTIVITY = [8, 6, 4, 3, 2, 2, 1, 1, 1, 1]
+NETWORKS = ["snet", "snetf", "snett", "usernet"]
+
+
+def write_months(months, seed=0):
+    # submissions and comments per month; comments link to submissions and reply to comments of any
+    # earlier month, a few to ones that do not exist, and some authors are deleted
+    rng = np.random.default_rng(seed)
+    submission_ids, comment_ids, files = [], [], []
+
+    for month in range(1, months + 1):
+        activity = np.array(ACTIVITY[:-1] + [ACTIVITY[-1] * (month > 3)], dtype=np.float64)
+        activity /= activity.sum()
+        authors = [f"u{i}" for i in rng.integers(0, 60 + 10 * month, 40)]
+        authors[0] = "[deleted]"
+        ids = [f"s{month}_{i}" for i in range(40)]
+        submission_ids += ids
+        submissions = pd.DataFrame({"id": ids, "created_utc": 1, "author": authors,
+                                    "subreddit": rng.choice(SUBREDDITS, 40, p=activity), "subreddit_id": "t5_x",
+                                    "url": "u", "permalink": "p", "domain": "d", "num_comments": 1, "score": 1,
+                                    "over_18": False, "stickied": False, "locked": False, "hide_score": False,
+                                    "distinguished": ""})
+
+        links = [f"t3_{submission_ids[i]}" for i in rng.integers(0, len(submission_ids), 150)]
+        links[:3] = ["t3_missing"] * 3
+        ids = [f"c{month}_{i}" for i in range(150)]
+        parents = [f"t1_{comment_ids[i]}" if comment_ids and rng.random() < 0.5 else link
+                   for i, link in zip(rng.integers(0, max(len(comment_ids), 1), 150), links)]
+        comment_ids += ids
+        comments = pd.DataFrame({"id": ids, "created_utc": 1,
+                                 "author": [f"u{i}" for i in rng.integers(0, 60 + 10 * month, 150)],
+                                 "subreddit": rng.choice(SUBREDDITS, 150, p=activity), "link_id": links,
+                                 "parent_id": parents, "score": 1, "distinguished": "", "controversiality": 0})
+        files.append((submissions, comments))
+
+    return files
+
+
+def test_incremental_update_equals_full_rebuild(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for directory in ["dataset/reddit_submissions_2008", "dataset/reddit_comments_2008", "result_tables"]:
+        os.makedirs(directory)
+
+    months = write_months(5)
+    for month, (submissions, comments) in enumerate(months[:3], start=1):
+        submissions.to_csv(f"dataset/reddit_submissions_2008/2008-{month:02}.csv")
+        comments.to_csv(f"dataset/reddit_comments_2008/2008-{month:02}.csv")
+
+    prepare_data()
+    rebuild_networks()
+
+    for month, (submissions, comments) in enumerate(months[3:], start=4):
+        submissions.to_csv(f"submissions_{month}.csv")
+        comments.to_csv(f"comments_{month}.csv")
+        update_month(f"submissions_{month}.csv", f"comments_{month}.csv")
+
+    incremental = {name: network_edges(f"models/{name}") for name in NETWORKS}
+    rebuild_networks()
+
+    for name in NETWORKS:
+        assert incremental[name] == network_edges(f"models/{name}"), name
+    assert len(incremental["usernet"][1]) > 0 and len(incremental["snetf"][1]) > 0
+
+
+def test_sharded_index_keeps_first_value(tmp_path):
+    index = ShardedIndex(str(tmp_path / "index"))
+    assert index.add(np.array(["b", "a", "b"]), np.array([1, 2, 3])) == 2
+    assert index.add(np.array(["c", "a"]), np.array([4, 5])) == 1
+
+    reopened = ShardedIndex(str(tmp_path / "index"))
+    assert len(reopened) == 3
+    assert reopened.lookup(np.array(["a", "b", "c", "d"]), -1).tolist() == [2, 1, 4, -1]
+    assert reopened.contains(np.array(["c", "x"])).tolist() == [True, False]
@@ -0,0 +1,51 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from katz import FALLBACK_ALPHA, KatzSolver
+
+
+def weighted_graph(directed):
+    graph = nx.gnp_random_graph(30, 0.15, seed=5, directed=directed)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 1 + (u + v) % 4
+    return graph
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("method", ["lu", "iterative"])
+def test_uniform_matches_networkx(directed, method):
+    graph = weighted_graph(directed)
+    solver = KatzSolver(graph, method=method)
+    expected = nx.katz_centrality(graph, alpha=solver.alpha, beta=1.0, weight="weight", max_iter=10_000, tol=1e-12)
+
+    assert solver.uniform() == pytest.approx([expected[node] for node in solver.nodes], abs=1e-8)
+
+
+@pytest.mark.parametrize("method", ["lu", "iterative"])
+def test_personalized_matches_networkx(method):
+    graph = weighted_graph(False)
+    solver = KatzSolver(graph, method=method)
+    scores = solver.personalized([0, 7], boost=50.0)
+
+    for column, target in enumerate([0, 7]):
+        beta = {node: 50.0 if node == target else 1.0 for node in graph}
+        expected = nx.katz_centrality(graph, alpha=solver.alpha, beta=beta, weight="weight", max_iter=10_000,
+                                      tol=1e-12)
+        assert scores[:, column] == pytest.approx([expected[node] for node in solver.nodes], abs=1e-8)
+
+
+def test_alpha_above_bound_is_rejected():
+    graph = weighted_graph(False)
+    radius = KatzSolver(graph).radius
+
+    with pytest.raises(ValueError):
+        KatzSolver(graph, alpha=1.01 / radius)
+
+
+@pytest.mark.parametrize("method", ["lu", "iterative"])
+def test_graph_without_edges_falls_back(method):
+    solver = KatzSolver(nx.empty_graph(5), method=method)
+
+    assert solver.radius == 0 and solver.alpha == FALLBACK_ALPHA
+    assert solver.uniform() == pytest.approx(np.full(5, 1 / np.sqrt(5)))
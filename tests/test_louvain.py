@@ -0,0 +1,60 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from louvain import ModularityGraph, communities, louvain, quality_matrix
+
+
+def planted_graph(directed=False):
+    # four planted groups of 15 nodes, with weights and a self-loop
+    graph = nx.planted_partition_graph(4, 15, 0.5, 0.05, seed=7, directed=directed)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 1 + (u * v) % 3
+    graph.add_edge(0, 0, weight=2)
+    return graph
+
+
+def partition(graph, labels):
+    nodes = list(graph)
+    return [{nodes[i] for i in np.flatnonzero(labels == label)} for label in range(labels.max() + 1)]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("resolution", [1.0, 0.5])
+def test_modularity_matches_networkx(directed, resolution):
+    graph = planted_graph(directed)
+    matrix = quality_matrix(graph)
+    labels = louvain(matrix, resolution, seed=1)
+
+    expected = nx.community.modularity(graph, partition(graph, labels), weight="weight", resolution=resolution)
+    assert ModularityGraph(matrix, resolution).modularity(labels) == pytest.approx(expected)
+
+    planted = np.repeat(np.arange(4), 15)
+    expected = nx.community.modularity(graph, graph.graph["partition"], weight="weight", resolution=resolution)
+    assert ModularityGraph(matrix, resolution).modularity(planted) == pytest.approx(expected)
+
+
+def test_planted_partition_is_recovered():
+    graph = planted_graph()
+    labels = louvain(quality_matrix(graph), seed=1)
+
+    assert sorted(map(sorted, partition(graph, labels))) == sorted(map(sorted, graph.graph["partition"]))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_refined_communities_are_connected(seed):
+    graph = nx.disjoint_union(nx.gnp_random_graph(80, 0.05, seed=seed), nx.karate_club_graph())
+    labels = louvain(quality_matrix(graph, None), seed=seed)
+
+    for community in partition(graph, labels):
+        assert nx.is_connected(graph.subgraph(community))
+
+
+def test_consensus_is_deterministic_for_a_fixed_seed():
+    graph = nx.karate_club_graph()
+    first = communities(graph, seed=3, processes=1)
+    second = communities(graph, seed=3, processes=2)
+
+    assert np.array_equal(first[0], second[0])
+    assert np.array_equal(first[1], second[1])
+    assert first[2] == second[2] and first[3] == second[3]
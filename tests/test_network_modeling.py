@@ -0,0 +1,148 @@
+import os
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from graph_storage import load_graph, load_stored_graph, save_graph, to_networkx
+from network_modeling import (SUBREDDIT_FILTER, WEIGHT_THRESHOLD, ComembershipAccumulator, connect_subreddits,
+                              connect_subreddits_iterative, generate_snet_filtered, generate_snet_target,
+                              threshold_sweep)
+
+
+def activity(rows=400, seed=0):
+    # repeated (author, subreddit) pairs, some subreddits only a few users share
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"author": [f"u{i}" for i in rng.integers(0, 60, rows)],
+                         "subreddit": [f"r{i}" for i in rng.zipf(1.6, rows) % 25]})
+
+
+def edge_weights(graph):
+    return {frozenset(edge): weight for *edge, weight in graph.edges(data="weight")}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 37, 1000])
+def test_streaming_equals_in_memory_construction(chunk_size):
+    submissions, comments = activity(seed=0), activity(seed=1)
+
+    expected = nx.Graph()
+    connect_subreddits(expected, submissions, comments)
+
+    accumulator = ComembershipAccumulator()
+    for data_frame in [submissions, comments]:
+        for start in range(0, len(data_frame), chunk_size):
+            accumulator.update(data_frame.iloc[start:start + chunk_size])
+
+    streamed = nx.Graph()
+    accumulator.to_graph(streamed)
+
+    assert edge_weights(streamed) == edge_weights(expected)
+    assert set(streamed) == set(submissions["subreddit"]) | set(comments["subreddit"])
+
+
+def test_sparse_construction_equals_iterative():
+    submissions, comments = activity(seed=2), activity(seed=3)
+    iterative, product = nx.Graph(), nx.Graph()
+
+    connect_subreddits_iterative(iterative, submissions, comments)
+    connect_subreddits(product, submissions, comments)
+
+    assert edge_weights(product) == edge_weights(iterative)
+
+
+def test_saved_accumulator_resumes(tmp_path):
+    first, second = activity(seed=4), activity(seed=5)
+
+    expected = ComembershipAccumulator()
+    expected.update(first)
+    expected.update(second)
+
+    accumulator = ComembershipAccumulator()
+    accumulator.update(first)
+    accumulator.save(str(tmp_path / "state.npz"))
+    resumed = ComembershipAccumulator.load(str(tmp_path / "state.npz"))
+    resumed.update(second)
+
+    assert resumed.author_codes == expected.author_codes and resumed.subreddit_codes == expected.subreddit_codes
+    assert (resumed.incidence != expected.incidence).nnz == 0
+    assert (resumed.comembership != expected.comembership).nnz == 0
+
+
+def subreddit_network():
+    # weights around the threshold, including exactly WEIGHT_THRESHOLD, and two targets missing from the network
+    rng = np.random.default_rng(6)
+    graph = nx.gnm_random_graph(40, 150, seed=6)
+    names = [f"r{node}" for node in graph]
+    names[3:13] = SUBREDDIT_FILTER[:10]
+    graph = nx.relabel_nodes(graph, dict(enumerate(names)))
+
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = int(rng.integers(WEIGHT_THRESHOLD - 5, WEIGHT_THRESHOLD + 6))
+    nx.set_node_attributes(graph, {node: node in SUBREDDIT_FILTER for node in graph}, "target")
+
+    targets = SUBREDDIT_FILTER[8:] + SUBREDDIT_FILTER[:8] + ["absent", "also_absent"]
+    return graph, targets
+
+
+def baseline_filtered(graph, threshold):
+    filtered = nx.Graph(graph)
+    filtered.remove_edges_from([(a, b) for a, b, attrs in filtered.edges(data=True) if attrs["weight"] <= threshold])
+    return filtered
+
+
+def baseline_target(graph, target_nodes):
+    target = nx.Graph()
+    target.add_nodes_from(target_nodes)
+    for a, b, attrs in graph.edges(data=True):
+        if a in target_nodes and b in target_nodes:
+            target.add_edge(a, b, weight=attrs["weight"])
+    return target
+
+
+def same_graph(first, second):
+    return (list(first.nodes(data=True)) == list(second.nodes(data=True)) and
+            edge_weights(first) == edge_weights(second))
+
+
+@pytest.fixture
+def stored_snet(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for directory in ["models", "result_tables"]:
+        os.makedirs(directory)
+
+    graph, targets = subreddit_network()
+    save_graph(graph, "models/snet")
+    return graph, targets, load_stored_graph("models/snet")
+
+
+def test_masked_networks_equal_the_baseline_construction(stored_snet):
+    graph, targets, stored = stored_snet
+
+    filtered = to_networkx(generate_snet_filtered(stored, WEIGHT_THRESHOLD))
+    assert same_graph(filtered, baseline_filtered(graph, WEIGHT_THRESHOLD))
+    assert same_graph(load_graph("models/snetf"), filtered)
+    assert any(weight == WEIGHT_THRESHOLD for *_, weight in graph.edges(data="weight"))
+
+    target = to_networkx(generate_snet_target(stored, targets))
+    assert same_graph(target, baseline_target(graph, targets))
+    assert list(target) == targets
+    assert same_graph(load_graph("models/snett"), target)
+
+
+def test_threshold_sweep_equals_filtering_each_threshold(stored_snet):
+    graph, _, stored = stored_snet
+    thresholds = list(range(WEIGHT_THRESHOLD - 6, WEIGHT_THRESHOLD + 7, 2))
+    sweep = threshold_sweep(stored, thresholds)
+
+    for threshold in thresholds:
+        filtered = baseline_filtered(graph, threshold)
+        filtered.remove_nodes_from(list(nx.isolates(filtered)))
+        sizes = sorted(map(len, nx.connected_components(filtered)), reverse=True) + [0, 0]
+
+        assert sweep.loc[threshold].to_dict() == {"nodes": filtered.number_of_nodes(),
+                                                   "edges": filtered.number_of_edges(),
+                                                   "components": len(sizes) - 2,
+                                                   "giant_component": sizes[0], "second_component": sizes[1]}
+
+    assert pd.read_csv("result_tables/snet_threshold_sweep.csv", index_col="threshold").equals(sweep)
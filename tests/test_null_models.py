@@ -0,0 +1,80 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from null_models import adjacency, edge_array, edge_keys, ensemble, null_edges, swap_edges
+
+
+def degrees(edges, node_count, directed):
+    matrix = adjacency(edges, node_count, directed)
+    return np.asarray(matrix.sum(axis=1)).ravel(), np.asarray(matrix.sum(axis=0)).ravel()
+
+
+def is_simple(edges, node_count, directed):
+    keys = edge_keys(edges[:, 0], edges[:, 1], node_count, directed)
+    return bool(np.all(edges[:, 0] != edges[:, 1])) and len(np.unique(keys)) == len(keys)
+
+
+def observed_graph(directed):
+    graph = nx.gnp_random_graph(60, 0.08, seed=11, directed=directed)
+    graph.add_edge(3, 3)
+    return graph
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_gnm_keeps_the_edge_count(directed):
+    edges, node_count = edge_array(observed_graph(directed))
+    sample = null_edges("gnm", edges, node_count, np.random.default_rng(0), directed)
+
+    assert len(sample) == len(edges) and is_simple(sample, node_count, directed)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_swap_keeps_the_degree_sequence(directed):
+    edges, node_count = edge_array(observed_graph(directed))
+    rng = np.random.default_rng(0)
+
+    for sample in [null_edges("swap", edges, node_count, rng, directed),
+                   swap_edges(edges, node_count, 5, rng, directed, lattice=True)]:
+        assert len(sample) == len(edges) and is_simple(sample, node_count, directed)
+        for expected, actual in zip(degrees(edges, node_count, directed), degrees(sample, node_count, directed)):
+            assert np.array_equal(expected, actual)
+
+    keys = edge_keys(edges[:, 0], edges[:, 1], node_count, directed)
+    assert not np.array_equal(np.sort(keys), np.sort(edge_keys(sample[:, 0], sample[:, 1], node_count, directed)))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_configuration_erases_at_most_the_degree_sequence(directed):
+    edges, node_count = edge_array(observed_graph(directed))
+    sample = null_edges("configuration", edges, node_count, np.random.default_rng(0), directed)
+
+    assert len(sample) <= len(edges) and is_simple(sample, node_count, directed)
+    for expected, actual in zip(degrees(edges, node_count, directed), degrees(sample, node_count, directed)):
+        assert np.all(actual <= expected)
+
+
+def test_configuration_keeps_degrees_without_loops_or_repeats():
+    # a perfect matching has one stub per node, so stub matching cannot draw self-loops or repeated edges
+    graph = nx.Graph([(2 * i, 2 * i + 1) for i in range(50)])
+    edges, node_count = edge_array(graph)
+    sample = null_edges("configuration", edges, node_count, np.random.default_rng(0))
+
+    assert len(sample) == len(edges)
+    assert np.array_equal(degrees(sample, node_count, False)[0], np.ones(node_count))
+
+
+def row_sums(matrix, directed):
+    return np.asarray(matrix.sum(axis=1)).ravel()
+
+
+def test_ensemble_is_reproducible_and_keeps_degrees():
+    graph = observed_graph(False)
+    samples = ensemble(graph, row_sums, replicas=4, seed=5, processes=1)
+    # the self-loop is left out of the null models
+    expected = [degree - 2 * graph.has_edge(node, node) for node, degree in graph.degree()]
+
+    assert samples.shape == (4, len(graph))
+    assert np.array_equal(samples, np.tile(expected, (4, 1)))
+    assert np.array_equal(ensemble(graph, row_sums, model="gnm", replicas=4, seed=5, processes=1),
+                          ensemble(graph, row_sums, model="gnm", replicas=4, seed=5, processes=2))
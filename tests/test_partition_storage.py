@@ -0,0 +1,72 @@
+import networkx as nx
+import numpy as np
+
+from partition_storage import PartitionView, convert_spectral_gml, save_partitions
+
+
+def subreddit_graph():
+    graph = nx.relabel_nodes(nx.karate_club_graph(), lambda node: f"r{node}")
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 1 + len(u + v) % 3
+    return graph
+
+
+def colored(graph, labels):
+    # the baseline per-k model: a copy of the graph with the label as a string "color" attribute
+    colored_graph = graph.copy()
+    nx.set_node_attributes(colored_graph, dict(zip(colored_graph, map(str, labels))), "color")
+    return colored_graph
+
+
+def same_graph(first, second):
+    return (list(first.nodes(data=True)) == list(second.nodes(data=True)) and
+            sorted(first.edges(data=True)) == sorted(second.edges(data=True)))
+
+
+def test_partitions_round_trip(tmp_path):
+    graph = subreddit_graph()
+    rng = np.random.default_rng(0)
+    partitions = {k: rng.integers(0, k, len(graph)) for k in [2, 5, 9]}
+    save_partitions(graph, str(tmp_path), partitions)
+
+    view = PartitionView(str(tmp_path))
+    assert view.keys == [2, 5, 9] and 5 in view and 3 not in view
+    assert view.labels.dtype == np.int16
+    for k, labels in partitions.items():
+        assert np.array_equal(view[k], labels)
+        assert same_graph(view.colored_graph(k), colored(graph, labels))
+
+
+def test_wide_labels_are_kept(tmp_path):
+    graph = subreddit_graph()
+    labels = np.arange(len(graph)) * 5000
+    save_partitions(graph, str(tmp_path), {0: labels})
+
+    view = PartitionView(str(tmp_path))
+    assert view.labels.dtype == np.int32 and np.array_equal(view[0], labels)
+
+
+def test_write_gml_matches_the_baseline_model(tmp_path):
+    graph = subreddit_graph()
+    labels = np.arange(len(graph)) % 4
+    save_partitions(graph, str(tmp_path / "partitions"), {4: labels})
+
+    PartitionView(str(tmp_path / "partitions")).write_gml(4, str(tmp_path / "view.gml"))
+    nx.write_gml(colored(graph, labels), str(tmp_path / "baseline.gml"))
+
+    assert same_graph(nx.read_gml(str(tmp_path / "view.gml")), nx.read_gml(str(tmp_path / "baseline.gml")))
+
+
+def test_convert_spectral_gml(tmp_path):
+    graph = subreddit_graph()
+    partitions = {k: np.arange(len(graph)) % k for k in [2, 3, 11]}
+    for k, labels in partitions.items():
+        nx.write_gml(colored(graph, labels), str(tmp_path / f"SNetT_spectral_{k}.gml"))
+
+    convert_spectral_gml(str(tmp_path))
+
+    view = PartitionView(str(tmp_path))
+    assert view.keys == [2, 3, 11]
+    for k, labels in partitions.items():
+        assert np.array_equal(view[k], labels)
+        assert same_graph(view.colored_graph(k), nx.read_gml(str(tmp_path / f"SNetT_spectral_{k}.gml")))
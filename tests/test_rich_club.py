@@ -0,0 +1,44 @@
+import networkx as nx
+import pytest
+
+from rich_club import normalized_rich_club, rich_club_coefficient
+
+
+def weighted_graph():
+    graph = nx.barabasi_albert_graph(80, 3, seed=1)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 1 + (u + 2 * v) % 5
+    return graph
+
+
+@pytest.mark.parametrize("graph", [nx.karate_club_graph(), nx.barabasi_albert_graph(80, 3, seed=1),
+                                   nx.disjoint_union(nx.path_graph(4), nx.empty_graph(3))])
+def test_coefficient_matches_networkx(graph):
+    expected = nx.rich_club_coefficient(graph, normalized=False)
+
+    assert rich_club_coefficient(graph).tolist() == pytest.approx([expected[k] for k in sorted(expected)])
+
+
+def test_weighted_coefficient_follows_its_definition():
+    # Opsahl et al.: weight among the nodes of degree > k over the weight of as many of the strongest edges
+    graph = weighted_graph()
+    strongest = sorted((w for _, _, w in graph.edges(data="weight")), reverse=True)
+    expected = []
+
+    for k in range(max(degree for _, degree in graph.degree())):
+        rich = [node for node, degree in graph.degree() if degree > k]
+        if len(rich) < 2:
+            break
+        edges = graph.subgraph(rich).edges(data="weight")
+        expected.append(sum(w for _, _, w in edges) / sum(strongest[:len(edges)]) if len(edges) else 0.0)
+
+    assert rich_club_coefficient(graph, weight="weight").tolist() == pytest.approx(expected)
+
+
+def test_normalized_shares_the_observed_coefficients():
+    graph = weighted_graph()
+    observed, normalized, samples = normalized_rich_club(graph, replicas=3, swaps_per_edge=2, processes=1)
+
+    assert observed == pytest.approx(rich_club_coefficient(graph))
+    assert samples.shape == (3, len(observed))
+    assert normalized == pytest.approx(observed / samples.mean(axis=0))
@@ -0,0 +1,57 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_storage import from_networkx
+from sparse_centrality import (closeness_centrality, eigenvector_centrality, forget, harmonic_centrality,
+                               to_csr)
+
+
+def disconnected_graph():
+    # two components and an isolated node, so unreachable pairs are exercised
+    graph = nx.disjoint_union(nx.karate_club_graph(), nx.path_graph(5))
+    graph.add_node("isolated")
+    return graph
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_closeness_and_harmonic_match_networkx(directed):
+    graph = nx.gnp_random_graph(40, 0.08, seed=3, directed=True) if directed else disconnected_graph()
+
+    assert closeness_centrality(graph, processes=1) == pytest.approx(nx.closeness_centrality(graph))
+    assert harmonic_centrality(graph, processes=1) == pytest.approx(nx.harmonic_centrality(graph))
+
+
+def test_weighted_distances_match_networkx():
+    graph = nx.karate_club_graph()
+    for u, v in graph.edges():
+        graph[u][v]["distance"] = 1 + (u + v) % 3
+
+    expected = nx.closeness_centrality(graph, distance="distance")
+    assert closeness_centrality(graph, distance="distance", processes=1) == pytest.approx(expected)
+
+
+def test_eigenvector_matches_networkx():
+    graph = nx.karate_club_graph()
+    expected = nx.eigenvector_centrality_numpy(graph, weight="weight")
+
+    assert eigenvector_centrality(graph, weight="weight") == pytest.approx(expected, abs=1e-8)
+
+
+def test_csr_of_stored_graph_matches_networkx():
+    graph = nx.karate_club_graph()
+    stored = from_networkx(graph)
+
+    assert np.allclose(to_csr(stored, "weight").toarray(), to_csr(graph, "weight").toarray())
+    assert np.allclose(to_csr(stored, None).toarray(), nx.to_numpy_array(graph, weight=None))
+
+
+def test_forget_drops_cached_matrices():
+    graph = nx.path_graph(4)
+    before = to_csr(graph, None)
+
+    graph.add_edge(0, 3)
+    assert to_csr(graph, None) is before
+
+    forget(graph)
+    assert to_csr(graph, None)[0, 3] == 1
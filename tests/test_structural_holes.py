@@ -0,0 +1,47 @@
+import math
+
+import networkx as nx
+import pytest
+
+import structural_holes
+from structural_holes import constraint
+
+
+def weighted_graph():
+    graph = nx.karate_club_graph()
+    graph.add_node("isolated")
+    return graph
+
+
+def assert_matches_networkx(graph, actual):
+    expected = nx.constraint(graph, weight="weight")
+
+    for node in graph:
+        if math.isnan(expected[node]):
+            assert math.isnan(actual[node])
+        else:
+            assert actual[node] == pytest.approx(expected[node])
+
+
+def test_matches_networkx():
+    graph = weighted_graph()
+    assert_matches_networkx(graph, constraint(graph, processes=1))
+
+
+def test_directed_matches_networkx():
+    graph = nx.gnp_random_graph(40, 0.1, seed=7, directed=True)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 1 + (u + 2 * v) % 5
+
+    assert_matches_networkx(graph, constraint(graph, processes=1))
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_row_blocks_give_the_same_result(monkeypatch, processes):
+    graph = weighted_graph()
+    expected = constraint(graph, processes=1)
+
+    monkeypatch.setattr(structural_holes, "BLOCK_ENTRIES", 50)
+    assert len(structural_holes._blocks(structural_holes.proportions(graph).tocsr())) > 2
+    assert_matches_networkx(graph, constraint(graph, processes=processes))
+    assert constraint(graph, processes=processes)[0] == pytest.approx(expected[0])
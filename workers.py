@@ -0,0 +1,9 @@
+import os
+
+# analysis_runner already runs one analysis per process; inside its workers the pools of the analyses
+# default to this many processes instead of one per CPU, which would oversubscribe the machine
+PROCESSES_VARIABLE = "ANALYSIS_PROCESSES"
+
+
+def worker_count(processes=None):
+    return processes or int(os.environ.get(PROCESSES_VARIABLE, 0)) or os.cpu_count() or 1